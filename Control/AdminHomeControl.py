@@ -1,5 +1,6 @@
 from PyQt6.QtWidgets import QMessageBox
 from View.adminpopupdetails import AdminDetailsPopup
+from View.PopupPool import popup_pool
 
 
 class AHControl:
@@ -222,11 +223,12 @@ class AHControl:
                                         "Profile information not available.")
                 return
 
-            # ✅ ALWAYS create a fresh popup instance
-            self.admin_popup = AdminDetailsPopup(parent=self.admin_home, model=self.model)
+            # Reuse the pooled popup and rebind it to the signed-in admin
+            self.admin_popup = popup_pool.open(AdminDetailsPopup, self.admin_home, self.model,
+                                               self.current_admin_id)
 
             # Load staff data and show popup
-            if self.admin_popup.loadAdminFromDatabase(self.current_admin_id):
+            if self.admin_popup:
                 # Center popup on parent window
                 parent_geo = self.admin_home.geometry()
                 popup_geo = self.admin_popup.geometry()
@@ -325,7 +327,7 @@ class AHControl:
             try:
                 self.admin_popup.hide()
                 self.admin_popup.close()
-                self.admin_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.admin_popup = None
                 print("✓ Closed admin popup before logout confirmation")
             except Exception as e:
@@ -1,9 +1,10 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QMessageBox
 
 # Add this import - SAME AS SOControl
 from View.OrderPopup import OrderDetailsPopup
+from View.PopupPool import popup_pool
+from View.DataTable import DataTable, TableColumn, status_color
+from View.LiveSearch import LiveSearch
 
 
 class AOrderControl:
@@ -27,6 +28,17 @@ class AOrderControl:
             self.admin_home.stackedWidget.currentChanged.connect(self.on_page_changed)
             print("✓ AOrderControl: Connected to stackedWidget page change signal")
 
+        # Model/view table replacing tableWidget_3
+        self.order_table = None
+        self.setup_order_table()
+
+        # Build the details popup in idle time so the first double-click is quick
+        popup_pool.warm(OrderDetailsPopup, self.admin_home, self.model)
+
+        # Debounced search on line3, queried on a worker thread
+        self.order_search = LiveSearch(self.model.search_orders, self.apply_order_search,
+                                       name="Order search")
+
         # Connect buttons from Order page
         self.connect_order_buttons()
 
@@ -44,6 +56,21 @@ class AOrderControl:
         """Format order ID as WSHY#001, WSHY#002, etc. - same as SOControl"""
         return f"WSHY#{order_id:03d}"
 
+    def setup_order_table(self):
+        """Replace the order QTableWidget with the shared model/view table"""
+        if not hasattr(self.admin_home, "tableWidget_3"):
+            return
+
+        self.order_table = DataTable(self.admin_home, "tableWidget_3", [
+            TableColumn("Order ID", lambda o: self.format_order_id(o['OrderID']),
+                        sort_key=lambda o: o['OrderID']),
+            TableColumn("Customer Name", lambda o: ' '.join((o.get('customer_name') or '').split()) or "Unknown"),
+            TableColumn("Status", lambda o: o.get('Status', 'Unknown'),
+                        color=lambda o: status_color(o.get('Status'))),
+            TableColumn("Total Amount", lambda o: f"₱{o.get('TotalAmount', 0):.2f}",
+                        sort_key=lambda o: o.get('TotalAmount', 0)),
+        ], keys=("OrderID",))
+
     def connect_order_buttons(self):
         """Connect navigation and action buttons on the Order page"""
 
@@ -101,75 +128,24 @@ class AOrderControl:
             self.admin_home.name_srt_btn_3.clicked.connect(self.sort_orders)
 
         # Connect order table double-click
-        if hasattr(self.admin_home, "tableWidget_3"):
-            self.admin_home.tableWidget_3.cellDoubleClicked.connect(
-                self.on_order_table_double_click
-            )
+        if self.order_table:
+            self.order_table.on_double_click(self.on_order_table_double_click)
             print("✓ Connected tableWidget_3 double-click")
         else:
             print("✗ tableWidget_3 not found in Admin")
 
     def load_order_data(self):
         """Load all order data into the table"""
-        if not hasattr(self.admin_home, "tableWidget_3"):
+        if not self.order_table:
             print("✗ Error: tableWidget_3 not found in Admin")
             return
 
         try:
             order_list = self.model.get_all_orders()
-            table = self.admin_home.tableWidget_3
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Customer Name", "Status", "Total Amount", "OrderID_Hidden"])
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Customer Name
-                customer_name = "Unknown"
-                if order.get('CustomerID'):
-                    customer_data = self.model.get_customer_by_id(order['CustomerID'])
-                    if customer_data:
-                        full_name = f"{customer_data['CFName']} {customer_data['CMName'] or ''} {customer_data['CLName']}".strip()
-                        customer_name = ' '.join(full_name.split())
-                table.setItem(row_num, 1, QTableWidgetItem(customer_name))
-
-                # Status with color coding
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-
-                # Apply colors based on status
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-
-                table.setItem(row_num, 2, status_item)
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
+            self.order_table.set_records(order_list)
 
             # Stretch first two columns, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-            for col in range(2, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.order_table.set_resize_modes(stretch=(0, 1), to_contents=(2, 3))
 
             print(f"✓ Admin: Loaded {len(order_list)} orders")
 
@@ -184,85 +160,31 @@ class AOrderControl:
         self.load_order_data()
 
     def search_order(self):
-        """Search orders by order ID, customer name, or status"""
-        if not hasattr(self.admin_home, "line3"):
+        """Search orders by order ID, customer name, or status (query runs off the GUI thread)"""
+        if not hasattr(self.admin_home, "line3") or not self.order_table:
             return
 
         search_term = self.admin_home.line3.text().strip()
 
         if not search_term:
+            self.order_search.cancel()
             self.load_order_data()
             return
 
-        try:
-            order_list = self.model.search_orders(search_term)
-            table = self.admin_home.tableWidget_3
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Customer Name", "Status", "Total Amount", "OrderID_Hidden"])
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Customer Name
-                customer_name = "Unknown"
-                if order.get('CustomerID'):
-                    customer_data = self.model.get_customer_by_id(order['CustomerID'])
-                    if customer_data:
-                        full_name = f"{customer_data['CFName']} {customer_data['CMName'] or ''} {customer_data['CLName']}".strip()
-                        customer_name = ' '.join(full_name.split())
-                table.setItem(row_num, 1, QTableWidgetItem(customer_name))
-
-                # Status with color coding
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-
-                table.setItem(row_num, 2, status_item)
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
-
-            # Stretch first two columns, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-            for col in range(2, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
-
-            print(f"✓ Admin: Found {len(order_list)} orders matching '{search_term}'")
+        self.order_search.request(search_term)
 
-        except Exception as e:
-            print(f"✗ Admin: Error searching orders: {e}")
-            import traceback
-            traceback.print_exc()
+    def apply_order_search(self, search_term, order_list):
+        """Show the result of the latest order search"""
+        self.order_table.set_records(order_list)
+        print(f"✓ Admin: Found {len(order_list)} orders matching '{search_term}'")
 
     def show_order_details(self):
         """Show order details popup"""
-        if not hasattr(self.admin_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.admin_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        order_id = self.order_table.selected_value("OrderID")
+        if order_id is None:
             QMessageBox.warning(
                 self.admin_home,
                 "No Selection",
@@ -271,26 +193,12 @@ class AOrderControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            order_id_item = self.admin_home.tableWidget_3.item(selected_row, 4)
-
-            if not order_id_item:
-                QMessageBox.warning(
-                    self.admin_home,
-                    "Error",
-                    "Could not retrieve order ID from table."
-                )
-                return
-
-            order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
 
             print(f"✅ Loading order details for Order {self.format_order_id(order_id)}")
 
-            # ✅ ALWAYS create a fresh popup instance
-            self.order_popup = OrderDetailsPopup(parent=self.admin_home, model=self.model)
-
-            # Load data directly from database using the order ID
-            success = self.order_popup.loadOrderFromDatabase(order_id)
+            # Reuse the pooled popup and rebind it to this order
+            self.order_popup = popup_pool.open(OrderDetailsPopup, self.admin_home, self.model, order_id)
+            success = self.order_popup is not None
 
             if not success:
                 QMessageBox.warning(
@@ -305,6 +213,9 @@ class AOrderControl:
             self.order_popup.raise_()
             self.order_popup.activateWindow()
 
+            # Next row is the likeliest next open
+            popup_pool.prefetch(OrderDetailsPopup, self.model, self.order_table.next_value("OrderID"))
+
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -324,24 +235,17 @@ class AOrderControl:
 
     def delete_order(self):
         """Delete order"""
-        if not hasattr(self.admin_home, "tableWidget_3"):
+        if not self.order_table:
             QMessageBox.warning(self.admin_home, "Error", "Order table not found.")
             return
 
-        selected_items = self.admin_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        selected_row = self.order_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(self.admin_home, "No Selection", "Please select an order to delete.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_display = self.admin_home.tableWidget_3.item(selected_row, 0).text()
-        order_id_item = self.admin_home.tableWidget_3.item(selected_row, 4)
-
-        if not order_id_item:
-            QMessageBox.warning(self.admin_home, "Error", "Could not get order ID.")
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+        order_id_display = self.order_table.text(selected_row, 0)
+        order_id = self.order_table.value(selected_row, "OrderID")
 
         reply = QMessageBox.question(
             self.admin_home,
@@ -354,7 +258,7 @@ class AOrderControl:
             try:
                 success = self.model.delete_order(order_id)
                 if success:
-                    self.admin_home.tableWidget_3.removeRow(selected_row)
+                    self.order_table.remove_row(selected_row)
                     print(f"✓ Admin: Deleted order: {order_id_display}")
                     QMessageBox.information(self.admin_home, "Success", "Order deleted successfully!")
                 else:
@@ -365,15 +269,15 @@ class AOrderControl:
 
     def sort_orders(self):
         """Sort order table by Order ID"""
-        if not hasattr(self.admin_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
         if self.sort_ascending_order:
-            self.admin_home.tableWidget_3.sortItems(0, Qt.SortOrder.AscendingOrder)
+            self.order_table.sort(0, ascending=True)
             if hasattr(self.admin_home, "name_srt_btn_3"):
                 self.admin_home.name_srt_btn_3.setText("Order ID ▲")
         else:
-            self.admin_home.tableWidget_3.sortItems(0, Qt.SortOrder.DescendingOrder)
+            self.order_table.sort(0, ascending=False)
             if hasattr(self.admin_home, "name_srt_btn_3"):
                 self.admin_home.name_srt_btn_3.setText("Order ID ▼")
 
@@ -415,7 +319,7 @@ class AOrderControl:
             try:
                 self.order_popup.hide()
                 self.order_popup.close()
-                self.order_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.order_popup = None
                 print("✓ Closed order popup before logout confirmation")
             except Exception as e:
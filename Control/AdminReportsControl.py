@@ -1,10 +1,16 @@
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem, QInputDialog
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QMessageBox, QInputDialog
 from datetime import datetime
 import os
 
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem, QInputDialog
+from Model.report_worker import ReportJob, attach_progress_dialog
+from View.DataTable import DataTable, TableColumn, status_color
+from View.LiveSearch import LiveSearch
+from View.PopupPool import popup_pool
+from View.RefreshScheduler import refresh_scheduler
+
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QMessageBox, QInputDialog
 from datetime import datetime
 import os
 
@@ -12,6 +18,12 @@ import os
 class AReportControl:
     """Controller for Admin Report/History page"""
 
+    # Tables whose change counters decide whether the history table reloads
+    WATCHED_TABLES = ('Orders', 'Customer')
+
+    # Rows fetched per page while scrolling the history table
+    HISTORY_PAGE_SIZE = 100
+
     def __init__(self, admin_home, dashboard, user, order, report, model, login_view):
         self.admin_home = admin_home
         self.dashboard = dashboard
@@ -23,25 +35,39 @@ class AReportControl:
 
         self.sort_ascending_history = True
         self.current_filter = "Completed"
-        self.refresh_timer = None
+        self.history_term = ""   # search term the history table is showing, "" = none
+        self.refresh_task = None
         self.is_destroyed = False
-        self.last_order_count = 0
-        self.last_customer_count = 0
         self.connections_made = False
 
         # ✅ ADD THIS LINE - Store popup as instance variable
         self.order_popup = None  # <-- THIS WAS MISSING!
+        self.report_job = None
 
         # Connect to page change signal for auto-refresh
         if hasattr(self.admin_home, 'stackedWidget'):
             self.admin_home.stackedWidget.currentChanged.connect(self.on_page_changed)
 
+        # Model/view table replacing tableWidget_4
+        self.history_table = None
+        self.setup_history_table()
+
+        # Debounced search on line4, queried on a worker thread
+        self.history_search = LiveSearch(self.query_history, self.apply_history_search,
+                                         name="History search")
+
         # Initial connection setup
         self.connect_report_buttons()
 
         # Load completed orders initially
         QTimer.singleShot(100, self.safe_load_history_data)
 
+        # Re-check every 10 seconds while the report page is on screen; reloads only if the data changed
+        if hasattr(self.admin_home, 'report_page_index'):
+            self.refresh_task = refresh_scheduler.register(
+                self.admin_home, self.admin_home.report_page_index, self.safe_refresh_history_data,
+                interval_ms=10000, model=self.model, tables=self.WATCHED_TABLES)
+
     def safe_load_history_data(self):
         """Safely load history data with error handling"""
         if not self.is_destroyed:
@@ -50,49 +76,39 @@ class AReportControl:
             except Exception as e:
                 print(f"✗ Safe load failed: {e}")
 
-    def setup_refresh_timer(self):
-        """Setup timer to periodically check for changes"""
-        if self.refresh_timer:
-            self.refresh_timer.stop()
-            self.refresh_timer.deleteLater()
-
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.safe_check_for_updates)
-        self.refresh_timer.start(10000)
-
+    def safe_refresh_history_data(self):
+        """
+        Auto-refresh: re-run the query on screen (filter and search term) for
+        the rows loaded so far, keeping the scroll position and selection
+        """
+        if self.is_destroyed or not self.history_table:
+            return
         try:
-            self.last_order_count = len(self.model.get_all_orders())
-            self.last_customer_count = len(self.model.get_all_customers())
-        except:
-            pass
-
-    def safe_check_for_updates(self):
-        """Safe wrapper for check_for_updates"""
-        if not self.is_destroyed:
-            try:
-                self.check_for_updates()
-            except Exception as e:
-                print(f"✗ Safe check failed: {e}")
+            if not self.history_table.reload_pages():
+                self.load_history_data()
+        except Exception as e:
+            print(f"✗ Safe refresh failed: {e}")
 
-    def check_for_updates(self):
-        """Check if data has changed and refresh if needed"""
-        try:
-            if self.is_destroyed:
-                return
+    def setup_history_table(self):
+        """Replace the history QTableWidget with the shared model/view table"""
+        if self.history_table or not hasattr(self.admin_home, "tableWidget_4"):
+            return
 
-            current_order_count = len(self.model.get_all_orders())
-            current_customer_count = len(self.model.get_all_customers())
-
-            if hasattr(self.admin_home, 'report_page_index'):
-                if self.admin_home.stackedWidget.currentIndex() == self.admin_home.report_page_index:
-                    if (current_order_count != self.last_order_count or
-                            current_customer_count != self.last_customer_count):
-                        print("✓ Reports: Data changed - refreshing")
-                        self.load_history_data()
-                        self.last_order_count = current_order_count
-                        self.last_customer_count = current_customer_count
-        except Exception as e:
-            print(f"✗ Reports: Error checking updates: {e}")
+        def order_date_text(order):
+            order_date = order.get('OrderDate')
+            if not order_date:
+                return 'N/A'
+            return order_date.strftime('%Y-%m-%d %H:%M') if hasattr(order_date, 'strftime') else str(order_date)
+
+        self.history_table = DataTable(self.admin_home, "tableWidget_4", [
+            TableColumn("Order ID", lambda o: f"WSHY#{o['OrderID']:03d}", sort_key=lambda o: o['OrderID']),
+            TableColumn("Status", lambda o: o.get('Status', 'Unknown'),
+                        color=lambda o: status_color(o.get('Status'))),
+            TableColumn("Date", order_date_text, sort_key=lambda o: o.get('OrderDate')),
+            TableColumn("Total Amount", lambda o: f"₱{o.get('TotalAmount', 0):.2f}",
+                        sort_key=lambda o: o.get('TotalAmount', 0)),
+        ], keys=("OrderID", "OrderDate"))
+        self.history_table.set_resize_modes(stretch=(0,), to_contents=(1, 2, 3))
 
     def on_page_changed(self, index):
         """Automatically refresh report data when report page becomes visible"""
@@ -104,11 +120,7 @@ class AReportControl:
                 print("✓ Reports: Page activated - refreshing data")
                 # Reconnect buttons to ensure they work after navigation
                 self.ensure_connections()
-                self.setup_refresh_timer()
                 self.load_history_data()
-            else:
-                if self.refresh_timer:
-                    self.refresh_timer.stop()
 
     def ensure_connections(self):
         """Ensure all button connections are active"""
@@ -144,9 +156,9 @@ class AReportControl:
                     pass
 
             # Disconnect table double-click
-            if hasattr(self.admin_home, "tableWidget_4"):
+            if self.history_table:
                 try:
-                    self.admin_home.tableWidget_4.cellDoubleClicked.disconnect()
+                    self.history_table.view.doubleClicked.disconnect()
                 except TypeError:
                     pass
 
@@ -209,102 +221,35 @@ class AReportControl:
             self.admin_home.name_srt_btn_4.clicked.connect(self.toggle_filter)
 
         # Connect table double-click
-        if hasattr(self.admin_home, "tableWidget_4"):
-            self.admin_home.tableWidget_4.cellDoubleClicked.connect(
-                self.on_history_table_double_click
-            )
+        if self.history_table:
+            self.history_table.on_double_click(self.on_history_table_double_click)
 
         print("✓ Reports: All button connections established")
 
-    def load_history_data(self, filter_status=None):
-        """Load order history data into the table"""
+    def load_history_data(self, filter_status=None, first_page=None):
+        """Load order history data (current filter and search term) into the table"""
         if self.is_destroyed:
             return
 
-        if not hasattr(self.admin_home, "tableWidget_4"):
+        if not self.history_table:
             print("Error: tableWidget_4 not found")
             return
 
-        table = self.admin_home.tableWidget_4
-        table.blockSignals(True)
-
         try:
             if filter_status is None:
                 filter_status = self.current_filter
 
-            # Get orders based on filter
-            if filter_status == "All":
-                order_list = self.model.get_all_orders()
-            elif filter_status == "Completed":
-                order_list = self.model.get_orders_by_status("Completed")
-            else:
-                order_list = self.model.get_orders_by_status(filter_status)
-
-            table.clearContents()
-            table.setRowCount(0)
-
-            header = table.horizontalHeader()
+            # First page only; the rest is fetched as the table scrolls
+            status = None if filter_status == "All" else filter_status
+            search_term = self.history_term
+            self.history_table.load_pages(
+                lambda after, page_size: self.fetch_history_page(status, after, page_size, search_term),
+                self.HISTORY_PAGE_SIZE,
+                first_page
+            )
 
-            if table.columnCount() != 6:
-                table.setColumnCount(6)
-                table.setHorizontalHeaderLabels(
-                    ["Order ID", "Order ID", "Status", "Date", "Total Amount", "OrderID_Hidden"]
-                )
-                table.setColumnHidden(0, True)
-                table.setColumnHidden(5, True)
-
-                header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-                header.setSectionResizeMode(2, header.ResizeMode.ResizeToContents)
-                header.setSectionResizeMode(3, header.ResizeMode.ResizeToContents)
-                header.setSectionResizeMode(4, header.ResizeMode.ResizeToContents)
-
-            completed_count = 0
-            for row_num, order in enumerate(order_list):
-                status = order.get('Status', 'Unknown')
-
-                if filter_status == "Completed" and status != "Completed":
-                    continue
-
-                if status == "Completed":
-                    completed_count += 1
-
-                table.insertRow(row_num)
-
-                # Raw Order ID (hidden)
-                table.setItem(row_num, 0, QTableWidgetItem(str(order['OrderID'])))
-
-                # Formatted Order ID (visible)
-                formatted_id = f"WSHY#{order['OrderID']:03d}"
-                table.setItem(row_num, 1, QTableWidgetItem(formatted_id))
-
-                # Status with color
-                status_item = QTableWidgetItem(status)
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-                table.setItem(row_num, 2, status_item)
-
-                # Order Date
-                order_date = order.get('OrderDate')
-                order_date_str = order_date.strftime('%Y-%m-%d %H:%M') if order_date and hasattr(
-                    order_date, 'strftime'
-                ) else ('N/A' if not order_date else str(order_date))
-                table.setItem(row_num, 3, QTableWidgetItem(order_date_str))
-
-                # Total Amount
-                table.setItem(row_num, 4, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID for data retrieval
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 5, order_id_item)
-
-            print(f"✓ Reports: Loaded {completed_count} completed orders (filter: {filter_status})")
+            print(f"✓ Reports: Loaded {self.history_table.row_count()} orders (filter: {filter_status}"
+                  + (f", search: '{search_term}')" if search_term else ")"))
 
         except Exception as e:
             print(f"✗ Reports: Error loading history data: {e}")
@@ -316,142 +261,45 @@ class AReportControl:
                     "Error",
                     f"Failed to load history data: {str(e)}"
                 )
-        finally:
-            try:
-                table.blockSignals(False)
-            except:
-                pass
+
+    def fetch_history_page(self, status, after, page_size, search_term=None):
+        """Next page of history rows after the last loaded (OrderDate, OrderID)"""
+        if after:
+            after = (after['OrderDate'], after['OrderID'])
+        return self.model.get_orders_page(status, after, page_size, search_term or None)
 
     def search_history(self):
-        """Search order history with current filter applied"""
+        """Search order history with current filter applied (query runs off the GUI thread)"""
         if self.is_destroyed:
             return
 
-        if not hasattr(self.admin_home, "tableWidget_4"):
+        if not self.history_table:
             return
 
         if not hasattr(self.admin_home, "line4"):
             return
 
         search_term = self.admin_home.line4.text().strip()
-        table = self.admin_home.tableWidget_4
 
         if not search_term:
+            self.history_search.cancel()
+            self.history_term = ""
             self.load_history_data()
             return
 
-        table.blockSignals(True)
+        self.history_search.request(search_term)
 
-        try:
-            # Get filtered orders first
-            if self.current_filter == "All":
-                filtered_orders = self.model.get_all_orders()
-            elif self.current_filter == "Completed":
-                filtered_orders = self.model.get_orders_by_status("Completed")
-            else:
-                filtered_orders = self.model.get_orders_by_status(self.current_filter)
-
-            # Search within filtered results
-            search_results = []
-            for order in filtered_orders:
-                search_lower = search_term.lower()
-
-                formatted_id = f"WSHY#{order['OrderID']:03d}".lower()
-                if search_lower in formatted_id:
-                    search_results.append(order)
-                    continue
-
-                customer_name = order.get('customer_name', '').lower()
-                if search_lower in customer_name:
-                    search_results.append(order)
-                    continue
-
-                status = order.get('Status', '').lower()
-                if search_lower in status:
-                    search_results.append(order)
-                    continue
-
-                order_date = order.get('OrderDate')
-                if order_date:
-                    date_str = order_date.strftime('%Y-%m-%d').lower()
-                    if search_lower in date_str:
-                        search_results.append(order)
-                        continue
-
-            table.clearContents()
-            table.setRowCount(0)
-
-            header = table.horizontalHeader()
-
-            if table.columnCount() != 6:
-                table.setColumnCount(6)
-                table.setHorizontalHeaderLabels(
-                    ["Order ID", "Formatted ID", "Status", "Date", "Total Amount", "OrderID_Hidden"]
-                )
-                table.setColumnHidden(0, True)
-                table.setColumnHidden(5, True)
-
-                header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-                header.setSectionResizeMode(2, header.ResizeMode.ResizeToContents)
-                header.setSectionResizeMode(3, header.ResizeMode.ResizeToContents)
-                header.setSectionResizeMode(4, header.ResizeMode.ResizeToContents)
-
-            # Add search results
-            for row_num, order in enumerate(search_results):
-                table.insertRow(row_num)
-
-                # Raw Order ID (hidden)
-                table.setItem(row_num, 0, QTableWidgetItem(str(order['OrderID'])))
-
-                # Formatted Order ID (visible)
-                formatted_id = f"WSHY#{order['OrderID']:03d}"
-                table.setItem(row_num, 1, QTableWidgetItem(formatted_id))
-
-                # Status with color
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-                table.setItem(row_num, 2, status_item)
-
-                # Order Date
-                order_date = order.get('OrderDate')
-                order_date_str = order_date.strftime('%Y-%m-%d %H:%M') if order_date and hasattr(
-                    order_date, 'strftime'
-                ) else ('N/A' if not order_date else str(order_date))
-                table.setItem(row_num, 3, QTableWidgetItem(order_date_str))
-
-                # Total Amount
-                table.setItem(row_num, 4, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 5, order_id_item)
-
-            print(f"✓ Reports: Found {len(search_results)} orders matching '{search_term}'")
+    def query_history(self, search_term):
+        """Worker thread: first page of the current filter's orders matching the search term"""
+        status = None if self.current_filter == "All" else self.current_filter
+        return self.fetch_history_page(status, None, self.HISTORY_PAGE_SIZE, search_term)
 
-        except Exception as e:
-            print(f"✗ Reports: Error searching history: {e}")
-            import traceback
-            traceback.print_exc()
-            if not self.is_destroyed:
-                QMessageBox.critical(
-                    self.admin_home,
-                    "Error",
-                    f"Failed to search history: {str(e)}"
-                )
-        finally:
-            try:
-                table.blockSignals(False)
-            except:
-                pass
+    def apply_history_search(self, search_term, search_results):
+        """Show the result of the latest history search; further matches load as the table scrolls"""
+        if self.is_destroyed:
+            return
+        self.history_term = search_term
+        self.load_history_data(first_page=search_results)
 
     def toggle_filter(self):
         """Toggle between different status filters"""
@@ -466,6 +314,11 @@ class AReportControl:
             current_index = 0
             self.current_filter = filters[0]
 
+        # A search still running was for the previous filter; reload with the term typed so far
+        self.history_search.cancel()
+        if hasattr(self.admin_home, "line4"):
+            self.history_term = self.admin_home.line4.text().strip()
+
         next_index = (current_index + 1) % len(filters)
         self.current_filter = filters[next_index]
 
@@ -478,10 +331,10 @@ class AReportControl:
         """Clean up resources before destruction"""
         self.is_destroyed = True
 
-        if self.refresh_timer:
-            self.refresh_timer.stop()
-            self.refresh_timer.deleteLater()
-            self.refresh_timer = None
+        if self.refresh_task:
+            refresh_scheduler.unregister(self.refresh_task)
+            self.refresh_task = None
+        self.history_search.cancel()
 
         if hasattr(self.admin_home, 'stackedWidget'):
             try:
@@ -509,25 +362,39 @@ class AReportControl:
 
         self.sort_ascending_history = True
         self.current_filter = "Completed"
-        self.refresh_timer = None
+        self.history_term = ""   # search term the history table is showing, "" = none
+        self.refresh_task = None
         self.is_destroyed = False
-        self.last_order_count = 0
-        self.last_customer_count = 0
         self.connections_made = False
 
         # ✅ ADD THIS LINE - Store popup as instance variable
         self.order_popup = None  # <-- THIS WAS MISSING!
+        self.report_job = None
 
         # Connect to page change signal for auto-refresh
         if hasattr(self.admin_home, 'stackedWidget'):
             self.admin_home.stackedWidget.currentChanged.connect(self.on_page_changed)
 
+        # Model/view table replacing tableWidget_4
+        self.history_table = None
+        self.setup_history_table()
+
+        # Debounced search on line4, queried on a worker thread
+        self.history_search = LiveSearch(self.query_history, self.apply_history_search,
+                                         name="History search")
+
         # Initial connection setup
         self.connect_report_buttons()
 
         # Load completed orders initially
         QTimer.singleShot(100, self.safe_load_history_data)
 
+        # Re-check every 10 seconds while the report page is on screen; reloads only if the data changed
+        if hasattr(self.admin_home, 'report_page_index'):
+            self.refresh_task = refresh_scheduler.register(
+                self.admin_home, self.admin_home.report_page_index, self.safe_refresh_history_data,
+                interval_ms=10000, model=self.model, tables=self.WATCHED_TABLES)
+
     # CHANGE 2: Store popup in view_order_details() and use it in go_to_logout()
     # ----------------------------------------------------------------------------
     def view_order_details(self):
@@ -535,31 +402,21 @@ class AReportControl:
         if self.is_destroyed:
             return
 
-        if not hasattr(self.admin_home, "tableWidget_4"):
+        if not self.history_table:
             QMessageBox.warning(self.admin_home, "Error", "History table not found.")
             return
 
-        selected_items = self.admin_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        order_id = self.history_table.selected_value("OrderID")
+        if order_id is None:
             QMessageBox.warning(self.admin_home, "No Selection", "Please select an order first.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_item = self.admin_home.tableWidget_4.item(selected_row, 5)
-
-        if not order_id_item:
-            QMessageBox.warning(self.admin_home, "Error", "Could not get order ID.")
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
-
         try:
             from View.OrderPopup import OrderDetailsPopup
 
-            # ✅ ALWAYS create fresh popup - REMOVE the "if None" check
-            self.order_popup = OrderDetailsPopup(self.admin_home, self.model)
-
-            success = self.order_popup.loadOrderFromDatabase(order_id)
+            # Reuse the pooled popup and rebind it to this order
+            self.order_popup = popup_pool.open(OrderDetailsPopup, self.admin_home, self.model, order_id)
+            success = self.order_popup is not None
 
             if success:
                 main_geo = self.admin_home.geometry()
@@ -574,6 +431,9 @@ class AReportControl:
                 self.order_popup.raise_()
                 self.order_popup.activateWindow()
                 print(f"✅ Reports: Showing order details for OrderID: {order_id}")
+
+                # Next row is the likeliest next open
+                popup_pool.prefetch(OrderDetailsPopup, self.model, self.history_table.next_value("OrderID"))
             else:
                 QMessageBox.warning(self.admin_home, "Error", "Could not load order details.")
 
@@ -596,11 +456,10 @@ class AReportControl:
         if self.is_destroyed:
             return
 
-        if not hasattr(self.admin_home, "tableWidget_4"):
+        if not self.history_table:
             return
 
-        selected_items = self.admin_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        if self.history_table.selected_row() is None:
             QMessageBox.warning(self.admin_home, "No Selection", "Please select an order to edit.")
             return
 
@@ -611,24 +470,17 @@ class AReportControl:
         if self.is_destroyed:
             return
 
-        if not hasattr(self.admin_home, "tableWidget_4"):
+        if not self.history_table:
             QMessageBox.warning(self.admin_home, "Error", "History table not found.")
             return
 
-        selected_items = self.admin_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        selected_row = self.history_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(self.admin_home, "No Selection", "Please select an order to delete.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_display = self.admin_home.tableWidget_4.item(selected_row, 1).text()
-        order_id_item = self.admin_home.tableWidget_4.item(selected_row, 5)
-
-        if not order_id_item:
-            QMessageBox.warning(self.admin_home, "Error", "Could not get order ID.")
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+        order_id_display = self.history_table.text(selected_row, 0)
+        order_id = self.history_table.value(selected_row, "OrderID")
 
         reply = QMessageBox.question(
             self.admin_home,
@@ -641,10 +493,11 @@ class AReportControl:
             try:
                 success = self.model.delete_order(order_id)
                 if success:
-                    self.admin_home.tableWidget_4.removeRow(selected_row)
+                    self.history_table.remove_row(selected_row)
                     print(f"✓ Reports: Deleted order: {order_id_display}")
 
-                    self.last_order_count -= 1
+                    if self.refresh_task:
+                        refresh_scheduler.mark_fresh(self.refresh_task)
 
                     QMessageBox.information(self.admin_home, "Success", "Order deleted successfully!")
                 else:
@@ -675,28 +528,6 @@ class AReportControl:
                 print("Reports: Annual report generation cancelled")
                 return
 
-            # Import the report generator
-            try:
-                from Model.Anual_Report import WashyAnnualReportGenerator
-            except ImportError:
-                QMessageBox.critical(
-                    self.admin_home,
-                    "Error",
-                    "Annual report generator not found. Please ensure Anual_Report.py is available."
-                )
-                return
-
-            # Get database configuration from model
-            db_config = {
-                'host': self.model.host if hasattr(self.model, 'host') else 'localhost',
-                'user': self.model.user if hasattr(self.model, 'user') else 'root',
-                'password': self.model.password if hasattr(self.model, 'password') else '',
-                'database': self.model.database if hasattr(self.model, 'database') else 'washy'
-            }
-
-            # Create report generator
-            report_gen = WashyAnnualReportGenerator(db_config)
-
             # Generate filename with timestamp
             timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
             filename = f"Washy_Annual_Report_{year}_{timestamp}.pdf"
@@ -708,55 +539,16 @@ class AReportControl:
 
             filepath = os.path.join(reports_dir, filename)
 
-            # Show progress message
-            QMessageBox.information(
-                self.admin_home,
-                "Generating Report",
-                f"Generating annual report for {year}...\nThis may take a moment."
-            )
+            # Build the PDF in a worker process; the page stays usable meanwhile
+            job = ReportJob('annual', self.model.db_config, (year,), filepath, parent=self.admin_home)
+            attach_progress_dialog(job, self.admin_home, "Generating Report",
+                                   f"Generating annual report for {year}...")
+            job.finished.connect(lambda success, result: self.on_report_finished(
+                year, filepath, success, result))
+            job.cancelled.connect(lambda: print("Reports: Annual report generation cancelled"))
 
-            # Generate the report
-            success = report_gen.generate_annual_report(year, filepath)
-
-            if success:
-                reply = QMessageBox.question(
-                    self.admin_home,
-                    "Report Generated",
-                    f"Annual report for {year} has been generated successfully!\n\n"
-                    f"File: {filepath}\n\n"
-                    f"Would you like to open the report?",
-                    QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
-                )
-
-                if reply == QMessageBox.StandardButton.Yes:
-                    # Open the PDF file with default system viewer
-                    import subprocess
-                    import platform
-
-                    try:
-                        if platform.system() == 'Windows':
-                            os.startfile(filepath)
-                        elif platform.system() == 'Darwin':  # macOS
-                            subprocess.call(['open', filepath])
-                        else:  # Linux
-                            subprocess.call(['xdg-open', filepath])
-
-                        print(f"✓ Reports: Opened annual report: {filepath}")
-                    except Exception as e:
-                        print(f"✗ Reports: Could not open PDF: {e}")
-                        QMessageBox.information(
-                            self.admin_home,
-                            "Report Saved",
-                            f"Report saved to: {filepath}\n\nPlease open it manually."
-                        )
-                else:
-                    print(f"✓ Reports: Annual report saved: {filepath}")
-            else:
-                QMessageBox.critical(
-                    self.admin_home,
-                    "Error",
-                    f"Failed to generate annual report for {year}.\nPlease check the console for details."
-                )
+            self.report_job = job
+            job.start()
 
         except Exception as e:
             print(f"✗ Reports: Error generating annual report: {e}")
@@ -768,6 +560,52 @@ class AReportControl:
                 f"Error generating annual report: {str(e)}"
             )
 
+    def on_report_finished(self, year, filepath, success, result):
+        """Worker finished: offer to open the PDF or show what went wrong"""
+        self.report_job = None
+        if self.is_destroyed:
+            return
+
+        if success:
+            reply = QMessageBox.question(
+                self.admin_home,
+                "Report Generated",
+                f"Annual report for {year} has been generated successfully!\n\n"
+                f"File: {filepath}\n\n"
+                f"Would you like to open the report?",
+                QMessageBox.StandardButton.Yes | QMessageBox.StandardButton.No
+            )
+
+            if reply == QMessageBox.StandardButton.Yes:
+                # Open the PDF file with default system viewer
+                import subprocess
+                import platform
+
+                try:
+                    if platform.system() == 'Windows':
+                        os.startfile(filepath)
+                    elif platform.system() == 'Darwin':  # macOS
+                        subprocess.call(['open', filepath])
+                    else:  # Linux
+                        subprocess.call(['xdg-open', filepath])
+
+                    print(f"✓ Reports: Opened annual report: {filepath}")
+                except Exception as e:
+                    print(f"✗ Reports: Could not open PDF: {e}")
+                    QMessageBox.information(
+                        self.admin_home,
+                        "Report Saved",
+                        f"Report saved to: {filepath}\n\nPlease open it manually."
+                    )
+            else:
+                print(f"✓ Reports: Annual report saved: {filepath}")
+        else:
+            QMessageBox.critical(
+                self.admin_home,
+                "Error",
+                f"Failed to generate annual report for {year}.\n{result or 'Please check the console for details.'}"
+            )
+
     # ==================== NAVIGATION METHODS ====================
 
     def go_to_home(self):
@@ -826,7 +664,7 @@ class AReportControl:
             try:
                 self.order_popup.hide()
                 self.order_popup.close()
-                self.order_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.order_popup = None
                 print("✓ Reports: Closed order popup before logout confirmation")
             except Exception as e:
@@ -1,5 +1,9 @@
-from PyQt6.QtCore import Qt, QTimer
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
+from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import QMessageBox
+
+from View.DataTable import DataTable, TableColumn
+from View.LiveSearch import LiveSearch
+from View.PopupPool import popup_pool
 
 
 class AManagerControl:
@@ -26,6 +30,13 @@ class AManagerControl:
         # CRITICAL: Set bidirectional reference
         self.editstaff_control.manager_control = self
 
+        self.staff_table = None
+        self.setup_staff_table()
+
+        # Debounced search on line, queried on a worker thread
+        self.staff_search = LiveSearch(self.model.search_staff, self.apply_staff_search,
+                                       name="Staff search")
+
         self.connect_manager_buttons()
         self.configure_table_settings()
         QTimer.singleShot(100, self.load_staff_data)
@@ -94,103 +105,59 @@ class AManagerControl:
         # Search functionality
         if hasattr(self.admin_home, "line"):
             self.admin_home.line.textChanged.connect(self.search_staff)
-            self.admin_home.line.returnPressed.connect(self.search_staff)
+            self.admin_home.line.returnPressed.connect(self.search_staff_now)
 
         # Table double-click
-        if hasattr(self.admin_home, "tw"):
-            self.admin_home.tw.cellDoubleClicked.connect(self.on_table_double_click)
-
-            # Get headers
-            h_header = self.admin_home.tw.horizontalHeader()
-            v_header = self.admin_home.tw.verticalHeader()
+        if self.staff_table:
+            self.staff_table.on_double_click(self.on_table_double_click)
 
-            # Prevent column/row reordering
-            h_header.setSectionsMovable(False)
-            v_header.setSectionsMovable(False)
-            h_header.setHighlightSections(False)
-            v_header.setHighlightSections(False)
-
-            # Disable drag and drop
-            self.admin_home.tw.setDragEnabled(False)
-            self.admin_home.tw.setDragDropMode(self.admin_home.tw.DragDropMode.NoDragDrop)
-            self.admin_home.tw.setSelectionMode(self.admin_home.tw.SelectionMode.SingleSelection)
+    def setup_staff_table(self):
+        """Replace the staff QTableWidget with the shared model/view table"""
+        if not hasattr(self.admin_home, "tw"):
+            return
 
+        self.staff_table = DataTable(self.admin_home, "tw", [
+            TableColumn("Name", lambda s: f"{s['EFName']} {s['EMName'] or ''} {s['ELName']}".strip()),
+            TableColumn("Email", lambda s: s['EEmail'] or ''),
+            TableColumn("Date Applied",
+                        lambda s: s['SDateApplied'].strftime('%Y-%m-%d') if s['SDateApplied'] else '',
+                        sort_key=lambda s: s['SDateApplied']),
+            TableColumn("Last Active",
+                        lambda s: s['LastActiveAt'].strftime('%Y-%m-%d %H:%M') if s['LastActiveAt'] else 'Never',
+                        sort_key=lambda s: s['LastActiveAt']),
+        ], keys=("StaffID",))
 
     def configure_table_settings(self):
         """Force configure table to be non-draggable"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             return
 
-        table = self.admin_home.tw
+        table = self.staff_table.view
         h_header = table.horizontalHeader()
-        v_header = table.verticalHeader()
-
         h_header.setSectionsMovable(False)
-        v_header.setSectionsMovable(False)
         h_header.setSectionsClickable(True)
-        v_header.setSectionsClickable(True)
         h_header.setHighlightSections(False)
-        v_header.setHighlightSections(False)
 
         table.setDragEnabled(False)
         table.setAcceptDrops(False)
         table.setDragDropMode(table.DragDropMode.NoDragDrop)
         table.setDragDropOverwriteMode(False)
-        h_header.setSectionResizeMode(h_header.ResizeMode.Interactive)
+        self.staff_table.set_resize_modes(stretch=(), interactive=range(4))
 
         print("✓ Forced table drag protection")
 
     def load_staff_data(self):
         """Load all staff data into the table"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             print("Error: tw (table widget) not found")
             return
 
-        table = self.admin_home.tw
-
-        # CRITICAL: Block signals during table rebuild
-        table.blockSignals(True)
-
         try:
             staff_list = self.model.get_all_staff()
+            self.staff_table.set_records(staff_list)
 
-            # Clear table completely
-            table.clearContents()
-            table.setRowCount(0)
-
-            # Get header ONCE
-            header = table.horizontalHeader()
-
-            # Only set structure if needed
-            if table.columnCount() != 5:
-                table.setColumnCount(5)
-                table.setHorizontalHeaderLabels([
-                    "Name", "Email", "Date Applied", "Last Active", "StaffID"
-                ])
-                table.setColumnHidden(4, True)
-
-                # Set resize modes - Interactive for all (user can resize manually)
-                for col in range(4):
-                    header.setSectionResizeMode(col, header.ResizeMode.Interactive)
-
-            # Add staff data
-            for row_num, staff in enumerate(staff_list):
-                table.insertRow(row_num)
-
-                full_name = f"{staff['EFName']} {staff['EMName'] or ''} {staff['ELName']}".strip()
-                table.setItem(row_num, 0, QTableWidgetItem(full_name))
-                table.setItem(row_num, 1, QTableWidgetItem(staff['EEmail'] or ''))
-
-                date_applied = staff['SDateApplied'].strftime('%Y-%m-%d') if staff['SDateApplied'] else ''
-                table.setItem(row_num, 2, QTableWidgetItem(date_applied))
-
-                last_active = staff['LastActiveAt'].strftime('%Y-%m-%d %H:%M') if staff['LastActiveAt'] else 'Never'
-                table.setItem(row_num, 3, QTableWidgetItem(last_active))
-
-                staff_id_item = QTableWidgetItem()
-                staff_id_item.setData(Qt.ItemDataRole.UserRole, staff['StaffID'])
-                staff_id_item.setText(str(staff['StaffID']))
-                table.setItem(row_num, 4, staff_id_item)
+            # Interactive for all (user can resize manually)
+            self.staff_table.set_resize_modes(stretch=(), interactive=range(4))
 
         except Exception as e:
             import traceback
@@ -200,89 +167,42 @@ class AManagerControl:
                 "Error",
                 f"Failed to load staff data: {str(e)}"
             )
-        finally:
-            # CRITICAL: Always unblock signals
-            table.blockSignals(False)
 
     def search_staff(self):
-        """Search staff and stretch first column only during search"""
-        if not hasattr(self.admin_home, "line") or not hasattr(self.admin_home, "tw"):
+        """Search staff as the user types; the query runs off the GUI thread"""
+        if not hasattr(self.admin_home, "line") or not self.staff_table:
             return
 
         search_term = self.admin_home.line.text().strip()
-        table = self.admin_home.tw
 
         if not search_term:
             # Simply reload data
+            self.staff_search.cancel()
             self.load_staff_data()
             return
 
-        # CRITICAL: Block signals during table rebuild
-        table.blockSignals(True)
-
-        try:
-            staff_list = self.model.search_staff(search_term)
-
-            # Clear table completely
-            table.clearContents()
-            table.setRowCount(0)
-
-            # Get header ONCE
-            header = table.horizontalHeader()
-
-            # Only set structure if needed
-            if table.columnCount() != 5:
-                table.setColumnCount(5)
-                table.setHorizontalHeaderLabels([
-                    "Name", "Email", "Date Applied", "Last Active", "StaffID"
-                ])
-                table.setColumnHidden(4, True)
-
-            # Set resize modes for search (stretch name column)
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, header.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(2, header.ResizeMode.ResizeToContents)
-            header.setSectionResizeMode(3, header.ResizeMode.ResizeToContents)
+        self.staff_search.request(search_term)
 
-            # Add search results
-            for row_num, staff in enumerate(staff_list):
-                table.insertRow(row_num)
+    def search_staff_now(self):
+        """Enter in the search field: search without waiting for the debounce"""
+        if hasattr(self.admin_home, "line") and self.admin_home.line.text().strip():
+            self.staff_search.run_now(self.admin_home.line.text().strip())
 
-                full_name = f"{staff['EFName']} {staff['EMName'] or ''} {staff['ELName']}".strip()
-                table.setItem(row_num, 0, QTableWidgetItem(full_name))
-                table.setItem(row_num, 1, QTableWidgetItem(staff['EEmail'] or ''))
+    def apply_staff_search(self, search_term, staff_list):
+        """Show the result of the latest staff search and stretch the name column"""
+        self.staff_table.set_records(staff_list)
 
-                date_applied = staff['SDateApplied'].strftime('%Y-%m-%d') if staff['SDateApplied'] else ''
-                table.setItem(row_num, 2, QTableWidgetItem(date_applied))
-
-                last_active = staff['LastActiveAt'].strftime('%Y-%m-%d %H:%M') if staff['LastActiveAt'] else 'Never'
-                table.setItem(row_num, 3, QTableWidgetItem(last_active))
-
-                staff_id_item = QTableWidgetItem()
-                staff_id_item.setData(Qt.ItemDataRole.UserRole, staff['StaffID'])
-                staff_id_item.setText(str(staff['StaffID']))
-                table.setItem(row_num, 4, staff_id_item)
-
-        except Exception as e:
-            import traceback
-            traceback.print_exc()
-            QMessageBox.critical(
-                self.admin_home,
-                "Error",
-                f"Failed to search staff: {str(e)}"
-            )
-        finally:
-            # CRITICAL: Always unblock signals
-            table.blockSignals(False)
+        # Set resize modes for search (stretch name column)
+        self.staff_table.set_resize_modes(stretch=(0,), to_contents=(1, 2, 3))
 
     def show_staff_details(self):
         """Show staff details popup when View button is clicked"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             return
 
-        selected_items = self.admin_home.tw.selectedItems()
+        selected_row = self.staff_table.selected_row()
 
-        if not selected_items:
+        if selected_row is None:
             QMessageBox.warning(
                 self.admin_home,
                 "No Selection",
@@ -290,25 +210,12 @@ class AManagerControl:
             )
             return
 
-        selected_row = selected_items[0].row()
-        staff_id_item = self.admin_home.tw.item(selected_row, 4)
-
-        if not staff_id_item:
-            QMessageBox.warning(
-                self.admin_home,
-                "Error",
-                "Could not retrieve staff ID."
-            )
-            return
-
-        staff_id = staff_id_item.data(Qt.ItemDataRole.UserRole)
+        staff_id = self.staff_table.value(selected_row, "StaffID")
 
-        # ✅ ALWAYS create fresh popup - REMOVE the "if None" check
+        # Reuse the pooled popup and rebind it to this staff member
         from View.StaffDetailsPopup import StaffDetailsPopup
-        self.staff_popup = StaffDetailsPopup(parent=self.admin_home, model=self.model)
-
-        # Load data directly from database using the staff ID
-        success = self.staff_popup.loadStaffFromDatabase(staff_id)
+        self.staff_popup = popup_pool.open(StaffDetailsPopup, self.admin_home, self.model, staff_id)
+        success = self.staff_popup is not None
 
         if not success:
             QMessageBox.warning(self.admin_home, "Error", "Could not load staff details.")
@@ -319,6 +226,9 @@ class AManagerControl:
         self.staff_popup.raise_()
         self.staff_popup.activateWindow()
 
+        # Next row is the likeliest next open
+        popup_pool.prefetch(StaffDetailsPopup, self.model, self.staff_table.next_value("StaffID"))
+
 
 
     def on_table_double_click(self, row, column):
@@ -335,13 +245,13 @@ class AManagerControl:
 
     def edit_staff(self):
         """Edit selected staff member - FIXED VERSION"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             print("Error: Table widget not found")
             return
 
-        selected_items = self.admin_home.tw.selectedItems()
+        selected_row = self.staff_table.selected_row()
 
-        if not selected_items:
+        if selected_row is None:
             QMessageBox.warning(
                 self.admin_home,
                 "No Selection",
@@ -350,20 +260,8 @@ class AManagerControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            staff_name = self.admin_home.tw.item(selected_row, 0).text()
-
-            # Get StaffID from column 4
-            staff_id_item = self.admin_home.tw.item(selected_row, 4)
-            if not staff_id_item:
-                QMessageBox.warning(
-                    self.admin_home,
-                    "Error",
-                    "Could not retrieve staff ID from table."
-                )
-                return
-
-            staff_id = staff_id_item.data(Qt.ItemDataRole.UserRole)
+            staff_name = self.staff_table.text(selected_row, 0)
+            staff_id = self.staff_table.value(selected_row, "StaffID")
 
 
             # STORE the selected staff_id
@@ -419,12 +317,12 @@ class AManagerControl:
             )
     def delete_staff(self):
         """Delete selected staff member"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             return
 
-        selected_items = self.admin_home.tw.selectedItems()
+        selected_row = self.staff_table.selected_row()
 
-        if not selected_items:
+        if selected_row is None:
             QMessageBox.warning(
                 self.admin_home,
                 "No Selection",
@@ -432,11 +330,8 @@ class AManagerControl:
             )
             return
 
-        selected_row = selected_items[0].row()
-        staff_name = self.admin_home.tw.item(selected_row, 0).text()
-
-        staff_id_item = self.admin_home.tw.item(selected_row, 4)
-        staff_id = staff_id_item.data(Qt.ItemDataRole.UserRole)
+        staff_name = self.staff_table.text(selected_row, 0)
+        staff_id = self.staff_table.value(selected_row, "StaffID")
 
         reply = QMessageBox.question(
             self.admin_home,
@@ -448,7 +343,7 @@ class AManagerControl:
         if reply == QMessageBox.StandardButton.Yes:
             try:
                 if self.model.delete_staff(staff_id):
-                    self.admin_home.tw.removeRow(selected_row)
+                    self.staff_table.remove_row(selected_row)
                     QMessageBox.information(
                         self.admin_home,
                         "Success",
@@ -472,15 +367,15 @@ class AManagerControl:
 
     def sort_by_name(self):
         """Sort table by Name column"""
-        if not hasattr(self.admin_home, "tw"):
+        if not self.staff_table:
             return
 
         if self.sort_ascending:
-            self.admin_home.tw.sortItems(0, Qt.SortOrder.AscendingOrder)
+            self.staff_table.sort(0, ascending=True)
             if hasattr(self.admin_home, "name_srt_btn"):
                 self.admin_home.name_srt_btn.setText("Name ▲")
         else:
-            self.admin_home.tw.sortItems(0, Qt.SortOrder.DescendingOrder)
+            self.staff_table.sort(0, ascending=False)
             if hasattr(self.admin_home, "name_srt_btn"):
                 self.admin_home.name_srt_btn.setText("Name ▼")
 
@@ -515,7 +410,7 @@ class AManagerControl:
             try:
                 self.staff_popup.hide()
                 self.staff_popup.close()
-                self.staff_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.staff_popup = None
                 print("✓ Closed staff popup before logout confirmation")
             except Exception as e:
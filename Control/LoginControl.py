@@ -40,6 +40,55 @@ from View.StaffReportsView import SReports
 from Control.StaffDeliveryControl import SDeliveryControl
 from View.StaffEditOrderView import SEditOrder
 from Control.StaffEditOrderControl import SEditOrderControl
+from Model.query_log import query_stats
+
+
+class LazyObject:
+    """Stand-in for a view/controller that is only constructed on first use.
+
+    Any attribute access (or assignment) builds the real object and is
+    forwarded to it. call_when_built() queues a setter (e.g. set_staff_id)
+    that is applied right away if the object exists, or right after it is
+    built otherwise.
+    """
+
+    def __init__(self, factory):
+        object.__setattr__(self, '_factory', factory)
+        object.__setattr__(self, '_instance', None)
+        object.__setattr__(self, '_building', False)
+        object.__setattr__(self, '_deferred', {})
+
+    def is_built(self):
+        return self._instance is not None
+
+    def get(self):
+        if self._instance is None:
+            if self._building:
+                raise RuntimeError("Circular lazy construction")
+            object.__setattr__(self, '_building', True)
+            try:
+                instance = self._factory()
+            finally:
+                object.__setattr__(self, '_building', False)
+            object.__setattr__(self, '_instance', instance)
+            for name, args in self._deferred.items():
+                method = getattr(instance, name, None)
+                if method:
+                    method(*args)
+        return self._instance
+
+    def call_when_built(self, name, *args):
+        self._deferred[name] = args
+        if self._instance is not None:
+            method = getattr(self._instance, name, None)
+            if method:
+                method(*args)
+
+    def __getattr__(self, name):
+        return getattr(self.get(), name)
+
+    def __setattr__(self, name, value):
+        setattr(self.get(), name, value)
 
 
 class LoginController:
@@ -53,69 +102,112 @@ class LoginController:
         self.current_staff_id = None
         self.current_admin_id = None
 
+        # Views and controllers are created lazily: nothing below touches the
+        # database until a role logs in and a page is first navigated to.
+        lazy = LazyObject
+
         # Initialize views
         # AdminView
-        self.dashboard = ADashboard(admin_home, model)
-        self.manager = AManager(admin_home)
-        self.managerc = AManagerC(admin_home)
-        self.cstaff = CreateStaff(admin_home)
-        self.order = AOrders(admin_home)
-        self.report = AReport(admin_home)
-        self.ccv = CreateCustomer(admin_home)
-        self.editstaff = EditStaff(admin_home)
-        self.editcustomer = EditCustomer(admin_home)
+        self.dashboard = lazy(lambda: ADashboard(admin_home, model))
+        self.manager = lazy(lambda: AManager(admin_home))
+        self.managerc = lazy(lambda: AManagerC(admin_home))
+        self.cstaff = lazy(lambda: CreateStaff(admin_home))
+        self.order = lazy(lambda: AOrders(admin_home))
+        self.report = lazy(lambda: AReport(admin_home))
+        self.ccv = lazy(lambda: CreateCustomer(admin_home))
+        self.editstaff = lazy(lambda: EditStaff(admin_home))
+        self.editcustomer = lazy(lambda: EditCustomer(admin_home))
 
         # StaffView
-        self.staff_db = SDashboard(staff_home, model)
-        self.customer = SManagerC(staff_home)
-        self.staff_ccv = SCreateCustomer(staff_home)
-        self.staffeditcustomer = SEditCustomer(staff_home)
-        self.stafforder = SOrders(staff_home)
-        self.createorder = CreateOrderManager(staff_home)
-        self.staffreport = SReports(staff_home)
-        self.delivery = SDelivery(self.staff_home)
-        self.editorder = SEditOrder(staff_home)
-
-        self.finalize_popup = FinalizeOrderPopup(parent=staff_home, model=model)
+        self.staff_db = lazy(lambda: SDashboard(staff_home, model))
+        self.customer = lazy(lambda: SManagerC(staff_home))
+        self.staff_ccv = lazy(lambda: SCreateCustomer(staff_home))
+        self.staffeditcustomer = lazy(lambda: SEditCustomer(staff_home))
+        self.stafforder = lazy(lambda: SOrders(staff_home))
+        self.createorder = lazy(lambda: CreateOrderManager(staff_home))
+        self.staffreport = lazy(lambda: SReports(staff_home))
+        self.delivery = lazy(lambda: SDelivery(self.staff_home))
+        self.editorder = lazy(lambda: SEditOrder(staff_home))
+
+        self.finalize_popup = lazy(lambda: FinalizeOrderPopup(parent=staff_home, model=model))
 
         # Admin Controllers
-        self.home_controller = AHControl(admin_home, self.dashboard, self.manager, self.order, self.report, self.cstaff,self.view)
-        self.dashboard_controller = ADashBControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view)
-        self.editstaff_controller = Editstaffcontrol(self.model, self.admin_home, self.dashboard, self.manager,self.order, self.report, self.view)
-        self.editcustomer_control = EditCustomerControl(self.model, self.admin_home, self.dashboard, self.manager,self.managerc, self.order, self.report, self.view)
-        self.manager_controller = AManagerControl(admin_home, self.dashboard, self.manager, self.managerc, self.cstaff,self.order, self.report, self.model, self.editstaff,self.editstaff_controller, self.view)
-        self.managerc_controller = AManagerControlC(admin_home, self.dashboard, self.manager, self.managerc, self.order,self.report, self.ccv, self.model, self.editcustomer,self.editcustomer_control, self.view)
-        self.order_controller = AOrderControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view)
-        self.report_controller = AReportControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view)
-        self.customer_controller = CreateCustomerControl(self.model, admin_home, self.dashboard, self.manager,self.order, self.report, self.view, self.managerc_controller)
-        self.staff_controller = Createstaffcontrol(self.model, admin_home, self.dashboard, self.manager, self.order,self.report, self.view, self.manager_controller)
-
-        # Staff Controllers - Initialize in correct order
-        self.staff_home_controller = SHControl(staff_home, self.staff_db, self.customer, self.stafforder, self.delivery,self.staffreport, self.view)
-        self.staff_dashboard_controller = SDashBControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.view)
-        self.staff_editcustomer_controller = SEditCustomerControl(self.model, staff_home, self.staff_db, self.customer,self.delivery, self.stafforder, self.staffreport,self.view)
-
-        # Initialize edit order controller FIRST (before order controller)
-        self.staff_editorder_controller = SEditOrderControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view)
-
-        # Initialize order controller WITH edit_order_control parameter
-        self.staff_order_controller = SOControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, model, self.view,edit_order_control=self.staff_editorder_controller)
-
-        self.staff_report_controller = SReportControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view)
-        self.staff_delivery_controller = SDeliveryControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view)
-
-        self.staff_smanagerc_controller = SManagerCControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.createorder, self.staffreport,self.model, self.staffeditcustomer,self.staff_editcustomer_controller, self.view)
-
-        # Create order controller
-        self.staff_createorder_controller = CreateOrderControl(staff_home, self.staff_db, self.customer,self.stafforder, self.delivery, self.staffreport,self.model, self.view, self.staff_smanagerc_controller,self.staff_order_controller)
-
-        # Set cross-references
-        self.staff_smanagerc_controller.createorder_control = self.staff_createorder_controller
-        self.staff_createcustomer_controller = SCreateCustomerControl(self.model, staff_home, self.staff_db,self.customer, self.stafforder, self.delivery,self.staffreport, self.view,self.staff_smanagerc_controller)
-        self.staff_delivery_controller.order_controller = self.staff_order_controller
+        self.home_controller = lazy(lambda: AHControl(admin_home, self.dashboard, self.manager, self.order, self.report, self.cstaff,self.view))
+        self.dashboard_controller = lazy(lambda: ADashBControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view))
+        self.editstaff_controller = lazy(lambda: Editstaffcontrol(self.model, self.admin_home, self.dashboard, self.manager,self.order, self.report, self.view))
+        self.editcustomer_control = lazy(lambda: EditCustomerControl(self.model, self.admin_home, self.dashboard, self.manager,self.managerc, self.order, self.report, self.view))
+        self.manager_controller = lazy(lambda: AManagerControl(admin_home, self.dashboard, self.manager, self.managerc, self.cstaff,self.order, self.report, self.model, self.editstaff,self.editstaff_controller, self.view))
+        self.managerc_controller = lazy(lambda: AManagerControlC(admin_home, self.dashboard, self.manager, self.managerc, self.order,self.report, self.ccv, self.model, self.editcustomer,self.editcustomer_control, self.view))
+        self.order_controller = lazy(lambda: AOrderControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view))
+        self.report_controller = lazy(lambda: AReportControl(admin_home, self.dashboard, self.manager, self.order, self.report,self.model, self.view))
+        self.customer_controller = lazy(lambda: CreateCustomerControl(self.model, admin_home, self.dashboard, self.manager,self.order, self.report, self.view, self.managerc_controller))
+        self.staff_controller = lazy(lambda: Createstaffcontrol(self.model, admin_home, self.dashboard, self.manager, self.order,self.report, self.view, self.manager_controller))
+
+        # Staff Controllers
+        self.staff_home_controller = lazy(lambda: SHControl(staff_home, self.staff_db, self.customer, self.stafforder, self.delivery,self.staffreport, self.view))
+        self.staff_dashboard_controller = lazy(lambda: SDashBControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.view))
+        self.staff_editcustomer_controller = lazy(lambda: SEditCustomerControl(self.model, staff_home, self.staff_db, self.customer,self.delivery, self.stafforder, self.staffreport,self.view))
+        self.staff_editorder_controller = lazy(lambda: SEditOrderControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view))
+        self.staff_order_controller = lazy(lambda: SOControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, model, self.view,edit_order_control=self.staff_editorder_controller))
+        self.staff_report_controller = lazy(lambda: SReportControl(staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view))
+        self.staff_delivery_controller = lazy(self._build_staff_delivery_controller)
+        self.staff_smanagerc_controller = lazy(self._build_staff_smanagerc_controller)
+        self.staff_createorder_controller = lazy(lambda: CreateOrderControl(staff_home, self.staff_db, self.customer,self.stafforder, self.delivery, self.staffreport,self.model, self.view, self.staff_smanagerc_controller,self.staff_order_controller))
+        self.staff_createcustomer_controller = lazy(lambda: SCreateCustomerControl(self.model, staff_home, self.staff_db,self.customer, self.stafforder, self.delivery,self.staffreport, self.view,self.staff_smanagerc_controller))
+
+        # Which view/controller owns each stacked page; built on first visit
+        self.admin_pages = {
+            admin_home.home_page_index: [self.home_controller],
+            admin_home.dashboard_page_index: [self.dashboard, self.dashboard_controller],
+            admin_home.users_page_index: [self.manager, self.manager_controller],
+            admin_home.managerc_page_index: [self.managerc, self.managerc_controller],
+            admin_home.CreateStaff_page_index: [self.cstaff, self.staff_controller],
+            admin_home.order_page_index: [self.order, self.order_controller],
+            admin_home.report_page_index: [self.report, self.report_controller],
+            admin_home.CreateCustomer_page_index: [self.ccv, self.customer_controller],
+            admin_home.EditStaff_page_index: [self.editstaff, self.editstaff_controller],
+            admin_home.EditCustomer_page_index: [self.editcustomer, self.editcustomer_control],
+        }
+        self.staff_pages = {
+            staff_home.home_page_index: [self.staff_home_controller],
+            staff_home.dashboard_page_index: [self.staff_db, self.staff_dashboard_controller],
+            staff_home.customer_page_index: [self.customer, self.staff_smanagerc_controller],
+            staff_home.order_page_index: [self.stafforder, self.staff_order_controller],
+            staff_home.report_page_index: [self.staffreport, self.staff_report_controller],
+            staff_home.CreateCustomer_page_index: [self.staff_ccv, self.staff_createcustomer_controller],
+            staff_home.EditCustomer_page_index: [self.staffeditcustomer, self.staff_editcustomer_controller],
+            staff_home.CreateOrder_page_index: [self.createorder, self.staff_createorder_controller],
+            staff_home.EditOrder_page_index: [self.editorder, self.staff_editorder_controller],
+            staff_home.Delivery_page_index: [self.delivery, self.staff_delivery_controller],
+        }
+        # Connected first so the queries of building/opening a page count for it
+        query_stats.watch_pages(admin_home.stackedWidget, "Admin")
+        query_stats.watch_pages(staff_home.stackedWidget, "Staff")
+        admin_home.stackedWidget.currentChanged.connect(
+            lambda index: self.build_page(self.admin_pages, index))
+        staff_home.stackedWidget.currentChanged.connect(
+            lambda index: self.build_page(self.staff_pages, index))
+
         # Connect login button
         self.view.login_btn.clicked.connect(self.handle_login)
 
+    def _build_staff_delivery_controller(self):
+        controller = SDeliveryControl(self.staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.staffreport, self.model, self.view)
+        controller.order_controller = self.staff_order_controller
+        return controller
+
+    def _build_staff_smanagerc_controller(self):
+        controller = SManagerCControl(self.staff_home, self.staff_db, self.customer, self.stafforder,self.delivery, self.createorder, self.staffreport,self.model, self.staffeditcustomer,self.staff_editcustomer_controller, self.view)
+        controller.createorder_control = self.staff_createorder_controller
+        return controller
+
+    def build_page(self, pages, index):
+        """Build the view/controller of a stacked page the first time it is shown"""
+        for lazy_object in pages.get(index, []):
+            if not lazy_object.is_built():
+                lazy_object.get()
+                print(f"✓ Built {type(lazy_object.get()).__name__} for page {index}")
+
     def handle_login(self):
         try:
             username = self.view.username.text().strip()
@@ -157,10 +249,9 @@ class LoginController:
                 # Set admin context in home controller
                 self.home_controller.set_admin_context(admin_id)
 
-                # Set admin ID in customer controller
-                if hasattr(self.customer_controller, 'set_admin_id'):
-                    self.customer_controller.set_admin_id(admin_id)
-                    print(f"✓ Set admin ID in CreateCustomerControl: {admin_id}")
+                # Set admin ID in customer controller (applied when it is built)
+                self.customer_controller.call_when_built('set_admin_id', admin_id)
+                print(f"✓ Set admin ID in CreateCustomerControl: {admin_id}")
 
                 # Clear login view and show admin home
                 self.view.close()
@@ -204,43 +295,21 @@ class LoginController:
                     self.staff_home_controller.set_staff_context(self.current_staff_id)
                     print(f"✓ Set staff ID in SHControl: {self.current_staff_id}")
 
-                # Set staff ID in ALL controllers that need it:
-
-                # 1. Edit Customer Controller
-                if hasattr(self.staff_editcustomer_controller, 'set_staff_id'):
-                    self.staff_editcustomer_controller.set_staff_id(self.current_staff_id)
-                    print(f"✓ Set staff ID in SEditCustomerControl: {self.current_staff_id}")
-
-                # 2. Edit Order Controller (already has it)
-                if hasattr(self.staff_editorder_controller, 'set_staff_id'):
-                    self.staff_editorder_controller.set_staff_id(self.current_staff_id)
-                    print(f"✓ Set staff ID in SEditOrderControl: {self.current_staff_id}")
-
-                # 3. Create Order Controller (already has it)
-                self.staff_createorder_controller.set_staff_id(self.current_staff_id)
-                print(f"✓ Set staff ID in CreateOrderControl: {self.current_staff_id}")
-
-                # 4. Create Customer Controller (already has it)
-                self.staff_createcustomer_controller.set_staff_id(self.current_staff_id)
-                print(f"✓ Set staff ID in CreateCustomerControl: {self.current_staff_id}")
-
-                # 5. Delivery Controller
-                self.staff_delivery_controller.set_staff_context(self.current_staff_id)
-                print(f"✓ Set staff ID in DeliveryControl: {self.current_staff_id}")
-
-                # 6. Finalize popup
-                self.finalize_popup.set_staff_id(self.current_staff_id)
-                print(f"✓ Set staff ID in FinalizeOrderPopup: {self.current_staff_id}")
-
-                # 7. Customer Manager Controller (SManagerCControl)
-                if hasattr(self.staff_smanagerc_controller, 'set_staff_id'):
-                    self.staff_smanagerc_controller.set_staff_id(self.current_staff_id)
-                    print(f"✓ Set staff ID in SManagerCControl: {self.current_staff_id}")
-
-                # 8. Order Controller (SOControl)
-                if hasattr(self.staff_order_controller, 'set_staff_id'):
-                    self.staff_order_controller.set_staff_id(self.current_staff_id)
-                    print(f"✓ Set staff ID in SOControl: {self.current_staff_id}")
+                # Set staff ID in ALL controllers that need it. Pages that
+                # have not been opened yet receive it when they are built.
+                staff_setters = [
+                    (self.staff_editcustomer_controller, 'set_staff_id'),
+                    (self.staff_editorder_controller, 'set_staff_id'),
+                    (self.staff_createorder_controller, 'set_staff_id'),
+                    (self.staff_createcustomer_controller, 'set_staff_id'),
+                    (self.staff_delivery_controller, 'set_staff_context'),
+                    (self.finalize_popup, 'set_staff_id'),
+                    (self.staff_smanagerc_controller, 'set_staff_id'),
+                    (self.staff_order_controller, 'set_staff_id'),
+                ]
+                for lazy_object, setter in staff_setters:
+                    lazy_object.call_when_built(setter, self.current_staff_id)
+                print(f"✓ Set staff ID in staff controllers: {self.current_staff_id}")
 
                 self.view.close()
                 self.staff_home.show()
@@ -224,26 +224,27 @@ class CreateOrderControl:
 
             customer_id = self.selected_customer_id
 
-            # Create order in database
-            order_id = self.model.create_order(
+            # Create order, service line and activity log in one transaction
+            order_id = self.model.create_order_with_service(
                 customer_id=customer_id,
                 staff_id=self.staff_id,
-                total_amount=total_amount,
+                service={
+                    'service_name': "Laundry Service",
+                    'weight_kg': weight,
+                    'price_per_kg': self.WASH_PRICE_PER_KG,
+                    'wash_amount': wash_total,
+                    'fast_dry': self.staff_home.fastDryCheckbox.isChecked(),
+                    'fast_dry_amount': fast_dry_total,
+                    'iron_only': self.staff_home.ironCheckbox.isChecked(),
+                    'iron_only_amount': iron_total,
+                    'fold': self.staff_home.foldCheckbox.isChecked(),
+                    'fold_amount': fold_total,
+                    'total_amount': total_amount
+                },
                 status='Pending'  # Initially Pending, not Completed
             )
 
             if order_id:
-                # Log activity
-                self.model.log_staff_activity(
-                    staff_id=self.staff_id,
-                    activity_type='CREATE_ORDER',
-                    order_id=order_id,
-                    customer_id=customer_id
-                )
-
-                # Update last active timestamp
-                self.model.update_staff_last_active(self.staff_id)
-
                 print(f"✓ Order {order_id} created and activity logged for Staff ID {self.staff_id}")
             else:
                 QMessageBox.critical(
@@ -253,29 +254,6 @@ class CreateOrderControl:
                 )
                 return
 
-            # Add order service details
-            service_id = self.model.add_order_service(
-                order_id=order_id,
-                service_name="Laundry Service",
-                weight_kg=weight,
-                price_per_kg=self.WASH_PRICE_PER_KG,
-                wash_amount=wash_total,
-                fast_dry=self.staff_home.fastDryCheckbox.isChecked(),
-                fast_dry_amount=fast_dry_total,
-                iron_only=self.staff_home.ironCheckbox.isChecked(),
-                iron_only_amount=iron_total,
-                fold=self.staff_home.foldCheckbox.isChecked(),
-                fold_amount=fold_total,
-                total_amount=total_amount
-            )
-
-            if not service_id:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Warning",
-                    "Order created but failed to add service details."
-                )
-
             # IMPORTANT: DO NOT CREATE TRANSACTION HERE
             # Transactions should only be created when payment is made
             # or when order is completed
@@ -1,7 +1,8 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
+from PyQt6.QtWidgets import QMessageBox
 
 from View.CustomerDetailsPopup import CustomerDetailsPopup
+from View.PopupPool import popup_pool
+from View.DataTable import DataTable, TableColumn
 
 
 class SManagerCControl:
@@ -34,6 +35,13 @@ class SManagerCControl:
         if hasattr(self.customer, 'parent') and hasattr(self.customer.parent(), 'currentChanged'):
             self.customer.parent().currentChanged.connect(self.on_page_changed)
 
+        # Model/view table replacing tableWidget_2
+        self.customer_table = None
+        self.setup_customer_table()
+
+        # Build the details popup in idle time so the first double-click is quick
+        popup_pool.warm(CustomerDetailsPopup, self.staff_home, self.model)
+
         # Connect buttons from Customer Manager page
         self.connect_managerc_buttons()
         self.customer_popup = None
@@ -119,48 +127,39 @@ class SManagerCControl:
             self.staff_home.name_srt_btn_2.clicked.connect(self.sort_customer_by_name)
 
         # Customer table double-click
-        if hasattr(self.staff_home, "tableWidget_2"):
-            self.staff_home.tableWidget_2.cellDoubleClicked.connect(self.on_customer_table_double_click)
+        if self.customer_table:
+            self.customer_table.on_double_click(self.on_customer_table_double_click)
+
+    def setup_customer_table(self):
+        """Replace the customer QTableWidget with the shared model/view table"""
+        if not hasattr(self.staff_home, "tableWidget_2"):
+            return
+
+        def last_order_text(customer):
+            last_order = customer.get('last_order_date')
+            if not last_order:
+                return 'No orders'
+            return last_order.strftime('%Y-%m-%d') if hasattr(last_order, 'strftime') else str(last_order)
+
+        self.customer_table = DataTable(self.staff_home, "tableWidget_2", [
+            TableColumn("Name", lambda c: ' '.join(f"{c['CFName']} {c['CMName'] or ''} {c['CLName']}".split())),
+            TableColumn("Total Orders", lambda c: str(c.get('total_orders', 0)),
+                        sort_key=lambda c: c.get('total_orders', 0)),
+            TableColumn("Last Order", last_order_text, sort_key=lambda c: c.get('last_order_date')),
+        ], keys=("CustomerID",))
 
     def load_customer_data(self):
         """Load all customer data into the table with correct structure and stretch first column"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             print("Error: tableWidget_2 not found")
             return
 
         try:
             customer_list = self.model.get_all_customers()
-            table = self.staff_home.tableWidget_2
-            table.setRowCount(0)
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["Name", "Total Orders", "Last Order", "CustomerID"])
-            table.setColumnHidden(3, True)
-
-            for row_num, customer in enumerate(customer_list):
-                table.insertRow(row_num)
-
-                # Full Name
-                full_name = f"{customer['CFName']} {customer['CMName'] or ''} {customer['CLName']}".strip()
-                table.setItem(row_num, 0, QTableWidgetItem(' '.join(full_name.split())))
-
-                # Total Orders
-                table.setItem(row_num, 1, QTableWidgetItem(str(customer.get('total_orders', 0))))
-
-                # Last Order
-                last_order = customer.get('last_order_date')
-                last_order_str = last_order.strftime('%Y-%m-%d') if last_order and hasattr(last_order, 'strftime') else ('No orders' if not last_order else str(last_order))
-                table.setItem(row_num, 2, QTableWidgetItem(last_order_str))
-
-                # CustomerID (hidden)
-                customer_id_item = QTableWidgetItem()
-                customer_id_item.setData(Qt.ItemDataRole.UserRole, customer['CustomerID'])
-                table.setItem(row_num, 3, customer_id_item)
+            self.customer_table.set_records(customer_list)
 
             # Stretch first column, other columns to contents
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            for col in range(1, 3):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.customer_table.set_resize_modes(stretch=(0,), to_contents=(1, 2))
 
             print(f"✓ Staff: Loaded {len(customer_list)} customers")
 
@@ -176,52 +175,18 @@ class SManagerCControl:
 
     def search_customer(self):
         """Search customers and stretch first column during search"""
-        if not hasattr(self.staff_home, "line2") or not hasattr(self.staff_home, "tableWidget_2"):
+        if not hasattr(self.staff_home, "line2") or not self.customer_table:
             return
 
         search_term = self.staff_home.line2.text().strip()
-        table = self.staff_home.tableWidget_2
-        header = table.horizontalHeader()
-
-        # Store original resize modes once
-        if not hasattr(self, "original_resize_modes_customer"):
-            self.original_resize_modes_customer = []
-            for col in range(table.columnCount()):
-                self.original_resize_modes_customer.append(header.sectionResizeMode(col))
 
         if not search_term:
-            # Restore original modes
-            if hasattr(self, "original_resize_modes_customer"):
-                for col, mode in enumerate(self.original_resize_modes_customer):
-                    header.setSectionResizeMode(col, mode)
             self.load_customer_data()
             return
 
-        # Stretch first column, other columns to contents
-        header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-        for col in range(1, 3):
-            header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
-
         try:
             customer_list = self.model.search_customers(search_term)
-
-            # Clear and setup table
-            table.setRowCount(0)
-            table.setColumnCount(4)
-            table.setHorizontalHeaderLabels(["Name", "Total Orders", "Last Order", "CustomerID"])
-            table.setColumnHidden(3, True)
-
-            for row_num, customer in enumerate(customer_list):
-                table.insertRow(row_num)
-                full_name = f"{customer['CFName']} {customer['CMName'] or ''} {customer['CLName']}".strip()
-                table.setItem(row_num, 0, QTableWidgetItem(' '.join(full_name.split())))
-                table.setItem(row_num, 1, QTableWidgetItem(str(customer.get('total_orders', 0))))
-                last_order = customer.get('last_order_date')
-                last_order_str = last_order.strftime('%Y-%m-%d') if last_order and hasattr(last_order, 'strftime') else ('No orders' if not last_order else str(last_order))
-                table.setItem(row_num, 2, QTableWidgetItem(last_order_str))
-                customer_id_item = QTableWidgetItem()
-                customer_id_item.setData(Qt.ItemDataRole.UserRole, customer['CustomerID'])
-                table.setItem(row_num, 3, customer_id_item)
+            self.customer_table.set_records(customer_list)
 
             print(f"✓ Staff: Found {len(customer_list)} customers matching '{search_term}'")
 
@@ -232,27 +197,17 @@ class SManagerCControl:
 
     def show_customer_details(self):
         """Show customer details popup"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             return
 
-        selected_items = self.staff_home.tableWidget_2.selectedItems()
-        if not selected_items:
+        customer_id = self.customer_table.selected_value("CustomerID")
+        if customer_id is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select a customer first.")
             return
 
-        selected_row = selected_items[0].row()
-        customer_id_item = self.staff_home.tableWidget_2.item(selected_row, 3)
-
-        if not customer_id_item:
-            return
-
-        customer_id = customer_id_item.data(Qt.ItemDataRole.UserRole)
-
-        # ✅ ALWAYS create a fresh popup instance
-        self.customer_popup = CustomerDetailsPopup(parent=self.staff_home, model=self.model)
-
-        # Load data directly from database using the customer ID
-        success = self.customer_popup.loadCustomerFromDatabase(customer_id)
+        # Reuse the pooled popup and rebind it to this customer
+        self.customer_popup = popup_pool.open(CustomerDetailsPopup, self.staff_home, self.model, customer_id)
+        success = self.customer_popup is not None
 
         if not success:
             QMessageBox.warning(self.staff_home, "Error", "Could not load customer details.")
@@ -263,19 +218,22 @@ class SManagerCControl:
         self.customer_popup.raise_()
         self.customer_popup.activateWindow()
 
+        # Next row is the likeliest next open
+        popup_pool.prefetch(CustomerDetailsPopup, self.model, self.customer_table.next_value("CustomerID"))
+
     def on_customer_table_double_click(self, row, column):
         """Handle double-click on customer table"""
         self.show_customer_details()
 
     def edit_customer(self):
         """Edit selected customer"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             print("Error: Table widget not found")
             return
 
-        selected_items = self.staff_home.tableWidget_2.selectedItems()
+        selected_row = self.customer_table.selected_row()
 
-        if not selected_items:
+        if selected_row is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -284,20 +242,8 @@ class SManagerCControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            customer_name = self.staff_home.tableWidget_2.item(selected_row, 0).text()
-
-            # Get CustomerID from column 3 (hidden)
-            customer_id_item = self.staff_home.tableWidget_2.item(selected_row, 3)
-            if not customer_id_item:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Error",
-                    "Could not retrieve customer ID from table."
-                )
-                return
-
-            customer_id = customer_id_item.data(Qt.ItemDataRole.UserRole)
+            customer_name = self.customer_table.text(selected_row, 0)
+            customer_id = self.customer_table.value(selected_row, "CustomerID")
 
             print(f"✓ Staff: Editing customer: {customer_name} (ID: {customer_id})")
 
@@ -325,22 +271,16 @@ class SManagerCControl:
 
     def delete_customer(self):
         """Delete customer"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             return
 
-        selected_items = self.staff_home.tableWidget_2.selectedItems()
-        if not selected_items:
+        selected_row = self.customer_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select a customer to delete.")
             return
 
-        selected_row = selected_items[0].row()
-        customer_name = self.staff_home.tableWidget_2.item(selected_row, 0).text()
-        customer_id_item = self.staff_home.tableWidget_2.item(selected_row, 3)
-
-        if not customer_id_item:
-            return
-
-        customer_id = customer_id_item.data(Qt.ItemDataRole.UserRole)
+        customer_name = self.customer_table.text(selected_row, 0)
+        customer_id = self.customer_table.value(selected_row, "CustomerID")
 
         reply = QMessageBox.question(
             self.staff_home,
@@ -353,7 +293,7 @@ class SManagerCControl:
             try:
                 success = self.model.delete_customer(customer_id)
                 if success:
-                    self.staff_home.tableWidget_2.removeRow(selected_row)
+                    self.customer_table.remove_row(selected_row)
                     print(f"✓ Staff: Deleted customer: {customer_name}")
                     QMessageBox.information(self.staff_home, "Success", "Customer deleted successfully!")
                 else:
@@ -364,13 +304,13 @@ class SManagerCControl:
 
     def create_order_for_customer(self):
         """Navigate to Create Order page with selected customer pre-loaded"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             print("Error: Table widget not found")
             return
 
-        selected_items = self.staff_home.tableWidget_2.selectedItems()
+        selected_row = self.customer_table.selected_row()
 
-        if not selected_items:
+        if selected_row is None:
             QMessageBox.information(
                 self.staff_home,
                 "No Selection",
@@ -379,20 +319,8 @@ class SManagerCControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            customer_name = self.staff_home.tableWidget_2.item(selected_row, 0).text()
-
-            # Get CustomerID from column 3 (hidden)
-            customer_id_item = self.staff_home.tableWidget_2.item(selected_row, 3)
-            if not customer_id_item:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Error",
-                    "Could not retrieve customer ID from table."
-                )
-                return
-
-            customer_id = customer_id_item.data(Qt.ItemDataRole.UserRole)
+            customer_name = self.customer_table.text(selected_row, 0)
+            customer_id = self.customer_table.value(selected_row, "CustomerID")
 
             print(f"✓ Staff: Creating order for customer: {customer_name} (ID: {customer_id})")
 
@@ -423,15 +351,15 @@ class SManagerCControl:
 
     def sort_customer_by_name(self):
         """Sort customer table by Name"""
-        if not hasattr(self.staff_home, "tableWidget_2"):
+        if not self.customer_table:
             return
 
         if self.sort_ascending_customer:
-            self.staff_home.tableWidget_2.sortItems(0, Qt.SortOrder.AscendingOrder)
+            self.customer_table.sort(0, ascending=True)
             if hasattr(self.staff_home, "name_srt_btn_2"):
                 self.staff_home.name_srt_btn_2.setText("Ascending")
         else:
-            self.staff_home.tableWidget_2.sortItems(0, Qt.SortOrder.DescendingOrder)
+            self.customer_table.sort(0, ascending=False)
             if hasattr(self.staff_home, "name_srt_btn_2"):
                 self.staff_home.name_srt_btn_2.setText("Descending")
 
@@ -471,7 +399,7 @@ class SManagerCControl:
             try:
                 self.customer_popup.hide()
                 self.customer_popup.close()
-                self.customer_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.customer_popup = None
                 print("✓ Closed customer popup before logout confirmation")
             except Exception as e:
@@ -1,8 +1,11 @@
 from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
+from PyQt6.QtWidgets import QMessageBox
 from datetime import datetime
 
 from View.OrderPopup import OrderDetailsPopup
+from View.PopupPool import popup_pool
+from View.DataTable import DataTable, TableColumn, status_color
+from View.LiveSearch import LiveSearch
 from View.FinalizeOrderPopup import FinalizeOrderPopup
 
 
@@ -37,6 +40,15 @@ class SDeliveryControl:
         self.sort_ascending_pickup = True
         self.sort_ascending_delivery = True
 
+        # Model/view tables replacing tableWidget_5 / tableWidget_6
+        self.pickup_table = None
+        self.delivery_table = None
+        self.setup_delivery_tables()
+
+        # Debounced search on line4_2, queried on a worker thread
+        self.pickup_search = LiveSearch(self.query_pickups, self.apply_pickup_search,
+                                        name="Pickup search")
+
         # Connect buttons and signals
         self.connect_delivery_buttons()
 
@@ -69,6 +81,38 @@ class SDeliveryControl:
 
         print(f"✓ Delivery - Staff context set: StaffID = {staff_id}")
 
+    def setup_delivery_tables(self):
+        """Replace the pickup/delivery QTableWidgets with the shared model/view table"""
+        def status_column():
+            return TableColumn("Status", lambda o: o.get('Status', ''),
+                               color=lambda o: status_color(o.get('Status')),
+                               align=Qt.AlignmentFlag.AlignCenter)
+
+        def customer_column():
+            return TableColumn("Name", lambda o: o.get('customer_name') or 'Unknown')
+
+        if hasattr(self.staff_home, "tableWidget_5"):
+            self.pickup_table = DataTable(self.staff_home, "tableWidget_5", [
+                customer_column(),
+                TableColumn("Scheduled Time",
+                            lambda o: self.format_datetime_display(o['OrderDate'])
+                            if o.get('OrderDate') else "Not scheduled yet",
+                            sort_key=lambda o: o.get('OrderDate')),
+                status_column(),
+            ], keys=("OrderID",))
+            self.pickup_table.set_resize_modes(stretch=(0,), to_contents=(1, 2))
+
+        if hasattr(self.staff_home, "tableWidget_6"):
+            self.delivery_table = DataTable(self.staff_home, "tableWidget_6", [
+                customer_column(),
+                TableColumn("Pickup Time",
+                            lambda o: self.format_datetime_display(o['DatePicked'])
+                            if o.get('DatePicked') else "Not picked up yet",
+                            sort_key=lambda o: o.get('DatePicked')),
+                status_column(),
+            ], keys=("OrderID",))
+            self.delivery_table.set_resize_modes(stretch=(0,), to_contents=(1, 2))
+
     def format_order_id(self, order_id):
         """Format order ID as WSHY#001, WSHY#002, etc."""
         return f"WSHY#{order_id:03d}"
@@ -129,62 +173,22 @@ class SDeliveryControl:
             self.staff_home.crt_btn_5.clicked.connect(self.view_selected_order)
 
         # Double-click on tables
-        if hasattr(self.staff_home, "tableWidget_5"):
-            self.staff_home.tableWidget_5.cellDoubleClicked.connect(self.on_pickup_table_double_click)
+        if self.pickup_table:
+            self.pickup_table.on_double_click(self.on_pickup_table_double_click)
 
-        if hasattr(self.staff_home, "tableWidget_6"):
-            self.staff_home.tableWidget_6.cellDoubleClicked.connect(self.on_delivery_table_double_click)
+        if self.delivery_table:
+            self.delivery_table.on_double_click(self.on_delivery_table_double_click)
 
     def load_pending_pickups(self):
         """Load orders pending pickup into tableWidget_5"""
-        if not hasattr(self.staff_home, "tableWidget_5"):
+        if not self.pickup_table:
             print("Error: tableWidget_5 not found")
             return
 
         try:
             # Get orders with status 'Pending' (waiting for pickup)
             orders = self.model.get_orders_by_status('Pending')
-
-            table = self.staff_home.tableWidget_5
-            table.setRowCount(0)
-            table.setColumnCount(3)
-            table.setHorizontalHeaderLabels(["Name", "Scheduled Time", "Status"])
-
-            for row_num, order in enumerate(orders):
-                table.insertRow(row_num)
-
-                # Customer Name
-                customer_name = order.get('customer_name', 'Unknown')
-                name_item = QTableWidgetItem(customer_name)
-                name_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 0, name_item)
-
-                # Get scheduled pickup time with shortened month
-                order_date = order.get('OrderDate')
-                if order_date:
-                    scheduled_time = self.format_datetime_display(order_date)
-                else:
-                    scheduled_time = "Not scheduled yet"
-
-                table.setItem(row_num, 1, QTableWidgetItem(scheduled_time))
-
-                # Status
-                status = order.get('Status', 'Pending')
-                status_item = QTableWidgetItem(status)
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.setItem(row_num, 2, status_item)
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-
-            # Resize columns
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            for col in range(1, 3):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.pickup_table.set_records(orders)
 
             print(f"✓ Loaded {len(orders)} pending pickups")
 
@@ -195,7 +199,7 @@ class SDeliveryControl:
 
     def load_pending_deliveries(self):
         """Load orders pending delivery into tableWidget_6"""
-        if not hasattr(self.staff_home, "tableWidget_6"):
+        if not self.delivery_table:
             print("Error: tableWidget_6 not found")
             return
 
@@ -205,48 +209,8 @@ class SDeliveryControl:
             ready_orders = self.model.get_orders_by_status('Ready')
             orders = processing_orders + ready_orders
 
-            table = self.staff_home.tableWidget_6
-            table.setRowCount(0)
-            table.setColumnCount(3)
-            table.setHorizontalHeaderLabels(["Name", "Pickup Time", "Status"])
-
-            for row_num, order in enumerate(orders):
-                table.insertRow(row_num)
-
-                # Customer Name
-                customer_name = order.get('customer_name', 'Unknown')
-                name_item = QTableWidgetItem(customer_name)
-                name_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 0, name_item)
-
-                # Get actual pickup time from DatePicked with shortened month
-                order_id = order['OrderID']
-                order_details = self.model.get_order_by_id(order_id)
-
-                if order_details and order_details.get('DatePicked'):
-                    pickup_time = self.format_datetime_display(order_details['DatePicked'])
-                else:
-                    pickup_time = "Not picked up yet"
-
-                table.setItem(row_num, 1, QTableWidgetItem(pickup_time))
-
-                # Status
-                status = order.get('Status', 'Processing')
-                status_item = QTableWidgetItem(status)
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.setItem(row_num, 2, status_item)
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing' or status == 'Ready':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-
-            # Resize columns
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            for col in range(1, 3):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            # Pickup time comes from DatePicked (already part of the get_orders_by_status row)
+            self.delivery_table.set_records(orders)
 
             print(f"✓ Loaded {len(orders)} pending deliveries")
 
@@ -257,11 +221,11 @@ class SDeliveryControl:
 
     def mark_as_picked_up(self):
         """Mark selected order as picked up"""
-        if not hasattr(self.staff_home, "tableWidget_5"):
+        if not self.pickup_table:
             return
 
-        selected_items = self.staff_home.tableWidget_5.selectedItems()
-        if not selected_items:
+        selected_row = self.pickup_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -279,9 +243,8 @@ class SDeliveryControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            customer_name = self.staff_home.tableWidget_5.item(selected_row, 0).text()
-            order_id = self.staff_home.tableWidget_5.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
+            customer_name = self.pickup_table.text(selected_row, 0)
+            order_id = self.pickup_table.value(selected_row, "OrderID")
 
             if not order_id:
                 return
@@ -301,36 +264,11 @@ class SDeliveryControl:
             pickup_time = datetime.now()
 
             # Update order: set status to 'Processing', set DatePicked, and set StaffID
+            # (one transaction with the activity log and the daily order summary)
             try:
-                cursor = self.model.conn.cursor()
-
-                # Update order with pickup time and staff who processed it
-                query = """
-                        UPDATE Orders
-                        SET Status     = %s,
-                            DatePicked = %s,
-                            StaffID    = %s
-                        WHERE OrderID = %s
-                        """
-                cursor.execute(query, ('Processing', pickup_time, self.current_staff_id, order_id))
-
-                # Log activity
-                cursor.execute("""
-                               INSERT INTO StaffActivityLog
-                                   (StaffID, ActivityType, OrderID, CustomerID, ActivityTime)
-                               VALUES (%s, %s, %s, %s, %s)
-                               """, (self.current_staff_id, 'PICKUP_ORDER', order_id,
-                                     order_details.get('CustomerID'), pickup_time))
-
-                # UPDATE LAST ACTIVE TIMESTAMP
-                cursor.execute("""
-                               UPDATE Staff
-                               SET LastActiveAt = %s
-                               WHERE StaffID = %s
-                               """, (pickup_time, self.current_staff_id))
-
-                self.model.conn.commit()
-                cursor.close()
+                if not self.model.mark_order_picked_up(order_id, self.current_staff_id,
+                                                       order_details.get('CustomerID'), pickup_time):
+                    return
 
                 # Use shortened month in confirmation message
                 QMessageBox.information(
@@ -351,7 +289,6 @@ class SDeliveryControl:
                     print("✓ Order management page refreshed")
 
             except Exception as e:
-                self.model.conn.rollback()
                 print(f"✗ Database error: {e}")
                 QMessageBox.warning(
                     self.staff_home,
@@ -371,11 +308,11 @@ class SDeliveryControl:
 
     def mark_as_delivered(self):
         """Mark selected order as delivered and show finalize payment popup"""
-        if not hasattr(self.staff_home, "tableWidget_6"):
+        if not self.delivery_table:
             return
 
-        selected_items = self.staff_home.tableWidget_6.selectedItems()
-        if not selected_items:
+        selected_row = self.delivery_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -392,9 +329,8 @@ class SDeliveryControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            customer_name = self.staff_home.tableWidget_6.item(selected_row, 0).text()
-            order_id = self.staff_home.tableWidget_6.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
+            customer_name = self.delivery_table.text(selected_row, 0)
+            order_id = self.delivery_table.value(selected_row, "OrderID")
 
             if not order_id:
                 return
@@ -414,34 +350,11 @@ class SDeliveryControl:
             delivery_time = datetime.now()
 
             # Update order: set DateDelivered
+            # (one transaction with the activity log and the data version)
             try:
-                cursor = self.model.conn.cursor()
-
-                # Update order with delivery time
-                query = """
-                        UPDATE Orders
-                        SET DateDelivered = %s
-                        WHERE OrderID = %s
-                        """
-                cursor.execute(query, (delivery_time, order_id))
-
-                # Log activity
-                cursor.execute("""
-                               INSERT INTO StaffActivityLog
-                                   (StaffID, ActivityType, OrderID, CustomerID, ActivityTime)
-                               VALUES (%s, %s, %s, %s, %s)
-                               """, (self.current_staff_id, 'DELIVER_ORDER', order_id,
-                                     order_details.get('CustomerID') if order_details else None, delivery_time))
-
-                # UPDATE LAST ACTIVE TIMESTAMP
-                cursor.execute("""
-                               UPDATE Staff
-                               SET LastActiveAt = %s
-                               WHERE StaffID = %s
-                               """, (delivery_time, self.current_staff_id))
-
-                self.model.conn.commit()
-                cursor.close()
+                if not self.model.mark_order_delivered(order_id, self.current_staff_id,
+                                                       order_details.get('CustomerID'), delivery_time):
+                    return
 
                 print(f"✅ Order {formatted_order_id} marked as delivered at {delivery_time}")
 
@@ -459,7 +372,6 @@ class SDeliveryControl:
                 self.finalize_popup.activateWindow()
 
             except Exception as e:
-                self.model.conn.rollback()
                 print(f"❌ Database error: {e}")
                 QMessageBox.warning(
                     self.staff_home,
@@ -491,24 +403,12 @@ class SDeliveryControl:
 
     def view_selected_order(self):
         """View selected order details from either table"""
-        # Try pickup table first
-        if hasattr(self.staff_home, "tableWidget_5"):
-            selected_items = self.staff_home.tableWidget_5.selectedItems()
-            if selected_items:
-                selected_row = selected_items[0].row()
-                order_id = self.staff_home.tableWidget_5.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
-                if order_id:
-                    self.show_order_details(order_id)
-                    return
-
-        # Try delivery table
-        if hasattr(self.staff_home, "tableWidget_6"):
-            selected_items = self.staff_home.tableWidget_6.selectedItems()
-            if selected_items:
-                selected_row = selected_items[0].row()
-                order_id = self.staff_home.tableWidget_6.item(selected_row, 0).data(Qt.ItemDataRole.UserRole)
+        # Try pickup table first, then the delivery table
+        for table in (self.pickup_table, self.delivery_table):
+            if table:
+                order_id = table.selected_value("OrderID")
                 if order_id:
-                    self.show_order_details(order_id)
+                    self.show_order_details(order_id, table)
                     return
 
         QMessageBox.warning(
@@ -521,17 +421,15 @@ class SDeliveryControl:
     # EXACT FIX FOR StaffDeliveryControl.py - Line 485
     # ============================================================================
 
-    def show_order_details(self, order_id):
-        """Show order details popup"""
+    def show_order_details(self, order_id, table=None):
+        """Show order details popup (table: list it was opened from, used for prefetching)"""
         try:
             formatted_order_id = self.format_order_id(order_id)
             print(f"✓ SDeliveryControl: Loading order details for Order {formatted_order_id}")
 
-            # ✅ FIXED: ALWAYS create fresh popup - REMOVED "if None" check
-            self.order_popup = OrderDetailsPopup(parent=self.staff_home, model=self.model)
-
-            # Load data directly from database using the order ID
-            success = self.order_popup.loadOrderFromDatabase(order_id)
+            # Reuse the pooled popup and rebind it to this order
+            self.order_popup = popup_pool.open(OrderDetailsPopup, self.staff_home, self.model, order_id)
+            success = self.order_popup is not None
 
             if not success:
                 QMessageBox.warning(
@@ -546,6 +444,10 @@ class SDeliveryControl:
             self.order_popup.raise_()
             self.order_popup.activateWindow()
 
+            # Next row is the likeliest next open
+            if table:
+                popup_pool.prefetch(OrderDetailsPopup, self.model, table.next_value("OrderID"))
+
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -564,63 +466,40 @@ class SDeliveryControl:
         popup.move(popup_x, popup_y)
 
     def search_pickups(self):
-        """Search pickups by customer name or order ID"""
-        if not hasattr(self.staff_home, "line4_2") or not hasattr(self.staff_home, "tableWidget_5"):
+        """Search pickups by customer name or order ID (query runs off the GUI thread)"""
+        if not hasattr(self.staff_home, "line4_2") or not self.pickup_table:
             return
 
         search_term = self.staff_home.line4_2.text().strip()
 
         if not search_term:
+            self.pickup_search.cancel()
             self.load_pending_pickups()
             return
 
-        try:
-            # Search all orders and filter for Pending status
-            all_orders = self.model.search_orders(search_term)
-            orders = [o for o in all_orders if o.get('Status') == 'Pending']
-
-            table = self.staff_home.tableWidget_5
-            table.setRowCount(0)
-
-            for row_num, order in enumerate(orders):
-                table.insertRow(row_num)
-
-                customer_name = order.get('customer_name', 'Unknown')
-                name_item = QTableWidgetItem(customer_name)
-                name_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 0, name_item)
-
-                order_date = order.get('OrderDate')
-                scheduled_time = self.format_datetime_display(order_date)
-                table.setItem(row_num, 1, QTableWidgetItem(scheduled_time))
-
-                status = order.get('Status', 'Pending')
-                status_item = QTableWidgetItem(status)
-                status_item.setTextAlignment(Qt.AlignmentFlag.AlignCenter)
-                table.setItem(row_num, 2, status_item)
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-
-            print(f"✓ Found {len(orders)} pending pickups matching '{search_term}'")
+        self.pickup_search.request(search_term)
 
-        except Exception as e:
-            print(f"✗ Error searching pickups: {e}")
+    def query_pickups(self, search_term):
+        """Worker thread: search all orders and keep the pending ones"""
+        all_orders = self.model.search_orders(search_term)
+        return [o for o in all_orders if o.get('Status') == 'Pending']
+
+    def apply_pickup_search(self, search_term, orders):
+        """Show the result of the latest pickup search"""
+        self.pickup_table.set_records(orders)
+        print(f"✓ Found {len(orders)} pending pickups matching '{search_term}'")
 
     def sort_pickup_table(self):
         """Sort pickup table by name"""
-        if not hasattr(self.staff_home, "tableWidget_5"):
+        if not self.pickup_table:
             return
 
         if self.sort_ascending_pickup:
-            self.staff_home.tableWidget_5.sortItems(0, Qt.SortOrder.AscendingOrder)
+            self.pickup_table.sort(0, ascending=True)
             if hasattr(self.staff_home, "name_srt_btn_6"):
                 self.staff_home.name_srt_btn_6.setText("Ascending")
         else:
-            self.staff_home.tableWidget_5.sortItems(0, Qt.SortOrder.DescendingOrder)
+            self.pickup_table.sort(0, ascending=False)
             if hasattr(self.staff_home, "name_srt_btn_6"):
                 self.staff_home.name_srt_btn_6.setText("Descending")
 
@@ -628,11 +507,11 @@ class SDeliveryControl:
 
     def on_pickup_table_double_click(self, row, column):
         """Handle double-click on pickup table - show order details"""
-        self.view_selected_order()
+        self.show_order_details(self.pickup_table.value(row, "OrderID"), self.pickup_table)
 
     def on_delivery_table_double_click(self, row, column):
         """Handle double-click on delivery table - show order details"""
-        self.view_selected_order()
+        self.show_order_details(self.delivery_table.value(row, "OrderID"), self.delivery_table)
 
     def refresh_all_tables(self):
         """Refresh both pickup and delivery tables"""
@@ -674,7 +553,7 @@ class SDeliveryControl:
             try:
                 self.order_popup.hide()
                 self.order_popup.close()
-                self.order_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.order_popup = None
                 print("✓ Closed order popup before logout confirmation")
             except Exception as e:
@@ -316,92 +316,55 @@ class SEditOrderControl:
             iron_only = 1 if self.staff_home.ironCheckbox_2.isChecked() else 0
             fold = 1 if self.staff_home.foldCheckbox_2.isChecked() else 0
 
-            # Update order service in database
-            try:
-                cursor = self.model.conn.cursor()
-                query = """
-                        UPDATE OrderService
-                        SET WeightKg       = %s,
-                            PriceperKG     = %s,
-                            WashAmount     = %s,
-                            FastDry        = %s,
-                            FastDryAmount  = %s,
-                            IronOnly       = %s,
-                            IronOnlyAmount = %s,
-                            Fold           = %s,
-                            FoldAmount     = %s,
-                            TotalAmount    = %s
-                        WHERE OrderServiceID = %s \
-                        """
-                cursor.execute(query, (
-                    weight,
-                    self.WASH_PRICE_PER_KG,
-                    wash_total,
-                    fast_dry,
-                    fast_dry_total,
-                    iron_only,
-                    iron_total,
-                    fold,
-                    fold_total,
-                    total_amount,
-                    self.current_service_id
-                ))
-
-                # Update order total amount
-                cursor.execute("""
-                               UPDATE Orders
-                               SET TotalAmount = %s
-                               WHERE OrderID = %s
-                               """, (total_amount, self.current_order_id))
-
-                # Log activity
-                cursor.execute("""
-                               INSERT INTO StaffActivityLog
-                                   (StaffID, ActivityType, OrderID, ActivityTime)
-                               VALUES (%s, %s, %s, NOW())
-                               """, (self.staff_id, 'EDIT_ORDER', self.current_order_id))
-
-                # UPDATE LAST ACTIVE TIMESTAMP
-                cursor.execute("""
-                               UPDATE Staff
-                               SET LastActiveAt = NOW()
-                               WHERE StaffID = %s
-                               """, (self.staff_id,))
-
-                self.model.conn.commit()
-                cursor.close()
-
-                # Format order ID
-                formatted_order_id = f"WSHY#{self.current_order_id:03d}"
-
-                # Show success message
-                QMessageBox.information(
-                    self.staff_home,
-                    "Success",
-                    f"Order {formatted_order_id} updated successfully!\n\n"
-                    f"Staff ID: {self.staff_id}\n"
-                    f"Total Amount: ₱{total_amount:.2f}"
-                )
+            # Service line, order total and activity log in one transaction
+            updated = self.model.update_order_with_service(
+                order_id=self.current_order_id,
+                service_id=self.current_service_id,
+                staff_id=self.staff_id,
+                service={
+                    'weight_kg': weight,
+                    'price_per_kg': self.WASH_PRICE_PER_KG,
+                    'wash_amount': wash_total,
+                    'fast_dry': fast_dry,
+                    'fast_dry_amount': fast_dry_total,
+                    'iron_only': iron_only,
+                    'iron_only_amount': iron_total,
+                    'fold': fold,
+                    'fold_amount': fold_total,
+                    'total_amount': total_amount
+                }
+            )
 
-                print(f"✓ EditOrder: Updated order {formatted_order_id} by Staff ID {self.staff_id}")
+            if not updated:
+                return
 
-                # Refresh order list immediately if order controller reference is available
-                if self.order_control:
-                    try:
-                        self.order_control.load_order_data()
-                        print(f"✓ EditOrder: Order list refreshed automatically")
-                    except Exception as e:
-                        print(f"✗ EditOrder: Failed to refresh order list: {e}")
+            # Format order ID
+            formatted_order_id = f"WSHY#{self.current_order_id:03d}"
 
-                # Clear form
-                self.clear_form()
+            # Show success message
+            QMessageBox.information(
+                self.staff_home,
+                "Success",
+                f"Order {formatted_order_id} updated successfully!\n\n"
+                f"Staff ID: {self.staff_id}\n"
+                f"Total Amount: ₱{total_amount:.2f}"
+            )
 
-                # Navigate to orders page
-                self.go_to_orders()
+            print(f"✓ EditOrder: Updated order {formatted_order_id} by Staff ID {self.staff_id}")
 
-            except Exception as e:
-                self.model.conn.rollback()
-                raise e
+            # Refresh order list immediately if order controller reference is available
+            if self.order_control:
+                try:
+                    self.order_control.load_order_data()
+                    print(f"✓ EditOrder: Order list refreshed automatically")
+                except Exception as e:
+                    print(f"✗ EditOrder: Failed to refresh order list: {e}")
+
+            # Clear form
+            self.clear_form()
+
+            # Navigate to orders page
+            self.go_to_orders()
 
         except Exception as e:
             import traceback
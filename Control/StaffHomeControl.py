@@ -1,6 +1,7 @@
 from PyQt6.QtWidgets import QMessageBox
-from datetime import datetime
 from View.StaffDetailsPopup import StaffDetailsPopup
+from View.PopupPool import popup_pool
+from Model.order_stats import EMPTY_ORDER_STATS
 
 
 class SHControl:
@@ -92,75 +93,16 @@ class SHControl:
             traceback.print_exc()
 
     def get_order_statistics(self):
-        """Get order statistics for the home page"""
-        try:
-            if not self.model:
-                print("✗ Model not available for statistics")
-                return {
-                    'completed_today': 0,
-                    'pending_issues': 0,
-                    'pending_delivery': 0,
-                    'pending_pickup': 0
-                }
-
-            # Get today's date
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            cursor = self.model.conn.cursor(dictionary=True)
-
-            # 1. Get orders completed today
-            cursor.execute("""
-                           SELECT COUNT(*) as completed_today
-                           FROM Orders
-                           WHERE DATE (DateDelivered) = %s AND Status = 'Completed'
-                           """, (today,))
-            completed_today = cursor.fetchone()['completed_today']
-
-            # 2. Get pending issues (orders not completed AND not cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_issues
-                           FROM Orders
-                           WHERE Status NOT IN ('Completed', 'Cancelled')
-                           """)
-            pending_issues = cursor.fetchone()['pending_issues']
-
-            # 3. Get pending delivery orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_delivery
-                           FROM Orders
-                           WHERE (Status = 'Ready for Delivery' OR Status = 'Processing')
-                             AND Status != 'Cancelled'
-                           """)
-            pending_delivery = cursor.fetchone()['pending_delivery']
-
-            # 4. Get pending pickup orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_pickup
-                           FROM Orders
-                           WHERE Status = 'Pending'
-                           """)
-            pending_pickup = cursor.fetchone()['pending_pickup']
-
-            cursor.close()
-
-            print(
-                f"✓ Statistics retrieved: Today={completed_today}, Issues={pending_issues}, Delivery={pending_delivery}, Pickup={pending_pickup}")
-
-            return {
-                'completed_today': completed_today,
-                'pending_issues': pending_issues,
-                'pending_delivery': pending_delivery,
-                'pending_pickup': pending_pickup
-            }
+        """Get order statistics for the home page (shared Model service, one cached query)"""
+        if not self.model:
+            print("✗ Model not available for statistics")
+            return dict(EMPTY_ORDER_STATS)
 
+        try:
+            return self.model.order_stats.get_stats()
         except Exception as e:
             print(f"✗ Error getting order statistics: {e}")
-            return {
-                'completed_today': 0,
-                'pending_issues': 0,
-                'pending_delivery': 0,
-                'pending_pickup': 0
-            }
+            return dict(EMPTY_ORDER_STATS)
 
     def update_profile_section(self):
         """Update the profile section with staff information"""
@@ -305,11 +247,12 @@ class SHControl:
                                         "Profile information not available.")
                 return
 
-            # ✅ ALWAYS create a fresh popup instance
-            self.staff_popup = StaffDetailsPopup(parent=self.staff_home, model=self.model)
+            # Reuse the pooled popup and rebind it to the signed-in staff member
+            self.staff_popup = popup_pool.open(StaffDetailsPopup, self.staff_home, self.model,
+                                               self.current_staff_id)
 
             # Load staff data and show popup
-            if self.staff_popup.loadStaffFromDatabase(self.current_staff_id):
+            if self.staff_popup:
                 # Center popup on parent window
                 parent_geo = self.staff_home.geometry()
                 popup_geo = self.staff_popup.geometry()
@@ -336,7 +279,7 @@ class SHControl:
             try:
                 self.staff_popup.hide()
                 self.staff_popup.close()
-                self.staff_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.staff_popup = None
                 print("✓ Closed staff popup before logout confirmation")
             except Exception as e:
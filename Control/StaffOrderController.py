@@ -1,8 +1,8 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
-from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QMessageBox
 
 from View.OrderPopup import OrderDetailsPopup
+from View.PopupPool import popup_pool
+from View.DataTable import DataTable, TableColumn, status_color
 
 
 class SOControl:
@@ -24,6 +24,13 @@ class SOControl:
         self.staff_id = None
         self.sort_ascending_order = True
 
+        # Model/view table replacing tableWidget_3
+        self.order_table = None
+        self.setup_order_table()
+
+        # Build the details popup in idle time so the first double-click is quick
+        popup_pool.warm(OrderDetailsPopup, self.staff_home, self.model)
+
         # Connect buttons from Order page
         self.connect_order_buttons()
 
@@ -74,6 +81,21 @@ class SOControl:
         """Format order ID as WSHY#001, WSHY#002, etc."""
         return f"WSHY#{order_id:03d}"
 
+    def setup_order_table(self):
+        """Replace the order QTableWidget with the shared model/view table"""
+        if not hasattr(self.staff_home, "tableWidget_3"):
+            return
+
+        self.order_table = DataTable(self.staff_home, "tableWidget_3", [
+            TableColumn("Order ID", lambda o: self.format_order_id(o['OrderID']),
+                        sort_key=lambda o: o['OrderID']),
+            TableColumn("Customer Name", lambda o: ' '.join((o.get('customer_name') or '').split()) or "Unknown"),
+            TableColumn("Status", lambda o: o.get('Status', 'Unknown'),
+                        color=lambda o: status_color(o.get('Status'))),
+            TableColumn("Total Amount", lambda o: f"₱{o.get('TotalAmount', 0):.2f}",
+                        sort_key=lambda o: o.get('TotalAmount', 0)),
+        ], keys=("OrderID",))
+
     def connect_order_buttons(self):
         """Connect navigation and action buttons on the Order page"""
 
@@ -144,72 +166,21 @@ class SOControl:
             self.staff_home.name_srt_btn_3.clicked.connect(self.sort_orders)
 
         # Connect order table double-click (tableWidget_3 on ManageOrder page)
-        if hasattr(self.staff_home, "tableWidget_3"):
-            self.staff_home.tableWidget_3.cellDoubleClicked.connect(
-                self.on_order_table_double_click
-            )
+        if self.order_table:
+            self.order_table.on_double_click(self.on_order_table_double_click)
 
     def load_order_data(self):
         """Load all order data into the table with customer names"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             print("Error: tableWidget_3 not found")
             return
 
         try:
             order_list = self.model.get_all_orders()
-            table = self.staff_home.tableWidget_3
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Customer Name", "Status", "Total Amount", "OrderID_Hidden"])
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Customer Name - get from CustomerID
-                customer_name = "Unknown"
-                if order.get('CustomerID'):
-                    customer_data = self.model.get_customer_by_id(order['CustomerID'])
-                    if customer_data:
-                        full_name = f"{customer_data['CFName']} {customer_data['CMName'] or ''} {customer_data['CLName']}".strip()
-                        customer_name = ' '.join(full_name.split())
-                table.setItem(row_num, 1, QTableWidgetItem(customer_name))
-
-                # Status with color coding
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-
-                # Apply colors based on status
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-
-                table.setItem(row_num, 2, status_item)
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
+            self.order_table.set_records(order_list)
 
             # Stretch first two columns, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-            for col in range(2, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.order_table.set_resize_modes(stretch=(0, 1), to_contents=(2, 3))
 
             print(f"✓ Loaded {len(order_list)} orders with customer names")
 
@@ -225,11 +196,11 @@ class SOControl:
 
     def cancel_order(self):
         """Cancel selected order - only works for Pending orders"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.staff_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        selected_row = self.order_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -238,17 +209,9 @@ class SOControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            order_id_display = self.staff_home.tableWidget_3.item(selected_row, 0).text()
-            status_item = self.staff_home.tableWidget_3.item(selected_row, 2)
-            current_status = status_item.text() if status_item else "Unknown"
-
-            # Get OrderID from hidden column
-            order_id_item = self.staff_home.tableWidget_3.item(selected_row, 4)
-            if not order_id_item:
-                return
-
-            order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+            order_id_display = self.order_table.text(selected_row, 0)
+            current_status = self.order_table.text(selected_row, 2)
+            order_id = self.order_table.value(selected_row, "OrderID")
 
             # Check if order is already cancelled
             if current_status == 'Cancelled':
@@ -285,8 +248,7 @@ class SOControl:
 
                 if success:
                     # Update the table immediately
-                    status_item.setText('Cancelled')
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
+                    self.order_table.set_cell(selected_row, 2, 'Cancelled', status_color('Cancelled'))
 
                     print(f"✓ Cancelled order: {order_id_display}")
                     QMessageBox.information(
@@ -313,11 +275,11 @@ class SOControl:
 
     def show_order_details(self):
         """Show order details popup"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.staff_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        order_id = self.order_table.selected_value("OrderID")
+        if order_id is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -326,26 +288,12 @@ class SOControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-            order_id_item = self.staff_home.tableWidget_3.item(selected_row, 4)
-
-            if not order_id_item:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Error",
-                    "Could not retrieve order ID from table."
-                )
-                return
-
-            order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
 
             print(f"✅ Loading order details for Order {self.format_order_id(order_id)}")
 
-            # ✅ ALWAYS create a fresh popup instance
-            self.order_popup = OrderDetailsPopup(parent=self.staff_home, model=self.model)
-
-            # Load data directly from database using the order ID
-            success = self.order_popup.loadOrderFromDatabase(order_id)
+            # Reuse the pooled popup and rebind it to this order
+            self.order_popup = popup_pool.open(OrderDetailsPopup, self.staff_home, self.model, order_id)
+            success = self.order_popup is not None
 
             if not success:
                 QMessageBox.warning(
@@ -360,6 +308,9 @@ class SOControl:
             self.order_popup.raise_()
             self.order_popup.activateWindow()
 
+            # Next row is the likeliest next open
+            popup_pool.prefetch(OrderDetailsPopup, self.model, self.order_table.next_value("OrderID"))
+
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -379,7 +330,7 @@ class SOControl:
 
     def search_order(self):
         """Search orders by order ID, customer name, or status"""
-        if not hasattr(self.staff_home, "line3"):
+        if not hasattr(self.staff_home, "line3") or not self.order_table:
             return
 
         search_term = self.staff_home.line3.text().strip()
@@ -390,58 +341,7 @@ class SOControl:
 
         try:
             order_list = self.model.search_orders(search_term)
-            table = self.staff_home.tableWidget_3
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Customer Name", "Status", "Total Amount", "OrderID_Hidden"])
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Customer Name
-                customer_name = "Unknown"
-                if order.get('CustomerID'):
-                    customer_data = self.model.get_customer_by_id(order['CustomerID'])
-                    if customer_data:
-                        full_name = f"{customer_data['CFName']} {customer_data['CMName'] or ''} {customer_data['CLName']}".strip()
-                        customer_name = ' '.join(full_name.split())
-                table.setItem(row_num, 1, QTableWidgetItem(customer_name))
-
-                # Status with color coding
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                elif status == 'Cancelled':
-                    status_item.setForeground(Qt.GlobalColor.darkRed)
-
-                table.setItem(row_num, 2, status_item)
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
-
-            # Stretch first two columns, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            header.setSectionResizeMode(1, header.ResizeMode.Stretch)
-            for col in range(2, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.order_table.set_records(order_list)
 
             print(f"✓ Found {len(order_list)} orders matching '{search_term}'")
 
@@ -452,22 +352,14 @@ class SOControl:
 
     def view_order_details(self):
         """View order details"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.staff_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        order_id = self.order_table.selected_value("OrderID")
+        if order_id is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select an order first.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_item = self.staff_home.tableWidget_3.item(selected_row, 4)
-
-        if not order_id_item:
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
-
         # Get full order details
         order_details = self.model.get_order_by_id(order_id)
 
@@ -483,11 +375,11 @@ class SOControl:
 
     def edit_order(self):
         """Edit order - loads data into edit form and navigates to edit page"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.staff_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        selected_row = self.order_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -496,11 +388,8 @@ class SOControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-
             # Get status from the table
-            status_item = self.staff_home.tableWidget_3.item(selected_row, 2)
-            current_status = status_item.text() if status_item else "Unknown"
+            current_status = self.order_table.text(selected_row, 2)
 
             # Check if order is cancelled
             if current_status == 'Cancelled':
@@ -512,18 +401,7 @@ class SOControl:
                 )
                 return
 
-            # Get OrderID from hidden column
-            order_id_item = self.staff_home.tableWidget_3.item(selected_row, 4)
-
-            if not order_id_item:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Error",
-                    "Could not retrieve order ID from table."
-                )
-                return
-
-            order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+            order_id = self.order_table.value(selected_row, "OrderID")
 
             # Check if edit order control is available
             if not self.edit_order_control:
@@ -563,20 +441,18 @@ class SOControl:
 
     def delete_order(self):
         """Delete order - Cancelled orders cannot be deleted"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
-        selected_items = self.staff_home.tableWidget_3.selectedItems()
-        if not selected_items:
+        selected_row = self.order_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select an order to delete.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_display = self.staff_home.tableWidget_3.item(selected_row, 0).text()
+        order_id_display = self.order_table.text(selected_row, 0)
 
         # Get status from the table
-        status_item = self.staff_home.tableWidget_3.item(selected_row, 2)
-        current_status = status_item.text() if status_item else "Unknown"
+        current_status = self.order_table.text(selected_row, 2)
 
         # Check if order is cancelled
         if current_status == 'Cancelled':
@@ -588,12 +464,7 @@ class SOControl:
             )
             return
 
-        order_id_item = self.staff_home.tableWidget_3.item(selected_row, 4)
-
-        if not order_id_item:
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+        order_id = self.order_table.value(selected_row, "OrderID")
 
         reply = QMessageBox.question(
             self.staff_home,
@@ -606,7 +477,7 @@ class SOControl:
             try:
                 success = self.model.delete_order(order_id)
                 if success:
-                    self.staff_home.tableWidget_3.removeRow(selected_row)
+                    self.order_table.remove_row(selected_row)
                     print(f"✓ Deleted order: {order_id_display}")
                     QMessageBox.information(self.staff_home, "Success", "Order deleted successfully!")
                 else:
@@ -617,15 +488,15 @@ class SOControl:
 
     def sort_orders(self):
         """Sort order table by Order ID"""
-        if not hasattr(self.staff_home, "tableWidget_3"):
+        if not self.order_table:
             return
 
         if self.sort_ascending_order:
-            self.staff_home.tableWidget_3.sortItems(0, Qt.SortOrder.AscendingOrder)
+            self.order_table.sort(0, ascending=True)
             if hasattr(self.staff_home, "name_srt_btn_3"):
                 self.staff_home.name_srt_btn_3.setText("Order ID ▲")
         else:
-            self.staff_home.tableWidget_3.sortItems(0, Qt.SortOrder.DescendingOrder)
+            self.order_table.sort(0, ascending=False)
             if hasattr(self.staff_home, "name_srt_btn_3"):
                 self.staff_home.name_srt_btn_3.setText("Order ID ▼")
 
@@ -671,7 +542,7 @@ class SOControl:
             try:
                 self.order_popup.hide()
                 self.order_popup.close()
-                self.order_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.order_popup = None
                 print("✓ Closed order popup before logout confirmation")
             except Exception as e:
@@ -1,12 +1,16 @@
-from PyQt6.QtCore import Qt
-from PyQt6.QtWidgets import QMessageBox, QTableWidgetItem
+from PyQt6.QtWidgets import QMessageBox
 
 from View.OrderPopup import OrderDetailsPopup
+from View.PopupPool import popup_pool
+from View.DataTable import DataTable, TableColumn, status_color
 
 
 class SReportControl:
     """Controller for Staff Report/History page"""
 
+    # Rows fetched per page while scrolling the history table
+    HISTORY_PAGE_SIZE = 100
+
     def __init__(self, staff_home, dashboard, customer, order, delivery, report, model, login_view):
         self.staff_home = staff_home
         self.dashboard = dashboard
@@ -21,6 +25,10 @@ class SReportControl:
         self.sort_ascending_history = True
         self.current_filter = "All"  # Track current filter
 
+        # Model/view table replacing tableWidget_4
+        self.history_table = None
+        self.setup_history_table()
+
         self.connect_report_buttons()
 
         # Load all orders initially
@@ -30,6 +38,28 @@ class SReportControl:
         """Format order ID as WSHY#001, WSHY#002, etc."""
         return f"WSHY#{order_id:03d}"
 
+    def setup_history_table(self):
+        """Replace the history QTableWidget with the shared model/view table"""
+        if not hasattr(self.staff_home, "tableWidget_4"):
+            return
+
+        def order_date_text(order):
+            order_date = order.get('OrderDate')
+            if not order_date:
+                return 'N/A'
+            return order_date.strftime('%Y-%m-%d') if hasattr(order_date, 'strftime') else str(order_date)
+
+        self.history_table = DataTable(self.staff_home, "tableWidget_4", [
+            TableColumn("Order ID", lambda o: self.format_order_id(o['OrderID']),
+                        sort_key=lambda o: o['OrderID']),
+            TableColumn("Status", lambda o: o.get('Status', 'Unknown'),
+                        color=lambda o: status_color(o.get('Status'))),
+            TableColumn("Date", order_date_text, sort_key=lambda o: o.get('OrderDate')),
+            TableColumn("Total Amount", lambda o: f"₱{o.get('TotalAmount', 0):.2f}",
+                        sort_key=lambda o: o.get('TotalAmount', 0)),
+        ], keys=("OrderID", "OrderDate"))
+        self.history_table.set_resize_modes(stretch=(0,), to_contents=(1, 2, 3))
+
     def connect_report_buttons(self):
         """Connect navigation and action buttons on the Report/History page"""
 
@@ -96,81 +126,38 @@ class SReportControl:
             self.staff_home.name_srt_btn_4.clicked.connect(self.toggle_filter)
 
         # Connect table double-click
-        if hasattr(self.staff_home, "tableWidget_4"):
-            self.staff_home.tableWidget_4.cellDoubleClicked.connect(
-                self.on_history_table_double_click
-            )
+        if self.history_table:
+            self.history_table.on_double_click(self.on_history_table_double_click)
 
     def load_history_data(self, filter_status=None):
         """Load all order history data into the table"""
-        if not hasattr(self.staff_home, "tableWidget_4"):
+        if not self.history_table:
             print("Error: tableWidget_4 not found")
             return
 
         try:
-            # Get orders based on filter
-            if filter_status:
-                order_list = self.model.get_orders_by_status(filter_status)
-            else:
-                order_list = self.model.get_all_orders()
-
-            table = self.staff_home.tableWidget_4
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Status", "Date", "Total Amount", "OrderID_Hidden"]
+            # First page only; the rest is fetched as the table scrolls
+            self.history_table.load_pages(
+                lambda after, page_size: self.fetch_history_page(filter_status, after, page_size),
+                self.HISTORY_PAGE_SIZE
             )
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Status
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                table.setItem(row_num, 1, status_item)
-
-                # Order Date
-                order_date = order.get('OrderDate')
-                order_date_str = order_date.strftime('%Y-%m-%d') if order_date and hasattr(
-                    order_date, 'strftime'
-                ) else ('N/A' if not order_date else str(order_date))
-                table.setItem(row_num, 2, QTableWidgetItem(order_date_str))
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
-
-            # Stretch first column, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            for col in range(1, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
-
-            print(f"✓ Staff: Loaded {len(order_list)} orders in history")
+
+            print(f"✓ Staff: Loaded {self.history_table.row_count()} orders in history")
 
         except Exception as e:
             print(f"✗ Staff: Error loading history data: {e}")
             import traceback
             traceback.print_exc()
 
+    def fetch_history_page(self, status, after, page_size):
+        """Next page of history rows after the last loaded (OrderDate, OrderID)"""
+        if after:
+            after = (after['OrderDate'], after['OrderID'])
+        return self.model.get_orders_page(status, after, page_size)
+
     def search_history(self):
         """Search order history"""
-        if not hasattr(self.staff_home, "line4"):
+        if not hasattr(self.staff_home, "line4") or not self.history_table:
             return
 
         search_term = self.staff_home.line4.text().strip()
@@ -181,52 +168,7 @@ class SReportControl:
 
         try:
             order_list = self.model.search_orders(search_term)
-            table = self.staff_home.tableWidget_4
-            table.setRowCount(0)
-            table.setColumnCount(5)
-            table.setHorizontalHeaderLabels(
-                ["Order ID", "Status", "Date", "Total Amount", "OrderID_Hidden"]
-            )
-            table.setColumnHidden(4, True)
-
-            for row_num, order in enumerate(order_list):
-                table.insertRow(row_num)
-
-                # Order ID - formatted as WSHY#001
-                formatted_id = self.format_order_id(order['OrderID'])
-                table.setItem(row_num, 0, QTableWidgetItem(formatted_id))
-
-                # Status
-                status_item = QTableWidgetItem(order.get('Status', 'Unknown'))
-                status = order.get('Status', 'Unknown')
-                if status == 'Completed':
-                    status_item.setForeground(Qt.GlobalColor.darkGreen)
-                elif status == 'Pending':
-                    status_item.setForeground(Qt.GlobalColor.darkYellow)
-                elif status == 'Processing':
-                    status_item.setForeground(Qt.GlobalColor.darkBlue)
-                table.setItem(row_num, 1, status_item)
-
-                # Order Date
-                order_date = order.get('OrderDate')
-                order_date_str = order_date.strftime('%Y-%m-%d') if order_date and hasattr(
-                    order_date, 'strftime'
-                ) else ('N/A' if not order_date else str(order_date))
-                table.setItem(row_num, 2, QTableWidgetItem(order_date_str))
-
-                # Total Amount
-                table.setItem(row_num, 3, QTableWidgetItem(f"₱{order.get('TotalAmount', 0):.2f}"))
-
-                # Hidden OrderID
-                order_id_item = QTableWidgetItem()
-                order_id_item.setData(Qt.ItemDataRole.UserRole, order['OrderID'])
-                table.setItem(row_num, 4, order_id_item)
-
-            # Stretch first column, others resize to content
-            header = table.horizontalHeader()
-            header.setSectionResizeMode(0, header.ResizeMode.Stretch)
-            for col in range(1, 4):
-                header.setSectionResizeMode(col, header.ResizeMode.ResizeToContents)
+            self.history_table.set_records(order_list)
 
             print(f"✓ Staff: Found {len(order_list)} orders matching '{search_term}'")
 
@@ -257,11 +199,12 @@ class SReportControl:
 
     def show_order_details(self):
         """Show order details popup"""
-        if not hasattr(self.staff_home, "tableWidget_4"):
+        if not self.history_table:
             return
 
-        selected_items = self.staff_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        # Raw OrderID kept alongside the row (NOT parsed from the display column)
+        order_id = self.history_table.selected_value("OrderID")
+        if order_id is None:
             QMessageBox.warning(
                 self.staff_home,
                 "No Selection",
@@ -270,30 +213,12 @@ class SReportControl:
             return
 
         try:
-            selected_row = selected_items[0].row()
-
-            # Get OrderID from hidden column 4 (NOT from display column 0)
-            order_id_item = self.staff_home.tableWidget_4.item(selected_row, 4)
-
-            if not order_id_item:
-                QMessageBox.warning(
-                    self.staff_home,
-                    "Error",
-                    "Could not retrieve order ID from table."
-                )
-                return
-
-            # Get the actual order ID from UserRole data
-            order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
 
             print(f"✓ SReportControl: Loading order details for Order {self.format_order_id(order_id)}")
 
-            # Create popup with model if it doesn't exist
-            if self.order_popup is None:
-                self.order_popup = OrderDetailsPopup(parent=self.staff_home, model=self.model)
-
-            # Load data directly from database using the order ID
-            success = self.order_popup.loadOrderFromDatabase(order_id)
+            # Reuse the pooled popup and rebind it to this order
+            self.order_popup = popup_pool.open(OrderDetailsPopup, self.staff_home, self.model, order_id)
+            success = self.order_popup is not None
 
             if not success:
                 QMessageBox.warning(
@@ -308,6 +233,9 @@ class SReportControl:
             self.order_popup.raise_()
             self.order_popup.activateWindow()
 
+            # Next row is the likeliest next open
+            popup_pool.prefetch(OrderDetailsPopup, self.model, self.history_table.next_value("OrderID"))
+
         except Exception as e:
             import traceback
             traceback.print_exc()
@@ -335,11 +263,10 @@ class SReportControl:
 
     def edit_order(self):
         """Edit order"""
-        if not hasattr(self.staff_home, "tableWidget_4"):
+        if not self.history_table:
             return
 
-        selected_items = self.staff_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        if self.history_table.selected_row() is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select an order to edit.")
             return
 
@@ -348,22 +275,16 @@ class SReportControl:
 
     def delete_order(self):
         """Delete order from history"""
-        if not hasattr(self.staff_home, "tableWidget_4"):
+        if not self.history_table:
             return
 
-        selected_items = self.staff_home.tableWidget_4.selectedItems()
-        if not selected_items:
+        selected_row = self.history_table.selected_row()
+        if selected_row is None:
             QMessageBox.warning(self.staff_home, "No Selection", "Please select an order to delete.")
             return
 
-        selected_row = selected_items[0].row()
-        order_id_display = self.staff_home.tableWidget_4.item(selected_row, 0).text()
-        order_id_item = self.staff_home.tableWidget_4.item(selected_row, 4)
-
-        if not order_id_item:
-            return
-
-        order_id = order_id_item.data(Qt.ItemDataRole.UserRole)
+        order_id_display = self.history_table.text(selected_row, 0)
+        order_id = self.history_table.value(selected_row, "OrderID")
 
         reply = QMessageBox.question(
             self.staff_home,
@@ -376,7 +297,7 @@ class SReportControl:
             try:
                 success = self.model.delete_order(order_id)
                 if success:
-                    self.staff_home.tableWidget_4.removeRow(selected_row)
+                    self.history_table.remove_row(selected_row)
                     print(f"✓ Staff: Deleted order: {order_id_display}")
                     QMessageBox.information(self.staff_home, "Success", "Order deleted successfully!")
                 else:
@@ -420,7 +341,7 @@ class SReportControl:
             try:
                 self.order_popup.hide()
                 self.order_popup.close()
-                self.order_popup.deleteLater()
+                # Pooled popup: only closed, the pool reuses it after the next login
                 self.order_popup = None
                 print("✓ Closed order popup before logout confirmation")
             except Exception as e:
@@ -4,6 +4,7 @@ import warnings
 from View.StaffHomeView import StaffHome
 
 warnings.filterwarnings("ignore", category=DeprecationWarning)
+import multiprocessing
 import sys
 
 from PyQt6.QtWidgets import QApplication, QWidget
@@ -36,10 +37,15 @@ class MainWindow(QWidget):
 
 # Entry point
 if __name__ == "__main__":
+    # Report PDFs are built in spawned worker processes (Model/report_worker.py)
+    multiprocessing.freeze_support()
     app = QApplication(sys.argv)
 
     # Create main window (initializes everything)
     main_window = MainWindow()
 
+    # Close pooled database connections when the app quits
+    app.aboutToQuit.connect(main_window.model.close)
+
     # Start event loop
     sys.exit(app.exec())
\ No newline at end of file
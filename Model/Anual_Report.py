@@ -13,6 +13,9 @@ from datetime import datetime
 import mysql.connector
 from typing import Dict, List
 
+from Model import queries
+from Model.report_worker import build_progress
+
 
 class WashyAnnualReportGenerator:
     """Generate annual summary reports for Washy Laundry System"""
@@ -21,6 +24,7 @@ class WashyAnnualReportGenerator:
         """Initialize report generator with database configuration"""
         self.db_config = db_config
         self.conn = None
+        self.last_filename = None
 
     def connect_db(self):
         """Establish database connection"""
@@ -46,28 +50,27 @@ class WashyAnnualReportGenerator:
         cursor = self.conn.cursor(dictionary=True)
         stats = {}
 
-        # Total orders for the year
-        cursor.execute("""
-                       SELECT COUNT(*) as total_orders
-                       FROM Orders
-                       WHERE YEAR (OrderDate) = %s
-                       """, (year,))
-        stats['total_orders'] = cursor.fetchone()['total_orders']
-
-        # Orders by status
+        # Order counts, revenue and weight come from the daily order
+        # summary: at most 366 rows instead of every order of the year
+        year_start, next_year = datetime(year, 1, 1).date(), datetime(year + 1, 1, 1).date()
         cursor.execute("""
-                       SELECT SUM(CASE WHEN Status = 'Completed' THEN 1 ELSE 0 END)  as completed,
-                              SUM(CASE WHEN Status = 'Pending' THEN 1 ELSE 0 END)    as pending,
-                              SUM(CASE WHEN Status = 'Processing' THEN 1 ELSE 0 END) as processing,
-                              SUM(CASE WHEN Status = 'Cancelled' THEN 1 ELSE 0 END)  as cancelled
-                       FROM Orders
-                       WHERE YEAR (OrderDate) = %s
-                       """, (year,))
-        status_data = cursor.fetchone()
-        stats['completed'] = status_data['completed'] or 0
-        stats['pending'] = status_data['pending'] or 0
-        stats['processing'] = status_data['processing'] or 0
-        stats['cancelled'] = status_data['cancelled'] or 0
+                       SELECT COALESCE(SUM(TotalOrders), 0)      as total_orders,
+                              COALESCE(SUM(CompletedOrders), 0)  as completed,
+                              COALESCE(SUM(PendingOrders), 0)    as pending,
+                              COALESCE(SUM(ProcessingOrders), 0) as processing,
+                              COALESCE(SUM(CancelledOrders), 0)  as cancelled,
+                              COALESCE(SUM(CompletedRevenue), 0) as total_revenue,
+                              COALESCE(SUM(CompletedKg), 0)      as total_weight
+                       FROM DailyOrderSummary
+                       WHERE SummaryDate >= %s
+                         AND SummaryDate < %s
+                       """, (year_start, next_year))
+        summary = cursor.fetchone()
+        stats['total_orders'] = int(summary['total_orders'])
+        stats['completed'] = int(summary['completed'])
+        stats['pending'] = int(summary['pending'])
+        stats['processing'] = int(summary['processing'])
+        stats['cancelled'] = int(summary['cancelled'])
 
         # Calculate completion rate
         if stats['total_orders'] > 0:
@@ -75,35 +78,22 @@ class WashyAnnualReportGenerator:
         else:
             stats['completion_rate'] = 0
 
-        # Total revenue
-        cursor.execute("""
-                       SELECT COALESCE(SUM(TotalAmount), 0) as total_revenue
-                       FROM Orders
-                       WHERE YEAR (OrderDate) = %s AND Status='Completed'
-                       """, (year,))
-        stats['total_revenue'] = int(cursor.fetchone()['total_revenue'])
-
-        # Total weight processed
-        cursor.execute("""
-                       SELECT COALESCE(SUM(os.WeightKg), 0) as total_weight
-                       FROM OrderService os
-                                INNER JOIN Orders o ON os.OrderID = o.OrderID
-                       WHERE YEAR (o.OrderDate) = %s AND o.Status='Completed'
-                       """, (year,))
-        stats['total_weight'] = int(cursor.fetchone()['total_weight'])
+        stats['total_revenue'] = int(summary['total_revenue'])
+        stats['total_weight'] = int(summary['total_weight'])
 
         # Busiest staff member
         cursor.execute("""
                        SELECT CONCAT(e.EFName, ' ', e.ELName) as staff_name,
-                              COUNT(o.OrderID)                as order_count
-                       FROM Orders o
-                                INNER JOIN Staff s ON o.StaffID = s.StaffID
+                              SUM(ds.TotalOrders)             as order_count
+                       FROM DailyStaffSummary ds
+                                INNER JOIN Staff s ON ds.StaffID = s.StaffID
                                 INNER JOIN Employees e ON s.EmployeeID = e.EmployeeID
-                       WHERE YEAR (o.OrderDate) = %s
+                       WHERE ds.SummaryDate >= %s
+                         AND ds.SummaryDate < %s
                        GROUP BY s.StaffID
                        ORDER BY order_count DESC
                            LIMIT 1
-                       """, (year,))
+                       """, (year_start, next_year))
         busiest = cursor.fetchone()
         stats['busiest_staff'] = busiest['staff_name'] if busiest else 'N/A'
 
@@ -111,8 +101,9 @@ class WashyAnnualReportGenerator:
         cursor.execute("""
                        SELECT COUNT(*) as new_customers
                        FROM Customer
-                       WHERE YEAR (DateCreated) = %s
-                       """, (year,))
+                       WHERE DateCreated >= %s
+                         AND DateCreated < %s
+                       """, (year_start, next_year))
         stats['new_customers'] = cursor.fetchone()['new_customers']
 
         # Average order value
@@ -127,30 +118,19 @@ class WashyAnnualReportGenerator:
     def get_all_orders_for_year(self, year: int) -> List[Dict]:
         """Get all orders for the specified year"""
         cursor = self.conn.cursor(dictionary=True)
-        cursor.execute("""
-                       SELECT o.OrderID,
-                              CONCAT(c.CFName, ' ', c.CLName) as customer_name,
-                              CONCAT(e.EFName, ' ', e.ELName) as staff_name,
-                              o.OrderDate,
-                              o.Status,
-                              o.TotalAmount,
-                              o.DatePicked,
-                              o.DateDelivered
-                       FROM Orders o
-                                LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
-                                LEFT JOIN Staff s ON o.StaffID = s.StaffID
-                                LEFT JOIN Employees e ON s.EmployeeID = e.EmployeeID
-                       WHERE YEAR (o.OrderDate) = %s
-                       ORDER BY o.OrderDate DESC
-                       """, (year,))
+        cursor.execute(queries.ORDERS_OF_YEAR, (datetime(year, 1, 1), datetime(year + 1, 1, 1)))
         orders = cursor.fetchall()
         cursor.close()
         return orders
 
         # ... (previous code remains the same)
 
-    def generate_annual_report(self, year: int, filename: str = None):
-        """Generate comprehensive annual report PDF"""
+    def generate_annual_report(self, year: int, filename: str = None, progress=None):
+        """Generate comprehensive annual report PDF
+
+        progress(percent, message) is called while the report is built
+        (see Model.report_worker.ReportJob).
+        """
 
         if not self.connect_db():
             print("Failed to connect to database")
@@ -158,11 +138,18 @@ class WashyAnnualReportGenerator:
 
         try:
             # Get statistics
+            if progress:
+                progress(5, "Loading annual statistics")
             stats = self.get_annual_statistics(year)
+            if progress:
+                progress(25, "Loading orders")
             orders = self.get_all_orders_for_year(year)
+            if progress:
+                progress(40, f"Laying out {len(orders)} orders")
 
             if not filename:
                 filename = f"washy_report_{year}.pdf"
+            self.last_filename = filename
 
             # Create PDF document
             doc = SimpleDocTemplate(
@@ -337,6 +324,9 @@ class WashyAnnualReportGenerator:
             elements.append(Paragraph(footer_text, styles['Normal']))
 
             # Build PDF
+            if progress:
+                progress(50, "Building PDF")
+                doc.setProgressCallBack(build_progress(progress, 50, 99))
             doc.build(elements)
             print(f"✅ Annual report generated: {filename}")
             return True
@@ -1,25 +1,236 @@
 import csv
+import functools
 import os
-from datetime import datetime
+import threading
+import time
+from datetime import datetime, timedelta
 
 import mysql.connector
 import pymysql
 from PyQt6.QtWidgets import QMessageBox
 
+from Model.db_pool import ConnectionPool
+from Model.entity_cache import EntityCache
+from Model import migrations, order_summary, queries
+from Model.order_stats import OrderStatsService
+from Model.query_log import query_stats
+from Model.search_index import SearchIndex
+from Model.unit_of_work import UnitOfWork
+
+
+def pooled(method):
+    """Run a Model method on its own pooled connection, exposed as self.conn"""
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        local = self._local
+        local.depth = getattr(local, 'depth', 0) + 1
+        try:
+            return method(self, *args, **kwargs)
+        finally:
+            local.depth -= 1
+            if local.depth == 0 and getattr(local, 'conn', None) is not None:
+                conn, local.conn = local.conn, None
+                self.pool.release(conn)
+    return wrapper
+
 
 class Model:
+    # Searches show at most SEARCH_LIMIT rows; index matches beyond SEARCH_MAX_IDS are
+    # filtered with LIKE instead of a huge IN (...) list
+    SEARCH_LIMIT = 500
+    SEARCH_MAX_IDS = 1000
+
     def __init__(self):
+        self.host = "localhost"
+        self.user = "root"
+        self.password = ""
+        self.database = "washy"
+        self.db_config = {
+            'host': self.host,
+            'user': self.user,
+            'password': self.password,
+            'database': self.database
+        }
+        self.pool = ConnectionPool(self.db_config, size=5)
+        self._local = threading.local()
+        self._shared_conn = None
+        self._shared_used = None
+        self.order_stats = OrderStatsService(self)
+        self.entity_cache = EntityCache()
+        self.customer_index = SearchIndex(self, ('Customer',), self._load_customer_search_rows, "Customer search")
+        self.staff_index = SearchIndex(self, ('Employees', 'Staff'), self._load_staff_search_rows, "Staff search")
+
+        # Open the first connection up front so a bad config is reported at startup
         try:
-            self.conn = mysql.connector.connect(
-                host="localhost",
-                user="root",
-                password="",
-                database="washy"
-            )
+            self.pool.release(self.pool.get_connection())
+            self._run_migrations()
+            self._backfill_order_summary()
         except mysql.connector.Error as err:
             QMessageBox.critical(None, "Database Connection Failed", str(err))
 
+    @property
+    def conn(self):
+        """Connection for the current operation.
+
+        Inside a @pooled method this is the connection leased for that call
+        (checked out on first use). Outside of one (legacy callers that still
+        reach into model.conn) a single long-lived pooled connection is kept
+        and pinged (reconnecting if the link dropped) once it has sat idle.
+        """
+        local = self._local
+        if getattr(local, 'depth', 0):
+            if getattr(local, 'conn', None) is None:
+                local.conn = self.pool.get_connection()
+            return local.conn
+
+        if self._shared_conn is None:
+            self._shared_conn = self.pool.get_connection()
+        else:
+            # Cleared first: if reconnecting fails the pool has already dropped it
+            shared, self._shared_conn = self._shared_conn, None
+            self._shared_conn = self.pool.ensure_alive(shared, self._shared_used)
+        self._shared_used = time.monotonic()
+        return self._shared_conn
+
+    @staticmethod
+    def _show_error(title, err):
+        """Error dialog on the GUI thread; searches running on a worker thread only log"""
+        if threading.current_thread() is threading.main_thread():
+            QMessageBox.critical(None, title, str(err))
+        else:
+            print(f"✗ {title}: {err}")
+
+    def unit_of_work(self):
+        """Transaction spanning several writes: `with model.unit_of_work() as uow:`"""
+        return UnitOfWork(self)
+
+    def close(self):
+        """Return the shared connection and close the pool"""
+        print(f"✓ Entity cache: {self.entity_cache.stats_line()}")
+        query_stats.summary()
+        if self._shared_conn is not None:
+            self.pool.release(self._shared_conn)
+            self._shared_conn = None
+        self.pool.close_all()
+
+    # ---------------------- DATA VERSION ----------------------
+    @pooled
+    def _run_migrations(self):
+        """Apply pending schema migrations (DataVersion, the daily rollups and hot-query indexes, see migrations)"""
+        try:
+            migrations.migrate(self.conn)
+        except mysql.connector.Error as err:
+            print(f"✗ Schema migration failed: {err}")
+            raise
+
+    @pooled
+    def explain_hot_queries(self):
+        """EXPLAIN the dashboard/profile queries; returns the names of those that scan a whole table"""
+        try:
+            return [name for name, _, scans in migrations.check_plans(self.conn) if scans]
+        except mysql.connector.Error as err:
+            print(f"✗ Error explaining queries: {err}")
+            return None
+
+    @pooled
+    def _backfill_order_summary(self):
+        """Fill the daily order rollups (see order_summary) from Orders while they are still empty"""
+        cursor = self.conn.cursor()
+        empty = order_summary.is_empty(cursor)
+        cursor.close()
+        if empty:
+            days = order_summary.rebuild(self.conn)
+            if days:
+                print(f"✓ Daily order summary backfilled: {days} days")
+
+    @pooled
+    def rebuild_daily_summary(self, start=None, end=None):
+        """Recompute the daily order rollups for [start, end) (default: all orders)"""
+        try:
+            days = order_summary.rebuild(self.conn, start, end)
+            self.bump_data_version('Orders')
+            print(f"✓ Daily order summary rebuilt: {days} days")
+            return days
+        except mysql.connector.Error as err:
+            print(f"✗ Error rebuilding daily order summary: {err}")
+            return None
+
+    def _bump_version(self, cursor, *tables):
+        """
+        Bump the change counter of each table inside the caller's transaction;
+        call _tables_changed() with the same tables once it has committed
+        """
+        cursor.executemany("""
+                           INSERT INTO DataVersion (TableName, Version)
+                           VALUES (%s, 1)
+                           ON DUPLICATE KEY UPDATE Version = Version + 1
+                           """, [(table,) for table in tables])
+
+    def _tables_changed(self, *tables):
+        """
+        Drop the cached reads built from tables. Only after the commit: dropped
+        earlier, a concurrent reader could reload the rows as they were before
+        it and keep them for the whole TTL.
+        """
+        if 'Orders' in tables:
+            self.order_stats.invalidate()
+        self.entity_cache.invalidate_tables(tables)
+
+    @pooled
+    def bump_data_version(self, *tables):
+        """Record a change for writers that commit outside the Model"""
+        try:
+            cursor = self.conn.cursor()
+            self._bump_version(cursor, *tables)
+            self.conn.commit()
+            self._tables_changed(*tables)
+            cursor.close()
+            return True
+        except mysql.connector.Error as err:
+            self.conn.rollback()
+            print(f"✗ Error bumping data version: {err}")
+            return False
+
+    @pooled
+    def get_data_version(self, tables=None):
+        """
+        Returns {TableName: Version} for the tracked tables (or only `tables`).
+        Compare with an earlier snapshot to see what changed since then.
+        """
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            if tables:
+                placeholders = ", ".join(["%s"] * len(tables))
+                cursor.execute(f"SELECT TableName, Version FROM DataVersion WHERE TableName IN ({placeholders})",
+                               tuple(tables))
+            else:
+                cursor.execute("SELECT TableName, Version FROM DataVersion")
+            results = cursor.fetchall()
+            cursor.close()
+            versions = {table: 0 for table in (tables or [])}
+            versions.update({row['TableName']: row['Version'] for row in results})
+            # Any poll doubles as a check for records other clients changed
+            self.entity_cache.observe_versions(versions)
+            return versions
+        except mysql.connector.Error as err:
+            print(f"✗ Error fetching data version: {err}")
+            return None
+
+    def get_changed_tables(self, since_versions, tables=None):
+        """
+        Returns (changed_tables, current_versions) relative to `since_versions`.
+        changed_tables is empty when nothing changed (or the lookup failed).
+        """
+        current = self.get_data_version(tables)
+        if current is None:
+            return set(), since_versions
+        since_versions = since_versions or {}
+        changed = {table for table, version in current.items()
+                   if since_versions.get(table) != version}
+        return changed, current
+
     # ---------------------- LOGIN ----------------------
+    @pooled
     def login(self, username, password):
         try:
             cursor = self.conn.cursor(dictionary=True)
@@ -32,6 +243,7 @@ class Model:
             QMessageBox.critical(None, "Login Error", f"Error during login:\n{err}")
             return None
 
+    @pooled
     def login2(self, username, password):
         try:
             cursor = self.conn.cursor(dictionary=True)
@@ -45,6 +257,7 @@ class Model:
             return None
 
     # ---------------------- EMPLOYEES ----------------------
+    @pooled
     def create_employee(self, fname, mname, lname, email, phone, user, passw, role='staff'):
         try:
             now = datetime.now()
@@ -60,7 +273,10 @@ class Model:
                     admin_id = cursor.lastrowid
                     sql3 = "INSERT INTO SecurAdm (Username, UPassword, AdminID) VALUES (%s, %s, %s)"
                     cursor.execute(sql3, (user, passw, admin_id))
+                    self._bump_version(cursor, 'Employees', 'Staff', 'Admin')
                     self.conn.commit()
+                    self._tables_changed('Employees', 'Staff', 'Admin')
+                    self.staff_index.changed(None, None, 'Employees', 'Staff', 'Admin')
                     return {'employee_id': employee_id, 'admin_id': admin_id, 'role': 'admin'}
                 else:
                     sql2 = "INSERT INTO Staff (EmployeeID, SDateApplied, LastActiveAt) VALUES (%s, %s, %s)"
@@ -68,7 +284,10 @@ class Model:
                     staff_id = cursor.lastrowid
                     sql3 = "INSERT INTO SecurStaff (Username, UPassword, StaffID) VALUES (%s, %s, %s)"
                     cursor.execute(sql3, (user, passw, staff_id))
+                    self._bump_version(cursor, 'Employees', 'Staff', 'Admin')
                     self.conn.commit()
+                    self._tables_changed('Employees', 'Staff', 'Admin')
+                    self.staff_index.changed(staff_id, (fname, lname, email, phone), 'Employees', 'Staff', 'Admin')
                     return {'employee_id': employee_id, 'staff_id': staff_id, 'role': 'staff'}
 
         except pymysql.IntegrityError as e:
@@ -83,6 +302,7 @@ class Model:
             QMessageBox.critical(None, "Error Creating Employee", str(e))
             return None
 
+    @pooled
     def get_all_staff(self):
         try:
             cursor = self.conn.cursor(dictionary=True)
@@ -102,6 +322,7 @@ class Model:
             QMessageBox.critical(None, "Error Fetching Staff", str(err))
             return []
 
+    @pooled
     def get_all_admins(self):
         try:
             cursor = self.conn.cursor(dictionary=True)
@@ -122,41 +343,19 @@ class Model:
             return []
 
     def get_staff_by_id(self, staff_id):
+        """Staff record with activity totals (cached, see entity_cache)"""
+        return self.entity_cache.get('staff', staff_id, lambda: self._fetch_staff_by_id(staff_id))
+
+    @pooled
+    def _fetch_staff_by_id(self, staff_id):
         try:
             cursor = self.conn.cursor(dictionary=True)
-            query = """
-                    SELECT e.*, \
-                           s.*, \
-                           sec.Username,
-                           COUNT(DISTINCT o.OrderID)    as orders_processed,
-                           COUNT(DISTINCT c.CustomerID) as customers_created,
-                           COUNT(DISTINCT t.TransactID) as transactions_count,
-                           COALESCE(SUM(
-                                            CASE
-                                                WHEN o.Status = 'Completed' THEN t.AmountPaid
-                                                ELSE 0
-                                                END
-                                    ), 0)               as total_transactions
-                    FROM Employees e
-                             INNER JOIN Staff s ON e.EmployeeID = s.EmployeeID
-                             LEFT JOIN SecurStaff sec ON s.StaffID = sec.StaffID
-                             LEFT JOIN Orders o ON s.StaffID = o.StaffID
-                             LEFT JOIN Customer c ON s.StaffID = c.StaffID
-                             LEFT JOIN Transactions t ON s.StaffID = t.StaffID AND o.OrderID = t.OrderID
-                    WHERE s.StaffID = %s
-                    GROUP BY e.EmployeeID, s.StaffID
-                    """
-            cursor.execute(query, (staff_id,))
+            cursor.execute(queries.STAFF_PROFILE, (staff_id, staff_id, staff_id, staff_id))
             result = cursor.fetchone()
 
             if result:
                 # Get last 2 activities
-                cursor.execute("""
-                               SELECT ActivityType, ActivityTime, OrderID, CustomerID
-                               FROM StaffActivityLog
-                               WHERE StaffID = %s
-                               ORDER BY ActivityTime DESC LIMIT 2
-                               """, (staff_id,))
+                cursor.execute(queries.STAFF_RECENT_ACTIVITY, (staff_id,))
                 activities = cursor.fetchall()
 
                 # Format activities into readable strings
@@ -173,6 +372,7 @@ class Model:
             QMessageBox.critical(None, "Error Fetching Staff Details", str(err))
             return None
 
+    @pooled
     def get_admin_by_id(self, admin_id):
         """Get admin details by admin ID"""
         try:
@@ -209,15 +409,7 @@ class Model:
                 # Get last 2 activities (checking if admin activity log exists)
                 # Note: You may need to create an AdminActivityLog table similar to StaffActivityLog
                 # For now, we'll try to get customer creation activities
-                cursor.execute("""
-                               SELECT 'CREATE_CUSTOMER' as ActivityType,
-                                      DateCreated       as ActivityTime,
-                                      CustomerID,
-                                      NULL              as OrderID
-                               FROM Customer
-                               WHERE AdminID = %s
-                               ORDER BY DateCreated DESC LIMIT 2
-                               """, (admin_id,))
+                cursor.execute(queries.ADMIN_RECENT_CUSTOMERS, (admin_id,))
                 activities = cursor.fetchall()
 
                 # Format activities
@@ -268,37 +460,77 @@ class Model:
 
         activity_text = activity_map.get(activity_type, activity_type)
         return f"{activity_text} at {time_str}"
+    @pooled
+    def _load_staff_search_rows(self):
+        """(StaffID, first name, last name, email, phone) of every staff member, for staff_index"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("""
+                           SELECT s.StaffID, e.EFName, e.ELName, e.EEmail, e.EPhone
+                           FROM Staff s
+                                    INNER JOIN Employees e ON e.EmployeeID = s.EmployeeID
+                           """)
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+        except mysql.connector.Error as err:
+            print(f"✗ Error loading staff search index: {err}")
+            return None
+
+    @pooled
     def search_staff(self, search_term):
+        """Staff whose name, email or phone contains search_term, first SEARCH_LIMIT by name"""
         try:
+            # Matches come from the in-memory index; short terms and huge match sets use LIKE
+            staff_ids = self.staff_index.search(search_term)
+            if staff_ids is not None and not staff_ids:
+                return []
+
             cursor = self.conn.cursor(dictionary=True)
-            search_pattern = f"%{search_term}%"
             query = """
                     SELECT e.EmployeeID, e.EFName, e.EMName, e.ELName, e.EEmail, e.EPhone,
                            s.StaffID, s.SDateApplied, s.LastActiveAt, sec.Username
                     FROM Employees e
                              INNER JOIN Staff s ON e.EmployeeID = s.EmployeeID
                              LEFT JOIN SecurStaff sec ON s.StaffID = sec.StaffID
-                    WHERE e.EFName LIKE %s
-                       OR e.ELName LIKE %s
-                       OR e.EEmail LIKE %s
-                       OR e.EPhone LIKE %s
+                    WHERE {where}
                     ORDER BY e.EFName, e.ELName
+                    LIMIT %s
                     """
-            cursor.execute(query, (search_pattern, search_pattern, search_pattern, search_pattern))
+            if staff_ids is not None and len(staff_ids) <= self.SEARCH_MAX_IDS:
+                placeholders = ", ".join(["%s"] * len(staff_ids))
+                cursor.execute(query.format(where=f"s.StaffID IN ({placeholders})"),
+                               (*staff_ids, self.SEARCH_LIMIT))
+            else:
+                search_pattern = f"%{search_term}%"
+                where = "e.EFName LIKE %s OR e.ELName LIKE %s OR e.EEmail LIKE %s OR e.EPhone LIKE %s"
+                cursor.execute(query.format(where=where),
+                               (search_pattern, search_pattern, search_pattern, search_pattern, self.SEARCH_LIMIT))
             results = cursor.fetchall()
             cursor.close()
+            if len(results) == self.SEARCH_LIMIT:
+                print(f"✓ Staff search '{search_term}': showing the first {self.SEARCH_LIMIT} matches")
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Searching Staff", str(err))
+            self._show_error("Error Searching Staff", err)
             return []
 
+    @pooled
     def delete_staff(self, staff_id):
         try:
             cursor = self.conn.cursor()
+            order_ids = order_summary.order_ids_of(cursor, 'StaffID', staff_id)
+            before = order_summary.contribution(cursor, order_ids)
             query = "DELETE FROM Staff WHERE StaffID = %s"
             cursor.execute(query, (staff_id,))
-            self.conn.commit()
             affected_rows = cursor.rowcount
+            # Deleting may cascade to (or detach) this staff's orders
+            order_summary.apply_delta(cursor, before, order_summary.contribution(cursor, order_ids))
+            tables = ('Staff', 'Orders') if order_ids else ('Staff',)
+            self._bump_version(cursor, *tables)
+            self.conn.commit()
+            self._tables_changed(*tables)
+            self.staff_index.changed(staff_id, None, 'Staff')
             cursor.close()
             return affected_rows > 0
         except mysql.connector.Error as err:
@@ -306,6 +538,7 @@ class Model:
             QMessageBox.critical(None, "Error Deleting Staff", str(err))
             return False
 
+    @pooled
     def update_staff(self, staff_id, fname, mname, lname, email, phone):
         try:
             cursor = self.conn.cursor()
@@ -321,7 +554,10 @@ class Model:
                     WHERE EmployeeID = %s
                     """
             cursor.execute(query, (fname, mname, lname, email, phone, employee_id))
+            self._bump_version(cursor, 'Employees', 'Staff')
             self.conn.commit()
+            self._tables_changed('Employees', 'Staff')
+            self.staff_index.changed(staff_id, (fname, lname, email, phone), 'Employees', 'Staff')
             cursor.close()
             return True
         except mysql.connector.Error as err:
@@ -330,6 +566,7 @@ class Model:
             return False
 
     # ---------------------- CUSTOMERS ----------------------
+    @pooled
     def get_all_customers(self):
         try:
             cursor = self.conn.cursor(dictionary=True)
@@ -356,86 +593,182 @@ class Model:
         """
         Returns customer info with total orders, total spent, and last order date.
         """
-        if not self.conn:
-            return None
+        return self.get_customer_profiles([customer_id]).get(customer_id)
 
+    def get_customer_profiles(self, customer_ids):
+        """
+        Batched get_customer_by_id: {CustomerID: profile} for every customer
+        found, with the cached ones served from entity_cache and the rest
+        loaded in one query.
+        """
+        ids = [cid for cid in customer_ids if cid is not None]
+        if not ids:
+            return {}
+        return self.entity_cache.get_many('customer', ids, self._fetch_customer_profiles)
+
+    @pooled
+    def _fetch_customer_profiles(self, customer_ids):
+        """
+        One round trip for many profiles. Orders and transactions are each
+        aggregated per customer before the join, so an order with several
+        payments is still counted once.
+        """
         try:
             cursor = self.conn.cursor(dictionary=True)
+            placeholders = ", ".join(["%s"] * len(customer_ids))
+            query = f"""
+                    SELECT c.CustomerID, c.CFName, c.CMName, c.CLName, c.CEmail, c.CPhone, c.DateCreated,
+                           COALESCE(o.total_orders, 0)     as total_orders,
+                           COALESCE(t.total_spent, 0)      as total_spent,
+                           o.last_order_date,
+                           COALESCE(o.completed_orders, 0) as completed_orders,
+                           COALESCE(o.pending_orders, 0)   as pending_orders
+                    FROM Customer c
+                             LEFT JOIN (SELECT CustomerID,
+                                               COUNT(*)                     as total_orders,
+                                               MAX(OrderDate)               as last_order_date,
+                                               SUM(Status = 'Completed')    as completed_orders,
+                                               SUM(Status != 'Completed')   as pending_orders
+                                        FROM Orders
+                                        WHERE CustomerID IN ({placeholders})
+                                        GROUP BY CustomerID) o ON o.CustomerID = c.CustomerID
+                             LEFT JOIN (SELECT ord.CustomerID,
+                                               SUM(tr.AmountPaid) as total_spent
+                                        FROM Transactions tr
+                                                 INNER JOIN Orders ord ON tr.OrderID = ord.OrderID
+                                        WHERE ord.CustomerID IN ({placeholders})
+                                        GROUP BY ord.CustomerID) t ON t.CustomerID = c.CustomerID
+                    WHERE c.CustomerID IN ({placeholders})
+                    """
+            cursor.execute(query, tuple(customer_ids) * 3)
+            results = cursor.fetchall()
+            cursor.close()
 
-            # Get basic customer info
-            cursor.execute("""
-                SELECT CustomerID, CFName, CMName, CLName, CEmail, CPhone, DateCreated
-                FROM Customer
-                WHERE CustomerID = %s
-            """, (customer_id,))
-            customer = cursor.fetchone()
-            if not customer:
-                return None
-
-            # Total orders and total spent
-            cursor.execute("""
-                SELECT 
-                    COUNT(*) AS total_orders, 
-                    IFNULL(SUM(T.AmountPaid), 0) AS total_spent,
-                    MAX(O.OrderDate) AS last_order_date
-                FROM Orders O
-                LEFT JOIN Transactions T ON O.OrderID = T.OrderID
-                WHERE O.CustomerID = %s
-            """, (customer_id,))
-            stats = cursor.fetchone()
-            customer['total_orders'] = stats['total_orders'] or 0
-            customer['total_spent'] = float(stats['total_spent'] or 0)
-            customer['last_order_date'] = stats['last_order_date']
-
-            # Completed and pending orders
-            cursor.execute("""
-                SELECT 
-                    SUM(CASE WHEN Status='Completed' THEN 1 ELSE 0 END) AS completed_orders,
-                    SUM(CASE WHEN Status!='Completed' THEN 1 ELSE 0 END) AS pending_orders
-                FROM Orders
-                WHERE CustomerID = %s
-            """, (customer_id,))
-            order_status = cursor.fetchone()
-            customer['completed_orders'] = order_status['completed_orders'] or 0
-            customer['pending_orders'] = order_status['pending_orders'] or 0
-
-            return customer
+            profiles = {}
+            for row in results:
+                row['total_orders'] = int(row['total_orders'])
+                row['total_spent'] = float(row['total_spent'])
+                row['completed_orders'] = int(row['completed_orders'])
+                row['pending_orders'] = int(row['pending_orders'])
+                profiles[row['CustomerID']] = row
+            return profiles
 
         except mysql.connector.Error as e:
-            QMessageBox.critical(None, "Error Getting Customer Data", str(e))
+            self._show_error("Error Getting Customer Data", e)
+            return None
+
+    @pooled
+    def get_customers_by_ids(self, customer_ids):
+        """
+        Batched customer lookup: one query for many IDs.
+        Returns {CustomerID: row} where row also carries a 'customer_name'.
+        Use it instead of get_customer_by_id per row when a table only needs
+        names/contacts; get_customer_profiles adds the order statistics.
+        """
+        ids = list({cid for cid in customer_ids if cid is not None})
+        if not ids:
+            return {}
+
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            placeholders = ", ".join(["%s"] * len(ids))
+            query = f"""
+                    SELECT CustomerID, CFName, CMName, CLName, CEmail, CPhone, DateCreated,
+                           CONCAT(CFName, ' ', COALESCE(CMName, ''), ' ', CLName) as customer_name
+                    FROM Customer
+                    WHERE CustomerID IN ({placeholders})
+                    """
+            cursor.execute(query, tuple(ids))
+            results = cursor.fetchall()
+            cursor.close()
+            return {row['CustomerID']: row for row in results}
+        except mysql.connector.Error as err:
+            self._show_error("Error Getting Customer Data", err)
+            return {}
+
+    @pooled
+    def _load_customer_search_rows(self):
+        """(CustomerID, first name, last name, email, phone) of every customer, for customer_index"""
+        try:
+            cursor = self.conn.cursor()
+            cursor.execute("SELECT CustomerID, CFName, CLName, CEmail, CPhone FROM Customer")
+            rows = cursor.fetchall()
+            cursor.close()
+            return rows
+        except mysql.connector.Error as err:
+            print(f"✗ Error loading customer search index: {err}")
             return None
 
+    @pooled
     def search_customers(self, search_term):
+        """
+        Customers whose name, email or phone contains search_term, first
+        SEARCH_LIMIT by name, with their order count and last order date
+        """
         try:
+            # Matches come from the in-memory index; short terms and huge match sets use LIKE
+            customer_ids = self.customer_index.search(search_term)
+            if customer_ids is not None and not customer_ids:
+                return []
+
             cursor = self.conn.cursor(dictionary=True)
-            pattern = f"%{search_term}%"
             query = """
                     SELECT c.CustomerID,
                            c.CFName, c.CMName, c.CLName,
-                           c.CEmail, c.CPhone,
-                           COUNT(DISTINCT o.OrderID) as total_orders,
-                           MAX(o.OrderDate) as last_order_date
+                           c.CEmail, c.CPhone
                     FROM Customer c
-                             LEFT JOIN Orders o ON c.CustomerID = o.CustomerID
-                    WHERE c.CFName LIKE %s OR c.CLName LIKE %s OR c.CEmail LIKE %s OR c.CPhone LIKE %s
-                    GROUP BY c.CustomerID
+                    WHERE {where}
                     ORDER BY c.CFName, c.CLName
+                    LIMIT %s
                     """
-            cursor.execute(query, (pattern, pattern, pattern, pattern))
+            if customer_ids is not None and len(customer_ids) <= self.SEARCH_MAX_IDS:
+                placeholders = ", ".join(["%s"] * len(customer_ids))
+                cursor.execute(query.format(where=f"c.CustomerID IN ({placeholders})"),
+                               (*customer_ids, self.SEARCH_LIMIT))
+            else:
+                pattern = f"%{search_term}%"
+                where = "c.CFName LIKE %s OR c.CLName LIKE %s OR c.CEmail LIKE %s OR c.CPhone LIKE %s"
+                cursor.execute(query.format(where=where), (pattern, pattern, pattern, pattern, self.SEARCH_LIMIT))
             results = cursor.fetchall()
+
+            # Order aggregates only for the customers shown
+            if results:
+                placeholders = ", ".join(["%s"] * len(results))
+                cursor.execute(f"""
+                    SELECT CustomerID, COUNT(*) as total_orders, MAX(OrderDate) as last_order_date
+                    FROM Orders
+                    WHERE CustomerID IN ({placeholders})
+                    GROUP BY CustomerID
+                    """, tuple(row['CustomerID'] for row in results))
+                orders = {row['CustomerID']: row for row in cursor.fetchall()}
+                for row in results:
+                    aggregate = orders.get(row['CustomerID'], {})
+                    row['total_orders'] = aggregate.get('total_orders', 0)
+                    row['last_order_date'] = aggregate.get('last_order_date')
             cursor.close()
+            if len(results) == self.SEARCH_LIMIT:
+                print(f"✓ Customer search '{search_term}': showing the first {self.SEARCH_LIMIT} matches")
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Searching Customers", str(err))
+            self._show_error("Error Searching Customers", err)
             return []
 
+    @pooled
     def delete_customer(self, customer_id):
         try:
             cursor = self.conn.cursor()
+            order_ids = order_summary.order_ids_of(cursor, 'CustomerID', customer_id)
+            before = order_summary.contribution(cursor, order_ids)
             query = "DELETE FROM Customer WHERE CustomerID = %s"
             cursor.execute(query, (customer_id,))
-            self.conn.commit()
             affected_rows = cursor.rowcount
+            # Deleting may cascade to (or detach) this customer's orders
+            order_summary.apply_delta(cursor, before, order_summary.contribution(cursor, order_ids))
+            tables = ('Customer', 'Orders') if order_ids else ('Customer',)
+            self._bump_version(cursor, *tables)
+            self.conn.commit()
+            self._tables_changed(*tables)
+            self.customer_index.changed(customer_id, None, 'Customer')
             cursor.close()
             return affected_rows > 0
         except mysql.connector.Error as err:
@@ -443,6 +776,7 @@ class Model:
             QMessageBox.critical(None, "Error Deleting Customer", str(err))
             return False
 
+    @pooled
     def update_customer(self, customer_id, fname, mname, lname, email, phone):
         try:
             cursor = self.conn.cursor()
@@ -452,7 +786,10 @@ class Model:
                     WHERE CustomerID=%s
                     """
             cursor.execute(query, (fname, mname, lname, email, phone, customer_id))
+            self._bump_version(cursor, 'Customer')
             self.conn.commit()
+            self._tables_changed('Customer')
+            self.customer_index.changed(customer_id, (fname, lname, email, phone), 'Customer')
             cursor.close()
             return True
         except mysql.connector.Error as err:
@@ -460,6 +797,7 @@ class Model:
             QMessageBox.critical(None, "Error Updating Customer", str(err))
             return False
 
+    @pooled
     def create_customer(self, fname, mname, lname, email, phone,
                         street_add, appart_unit, city, zip_code,
                         staff_id=None, admin_id=None):
@@ -485,7 +823,10 @@ class Model:
                           """
             cursor.execute(sql_address, (customer_id, street_add, appart_unit, city, zip_code))
 
+            self._bump_version(cursor, 'Customer', 'Address')
             self.conn.commit()
+            self._tables_changed('Customer', 'Address')
+            self.customer_index.changed(customer_id, (fname, lname, email, phone), 'Customer', 'Address')
             return customer_id
 
         except Exception as e:
@@ -493,6 +834,7 @@ class Model:
             QMessageBox.critical(None, "Error Creating Customer", str(e))
             return None
 
+    @pooled
     def add_customer_address(self, customer_id, street_add, appart_unit, city, zip_code):
         try:
             cursor = self.conn.cursor()
@@ -501,7 +843,9 @@ class Model:
                     VALUES (%s,%s,%s,%s,%s)
                     """
             cursor.execute(query, (customer_id, street_add, appart_unit, city, zip_code))
+            self._bump_version(cursor, 'Address')
             self.conn.commit()
+            self._tables_changed('Address')
             address_id = cursor.lastrowid
             cursor.close()
             return address_id
@@ -510,6 +854,7 @@ class Model:
             QMessageBox.critical(None, "Error Adding Address", str(err))
             return None
 
+    @pooled
     def update_customer_address(self, address_id, street_add, appart_unit, city, zip_code):
         try:
             cursor = self.conn.cursor()
@@ -519,7 +864,9 @@ class Model:
                     WHERE AddID=%s
                     """
             cursor.execute(query, (street_add, appart_unit, city, zip_code, address_id))
+            self._bump_version(cursor, 'Address')
             self.conn.commit()
+            self._tables_changed('Address')
             cursor.close()
             return True
         except mysql.connector.Error as err:
@@ -527,12 +874,15 @@ class Model:
             QMessageBox.critical(None, "Error Updating Address", str(err))
             return False
 
+    @pooled
     def delete_customer_address(self, address_id):
         try:
             cursor = self.conn.cursor()
             query = "DELETE FROM Address WHERE AddID=%s"
             cursor.execute(query, (address_id,))
+            self._bump_version(cursor, 'Address')
             self.conn.commit()
+            self._tables_changed('Address')
             affected_rows = cursor.rowcount
             cursor.close()
             return affected_rows > 0
@@ -542,6 +892,12 @@ class Model:
             return False
 
     def get_customer_addresses(self, customer_id):
+        addresses = self.entity_cache.get('addresses', customer_id,
+                                          lambda: self._fetch_customer_addresses(customer_id))
+        return addresses if addresses is not None else []
+
+    @pooled
+    def _fetch_customer_addresses(self, customer_id):
         try:
             cursor = self.conn.cursor(dictionary=True)
             query = "SELECT * FROM Address WHERE CustomerID=%s"
@@ -550,10 +906,11 @@ class Model:
             cursor.close()
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Fetching Customer Addresses", str(err))
-            return []
+            self._show_error("Error Fetching Customer Addresses", err)
+            return None
 
     # ---------------------- ORDERS ----------------------
+    @pooled
     def get_all_orders(self):
         """Get all orders without transaction date"""
         try:
@@ -577,11 +934,15 @@ class Model:
             cursor.close()
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Fetching Orders", str(err))
+            self._show_error("Error Fetching Orders", err)
             return []
 
     def get_order_by_id(self, order_id):
         """Get order details without transaction date"""
+        return self.entity_cache.get('order', order_id, lambda: self._fetch_order_by_id(order_id))
+
+    @pooled
+    def _fetch_order_by_id(self, order_id):
         try:
             cursor = self.conn.cursor(dictionary=True)
             query = """
@@ -611,18 +972,9 @@ class Model:
     def create_order(self, customer_id, staff_id, total_amount, status='Pending'):
         """Create a new order"""
         try:
-            cursor = self.conn.cursor()
-            query = """
-                    INSERT INTO Orders (CustomerID, StaffID, TotalAmount, Status)
-                    VALUES (%s, %s, %s, %s)
-                    """
-            cursor.execute(query, (customer_id, staff_id, total_amount, status))
-            self.conn.commit()
-            order_id = cursor.lastrowid
-            cursor.close()
-            return order_id
+            with self.unit_of_work() as uow:
+                return uow.insert_order(customer_id, staff_id, total_amount, status)
         except mysql.connector.Error as err:
-            self.conn.rollback()
             QMessageBox.critical(None, "Error Creating Order", str(err))
             return None
 
@@ -631,26 +983,15 @@ class Model:
                           iron_only_amount, fold, fold_amount, total_amount):
         """Add a service to an order"""
         try:
-            cursor = self.conn.cursor()
-            query = """
-                    INSERT INTO OrderService
-                    (OrderID, ServiceName, WeightKg, PriceperKG, WashAmount,
-                     FastDry, FastDryAmount, IronOnly, IronOnlyAmount,
-                     Fold, FoldAmount, TotalAmount)
-                    VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
-                    """
-            cursor.execute(query, (order_id, service_name, weight_kg, price_per_kg,
-                                   wash_amount, fast_dry, fast_dry_amount, iron_only,
-                                   iron_only_amount, fold, fold_amount, total_amount))
-            self.conn.commit()
-            service_id = cursor.lastrowid
-            cursor.close()
-            return service_id
+            with self.unit_of_work() as uow:
+                return uow.insert_order_service(order_id, service_name, weight_kg, price_per_kg,
+                                                wash_amount, fast_dry, fast_dry_amount, iron_only,
+                                                iron_only_amount, fold, fold_amount, total_amount)
         except mysql.connector.Error as err:
-            self.conn.rollback()
             QMessageBox.critical(None, "Error Adding Order Service", str(err))
             return None
 
+    @pooled
     def add_transaction(self, order_id, amount_paid, payment_method, staff_id=None):
         """Add a transaction for an order"""
         try:
@@ -660,7 +1001,9 @@ class Model:
                     VALUES (%s, %s, %s, %s)
                     """
             cursor.execute(query, (order_id, amount_paid, payment_method, staff_id))
+            self._bump_version(cursor, 'Transactions')
             self.conn.commit()
+            self._tables_changed('Transactions')
             transaction_id = cursor.lastrowid
             cursor.close()
             return transaction_id
@@ -672,32 +1015,104 @@ class Model:
     def update_order_status(self, order_id, status):
         """Update order status"""
         try:
-            cursor = self.conn.cursor()
-            query = "UPDATE Orders SET Status=%s WHERE OrderID=%s"
-            cursor.execute(query, (status, order_id))
-            self.conn.commit()
-            cursor.close()
+            with self.unit_of_work() as uow:
+                uow.set_order_status(order_id, status)
             return True
         except mysql.connector.Error as err:
-            self.conn.rollback()
             QMessageBox.critical(None, "Error Updating Order Status", str(err))
             return False
 
     def delete_order(self, order_id):
         """Delete order (cascades to related tables)"""
         try:
-            cursor = self.conn.cursor()
-            query = "DELETE FROM Orders WHERE OrderID=%s"
-            cursor.execute(query, (order_id,))
-            self.conn.commit()
-            affected_rows = cursor.rowcount
-            cursor.close()
+            with self.unit_of_work() as uow:
+                affected_rows = uow.delete_order(order_id)
             return affected_rows > 0
         except mysql.connector.Error as err:
-            self.conn.rollback()
             QMessageBox.critical(None, "Error Deleting Order", str(err))
             return False
 
+    def create_order_with_service(self, customer_id, staff_id, service, status='Pending'):
+        """
+        Create an order, its OrderService line and the CREATE_ORDER activity
+        in one transaction. `service` holds the add_order_service arguments
+        (without order_id). Returns the new OrderID or None.
+        """
+        try:
+            with self.unit_of_work() as uow:
+                order_id = uow.insert_order(customer_id, staff_id, service['total_amount'], status)
+                uow.insert_order_service(order_id, **service)
+                uow.log_activity(staff_id, 'CREATE_ORDER', order_id, customer_id)
+                uow.touch_staff(staff_id)
+            return order_id
+        except mysql.connector.Error as err:
+            QMessageBox.critical(None, "Error Creating Order", str(err))
+            return None
+
+    def update_order_with_service(self, order_id, service_id, staff_id, service):
+        """
+        Update an OrderService line and the order total, and log EDIT_ORDER,
+        in one transaction. `service` holds the OrderService columns. Returns True/False.
+        """
+        try:
+            with self.unit_of_work() as uow:
+                uow.update_order_service(service_id, **service)
+                uow.set_order_total(order_id, service['total_amount'])
+                uow.log_activity(staff_id, 'EDIT_ORDER', order_id)
+                uow.touch_staff(staff_id)
+            return True
+        except mysql.connector.Error as err:
+            QMessageBox.critical(None, "Error Updating Order", str(err))
+            return False
+
+    def complete_order_payment(self, order_id, amount_paid, payment_method, staff_id=None, customer_id=None):
+        """
+        Record the payment, mark the order Completed and log
+        COMPLETE_TRANSACTION in one transaction. Returns the TransactionID or None.
+        """
+        try:
+            with self.unit_of_work() as uow:
+                transaction_id = uow.insert_transaction(order_id, amount_paid, payment_method, staff_id)
+                uow.set_order_status(order_id, 'Completed')
+                if staff_id:
+                    uow.log_activity(staff_id, 'COMPLETE_TRANSACTION', order_id, customer_id)
+                    uow.touch_staff(staff_id)
+            return transaction_id
+        except mysql.connector.Error as err:
+            QMessageBox.critical(None, "Error Completing Transaction", str(err))
+            return None
+
+    def mark_order_picked_up(self, order_id, staff_id, customer_id=None, picked_at=None):
+        """
+        Move the order to Processing under the collecting staff member and log
+        PICKUP_ORDER in one transaction. Returns True/False.
+        """
+        try:
+            with self.unit_of_work() as uow:
+                uow.mark_order_picked_up(order_id, staff_id, picked_at or datetime.now())
+                uow.log_activity(staff_id, 'PICKUP_ORDER', order_id, customer_id)
+                uow.touch_staff(staff_id)
+            return True
+        except mysql.connector.Error as err:
+            QMessageBox.critical(None, "Error Updating Order Status", str(err))
+            return False
+
+    def mark_order_delivered(self, order_id, staff_id, customer_id=None, delivered_at=None):
+        """
+        Set DateDelivered and log DELIVER_ORDER for the delivering staff member
+        in one transaction. Returns True/False.
+        """
+        try:
+            with self.unit_of_work() as uow:
+                uow.mark_order_delivered(order_id, delivered_at or datetime.now())
+                uow.log_activity(staff_id, 'DELIVER_ORDER', order_id, customer_id)
+                uow.touch_staff(staff_id)
+            return True
+        except mysql.connector.Error as err:
+            QMessageBox.critical(None, "Error Updating Order Delivery", str(err))
+            return False
+
+    @pooled
     def search_orders(self, search_term):
         """Search orders without transaction date"""
         try:
@@ -725,48 +1140,45 @@ class Model:
             cursor.close()
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Searching Orders", str(err))
+            self._show_error("Error Searching Orders", err)
             return []
 
+    @pooled
     def get_orders_by_status(self, status):
         """Get orders by status without transaction date"""
         try:
             cursor = self.conn.cursor(dictionary=True)
-            query = """
-                    SELECT o.OrderID, \
-                           o.CustomerID,
-                           CONCAT(c.CFName, ' ', COALESCE(c.CMName, ''), ' ', c.CLName) as customer_name,
-                           o.OrderDate, \
-                           o.DatePicked, \
-                           o.DateDelivered,
-                           o.TotalAmount, \
-                           o.Status, \
-                           o.StaffID
-                    FROM Orders o
-                             LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
-                    WHERE o.Status = %s
-                    ORDER BY o.OrderDate DESC
-                    """
-            cursor.execute(query, (status,))
+            cursor.execute(queries.ORDERS_BY_STATUS, (status,))
+            results = cursor.fetchall()
+            cursor.close()
+            return results
+        except mysql.connector.Error as err:
+            self._show_error("Error Fetching Orders by Status", err)
+            return []
+
+    @pooled
+    def get_orders_page(self, status=None, after=None, page_size=100, search=None):
+        """
+        One page of orders, newest first, using keyset pagination.
+        after: (OrderDate, OrderID) of the last row already shown, None for the first page
+        search: substring of the order number (WSHY#001), customer name, status or date (YYYY-MM-DD)
+        """
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            cursor.execute(*queries.orders_page(status, after, page_size, search))
             results = cursor.fetchall()
             cursor.close()
             return results
         except mysql.connector.Error as err:
-            QMessageBox.critical(None, "Error Fetching Orders by Status", str(err))
+            self._show_error("Error Fetching Orders", err)
             return []
 
+    @pooled
     def get_orders_by_customer(self, customer_id):
         """Get orders for a customer without transaction date"""
         try:
             cursor = self.conn.cursor(dictionary=True)
-            query = """
-                    SELECT o.*, CONCAT(c.CFName, ' ', COALESCE(c.CMName, ''), ' ', c.CLName) as customer_name
-                    FROM Orders o
-                             LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
-                    WHERE o.CustomerID = %s
-                    ORDER BY o.OrderDate DESC
-                    """
-            cursor.execute(query, (customer_id,))
+            cursor.execute(queries.ORDERS_OF_CUSTOMER, (customer_id,))
             results = cursor.fetchall()
             cursor.close()
             return results
@@ -774,27 +1186,93 @@ class Model:
             QMessageBox.critical(None, "Error Fetching Orders by Customer", str(err))
             return []
 
+    @pooled
     def get_order_statistics(self):
-        """Get overall order statistics"""
+        """Get overall order statistics (from the daily order summary)"""
         try:
             cursor = self.conn.cursor(dictionary=True)
             query = """
-                    SELECT COUNT(*) as total_orders,
-                           COUNT(CASE WHEN Status='Completed' THEN 1 END) as completed_orders,
-                           COUNT(CASE WHEN Status='Pending' THEN 1 END) as pending_orders,
-                           COUNT(CASE WHEN Status='Cancelled' THEN 1 END) as cancelled_orders,
-                           COALESCE(SUM(TotalAmount),0) as total_revenue,
-                           COALESCE(AVG(TotalAmount),0) as average_order_value
-                    FROM Orders
+                    SELECT COALESCE(SUM(TotalOrders), 0) as total_orders,
+                           COALESCE(SUM(CompletedOrders), 0) as completed_orders,
+                           COALESCE(SUM(PendingOrders), 0) as pending_orders,
+                           COALESCE(SUM(CancelledOrders), 0) as cancelled_orders,
+                           COALESCE(SUM(OrderAmount), 0) as total_revenue
+                    FROM DailyOrderSummary
                     """
             cursor.execute(query)
             result = cursor.fetchone()
             cursor.close()
+            for key in ('total_orders', 'completed_orders', 'pending_orders', 'cancelled_orders'):
+                result[key] = int(result[key])
+            total_orders = result['total_orders']
+            result['average_order_value'] = result['total_revenue'] / total_orders if total_orders else 0
             return result
         except mysql.connector.Error as err:
             QMessageBox.critical(None, "Error Fetching Order Statistics", str(err))
             return None
 
+    @pooled
+    def get_order_counters(self):
+        """
+        Home/dashboard counters (completed today, pending issues/delivery/pickup)
+        in one round trip; each is an index range on (Status, DateDelivered)
+        """
+        try:
+            today = datetime.now().date()
+            cursor = self.conn.cursor(dictionary=True)
+            cursor.execute(queries.ORDER_COUNTERS, (today, today + timedelta(days=1)))
+            result = cursor.fetchone()
+            cursor.close()
+            return {key: int(value or 0) for key, value in result.items()}
+        except mysql.connector.Error as err:
+            print(f"✗ Error fetching order counters: {err}")
+            return None
+
+    @pooled
+    def get_completed_revenue(self, start_date, end_date=None):
+        """Revenue of completed orders placed from start_date up to today (or before end_date)"""
+        end_date = end_date or datetime.now().date() + timedelta(days=1)
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            cursor.execute(queries.COMPLETED_REVENUE, (start_date, end_date))
+            result = cursor.fetchone()
+            cursor.close()
+            return float(result['revenue'])
+        except mysql.connector.Error as err:
+            print(f"✗ Error fetching completed revenue: {err}")
+            return 0.0
+
+    @pooled
+    def get_weekly_order_counts(self, start_date, end_date=None):
+        """
+        Returns [{'week_start': date, 'orders': int}, ...] for every Monday-based
+        week from the week of start_date to the week of end_date (inclusive),
+        with empty weeks filled in as 0. Summed from the daily order summary,
+        so at most one row per day of the window is read.
+        """
+        end_date = end_date or datetime.now()
+        first_week = start_date.date() if isinstance(start_date, datetime) else start_date
+        last_week = end_date.date() if isinstance(end_date, datetime) else end_date
+        first_week -= timedelta(days=first_week.weekday())
+        last_week -= timedelta(days=last_week.weekday())
+
+        try:
+            cursor = self.conn.cursor(dictionary=True)
+            cursor.execute(queries.WEEKLY_ORDER_COUNTS, (first_week, last_week + timedelta(days=7)))
+            counts = {row['week_start']: row['orders'] for row in cursor.fetchall()}
+            cursor.close()
+        except mysql.connector.Error as err:
+            print(f"✗ Error fetching weekly order counts: {err}")
+            return []
+
+        weeks = []
+        week = first_week
+        while week <= last_week:
+            weeks.append({'week_start': week, 'orders': int(counts.get(week, 0))})
+            week += timedelta(days=7)
+        return weeks
+
+    @pooled
     def edit_employee(self, employee_id, fname, mname, lname, email, phone, username=None, password=None, role=None):
         """
         Edit employee information and optionally update credentials
@@ -876,8 +1354,12 @@ class Model:
                             sec_query = f"UPDATE SecurStaff SET {', '.join(update_parts)} WHERE StaffID = %s"
                             cursor.execute(sec_query, tuple(params))
 
+            self._bump_version(cursor, 'Employees', 'Staff', 'Admin')
             self.conn.commit()
+            self._tables_changed('Employees', 'Staff', 'Admin')
             cursor.close()
+            # Keyed by EmployeeID here, not StaffID: let the next search rebuild
+            self.staff_index.invalidate()
 
             # Return updated employee info
             return {
@@ -898,6 +1380,7 @@ class Model:
             QMessageBox.critical(None, "Error Editing Employee", str(err))
             return None
 
+    @pooled
     def get_employee_full_info(self, employee_id):
         """
         Get complete employee information including role and credentials
@@ -953,6 +1436,7 @@ class Model:
 
 
 
+    @pooled
     def update_staff_last_active(self, staff_id):
         """Update the LastActiveAt timestamp for a staff member"""
         try:
@@ -962,12 +1446,15 @@ class Model:
             cursor.execute(query, (now, staff_id))
             self.conn.commit()
             cursor.close()
+            # Not a tracked change, so only this record's cached copy is dropped
+            self.entity_cache.invalidate('staff', staff_id)
             print(f"✓ Updated LastActiveAt for StaffID {staff_id} to {now}")
             return True
         except Exception as e:
             print(f"✗ Error updating LastActiveAt: {e}")
             return False
 
+    @pooled
     def log_staff_activity(self, staff_id, activity_type, order_id=None, customer_id=None):
         """
         Log a staff activity to the database
@@ -989,7 +1476,9 @@ class Model:
                     VALUES (%s, %s, %s, %s, NOW())
                     """
             cursor.execute(query, (staff_id, activity_type, order_id, customer_id))
+            self._bump_version(cursor, 'StaffActivityLog')
             self.conn.commit()
+            self._tables_changed('StaffActivityLog')
             cursor.close()
             return True
         except Exception as e:
@@ -997,6 +1486,7 @@ class Model:
             self.conn.rollback()
             return False
 
+    @pooled
     def get_recent_activities(self, limit=10):
         """Get recent staff activities with staff and customer/order details"""
         try:
@@ -1030,6 +1520,7 @@ class Model:
             traceback.print_exc()
             return []
 
+    @pooled
     def get_staff_activities(self, staff_id, limit=20):
         """Get activities for a specific staff member"""
         try:
@@ -1065,22 +1556,14 @@ class Model:
             QMessageBox.critical(None, "Error Fetching Admin Details", str(err))
             return None
 
+    @pooled
     def get_top_services_this_week(self, limit=3):
         """Get top services used this week by count"""
+        week_start = datetime.now().date()
+        week_start -= timedelta(days=week_start.weekday())
         try:
             cursor = self.conn.cursor(dictionary=True)
-            query = """
-                    SELECT ServiceName, \
-                           COUNT(*)         as service_count, \
-                           SUM(TotalAmount) as total_revenue
-                    FROM OrderService os
-                             INNER JOIN Orders o ON os.OrderID = o.OrderID
-                    WHERE YEARWEEK(o.OrderDate, 1) = YEARWEEK(CURDATE(), 1)
-                    GROUP BY ServiceName
-                    ORDER BY service_count DESC
-                        LIMIT %s
-                    """
-            cursor.execute(query, (limit,))
+            cursor.execute(queries.TOP_SERVICES, (week_start, week_start + timedelta(days=7), limit))
             results = cursor.fetchall()
             cursor.close()
             return results
@@ -1,11320 +0,0 @@
-# -*- coding: utf-8 -*-
-
-# Resource object code
-#
-# Created by: The Resource Compiler for PyQt5 (Qt v5.15.2)
-#
-# WARNING! All changes made in this file will be lost!
-
-from PyQt6 import QtCore
-
-qt_resource_data = b"\
-\x00\x00\x0d\xdc\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x28\x00\x00\x00\x2c\x08\x06\x00\x00\x00\x17\x6f\xfa\x7b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0d\x71\x49\x44\x41\x54\x58\x47\xcd\x99\x6b\x70\
-\x5c\xe5\x79\xc7\x7f\xef\x39\x67\xcf\xd9\xab\x56\x92\x25\xd9\x92\
-\x6c\x5d\x91\xb0\x85\x0d\xd8\x60\x08\xd8\x99\x60\x9a\x00\x2e\x75\
-\xcc\x2d\xbd\xc4\x0d\x53\x26\x4d\x1b\x37\x9d\x96\x09\x24\x94\xc9\
-\x4c\x3e\x40\x9b\xe6\x03\xed\x4c\x93\x34\xa4\x01\x12\x32\x05\x5a\
-\x0a\xe5\x16\x30\x60\x9b\x80\x31\x60\x30\x18\xdf\xb1\x2d\x5b\xd6\
-\x6d\x75\x5d\xad\xb4\xda\xcb\xd9\xdd\x73\x7b\xfb\xe1\xac\x64\xad\
-\x6d\x98\x7e\x21\xf0\xcc\x9c\xd1\xcc\xee\x7f\x9f\xf3\xbc\xef\xf3\
-\x3e\xff\xe7\xff\xbc\x12\x52\x4a\xc9\x59\x26\x25\x0c\x25\x0b\x1c\
-\x1c\xc8\x52\xb2\x3c\x42\x86\xca\xca\xd6\x28\x6d\x0d\xa1\xb3\xa1\
-\x00\x4c\xcc\x94\xd8\x77\x3a\x43\xbe\xe0\xa2\x07\x14\x7a\x96\x45\
-\xe8\x6c\x8c\xa0\x88\xb3\x91\x30\x9d\xb5\xd8\xd7\x97\x21\x9d\x77\
-\xd0\x14\x41\x57\x73\x84\xe5\x4b\x23\x68\xe7\x03\x03\xe2\x7c\x01\
-\x66\x0b\x2e\xff\xfe\xd2\x20\xaf\xee\x9f\xa2\x21\xae\x93\xca\xda\
-\xac\xed\x8a\x73\xdf\x96\x2e\x02\x6a\xa5\xa3\xa2\xed\xf2\xd8\xeb\
-\xa3\x3c\xfe\xe6\x18\x8b\xe3\x3a\x33\x79\x9b\x15\xcd\x51\xfe\xe9\
-\x1b\xdd\x44\x82\x6a\x05\xb6\x64\x7b\x3c\xff\xde\x04\x0f\xbe\x32\
-\x4c\x5d\x2c\x40\xae\xe8\xb2\x74\x51\x90\x1f\xdd\xde\x4d\x7d\x95\
-\x5e\x81\x9d\x33\x05\x40\x02\xae\x2b\x31\x8b\x2e\x19\xd3\x21\x31\
-\x55\x60\x30\x59\xe0\xba\xd5\x75\xfc\xc7\x77\x2e\xe2\xba\xd5\x8b\
-\xe8\x1b\x33\xe9\x1f\x37\xc9\x98\x4e\xc5\x33\x9a\xb2\x38\x9e\xc8\
-\xb3\x6e\x79\x0d\xbf\xf8\x9b\x8b\xb8\x7d\x43\x33\xc3\x53\x45\x4e\
-\x8e\x9d\x8b\x1d\x9f\x29\x71\x78\x30\xc7\xca\x96\x28\x3f\xf9\xab\
-\x1e\xbe\xf3\x87\x2d\x4c\xa6\x2d\x4e\x8e\xf8\xd8\x5c\xc1\xc1\x76\
-\x3d\x16\x6e\x99\xe6\x79\x92\x91\x54\x89\x37\x8e\xa4\x18\x4c\x16\
-\xb1\x1c\x49\xc6\xb4\x19\x4a\x16\xf9\xc2\x85\xd5\x84\x0d\x95\x25\
-\xd5\x06\xa9\xac\xcd\xcf\xb6\x0d\x51\x1d\x0e\x2c\x58\x1f\xe4\x2d\
-\x97\xe3\x89\x1c\x37\xac\xa9\x27\x6c\xa8\xd4\x57\xe9\xe4\x8a\x2e\
-\xbf\x7c\x75\x98\xba\x58\xe5\xae\x14\x2c\x87\x8f\x86\xf3\xac\xed\
-\x8a\x13\x0d\xaa\xd4\xc5\x74\x3c\x29\x79\xf4\xb5\x04\x4b\x6a\x0c\
-\x34\x55\x50\x57\xa5\xb3\xbe\xa7\x86\x8b\x5a\xa2\xa8\x8a\x40\x99\
-\xcc\x58\xfc\xf4\xa5\x41\xfe\xf3\x8d\x51\x4e\x24\x72\x4c\x67\x2d\
-\x32\xa6\x83\xe3\x7a\x15\xce\x5d\xcf\x23\x67\x3a\xcc\xe4\xad\x8a\
-\x27\x93\xb7\xb1\x1c\x09\x0b\x32\xef\x49\x49\xae\x70\x2e\x76\xd6\
-\x74\xb0\x9c\x05\x7e\x85\x9f\xbd\x5c\xd1\x65\x26\x6f\x33\x90\x2c\
-\xf0\xc2\xde\x49\xfe\xf5\xf9\x7e\x4e\x8c\xe4\x91\x80\xb6\xb7\x77\
-\x96\xbe\x71\x93\xef\xdd\xdc\xce\x86\x55\x8b\x10\x02\xfa\x27\x0a\
-\x3c\xf0\x6c\x3f\x45\xcb\xc5\x76\x25\x45\xdb\x63\x71\xb5\xc1\x3d\
-\xb7\x75\x70\x41\x63\xf8\xcc\x0b\x80\xf1\x99\x12\x0f\x3c\xd7\x4f\
-\xd1\xf2\xb0\x5d\x49\xc9\xf1\xa8\x8d\x05\xb8\x73\x73\x1b\x97\xb4\
-\xc5\x2a\xb0\x93\xb3\x16\x3f\xf9\xed\x20\x25\xe7\x0c\x36\x12\x54\
-\xd9\xba\x71\x19\x57\xaf\xa8\xc1\xf3\xa0\x6f\x3c\xcf\xbf\xfd\x76\
-\x90\x3d\xc7\xd3\x74\x35\x46\x50\x52\x19\x9b\xc6\x1a\x83\x2f\xf6\
-\xd4\xa2\xa9\x02\x55\x11\xc4\xc3\x1a\x55\x61\x8d\x5d\x47\x67\x78\
-\xfc\x8d\x51\x76\x1f\x9d\x26\x1a\x54\x69\x88\xeb\xa8\x8a\x8f\x99\
-\x7b\x62\x21\x8d\x86\xb8\xc1\xde\xde\x59\x9e\x78\x63\x94\x97\xf7\
-\x25\xd1\x55\x85\xc6\x6a\xe3\x1c\x6c\x34\xa8\xd2\x54\x6b\x70\x74\
-\x30\xc7\x7f\xed\x1a\xe3\xf9\x77\x27\xf1\x3c\x49\x63\x6d\x10\x55\
-\x11\x04\x34\x41\x57\x53\x84\x75\x2b\x6a\x98\x48\x97\x70\x3d\x89\
-\x82\x80\xb0\xa1\x20\x16\xa4\xa8\x26\x1a\x60\xc3\xaa\x5a\x8a\x96\
-\xc7\x53\x6f\x8f\x53\xb0\x3c\x6e\xb9\x6a\x09\xf1\x88\xb6\x70\x43\
-\x00\x88\x85\x34\x36\xac\xaa\x25\xa0\x0a\x9e\x7a\x7b\x9c\xe1\xa9\
-\x22\x37\x5e\x5e\x4f\x5d\xfc\xdc\xaa\x8c\x06\x7d\x6c\x7d\x5c\xe7\
-\xb9\xf7\x26\x38\x9e\xc8\xf1\xe5\x4b\xeb\x68\xae\x35\xe6\x31\xaa\
-\x22\x08\x1b\x0a\x9e\x94\x48\x40\xfc\x7a\x67\x42\x1e\x4b\x64\xb9\
-\xef\xeb\xdd\x18\x01\x65\x1e\xe8\x78\x92\x44\xb2\xc8\xc8\x74\x91\
-\xe6\xda\x20\xcb\xea\xfd\x55\x9e\xcf\xe6\x0a\x6d\x28\x59\xa0\x2e\
-\xae\xd3\xb1\x38\x4c\x40\x3b\x3f\x56\x4a\x98\x48\x97\xe8\x9f\x30\
-\x89\x87\x03\x74\x36\x86\x2b\xde\x0b\xf0\xcc\x9e\x09\x3e\x1a\xce\
-\x71\xd7\x4d\xed\x28\x7e\x9c\xe7\x9a\xa6\x08\xda\x16\x87\x58\xb7\
-\xa2\x86\xb6\xc5\xa1\x8f\x0d\x0e\x40\x51\x04\xcb\xea\x83\xac\xeb\
-\xa9\xe1\xc2\xe6\xc8\xc7\x06\x07\x20\x04\x2c\xa9\x31\xb8\x6a\x79\
-\x0d\x3d\x2d\xd1\x73\x82\x3b\xdb\x3e\xf9\xdb\xcf\x81\x89\x47\x76\
-\x24\xe4\xae\x23\x29\xfe\xec\x8b\x4d\x9f\xb8\xf2\xdf\xa7\xbd\xd7\
-\x9b\xc6\xf1\x24\xdf\xbb\xb9\x03\xf1\xd0\xab\xc3\xf2\xa1\xed\xc3\
-\xd4\x55\xe9\x15\x85\xf2\x59\x5a\xd1\xf2\x58\xdf\x53\xcd\x3d\xb7\
-\x76\x22\x7e\xb5\x23\x21\xdf\x39\x9e\xe6\x5b\xd7\x2d\x25\xa0\x7d\
-\x3e\x32\xbe\xfb\xe8\x34\xb3\xa6\xcd\xdd\x37\x77\x20\x7e\xb5\x73\
-\x58\x1e\x4f\xe4\xb8\xef\xeb\xdd\xe8\x01\x05\xdb\xf1\xb0\x9d\x33\
-\x85\xa3\x28\x60\x04\x14\x94\xf2\xf6\x7a\x12\x2c\xdb\xc3\xf5\xce\
-\x60\x02\x9a\x20\xa0\x29\xf3\xcd\xc4\x71\x25\x96\x73\xa6\xa7\x0a\
-\xe1\xfb\x98\x2b\x34\x29\xc1\x72\x3c\x1c\xf7\x8c\x0f\x4d\x15\xe8\
-\x9a\x4f\x77\x0b\xab\xb8\x82\xd8\x0a\x25\x97\x9d\x07\x52\xbc\xd7\
-\x9b\xc6\xb2\x3d\x14\x45\xd0\x58\x6b\xf0\xd5\x2b\x1b\x68\x5f\x1c\
-\x06\x09\x43\x93\x05\xb6\xed\x4b\x32\x30\x51\x40\x4a\x49\x20\xa0\
-\x70\x59\x67\x15\xd7\xad\xae\x27\x16\x52\xb1\x5d\xc9\x9e\x63\x33\
-\xbc\x7e\x64\x9a\x9c\xe9\x80\x10\xd4\x44\x35\x36\x5e\x56\xcf\xc5\
-\x6d\x31\x54\x45\x30\x93\xb7\x79\x71\xef\x24\x47\x87\x72\x78\x9e\
-\x44\x55\x05\xdd\x4d\x11\x36\x5d\xd1\x40\xfd\x59\xfc\x39\x9f\x53\
-\x09\x0c\x26\x0b\x3c\xfa\xbb\x11\x8e\x25\xf2\xe4\x4a\x1e\xc9\x8c\
-\xc5\x8b\xef\x27\xd9\xb1\x3f\xe5\xef\xac\xeb\xf1\xda\xa1\x14\x4f\
-\xbd\x3d\x4e\x2a\x67\x93\x2b\x79\x0c\x4c\x16\x78\x64\x47\x82\x81\
-\x09\x13\x80\x8c\x69\xf3\x9b\xd7\x47\xd8\x73\x3c\x4d\xae\xe4\x91\
-\xce\xdb\xbc\x75\x2c\xcd\x33\x7b\x26\xc8\x17\x5d\x5c\x4f\xf2\xc1\
-\xc9\x59\x1e\xdb\x35\x46\x22\x55\x24\x57\xf2\x18\x9b\xb6\x78\x7c\
-\xd7\x28\x07\xfa\x33\x15\x4a\x86\x0a\x9a\x91\x90\x35\x5d\xf4\x80\
-\x60\xcb\x97\x1a\x79\x70\x6b\x0f\xff\xb8\xa5\x8b\xe5\x4b\x23\xa4\
-\x4d\x1b\xc7\x95\x48\x09\xe9\xbc\x4d\x53\xad\xc1\x8f\x6f\xef\xe6\
-\xc1\xad\x3d\xdc\xb5\xb9\x8d\x7c\xd1\xa5\x60\xf9\x22\xc0\x2c\x7a\
-\x58\xb6\x64\xc3\xaa\x5a\x1e\xdc\xda\xc3\x03\x77\x2c\xe7\xda\x55\
-\xb5\xa4\xf3\xf6\x7c\xda\x67\x4d\x87\xea\x88\xc6\x77\x6f\x6a\xe3\
-\xc1\xad\x3d\xfc\xe0\x4f\x3a\xa8\x8d\xe9\xa4\xf3\x0e\xde\x59\x11\
-\x7e\x3e\xaa\xe2\x13\xac\x22\x40\x5d\x13\x78\x2e\x1c\x1e\xcc\xb1\
-\x6d\x5f\x92\xd7\x8f\x4c\x93\xca\xda\x04\x03\x2a\x8a\x10\x08\x01\
-\xc1\x80\x42\xae\xe8\xf2\xda\xa1\x14\xdb\xf6\x25\x79\xaf\x37\x8d\
-\xae\x89\x79\xa5\xad\xaa\x3e\x6e\xb0\x7c\x56\x77\x1c\x9c\x62\x60\
-\xb2\x80\x11\x50\x51\x15\xff\x3b\x23\xa0\x50\xb2\x3d\xde\x3d\x91\
-\x66\xdb\xbe\x24\xbb\x8f\xce\x50\xb0\x5c\x82\x81\x33\x85\x36\x67\
-\xf3\x45\x22\x04\x2c\xad\x0b\xd2\xd3\x12\x65\xcf\x89\x34\xbb\x3f\
-\x9a\x41\x00\x8b\x6b\x0c\x2e\xeb\xac\x42\x0f\x08\xa4\x84\x35\x9d\
-\x71\xf6\xf5\x65\x78\x68\x7b\x02\x80\x80\x2a\xb8\x6a\x79\x0d\x8d\
-\xe5\x86\x5f\x1d\xd1\xb8\xb2\x3b\xce\x2b\xfb\x53\xfc\xcb\x73\x03\
-\x00\x54\x85\x34\xfe\xfc\x9a\x46\x22\x41\x7f\xa1\xcb\x9b\x23\xb4\
-\xd6\x87\x78\x66\xcf\x24\x00\x8a\x80\xae\xa6\x30\xdd\xcd\x11\x94\
-\xb3\x5a\x6a\x25\xcd\x68\x0a\x05\xcb\xad\xa0\x08\x55\x15\x84\x75\
-\x15\xad\xbc\x43\x8e\x2b\x29\x58\xee\x3c\x45\x08\x01\xba\xa6\x10\
-\xd2\x55\x44\x59\x80\x96\x6c\x8f\x92\xe5\xcd\x9f\x27\x45\x11\x84\
-\x74\x05\xbd\xcc\xb3\x9e\x27\x31\x2d\x0f\x7b\x4e\xbc\x0a\x08\xa8\
-\x0a\x61\x5d\x41\x51\x44\xa5\x58\xf0\x11\x67\x4c\x4a\xc8\x17\x3d\
-\x72\x05\x97\x7c\xd1\xc5\xb2\xbd\xf9\x0e\x23\x01\xb3\xe4\x72\x72\
-\xd4\x64\xff\xe9\x0c\x1f\xf6\x65\x38\xd0\x9f\x25\x31\x55\x9c\x0f\
-\x58\x4a\xc9\xd4\xac\xc5\xe1\xc1\x2c\x1f\xf6\x65\xd8\x7f\x3a\xc3\
-\xd1\xc1\x1c\xb3\x79\x67\x5e\x96\xd8\xae\x64\x60\x72\x81\x8f\xbe\
-\x2c\xfd\xe3\x26\xa5\x85\x6a\xbb\x6c\x15\x3c\x98\xce\xdb\xfc\x7c\
-\xdb\x10\x87\x07\xb3\x08\x21\x90\x40\x2c\xa8\x72\xc7\x97\x97\x72\
-\xd5\x85\xd5\xb8\x9e\x64\xd7\x91\x69\x1e\xde\x91\xc0\x71\x25\x42\
-\x80\xeb\x49\x9a\x6a\x0d\x7e\xf0\xb5\x4e\x3a\x96\x84\xc9\x15\x5d\
-\x7e\xfe\xf2\x10\x1f\x9c\xcc\xcc\x1f\x0b\x4f\x4a\x36\xad\x6d\xe0\
-\x8e\x3f\x68\xc6\xd0\x15\x0e\x0f\x66\x79\xe0\xd9\x7e\x7f\xf4\x54\
-\x05\x9e\x27\x89\x04\x55\xee\xb9\xb5\x83\xcb\x2f\x88\x2f\x0c\x69\
-\x01\x0f\x4a\x18\x4e\x16\x79\xff\xd4\x2c\x41\x5d\x61\xc5\xd2\x30\
-\xad\x75\x41\x46\x52\x45\xf6\x9d\x9a\xa5\xe4\xf8\xdd\xe3\xd4\x98\
-\x89\xaa\x08\xee\xbe\xb9\x9d\xfb\xb7\x74\x73\xfb\x86\x66\x7a\x47\
-\xf2\xa4\xb2\x36\x00\x99\xbc\xc3\xe0\x64\x81\x8b\xdb\xa2\xdc\xbf\
-\xa5\x9b\x7f\xb8\xb5\x83\x55\xad\x51\x8e\x8f\xe4\x31\x2d\x0f\xcf\
-\x83\x81\xc9\x02\x45\xcb\xe3\x2f\xae\x6d\xe6\xfe\x2d\xdd\x7c\xfb\
-\x86\x16\x8a\xb6\xc7\x50\xb2\x58\xd1\xa1\x38\xbb\x8a\x8b\xb6\x47\
-\x50\x57\xd8\xb4\xb6\x81\x1f\xfe\x69\x17\x7f\xbf\xa9\x95\x8e\x25\
-\x61\x4c\xcb\xc5\x2b\xff\xd0\x93\x92\x90\xae\xb0\xb2\x25\xca\xea\
-\x8e\x18\xdd\x4d\x61\x14\xe1\xef\x14\xe5\x85\x2a\x42\x50\x1f\xd7\
-\x59\xdd\x11\xe3\xe2\xb6\x18\x0d\x71\x03\x29\x25\x73\x23\xb8\x94\
-\xa0\x07\x14\xba\x9a\xc3\xac\xee\x88\xb1\x7c\x59\x84\x60\x40\x3d\
-\x27\x38\xce\x0e\x50\x08\xff\xc7\xa6\xe5\x92\xce\xdb\x64\x0a\x7e\
-\x31\x2c\xac\x2b\x45\x08\x2c\xc7\x23\x91\x2a\x32\x94\x2c\x30\x91\
-\x2e\xa1\x08\xbf\x12\xe7\x7d\x00\xd9\x82\xc3\x50\xb2\xc0\x70\xaa\
-\x48\xa6\xe0\x94\x69\xca\xa7\x19\x55\xf8\x73\xf8\xc4\x8c\xaf\xc2\
-\xc7\xa6\x4b\xd8\xae\x3c\xaf\x28\x2e\x9f\x41\x81\x3f\x9b\xa8\xb8\
-\xae\x64\xfb\xfe\x14\x27\x12\x79\xcc\x92\xc7\x60\xb2\xc0\x25\xed\
-\x7e\x0f\x55\x15\x41\x6b\x43\x90\x97\x3e\x70\xf8\xd6\xcf\x8e\x82\
-\xf0\x57\xd8\xdd\x1c\x26\x1e\xf5\xe7\xe5\x68\x48\xa5\xae\x2a\xc0\
-\x8e\x03\x29\x5e\xd9\x9f\x02\xe9\xf3\xeb\xd7\xd6\x2d\xf1\x79\x4e\
-\x40\x63\x6d\x10\xdb\x93\xfc\xf0\x89\x53\x20\x04\x02\xa8\xab\x0a\
-\xd0\x58\x6b\x9c\x4b\x33\x8f\xbf\x31\x2a\xfb\xc6\x4d\xbe\x7f\x4b\
-\x3b\xb6\x23\x79\xe1\xfd\x09\x0e\x0f\xe4\xb0\x5d\x89\x22\x60\x51\
-\x2c\xc0\xe6\x2b\x1b\xb8\x70\x69\x14\x24\x4c\xe7\x6c\x0e\xf6\x67\
-\xe6\xcf\xdc\x5c\xd0\x2b\x5b\x62\x18\x01\x05\xd7\x93\xf4\x8d\x99\
-\x1c\x1f\xc9\x53\xb2\xfd\xaa\x0c\xe9\x2a\x97\xb4\xc5\x58\x5a\x17\
-\x44\x08\xc8\x17\x5d\x0e\xf4\x67\x18\x9d\x2e\xf9\x41\x08\x58\x52\
-\x6d\x70\x69\x47\x15\xd1\xa0\xca\x33\x7b\xc6\xcb\x34\xd3\x81\x38\
-\x91\xc8\x49\xcb\xf1\xe8\x69\x89\x22\x10\x7e\x7a\x73\x36\xae\x27\
-\x11\xc2\xe7\xaf\x9a\x68\xa0\x42\x2a\x15\x2c\x77\xfe\xe5\x8a\x10\
-\x04\x75\xa5\x72\xe0\x72\x25\x66\xc9\x17\x06\x62\x8e\x4b\x0d\xbf\
-\x93\xfc\x7f\xac\x22\xc0\x74\xde\x96\xae\x27\xa9\x89\x04\xc8\x17\
-\x5d\x5e\xfe\x30\xc9\x87\x7d\x99\xf9\xb3\xd7\x50\xad\xb3\xf9\xca\
-\x06\x2e\x68\x8a\x80\x84\xfe\x09\x93\x17\xdf\x4f\x32\x3c\x55\x00\
-\x04\x9a\x2a\xb8\xb8\x2d\xc6\x8d\x97\xd7\x53\x15\xd6\xb0\x1c\x8f\
-\x37\x8f\x4c\xf3\xe6\x47\x33\x14\x4a\x1e\x20\xa9\x0a\x6b\xdc\xb0\
-\xa6\x9e\x35\x9d\x55\xf3\x41\x7a\x12\xcc\xa2\x43\x2a\x6b\x53\xb0\
-\xdc\xf9\x22\xf3\x24\xbc\xf2\x61\x92\x5c\xd1\xe1\xfb\xb7\x74\xa2\
-\xed\xed\x4d\x33\x95\xb1\xb8\x6d\x5d\x23\x83\xc9\x02\x4f\xbc\x39\
-\x46\x2c\xa8\xd2\xbe\x38\x8c\x59\x72\xd9\x79\x30\x45\xd8\x50\x69\
-\xa9\x0f\x21\x04\xec\x3c\x98\xe2\x85\xbd\x93\x5c\xd6\x59\x45\x50\
-\x57\x99\xca\x58\xfc\x7a\x67\x82\x9e\x65\x51\x2e\x69\x8f\x91\xce\
-\x39\x3c\xb6\x6b\x8c\xd9\xbc\xcd\xc5\x6d\x55\x58\x8e\xc7\x81\xfe\
-\x2c\x85\x92\x47\x77\x53\x84\x78\x44\xf3\xe9\x6a\xd4\xe4\xe9\x77\
-\xc6\x39\x3d\x5e\xc0\xf1\x3c\x24\x20\x3d\xbf\xb8\x52\x59\x9b\x6b\
-\x2f\xa9\x05\x40\x59\xd9\x12\xe3\xea\xe5\x35\xa8\xe5\xb3\x61\x68\
-\x82\x8d\x97\xd5\x73\xef\x6d\x1d\x6c\xdd\xb8\x8c\x8e\x25\x21\x72\
-\x45\x07\xd7\xf3\xe5\x56\xb6\xe0\x50\x1f\xd7\xf9\xdb\x1b\x5b\xb9\
-\xf7\xb6\x0e\xb6\x7c\xa9\xd1\x6f\x6d\xe5\x94\x97\x6c\x5f\x29\x5f\
-\xde\x15\xe7\xde\xdb\x3a\xb8\xf3\xab\xad\xac\xed\x8a\x93\x2d\xfa\
-\x37\x57\x00\x53\x19\x9b\x87\xb6\x27\xf8\xe0\xd4\x2c\x57\xaf\xa8\
-\xe6\x2f\xaf\x5b\xc6\x5f\x5f\xdf\xc2\xa6\x2b\x1a\x50\x14\x41\xb6\
-\xe8\xcc\x65\x1b\xe5\x5c\xe6\xf1\x0f\xed\xc2\xbf\xe7\xb3\x8f\xc5\
-\xcc\x7d\x7e\xee\x47\x50\xee\xc3\xbd\x23\x39\x7a\x47\xf3\xfc\xf1\
-\xfa\x25\x7c\xf3\x2b\x4b\x59\xbf\xa2\x86\xb6\x86\x20\x1f\x0d\xe7\
-\xc8\x98\x8e\x7f\x27\x53\x76\xac\xed\x3e\x3a\xc3\xc0\x84\xc9\x9d\
-\x9b\xdb\x08\x1b\x0a\xb6\x23\x79\x79\xdf\x24\xc7\x87\x73\xe4\x4b\
-\x2e\x03\x13\x05\x56\xb6\xf8\x34\x23\x04\x44\x43\x1a\xc9\x59\x8b\
-\x9f\xbe\x38\x48\x48\x57\x48\x66\x2c\x8c\x80\x82\x11\xf0\x1d\x1a\
-\x9a\x3f\x7b\xbc\x7f\x32\xcd\x8f\x9f\xee\xc3\x72\x3c\x7a\x47\x4d\
-\xba\x1a\xc3\x68\xaa\xdf\x3e\x93\x19\x8b\xa0\xae\xd0\xb9\x24\x8c\
-\x27\x61\x24\x55\xe4\xe1\xed\xc3\x1c\x1a\xc8\xf1\xed\x1b\x96\x51\
-\xb2\x3d\xfa\x27\x0b\x00\x28\xa6\xe5\x30\x9d\xf7\x29\x63\x59\x7d\
-\x88\xd5\x9d\x55\xe4\x8b\x92\x43\x83\x39\x4e\x4f\x14\x68\xac\x31\
-\x58\xd3\x59\x85\x11\x50\xd0\x14\xc1\xea\x8e\x18\xad\x0d\x21\x4e\
-\x8e\x99\x1c\x1a\xcc\x31\x9e\xb6\x59\x7f\x51\x0d\x8d\xb5\x41\x00\
-\x62\x61\x95\xf5\x2b\xaa\xd1\x35\x95\x43\x83\x39\x8e\x8f\x98\x18\
-\x01\x85\x2f\x5c\x58\x4d\x24\xa8\x21\x25\xcc\xdd\xec\x09\x45\x30\
-\x9a\x2a\xf2\xe8\x6b\x23\xbc\x73\x2c\xcd\x96\x6b\x1a\xd9\x74\x45\
-\x03\x21\xe3\xcc\xcd\xac\x78\x64\xc7\xb0\x3c\x3c\x90\xe5\x47\xb7\
-\x77\x13\xd2\x55\x1c\x57\x92\xca\xd9\x38\x8e\x2f\x06\xa2\x41\x95\
-\xaa\xf0\x19\x4d\x31\x47\x33\x33\x39\xff\x9c\x68\xaa\x3f\x14\xcd\
-\x49\x29\xf0\x05\xc4\x6c\xde\xa1\x60\xf9\x4a\x68\x8e\xaa\x28\x53\
-\xd0\xb3\xef\x4e\xf0\x3f\x6f\x8d\xf1\x8d\x0d\x4d\x1c\xec\xcf\xb1\
-\xb7\x37\xcd\x96\x6b\x9a\xd8\x5c\x0e\xae\x42\x6e\x79\x9e\xbf\xc5\
-\x63\xd3\x25\x1c\x57\xa2\xa9\x82\xc5\x71\x9d\xe6\x45\x06\x4d\xb5\
-\x46\x45\x70\x94\xcf\x5c\xd8\x50\x69\x5e\x64\xd0\xbc\xc8\x60\x71\
-\xb5\x5e\x11\x1c\x65\xf2\xae\x8d\x05\xe6\x7d\xcc\x05\x47\x59\xb2\
-\x39\xae\x47\x3a\xef\xf0\xdf\x6f\x8e\x73\xe0\x74\x86\xad\x1b\x5b\
-\xb8\xe5\xaa\xc5\x15\x3b\x37\x67\xe2\xa1\x57\x87\xe5\x2f\x5e\x19\
-\x62\x6d\x57\x35\xd7\xaf\x59\x44\x6d\xf4\xd3\xbd\x61\xb0\x6c\x8f\
-\x57\xf7\x4f\xf1\xbb\xc3\x29\x1a\xaa\x74\xb6\x6e\x6c\xe1\x86\x35\
-\xf5\x15\xd7\x2e\x3e\x51\xe7\xb9\xeb\xa6\x76\x3f\xc5\x4f\xee\x1e\
-\xe7\x82\xc6\x30\x7d\x13\x66\x99\x5c\x3f\x3d\x13\xe5\xb1\x60\x65\
-\x6b\x8c\xeb\x57\xd7\x71\x45\x77\xbc\xa2\x0b\x49\x09\x4f\xee\x1e\
-\xe3\xd4\xb8\xc9\xdd\x37\xb5\x23\x9e\x7c\x6b\x4c\xfe\xef\xdb\xe3\
-\xfc\xdd\xa6\x36\x5a\xeb\x83\xf3\x8a\xe3\xd3\x34\xad\xdc\xfa\x22\
-\x86\x3f\x26\xcc\x99\xeb\x49\xa6\x32\x16\x0f\x6f\x4f\x50\x1b\xd3\
-\xf9\xe6\x57\x9a\x11\x27\x47\x73\xf2\x9f\x9f\xee\xa7\x64\xbb\xfc\
-\xd1\xe5\x0d\xd4\xc4\x02\xe7\x4c\x56\xbf\x0f\x93\x80\x59\x74\x39\
-\x34\x90\xe5\xe8\x50\x8e\xef\xde\xd4\xc6\x95\xdd\xd5\x08\xc7\xf5\
-\xe4\xb1\xe1\x3c\x1f\x9c\x9a\x65\x78\xaa\x80\x59\x72\x7d\xf4\x67\
-\x60\x46\x40\xa5\xa1\x5a\xe7\xd2\xf6\x2a\x56\x77\xc6\xfc\x41\x4c\
-\x96\xff\xd5\xe4\xba\xb2\x7c\x7b\xf0\x19\x45\x07\x08\x21\x50\x15\
-\xd0\xd4\x33\x77\xe6\xff\x07\x4f\x57\xd1\x9a\xd3\xec\xbd\x05\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\xcb\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2c\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xc8\xdd\xb9\x1c\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x06\x60\x49\x44\x41\x54\x58\x47\xed\x98\xdb\x53\
-\x1b\xd7\x1d\xc7\x3f\xbb\x42\x2b\xc0\x92\x18\x74\x0b\xe2\xe2\x1a\
-\x0c\x48\xb8\x75\xc6\xb1\xdd\xc6\x69\x12\x17\x83\xdd\x99\xda\x75\
-\xdc\xf6\xa1\xad\x0d\x98\x34\x7d\x28\xed\xe4\x8f\xc8\x6b\x52\xb7\
-\x9d\x36\x2e\x66\xda\x71\xc2\xcd\x6e\x92\xe9\x4c\xea\xd8\x38\x29\
-\xb1\xdd\x5b\xfa\x60\x0c\x08\xf0\x38\x41\x42\x0b\xc6\x09\x98\x8b\
-\x10\xcc\x18\xdd\x17\xa9\x0f\x18\x35\x08\x09\x0b\x47\x64\xdc\x8e\
-\x3f\x2f\x9a\xd5\xea\xfc\xce\x67\xcf\xd9\xf3\xd5\xd9\x15\x1c\x0e\
-\x47\x8c\xff\x21\x84\x4c\x0a\xdf\xbb\x77\x8f\x9b\x43\x43\x0c\x7f\
-\x32\xcc\x96\xdc\x5c\x9e\xdc\xb5\x8b\xb2\xb2\x32\x34\xd9\x9a\xc4\
-\x9f\x3e\x34\x19\x13\x9e\x99\x9e\xe6\x7c\x67\x27\x43\x83\x43\x84\
-\x42\x21\x04\x41\x20\x3b\x27\x87\x17\xbe\x77\x8c\xea\x03\x07\xd0\
-\xeb\xf5\x89\x4d\x1e\x0a\x55\x53\x53\xd3\x2b\x89\x5f\x6e\x14\xd9\
-\xed\xe6\xcd\xb3\x6f\x30\xe0\x18\xa0\xe4\x2b\x5b\xf9\xd9\xcf\x9b\
-\xd8\xb6\xad\x14\x59\x96\x71\xf4\xf5\xa3\x28\x11\x8a\x8b\x8b\xc9\
-\xcd\xcd\x4d\x6c\xba\x61\xbe\xb0\xb0\xa3\xaf\x9f\x73\x9d\x9d\xb8\
-\x9c\x4e\x76\xed\x7e\x8a\x13\x75\x75\xd8\x6c\x36\xb6\x95\x96\x62\
-\xb1\x58\x18\x1b\x1b\x63\x68\x70\x90\x85\x85\x05\x8a\x4b\x4a\xd0\
-\xe9\x74\x89\x25\x36\xc4\x43\xdf\x12\xb1\x58\x8c\xbf\x5d\xbd\xca\
-\xa5\x8b\x97\x98\x9c\x98\xa0\xba\xe6\x00\x47\xbe\x7b\x94\xc2\xa2\
-\x42\x54\x2a\x15\x00\x91\x48\x04\x97\xd3\xc5\xf9\x8e\x0e\xc6\xc7\
-\xc7\xb1\xd9\xed\x9c\xa8\xaf\xa7\x6c\x7b\x19\x82\x20\x24\x96\x4c\
-\x8b\x87\x1a\x61\x45\x51\xb8\x78\xe1\x3d\x2e\xbd\x77\x91\x39\x8f\
-\x87\x17\x8e\x1d\xe3\xc8\xd1\xa3\x14\x14\x14\xc4\x65\x01\x54\x2a\
-\x15\x46\xa3\x91\xf2\xca\x4a\x26\x26\x26\x71\x0e\x0f\x23\xbb\xdd\
-\x58\x0b\xad\x18\x8d\x46\x44\x51\x5c\x55\x37\x1d\x36\x2c\x1c\x08\
-\x04\xf8\xf3\xdb\xef\x70\xa5\xbb\x9b\x40\x30\xc8\x0f\x8f\xff\x98\
-\xda\x43\x87\x30\x18\x0c\x49\x05\x44\x51\x44\xaf\xd7\x63\xb3\xdb\
-\x98\xf3\x78\x18\x71\xb9\xf8\xe4\xd6\xc7\x18\x4d\x26\x2c\x16\xcb\
-\xaa\x0b\x4c\x87\x0d\x09\x2f\xcc\xcf\x73\xae\xa3\x83\x7f\xfd\xe3\
-\x9f\x64\x65\x65\x71\xa2\xa1\x9e\xe7\x9e\x7f\x1e\x9d\x4e\xb7\xee\
-\x14\x0b\x82\x80\x56\xab\xa5\x6a\xc7\x0e\x7c\xbe\x45\xdc\xee\x11\
-\x86\x06\x06\xc9\xcb\xcb\xa3\xc0\x5a\x80\x5a\xad\x4e\x6c\x92\x92\
-\xb4\x85\x27\x27\x26\x68\x6b\x6d\xa3\xe7\x7a\x0f\x06\x43\x3e\x27\
-\x1b\x5f\xe4\xeb\x4f\x7f\x83\x9c\x9c\x9c\x75\x65\x57\x10\x04\x81\
-\xec\xec\x6c\x6c\x76\x3b\x8a\xa2\x30\x2a\x8f\x32\x38\xe0\x40\x92\
-\x24\xac\x85\x85\x68\x34\xe9\x65\x75\x5a\xc2\xb2\xdb\x4d\x7b\x5b\
-\x1b\x37\x07\x07\x29\x2d\x2b\xa3\xa1\xb1\x91\x9d\x4f\xee\x44\xa3\
-\xd1\xa4\x25\xbb\x82\x20\x08\x48\x92\x44\x79\x45\x05\x3a\xad\x16\
-\x59\x1e\xc5\xd1\xd7\x47\x2c\x16\xa5\xa8\xb8\x98\x9c\x9c\x9c\xc4\
-\x26\x6b\x78\xa0\x70\x6f\xcf\x0d\xce\x75\x2c\xc7\xd6\x9e\xbd\x7b\
-\x38\x5e\x57\x47\x79\x45\xc5\x86\xa6\x31\x11\xb5\x5a\x4d\xc9\xd6\
-\xad\x58\x0b\xac\x8c\x8d\x8d\x31\xe0\x18\x60\x7e\xde\x9b\x56\xec\
-\xa5\x8c\xb5\x68\x34\xca\x95\xee\x0f\xb9\xdc\xd5\xc5\xf4\xd4\x14\
-\xb5\x07\x0f\xf2\x9d\x23\x87\x29\xb0\x5a\x37\xbc\x50\x52\xa1\x44\
-\x22\xb8\xdd\x6e\x3a\x3b\x3a\xb8\x3d\x3a\x96\x56\xec\x25\x1d\xe1\
-\x70\x38\xcc\x5f\xde\x7d\x97\xcb\x5d\x5d\x2c\xcc\xcf\x73\xec\x07\
-\xdf\xe7\xf0\x91\xc3\x58\x9e\x78\x22\x63\xb2\x00\xa2\x4a\x45\xbe\
-\xc1\x40\x65\x65\x25\x77\xef\x2e\xc7\x9e\xfb\x01\xb1\xb7\x46\xd8\
-\xef\xf3\xf3\xd6\xf9\xf3\x5c\xbb\x72\x15\x45\x51\xf8\xd1\xf1\xe3\
-\xd4\xd4\xd6\x92\x9f\x9f\x9f\xb4\xc0\x17\x45\x14\x45\x74\x7a\x3d\
-\xf6\xaa\x2a\xbc\x73\x5e\x5c\x4e\x27\x1f\xdf\xba\x95\x32\xf6\x56\
-\x09\x7b\xbd\x5e\x3a\xdb\xdb\xf9\xf7\x47\x1f\x21\x69\x34\xd4\x9f\
-\x6c\xe0\x9b\xcf\x3e\x8b\x56\xab\x4d\x39\x45\x99\x40\x10\x04\x72\
-\xb7\x6c\xc1\xbe\xa3\x8a\x40\x20\xc0\xc8\xc8\x08\x43\x03\x03\x49\
-\x63\x2f\x2e\xfc\xd9\xa7\x9f\xd1\xde\xfa\x26\xbd\x37\x6e\x60\xb6\
-\x58\x38\xd9\xd8\xc8\xee\xbd\x7b\xc8\xcd\xcd\xdd\x54\xd9\x15\x04\
-\x41\x40\xa3\xd1\x60\xb3\xdb\x10\x05\x01\xd9\x2d\xe3\x70\xf4\xaf\
-\x89\x3d\x55\x53\x53\xd3\x2b\x2e\xa7\x93\xf6\xd6\x36\x6e\x0e\xdd\
-\xa4\xa2\xb2\x92\xfa\x93\x0d\x7c\x75\xe7\xd7\xd2\xce\xc6\x4c\xb1\
-\x12\x7b\x65\xdb\xb7\x93\x97\xa7\x47\x76\xcb\xf4\xf7\xae\x8e\x3d\
-\x11\x60\x66\x7a\x86\x39\x8f\x87\xa7\xf7\xed\xa3\xf1\xa5\x9f\x60\
-\xaf\xaa\xc2\xb7\xb8\xc8\xa8\x2c\x33\x3b\x3b\x8b\xa2\x28\x89\xb5\
-\x33\x4e\x38\x1c\xe6\xce\xf8\x1d\xc6\x6f\xdf\x06\xe0\xb9\xfd\xfb\
-\x79\xf1\xa7\x2f\x61\xb6\x58\x18\x1a\x18\xc4\xeb\xf5\xc2\x4a\xac\
-\x85\x42\x21\xdc\x23\x6e\xcc\x66\x13\x26\xb3\x19\x51\x14\xf9\xfb\
-\xb5\x6b\x74\x5d\xea\x62\xdf\x33\xcf\x70\xf0\xdb\x87\xc8\xcb\xcb\
-\x4b\xe8\x22\xb3\xcc\xcc\xcc\x70\xf6\x0f\x7f\x24\x12\x89\xd0\xd0\
-\xd8\x48\x69\x59\x29\x8a\xa2\x20\xbb\x65\xb2\x73\xb2\xb1\x5a\xad\
-\x48\x92\xb4\x3c\xc2\x1a\x8d\x06\x7b\x95\x1d\xb3\xc5\x12\x4f\x82\
-\x70\x38\xc2\xe2\xe2\x22\xa1\x50\x90\x58\x34\x9a\x58\x3f\xe3\xc4\
-\xa2\x31\xfc\x7e\x3f\x3e\x9f\x8f\xa5\xa5\x25\x00\xb2\xb2\xb2\x28\
-\xaf\x28\xa7\xa4\xa4\x04\x49\x92\x00\x96\x85\xb9\xbf\x15\xfc\x32\
-\x16\xd7\x46\x51\xa9\x54\xab\xe2\x34\xf3\xc1\xba\xc9\x3c\x16\xde\
-\x6c\x52\x0b\xdf\xbf\x9d\x05\x84\xff\x1e\xa4\x60\x69\x69\x09\x47\
-\xbf\x83\xd6\xb3\x6f\xf0\xeb\x5f\x9e\xe2\xd4\xab\xaf\x71\xea\xd5\
-\xd7\xf8\xcd\xa9\x5f\xf1\xf6\x9f\xde\xe2\xd3\x3b\x77\xe2\x0b\x29\
-\x15\xe9\x2e\x9f\xd4\xc2\xf7\xf7\x70\xcb\x1f\x49\x37\x74\x71\xae\
-\x5d\xb9\x4a\x7b\x6b\x2b\x1f\x76\x77\x73\xa3\xa7\x87\xde\xde\x5e\
-\x7a\x7b\x7b\xe9\xb9\x7e\x9d\x8b\x17\x2e\xd0\xd2\x7c\x86\xdb\x63\
-\x63\x89\xcd\x56\x11\x5b\xbf\x8b\x38\xa9\x85\xe3\x23\xfc\xb9\x83\
-\x24\x84\xc3\x61\xfa\xfb\xfb\xf0\xfb\xfd\xfc\xe2\xe5\x97\x39\x7d\
-\xa6\x99\xe6\x96\x16\x9a\x5b\x5a\x38\x7d\xa6\x99\xfd\xd5\xd5\xdc\
-\x9d\x9c\x44\x76\xcb\x04\x02\x81\xc4\xe6\x71\xbe\xb4\x11\xf6\xfb\
-\x7c\x04\xfc\x7e\xb4\x5a\x2d\x66\x8b\x05\xa3\xc9\x84\xc1\x68\xc0\
-\x60\x34\x60\x34\x99\x28\x2a\x2a\x42\x2d\x49\x78\xbd\x73\x84\x42\
-\xa1\xc4\xe6\x71\x52\xf7\xb0\x9a\xd4\xc2\x71\xd6\x2f\x15\x8d\xc5\
-\x88\xc5\x40\x14\x84\xa4\xa3\x24\x8a\x22\x82\x20\x10\x8d\x46\xd3\
-\x9f\xf7\x75\x48\x43\xf8\xd1\xe2\xb1\xf0\x66\xf3\xc8\x08\x27\xb9\
-\xfd\x93\xf2\xc8\x08\xa7\xcb\x63\xe1\xcd\xe6\xff\x47\x58\xa7\xd3\
-\x22\xa9\xd5\x78\x66\x3d\x04\x82\xc1\xc4\xd3\x71\xa6\xa7\xa6\xf0\
-\xfb\xfd\xe8\xf4\xfa\xf8\x53\xc1\xe7\xd1\xea\xb4\xa8\xd5\x59\x0f\
-\xac\x33\x3b\x3b\x4b\x30\x10\x40\xaf\xd7\x21\x49\xa9\x5f\x83\xa5\
-\x7c\x55\x35\x3f\x3f\xcf\xe9\xdf\xfe\x0e\xe7\xf0\x30\x9a\xec\x6c\
-\x54\xaa\xe4\xd7\xa6\x44\x14\x7c\x3e\x1f\x75\x0d\x0d\xd4\x1e\xac\
-\x65\x8b\x56\xbb\xea\xfc\x9c\xc7\xc3\xef\x5f\x7f\x1d\x97\xd3\xb5\
-\x6e\x9d\x48\x44\x21\x18\x08\x70\xa2\xbe\x8e\x9a\xda\xb5\x75\x56\
-\x48\x29\x1c\x8b\xc5\x18\x71\x8d\xf0\xc1\xfb\x97\x99\xba\x3b\xb5\
-\xee\xdf\xea\xae\xdd\x4f\x51\x5d\x53\x83\xd9\x6c\x5e\xf3\x98\x15\
-\x8b\x46\x71\x3a\x9d\xfc\xf5\xfd\x0f\x98\x9e\x9a\x5a\x75\x2e\x91\
-\xdd\x7b\xf7\xf2\xad\x03\xd5\x98\x4c\xa6\x35\x75\x56\x48\x29\xcc\
-\xfd\x7d\x6e\x30\x18\x7c\xe0\x5e\x56\x92\xa4\xe5\x27\xda\x14\xaf\
-\xb2\x32\x55\x07\xe0\x3f\x6e\xa5\x8b\xdd\xec\x9c\xe4\x1f\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x02\xa5\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x1d\x08\x06\x00\x00\x00\xb0\xba\xac\x4b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x02\x3a\x49\x44\x41\x54\x48\x4b\xb5\x96\xdd\x6a\
-\xd4\x40\x14\xc7\x7f\x33\xd9\x6c\x77\xb7\x74\x51\xb4\x5a\x05\x2d\
-\xe2\x07\x54\xc4\x07\x10\xf1\xca\x67\xf0\x0d\x7c\x13\xbd\xd0\x2b\
-\xc1\xd7\xa8\xe8\x85\xa0\x6f\x20\x5e\xa8\xf4\xa2\x2d\x54\x8b\x0b\
-\xdb\x62\xb1\x62\x65\xd9\xd6\x64\x26\x99\xf1\x62\xb2\x9b\x49\xba\
-\xba\x65\x13\xff\x10\xc8\xe4\x4c\xce\xff\x7c\xce\x19\xf1\x68\x55\
-\x59\xa6\xa0\x15\xc2\x99\x05\x41\xd8\x70\x6b\x63\xe1\x60\x08\xc3\
-\xc8\x62\xa7\xfc\x2d\x4e\x42\x70\xe5\x9c\xe0\xee\x4a\x40\xb7\xed\
-\xd6\x89\x81\x0f\xdb\x86\xb5\x9e\x41\xa7\xe5\xdd\x45\x88\xc7\xab\
-\xca\x36\x43\x10\x65\x89\x87\xe5\x45\x49\xb7\x03\xc2\xdb\x14\x6b\
-\xd8\xde\x33\x24\xff\x20\x50\x09\x88\xa7\xaf\x94\xbd\x75\x59\x12\
-\x06\x65\x71\x75\xac\xf7\x0d\xe2\xd9\x6b\x65\x1f\xdc\x69\xd0\x6e\
-\x96\xc5\xd5\xf1\xe2\x7d\x82\x78\xf2\x52\xd9\xeb\x17\x24\xf3\xad\
-\x62\x08\xaa\x22\xd6\xf0\xf9\x9b\x41\xea\x14\x36\x76\x0c\x71\xe2\
-\x04\xa2\xa6\x67\x73\xc7\x70\x14\x7b\x55\xf4\xf0\x7e\xc8\x62\x37\
-\xf7\xe2\xb7\x82\x66\x08\x81\x70\x65\x19\x6b\x57\xae\x42\xb8\xf7\
-\x46\x00\x81\x04\x9b\xed\x6d\x67\xb2\x11\x9e\xbf\xd1\x0c\x8e\x40\
-\x8e\x3e\xc4\xda\xe2\xd7\xeb\xe6\xae\xe1\xd7\xa1\x53\x3e\x8c\x60\
-\xa3\x9f\x97\xe4\x97\x3d\xc3\xfe\xc0\x62\x2c\x44\x8a\x63\xe5\x9a\
-\x1a\x30\xc6\xbd\x8f\x09\x54\xe2\xac\x19\x61\xad\x97\xb2\xfb\xd3\
-\x62\x0c\xec\x0f\x2c\x1f\xbf\xa6\x63\x25\xeb\x7d\x43\xef\xbb\x25\
-\x4d\x61\x70\x68\x79\xb7\x95\xa2\xb2\x10\x93\x79\x34\xd2\x35\x26\
-\x88\x12\xa6\x76\xe5\x49\x11\xeb\x5c\x57\x21\x44\x05\x17\x2a\xc0\
-\x0f\xb7\x47\x50\x9f\x07\x2a\x65\x6c\x6c\x91\xc0\xdb\x54\x05\x91\
-\xce\x0f\x41\x2f\xc9\x75\xa9\x87\x78\x52\x92\x63\xed\x4a\xb2\x0e\
-\xc4\xc9\x5f\x42\x54\x17\x94\xb6\x64\x6d\x50\x6a\xb4\xba\x3c\xf0\
-\x8c\xcd\x09\xbc\x46\xa9\x8a\x68\x62\x1f\xd4\xd9\x68\x49\xde\x53\
-\x79\x15\xd5\x19\x22\xcf\xd8\xff\xd2\x07\xf1\xa4\x24\xeb\x34\x3f\
-\x01\xab\x42\x4d\x4a\x32\x35\xe6\x61\x62\x88\x18\x95\xaa\xff\x61\
-\x06\xf8\xb3\x80\x63\x04\xde\x4c\x68\x85\x82\x30\x93\x06\xd2\xad\
-\x47\x03\x6b\x2e\x14\xee\x16\x22\x40\x4a\xe8\x34\x45\x61\x12\xfa\
-\x46\x96\x3c\xc8\x5d\xbb\x71\x51\x72\x76\xc1\x29\x38\xd5\x81\x95\
-\x4b\x92\x46\x76\xb5\xb9\xb6\x24\x58\x3a\x2d\x90\x02\xe6\xdb\x82\
-\xdb\xcb\x19\x61\x49\x07\x94\x6e\x76\xf7\x6e\x06\x5c\x3d\x2f\x08\
-\x64\x36\xb9\x67\xc0\x8f\x81\xe5\xed\xa7\x94\x28\x4b\x74\x81\xa0\
-\xdb\x11\x74\xe6\x66\xd6\x0d\xd9\xe8\x3d\x18\xba\x79\x0d\xf0\x07\
-\xfe\x12\x30\xc2\xd7\x68\xf3\xf8\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x07\x57\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2e\x00\x00\x00\x24\x08\x06\x00\x00\x00\xf6\x22\x08\x51\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x06\xec\x49\x44\x41\x54\x58\x47\xed\x97\xdb\x4f\
-\x53\xdb\x16\x87\xbf\xd5\xcb\x5a\x2d\xa4\x94\xde\x20\x50\x0a\xd9\
-\x8a\x21\x08\x88\x0a\x31\x41\xaa\xa1\x12\xa2\x02\x21\x98\xf8\x60\
-\xf4\xc9\x37\xff\x8c\xf3\xaf\x48\x7c\xf1\x85\x9b\x01\x04\x13\x2b\
-\xa9\x29\x26\x12\xb9\x25\x28\xad\x80\x20\x44\x2e\x52\x81\x62\xef\
-\xed\xda\x0f\xc7\x76\xd3\x16\x41\x70\x1f\x4f\x4c\xfc\x92\xf1\xd0\
-\xb5\xc6\x9c\xf3\xb7\x46\xc7\x18\x73\x4e\x61\x62\x62\x42\xe6\x37\
-\x44\x91\xf9\xe0\x77\xe1\x8f\xf0\x5f\xcd\x1f\xe1\xbf\x9a\x3f\xc2\
-\x7f\x35\xbf\xad\x70\xe1\xa8\x0d\x28\x10\x08\xe0\x76\xbb\x19\x1e\
-\x1e\xc6\xeb\xf5\x12\x0a\x85\x90\xe5\x43\x87\x64\xa1\x56\xab\x29\
-\x29\x29\xe1\xfa\xf5\xeb\xd8\xed\x76\x4c\x26\x13\x0a\xc5\xcf\xc5\
-\xec\x48\xe1\xcf\x9f\x3f\x67\x68\x68\x08\x9d\x4e\x47\x65\x65\x25\
-\x7a\xbd\xfe\xd8\x8b\x86\x42\x21\xa6\xa6\xa6\xd8\xdc\xdc\xa4\xa5\
-\xa5\x85\x2b\x57\xae\x90\x97\x97\x97\xe9\x76\x2c\x0e\x15\x1e\x8d\
-\x46\x79\xf4\xe8\x11\xbb\xbb\xbb\x5c\xbb\x76\x8d\x53\xa7\x4e\x21\
-\x8a\x62\xa6\xdb\x91\xc8\xb2\xcc\xa7\x4f\x9f\x78\xfc\xf8\x31\x85\
-\x85\x85\xb4\xb6\xb6\x62\xb1\x58\x32\xdd\x8e\xc5\xa1\xa1\x0b\x85\
-\x42\x04\x02\x01\xb4\x5a\x2d\xf9\xf9\xf9\x68\xb5\x5a\xd4\x6a\xf5\
-\xb1\x4d\x14\x45\xcc\x66\x33\x3a\x9d\x8e\x70\x38\x4c\x30\x18\x24\
-\x91\x48\x64\x2e\x77\x2c\x0e\x15\x9e\xcc\x65\x41\x10\x52\x76\x52\
-\x92\xe3\x65\x59\x3e\x76\x8d\x1c\xc4\xa1\xa9\x12\x0c\x06\xe9\xea\
-\xea\x42\x14\x45\xae\x5f\xbf\x4e\x51\x51\xd1\x89\xc5\x07\x02\x01\
-\xba\xba\xba\xf0\x7a\xbd\x94\x96\x96\x62\x30\x18\x52\x73\x89\xa2\
-\x48\x45\x45\x05\xe5\xe5\xe5\xe4\xe6\xe6\xfe\xd0\x1a\x87\x0a\x97\
-\x65\x99\x40\x20\x80\x20\x08\x68\x34\x9a\x63\x17\xe5\x7e\x92\xc2\
-\x5d\x2e\x17\xa2\x28\xa2\xd1\x68\x52\xef\x42\xa1\x10\xc1\x60\x90\
-\x73\xe7\xce\xd1\xde\xde\x4e\x45\x45\x05\x92\x24\xa5\x8d\xcf\x44\
-\x98\x98\x98\x90\xa3\xd1\x28\xa3\xa3\xa3\x8c\x8d\x8d\xb1\xb3\xb3\
-\x93\xe6\xa0\x56\xab\x69\x68\x68\xe0\xf2\xe5\xcb\x98\x4c\xa6\x1f\
-\x8a\xc6\x41\x24\x85\x47\x22\x11\x1c\x0e\x07\x56\xab\x35\x15\x08\
-\x59\x96\x99\x9d\x9d\xa5\xbf\xbf\x1f\xa5\x52\x49\x47\x47\x07\xb5\
-\xb5\xb5\x68\xb5\xda\xcc\x69\x52\x28\x00\x14\x0a\x05\x7a\xbd\x1e\
-\xab\xd5\x4a\x59\x59\x59\x9a\xd9\x6c\x36\x2c\x16\x0b\x5a\xad\xf6\
-\xc4\xa2\xf7\x23\x49\x12\x79\x79\x79\xe4\xe7\xe7\xa7\x2c\x14\x0a\
-\x51\x54\x54\xc4\xcd\x9b\x37\x89\xc5\x62\xbc\x78\xf1\x82\x85\x85\
-\x05\xa2\xd1\x68\xe6\xf0\x14\xa9\x54\x89\x46\xa3\x44\xa3\xd1\xac\
-\xc2\x11\x04\x01\xb5\x5a\x8d\x4a\xa5\xfa\x29\xe1\xc9\x88\x0b\x82\
-\xc0\x8d\x1b\x37\xb0\xd9\x6c\xa9\x88\x0f\x0c\x0c\xb0\xb2\xb2\x42\
-\x5d\x5d\x1d\x3e\x9f\x8f\xe1\xe1\x61\xfe\xfa\xeb\x2f\xda\xdb\xdb\
-\xb1\xd9\x6c\x28\x95\xca\xcc\xe9\xfe\xe9\x2a\x6a\xb5\x9a\x9c\x9c\
-\x1c\xd6\xd6\xd6\x70\x3a\x9d\xf4\xf6\xf6\xd2\xdd\xdd\x4d\x5f\x5f\
-\x1f\x33\x33\x33\x7c\xfd\xfa\x35\xeb\xa3\xfe\x2d\x22\x91\x08\xc1\
-\x60\x10\x41\x10\x68\x68\x68\xa0\xb9\xb9\x99\xf7\xef\xdf\xe3\x74\
-\x3a\xd9\xdc\xdc\x3c\x70\xdd\xac\x6a\x5b\x5b\x5b\x63\x62\x62\x02\
-\xb7\xdb\x9d\xb2\xc5\xc5\x45\xc2\xe1\x70\xa6\xeb\xff\x04\x51\x14\
-\x69\x6e\x6e\xc6\xe1\x70\x30\x3b\x3b\x8b\xcb\xe5\xe2\xcb\x97\x2f\
-\x59\xe2\xb3\xba\x4a\x24\x12\x21\x14\x0a\xa5\x6d\x10\x92\x24\x21\
-\x49\xd2\xbf\xd2\x55\x0e\x4a\x95\x9e\x9e\x1e\x96\x97\x97\xb1\xdb\
-\xed\x54\x55\x55\xa1\xd1\x68\xd8\xdb\xdb\xa3\xb7\xb7\x97\xf9\xf9\
-\x79\x9a\x9a\x9a\xa8\xaf\xaf\x27\x37\x37\x37\x35\x5f\x96\x12\x51\
-\x14\xc9\xcb\xcb\x23\x37\x37\x97\x40\x20\xc0\xfa\xfa\x3a\x7e\xbf\
-\xff\xa7\x77\xba\xc3\xd0\xe9\x74\x6c\x6f\x6f\x33\x33\x33\xc3\xe4\
-\xe4\x24\x53\x53\x53\xcc\xcf\xcf\x63\x34\x1a\xd9\xdb\xdb\x63\x71\
-\x71\x91\x40\x20\x90\x36\x26\x2b\xe2\x49\x16\x16\x16\x70\x3a\x9d\
-\x78\x3c\x1e\xea\xeb\xeb\x69\x6a\x6a\xc2\x6c\x36\x9f\xb8\x40\x0f\
-\x8b\xf8\xce\xce\x0e\x4e\xa7\x93\xc1\xc1\x41\x3e\x7c\xf8\x90\xea\
-\x26\x89\x44\x82\x70\x38\xcc\xad\x5b\xb7\xb8\x7b\xf7\x6e\x5a\x0b\
-\xfd\xae\xf0\x58\x2c\x46\x38\x1c\x26\x16\x8b\xa1\x56\xab\x91\x24\
-\xe9\xc0\xea\xfe\x51\x0e\x13\x2e\xcb\x32\x91\x48\x84\x40\x20\x40\
-\x2c\x16\x4b\xcb\xe7\xa1\xa1\x21\x94\x4a\x25\x4d\x4d\x4d\x14\x17\
-\x17\xa7\xc6\x64\xa5\x4a\x12\x95\x4a\x85\x28\x8a\xb8\x5c\x2e\x5e\
-\xbe\x7c\x89\xdf\xef\xcf\x74\x49\xe1\xf3\xf9\x58\x5d\x5d\x3d\x71\
-\x4a\x09\x82\x80\x24\x49\x18\x0c\x06\x2c\x16\x0b\x05\x05\x05\x29\
-\xd3\xe9\x74\x07\xb6\x62\x55\xda\xaf\x0c\xc2\xe1\x30\x1f\x3f\x7e\
-\x44\x14\x45\xaa\xaa\xaa\xd0\xeb\xf5\xa9\x09\xa2\xd1\x28\x2e\x97\
-\x8b\xfe\xfe\x7e\x3c\x1e\x0f\x91\x48\x04\xb3\xd9\x4c\x5b\x5b\x1b\
-\x2d\x2d\x2d\x14\x14\x14\x1c\x59\xcc\xef\xde\xbd\x63\x64\x64\x84\
-\xf1\xf1\x71\x82\xc1\x20\x67\xce\x9c\xa1\xb5\xb5\x95\x8b\x17\x2f\
-\x92\x93\x93\x93\xe9\x9e\x86\xf2\xc1\x83\x07\xff\xc9\x7c\x98\x24\
-\x1c\x0e\x33\x39\x39\x89\x20\x08\x94\x97\x97\xa3\xd3\xe9\x10\x04\
-\x81\x78\x3c\xce\xf0\xf0\x30\x7d\x7d\x7d\x58\x2c\x16\xee\xdd\xbb\
-\x47\x7b\x7b\x3b\x0a\x85\x82\x57\xaf\x5e\x11\x8d\x46\xb1\x5a\xad\
-\xe4\xe4\xe4\xa4\x3e\x54\xa5\xfa\x6f\x8c\xac\x56\x2b\x25\x25\x25\
-\x4c\x4e\x4e\xf2\xf0\xe1\x43\xd6\xd7\xd7\xa9\xab\xab\xa3\xba\xba\
-\x9a\xd5\xd5\x55\x5e\xbf\x7e\x8d\x4a\xa5\xa2\xa8\xa8\x08\x49\x92\
-\x78\xfb\xf6\x2d\xf1\x78\x9c\xb2\xb2\xb2\xd4\xfa\x1c\x25\x5c\x14\
-\x45\xbc\x5e\x2f\x7e\xbf\x1f\xab\xd5\x8a\xd1\x68\x44\xa9\x54\x32\
-\x3f\x3f\xcf\xe8\xe8\x28\x36\x9b\x8d\x8e\x8e\x0e\xaa\xab\xab\x29\
-\x2e\x2e\xa6\xa2\xa2\x82\xbd\xbd\x3d\x96\x96\x96\xc8\xcb\xcb\xc3\
-\x62\xb1\xa0\x56\xab\xe1\x5b\x3a\x14\x14\x14\x50\x58\x58\xc8\xc6\
-\xc6\x06\x03\x03\x03\x68\x34\x1a\x6e\xdf\xbe\x8d\xc3\xe1\xa0\xa6\
-\xa6\x86\x9a\x9a\x1a\xd6\xd6\xd6\x58\x5a\x5a\xc2\x60\x30\x60\x32\
-\x99\x98\x9b\x9b\x3b\x50\xf8\x77\x8b\x33\xc9\xf4\xf4\x34\xdd\xdd\
-\xdd\xf8\xfd\x7e\xca\xca\xca\xd0\xeb\xf5\x2c\x2f\x2f\xe3\xf7\xfb\
-\x71\x38\x1c\x34\x36\x36\xa6\xae\x61\xb2\x2c\xf3\xe6\xcd\x1b\x06\
-\x07\x07\x89\xc7\xe3\x58\xad\xd6\xb4\x53\x60\x92\x95\x95\x15\x36\
-\x36\x36\xb8\x7a\xf5\x2a\x4d\x4d\x4d\x18\x0c\x06\xf8\xd6\x45\xdc\
-\x6e\x37\x23\x23\x23\x28\x95\x4a\x8c\x46\x23\x5e\xaf\x97\x0b\x17\
-\x2e\xd0\xd6\xd6\x86\xc5\x62\xf9\xe7\x1f\xcc\x98\x33\x8b\xca\xca\
-\x4a\xee\xdf\xbf\xcf\xd8\xd8\x18\xd3\xd3\xd3\xcc\xcd\xcd\xe1\xf3\
-\xf9\xd0\xe9\x74\xc8\xb2\x9c\x56\x34\xc9\x22\x8b\xc7\xe3\x2c\x2c\
-\x2c\xb0\xba\xba\x9a\x4a\x91\xfd\x6c\x6f\x6f\xa3\xd7\xeb\x53\x37\
-\xaa\x24\x0a\x85\x02\xa3\xd1\x88\x42\xa1\x60\x7e\x7e\x1e\x9f\xcf\
-\x47\x7d\x7d\x3d\x76\xbb\x3d\xed\xfc\xce\x8f\x08\x57\xab\xd5\xd8\
-\x6c\xb6\xd4\x5d\x31\x91\x48\xe0\xf1\x78\x78\xfa\xf4\x29\xbb\xbb\
-\xbb\x59\x27\xb8\x95\x95\x15\x44\x51\xe4\xce\x9d\x3b\x9c\x3f\x7f\
-\xfe\xc0\x22\x9b\x9c\x9c\xc4\xe5\x72\x11\x0c\x06\x89\xc5\x62\x69\
-\xef\x3e\x7f\xfe\x8c\x28\x8a\x74\x76\x76\x72\xe9\xd2\x25\x4c\x26\
-\x13\xa2\x28\x66\xb5\xe2\x43\x73\x3c\x89\x20\x08\xa8\x54\x2a\x24\
-\x49\x42\xa3\xd1\x60\x36\x9b\xd9\xda\xda\x62\x7c\x7c\x1c\xbf\xdf\
-\x8f\xc1\x60\x20\x91\x48\xe0\x72\xb9\x78\xf6\xec\x19\x36\x9b\x8d\
-\xc6\xc6\x46\x8a\x8b\x8b\xd1\x6a\xb5\x68\x34\x9a\x34\xd3\xeb\xf5\
-\x2c\x2e\x2e\xe2\xf1\x78\xd0\xe9\x74\xa9\x5a\xf0\x7a\xbd\x3c\x79\
-\xf2\x04\x8d\x46\x43\x63\x63\x23\xa5\xa5\xa5\xdf\x3d\x6a\x1c\x99\
-\xe3\x07\x21\xcb\x32\x5b\x5b\x5b\x0c\x0d\x0d\x31\x32\x32\x42\x28\
-\x14\x22\x1e\x8f\x13\x8b\xc5\xb0\xdb\xed\x74\x74\x74\x70\xfa\xf4\
-\xe9\xb4\x34\xd8\x8f\x2c\xcb\xac\xae\xae\xd2\xd3\xd3\x83\xdb\xed\
-\x4e\x45\xd3\xef\xf7\x53\x5b\x5b\x4b\x67\x67\x27\x67\xcf\x9e\x3d\
-\xb0\x3e\x92\x9c\x48\x38\xdf\x16\x4f\x5e\xb9\xf6\x6f\x3a\x1a\x8d\
-\x06\xad\x56\x9b\xf5\xd7\x66\x92\x48\x24\x08\x06\x83\x84\x42\xa1\
-\xb4\x67\x92\x24\xa1\xd5\x6a\x0f\xdc\x74\xf6\x73\x62\xe1\xff\x6f\
-\xfe\x06\x53\x10\x0d\xba\x53\x56\x38\x1a\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x06\x67\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x24\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xdb\x0a\xf9\xe8\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x05\xfc\x49\x44\x41\x54\x58\x47\xcd\x98\x5d\x48\
-\x54\x5b\x14\xc7\x7f\xa3\x41\xda\x04\x65\x72\xb2\x22\x47\xc8\xb4\
-\x31\xd2\x22\xa5\x07\x23\x34\x23\xd4\x20\xa2\x2f\x82\x31\xa2\x68\
-\x7a\xe9\x13\x15\x64\x4a\x30\x24\x62\x8c\xc0\x12\xca\x1e\x2a\x18\
-\xa9\xd0\xbe\x1e\x7a\x48\x14\xaa\xe3\x40\xd6\x83\x1a\x39\xc1\x28\
-\xa5\x85\x62\x61\x65\x96\x91\x19\x4a\xac\xfb\xe0\x75\xf2\x6c\xc7\
-\x71\x34\xeb\xde\x1f\xec\x87\x59\xeb\xbf\xf7\x59\x67\x9d\xbd\xd7\
-\x59\x67\x4c\x22\x22\xfc\x8f\x08\x51\x0d\xc1\x70\xeb\xd6\x2d\x76\
-\xec\xd8\x41\x6e\x6e\x2e\x5d\x5d\x5d\xaa\xfb\xf7\x90\x49\xb2\x6f\
-\xdf\x3e\x01\x24\x39\x39\x59\x62\x62\x62\x64\xd6\xac\x59\xf2\xe4\
-\xc9\x13\x55\x36\x65\x4c\x32\xc1\x23\x6b\x6f\x6f\xa7\xaa\xaa\x8a\
-\xa1\xa1\x21\x06\x07\x07\x71\x3a\x9d\x6c\xdf\xbe\x9d\x3b\x77\xee\
-\xd0\xd3\xd3\x83\xd5\x6a\x25\x26\x26\x86\xcd\x9b\x37\x03\x10\x16\
-\x16\x86\xc3\xe1\x50\x97\x09\x1e\x35\xc2\xd1\x7c\xfa\xf4\x49\xc2\
-\xc3\xc3\x05\x30\x8c\xea\xea\x6a\x9f\xe6\xc8\x91\x23\x63\xfc\x85\
-\x85\x85\x86\x75\x26\x83\x49\x86\x2f\xcc\xed\xdb\xb7\xe9\xee\xee\
-\x06\x20\x2e\x2e\x8e\x9c\x9c\x1c\x9a\x9b\x9b\x59\xb5\x6a\x15\x0e\
-\x87\x03\xa7\xd3\xa9\xde\x8b\x5f\xa2\xa3\xa3\x49\x4c\x4c\xa4\xba\
-\xba\x9a\xf7\xef\xdf\x73\xe5\xca\x15\x86\x86\x86\x08\x0d\x0d\x25\
-\x23\x23\x83\xb5\x6b\xd7\xaa\x53\x8c\x88\x88\xc4\xc6\xc6\x8e\xb9\
-\x4b\x11\x91\xe7\xcf\x9f\x0b\x20\x0e\x87\x43\xb9\x8f\xf1\x59\xbc\
-\x78\xb1\x64\x67\x67\x8b\x88\xc8\xc5\x8b\x17\xc7\xac\x7b\xea\xd4\
-\x29\x75\x8a\x81\x10\xfe\xdd\x27\xf9\xf9\xf9\xe8\xba\x8e\xae\xeb\
-\xb4\xb5\xb5\xa9\x71\x4f\x89\x83\x07\x0f\xf2\xf8\xf1\x63\x74\x5d\
-\xa7\xb6\xb6\x96\x65\xcb\x96\x51\x52\x52\xa2\xca\x8c\xc8\xf0\xa6\
-\x16\xaf\xd7\xab\x06\xfb\xdb\x19\x52\x39\x74\xe8\x90\x00\xd2\xd3\
-\xd3\xa3\xba\x7c\x04\xac\x43\x31\x31\x31\x98\xcd\x66\x4a\x4a\x4a\
-\x30\x99\x4c\x41\x8d\xae\xae\x2e\xe2\xe3\xe3\xd5\xa5\x82\x66\x86\
-\x6a\x18\xcd\xdc\xb9\x73\xb9\x7f\xff\x3e\xba\xae\xab\xae\x71\x99\
-\x31\x63\x06\x79\x79\x79\xaa\x19\x80\xa4\xa4\x24\x96\x2e\x5d\x4a\
-\x64\x64\x24\x00\x59\x59\x59\xfc\xfc\xf9\x93\xeb\xd7\xaf\x13\x15\
-\x15\x35\x2c\x92\x00\x8f\xec\x4f\x52\x5e\x5e\xee\xdb\xe8\x11\x11\
-\x11\x52\x59\x59\x29\x22\x22\xff\x59\x40\xab\x57\xaf\x16\x40\xb2\
-\xb3\xb3\x7d\xa7\xfc\xcb\x97\x2f\xc3\x75\xc8\x64\x32\xe1\xf5\x7a\
-\x49\x48\x48\x00\xa0\xbf\xbf\x9f\x86\x86\x86\xd1\xd9\x06\x20\x3e\
-\x3e\x9e\x45\x8b\x16\xa9\xe6\x49\x73\xf6\xec\x59\x12\x13\x13\xb1\
-\xdb\xed\xbc\x7d\xfb\x96\x95\x2b\x57\x72\xf8\xf0\x61\xec\x76\xbb\
-\xff\x47\xe6\xf1\x78\xc6\xd4\x0f\x40\xca\xcb\xcb\x45\x44\xa4\xbb\
-\xbb\x5b\x34\x4d\x1b\xe3\x57\x47\x41\x41\x81\x6f\xcd\x11\x46\x6a\
-\x53\x65\x65\xa5\xf4\xf5\xf5\x89\xc5\x62\x11\x40\x1a\x1a\x1a\x44\
-\x44\x24\xe0\xa6\xb6\xdb\xed\xe4\xe4\xe4\xe0\xf1\x78\x38\x76\xec\
-\x98\xcf\x1e\x15\x15\xc5\xae\x5d\xbb\x78\xf1\xe2\x85\x41\xaf\xb2\
-\x71\xe3\x46\xc3\xef\x91\x7a\xb7\x70\xe1\x42\x36\x6d\xda\x84\xae\
-\xeb\x74\x76\x76\xb2\x65\xcb\x16\x52\x52\x52\x86\x45\x12\x20\x43\
-\xa7\x4f\x9f\x16\x11\x11\xb7\xdb\x6d\xc8\xd0\x54\x49\x4e\x4e\x16\
-\x40\x74\x5d\x97\x0f\x1f\x3e\x48\x44\x44\x84\x68\x9a\x26\xbd\xbd\
-\xbd\x3e\x8d\xdf\x0c\x8d\x34\x00\x0f\x1f\x3e\x64\x70\x70\x90\x8e\
-\x8e\x0e\x83\x1d\x60\xf7\xee\xdd\x7e\x7b\x21\x93\xc9\xc4\xd1\xa3\
-\x47\xd9\xba\x75\xab\xc1\xee\x74\x3a\x69\x6a\x6a\x22\x37\x37\x97\
-\xf4\xf4\x74\xb2\xb2\xb2\xf8\xfc\xf9\x33\x35\x35\x35\x44\x44\x44\
-\xf8\x74\x7e\x0b\xa3\xc9\x64\x02\xe0\xd1\xa3\x47\x14\x17\x17\xe3\
-\x72\xb9\x0c\x76\x94\xe0\x46\x13\x12\x12\xc2\xcc\x99\x33\x0d\x36\
-\x8f\xc7\xc3\x89\x13\x27\xb0\x5a\xad\x94\x96\x96\xe2\x72\xb9\xa8\
-\xad\xad\xe5\xc0\x81\x03\x64\x66\x66\x1a\xb4\x7f\xe5\x94\x25\x24\
-\x24\xd0\xda\xda\x4a\x73\x73\x33\x9a\xa6\x11\x17\x17\x47\x64\x64\
-\x24\x5e\xaf\x17\xb3\xd9\x6c\x14\x8b\x9f\x3d\x34\x9d\x1c\x3f\x7e\
-\x5c\x00\x71\x3a\x9d\x22\x22\x92\x9e\x9e\x2e\x80\xd4\xd7\xd7\xab\
-\x52\x91\x3f\x5d\x18\x1b\x1b\x1b\x05\x90\xd4\xd4\x54\x11\x11\xb9\
-\x70\xe1\x82\x00\x92\x9f\x9f\xaf\x4a\x7d\xf8\x0d\x68\xa2\x3a\x14\
-\x0c\x03\x03\x03\x12\x1b\x1b\x2b\x66\xb3\x59\x3a\x3a\x3a\xa4\xad\
-\xad\x4d\xc2\xc2\xc2\xc4\x6a\xb5\xaa\x52\x03\x01\x4f\x59\x46\x46\
-\x06\xeb\xd6\xad\xa3\xa3\xa3\x03\x97\xcb\x65\xd8\xc8\xad\xad\xad\
-\xbe\x0e\x13\xc0\x62\xb1\xb0\x64\xc9\x12\xdf\xef\x82\x82\x02\xda\
-\xdb\xdb\xb9\x7a\xf5\x2a\x16\x8b\x85\x94\x94\x14\x7e\xfc\xf8\xc1\
-\xcd\x9b\x37\x7d\x1a\xbf\x48\x80\x0c\x8d\x57\x87\xbe\x7f\xff\x3e\
-\x26\x7b\x73\xe6\xcc\xf1\xcd\xd7\x75\x5d\x00\xc9\xcc\xcc\x14\x11\
-\x91\x92\x92\x12\x01\xa4\xb8\xb8\xd8\xa7\x19\x0f\xbf\x19\x1a\xe1\
-\xcd\x9b\x37\xd4\xd5\xd5\xe1\xf1\x78\x0c\xf6\xf0\xf0\x70\x2e\x5f\
-\xbe\x6c\xa8\x43\x56\xab\x15\x80\xaf\x5f\xbf\x62\xb3\xd9\xd0\x34\
-\x8d\x6b\xd7\xae\xd1\xda\xda\x8a\xc3\xe1\x20\x29\x29\x89\xa2\xa2\
-\xa2\x51\xab\x8c\x83\x04\xc8\x90\x3a\x82\xd9\x43\x7b\xf7\xee\x15\
-\x40\x6a\x6a\x6a\x44\x44\x24\x29\x29\x49\x00\x69\x69\x69\x51\xa5\
-\x7e\xf1\x9b\xa1\xf9\xf3\xe7\x73\xf2\xe4\x49\xd5\xfc\xeb\x7d\x33\
-\x0e\xb5\xb5\xb5\xb8\x5c\x2e\xec\x76\x3b\x99\x99\x99\x14\x15\x15\
-\xe1\xf1\x78\x28\x2d\x2d\xc5\x6a\xb5\x52\x51\x51\xc1\x99\x33\x67\
-\xf0\x7a\xbd\xea\xd4\x5f\x88\x9f\x0c\x4d\x85\xde\xde\x5e\xd1\x34\
-\x4d\x2c\x16\x8b\x7c\xfb\xf6\x6d\xcc\x91\x97\xe9\xe8\xa9\x27\x43\
-\x59\x59\x19\x1f\x3f\x7e\xa4\xb2\xb2\x92\xd0\xd0\x50\x6c\x36\x1b\
-\xb3\x67\xcf\xa6\xaa\xaa\x4a\x95\x06\xc4\x6f\x40\xaf\x5f\xbf\x26\
-\x3d\x3d\x7d\xcc\xb8\x77\xef\x9e\x2a\xf5\x51\x5f\x5f\x4f\x74\x74\
-\x34\xa9\xa9\xa9\xe4\xe5\xe5\xf1\xf2\xe5\x4b\xce\x9f\x3f\x4f\x74\
-\x74\xb4\x2a\x0d\x88\xdf\x80\xfa\xfb\xfb\x71\xbb\xdd\x74\x76\x76\
-\x02\xd0\xd7\xd7\x87\xdb\xed\xe6\xdd\xbb\x77\xaa\xd4\x47\x7d\x7d\
-\x3d\x9a\xa6\xb1\x66\xcd\x1a\x2e\x5d\xba\xc4\x9e\x3d\x7b\xd8\xbf\
-\x7f\xbf\x2a\x9b\x10\xbf\x01\x8d\x60\xb7\xdb\xa9\xab\xab\xa3\xac\
-\xac\x4c\x75\x19\x68\x6a\x6a\x62\x60\x60\x80\x67\xcf\x9e\xf1\xea\
-\xd5\x2b\xee\xde\xbd\x4b\x45\x45\x85\x2a\x0b\x8a\x80\x01\x05\x4b\
-\x63\x63\x23\x00\x1b\x36\x6c\xa0\xa5\xa5\x85\x6d\xdb\xb6\xa9\x92\
-\xa0\x09\x18\x50\x61\x61\x21\x26\x93\x89\xb4\xb4\x34\xd5\x65\x60\
-\xe7\xce\x9d\xdc\xb8\x71\x83\x07\x0f\x1e\xb0\x60\xc1\x02\xd5\x3d\
-\x29\xfc\x06\x64\x36\x9b\x49\x4b\x4b\x1b\x33\xc6\xeb\x85\xe6\xcd\
-\x9b\x87\xcd\x66\x53\xcd\x53\x43\xa6\xa9\x0e\x05\xc3\x5f\xad\x43\
-\xd3\x85\x2f\xa0\xbe\xbe\x3e\xa3\xe7\x0f\x30\x72\x0d\xb5\xe7\x1e\
-\x8d\xaf\xa7\xd6\x34\x8d\xe5\xcb\x97\xab\xfe\x69\x63\x70\x70\x90\
-\xa7\x4f\x9f\xb2\x62\xc5\x8a\xc0\xdf\x73\x22\x22\xe7\xce\x9d\x0b\
-\xea\x4b\xf4\x77\xc7\xfa\xf5\xeb\x27\x7c\xeb\x4f\xf8\x2f\xec\xdf\
-\xe6\x1f\x88\x2a\xc6\xe0\xc8\xe9\x89\x63\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x03\x9a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x18\x00\x00\x00\x1e\x08\x06\x00\x00\x00\x36\x2e\xde\xe5\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x03\x2f\x49\x44\x41\x54\x48\x4b\xad\x96\xd9\x72\
-\x23\x45\x10\x45\x4f\x96\x5a\xdd\xda\xba\x65\xd9\x2d\x99\x11\xc6\
-\x06\x1e\x4c\xcc\xc3\x04\x3f\xc9\xe7\xf0\x2d\x10\x41\xf0\x42\x04\
-\xcb\xd8\x26\x3c\xb6\xf6\x5d\xea\x35\x79\x28\x64\x90\x6c\xd9\x92\
-\x3d\xf7\xb9\x2a\x4f\xf5\xad\xcc\xdb\x25\x3f\xfc\x18\x2b\x9f\x41\
-\xae\x03\x7e\x59\x70\x1d\x58\x44\x30\x5f\x29\x69\x0e\x66\x7b\xe1\
-\x6b\xe4\x3a\x70\xd1\x32\x7c\x7b\x2a\xb4\xea\xc2\xd7\x2d\xe1\xbc\
-\x29\x54\xbc\xcf\x04\x38\x3b\x11\xce\x43\xa1\x37\x55\x7e\xbd\xce\
-\x99\xaf\xe0\xbb\xb6\xe1\xb4\x2e\x6f\x07\xb4\xea\xc2\x65\xdb\x70\
-\x3f\x54\x6e\x7a\x4a\x96\xc3\xef\x77\x39\x8b\x08\xca\xee\x1b\x01\
-\x15\x17\xbe\xbf\x30\x94\x8a\x42\x9a\x83\x57\x04\x11\x38\xaa\x0a\
-\xc6\x40\x9c\xbd\xc1\xa2\x82\x81\xb3\xd0\xa0\x0a\xbd\x69\x4e\x18\
-\x08\x17\x4d\x43\xa3\x2a\xbc\xff\x52\x48\x52\x18\x4c\xf5\xf5\x80\
-\x66\x20\x34\x03\xe1\x63\x37\xe7\xaa\xa3\x8c\xe6\x4a\xa3\x2a\x7c\
-\x38\x37\x04\x15\xe1\xef\x7e\xce\x70\xfe\x4a\x80\x5f\xb6\x17\x1b\
-\x27\xca\x3c\x82\xd1\x42\xb9\x1d\xe4\x2c\x23\xe5\x8b\x86\xd0\x1d\
-\x2b\x9f\x86\x8a\xea\x2b\x2c\x72\x1d\x38\xff\xd7\x9a\xbb\x91\xb2\
-\x4a\x6c\x21\x11\x41\x81\xeb\x6e\xce\x4d\x5f\x89\x53\xbb\xfe\x20\
-\x80\x11\x78\xd7\x10\x6a\x25\x7b\xea\xe1\x5c\x59\xc5\x50\x2c\x80\
-\x5f\xb2\x6b\xfe\xb8\x57\x7a\x13\x65\x3d\xbd\x07\x01\xc2\x40\x38\
-\x3b\x31\x2c\x62\xe8\x4d\x6c\x09\xa7\x60\xdb\x31\x0c\x84\xc1\x4c\
-\x19\xcc\xfe\x2b\xce\x21\x00\xbf\x2c\x5c\x34\x85\x24\x55\xba\x63\
-\x45\x00\xc1\x16\x6f\xd4\x60\x1e\x29\xc3\x39\xa4\xd9\xe6\xbe\xbd\
-\x00\x9e\x03\xe7\xa1\x50\x30\xd0\x99\x28\x71\x6a\x07\xca\xe6\x8f\
-\x85\x0c\x66\x30\x5d\x3c\x8e\xb5\x17\x01\x05\x03\xed\x63\xa1\x5e\
-\x81\xd9\x0a\x26\x0b\x48\x73\xa1\xe8\x08\xb5\x92\xd0\xf4\x6d\x44\
-\xf4\xa7\x9b\xd6\xac\xf5\x22\x20\x0c\x84\xf6\xb1\x21\x4a\xe0\x76\
-\xa0\xa4\xb9\x82\x2a\x25\x17\x8e\x7d\x61\xb2\x84\xfe\xf4\xb1\x35\
-\x6b\x3d\x0b\xa8\x95\xac\x35\x71\x6a\x73\x46\xd5\x0e\x4e\xc5\x13\
-\x82\xb2\xb5\xac\x37\x55\x66\xcb\xa7\xce\x6e\xb5\x13\xe0\x14\x6c\
-\x71\xa7\x60\x3b\x26\xc9\x14\x23\x82\x57\x14\xfc\x32\x34\xaa\x70\
-\x3f\xda\x6d\xcd\x5a\x3b\x01\xad\xba\x70\xe2\x0b\xcb\x08\xc6\x0b\
-\x28\x18\x01\x51\xca\x1e\x1c\xd7\x84\xde\xc4\xf6\x7b\x96\x6f\xef\
-\xdc\xd4\x93\x00\xdb\x92\x86\x34\x83\x9b\xbe\x92\x29\x24\x99\xe2\
-\x39\x76\xc8\x96\x91\xf5\x7d\x95\x6c\xef\x7c\xac\x47\x00\xcf\x81\
-\x6f\x5a\x82\x00\x7f\x75\x94\x2c\x53\x8c\x40\xc9\xb5\xd6\x54\x5c\
-\xa1\x33\xb1\x53\xfc\x9c\x35\x6b\x6d\x00\x8c\xc0\xe9\x91\x2d\xd4\
-\x19\xe7\xc4\xa9\x2d\x6c\x04\xca\x2e\xd4\x2b\xc2\xfd\xf8\x65\xdf\
-\xff\xaf\x0d\x40\x18\xd8\x91\x1f\xce\xac\xef\x15\x8f\x87\xd0\x2a\
-\x15\x61\x34\x57\xfa\x53\x48\x76\xb4\xe4\x53\x7a\x00\xb8\x8e\x8d\
-\xe0\xaa\x27\x24\x99\x52\xf1\x60\x19\x43\x9a\x29\xb5\x12\x18\x11\
-\x7a\x53\xfb\x5a\x38\x44\x0f\x80\x30\x10\x66\x2b\x65\x11\x29\xed\
-\x86\xa1\x5e\x11\x9b\x92\x65\xc1\x2f\x09\xdd\x89\x32\xdc\x0a\xb2\
-\x7d\x64\xc0\xfe\x47\x83\xb2\x30\x5b\xc1\x4f\x7f\xe6\xfc\x72\x95\
-\x93\xe5\xf0\x55\x28\xbc\x6b\xd8\x28\xd8\x4e\xc9\x7d\x65\xc0\x5e\
-\x60\x9a\x29\x71\x02\x0a\xf6\x4b\x62\xa5\x5e\x15\x16\x31\x0c\xe7\
-\x2f\xf7\xfb\x2e\x19\x80\xd0\x17\x1a\x35\xfb\x2a\x3b\xaa\xda\x47\
-\x53\xd3\x17\x3e\x0d\x6c\x44\x44\x7b\xf4\xfb\x2e\x19\xb0\xed\x77\
-\xd9\x36\x5c\xb6\x6d\xe6\xb7\x02\xe1\x6e\xa4\xfc\x76\x9b\x33\x7d\
-\x26\x67\xf6\x91\x01\x98\x2c\x95\xab\x6e\x4e\x94\xc2\x64\xa1\xfc\
-\xfc\x31\xe7\xba\xa7\x3b\x13\xf2\x10\xc9\xfa\xf1\x2b\x02\xfa\xb6\
-\xc3\x3e\xa9\x7f\x00\x2a\x0c\x7e\x6a\xc6\x65\x49\xfc\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0e\xde\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2b\x00\x00\x00\x2a\x08\x06\x00\x00\x00\x2a\x01\xa2\x65\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0e\x73\x49\x44\x41\x54\x58\x47\xad\x99\x69\x4f\
-\x1b\xe7\xd7\xc6\x7f\xe3\x59\x6c\x8f\xc7\x36\xd8\x18\xb0\x89\x1d\
-\x88\x1d\x48\x20\x09\x24\x21\x49\x69\x94\x7f\xa2\x4a\x69\xd5\xaa\
-\x52\xbf\x46\x3f\xc6\xf3\x59\xaa\x2e\x52\x97\x54\x6a\xdf\xb4\x4a\
-\xd4\xa6\xcd\xa6\x2c\x84\x00\x55\x80\xb2\x98\xb0\x4e\x00\x2f\x78\
-\x1f\x8f\xed\x79\x5e\x80\xa7\x31\x90\xb6\xcf\x72\x49\x23\xa1\xb9\
-\x7d\xcf\x7d\xcd\x99\x73\xae\xb3\x20\x4c\x4c\x4c\x58\xfc\x3f\xa0\
-\x5e\xaf\x63\x9a\x26\xb5\x5a\x8d\x7a\xbd\x0e\x80\x28\x8a\x28\x8a\
-\x82\x24\x49\x38\x1c\x8e\x83\x5b\xfe\xc7\x10\xfe\x2f\x64\xeb\xf5\
-\x3a\xc9\x64\x92\x89\x89\x09\xe6\xe7\xe7\x29\x14\x0a\x28\x8a\x82\
-\xaa\xaa\x34\x1a\x0d\x0a\x85\x02\xa6\x69\xd2\xd1\xd1\xc1\xd9\xb3\
-\x67\x19\x1e\x1e\xa6\xb3\xb3\x13\x51\x14\x0f\x3e\xea\x5f\xe1\x7f\
-\x4d\x76\x6b\x6b\x8b\x07\x0f\x1e\xf0\xec\xd9\x33\x0c\xc3\xc0\xe5\
-\x72\x01\x50\xa9\x54\x30\x0c\x03\x41\x10\x70\xbb\xdd\x28\x8a\x42\
-\xbd\x5e\x27\x9f\xcf\xd3\xd9\xd9\xc9\xf5\xeb\xd7\x19\x1e\x1e\xc6\
-\xe7\xf3\x21\x08\xc2\xc1\xc7\xfe\x2d\xfe\x35\xd9\x26\x01\x59\x96\
-\x99\x9b\x9b\xe3\xce\x9d\x3b\xbc\x7e\xfd\x1a\xc3\x30\x78\xfd\xfa\
-\x35\xc5\x62\x11\xa7\xd3\x89\xdf\xef\xa7\xad\xad\x8d\x5a\xad\x46\
-\x36\x9b\x25\x9f\xcf\x63\x9a\x26\xed\xed\xed\xf8\xfd\x7e\x44\x51\
-\x64\x74\x74\x94\xab\x57\xaf\xda\xee\x12\x08\x04\x50\x55\xf5\x1f\
-\xc9\xff\x2b\xb2\x9b\x9b\x9b\x3c\x78\xf0\x80\x48\x24\x42\xad\x56\
-\x63\x7c\x7c\x9c\x4a\xa5\x42\x2a\x95\x62\x6b\x6b\x8b\x50\x28\xc4\
-\xa9\x53\xa7\x88\x46\xa3\xb4\xb5\xb5\xe1\xf1\x78\x68\x34\x1a\x14\
-\x8b\x45\xd2\xe9\x34\x4b\x4b\x4b\xbc\x7c\xf9\x92\x4a\xa5\x42\x24\
-\x12\x41\x10\x04\x4e\x9f\x3e\x8d\xaa\xaa\x2c\x2f\x2f\x73\xec\xd8\
-\x31\xc6\xc6\xc6\x08\x87\xc3\x48\x92\x74\xf0\x78\x1b\xff\x48\x76\
-\x66\x66\x86\xfb\xf7\xef\x23\x8a\x22\x9a\xa6\xb1\xb0\xb0\x80\xa2\
-\x28\xe4\xf3\x79\xb2\xd9\x2c\xfd\xfd\xfd\x8c\x8e\x8e\xd2\xd7\xd7\
-\x87\xd7\xeb\x65\x73\x73\x93\xb9\xb9\x39\x7c\x3e\x1f\x89\x44\x02\
-\x8f\xc7\xc3\xee\xee\x2e\xf3\xf3\xf3\x3c\x7c\xf8\x10\x5d\xd7\xe9\
-\xee\xee\xa6\x5c\x2e\x13\x0e\x87\xd1\x34\x0d\x5d\xd7\xb9\x70\xe1\
-\x02\x97\x2f\x5f\xc6\xeb\xf5\xbe\xd5\xc2\x7f\x4b\x76\x62\x62\x82\
-\xf1\xf1\x71\xfc\x7e\x3f\x91\x48\x84\xa7\x4f\x9f\x62\x9a\x26\x95\
-\x4a\x05\x51\x14\x39\x73\xe6\x0c\xc3\xc3\xc3\x74\x75\x75\xa1\x28\
-\x0a\x86\x61\x70\xeb\xd6\x2d\x92\xc9\x24\x2e\x97\x8b\x77\xdf\x7d\
-\x97\x73\xe7\xce\xa1\xaa\x2a\x95\x4a\x85\x8d\x8d\x0d\x7e\xff\xfd\
-\x77\xd6\xd7\xd7\x71\x38\x1c\x18\x86\xc1\xe8\xe8\x28\x3d\x3d\x3d\
-\x88\xa2\xc8\xee\xee\x2e\x3d\x3d\x3d\xc4\x62\x31\x14\x45\x39\x48\
-\x87\xb7\xea\xc9\xf4\xf4\x34\x2f\x5e\xbc\xa0\xab\xab\x8b\x77\xde\
-\x79\x87\x5c\x2e\x47\xbd\x5e\xc7\x30\x0c\x4a\xa5\x12\xa7\x4e\x9d\
-\xe2\xf2\xe5\xcb\xf4\xf4\xf4\xe0\x72\xb9\x48\x26\x93\x7c\xf5\xd5\
-\x57\x3c\x7b\xf6\x8c\x60\x30\x88\x69\x9a\x7c\xfb\xed\xb7\x7c\xf6\
-\xd9\x67\xfc\xf9\xe7\x9f\x48\x92\x44\x5f\x5f\x1f\x37\x6f\xde\xa4\
-\xad\xad\x0d\x87\xc3\x41\xb9\x5c\x66\x6d\x6d\x0d\x4d\xd3\x38\x76\
-\xec\x18\xba\xae\x73\xf7\xee\x5d\x16\x16\x16\xa8\x56\xab\x07\x29\
-\x1d\x4d\xf6\xe5\xcb\x97\x3c\x7a\xf4\x88\xb6\xb6\x36\xce\x9f\x3f\
-\x8f\x2c\xcb\x24\x93\x49\x00\x8a\xc5\x22\xbd\xbd\xbd\x0c\x0f\x0f\
-\x13\x0c\x06\x91\x24\x89\xcd\xcd\x4d\xee\xdf\xbf\x4f\xb5\x5a\xe5\
-\xca\x95\x2b\x84\xc3\x61\x12\x89\x04\xa3\xa3\xa3\x94\x4a\x25\x5e\
-\xbc\x78\x81\xae\xeb\x58\x96\x45\x38\x1c\xe6\xdd\x77\xdf\x05\xc0\
-\xeb\xf5\xa2\xeb\x3a\x6b\x6b\x6b\x28\x8a\xc2\xc8\xc8\x08\xc5\x62\
-\x91\x47\x8f\x1e\xb1\xb2\xb2\x82\x69\x9a\x2d\xbc\x0e\x91\xdd\xde\
-\xde\xe6\xf9\xf3\xe7\xf8\xfd\x7e\x46\x46\x46\xe8\xea\xea\x62\x6d\
-\x6d\x8d\x5a\xad\xc6\xee\xee\x2e\x4e\xa7\x93\x81\x81\x01\xba\xba\
-\xba\x90\x65\x19\x80\xa9\xa9\x29\x4c\xd3\x44\x55\x55\xb6\xb7\xb7\
-\x59\x5e\x5e\x66\x7e\x7e\x9e\xa9\xa9\x29\x66\x66\x66\xd8\xde\xde\
-\xb6\x0f\x96\x24\x89\x53\xa7\x4e\xd1\xdd\xdd\x8d\xaa\xaa\x64\xb3\
-\x59\x56\x57\x57\x29\x16\x8b\x1c\x3f\x7e\x9c\xab\x57\xaf\xb2\xb3\
-\xb3\xc3\xd4\xd4\x14\xd9\x6c\x96\x46\xa3\x61\x73\x3b\x44\xf6\xf9\
-\xf3\xe7\x08\x82\xc0\xb9\x73\xe7\x88\x44\x22\xb6\x55\x25\x49\xa2\
-\x58\x2c\xe2\xf5\x7a\xe9\xea\xea\xc2\xe9\x74\xda\x7b\x56\x57\x57\
-\x6d\xbf\x94\x65\x99\xe1\xe1\x61\xde\x7f\xff\x7d\x6e\xdc\xb8\xc1\
-\x27\x9f\x7c\xc2\xf5\xeb\xd7\xe9\xea\xea\xb2\x93\x81\xaa\xaa\x44\
-\xa3\x51\x4c\xd3\x44\x14\x45\xd2\xe9\x34\xa9\x54\x0a\x41\x10\x18\
-\x1c\x1c\x64\x70\x70\x90\x64\x32\xc9\xc2\xc2\x02\x86\x61\xd8\xe7\
-\xb4\x90\x5d\x5c\x5c\x64\x73\x73\x93\x48\x24\x42\x24\x12\xb1\x9d\
-\x3c\x9d\x4e\x53\xab\xd5\x68\x34\x1a\x84\x42\x21\xfb\xf3\x37\x21\
-\x49\x12\x96\x65\xe1\xf1\x78\x48\xa7\xd3\x4c\x4c\x4c\xb0\xb8\xb8\
-\x88\x24\x49\x0c\x0d\x0d\xd9\xaa\xd0\x8c\x72\x41\x10\xe8\xe9\xe9\
-\xa1\x5e\xaf\xe3\xf1\x78\x30\x4d\x93\x7c\x3e\x4f\xbd\x5e\xc7\xed\
-\x76\x33\x3a\x3a\x8a\x28\x8a\xcc\xcd\xcd\xb1\xb3\xb3\x63\xeb\xb1\
-\x4d\xb6\xd1\x68\x30\x39\x39\x89\xa2\x28\xf4\xf6\xf6\xda\x0f\x37\
-\x0c\x83\x5a\xad\x86\x69\x9a\xf8\x7c\x3e\x42\xa1\x10\x2e\x97\xab\
-\x45\x5e\x62\xb1\x18\xa9\x54\x0a\x8f\xc7\xc3\xd8\xd8\x18\x7d\x7d\
-\x7d\x14\x8b\x45\xc6\xc7\xc7\xb9\x75\xeb\x16\x93\x93\x93\x94\x4a\
-\x25\xfb\xf7\x00\xe1\x70\x18\x97\xcb\x85\xcf\xe7\xa3\xd1\x68\x50\
-\x2e\x97\x69\x34\x1a\x08\x82\x40\x28\x14\x62\x60\x60\x80\x54\x2a\
-\xc5\xda\xda\x9a\x1d\x6c\x36\x59\x5d\xd7\x29\x14\x0a\x74\x77\x77\
-\x13\x0c\x06\xed\x4f\xd6\x68\x34\x70\x38\x1c\x34\x1a\x0d\x9c\x4e\
-\x27\x4e\xa7\xf3\x50\x51\x32\x3c\x3c\x4c\x24\x12\x61\x7c\x7c\x9c\
-\xbb\x77\xef\xb2\xbc\xbc\x8c\x24\x49\x9c\x3f\x7f\x9e\x40\x20\xc0\
-\xec\xec\x2c\xab\xab\xab\x2d\x11\xee\xf5\x7a\x71\x3a\x9d\xb6\xdf\
-\xd7\xeb\x75\x2c\x6b\x4f\x45\x25\x49\x62\x64\x64\x04\x59\x96\x59\
-\x5d\x5d\x25\x97\xcb\xed\xf1\x68\x6e\x9e\x9f\x9f\x47\x14\x45\xba\
-\xbb\xbb\x5b\x2c\xa7\x28\x0a\x0e\x87\x03\x59\x96\x31\x0c\x83\x4a\
-\xa5\xd2\xe2\xf4\xec\xa7\xcb\xab\x57\xaf\xf2\xe1\x87\x1f\x72\xe1\
-\xc2\x05\x3a\x3a\x3a\x78\xfd\xfa\x35\x8b\x8b\x8b\x74\x74\x74\x50\
-\x28\x14\xd0\x75\xbd\x25\xba\x0b\x85\x02\xa5\x52\x89\x6a\xb5\x8a\
-\x2c\xcb\xf6\x39\x4d\x84\x42\x21\xa2\xd1\x28\x99\x4c\x86\xed\xed\
-\x6d\x6a\xb5\xda\x1e\x59\xc3\x30\x58\x5a\x5a\xc2\xe5\x72\xd1\xd1\
-\xd1\xd1\xe2\x8f\xa2\x28\xe2\x76\xbb\xd1\x34\x8d\x4a\xa5\x42\x2e\
-\x97\xc3\x34\x4d\xdb\x0a\x00\x3b\x3b\x3b\xac\xad\xad\xe1\xf1\x78\
-\xb8\x70\xe1\x02\x37\x6e\xdc\xe0\xe2\xc5\x8b\x76\x00\x99\xa6\x49\
-\xb1\x58\xb4\x7d\xaf\xb9\x47\x10\x04\x6a\xb5\x1a\x8a\xa2\xe0\x76\
-\xbb\x5b\xc8\x4a\x92\x44\x6f\x6f\x2f\xa6\x69\x92\x4e\xa7\x31\x4d\
-\x73\x8f\xec\xf6\xf6\x36\xd5\x6a\x15\x9f\xcf\x77\x68\x13\x80\xa6\
-\x69\xf6\x67\xca\xe7\xf3\x14\x0a\x05\xdb\xba\xf9\x7c\x9e\xdf\x7e\
-\xfb\x8d\x5f\x7f\xfd\x95\xef\xbe\xfb\x8e\x2f\xbe\xf8\x82\xaf\xbf\
-\xfe\x9a\x3b\x77\xee\x50\xaf\xd7\x6d\x3f\x3c\x68\xb9\xed\xed\x6d\
-\x54\x55\xc5\x30\x0c\xea\xf5\xfa\xa1\x75\x80\xe3\xc7\x8f\x53\xaf\
-\xd7\x49\xa5\x52\x54\xab\xd5\x3d\xb2\x5b\x5b\x5b\x48\x92\x84\xcf\
-\xe7\x3b\xb2\x90\x08\x87\xc3\x14\x8b\x45\x54\x55\x25\x95\x4a\xb1\
-\xb9\xb9\x69\xfb\x9f\x65\x59\xe8\xba\x4e\xa9\x54\x22\x1e\x8f\x73\
-\xf2\xe4\x49\x7a\x7b\x7b\xf9\xcf\x7f\xfe\xc3\xd9\xb3\x67\x59\x5a\
-\x5a\x42\x51\x94\x16\x75\x31\x0c\x83\x85\x85\x05\x1c\x0e\x07\xa5\
-\x52\x09\x97\xcb\x65\x57\x64\x6f\xc2\xef\xf7\xe3\xf5\x7a\x6d\x03\
-\x39\x00\x32\x99\x0c\x6e\xb7\xfb\xc8\x0d\x00\x27\x4f\x9e\x44\x51\
-\x14\x3c\x1e\x0f\xb9\x5c\x8e\xc9\xc9\x49\xd6\xd7\xd7\xa9\xd5\x6a\
-\xa8\xaa\xca\x95\x2b\x57\xf0\xf9\x7c\x4c\x4e\x4e\x32\x3d\x3d\x8d\
-\xd3\xe9\x24\x93\xc9\xf0\xe2\xc5\x0b\x5c\x2e\x17\x97\x2e\x5d\x22\
-\x1a\x8d\xda\xc1\x34\x31\x31\xc1\xfa\xfa\x3a\xe9\x74\x1a\x59\x96\
-\x89\x46\xa3\xb4\xb7\xb7\x1f\x3a\x5b\x14\x45\xfc\x7e\x3f\x86\x61\
-\xfc\x45\xb6\x59\xe1\x7b\x3c\x9e\x43\x1b\x00\xda\xdb\xdb\xe9\xef\
-\xef\xa7\x54\x2a\xe1\xf5\x7a\x79\xf5\xea\x15\xd3\xd3\xd3\x64\xb3\
-\x59\x1c\x0e\x07\x43\x43\x43\x7c\xfc\xf1\xc7\x7c\xf0\xc1\x07\x98\
-\xa6\x49\x32\x99\x64\x63\x63\x83\x70\x38\xcc\xf5\xeb\xd7\x19\x1a\
-\x1a\x42\xd3\x34\x04\x41\x60\x65\x65\x85\x27\x4f\x9e\x00\x90\x4a\
-\xa5\x08\x06\x83\xf4\xf5\xf5\xbd\xb5\x9e\xf5\x7a\xbd\xd4\xeb\x75\
-\x2a\x95\xca\x1e\xd9\x52\xa9\x84\x65\x59\x48\x92\x74\xe4\x06\x51\
-\x14\x19\x19\x19\x21\x12\x89\x50\x2e\x97\x71\xb9\x5c\x4c\x4e\x4e\
-\x72\xf7\xee\x5d\x74\x5d\x47\x51\x14\xe2\xf1\x38\xd7\xae\x5d\x23\
-\x1e\x8f\x33\x3d\x3d\x4d\x3a\x9d\xa6\xaf\xaf\x8f\x58\x2c\x86\xaa\
-\xaa\x38\x1c\x0e\x16\x16\x16\xf8\xe1\x87\x1f\x28\x97\xcb\x14\x0a\
-\x05\x64\x59\x66\x68\x68\x88\x9e\x9e\x1e\xdb\xea\x07\xe1\xf1\x78\
-\x70\x38\x1c\xd4\xeb\x75\xc4\x4f\x3f\xfd\xf4\xbf\xa6\xa7\xa7\x01\
-\x88\x46\xa3\x68\x9a\x76\xc8\xd1\x01\x5c\x2e\x17\x81\x40\x00\x5d\
-\xd7\xc9\xe5\x72\x38\x9d\x4e\x96\x96\x96\x48\x26\x93\xa8\xaa\x4a\
-\x7b\x7b\x3b\x6e\xb7\x9b\x8e\x8e\x0e\x4e\x9c\x38\xc1\xc8\xc8\x08\
-\xf1\x78\x1c\x4d\xd3\x28\x95\x4a\xdc\xbb\x77\x8f\x1f\x7f\xfc\x91\
-\x72\xb9\x6c\x97\x99\xa3\xa3\xa3\x5c\xbe\x7c\x99\x40\x20\x70\xe4\
-\x99\xec\xeb\x7f\x2a\x95\xa2\xbb\xbb\x7b\xaf\x9e\xfd\xfe\xfb\xef\
-\x29\x95\x4a\x8c\x8d\x8d\x11\x8b\xc5\x8e\x0c\x32\x80\x5a\xad\xc6\
-\xd2\xd2\x12\x3f\xfd\xf4\x13\x1b\x1b\x1b\xf6\x27\x6a\xba\x47\x24\
-\x12\xa1\xab\xab\x8b\x60\x30\x48\xbd\x5e\x67\x67\x67\x07\x5d\xd7\
-\xd1\x75\x9d\x4a\xa5\x82\xdb\xed\xa6\x58\x2c\x52\xa9\x54\xb8\x74\
-\xe9\x12\xd7\xae\x5d\x23\x1c\x0e\xbf\xd5\xaa\x00\xf7\xee\xdd\x23\
-\x99\x4c\x72\xfe\xfc\xf9\x3d\xcb\xae\xaf\xaf\xb3\xbb\xbb\x4b\x67\
-\x67\x27\x81\x40\xe0\x48\xbf\x05\x70\x38\x1c\xf8\x7c\x3e\x82\xc1\
-\x20\x96\x65\xb1\xbe\xbe\x4e\xb5\x5a\x25\x14\x0a\xe1\x74\x3a\xd1\
-\x75\x9d\xe5\xe5\x65\x96\x97\x97\x59\x5c\x5c\x24\x99\x4c\x52\xaf\
-\xd7\xf1\x7a\xbd\x98\xa6\x49\x26\x93\xb1\x53\x72\xb3\x8d\xf9\x3b\
-\xa2\x00\x7f\xfc\xf1\x07\x86\x61\x70\xfc\xf8\xf1\x3d\xcb\x3e\x7e\
-\xfc\x98\x97\x2f\x5f\x72\xee\xdc\x39\x86\x86\x86\xec\x4e\xb5\x89\
-\x64\x32\xc9\xda\xda\x9a\x5d\x01\x35\x85\xfa\xd5\xab\x57\x2c\x2e\
-\x2e\x62\x18\x06\xaa\xaa\xe2\x72\xb9\xd0\x34\x0d\x55\x55\xa9\xd7\
-\xeb\x14\x8b\x45\x0a\x85\x02\xe5\x72\x99\x4a\xa5\x42\x30\x18\xa4\
-\xb7\xb7\x97\x58\x2c\xd6\x22\x93\x9a\xa6\xd1\xd7\xd7\x77\xa8\x40\
-\x02\xf8\xf2\xcb\x2f\xb1\x2c\x8b\x6b\xd7\xae\xed\x59\x36\x9f\xcf\
-\xdb\x7d\x53\x38\x1c\x6e\x69\x29\x8a\xc5\x22\x77\xee\xdc\x61\x66\
-\x66\x86\xdd\xdd\x5d\x76\x77\x77\xc9\xe5\x72\x94\xcb\x65\x24\x49\
-\xc2\xed\x76\xe3\xf1\x78\xf0\xf9\x7c\x76\x07\xeb\x72\xb9\x70\x3a\
-\x9d\xf6\x0b\xb8\xdd\x6e\x02\x81\x00\x9d\x9d\x9d\x38\x9d\x4e\x0c\
-\xc3\x20\x9f\xcf\xdb\x6e\x32\x33\x33\x83\xaa\xaa\x76\x7b\xd4\x44\
-\xa9\x54\xe2\xfe\xfd\xfb\xf8\x7c\x3e\x06\x06\x06\x90\xd8\xcf\xc3\
-\xd5\x6a\x15\x5d\xd7\x6d\xf1\x6f\x3a\xbc\x69\x9a\x64\xb3\x59\x2a\
-\x95\x0a\x8a\xa2\x90\x48\x24\xf0\xf9\x7c\xdc\xbf\x7f\x1f\xbf\xdf\
-\xdf\xd2\xa6\x08\x82\x80\xae\xeb\xdc\xbb\x77\x8f\x70\x38\xcc\xf0\
-\xf0\x30\x1e\x8f\xc7\x3e\x3c\x93\xc9\x30\x35\x35\x45\x57\x57\x17\
-\xf1\x78\x9c\x27\x4f\x9e\xd0\x68\x34\xa8\x54\x2a\x14\x0a\x85\x96\
-\x74\xcc\x7e\x9d\xdc\xe4\xa3\x28\xca\x9e\x74\x35\x1b\xc2\x4c\x26\
-\xc3\xd6\xd6\x16\xb5\x5a\xad\x65\x93\x20\x08\x38\x1c\x0e\x2c\xcb\
-\xa2\xad\xad\x8d\x78\x3c\x8e\x2c\xcb\xf8\x7c\x3e\x4e\x9c\x38\x41\
-\x22\x91\x20\x1e\x8f\x73\xe2\xc4\x09\xe2\xf1\x38\x6e\xb7\x9b\xf6\
-\xf6\x76\x7a\x7b\x7b\x49\x24\x12\xf6\xd5\xdd\xdd\x0d\xfb\x9f\x3d\
-\x1a\x8d\x22\x49\x12\xa2\x28\xbe\x55\x32\xe7\xe6\xe6\x90\x65\x99\
-\xce\xce\xce\xbf\xc8\x36\xf5\xae\x52\xa9\xa0\xeb\xfa\x91\xcd\x1a\
-\xfb\xa9\x55\x10\x04\x5c\x2e\x97\x5d\x29\x29\xfb\xb3\x2c\x51\x14\
-\x11\x45\xd1\x76\x01\x59\x96\x5b\xee\x8b\xa2\xd8\x22\x4f\xcd\x20\
-\x7e\xb3\x20\x7a\x13\xf9\x7c\x9e\x95\x95\x15\x3a\x3b\x3b\x89\x46\
-\xa3\x7f\x91\x05\x38\x71\xe2\x04\x3e\x9f\x8f\xed\xed\x6d\xbb\x7e\
-\x2c\x95\x4a\x6c\x6d\x6d\x91\xcd\x66\xb1\x2c\xcb\xd6\xcc\xa6\x6c\
-\x39\x1c\x0e\xd6\xd7\xd7\x59\x5a\x5a\xb2\xaf\xcd\xcd\x4d\x34\x4d\
-\xc3\xb2\x2c\xd6\xd6\xd6\x5a\xd6\x76\x76\x76\x50\x55\x15\xd3\x34\
-\x59\x5d\x5d\x45\x51\x14\x9c\x4e\xa7\x5d\xf0\xbc\x89\xb9\xb9\x39\
-\x7b\x28\xe2\xf3\xf9\xf6\xdc\xac\x39\x37\xb0\x2c\x8b\xf1\xf1\x71\
-\x6a\xb5\x1a\x89\x44\x82\x40\x20\xc0\xbd\x7b\xf7\x78\xfc\xf8\x31\
-\xaf\x5e\xbd\x42\x92\x24\x54\x55\xb5\xe7\x57\xf9\x7c\xde\x2e\x1f\
-\xdf\xb4\x58\x73\x20\x27\x49\x12\x2e\x97\xab\x65\xad\xa9\xc9\xcd\
-\xb5\xd5\xd5\x55\x1a\x8d\x06\x6e\xb7\x9b\x8f\x3e\xfa\x88\xb1\xb1\
-\x31\x3c\x1e\x0f\xa9\x54\x8a\x6f\xbe\xf9\x06\x80\xf7\xde\x7b\x8f\
-\xbe\xbe\x3e\x64\x59\x6e\x1d\x72\x14\x0a\x05\x52\xa9\x14\xb9\x5c\
-\x8e\x50\x28\xc4\x9d\x3b\x77\xd8\xd8\xd8\x20\x93\xc9\x90\x48\x24\
-\x18\x18\x18\x60\x66\x66\x86\x6a\xb5\x4a\x3c\x1e\x3f\xa4\xc9\x8f\
-\x1f\x3f\x46\x10\x04\x4e\x9e\x3c\x89\xdf\xef\x6f\x21\xfa\xe8\xd1\
-\x23\x34\x4d\x23\x91\x48\xb0\xb2\xb2\xc2\xce\xce\x0e\xb3\xb3\xb3\
-\x1c\x3b\x76\x8c\xcb\x97\x2f\x73\xe6\xcc\x19\xbb\x96\xbe\x7d\xfb\
-\x36\x13\x13\x13\x8c\x8e\x8e\x32\x3a\x3a\x6a\x4f\x69\x5a\x44\xad\
-\xd9\xbc\x3d\x7c\xf8\x10\xb7\xdb\x8d\xae\xeb\x78\x3c\x1e\x8a\xc5\
-\x22\x9d\x9d\x9d\x0c\x0e\x0e\xb2\xbd\xbd\x6d\x97\x83\xcd\x20\x69\
-\x62\x76\x76\x16\x51\x14\xe9\xef\xef\x6f\xe9\x66\x01\xc6\xc7\xc7\
-\xf1\x7a\xbd\x0c\x0c\x0c\x50\xab\xd5\xa8\x56\xab\xb6\x5c\xf5\xf7\
-\xf7\xdb\x44\xff\xf8\xe3\x0f\x26\x26\x26\x38\x76\xec\x18\x03\x03\
-\x03\x2d\x8d\x66\x4b\x42\x16\x04\x01\x4d\xd3\x38\x79\xf2\x24\x6b\
-\x6b\x6b\xcc\xce\xce\xda\x8d\x1c\xfb\xd5\xbb\xbd\xd1\xe1\x40\x92\
-\xa4\x96\xcb\xb2\x2c\x2c\xcb\x42\x14\x45\x3b\xc0\x9a\x57\xad\x56\
-\xdb\x6b\x4d\x1c\x0e\x5b\xe6\x9a\xcf\x69\x06\x5f\x32\x99\xe4\xe7\
-\x9f\x7f\x46\x96\x65\xce\x9e\x3d\x4b\x47\x47\x47\xcb\x0b\x1f\xaa\
-\x1e\x64\x59\xe6\xf4\xe9\xd3\x7b\x22\x2c\x49\xe4\x72\x39\x1c\x0e\
-\x07\xc5\x62\x91\x95\x95\x15\x4a\xa5\x12\xa6\x69\xb2\xb5\xb5\x45\
-\x32\x99\x6c\x09\x20\xc3\x30\x30\x4d\x13\x5d\xd7\x5b\xee\x2f\x2d\
-\x2d\x61\x59\x16\xd5\x6a\x95\x66\x6a\x6f\x92\xcf\x66\xb3\xec\xec\
-\xec\xb0\xbc\xbc\xcc\xed\xdb\xb7\x31\x0c\x83\x8b\x17\x2f\x72\xfc\
-\xf8\xf1\x96\x04\xc1\xdb\x06\x73\x96\x65\x91\xc9\x64\xf8\xfc\xf3\
-\xcf\x79\xfa\xf4\x29\xbb\xbb\xbb\x78\x3c\x1e\x34\x4d\x23\x9f\xcf\
-\x63\xed\xcf\x08\x64\x59\x6e\xd1\xc7\x74\x3a\x8d\xc3\xe1\x40\xd3\
-\xb4\x16\xf7\x60\xbf\x8d\x91\x65\x19\xaf\xd7\x4b\xb9\x5c\xa6\x5a\
-\xad\x92\xcd\x66\x71\xbb\xdd\xc4\x62\x31\x9c\x4e\x27\xa1\x50\x88\
-\x77\xde\x79\x87\xb3\x67\xcf\xda\x89\xe6\x4d\x1c\x49\x96\x7d\xc2\
-\xcb\xcb\xcb\xfc\xf9\xe7\x9f\xfc\xf2\xcb\x2f\x98\xa6\x89\xd7\xeb\
-\x25\x16\x8b\x11\x0c\x06\x79\xfe\xfc\x39\x6d\x6d\x6d\xf4\xf7\xf7\
-\xdb\xb5\x84\xb5\xdf\xa3\x8d\x8f\x8f\x13\x0a\x85\x48\x24\x12\x2d\
-\x6b\xb9\x5c\x8e\xd9\xd9\x59\x02\x81\x00\xd1\x68\x94\xa9\xa9\x29\
-\xaa\xd5\x2a\x9b\x9b\x9b\x74\x77\x77\x73\xf3\xe6\x4d\xce\x9c\x39\
-\x63\x4b\xd5\x41\x1c\x5d\x0b\xee\xfb\x6f\x2c\x16\x43\xd3\x34\xe6\
-\xe7\xe7\xc9\xe5\x72\x68\x9a\xc6\xe0\xe0\x20\x89\x44\x82\xf5\xf5\
-\x75\xc2\xe1\x30\x57\xae\x5c\xc1\xef\xf7\xdb\xfb\xd2\xe9\x34\xba\
-\xae\x13\x8b\xc5\x18\x1b\x1b\xc3\xeb\xf5\xda\x6b\x4d\x65\xe9\xeb\
-\xeb\xe3\xc2\x85\x0b\x64\x32\x19\xdb\xad\x06\x07\x07\xe9\xef\xef\
-\x7f\x2b\x51\x8e\xf2\xd9\x37\xd1\x0c\x14\x51\x14\xb1\x2c\xcb\x1e\
-\x78\xbc\xe9\x4b\x6f\x66\xb2\xe6\xd5\x4c\xcf\x07\xd7\x1c\xfb\xc3\
-\x12\x61\x7f\xdc\xdf\x7c\xa6\x24\x49\x78\x3c\x9e\x43\xba\x7c\x10\
-\x6f\x5f\x39\x00\x55\x55\x09\x06\x83\x78\x3c\x1e\x14\x45\x21\x14\
-\x0a\x1d\xd9\x60\xca\xb2\x4c\x47\x47\x07\x3e\x9f\xef\xd0\x9a\xd3\
-\xe9\xa4\xa3\xa3\xc3\xce\x7e\xed\xed\xed\x04\x02\x01\xfb\x05\xff\
-\x09\xc2\xc4\xc4\x84\x55\x28\x14\xd8\xdd\xdd\x6d\x99\xd8\x35\x51\
-\xad\x56\x79\xf5\xea\x15\x96\x65\xe1\x72\xb9\xec\xff\x19\x34\x7b\
-\xaf\xf6\xf6\xf6\x96\x60\xaa\xd5\x6a\xbc\x7e\xfd\xda\x6e\xaf\xdf\
-\x5c\x33\x0c\x83\x74\x3a\x8d\x6b\x7f\xc6\xd5\x9c\xb4\xe4\x72\x39\
-\xda\xda\xda\x08\x85\x42\xc8\x47\x14\xe3\xaa\xaa\xe2\xf7\xfb\xf7\
-\xc8\x56\xab\x55\x7b\xd8\x70\x10\xcd\x4f\xd5\x44\x53\x23\x9b\xf7\
-\x04\x41\x68\xb1\x4a\x53\x6b\xff\xcd\x5a\xf3\xef\xa6\x7b\x1d\xfc\
-\x7d\x13\xb2\x2c\xe3\x74\x3a\xf9\x6f\x9c\x6e\x05\xf1\x2b\xbb\x0d\
-\x85\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x6e\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x22\x00\x00\x00\x16\x08\x06\x00\x00\x00\xa5\xac\x4e\x79\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x05\x03\x49\x44\x41\x54\x48\x4b\x9d\x96\xd9\x6e\
-\x53\x57\x14\x86\xbf\xbd\x8f\x13\x3b\x76\xec\xcc\x33\x81\x84\x4c\
-\x04\x01\x61\x52\x8b\xa0\x55\x55\x15\x5a\xd4\x3e\x40\x9f\xa6\x52\
-\x2f\xfa\x20\x7d\x80\x4a\x48\x55\x6f\x3a\xd0\x48\x55\x5b\x95\xa1\
-\x14\x48\xd2\xa4\x10\x48\xc8\x4c\x88\x43\x26\x4f\xc7\xde\x7b\xf5\
-\x62\x1f\x4f\x21\x40\xda\x5f\xf2\x85\xed\x7d\xd6\xfa\xd7\x5e\xff\
-\xfa\xd7\x51\x5f\x7d\xe3\x0b\x87\x84\xa7\xa1\xc6\x03\xcf\x03\xad\
-\x14\x5a\x95\xff\x13\x40\x2c\x18\x11\x0a\x06\xf2\x06\xe4\xd0\x91\
-\x41\x1d\x86\x48\x34\x0c\xed\x09\x45\x57\x93\xa2\xa7\x45\xd1\x1a\
-\x57\xc4\xc2\x8a\x70\x4d\xf9\x8c\x15\xc8\xf8\xb0\x93\x16\xd6\xb6\
-\x84\xc5\xa4\x90\xdc\x75\x1f\xbf\x50\x19\xed\x60\xbc\x91\x48\xa4\
-\x06\x06\x3a\x35\x03\x9d\x8a\xde\x16\x45\x22\x5a\x7d\x0b\x6f\x82\
-\xb1\xf0\x62\x47\x58\xd9\x14\x66\xd7\x84\xb9\x75\x4b\xc1\xec\x3f\
-\x55\xc6\x6b\x89\x0c\x77\x6b\xce\xf5\x29\xda\x1b\x15\xf1\x3a\x45\
-\x65\x7e\xbf\x00\xa9\xac\x90\xf6\x21\x95\x05\xad\xa1\x3e\x02\xb1\
-\xb0\x22\x1a\x76\x2d\xac\xc4\x66\x4a\x98\x7b\x2e\xdc\x7b\x6a\x59\
-\xdf\x3e\x30\xdd\xab\x44\x1a\xa2\x8a\xf7\x47\x3d\xfa\x3b\x14\xf1\
-\x08\xa8\x80\x41\x2e\x0f\x0b\x1b\x96\xa9\x25\xcb\xc6\x0e\xb4\xc6\
-\xa1\x35\xa1\x68\xaa\xd7\x18\x23\x6c\xee\xba\x96\xf8\x06\xfa\xdb\
-\x14\xa3\x47\x3c\x5a\xe2\xe5\xe7\x0b\xc6\xdd\xd0\xed\xc7\x86\x99\
-\x15\xa7\xa3\x4a\x54\x11\x69\xaa\x57\x7c\x3c\xe6\xd1\xd7\xae\x08\
-\x05\x55\x59\x81\xa9\x45\xe1\xee\x13\xc3\xe6\xae\x50\x13\x82\xcb\
-\x23\x1e\x23\x3d\x9a\xda\x50\x50\xbd\xb8\x56\xbc\x4c\x09\xbf\xcf\
-\x18\xe6\xd7\x05\xa5\xa1\xa7\x45\x71\x69\xc8\xa3\xb7\xd5\xdd\xa8\
-\x08\xec\x65\x61\x7c\xb2\xc0\xf4\x72\x35\x99\x12\x91\x78\x1d\x7c\
-\x32\xe6\x31\xd4\xad\x4b\x3a\xf0\x0b\xf0\xe3\x03\xc3\xe4\xa2\xc5\
-\x18\x68\x88\x29\x3e\x3d\xef\x71\xac\xed\xf5\x5a\xc9\xe6\xe1\xfb\
-\xfb\x86\xe9\x25\x8b\x15\x47\xf4\xf2\xb0\xe6\xca\xa8\x57\x7a\x26\
-\x9d\x83\x6f\xef\x16\x98\x7b\x2e\xd8\xe0\x1a\x34\x40\x6d\x08\x2e\
-\x1c\xf7\x18\xe8\x74\x24\xac\xc0\x4a\x52\xf8\x7a\x3c\xcf\x83\x79\
-\x27\x32\xcf\x83\xf3\xfd\x9a\xde\x16\x47\xc2\x0a\x64\x7d\x58\xdc\
-\x10\xd6\xb6\x1c\x69\x11\x27\xf0\x8f\x4e\x7b\xb4\xc4\x15\x88\x6b\
-\xc9\xaf\x33\x96\x1b\xb7\x0c\x3b\x69\x37\xe6\xd1\x30\x5c\x3f\xeb\
-\xd1\x9a\x28\x6b\xcf\xbb\xfa\xf9\x17\x5f\x8e\xf4\x68\xae\x9c\xf0\
-\x88\xd4\xb8\xf9\x9f\x5e\xb4\x7c\xf7\xa7\x61\x2b\x5d\xac\x13\xba\
-\x9b\x15\x17\x07\x35\x89\xa8\xc2\x58\xf8\x7b\xd1\x72\xe3\x76\x81\
-\x3b\x4f\x2c\xf7\xe7\x2d\xcb\x9b\x42\x6b\x42\x51\x1f\x71\x63\x5d\
-\x30\xb0\x94\x14\x8c\x75\xc9\x37\xf7\x9c\x8e\xda\x1b\x14\xd1\xb0\
-\xa2\xae\xd6\xd9\xc1\xc2\x86\x90\xf1\x41\xd7\xd5\xc2\xa5\x61\x4d\
-\x2c\xec\x2a\x9a\x5e\xb2\x8c\x4f\x19\x52\xb9\x32\x09\x02\x11\x37\
-\xd7\x3b\xfe\xc9\x5d\xe1\x97\x69\xc3\x76\xda\x3d\x63\x2d\x2c\x6c\
-\x08\x13\xcf\x2c\xd9\xbc\x3b\x7f\xbc\x43\x97\x74\x46\xa0\xb5\xa7\
-\xeb\xc2\x6f\xff\x58\xb6\x52\xae\x1f\xdd\x4d\x8a\xab\x67\x3c\x67\
-\x90\xe1\x90\xa2\xbd\xc1\x25\x48\xe7\x60\x72\xc1\xb2\x97\x2d\x07\
-\x28\x22\xe4\x39\x57\x25\xa8\xce\x0f\x12\x16\x61\x2d\x6c\x67\x20\
-\x1b\x68\xbf\x3e\x02\x6a\xdf\x18\x1b\x0b\xb3\xab\xb6\x74\x53\x00\
-\x83\x9d\x6e\x30\x74\xae\xe0\xdc\x0f\x20\x52\x0b\x7d\xed\xd5\x8e\
-\x59\x44\xd1\xb6\x01\x9a\x63\x0a\x1d\x90\xaa\x44\xb4\x06\xc2\x35\
-\xae\x28\xbf\x20\x07\x5a\x7c\x7b\x83\xa2\x39\x5e\x16\xfb\xdc\xba\
-\x60\x0c\xe8\x8c\x0f\xb7\x67\x2d\xf9\x82\x53\xf8\xc5\x01\x8f\x93\
-\x47\x34\xa1\x7d\x89\xf6\xb2\xc2\x4e\xc6\x45\x6e\x6d\x50\x8c\x74\
-\xeb\x2a\xe3\x6a\x88\x2a\x06\xba\x14\x75\xb5\xee\xfb\xf2\xa6\x60\
-\x83\xaa\x8b\x68\x8a\x29\xde\x19\xd2\x74\x36\x2a\x94\x72\x2b\xe1\
-\xa7\x09\x43\xc1\x82\xb6\x02\x8f\x57\x2d\xd3\xcb\x16\x09\x26\xe8\
-\xda\x19\x8f\xb1\x63\x1a\x5d\x91\x68\x63\x57\x78\xbe\xe5\xaa\xd4\
-\x0a\xae\x9e\xf6\xb8\x7e\xd6\x63\xa4\x5b\x71\xea\xa8\xe6\xfa\x39\
-\xcd\x70\x97\x2e\x19\xd8\xd4\xa2\xad\xda\x31\xb1\x30\xbc\x37\xea\
-\xce\x14\x0b\xf8\xe1\x81\x21\x19\x38\x6d\xc9\x47\xda\x12\x8a\x6b\
-\x63\x1e\x7d\x6d\x8e\xad\x08\x3c\x7c\x66\xb9\xf9\xd0\x90\x0d\x46\
-\xf3\x44\x8f\xe6\xc3\x53\x9a\xa6\xfa\xc0\xa0\x02\x93\x02\xe7\xa0\
-\x45\xd3\x9a\x58\xb0\xdc\x9c\x30\xa4\x73\xee\xf7\x44\x04\x3e\xbb\
-\x18\x2a\xc5\xb6\x02\x3f\x4f\x18\xee\xcd\xb9\x4e\x54\x11\x01\xe8\
-\x6a\x52\x7c\x70\xd2\x19\x56\xc8\x0b\xc6\x6e\x17\xc6\x27\x0d\xab\
-\x2f\x85\xb4\x2f\x0c\x76\x6a\xde\x1d\xd2\xb4\x25\xf6\x6d\x5f\x0b\
-\x69\x1f\x66\x96\x2d\x7f\x3c\xb2\x64\xf3\x42\x34\xac\x38\xda\xe6\
-\x62\xc6\x23\x2e\x5e\x3a\x07\xb7\x1e\x19\xfe\x9a\x2b\x4f\x18\xfb\
-\x89\x00\x34\x46\xe1\xc2\xa0\xc7\x68\x8f\xdb\xb6\x0a\x27\xd2\xe5\
-\xa4\x30\xff\xc2\xb2\xb6\x25\x78\x1a\x7a\x5b\x34\xf1\x28\x84\x9c\
-\x6f\x91\x2b\xc0\x8b\x6d\xe1\xc5\x8e\x10\x0b\x2b\xba\x9b\x15\xc7\
-\xda\x14\x2d\x81\x30\x8d\x85\xd5\x97\xc2\x9d\x27\x96\xd9\xd5\xea\
-\xb6\x71\x10\x11\x02\x9d\x1c\x6d\xd3\x9c\xee\x55\x0c\x75\xeb\xd2\
-\xd8\xba\x11\x15\xf6\x32\x90\xcb\xbb\x05\x57\x69\xf5\xe1\x90\xa2\
-\x2e\xec\x44\x59\x1b\x2a\x2f\xbc\x8c\xef\x34\xf3\xf0\x99\xdb\xbe\
-\xc5\xd1\xad\xc4\x81\x44\x8a\x48\xd4\x29\x3a\x1a\xe1\x5c\xbf\x47\
-\x7f\xbb\x6b\xd7\x7f\x41\xc6\x87\xe9\x65\xcb\xd4\xa2\x25\xb9\x23\
-\xaf\x98\x64\x25\xde\x48\x84\x40\x84\xb1\x5a\x45\x6b\x03\x9c\xea\
-\xd5\xf4\x75\x68\xe2\x91\xea\x9b\xa8\x84\x1f\xb4\x68\x66\xc5\x32\
-\xbb\x26\xa4\xb2\xce\xc2\xdf\x86\xb7\x12\x29\x42\x29\xe7\xae\x5e\
-\xf0\x12\xd4\x5c\xef\x5e\x98\x62\x61\x37\x05\x3b\x19\xd8\xdc\x15\
-\xb6\x52\x42\xde\x38\x03\x3c\xa8\x05\xaf\xc3\xa1\x89\xec\x87\x0a\
-\xc8\x15\x21\xe2\x44\xfb\x7f\xf1\x2f\xcc\x01\x6e\x1e\x8a\xe1\x5c\
-\xbf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x05\x3f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2b\x00\x00\x00\x2b\x08\x06\x00\x00\x00\xe1\x5d\x71\xc0\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x04\xd4\x49\x44\x41\x54\x58\x47\xd5\x98\xd9\x53\
-\xf2\x3c\x14\xc6\x9f\xa4\x52\x64\x71\x45\x10\x10\x71\x61\xc6\x65\
-\x5c\x6e\xfc\xff\xff\x00\x67\xbc\x71\x03\x71\x7b\x47\xb1\x8a\x20\
-\x8a\xa8\x20\xa5\x4d\xde\x8b\xb7\xcd\x34\x05\x84\x02\x7e\xfa\xfd\
-\xae\xe8\xc9\x43\xe6\x99\xd3\xf4\xe4\x24\x24\x9f\xcf\x73\xfc\x4f\
-\xa0\xee\x80\x17\x74\x5d\xc7\xfb\xfb\x3b\xaa\xd5\x2a\xea\xf5\x3a\
-\x4c\xd3\x74\x4b\x46\x0a\xf1\x92\x59\x5d\xd7\x51\x2a\x95\x50\x2a\
-\x95\xf0\xfc\xfc\xec\x1e\x06\x21\x04\xe3\xe3\xe3\x98\x9e\x9e\x46\
-\x24\x12\x41\x3c\x1e\x77\x4b\x86\xa2\x2f\xb3\xcd\x66\x13\x97\x97\
-\x97\x78\x78\x78\x70\x0f\x7d\x89\xdf\xef\x47\x32\x99\x44\x2a\x95\
-\x82\xdf\xef\x77\x0f\x7b\xe6\x4b\xb3\x9c\x73\x94\xcb\x65\x9c\x9d\
-\x9d\x41\xd7\x75\xf7\x70\xdf\x28\x8a\x82\xb5\xb5\x35\x2c\x2c\x2c\
-\xb8\x87\x3c\xd1\xd5\xac\x69\x9a\x38\x3f\x3f\x87\xa6\x69\xee\x21\
-\xa8\xaa\x8a\xf9\xf9\x79\x04\x02\x01\xa8\xaa\x0a\x9f\xcf\x07\x5d\
-\xd7\xd1\x6c\x36\x51\xab\xd5\x50\xa9\x54\xda\xd6\x2f\xa5\x14\x0b\
-\x0b\x0b\x58\x5f\x5f\x97\xe2\x5e\xe8\x68\xd6\x34\x4d\xe4\xf3\x79\
-\xdc\xdf\xdf\x8b\x18\x21\x04\x93\x93\x93\x58\x59\x59\xc1\xdc\xdc\
-\x9c\xa4\x77\xc3\x18\xc3\xc3\xc3\x03\x6e\x6f\x6f\xf1\xf1\xf1\x21\
-\xe2\x84\x10\xcc\xce\xce\x62\x77\x77\x17\x8a\xa2\x48\xff\xe9\x87\
-\x36\xb3\xa6\x69\xe2\xe2\xe2\x02\x77\x77\x77\x22\xa6\xaa\x2a\x56\
-\x57\x57\x91\x4a\xa5\x9c\xd2\x9e\x30\xc6\xa0\x69\x1a\xf2\xf9\xbc\
-\x88\x51\x4a\x91\x4c\x26\xb1\xb1\xb1\x21\x69\xfb\x41\x2a\x5d\x8c\
-\x31\x3c\x3e\x3e\x4a\x46\xfd\x7e\x3f\xf6\xf6\xf6\x3c\x1b\x85\x65\
-\x2c\x95\x4a\x49\x99\xb4\xb3\x5e\x2c\x16\xdd\xf2\x9e\x48\x66\x75\
-\x5d\xc7\xd5\xd5\x95\x78\x1e\x1b\x1b\xc3\xf6\xf6\x36\x42\xa1\x90\
-\x53\xe6\x09\x42\x08\xa2\xd1\x28\xb6\xb7\xb7\x45\xcc\x34\x4d\x5c\
-\x5e\x5e\xa2\xd1\x68\x48\xda\x5e\x08\xb3\xa6\x69\xe2\xe6\xe6\x06\
-\xcd\x66\x13\xb0\xbe\xe0\x4c\x26\x83\x99\x99\x19\xa7\x7e\x20\x08\
-\x21\x88\x44\x22\xc8\x64\x32\x22\xa6\xeb\x3a\xfe\xfc\xf9\x23\xe9\
-\x7a\x41\x61\x95\xa8\x8f\x8f\x0f\x14\x0a\x05\xc0\x9a\x3c\x1c\x0e\
-\x63\x71\x71\xd1\xad\x1f\x18\x4a\x29\x16\x17\x17\x31\x31\x31\x01\
-\x58\xcb\xa1\x5c\x2e\xa3\xd5\x6a\xb9\xa5\x5d\xa1\x70\xac\x55\x1b\
-\xbb\x2e\x8e\x1a\x4a\x29\x96\x96\x96\xc4\x33\x63\x0c\xa5\x52\x49\
-\xd2\x7c\x85\x30\x5b\xa9\x54\x00\x2b\xab\x53\x53\x53\x98\x9a\x9a\
-\x72\x6b\x87\x86\x52\x8a\xb9\xb9\x39\x4c\x4e\x4e\x02\x1d\x92\xd4\
-\x0b\xca\x39\xc7\xe7\xe7\x27\xde\xdf\xdf\xff\x05\x28\x45\x24\x12\
-\x71\xeb\x46\x06\x21\x44\xd4\x69\xce\x39\xde\xde\xde\x50\xaf\xd7\
-\xdd\xb2\x8e\x50\xce\xb9\x30\x0a\x6b\xb2\xe9\xe9\x69\x49\x34\x4a\
-\x28\xa5\xd2\x5b\x63\x8c\xa1\x56\xab\x49\x9a\x6e\x50\x00\xd2\x22\
-\xb7\x3b\xa7\xef\xa2\xd3\xfc\x9f\x9f\x9f\xd2\x73\x37\x28\xe7\xbc\
-\xcd\xac\xaa\xaa\x92\x68\xd4\xf8\x7c\x3e\xf1\x9b\x73\x0e\xc3\x30\
-\xa4\xf1\x6e\xb4\x35\xdf\x5e\xfe\x3c\x0a\x08\x21\x18\x1b\x1b\x73\
-\x87\x3b\x42\x09\x21\x6d\xbd\xe6\x30\xed\x60\x2f\x38\xe7\x6d\xf3\
-\xf7\xfb\x26\xa9\xdd\x4d\xd9\xd8\x1b\xc4\x77\xc1\x39\xc7\xeb\xeb\
-\xab\x78\xee\x94\xac\x6e\x50\x42\x08\x02\x81\x80\x58\x47\x8c\xb1\
-\x8e\x47\x96\x51\xd1\xc9\xac\xbd\xab\xf5\x82\xc2\xd1\xab\xc2\xb1\
-\xab\x7c\xd7\xba\x6d\xb5\x5a\x28\x97\xcb\x80\xc3\x68\xdf\xcb\x00\
-\x56\xed\x8b\xc5\x62\x22\x68\x18\x86\xa7\x6d\xb0\x5f\x4c\xd3\x84\
-\xa6\x69\xa2\xfa\x78\xdd\x80\x24\xb3\x81\x40\x00\x70\x74\x60\xee\
-\x0f\x61\x58\x74\x5d\x97\x7a\x65\x9f\xcf\x87\x44\x22\x21\x69\xbe\
-\x42\x94\x2e\x45\x51\x90\x4e\xa7\xc5\x40\xbd\x5e\x47\x2e\x97\x13\
-\xcf\xc3\x62\x18\x06\xb2\xd9\xac\xc8\xaa\xa2\x28\x58\x5e\x5e\xee\
-\x7b\x09\xc0\x69\x96\x52\x8a\x78\x3c\x2e\xbe\x4c\xce\x39\x2a\x95\
-\x8a\x74\x24\x19\x14\xc3\x30\x70\x78\x78\x88\x97\x97\x17\xc0\xd1\
-\x82\x7a\x3d\x7d\x48\x9b\x82\x7d\x32\x70\x1e\x41\x34\x4d\xc3\xe9\
-\xe9\xa9\x53\xe6\x09\xc3\x30\x70\x7c\x7c\x2c\x8c\x62\x88\x16\x54\
-\x32\x6b\xb7\x87\x9b\x9b\x9b\x22\xc6\x18\x43\xb1\x58\xc4\xfe\xfe\
-\xbe\xa7\x76\x8e\x73\x8e\x5a\xad\x86\x83\x83\x03\xd1\x7e\xda\xd8\
-\xe7\x30\xaf\xb4\x9d\x6e\x61\x4d\x56\x28\x14\x70\x71\x71\x21\xc5\
-\x09\x21\x08\x06\x83\x88\xc7\xe3\x88\x46\xa3\x08\x87\xc3\xd2\x38\
-\x1c\x26\x6f\x6e\x6e\xbe\xac\x28\x94\x52\x24\x12\x09\x29\x31\xbd\
-\xe8\x68\x16\x8e\xc6\x38\x9f\xcf\x77\xad\xb9\x8a\xa2\xc0\xef\xf7\
-\x43\x55\x55\xb1\x8d\xea\xba\xde\x76\xc1\x61\x6f\x3c\xf1\x78\x1c\
-\xd7\xd7\xd7\x22\x4e\x29\xc5\xfc\xfc\x3c\xb6\xb6\xb6\x24\x7d\x37\
-\xba\x9a\xb5\x69\x34\x1a\xc8\xe5\x72\x03\xed\x6a\x76\x3b\x98\x4e\
-\xa7\x91\x48\x24\x40\x29\x45\xb1\x58\x44\x36\x9b\x15\x1a\x2f\x86\
-\x7b\x9a\x85\xf5\x6a\xab\xd5\x2a\x34\x4d\x43\xa9\x54\x02\x63\xcc\
-\x2d\x91\x20\x84\x20\x14\x0a\x21\x9d\x4e\x23\x99\x4c\x4a\x63\xf6\
-\x37\x30\x88\xe1\xbe\xcc\x3a\x69\x36\x9b\x78\x7c\x7c\x44\xa3\xd1\
-\x80\x61\x18\x30\x0c\x03\x8c\x31\x04\x02\x01\x84\x42\x21\x04\x83\
-\x41\x84\x42\xa1\xb6\x06\xdb\x49\x37\xc3\xb1\x58\x4c\xba\x5f\x70\
-\xe3\xd9\xec\xa8\x18\xc4\x70\x5b\xf3\xfd\x5f\x61\x6f\x42\x4e\x63\
-\x76\x13\x75\x72\x72\x22\x69\x6d\x7e\xcc\x2c\xba\x64\xd2\xae\x42\
-\x47\x47\x47\x92\x16\x3f\x6d\x16\x5d\x0c\x73\xeb\x12\xdb\x6d\xf8\
-\xc7\xcd\xc2\x61\x78\x67\x67\x47\xc4\x3a\x19\xfe\x15\x66\x61\x19\
-\x76\xdf\x36\x72\xce\xf1\xf4\xf4\x24\xba\xbf\x5f\x63\x16\xae\x0c\
-\x53\xfa\xcf\x1a\xb3\x2e\xf0\xf0\xdb\xcc\xa2\xc3\x1a\xa6\x94\x62\
-\x76\x76\x16\xf8\xc9\x3a\x3b\x08\x7f\x01\x5f\xfe\x7d\x57\xad\x6b\
-\xb2\x07\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x04\x99\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x1e\x00\x00\x00\x1e\x08\x06\x00\x00\x00\x3b\x30\xae\xa2\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x04\x2e\x49\x44\x41\x54\x48\x4b\xb5\x96\x5b\x73\
-\x9b\x3c\x10\x86\x1f\x49\x80\x39\x98\x83\x1b\x3b\xa7\x99\xfe\xff\
-\xdf\xe4\xdb\x36\xd3\xc9\x01\xb7\x80\x31\x60\x40\xe8\xbb\xa8\x61\
-\x1c\x27\x76\xd3\x4c\xbf\x67\x46\x37\x1e\x59\x2f\xbb\x5a\xbd\xbb\
-\x62\xbd\x5e\x1b\x4e\x30\xe6\xf7\x4f\xc3\x30\xbc\x5a\xc6\x18\xa4\
-\x94\x08\x21\x10\x42\x20\xa5\x44\x29\x85\x10\xe2\xf4\x88\x3f\x22\
-\x8e\x85\x8d\x31\x68\xad\xd9\xef\xf7\x34\x4d\x43\x55\x55\xd4\x75\
-\x4d\xdb\xb6\x68\xad\x19\x86\x01\xa5\x14\x52\x4a\x2c\xcb\xc2\xf3\
-\x3c\x82\x20\xc0\xf7\x7d\x1c\xc7\xf9\xab\x8f\x98\x84\x8d\x31\xb4\
-\x6d\x4b\x51\x14\x64\x59\x46\x59\x96\xb4\x6d\x0b\x80\x94\x72\x8a\
-\x94\x93\x4c\xcc\x66\x33\xc2\x30\x24\x49\x12\xc2\x30\xc4\x71\x9c\
-\x0f\x89\x8b\xf5\x7a\x6d\x46\xd1\x9f\x3f\x7f\x92\xa6\x29\x55\x55\
-\xa1\x94\xc2\xf3\x3c\x7c\xdf\xc7\x75\x5d\x2c\xcb\x42\x08\x81\x31\
-\x86\xbe\xef\xd1\x5a\x53\x96\x25\x65\x59\xa2\xb5\x26\x08\x02\x56\
-\xab\x15\x49\x92\x7c\x48\x5c\xac\xd7\x6b\xd3\x75\x1d\x59\x96\xf1\
-\xf8\xf8\xc8\x6e\xb7\xc3\xf7\x7d\x16\x8b\x05\x61\x18\xbe\x12\x1d\
-\x19\x86\x01\x80\xa6\x69\xc8\xb2\x8c\x34\x4d\x69\x9a\x86\x30\x0c\
-\xb9\xb9\xb9\x21\x49\x12\x6c\xdb\x3e\x92\x79\x8b\x1c\xa3\xcd\xf3\
-\x9c\xaa\xaa\xf0\x3c\x8f\xd5\x6a\xc5\x72\xb9\x7c\x25\xac\x94\x9a\
-\x96\x6d\xdb\xd8\xb6\xcd\x7c\x3e\x67\xb9\x5c\xb2\x5c\x2e\x71\x1c\
-\x87\xed\x76\xcb\xaf\x5f\xbf\x68\x9a\x66\xfa\xb8\x73\x48\x80\xba\
-\xae\x29\x8a\x02\x29\x25\x8b\xc5\x82\x24\x49\x70\x5d\x17\xa5\xd4\
-\xe9\xfe\x57\x08\x21\x70\x5d\x97\x2f\x5f\xbe\x10\xc7\x31\x00\xdb\
-\xed\x76\x4a\xff\x25\xa4\xd6\x9a\xdd\x6e\x47\xd7\x75\x04\x41\x40\
-\x14\x45\x1f\xba\xa3\x11\x21\x04\xb3\xd9\x8c\x24\x49\xf0\x7d\x9f\
-\xb6\x6d\xa7\xc2\x1c\x9f\xe5\x7b\x48\xad\x35\x55\x55\x21\xa5\x64\
-\x3e\x9f\xe3\x79\xde\x1f\x23\x3d\x45\x29\x45\x10\x04\x84\x61\x88\
-\x10\x82\xaa\xaa\xd8\xef\xf7\x17\xd3\x2d\xc7\x77\x3b\x56\xf1\xdf\
-\x8a\x72\x88\xda\xb6\x6d\x7c\xdf\xc7\xb2\x2c\x9a\xa6\xa1\xae\xeb\
-\x8b\xe9\x96\x7d\xdf\xd3\xf7\x3d\x96\x65\x61\xdb\x36\x52\xca\xd3\
-\x3d\x1f\x42\x4a\x89\xe3\x38\x58\x96\x85\xd6\x9a\xb6\x6d\x27\xb7\
-\x7b\x0f\x69\x8c\x99\xac\xf0\xd8\x24\xfe\x16\x21\xc4\x54\xf5\xc6\
-\x98\x8b\xa2\x8c\xc2\x1c\x9c\xeb\xd2\xc6\x8f\x30\x9e\x31\x7e\xfc\
-\xa5\x20\xe4\xf8\x46\x8f\x1b\xc1\x67\x18\x86\x61\x72\x34\x21\xc4\
-\x1b\xd3\x39\x45\x8e\x86\xa0\xb5\xa6\xeb\xba\x4f\x0b\x1b\x63\xe8\
-\xba\x8e\xbe\xef\x91\x52\x4e\xf5\x72\x4e\x5c\x2a\xa5\x70\x1c\x87\
-\xbe\xef\xa9\xaa\xea\x53\xe2\xa3\xfb\x8d\x7e\xe0\x38\x0e\x8e\xe3\
-\x5c\x2c\x54\xa9\x94\x62\x3e\x9f\x23\x84\xa0\x28\x0a\xb6\xdb\x2d\
-\x7d\xdf\x9f\xee\xbb\x48\xd7\x75\xe4\x79\x4e\x9e\xe7\x48\x29\x89\
-\xa2\x08\xdf\xf7\x2f\x0b\x4b\x29\x09\x82\x00\xcf\xf3\xa8\xeb\x9a\
-\x34\x4d\xd9\x6e\xb7\x1f\x8e\x7c\x6c\x30\x2f\x2f\x2f\x34\x4d\x83\
-\xef\xfb\xc4\x71\xcc\x6c\x36\x3b\x9b\x66\x00\x29\x84\xc0\xf3\x3c\
-\x92\x24\xc1\xb2\x2c\xf2\x3c\xe7\xf1\xf1\x91\xcd\x66\x33\xa5\x7e\
-\x2c\xba\xd3\xd5\xb6\x2d\x59\x96\xf1\xf4\xf4\x44\x9e\xe7\x18\x63\
-\x70\x5d\x17\xd7\x75\x2f\x8a\x32\xb6\xc5\x61\x18\xa8\xaa\x8a\xe7\
-\xe7\x67\xd2\x34\xa5\xef\x7b\x5c\xd7\x65\x3e\x9f\x4f\x36\x6a\xdb\
-\xf6\x74\x98\x39\xf4\xe4\xb2\x2c\xd9\x6c\x36\x94\x65\x39\x15\x55\
-\x1c\xc7\xdc\xde\xde\x12\xc7\xf1\x45\xcf\x9f\x26\x90\xb1\xb1\x6f\
-\x36\x9b\xa9\xb5\x01\xd8\xb6\xcd\x6c\x36\x7b\xe5\x6a\x5a\x6b\xfa\
-\xbe\x67\xbf\xdf\x63\x8c\x99\xc6\x9e\xa6\x69\xe8\xfb\x9e\x28\x8a\
-\xb8\xbe\xbe\x9e\xfa\xf2\x7b\xe2\xaf\x66\x2e\xad\x35\x4d\xd3\x50\
-\x14\x05\x45\x51\x50\x96\xe5\x64\xf6\xc7\xa6\x30\x2e\xdb\xb6\x49\
-\x92\x84\x28\x8a\x90\x52\x92\xe7\xf9\x94\xb1\x30\x0c\xb9\xbd\xbd\
-\x3d\x3b\x14\xbc\x12\xe6\x60\x04\x63\xe3\xa8\xeb\x7a\xea\x34\xa3\
-\xe1\x8f\xef\xfe\x78\xd8\x1b\x0f\xae\xeb\x7a\xba\xae\xae\xeb\x88\
-\xe3\x98\xbb\xbb\x3b\x16\x8b\xc5\x9b\xe6\xf3\x46\x78\xc4\x1c\xfc\
-\x76\x74\xa3\x63\x2b\x54\x87\x49\xf3\xd4\xdf\x87\x61\x60\xb7\xdb\
-\xf1\xf2\xf2\x42\x9a\xa6\xb4\x6d\x4b\x14\x45\xdc\xdf\xdf\x4f\xc5\
-\x3b\x72\x56\x78\xe4\xdc\x93\x7a\xef\xde\x38\x88\x57\x55\x45\x9a\
-\xa6\x3c\x3d\x3d\xd1\xb6\x2d\x61\x18\x72\x77\x77\xc7\xd5\xd5\xd5\
-\x24\x7e\xfe\x85\x1f\x38\xbe\xd3\xe3\x75\x0e\x29\x25\xbe\xef\x73\
-\x7d\x7d\xcd\x6a\xb5\x42\x29\x45\x96\x65\x7c\xff\xfe\x9d\xe7\xe7\
-\xe7\x69\x38\xf8\xa3\xf0\x67\x90\x52\xe2\x79\x1e\x37\x37\x37\x2c\
-\x97\x4b\x94\x52\x14\x45\xc1\xb7\x6f\xdf\xf8\xf1\xe3\xc7\xef\x3d\
-\xa7\x7f\xfa\x57\x08\x21\xf0\x7d\x9f\xfb\xfb\x7b\xae\xae\xae\x90\
-\x52\xb2\xdb\xed\x78\x78\x78\xc0\x18\xf3\xff\x09\x73\x10\x0f\x82\
-\x80\xaf\x5f\xbf\x12\xc7\xf1\x94\x09\x3e\x52\x5c\xff\x8a\xe3\x22\
-\x15\x42\xf0\x1f\xc8\x51\xa4\x75\x46\x07\x17\x4e\x00\x00\x00\x00\
-\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0b\x3b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xc5\xc3\xc9\x5b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0a\xd0\x49\x44\x41\x54\x58\x47\xad\x99\x5b\x4f\
-\x1b\x57\x17\x86\x1f\x7b\x7c\x36\x60\x8c\x8d\xc1\x80\x81\xd4\x1c\
-\x6a\x50\x02\x15\x21\x52\x02\xa5\x24\x85\x22\x9a\xb6\x37\x3d\x5c\
-\xf4\xa2\xaa\xa2\xfe\x90\x5e\xa7\xbf\x20\x8a\xda\x46\x6d\x25\xa2\
-\x4a\x51\x1b\x55\xad\x68\x44\x48\x22\x92\xa6\xd4\x40\x92\x96\xa3\
-\x43\xc0\x98\x33\x36\x60\x30\x36\xc6\x1e\x7b\xbe\x8b\x2f\x1e\x61\
-\x6c\x02\x89\xf2\x4a\xfb\x66\x66\xed\xed\x77\xef\xf5\xae\xc3\x1e\
-\x2b\x1e\x3d\x7a\x24\xed\xed\xed\x11\x0c\x06\x89\x44\x22\x24\x93\
-\x49\x5e\x27\x34\x1a\x0d\x26\x93\x09\xa3\xd1\x88\x20\x08\x07\x5f\
-\x1f\x1b\x8a\xdb\xb7\x6f\x4b\x4f\x9e\x3c\x61\x74\x74\x94\x8d\x8d\
-\x8d\xd7\x4e\x54\xa7\xd3\x51\x5b\x5b\xcb\xe9\xd3\xa7\x29\x29\x29\
-\x41\xa5\x52\x1d\x34\x39\x16\x14\x57\xaf\x5e\x95\x7e\xf8\xe1\x07\
-\x66\x66\x66\xc8\xcd\xcd\x45\xab\xd5\xa2\x50\x28\x0e\xda\xbd\x34\
-\x12\x89\x04\x5b\x5b\x5b\x6c\x6e\x6e\x52\x54\x54\x44\x57\x57\x17\
-\x1d\x1d\x1d\x94\x95\x95\xbd\x12\x59\xc5\x37\xdf\x7c\x23\x7d\xf7\
-\xdd\x77\xe4\xe5\xe5\xd1\xd6\xd6\x86\xd5\x6a\x3d\x68\xf3\x4a\x88\
-\x44\x22\x0c\x0f\x0f\x73\xff\xfe\x7d\x42\xa1\x10\xe5\xe5\xe5\x74\
-\x77\x77\xd3\xd1\xd1\x81\xc3\xe1\x78\x69\xb2\x42\x67\x67\xe7\xd7\
-\x93\x93\x93\xb8\x5c\x2e\xba\xbb\xbb\x79\xe3\x8d\x37\x30\x99\x4c\
-\x94\x95\x95\x51\x5d\x5d\x4d\x49\x49\x09\x7a\xbd\x1e\xad\x56\x8b\
-\xd1\x68\x24\x27\x27\xe7\x85\xc3\x66\xb3\xe1\x74\x3a\x29\x2d\x2d\
-\x65\x7d\x7d\x9d\xe9\xe9\x69\x00\xe2\xf1\x38\xcb\xcb\xcb\x00\x58\
-\xad\x56\x72\x73\x73\x51\x2a\x95\x07\xe8\x1c\x0e\x15\x80\x20\x08\
-\x68\x34\x1a\x04\x41\x60\x7e\x7e\x9e\xa1\xa1\x21\xca\xca\xca\x38\
-\x73\xe6\x0c\x7e\xbf\x9f\x3b\x77\xee\xe0\xf5\x7a\x89\xc7\xe3\x07\
-\xe7\x67\xa0\xb8\xb8\x98\x96\x96\x16\x1c\x0e\x87\xbc\x6e\x4d\x4d\
-\x0d\x36\x9b\x8d\xa9\xa9\x29\xfa\xfa\xfa\x00\xe8\xec\xec\x7c\xa9\
-\x93\x95\xb7\x94\xd2\xe5\xf6\xf6\x36\x0b\x0b\x0b\x04\x02\x01\x44\
-\x51\x64\x77\x77\x97\x85\x85\x05\x26\x26\x26\x18\x1b\x1b\x7b\xe1\
-\x98\x98\x98\xc0\xeb\xf5\xb2\xb5\xb5\x25\x07\xa5\x24\x49\x14\x14\
-\x14\xd0\xdc\xdc\x4c\x63\x63\x23\xe1\x70\x98\x5b\xb7\x6e\x71\xeb\
-\xd6\x2d\x7c\x3e\xdf\xb1\x36\x4f\xea\x44\x53\x10\x04\x01\xa7\xd3\
-\x89\x56\xab\xc5\x6c\x36\x93\x93\x93\x43\x59\x59\x19\xef\xbd\xf7\
-\x1e\x35\x35\x35\xec\xed\xed\xed\x37\xcf\x80\x52\xa9\xc4\x6e\xb7\
-\x53\x57\x57\x87\x4e\xa7\x83\xe7\x41\xe5\xf5\x7a\x31\x18\x0c\x6c\
-\x6f\x6f\x93\x4c\x26\x99\x9f\x9f\xa7\xb7\xb7\x17\x8d\x46\x43\x77\
-\x77\x37\x36\x9b\xed\x48\x19\x28\x2e\x5f\xbe\x2c\xfd\xfc\xf3\xcf\
-\x34\x36\x36\xf2\xc9\x27\x9f\x60\x36\x9b\x89\xc5\x62\xa8\x54\x2a\
-\x34\x1a\x0d\x89\x44\x82\x9d\x9d\x1d\x22\x91\x08\x89\x44\xe2\xe0\
-\xfc\x0c\xe8\x74\x3a\xf2\xf2\xf2\x10\x45\x91\xfe\xfe\x7e\x6e\xdc\
-\xb8\xc1\xda\xda\x1a\x2a\x95\x0a\x49\x92\x88\xc7\xe3\x44\xa3\x51\
-\xa2\xd1\x28\x67\xcf\x9e\xe5\xd2\xa5\x4b\xb8\x5c\x2e\xd4\x6a\xf5\
-\xc1\xa5\xd2\x90\x76\xa2\xc9\x64\x12\x9f\xcf\xc7\xe4\xe4\x24\x45\
-\x45\x45\xb8\x5c\x2e\x82\xc1\x20\x43\x43\x43\x2c\x2d\x2d\x21\x8a\
-\xe2\x7e\xf3\xac\xb0\x5a\xad\x34\x34\x34\x50\x59\x59\x49\x7d\x7d\
-\x3d\x89\x44\x82\x60\x30\x88\x24\x49\xb2\xcd\xcc\xcc\x0c\x83\x83\
-\x83\xc4\xe3\x71\xe2\xf1\x78\xda\xbb\xc3\x90\x46\x54\x92\x24\x96\
-\x97\x97\x19\x1c\x1c\xa4\xa6\xa6\x86\x13\x27\x4e\x10\x08\x04\x70\
-\xbb\xdd\x4c\x4d\x4d\x11\x8b\xc5\xf6\x9b\x67\x45\x79\x79\x39\x66\
-\xb3\x19\x87\xc3\x41\x65\x65\x25\xa5\xa5\xa5\x19\x44\x06\x06\x06\
-\x98\x9e\x9e\x46\xa1\x50\x64\xbc\x3b\x0c\x19\x1a\xad\xac\xac\xe4\
-\xdd\x77\xdf\xc5\x6a\xb5\x62\x30\x18\x28\x2e\x2e\xe6\x9d\x77\xde\
-\xa1\xb6\xb6\xf6\x58\x27\x6a\xb1\x58\xa8\xaa\xaa\x42\xab\xd5\x22\
-\x08\x42\xd6\xb2\xa9\xd5\x6a\x8f\xd4\xe4\x41\x64\x68\xd4\x6a\xb5\
-\x92\x48\x24\x50\x2a\x95\x08\x82\x20\xeb\xea\xb8\xa5\x35\x35\x4f\
-\x10\x84\x43\x2b\xdc\xbd\x7b\xf7\xb8\x72\xe5\x0a\x05\x05\x05\x7c\
-\xf9\xe5\x97\x9c\x3a\x75\x0a\x8d\x46\x73\xd0\x2c\x0d\x19\xae\x5f\
-\x5d\x5d\x65\x7e\x7e\x9e\xfc\xfc\x7c\xca\xcb\xcb\x09\x87\xc3\x78\
-\x3c\x1e\x02\x81\xc0\xb1\x82\xc9\x64\x32\xe1\x74\x3a\xb1\xdb\xed\
-\x47\xfe\xf8\xcb\x20\x23\x98\xa6\xa7\xa7\xf9\xf3\xcf\x3f\xa9\xad\
-\xad\xc5\x62\xb1\xe0\xf3\xf9\xb8\x71\xe3\x06\x4f\x9e\x3c\x39\x32\
-\x3d\x01\x54\x55\x55\xf1\xf1\xc7\x1f\x63\x36\x9b\x5f\x2b\x51\xa1\
-\xb3\xb3\xf3\xeb\xb1\xb1\x31\x8a\x8b\x8b\xa9\xab\xab\x93\x5d\xe6\
-\x70\x38\x28\x2b\x2b\x93\x5d\x6f\xb1\x58\xa8\xac\xac\xc4\xe9\x74\
-\xbe\x70\xd4\xd6\xd6\xf2\xe6\x9b\x6f\x52\x54\x54\x74\x68\xca\x99\
-\x9b\x9b\x63\x78\x78\x18\xbd\x5e\x4f\x63\x63\x23\x45\x45\x45\x59\
-\xb5\xbc\x1f\x19\x1a\xb5\x58\x2c\x88\xa2\x88\x52\xa9\x44\xad\x56\
-\x93\x4c\x26\x89\xc5\x62\xc7\x72\x3b\xcf\x35\xaa\x56\xab\x51\xa9\
-\x54\xaf\x55\xa3\x19\xa1\x17\x0a\x85\xf0\xf9\x7c\x04\x02\x01\xe2\
-\xf1\x38\xe1\x70\x98\xd9\xd9\x59\xfe\xfd\xf7\x5f\x1e\x3d\x7a\x94\
-\x31\xbc\x5e\x2f\x89\x44\x02\x83\xc1\x40\x4e\x4e\x0e\x06\x83\x01\
-\xb5\x5a\x7d\x28\xc9\x57\x85\x8a\x7d\x91\x2a\x49\x12\x1e\x8f\x87\
-\xbb\x77\xef\xe2\x74\x3a\xb9\x70\xe1\x02\x4b\x4b\x4b\xdc\xbc\x79\
-\x13\x8f\xc7\x93\x91\x47\x15\x0a\x05\x2e\x97\x8b\x0f\x3f\xfc\x10\
-\x97\xcb\x85\x56\xab\x4d\x7b\x7f\x14\xa2\xd1\x28\x8b\x8b\x8b\x48\
-\x92\x84\x42\xa1\x20\x3f\x3f\x9f\xe2\xe2\x62\x0c\x06\x43\x46\xfa\
-\x12\x3e\xff\xfc\xf3\xaf\x25\x49\xa2\xba\xba\x1a\x87\xc3\x41\x28\
-\x14\x22\x10\x08\x60\xb5\x5a\x29\x2f\x2f\x67\x77\x77\x97\xc5\xc5\
-\x45\x44\x51\x94\x4f\x6d\xff\xb0\xdb\xed\x38\x9d\x4e\x2c\x16\xcb\
-\xb1\x3b\xa1\x94\x46\x03\x81\x00\x7e\xbf\x9f\xc7\x8f\x1f\xe3\x76\
-\xbb\x99\x99\x99\x41\x14\x45\x4c\x26\x13\x7a\xbd\x3e\x8d\xac\x62\
-\x60\x60\x40\x0a\x87\xc3\x18\x0c\x06\x8c\x46\x23\xd1\x68\x94\x70\
-\x38\x2c\xf7\x9f\xf1\x78\x9c\xf5\xf5\x75\xc2\xe1\x70\xd6\x5c\xaa\
-\xd5\x6a\x11\x45\x91\x8d\x8d\x8d\xb4\x13\x37\x1a\x8d\x94\x94\x94\
-\x60\xb5\x5a\x33\x36\x90\xd2\xe8\xcc\xcc\x0c\x26\x93\x89\xa2\xa2\
-\x22\x94\x4a\x25\xc1\x60\x10\x8b\xc5\xc2\x07\x1f\x7c\x40\x7b\x7b\
-\x3b\xf9\xf9\xf9\xb2\x84\x54\x92\x24\x91\x4c\x26\xe5\x52\xa6\xd7\
-\xeb\xd1\xeb\xf5\xf0\xdc\xb5\xa9\x8e\xe8\xb0\x52\xe7\xf7\xfb\xe9\
-\xef\xef\x67\x60\x60\x80\x60\x30\x28\x3f\xb7\xd9\x6c\x74\x74\x74\
-\xf0\xf6\xdb\x6f\x93\x9f\x9f\x9f\x36\x27\x05\x93\xc9\x44\x73\x73\
-\x33\x67\xcf\x9e\x45\xaf\xd7\xe3\x76\xbb\xf9\xfb\xef\xbf\x71\xbb\
-\xdd\x54\x57\x57\x93\x93\x93\x23\x67\x0e\xa5\xd7\xeb\xa5\xaf\xaf\
-\x8f\xd1\xd1\x51\x76\x77\x77\x51\x28\x14\xf2\x60\x1f\xd9\x54\xb5\
-\x39\x38\x76\x76\x76\x98\x9d\x9d\x95\xfb\xd0\x78\x3c\xce\xe6\xe6\
-\x26\x4f\x9f\x3e\xc5\xeb\xf5\x1e\x9a\x7b\x15\x0a\x05\x76\xbb\x9d\
-\x96\x96\x16\x5a\x5a\x5a\x68\x6d\x6d\xa5\xb5\xb5\x15\x9b\xcd\x46\
-\x20\x10\x60\x65\x65\x25\xcd\x43\xca\xb5\xb5\x35\x06\x07\x07\x19\
-\x1f\x1f\x27\x12\x89\xa4\x2d\x96\x0d\xb1\x58\x8c\xb5\xb5\x35\x9e\
-\x3e\x7d\xca\xc4\xc4\x04\xcf\x9e\x3d\x23\x10\x08\xa0\xd3\xe9\x38\
-\x7d\xfa\x34\x17\x2f\x5e\xe4\xe4\xc9\x93\xa8\xd5\x6a\x44\x51\xcc\
-\xea\x09\x8d\x46\x83\x5e\xaf\x47\xa5\x52\xa1\x52\xa9\x50\xab\xd5\
-\xf2\x10\x04\x81\x64\x32\x99\x31\x57\x99\x4c\x26\xd9\xdb\xdb\x63\
-\x6f\x6f\x2f\xab\x06\x0f\x22\xe5\xea\x9f\x7e\xfa\x89\xef\xbf\xff\
-\x9e\x5f\x7f\xfd\x15\x8f\xc7\x83\x20\x08\x54\x55\x55\xd1\xd4\xd4\
-\x44\x45\x45\x85\x9c\x01\xb2\x11\x4d\x05\xea\xf6\xf6\x36\x23\x23\
-\x23\x3c\x7e\xfc\x98\x91\x91\x11\x86\x87\x87\x59\x5d\x5d\xc5\x64\
-\x32\x61\xb3\xd9\xd2\x72\x6b\x46\x1e\x3d\x0a\x6b\x6b\x6b\xb8\xdd\
-\x6e\x06\x07\x07\x99\x9e\x9e\x26\x10\x08\x10\x8d\x46\x91\x24\x09\
-\x41\x10\xe4\x53\x79\x11\x0a\x0a\x0a\xe4\x8c\x72\xf7\xee\x5d\x7e\
-\xfc\xf1\x47\xbe\xfd\xf6\x5b\x7a\x7b\x7b\x09\x85\x42\x14\x17\x17\
-\x53\x58\x58\x98\x56\xd9\x8e\x24\x9a\xea\xf0\xd7\xd7\xd7\xf1\xfb\
-\xfd\x6c\x6c\x6c\x10\x0a\x85\xc8\xcb\xcb\xa3\xa5\xa5\x85\xce\xce\
-\x4e\x9c\x4e\xe7\x91\x95\x25\x85\x68\x34\x8a\xcf\xe7\xc3\xe7\xf3\
-\x11\x89\x44\xd8\xd8\xd8\x60\x6a\x6a\x8a\xc9\xc9\x49\x56\x57\x57\
-\x89\x46\xa3\x2c\x2d\x2d\x31\x33\x33\xc3\xce\xce\x8e\x3c\xef\xc8\
-\xc4\xb7\xbc\xbc\x9c\xd6\xe1\xaf\xac\xac\xb0\xb4\xb4\x84\xd5\x6a\
-\xa5\xae\xae\x0e\x8b\xc5\xc2\xc2\xc2\x02\xd1\x68\xf4\xe0\xd4\x0c\
-\x88\xa2\xc8\xf4\xf4\x34\xbf\xfd\xf6\x1b\x0f\x1f\x3e\x24\x2f\x2f\
-\x8f\xa6\xa6\x26\xec\x76\x3b\x82\x20\xe0\xf7\xfb\xf1\x78\x3c\x8c\
-\x8e\x8e\x22\x08\x02\x5a\xad\x96\x86\x86\x86\xff\xeb\xf9\xe0\x62\
-\x07\x31\x3b\x3b\xcb\xcd\x9b\x37\x99\x9b\x9b\x43\xa7\xd3\x21\x8a\
-\x22\xa1\x50\x48\x4e\xf0\x6a\xb5\x3a\xa3\x8a\x1c\x86\xcd\xcd\x4d\
-\xdc\x6e\x37\x8f\x1e\x3d\x22\x2f\x2f\x8f\xae\xae\x2e\xda\xda\xda\
-\xe4\x3c\xba\xb1\xb1\xc1\x5f\x7f\xfd\x45\x6f\x6f\x2f\x13\x13\x13\
-\x3c\x7c\xf8\x90\xf2\xf2\x72\x74\x3a\x5d\xa6\xeb\xe3\xf1\x38\xdb\
-\xdb\xdb\x72\xd5\x48\xb9\xdb\x64\x32\xd1\xda\xda\xca\xb9\x73\xe7\
-\xb0\xd9\x6c\x47\xea\x30\x1b\x96\x97\x97\x19\x1b\x1b\x03\xe0\xdc\
-\xb9\x73\x5c\xb8\x70\x81\xca\xca\x4a\x72\x73\x73\x31\x1a\x8d\x94\
-\x96\x96\x72\xfe\xfc\x79\xce\x9f\x3f\x8f\x46\xa3\x61\x71\x71\x51\
-\xbe\x7a\xa7\x11\x4d\x26\x93\x78\xbd\x5e\x7e\xff\xfd\x77\x7a\x7a\
-\x7a\xe8\xe9\xe9\xe1\xfe\xfd\xfb\x6c\x6d\x6d\x61\xb7\xdb\xe9\xec\
-\xec\xa4\xbd\xbd\x5d\x76\xd5\xcb\x22\x18\x0c\xb2\xb2\xb2\x82\xc5\
-\x62\xe1\xd4\xa9\x53\xd8\x6c\xb6\xb4\xaa\xa5\x54\x2a\xb1\x5a\xad\
-\xb8\x5c\x2e\xb9\xc5\xdc\xdd\xdd\xcd\x24\x1a\x8b\xc5\x98\x98\x98\
-\xe0\x97\x5f\x7e\xa1\xa7\xa7\x87\xeb\xd7\xaf\xf3\xe0\xc1\x03\xb6\
-\xb7\xb7\x65\xcd\xa4\xee\x42\xfb\xbb\xa3\xe3\x76\x4a\xb1\x58\x8c\
-\x48\x24\x82\x5e\xaf\xc7\x62\xb1\x64\x0d\x40\xa5\x52\x89\xc9\x64\
-\xc2\x6a\xb5\x22\x08\x02\xa2\x28\x66\x12\x15\x45\x91\x48\x24\xc2\
-\xee\xee\x2e\x85\x85\x85\xb4\xb6\xb6\xf2\xd6\x5b\x6f\x91\x9b\x9b\
-\xbb\xdf\xec\x95\x21\x49\x52\x5a\x1a\x3b\x6c\x83\x29\xed\xf3\xdc\
-\xcb\x1c\x16\xf5\x82\x20\x50\x57\x57\xc7\x17\x5f\x7c\xc1\xb3\x67\
-\xcf\xf0\xfb\xfd\x87\x2e\xfa\x2a\x58\x59\x59\xe1\xce\x9d\x3b\x8c\
-\x8f\x8f\x67\x0d\x44\xbf\xdf\xcf\xec\xec\x2c\x46\xa3\x51\x7e\x96\
-\x95\x68\x32\x99\x64\x69\x69\x89\x07\x0f\x1e\xb0\xba\xba\xca\xce\
-\xce\x0e\x2b\x2b\x2b\xdc\xbb\x77\x8f\xbd\xbd\x3d\x56\x57\x57\x49\
-\x24\x12\xfc\xf3\xcf\x3f\xe4\xe4\xe4\x30\x37\x37\xc7\xe6\xe6\x26\
-\xff\xfd\xf7\x1f\x5b\x5b\x5b\x4c\x4d\x4d\x65\x4d\x57\xa9\xaf\x2f\
-\xb3\xb3\xb3\xcc\xcf\xcf\x67\x25\xc9\xf3\xdf\x8f\xc7\xe3\x34\x35\
-\x35\xc9\x32\xcb\xb8\xd7\x6b\x34\x1a\x94\x4a\x25\xe3\xe3\xe3\x4c\
-\x4f\x4f\x93\x48\x24\x88\xc5\x62\xac\xaf\xaf\xb3\xb0\xb0\x00\xcf\
-\xb5\xc6\xf3\x93\x51\x28\x14\xb2\x8e\xfc\x7e\xbf\xac\x2b\xb3\xd9\
-\x8c\x4e\xa7\x4b\x0b\x3a\x87\xc3\x41\x57\x57\x17\x23\x23\x23\x8c\
-\x8d\x8d\xa1\xd5\x6a\xa9\xa9\xa9\xa1\xa0\xa0\x20\x2b\x69\xa7\xd3\
-\x29\xdf\xa7\xd2\x88\x6a\x34\x1a\x9c\x4e\x27\x6d\x6d\x6d\xcc\xcf\
-\xcf\x1f\xfb\x9e\x94\x0d\x76\xbb\x9d\x93\x27\x4f\x62\x30\x18\xe4\
-\x67\x27\x4e\x9c\xa0\xb4\xb4\x94\xd2\xd2\x52\x02\x81\x00\xf9\xf9\
-\xf9\x7c\xfa\xe9\xa7\xd4\xd7\xd7\x67\x0d\xac\xd4\xc1\x09\x82\xf0\
-\xff\xcb\xdd\xf5\xeb\xd7\x69\x68\x68\xe0\xb3\xcf\x3e\xc3\x6c\x36\
-\xb3\xb9\xb9\x29\x7f\x79\x7b\x55\xe4\xe4\xe4\x60\xb1\x58\xd0\xe9\
-\x74\x69\xfa\x96\x24\x89\xfe\xfe\x7e\xae\x5c\xb9\x82\xcd\x66\xe3\
-\xd2\xa5\x4b\x72\xb7\xf5\x22\x28\x2e\x5f\xbe\x2c\x5d\xbb\x76\x0d\
-\xab\xd5\x4a\x7b\x7b\x3b\x16\x8b\x45\x8e\xce\x97\x81\xc9\x64\xc2\
-\xe1\x70\x90\x9b\x9b\xcb\xfa\xfa\x3a\x8b\x8b\x8b\x59\x75\x2a\x8a\
-\x22\x23\x23\x23\xf4\xf5\xf5\x51\x5f\x5f\xcf\x57\x5f\x7d\x45\x75\
-\x75\xf5\x91\x79\x59\x71\xf5\xea\x55\xe9\xda\xb5\x6b\x78\x3c\x1e\
-\x8c\x46\xe3\x2b\xff\xd9\xe0\x74\x3a\xb9\x78\xf1\x22\x35\x35\x35\
-\x0c\x0f\x0f\xf3\xc7\x1f\x7f\xb0\xb6\xb6\x96\xb1\x61\x51\x14\xd9\
-\xd9\xd9\xc1\x60\x30\xf0\xfe\xfb\xef\xf3\xd1\x47\x1f\x51\x58\x58\
-\x98\x66\x93\x0d\x8a\xdb\xb7\x6f\x4b\x43\x43\x43\x8c\x8e\x8e\x12\
-\x89\x44\x5e\x89\x24\xcf\xaf\x1e\xcd\xcd\xcd\x38\x1c\x0e\x3c\x1e\
-\x0f\xc3\xc3\xc3\x6c\x6d\x6d\x1d\x34\x93\xf3\x68\x45\x45\x05\x67\
-\xce\x9c\xa1\xa2\xa2\xe2\x48\xb7\x03\x28\x86\x87\x87\xa5\x78\x3c\
-\x9e\xd1\x51\xbf\x2c\x52\x1f\x1e\x52\x51\x7f\xd4\x77\xcf\x54\x52\
-\x3f\xca\xe5\x29\xfc\x0f\x58\xf4\x26\x92\x66\x8b\x44\xc0\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0d\x8f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xc5\xc3\xc9\x5b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0d\x24\x49\x44\x41\x54\x58\x47\xa5\x98\xdb\x53\
-\x53\xe7\xf7\xc6\x3f\xd9\x39\x43\x02\x84\x70\x48\xc2\x51\x40\x09\
-\x22\x50\x40\x10\x04\x15\x45\xa7\xe3\x54\x1d\xea\x38\xd3\x5e\x75\
-\x7a\xd9\x3f\xe3\xf7\x97\xf4\xb2\x37\xb5\x63\xeb\x54\xb4\x03\x5a\
-\x6d\x3d\xa3\x48\x04\xe4\x50\xc2\x21\x02\x39\x10\x20\x04\x48\xb2\
-\x93\xec\x9d\xdf\x05\x64\x97\x00\x5a\xdb\xef\x33\x93\x8b\xcc\xbc\
-\xfb\xdd\xcf\x5e\xef\x5a\xcf\x7a\xd6\xab\x7a\xf3\xe6\x4d\x8a\xff\
-\x00\x59\x96\x49\x26\x93\xc4\xe3\x71\x12\x89\x04\xa2\x28\x92\x4c\
-\x26\x91\x65\x59\x59\xa3\x56\xab\xd1\xeb\xf5\xe8\xf5\x7a\x0c\x06\
-\x03\x1a\x8d\x06\x95\x4a\x95\xb1\xcf\xa7\x42\xf5\x6f\x89\x4a\x92\
-\x44\x34\x1a\x25\x18\x0c\xe2\xf1\x78\xf0\x78\x3c\x2c\x2c\x2c\xe0\
-\x76\xbb\xf1\xfb\xfd\x88\xa2\x48\x2a\xb5\xb3\xa5\xc5\x62\xa1\xba\
-\xba\x1a\xa7\xd3\x49\x5d\x5d\x1d\x0e\x87\x03\x93\xc9\x44\x76\x76\
-\x36\x3a\x9d\xee\x5f\x91\xfe\x64\xa2\x69\x82\x1e\x8f\x87\x57\xaf\
-\x5e\xf1\xe4\xc9\x13\xe6\xe6\xe6\x88\x44\x22\x00\x08\x82\x80\x4a\
-\xa5\x42\xa5\x52\x91\x4a\xa5\x32\x22\xab\x52\xa9\xd0\x6a\xb5\x14\
-\x15\x15\x71\xe2\xc4\x09\x3a\x3b\x3b\xa9\xaf\xaf\x27\x3f\x3f\xff\
-\x93\xa3\xfc\x8f\x44\x53\xa9\x14\xa2\x28\xb2\xb4\xb4\xc4\xe3\xc7\
-\x8f\x79\xf4\xe8\x11\x73\x73\x73\x88\xa2\x88\x4e\xa7\xc3\x60\x30\
-\x50\x54\x54\x44\x55\x55\x15\xc5\xc5\xc5\xe8\x74\x3a\x12\x89\x04\
-\x91\x48\x84\xed\xed\x6d\x82\xc1\x20\x5e\xaf\x97\xb5\xb5\x35\xe5\
-\xa3\x0a\x0b\x0b\xe9\xee\xee\xe6\xc2\x85\x0b\xd4\xd4\xd4\x60\x32\
-\x99\x50\xab\xd5\xfb\x5f\x9d\x81\x8f\x12\x95\x65\x99\x8d\x8d\x0d\
-\x86\x86\x86\xe8\xef\xef\x67\x74\x74\x94\x58\x2c\x86\xd1\x68\xa4\
-\xba\xba\x9a\xb6\xb6\x36\x9a\x9a\x9a\x28\x2d\x2d\x55\x5e\x96\x8e\
-\x68\xfa\x27\x49\x12\x3e\x9f\x8f\xe1\xe1\x61\x9e\x3f\x7f\xce\xcc\
-\xcc\x0c\xa1\x50\x08\x80\xaa\xaa\x2a\x3e\xff\xfc\x73\xba\xbb\xbb\
-\xb1\xdb\xed\x1f\x4d\x87\x0f\x12\x95\x24\x89\xe5\xe5\x65\xee\xdd\
-\xbb\xc7\xc0\xc0\x00\x4b\x4b\x4b\x68\xb5\x5a\xea\xeb\xeb\xb9\x78\
-\xf1\x22\x2d\x2d\x2d\x14\x14\x14\xa0\xd7\xeb\x91\x65\x99\x48\x24\
-\xa2\x14\x14\x7b\x0a\xc9\x68\x34\xa2\xd1\x68\x48\x26\x93\x6c\x6c\
-\x6c\x30\x3a\x3a\xca\xfd\xfb\xf7\x79\xfb\xf6\x2d\xa1\x50\x88\xac\
-\xac\x2c\xba\xba\xba\xb8\x72\xe5\x0a\x75\x75\x75\x64\x65\x65\x1d\
-\x4a\xf6\x50\xa2\x92\x24\xb1\xb0\xb0\xc0\xed\xdb\xb7\x19\x1c\x1c\
-\x64\x6d\x6d\x0d\x9b\xcd\x46\x6f\x6f\x2f\xbd\xbd\xbd\x94\x97\x97\
-\x63\x30\x18\x90\x65\x99\xad\xad\x2d\xa6\xa6\xa6\x78\xfa\xf4\x29\
-\xef\xde\xbd\x23\x10\x08\x00\x50\x50\x50\xc0\xd1\xa3\x47\x69\x69\
-\x69\xc1\xe9\x74\x52\x58\x58\x88\x5e\xaf\x27\x99\x4c\x12\x0a\x85\
-\x18\x1a\x1a\xe2\xde\xbd\x7b\x8c\x8d\x8d\x21\x8a\x22\xed\xed\xed\
-\xdc\xb8\x71\x83\xcf\x3e\xfb\x8c\xec\xec\xec\x03\x64\x0f\x10\x95\
-\x65\x99\x85\x85\x05\x6e\xde\xbc\xc9\xe0\xe0\x20\x9b\x9b\x9b\x38\
-\x9d\x4e\xfa\xfa\xfa\xe8\xec\xec\x24\x3f\x3f\x1f\xb5\x5a\x8d\x28\
-\x8a\xb8\xdd\x6e\x7e\xfb\xed\x37\x9e\x3c\x79\x82\xcf\xe7\x43\x96\
-\x65\x25\xd7\xd2\xc5\x94\x95\x95\xc5\x89\x13\x27\xb8\x7c\xf9\x32\
-\xad\xad\xad\x58\x2c\x16\x54\x2a\x15\xf1\x78\x1c\x97\xcb\xc5\xcf\
-\x3f\xff\xcc\xcb\x97\x2f\xd9\xde\xde\xa6\xbb\xbb\x9b\xaf\xbe\xfa\
-\x8a\xfa\xfa\x7a\x8c\x46\xe3\x5e\x5a\xa8\xbf\xfb\xee\xbb\xff\x4b\
-\xff\x49\xa5\x52\x04\x02\x01\x7e\xfd\xf5\x57\x06\x06\x06\xd8\xd8\
-\xd8\xa0\xb9\xb9\x99\xaf\xbf\xfe\x9a\xce\xce\x4e\x2c\x16\x0b\x82\
-\x20\x10\x8f\xc7\x79\xfd\xfa\x35\x3f\xfc\xf0\x03\x7f\xfc\xf1\x07\
-\x5b\x5b\x5b\x58\x2c\x16\x6a\x6a\x6a\x68\x6d\x6d\xc5\xe9\x74\x92\
-\x9b\x9b\x4b\x2a\x95\x62\x6b\x6b\x0b\x8f\xc7\xc3\xfc\xfc\x3c\x06\
-\x83\x81\xe2\xe2\x62\x8c\x46\xa3\xa2\x02\x0e\x87\x83\x48\x24\x82\
-\xcf\xe7\x63\x61\x61\x01\x80\x92\x92\x12\x72\x73\x73\x33\x0a\x2c\
-\x83\x68\x34\x1a\x65\x70\x70\x90\x3b\x77\xee\xe0\xf7\xfb\x69\x6c\
-\x6c\xe4\xc6\x8d\x1b\xb4\xb5\xb5\x91\x93\x93\xa3\x14\xca\xf8\xf8\
-\x38\xb7\x6e\xdd\x62\x68\x68\x08\xa3\xd1\xc8\xa5\x4b\x97\xf8\xf6\
-\xdb\x6f\xb9\x7e\xfd\x3a\xdd\xdd\xdd\x9c\x3a\x75\x8a\x73\xe7\xce\
-\xd1\xd1\xd1\x41\x4e\x4e\x0e\x6b\x6b\x6b\xbc\x7f\xff\x9e\x60\x30\
-\x88\xc5\x62\xc1\x66\xb3\xa1\xd7\xeb\x51\xab\xd5\xe4\xe7\xe7\x63\
-\xb5\x5a\x09\x87\xc3\x2c\x2d\x2d\xb1\xbc\xbc\x8c\xd9\x6c\xa6\xac\
-\xac\x2c\x23\x05\x14\xa2\xb2\x2c\xe3\x72\xb9\xe8\xef\xef\xe7\xaf\
-\xbf\xfe\xa2\xa2\xa2\x82\x2f\xbf\xfc\x92\x8e\x8e\x0e\x72\x73\x73\
-\x95\x07\xc2\xe1\x30\x03\x03\x03\x3c\x7c\xf8\x10\xb5\x5a\xcd\xb5\
-\x6b\xd7\xe8\xeb\xeb\xe3\xe8\xd1\xa3\x98\x4c\x26\xf4\x7a\x3d\x3a\
-\x9d\x0e\xbd\x5e\x8f\xc5\x62\xe1\xd8\xb1\x63\xe8\xf5\x7a\x96\x97\
-\x97\x99\x9d\x9d\x45\xa7\xd3\x51\x51\x51\x41\x5e\x5e\x1e\x6a\xb5\
-\x1a\x41\x10\xb0\x5a\xad\x64\x65\x65\xb1\xb2\xb2\x82\xc7\xe3\x21\
-\x1a\x8d\x52\x5c\x5c\xac\xc8\x1d\x80\x90\x8e\xe6\xfa\xfa\x3a\x2f\
-\x5f\xbe\xe4\xdd\xbb\x77\xe8\xf5\x7a\x7a\x7a\x7a\x38\x75\xea\x14\
-\x79\x79\x79\x19\x89\x3d\x3d\x3d\xcd\xd8\xd8\x18\x5b\x5b\x5b\xb4\
-\xb5\xb5\x71\xee\xdc\x39\x1c\x0e\x07\x5a\xad\xf6\x40\x01\x08\x82\
-\x80\xc9\x64\xe2\xcc\x99\x33\x74\x76\x76\x62\x32\x99\x98\x9c\x9c\
-\x64\x7a\x7a\x9a\x68\x34\xaa\xac\xd3\x68\x34\xb4\xb5\xb5\xd1\xdb\
-\xdb\x4b\x49\x49\x09\xd3\xd3\xd3\x0c\x0f\x0f\x13\x0c\x06\x91\x24\
-\x69\x67\x2f\x76\x73\x73\x6a\x6a\x8a\xf1\xf1\x71\x22\x91\x08\x2d\
-\x2d\x2d\xb4\xb7\xb7\x2b\x89\x9f\x46\x2a\x95\x62\x61\x61\x81\xf9\
-\xf9\x79\x0a\x0b\x0b\x69\x6c\x6c\xc4\x6e\xb7\xa3\xd5\x6a\x95\x35\
-\xfb\xa1\x52\xa9\x28\x28\x28\xe0\xc4\x89\x13\x94\x95\x95\x11\x0c\
-\x06\x59\x5a\x5a\x42\x14\xc5\x8c\x75\x5a\xad\x96\xa6\xa6\x26\x9a\
-\x9a\x9a\xd0\x68\x34\x8c\x8d\x8d\x31\x3d\x3d\x4d\x2c\x16\x83\x34\
-\xd1\x48\x24\xc2\xc4\xc4\x04\xb3\xb3\xb3\xe4\xe7\xe7\xd3\xdc\xdc\
-\x4c\x59\x59\xd9\x01\x02\xd1\x68\x94\xf5\xf5\x75\x22\x91\x08\x85\
-\x85\x85\x38\x1c\x0e\xf4\x7a\x7d\xc6\x9a\xc3\x20\x08\x02\x76\xbb\
-\x1d\xbb\xdd\x8e\x24\x49\xac\xae\xae\xb2\xb5\xb5\x95\xd1\x66\x01\
-\x4a\x4b\x4b\x69\x6e\x6e\xa6\xa4\xa4\x04\x8f\xc7\xc3\xe4\xe4\x24\
-\x9b\x9b\x9b\xa4\x52\xa9\x1d\xa2\x4b\x4b\x4b\x2c\x2c\x2c\x10\x8b\
-\xc5\xa8\xa9\xa9\xa1\xb6\xb6\x16\x93\xc9\x74\xe0\x28\x45\x51\x44\
-\x14\x45\x64\x59\xc6\x68\x34\x62\x30\x18\x10\x04\x25\x7b\x3e\x0a\
-\xb3\xd9\x4c\x4e\x4e\x0e\x82\x20\x10\x8d\x46\x89\x46\xa3\xca\xb1\
-\xa6\xa1\x56\xab\xa9\xab\xab\xc3\xe9\x74\x92\x4a\xa5\x70\xbb\xdd\
-\x2c\x2e\x2e\x12\x8f\xc7\x77\x88\xfa\x7c\x3e\x7c\x3e\x1f\x5a\xad\
-\x96\x9a\x9a\x1a\x4a\x4a\x4a\x0e\x44\x93\xdd\x5c\x4a\x9b\x08\x51\
-\x14\x89\xc7\xe3\x8a\x53\xfa\x27\x24\x93\x49\x92\xc9\x24\xa9\x54\
-\x2a\x63\x9f\xfd\xb0\xdb\xed\x94\x95\x95\x61\x34\x1a\x59\x5c\x5c\
-\xe4\xfd\xfb\xf7\x88\xa2\xb8\x43\x74\x65\x65\x85\x40\x20\x40\x7e\
-\x7e\x3e\x0e\x87\x03\x83\xc1\x70\xe8\x26\x46\xa3\x11\x93\xc9\x84\
-\x56\xab\x65\x7d\x7d\x9d\xd5\xd5\x55\x12\x89\xc4\xfe\x65\x87\x62\
-\x75\x75\x95\x95\x95\x15\x64\x59\xc6\x6c\x36\x7f\xd0\x88\x68\x34\
-\x1a\xca\xcb\xcb\x29\x29\x29\x61\x63\x63\x83\x40\x20\xf0\x77\x44\
-\x45\x51\x24\x16\x8b\x51\x50\x50\x40\x51\x51\x91\x22\x09\xfb\xa1\
-\x56\xab\x29\x2d\x2d\xc5\x6e\xb7\x13\x08\x04\x70\xbb\xdd\x84\xc3\
-\xe1\x03\xb9\xb6\x1f\xe9\x2e\xe6\xf1\x78\xc8\xcb\xcb\xa3\xa4\xa4\
-\x04\xa3\xd1\x78\x68\x30\x54\x2a\x95\x92\xcf\xf1\x78\x9c\x70\x38\
-\x4c\x22\x91\xf8\xbb\xea\xd9\x35\xba\x16\x8b\x05\x8d\x46\xb3\xff\
-\x79\xd8\xdd\xa4\xaa\xaa\x8a\x63\xc7\x8e\x01\xf0\xea\xd5\x2b\x86\
-\x87\x87\xd9\xd8\xd8\xf8\x60\x0a\xc4\xe3\x71\x46\x46\x46\x78\xf6\
-\xec\x19\xab\xab\xab\x1c\x3b\x76\x8c\xda\xda\x5a\xb2\xb2\xb2\xf6\
-\x2f\x55\x90\x93\x93\x43\x4e\x4e\x0e\x6a\xb5\x9a\x64\x32\x89\x24\
-\x49\x7f\xeb\x28\xa0\x8c\x0d\x1f\x2b\x90\x92\x92\x12\x45\x15\x66\
-\x67\x67\xb9\x73\xe7\x0e\xcf\x9f\x3f\xc7\xeb\xf5\xb2\xbd\xbd\x4d\
-\x22\x91\x20\x99\x4c\x2a\x0a\xf1\xe6\xcd\x1b\x6e\xdf\xbe\x8d\xcb\
-\xe5\xa2\xa0\xa0\x80\x53\xa7\x4e\x71\xe4\xc8\x91\x0f\x9e\x1a\x40\
-\x76\x76\xb6\x92\x1a\x92\x24\x21\x49\x12\x19\xa1\xd3\x68\x34\x87\
-\x0a\xf7\x5e\xa8\xd5\x6a\x4e\x9e\x3c\x89\xdf\xef\x67\x7b\x7b\x9b\
-\xd1\xd1\x51\xbc\x5e\x2f\x0d\x0d\x0d\x34\x36\x36\x52\x59\x59\x89\
-\x5a\xad\xc6\xeb\xf5\x32\x3e\x3e\xce\xc8\xc8\x08\x8b\x8b\x8b\x64\
-\x67\x67\xd3\xd3\xd3\x43\x7b\x7b\x7b\x46\xa7\x3b\x0c\x06\x83\x41\
-\x51\x94\x43\x89\xa6\xcd\xee\x3f\x21\x2f\x2f\x8f\xf3\xe7\xcf\x13\
-\x0a\x85\xb8\x77\xef\x1e\xcb\xcb\xcb\xf8\xfd\x7e\x1e\x3d\x7a\xa4\
-\xa4\x8d\x24\x49\x24\x12\x09\x12\x89\x04\x7a\xbd\x9e\x8e\x8e\x0e\
-\x7a\x7a\x7a\xb0\xd9\x6c\x1f\x3d\x31\x76\x53\x6c\xff\x87\x64\x3c\
-\x11\x8b\xc5\x88\xc5\x62\x1f\x2d\x0e\x49\x92\x58\x5b\x5b\x63\x74\
-\x74\x94\xa9\xa9\x29\x36\x37\x37\x95\xaf\x4e\x4b\x50\xfa\xbf\x2c\
-\xcb\xa4\x52\x29\x12\x89\x04\xf3\xf3\xf3\x8c\x8d\x8d\xe1\xf5\x7a\
-\xff\x51\xd6\xd2\xc5\x2d\xcb\x32\x82\x20\x20\x08\x42\x66\x44\xa3\
-\xd1\x28\x91\x48\x04\x49\x92\x0e\x95\x8e\x78\x3c\xce\xfc\xfc\x3c\
-\x77\xef\xde\xe5\xe1\xc3\x87\x04\x02\x01\x34\x1a\x0d\x0e\x87\x43\
-\xb1\x6c\x56\xab\x15\x8d\x46\xc3\xe6\xe6\x26\x5e\xaf\x17\x9f\xcf\
-\x47\x28\x14\xc2\xed\x76\xf3\xfd\xf7\xdf\x33\x31\x31\xc1\xe5\xcb\
-\x97\x39\x7e\xfc\x38\x26\x93\xe9\xd0\xe8\x46\x22\x11\x22\x91\x88\
-\xe2\x6f\xd5\x6a\xf5\x0e\xd1\x74\xa8\x43\xa1\x10\xa1\x50\x88\x64\
-\x32\x79\x20\xd9\x45\x51\x64\x64\x64\x44\x31\xba\xa2\x28\x52\x5e\
-\x5e\x4e\x57\x57\x17\x5d\x5d\x5d\x94\x96\x96\x66\x74\xaa\xf4\xbc\
-\x14\x0a\x85\x18\x1d\x1d\xe5\xd1\xa3\x47\xca\x18\xb2\xb8\xb8\x48\
-\x5f\x5f\x1f\xa7\x4f\x9f\x56\x3c\xee\x5e\xac\xaf\xaf\xb3\xbe\xbe\
-\xbe\x93\x9b\x1a\xcd\xdf\x44\x75\x3a\x1d\x3a\x9d\x8e\x40\x20\x80\
-\xcf\xe7\x23\x1e\x8f\x67\xc8\x47\x22\x91\x60\x78\x78\x98\x1f\x7f\
-\xfc\x91\xe1\xe1\x61\x64\x59\xa6\xbb\xbb\x9b\x6b\xd7\xae\x29\x91\
-\x51\xef\x0e\x76\xfb\x61\x36\x9b\xb1\xd9\x6c\x34\x37\x37\x33\x38\
-\x38\x48\x7f\x7f\x3f\x53\x53\x53\xdc\xbc\x79\x93\x54\x2a\x45\x77\
-\x77\xf7\x01\xf3\x93\xee\x94\x6a\xb5\x5a\x69\x30\x02\x40\x71\x71\
-\x31\x36\x9b\x8d\x8d\x8d\x0d\xbc\x5e\x2f\xd1\x68\x54\xc9\x21\x59\
-\x96\x99\x9a\x9a\xe2\xee\xdd\xbb\x8c\x8c\x8c\xa0\xd3\xe9\xb8\x7a\
-\xf5\x2a\xdf\x7c\xf3\x0d\x2d\x2d\x2d\xe4\xe6\xe6\x7e\xb0\x1d\xb2\
-\x6b\x48\xf4\x7a\x3d\x76\xbb\x9d\x6b\xd7\xae\x71\xe3\xc6\x0d\x2a\
-\x2b\x2b\x71\xbb\xdd\xf4\xf7\xf7\xe3\x72\xb9\xd8\xde\xde\x56\xde\
-\x97\x4c\x26\xf1\x7a\xbd\xf8\xfd\x7e\xac\x56\xab\x62\x7c\x04\x76\
-\x5d\x4b\x69\x69\x29\x00\x73\x73\x73\x4a\x7f\x05\x08\x06\x83\xfc\
-\xfe\xfb\xef\xbc\x78\xf1\x82\x64\x32\xc9\xb9\x73\xe7\xb8\x72\xe5\
-\x0a\x35\x35\x35\x1f\x6c\xb5\x87\x41\x10\x04\xf2\xf2\xf2\xb8\x74\
-\xe9\x12\x5f\x7c\xf1\x05\x0e\x87\x83\xb7\x6f\xdf\x72\xff\xfe\x7d\
-\x16\x16\x16\x94\xe9\x35\x6d\xb0\xc3\xe1\x30\x36\x9b\x0d\x87\xc3\
-\x81\x4e\xa7\xdb\x21\xea\x70\x38\xa8\xae\xae\x26\x37\x37\x97\x99\
-\x99\x19\x26\x27\x27\xd9\xda\xda\x42\x92\x24\x46\x47\x47\x19\x19\
-\x19\x61\x7b\x7b\x9b\x93\x27\x4f\x72\xe9\xd2\x25\x2a\x2b\x2b\x0f\
-\xe4\xf0\xa7\x40\xa5\x52\x91\x9b\x9b\xcb\x85\x0b\x17\x38\x73\xe6\
-\x0c\x66\xb3\x19\x97\xcb\x85\xcb\xe5\x52\xd4\x63\x62\x62\x82\xc9\
-\xc9\x49\x64\x59\xa6\xa2\xa2\x22\x93\xa8\x4e\xa7\xc3\xe9\x74\x52\
-\x5d\x5d\x4d\x38\x1c\x66\x74\x74\x94\xc5\xc5\x45\x7c\x3e\x1f\xe3\
-\xe3\xe3\x78\x3c\x1e\x0a\x0b\x0b\xe9\xe8\xe8\x50\x22\xf9\x5f\xa1\
-\x52\xa9\x28\x2c\x2c\xa4\xa5\xa5\x85\xea\xea\x6a\xd6\xd7\xd7\x99\
-\x9a\x9a\x22\x18\x0c\xb2\xbc\xbc\xcc\xd8\xd8\x18\x4b\x4b\x4b\x54\
-\x56\x56\xd2\xd0\xd0\x40\x5e\x5e\xde\x8e\x44\xa5\x1f\xae\xa9\xa9\
-\xa1\xbe\xbe\x9e\x9c\x9c\x1c\x5c\x2e\x17\x2f\x5f\xbe\x64\x78\x78\
-\x98\x99\x99\x19\x62\xb1\x18\x75\x75\x75\x1c\x3f\x7e\x1c\xb3\xd9\
-\xfc\xc9\xc7\xfd\x21\x08\x82\x40\x6d\x6d\x2d\x75\x75\x75\x18\x8d\
-\x46\xe6\xe7\xe7\x99\x9e\x9e\xe6\xcf\x3f\xff\xe4\xf5\xeb\xd7\x24\
-\x12\x09\x1a\x1a\x1a\x70\x3a\x9d\x4a\x51\x2b\xba\x60\x36\x9b\x69\
-\x6b\x6b\xa3\xb1\xb1\x91\x78\x3c\xce\xe3\xc7\x8f\x19\x18\x18\x60\
-\x6e\x6e\x0e\x93\xc9\xc4\xd1\xa3\x47\xb1\xd9\x6c\x87\xfa\xd4\xff\
-\x82\xfc\xfc\x7c\x2a\x2b\x2b\xb1\x5a\xad\xf8\xfd\x7e\x06\x07\x07\
-\x79\xf0\xe0\x01\xcb\xcb\xcb\x38\x9d\x4e\x5a\x5b\x5b\xb1\x5a\xad\
-\x8a\x74\x29\x44\x55\x2a\x15\x4e\xa7\x93\xae\xae\x2e\xca\xca\xca\
-\x70\xbb\xdd\xbc\x78\xf1\x42\x19\x5f\xad\x56\xeb\x27\x8d\x1d\x9f\
-\x0a\x41\x10\x70\x38\x1c\xd8\xed\x76\xb6\xb7\xb7\x79\xf6\xec\x19\
-\x6f\xdf\xbe\x25\x27\x27\x87\x33\x67\xce\xd0\xd0\xd0\x90\x21\x91\
-\x19\x4a\xab\xd5\x6a\xe9\xea\xea\xe2\xe2\xc5\x8b\x14\x17\x17\x2b\
-\x6d\xd0\x64\x32\x7d\xd0\xe8\xfe\x2f\x48\xef\xab\xda\xbd\x39\x31\
-\x1a\x8d\x9c\x3d\x7b\x96\xd3\xa7\x4f\x1f\x98\x7e\x33\x88\xaa\x54\
-\x2a\xf2\xf2\xf2\xe8\xed\xed\xe5\xfc\xf9\xf3\x14\x15\x15\x21\x08\
-\x02\x91\x48\x84\xd5\xd5\x55\xc2\xe1\xb0\x22\x23\xff\x2b\x62\xb1\
-\x98\x32\x28\xa6\x52\x29\xb2\xb3\xb3\xe9\xee\xee\xa6\xb7\xb7\x17\
-\x87\xc3\x71\xc0\x13\x67\xdc\x94\xb0\x4b\xd6\x64\x32\x61\xb3\xd9\
-\x10\x45\x11\xbf\xdf\x8f\xd7\xeb\x65\x7e\x7e\x1e\x51\x14\x31\x9b\
-\xcd\x64\x65\x65\x7d\x54\xe4\x3f\x86\x44\x22\xc1\xc6\xc6\x06\x4f\
-\x9f\x3e\xe5\xa7\x9f\x7e\xc2\xe5\x72\xa1\xd5\x6a\xb9\x78\xf1\x22\
-\xd7\xaf\x5f\xa7\xb6\xb6\xf6\x50\x7d\x3e\x40\x94\x5d\xb2\xe9\xd6\
-\x17\x8f\xc7\x59\x59\x59\xc1\xef\xf7\x33\x35\x35\xc5\xfc\xfc\x3c\
-\x92\x24\x29\x06\x5b\xd8\x73\xd3\xfc\x21\x48\x92\x84\x28\x8a\x84\
-\xc3\x61\x26\x27\x27\xb9\x75\xeb\x16\xbf\xfc\xf2\x0b\x73\x73\x73\
-\x58\x2c\x16\xae\x5e\xbd\x4a\x5f\x5f\x1f\x55\x55\x55\xe8\xf5\xfa\
-\x43\xf7\x3a\x70\x9b\xb7\x17\x92\x24\xb1\xb2\xb2\xc2\x83\x07\x0f\
-\x18\x1c\x1c\xc4\xed\x76\x23\x8a\x22\x46\xa3\x91\xaa\xaa\x2a\x9a\
-\x9a\x9a\x68\x68\x68\xa0\xac\xac\x8c\xac\xac\x2c\xb4\x5a\xad\xd2\
-\xf3\x53\xbb\xd7\xe3\x89\x44\x82\xd5\xd5\x55\x66\x66\x66\x18\x1a\
-\x1a\x62\x7c\x7c\x9c\xb5\xb5\x35\xd4\x6a\x35\xc7\x8f\x1f\xe7\xca\
-\x95\x2b\xb4\xb7\xb7\x2b\x57\x3c\x1f\xc2\x47\x89\xb2\xdb\xeb\xa3\
-\xd1\x28\x13\x13\x13\x0c\x0c\x0c\xf0\xfa\xf5\x6b\x02\x81\xc0\xce\
-\xc0\x25\x08\x68\x34\x1a\x4c\x26\x93\x72\xd9\x65\xb5\x5a\xd1\xe9\
-\x74\xc4\x62\x31\x36\x37\x37\x09\x04\x02\xac\xac\xac\x28\xb9\x98\
-\xbe\xc5\x3b\x7b\xf6\x2c\x3d\x3d\x3d\x54\x56\x56\x1e\x7a\xd4\xfb\
-\xf1\x8f\x44\xd9\x63\xd9\x36\x37\x37\x99\x98\x98\xe0\xc5\x8b\x17\
-\x8c\x8f\x8f\x2b\xe3\x48\x22\x91\x50\x14\x22\xfd\x42\x95\x4a\x85\
-\x20\x08\x3b\x16\x4d\xa3\x21\x3b\x3b\x9b\x23\x47\x8e\xd0\xda\xda\
-\x4a\x73\x73\x33\x15\x15\x15\x64\x67\x67\x7f\x34\x8a\x7b\xf1\x49\
-\x44\xd3\x48\x13\x4e\x3b\xf0\xe5\xe5\x65\x26\x27\x27\x99\x9d\x9d\
-\x65\x69\x69\x89\x60\x30\xa8\x44\xce\x60\x30\x50\x58\x58\x48\x79\
-\x79\x39\x55\x55\x55\xd4\xd6\xd6\xe2\x70\x38\x0e\xa4\xc8\xa7\xe2\
-\x5f\x11\xdd\x8b\xbd\x39\x98\x1e\x43\xd2\xa3\x07\x7b\x22\x9a\xbe\
-\x15\xd1\x68\x34\x4a\xe1\xfd\x17\xfc\x3f\x2a\x4a\x6a\x9f\x1f\x14\
-\x3b\x3c\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\xc7\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2b\x00\x00\x00\x2a\x08\x06\x00\x00\x00\x2a\x01\xa2\x65\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x08\x5c\x49\x44\x41\x54\x58\x47\xd5\x98\xcb\x6b\
-\x13\x6d\x1b\x87\xaf\x99\x24\x4d\x9a\x63\x53\x93\xb6\x69\xeb\x8b\
-\x55\x93\xd6\xc3\x42\xc5\x03\xa2\xf5\xd0\x8a\xa2\x58\xf0\x5f\x10\
-\x41\xd4\x9d\x1b\x5d\xb8\x71\xa1\x50\x41\x51\x14\xdc\xba\x11\x41\
-\x11\x97\x22\x8a\x45\x51\xd4\x82\x4d\x3d\x94\xda\x6a\x5b\xea\x21\
-\x07\x6d\x9b\xb4\xcd\x39\x93\xc9\x7c\x8b\xb7\x19\x72\xb2\x26\x9f\
-\xef\xe7\xcb\xf7\x83\x21\x84\x67\x32\x73\xe5\x7e\xee\xfb\xf7\xdc\
-\xcf\x23\x0c\x0e\x0e\x2a\xfc\x9f\x48\x78\xf9\xf2\xa5\x72\xe5\xca\
-\x15\x06\x06\x06\x90\x65\xb9\x78\x9c\xb6\xb6\x36\x8e\x1c\x39\x42\
-\x47\x47\x07\xa2\x28\x16\x0f\xff\x51\x89\xb1\x58\x8c\x40\x20\xc0\
-\xe7\xcf\x9f\x99\x9c\x9c\x2c\xb9\x5e\xbc\x78\xc1\xbb\x77\xef\x88\
-\x46\xa3\x28\xca\xbf\x3b\x09\xa2\x5e\xaf\xc7\x60\x30\x20\x08\x02\
-\x8a\xa2\x94\x5c\xc9\x64\x92\xe1\xe1\x61\x66\x66\x66\xfe\x75\x58\
-\x61\x60\x60\x40\x09\x04\x02\x8c\x8f\x8f\x13\x89\x44\x54\xa0\xbe\
-\xbe\x3e\x5e\xbf\x7e\x4d\x34\x1a\x65\xe5\xca\x95\x9c\x3a\x75\x8a\
-\xf5\xeb\xd7\xa3\xd1\x68\x8a\x9f\xf1\xc7\x24\x8a\xa2\x88\xcb\xe5\
-\x62\xcb\x96\x2d\x74\x75\x75\xd1\xdd\xdd\x4d\x77\x77\x37\x3b\x77\
-\xee\xc4\xe1\x70\x20\x08\x02\x93\x93\x93\x04\x02\x01\x24\x49\x2a\
-\xfe\xfd\x1f\x95\xf0\x33\x37\x18\x1f\x1f\xe7\xc2\x85\x0b\x78\xbd\
-\x5e\x64\x59\xa6\xa7\xa7\x87\x3d\x7b\xf6\x60\xb7\xdb\x11\x04\xa1\
-\xf8\xf6\xff\x89\x44\x51\xa4\xb5\xb5\x15\x8b\xc5\x82\x20\x08\x3f\
-\x87\x95\x24\x89\xf3\xe7\xcf\xf3\xf0\xe1\x43\x12\x89\x04\x26\x93\
-\x09\x93\xc9\xf4\x47\x1d\x41\x10\x04\xac\x56\x2b\x27\x4f\x9e\x64\
-\xe3\xc6\x8d\x3f\x87\x05\xb8\x75\xeb\x16\xb7\x6e\xdd\xc2\xef\xf7\
-\xa3\x28\xca\x1f\x8b\x68\xbe\x44\x51\xa4\xb7\xb7\x97\x5d\xbb\x76\
-\xb1\x68\x98\x3a\x3a\x3a\x58\xb2\x64\x89\x0a\x59\xec\x14\x7f\xe2\
-\x92\x65\x99\x6c\x36\x0b\x80\xb6\x88\xaf\x40\x6e\xb7\x9b\xfa\xfa\
-\x7a\x15\xd6\xed\x76\xd3\xdd\xdd\x8d\xcb\xe5\x2a\x9b\x0e\xe9\x74\
-\x9a\xbb\x77\xef\x02\xb0\x6b\xd7\x2e\x9a\x9a\x9a\x4a\xee\x1b\x1f\
-\x1f\xe7\xd1\xa3\x47\xac\x5e\xbd\x9a\x0d\x1b\x36\x60\x32\x99\x4a\
-\x66\x6c\x64\x64\x84\xbe\xbe\x3e\x82\xc1\x20\x4a\x9e\x5d\x2e\x0a\
-\x6b\x36\x9b\xf1\x78\x3c\xbc\x7f\xff\x9e\x50\x28\x44\x34\x1a\xa5\
-\xbd\xbd\x9d\x8d\x1b\x37\x96\xb5\xb0\x64\x32\xc9\xd3\xa7\x4f\x51\
-\x14\x85\xcd\x9b\x37\xe3\x76\xbb\x4b\x60\x2d\x16\x0b\xfd\xfd\xfd\
-\xb8\xdd\x6e\x76\xec\xd8\x81\xdd\x6e\x2f\x18\x07\x98\x9f\x9f\x57\
-\x9f\x5f\x5f\x5f\xaf\xae\x03\xa5\xe1\xc9\x93\x20\x08\x74\x74\x74\
-\xa8\x16\xf6\xe3\xc7\x0f\xa6\xa7\xa7\x11\x04\x01\x83\xc1\x40\x6d\
-\x6d\x6d\xc1\x65\x30\x18\xd0\x6a\xb5\x68\x34\x1a\xf4\x7a\x7d\xc9\
-\x78\x6d\x6d\x2d\x7a\xbd\x1e\x51\x14\xd1\xe9\x74\x18\x0c\x86\xb2\
-\xcf\x99\x99\x99\x21\x1e\x8f\x03\xe0\x72\xb9\xb0\x58\x2c\x00\x8b\
-\xc3\x02\xac\x5d\xbb\x56\x85\x95\x65\x99\xd1\xd1\x51\x42\xa1\x50\
-\xf1\x6d\xb0\xf0\xe7\xfe\x09\x05\x02\x01\x75\x79\x6f\x69\x69\x51\
-\xad\xeb\x97\xb0\xf5\xf5\xf5\x2c\x5d\xba\x14\xa3\xd1\x88\x20\x08\
-\x8c\x8c\x8c\x30\x3d\x3d\xad\x26\xfd\x3f\xad\x40\x20\xc0\xdc\xdc\
-\x9c\xda\x54\x35\x37\x37\xab\xb0\x8b\xe6\x2c\x80\x46\xa3\xa1\xa3\
-\xa3\x83\x57\xaf\x5e\x11\x8b\xc5\xf8\xf8\xf1\x23\x83\x83\x83\x88\
-\xa2\x58\x92\xb7\xa9\x54\x8a\xf9\xf9\x79\xb2\xd9\x2c\xe3\xe3\xe3\
-\x48\x92\x54\x92\xb3\x93\x93\x93\x24\x12\x09\x82\xc1\x20\xa3\xa3\
-\xa3\x98\xcd\xe6\x82\x19\xf9\xf4\xe9\x13\x53\x53\x53\x6a\x61\xb5\
-\xb4\xb4\xa8\xf7\x2c\xea\xb3\x39\x8d\x8e\x8e\x72\xf1\xe2\x45\x06\
-\x07\x07\x91\x65\x99\xba\xba\x3a\x0c\x06\x43\xf1\x6d\x00\x84\xc3\
-\x61\x04\x41\xc0\x6c\x36\xa3\xd5\x96\xc6\x22\x9d\x4e\x13\x89\x44\
-\xd4\x5c\x2d\xfe\x33\x92\x24\x31\x3f\x3f\x8f\x24\x49\x58\xad\x56\
-\xce\x9e\x3d\x4b\x67\x67\x27\x5a\xad\xf6\xd7\x91\x65\xa1\xa7\x6d\
-\x6c\x6c\x44\xa7\xd3\x21\xcb\x32\x46\xa3\x91\x03\x07\x0e\xf0\xd7\
-\x5f\x7f\x15\xbc\x2c\x67\x5d\x8a\xa2\xb0\x7b\xf7\xee\xb2\xd6\x35\
-\x36\x36\xc6\xa3\x47\x8f\x58\xb3\x66\x4d\x59\xeb\xba\x7f\xff\x3e\
-\x6f\xde\xbc\x41\x92\x24\x9a\x9b\x9b\xb1\x5a\xad\xea\x78\x45\xb0\
-\x35\x35\x35\x78\x3c\x1e\xbc\x5e\x2f\xc1\x60\x90\x70\x38\xcc\x8a\
-\x15\x2b\xd8\xbe\x7d\x7b\x41\x2a\x24\x93\x49\x9e\x3c\x79\x82\xa2\
-\x28\x6c\xda\xb4\xa9\xac\x75\x99\xcd\x66\xfa\xfb\xfb\x59\xb9\x72\
-\x25\x9d\x9d\x9d\x25\xd6\xf5\xf4\xe9\x53\xb5\x61\xca\xcf\x57\x2a\
-\x71\x83\x9c\xf2\x57\xb3\x64\x32\x89\xdf\xef\x27\x9d\x4e\x17\x58\
-\xcf\xef\x5a\x57\x24\x12\x21\x1e\x8f\xab\xc5\x9b\xef\x04\x54\x03\
-\xdb\xde\xde\xae\xc2\x2a\x8a\xc2\x87\x0f\x1f\x4a\x1a\xf2\xdf\xb5\
-\xae\x7c\xcb\xe2\x77\x22\x6b\xb1\x58\x58\xb1\x62\x05\x36\x9b\x0d\
-\x41\x10\x18\x1d\x1d\x2d\x81\xfd\x5d\xf9\xfd\x7e\xa2\xd1\x28\x00\
-\x26\x93\x09\xa7\xd3\x89\x5e\xaf\x57\xc7\x2b\x86\x15\x45\x91\x55\
-\xab\x56\xa9\xd1\xf5\xfb\xfd\xf8\x7c\x3e\x92\xc9\x64\xf1\xad\x7f\
-\xdb\x4c\x99\x28\xc7\x62\x31\xa6\xa7\xa7\x49\xa5\x52\x78\xbd\x5e\
-\x6e\xdc\xb8\x41\x6f\x6f\x2f\xa7\x4f\x9f\xe6\xe8\xd1\xa3\x5c\xbb\
-\x76\x8d\xaf\x5f\xbf\x92\xcd\x66\x69\x6a\x6a\xc2\x6a\xb5\x16\xe4\
-\x7c\x45\x05\x96\x53\x2e\x6f\x27\x26\x26\xd4\xd5\x6c\xf3\xe6\xcd\
-\x18\x8d\x46\x12\x89\x04\x81\x40\x80\x58\x2c\x86\x24\x49\xbc\x7e\
-\xfd\x9a\x77\xef\xde\xf1\xfd\xfb\x77\xbe\x7f\xff\x8e\xdf\xef\x67\
-\x76\x76\x96\x48\x24\xc2\xdc\xdc\x1c\x3e\x9f\x8f\xc1\xc1\x41\xb5\
-\xb3\x92\x65\x99\x4c\x26\x53\xe0\xaf\xf9\x4e\xc0\x62\x3b\x85\x72\
-\x92\x65\x99\xde\xde\x5e\x1e\x3c\x78\x40\x34\x1a\xa5\xb1\xb1\x91\
-\x96\x96\x16\x24\x49\x22\x1a\x8d\x92\x4a\xa5\x08\x87\xc3\x28\x8a\
-\x42\x6d\x6d\x2d\x00\x99\x4c\x86\x4c\x26\x83\x24\x49\xea\xaa\xf4\
-\xab\xd4\xd1\xeb\xf5\x9c\x38\x71\x82\x9e\x9e\x1e\xea\xea\xea\x54\
-\xe0\xaa\x60\x01\x6e\xdf\xbe\xcd\xcd\x9b\x37\xf1\xf9\x7c\x08\x82\
-\x80\x46\xa3\x21\x9b\xcd\xaa\x15\x9c\x03\xc9\xbd\x60\x31\x30\x83\
-\xc1\x80\xc3\xe1\xc0\xe9\x74\xaa\x9f\x8d\x8d\x8d\x78\x3c\x1e\xdc\
-\x6e\x37\x75\x75\x75\x05\xd6\x58\x35\xec\xf5\xeb\xd7\xb9\x77\xef\
-\x1e\xa1\x50\x68\x51\x10\x00\xa3\xd1\x88\xc3\xe1\xc0\xe1\x70\xd0\
-\xd0\xd0\x40\x43\x43\x03\x4e\xa7\x13\xa7\xd3\x49\x53\x53\x13\x16\
-\x8b\x85\x9a\x9a\x9a\xbf\x57\xa7\xbc\xab\xa6\xa6\x06\x9d\x4e\x57\
-\x92\xf7\x55\xc1\xce\xcc\xcc\x70\xfe\xfc\x79\x9e\x3f\x7f\x8e\x24\
-\x49\x6a\xc5\xe6\x22\x92\x83\x72\x3a\x9d\xb8\x5c\x2e\x75\xc9\xcd\
-\x79\x6f\x31\x94\x28\x8a\xa5\x40\x65\x0a\x33\xa7\xaa\x60\x87\x87\
-\x87\xb9\x74\xe9\x12\x6f\xdf\xbe\x65\xef\xde\xbd\x1c\x3a\x74\x88\
-\xe6\xe6\x66\x74\x3a\x5d\x01\x50\xee\x7b\xf1\xea\x45\x1e\x4c\x34\
-\x1a\x65\x6e\x6e\x8e\x48\x24\x42\x26\x93\x51\xc7\x35\x1a\x0d\xad\
-\xad\xad\x25\x0d\x0e\xd5\xc2\xbe\x79\xf3\x86\xcb\x97\x2f\x33\x34\
-\x34\xc4\xba\x75\xeb\x38\x78\xf0\x20\xcb\x96\x2d\x53\x1b\x96\x78\
-\x3c\x4e\x38\x1c\x26\x14\x0a\x11\x0e\x87\x99\x9b\x9b\x63\x76\x76\
-\x56\xfd\xcc\x3f\x77\xc8\x39\x80\x92\xb7\xdf\x62\xc1\x22\xd7\xae\
-\x5d\xcb\xe1\xc3\x87\xf1\x78\x3c\x05\x7f\xb8\x2a\xd8\x70\x38\xcc\
-\xb9\x73\xe7\x78\xf6\xec\x19\xa2\x28\x62\x36\x9b\xd1\xe9\x74\xea\
-\x78\xce\x86\x32\x99\x8c\x0a\x93\xdb\xf0\xe5\x17\xe1\xaf\xd4\xda\
-\xda\xca\x99\x33\x67\x4a\xb6\x4f\x55\xc1\x66\xb3\x59\x9e\x3f\x7f\
-\xce\x8d\x1b\x37\x18\x1e\x1e\x5e\xf4\x84\x26\x17\x29\x93\xc9\x84\
-\xcd\x66\xc3\x62\xb1\xa8\x33\x20\x8a\x22\x46\xa3\x11\x9b\xcd\xa6\
-\xe6\x75\xfe\x94\xb7\xb7\xb7\xb3\x6d\xdb\x36\x9c\x4e\xe7\x7f\xef\
-\xb3\x2c\x74\x56\x53\x53\x53\x78\xbd\x5e\x26\x26\x26\x48\xa5\x52\
-\xea\x98\xc5\x62\xc1\xe1\x70\x60\xb7\xdb\xb1\xdb\xed\xd8\x6c\x36\
-\xf4\x7a\x3d\x1a\x8d\x46\x2d\x26\xd5\x33\x17\x6c\xaf\x5c\x91\xe5\
-\x0e\x0b\x8b\x73\xbe\x6a\x58\x16\x22\x9c\x4c\x26\x91\x24\xa9\x60\
-\x6a\x45\x51\x54\x0b\x2d\x07\x52\xfc\xc2\x4a\x54\x0c\x9f\x53\x55\
-\xb0\x91\x48\x84\xbe\xbe\x3e\x5e\xbc\x78\x41\x20\x10\xc0\x66\xb3\
-\xb1\x75\xeb\x56\xba\xba\xba\x68\x68\x68\x28\x88\x5c\x25\x7a\xff\
-\xfe\x3d\x8f\x1f\x3f\x66\x68\x68\x08\x45\x51\x68\x6b\x6b\x63\xff\
-\xfe\xfd\xac\x59\xb3\xa6\xec\x4e\xa4\x2a\xd8\x7b\xf7\xee\x71\xe7\
-\xce\x1d\xbe\x7c\xf9\x42\x3a\x9d\x46\xab\xd5\x62\x34\x1a\x39\x7e\
-\xfc\x38\xfb\xf6\xed\x2b\x68\xe7\x7e\x25\x9f\xcf\xc7\xd5\xab\x57\
-\xe9\xef\xef\x27\x1e\x8f\xa3\x28\x0a\x7a\xbd\x9e\xf5\xeb\xd7\x73\
-\xec\xd8\x31\x56\xad\x5a\x55\x32\x2b\x15\xcf\x91\x24\x49\x78\xbd\
-\x5e\x3e\x7f\xfe\x4c\x22\x91\x40\x96\x65\x52\xa9\x14\xb3\xb3\xb3\
-\x78\xbd\xde\x82\x4d\x5e\x25\x1a\x1a\x1a\x62\x62\x62\x82\x48\x24\
-\x82\x24\x49\x64\x32\x19\x62\xb1\x18\x03\x03\x03\x7c\xfb\xf6\xad\
-\x6c\xf1\x56\x0c\xfb\xe3\xc7\x0f\x42\xa1\x50\xc9\x43\x14\x45\xe1\
-\xeb\xd7\xaf\xcc\xcf\xcf\x57\x05\x1b\x0c\x06\xcb\x1e\xfd\x27\x12\
-\x09\xa6\xa6\xa6\x48\x26\x93\x25\x63\x15\xc3\x36\x36\x36\x62\xb7\
-\xdb\x55\xfb\xc9\x57\x6e\x69\xad\x34\x05\x00\x1a\x1a\x1a\x4a\x36\
-\x8b\x2c\xec\xf7\x9c\x4e\xa7\x7a\x4e\x91\xaf\x8a\x61\xb5\x5a\x2d\
-\xdb\xb7\x6f\xa7\xb5\xb5\xb5\x20\x97\xac\x56\x2b\x5b\xb7\x6e\xc5\
-\xe5\x72\x95\x3c\x7c\x31\x6d\xda\xb4\x09\x8f\xc7\x53\xb0\x13\x00\
-\xe8\xec\xec\x64\xf9\xf2\xe5\x25\x67\x12\x54\x5b\x60\xf1\x78\x9c\
-\xb1\xb1\x31\xc6\xc6\xc6\x08\x87\xc3\xd4\xd6\xd6\xaa\xed\x5c\x71\
-\xa3\xfc\x2b\x65\xb3\x59\x82\xc1\x20\xc3\xc3\xc3\xf8\x7c\x3e\x75\
-\x77\xb0\x7a\xf5\x6a\x5c\x2e\x17\x35\x35\x35\xc5\x3f\xa9\x0e\x96\
-\x85\x42\x4b\xa7\xd3\x64\xb3\x59\x04\x41\x40\xaf\xd7\x97\xac\x40\
-\x95\x2a\x9b\xcd\x92\x4e\xa7\xd5\x3a\xd0\x2e\xb4\x87\xe5\xa2\x0a\
-\xf0\x1f\xc8\xdf\x62\x94\x2e\xbb\x6a\x93\x00\x00\x00\x00\x49\x45\
-\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x2a\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x1c\x08\x06\x00\x00\x00\x17\xe0\x2d\xeb\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x07\xbf\x49\x44\x41\x54\x58\x47\xd5\x97\x59\x4c\
-\x53\xdb\x1a\xc7\x7f\xbb\x14\x0a\x6d\x77\x53\x19\xb4\x50\x0a\x42\
-\x19\x14\x0c\x2a\x2f\x4e\x04\xa3\x71\x78\xd0\x04\xa2\x38\x26\x6a\
-\x34\x11\x79\xd1\x48\x62\x42\xf4\xc1\xc4\x07\xa3\x18\x1f\x34\x1a\
-\xa3\x31\x3e\x38\x44\x63\x1c\x12\x13\x27\xd4\xf8\xa2\xa0\x06\xe2\
-\x00\xb1\x52\x28\x88\x22\x8a\x14\x44\x37\x2d\x94\xb6\xbb\xfb\x3c\
-\x5c\xd8\x87\x8d\x7a\xee\xf5\x9e\x7b\xce\xc9\xfd\x25\x7d\xe8\x37\
-\xed\x7f\xd6\xfe\xd6\xb7\xd6\x16\x14\x45\x51\xf8\x3f\x40\xf8\x27\
-\x85\x06\x83\x41\xde\xbf\x7f\x8f\xdb\xed\xa6\xa5\xa5\x05\xb7\xdb\
-\x8d\x2c\xcb\x54\x56\x56\x92\x97\x97\xa7\x89\xfd\xdb\x84\x86\x42\
-\x21\x3e\x7e\xfc\xa8\x8a\x6a\x6e\x6e\xc6\xe3\xf1\xe0\xf3\xf9\x88\
-\x8f\x8f\xc7\x6e\xb7\x13\x13\x13\x43\x6b\x6b\x2b\xa5\xa5\xa5\x94\
-\x97\x97\x6b\xf2\xff\x12\xa1\xb2\x2c\xe3\xf5\x7a\x79\xf3\xe6\x0d\
-\x6e\xb7\x1b\xb7\xdb\x8d\xc7\xe3\xa1\xbf\xbf\x1f\x51\x14\xb1\xdb\
-\xed\x24\x27\x27\x93\x9a\x9a\x4a\x46\x46\x06\xf1\xf1\xf1\x88\xa2\
-\xc8\xd0\xd0\x10\x97\x2e\x5d\x62\x70\x70\x90\x63\xc7\x8e\x69\x6a\
-\x0a\x92\x24\x29\x4f\x9f\x3e\xa5\xab\xab\x4b\xe3\xf8\x6f\x08\x04\
-\x02\xb4\xb5\xb5\xe1\xf1\x78\xf8\xfc\xf9\x33\x92\x24\x31\x30\x30\
-\x40\x30\x18\xc4\x6e\xb7\x93\x99\x99\x49\x62\x62\x22\x16\x8b\x05\
-\x51\x14\xb1\x58\x2c\x98\x4c\x26\x74\x3a\x1d\x00\x83\x83\x83\xd4\
-\xd6\xd6\xe2\xf5\x7a\xb9\x77\xef\x9e\xa6\xb6\xd0\xdc\xdc\xac\x94\
-\x97\x97\x63\x30\x18\x30\x1a\x8d\x1a\xe7\xaf\x22\xcb\x32\x7e\xbf\
-\x9f\x81\x81\x01\x42\xa1\x90\x6a\x8f\x8a\x8a\x42\x14\x45\xcc\x66\
-\x33\x7a\xbd\x5e\x93\x33\x96\x48\x24\x42\x4f\x4f\x0f\x81\x40\x80\
-\x5b\xb7\x6e\x61\xb7\xdb\x55\x9f\xf0\xf2\xe5\x4b\x65\xd3\xa6\x4d\
-\x54\x56\x56\x52\x50\x50\xa0\x49\xfc\xbb\x89\x44\x22\x3c\x7f\xfe\
-\x9c\x83\x07\x0f\x72\xf2\xe4\x49\x16\x2f\x5e\xac\xfa\xf4\x8a\xa2\
-\x60\x30\x18\xc8\xc9\xc9\x21\x3b\x3b\x9b\xfa\xfa\x7a\xde\xbd\x7b\
-\x87\x4e\xa7\xc3\x66\xb3\xb1\x70\xe1\xc2\x3f\x5c\x85\x70\x38\xcc\
-\xe7\xcf\x9f\x69\x6b\x6b\xc3\xeb\xf5\xe2\x70\x38\x98\x3c\x79\x32\
-\x13\x27\x4e\x1c\x1f\xaa\x41\x92\x24\x1e\x3d\x7a\x84\xd7\xeb\x45\
-\xaf\xd7\xe3\x70\x38\x28\x2a\x2a\x42\x92\x24\xfc\x7e\x3f\x2e\x97\
-\x4b\x2b\x74\x6c\xf2\xa7\x4f\x9f\x38\x74\xe8\x10\xc1\x60\x10\xab\
-\xd5\xca\xd4\xa9\x53\x29\x2e\x2e\xfe\xa1\x50\x59\x96\xf1\x78\x3c\
-\x9c\x38\x71\x82\x57\xaf\x5e\x91\x90\x90\x80\x20\x08\x28\x8a\xc2\
-\xd7\xaf\x5f\x29\x2e\x2e\xa6\xa2\xa2\x82\x49\x93\x26\x8d\x4f\x85\
-\x11\xa1\xf7\xef\xdf\xe7\xed\xdb\xb7\xf8\x7c\x3e\x2c\x16\x0b\x85\
-\x85\x85\x30\xd2\xab\x2e\x97\x4b\x13\xaf\x51\x30\x3c\x3c\x8c\x24\
-\x49\xac\x5f\xbf\x9e\x79\xf3\xe6\x61\x32\x99\x88\x89\x89\x19\x1b\
-\x02\x23\xf3\xef\xd9\xb3\x67\x54\x57\x57\x13\x15\x15\xc5\x86\x0d\
-\x1b\x98\x36\x6d\x1a\x81\x40\x80\xe8\xe8\x68\x1a\x1a\x1a\xa8\xa9\
-\xa9\xa1\xa5\xa5\x85\xaa\xaa\xaa\x1f\xb6\x54\x62\x62\x22\x15\x15\
-\x15\x48\x92\x44\x5d\x5d\x1d\xe7\xce\x9d\x43\x96\x65\x18\x11\xda\
-\xdc\xdc\x8c\x2c\xcb\x44\x45\x45\x01\xf0\xaf\xed\x36\x06\x83\xc1\
-\x80\xd3\xe9\x64\xc6\x8c\x19\x64\x67\x67\xab\x3b\x72\x94\x48\x24\
-\x42\x6b\x6b\x2b\x47\x8f\x1e\x25\x3f\x3f\x9f\xfd\xfb\xf7\xb3\x66\
-\xcd\x1a\x12\x12\x12\xb8\x7e\xfd\x3a\xb9\xb9\xb9\x6c\xdc\xb8\x91\
-\x3d\x7b\xf6\x90\x92\x92\xc2\x81\x03\x07\xe8\xee\xee\xd6\xd4\x00\
-\x88\x8d\x8d\x65\xca\x94\x29\x4c\x9f\x3e\x9d\x8c\x8c\x0c\x8d\x4f\
-\x96\x65\xfa\xfa\xfa\xe8\xe8\xe8\x50\x6d\x1a\x15\xf1\xf1\xf1\x94\
-\x94\x94\x90\x99\x99\x39\xd6\xac\xa1\xaf\xaf\x8f\x6b\xd7\xae\x11\
-\x89\x44\xd8\xb1\x63\x07\x39\x39\x39\xb8\xdd\x6e\xf6\xee\xdd\xcb\
-\xe5\xcb\x97\xd9\xb7\x6f\x1f\xdd\xdd\xdd\xcc\x9a\x35\x8b\xd5\xab\
-\x57\x13\x0e\x87\x39\x7f\xfe\xfc\xf8\x32\x2a\x7a\xbd\x9e\xec\xec\
-\x6c\x4a\x4b\x4b\x89\x8b\x8b\x43\x10\x04\xf4\x7a\x3d\x31\x31\x31\
-\xbc\x79\xf3\x46\x8d\xd3\x08\x4d\x4a\x4a\x62\xfd\xfa\xf5\xa4\xa7\
-\xa7\x8f\x35\x6b\xe8\xed\xed\xe5\xf1\xe3\xc7\x2c\x5b\xb6\x0c\xbb\
-\xdd\xce\x97\x2f\x5f\xb8\x79\xf3\x26\x0e\x87\x83\x33\x67\xce\x90\
-\x98\x98\xc8\xc5\x8b\x17\x55\x01\xc5\xc5\xc5\xdc\xbd\x7b\x97\xa1\
-\xa1\xa1\xf1\xa5\x60\x64\x74\x39\x9d\x4e\xb6\x6e\xdd\xaa\xee\x05\
-\xa3\xd1\x48\x4a\x4a\x8a\xa6\x4f\x35\x42\xa3\xa3\xa3\x49\x4a\x4a\
-\xc2\x60\x30\x8c\x35\xab\x28\x8a\x82\xcf\xe7\xa3\xa7\xa7\x87\x59\
-\xb3\x66\xa9\xf6\xe1\xe1\x61\x5a\x5a\x5a\xe8\xef\xef\xa7\xb0\xb0\
-\x90\x65\xcb\x96\x01\x20\x8a\x22\xd3\xa7\x4f\xc7\xeb\xf5\xf2\xe1\
-\xc3\x87\x31\x95\xb4\x18\x0c\x06\x92\x93\x93\xd5\xff\x46\xa3\x91\
-\xb4\xb4\x34\x5e\xbf\x7e\xad\xda\xbe\xeb\xd1\x7f\x87\x2c\xcb\x84\
-\xc3\x61\xe2\xe2\xe2\x60\xa4\x5d\xca\xca\xca\x48\x4b\x4b\xe3\xea\
-\xd5\xab\x5c\xbe\x7c\x19\xaf\xd7\x0b\x23\xab\x65\x36\x9b\x11\x04\
-\x81\xc1\xc1\xc1\x71\x95\x7e\x8e\xc9\x64\x22\x23\x23\x03\x8f\xc7\
-\x43\x20\x10\x80\x5f\x15\x2a\x08\x02\xb1\xb1\xb1\x88\xa2\xa8\x1e\
-\xb9\x92\x24\xd1\xd8\xd8\x48\x51\x51\x11\xbb\x76\xed\x22\x2f\x2f\
-\x8f\x07\x0f\x1e\xc0\xc8\x74\xf8\xf4\xe9\x93\x3a\x93\xff\x53\x62\
-\x63\x63\xc9\xc8\xc8\xc0\xe7\xf3\xd1\xde\xde\x0e\xe3\x85\x86\xc3\
-\x61\xbe\x7e\xfd\xca\x1f\xdd\x53\xac\x56\x2b\xb9\xb9\xb9\x3c\x7c\
-\xf8\x10\x00\x9d\x4e\xc7\xc0\xc0\x00\xa7\x4f\x9f\xe6\xc2\x85\x0b\
-\x3c\x7b\xf6\x8c\xac\xac\x2c\x00\xfa\xfb\xfb\x79\xfa\xf4\x29\xf9\
-\xf9\xf9\x24\x24\x24\x8c\xab\xf4\x3b\xa3\xcf\x1d\x45\xa7\xd3\x61\
-\xb5\x5a\xb1\xd9\x6c\xea\xeb\xd7\x08\xed\xec\xec\x64\xdf\xbe\x7d\
-\xbc\x78\xf1\x62\xac\x59\x43\x52\x52\x12\x8b\x17\x2f\xa6\xa6\xa6\
-\x86\xba\xba\x3a\x2c\x16\x0b\xa5\xa5\xa5\x94\x95\x95\xd1\xd8\xd8\
-\xc8\xa6\x4d\x9b\x58\xb5\x6a\x15\x81\x40\x80\xfa\xfa\x7a\x1e\x3e\
-\x7c\xc8\xda\xb5\x6b\x7f\x78\x68\x30\x22\xb2\xa1\xa1\x81\xca\xca\
-\x4a\x86\x87\x87\x55\xbb\xd1\x68\x24\x3d\x3d\xfd\x77\xa1\x82\x20\
-\xa8\x4e\xbf\xdf\x4f\x63\x63\x23\xbd\xbd\xbd\xaa\x6d\x3c\x46\xa3\
-\x91\xa2\xa2\x22\xe6\xce\x9d\x4b\x75\x75\x35\x2e\x97\x8b\xd4\xd4\
-\x54\x4a\x4a\x4a\xa8\xaa\xaa\x62\xe9\xd2\xa5\x58\xad\x56\x9e\x3c\
-\x79\xc2\xa9\x53\xa7\x58\xb0\x60\x01\xf3\xe7\xcf\x1f\x5f\x46\x65\
-\xf4\x4a\xf8\xea\xd5\x2b\x42\xa1\x10\x8a\xa2\x10\x89\x44\x90\x65\
-\x19\xa3\xd1\xa8\x8e\x28\x3d\x23\xbd\x37\x8a\x24\x49\xdc\xbb\x77\
-\x8f\xee\xee\x6e\x6c\x36\x1b\x8b\x16\x2d\xd2\x0c\x7d\x41\x10\xb0\
-\xdb\xed\x6c\xdb\xb6\x8d\x2b\x57\xae\xb0\x7b\xf7\x6e\xf2\xf3\xf3\
-\xc9\xce\xce\x26\x14\x0a\x71\xf6\xec\x59\x5c\x2e\x17\x1d\x1d\x1d\
-\x2c\x59\xb2\x84\x95\x2b\x57\x22\x8a\xa2\x9a\x3f\x8a\x24\x49\xd4\
-\xd6\xd6\xd2\xd5\xd5\x45\x53\x53\x13\x8c\x4c\x15\x80\x8e\x8e\x0e\
-\x76\xee\xdc\x49\x38\x1c\xa6\xb8\xb8\x18\xc6\x1f\xa1\xa3\xcb\xdd\
-\xd4\xd4\x44\x5b\x5b\x1b\x99\x99\x99\xcc\x99\x33\xe7\xbb\x07\xe9\
-\xf5\x7a\x9c\x4e\x27\x9b\x37\x6f\xa6\xa0\xa0\x80\xa6\xa6\x26\x5c\
-\x2e\x17\xbd\xbd\xbd\x24\x27\x27\xe3\x74\x3a\x29\x29\x29\x61\xe6\
-\xcc\x99\x3f\xed\xcd\xfe\xfe\x7e\xae\x5d\xbb\x86\xd7\xeb\x25\x10\
-\x08\x90\x97\x97\xa7\x8e\xc5\x09\x13\x26\xb0\x65\xcb\x16\x66\xcc\
-\x98\xa1\x6e\x42\xe1\xe5\xcb\x97\x4a\x79\x79\x39\x47\x8e\x1c\x61\
-\xe6\xcc\x99\x74\x74\x74\xa8\xc3\x39\x2e\x2e\x8e\xac\xac\xac\x9f\
-\xf6\x97\xa2\x28\x04\x83\x41\xfa\xfa\xfa\xf0\xfb\xfd\x0c\x0f\x0f\
-\x13\x17\x17\x87\xc5\x62\xc1\x6a\xb5\x12\x1d\x1d\x3d\x3e\x45\x65\
-\x68\x68\x08\x8f\xc7\x43\x38\x1c\x46\x10\x04\x8c\x46\x23\x99\x99\
-\x99\x3c\x7a\xf4\x88\xed\xdb\xb7\x73\xe3\xc6\x0d\x9c\x4e\xa7\x1a\
-\x2f\xbc\x78\xf1\x42\x59\xb7\x6e\x1d\x65\x65\x65\x1a\xc7\x3f\x41\
-\x24\x12\xa1\xa5\xa5\x85\xdb\xb7\x6f\x73\xe7\xce\x1d\xed\xc5\xb9\
-\xbd\xbd\x5d\xd9\xbd\x7b\x37\xdf\xbe\x7d\x43\x51\x14\xba\xba\xba\
-\x48\x4a\x4a\xc2\x62\xb1\x68\x8a\x8c\x45\x51\x14\xfc\x7e\x3f\x9d\
-\x9d\x9d\x04\x83\x41\xd5\xae\xd3\xe9\x30\x9b\xcd\xa4\xa5\xa5\xa9\
-\xb7\x9e\x5f\x25\x14\x0a\x61\xb3\xd9\x38\x71\xe2\x84\xe6\x84\x14\
-\x02\x81\x80\xf2\xee\xdd\x3b\xfc\x7e\x3f\xef\xdf\xbf\xe7\xf8\xf1\
-\xe3\xcc\x9e\x3d\x9b\x15\x2b\x56\xc0\x88\xa8\xc1\xc1\x41\xda\xda\
-\xda\xd4\x0f\xb5\xd6\xd6\x56\x3a\x3b\x3b\x11\x04\x01\xa7\xd3\x49\
-\x4e\x4e\x0e\xb9\xb9\xb9\x64\x65\x65\xe1\x70\x38\x30\x99\x4c\x9a\
-\x0d\xfa\x2b\x08\x82\x80\x28\x8a\xdf\xbd\x5d\xcd\x57\xe8\x87\x0f\
-\x1f\xa8\xae\xae\xc6\xe7\xf3\xb1\x7c\xf9\x72\x5a\x5b\x5b\x69\x6e\
-\x6e\xa6\xbd\xbd\x9d\x70\x38\x8c\xc3\xe1\x20\x25\x25\x05\x9b\xcd\
-\x46\x6a\x6a\x2a\xe9\xe9\xe9\x88\xa2\xa8\xfe\xcc\x66\xb3\x7a\xb4\
-\xfe\xaf\xd1\x08\xfd\xf6\xed\x1b\x97\x2e\x5d\xe2\xf0\xe1\xc3\x14\
-\x16\x16\x62\xb7\xdb\x99\x34\x69\x12\x76\xbb\x9d\xf4\xf4\x74\x2c\
-\x16\x0b\x16\x8b\x05\xb3\xd9\x8c\x28\x8a\x7f\x99\xa8\x1f\xa1\x11\
-\x2a\xcb\x32\xbd\xbd\xbd\x78\x3c\x1e\x4c\x26\x93\x66\xa5\xfe\xec\
-\x17\xea\x9f\xe5\x37\xf1\x9b\x53\x87\xf1\xbe\x1d\x14\x00\x00\x00\
-\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x09\x11\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x1f\x08\x06\x00\x00\x00\x91\x74\x5f\x45\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x08\xa6\x49\x44\x41\x54\x58\x47\xad\x98\xdb\x73\
-\x1b\xd5\x1d\xc7\x3f\xab\x5d\x59\x17\x4b\x72\x24\x4b\x96\x63\x59\
-\x96\x6d\xd9\x4e\x4c\x88\x5d\xb0\x0d\xa1\x69\x27\xc5\x09\xb1\x03\
-\x9d\x42\x4b\xd2\x40\x29\xa1\x3c\xb4\xe5\x2f\xe8\xb4\x6f\xfd\x0f\
-\xda\xe9\x0b\x85\x34\x4c\xa1\x74\x68\x71\x1c\xe8\x4c\xa1\x4d\x03\
-\x43\xec\x5c\x4a\x12\x77\x92\x92\x00\x49\x2c\x4b\x0e\xf8\x1a\xcb\
-\x92\x75\xb1\xa4\xd5\x4a\xda\x3e\x48\x59\x4b\xbe\x91\x4c\xf9\xcc\
-\xf8\xe1\xac\x7e\xbb\xe7\x7b\xce\xf9\xdd\x8e\x85\xcb\x97\x2f\xab\
-\xdc\x23\x8a\xa2\x20\xcb\x32\x4a\x36\x0b\x82\x80\x5e\xaf\xc7\x64\
-\x32\x21\x8a\xe2\x6a\x53\x8d\x6c\x36\x8b\x2c\xcb\x88\xa2\x88\xd1\
-\x68\x44\xa7\xd3\xad\x36\xd9\x14\xe1\x6e\x85\x2a\x8a\xc2\x7f\xaf\
-\x5c\x61\xe4\xa3\xd3\x84\x82\x41\x64\x59\x46\x55\x55\x10\x40\x40\
-\xa0\xca\x60\xa0\xb3\x73\x3b\xfd\xfb\x1e\xa3\xad\xbd\x8d\xaa\xaa\
-\xaa\x8a\xf7\xaf\x5c\xb9\xc2\x89\xa1\xe3\xcc\xce\xcc\x60\xb3\xd9\
-\xe8\xe9\xed\xe5\xd1\xbd\xfd\xb8\xeb\xeb\xef\x4a\xf4\x5d\x09\x4d\
-\x24\x12\xbc\xfd\xd6\x5b\x5c\xb8\x70\x91\x44\x3c\x4e\x2e\x97\x2b\
-\x8a\x2c\x43\x10\x04\x24\x49\xc2\x68\x32\xf2\xe4\x53\xdf\xa7\x7f\
-\xdf\x5e\x6c\x36\x9b\xf6\xfb\xd8\xd8\x18\x7f\x7e\xe3\x4f\x7c\xf9\
-\xc5\x17\x08\x42\x71\x61\x75\x75\x2e\x0e\x1d\x3e\xcc\x83\x3d\x3d\
-\x18\x8d\xc6\x8a\xef\xad\xe6\x2b\x97\x12\x8f\xc5\x79\xf3\xf5\x37\
-\x18\x1d\x19\x25\x1a\x89\xa0\x28\xca\x1a\x91\x00\xaa\xaa\xa2\x28\
-\x0a\x89\x78\x82\xe1\xa1\x21\x3e\xf8\xd7\x29\xe2\xb1\xd8\x6a\x33\
-\x28\xd9\xca\x99\x0c\xd3\x53\xd3\xfc\xf1\xd8\x6b\x8c\x5d\xba\x84\
-\x2c\xcb\xab\xcd\x2a\x10\x5f\x7a\xe9\xa5\x5f\xaf\x7e\x78\x87\x5c\
-\x2e\xc7\x5f\xff\xf2\x17\xce\x9f\x3d\xcb\xf2\xf2\xb2\x26\xd0\xed\
-\x76\x33\x70\xe0\x00\xfb\x07\x07\xd9\xfd\xad\xdd\xd8\x1d\x0e\xc2\
-\xe1\x05\x32\xe9\x8c\xf6\x5e\x28\x14\xc2\xe5\xaa\xa3\x7e\xeb\xd6\
-\xa2\x0f\x1b\x8d\x34\x7a\xbd\x88\xa2\x8e\xc8\x62\x84\x6c\x36\x8b\
-\xaa\xaa\x64\x32\x19\xa6\xbe\xfc\x92\xf6\xf6\x76\x9c\x4e\xe7\x2a\
-\x05\x2b\x6c\x2a\x74\x6c\x6c\x8c\x0f\x4f\x7d\x40\x78\x61\x01\x55\
-\x55\x31\x1a\x8d\x0c\x1c\x38\xc0\x8f\x5f\x38\x42\x5f\x5f\x2f\x4d\
-\xbe\x26\x3c\x1e\x0f\x3b\x76\xdc\xc7\x37\x1e\x78\x80\x74\x3a\xcd\
-\xc2\xc2\x02\xb9\x5c\x8e\x6c\x36\x4b\x34\x1a\xa5\xa3\xa3\x03\x87\
-\xc3\x81\xd1\x68\xc4\xed\x76\xd3\xd5\xdd\xcd\xce\xae\x2e\x66\x66\
-\xa6\x89\x44\x22\xa8\xaa\x4a\x32\x99\xc4\x6a\xb5\xd1\xe8\xf5\x62\
-\x32\x99\x56\xcb\x80\xaf\x3a\xfa\xb1\x8b\x97\x98\x9f\x9b\xd3\x76\
-\xf2\xb1\x81\xfd\x3c\xfe\xdd\x27\xf0\x7a\xbd\x18\x4d\x26\xf4\x7a\
-\x7d\x71\xb7\xcc\x66\x9a\x5b\x5a\x78\xee\xf9\xe7\xd9\xde\xd9\xa9\
-\x45\x7f\x28\x18\x24\x14\x0c\x92\xc9\x64\x34\x1f\xae\xae\xae\xa6\
-\xbd\xa3\x83\x1f\x1c\x3c\x48\xa3\xd7\x0b\x40\xa1\x50\xe0\xda\x27\
-\x9f\x10\x89\x44\x2a\xe6\x2f\x67\x43\xa1\xf3\xf3\xf3\xcc\xcd\xce\
-\x6a\xbe\xd3\xea\xf7\xf3\xf0\xae\x5d\xb8\x5c\xae\x75\xa3\x54\xa7\
-\xd3\xe1\x74\x39\xe9\xdf\xbb\x97\xfa\xfa\x7a\x00\xf2\xf9\x3c\x81\
-\xc0\x04\xf1\x58\xbc\xc2\x56\x14\x45\xba\xba\xbb\xe9\xec\xec\xd4\
-\x76\x30\x14\x0a\x11\x8d\x44\x28\x14\x0a\x15\xb6\x77\x58\x3b\x63\
-\x89\xc5\x70\x98\x74\x3a\xad\x8d\x3b\x3b\x3b\x37\x14\x79\x07\x41\
-\x10\xd8\x71\xff\x0e\x1c\x0e\x87\xf6\x6c\x7e\x6e\x8e\x54\x3a\x55\
-\x61\x07\x20\x49\x12\x2d\xfe\x56\xac\xa5\xcc\x90\xcf\xe7\x89\x46\
-\xa2\x64\xb3\xd9\xd5\xa6\xb0\x99\xd0\x4c\x46\x26\x9f\xcb\x69\x63\
-\x8b\xd5\x82\x5e\xaf\xaf\xb0\x59\x0f\xab\xcd\x46\xb5\xc5\xa2\x1d\
-\x7f\x22\x1e\x2f\x16\x86\x75\x30\x1a\x8d\x48\x65\x45\x42\x51\x94\
-\x7b\xdf\x51\xa3\xd1\x80\x28\x49\xda\x38\x99\x4c\xa2\x28\x4a\x85\
-\xcd\x7a\x64\xe5\x2c\x99\x4c\x86\x7c\x3e\x0f\x80\xc1\x60\xd8\xb0\
-\x62\x2d\xdc\x5e\xa8\x38\x35\xab\xd5\xba\xe1\x66\x6c\x28\xd4\xe1\
-\x70\x60\x30\x18\xb4\x71\x30\x30\x41\x2c\x5e\xe9\x6b\xeb\x11\x08\
-\x04\x88\x2d\x2d\x69\x63\x87\xd3\x89\x61\x9d\x64\x1e\x89\x44\xb8\
-\x76\xf5\x2a\xb1\x52\xae\xdd\x62\xb7\x63\x77\x38\xee\x5d\x68\x9d\
-\xdb\x8d\xd3\xe9\x44\x2a\xed\xea\xf8\xf8\x38\x37\xaf\x5f\x27\x95\
-\x5a\xeb\x6f\x77\x50\x14\x85\xf3\xe7\xce\x32\x3f\x3f\xaf\x3d\xf3\
-\xfb\x5b\xa9\x29\xab\x50\x00\xe9\x74\x9a\x77\x8e\x1f\x27\x30\x3e\
-\xae\x1d\x75\xc7\xb6\x6d\xd8\x1d\xf6\x0a\xbb\x72\x36\x14\xaa\xd3\
-\xe9\x78\xa0\xe7\x41\x9c\x2e\x17\x94\x92\xf8\x89\xe1\x61\xc6\x2e\
-\x5e\x22\x93\x29\x26\xf6\x72\xb2\xd9\x2c\xef\x9e\x38\xc1\xa5\x0b\
-\x17\xb5\xe3\x74\xd7\xd7\xd3\xde\xd1\x41\xb5\xc5\x02\x80\x9c\x91\
-\xf9\xf7\xf9\xf3\xfc\xee\x37\xbf\xe5\xcc\xe8\x19\x6d\xd1\x35\x35\
-\x35\xec\xf9\xce\x1e\xdc\x6e\x77\xc5\x37\xcb\xd9\xb4\xd6\xa7\x52\
-\x29\x8e\xfe\xfe\x15\x2e\x7c\xfc\x31\xd9\x6c\x16\x41\x10\xb0\xda\
-\x6c\x3c\xf4\xd0\x43\xf4\xf4\xf6\xe2\x6f\xf3\x23\xcb\x32\x13\x81\
-\x00\x67\xcf\x9c\xe5\xc6\xf5\xeb\x24\x93\x49\x2d\xef\x3e\xf3\xa3\
-\x67\xd9\x3f\x38\x88\xcd\x66\xe3\x1f\xef\xbd\xcf\x87\xa7\x4e\xb1\
-\xb0\xb0\x40\x46\xce\x90\xcf\xe5\x51\x55\x15\x41\x10\x38\xfc\xcc\
-\x33\xec\x3f\x30\x48\x4d\x4d\xcd\x6a\x09\x1a\x9b\x0a\x05\x98\x0c\
-\x4d\xf2\xca\xcb\x2f\x33\x7e\xf3\x26\xa8\x80\x00\x7a\xbd\x9e\x2a\
-\x83\x01\xbd\x24\x15\x6b\x7c\x2e\x47\x36\x93\x21\x97\x5f\x99\xfc\
-\x9b\xbb\x77\x73\xe8\xf0\x0f\x69\xf4\x7a\x11\x04\x81\x13\xc3\xc3\
-\xbc\xff\xf7\xf7\x58\x8a\x46\x2b\xbe\xef\x74\x3a\x39\xf2\xe2\x8b\
-\xf4\xf6\xf5\xae\xe9\xb8\xca\xd9\xf0\xe8\xef\xe0\x72\x39\xd9\xd9\
-\xdd\xc5\x96\x2d\x35\x20\x14\x9f\x29\x8a\xc2\x72\x32\xc9\xd2\xd2\
-\x12\xb1\x58\x8c\xd4\xf2\x32\xb9\x52\x94\x0b\x82\x80\xa3\xb6\x96\
-\xfb\xee\xdf\x81\xdd\xe1\x40\x10\x8a\x2f\x6d\xb4\x1b\x91\x48\x84\
-\xd7\x8e\x1e\xe5\xf8\xdb\x6f\xb3\xb8\xb8\xb8\xfa\x67\x8d\x4d\x6b\
-\xfd\xf9\x73\xe7\x38\x76\xf4\x0f\xfc\xe7\xd2\x18\xa9\x54\x6a\xdd\
-\xae\x69\x3d\x64\x59\xe6\xfa\xe7\x9f\x13\x18\x1f\xa7\xb6\xb6\x16\
-\xbb\xdd\xce\xdc\xdc\x1c\xa1\x60\x90\xe5\x32\xd7\xa0\xd4\x49\x65\
-\x32\x19\x42\xc1\x10\xb7\x26\x27\x71\xbb\xdd\xd8\xed\xf6\x35\x85\
-\x65\xdd\xa3\x4f\x2d\xa7\xf8\xdb\xbb\xef\x30\x3a\x32\xc2\xe2\x62\
-\x84\x42\x69\xb7\xca\xd1\x4b\x12\xa2\xbe\x98\x11\x72\x4a\x8e\x7c\
-\xe9\xd8\xcb\x91\x24\x09\x47\x6d\x2d\x4f\x1f\x3a\xc8\x83\x3d\x3d\
-\xe8\x74\x3a\xf2\xf9\x3c\xb3\x33\x33\x7c\xfe\xe9\x67\x9c\x19\x1d\
-\x65\x76\x76\x56\x8b\x7c\x49\x92\x68\xf2\xf9\xf8\xe9\xcf\x7f\x46\
-\x7b\x47\x47\xc5\xb7\xd6\x08\x4d\xa7\xd3\xbc\xf9\xfa\x1b\x9c\x3f\
-\x77\xae\x22\x30\x24\x49\xa2\xb7\xaf\x8f\x9e\xde\x1e\xda\x3b\x3a\
-\x30\x57\x57\x97\x3c\x41\x40\x45\x25\xb2\xb8\xc8\xc4\xc4\x04\xe7\
-\xce\x9c\x65\x22\x10\xd0\x7a\x04\x41\x10\x30\x99\xcd\x1c\x3c\x74\
-\x88\x47\xf7\xf6\x63\xb5\x5a\xc9\xe7\xf3\x28\x8a\xc2\x52\x34\xca\
-\xc9\x7f\x9e\x64\xf4\xf4\x69\x2d\x9f\xea\x44\x1d\xbb\x1e\x79\x84\
-\xc3\xcf\x3e\x8b\xc7\xe3\xd1\x74\xad\x39\xfa\xe1\xa1\x21\x46\x47\
-\x46\x49\x24\x12\x9a\xc8\xc6\xc6\x46\x9e\x3b\xf2\x3c\x8f\x3f\xf1\
-\x04\xfe\xf6\x36\xb6\xd8\xed\x98\xcd\x66\x4c\x26\x93\xf6\xb7\xc5\
-\x6e\xc7\xe7\xf3\xf1\xf0\x23\xbb\xb0\xda\x6a\x98\x9e\x9a\xd2\xd2\
-\x8f\xa2\x28\x4c\x4e\x4e\xd2\xe0\x69\xa0\xbe\xbe\x1e\xbd\x5e\x5f\
-\xec\xa4\x2c\x16\xb6\x6d\xdf\x8e\xd5\x56\xc3\xd4\xd4\x94\xe6\x16\
-\x73\xb3\x73\xd8\xed\x0e\x3c\x8d\x8d\x5a\xd1\xa9\x10\x3a\xf2\xd1\
-\x69\x4e\x9d\x3c\x49\x38\x1c\xd6\x44\x3e\xbc\x6b\x17\x47\x7e\xf2\
-\x02\x3b\xbb\xba\xa8\xae\xae\x46\x92\x24\x2d\x40\xca\x11\x04\x01\
-\x51\x14\x31\x18\x0c\xf8\x9a\x7d\xb4\xfa\xfd\xcc\xcf\xcd\x11\x8d\
-\x46\x51\x55\x95\xac\x2c\x33\x3d\x3d\x4d\x5b\x7b\x1b\xb5\xa5\x06\
-\x59\x28\x5d\x0c\xbd\x4d\x5e\x44\x9d\xc8\x54\x69\x71\x85\x42\x81\
-\xdb\xf3\xf3\x74\xde\xd7\xa9\xe5\x71\x4d\xe8\xd2\xd2\x12\xc3\x43\
-\x43\x04\x02\x01\x4d\xe4\xb7\xf7\xec\xe1\xe9\x43\x07\xf1\x35\x37\
-\xa3\xd7\xeb\xd7\x15\xb8\x1e\x92\x24\x51\x5b\x5b\x4b\xab\xdf\x4f\
-\x28\x18\x22\x52\x8a\xe6\x44\x22\x81\xc9\x6c\xc2\xdb\xd4\x84\xd9\
-\x6c\xd6\xec\x45\x51\xc4\xd7\xec\xe3\xf6\xfc\x6d\x66\x66\x66\xc8\
-\x29\x0a\xa9\x54\x0a\x8b\xc5\x82\xd7\xeb\xc5\x64\x36\xaf\xa4\xa7\
-\x91\x8f\x4e\x73\x6b\x72\x52\x73\x6c\x7f\x5b\x1b\xfb\x07\xf6\xe3\
-\x6d\x6a\xda\xb0\xa9\xd8\x0c\x49\x92\x68\x6e\x69\xe1\x7b\x4f\x3d\
-\x89\xa7\xb1\x11\x4a\x0d\xf2\x99\x91\x51\x6e\x4d\xde\x5a\xd3\x25\
-\x19\x0c\x06\xfa\xf7\xf6\xd3\xd0\xd0\xa0\xd9\x7e\xf6\xd9\xa7\x44\
-\x4b\x79\x57\x47\xa9\x15\xbb\x76\xf5\x13\x96\x4a\xcd\x44\x55\x55\
-\x15\x03\x83\x83\xb4\xb4\xb6\xae\x49\x13\xf7\x82\x4e\xa7\xa3\xb7\
-\xaf\x8f\x9d\x3b\x77\x6a\x3b\x18\x8b\xc5\xf8\xf4\xda\x55\x6d\xae\
-\x72\x5a\x5a\x5b\x69\x6e\x6e\xd6\xfc\x32\x18\x0c\x69\xae\xa3\x03\
-\xb8\x71\xe3\x06\xe1\x70\x58\x5b\x65\x6f\x5f\x1f\xdb\xb6\x6f\xfb\
-\xca\x2b\xec\xdd\xa0\xd7\xeb\xe9\xdf\xb7\x8f\x86\x52\x04\xab\xaa\
-\xca\xcd\xeb\x37\xd6\x15\x2a\x8a\x22\x6d\x1d\xed\x5a\x29\xcd\xe7\
-\x72\x24\x12\x09\x14\x45\x29\x0a\xbd\x79\xe3\x26\x4b\xd1\x95\x17\
-\xbb\xba\xbb\x37\xbd\x11\xde\x2b\xbe\x66\x1f\x9e\x46\x8f\x56\x22\
-\xc7\xc7\xc7\x2b\x5a\xc1\x72\x3c\x1e\x0f\xd5\x96\x6a\x6d\x2c\x67\
-\x64\xf2\xf9\x7c\x51\x68\x38\x1c\xd6\x3a\x22\xa7\xcb\xc5\xd6\x86\
-\xad\x54\x95\xf5\xa2\xff\x2f\xa2\x28\xe2\xf7\xb7\x69\xff\x90\xc8\
-\xe5\x72\x84\x17\x56\xe6\x2c\xc7\x6e\x77\x60\x30\xac\x9c\xa4\xa2\
-\x64\x29\x14\x0a\x45\xa1\xcb\xcb\x2b\xdd\x7b\x4d\x4d\x0d\x06\x83\
-\xf1\xae\x23\xfc\x6e\x71\xd6\xb9\x30\x96\x5d\x85\x63\xf1\xf8\xba\
-\xf7\x23\xb7\xdb\xcd\x2f\x7e\xf5\x4b\x5e\x3d\x76\x8c\x57\x8f\x1d\
-\xe3\xb1\x81\x01\xcc\x66\x73\xb1\x32\x05\x27\x82\xc4\x4b\xdd\xbb\
-\xc5\x52\x8d\xc7\xe3\xc1\x54\x96\x3e\xbe\x0e\x92\x89\x24\xd3\xd3\
-\xd3\x5a\xaf\x5a\xe7\xae\xc3\xe5\x72\x6d\xd8\xd1\xaf\x46\xb8\x7c\
-\xf9\xb2\x5a\xc8\x17\x56\xea\xb4\x50\x8c\xd6\xaf\x7b\x47\x55\x55\
-\x2d\x06\xeb\x9d\x69\x74\xc2\x3d\x65\x94\xff\x01\xe2\xd6\xd8\xb1\
-\xb2\x53\x59\x1e\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x0d\xac\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xc5\xc3\xc9\x5b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0d\x41\x49\x44\x41\x54\x58\x47\xcd\x98\xd9\x53\
-\x93\x67\xf4\xc7\x3f\x6f\xf6\x17\x12\x93\x40\x0c\x10\xf6\x20\x8b\
-\x48\xc1\x22\x88\x10\x41\x10\xb0\x88\x4b\x7b\xd3\x5e\x39\x9d\x71\
-\x7a\xd3\xbb\xfe\x0b\xbf\x9b\x5e\x3a\xd3\x9b\xde\xf5\xca\x6d\xaa\
-\xd4\xba\xd4\xad\x83\x8a\x3a\x02\x0a\x18\xa1\x0e\x45\x3a\x24\x2c\
-\x86\xdd\x10\x12\x88\x09\x59\x7f\x17\xc2\xfb\x93\xcd\xea\xf4\xe6\
-\xf7\x9d\x79\x66\x32\xef\x72\xde\x4f\xce\x73\x9e\x73\xce\xf3\x08\
-\x2f\x5e\xbc\x88\xf3\xff\x4c\xf1\xf8\x3b\x24\x41\x10\xa4\x6b\xc2\
-\x7f\x05\xf5\x78\x3c\xfc\xfe\xfb\xef\x38\x1c\x0e\xe9\x03\xef\xab\
-\xbe\xbe\x9e\x9a\x9a\x1a\x74\x3a\xdd\xc6\x5b\x9f\x24\xd9\xc6\x0b\
-\x9f\x2a\x8f\xc7\xc3\xd3\xa7\x4f\x51\x28\x14\xe4\xe5\xe5\xad\x1b\
-\x33\x33\x33\x0c\x0e\x0e\xb2\xbc\xbc\xbc\xf1\xb5\x4f\xd6\x7f\x06\
-\x0d\x87\xc3\x04\x83\x41\x2a\x2b\x2b\x39\x71\xe2\x04\x27\x4f\x9e\
-\x94\x46\x56\x56\x16\xe1\x70\x98\x68\x34\xba\xf1\xb5\x4f\xd6\xbf\
-\x82\xfa\xfd\x7e\xc6\xc6\xc6\xb6\xf5\xca\xda\x74\xeb\xf5\x7a\x76\
-\xee\xdc\xb9\x6e\x88\xa2\xb8\xee\x99\x8d\x72\xbb\xdd\xb8\x5c\x2e\
-\x82\xc1\xe0\xc6\x5b\x9b\xf4\x41\xd0\xe5\xe5\x65\xda\xda\xda\x38\
-\x73\xe6\x0c\x7f\xfe\xf9\x27\x5e\xaf\x77\xe3\x23\x92\x04\x41\x40\
-\x26\x93\x21\x08\xc2\x96\x63\xa3\x66\x66\x66\x38\x7f\xfe\x3c\x67\
-\xce\x9c\xa1\xab\xab\x8b\xb7\x6f\xdf\x6e\x7c\x64\x9d\xb6\x05\xf5\
-\xf9\x7c\xb4\xb5\xb5\x61\xb7\xdb\x31\x9b\xcd\x3c\x7c\xf8\x90\xdb\
-\xb7\x6f\xb3\xb0\xb0\x00\xc0\xe2\xe2\x22\x9d\x9d\x9d\x5c\xb9\x72\
-\x85\xa9\xa9\xa9\x8d\xaf\x03\x20\x93\xc9\x78\xf9\xf2\x25\x37\x6e\
-\xdc\x60\x60\x60\x40\x82\x99\x9c\x9c\xe4\xec\xd9\xb3\xbc\x7e\xfd\
-\x1a\x51\x14\xb9\x76\xed\x1a\x4f\x9e\x3c\xf9\x20\xac\xfc\xfb\xef\
-\xbf\xff\x9f\x8d\x17\xdf\x87\x6c\x68\x68\xa0\xb9\xb9\x19\xb9\x5c\
-\xce\x93\x27\x4f\xf0\xf9\x7c\x38\x9d\x4e\xae\x5f\xbf\x4e\x67\x67\
-\x27\x2b\x2b\x2b\x54\x55\x55\x51\x5d\x5d\x8d\x5e\xaf\x5f\x67\x47\
-\xa5\x52\x11\x08\x04\x70\x38\x1c\xf4\xf4\xf4\xe0\x74\x3a\xf1\xf9\
-\x7c\xdc\xbc\x79\x93\x37\x6f\xde\x70\xf4\xe8\x51\xea\xea\xea\x70\
-\xbb\xdd\x3c\x7d\xfa\x14\x51\x14\x49\x4d\x4d\x45\xa5\x52\xad\xb3\
-\xc3\x56\xe9\xc9\xeb\xf5\xd2\xd6\xd6\x46\x5f\x5f\x1f\x4d\x4d\x4d\
-\x1c\x3e\x7c\x18\xbd\x5e\x8f\xc7\xe3\xe1\xde\xbd\x7b\x74\x74\x74\
-\x00\x60\xb5\x5a\x29\x29\x29\xc1\x62\xb1\x60\x36\x9b\x49\x4a\x4a\
-\x22\x14\x0a\xb1\xb4\xb4\x84\x5c\x2e\x97\xd2\xd1\x9b\x37\x6f\x98\
-\x9f\x9f\x67\x7c\x7c\x9c\xc1\xc1\x41\x26\x26\x26\x10\x45\x91\x93\
-\x27\x4f\x72\xe0\xc0\x01\x12\x13\x13\x71\xb9\x5c\xfc\xf6\xdb\x6f\
-\x8c\x8c\x8c\xf0\xd5\x57\x5f\x71\xf0\xe0\x41\x12\x13\x13\xdf\xc7\
-\xda\x0c\x7a\xee\xdc\x39\xee\xdf\xbf\x4f\x53\x53\x13\x2d\x2d\x2d\
-\x24\x27\x27\x23\x08\x02\xf1\x78\x1c\xb7\xdb\x8d\xdd\x6e\x47\xad\
-\x56\x93\x99\x99\x89\x4e\xa7\x63\x74\x74\x94\xc1\xc1\x41\xc6\xc6\
-\xc6\xf0\xf9\x7c\x84\x42\x21\x64\x32\x19\x2a\x95\x0a\xa3\xd1\x48\
-\x7e\x7e\x3e\xa5\xa5\xa5\x24\x27\x27\xe3\x76\xbb\x71\x3a\x9d\x98\
-\x4c\x26\x76\xef\xde\x8d\x4e\xa7\x43\x10\x04\x62\xb1\x18\x13\x13\
-\x13\x5c\xb8\x70\x81\xf1\xf1\x71\x4e\x9f\x3e\x4d\x45\x45\x05\x4a\
-\xa5\x52\xe2\x52\xbc\x0f\x09\x60\x34\x1a\x09\x04\x02\xb0\x3a\x75\
-\x6b\x0b\x41\x10\x04\x92\x93\x93\xb1\xd9\x6c\x04\x83\x41\xfa\xfb\
-\xfb\xe9\xec\xec\x24\x18\x0c\xb2\x63\xc7\x0e\xd2\xd2\xd2\x28\x2a\
-\x2a\xc2\x68\x34\x12\x0e\x87\xf1\xf9\x7c\x2c\x2c\x2c\x30\x32\x32\
-\x42\x6f\x6f\x2f\x99\x99\x99\x1c\x3a\x74\x88\x03\x07\x0e\xa0\xd5\
-\x6a\xd7\xd9\x96\xc9\x64\xe8\x74\x3a\x82\xc1\x20\x72\xb9\x1c\x51\
-\x14\x91\xc9\xd6\x2f\x9f\x4d\x31\x9a\x94\x94\x44\x3c\x1e\xa7\xb7\
-\xb7\x17\x8d\x46\x83\xc5\x62\x91\x62\x46\x10\x04\x16\x16\x16\xb8\
-\x72\xe5\x0a\xed\xed\xed\x24\x25\x25\x51\x57\x57\x47\x71\x71\x31\
-\x7a\xbd\x9e\x48\x24\xc2\xfc\xfc\x3c\xa1\x50\x08\x83\xc1\x40\x6e\
-\x6e\x2e\xc5\xc5\xc5\x18\x0c\x06\x5e\xbe\x7c\x49\x77\x77\x37\xa2\
-\x28\x92\x99\x99\x89\x5a\xad\x96\xbe\xe9\xf5\x7a\xb9\x7c\xf9\x32\
-\x53\x53\x53\xb4\xb6\xb6\xb2\x77\xef\x5e\x34\x1a\xcd\x7b\x54\x5b\
-\x4c\x7d\x3c\x1e\x67\x6e\x6e\x8e\x3f\xfe\xf8\x83\x81\x81\x01\x5a\
-\x5b\x5b\xa9\xad\xad\x45\xab\xd5\xe2\x72\xb9\xb8\x78\xf1\x22\xc3\
-\xc3\xc3\xd8\x6c\x36\xca\xcb\xcb\x71\x38\x1c\xd8\xed\x76\xe6\xe6\
-\xe6\x88\x44\x22\x28\x95\x4a\x62\xb1\x18\x91\x48\x44\xfa\xa3\xf5\
-\xf5\xf5\x68\x34\x1a\xda\xdb\xdb\x19\x1b\x1b\xe3\x8b\x2f\xbe\xa0\
-\xa9\xa9\x09\x83\xc1\x20\x41\x0e\x0e\x0e\xd2\xdc\xdc\x8c\xcd\x66\
-\x43\xaf\xd7\x6f\x4a\x69\x9b\x3c\x2a\x08\x02\x09\x09\x09\xa4\xa5\
-\xa5\xd1\xdd\xdd\xcd\xe2\xe2\x22\x45\x45\x45\x28\x14\x0a\x2e\x5d\
-\xba\x84\xc3\xe1\xa0\xa5\xa5\x85\xa2\xa2\x22\x3a\x3b\x3b\xe9\xed\
-\xed\xc5\x6c\x36\x53\x59\x59\x49\x55\x55\x15\x95\x95\x95\x94\x95\
-\x95\x51\x54\x54\x84\xd9\x6c\x66\x7a\x7a\x1a\xbb\xdd\x8e\x4e\xa7\
-\xa3\xaa\xaa\x8a\x48\x24\x42\x77\x77\x37\x26\x93\x09\x8b\xc5\x82\
-\xd3\xe9\xa4\xad\xad\x8d\xf2\xf2\x72\x1a\x1b\x1b\x49\x4a\x4a\xda\
-\x04\xc9\x56\x31\xca\x6a\xcc\x04\x02\x01\x96\x97\x97\x29\x2d\x2d\
-\x45\xa7\xd3\xd1\xd1\xd1\xc1\xc8\xc8\x08\x47\x8e\x1c\x21\x2d\x2d\
-\x8d\x9b\x37\x6f\x12\x0a\x85\x38\x7a\xf4\x28\xc5\xc5\xc5\x98\x4c\
-\x26\x34\x1a\x8d\xf4\x91\x68\x34\x4a\x20\x10\xa0\xac\xac\x8c\xde\
-\xde\x5e\x7a\x7a\x7a\xf0\x7a\xbd\x54\x57\x57\x13\x08\x04\x68\x6f\
-\x6f\x27\x3d\x3d\x1d\x8b\xc5\x82\x5e\xaf\xc7\xe7\xf3\x11\x89\x44\
-\xb6\x84\xe4\x43\x09\xbf\xbb\xbb\x1b\x9d\x4e\x47\x59\x59\x19\x1e\
-\x8f\x87\xfb\xf7\xef\xb3\x7b\xf7\x6e\xf6\xec\xd9\xc3\xc3\x87\x0f\
-\x91\xcb\xe5\x1c\x3b\x76\x8c\xba\xba\x3a\x72\x72\x72\xd0\xe9\x74\
-\xa8\x54\x2a\x94\x4a\x25\x4a\xa5\x12\x8d\x46\x83\xc1\x60\xa0\xb0\
-\xb0\x90\xd6\xd6\x56\x8e\x1e\x3d\xca\xcb\x97\x2f\x19\x1f\x1f\xa7\
-\xb1\xb1\x11\xbf\xdf\xcf\xd3\xa7\x4f\x11\x04\x81\x83\x07\x0f\xe2\
-\x70\x38\x98\x9c\x9c\xdc\xb6\xdc\x6e\x09\xea\xf3\xf9\xe8\xef\xef\
-\xa7\xb8\xb8\x98\x9c\x9c\x1c\x9e\x3c\x79\x42\x3c\x1e\xa7\xbc\xbc\
-\x9c\xe7\xcf\x9f\x33\x3d\x3d\x8d\xcd\x66\xa3\xac\xac\x0c\x9d\x4e\
-\x27\x95\xce\x8d\x12\x04\x01\xb9\x5c\x8e\xc9\x64\xa2\xba\xba\x9a\
-\x7d\xfb\xf6\xd1\xd5\xd5\x45\x34\x1a\x65\xef\xde\xbd\xf4\xf5\xf5\
-\x31\x39\x39\x49\x6d\x6d\x2d\x72\xb9\x9c\xe1\xe1\x61\x96\x96\x96\
-\x36\x9a\x81\xb5\xa9\xbf\x7b\xf7\x2e\x13\x13\x13\xd2\x45\xaf\xd7\
-\xcb\xc4\xc4\x04\xad\xad\xad\xc8\xe5\x72\x06\x06\x06\xc8\xcf\xcf\
-\x47\xad\x56\x33\x30\x30\x40\x45\x45\x05\xa5\xa5\xa5\x88\xa2\xb8\
-\x25\xe0\x46\x09\x82\x40\x62\x62\x22\x2d\x2d\x2d\x8c\x8e\x8e\x32\
-\x34\x34\xc4\x9e\x3d\x7b\xe8\xea\xea\x62\x64\x64\x04\xab\xd5\x4a\
-\x4e\x4e\x0e\xdd\xdd\xdd\xcc\xce\xce\xa2\xd5\x6a\xa5\x77\x6b\x6b\
-\x6b\xc9\xcf\xcf\x7f\xe7\xd1\xb5\xf2\xe6\xf5\x7a\xf1\x7a\xbd\x84\
-\xc3\x61\x6a\x6a\x6a\xb0\x5a\xad\x8c\x8f\x8f\xe3\xf5\x7a\x29\x2c\
-\x2c\xc4\xe3\xf1\xa0\xd5\x6a\x29\x29\x29\xc1\x60\x30\x7c\x14\xe4\
-\x9a\x04\x41\x20\x25\x25\x85\xfd\xfb\xf7\x33\x37\x37\x87\x4e\xa7\
-\x23\x35\x35\x95\xd1\xd1\x51\x7c\x3e\x1f\xd5\xd5\xd5\xe4\xe6\xe6\
-\xb2\xb2\xb2\x22\x71\xf4\xf7\xf7\x33\x3a\x3a\x4a\x28\x14\x7a\xe7\
-\xd1\x50\x28\x44\x55\x55\x15\x25\x25\x25\xb0\x9a\xa2\x34\x1a\x0d\
-\x66\xb3\x99\x57\xaf\x5e\xa1\x56\xab\x49\x4e\x4e\x66\x70\x70\x10\
-\xbd\x5e\x8f\xd1\x68\xdc\x94\x90\x3f\x46\x32\x99\x0c\xab\xd5\xca\
-\xa3\x47\x8f\x08\x04\x02\x64\x66\x66\x32\x31\x31\xc1\xf2\xf2\x32\
-\x9f\x7d\xf6\x19\x16\x8b\x85\x50\x28\x24\x39\xe0\xca\x95\x2b\xc4\
-\x62\x31\xa2\xd1\xe8\x3b\x8f\xca\x64\x32\xd2\xd2\xd2\xb0\x5a\xad\
-\x58\xad\x56\xf2\xf2\xf2\xc8\xc8\xc8\x40\xad\x56\xe3\xf3\xf9\x48\
-\x48\x48\x40\xad\x56\xe3\x70\x38\x50\xab\xd5\x24\x24\x24\x6c\x64\
-\xf8\x68\x99\xcd\x66\xfc\x7e\x3f\xb3\xb3\xb3\x18\x0c\x06\x02\x81\
-\x00\xc1\x60\x10\xad\x56\x4b\x56\x56\x16\x79\x79\x79\x12\x87\xd1\
-\x68\x44\x2e\x97\xc3\xfb\x8b\x49\x26\x93\x21\x97\xcb\xa5\xb1\xb6\
-\x40\x22\x91\x88\xf4\x7b\x71\x71\x91\x68\x34\xfa\x49\x53\xbe\x51\
-\x6b\x05\xc1\xef\xf7\xa3\x50\x28\x88\x44\x22\x92\xcd\xad\x18\xd6\
-\xf4\xaf\xf3\x27\x8a\x22\xa1\x50\x88\x48\x24\x82\xd1\x68\x64\x69\
-\x69\xe9\xa3\x3a\xf2\xed\xe4\x76\xbb\x09\x04\x02\xe8\xf5\x7a\x62\
-\xb1\x18\x0a\x85\x42\xf2\xda\x87\x24\x03\x88\x44\x22\x4c\x4d\x4d\
-\xe1\x74\x3a\xa5\xb1\xb0\xb0\x40\x34\x1a\xc5\x60\x30\xb0\xbc\xbc\
-\x4c\x30\x18\x24\x3d\x3d\x1d\xaf\xd7\x8b\xdf\xef\xdf\x68\xe7\xa3\
-\xe5\x72\xb9\x10\x45\x11\x83\xc1\x80\xc7\xe3\x41\x14\x45\xa9\xee\
-\xcf\xcc\xcc\x6c\xc9\xc0\x5a\x7a\x0a\x06\x83\x5c\xbe\x7c\x99\xbb\
-\x77\xef\x4a\x06\xd3\xd3\xd3\x39\x75\xea\x14\x79\x79\x79\xd2\x07\
-\x92\x93\x93\x79\xf6\xec\x19\x53\x53\x53\xe4\xe6\xe6\xa2\x50\x6c\
-\x59\xd8\xb6\x55\x24\x12\xe1\xc5\x8b\x17\x88\xa2\x88\x52\xa9\xc4\
-\xe9\x74\x92\x92\x92\xc2\x8e\x1d\x3b\xe8\xea\xea\xe2\xf6\xed\xdb\
-\xbc\x79\xf3\x46\x7a\x7e\x72\x72\x92\x82\x82\x02\x64\x32\xd9\x3b\
-\xd0\x53\xa7\x4e\xe1\x76\xbb\xa5\xd8\x9b\x9f\x9f\xe7\xce\x9d\x3b\
-\x38\x9d\x4e\xaa\xaa\xaa\xb0\x58\x2c\x0c\x0f\x0f\x73\xe8\xd0\x21\
-\xd4\x6a\x35\xf7\xef\xdf\x27\x27\x27\x87\xec\xec\xec\xff\xa3\xf8\
-\x08\xf5\xf7\xf7\x63\xb7\xdb\xa9\xaa\xaa\xc2\xe3\xf1\x30\x3b\x3b\
-\x4b\x6d\x6d\x2d\x46\xa3\x91\xce\xce\x4e\xc2\xe1\xb0\xd4\xac\x00\
-\xc4\x62\x31\x76\xef\xde\x8d\x46\xa3\x79\xd7\x94\xec\xdc\xb9\x93\
-\xec\xec\xec\x75\xa3\xaf\xaf\x0f\x80\x82\x82\x02\x54\x2a\x15\x5d\
-\x5d\x5d\xe4\xe7\xe7\x93\x9e\x9e\x4e\x4f\x4f\x0f\x09\x09\x09\x64\
-\x65\x65\xad\x6b\xd7\x3e\x24\x8f\xc7\xc3\xb9\x73\xe7\x00\x68\x69\
-\x69\xe1\xd9\xb3\x67\x00\x34\x36\x36\x12\x8b\xc5\xb8\x76\xed\x1a\
-\x95\x95\x95\x1c\x39\x72\x84\xfc\xfc\x7c\xb2\xb3\xb3\xc9\xc9\xc9\
-\xc1\x60\x30\xbc\x5b\x58\x00\x0a\x85\x02\x95\x4a\x25\x0d\x83\xc1\
-\xc0\xe7\x9f\x7f\xce\xf0\xf0\x30\xb3\xb3\xb3\x54\x54\x54\x60\xb1\
-\x58\xe8\xe9\xe9\xc1\x6a\xb5\x52\x5a\x5a\xca\x83\x07\x0f\xb8\x75\
-\xeb\x96\xb4\xd9\xfb\x90\x46\x47\x47\x39\x7f\xfe\x3c\x23\x23\x23\
-\x34\x36\x36\xb2\xbc\xbc\x8c\xc3\xe1\xc0\x66\xb3\x91\x91\x91\x41\
-\x4f\x4f\x0f\x0a\x85\x82\x82\x82\x02\xf4\x7a\xfd\x3a\x96\xb5\x95\
-\xbf\xa9\xcd\x63\xb5\x8a\x18\x0c\x06\x3a\x3b\x3b\x89\x44\x22\x14\
-\x16\x16\x92\x9a\x9a\x4a\x77\x77\x37\x3e\x9f\x8f\x03\x07\x0e\x10\
-\x8d\x46\xe9\xea\xea\x62\x78\x78\x18\xb5\x5a\x4d\x52\x52\xd2\xba\
-\xad\x03\xc0\xc2\xc2\x02\x0f\x1e\x3c\x90\x9a\xe2\xa6\xa6\x26\x4c\
-\x26\x13\xb7\x6e\xdd\x22\x37\x37\x97\xc6\xc6\x46\x42\xa1\x10\x97\
-\x2e\x5d\xa2\xa0\xa0\xe0\x83\x47\x3f\xdb\xae\x86\x78\x3c\x4e\x28\
-\x14\x62\x7a\x7a\x9a\x95\x95\x15\x8a\x8b\x8b\x69\x68\x68\xe0\xe6\
-\xcd\x9b\x2c\x2d\x2d\x61\xb3\xd9\x48\x4b\x4b\xa3\xa3\xa3\x83\x5f\
-\x7e\xf9\x05\x83\xc1\x40\x46\x46\x06\x99\x99\x99\xac\xac\xac\xf0\
-\xfa\xf5\x6b\x66\x67\x67\x99\x9b\x9b\x63\xd7\xae\x5d\xb4\xb6\xb6\
-\xb2\xb4\xb4\xc4\xf5\xeb\xd7\x51\xab\xd5\x1c\x3a\x74\x88\x94\x94\
-\x14\x9c\x4e\x27\xf3\xf3\xf3\x58\x2c\x96\x6d\x3b\x27\xb6\xf3\xa8\
-\xcb\xe5\xe2\xc2\x85\x0b\x2c\x2f\x2f\x4b\x31\xa3\xd1\x68\x48\x49\
-\x49\x41\xa5\x52\xd1\xd7\xd7\x87\xc3\xe1\xc0\x6c\x36\xb3\x7f\xff\
-\x7e\xb2\xb2\xb2\x50\x2a\x95\xf8\xfd\x7e\x5c\x2e\x17\x1e\x8f\x07\
-\xa5\x52\x49\x56\x56\x16\x36\x9b\x8d\xcc\xcc\x4c\x86\x87\x87\x79\
-\xf0\xe0\x01\x49\x49\x49\x9c\x3c\x79\x92\xe2\xe2\x62\x34\x1a\x8d\
-\xb4\xcd\xb1\xdb\xed\x84\xc3\x61\x32\x32\x32\xa4\x13\x96\xf7\xb5\
-\x69\x2b\x32\x3e\x3e\xce\x85\x0b\x17\x98\x9a\x9a\xe2\xd8\xb1\x63\
-\xd4\xd4\xd4\xb0\x63\xc7\x0e\x84\xd5\x9d\xa8\xd7\xeb\xc5\x6e\xb7\
-\xf3\xe8\xd1\x23\x26\x26\x26\xd8\xb9\x73\x27\xbb\x76\xed\x22\x3b\
-\x3b\x5b\xea\x49\x63\xb1\x18\xa1\x50\x88\xf9\xf9\x79\x46\x47\x47\
-\x19\x19\x19\x21\x1a\x8d\xb2\x67\xcf\x1e\xea\xea\xea\x28\x28\x28\
-\x90\x3a\xaf\xb5\xdd\xed\xbd\x7b\xf7\x78\xfc\xf8\xb1\x74\x86\x65\
-\x32\x99\xde\xc7\xda\x0c\xfa\xf3\xcf\x3f\xf3\xf8\xf1\x63\xbe\xf9\
-\xe6\x1b\x9a\x9a\x9a\x24\xc8\x35\xc5\xe3\x71\x02\x81\x00\x2e\x97\
-\x8b\x91\x91\x11\x5e\xbd\x7a\x85\xcb\xe5\xe2\xed\xdb\xb7\xc8\xe5\
-\x72\xd4\x6a\xb5\x04\x1a\x8b\xc5\x30\x1a\x8d\x58\xad\x56\x0a\x0b\
-\x0b\xc9\xcb\xcb\xc3\x64\x32\xad\xdb\x81\xae\xd9\x74\xbb\xdd\x9c\
-\x3d\x7b\x96\x17\x2f\x5e\xf0\xdd\x77\xdf\x51\x53\x53\x23\x79\x9b\
-\xad\x62\x34\x33\x33\x13\x80\xb1\xb1\x31\xa9\xd4\xad\x69\x7c\x7c\
-\x9c\x1b\x37\x6e\x20\x97\xcb\xa9\xad\xad\xa5\xba\xba\x9a\x92\x92\
-\x12\xe6\xe6\xe6\x58\x5c\x5c\xc4\xe7\xf3\xe1\xf7\xfb\x91\xc9\x64\
-\x68\xb5\x5a\xf4\x7a\x3d\xc9\xc9\xc9\x98\xcd\x66\xd4\x6a\x35\x7f\
-\xfd\xf5\x17\xe7\xcf\x9f\x27\x2b\x2b\x8b\xe6\xe6\x66\xc9\x6b\x82\
-\x20\xe0\x76\xbb\x79\xfd\xfa\x35\x89\x89\x89\x52\x4a\x7a\x5f\x9b\
-\x3c\xba\x36\x0d\xed\xed\xed\x94\x95\x95\xf1\xf5\xd7\x5f\x93\x9a\
-\x9a\xca\xf8\xf8\x38\xe7\xce\x9d\x63\x68\x68\x88\x78\x3c\x8e\x5e\
-\xaf\xa7\xac\xac\x8c\xd2\xd2\x52\x0a\x0a\x0a\xd0\x6a\xb5\x84\xc3\
-\x61\xa9\x4d\x5b\x4b\x2f\xb3\xb3\xb3\xfc\xf3\xcf\x3f\xd8\xed\x76\
-\x5e\xbd\x7a\x45\x24\x12\x21\x14\x0a\xd1\xd4\xd4\xc4\x97\x5f\x7e\
-\x89\xc9\x64\x62\x68\x68\x88\x8b\x17\x2f\xe2\xf3\xf9\x38\x7e\xfc\
-\x38\xd5\xd5\xd5\xeb\x9a\x67\xb6\x5a\x4c\xa2\x28\x92\x96\x96\x86\
-\x4c\x26\xa3\xb3\xb3\x93\xb9\xb9\x39\x00\xae\x5d\xbb\x86\xd3\xe9\
-\xe4\xf8\xf1\xe3\x34\x34\x34\x20\x97\xcb\x71\xb9\x5c\x3c\x7f\xfe\
-\x1c\xbb\xdd\x8e\xd5\x6a\x25\x35\x35\x15\x51\x14\x11\x45\x11\x95\
-\x4a\x45\x47\x47\x07\xbf\xfe\xfa\x2b\x43\x43\x43\x00\x54\x55\x55\
-\xd1\xd8\xd8\x08\xab\xcd\xfa\xca\xca\x0a\x1e\x8f\x87\xab\x57\xaf\
-\x12\x08\x04\x38\x71\xe2\x04\xfb\xf7\xef\x47\xab\xd5\x6e\xea\xd0\
-\x36\x79\x94\xd5\x98\x59\xcb\x81\x77\xee\xdc\x21\x1c\x0e\xa3\x50\
-\x28\x24\x48\x9d\x4e\x87\xdb\xed\x66\x7e\x7e\x9e\xbf\xff\xfe\x9b\
-\xab\x57\xaf\xf2\xc3\x0f\x3f\x50\x5d\x5d\xbd\xce\xce\x4f\x3f\xfd\
-\xc4\xe4\xe4\x24\xf5\xf5\xf5\xd2\x1f\xd1\x6a\xb5\xcc\xcc\xcc\x70\
-\xeb\xd6\x2d\x7a\x7b\x7b\xf1\xfb\xfd\xa4\xa7\xa7\x73\xe2\xc4\x09\
-\xf6\xed\xdb\xb7\x25\x24\x5b\x79\x94\xd5\x98\x59\x3b\x59\x5b\x4b\
-\x3b\xcd\xcd\xcd\xd4\xd7\xd7\x4b\xcd\x6c\x42\x42\x02\x26\x93\x09\
-\x99\x4c\x46\x57\x57\x17\xe5\xe5\xe5\x9b\x6a\xff\xa3\x47\x8f\xd0\
-\x68\x34\x34\x34\x34\x60\xb5\x5a\x11\x45\x11\xf9\xea\x01\x5a\x7a\
-\x7a\x3a\x6f\xdf\xbe\x45\xa5\x52\xd1\xd2\xd2\x42\x45\x45\xc5\xb6\
-\x90\x7c\xa8\x1f\x15\x04\x81\xa4\xa4\x24\x0e\x1f\x3e\xcc\xe9\xd3\
-\xa7\xa9\xab\xab\x5b\xb7\x4f\x92\xc9\x64\x28\x14\x0a\x14\x0a\xc5\
-\xb6\xc6\x01\xe4\x72\x39\x4a\xa5\x12\xb9\x5c\xbe\xee\xdd\xd4\xd4\
-\x54\x8e\x1f\x3f\xce\xb7\xdf\x7e\xcb\xbe\x7d\xfb\x48\x4c\x4c\xfc\
-\xa0\x9d\x6d\x41\x59\x85\x35\x1a\x8d\xe4\xe5\xe5\x6d\x79\xcc\xf2\
-\xbe\xa6\xa7\xa7\xd7\xf5\x92\x6b\x9b\xc5\x58\x2c\xb6\x65\xc5\x59\
-\x83\xcd\xc9\xc9\xf9\x57\x48\xb6\x8b\xd1\x4f\xd1\xf0\xf0\x30\x3f\
-\xfe\xf8\x23\x2b\x2b\x2b\x18\x8d\xc6\x75\xf7\xc6\xc6\xc6\xb0\xd9\
-\x6c\x9c\x3e\x7d\x9a\x8c\x8c\x8c\x75\xf7\x3e\x55\xff\x19\x74\x69\
-\x69\x89\xc1\xc1\x41\x96\x96\x96\x36\x79\x25\x16\x8b\x91\x9e\x9e\
-\x2e\xc5\xe7\x7f\xd1\xff\x02\x44\xae\xcd\xfc\xda\xd5\xdf\x76\x00\
-\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x08\x8f\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x26\x00\x00\x00\x2a\x08\x06\x00\x00\x00\xdf\xff\x29\xd5\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x08\x24\x49\x44\x41\x54\x58\x47\xcd\x98\x59\x4c\
-\x53\xdb\x17\xc6\xbf\x1e\x5a\xa1\xad\x20\xf3\x20\x85\x8a\x4c\x32\
-\x14\x50\x40\x04\x4c\x18\x35\x8a\x88\x12\x13\x87\x40\x30\x3c\x1a\
-\x13\x87\x17\x20\x24\xc6\xf0\x62\x00\x1f\x88\xc2\x0b\x11\x49\x08\
-\x60\x0c\x8e\x48\x04\x09\x24\x88\x84\x3a\xe0\x00\x48\xd0\x14\x44\
-\x08\x94\x2a\x50\x20\x65\x28\x94\xb6\xeb\x3e\x60\x8f\xb4\xbd\x5e\
-\xee\x3f\x5c\xc8\xff\x97\x9c\x94\x9e\x6f\x9d\xc3\x3a\x6b\xaf\xef\
-\xec\xbd\xcb\x21\x22\xc2\xdf\xa0\x56\xab\x21\x93\xc9\xa0\x54\x2a\
-\x21\x14\x0a\xe1\xeb\xeb\x0b\x5b\x5b\x5b\x30\x0c\x63\x1a\x8a\x81\
-\x81\x01\x8c\x8f\x8f\x83\x61\x18\x88\x44\x22\x78\x7a\x7a\xc2\xc2\
-\xc2\xc2\x34\x0c\x13\x13\x13\xf8\xfe\xfd\x3b\x16\x16\x16\x60\x6f\
-\x6f\x8f\xa0\xa0\x20\xf0\x78\x3c\xd3\xb0\x55\xe8\x0f\xbc\x79\xf3\
-\x86\x52\x52\x52\x28\x38\x38\x98\xa2\xa2\xa2\xa8\xb6\xb6\x96\x16\
-\x17\x17\x4d\xc3\x68\x7e\x7e\x9e\xb2\xb3\xb3\x29\x2c\x2c\x8c\x42\
-\x43\x43\xe9\xe2\xc5\x8b\x34\x33\x33\x63\x1a\x46\x44\x44\xb7\x6e\
-\xdd\xa2\xd8\xd8\x58\x0a\x0e\x0e\xa6\xc4\xc4\x44\x92\xc9\x64\xa4\
-\xd3\xe9\x4c\xc3\x88\x88\xc8\xe8\xf1\x57\x56\x56\x30\x33\x33\x83\
-\xe9\xe9\x69\xd4\xd7\xd7\x43\xa1\x50\x20\x2b\x2b\x0b\x02\x81\x00\
-\x8f\x1f\x3f\x86\x5c\x2e\xc7\xf4\xf4\xb4\xd1\xf1\xee\xdd\x3b\x34\
-\x37\x37\x23\x25\x25\x05\xb1\xb1\xb1\x78\xf2\xe4\x09\x06\x07\x07\
-\xa1\x54\x2a\x8d\xe2\x26\x26\x26\x50\x53\x53\x03\x67\x67\x67\x64\
-\x65\x65\x41\x26\x93\xa1\xb9\xb9\x19\x0a\x85\x02\xd3\xd3\xd3\x58\
-\x5e\x5e\xc6\xda\xc1\xe3\x10\x11\x2d\x2d\x2d\xa1\xa7\xa7\x07\x63\
-\x63\x63\x18\x1e\x1e\x86\x4e\xa7\xc3\xbd\x7b\xf7\x10\x11\x11\x81\
-\x9b\x37\x6f\xa2\xa6\xa6\x06\xb7\x6f\xdf\xc6\x99\x33\x67\x60\x63\
-\x63\xb3\xf6\x59\xf0\xf1\xe3\x47\x48\xa5\x52\xbc\x7e\xfd\x1a\x1a\
-\x8d\x06\x07\x0f\x1e\x44\x6a\x6a\x2a\x76\xed\xda\x65\x34\x9c\x6a\
-\xb5\x1a\x25\x25\x25\xa8\xa8\xa8\xc0\xf1\xe3\xc7\x71\xe2\xc4\x09\
-\xac\xac\xac\x20\x2e\x2e\x0e\x7c\x3e\x1f\xee\xee\xee\x10\x8b\xc5\
-\x08\x0b\x0b\x83\x40\x20\x00\x17\x00\xa4\x52\x29\xae\x5d\xbb\x06\
-\xad\x56\x0b\x3b\x3b\x3b\x30\x0c\x03\x85\x42\x01\x2e\x97\x0b\x0e\
-\x87\x03\x4b\x4b\x4b\xcc\xcf\xcf\x43\x2a\x95\xc2\xca\xca\x6a\x6d\
-\x5e\x18\x1d\x1d\x85\x85\x85\x05\x1b\x07\x00\x1f\x3e\x7c\xc0\xc8\
-\xc8\x88\x51\x3f\x2e\x2d\x2d\x61\x79\x79\x19\x96\x96\x96\x6c\xec\
-\xe0\xe0\x20\x3a\x3a\x3a\xc0\xe3\xf1\x30\x39\x39\x09\xad\x56\x8b\
-\xe2\xe2\x62\xc4\xc5\xc5\xad\xf6\x58\x5a\x5a\x1a\xa5\xa5\xa5\x51\
-\x47\x47\x07\x69\x34\x1a\x22\x22\x3a\x77\xee\x1c\x65\x67\x67\xd3\
-\x8f\x1f\x3f\xa8\xb8\xb8\x98\x22\x23\x23\x69\x7c\x7c\xdc\xa4\x13\
-\x88\x6a\x6a\x6a\xc8\xd7\xd7\x97\x64\x32\x19\xf5\xf5\xf5\x91\xab\
-\xab\x2b\xb5\xb6\xb6\xb2\xf7\x31\xa0\x54\x2a\x49\x2c\x16\x53\x75\
-\x75\x35\xcd\xce\xce\x52\x72\x72\x32\xe5\xe4\xe4\xd0\xec\xec\x2c\
-\x11\x11\x75\x75\x75\x51\x4c\x4c\x0c\x65\x67\x67\x93\x52\xa9\x5c\
-\xed\xb1\xee\xee\x6e\x1c\x3d\x7a\x14\xfb\xf6\xed\x63\x5d\x12\x1e\
-\x1e\x8e\xfe\xfe\x7e\x34\x34\x34\xa0\xad\xad\x0d\x12\x89\x84\xad\
-\xc8\x5a\x42\x42\x42\xa0\xd1\x68\xf0\xf4\xe9\x53\x54\x57\x57\x63\
-\xfb\xf6\xed\xf0\xf4\xf4\x04\x97\xcb\x35\x8a\xb3\xb7\xb7\x87\x9f\
-\x9f\x1f\x9a\x9b\x9b\xf1\xe0\xc1\x03\x0c\x0d\x0d\x21\x24\x24\x84\
-\xbd\x67\x44\x44\x04\x0e\x1d\x3a\x84\xfe\xfe\x7e\x68\x34\x1a\xb0\
-\xb5\x76\x77\x77\x37\xba\xd9\xb1\x63\xc7\xe0\xe1\xe1\x81\xd2\xd2\
-\x52\x2c\x2e\x2e\xe2\xd4\xa9\x53\x10\x0a\x85\xac\x6e\x40\x22\x91\
-\x20\x3d\x3d\x1d\x75\x75\x75\x78\xf9\xf2\x25\x32\x33\x33\xe1\xe2\
-\xe2\x02\x0e\x87\x63\x1a\x8a\xec\xec\x6c\x4c\x4e\x4e\xa2\xac\xac\
-\x0c\x7b\xf7\xee\x45\x5c\x5c\x9c\xd1\xc3\xee\xdc\xb9\x13\x0b\x0b\
-\x0b\xd0\xeb\xf5\xab\x43\xe9\xe9\xe9\x49\xf5\xf5\xf5\xb4\xbc\xbc\
-\x6c\x54\xfe\xf9\xf9\x79\x6a\x69\x69\x21\x85\x42\xf1\x47\x5b\x1b\
-\x90\x4a\xa5\xd4\xdb\xdb\x6b\x36\x84\xa6\x8c\x8e\x8e\x52\x5b\x5b\
-\x1b\xa9\xd5\x6a\x53\x89\xca\xcb\xcb\x29\x28\x28\x88\xe4\x72\xb9\
-\xf1\xeb\xc2\x14\xa1\x50\x88\xe4\xe4\x64\xb8\xba\xba\xfe\xed\x8b\
-\x75\x2d\xd1\xd1\xd1\x90\x48\x24\x7f\x7e\x61\xfe\x42\x24\x12\x21\
-\x3e\x3e\xde\xcc\x44\xa6\x70\x88\x88\xc4\x62\x31\x6e\xdc\xb8\x81\
-\xa4\xa4\x24\x6c\xdb\xb6\xcd\x34\x66\xcb\xa8\xaa\xaa\x42\x45\x45\
-\x05\x5a\x5a\x5a\x7e\x27\x96\x90\x90\x00\x3f\x3f\x3f\xb3\xa6\xdd\
-\x4a\xde\xbe\x7d\x8b\xde\xde\x5e\xb4\xb7\xb7\xff\x4e\xcc\xd1\xd1\
-\x11\x4e\x4e\x4e\xeb\x0e\xd9\x66\x32\x3a\x3a\x8a\xb9\xb9\x39\x48\
-\xa5\xd2\x7f\x6e\xfe\xad\x66\x6d\xf3\x9b\x8d\xdb\xd8\xd8\x18\x64\
-\x32\x19\x34\x1a\x0d\x88\x08\x3c\x1e\x0f\x12\x89\x84\xad\xe6\x66\
-\xea\x46\x90\x49\xc5\x0a\x0b\x0b\xc9\xcb\xcb\x8b\xbc\xbd\xbd\xc9\
-\xc7\xc7\x87\x9c\x9d\x9d\xa9\xb2\xb2\x92\x5d\x59\x6c\xa6\xfe\x8f\
-\xaf\x8b\xae\xae\x2e\xf8\xfb\xfb\x23\x27\x27\x07\xd7\xaf\x5f\x87\
-\x48\x24\x42\x6f\x6f\x2f\x96\x97\x97\xb7\x44\x37\x60\x96\xd8\xca\
-\xca\x0a\x7c\x7c\x7c\x70\xfa\xf4\x69\x64\x66\x66\x42\x24\x12\x41\
-\xab\xd5\x6e\x99\x6e\xc0\x2c\x31\x81\x40\x80\xb1\xb1\x31\xb4\xb6\
-\xb6\xa2\xa9\xa9\x09\x3f\x7f\xfe\x04\x9f\xcf\x67\xa7\x98\xcd\xd6\
-\x0d\x98\x25\x16\x1f\x1f\x0f\xb9\x5c\x8e\xfc\xfc\x7c\x5c\xba\x74\
-\x09\x6a\xb5\x1a\x91\x91\x91\xec\x9c\xb6\xd9\xba\x01\x33\x57\x9e\
-\x3f\x7f\x1e\x5e\x5e\x5e\x98\x9a\x9a\x82\x5e\xaf\x87\x9b\x9b\x1b\
-\x62\x62\x62\xd8\x29\x64\xb3\x75\x03\x66\x15\x23\x22\xf8\xfb\xfb\
-\x63\xff\xfe\xfd\x88\x8a\x8a\x82\xb7\xb7\x37\x38\x1c\x0e\xbb\xec\
-\x9d\x9a\x9a\x02\x97\xcb\x85\xbd\xbd\x3d\x1c\x1c\x1c\x40\x44\x50\
-\xa9\x54\xab\x2b\x82\xff\x40\x37\x60\x56\xb1\xce\xce\x4e\x34\x35\
-\x35\x41\xa3\xd1\xb0\x09\x65\x64\x64\x20\x3c\x3c\x1c\x3c\x1e\x0f\
-\xb5\xb5\xb5\x28\x2f\x2f\x07\xc3\x30\xe0\x70\x38\x50\xa9\x54\x28\
-\x2c\x2c\xc4\xd9\xb3\x67\xc1\xe7\xf3\x37\xa4\xaf\xc5\xac\x62\x55\
-\x55\x55\xe8\xec\xec\x04\xc3\x30\xe0\xf3\xf9\x78\xf1\xe2\x05\x9e\
-\x3d\x7b\x06\xb5\x5a\x0d\xfc\x0b\xbb\x6f\x54\x37\x60\x96\x98\x4a\
-\xa5\x42\x64\x64\x24\x0a\x0a\x0a\x50\x54\x54\x84\xc0\xc0\x40\xcc\
-\xcd\xcd\xb1\xa5\x5e\xcf\xee\x1b\xd5\x0d\x98\x25\xc6\x30\x0c\x54\
-\x2a\x15\xbe\x7d\xfb\x86\x81\x81\x01\xcc\xcf\xcf\x1b\x4d\xec\xeb\
-\xd9\x7d\xa3\xba\x01\xf6\x3f\x1a\x04\x1f\x1f\x1f\x8c\x8d\x8d\xe1\
-\xce\x9d\x3b\x28\x2d\x2d\xc5\xec\xec\x2c\x3c\x3c\x3c\xd8\xe5\xd0\
-\x7a\x76\xdf\xa8\x6e\x80\x8b\x5f\xc9\x38\x3a\x3a\x82\x61\x18\x64\
-\x66\x66\xc2\xce\xce\x0e\x2a\x95\x0a\x44\x84\x93\x27\x4f\x22\x2d\
-\x2d\x0d\x7c\x3e\x1f\xf8\x17\x76\xdf\xa8\x6e\x28\x10\x17\x00\x2e\
-\x5f\xbe\x8c\xd0\xd0\x50\x70\xb9\x5c\x38\x38\x38\xe0\xc0\x81\x03\
-\x46\xb3\xff\x8e\x1d\x3b\xd8\x0b\xd6\xda\x9d\x88\x58\xbb\x5b\x5a\
-\x5a\x82\x61\x98\x75\x75\x2b\x2b\x2b\x1c\x3e\x7c\x18\x5a\xad\x16\
-\x0b\x0b\x0b\xd0\xe9\x74\x50\xab\xd5\x58\x5c\x5c\xc4\xe4\xe4\x24\
-\x74\x3a\xdd\xef\xc4\x34\x1a\x0d\xd4\x6a\xf5\xba\x76\xfe\x2f\x74\
-\xbd\x5e\x8f\xbe\xbe\x3e\x0c\x0d\x0d\x61\x64\x64\x84\x75\x23\x11\
-\xa1\xb1\xb1\x11\x4b\x4b\x4b\xbf\x13\x6b\x6c\x6c\x44\x50\x50\x10\
-\x6c\x6d\x6d\x59\x3b\xa7\xa7\xa7\x43\x20\x10\xa0\xa4\xa4\x04\xbd\
-\xbd\xbd\x48\x4f\x4f\x07\x9f\xcf\xdf\xb0\x3e\x3c\x3c\x8c\xbc\xbc\
-\x3c\x8c\x8f\x8f\xc3\xd1\xd1\x11\x3c\x1e\x0f\x5a\xad\x16\x9f\x3e\
-\x7d\xc2\xcc\xcc\x0c\xdc\xdc\xdc\x00\x43\xf3\x17\x14\x14\xc0\xdb\
-\xdb\x1b\x16\x16\x16\xeb\xda\x79\xa3\xfa\xa3\x47\x8f\xf0\xf5\xeb\
-\x57\xe4\xe7\xe7\xe3\xd1\xa3\x47\xa8\xaf\xaf\x47\x7e\x7e\x3e\x7c\
-\x7d\x7d\x21\x12\x89\x58\x93\x31\x00\x50\x56\x56\x86\x91\x91\x11\
-\xe8\x74\xba\x75\xed\xbc\x51\xbd\xa7\xa7\x07\xe1\xe1\xe1\x48\x4c\
-\x4c\x84\x40\x20\xc0\xab\x57\xaf\x90\x9b\x9b\x0b\x07\x07\x07\x23\
-\x93\x31\x00\x70\xff\xfe\x7d\x7c\xf9\xf2\x05\x3a\x9d\x6e\x5d\x3b\
-\x6f\x54\x9f\x9b\x9b\x83\xab\xab\x2b\xf4\x7a\x3d\xda\xdb\xdb\x91\
-\x97\x97\x07\x7b\x7b\x7b\x14\x16\x16\x22\x30\x30\x90\xfd\x85\x88\
-\x9d\x2b\x0d\x5b\xf3\xf5\xec\xbc\x51\x1d\xbf\xcc\xd6\xd6\xd6\x86\
-\xe2\xe2\x62\x38\x39\x39\xa1\xb8\xb8\x18\x01\x01\x01\xab\xbb\x23\
-\x03\x86\x35\xff\x95\x2b\x57\x68\x78\x78\x78\xdd\x9f\x02\x36\x4a\
-\x6a\x6a\x2a\x25\x24\x24\xd0\xee\xdd\xbb\x29\x29\x29\x89\xba\xbb\
-\xbb\x49\xab\xd5\x12\xfd\x69\x97\xd4\xd0\xd0\x00\x1b\x1b\x1b\x76\
-\x15\xb1\x59\xc8\xe5\x72\xc8\x64\x32\x44\x46\x46\xa2\xa8\xa8\x08\
-\x41\x41\x41\xec\xf0\x11\x11\xdb\x8b\xec\x86\x57\x28\x14\xc2\xda\
-\xda\x9a\x0d\x30\x7c\xae\x3d\x4c\xcf\xad\xf7\xdd\xf4\x1c\x00\x58\
-\x59\x59\x61\xcf\x9e\x3d\xc8\xcb\xcb\x43\x48\x48\x88\xd1\xce\xbf\
-\xb0\xb0\x10\x75\x75\x75\x78\xfe\xfc\xf9\x6a\x62\x31\x31\x31\xf0\
-\xf5\xf5\xc5\x91\x23\x47\xe0\xe2\xe2\x02\x22\x82\x5e\xaf\x87\x5e\
-\xaf\x67\xff\xd6\xe9\x74\x46\xe7\xff\x97\x63\xed\x75\xce\xce\xce\
-\x88\x88\x88\x80\xad\xad\x2d\x5b\x1d\xbd\x5e\x0f\xa5\x52\x89\xab\
-\x57\xaf\x82\xc7\xe3\xe1\xee\xdd\xbb\xab\x89\x55\x56\x56\xa2\xb2\
-\xb2\x12\x62\xb1\x18\x01\x01\x01\xe0\xf1\x78\x66\xb3\xfd\x66\xb2\
-\xb2\xb2\x82\xcf\x9f\x3f\xe3\xfd\xfb\xf7\xc8\xcd\xcd\x45\x46\x46\
-\xc6\x6a\x62\x8b\x8b\x8b\x78\xf8\xf0\x21\x1a\x1b\x1b\xa1\x52\xa9\
-\x4c\xaf\xdb\x12\x2c\x2d\x2d\x11\x1d\x1d\x8d\x0b\x17\x2e\xc0\xda\
-\xda\x7a\x35\x31\xd3\xa0\xff\x07\xfe\x02\xcc\x2f\x3e\x58\x13\x64\
-\xf2\x06\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x11\xe1\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x40\x00\x00\x00\x4c\x08\x06\x00\x00\x00\xdd\xab\xb1\xa5\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x11\x76\x49\x44\x41\x54\x78\x5e\xe5\x9c\x7b\x74\
-\x54\xd5\xbd\xc7\x3f\xf3\xc8\x24\x33\x79\x53\x42\x42\x00\xb1\x3c\
-\x92\x68\x12\x10\x42\x20\x60\x32\x89\x82\xa4\x8d\xa4\x31\x3c\xe5\
-\x4a\x0b\x42\x6d\x15\x01\xaf\x5e\xed\x6a\x17\x17\xb1\xae\x6b\xb5\
-\x08\xba\xf0\x5a\x45\x40\x2f\x8d\x22\x57\x25\x44\x34\x68\x79\xd9\
-\x10\xd0\x54\xac\xa0\x3c\x12\x20\xa6\x80\x21\x86\x97\xe1\x91\x4c\
-\x66\x32\x33\xe7\x9c\xfb\xc7\xcc\x9c\xcc\xec\x33\x21\x01\x13\xba\
-\x2e\xfd\xae\xf5\x5d\xb3\xf7\x6f\xff\xf6\x3e\xbf\xf9\xee\xe7\x39\
-\x67\x12\x9d\xcd\x66\x53\xf8\x27\xe0\xf4\xe9\xd3\x94\x97\x97\x73\
-\xee\xdc\x39\x92\x93\x93\x29\x28\x28\x20\x2c\x2c\x4c\x74\xeb\x71\
-\xe8\x45\xc3\xf5\xc0\x86\x0d\x1b\x28\x2c\x2c\xa4\xb9\xb9\x99\xc1\
-\x83\x07\xf3\xc5\x17\x5f\x90\x9b\x9b\x4b\x75\x75\xb5\xe8\xda\xe3\
-\xd0\x5d\xef\x11\xb0\x7f\xff\x7e\x1e\x7d\xf4\x51\xca\xcb\xcb\x89\
-\x88\x88\x50\xed\x5f\x7f\xfd\x35\x0f\x3c\xf0\x00\xbb\x76\xed\xc2\
-\x6c\x36\x07\xd4\xe9\x49\x5c\x17\x01\x74\x3a\x1d\x21\x21\x21\x18\
-\x0c\x06\x24\x49\x42\x96\x65\x0c\x06\x03\x2e\x97\x0b\x59\x96\x55\
-\xbf\xa5\x4b\x97\x72\xeb\xad\xb7\x32\x63\xc6\x8c\x80\xfa\x3d\x89\
-\x1e\x9f\x02\x7a\xbd\x1e\xb3\xd9\x8c\xd1\x68\x44\xa7\xd3\x61\x34\
-\x1a\x31\x99\x4c\x18\x0c\x06\xc2\xc2\xc2\x30\x1a\x8d\xaa\x6f\x46\
-\x46\x06\x35\x35\x35\x01\xf5\x7b\x1a\x3d\x2e\x80\xc9\x64\x12\x4d\
-\x01\x30\x99\x4c\xe8\x74\x3a\x00\xce\x9e\x3d\x4b\x6c\x6c\xac\xe8\
-\xd2\xa3\xe8\x71\x01\xf4\xfa\xce\x2f\xa1\xd3\xe9\x70\x3a\x9d\xfc\
-\xf9\xcf\x7f\xa6\xb0\xb0\x50\x2c\xee\x51\x74\x1e\xdd\x0f\x84\x24\
-\x49\xa2\x29\x00\x8a\xa2\x50\x53\x53\xc3\xb4\x69\xd3\x98\x36\x6d\
-\x1a\x83\x06\x0d\x12\x5d\x7a\x14\x3d\x2e\x80\xd3\xe9\x0c\x58\xe8\
-\xfc\xb1\x7c\xf9\x72\x22\x22\x22\x58\xb0\x60\x01\xf3\xe7\xcf\x67\
-\xd1\xa2\x45\xa2\x4b\x8f\xa3\xc7\x05\x50\x14\x05\x87\xc3\x81\xd3\
-\xe9\xc4\xed\x76\x23\x49\x12\x92\x24\xe1\x74\x3a\xb1\xd9\x6c\xb4\
-\xb6\xb6\xb2\x62\xc5\x0a\xf2\xf3\xf3\xc5\xaa\xd7\x05\x3d\x2e\x80\
-\x0f\x6e\xb7\x1b\xa7\xd3\x49\x5b\x5b\x9b\xca\xa6\xa6\x26\x00\xce\
-\x9d\x3b\x87\xa2\xf4\xf8\x6e\x1c\x14\xd7\xe5\x1c\x80\x77\x2d\x38\
-\x78\xf0\x20\xbb\x77\xef\xa6\xb2\xb2\x92\xda\xda\x5a\x64\x59\xa6\
-\xae\xae\x8e\xe1\xc3\x87\xe3\x70\x38\xc8\xcc\xcc\x24\x27\x27\x87\
-\x9c\x9c\x1c\x06\x0e\x1c\x28\x36\xd1\x23\xe8\x31\x01\xdc\x6e\x37\
-\xd5\xd5\xd5\x54\x56\x56\xb2\x7b\xf7\x6e\x8e\x1e\x3d\x4a\x5a\x5a\
-\x1a\x39\x39\x39\xe4\xe6\xe6\x92\x92\x92\xc2\xc9\x93\x27\x39\x7e\
-\xfc\x38\xa3\x46\x8d\xc2\x64\x32\xf1\xc5\x17\x5f\xa8\xfe\x67\xce\
-\x9c\x21\x33\x33\x13\xab\xd5\x4a\x76\x76\x36\x03\x06\x0c\x50\xb7\
-\xcb\xee\x44\xb7\x09\x20\x49\x12\xd5\xd5\xd5\x6a\x0f\xd7\xd4\xd4\
-\x90\x9a\x9a\x8a\xd5\x6a\x25\x2f\x2f\x8f\xe4\xe4\xe4\xab\xfa\x02\
-\x4e\xa7\x93\xbd\x7b\xf7\x06\x08\x92\x95\x95\xa5\x8e\x90\x7e\xfd\
-\xfa\x5d\x55\x7b\x1d\xe1\x9a\x05\x90\x65\x99\x9a\x9a\x1a\x35\xc0\
-\x43\x87\x0e\x91\x9a\x9a\x4a\x4e\x4e\x0e\x79\x79\x79\xa4\xa4\xa4\
-\x74\xe9\x0c\xd0\x55\xb4\xb5\xb5\xf1\xf9\xe7\x9f\xab\xd7\x3b\x77\
-\xee\x1c\x63\xc7\x8e\xc5\x6a\xb5\x92\x93\x93\x43\x62\x62\xa2\x58\
-\xa5\x4b\xe8\xb2\x00\xb2\x2c\x73\xe4\xc8\x11\xb5\x87\x0f\x1f\x3e\
-\x4c\x4a\x4a\x0a\x39\x39\x39\x58\xad\x56\x52\x53\x53\xbb\xf5\x0b\
-\x77\x06\xbb\xdd\x1e\x30\x42\x2e\x5e\xbc\xc8\xe8\xd1\xa3\xd5\x29\
-\xd3\x55\x41\x3a\x14\x40\x92\x24\x8e\x1d\x3b\xa6\x7e\xe1\x43\x87\
-\x0e\x91\x94\x94\x84\xd5\x6a\xc5\x6a\xb5\x92\x9e\x9e\xde\x2d\x43\
-\xb0\xbb\xe0\x70\x38\xa8\xaa\xaa\x52\x05\xb9\x7c\xf9\xb2\x3a\x65\
-\xb2\xb3\xb3\xe9\xdb\xb7\xaf\x58\x05\x44\x01\xec\x76\x3b\x1b\x37\
-\x6e\x64\xfb\xf6\xed\x7c\xfd\xf5\xd7\x24\x25\x25\xa9\x8b\x56\x7a\
-\x7a\xfa\x75\xed\xe1\x1f\x0a\xbb\xdd\xae\x11\x64\xdc\xb8\x71\x14\
-\x15\x15\x71\xc7\x1d\x77\xa8\x9d\xa7\x0a\x70\xe0\xc0\x01\xe6\xce\
-\x9d\xcb\xdd\x77\xdf\x4d\x71\x71\x31\xe9\xe9\xe9\x18\x0c\x06\xb1\
-\xdd\xff\xb7\x68\x6d\x6d\xe5\xb3\xcf\x3e\xa3\xa4\xa4\x84\xe6\xe6\
-\x66\x4a\x4a\x4a\x88\x8c\x8c\xf4\x08\x70\xe1\xc2\x05\xee\xba\xeb\
-\x2e\xd6\xad\x5b\x47\x5a\x5a\x9a\x58\xf7\x86\xc3\xeb\xaf\xbf\xce\
-\x8e\x1d\x3b\xd8\xb0\x61\x83\xe7\x24\xb8\x76\xed\x5a\xee\xbf\xff\
-\xfe\x7f\x89\x2f\x0f\x30\x6f\xde\x3c\x6c\x36\x1b\x07\x0e\x1c\xf0\
-\x08\xb0\x6b\xd7\x2e\x26\x4f\x9e\x2c\xfa\xdd\xd0\x28\x2a\x2a\xa2\
-\xa2\xa2\xc2\x33\x05\xf2\xf2\xf2\xd8\xb6\x6d\x1b\x6e\xb7\x9b\x85\
-\x0b\x17\x8a\xbe\x37\x14\x06\x0d\x1a\xc4\xe2\xc5\x8b\x29\x2b\x2b\
-\xe3\xf0\xe1\xc3\x60\xb3\xd9\x94\x29\x53\xa6\x28\x7b\xf6\xec\x51\
-\x1a\x1a\x1a\x14\xe0\x86\xe6\xa8\x51\xa3\x14\x9b\xcd\xa6\x3c\xf9\
-\xe4\x93\xca\xaa\x55\xab\x14\x9d\xcd\x66\x53\xca\xca\xca\xd8\xb6\
-\x6d\x1b\xcf\x3e\xfb\x2c\xc5\xf7\xdc\xc3\x96\xf2\x72\x55\x31\xc5\
-\xbb\x5d\xd4\xd5\xd5\x51\x5a\x5a\x4a\x54\x54\x14\x33\x67\xce\x24\
-\x3a\x3a\x5a\xf5\xd9\xb9\x73\x27\x55\x55\x55\xa4\xa7\xa7\x53\x58\
-\x58\xa8\x6e\x97\x76\xbb\x9d\x77\xde\x79\x87\xc6\xc6\x46\x0a\x0a\
-\x0a\x18\x3e\x7c\xb8\x5a\xa7\x2b\xd0\x75\xf3\x1d\x62\x73\x73\x33\
-\xd3\xef\xbd\x97\xad\x5b\xb7\x92\x9d\x9d\xcd\xd6\xad\x5b\x3d\x53\
-\x40\x96\x65\x8a\x8a\x8a\xc8\xcd\xcd\x65\xcb\x96\x2d\xfc\xe5\xa3\
-\x8f\xd4\x4a\x8a\x4e\x47\x4d\x4d\x0d\x45\xb3\xe6\xa1\x8b\x8a\x27\
-\x2c\xb6\x0f\x51\x4d\xb5\x6c\xff\xcb\x47\x84\x85\x85\xb1\x6a\xd5\
-\x2a\x5e\x2a\xab\xe0\xd2\xf1\xc3\xc4\x0d\xb7\x72\x77\x52\x0c\xcf\
-\x3c\xf3\x0c\x8a\xa2\x50\x3c\x79\x32\xdf\x27\x8e\x21\x6a\xe0\x2d\
-\xd4\x96\xae\x64\xcd\xb2\xa5\xe4\xe6\xe6\x06\x04\x75\x25\xf4\x84\
-\x00\x77\x17\x16\x92\x9c\x9c\x4c\x46\x46\x06\x8f\x3c\xf2\x48\xfb\
-\x39\xa0\xb9\xb9\x99\x05\x0b\x16\x50\x51\x51\xc1\xbc\xb9\x73\x89\
-\x8e\x8a\x02\xe0\x17\xb3\x67\xf3\xfb\xa7\x9f\xe6\xab\xde\xd9\x28\
-\xb2\x44\x78\xdf\x41\xd4\xef\x7c\x9b\xa5\x53\x6f\x67\xd2\xa4\x49\
-\x0c\x1b\x99\xc9\xb0\x67\x77\x70\x7c\xcb\x1a\x06\xdf\x33\x9f\xaa\
-\xc7\xc7\x53\xfd\xb9\xe7\x66\xe8\xbe\xdf\x3e\x4f\xd6\x6f\xd6\xd0\
-\xd2\x78\x82\xba\x8f\xde\x60\xa8\xdc\xc0\xfa\xf5\xeb\xc5\xb8\x82\
-\x42\x51\x14\x5e\x5f\xbb\x16\xc9\xed\x16\x8b\xae\x09\x0a\x70\xf2\
-\xe4\x49\x4a\xde\x7c\x93\xa5\x4b\x97\xaa\x4f\x9f\xd4\xa3\x5d\x64\
-\x64\x24\x2b\x57\xae\x24\x2e\x2e\x8e\xc1\x83\x06\x11\x66\x36\x13\
-\x66\x36\x83\x4e\x87\x5e\xaf\xc7\x79\xf9\x7b\xa2\x07\x0f\xc7\x68\
-\x89\xc4\xd5\xda\xa2\x0e\x73\xbd\x5e\x87\xa3\xa9\x91\x7e\xb9\x53\
-\xb0\x7f\xdf\x08\xde\xc7\x5f\x7a\xbd\x1e\xc9\x69\xc7\xfe\x7d\x23\
-\x6d\x97\xce\x21\xb5\xb5\x5e\xf5\x49\x32\x2c\x2c\x4c\x8d\xe3\x87\
-\xd2\x62\xb1\x30\x6a\xd4\x28\xd2\xd2\xd2\x02\x1e\xbd\x05\x1c\x85\
-\x2f\x5e\xbc\x48\x71\x71\xb1\x66\x0a\xd4\xd6\xd6\x32\x69\xea\x4c\
-\xa2\x33\x0b\x70\xb5\x5c\x22\xf6\x7c\x35\x1f\x6f\x29\x27\x34\x34\
-\x94\x37\xde\x78\x83\x67\x56\xaf\xa7\xcf\x88\xf1\x34\x1d\xd9\xcb\
-\xac\x3b\x33\x58\xb2\x64\x09\x8a\xa2\x30\x63\xc6\xbd\xd4\xba\xa2\
-\xb0\xf4\x19\xc0\x99\xbf\x6d\xa1\xe4\xd5\x17\x19\x37\x6e\x9c\xda\
-\x76\x67\xe8\x89\x29\x30\x65\xda\x34\x76\xed\xda\xa5\xda\xba\x24\
-\x00\x40\x7d\x7d\x3d\xef\xbf\xff\x3e\x91\x91\x91\x4c\x9f\x3e\x1d\
-\x8b\xc5\xa2\xfa\x7c\xfa\xe9\xa7\x54\x55\x55\x31\x6c\xd8\x30\x26\
-\x4e\x9c\xa8\xda\x5d\x2e\x17\x1b\x37\x6e\xe4\xf4\xe9\xd3\x14\x14\
-\x14\x90\x9c\x9c\xac\x96\x75\x05\xff\x14\x01\x26\x4c\x98\xc0\xf2\
-\xe7\x9f\x57\x1d\xf8\x67\xde\xf1\x75\xb3\x00\xad\xad\xad\xfc\x71\
-\xd9\xb2\x2b\x0b\x30\x28\x75\x04\x7d\xb3\x0a\x54\x87\x1b\x09\xb2\
-\xdb\x45\x9f\x8b\x47\xaf\x2c\xc0\xb0\x09\x93\xb1\x3e\xbf\x4d\x75\
-\xb8\x91\xe0\x6a\x6d\xe6\xf4\xb2\x7b\x02\x04\xd0\x2c\xcb\x8a\x77\
-\x0b\x12\x89\x97\xa2\x4d\x4c\xfb\xfc\x44\xdf\x60\xed\x88\x3e\x5d\
-\xa9\x1b\xcc\x26\xb6\xd7\x51\x3b\x28\xda\x17\x34\x1a\x01\xc0\x3b\
-\xf7\x3a\x68\x48\xb4\x89\xe9\x60\xc1\xf9\xd3\xed\xb0\xd1\x74\xec\
-\x4b\x4e\x55\x6e\xa4\xee\xc3\xd7\xa8\xdb\xfc\x0a\xc7\x3f\x7e\x83\
-\xc6\xaa\x72\x2e\xd7\x1f\x45\x96\xdc\x1d\xd6\x0d\x66\xf7\xbf\x56\
-\x97\x62\x10\xa0\x99\x02\xe9\x13\x8a\xb1\x3e\xf7\xb1\xaf\xd8\x3b\
-\x26\x7c\x69\x84\xbc\xd8\x60\x30\x1b\x38\x5b\x2e\xd1\xb0\xbb\x94\
-\xc6\xaa\x0f\x89\x75\x9e\x27\x63\xc4\x6d\x24\x25\x25\x11\x17\x17\
-\x87\xd1\x68\xc4\x6e\xb7\xd3\xd8\xd8\x48\x75\x75\x35\xfb\x0e\x1d\
-\x81\xfe\xe9\x0c\xc8\x9d\x4a\x9f\x91\x13\xd0\x1b\x7c\xaf\xcf\x95\
-\x20\xed\x8b\x31\x75\x64\xf3\xc0\xd5\xda\xcc\x99\x15\x53\xaf\xbc\
-\x06\xa4\x8f\x2f\x26\xe7\xb9\xf6\x6d\xf0\x87\xc0\x65\xbb\x44\xed\
-\xa6\x97\x70\x1f\xd8\xca\xbc\xd9\xb3\x28\x2e\x2e\xa6\xbe\xbe\x9e\
-\xaa\xaa\x2a\x8e\x1e\x3d\xca\xd9\xb3\x67\x71\xb9\xdd\x58\xcc\x66\
-\xfa\xf5\xeb\x47\x5a\x5a\x1a\xd9\xd9\xd9\xb4\xb5\xb5\xf1\xe6\x9b\
-\x6f\x52\xb6\xbd\x92\xfe\x93\x1e\x66\xc0\x1d\x33\xd0\x5d\xe5\x21\
-\x2a\x18\xdc\xad\xcd\x9c\x79\x21\x70\x1b\x0c\xde\xaa\x38\x6c\xae\
-\x81\x8d\x7f\xdb\xc2\xfe\x25\x05\x3c\x72\xc7\x50\x36\xbd\xbb\x81\
-\x13\x27\x4e\x90\x57\x5c\xcc\x82\x8d\x9b\xd8\x7e\xf3\x10\x2e\x3d\
-\xfa\x04\xb1\x25\x1b\x88\x7f\xb7\x0c\xcb\xab\x6b\xa9\x9f\x35\x87\
-\xb7\x75\x46\xa6\xfc\xe1\x59\x66\xff\xea\x57\x0c\x18\x30\x80\xca\
-\x8f\xca\xc8\x72\x57\xf3\xd9\xe2\x49\xb4\x34\x7c\xa3\xb9\xc6\xd5\
-\x52\x51\xb4\xa3\x22\xa8\x00\xfe\x73\xe8\x6a\x29\x4b\x6e\x0e\xaf\
-\x5b\x4a\xaf\xaf\x36\xb0\xe3\xc3\x4d\x7c\xf5\xd5\x57\x4c\x7c\x70\
-\x3e\xc7\xf2\x0b\x18\xff\xf7\x03\x64\xae\x7c\x99\x81\xd3\x67\x10\
-\x93\x96\x8e\x29\x36\x96\x90\xc8\x48\xc2\xe2\x13\xe8\x3d\x26\x8b\
-\xa1\xbf\x7a\x88\xec\xf5\xef\x30\xf2\x93\xdd\x94\x85\x5a\xb8\xb3\
-\x78\x32\xc9\xc9\xc9\x6c\x7a\x6d\x39\x27\x5f\x9e\x47\xe3\xe7\x5b\
-\x34\xd7\xbb\x1a\x06\x9b\x16\x41\x04\x50\x3c\xab\xa5\x4a\x9f\x82\
-\xa2\x4d\x4c\x2b\x28\x92\x8b\xfd\x2f\x2d\xe0\x67\x83\xc3\x58\xbc\
-\x78\x31\x77\x4f\x9b\xc6\xc1\x8c\xd1\x8c\xdf\xfe\x09\x89\x3f\x29\
-\x00\x1d\x28\x92\x8c\x22\xfb\x51\x92\x51\x24\xc9\x6b\x97\x50\x64\
-\x19\x63\x78\x04\x49\x0f\x3e\xcc\xed\x15\x7b\x78\xe5\x68\x2d\x4b\
-\x9f\x7a\x8a\xcd\x1b\xdf\xc5\xb8\x7b\x2d\xf5\x7f\xfd\xdf\x2b\xc6\
-\x10\x18\x67\x10\x0a\xd0\x0a\xe0\xd9\x07\xdb\x87\x8c\x22\x03\xde\
-\xc6\xf1\xb7\xf9\x0b\xe3\xf9\x3c\xb8\xe6\x77\xcc\x1a\x37\x94\xbc\
-\xbc\x3c\x8a\xe7\x3f\x4c\xea\xfa\x77\xb8\x79\xe6\x7d\xde\x2f\x2a\
-\x79\x28\x7b\x3f\xfd\xf3\x3e\x0a\x36\x43\x58\x18\x23\x9e\x5d\x86\
-\xeb\x97\xbf\x66\xf2\xcc\x99\xbc\xfa\xca\x9f\x30\xef\x7b\x97\xc6\
-\xcf\x3f\x0a\x1e\x03\x5e\x9b\x1a\xa7\xb7\xd7\xfd\xbf\x8f\x00\xad\
-\x00\x7e\x53\x00\x45\x41\x41\x41\x91\xfd\x86\x91\x68\xf3\x5e\xec\
-\xe4\x8e\xb7\x18\x13\xdb\xc6\xf8\xf1\xe3\x99\xf7\xe4\x52\xb2\x37\
-\x7d\x40\xf8\x4d\x37\xb7\xf7\xb8\xa4\x25\x82\x9d\x20\x3e\x8a\x24\
-\x93\x98\x5f\x40\xe2\x1f\x96\x31\x7d\xd6\x2c\xd6\xac\x7e\x8d\xa6\
-\x0f\x56\xd0\xdc\xf0\x8d\x26\x06\x95\x72\xbb\x08\x6a\xb9\x4f\x08\
-\x01\x41\x04\xf0\xcd\x15\x3f\xf5\xfc\x54\x0c\xb0\x79\xd3\xad\x67\
-\xbf\xc5\x56\xb1\x8e\x25\x4b\x96\x30\x7b\xe1\x22\xc6\x94\xac\x27\
-\x24\x26\x46\xed\x49\x24\x09\xe4\x76\xfa\xec\xb2\xb7\xb7\x7d\x36\
-\xd9\xe7\xef\x3f\x2a\xbc\x8c\x1b\x93\x45\xef\xdf\xfc\x8e\x05\x0b\
-\x17\xb2\x6e\xcd\x2a\x0e\xbe\xfa\x98\xc7\xb7\xb3\x18\x7d\x36\xb5\
-\x2c\x10\x1a\x01\x14\x40\x51\x64\x2f\x95\xf6\x34\x7e\x69\x81\xd5\
-\x25\x4f\xb3\x72\xc5\x32\x1e\x7d\xec\x31\x86\x3c\xfd\x0c\xe6\x3e\
-\x09\x9e\x2f\xad\xce\x6f\x1f\x3d\x79\xbc\xbd\xed\xef\xd3\x6e\x13\
-\xf3\xed\x3e\x89\x77\xe5\x73\x6a\x68\x32\x7b\xf7\xee\x65\xe6\x5d\
-\x59\xd4\xff\xf5\x1d\x4d\x2c\x9a\xb8\x03\xf2\x5d\x10\x00\xf0\x53\
-\xcc\x37\xbf\xc5\x74\x3b\x2f\x9f\xa8\x26\xc9\xdc\x8a\xdb\xed\xe6\
-\x68\x78\x24\x7d\xb2\x73\xbc\xbd\xe6\x59\xd4\xf0\x5f\xf0\xfc\xec\
-\x81\x69\x7f\x9b\x98\xf7\xf7\x91\x49\x7d\xe2\xb7\x2c\x5b\xbd\x9a\
-\x87\x1e\x7a\x88\x86\xad\x6b\x51\xdc\x6e\x4d\x4c\xda\x58\xfd\x16\
-\x48\x01\x5a\x01\x14\x02\xe7\x93\x77\x4e\x05\x4d\x2b\x0a\x27\xfe\
-\xb2\x8e\x27\x1e\x7f\x9c\x3f\x3c\xf7\x1c\xb7\x3c\xf6\xb8\xd0\xe3\
-\xdd\x4f\x43\x68\x28\x7d\x7f\x71\x3f\x1b\x36\x6c\x60\x46\xc1\x78\
-\xce\xfc\x7d\x7b\x40\x3c\x08\xb1\x6b\xf2\x02\xb4\x02\xa0\x80\x2c\
-\x50\x09\x9e\x96\x9d\x0e\x94\x13\x7f\x27\x3e\x3e\x9e\x93\x96\x70\
-\xc2\x6f\x1a\x18\xb8\xc5\xf5\x10\x6f\x9a\x3c\x95\x37\xdf\x7b\x8f\
-\x59\xb3\x66\xd1\xb0\xa7\x2c\x20\x26\xc5\x3f\x56\xd9\xbb\x20\xfa\
-\x6c\x5d\x13\x00\xcd\xde\xa9\x08\x79\x1f\x2f\xd4\xee\x63\x42\x6e\
-\x36\x9b\x37\x6f\xa6\xff\xa4\x9f\x69\x7a\xab\xa7\x68\x08\x0d\x45\
-\x4a\x4e\xc1\xed\x76\x63\x38\xff\x0d\xb2\xdb\xd5\x1e\x97\x1c\x24\
-\x6e\xaf\xad\xcb\x23\x40\x5c\x54\x7c\x8d\x89\xbc\x70\x6c\x1f\xd9\
-\xd9\xd9\x54\x54\x54\xd0\x7b\x4c\x16\x8a\xdb\x8d\x1c\x84\xa2\x5d\
-\xf1\xb3\x89\x65\xa2\x9f\x68\xf3\xb1\x77\xd6\x38\x2a\x2b\x2b\x19\
-\x9b\x71\x1b\x2d\xa7\x6a\x35\xb1\x05\x8b\x1b\x59\xfb\xa3\x4d\xad\
-\x00\x0a\xc2\x82\xd4\x31\x5b\x1a\x6a\xb9\xe5\x96\x5b\x38\xfa\xdd\
-\x77\x98\x62\x63\x3d\xb7\xb2\x41\x28\xda\x65\x3f\x9b\x58\x26\xfa\
-\x89\x36\x45\xf2\x08\x13\x9d\x9c\xc2\x81\x03\x07\x48\x4d\x4d\xa5\
-\xb9\xfe\x88\x26\xb6\xa0\x54\xba\xb0\x08\x7a\x0e\x39\xda\x79\x17\
-\x8c\x8e\x0b\x67\x88\x8b\x8b\xc3\x1d\x11\xe9\xed\x55\x29\x08\x45\
-\xbb\x2f\x2f\x7e\x8a\xf4\x8d\x14\xd1\xe6\x99\x06\xa1\x71\x71\xd4\
-\x9f\x3a\x45\xff\xfe\xfd\x71\x34\x9d\xd6\xc4\xd6\x11\x45\x68\x04\
-\xb8\x9a\x11\x20\xb7\xd9\xd1\xe9\x74\x18\x2c\x16\x64\xb7\xa4\x19\
-\xa6\x1e\x7a\x02\xd7\xe6\x7d\xfe\xda\x7a\xed\xe5\x62\x59\x7b\x5e\
-\x6f\x0c\xa1\xa5\xa5\x85\xf0\xf0\x70\xdc\x8e\x56\x4d\x6c\x1d\x51\
-\x84\x56\x00\x14\x4d\xa5\x8e\x88\x4e\x87\x4e\xa7\xf3\xeb\x2d\x81\
-\xde\xe1\xea\xfb\x52\xea\xd0\x16\xfd\x84\x3a\x01\xe5\xde\x36\x34\
-\x3e\x2e\x27\x46\xef\x1f\x60\xe8\x74\x3a\x4d\x6c\x1d\x51\x84\x56\
-\x00\x25\xf8\x14\xf0\x1d\x68\xfc\x0f\x36\x46\x4b\x14\x0e\x87\x03\
-\xe9\xf2\x65\xed\x3c\xf5\x05\x2e\xe6\x45\x9b\x48\xb1\x5c\xcc\x7b\
-\x6d\xce\x0b\x17\xe8\xd5\xab\x17\x4d\x4d\x4d\x18\x2d\x91\x9a\x78\
-\x83\x91\xae\xac\x01\x40\xc0\x99\x5d\x4c\xfb\xdb\xcc\x3f\xea\x4b\
-\x7d\x7d\x3d\xd1\xb2\x84\x59\x92\x08\x87\xeb\x46\x77\xfd\xb7\x0c\
-\x1d\x3a\x94\xba\xba\x3a\xc2\x7a\x25\x04\xdc\x6b\x74\xc4\xae\x8f\
-\x00\xc5\xeb\xac\x48\x6a\x5a\x91\xbd\x69\x5f\x5e\x91\x88\xe8\x37\
-\x84\x7d\xfb\xf6\x31\x7a\xc4\x08\x0c\x27\xfe\x41\x9f\x10\xe3\x75\
-\x63\x5b\xf5\x21\x32\x33\x33\xd9\xb7\x7f\x3f\x91\xfd\x87\x06\xc6\
-\xe7\xcf\x80\xb8\xbb\x30\x02\x14\xfc\x1e\x5a\xf8\x3e\x7d\xf4\xdd\
-\xa2\x7a\xd3\x31\x83\x6f\x63\xe7\xce\x9d\xe4\xe7\xe7\x73\xfe\xd3\
-\x3d\x24\x84\x84\x90\x10\x12\x42\xbc\x97\xfe\xe9\x60\x79\x9f\x4d\
-\xac\xd7\x91\xaf\x7f\xd9\x99\xaa\x2a\xc6\x8e\x1d\xcb\xc1\x7f\x7c\
-\x47\x48\x78\x8c\x36\x3e\x5f\x5e\x11\xa6\x81\x00\x8d\x00\x9e\x35\
-\xc0\xaf\xd7\x25\xed\x42\xe2\x69\x4c\x22\xac\x57\x02\xfb\xbe\x69\
-\x20\x3b\x3b\x9b\x6f\x76\xee\xa0\x4f\x88\x91\xf8\x50\x13\x09\x5e\
-\xde\x6c\x31\x93\x1e\x1d\xc5\xc8\xd8\x18\x6e\x8b\x89\x66\x48\x44\
-\x38\x7d\x43\x43\xd5\xf2\x84\x50\x13\xf1\x7e\x4c\x08\x35\x91\x18\
-\x1a\x4a\x52\x44\x38\xc3\x63\xa2\xc9\x88\x8d\x61\x78\x4c\x14\x43\
-\x23\xc2\x49\xf4\xab\x23\x9f\xaa\x67\x50\x4c\x34\x5f\x7e\xf9\x25\
-\xd1\x29\x59\xda\xf8\x7c\xa7\x46\xff\xb4\x37\x2f\x42\xf3\x54\xf8\
-\xd6\xec\x7c\x46\x3e\xf2\x4a\xa0\xd7\x15\x70\xaa\x72\x23\x73\x32\
-\xe2\x39\x79\xf2\x24\x51\xc3\x86\x93\x33\xa9\x90\x50\x83\x81\x38\
-\x73\x28\x66\xf5\x91\x76\x3b\xdc\x8a\xcc\xc5\x36\x27\x32\x60\x36\
-\x18\x08\xd1\xeb\x91\x15\x05\xa7\x2c\x63\xd4\xe9\xb1\x18\x0d\xe8\
-\x83\xbc\x8f\x94\x14\x85\xa6\xb6\x36\x2e\x39\x5d\xbc\xf8\xd8\xbf\
-\xf3\xc8\xcf\x7f\xce\xf2\xe5\x2b\x70\xe5\x3e\x88\x25\x6e\x80\xe8\
-\x1e\x14\x6e\x87\x0d\xfb\xc6\x25\x9d\x3f\x15\x0e\x3e\x7f\x82\xcc\
-\x2d\x59\x22\x21\x33\x9f\x57\xd6\xfc\x0f\x8b\x16\x2d\x62\xf3\x2b\
-\x7f\x22\x56\xaf\xa3\x97\x29\x04\x49\x92\x69\x71\x3a\x35\xd4\x29\
-\xd0\xcf\x62\xe1\x26\x8b\x85\xb8\xd0\x50\x62\x42\x42\xe8\x65\x32\
-\x91\x10\x16\x46\xef\x50\x13\x26\xbd\x1e\xbb\xdb\xad\xa9\x67\x77\
-\xb9\x30\xeb\xf5\x5c\x38\x76\x14\xc7\x77\xdf\x11\x19\x19\xc9\x91\
-\x4b\x0a\xe6\x1f\x25\xb6\xaf\x55\x7e\x71\x05\xa3\xef\xb7\x0b\xfe\
-\xd0\x8e\x80\xdb\x27\x72\xdb\xc2\x97\xd4\xd7\x0b\x5d\xc1\xa9\xdd\
-\x9b\xb8\x67\x88\x99\xf8\xf8\x78\x0e\xd7\xd5\xf1\xfb\x65\x7e\x6f\
-\x97\xbb\x11\x0e\x87\x9d\x29\x13\x27\xf2\xc6\xea\xd5\xfc\xfa\xc1\
-\x87\x30\x4e\x78\x98\xf0\xf8\xc0\x3f\xac\x50\xfc\x5e\x8d\x88\x70\
-\x3b\x6c\x38\xca\x9e\xbe\xf2\x08\x50\xf0\x6c\x83\xa2\x7a\x57\x62\
-\xe2\xd8\x42\x5e\x2f\xfd\x98\xd1\xa3\x47\x73\xe6\xdb\x6f\xd9\x5e\
-\xba\x91\x04\x8b\xb9\x5b\xd9\x27\x2c\x94\x25\x8b\x16\xf1\xcb\x39\
-\x73\xf8\xf0\xc3\x0f\x69\xea\x95\x82\x25\xae\xbf\x26\x96\x2b\xc7\
-\xae\x1d\x01\x1a\x01\x3a\x3a\x08\x5d\x89\x00\x43\xa6\xfd\x07\x3f\
-\x9f\xfb\x00\x7f\x7c\xee\x39\x5e\x5f\xbd\x9a\x4d\xef\xbd\x87\xc9\
-\x60\xe8\x16\xea\x15\x85\x45\x0f\x3f\x4c\x62\x42\x02\x03\x07\x0e\
-\xe4\xe5\xb7\x37\x73\xd3\xf8\x7f\xd3\xc4\xd1\x39\xb5\x8b\xa0\x56\
-\x00\xba\x7e\x2f\xe0\xcf\xb0\xd8\x78\x62\xee\xbc\x9f\x7b\xef\x9b\
-\xc5\x9a\x35\x6b\x58\xbd\x7a\x35\x4f\x3d\xf5\x14\xee\x4e\xfe\x6e\
-\xb0\x33\x9c\x3f\x7f\x9e\xa2\xa2\x22\x7a\xf7\xee\x4d\x41\x41\x01\
-\xf3\x16\x3d\x41\xf2\xcc\xdf\xc1\x35\xc4\x19\x6c\x0d\x08\x22\x40\
-\xd7\xef\x05\x44\x46\xdd\x9c\x8a\x7e\xd4\x54\x7e\x36\x79\x2a\xcb\
-\x96\x2d\xa3\xb5\xb5\x15\x6b\x4e\x0e\x7b\xf7\xee\x15\x2f\xd2\x29\
-\x24\x59\xa6\xa4\xa4\x04\xab\xd5\xca\xec\xd9\xb3\x49\x4a\x4a\x62\
-\xfa\xbc\xf9\x0c\xb9\x6f\x09\x46\x73\xb8\xe6\xda\x5d\xa2\xa2\xed\
-\x0c\xad\x00\xd7\x30\x05\xfc\x19\x3d\x68\x18\xd1\x13\x1f\x62\x62\
-\xf1\xbd\xf4\xed\xdb\x97\x17\x5f\x7c\x91\xc5\x8b\x17\xf3\xd3\x9f\
-\xfe\x94\xd2\xd2\x52\x5a\x5a\x5a\xc4\x2b\x06\xa0\xa1\xa1\x81\x95\
-\x2b\x57\x92\x31\x72\x24\x55\x55\x55\x94\x96\x96\xb2\x65\xcb\x16\
-\x1e\x7f\xfe\x35\x52\x66\x3f\x4d\x48\x78\xb4\xe6\x9a\x57\x43\x11\
-\x9a\x5d\x20\x65\xec\x78\xd2\xe7\x3d\x13\xe8\xe4\xfd\xf4\x5f\x61\
-\x83\xad\xb6\xfe\x36\xc9\xe5\xe4\xdb\x4f\xde\xe6\x47\x2d\xdf\xb2\
-\xe4\x3f\x17\xf3\xe3\x1f\xff\x98\xb7\xde\x7a\x8b\xed\xdb\xb7\x13\
-\x1b\x1b\x4b\x72\x4a\x0a\x09\xf1\xf1\x84\x98\x4c\xb4\xda\x6c\xd4\
-\x9f\x3a\x45\xf5\xe1\xc3\x84\x87\x87\x53\x54\x54\x44\x51\x51\x11\
-\x1f\x7c\xf0\x01\x2b\x5e\x5e\x45\xf4\xa8\x49\xc4\xdd\x96\xa7\xbe\
-\x1c\xef\x6a\x0c\xa2\x5d\x6a\x6b\x45\xda\xb6\xf2\xca\xaf\xc7\x53\
-\xb2\xee\x24\x7d\xee\x7f\xa9\x0e\x3f\x14\x8e\x8b\x67\x69\xf8\xf4\
-\x7d\x4c\xdf\xff\x83\x69\xc5\x45\xe4\xe7\xe7\x33\x78\xf0\x60\x1a\
-\x1b\x1b\x3d\xaf\xc7\x5d\x2e\x2c\x16\x0b\x89\x89\x89\x44\x44\x44\
-\xb0\x6f\xdf\x3e\xca\xcb\xcb\xf9\xf8\xaf\x7b\x88\x4a\xcd\x21\x21\
-\xf3\x27\x18\x4c\xdd\xf3\xaf\x35\xdc\x6d\xad\xc8\x3b\xfe\xbb\x73\
-\x01\xd2\xe6\xfc\x5e\x75\xe8\x2e\x48\xae\x36\x2e\x7e\xf3\x15\x97\
-\x8e\x1f\xc2\x76\xfa\x38\x11\x7a\x89\xd8\x08\x33\x21\x21\x46\x5a\
-\x1d\x6d\x5c\x68\x71\xe0\x0e\x8d\x24\xa2\xdf\x10\x62\x87\x8c\x20\
-\xa2\x7f\x52\xb7\xff\x4d\x92\xd4\x66\x47\xfe\xe4\x4f\x9d\x08\x30\
-\xe6\x0e\x52\x67\x2f\xf5\x15\xfb\x4e\x06\xd7\x8e\x4e\x9a\x50\x14\
-\x19\x9d\x4e\xbb\x14\xf5\x04\xa4\x36\x3b\x4a\xc5\xaa\x2b\x1f\x84\
-\x08\x78\x2a\x2c\x69\x9e\xb4\x5e\x15\x7d\x8b\x8f\x2f\xed\xff\xe9\
-\xa5\xe7\x45\x4c\x90\xba\x3d\x44\x11\x1a\x01\x3c\x6f\x90\x82\x6c\
-\x21\xd7\x42\xff\xb3\xb9\xff\xfd\x44\x47\x3e\xd7\x81\x22\x34\x02\
-\x78\xce\x01\xda\xed\xe3\x46\xa1\x08\xcd\x1a\x30\x38\x7d\x24\x89\
-\xb7\x17\x79\xe7\xad\x0e\x74\xde\xe2\x8e\xf6\x97\x60\x50\x7d\xbd\
-\x0b\x80\xef\x0a\x62\x7d\x71\x4f\x43\xf0\x11\x6d\x62\xde\x07\x05\
-\xef\x4f\x7a\xfd\x16\x1b\x31\x5e\xc5\xf3\x4b\xd1\xde\xe7\x0f\x76\
-\xbc\x08\x3a\x1c\x0e\x5e\x78\xe1\x05\xb5\xf0\x46\x44\x62\x62\x22\
-\x73\xe6\xcc\x51\xf3\x01\x02\xfc\x2b\xe2\xff\x00\x35\x40\x34\x76\
-\xd7\xa0\x86\xc1\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\
-\x00\x00\x25\x5b\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x75\x00\x00\x01\x32\x08\x06\x00\x00\x00\x05\xa0\x40\x1c\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x24\xf0\x49\x44\x41\x54\x78\x5e\xed\xdd\xe9\x93\
-\x9c\xc5\x9d\x27\xf0\x6f\x66\xdd\xd5\xd5\xf7\xdd\x52\xb7\x6e\x21\
-\x84\x2c\x24\x0e\x23\x81\x2d\x4e\x63\xf0\x0d\xb6\x59\x76\x3d\xb6\
-\xb1\x3d\x13\x1b\xe1\x17\x1b\xbb\xb1\xff\xc2\xbe\xdb\x8d\xf1\x38\
-\x36\x76\x36\x3c\x83\xbd\x3e\x66\x66\x3d\x3e\xc0\xb3\xb6\x87\xc3\
-\x83\x2d\x30\x60\x81\x90\x25\x84\x84\x6e\xa9\x5b\xea\x56\xb7\xfa\
-\x3e\xaa\xba\xce\xe7\xc9\x7d\x91\x99\x4f\x3d\xd5\x12\x20\x74\x56\
-\xc2\xf7\x13\x72\x94\xba\xab\xdb\x08\xbd\xf8\xf6\x8f\xcc\x6f\xe6\
-\x23\x94\x52\x0a\x75\x2c\x97\xaf\x60\x7c\x32\x8f\x91\xf1\x45\x8c\
-\x9c\x5b\xc4\xf0\xb9\x1c\xa6\x67\x0a\x58\x58\x2c\x63\x31\x5f\x41\
-\xa1\xe0\x21\x5f\xaa\xa0\x58\xf2\xe1\xfb\x75\xfd\xaf\x42\x44\x75\
-\x2c\x16\x95\x48\x26\x22\x48\x25\x23\x48\x26\xa2\x48\x27\x23\x68\
-\x69\x4a\xa0\xa7\x33\x85\x65\x5d\x69\x2c\xef\x6e\xc0\xf2\x9e\x06\
-\x34\x37\xc6\x11\x8d\xca\xa5\xdf\x5e\x37\x44\xbd\x85\xfa\x42\xae\
-\x8c\xe3\xa7\xe7\x70\xe0\xe8\x2c\x0e\x1e\x9b\xc1\xc8\xb9\x1c\x0a\
-\x45\x0f\xbe\xaf\xe0\x2b\x98\x57\x05\xe8\x5f\xb0\x7f\xfc\xfa\xfa\
-\xb7\x20\x22\x17\x09\x01\x08\x08\x98\x5f\x10\x42\x40\x4a\x40\x0a\
-\x01\x21\xf5\xef\xdb\x9a\x13\x58\xb7\xb2\x19\x37\xad\x6d\xc5\x4d\
-\x6b\x5b\xd0\xd3\x91\x46\x3c\x5e\x3f\x21\x7f\xdd\x43\x3d\x97\x2f\
-\xe3\xe4\x99\x2c\xde\x3e\x3e\x83\x03\xc7\x66\x30\x34\x92\xc5\x62\
-\xbe\x82\x72\xc5\x87\xe7\xab\x60\xfa\x56\x4a\x41\x08\x01\xa5\xf4\
-\x5f\xfc\xf9\xaf\x7c\x9f\xef\xf3\xfd\xf3\x3f\xcf\xf7\xaf\xf4\xfb\
-\x52\x02\x52\x4a\x44\x23\x02\x11\x29\xd0\xd1\x96\xc2\x0d\x2b\x9b\
-\x70\xd3\xba\x56\x6c\x5a\xd7\x8a\xce\xf6\x24\x62\xd7\x71\x92\xbf\
-\x6e\xa1\x5e\x28\x79\x38\x70\x74\x06\x2f\xed\x1e\xc3\xfe\x23\xd3\
-\x98\x5b\x28\xa1\x5c\x31\x4b\x28\x0a\x40\xe8\x2f\xd4\x0a\x3e\xe6\
-\xfb\x7c\x9f\xef\xf3\xfd\x3a\x79\x5f\x08\x81\x88\x09\xf8\xd5\xfd\
-\x8d\xb8\x73\x6b\x17\xb6\x6d\xed\x46\x77\x7b\x12\xd1\xc8\xb5\x0f\
-\xf7\x6b\x1e\xea\xd9\x7c\x19\xaf\xee\x39\x87\xe7\x5f\x19\xc1\x99\
-\xd1\x2c\xf2\x05\x1f\x9e\xef\xc3\xf7\xf5\x5f\x90\xfd\x8b\xe2\x2b\
-\x5f\xf9\xca\x57\xd7\x5e\x85\x10\x88\x45\x25\x32\xe9\x28\xb6\x6f\
-\xe9\xc2\x43\x3b\x96\x63\xa0\x37\x83\x58\xec\xda\x85\xfb\x35\x0b\
-\xf5\x7c\xa1\x82\x97\xf7\x9c\xc3\x73\x7f\x3c\x83\xc1\xb3\x39\x14\
-\x0a\x1e\xbc\x77\xd9\xd8\xb4\x3f\x10\x53\xa9\x28\x06\x7a\x1a\xd0\
-\xd3\x99\x46\x7b\x4b\x02\x6d\x2d\x49\x74\xb4\x24\x90\x69\xd0\x1b\
-\x19\xa9\x64\x14\xa9\x44\x14\xc9\x44\x04\x52\x86\x7e\xac\x12\x11\
-\xbd\x0f\xe5\xb2\x8f\x7c\xd1\x43\xbe\x50\x41\xbe\xe0\x61\xb1\x50\
-\xc1\xec\x7c\x11\x53\xb3\x45\x4c\xcd\x16\x30\x3d\x5b\xc4\xe0\x48\
-\x16\x53\xb3\x45\x54\x2a\x3e\xde\x39\xbd\x74\x7e\x45\xa3\x12\x8d\
-\x0d\x51\x6c\xdf\xda\x8d\x87\x76\x2c\xc7\x8a\x6b\x14\xee\x57\x3d\
-\xd4\xf3\x85\x0a\xfe\xb4\x6f\x02\xcf\xbc\x34\x8c\xc1\xe1\x05\xe4\
-\x0b\x15\xf8\x4a\xe9\x35\x2a\x08\xfd\x5f\x32\x02\x35\x1f\xf7\x75\
-\xa7\xb1\x69\x5d\x2b\x6e\xd9\xd8\x8e\x1b\x56\x35\xa3\x31\x13\x47\
-\x44\x0a\x08\x01\x48\x29\x20\x84\xfe\xbd\x30\xdf\x0b\xe8\x8f\x89\
-\x88\x2e\x87\x52\x3a\x8b\xc2\xbf\xf7\x43\xaf\xbe\xaf\x30\x32\x96\
-\xc3\xfe\x23\xd3\xd8\xfb\xf6\x34\x8e\x0e\xce\x61\xb1\x50\x86\xef\
-\x5f\x38\xcf\x00\x20\x16\x93\x68\x48\x47\x71\xd7\xd6\x6e\x3c\x7c\
-\x77\x3f\xfa\x7b\x1b\xae\xea\x9a\xfb\x55\x0d\xf5\x53\xc3\x0b\xf8\
-\xe5\xf3\x43\xd8\x7b\x70\x12\x73\xd9\x12\x3c\xef\xc2\xff\xa8\x78\
-\x5c\x62\x4d\x7f\x23\x6e\xb9\xb1\x03\xb7\x6c\xea\x40\x5f\x57\x1a\
-\xc9\x44\x04\xd1\xa8\x40\x44\x4a\x06\x36\x11\xd5\x0d\xdf\x57\xf0\
-\x3c\x85\x8a\xe7\x63\x21\x57\xc6\xa1\x13\xb3\xd8\x73\x70\x12\xfb\
-\x0e\x4d\x63\x7a\xae\x78\xc1\x9c\xb3\x93\x7b\x4f\x67\x1a\x9f\xbf\
-\x6f\x00\x77\xde\xda\x8d\x96\xc6\xf8\x55\xc9\xb6\xab\x12\xea\xb3\
-\x0b\x65\xfc\x76\xe7\x69\xec\x7c\x6d\x14\xe7\x26\x17\x51\xf1\x14\
-\xaa\xff\x14\xb3\xcb\x00\xa0\xa7\x23\x85\xfb\xb7\xf7\xe1\xe3\xb7\
-\xf5\xa0\xa3\x35\x89\x58\x4c\xef\x28\x73\x19\x85\x88\x5c\xa0\x14\
-\xe0\xf9\x0a\x95\x8a\x8f\x62\xc9\xc3\xe1\x93\xb3\x78\xe6\xa5\x61\
-\x1c\x38\x36\x83\xc5\x7c\x05\xca\x37\x8b\xed\x86\x10\x40\x3c\x16\
-\xc1\xa6\x75\xad\x78\xe4\xc1\x95\xd8\xb8\xb6\x05\xc9\x44\xc4\x24\
-\xe2\x95\x71\xc5\x43\xfd\xe8\xa9\x39\xfc\xd3\x6f\x4e\xe0\xe0\xb1\
-\x59\x2c\xe6\xf5\x52\xcb\x52\x3d\x1d\x29\x3c\x70\x57\x1f\x76\xdc\
-\xde\x83\xae\xb6\x14\xe2\x31\x09\x71\x35\x7e\x64\x11\x11\x5d\x43\
-\x9e\xa7\x50\xaa\xf8\x38\x78\x74\x06\xbf\xd9\x79\xba\x1a\xee\x4b\
-\x62\x30\x22\x05\x5a\x9b\xe2\xf8\xf2\xc3\xab\xb0\xe3\xf6\x5e\x34\
-\x5f\xc1\xa9\xfd\x8a\x85\xba\xef\xfb\xf8\xfd\xae\x51\xfc\xea\x77\
-\xa7\x71\x7a\x34\x8b\x72\xc5\xd3\x13\xb9\x19\xcc\x95\x52\x68\xcc\
-\xc4\xf1\xf0\x8e\xe5\xb8\x7f\x7b\x1f\x7a\x3a\x18\xe6\x44\xf4\xc1\
-\x64\xc3\xfd\xcd\x43\x53\xf8\xe5\xf3\x83\x38\x7a\x6a\x0e\xa5\xb2\
-\x1f\x6a\xcb\x28\x48\x29\x90\x8c\x47\x70\xdf\xb6\x3e\x7c\xe1\x13\
-\x2b\xd0\xd7\x95\xbe\x22\xab\x14\x57\x24\xd4\xe7\xb3\x65\xfc\xe2\
-\xd9\x53\xd8\xf9\xfa\x18\xa6\x67\x0b\x7a\x4d\x29\x54\xf3\x01\x80\
-\x8f\xde\xdc\x89\x47\x1f\x5c\x89\xb5\x03\x4d\x48\x25\x23\x90\x0c\
-\x73\x22\xfa\x80\xf3\x3c\x85\x85\x5c\x19\xff\xf6\xea\x08\x7e\xbb\
-\xf3\x0c\xc6\xa7\x0b\xf0\x97\xe4\x63\x2c\x2a\x71\xc3\xaa\x66\x7c\
-\xe5\x73\x6b\x71\xe3\x9a\x66\x24\xe2\x91\xa5\xff\x37\xef\xcb\x65\
-\x87\xfa\xec\x7c\x09\x3f\x7c\xea\x18\xfe\xb4\x6f\x1c\x0b\xb9\x32\
-\x7c\xdf\x37\x27\xaf\xf4\x09\xac\xe5\x3d\x0d\xf8\xf2\x43\xab\x70\
-\xeb\xa6\x76\xb4\x34\x26\x10\x89\x30\xcc\x89\xe8\xc3\xa5\x5c\xf6\
-\x71\x66\x2c\x87\x5f\x3e\x77\x0a\xbb\xdf\x9a\xc4\x42\xae\x04\xa0\
-\x9a\x93\x52\x00\xcb\xba\x1b\xf0\xc4\xa3\xeb\xb1\x65\x63\x3b\x52\
-\xc9\x4b\x5f\x67\xbf\xac\x50\x1f\x9b\xcc\xe3\x47\x4f\x1f\xc3\x1b\
-\xfb\x27\x91\xcb\x97\x11\xae\x9d\x0b\x00\xf7\x6c\xeb\xc5\xa3\x9f\
-\x58\x81\x81\xbe\x0c\xe2\xb1\xc8\x15\x5b\x33\x22\x22\x72\x8d\xaf\
-\x14\x4a\x25\x1f\xbf\xdf\x75\x16\x4f\x3f\x3f\x88\xb3\xe3\x79\xf8\
-\xbe\x0a\xaa\x23\x42\x08\x74\xb4\x25\xf1\xb5\x2f\xac\xc5\x1d\x37\
-\x77\x22\x93\x8e\x5d\x52\x66\x5e\x72\xa8\x9f\x3c\xb3\x80\x1f\x3f\
-\x7d\x1c\x6f\x1e\x99\x42\xb1\xe8\xc1\x0f\xf5\xcc\x53\xc9\x28\xbe\
-\xf4\xc9\x95\xb8\x7f\x7b\x1f\x3a\xdb\x92\x9c\xce\x89\x88\x8c\x72\
-\xc5\xc7\xa1\x13\xb3\xf8\xf1\xaf\x8e\xe3\xc8\xa9\x39\x7d\x90\xc9\
-\xf6\xda\x05\xd0\x9c\x89\xe1\xf1\x4f\xaf\xc1\x3d\x77\x5c\xda\x06\
-\xea\x25\x85\xfa\xc9\xd3\x0b\xf8\xfe\x2f\x8e\xe2\xe0\xb1\x19\x14\
-\x4b\x5e\xcd\xc9\xaa\xe6\xc6\x18\xbe\xfe\xc8\x3a\xdc\xb9\xb5\x0b\
-\x4d\x99\xf8\x15\x59\xf8\x27\x22\xfa\x20\xf1\xcc\x21\xa6\x1f\xfc\
-\xe2\x28\xf6\x1d\x99\x46\xa1\xe0\x05\xef\x09\x00\xe9\x54\x14\x5f\
-\xf9\xdc\x1a\xdc\xbb\xad\xef\x7d\xf7\xd9\xdf\x77\xa8\x9f\x19\xcb\
-\xe1\xc9\x9f\x1d\xc5\x9b\x87\xa7\x50\x28\x7a\xa1\xdd\x50\x85\xce\
-\xb6\x14\x9e\x78\x74\x1d\x3e\xba\xf9\xd2\xff\xd3\x81\x88\xe8\xc3\
-\xc0\x57\x0a\xe3\x53\x05\xfc\xe0\x17\x47\xf1\xc6\x81\x49\xe4\x0b\
-\xe1\x5e\xbb\x42\x63\x43\x1c\x5f\x7f\x64\x2d\x3e\x7e\x5b\x0f\x9a\
-\x32\x17\x1f\xec\xef\x2b\xd4\xc7\x26\xf3\x78\xf2\x67\x47\xf0\xe7\
-\x83\x53\xfa\x0f\x10\x7a\x6f\x59\x77\x1a\xdf\xfc\xa2\x5e\xe4\x4f\
-\x27\xa3\x17\xfd\x07\x20\x22\xfa\xb0\x52\x0a\x98\x99\x2b\xe2\x47\
-\x4f\x1f\xc3\xab\x7b\xc7\x91\x5d\x2c\xd7\x74\xda\x5b\x9a\xe2\xf8\
-\xc6\xa3\xeb\x71\xe7\x2d\x5d\x17\x3d\x28\x5f\x74\xa8\x4f\xcd\x16\
-\xf0\xe4\xcf\x8e\xe2\xf5\xfd\x13\x58\x2c\x54\xf4\x5d\x07\xba\x70\
-\x89\x35\x03\x4d\xf8\xd6\x63\x37\xe0\xa6\xb5\x2d\x97\x5d\xc7\x21\
-\x22\xfa\x30\x51\x0a\xc8\xe6\xca\xf8\xc9\xff\x3b\x8e\x97\x5e\x1f\
-\xc5\x5c\xd6\xdc\x25\x23\xf4\x2e\x65\x7b\x6b\x0a\xdf\xfa\xf2\x7a\
-\x7c\x74\x73\xe7\x45\x0d\xcc\x17\x75\xab\x8c\xef\xfb\x78\xea\xf9\
-\x21\xec\x3d\x34\x85\xc5\x42\x05\xca\xd7\x3b\xb5\x50\xba\x86\xf3\
-\xd5\x2f\xac\xc5\xc6\x35\x0c\x74\x22\xa2\xf7\x4b\x08\xa0\x31\x13\
-\xc3\x57\x3e\xb7\x16\xdb\xb6\x74\x23\x93\x8a\xe9\xbd\x48\x05\x28\
-\x08\x4c\xcd\x14\xf0\xab\xdf\x9d\xc6\xd0\x48\xf6\x5d\x6f\xb6\xb5\
-\x2e\x2a\xd4\xff\xf0\xda\x18\xde\x78\x6b\xc2\xf4\xd0\x6d\x71\x5e\
-\xa1\xbd\x35\x89\x27\x1e\x5d\x87\xcd\x1b\xda\x90\x48\x30\xd0\x89\
-\x88\x2e\x55\x53\x26\x86\xaf\x3e\xb2\x16\xb7\x6e\x6a\x47\x2a\x11\
-\x09\x72\x56\x01\x38\x36\x38\x8b\x7f\x7d\xf1\x0c\x46\xcf\xe5\xde\
-\xf3\x59\xcc\xef\x19\xea\x47\x07\xe7\xf0\xec\x4b\x23\x38\x3b\x9e\
-\x47\xa5\x62\x6a\x8b\x4a\xa1\x29\x13\xc3\x13\x8f\xac\xc3\xd6\x8d\
-\xed\x48\x25\xa2\x97\x5c\x94\x27\x22\x22\xdd\x7a\x69\x6b\x4a\xe0\
-\x89\x47\xd7\x63\xf3\x0d\x6d\x48\xc4\x23\x26\x6f\x01\xdf\x07\x5e\
-\x7c\x7d\x0c\x6f\x1c\x9c\xc2\x42\xae\x76\xdd\x7d\xa9\x77\x0d\xf5\
-\xb9\x85\x32\x9e\x7e\x6e\x08\x27\xce\xcc\xa3\x5c\xf1\xa0\xf7\x64\
-\x15\xe2\x31\x89\xc7\x3f\xb3\x06\xb7\x7d\xa4\x03\xe9\xf4\x7b\xaf\
-\xf1\x10\x11\xd1\x7b\x13\x02\xe8\xee\x48\xe1\x2f\x3e\xbf\x16\x6b\
-\xfb\x1b\x11\x89\xe8\x67\x45\x28\x28\x94\xcb\x3e\x9e\x7e\x7e\x10\
-\x87\x4e\xcc\xa2\x54\xaa\x56\x20\x97\x7a\xd7\x50\xff\xc3\x6b\xa3\
-\x38\x7c\x6a\x0e\xf9\x82\x07\xa5\x04\xec\xd9\xa7\x4f\xdd\xd3\x8f\
-\xed\x37\x77\xa1\xa9\x31\xc6\x3b\x5c\x88\x88\xae\x20\x21\x80\xd5\
-\xfd\x8d\xf8\xf4\x7d\xfd\x58\xd6\xdd\x60\x32\x56\xe7\xef\xf8\x74\
-\x01\xff\xf6\xca\x59\x9c\x9d\xc8\xbf\xe3\xfa\xfa\x3b\x86\xfa\xe9\
-\xb3\x59\xec\xda\x3b\x8e\x89\x69\x7d\x94\x55\x2f\xd9\x0b\x7c\x64\
-\x7d\x2b\xee\xbe\xbd\x17\x9d\xed\x49\x44\x78\xb0\x88\x88\xe8\x8a\
-\x93\x52\x60\xc7\x6d\x3d\xb8\x63\x4b\x27\x9a\x1b\x75\x95\x51\x40\
-\x40\xf9\x0a\xbb\xde\x9c\xc0\xa1\x13\xb3\xc8\x5f\xe0\x4a\x5f\xbc\
-\x53\xa8\x7b\xbe\x8f\x7f\x7d\x71\x18\x27\x87\x17\x50\xf1\x74\xa0\
-\x03\x02\x6d\x2d\x09\x7c\xf9\xe1\x55\x58\x33\xd0\x78\x55\x1f\xc7\
-\x44\x44\xf4\x61\x17\x8d\x4a\x7c\xe9\xc1\x95\xd8\xb4\xae\x0d\xc9\
-\x44\x44\x9f\x0b\x12\x02\xe5\x8a\x87\x67\x5f\x1c\xc6\xe9\xb1\xdc\
-\x05\xa7\xf5\x0b\x26\xf3\xee\xb7\xa6\xb0\xff\xe8\xb4\x2e\xc2\xfb\
-\x3a\xd0\x95\x52\xf8\xc2\xfd\x03\x58\xbf\xb2\x19\xf1\x18\x9b\x2e\
-\x44\x44\x57\x5b\x53\x63\x1c\x9f\x7b\x60\x00\x03\xbd\x0d\xfa\x0e\
-\x2d\xa5\xf3\xf8\xd8\xd0\x1c\x76\xed\x1d\xc7\xf4\x6c\xe1\xbc\x07\
-\x11\x9d\x17\xea\xe5\x8a\x8f\x3f\xbe\x3e\x86\xd1\xf1\x3c\x3c\xcf\
-\x37\x37\xba\x03\x5b\x36\xb4\x63\xf3\x86\x76\x34\x66\xb8\x31\x4a\
-\x44\x74\x2d\x08\x01\x6c\x5c\xdb\x82\x5b\x36\x76\xa0\x39\x13\x87\
-\x30\xfd\x75\x5f\x01\x3b\x5f\x1f\xc5\xf0\xb9\xc5\xf3\x9e\x89\x7a\
-\x5e\xa8\xef\x3b\x34\x85\xa1\xb3\x59\x14\x8b\x95\x60\x42\x4f\xc4\
-\x25\x1e\xf8\x58\x1f\xfa\xfb\x1a\x10\x89\x9c\xf7\x2d\x44\x44\x74\
-\x95\x44\xa4\xc0\xa7\xee\x59\x8e\x81\xbe\x06\xbd\x8f\x69\xfa\xeb\
-\xe3\x53\x05\xec\x7b\x7b\x0a\x33\x73\xc5\x9a\x69\xbd\x26\xa1\xcb\
-\x15\x1f\x2f\xbf\x31\x8e\xb3\xe3\x8b\xf0\x7c\xfd\x8d\x02\x02\xdb\
-\xb6\x76\x61\xfd\x8a\x66\x24\xe3\x97\x7e\x71\x3b\x11\x11\x5d\x9a\
-\xce\xb6\x14\xee\xba\xa5\x1b\x9d\x6d\xa9\x60\xd3\xd4\xf7\x15\x5e\
-\xdd\x3b\x8e\xb1\x49\xf3\x34\x25\xa3\x26\xd4\x0f\x1c\x9d\xc1\xc9\
-\x33\xf3\x28\x94\xbc\x20\xd0\x63\x31\x89\x6d\x5b\xba\xd0\xdd\xc1\
-\x7b\xd1\x89\x88\xae\x07\x21\x80\x8f\xdd\xd6\x8d\xde\xce\x14\x22\
-\x11\x09\x65\xda\x88\xc3\x63\x39\xec\x7d\x7b\x0a\x33\x0b\xa5\x60\
-\x5a\x0f\x42\xdd\xf7\x15\xfe\xb4\x77\x1c\x63\x13\xe6\x19\xa3\xa6\
-\x17\x79\xfb\xe6\x0e\xac\x5c\xa6\x9f\x5c\x44\x44\x44\xd7\x47\x6b\
-\x53\x02\xb7\x6f\xee\x40\x7b\x4b\x1c\x52\xea\x60\x57\x3e\xf0\xca\
-\x9e\x73\x18\x9b\xb0\xd5\xf3\x50\xa8\x0f\x8f\xe5\x70\x6a\x38\x8b\
-\xc5\x7c\x59\x37\x18\x95\x42\x2c\x2a\x71\xe7\x2d\x5d\xe8\xe9\x48\
-\x71\x4a\x27\x22\xba\x8e\x84\x00\x76\xdc\xde\x83\xbe\xae\x06\x44\
-\x6c\x6f\x5d\x29\x9c\x19\xcd\x61\x78\x6c\x11\xc5\xa2\x07\xa5\x42\
-\xa1\xbe\xef\xf0\x34\x26\x66\xf2\xf0\x94\x3e\x92\x0a\x21\x70\xd3\
-\xba\x56\xac\xe8\xcd\x20\xce\xdb\x17\x89\x88\xae\xbb\xf6\x96\x24\
-\x6e\x5a\xd7\x82\xe6\xa6\x84\x6e\x21\x0a\x01\xcf\xf7\xb1\xff\xf0\
-\x14\xa6\x66\xf5\x86\xa9\x84\x79\xd2\xf5\x81\x23\x33\x98\x9e\x2d\
-\xc1\xf7\x7c\x7d\xb5\x8c\x52\xd8\xb2\xa1\x1d\xed\xad\x49\xb0\xf0\
-\x42\x44\x74\xfd\x09\x01\xdc\xbc\xa1\x0d\xed\x2d\xb6\xde\xa8\x97\
-\xca\xdf\x3c\x34\x8d\x89\x99\x02\x7c\xdf\x84\xfa\xe1\x93\x73\x18\
-\x9d\x58\x44\xa5\xec\x99\x5e\xba\x42\x4b\x63\x1c\x6b\x57\x36\xa1\
-\xb1\x21\xa6\xef\x4e\x27\x22\xa2\xeb\xee\xa6\xb5\xad\xe8\xee\x48\
-\x21\x26\x45\x90\xd7\x53\xb3\x05\x1c\x1b\x9c\xc7\x42\xae\xac\x43\
-\xfd\xd8\xd0\x3c\xe6\x16\xca\xf0\x95\x5e\xa3\x81\x10\xd8\xbc\xa1\
-\x0d\x9d\xad\x09\xae\xa5\x13\x11\xd5\x91\x48\x44\x60\xd3\xba\x56\
-\xb4\xb6\x56\x97\x60\x7c\xa5\x87\xf3\xd9\xf9\x12\xa4\x52\xc0\xf1\
-\x41\x13\xea\xbe\xaf\xaf\xd7\x55\x0a\x9b\x37\xb4\xa1\xa3\x35\xc1\
-\x5b\x18\x89\x88\xea\xcc\xcd\x37\xb6\xa1\xbd\x25\x81\x88\xd0\x83\
-\xb8\x80\xc0\xe0\x99\x2c\x16\xb2\x65\xc8\xf1\xe9\x3c\xa6\xe6\x0a\
-\x28\x57\x3c\x53\x63\x04\x3a\x5a\x53\x58\xd6\x93\x46\xf2\x22\x9e\
-\x87\x47\x44\x44\xd7\xd6\x8a\xbe\x0c\xda\x5b\x92\x88\x44\x05\x84\
-\xd0\xf5\xf3\xb1\xa9\x3c\xa6\xe6\x8a\x90\x43\x23\x39\xcc\x67\xcb\
-\xf0\x95\x0a\x0a\xed\x03\x3d\x0d\x68\x4c\xf3\xae\x74\x22\xa2\x7a\
-\x24\xa5\x40\x7f\x6f\x03\x1a\xd3\xf1\xe0\x94\xbf\xe7\xf9\x38\x7d\
-\x36\x0b\x39\x38\xb2\x80\x6c\xce\x3c\x4c\xda\xf4\x1e\xfb\x7b\xd3\
-\xc8\x34\xe8\x3b\x7c\x89\x88\xa8\xfe\x0c\xf4\x66\xd0\x90\x8a\xea\
-\xe1\x5b\xe9\xfc\x1e\x1c\xce\x42\x4e\x4c\xe5\xb1\x58\x28\xeb\xf3\
-\x46\xfa\x1d\xf4\x2f\xcb\x20\x93\x66\xeb\x85\x88\xa8\x5e\x0d\xf4\
-\x36\x20\x93\x89\x02\x66\xb3\x54\x41\x61\x74\x7c\x11\x72\x6a\xa6\
-\x88\x62\xd1\x0f\xee\x4d\x87\x02\x3a\x9a\x13\x48\x26\x22\x9c\xd4\
-\x89\x88\xea\x54\x77\x67\x0a\xe9\xa4\x9d\xd4\x75\x7e\x4f\xcc\x14\
-\x21\x8b\x65\x15\xdc\x19\x00\xa5\xd0\xd1\x96\x42\x3a\x1d\x05\x9f\
-\x54\x47\x44\x54\xbf\xd2\xc9\x28\x32\xe9\x28\xa4\x3d\xf0\xaf\x14\
-\xb2\x8b\x65\xc8\x52\xd9\x83\x12\xba\xf5\x02\x21\xd0\xd6\x1c\xd7\
-\x97\x77\x71\x4c\x27\x22\xaa\x5b\x42\xe8\x4b\xbe\x92\xf1\x48\xb0\
-\x04\xe3\xfb\x0a\xd2\xd3\x17\xa7\xeb\x1d\x54\xa5\xd0\xd6\x1c\xe7\
-\xbd\xe9\x44\x44\x0e\x68\x6b\x49\x20\x11\x8f\x04\x4b\x30\x02\x80\
-\xf4\x7c\x05\xe8\x5f\x00\x04\x32\xe9\x38\x62\x31\xa9\x93\x9f\x88\
-\x88\xea\x56\x26\x1d\x43\x2c\x6a\xd7\x5f\xf4\x8a\x8b\xf4\x3d\xdd\
-\x7a\x11\xa6\xfd\x92\x48\x48\x44\x22\x82\x99\x4e\x44\x54\xe7\x12\
-\xf1\x08\xa4\xb9\x70\xd1\x9e\x33\x92\x9e\xd9\x35\x55\xa6\xe7\x18\
-\x8f\x47\x78\x2b\x23\x11\x91\x03\xe2\x71\x11\xdc\xcf\x65\xcf\x19\
-\x49\x28\x65\x2e\xf1\x32\x93\x7a\x4c\x42\x4a\x2e\xbf\x10\x11\xd5\
-\xbb\x44\xd4\x54\x1a\x43\xe7\x8c\xa4\x6f\x4e\x92\x9a\x45\x75\xc4\
-\x63\x12\x52\x0a\xfd\x39\x22\x22\xaa\x5b\xf1\xb8\x40\x34\xbc\x5c\
-\xae\x00\xa9\xcc\x84\x6e\x3f\x11\x91\x92\x1d\x75\x22\x22\x07\xc4\
-\x62\xb2\x7a\xf2\xdf\x9c\x1f\x95\xa6\xa0\xae\x3f\x29\x84\xb9\x9f\
-\x37\xfc\x6d\x44\x44\x54\x97\x82\xbc\xd6\x0f\xcc\x08\x3d\xa3\xb4\
-\x7a\xa2\xd4\x5c\x02\x43\x44\x44\xce\x50\xd5\x9e\xba\xfe\x84\x39\
-\x51\x4a\x44\x44\x6e\x51\x30\xa5\x74\x3d\x8f\x07\x93\xba\xee\xa9\
-\x13\x11\x91\x6b\xf4\x1d\x8d\x7a\x25\xc6\xac\xa9\xeb\x95\x17\x36\
-\x5e\x88\x88\x1c\xb2\x24\xbf\xf5\x9a\x7a\xf5\xd6\xc6\x6a\x0b\x86\
-\x88\x88\xea\x9f\x6d\xa3\xdb\xfc\xb6\xed\x97\x70\x4f\x9d\x88\x88\
-\x1c\xa1\x73\x1c\x50\xd5\x5a\xa3\x9e\xd4\x83\x19\x3e\xfc\xd5\x44\
-\x44\x54\xd7\x82\x79\xdc\x34\x17\xab\x3d\xf5\xea\x17\x10\x11\x91\
-\x23\x96\xe6\x77\xb5\xa7\x6e\x70\x52\x27\x22\x72\x93\xc9\x6f\xa9\
-\x5f\xd9\x53\x27\x22\x72\xd2\x7b\xf5\xd4\x19\xee\x44\x44\x6e\x79\
-\x97\x9e\x3a\x11\x11\xb9\xc6\xe6\x77\x4d\x4f\x5d\xb0\xd5\x48\x44\
-\xe4\x1c\x85\x6a\x0b\x46\x54\x7b\xea\x9c\xd4\x89\x88\x5c\xa4\x7b\
-\xea\x4b\x27\x75\xf3\xa6\xe2\xa8\x4e\x44\xe4\x94\x9a\xfc\x66\x4f\
-\x9d\x88\xe8\x03\x82\x3d\x75\x22\xa2\x0f\x10\x93\xdf\x41\xa8\xf3\
-\x32\x2f\x22\x22\x37\x85\xd3\x3b\x08\x75\x5e\xbb\x4b\x44\xe4\xa6\
-\x70\x7a\x4b\x65\x76\x47\xb9\x49\x4a\x44\xe4\x26\x9b\xdf\x4a\x01\
-\x52\x98\x87\x95\xda\x9e\x3a\xb3\x9d\x88\xc8\x1d\xd5\xe7\x61\x98\
-\x9e\x7a\xf5\x24\x92\xbd\x3d\x80\x88\x88\x5c\x21\x4c\xeb\x25\xe8\
-\xa9\x57\x4f\x92\xea\x89\x9d\x88\x88\xdc\x11\x5e\x7a\x81\x9e\xd4\
-\xab\xf7\x7b\xd9\xc4\x27\x22\x22\x37\x08\xb3\xc4\xa2\xf3\x5b\x41\
-\x22\xb8\x76\xd7\x4c\xea\x5c\x83\x21\x22\x72\x46\xcd\xa4\x0e\x71\
-\x81\x9e\x3a\x27\x75\x22\x22\xa7\x84\x63\x5b\x56\x57\xd4\xed\x0c\
-\x1f\x7a\x97\x88\x88\xea\xde\x92\x9e\xba\xfe\x8d\xed\xab\x73\x52\
-\x27\x22\x72\x44\xcd\xd2\x8b\xce\xf1\x50\x4f\x9d\x23\x3a\x11\x91\
-\x53\xc2\x9b\xa4\xd0\x39\x5e\xd3\x53\x27\x22\x22\x87\x5c\x78\x52\
-\xb7\x5b\xa4\x7a\x62\x67\xb4\x13\x11\x39\x22\xb4\xc0\x62\x57\x5c\
-\x82\x49\xdd\xf6\xd4\xb9\x08\x43\x44\xe4\x88\xd0\x14\x2e\x84\x99\
-\xd4\x97\xf6\xd4\x39\xa9\x13\x11\x39\xa4\x66\x09\x46\x54\x2b\x8d\
-\x8c\x73\x22\x22\xd7\xa9\xf0\x93\x8f\x78\x47\x00\x11\x91\xbb\x94\
-\x9e\xd4\x6b\x7b\xea\x5c\x51\x27\x22\x72\x8d\x5d\x7a\x31\xed\x17\
-\xfd\x19\xf6\xd4\x89\x88\x5c\x64\x2e\x63\x0c\xf7\xd4\x6d\xc2\x13\
-\x11\x91\x6b\xaa\xd7\xa6\x07\x93\x7a\xb5\xfd\xc2\x60\x27\x22\x72\
-\x49\x50\x75\x31\x2b\x2e\x4b\x7a\xea\x5c\x82\x21\x22\x72\x45\x78\
-\x0c\xd7\x57\xbe\x98\xf6\x8b\x3e\x53\xca\x49\x9d\x88\xc8\x25\x76\
-\x20\x47\xa8\xec\x22\xf5\x1b\xb6\xce\xc8\x49\x9d\x88\xc8\x15\x76\
-\xe9\x5c\xd3\x39\x6e\x26\xf5\xea\x27\x88\x88\xc8\x45\x66\x52\x0f\
-\x56\x5c\xd8\x53\x27\x22\x72\x93\x82\xce\xef\x70\x4f\x9d\x4f\x9d\
-\x26\x22\x72\x50\xd0\x76\xd1\x39\xbe\xa4\xa7\xce\x49\x9d\x88\xc8\
-\x29\xe6\x41\x47\x36\xc7\xf5\xa4\x6e\x36\x4b\x95\xe2\x35\x8d\x44\
-\x44\x4e\x09\x3d\xe8\x28\x74\xa2\x54\xd7\x1a\x05\x2f\x54\x27\x22\
-\x72\x8b\x39\x40\xfa\xce\x3d\x75\x4e\xea\x44\x44\xce\xb0\xe7\x8b\
-\x2e\xd8\x53\xd7\xaf\x44\x44\xe4\x0a\x9b\xdb\x36\xc7\x43\x93\x7a\
-\xf5\x95\x88\x88\xdc\xa0\x73\x5b\x05\x2b\x2e\xe6\x21\x19\xf6\x56\
-\x2f\xfd\x68\x3b\x46\x3b\x11\x91\x03\x4c\x6e\x43\x09\xf3\x6a\x9f\
-\x7c\x14\xea\xa9\x9b\xb7\x88\x88\xa8\xde\x05\xe7\x8c\xa0\x13\x5e\
-\xd8\x49\xdd\xec\x9a\x72\x52\x27\x22\x72\x88\xae\xbd\xd4\xf6\xd4\
-\xf5\x1b\x7a\x42\x57\xe6\x95\x93\x3a\x11\x91\x03\xcc\xa4\x2e\xa0\
-\xaa\x3d\x75\xfd\x86\x9e\xd0\x85\x79\xe5\xa4\x4e\x44\xe4\x00\x3b\
-\xa9\x43\x84\x7a\xea\xca\x4e\xe8\xbc\x4f\x9d\x88\xc8\x39\x4b\x56\
-\x5a\x24\x84\x9d\xd0\xd9\x53\x27\x22\x72\x8e\x5d\x69\x31\x7b\xa2\
-\xc1\xa4\x0e\xd3\x74\x24\x22\x22\x87\x28\xbd\x68\x7e\xc1\x9e\xba\
-\xb0\x7d\x75\x66\x3b\x11\x91\x23\x74\x4f\x5d\xe7\xb7\x6d\xbf\xe8\
-\x44\xd7\x49\xcf\xfa\x0b\x11\x91\x43\x14\x20\xcc\xa4\x2e\x50\x9d\
-\xd4\x6d\xcf\x91\x93\x3a\x11\x91\x4b\x04\x54\x70\xa2\xd4\x86\xba\
-\xd9\x35\x35\xc9\x4e\x44\x44\xae\x30\x3d\x75\x7b\xb2\x54\xea\x01\
-\x5d\xef\x9a\xf2\x91\x76\x44\x44\x8e\x31\x3d\x75\x7b\xb2\x54\x86\
-\xfb\x8d\xf6\xaa\x00\x22\x22\x72\x83\xce\x6f\x73\xa2\x14\x66\x52\
-\xb7\x27\x49\xd9\x53\x27\x22\x72\x47\x75\xa5\x45\xb7\x5f\x14\x42\
-\x93\xba\xfe\x02\x2e\xbd\x10\x11\xb9\xa2\xba\x17\xaa\xdb\x2f\xd5\
-\x49\xdd\xec\x9a\xda\x27\x67\x10\x11\x51\xfd\xd3\x69\x5d\xed\xa9\
-\x2b\xdb\x7e\xb1\xfd\x46\x7b\x22\x89\x88\x88\xea\x9f\x4e\xeb\x77\
-\xe8\xa9\x73\x40\x27\x22\x72\x4b\x78\x52\xb7\x9f\xa8\x3e\xf9\xc8\
-\x7e\x05\xc3\x9d\x88\xc8\x1d\x66\x4d\xdd\x2e\xb4\xd4\xdc\xa7\x0e\
-\x21\x00\xc1\x54\x27\x22\x72\xc6\xd2\x9e\x3a\xa0\x93\x3e\xd8\x45\
-\xb5\x63\x3c\x11\x11\xd5\xbf\xd0\x89\x52\x81\xa5\x93\x3a\x11\x11\
-\xb9\xc5\x4e\xea\x66\xf5\x7c\xc9\x7d\xea\x5c\x52\x27\x22\x72\x89\
-\xce\xef\x6a\x77\x51\x22\x54\x62\xac\x9e\x49\x22\x22\xa2\xba\x67\
-\x6e\x4b\x87\xc9\x6f\xa5\xcc\xe1\x23\x1b\xe3\xd5\x33\x49\x44\x44\
-\x54\xf7\x42\x6d\xf4\x9a\x9e\x7a\xf0\xc4\x23\xf3\x16\x11\x11\x39\
-\x20\x78\x62\xdd\x92\x9e\xba\x5d\x53\xd7\x79\xce\x49\x9d\x88\xc8\
-\x09\xa2\xba\xa6\x6e\x17\xd5\x4d\xfb\xa5\xfa\x05\x9c\xd4\x89\x88\
-\x1c\x61\x77\x47\x61\x03\x3e\xe8\xa9\x87\xbe\x80\x93\x3a\x11\x91\
-\x3b\x42\xf9\x1d\xea\xa9\x87\xe7\x73\x4e\xea\x44\x44\xce\xa8\xd9\
-\x2c\x0d\x4d\xea\x22\x88\x73\x4e\xea\x44\x44\xce\x08\xe5\xb7\x9e\
-\xd4\x43\x7b\xa4\xd5\x33\x49\x44\x44\xe4\x0a\x9b\xdf\xa1\xfb\xd4\
-\x39\xa9\x13\x11\xb9\xa8\x26\xbf\xab\x3d\x75\xfb\xf0\x52\xfb\x25\
-\x44\x44\xe4\x02\x3b\xa1\xdb\xf2\x62\x30\xa9\xdb\x6b\x1b\x39\xa9\
-\x13\x11\xb9\xc3\xc6\xb6\x32\x23\xbb\x79\xf2\x51\x78\x51\x9d\x93\
-\x3a\x11\x91\x53\x42\x6b\x30\xec\xa9\x13\x11\xb9\xac\x26\xbf\x6b\
-\x7a\xea\x4b\xde\x21\x22\xa2\xfa\xb7\xe4\x11\xd3\xa1\x9e\xba\xbd\
-\x74\x97\x93\x3a\x11\x91\x33\x6a\xce\x19\x01\x32\xfc\x80\x0c\xdb\
-\x82\x21\x22\x22\x77\x54\x97\xd4\x15\xa4\x30\x8f\xb2\xb3\x49\x2f\
-\x04\x27\x75\x22\x22\x97\x04\xf9\x0d\x01\x69\xfb\x8d\xb6\xa7\xce\
-\x49\x9d\x88\xc8\x0d\xc1\x4e\x68\x90\xe3\x17\xe8\xa9\x73\x52\x27\
-\x22\x72\x43\x90\xd6\xb5\x3d\x75\x73\x92\x54\x29\x88\xe0\xc2\x75\
-\x22\x22\xaa\x77\x41\x5a\x2b\x40\x98\x51\x5d\xc2\x3c\xac\x34\xfc\
-\x4a\x44\x44\xf5\x2f\x9c\xd6\x36\xbf\xd9\x53\x27\x22\x72\x94\x0a\
-\xfd\xcf\xaa\xe9\xa9\x6b\x9c\xd4\x89\x88\x5c\x12\x4e\x6d\x69\x27\
-\x74\x4e\xea\x44\x44\x6e\xaa\xa6\xb7\x82\xb4\x27\x49\x39\xa9\x13\
-\x11\xb9\xa9\x9a\xde\x42\x9f\x28\xad\xed\xa7\x73\x52\x27\x22\x72\
-\x89\x8d\x6f\xa5\x42\x27\x4a\x75\x4f\x5d\xcf\xec\x44\x44\xe4\x10\
-\x53\x47\x17\x22\x34\xa9\xeb\x9e\xba\xe0\xa4\x4e\x44\xe4\x1a\x73\
-\x70\x54\x5d\xb8\xa7\x4e\x44\x44\xae\x09\xf5\xd4\xf5\x49\x52\xd3\
-\x6b\x24\x22\x22\x17\x99\x1c\xaf\x99\xd4\x83\xcb\x03\x88\x88\xc8\
-\x0d\x41\xc7\x45\xe7\x77\xd0\x53\xd7\xef\x70\x4d\x9d\x88\xc8\x4d\
-\xa2\xda\x53\xaf\x06\x3a\x11\x11\xb9\xa5\x3a\x88\x07\x3d\x75\xbd\
-\x04\xc3\x09\x9d\x88\xc8\x3d\xd5\x92\x4b\xd0\x53\x07\xaa\x75\x18\
-\x66\x3b\x11\x91\x5b\xec\xb5\xe9\x41\x4f\x1d\x26\xe1\x85\x10\xa6\
-\x09\x43\x44\x44\xae\x50\x35\x3d\x75\x7b\x92\x94\x93\x3a\x11\x91\
-\x73\x94\xa9\xa3\xdb\xa5\x74\x19\x9c\x24\x35\xc1\xce\xfd\x52\x22\
-\x22\x77\x08\x08\xd3\x75\xd1\xa5\x97\xf3\x7b\xea\x9c\xd4\x89\x88\
-\x9c\x11\x44\x76\x30\xa9\x9f\xd7\x53\x27\x22\x22\xf7\x84\x26\x75\
-\x1e\x3c\x22\x22\x72\x55\xed\x60\x6e\x26\x75\x5e\xbb\x4b\x44\xe4\
-\x26\x73\x7d\xba\xc9\x71\x33\xa9\x57\xeb\x30\x44\x44\xe4\x16\x11\
-\xaa\xa5\x9f\xd7\x53\x27\x22\x22\xb7\xe8\xf2\x8b\x99\xd4\xed\x6f\
-\x38\xa9\x13\x11\xb9\x47\x85\x1e\x49\x5a\x7d\xf2\x51\x28\xd8\x89\
-\x88\xc8\x1d\xc2\x3c\x92\xb4\x7a\xa2\x34\x74\x99\x17\x27\x75\x22\
-\x22\xb7\x28\xa5\x00\xa5\x42\x27\x4a\x43\xfd\x74\x7d\x0d\x2f\x11\
-\x11\xb9\x43\x98\xf4\xbe\x40\x4f\xbd\xfa\xc0\x0c\x22\x22\x72\x83\
-\x59\x69\x61\x4f\x9d\x88\xe8\x83\xa0\xda\x53\xaf\x99\xd4\xf5\x5d\
-\x30\x9c\xd4\x89\x88\xdc\xa2\x74\xac\xdb\x35\x75\x3b\xb2\xeb\x8f\
-\xcd\x6d\x5f\x44\x44\xe4\x08\x01\x05\x11\x5c\x9f\x2e\xc3\xfd\x46\
-\xa5\xf4\xbd\xbc\x44\x44\xe4\x86\xda\x9e\x3a\x20\xf5\x80\x1e\xea\
-\xa9\xf3\xf6\x5d\x22\x22\x67\xd4\xf6\xd4\x01\x29\x96\xf6\xd4\xf9\
-\x9c\x0c\x22\x22\x67\x84\x7b\xea\xc2\xae\xa9\xdb\x7e\x3a\x27\x75\
-\x22\x22\xb7\xe8\xfc\x16\x66\x62\x57\x90\x3a\xc4\x43\x93\x3a\x8b\
-\x8d\x44\x44\x6e\x08\xf2\xdb\x9e\x28\x05\xa4\x5e\x6e\xb1\xad\x17\
-\xbd\x36\xc3\x49\x9d\x88\xc8\x0d\x76\x52\xb7\xe3\xb8\x84\x32\x27\
-\x49\x05\x18\xe7\x44\x44\x8e\xb1\x93\xba\xcd\xef\xda\x9e\x3a\x17\
-\x5e\x88\x88\x1c\x63\x7a\xea\x26\xc7\xa5\x1e\xd0\x79\xa2\x94\x88\
-\xc8\x49\xaa\x7a\xa2\x34\xe8\xa9\xeb\x93\x48\xfa\x95\x88\x88\x1c\
-\x22\xc2\x27\x4a\xcd\xa4\x1e\x3e\x91\x44\x44\x44\xee\x50\x4a\x41\
-\xd8\x9e\x7a\xcd\x89\x52\xdb\x53\x27\x22\x22\x67\x08\x21\xa0\x84\
-\xe9\xa9\x2b\x40\x22\x34\xa1\x73\x52\x27\x22\x72\x4b\xf8\x44\x29\
-\x60\x42\xbd\xda\x53\x27\x22\x22\x97\x54\x7b\xea\x9a\x9e\xd4\x83\
-\x9e\x3a\x11\x11\xb9\xa4\xda\x53\xd7\xa4\x3d\x49\x1a\xbc\x12\x11\
-\x91\x43\x42\x27\x4a\x95\xb9\x26\x00\xe6\x76\x46\xf6\xd4\x89\x88\
-\x1c\xa3\xcc\xa4\x6e\x72\x5c\xda\x7e\xba\x7e\x5d\xfa\xd5\x44\x44\
-\x54\xd7\x82\x9e\xba\xce\x76\x69\x4f\x92\xda\x41\x9d\xb3\x3a\x11\
-\x91\x43\x82\x9e\xba\x1e\xcc\xcd\xa4\xae\xc3\x5c\x08\x7b\xb3\x3a\
-\x11\x11\x39\x41\x00\x4a\xd4\x3c\xf9\x28\xbc\xa4\x6e\x6f\x56\x27\
-\x22\x22\x27\x28\x40\xa8\xea\xcd\x00\xb5\x27\x4a\xa1\xdf\x24\x22\
-\x22\x47\xd8\x13\xa5\xa6\xd8\x58\x7b\xa2\xb4\xa6\xed\x48\x44\x44\
-\x75\xcf\x9e\x28\x35\x1f\x4a\x84\x9e\x8f\x61\xdb\x8e\x44\x44\x54\
-\xff\xc2\x43\xb8\xcd\x71\x69\x37\x49\xed\x2b\x27\x75\x22\x22\x37\
-\x84\x87\x70\x9b\xe3\xc1\x89\x52\x9e\x3b\x22\x22\x72\x8b\x1e\xc4\
-\xed\x93\x8f\x42\x93\xba\xed\xa9\x73\x4c\x27\x22\x72\x8c\xe9\xa9\
-\xc3\xb4\x5d\xf4\xa4\xce\xab\x5f\x88\x88\xdc\x64\x7a\xea\x10\x7a\
-\xcf\xd4\xb4\x5f\xaa\x8b\xec\x44\x44\xe4\x10\xd3\x53\xb7\x65\x17\
-\x7d\x9f\x3a\xaf\x53\x27\x22\x72\x93\x9d\xd4\xcd\x5c\x1e\x4c\xea\
-\xf6\x13\x44\x44\xe4\x10\x33\xa5\x9b\x95\x74\xfb\xe4\xa3\xea\xe8\
-\x4e\x44\x44\xee\x31\x9d\x17\x7d\x4d\x80\xdd\x24\xe5\xa4\x4e\x44\
-\xe4\x26\x9b\xe3\xa1\x49\x9d\x91\x4e\x44\xe4\xb4\x70\xfb\x25\xd8\
-\x2d\x0d\x46\x77\x22\x22\xaa\x7b\x36\xaf\xcd\xa2\xba\x04\xec\x62\
-\x0c\x7b\xea\x44\x44\xce\xb1\xb9\x1d\xf4\xd4\xc3\x93\x39\x27\x74\
-\x22\x22\xb7\x84\x56\x58\x82\xf6\x8b\xde\x24\x65\xa2\x13\x11\x39\
-\xe7\x42\x3d\x75\x9d\xf0\xfa\x41\x19\x44\x44\xe4\x10\xfb\xe4\xa3\
-\x6a\x4f\x5d\x47\xb9\x32\xf7\x7c\x31\xd8\x89\x88\xdc\x62\x03\x5d\
-\x29\x05\x89\x60\x42\xaf\x3e\xd2\x8e\x88\x88\xdc\xa2\xa0\x5b\x8c\
-\x35\x3d\x75\x4e\xea\x44\x44\x6e\xb2\x37\x03\xe8\x9e\x3a\x74\xc2\
-\x2b\x7b\xdb\x17\x11\x11\x39\x45\x9f\x37\x0a\xad\xa9\xdb\xfb\x77\
-\xed\x2e\x2a\x11\x11\x39\xc4\x5c\xfe\x22\xa1\xcc\x49\xd2\xf0\x89\
-\x52\x22\x22\x72\x8b\x5e\x72\x31\x8f\xb3\x13\x7a\xd7\x94\x88\x88\
-\xdc\x53\x4d\x6f\x55\x3d\x51\xca\x9e\x3a\x11\x91\x9b\xaa\x25\x17\
-\x01\x69\x77\x46\x6d\x4f\x9d\x88\x88\xdc\x62\xf6\x48\xa1\xf4\xa4\
-\x6e\xfb\xe9\x9c\xd4\x89\x88\x5c\x53\x0d\x74\x9d\xe3\x12\xf6\x24\
-\xa9\xe9\xa9\x13\x11\x91\x5b\x4c\x79\x71\xc9\x89\x52\xd3\x53\x27\
-\x22\x22\xc7\x98\x6b\x77\x85\x3e\x51\x6a\x26\x74\xa5\x20\x38\xaa\
-\x13\x11\xb9\xc3\xd6\xd0\x95\x69\xa5\x2b\x05\xa9\x60\x26\x74\x4e\
-\xea\x44\x44\x6e\x09\x0d\xe2\x36\xc7\xa5\xd0\x7d\xc6\xea\xa2\x0c\
-\x11\x11\xb9\x21\x3c\x88\xdb\x13\xa5\x0a\xe6\x24\xa9\x5d\x94\x21\
-\x22\x22\x37\x84\x07\x71\x73\xf9\x4b\xcd\x7d\xea\x1c\xd5\x89\x88\
-\x1c\x62\xe6\x70\xfd\x22\x4c\x4f\xdd\x04\xb9\x60\xa0\x13\x11\x39\
-\xc9\xa6\x77\xd0\x53\x87\xe9\x37\x12\x11\x91\x7b\x6c\x7c\x07\x93\
-\xba\xde\x34\xd5\xa3\x3b\x11\x11\xb9\xc3\x94\x5e\xcc\x55\x2f\x02\
-\x12\xf6\x89\x47\x4a\x7f\x82\x88\x88\xdc\x51\x2d\x2f\x0a\x73\xa2\
-\x54\xe8\xdf\xb0\xa7\x4e\x44\xe4\x1e\xbb\xc2\x12\xf4\xd4\xf5\x49\
-\x52\x7b\xc6\x74\xe9\x97\x13\x11\x51\x3d\x0b\x56\x58\x6c\x4f\xbd\
-\x3a\xa1\xb3\xa7\x4e\x44\xe4\x9a\x20\xb5\x83\x9e\x7a\x30\xa1\x9b\
-\xcb\x03\x88\x88\xc8\x3d\x42\x00\x41\x4f\xdd\x24\x3c\x27\x75\x22\
-\x22\xd7\xd8\x3e\xa3\x99\xd4\xed\x49\x52\xdd\x53\xe7\xa4\x4e\x44\
-\xe4\x14\x55\x5d\x42\x57\x50\x90\x7a\x91\x5d\x6f\x96\xb2\xa7\x4e\
-\x44\xe4\x1a\x7d\x6d\x7a\xd0\x53\xb7\x13\x3a\x7b\xea\x44\x44\x2e\
-\xd2\x93\x7a\xd0\x53\xb7\x75\x46\x61\xfb\xea\x44\x44\xe4\x0c\x3d\
-\xa1\x9b\x03\xa4\xc2\x4e\xea\x26\xd0\x05\xdb\x2f\x44\x44\x4e\x11\
-\xe1\xab\x5e\x6a\x4e\x94\x9a\xa4\x27\x22\x22\x77\xe8\xbd\x50\x15\
-\xdc\x0c\x50\x3d\x51\x6a\x92\x9e\x7b\xa5\x44\x44\xee\xd0\x7b\xa1\
-\x22\xb8\x19\x40\xdf\xd2\x18\xda\x2c\xe5\x5e\x29\x11\x91\x3b\xaa\
-\x77\xbf\x98\x9e\xba\xb9\xb8\xb1\xfa\xe4\x23\x4e\xea\x44\x44\x0e\
-\xd1\x6b\xea\x7a\x22\x37\xed\x17\x61\x76\x4f\x01\x85\x8a\xaf\xa0\
-\x14\xb3\x9d\x88\xa8\xde\x79\x9e\x82\xf2\x15\x84\xd2\xeb\xea\x7a\
-\x52\x17\x80\x32\x3d\x47\x40\xa0\x54\xf6\xe1\xf9\x8a\x57\x06\x10\
-\x11\xd5\xb9\x62\xd9\x87\x17\x0c\xe1\xa6\xfd\x22\xcd\x25\x30\x7a\
-\xb3\x54\xa1\x54\xf6\xe0\xfb\xfe\xd2\xef\x25\x22\xa2\x3a\x53\x2c\
-\x7a\xf0\x3c\x3f\x58\x7a\x11\x02\x90\x42\x54\x4f\x22\x01\x02\xc5\
-\xa2\x0f\xcf\x5b\xfa\xad\x44\x44\x54\x6f\x4a\x25\x1f\xbe\x57\xdd\
-\x24\x55\x0a\x90\x91\x88\x5d\x64\xd7\x6f\x14\xcd\xf2\x0b\x17\x5f\
-\x88\x88\xea\x5b\xb1\xe4\xa1\xe2\xe9\x95\x95\xe0\x44\xa9\x94\x22\
-\xb8\x46\x5d\x08\x81\x85\x6c\x19\xa5\xb2\xcf\x9d\x52\x22\xa2\x3a\
-\x37\x9f\x2d\xa3\x5c\xd6\xe5\x96\xe0\x44\x69\x2c\x52\xad\x31\x2a\
-\xa5\x30\x39\x5d\x40\xa1\xe8\x71\x9f\x94\x88\xa8\xce\x4d\x4c\x97\
-\xb0\x58\xac\x40\x29\x73\xa2\x14\x80\x8c\xc5\x24\x84\xb4\x27\x8e\
-\x04\xc6\x27\x8b\xc8\x17\x3c\x5e\xc3\x4b\x44\x54\xe7\x46\xc7\xf3\
-\xc8\xe7\xed\xca\x8a\xce\x71\x99\x88\xcb\xa0\xba\x0e\x28\x8c\x8e\
-\xe7\xb1\x98\xaf\x70\x52\x27\x22\xaa\x63\xf9\xbc\x87\x6c\xae\x82\
-\x4a\xc5\xb3\x67\x4a\xd1\xd8\x10\x83\x6c\x6f\x4d\x22\x99\x88\x9a\
-\x75\x75\x01\xdf\x53\x18\x9f\x2c\xe8\x69\x9d\xc1\x4e\x44\x54\x97\
-\x86\xc7\x16\x91\xcd\x95\xe1\x07\x39\x2d\xd0\xd9\x91\x80\xec\xed\
-\x4a\x22\x95\x92\x41\x4f\x1d\x02\x38\x31\x94\xc5\xfc\x42\x89\xb7\
-\x36\x12\x11\xd5\xa9\x93\x43\x59\xcc\x67\xcb\xa1\x9c\x56\x58\xde\
-\x93\x86\x5c\x35\x90\x41\x73\x26\x61\x56\x63\x74\xcf\x51\x7f\x71\
-\x25\xf4\x13\x80\x88\x88\xea\xc9\x89\x33\x59\xcc\x2f\x94\xa1\x7c\
-\x7b\x01\x80\xc0\x9a\x15\x8d\x90\xeb\x56\x36\xa1\xa9\x31\x0a\x29\
-\xed\x83\x32\x80\xa3\x83\x0b\x98\x9d\x2f\x43\x31\xd5\x89\x88\xea\
-\xd2\xa9\xa1\x05\x2c\xe4\x2a\xf0\x4d\x6e\x03\x0a\xeb\x56\x66\x20\
-\xfb\x7a\x52\xe8\x6c\x4f\x20\x1a\xd5\x4b\x30\x4a\x01\xb3\x73\x25\
-\x8c\x4f\xe6\x51\x28\x71\x5d\x9d\x88\xa8\xde\x9c\x1e\xc9\x61\x7a\
-\xae\x84\x72\x45\x5f\x11\xa0\x14\xd0\xdb\x95\x42\x67\x7b\x12\x32\
-\x1a\x11\x58\xdd\xdf\x88\xa6\x8c\xdd\x2c\x05\x7c\x5f\xe1\xe0\xd1\
-\x39\x4c\xcf\x96\xe0\x33\xd5\x89\x88\xea\xca\x81\x23\x73\x98\x9c\
-\x2e\x41\xf9\xba\x9f\x2e\x00\xac\x59\xd1\x88\xe6\xa6\x18\x24\x00\
-\xdc\xbc\xb1\x05\xed\xad\x09\x44\x42\x4f\x40\x7a\x7d\xdf\x14\x26\
-\x26\x0b\xf0\xb9\x04\x43\x44\x54\x57\x76\xed\x9d\xc4\xf8\x64\x01\
-\x9e\xaf\xaf\x06\x50\x00\x6e\xba\xa1\x19\x6d\x2d\x09\x13\xea\x37\
-\xb6\xa2\xb7\x2b\x85\x48\xd4\xdc\xaa\xae\x14\x06\x87\x73\x38\x3e\
-\x94\xc5\xe2\x22\x97\x60\x88\x88\xea\xc5\xb1\x53\x0b\x18\x1a\xc9\
-\x05\x27\xff\x95\x52\x68\x69\x8e\xe1\x23\x1b\x5a\xd0\xd2\x14\xd7\
-\xa1\x9e\x4a\x45\xb0\x75\x53\x1b\xda\x5b\x13\x90\x52\xe8\xbe\xba\
-\xaf\xb0\xfb\xcd\x69\x8c\x4f\x71\x5a\x27\x22\xaa\x17\xaf\xbf\x39\
-\x85\xf1\x89\x02\xaa\x37\xa4\x0b\xdc\xbe\xb9\x1d\xbd\x5d\x29\x44\
-\x23\x42\x87\x3a\x00\xdc\xb1\xa5\x0d\x5d\x1d\x36\xd4\x75\x88\xbf\
-\xba\x67\x02\xc3\xa3\x8b\xa8\x54\x78\xbf\x3a\x11\xd1\xf5\xb6\x90\
-\x2d\xe3\x4f\x7b\x26\x30\x3e\x55\x80\x67\x52\x5d\x40\xe1\x8e\xad\
-\x1d\xe8\x36\xf9\x1d\x84\xfa\xba\xd5\x4d\x58\xbf\xaa\x09\x0d\xa9\
-\x48\xd0\x82\xc9\x66\xcb\x78\x71\xd7\x39\x8c\x4e\xe8\xb5\x1b\x22\
-\x22\xba\x7e\x76\xfe\x69\x1c\xa7\x47\xf2\x28\x57\x4c\x1e\x2b\x60\
-\xc5\xf2\x0c\x56\x0f\x64\x90\x4e\xea\xb2\x4b\x10\xea\x11\x29\x70\
-\xef\x9d\xdd\xe8\xeb\x4e\x23\x22\x01\x21\x74\xa1\xfd\x85\x97\xcf\
-\x61\xf0\x4c\x96\xd3\x3a\x11\xd1\x75\x94\xcb\x57\xb0\x73\xd7\x39\
-\x8c\x8e\xe7\xf5\x92\xb8\xd2\x77\x78\xdd\xbd\xad\x0b\xcb\x7a\xd2\
-\x88\x44\xcc\x85\x5e\xe1\x6f\xba\x63\x4b\x3b\xd6\xae\xcc\x20\x99\
-\x88\xe8\x4f\x08\x81\x99\xf9\x12\x5e\xde\x3d\x81\x73\x13\x5c\x5b\
-\x27\x22\xba\x5e\x5e\xdc\x35\x8e\xe3\x83\x0b\x28\x95\x4d\x79\x45\
-\x08\xf4\x75\xa7\x71\xe7\xad\x1d\xe8\x6c\xb3\x4b\xe7\x4b\x42\x3d\
-\x16\x93\xb8\xef\xce\x6e\xf4\x76\x99\xd4\x37\xb5\x97\x67\x77\x8e\
-\xe2\xe8\xc9\x05\x14\x4b\x9c\xd6\x89\x88\xae\xb5\x99\xd9\x12\x9e\
-\xdf\x39\x8a\xb3\x63\x79\x78\x15\x73\x82\x54\x29\xdc\xbb\xbd\x0b\
-\x2b\x96\x35\x20\x6a\x9a\x8b\x58\x1a\xea\x00\x70\xd7\xed\x5d\x58\
-\xbd\x22\x83\x78\x54\x02\x26\xd7\xe7\x16\xca\x78\xfa\xb9\x33\x18\
-\x1a\xce\xa1\xe2\x71\x5a\x27\x22\xba\x96\xfe\xf9\x37\x43\x38\x70\
-\x74\x16\x85\x92\x0f\x98\x3d\xcf\xf6\xb6\x04\xb6\xdf\xda\x81\x8e\
-\xf6\xea\x94\x8e\x0b\x85\x7a\x3a\x15\xc1\x83\x3b\x7a\xb0\xac\x37\
-\x0d\x29\x05\x84\x39\x61\xfa\xf2\xee\x09\xbc\xb6\x77\x12\x73\xf3\
-\x25\xf6\xd6\x89\x88\xae\x91\xfd\x87\x66\xf1\xca\xee\x49\x4c\xce\
-\x54\x4f\x90\x02\xc0\x83\x3b\x7a\xf5\x00\x1e\xab\x8d\xf1\xf3\x42\
-\x1d\x00\xee\xdd\xde\x8d\x2d\x1b\x5b\x91\x49\xc7\x00\xa1\x9f\xa7\
-\x51\xa9\x28\xfc\xe4\xe9\x41\x1c\x38\x32\x87\x62\xc9\x5b\xfa\x2d\
-\x44\x44\x74\x85\x2d\xe4\xca\xf8\xe9\xbf\x0c\xe2\xd8\xa9\x79\x78\
-\x15\xfd\x3c\x3a\x7b\x25\xc0\xfd\x77\xf5\xa0\xa7\x33\x55\x33\xa5\
-\xe3\x9d\x42\x3d\x1e\x97\xf8\xe2\xa7\xfa\xb1\x6a\xa0\x01\x91\x48\
-\xf5\xb9\x48\x63\xe3\x79\xfc\xf0\xe7\x27\x71\xec\x54\x16\x15\x5b\
-\xa9\x21\x22\xa2\xab\xe2\x27\x4f\x0d\xe2\xb5\x7d\x53\xc8\xe5\xbd\
-\xe0\x1e\x2e\x21\x05\xbe\xf8\xa9\x7e\xac\x5f\xdd\x88\x58\xf4\xfc\
-\x08\x3f\xff\x33\xc6\xc6\xf5\xcd\xb8\x67\x7b\x37\x3a\xdb\x92\x88\
-\x48\x09\x28\xbd\xbe\xbe\xe7\xad\x69\x3c\xbb\xf3\x2c\xce\xf1\x5e\
-\x18\x22\xa2\xab\xe6\x85\x97\xc7\xf0\xfb\x57\xce\x61\x6a\xa6\x04\
-\x3f\xb4\x97\x79\xe7\xad\x1d\xb8\xed\x23\x6d\x35\x97\x30\x86\xbd\
-\x63\xa8\x47\xa4\xc0\xe7\x1f\x5c\x86\x1b\xd7\x35\x21\x1e\x37\x6b\
-\x30\x0a\xf0\x3c\x85\x9f\xff\xf6\x34\x5e\xdb\x37\x89\xec\x22\x9f\
-\x65\x4a\x44\x74\xa5\x0d\x0d\xe7\xf0\xcf\xbf\x3e\x8d\x93\x43\x59\
-\x7d\xbd\xae\xc9\xdf\x96\xe6\x18\x1e\xf9\x64\x3f\x56\xf6\x37\x20\
-\x12\xb9\x70\x7c\x5f\xf8\xb3\x46\x67\x5b\x12\x5f\x7d\x64\x15\xd6\
-\xac\xc8\x20\x1a\xd1\xc1\xae\x14\x90\x5b\xac\xe0\x7b\x3f\x39\x86\
-\xdd\xfb\xa6\x90\x2f\x70\x7d\x9d\x88\xe8\x4a\x99\x9e\x2d\xe1\x6f\
-\x7f\x72\x0c\xfb\x0f\xcd\xa0\x64\xf7\x2f\x15\x20\xa5\xc0\xd7\x1e\
-\x5d\x85\x5b\x36\xb7\x22\x95\x8c\x5c\x70\x4a\xc7\x7b\x85\xba\x10\
-\xc0\xad\x9b\xdb\xf0\x99\xfb\x97\xa1\xb7\x2b\x05\x29\x84\xe9\x47\
-\x02\x23\xe7\xf2\xf8\x9b\x27\x8f\x60\xef\x81\x69\x14\x8a\x0c\x76\
-\x22\xa2\xcb\x95\x5d\xac\xe0\x7f\xfe\x9f\x23\x78\x79\xf7\x38\xb2\
-\xb9\x8a\xde\xcf\x34\xbb\xa3\xf7\xdd\xd5\x8d\x1d\xdb\xba\xd1\xd6\
-\x5c\x5b\x61\x5c\xea\x5d\x43\x1d\x00\x22\x11\x81\x47\x1e\xea\xc7\
-\xb6\x5b\x3a\xd0\x98\x89\xea\x4f\x0a\x01\xdf\x07\x06\x87\x73\xf8\
-\xee\x0f\x8e\xe0\xd0\xb1\x39\x5e\x23\x40\x44\x74\x19\xf2\x05\x0f\
-\xff\xeb\x47\x47\xf1\xfb\x57\xc7\x31\x37\xaf\x03\x5d\x9f\x1c\xd5\
-\x6d\x97\xc7\x3e\x3b\x80\xd5\x03\xb5\x07\x8d\x2e\xe4\x3d\x43\x1d\
-\x00\x32\x0d\x51\x7c\xe3\xdf\xad\xc6\xcd\x1b\x5b\x91\x4a\x44\x00\
-\xf3\xa4\x0d\xcf\x57\x38\x74\x7c\x1e\xdf\xf9\xfe\x11\xbc\x7d\x7c\
-\x9e\x07\x93\x88\x88\x2e\x41\xb1\xe4\xe3\xef\xff\xe9\x38\x9e\x7b\
-\x71\x14\xd3\x33\x45\xd3\x47\xd7\xab\x25\x4d\x8d\x31\x7c\xe3\xb1\
-\xd5\xf8\xc8\x86\x16\xc4\x63\xe6\x0a\x97\x77\x71\x51\xa1\x0e\x00\
-\xfd\x7d\x69\xfc\xe7\xbf\xdc\x80\x2d\x37\xb5\x22\x61\xee\x86\x11\
-\x42\x6f\x9c\xee\x3b\x38\x83\xff\xf6\xdd\x03\x78\xe3\xcd\x29\x14\
-\xb9\x14\x43\x44\x74\xd1\xb2\x8b\x15\x7c\xe7\xc9\xc3\x78\xea\xd9\
-\x33\x18\x9f\x2c\xc2\x57\xa6\x8f\x2e\x80\x54\x32\x82\x6f\x7f\x75\
-\x1d\x76\x7c\xb4\x13\x99\xf4\x85\xdb\x2e\x4b\x09\x65\x8f\x27\x5d\
-\x04\xfb\xec\xd2\xff\xf1\xbd\x43\xd8\xff\xf6\x2c\x8a\xe5\xea\x92\
-\x4b\x44\x0a\xac\x1c\x68\xc0\x7f\xfd\xab\x1b\x71\xc7\xd6\x76\xa4\
-\x92\xef\xfd\x13\x85\x88\xe8\xc3\x6c\x76\xae\x8c\xbf\xf9\xfe\x61\
-\xbc\xf0\xf2\x18\x66\xe6\xcb\x41\x4d\x5c\x00\x88\xc5\x25\xbe\xfd\
-\xf5\xf5\xf8\xfc\x27\x96\xd5\x5c\xd8\xf5\x5e\xde\x57\xa8\xc3\x2c\
-\xb9\xec\x7d\x6b\x06\x7f\xfd\xf7\x87\x71\xf0\xd8\x1c\xca\x65\x5f\
-\xb7\x6d\x94\x42\x24\x22\xd1\xdb\x9d\xc4\x7f\xf9\xcb\x1b\xf1\xf1\
-\x3b\x3a\xd1\x90\xba\xb8\x9f\x2c\x44\x44\x1f\x36\xe7\x26\xf3\xf8\
-\xce\xdf\x1d\xc1\x8b\xaf\x8d\x63\x61\xa1\xac\xd7\xd0\x4d\xa0\x47\
-\x23\x12\x7f\xf5\x95\x35\x78\xf4\xe1\x7e\x74\x77\x26\x11\xb9\xc8\
-\x40\xc7\xa5\x84\x3a\x60\x96\x5c\xde\x9e\xc5\x77\xbf\x7f\x18\xfb\
-\x0f\xcd\xa1\x54\xae\x2e\xb9\x08\x01\xb4\x36\x27\xf0\xad\xc7\x57\
-\xe3\x33\xf7\xf7\xa1\xbd\x2d\x01\xc9\x64\x27\x22\x0a\xbc\xb1\x7f\
-\x0a\x7f\xf7\x8f\x27\xb0\xf7\xc0\x0c\x16\x0b\xb5\xe7\x7d\x52\x09\
-\x89\x6f\x3e\xbe\x06\x8f\x7c\xd2\x04\xba\xb9\x27\xfd\x62\x5d\x52\
-\xa8\xc3\x04\xfb\xf1\xc1\x2c\xfe\xfb\xf7\xde\xc6\x9f\xdf\x9a\xa9\
-\xd6\x1a\xcd\xe2\x7e\x22\x1e\xc1\x7d\x77\x75\xe3\x3f\xfe\xc5\x5a\
-\xac\x1e\xc8\xbc\xef\x3f\x18\x11\xd1\x07\x4d\xb9\xec\xe3\xa7\xbf\
-\x3e\x8d\x9f\xfd\xfa\x34\xce\x9c\xcd\xa1\x5c\xf6\x6b\x6a\x8b\xcd\
-\x8d\x31\x7c\xfb\x6b\xeb\xf0\xc9\x7b\xfa\xd0\xd1\x1a\xbf\xe8\x25\
-\x97\xb0\x4b\x0e\x75\x98\x35\xf6\xa1\xe1\x1c\xfe\xfa\xc9\x23\xd8\
-\xf5\xe7\x09\x2c\xe6\xcd\xe5\xed\xe6\x0f\x18\x8b\x4a\xf4\xf7\xa5\
-\xf1\x8d\x2f\xaf\xc6\x7d\x77\x75\xa3\xa5\x39\xce\xe5\x18\x22\xfa\
-\x50\x3a\x7a\x72\x01\x4f\xfe\xdf\x13\x78\x75\xcf\x24\x66\xe7\x4b\
-\xd5\x6b\x56\x4c\x5e\x76\x77\xa4\xf0\x9f\xbe\xb9\x1e\xf7\x6e\xef\
-\x42\x53\x63\xec\x92\x02\x1d\x97\x1b\xea\x30\xc1\x3e\x31\x55\xc4\
-\xff\xfe\xf1\x31\xfc\xee\xe5\x31\xcc\xce\x95\x4c\xbf\x52\x41\x08\
-\x01\x29\x04\x12\x09\x89\xbb\x6e\xed\xc4\x37\x1f\x5f\x8d\x1b\xd7\
-\x35\x21\x11\xe7\x26\x2a\x11\x7d\x38\x2c\x64\xcb\xf8\xe5\x33\xc3\
-\x78\xea\xd9\x33\x38\x33\x9c\x43\xa9\xec\xc3\x37\xf9\x68\x03\xfd\
-\x86\x35\x8d\xf8\xf6\xd7\xd6\x63\xdb\x2d\xed\xc8\xa4\x63\x97\x35\
-\xfc\x5e\x76\xa8\xc3\x14\xe4\x73\xf9\x32\x9e\x7e\x66\x18\xff\xf8\
-\xf4\x10\x86\x47\x17\xab\x3f\x85\x84\xfe\x49\x14\x8d\x0a\xb4\xb7\
-\x26\xf0\xd8\x67\x06\xf0\x85\x87\x96\xa3\xbb\x23\x79\xc9\x3f\x89\
-\x88\x88\x5c\xf0\xea\x1b\x93\xf8\xe1\xcf\x4e\x62\xff\xe1\x59\x64\
-\x73\x15\x7d\xd3\x62\x28\x71\xa5\x14\x78\xf0\xee\x1e\x7c\xe3\xb1\
-\xd5\x58\xbf\xba\x09\xf1\x98\xbc\xac\x40\xc7\x95\x0a\x75\xab\x54\
-\xf6\xf1\xc6\xfe\x69\xfc\xed\x8f\x8f\xe2\xc0\xe1\x79\xf3\x2c\x3d\
-\xfd\x13\x49\x29\x40\x4a\xfd\xc8\xbc\x95\xcb\x1b\xf0\xd0\xdd\xbd\
-\x78\xf8\xbe\x3e\x2c\xeb\x49\xeb\x7b\x65\x88\x88\x3e\x00\x8a\x25\
-\x1f\xaf\xfd\x79\x12\xbf\x7a\x7e\x18\x7f\x7e\x6b\x1a\xd3\x73\xa5\
-\xe0\xaa\x72\x7b\xa0\x48\x29\xa0\xb1\x31\x86\x27\xbe\xb4\x0a\x9f\
-\x7d\x40\x5f\xc3\xf2\x5e\x27\x45\x2f\xd6\x15\x0d\x75\x98\x0d\xd4\
-\xb3\xe7\x0a\xf8\xe9\xbf\x0c\xe2\x37\x2f\x8c\x60\x6a\xba\x04\xcf\
-\x9c\x40\xb5\x84\x14\x88\x47\x05\x9a\x32\x31\x7c\xec\x8e\x4e\x7c\
-\xf6\x81\xe5\xd8\xb4\xa1\x99\x15\x48\x22\x72\xd6\xf0\x68\x1e\x2f\
-\xbd\x76\x0e\xbf\x79\xe1\x2c\x4e\x0e\xe5\xb0\x98\xaf\xc0\xf3\x7c\
-\xf8\x4a\x2f\x58\x58\x0a\xc0\xe6\x1b\x5b\xf0\xcd\xc7\x57\xe3\x8e\
-\x2d\x1d\x68\xca\x44\xaf\xe8\xaa\xc5\x15\x0f\x75\x98\x9f\x46\xc5\
-\x92\x87\xfd\x6f\xcf\xe2\x87\x3f\x3f\x89\xdd\xfb\xa7\x91\x5b\x2c\
-\x03\x4a\x3f\x70\x43\xff\xa4\xd2\x13\x7c\x34\x2a\x91\x88\xe9\x0d\
-\xd5\x1d\x77\x74\xe1\xc1\x7b\x7a\xb0\x66\x20\xc3\x75\x77\x22\xaa\
-\x7b\xb3\xf3\x65\xec\xda\x33\x89\x67\x5f\x3c\x8b\xfd\x87\x66\x31\
-\x3b\x5f\xd6\x6b\xe6\x9e\x0f\x60\x49\xde\x41\xa0\xb3\x3d\x81\xff\
-\xf0\xc8\x2a\x3c\x74\x4f\x2f\x7a\xbb\x92\x88\x45\x2f\x7f\xb9\x65\
-\xa9\xab\x12\xea\x96\xe7\x29\x14\x4b\x1e\x9e\xdd\x39\x86\x7f\x78\
-\xea\x14\x4e\x0c\x65\xab\x15\x1e\xc3\x2c\xb9\x43\x4a\x81\x58\x54\
-\x20\x1e\x93\x58\xd9\x9f\xc1\xed\x5b\xda\x70\xd7\xad\x1d\xd8\xb4\
-\xa1\x05\x8d\x0d\x97\xb7\x71\x40\x44\x74\xa5\x0c\x8d\xe4\xb0\x7b\
-\xdf\x34\x5e\xdd\x33\x81\xb7\x0e\xcf\x61\x66\xae\x84\x62\xc9\x83\
-\xe7\xe9\xf5\xf2\x0b\xe5\x5b\x2a\x19\xc1\xa7\xef\x5b\x86\x7f\xff\
-\xf9\x01\xac\x1a\xc8\x20\x99\x78\xe7\xab\x73\x2f\xd7\x55\x0d\x75\
-\xab\x5c\xf6\x31\x3d\x57\xc2\xb3\x7f\x18\xc5\xcf\x7f\x7b\x1a\xa7\
-\x47\x72\x28\x57\xf4\x92\x4c\x75\xcd\xbd\xfa\x1a\x89\x48\x44\xa2\
-\x02\xb1\xa8\x44\x73\x63\x0c\x6b\x56\x64\xb0\xbc\x37\x8d\xee\x8e\
-\x24\xba\xda\x93\xe8\xee\x4c\xa0\x31\x13\x43\xa6\x21\x8a\x86\x54\
-\x14\xe9\x54\x14\xa9\x54\xe4\x7d\x9d\xba\x22\x22\x0a\x2b\x95\x7d\
-\xe4\x16\x2b\x58\xcc\x7b\xc8\x2d\x56\x90\xcd\x55\x30\x35\x5b\xc4\
-\xf8\x64\x01\xe7\x26\x0b\x98\x98\x2a\xe2\xe8\xc9\x79\x8c\x4d\x14\
-\x90\x2f\x78\xa8\x54\x54\x70\x3b\xed\x79\x39\x66\x02\x3d\x99\x90\
-\xb8\x67\x7b\x0f\x1e\xfb\x6c\x3f\x6e\x5c\xd7\x8c\xc6\x86\x2b\xbb\
-\xd4\x72\x21\xd7\x24\xd4\x61\x96\x64\xca\x15\x1f\x93\x53\x45\x3c\
-\xf7\xe2\x28\x7e\xf9\xcc\x30\x86\x46\x72\xef\x79\x65\xaf\x10\x7a\
-\x8a\x8f\x48\xa1\x2b\x92\x12\xc1\xbd\xee\x42\xe8\x2f\x10\xe6\xc1\
-\x4c\x44\x44\x97\xc3\x96\x53\x94\xd2\xb7\x24\x2a\xa5\xe0\xfb\xd5\
-\x57\xcf\x57\x17\xf5\x18\xcf\x54\x32\x82\x7b\xb6\x77\xe3\xb1\xcf\
-\xf4\x63\xc3\xda\x26\x34\x36\xc4\xae\xd9\x01\xcc\x6b\x16\xea\x96\
-\x52\x7a\x72\x9f\x9d\x2f\x63\xf7\x9b\x53\x78\x66\xe7\x28\xf6\xbc\
-\x39\x85\x39\x73\xf7\x01\x82\xdd\x61\xfb\x1b\x7e\xcc\x8f\xf9\x31\
-\x3f\xae\xff\x8f\x85\x14\x58\x3d\xd0\x88\xfb\xee\xea\xc2\x03\x1f\
-\xeb\xc1\xca\xfe\x06\x34\xa4\xa2\xd7\x2c\xcc\xad\x6b\x1e\xea\x96\
-\x52\x40\xc5\xf3\x51\x2e\x2b\x8c\x8c\x2d\xe2\x8f\xaf\x4d\xe0\x85\
-\x57\xce\xe1\xc8\x89\x79\x2c\xe6\x6b\x9f\xf8\xc1\x57\xbe\xf2\x95\
-\xaf\xf5\xfa\xda\xd3\x99\xc2\xb6\xad\x6d\x78\xe8\xde\x3e\x6c\x5c\
-\xd7\x84\xc6\x4c\x0c\xf1\x98\xbc\xea\xcb\x2c\xef\xe4\xba\x85\x7a\
-\x98\xef\x2b\x54\x2a\x0a\xe5\x8a\x8f\xa9\xd9\x12\x0e\x1e\x99\xc3\
-\x9e\xb7\xa6\xb1\x67\xff\x14\x06\x87\x73\x28\x16\xfd\xe0\x27\xa3\
-\x0a\x4e\x62\xf1\x63\x7e\xcc\x8f\xf9\xf1\xb5\xff\xb8\xa3\x2d\x89\
-\x9b\xd6\x37\xe3\xb6\xcd\xad\xb8\x65\x53\x3b\x06\x96\xa7\xd1\x90\
-\x8a\x22\x1e\x97\x66\x99\x78\x69\xc2\x5d\x5b\x75\x11\xea\x61\x4a\
-\x01\x9e\xe7\xa3\xe2\xe9\xa0\x9f\xcf\x96\x71\xf6\x5c\x1e\x67\xce\
-\xe6\x70\x7a\x64\x11\xa7\x47\x16\x31\x3e\x55\x40\x36\x57\x41\x2e\
-\x5f\x41\x3e\xef\x61\xb1\x50\x41\xa1\xe0\xc1\x7f\xf7\xe5\x79\x22\
-\xa2\x77\x14\x8b\x49\x24\x93\x12\xe9\x64\x14\xe9\x64\x04\x0d\xe9\
-\x28\x5a\x5b\x12\x58\xd6\x93\x42\x7f\x5f\x1a\x03\xcb\xd2\x58\xd1\
-\xd7\x80\xf6\xb6\x04\x12\x71\x89\x68\x54\x22\x1a\x15\x90\x52\xe0\
-\x3a\xe7\x78\x8d\xff\x0f\x0f\xee\x0d\x04\xf6\x73\xbd\x56\x00\x00\
-\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x0d\x40\
-\x00\
-\x00\x2d\xbf\x78\x9c\xed\x9a\x6b\x58\x92\x69\x1a\xc7\x5f\x0f\xe9\
-\x96\xa5\x33\x5b\xdb\x41\x0b\xd7\xed\xda\x71\xdc\xd6\x9c\xcd\x9c\
-\x1a\x10\x29\x6d\x52\xcb\xf3\x21\x4b\x13\x6b\x3a\x38\x4a\x1e\x1a\
-\x15\x0f\x08\x38\x53\xe9\x34\x8e\x87\x46\x4d\xcb\x10\xdb\x3c\x04\
-\x08\x64\x89\xe4\x01\xb0\x1c\x73\xb3\x46\x74\x02\x49\x05\xcd\xcc\
-\x34\x14\x90\xf4\x85\xc4\x84\xe5\x05\xf7\xf3\x7e\xda\xeb\xda\x0f\
-\x70\x5d\xef\xc5\xfb\xfc\x9e\xfb\xbd\x9f\xe7\xbe\x9f\xd3\x87\xe7\
-\x7f\x35\x24\xc8\x77\xc3\x3a\xfb\x75\x00\x00\x6c\xf0\xf7\x3b\x14\
-\x06\x00\x56\xfa\xc7\x72\xf3\x1f\xac\xf4\x24\xd8\xf1\xaf\xcd\xfa\
-\x3f\xb3\xb4\x30\x5f\x6f\x80\xd1\xbf\xfd\x9d\xbe\x60\x19\x7f\x30\
-\xf0\x20\x00\x34\x97\xd8\x7c\x3c\xbd\x46\x5f\x5e\x9b\xea\x77\x22\
-\x0d\x00\x6c\x7f\x85\x1e\xb3\x8a\x5d\xb6\x0e\x00\xe0\x1a\xe1\x7f\
-\xe8\x60\x44\x16\x5a\x26\x49\x2a\xad\x4f\x88\x1d\x57\xea\xbe\x92\
-\xe0\x73\x1a\x70\x39\x0d\x1d\x99\x39\xe7\x33\x1b\x2a\xcd\xcc\xa2\
-\x42\x7f\xf8\xc5\xdb\x27\xd5\xc9\xd3\xf2\xf3\xc0\x84\xab\xff\xd8\
-\x1c\xf2\xb5\xf9\xa1\xfb\x75\xdf\x04\xfc\xec\xbf\xd7\x25\xfc\x4f\
-\x81\x7f\xab\xff\xe4\x9f\x3f\x46\x9e\xd8\x65\xef\xf7\xb7\xfa\x73\
-\x9b\xbf\x0e\x68\xed\x0b\xf3\x4b\xc0\xee\x73\xd8\x68\xb9\xe9\xf8\
-\x65\xc9\x70\x41\xb6\x7c\x98\x74\x31\x13\x96\x73\x1e\xab\xb9\xd5\
-\xf9\x63\x68\xdb\x62\xd4\x27\x98\x74\xc5\xf2\x2d\xfe\xf4\x94\x42\
-\xba\x05\xaf\xe9\xb9\x45\x5d\x20\xcd\x8a\x2f\x4d\xcc\x12\x2e\xee\
-\xa9\x09\x80\xc2\x03\x80\x3c\xb7\xbd\x9b\x42\x0d\x6f\x80\x36\xab\
-\x1b\x6b\x7c\x7b\xa5\xfb\x63\x98\xf1\xcd\xdc\x69\x8d\xe1\xff\xcf\
-\x9f\x98\xc0\xff\x13\xf8\xe1\x20\x47\xe5\x53\x86\x7d\x53\x18\x73\
-\x72\xab\xe0\xf5\xe3\x93\xae\xbb\xd7\x27\x9e\x4e\x1e\x80\x59\x04\
-\xb0\xfc\x23\x8b\x7a\x23\x27\xfd\x85\xfd\x75\x89\x9e\xaa\x63\xe6\
-\x7a\xe3\x01\x6b\x04\xa2\xac\xdd\xab\x46\xf0\x42\xd4\x9b\x81\xef\
-\x8d\x87\xc7\xad\x73\x9a\x2a\xcc\x5a\xb2\x39\x26\xad\xe6\x25\xb3\
-\x6a\x70\xa9\xb7\x87\x2a\xad\x59\x9e\x37\x05\x1f\x53\xc5\xda\xad\
-\x5d\x01\x0e\xb6\x05\xac\x87\x0f\x8f\xdf\x19\xbc\x7b\xf8\x4e\xa8\
-\xab\x9b\x9b\xa8\xaf\xef\xc8\x86\x82\xdd\x5e\x90\xb3\xf4\xe1\xc1\
-\xf0\x4a\xe9\xed\xf0\xca\xd9\x19\xca\x51\x70\xb4\xc4\x33\x92\x97\
-\x35\xfe\x0e\xae\xfd\x80\x5d\x3e\xe3\x1e\xe8\x97\xf0\xf3\x5b\x6b\
-\x50\x14\x97\x1d\xce\x91\x63\x54\x82\x07\x6a\x3b\x0c\xe1\xcf\x37\
-\x81\x8f\xfe\xae\xae\xae\xc2\x31\x0e\x0e\x93\x94\x44\xd7\xfb\xc4\
-\xad\xd7\x7b\x3a\x60\x8d\xd7\xfe\x5a\xdf\xbe\xbc\xaf\x5f\x10\xab\
-\xbe\xd5\x84\xf3\x02\x0f\xe1\x3c\xd3\x2e\x97\x53\xed\x6d\xad\x40\
-\xcd\x16\xa6\x20\x06\xdd\x8c\xe6\x23\x42\x3c\x14\xa8\x10\x0b\x71\
-\xea\xd1\xa3\x47\x59\x5c\x2e\x9a\x46\xa3\x79\xec\xdb\x27\x82\x59\
-\x40\x81\x1d\xb4\x23\x73\x4f\xa2\x16\xc6\x8b\x45\xc1\xba\xf7\x67\
-\xc0\x01\xca\x51\x99\x32\xa0\xea\x5d\xe9\x9e\x7d\x4d\xed\x93\x19\
-\xd6\xd2\x51\xdd\xe3\xef\xe8\xf2\x9a\x61\x94\x45\x17\x99\x32\x91\
-\x7a\x7c\x76\x76\x96\xd5\xdc\x3c\x71\x1d\x9a\xfb\x07\x4a\x72\x67\
-\xb8\xe1\xa0\xbc\x03\xd6\x84\x43\xe1\x19\xc8\x9b\x89\xee\xdb\xc2\
-\xb0\x25\x56\x60\x31\x2f\x37\x9c\xa3\x3c\xb7\x8b\x85\x21\xbc\x45\
-\x7b\x1d\x88\x6f\x62\x30\x86\xbe\xb7\xb0\x4e\x54\xcb\x25\xb2\x4f\
-\xa1\xe4\xef\xc8\x18\x8f\xef\x17\xee\x50\xac\x9c\x5d\x51\x75\x07\
-\xb3\x7c\xc3\x13\xde\x7a\xf7\x5d\xb3\x28\x04\x27\x53\x10\x11\xfc\
-\x68\x32\xa5\x72\xc3\xc0\x89\xb4\xb4\xb4\x8c\x0f\xf3\x13\xd1\x31\
-\x31\x98\x12\xe8\xa3\x99\x7b\xc4\x95\x47\xd6\xb3\xd6\x5e\xf3\xc3\
-\x23\xdc\xf6\x17\xb0\xc0\x8a\x1b\x6b\x5d\xba\x1f\xd5\x72\x15\xa3\
-\xc9\x8c\x14\xdc\x53\xc6\x4d\x87\xe7\xbf\x1e\xb5\x9a\xa9\xd0\xff\
-\x46\xc4\xe2\xc5\x8c\x38\xe8\x2b\xe4\xfb\x99\xa1\xa9\x9c\x65\x9c\
-\x57\xa8\xe3\xd2\x87\x61\xd5\xb7\x89\xcf\x0f\xf9\xb5\x9d\x4b\x8a\
-\xc2\xbf\xea\x28\x11\x7c\x5f\x4f\xd3\x77\x68\xc7\x1e\xfb\x22\xe9\
-\xbf\xae\xed\x64\xb5\xb4\x08\x60\x66\x50\x56\x4e\xa3\xb2\xd5\x3b\
-\x41\x64\x26\x81\xba\x3b\xf6\x06\x77\xd4\x25\xdc\x31\x0c\xbd\xf4\
-\x58\xa8\x69\x66\xc3\x9a\x94\x19\x9f\xae\xa9\xb5\xb3\xba\x74\x30\
-\x29\x39\x79\x48\xa3\xc9\xc1\x59\x42\xa9\x28\x40\xb6\x67\xb4\xa1\
-\x17\x4a\x14\x34\xeb\x60\x74\x62\x49\x4e\xd2\x4b\xdb\x17\x6f\x1c\
-\xd0\xf7\x98\x84\xb9\x94\x0b\x3f\x7e\x0e\x20\xf7\xdc\x08\x90\xbe\
-\x6c\x3e\xc3\x62\xb1\x84\xab\x6d\xf8\xda\xfe\x5d\x88\x54\xb4\x71\
-\x92\x47\xc5\x2f\x60\xe0\x88\x20\xbf\x3c\x8a\xf7\x6d\x1c\x47\x41\
-\x5f\xc6\x74\x2e\xa4\xe3\x2c\x0f\xd8\xdd\x82\x67\x50\x83\x48\x70\
-\x61\x3f\x14\x48\xfa\xcb\x47\xac\x1e\x4a\xa1\x4b\xf8\xb6\x30\xae\
-\xf6\x99\x5a\xd0\x31\x96\x1b\x2e\x3c\xab\xe1\x16\x6e\x38\x75\xfd\
-\x42\x52\x92\xf0\x69\x99\xf3\xe8\x36\xbd\x5d\x9e\xed\x28\x2f\x25\
-\x42\xad\xad\x1e\x9d\x6d\x63\xff\x9d\xed\xcb\xd9\x9b\xe1\x34\x85\
-\xa9\x79\x10\x81\x52\xb6\x5a\x78\x34\x5d\x84\x1c\x93\x90\xb8\xa1\
-\xdf\x36\x41\xc6\x35\x6d\x09\x8a\xbb\x5e\x9a\x9d\x6e\xb4\x4b\x98\
-\x42\x59\xa8\x22\x20\xd2\xaf\x4d\x36\xff\x8d\x64\x89\x64\x8d\x21\
-\x7c\xfe\x4f\x20\xa0\x8c\x4e\xa7\xc3\xf1\x9a\x74\x84\x61\xba\x9c\
-\xe6\xc3\xef\x75\x10\xa6\xe2\x56\x7a\x46\x3a\xf6\x8e\xc3\xc0\x3e\
-\xc1\xe5\xf2\x89\x53\x21\x99\xdc\xc9\x54\xd7\xfe\xe0\x91\x9d\x40\
-\x43\xd7\x0d\xf7\x78\xe9\xeb\x9e\x42\x99\x61\x82\x16\x70\xe6\xbf\
-\xc2\xcd\xae\x8c\x2f\xbf\xc6\xca\x2b\x28\x6b\x5d\x50\x9a\xd6\xdf\
-\xa2\x25\xb2\xcf\xd6\x75\xed\xc5\x2d\x0e\xfa\x62\x3c\x55\x29\x48\
-\xc8\x8e\x9c\x3b\xfb\x2c\x99\xc2\x03\x03\xf9\xc9\xd3\x63\x55\x3f\
-\x95\xbe\x77\x8d\x63\x47\xbb\xf1\x92\x18\x24\xb3\xaa\x3d\x22\x66\
-\x1c\xb3\x17\x86\x6b\x22\x41\x79\x9b\x79\xe8\xc8\x99\xbc\x02\x56\
-\xf0\xa3\x13\xa6\xd1\x33\x78\xbf\x6d\xb6\xd6\x60\x30\x17\x6c\xc0\
-\x5a\x9d\x3a\x82\x5c\x7a\x53\x96\x31\xf1\xf8\x0a\x16\x3a\x66\x6a\
-\xbb\xb1\x45\xf9\xa0\x42\xf7\x48\xd4\x9a\xe6\xb6\xe8\x55\xf7\x71\
-\xc0\xc1\x4e\xf4\x5a\x1c\x84\xb0\xf8\xa2\x27\xe8\xd6\xfe\xd0\xb2\
-\xab\xf1\xdf\x40\x0e\x17\x9f\x8a\x88\x3d\xd1\x9c\x77\x15\xd5\x32\
-\x71\x36\xc7\xd6\xa5\x7a\xd9\x17\x2c\x72\xb3\x67\xb9\x03\xe1\x72\
-\xa9\x90\x96\xa1\x9a\x1b\x36\xfa\x9b\x1c\x5b\x29\x66\x52\xeb\x7b\
-\x08\x48\xea\x1d\x91\xd3\x54\x5c\x67\xc2\x03\xab\xa9\xdb\xdd\xc0\
-\x83\x99\xe7\x37\xdc\x61\x9e\x76\x50\x7e\xdc\xd9\x4d\x0a\x2a\x4f\
-\x9d\x3f\xdd\x9a\xd6\x08\x7e\x59\xb7\x3d\xda\x51\x58\xf8\x25\x9e\
-\x6e\xd3\xd5\x64\x5f\xd2\x0b\x8d\xbd\x71\x28\xc5\xa8\x8f\x34\x3e\
-\x4d\x82\x6c\xaf\xf8\x7d\xb4\xf4\xbd\x4f\x0a\x3c\xe2\x92\xfe\xbc\
-\x38\x3f\x3c\xfc\x20\x5e\x72\xc4\x10\xe5\x0d\x21\xd2\x06\xec\xe7\
-\xbd\x9f\xc3\xca\x9b\xd0\xf9\xe5\x6d\xa7\x85\x64\xd4\xef\xe4\xe8\
-\x35\x5d\xe4\x62\x65\xd6\xc9\x69\x3e\x39\x25\x1e\xf2\x04\x97\xe3\
-\xc6\xe6\x3b\xb1\x52\xc8\x46\xa1\x69\x88\xa1\x7e\x86\x90\xad\xef\
-\x5a\x6f\x3c\x7c\x34\xd3\xf3\xda\x58\xb0\x52\x2b\xd6\x62\xe5\x75\
-\x7a\x83\x94\x5c\x65\x0d\xd6\xfc\xd4\xe1\xd8\xf6\x74\x0a\x23\xb6\
-\x63\x68\xb5\x2f\xd5\x71\xac\xe1\x20\x92\xa0\xa3\xf4\xbb\x53\xe3\
-\x77\x93\xd1\x17\x1d\xd6\xe4\xa1\x52\xe5\xe2\x36\xac\xb9\x21\x6a\
-\xee\xca\x54\xc1\x08\xa5\x2c\x67\x4b\x18\x77\xd2\x61\xc8\xf3\xf8\
-\xd6\x3c\xb7\x54\xe5\xeb\x9e\xd5\x5a\x95\xab\x9b\xe0\x28\xef\x3b\
-\x0e\x09\xd1\x98\xe9\x34\x55\x1f\xc7\x15\x04\x01\xcf\x1f\xca\x64\
-\xb2\x91\xe1\x8b\x31\xd0\x5a\xaf\x4d\x49\x26\x4e\x04\xca\x04\x5f\
-\x71\x6c\x5c\xf8\xc3\x33\x12\xe6\xfa\x2e\xf2\x7d\x65\xd6\xdc\x31\
-\xc3\x0e\x62\x27\xd1\x0a\x93\xeb\xc4\x21\x38\x2c\x5f\x28\xcf\xd6\
-\x4d\x6e\xcd\x43\x25\xe2\x70\x1d\x24\xc3\x7a\x7f\x38\xca\x1b\x29\
-\x2a\x77\x90\xae\xa9\xee\x18\x5d\x0b\x50\xa9\x52\xfd\x70\xc8\x0c\
-\xab\xad\x57\x16\x83\xbe\xcb\x42\xda\xc8\xc4\x2e\x9c\x75\x2e\xec\
-\xb5\x2e\x80\xa5\xb7\xc1\x1f\x4a\xd2\x3e\x28\xe3\x6b\x71\x7f\x0a\
-\xe3\xce\x75\xdd\x25\x01\xb5\x47\xfc\x0c\xe9\x74\x75\x9a\xb2\x8a\
-\x1e\x75\x1f\x0f\x02\x42\x40\x9c\xdd\x2d\x6b\xa8\x63\x44\x95\x62\
-\x56\xf5\xd7\x9f\xd0\x57\xca\x07\x1f\xd7\x92\x80\x57\xea\xc0\xcf\
-\xca\xfe\x13\xd5\x9c\xdc\x58\x73\xe5\x76\xa9\xb9\xe1\xb8\x78\x71\
-\x36\xbb\xb2\xf4\xbb\xee\x9f\xdb\x57\xd8\x96\xaf\xb6\xbd\x3d\x6c\
-\x68\x4d\x37\x37\xec\x21\x0a\x22\xfd\x4e\x2b\xdd\x93\xba\x7a\xbe\
-\x34\xf4\x7d\x3c\xc9\x0e\xff\x9a\x4d\x44\x18\x8a\x79\xf1\xa5\xab\
-\x0e\x3e\xf9\x83\x8b\xf1\xe0\xf9\xde\x04\x4c\xc0\x04\x4c\xc0\x04\
-\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\
-\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\x04\x4c\xc0\
-\x04\x4c\xe0\x7f\x02\x0e\x32\xbd\xfb\xce\x7a\x26\x38\x1b\x0a\xb5\
-\xbd\x58\xb8\x76\x98\xa8\x47\x15\xb3\x32\x73\x80\x78\xea\x8b\xad\
-\x2d\x1b\xa1\x8a\x1d\x99\x53\x23\x41\x88\x8c\x23\xfa\x1a\xd6\xac\
-\x84\x61\x94\xd0\x74\xe9\xc8\xcf\xa2\xae\x94\x3b\xbc\xed\x7b\x31\
-\x89\x35\xcf\x1b\x9f\x5e\xbd\x14\xbd\x60\xe3\xb2\xaf\x5f\x81\x9e\
-\x53\x39\x6e\xcc\x8b\xef\x4f\x7d\x49\x63\xef\x85\xcc\x09\xfc\x8d\
-\x5b\x18\xac\xf0\xc6\x45\x69\x78\xa3\x6f\xbf\x97\x24\x08\x08\x89\
-\x8c\x2c\x2c\x2c\x34\xde\xe8\xda\x6d\x47\xe1\xea\x49\xf0\xfa\x28\
-\xa7\xa9\x34\xe7\x56\xe8\xba\xf7\xb2\x41\x9f\x30\x06\x57\x1e\x62\
-\xa3\x96\x15\x91\x7e\xd9\xf3\xe9\x6c\xda\x26\x80\xbf\xdd\x70\xd3\
-\x5a\x4b\x86\x8d\xfe\x31\x2c\xb9\x6a\x61\x0b\x53\x24\x54\xe6\x22\
-\x2c\x0e\xc8\xc6\x38\xff\xb9\x37\x5e\x76\xdc\x3f\x1e\x44\x7a\x41\
-\x2b\x0d\x8b\x04\xe7\x87\x1e\x92\x80\xaa\x8b\x97\x1e\xd5\x1e\x3b\
-\x76\x6c\xc4\x20\x90\x28\x5e\x9e\x71\xee\x6f\x0d\x9f\x5e\xdc\x5d\
-\x27\x5e\x40\x54\x8e\xac\xcd\xdb\xc6\x6e\x69\x89\xe8\x3e\xad\x18\
-\xfb\x1d\x72\x70\x7e\xcc\xf7\x72\xb9\x83\x02\x35\x8e\xeb\x2f\x38\
-\x07\xe4\x9a\xb1\x0d\xf2\x2e\xcd\xf4\x63\x15\xa8\x99\x71\x86\xa5\
-\x4c\xf7\xbf\x8b\xbd\xb6\x7f\xa1\x23\x58\xf4\xce\x26\x0d\xba\x6e\
-\x8f\x89\x89\xc1\x18\x32\x08\x97\x33\x74\x84\xfb\x24\x38\x25\xd3\
-\xa9\x9e\x2a\xe5\x11\xe6\xbc\x11\x66\x5f\xdc\xb9\x5e\x59\x89\xd9\
-\x0b\x09\x0a\xa0\x4c\xaa\xc9\x5e\x39\x9d\x7a\x8b\x4a\xa7\x29\x7c\
-\x26\x99\xf1\x68\x80\xbe\x09\xa0\x0e\x89\x44\xfa\x90\xa1\xae\x21\
-\x94\x1f\x2a\x34\xff\xea\xed\xd0\xe5\x96\x4b\x31\x7e\xc3\xdb\xa2\
-\x56\x86\x94\xfe\x08\x8b\x2f\xce\xe4\x77\x9f\xa6\x33\x18\xad\xab\
-\x4e\x36\xf2\xd2\x5b\x48\x70\x5a\x25\xd4\x8c\x35\x51\xde\x52\xd0\
-\x6f\xf1\xfc\x61\x51\xd1\x06\x85\xe1\x16\x1a\xf9\x00\x9f\xd1\xa8\
-\x95\x11\xb3\xeb\x48\x08\x1a\x9b\xec\x85\xd7\xbe\x99\xca\x79\x23\
-\xf6\xd6\xfb\xd9\xa9\xf7\xb3\x63\x7f\x6a\xed\xaa\x96\x82\xdc\xb9\
-\x3c\x08\x27\x2a\xdf\x61\xe5\x4d\x63\xf9\xe5\x54\x2a\x51\xf5\xc0\
-\x19\x43\x20\x70\x49\x66\x55\x66\xd6\x76\xb0\x74\x07\x43\xae\xe3\
-\x77\xc7\x0e\x53\x32\x25\xe0\x12\x56\xde\x82\x26\x9a\x83\x57\xef\
-\x6c\x91\x8e\xf1\x4b\x46\xb7\xe5\xb9\xb0\xef\xdd\x0b\x71\x70\x70\
-\x30\xaa\x3d\x7a\xf1\xe3\xc1\xf8\xf6\x20\x4f\x42\x3d\x09\x41\x17\
-\x41\x7d\x23\x65\x7a\x9d\x0c\x2e\x99\x1e\xd1\x5b\x62\x3f\xcc\x4f\
-\xd8\xaf\xb7\x5a\xd5\x85\xac\xf0\xf9\x35\x4c\x35\xfe\xc3\x04\x56\
-\xde\x39\x56\x50\xae\xcc\x0a\x43\x7d\x9c\x58\xd0\x27\xb3\x7c\x84\
-\x9d\x12\x27\x1b\x65\x33\x8d\x3d\xbc\x27\xa3\x21\xc0\xeb\x99\x2b\
-\xe7\x11\x6a\x6f\x85\xcf\x91\x48\x61\xac\x9a\x44\x5b\x2e\x09\x82\
-\x3c\xba\xa3\x50\x71\xd5\xd5\xd5\xab\x6d\x4b\x94\x63\xc1\x43\xd3\
-\xc5\x71\x17\xa6\xd1\x55\x3f\x41\x23\xcf\x56\xe4\x36\xd5\x74\xee\
-\xf1\x70\xb3\xce\x43\x3d\xb9\xb6\xd3\x37\xd1\x10\x97\xc1\x29\x79\
-\x19\xdc\x08\x3a\x12\xc0\xe3\x08\xf5\x13\x41\x79\x81\xf2\x6c\xd8\
-\x78\xf6\xf4\xd3\xf6\xd6\x49\xc4\x82\x59\xc3\xe0\x6f\xfb\xc6\x4f\
-\xe2\x54\x73\x09\x46\x85\xc5\xdc\x3e\xc7\xdc\xfb\x63\x1a\x79\x09\
-\x3b\x8d\x19\x10\xe8\x47\xa1\x6a\xc4\x57\x77\x81\xfd\x44\x76\x24\
-\xa2\x8c\x92\x73\x02\x70\x4f\x39\x73\xe6\x8e\x2d\xcc\xf3\xe5\xaa\
-\x4a\xc7\xa7\x71\xb7\x10\xc3\xd3\x71\xdb\x73\x33\x1a\x91\xd2\x0a\
-\xca\x2e\x5b\x47\xdc\x4c\xd8\x8a\x44\x4d\xa6\x2b\x17\x39\x7b\xf3\
-\x6e\xb4\x34\x37\x87\x16\xd8\xee\x48\x5c\x75\xff\x7c\x89\x06\x52\
-\x89\xe9\x29\x48\xa5\x80\xa5\xba\x9b\xd9\x70\xff\x4b\xf1\x72\xd7\
-\x15\xcd\xb2\x63\x56\xe7\x13\x0f\x11\xcc\x6c\x60\xe7\x5f\x8c\xeb\
-\x6a\x3b\x31\xb7\x03\xad\xe4\xa8\x05\x67\x62\x46\x65\xa1\x6e\x81\
-\xe7\xa0\xbe\xb0\x82\x51\x91\x29\x04\xc5\xd3\xf6\x2f\x37\x87\x03\
-\x9a\x99\x81\xdb\x3e\x46\x6b\x7e\xae\x66\xd0\x06\xfc\x85\xb7\x80\
-\x01\x11\xbd\x6e\xad\xbe\x1c\x0f\x16\x34\x1e\xdf\x4f\x8e\x82\xf9\
-\x99\x3b\x68\xce\xcc\x00\xf0\x99\x65\x15\x9c\x3d\x96\x83\x49\xba\
-\x70\xa1\xc5\x38\xad\x54\xcf\x74\x38\x1a\x5a\x23\xe1\xa1\x1b\xf9\
-\x71\x49\x25\x39\x49\x52\x9b\x6e\xa5\x33\x43\x48\xd3\x2d\x75\x83\
-\xcd\xbe\xbd\x90\x56\xca\xdd\xbe\x48\xba\xc4\x27\x12\xe8\x4c\x26\
-\xdb\xd7\x18\xb1\x5a\xb7\x18\x2f\x05\x75\x8b\x44\xc1\x15\xd9\xac\
-\x2c\x54\xb1\x41\xca\x72\xbc\xd9\x32\xd9\xa2\xa9\x66\x0e\xc7\x65\
-\x76\x9e\x0f\xfe\x2d\x18\xef\x65\x3e\x43\xc6\x2f\xab\x84\x74\xf6\
-\x58\x74\x5a\x1a\xf7\x17\x83\x34\xc4\xad\x98\x24\x61\xf0\x54\x6e\
-\xba\x28\x89\xae\x6b\x09\xd2\x66\x45\xe8\x63\x1a\xe9\x4c\x88\x40\
-\x69\x55\x3e\xe0\xad\x15\xd9\x5a\x80\x7f\xb9\xad\xad\x0d\x9e\xfb\
-\x21\x95\x4e\xa7\xb3\x56\x1b\xc4\x79\x7d\x08\x59\xe9\xb2\x86\xdd\
-\x7d\x16\x95\x39\x72\x87\xb2\x27\xcd\x69\x4a\x97\xfd\x42\x86\x01\
-\x63\x99\x71\x74\x89\x8d\xfb\xd2\x7b\x33\xf8\x69\x3c\x9e\x63\xbb\
-\x03\xfe\x66\xb3\x51\xa9\x26\xd6\x37\xd0\x3e\xc9\x21\x37\x05\xc3\
-\xf0\xf7\x91\x37\x8f\xb8\x3b\x84\x51\xa9\x6f\xf3\x23\x53\x88\xa0\
-\x36\x67\xf2\xd9\xb1\xc4\xa4\x84\xf3\xba\xf5\x00\xb1\x01\x5a\x67\
-\x4c\xa6\xe8\xc9\x93\xc3\x45\x87\xef\xa8\xb6\x1a\x16\xa5\xe6\x0a\
-\x2e\x58\x88\x23\x68\x6f\xb7\x4f\x87\x07\xb7\xf8\x86\x27\x35\xf8\
-\xf4\x39\xaa\x34\x4c\x49\x4c\x4a\x76\x4f\xb4\x04\xbb\x50\xfb\xd6\
-\xd3\x67\xcd\xab\xfc\x98\xe8\x68\x2a\x08\x82\xd1\xb1\xb1\x19\x16\
-\x86\x85\xe3\x0c\xfb\x2a\xad\x4d\x3b\xc9\x84\xd1\xd4\xba\xbe\x66\
-\x78\x8e\x34\x0c\xe7\xb9\xf1\x72\xf9\x93\x6f\x09\x21\x29\x78\xa1\
-\x36\x47\x56\xa8\x12\x5c\x5b\xb9\x74\xd3\xf1\xe7\x51\x47\xb3\x57\
-\x47\x5b\xf4\xbb\x10\x4e\x2d\xa7\xb3\x58\x1e\xec\x60\x28\xd4\x9c\
-\xd7\x0f\x7a\x77\x0f\x49\x78\x17\x1b\xbc\xb2\xf8\x4f\xdb\x15\xee\
-\xd3\x23\x93\x37\x76\xd6\xe5\x7e\xea\xa6\xa3\x56\x68\xde\x56\x36\
-\x0d\xa5\xd9\xed\x16\x68\xde\xd7\x5e\xf7\x2d\xbb\xe9\xf8\xd3\x2e\
-\x80\xf8\x32\x75\x7f\x53\x4f\x4f\x8f\x7d\xd1\x61\x0f\xfb\xa2\xc4\
-\xec\xec\x36\xfd\xae\x97\xb8\x3f\xbd\x07\x52\x27\xd5\x3e\x83\x79\
-\x66\x53\x60\xf0\x6c\x4a\x71\x0d\x37\x82\x97\xb1\x48\xd1\xcc\xaf\
-\x34\xce\xbe\xd9\x18\x35\xe2\x58\x9d\xe0\xdd\x47\x1e\x60\x0c\xde\
-\x3b\xbc\xd0\x1d\x7d\x72\xab\xe0\xb1\xb8\x16\x69\x55\x95\x58\x46\
-\xb5\x2f\xa1\x3d\x29\xa3\x92\xfc\x85\x59\x73\x74\x68\xa7\xae\xb5\
-\xc3\x62\x3f\xcb\xc0\x7b\x52\x1a\x99\x25\xb3\x9a\x62\x7e\x3a\x77\
-\x93\xb7\x51\x08\x7b\xe0\x15\x22\xca\x78\xa8\xfc\xbf\x68\x3c\x4d\
-\xe0\xbf\x80\x1f\x74\x16\xa5\x27\x16\xae\x1f\xb8\xb6\xae\x13\x2a\
-\xfa\x7f\x1d\x74\x88\xe1\x7d\xea\x87\x7f\x03\xd5\xb1\x2d\x0f\
-\x00\x00\x23\x75\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x01\x77\x00\x00\x01\x32\x08\x06\x00\x00\x00\x01\x55\x90\x21\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x23\x0a\x49\x44\x41\x54\x78\x5e\xed\xdd\x7b\x94\
-\x5c\x65\x99\xef\xf1\xdf\xde\xd5\xdd\x55\x5d\xd5\xf7\x74\x77\x3a\
-\x97\x0e\x09\xb9\x87\x04\x10\x10\x83\x28\x0c\x22\xa2\x8c\x7a\x70\
-\x10\x5d\xa3\x23\x1e\xef\xcb\x59\xc7\xcb\x1c\x41\xcf\x5c\x8e\x73\
-\xe6\x78\x66\x74\xd4\x19\x8f\x33\xb3\x96\x3a\xa3\xe2\xd2\x39\xa3\
-\x0b\x6f\x30\xe0\x08\x82\x03\x8a\x22\xc8\x35\xf7\x2b\x21\xe9\xdc\
-\x3b\x9d\xf4\xb5\xba\xeb\xbe\xcf\x1f\xef\xde\xbb\xf6\xae\xee\x40\
-\x12\x72\xa9\x17\xbf\x9f\xb5\x58\x3b\x55\xbb\x2a\x40\xfe\xf8\xf5\
-\x93\x67\x3f\xef\xfb\x3a\x9e\xe7\x79\xaa\x73\xe3\xd9\xa2\x0e\x1d\
-\x99\xd2\xfe\xc3\x59\xed\x3f\x3c\xa9\x7d\x87\xb3\x1a\x1e\xcd\x6b\
-\x62\xb2\xa8\xa9\x5c\x59\xb9\x5c\x49\x53\x85\xb2\xf2\x85\x8a\x2c\
-\xf8\xdf\x01\x50\xa7\x9a\x1a\x5d\xa5\x92\x09\x35\xa7\x1a\x94\x4a\
-\x26\x94\x49\x35\xa8\xb3\x3d\xa9\x39\xbd\x69\xcd\x9b\x9d\xd6\xfc\
-\xd9\x19\xcd\xef\xcb\xa8\x35\xd3\x28\xd7\x75\x6a\xbf\x5e\x57\x9c\
-\x7a\x0c\xf7\x91\xb1\xbc\x36\xee\x1c\xd6\xba\x2d\xc7\xb4\x6e\xeb\
-\x31\x1d\x3a\x32\xa9\x52\xb9\xee\xfe\x33\x01\xfc\x8e\xea\xe9\x4a\
-\xe9\x82\xa5\x9d\xba\x68\xc5\x2c\x5d\xb8\xac\x53\xbd\xb3\x9a\x95\
-\x48\xd4\x57\xd8\xd7\x45\xb8\x8f\x4d\x14\xb4\x65\xd7\xa8\xd6\x6f\
-\x3d\xaa\x75\x5b\x8f\x69\xe0\x40\x56\xa5\x72\x45\x9e\x27\x39\x8e\
-\x22\x57\x4f\x8e\xe3\xcc\xf0\x3e\xf7\xb9\xcf\x7d\xee\x9f\xbb\xfb\
-\x7d\x3d\x69\xad\x5e\xda\xa1\x8b\x56\xcc\xd2\x45\x2b\xba\x34\xab\
-\x23\x79\xce\x2b\xfb\x73\x1a\xee\x93\xb9\x92\x1e\x5b\x77\x44\x3f\
-\xff\xcd\x01\x6d\xda\x31\xac\x7c\xa1\x1c\xfe\x81\xc9\x93\x14\xf9\
-\x03\x0c\x70\x9f\xfb\xdc\xe7\x7e\xbd\xde\x97\xa4\x65\x8b\xda\x75\
-\xcd\xe5\x73\x74\xe5\x65\x7d\xea\x6a\x6f\x92\x5b\xfb\x81\xb3\xe4\
-\x9c\x84\xfb\xe8\x44\x41\xf7\xfe\x72\x9f\x7e\xf2\xd0\x80\x8e\x8e\
-\xe4\x55\xa9\x98\x3f\xa0\xe0\x0f\x8a\x2b\x57\xae\x5c\x6d\xbf\x36\
-\x27\x13\xba\xee\xca\x79\xfa\x2f\xd7\x9e\xa7\xd9\xdd\xcd\x67\xbd\
-\x92\x3f\xab\xe1\x9e\x9d\x2c\xea\x27\xbf\xd8\xab\x7b\x1e\x1c\xd0\
-\xd0\x70\x5e\xf2\xcc\x0f\xc0\xe3\x09\x7e\x40\xb6\x64\x1a\xb5\xb8\
-\xbf\x55\x7d\x3d\x69\x75\x77\xa6\xd4\xdd\x99\x52\x4f\x57\x4a\x2d\
-\xe9\x06\xa5\x53\x09\xa5\x9b\x1b\xd4\x9c\x6a\x50\x73\x32\x21\xc7\
-\x39\xbb\x7f\x80\x00\x5e\x3a\xf2\x85\x8a\x26\x73\x25\x4d\x4d\x95\
-\x34\x99\x2b\x29\x3b\x55\xd2\xb1\x91\x9c\x8e\x1c\xcb\x69\x68\xd8\
-\xfc\xb3\x63\xf7\x98\x8e\x8d\x15\xe4\x55\xbc\x13\xca\xaf\x74\x2a\
-\xa1\xd7\xfa\x21\xdf\x77\x16\x43\xfe\xac\x84\x7b\x76\xb2\xa8\xfb\
-\x7e\x7d\x40\x77\x3d\xb0\x47\x43\xc7\x72\xaa\x78\x9e\xff\x13\xce\
-\x93\x23\xc7\xfc\x0d\xa7\xe6\xf5\xa2\xfe\x56\x5d\xb2\x6a\x96\x2e\
-\xbf\xb0\x47\xcb\x17\xb5\x2b\xd9\x94\xa8\xfd\x6d\x01\xe0\x9c\x78\
-\x6e\xef\xb8\x9e\xd8\x38\xa4\x27\x36\x0c\x69\xdb\xee\x51\x15\x8a\
-\xe5\xe7\xcd\x33\xc7\x91\x52\xc9\x84\x5e\x77\xe5\x3c\xdd\x78\xdd\
-\x42\xf5\xce\x4a\x9d\xf1\x76\xcd\x19\x0f\xf7\xcd\x3b\x47\x74\xfb\
-\x8f\x76\x68\xdb\xae\x11\x15\x4b\x95\xda\xdb\xa1\x64\xd2\xd5\xea\
-\x25\x9d\x7a\xc5\x85\xbd\xba\xfc\xa2\x1e\xf5\x74\xa5\xce\xda\x4f\
-\x38\x00\x38\x55\xe3\xd9\xa2\x9e\xde\x7c\x54\x8f\xae\x1b\xd4\x53\
-\x9b\x86\x34\x36\x51\xd4\xf3\xa5\x6a\x5f\x4f\x5a\xef\x7a\xf3\x62\
-\x5d\x71\xc9\x6c\x35\x27\xcf\x5c\xd1\x7a\xc6\xc2\x7d\x68\x38\xaf\
-\x7f\xfd\xf7\x9d\xfa\xe5\xe3\x87\x34\x35\x55\x34\x3f\xba\x42\xfe\
-\xd3\x08\x49\x0b\xe6\x64\x74\xe3\x75\x0b\x75\xf5\xcb\xfb\x94\x6e\
-\x6e\x88\x7c\x06\x00\xec\x52\x2c\x55\xf4\xcc\xe6\xa3\xfa\xc1\x7d\
-\xbb\xb5\x75\xd7\x88\x0a\xc5\x4a\xb5\x09\x1f\x32\xf9\x77\xc9\xaa\
-\x6e\xbd\xeb\xc6\x25\x5a\x72\x5e\x9b\x1a\xce\xc0\x18\xe5\x19\x09\
-\xf7\xa7\x37\x1f\xd5\x57\xbf\xb7\x45\xfb\x0e\x4e\xaa\x72\x9c\xdf\
-\x7e\xc1\xdc\x8c\xfe\xe0\x75\x0b\xf5\xea\xcb\xfa\x94\x4e\x11\xea\
-\x00\x5e\x5a\x9e\xdc\x38\xa4\x3b\x7e\xba\x4b\x5b\x76\x8d\xaa\x58\
-\x9c\xb9\x6b\xd1\x96\x69\xd4\x07\xdf\xbe\x5c\x57\x5e\xda\xa7\xd4\
-\x69\xae\xe2\x4f\x6b\xb8\x97\xcb\x15\xfd\xf0\x67\xbb\xf5\xc3\x7b\
-\xf7\x68\x2c\x5b\x08\xe7\x42\xab\x63\x43\x9e\x3a\xdb\x93\xfa\xc3\
-\x37\x2e\xd6\xb5\x57\xcc\x55\x86\x4a\x1d\xc0\x4b\xdc\xa3\xcf\x0c\
-\xea\xdb\x77\xee\xd4\x9e\xfd\xe3\xaa\x78\xd1\xa9\x1a\x93\x8f\xae\
-\x23\xbd\xf9\xda\xf3\xf4\xb6\x1b\xce\x57\x67\x5b\x53\xed\xd7\x4f\
-\xd9\x69\x0b\xf7\x63\xa3\x79\x7d\xf5\xbb\x5b\xf5\xd8\xba\x23\x2a\
-\x14\xcb\x33\xce\x81\x5e\xf7\xaa\x79\x7a\xe7\x9b\x16\xab\xb7\xab\
-\x39\xfe\xb7\x14\x00\x78\x09\xcb\xe5\xcb\xfa\xd1\xcf\x76\xeb\xce\
-\x07\xf6\x68\x3c\x5b\x9c\x31\x1f\x57\x2d\xe9\xd0\x1f\xbf\x63\x95\
-\x16\xcd\x6f\x39\x2d\xcf\x1b\x4f\x4b\xb8\x0f\x1d\xcb\xe9\xf3\x5f\
-\xdf\xa0\xcd\x3b\x87\x55\xae\x78\x91\x95\x5c\xe6\xba\x64\x41\x9b\
-\x3e\xf0\xf6\xe5\x5a\xb9\xb8\x43\x8d\x0d\x6e\xed\xd7\x01\xe0\x77\
-\xc2\xde\x83\x59\x7d\xf3\x07\xdb\xf4\xd4\x96\xa3\xca\xe7\xcb\xb1\
-\x9c\xf4\x3c\x4f\x73\x7b\x33\xfa\xef\xef\x59\xad\x15\x8b\x3b\x5e\
-\x74\x1f\xfe\x45\x87\xfb\xc0\x81\x09\xfd\xfd\xed\x1b\xb5\x63\xf7\
-\x98\x2a\x35\x73\x9f\x8e\xa4\x3f\xb8\x7e\xa1\xde\xf6\x86\x45\x6a\
-\x6f\x3d\x7d\x7f\xdd\x00\x00\x9b\xdd\xf5\xf3\x3d\xfa\xde\x3d\xbb\
-\x34\x3c\x56\x08\xe7\xe1\x83\x6b\x67\x7b\x52\x1f\x7f\xf7\x05\x7a\
-\xd9\xaa\x59\x6a\x6a\x3c\xf5\x62\xf8\x45\x85\xfb\xa6\x1d\xc3\xfa\
-\x87\x6f\x6f\xd6\xc0\xc1\x09\x49\xf1\xb9\xce\x4c\xba\x51\x7f\xfc\
-\x87\x2b\x74\xe5\xa5\xb3\x4f\xfb\x83\x02\x00\xb0\xdd\x86\xed\xc3\
-\xfa\xc7\xef\x6c\xd6\xde\x19\xf2\x33\x9d\x4a\xe8\xc3\xef\x58\xa9\
-\x57\x5f\x76\xea\x0f\x5a\x4f\x39\xdc\x37\x6d\x1f\xd6\xdf\xdd\xbe\
-\x51\x07\x07\x27\xa7\xad\xd2\x9a\xd5\x91\xd4\x6d\xef\x5f\xa3\xd5\
-\x4b\x3b\xd5\x40\x1b\x06\x00\x66\x74\xe0\x70\x56\x5f\xf8\xc6\x46\
-\x6d\xdf\x3d\xaa\x72\xcd\xce\xb7\x8d\x0d\xae\x3e\xf2\xae\x55\xba\
-\xea\xe5\xa7\x16\xf0\xa7\x14\xee\x3b\xf6\x8c\xe9\x0b\x5f\xdf\xa0\
-\xbd\x07\x27\xcc\xb0\x7e\xf8\x54\xc0\xd3\xbc\xd9\x19\xdd\xfa\xbe\
-\x35\x5a\xb6\xb0\xbd\xee\xb6\xc0\x04\x80\x7a\x73\x74\x24\xaf\x2f\
-\x7c\x7d\x83\x36\xee\x38\xa6\x52\x29\x32\x4e\x23\x4f\xa9\x64\x83\
-\xfe\xe4\xbf\x5e\xa0\xb5\x17\xf7\x9e\xf4\x2a\xfd\x93\x0e\xf7\x81\
-\x83\x59\x7d\xee\x6b\xeb\xb4\x7b\xdf\xc4\xb4\x19\xf6\xc5\xfd\xad\
-\xba\xf5\x7d\x6b\x74\xde\xfc\x96\x33\xbe\xb4\x16\x00\x5e\x2a\xc6\
-\xb3\x45\x7d\xe9\xf6\x8d\x7a\x62\xe3\x90\x59\xf8\x14\x91\x49\x37\
-\xe8\xd6\xf7\xae\xd1\xa5\xab\xbb\x4f\xaa\x07\x7f\x52\xe1\x7e\x68\
-\x68\x52\x9f\xfd\xea\x7a\xed\xd8\x3d\xea\xcf\x6b\x06\x73\xec\x9e\
-\x56\x2f\xeb\xd2\xad\xef\x5f\xa3\xbe\xee\xe6\xda\xaf\x01\x00\x5e\
-\x40\x3e\x5f\xd6\x97\xbf\xb3\x49\x8f\x3c\x79\x58\x39\xff\x54\xb9\
-\x20\x5f\x3b\xda\x92\xba\xed\x03\x6b\x74\xe1\xf2\xae\x13\x9e\x38\
-\x3c\xb1\x4f\xf9\x0b\x94\xfe\xf9\x7b\xdb\xb4\x6b\xef\x98\x2a\x9e\
-\x79\xac\x1b\x2c\x50\x3a\xbf\xbf\x4d\x1f\xb9\x65\x95\x66\xcf\x22\
-\xd8\x01\xe0\x54\x24\x93\x09\xfd\xb7\x3f\xba\x40\x97\x5c\xd0\xad\
-\xa6\x06\x37\xb2\x00\xd4\xd1\xc8\x58\x41\xdf\xf9\xf1\xb3\x3a\x72\
-\x2c\x57\xfb\xb5\xe3\x3a\xe1\x70\xff\xd1\xcf\xf6\x68\xe3\x8e\x61\
-\x15\x4b\x66\x8e\x3d\x58\x71\x3a\xa7\x37\xad\x4f\xbc\x77\xb5\xfa\
-\xe7\x64\x58\x98\x04\x00\x2f\x42\x3a\x95\xd0\xc7\xdf\xb3\x5a\x17\
-\x2c\xed\x50\xc2\x75\xc2\x9c\x95\x23\x6d\xd9\x35\xac\x1f\xde\xfb\
-\x9c\x86\x47\xf3\xb5\x5f\x9b\xd1\x09\x85\xfb\x33\x5b\x8e\xea\xee\
-\x07\xf7\x6a\x6c\xdc\xec\x76\xe6\xc8\x0c\xdc\x77\xb5\x27\x75\xeb\
-\xfb\xd6\x68\xe1\xfc\x56\x7a\xec\x00\x70\x1a\xb4\x65\x1a\xf5\x89\
-\xf7\xae\xd1\xd2\x85\x6d\x72\x1d\xc7\xcf\x5b\x93\xbb\xff\xf1\x8b\
-\x7d\x7a\x7a\xf3\x31\xe5\x0b\xe5\xda\xaf\x4d\xf3\x82\xe1\x7e\x74\
-\x24\xaf\xdb\x7f\xb0\x43\x43\xc3\x39\x79\xf2\xfc\x41\x7b\x4f\xc9\
-\xa6\x84\x3e\xfa\xee\x0b\xb4\x74\x61\x1b\x53\x31\x00\x70\x1a\x75\
-\x77\xa5\xf4\x91\x77\xad\x52\x5f\x77\xb3\xc9\x5d\xc7\xe4\xae\xe7\
-\x49\xdf\xf8\xfe\x36\x33\xd0\x52\x79\xfe\xc7\xa5\x2f\x18\xee\x3f\
-\xbe\x7f\x8f\xf6\x1d\xce\xfa\x33\x98\x8e\xcc\x1a\x54\x47\xb7\xbc\
-\x65\x89\x2e\x5c\xd6\x75\x52\x4f\x6f\x01\x00\x27\x66\xf1\x82\x36\
-\xbd\xed\xf7\x17\xa9\xab\x3d\xe5\xef\x0f\x6f\xf2\x77\x68\x24\xaf\
-\x3b\x1f\xd8\xa3\xe1\xb1\x42\xed\x57\x62\x9e\x37\x99\xb7\x3f\x37\
-\xaa\x5f\x3f\x79\x58\x13\xd9\xa2\xff\x8e\x59\x41\x75\xc5\xcb\x7a\
-\x75\xf5\xcb\xe7\x28\x93\x66\x57\x47\x00\x38\x53\x5e\xff\xea\xf9\
-\xba\xfc\xa2\x1e\xff\x50\x0f\x93\xbf\xf2\x3c\x3d\xf4\xd8\x21\x6d\
-\x7f\xee\xf8\x5b\x09\xeb\xf9\xc2\xbd\x54\xae\xe8\xff\xdd\xbd\xcb\
-\x3c\x9d\xf5\x07\xea\x25\x47\xb3\xbb\x9b\xf5\xfe\x9b\x97\xa9\xa7\
-\x2b\x55\xfb\x15\x00\xc0\x69\xf6\xc1\xb7\x2d\xd7\x92\xf3\xda\x94\
-\x48\xb8\x66\x37\x00\xc7\x51\xc5\xab\xe8\x7b\xf7\xec\xd2\xd0\xc8\
-\xf1\xa7\x67\x8e\x1b\xee\x3f\xff\xcd\x41\x6d\x7b\xce\x3f\x1a\xcf\
-\xf3\x5b\x32\x9e\xa7\xf7\xdf\xbc\x4c\xbd\x8c\x3c\x02\xc0\x59\x91\
-\x49\x37\xe8\x96\xb7\x2c\x55\x77\x47\xd2\xbc\xe1\xe7\xf1\x96\x5d\
-\x23\x7a\xf8\xf1\x43\x9a\x98\x0c\x3a\x2b\x71\x33\x86\x7b\xa1\x58\
-\xd1\xbd\xbf\xd8\xa7\xd1\xf1\x62\x64\x67\x79\xe9\xd5\x97\xf6\x69\
-\xc5\xe2\x0e\xfa\xec\x00\x70\x16\x5d\xb8\xbc\x53\x97\xad\xf6\xdb\
-\x33\x7e\x1e\x3b\x8e\xa3\xbb\x1f\xdc\xab\xa3\x23\xf9\x69\xfb\x7b\
-\xe9\x78\xe1\xfe\xf0\x13\x87\x74\xf8\xe8\x94\xca\xe5\x8a\xe4\xef\
-\x33\xdc\x9c\x4a\xe8\x2d\xd7\x9f\xa7\xae\xe0\xa7\x07\x00\xe0\xac\
-\x79\xc7\x9b\xcf\x57\x77\x57\x2a\xb6\xce\x68\xf0\x68\x4e\x8f\x3d\
-\x73\x44\xd9\x19\xaa\xf7\x69\xe1\x5e\x28\x56\x74\xdf\xc3\xfb\x35\
-\x3c\x96\x0f\xe7\xd9\x1d\x39\xba\xfe\xd5\xf3\x34\x7f\x76\xc6\x0c\
-\xd6\x03\x00\xce\xaa\xee\xce\x94\xae\x7b\xe5\x3c\xb5\xb7\x24\xab\
-\xdb\x03\x7b\x9e\xee\x7f\x64\xbf\x46\xc6\x4e\x20\xdc\x1f\x7d\x66\
-\x50\xfb\x0e\x65\x55\xa9\x98\xb9\x4a\x47\x8e\x92\x4d\xae\xae\x59\
-\x3b\x57\x6d\xad\x8d\xb5\x1f\x07\x00\x9c\x25\xd7\x5f\x35\x4f\x1d\
-\x6d\x8d\xe6\xe4\x26\x3f\x9f\xf7\xec\x9f\xd0\x6f\xd7\x1f\x51\x76\
-\xaa\x14\xfb\x6c\x2c\xdc\x2b\x15\x4f\x0f\x3c\x72\xc0\x5f\x89\x5a\
-\x9d\x6b\xbf\xf6\x95\x73\x35\x7b\x56\x8a\x55\xa8\x00\x70\x0e\x75\
-\xb4\x36\xe9\xea\xcb\xfb\xd4\x92\x6e\x08\xf3\xd9\x91\xa3\xfb\x1e\
-\xde\xa7\x91\x9a\xb9\xf7\x58\xb8\xef\xdc\x33\xa6\x81\x03\x59\x15\
-\x8a\xe5\x70\x9e\xb2\xa9\xd1\xd5\x6b\xaf\x9c\xcb\x31\x79\x00\x50\
-\x07\xde\x70\x75\xbf\xba\xda\x93\x52\xa4\x35\xb3\x7b\xff\x84\xf6\
-\x1f\x9e\x54\xa9\x54\x9d\x7b\x8f\x85\xfb\x23\x4f\x0f\x6a\x3c\x5b\
-\x30\x0f\x51\xcd\xe3\x58\xbd\xe2\xa2\x5e\xcd\x9e\xd5\x7c\x5a\x4e\
-\xe3\x06\x00\xbc\x38\xb3\x3a\x92\xba\x78\xd5\x2c\xa5\xd3\x8d\x61\
-\x4e\x7b\x9e\xa7\x47\x9f\x3e\xac\xf1\x70\xc1\x69\x24\xdc\xf3\x85\
-\x8a\x9e\xdc\x38\xa4\x89\xc9\x52\x38\x47\x29\xcf\xd3\x15\x17\xf7\
-\xaa\x25\x4d\xaf\x1d\x00\xea\xc5\xda\x8b\x7b\xd4\xea\xb7\x66\x82\
-\xbc\x7e\xf4\x99\x23\x1a\x9b\x29\xdc\x9f\xda\x34\xa4\x63\x23\x79\
-\x79\x95\x60\xae\xdd\x53\x77\x67\x4a\xcb\x16\xb5\x9f\xd2\xf9\x7d\
-\x00\x80\x33\xe3\xd2\x0b\xba\xd5\xd5\x91\x34\x01\xee\xe7\xf5\xd0\
-\x70\x4e\x9b\x77\x8e\x68\x2a\x6f\x76\x8c\x0c\xc3\x7d\xd3\x8e\x11\
-\x4d\xe6\xca\x61\x89\x2f\xc7\xec\x21\xd3\x9a\x61\xff\x18\x00\xa8\
-\x37\x97\x5f\xd8\xa3\x96\x96\xc6\x30\xaf\x3d\x49\xeb\xb6\x1c\xd3\
-\xe4\xa4\x99\x9a\x71\xe5\xaf\x66\xdd\xb4\x63\x58\x53\xb9\xb2\xdf\
-\xa4\x37\x03\xf2\xaf\xb8\xa8\x47\xad\x19\x5a\x32\x00\x50\x6f\xd6\
-\x5e\xdc\xa3\x96\x74\x43\x6c\x3d\xd2\xf6\xe7\xc6\x34\x95\x8f\x84\
-\xfb\xbe\xc3\x59\x8d\x4e\x14\x54\xae\x54\xfc\xf1\x1a\x69\x6e\x6f\
-\x46\x73\x67\xa7\xd5\x70\x82\xe7\xf5\x01\x00\xce\x9e\xc5\x0b\xda\
-\xd4\xd1\x96\x94\xe3\x9a\xad\x08\x3c\x79\xda\x3f\x98\xd5\xf0\x58\
-\x41\x95\x8a\x67\xc2\x7d\xfb\x73\x63\xa6\x25\xe3\x1f\xc4\xe1\xc8\
-\xd1\xe2\xfe\x56\x25\x9b\xe8\xb5\x03\x40\xbd\x5a\xbc\xa0\x55\xcd\
-\x4d\x0d\xfe\xba\x24\xb3\x56\x69\xc7\xee\x31\x4d\xe5\xcb\x26\xdc\
-\x77\xec\x1e\x55\x3e\x57\x36\x9b\xd1\xf8\x25\xfe\xe2\x05\xad\x3c\
-\x48\x05\x80\x3a\xb6\x64\x41\x9b\x92\x4d\xae\xbf\x2e\xc9\xe4\xf7\
-\xf6\xe7\x46\x95\xcb\xf9\xe1\x7e\x70\x70\x52\xf9\xa2\xff\x30\xd5\
-\x7c\x42\x8b\xcf\x6b\x23\xdc\x01\xa0\x8e\x2d\x5e\xd0\xaa\x54\x2a\
-\x51\x9d\x77\x97\xa7\xbd\x07\xb3\xca\x17\xcb\x72\x83\x9d\xc5\x4a\
-\x25\x2f\x32\xdf\x2e\xf5\x76\xa5\xd4\x48\xbf\x1d\x00\xea\xd6\xbc\
-\xbe\x8c\x9a\x1a\x83\xca\xdd\xe4\xf7\xa1\x23\x53\x2a\x16\x2b\x72\
-\xc7\xb3\x25\x15\xcb\x5e\xd8\xb3\x91\xe7\x69\xee\xec\x8c\x9a\x9a\
-\x08\x76\x00\xa8\x67\x99\xe6\x06\xb5\x64\x1a\xcd\x61\x79\x32\xf9\
-\x3d\x96\x2d\xaa\x50\xac\xc8\x1d\x9b\x28\x98\xfd\x08\xfc\x39\x49\
-\x39\x8e\x7a\x3a\x93\x6a\x48\x10\xee\x00\x50\xef\x7a\x3a\x53\x6a\
-\x6c\xac\x1e\xc1\xe7\x79\x9e\x0a\xa5\x8a\xdc\xec\x64\xd1\xac\x4a\
-\xf5\xe7\xdb\xe5\x79\xea\xa1\x25\x03\x00\x56\xe8\xe9\x6a\x56\x63\
-\xc2\x0d\xf3\xdb\x91\x54\x2a\x56\xe4\xe6\x0a\x15\x95\xc3\xed\x7d\
-\x25\xc9\x51\x5b\x4b\x93\x12\x09\x36\x0a\x03\x80\x7a\xd7\xd6\xd2\
-\x58\x3d\x3c\xdb\xcf\xf1\x52\xa5\x22\xb7\x50\xa8\xc8\x0b\x0f\xe6\
-\x30\xd7\x54\x2a\xc1\x2e\x90\x00\x60\x81\x54\x32\x21\xc7\xa9\xe6\
-\x77\x30\x16\xe9\x16\x4b\x15\x55\xc2\x7d\x81\xcd\x9c\x64\xb2\x29\
-\x21\xb2\x1d\x00\xea\x5f\x32\xe9\xca\x75\xdd\x30\xbf\x3d\xcf\x53\
-\xb9\xec\xc9\xad\x54\x4c\x31\x6f\x36\x9f\xf1\x2b\xf7\x64\x42\x0e\
-\xe9\x0e\x00\x75\x2f\xd5\xd8\x60\xfa\xed\x7e\x7e\xcb\x91\xca\x9e\
-\xe4\x96\xca\x9e\xbc\x8a\xd9\x9b\xc0\x6f\xda\x28\xd9\xe8\x72\xa4\
-\x1e\x00\x58\x20\x95\x74\xcd\x33\x52\x3f\xbf\xe5\x99\x07\xab\x6e\
-\xb9\xe2\xc9\x73\xfc\xca\xdd\xbf\xd1\x90\x70\xab\x73\x93\x00\x80\
-\xba\xd5\x18\x5d\x93\xe4\xaf\x43\x0d\x37\x0e\x33\x6f\xf8\x69\xee\
-\x38\x32\x35\x3e\x00\xc0\x0a\x91\xfc\x36\x75\xba\x13\x39\x43\x35\
-\xb2\x42\x35\x2c\xef\x01\x00\xf5\x2f\x92\xdf\x26\xe6\x83\xca\x5d\
-\x8a\xcc\xb9\x03\x00\xec\x52\xcd\xef\x60\xde\x3d\x98\x7c\x97\xc2\
-\x39\x77\x00\x80\x5d\xaa\xf9\x5d\xad\xdc\x23\x89\x1e\xcc\x49\x02\
-\x00\x2c\x51\x93\xdf\xd5\x9e\xbb\x1f\xf5\xd5\xdd\x7e\xa9\xdd\x01\
-\xc0\x1a\xb5\xf9\xed\x28\xd2\x73\xf7\xe2\x73\xee\x00\x00\x4b\xd4\
-\xe6\x77\x58\xb9\x9b\x6b\x6c\xce\x1d\x00\x60\x89\xda\xfc\xae\xad\
-\xdc\xc3\x56\x3b\x2d\x77\x00\xb0\x47\x6d\x7e\xfb\x39\x1f\x99\x73\
-\xaf\xb9\x02\x00\xec\x30\x43\x7e\xbb\xd5\xd7\xcc\xb9\x03\x80\x9d\
-\x66\x98\x73\xaf\x06\x7a\x75\x4e\x92\x90\x07\x00\x9b\xcc\x30\xe7\
-\xee\xf7\xde\xcd\x4b\x7f\x8a\x86\xb6\x3b\x00\xd8\x25\xc8\xef\xe0\
-\xd9\xaa\xa9\xdc\xfd\x39\xc9\x60\x9a\x86\xca\x1d\x00\xec\x11\xcd\
-\xef\xe0\x1a\x56\xee\x4e\x10\xf0\x54\xee\x00\x60\x95\x68\x7e\x07\
-\xd7\x58\xe5\x2e\xff\x06\x95\x3b\x00\xd8\x23\x9a\xdf\xaa\xad\xdc\
-\x63\x73\x92\x00\x00\x7b\x44\xf3\x3b\x56\xb9\x2b\xd2\x68\xa7\x6c\
-\x07\x00\xbb\xd4\xe4\xb7\x17\x5b\xc4\x24\xb1\x69\x18\x00\x58\x2a\
-\x9a\xdf\x8e\x14\xdd\xcf\x5d\x6c\xf7\x0b\x00\x96\x8a\xe6\xb7\xa9\
-\xdc\x23\x9b\xce\x04\x4d\x79\x00\x80\x5d\x62\x0f\x55\x3d\xbf\x72\
-\x77\xfc\x43\x55\x99\x73\x07\x00\xfb\xd4\xce\xb9\xcb\x09\x2b\xf7\
-\x60\x4e\xd2\x2c\x61\xa5\x39\x03\x00\xf6\x88\xe6\x77\x4d\xe5\x1e\
-\x94\xf4\xa6\x82\xa7\x72\x07\x00\x7b\x44\xf3\x3b\xa8\xd0\xcd\xae\
-\x90\x9e\x67\x4a\x79\x99\xab\x43\xba\x03\x80\x35\xa2\xf9\x1d\x54\
-\xe8\xfe\x28\x64\xf5\x50\x55\xcf\x93\x3c\xfa\x32\x00\x60\x8d\x58\
-\xe5\xee\x37\xd6\x67\x9e\x73\xa7\x72\x07\x00\xab\xd4\xae\x53\x72\
-\xa3\xf3\x31\xe1\x9c\x24\x95\x3b\x00\x58\xa5\x76\x9d\x92\x5b\x2d\
-\xe5\xab\xf3\xee\x54\xee\x00\x60\x89\x9a\xfc\xf6\x3c\x4f\x5e\xd0\
-\x73\xaf\xce\xb9\x53\xb2\x03\x80\x55\x82\x86\x8b\x9f\xdf\x8e\xe3\
-\xc8\xa9\x4e\xcb\x54\xe7\x24\x01\x00\x16\x39\x5e\xe5\xee\xc9\x93\
-\xe3\x98\x17\xd1\x16\x0d\x00\xc0\x02\x61\xc3\xa5\xda\x81\x71\x1c\
-\xc9\x75\xc2\x37\x54\x9d\x93\x04\x00\xd8\x21\x2c\xc8\x4d\x7e\x47\
-\x2a\x77\x4d\x9b\x73\x07\x00\x58\x24\x96\xdf\xfe\x9c\xbb\xb9\x04\
-\x89\x4e\xb2\x03\x80\x9d\xe2\x39\xee\xc6\x07\xdf\x1d\x02\x1e\x00\
-\xac\x14\xe4\x77\x58\xb9\xd7\xce\xb9\xd3\x74\x07\x00\xdb\x04\xf9\
-\x1d\x4c\xcd\xf8\xd3\x32\x66\x1e\x92\x39\x77\x00\xb0\x51\x35\xbf\
-\x83\x6b\x75\x85\xaa\x53\x4d\x7c\x00\x80\x4d\xaa\xf9\x1d\x56\xee\
-\xa6\x62\x8f\xee\x2a\x46\xc0\x03\x80\x4d\x4c\x6a\x9b\xfc\xae\x56\
-\xee\x91\x23\xf6\xa2\xa5\x3d\x00\xa0\xfe\x55\xcb\x71\x93\xdf\xb1\
-\xca\x5d\x33\x34\xe3\x01\x00\xf5\xaf\x3a\xce\x1e\xe4\x77\xa4\xe7\
-\x6e\x3e\x10\x1f\xa3\x01\x00\xd4\xbf\xa0\x25\x53\xcd\xef\xa0\x72\
-\xf7\x7f\x11\xff\x00\x00\xc0\x2e\xf1\x02\x3d\xb6\x9f\xbb\x3f\x36\
-\x13\xfb\x38\x00\xc0\x02\x41\x7e\x87\x3d\xf7\xe8\xa1\xaa\xe6\x17\
-\xb5\x5f\x01\x00\xd4\xb3\x68\x7e\x1f\x7f\xce\x9d\xca\x1d\x00\xac\
-\x12\xc9\xef\xea\xb4\x4c\x58\xb9\x9b\x87\xaa\x9e\xe7\x51\xbc\x03\
-\x80\x4d\x22\xf9\x3d\xc3\x0a\x55\xc9\x6c\x45\xe0\x50\xbc\x03\x80\
-\x4d\x22\xf9\x1d\xab\xdc\xa5\x9a\x39\x77\x2a\x77\x00\xb0\x46\xbc\
-\x25\x13\xa9\xdc\x25\x53\xd2\x4b\x9e\x7f\x05\x00\xd8\x22\x9e\xdf\
-\xb5\x95\x7b\xcd\x15\x00\x60\x87\x78\x7e\xd7\x54\xee\x7e\xd3\xc6\
-\x94\xf6\x0c\x44\x02\x80\x1d\xfc\xdc\xae\x5e\x6b\x2a\xf7\xe8\x9c\
-\xa4\xc3\x40\x24\x00\xd8\xc1\x89\xe7\x77\x6c\xce\xdd\x7c\x20\x32\
-\x27\x49\xe5\x0e\x00\x76\xf0\x6a\xf2\x7b\xa6\xca\xdd\xfc\x00\xa0\
-\x72\x07\x00\x6b\xf8\x95\x7b\x98\xdf\xb1\x39\x77\xf9\xc9\x2f\x73\
-\x44\x13\x95\x3b\x00\x58\x22\xa8\xdc\x83\xfc\x8e\xad\x50\xf5\x82\
-\x8a\xbd\x7a\x03\x00\x60\x87\x68\x7e\x07\x5d\x17\x57\x92\x3c\x27\
-\xa8\xd8\x99\x73\x07\x00\xdb\x44\xf3\x3b\x28\xcf\x5d\xc9\x94\xf5\
-\x41\xc5\xce\x9c\x3b\x00\xd8\x25\x9e\xdf\xb5\xd3\x32\xfe\x9c\xa4\
-\x13\xcc\x4b\x92\xf1\x00\x60\x89\x68\x7e\x47\x7a\xee\x86\xe7\xdf\
-\x37\x57\xba\x33\x00\x60\x8b\x9a\xfc\x0e\xdb\x32\x92\x3f\x1f\x69\
-\xae\x54\xee\x00\x60\x93\x9a\xfc\x8e\x85\x7b\xf0\x94\x95\x69\x19\
-\x00\xb0\x4b\x34\xbf\xab\x95\x7b\x7c\xce\x9d\xa3\xf6\x00\xc0\x32\
-\x91\xfc\x0e\xea\x73\x33\xe7\x1e\xce\x49\x06\x4f\x5d\x69\xb8\x03\
-\x80\x2d\xa2\xf9\x1d\x9f\x73\x0f\xe7\x24\xfd\xa7\xad\x00\x00\x2b\
-\xd4\xe6\x77\xd0\x77\x71\xe5\xd7\xe9\xcc\xb9\x03\x80\x7d\x6a\xf3\
-\x3b\x5e\xb9\x47\xe6\xdb\xa3\x27\x79\x00\x00\xea\x5b\xd8\x71\x09\
-\x0f\xc9\x36\xef\x9b\x69\x99\xc8\x7c\x64\x74\x85\x13\x00\xa0\xbe\
-\x99\x72\x3c\x3e\xe7\xee\x45\xb7\x1f\x08\xdf\x01\x00\x58\xc3\xc4\
-\x76\x24\xbf\xfd\x69\xc8\xb0\x72\x0f\x6b\x79\x02\x1e\x00\xec\x12\
-\xcd\xef\x69\x95\x3b\x73\xee\x00\x60\xa7\x9a\x39\xf7\x6a\xe5\x2e\
-\x93\xfc\x8e\x7f\xa5\xe7\x0e\x00\x16\x89\xe4\x77\x50\x9e\x57\xc3\
-\x3d\x48\x7e\x00\x80\x5d\x22\xf9\x1d\x5c\xdd\xb0\x55\x13\xce\x49\
-\xd2\x94\x01\x00\x9b\x44\xf3\xdb\x54\xf0\x92\x1b\xb4\xd8\x83\x46\
-\x8c\x13\x5b\xe3\x04\x00\xa8\x6b\x35\xf9\x1d\xce\xb9\x7b\x9e\x39\
-\x66\xaf\x5a\xd2\x47\xd7\x38\x01\x00\xea\x5a\x4d\x7e\x07\xf1\xed\
-\x06\xdd\xf7\xf0\x04\x26\xff\x23\x00\x00\x0b\xd4\xe6\x77\x50\xb9\
-\x07\x4d\x9a\xa0\x67\x63\x6e\x50\xb9\x03\x80\x15\x6a\xf3\x3b\xac\
-\xdc\x6b\xde\x08\xbb\xf1\x00\x80\xfa\x57\x93\xdf\xf1\xbd\x65\x82\
-\x0f\x84\x57\x2a\x77\x00\xb0\x46\x24\xbf\x83\xf4\x8e\xcc\xb9\x47\
-\xeb\x75\x2a\x77\x00\xb0\xc6\xf4\x96\x7b\xbc\x72\x0f\x56\x36\x51\
-\xb9\x03\x80\x45\x22\xf9\x1d\xaf\xdc\xa7\xf5\xe2\xa9\xdc\x01\xc0\
-\x26\x41\x7e\x7b\x9e\x79\x11\xd9\xcf\x9d\xca\x1d\x00\x6c\x14\xcb\
-\x6f\xc7\xfc\x13\x56\xee\x26\xf1\x83\xe5\x4b\x54\xee\x00\x60\x8b\
-\x58\x7e\xcf\x54\xb9\x07\xdb\x45\x52\xb9\x03\x80\x3d\x62\xf9\x5d\
-\x5b\xb9\x87\xd7\x30\xfa\x01\x00\xd6\x88\xf6\x66\xc2\xca\x3d\xb8\
-\x11\x5e\xa9\xdc\x01\xc0\x1a\xb1\xfc\x36\x6a\xe6\xdc\x67\xf8\x04\
-\x00\xa0\xbe\xc5\xf2\xdb\xa8\x99\x73\x0f\x36\xfb\xa5\x72\x07\x00\
-\x6b\xc4\xf2\xdb\x70\xa5\xe9\x1b\xbd\x87\x9b\xd0\x00\x00\xac\x50\
-\x6d\xb9\x9b\x1a\xde\x95\x24\xc7\x3f\xa2\x29\xe8\xc5\x3b\x0e\x95\
-\x3b\x00\xd8\x24\xcc\x6f\xb3\x01\x70\x50\xb9\x57\x2b\x76\x2a\x77\
-\x00\xb0\x47\xf8\xa4\x34\xcc\x6f\xf3\x9e\x39\x43\xb5\x66\xce\x9d\
-\xca\x1d\x00\xec\x10\xa6\x75\x74\xce\x5d\xe1\x19\xaa\xc1\xca\x26\
-\x4f\x4e\x74\xe3\x77\x00\x40\x5d\x0b\xd3\xda\xcf\xef\x60\x43\x77\
-\x53\xb9\x87\x87\xaa\xb2\x42\x15\x00\x6c\x62\x0a\x73\xf3\xab\x68\
-\x7e\x33\xe7\x0e\x00\x16\xf3\x24\x79\x27\x32\xe7\x6e\x50\xb9\x03\
-\x80\x35\x62\xf9\x6d\x98\x69\x19\x3f\xf1\xa9\xdc\x01\xc0\x4e\xb5\
-\x39\x6e\xe6\xdc\xfd\x95\x4d\x54\xee\x00\x60\xa7\x20\xbf\x83\x6b\
-\xb8\x42\xd5\x3c\x64\xa5\x72\x07\x00\x1b\x85\x3b\x0d\x04\xd3\x32\
-\x52\x75\x85\xaa\x99\x93\x34\x35\x3c\x00\xc0\x22\x7e\x7e\x07\xeb\
-\x94\x62\x95\xbb\x99\x93\x74\xa8\xdc\x01\xc0\x36\x7e\x7e\xc7\x2a\
-\xf7\xe9\x73\xee\x00\x00\xbb\xcc\x38\xe7\xee\xaf\x6c\x32\xf3\x34\
-\x00\x00\xeb\x04\xf9\x7d\x9c\xca\x3d\xb6\x39\x01\x00\xa0\xfe\xcd\
-\x90\xdf\xb1\x39\x77\xf3\x09\x7a\xee\x00\x60\x1f\x93\xdf\xd3\xe6\
-\xdc\xab\xc1\x0e\x00\xb0\x4b\x35\xbf\xa7\xcd\xb9\x9b\xd6\x0c\x15\
-\x3b\x00\xd8\xa7\x9a\xdf\xd3\xe6\xdc\x83\xab\xe7\xf9\x3b\xbd\x03\
-\x00\xac\x11\xe4\xf7\xb4\x39\xf7\xe0\xea\x38\x0e\xdd\x19\x00\xb0\
-\x4c\x90\xdf\xf1\x39\xf7\xe0\x0d\x2a\x77\x00\xb0\x8e\xa7\x48\x7e\
-\xc7\xe6\xdc\x83\x8a\xdd\x0f\x78\x2a\x77\x00\xb0\x87\x13\x8c\x41\
-\x46\x76\x18\x98\x76\x12\x93\xa8\xdc\x01\xc0\x2a\x26\xb2\x6b\xe6\
-\xdc\xc3\x95\xa9\xe1\x47\x28\xdb\x01\xc0\x3e\x41\x7e\xd7\x54\xee\
-\xb5\x37\x00\x00\xb6\x88\xe6\x77\x50\xb9\x47\x6e\x44\x9b\xf1\x00\
-\x00\x5b\x54\xf3\x3b\x9c\x96\x09\x7b\x35\x8a\xcc\xb9\x03\x00\xac\
-\x72\x62\x73\xee\x00\x00\xab\xcc\x38\xe7\x1e\x4d\x7c\x2a\x77\x00\
-\xb0\x4b\x34\xbf\xa7\x55\xee\xb5\x37\x00\x00\xf5\xcf\x3b\x4e\x81\
-\x1e\xd9\xcf\xbd\xda\x9a\x01\x00\xd8\xc1\xa9\x69\xad\x87\xd3\x32\
-\xe6\x76\xf5\x8d\x60\xbb\x48\x00\x40\xfd\x8b\x0d\xc5\x44\xe7\xdc\
-\xcd\xed\xea\x7c\x64\xf5\xe0\x0e\x00\x80\x1d\xa2\xf9\x3d\x43\xe5\
-\x1e\x2d\xe9\x01\x00\xb6\x88\xe6\xf7\x0c\x95\xbb\xd9\x73\x86\xca\
-\x1d\x00\xec\x12\xcd\x6f\xb3\x57\x58\xe4\x0c\x55\xf3\x86\x1c\x87\
-\x1d\x08\x00\xc0\x16\x9e\x62\xf9\xed\x79\x9e\x9c\x70\xce\xdd\x7f\
-\xca\x1a\x8e\xd1\xd0\x99\x01\x00\x3b\x38\xb5\xe3\xec\x26\xef\xfd\
-\xca\xbd\x76\x4e\xb2\xf6\xdb\x00\x80\xba\xe4\x4d\xcf\xef\x48\xe5\
-\x1e\x9f\x73\x67\x1d\x13\x00\x58\xc2\xaf\xdc\x15\xe4\xb7\x9c\x68\
-\xe5\x6e\xde\x50\x58\xc1\xc7\xbf\x0b\x00\xa8\x53\x9e\x29\xd0\x15\
-\xe4\x77\x38\x2d\xe3\x99\x9b\xc1\x1b\x41\x33\x1e\x00\x60\x87\x68\
-\x7e\x07\x5c\x39\xa6\xac\x37\x67\xf0\xc9\x3c\x75\xad\x7e\x07\x00\
-\x50\xe7\xa2\xf9\x1d\xf0\x2b\x77\xbf\x94\x77\x14\xcc\xd5\x00\x00\
-\x2c\x31\x53\x7e\xbb\x26\xf0\xbd\xea\x9c\x24\x4d\x19\x00\xb0\x4c\
-\x35\xbf\x3d\xbf\xd5\xee\x86\x63\xed\xc1\x94\x0c\x4f\x53\x01\xc0\
-\x2e\x91\xfc\x76\xfc\x56\xbb\xeb\x04\x85\x7c\x30\x25\xc3\x1c\x24\
-\x00\xd8\x25\x92\xdf\xd5\xca\xdd\x6f\xc4\x04\x53\x32\xd1\xa7\xad\
-\x00\x80\xfa\x17\xcd\xef\x69\x95\xbb\x99\x8f\x34\x57\x00\x80\x3d\
-\xa2\xf9\x1d\xab\xdc\x15\xa9\xd8\xa9\xdc\x01\xc0\x2e\x33\xe5\xb7\
-\xbf\xe5\x6f\x74\x4e\x12\x00\x60\x93\x99\xf2\x3b\x0c\xf7\xea\x9c\
-\x24\x00\xc0\x26\x33\xe5\xb7\x09\x77\x4f\xa6\x03\x1f\x5c\x01\x00\
-\x16\x89\xe4\xb7\x5f\xc1\x9b\x70\x0f\xe6\xdb\x99\x73\x07\x00\xfb\
-\x44\xf3\xdb\xaf\xcf\xcd\xae\x90\xe6\x31\xab\x7f\xad\xf9\x12\x00\
-\xa0\xbe\x45\xf3\x3b\x5a\xb9\x87\x2b\x9b\xfc\xa0\xa7\x76\x07\x00\
-\x8b\x44\xf2\x7b\x86\xca\xbd\x3a\xef\x4e\xf1\x0e\x00\x16\x89\xe4\
-\x77\x50\xa0\x47\xce\x50\x0d\xae\xc1\xce\xc0\x00\x00\x1b\x44\xf3\
-\xdb\xf1\x33\x3d\x7e\x86\xaa\xff\x26\x95\x3b\x00\xd8\x23\x9a\xdf\
-\x9e\xff\x4f\x75\xce\x3d\x58\xe1\x54\xed\xc7\x03\x00\x2c\x10\xcd\
-\xef\x40\x38\xe7\xee\x44\xae\x54\xee\x00\x60\x87\xf0\x19\x6a\xcd\
-\x79\x1d\xe1\x9c\xbb\x17\xb9\x52\xb9\x03\x80\x1d\x82\x56\x4c\x34\
-\xc7\x55\xbb\x42\x95\xf5\x4b\x00\x60\x17\x93\xdb\x91\xfc\xae\xad\
-\xdc\x83\x39\x49\xca\x76\x00\xb0\x48\x6d\x7e\x47\x2b\xf7\xe8\x9c\
-\x3b\x0d\x77\x00\xb0\x48\x4d\x7e\x07\x15\xfc\xb4\x39\x77\x2a\x77\
-\x00\xb0\x4b\x34\xbf\x83\xfa\x3c\x32\xe7\x4e\xae\x03\x80\x8d\xa2\
-\xf9\x1d\x5c\x63\x95\x7b\xf4\x06\x00\xc0\x0e\xd1\xfc\x8e\x57\xee\
-\x33\x94\xf4\x00\x00\x3b\x44\xf3\x3b\xd6\x73\x8f\x35\xe3\xa3\xdf\
-\x00\x00\xd4\xbd\x58\x7e\x47\xa7\x65\xc2\x8a\x9d\x41\x77\x00\xb0\
-\x4e\x2c\xbf\xa7\x55\xee\xd1\xa7\xaa\x64\x3c\x00\x58\x23\x96\xdf\
-\x33\xcd\xb9\xc7\xba\xf1\x00\x00\x3b\x44\xf2\x7b\xda\x9c\x7b\x58\
-\xad\x53\xb5\x03\x80\x5d\x22\xf9\x3d\x6d\xce\xdd\x34\xe3\x49\x76\
-\x00\xb0\x4e\x24\xbf\x83\x14\x8f\x55\xee\x8e\xcc\x86\xef\x00\x00\
-\x8b\x44\xf2\xbb\xa6\x72\x0f\x12\xdf\x3f\x64\x35\xfa\x25\x00\x40\
-\xdd\x0b\xf3\xdb\xf3\x24\x79\xfe\xb4\x4c\x58\xb1\xc7\x93\x1f\x00\
-\x60\x0b\x3f\xc7\x1d\x47\x92\x33\x7d\xce\x9d\xca\x1d\x00\x2c\x54\
-\xb3\x6d\xbb\x1b\x94\xea\x41\xe2\x7b\x9e\xe4\x90\xee\x00\x60\x17\
-\x3f\xbf\x83\xd6\x8b\xeb\x37\x69\xcc\x2b\x7f\x93\x19\x8f\xbe\x0c\
-\x00\xd8\x25\xd8\x24\x2c\xec\xb9\x9b\x92\xdd\x94\xee\xac\x50\x05\
-\x00\x3b\x85\xfb\xfe\x06\x3d\xf7\xa0\x4a\x77\x82\xa7\xac\x00\x00\
-\xdb\x54\xf3\x3b\x56\xb9\x07\x0f\x55\x99\x73\x07\x00\x1b\x55\xf3\
-\x3b\x56\xb9\x9b\xb7\x82\x39\x49\x00\x80\x5d\xaa\xeb\x94\x6a\x7a\
-\xee\x5e\x2c\xf9\x01\x00\xb6\x88\xe6\xb7\x13\x56\xee\x32\x4f\x57\
-\xcd\x43\x56\x2a\x77\x00\xb0\x4d\x34\xbf\xc3\x15\xaa\xa6\x70\xaf\
-\xae\x6c\xe2\x99\x2a\x00\xd8\x25\x9a\xdf\x4e\xb0\x42\xd5\xb4\xdc\
-\x83\x95\x4d\x9e\x59\xb9\x0a\x00\xb0\x83\x29\xd4\xc3\xfc\x8e\x55\
-\xee\x5e\xb8\xb2\x89\xca\x1d\x00\xac\x12\x8e\xb3\x57\x73\x5c\x9e\
-\x5f\xb9\x3b\xd1\x95\x4d\x54\xee\x00\x60\x8f\xa0\x20\x8f\xe5\x78\
-\x50\xb9\x2b\xb2\xb2\x89\xd2\x1d\x00\xec\x11\x16\xe4\xe1\x61\xd8\
-\xd5\xca\x3d\x3a\xe7\x4e\xe9\x0e\x00\x16\xf1\xeb\xf1\x20\xbf\xc3\
-\x39\x77\xf3\xbe\x09\x74\x33\x1f\x09\x00\xb0\x4d\x90\xdf\x66\xde\
-\x3d\x98\x73\x0f\x2a\x77\x5a\x32\x00\x60\xa5\x20\xbf\xcd\x4a\xd5\
-\x9a\x93\x98\x1c\x27\x28\xe9\x01\x00\xb6\x88\xe6\x77\xbc\x72\x8f\
-\xad\x50\xa5\x35\x03\x00\x36\x89\xe6\xb7\xb9\x06\x95\xbb\x63\xde\
-\x60\xce\x1d\x00\xec\x13\xcb\x6f\xa7\xb6\x72\x37\x4b\x9b\x18\x96\
-\x01\x00\xcb\xc4\xf2\xdb\xf3\xa7\x65\xfc\x3b\x7e\xc5\xce\x9c\x3b\
-\x00\xd8\x26\x9e\xdf\x8e\x14\xad\xdc\x4d\xc5\x6e\x4a\x7b\x00\x80\
-\x45\x62\xf9\x1d\x54\xee\xb5\x89\x4f\xe5\x0e\x00\x76\x89\xe5\x77\
-\x50\xb9\x3b\x91\x95\x4d\xe1\x0d\x00\x80\x3d\xaa\xf9\x1d\x39\x89\
-\x29\x18\x7f\x34\x0f\x55\x99\x73\x07\x00\xdb\x54\xf3\xbb\x7a\x12\
-\x53\x30\x06\x19\xce\x47\x52\xb9\x03\x80\x5d\xaa\xf9\xed\x79\x9e\
-\xe4\xf9\x3d\x77\xc7\x0f\xf8\xe0\x0a\x00\xb0\x47\x34\xbf\x1d\xc7\
-\x91\x1c\x7f\x5a\x66\xda\x0d\x00\x80\x35\xa6\x15\xe8\x9e\x27\x37\
-\x18\x9f\x09\x2a\x76\x2a\x77\x00\xb0\x4b\x2c\xbf\xab\x95\xbb\x19\
-\x9f\x09\x2a\x76\xb3\xd2\xa9\xe6\x9b\x00\x80\xba\x15\xcf\xef\xb0\
-\x72\x57\x7c\x8c\xc6\x63\x0b\x02\x00\xb0\x49\x2c\xbf\x63\x2b\x54\
-\x63\x27\x78\x50\xb9\x03\x80\x5d\x22\xf9\x1d\xcc\xb9\x27\x12\x8e\
-\x5f\xd2\x9b\x6d\x7f\x25\x4f\xa5\x8a\xc7\x42\x55\x00\xb0\x40\xa9\
-\xec\x99\x87\xa9\x52\x58\xa8\xcb\x71\x4c\xb8\x57\x57\xa8\x4a\x92\
-\xa3\x5c\xbe\xac\x0a\xe9\x0e\x00\x75\xcf\xe4\x75\xb0\x73\x8c\x69\
-\xcd\x24\x5c\x47\x6e\xc2\x75\xe4\x06\x2b\x9b\xfc\x0a\x3e\x5f\x28\
-\xcb\xab\x10\xee\x00\x50\xef\x72\xb9\xb2\x2a\x95\x6a\x7e\x3b\x8e\
-\xe4\xba\x92\xdb\xd8\x64\x06\x66\xc2\x95\x4d\x72\x94\xcb\x55\x44\
-\xb6\x03\x40\xfd\xcb\xe5\xcb\xf2\x2a\xd1\x87\xaa\x52\x22\xe1\xca\
-\x4d\x35\xba\x4a\xb8\xf1\x39\xf7\x5c\xc1\xfc\x24\x00\x00\xd4\xb7\
-\x5c\xbe\xac\x72\xa5\x22\x45\x16\xa4\x3a\x8e\xe4\xa6\x52\x09\x7f\
-\xe6\xbd\x3a\x27\x39\x32\x5a\x50\xa9\x4c\xb8\x03\x40\xbd\x1b\x1e\
-\x2d\xa8\x5c\x36\xbf\x0e\x56\xa8\x36\x24\x1c\xb9\xad\x99\xc6\x69\
-\x95\xfb\xc1\xc1\x29\x15\x8b\xe6\x27\x01\x00\xa0\x7e\x1d\x18\xcc\
-\x29\x5f\x34\xe9\x1e\xe4\x78\x63\xa3\x2b\xb7\xbd\xad\x51\xd5\x71\
-\x48\x49\x72\x74\xe0\xf0\x94\x0a\x84\x3b\x00\xd4\xbd\xbd\x07\xb2\
-\x2a\x16\x82\x4e\x8b\xc9\xf1\x64\xa3\x2b\xb7\xad\xb5\x51\x4d\x8d\
-\x6e\x30\x47\x23\xc9\xd3\xc0\xfe\x49\xe5\x0b\x7e\x9d\x0f\x00\xa8\
-\x4b\x13\xd9\x92\xb2\x93\xd5\x9e\xbb\xe4\xa9\xa3\xad\x49\x4d\x4d\
-\x09\xb9\xae\xe3\xa8\xaf\xa7\x59\x8d\x8d\x09\xff\xa6\xd9\x9b\x60\
-\xff\xa1\x49\xaa\x77\x00\xa8\x63\xbb\x06\x26\x94\xcb\x95\xc2\x8a\
-\x5d\x72\x34\xb7\xaf\x59\x4d\x8d\xae\xd9\x7e\xa0\x7f\x6e\x5a\x4d\
-\x4d\xc1\x4d\xb3\xb7\xcc\xe6\xed\x63\x9a\x9c\x2a\x55\x7f\x17\x00\
-\x40\x5d\xd9\xb2\x63\x54\x53\xf9\xb2\xbf\x32\x55\x92\x3c\x9d\xdf\
-\xdf\xa2\x64\xd2\x0f\xf7\x95\x4b\xdb\x95\x4e\x35\x46\x56\x38\x49\
-\x5b\x76\x8e\x69\x2a\x47\x6b\x06\x00\xea\xd5\x96\x67\xc7\x34\x39\
-\x55\x8e\xed\x30\xb0\x6a\x69\xbb\xd2\xa9\x06\x13\xee\x17\x2c\xeb\
-\x50\x73\xb3\x2b\xb3\x5b\xa4\x59\xe1\xb4\x61\xdb\x88\xff\x25\x00\
-\x40\x3d\xda\xb6\x73\x54\x39\xbf\x72\x37\x33\x31\x9e\x56\x2f\x6f\
-\x57\xba\x39\x61\xc2\xfd\xbc\xf9\x69\x75\x77\x26\xe5\xba\x66\x6a\
-\xc6\xf3\xa4\xe1\x91\x82\x0e\x1d\x99\x52\xb1\x44\xdf\x1d\x00\xea\
-\xcd\xf6\x5d\x63\x1a\xcb\x96\xfc\x05\xa7\x26\xb7\x17\xce\xcf\xa8\
-\xb3\xc3\x64\xb9\x2b\x49\xae\xe3\x68\xe5\x92\x76\xa5\x53\x89\xd8\
-\xbc\xfb\xe3\xeb\x8e\x6a\x22\x4b\xdf\x1d\x00\xea\xcd\xe3\xeb\x8e\
-\x69\x7c\xa2\x64\x36\xf9\xf5\x77\x85\x5c\xb5\xac\x43\xe9\x66\x33\
-\x1c\xe3\xef\xe7\x2e\xad\xbd\xa4\x5b\x2d\x99\x46\x39\xfe\x53\x57\
-\xc7\x71\xf4\xe0\x23\x87\x35\x36\x5e\xac\xfe\x6e\x00\x80\xba\xf0\
-\xc0\xaf\x0e\x69\x6c\xbc\x68\xf6\xf4\x75\x1c\x79\x92\x2e\xbb\xb0\
-\x4b\x2d\xe9\x06\x29\x16\xee\x2f\xeb\x56\x77\x57\xd2\xef\xdb\x98\
-\x9f\x04\xcf\xee\x99\xd0\x8e\xdd\xe3\x2a\x14\x68\xcd\x00\x40\xbd\
-\x58\xb7\x79\x58\x07\x07\xa7\x54\x2a\x57\xf7\x94\xe9\x99\x95\xd4\
-\x25\xab\xbb\x94\x6e\xae\x09\xf7\x64\xd2\xd5\x2b\x2f\xeb\x51\x6b\
-\x4b\xa3\xff\x8e\x49\xf9\x87\x7e\x33\xa8\x51\xaa\x77\x00\xa8\x1b\
-\x0f\xfe\x66\x50\x63\xe3\xc5\xb0\xd3\x22\x39\xba\xe6\x8a\xd9\x6a\
-\x6f\x0b\xf2\x3b\x12\xee\x92\xf4\x9a\x57\xf6\xaa\xad\xd5\xa4\x7e\
-\x30\x37\x79\xff\xc3\x07\x75\xe4\x68\x2e\xec\xc5\x03\x00\xce\x9d\
-\xe1\xd1\x82\x1e\x7c\xe4\x90\xc6\x26\x8a\xfe\x41\x4b\x92\x23\x4f\
-\xaf\xb9\xb2\x4f\xed\xad\xc7\x09\xf7\x0b\x96\x75\x68\xd9\xa2\x36\
-\xb3\x1d\x81\xff\xf4\x35\x3b\x59\xd2\x3d\x3f\xdf\xaf\xe1\x51\xaa\
-\x77\x00\x38\xd7\xee\xbc\x77\x9f\x8e\x8d\x14\xa3\x3b\xc6\x68\xc5\
-\x92\x76\x2d\x98\x97\x51\x63\x43\x35\xd2\x63\xe1\x2e\x49\x37\x5e\
-\x3f\x5f\x5d\x1d\xc9\xea\xdc\xa4\x27\xdd\x79\xdf\x3e\x1d\x3a\x32\
-\x45\xf5\x0e\x00\xe7\xd0\xd8\x44\x51\x3f\x7d\xe8\x80\x46\xc6\x0a\
-\x61\x3e\xcb\x91\xde\x74\xdd\x3c\x75\xb5\x37\xc5\x3e\x3b\x2d\xdc\
-\xaf\x5e\xdb\xab\x85\xf3\xd3\x6a\x48\xf8\x2b\x9e\x1c\x47\xa3\xe3\
-\x45\xdd\xf7\x8b\x83\x1a\x19\xa3\x7a\x07\x80\x73\xe5\xae\x9f\xed\
-\xd3\xc1\x41\x53\x68\x07\xf9\xbc\xa8\xbf\x45\x57\x5d\xde\xab\x96\
-\x4c\xd0\x52\x37\xa6\x85\xbb\xeb\x3a\xba\xf1\xfa\x7e\x75\xb6\xfb\
-\x93\x33\xfe\x8a\xd5\x3b\xee\x1e\xd0\xc0\xbe\xac\xca\x9c\xd0\x04\
-\x00\x67\xdd\xe0\x50\x4e\x77\xde\xbb\x4f\x23\xa3\x05\x79\x9e\xc2\
-\x7c\xbe\xf1\xfa\xf9\x9a\xd5\x19\xaf\xda\x35\x53\xb8\x4b\xd2\x75\
-\x57\xcd\xd1\xfc\x39\x69\xb9\x8e\x13\x6c\x12\xa9\xf1\x6c\x49\xb7\
-\x7f\x7f\x97\x8e\x1c\xcd\xd7\x7e\x1c\x00\x70\x86\xfd\xe3\xb7\xb6\
-\x6b\xef\x81\xac\x2a\x5e\x70\xe2\x92\x34\x67\x76\xb3\xae\x5e\xdb\
-\xab\x96\x4c\xf5\x41\x6a\x60\xc6\x70\x4f\x36\xb9\xba\xf9\x8d\xfd\
-\xea\xea\x4c\x9a\x9f\x10\xfe\x1c\xe5\xfd\x0f\x1f\xd2\x6f\x9f\x1e\
-\x62\x43\x31\x00\x38\x8b\x7e\xfd\xc4\x90\x1e\x7d\x6a\x48\xd9\xa9\
-\x72\x98\xc7\x92\xf4\xf6\x37\x9d\xa7\xde\xee\x54\xb8\x3e\x29\x6a\
-\xc6\x70\x97\xa4\x37\x5e\x3b\x4f\x6b\x96\xb7\x2b\xd9\x98\x08\x7a\
-\xf6\x92\xa4\x2f\x7d\x63\x9b\x76\x0d\x4c\x70\x80\x36\x00\x9c\x05\
-\x23\x63\x05\x7d\xe5\xdb\xdb\x75\x78\x28\x27\x47\x66\x25\xaa\x23\
-\x69\xf5\xf2\x0e\x5d\x7f\xf5\x1c\xb5\x85\x6b\x93\xe2\x8e\x1b\xee\
-\xae\xeb\xe8\x03\xef\x58\xa2\xde\x9e\xa4\x14\x4e\xbd\x9b\xbe\xcf\
-\xdf\xff\xf3\x56\x1d\x1c\xcc\xc5\x3e\x0f\x00\x38\xfd\x3e\xff\xd5\
-\x2d\xda\xfa\xec\x98\xca\x65\xaf\x3a\xd7\xee\x3a\xfa\xd0\x1f\x2d\
-\xd1\xec\x9e\x54\xed\xc7\x43\xc7\x0d\x77\x49\xba\x70\x65\x87\x5e\
-\x77\xd5\x1c\xb5\xb6\xf8\x7b\xce\xf8\x09\xff\xe8\xd3\x43\xba\xeb\
-\x67\xfb\x58\xb9\x0a\x00\x67\xd0\x1d\xf7\x0c\xe8\xd7\x8f\x1f\x51\
-\x2e\x57\xa9\x56\xd8\x92\x6e\xb8\x66\xae\x56\x2f\x6b\xf7\xd7\x24\
-\xcd\xec\xf8\x77\x7c\xef\x7e\xeb\x22\x2d\xea\xcf\xc8\x35\xeb\x9a\
-\xc2\x7f\xc1\xbf\xfc\xdb\x4e\x3d\xb3\x69\x98\xa3\xf8\x00\xe0\x0c\
-\xd8\xba\x73\x4c\xb7\xdf\xb1\x4b\x43\xc7\xf2\xa6\x62\xf7\xf3\xb7\
-\x67\x56\x52\xb7\xdc\xb4\x48\xdd\x5d\xa6\xab\x72\x3c\x2f\x18\xee\
-\xb3\x3a\x93\xfa\xd8\x7b\x96\x9b\xf2\xdf\x6f\xf6\x78\x9e\x54\x28\
-\x56\xf4\xbf\xbf\xb4\x41\x9b\xb6\x8d\xa8\x5c\xa6\xff\x0e\x00\xa7\
-\xcb\xe1\xa1\x9c\xfe\xea\xff\x6e\xd0\xfe\x83\x93\xd1\x13\xf4\xe4\
-\xba\x8e\x6e\xfb\xd0\x4a\x2d\x5e\xd8\x22\xd7\x9d\xe1\x29\x6a\xc4\
-\x0b\x86\xbb\x24\xad\xbd\xb4\x5b\x37\xdd\xd0\xaf\x8e\xf6\x26\x29\
-\x9c\xaf\x94\x0e\x0d\xe5\xf4\x67\x7f\xbb\x5e\xdb\x77\x8d\xf1\x80\
-\x15\x00\x4e\x83\xd1\xf1\xa2\xfe\xf4\x73\xcf\x68\xf3\x8e\x51\x53\
-\x38\x47\x56\xa2\xde\xfc\xc6\x7e\xbd\xe2\x92\x6e\xa5\x92\x66\xcf\
-\xf6\xe7\x73\x42\xe1\x2e\x49\xef\xb9\x79\xb1\x2e\x5d\xd3\xa5\x64\
-\xd2\x0d\x57\x46\x79\x9e\x34\x70\x20\xab\xff\xf9\xc5\xf5\xda\x77\
-\x70\xb2\xf6\x2b\x00\x80\x93\x90\x9d\x2c\xe9\xcf\x3f\xbf\x4e\x4f\
-\x6f\x1a\x51\xb1\x68\x82\xdd\xe4\xad\xb4\x66\x45\x87\xde\x7d\xf3\
-\xf9\xea\xee\x7c\xfe\x76\x4c\xe0\x84\xc3\x3d\x99\x74\x75\xdb\x87\
-\x57\x6a\xe9\xa2\x36\x35\x24\xcc\xbf\xd1\x5f\x20\xa5\x2d\x3b\xc7\
-\xf4\x17\x5f\x5c\xaf\x7d\x87\x08\x78\x00\x38\x15\x53\xb9\xb2\xfe\
-\xea\x4b\x1b\xf4\x9b\xa7\x86\x54\xc8\x07\xf3\xec\xa6\x53\xd2\xd5\
-\x91\xd4\x6d\x1f\x5a\xa9\x79\x7d\xe9\xda\xaf\x1d\xd7\x09\x87\xbb\
-\x24\xf5\xcf\x49\xeb\xaf\x3f\x79\x91\x96\xf8\xfd\x1e\xbf\x80\x97\
-\xe7\x49\x4f\xae\x3f\xa6\x8f\x7d\xfa\x49\x6d\x7b\x96\x16\x0d\x00\
-\x9c\x8c\xd1\xf1\xa2\x6e\xfd\x3f\x4f\xe9\xfe\x5f\x1d\xd2\xd4\x54\
-\xd9\x54\xec\x7e\xbe\x66\xd2\x0d\xfa\xcc\xad\x6b\xb4\x66\x45\x87\
-\x29\xac\x4f\x90\xe3\x9d\xc2\x56\x8f\x1b\xb7\x8d\xe8\x4f\x3f\xb7\
-\x4e\xcf\x0d\x4c\x28\x9a\xe3\x8e\xa4\x05\xf3\x33\xfa\xdc\xff\xb8\
-\x58\xab\x97\xb7\x2b\x71\x12\xff\x21\x00\xf0\xbb\xe8\xc8\xd1\xbc\
-\x3e\xf5\x37\x4f\xeb\xa9\x0d\xc3\x2a\x94\xaa\xd3\x87\x8e\xdf\x31\
-\xf9\xeb\x4f\x5d\xac\x6b\xae\xe8\x3d\xa1\x3e\x7b\xd4\x49\x55\xee\
-\x81\xd5\xcb\x3b\xf4\x97\x1f\x5f\xa3\xf9\x73\x33\xe1\xb2\xd7\x60\
-\x49\xec\xc0\xbe\xac\x3e\xf6\xbf\x9e\xd0\xe3\xeb\x8e\xa9\x18\xf9\
-\x0f\x05\x00\xc4\xed\x3d\x90\xd5\x47\x3f\xfd\x84\x9e\x58\x7f\x4c\
-\x85\xa2\x69\xc5\xc8\xcf\xd3\xc6\x06\x57\x9f\xfe\xd8\x1a\x5d\xbd\
-\xf6\xe4\x83\x5d\xa7\x5a\xb9\x07\x9e\xda\x38\xac\xbf\xfc\xbb\xf5\
-\xda\x35\x90\x9d\xb6\xd7\x7b\x26\xdd\xa0\x4f\x7e\x78\xa5\x6e\xb8\
-\x66\xae\x32\xfe\x81\xad\x00\x00\xe3\x3f\x7f\x7d\x48\x5f\xfc\xda\
-\x56\x0d\xec\x9f\x54\xa5\x36\x3f\x9b\x13\xfa\xf3\x8f\x5e\xa0\xd7\
-\x5d\x35\x57\xe9\xe6\x93\x0f\x76\xbd\xd8\x70\x97\xa4\x9d\xbb\x27\
-\xf4\xa9\xcf\x3e\xad\x6d\xcf\x8e\xab\x52\x33\xb6\x23\xcf\x6c\x22\
-\xff\x89\x0f\xad\x50\xef\xac\xe3\x2f\x93\x05\x80\xdf\x15\xf9\x42\
-\x45\xff\xf0\xcd\x6d\xfa\xc1\x4f\xf6\x6a\x22\xeb\x9f\xa8\x14\xc9\
-\xcd\x59\x1d\x49\x7d\xe6\xb6\x35\xba\xe2\xd2\x1e\x25\x9b\x4e\xa9\
-\xb9\x22\x9d\x8e\x70\x97\xff\x57\x8b\x3f\xfb\xdb\xf5\x5a\xb7\x65\
-\x58\xa5\x92\xff\xdb\x05\xff\xc1\x92\xe6\xf7\xa5\xf5\x89\x0f\xae\
-\xd0\x55\x6b\x7b\xd5\x9c\x3a\xb5\x9f\x42\x00\x60\xbb\xa7\x37\x0d\
-\xeb\x0b\x5f\xd9\xa2\x8d\xdb\x46\x55\x2a\x47\xda\xd6\x7e\x5e\xf6\
-\xcf\xcd\xe8\x6f\x3e\x79\xa1\x2e\x5a\xd5\xa9\x86\x86\x17\xf7\xcc\
-\xf2\xb4\x84\xbb\x24\x0d\x8f\x14\xf4\x99\x2f\x6f\xd4\x43\x8f\x0e\
-\x2a\x97\xf3\x9f\xf6\x7a\x9e\x1c\x27\x78\xec\x2b\x5d\xf7\xaa\x3e\
-\x7d\xec\xfd\xcb\xb5\x70\x7e\xe6\x05\x57\x57\x01\xc0\x4b\xc5\xc8\
-\x68\x41\x5f\xfb\xb7\x67\xf5\xa3\x9f\xee\xd5\xf8\x78\x71\xc6\x7c\
-\xbc\x64\x75\xa7\xfe\xe2\xa3\xab\xb5\xf4\xfc\x56\x25\x4e\x43\x3e\
-\x9e\xb6\x70\x97\xa4\x52\xb9\xa2\x6f\xdd\xf1\x9c\x6e\xbf\x63\x97\
-\x86\x47\x0a\xd5\x1b\xc1\x5f\x39\x24\xb5\xb7\x35\xea\x83\xef\x5c\
-\xa2\x9b\x6e\xe8\x3f\xee\x56\x95\x00\xf0\x52\xf1\x1f\xff\x79\x40\
-\xff\xf4\xad\xed\xa6\xb7\x5e\x89\xb4\xae\x7d\xae\xeb\xe8\x1d\x6f\
-\x39\x4f\x1f\x7c\xe7\x92\x13\x5e\xa0\x74\x22\x4e\x6b\xb8\x07\x1e\
-\x79\x72\x48\x9f\xfd\xa7\x4d\xe1\x83\xd6\xe0\x27\x54\x30\x90\xef\
-\x79\xd2\xa2\xfe\x8c\x6e\xba\xa1\x5f\x6f\x7e\xdd\x7c\x75\x77\xfa\
-\x47\xfa\x01\xc0\x4b\xc0\x54\xae\xac\xfb\x7f\x79\x50\xdf\xfb\xf7\
-\x01\x6d\xda\x3e\xa2\x62\xc9\x9c\x79\x1a\xe4\x5f\x70\xed\xec\x68\
-\xd2\xa7\x3e\xbc\x52\xd7\xbd\x7a\xce\x29\x3f\x38\x3d\x9e\x33\x12\
-\xee\x92\x34\x38\x94\xd7\x57\xbe\xbd\x5d\xf7\xfc\xfc\x80\xb2\x93\
-\xa5\x68\x0b\x5e\x8a\xb4\xe4\xd3\xcd\x09\xbd\xe1\x35\x73\xf5\xd6\
-\x1b\x16\x68\xe5\xd2\xb6\xe7\xdd\xc2\x12\x00\xea\xd9\xce\xdd\x13\
-\xba\xf7\xa1\x03\xfa\xe1\x4f\xf7\x6a\xf0\x48\x5e\x95\x60\x25\xff\
-\x0c\xf9\x77\xe5\x65\xdd\xfa\x93\x0f\xac\xd0\xf2\xc5\xfe\xaa\xff\
-\xd3\xec\x8c\x85\x7b\xe0\x89\x75\xc7\xf4\xe5\x6f\x6e\xd3\xfa\xad\
-\x23\x2a\x14\xca\xd5\x93\x44\x82\x9e\x53\xe4\xf5\xa2\xfe\x8c\x5e\
-\xff\x7b\x73\xf5\xc6\xeb\xe6\x6a\xc1\x9c\x0c\x8b\xa0\x00\xd4\xbd\
-\xa1\x63\x79\x3d\xf0\xf0\x21\xdd\x75\xff\x3e\x6d\xd9\x31\xa6\x7c\
-\xa1\x32\x63\xbe\x05\xaf\xe7\xf5\x35\xeb\xa3\xef\x5b\xa1\x6b\xaf\
-\x9c\x7d\xda\xab\xf5\xa8\x33\x1e\xee\x81\x3b\xee\x1e\xd0\xbf\x7c\
-\x77\xa7\x0e\x1c\xce\xc9\xab\x04\xe7\x89\x18\x35\x2d\x28\x39\x92\
-\x96\x2d\x6e\xd3\xab\x5e\xde\xad\xab\xd7\xf6\x6a\xcd\x8a\x8e\x53\
-\x1a\xe2\x07\x80\x33\x61\xeb\xb3\x63\xfa\xd5\x6f\x8f\xe8\x97\x8f\
-\x0d\x6a\xc3\xd6\x51\xe5\xf2\xd5\x73\xa5\x67\xca\x33\xcf\x5f\xfb\
-\x73\xcb\x4d\x8b\x74\xcb\x4d\x0b\xcd\x0e\xbb\x67\xd8\x59\x0b\x77\
-\x49\x1a\x9b\x28\xea\x8e\xbb\x07\xf4\xaf\x3f\xde\xad\x23\x43\x39\
-\x73\x8a\xb7\xbf\xb2\xd5\xf4\xe4\x6b\xae\xfe\x1f\x4c\x5b\x6b\xa3\
-\x56\x2e\x69\xd3\xfc\x39\x69\xf5\xf5\xa4\xd4\xd7\xd3\xac\xbe\xde\
-\x94\x5a\x5b\x1a\xd5\x92\x69\x50\x4b\xba\x41\x99\x74\x83\x9a\x9b\
-\x13\x72\x69\xde\x03\x38\x45\xb9\x7c\x59\x13\xd9\x92\xb2\x53\x65\
-\x4d\x64\x8b\x1a\x9f\x28\x69\xf0\x68\x4e\x87\x8e\x4c\xe9\xd0\x60\
-\x4e\x87\x87\x72\xda\xb8\x75\x44\x47\x87\x0b\x2a\x57\x82\xcd\x13\
-\x9f\x3f\xbf\xd2\xcd\x09\xdd\x78\x7d\xbf\x6e\x79\xeb\x42\xcd\x9f\
-\x93\x3e\x6b\x93\x82\x67\x35\xdc\x03\xc3\x23\x05\x7d\xff\x27\x03\
-\xfa\xee\x5d\x03\x3a\x3c\x94\x9b\xb6\xba\x15\x00\x6c\x97\x49\x37\
-\xe8\xc6\xeb\xe7\xeb\x96\x9b\xce\x6e\xa8\x07\xce\x49\xb8\x07\x26\
-\xb2\x25\xfd\xe2\xd1\x41\xdd\x79\xdf\x3e\x3d\xb9\xfe\x98\xa6\x72\
-\x25\xbf\x39\x55\xed\x51\xf1\x9a\xd7\xbc\xe6\xb5\x2d\xaf\x1d\xd7\
-\xd1\xea\x65\x1d\xfa\xfd\xd7\xce\xd5\x1b\x7e\x6f\x8e\xba\x67\x25\
-\xcf\x59\x37\xe1\x9c\x86\x7b\xd4\xde\x03\x93\xba\xef\xa1\x83\xba\
-\xf7\xa1\x83\xda\xb1\x7b\x5c\x85\x42\xa5\xda\xac\xe2\xca\x95\x2b\
-\xd7\x3a\xbe\x2e\x98\x97\xd1\x6b\xae\xe8\xd5\x8d\xaf\x9f\xaf\xc5\
-\xe7\xb5\xa8\xa1\xe1\xdc\x4f\xfd\xd5\x4d\xb8\x47\x0d\x0d\xe7\xf5\
-\xd4\x86\x61\x3d\xfa\xd4\x90\x1e\x7b\x7a\x48\x03\xfb\x27\x55\x2a\
-\x7b\x0a\x06\x44\xbd\x70\x65\x17\xaf\x79\xcd\x6b\x5e\x9f\xfd\xd7\
-\x73\x67\xa7\x75\xc9\xea\x4e\xad\xbd\x64\x96\x2e\xbf\xb8\x5b\x73\
-\xfb\x9a\xcf\xc8\x38\xe3\x8b\x51\x97\xe1\x5e\x6b\x74\xbc\xa8\xbd\
-\x07\x26\xb5\x7b\xef\x84\x76\xef\xcd\x6a\xf7\xbe\xac\x06\x8f\xe6\
-\xcc\x83\x8f\xc9\x92\x26\xa7\xca\xca\x4e\x95\x94\xcb\x95\x55\xff\
-\xff\x37\x00\xea\x55\x53\x93\xab\x74\x73\x42\xe9\xe6\x06\x65\x9a\
-\x13\x6a\xc9\x34\xaa\xbb\x2b\xa5\x05\xf3\xd2\x5a\xd8\x9f\xd1\xc2\
-\xf9\x19\x9d\xdf\xdf\xa2\x8e\xf6\xc6\xb3\xde\x43\x3f\x59\xff\x1f\
-\x50\xf7\x72\x56\x75\xf0\xe8\x26\x00\x00\x00\x00\x49\x45\x4e\x44\
-\xae\x42\x60\x82\
-\x00\x00\x0a\x42\
-\x00\
-\x00\x2a\x9b\x78\x9c\xed\x9a\xfb\x57\xd3\x47\x16\xc0\xe3\x83\xfa\
-\xa0\x40\x5d\x5a\x04\x79\x04\x8e\xdd\xb5\x88\x05\x11\xaa\x40\x40\
-\x14\x75\xc1\x45\x42\x9b\x56\x28\x14\x02\xc8\x01\x16\x21\x86\x10\
-\x0d\xe1\x11\x62\x55\xa4\xd6\x18\x42\x4b\x8d\x2c\x24\xd9\x5d\x40\
-\xda\x82\x40\x04\x79\x98\x90\xe0\x83\x64\x05\x21\x42\x84\x20\xaf\
-\x80\x11\xd9\x08\x22\x21\x40\x02\x84\x64\x93\xef\x37\xe9\xfe\x05\
-\xbb\xa7\x3f\x7c\x73\x4e\xce\x7c\x67\xee\x9d\xcf\xbd\x73\xe7\xce\
-\xfc\x32\xf7\xda\xe7\xc8\x60\x8b\xed\xbb\xb6\xc3\x60\x30\x8b\x93\
-\x21\xc7\x51\x30\xd8\x7b\xfa\xff\x66\x9b\xad\xef\xe9\x47\xc2\xe1\
-\x7f\x64\xeb\x9b\x0d\x78\x54\x70\x10\xac\xae\xd7\x41\xae\xef\x6c\
-\x4e\x39\x1a\x76\x14\x06\x63\x17\x99\x6b\x12\xcc\xf4\xfd\x6d\x19\
-\x21\x51\x78\x18\xcc\xf2\xb1\xe1\xbf\xe1\x27\x37\x4b\x7b\x18\x6c\
-\xef\xfe\x93\xc7\x8f\x7e\x45\x44\xbf\x1d\x4b\x9b\x65\x66\xc5\x0a\
-\x15\x71\xe1\x88\x7b\x4d\x05\x17\x0a\xa8\x16\x43\xdf\x7e\x19\x6f\
-\xff\x90\xd6\x70\x60\xf3\xc6\x4d\x97\x8e\x1e\x71\x3e\x6e\xdd\x77\
-\x71\xfb\x8e\xa3\x96\x99\xcf\x26\xac\xad\x6c\xaf\x7e\xb2\xf9\x0f\
-\xce\x5d\x4f\x9c\x05\x19\x11\x27\xb7\xa6\x3b\xa7\x5b\xd3\xf6\x0b\
-\x70\x1d\x96\x1d\xf7\x09\xe9\x6e\x16\x23\xf7\x9b\x6b\x63\x49\xb0\
-\x8f\x89\x05\x2d\x89\x7e\x43\xa4\x31\x52\xbb\x53\x3e\x4f\x75\x19\
-\xa1\x2b\x94\x20\x24\xeb\x71\xec\x05\x36\xdc\x9f\xa8\x7c\x70\x79\
-\x13\xcc\xf0\xbb\xa8\x4b\xad\xfa\x6e\x23\xf0\x39\x2f\xbe\x53\x6e\
-\x09\x7c\xc1\x34\x34\x1a\x38\xf6\xc1\x95\x0f\x41\x35\xe7\x4a\x50\
-\xb2\xd9\xc5\x0c\x68\x9d\xb7\xba\x82\x03\x47\x43\x36\x00\xed\xd6\
-\xa0\xed\x40\x7b\xe4\x03\x14\x28\xb8\x04\x21\xfe\x27\x88\x08\x4a\
-\xe3\xe1\x8c\x0c\xbf\xcc\xee\x88\xfa\x68\xcf\xc1\x5a\xb4\x6f\x44\
-\x7d\x8c\x67\xc4\x9d\x68\xcf\x00\x60\x47\x3b\x1e\xfa\x66\x4c\x4c\
-\x0c\x91\x95\x0f\x70\x62\x6d\x99\x50\xbb\x69\xa1\x43\x14\x14\xd2\
-\x66\xb6\x07\xce\x21\x94\x2f\xfd\xbd\x47\xd6\x64\x2d\x29\xb2\x6e\
-\xa9\x75\xdc\x83\x89\x42\x20\x5b\xbb\xbf\x10\x17\x01\x16\x3b\x66\
-\x63\x9a\x13\x55\xad\xe7\x85\x37\x64\x77\x1d\x39\x42\x3a\xef\xc2\
-\x98\x7a\xc2\x2c\xf2\x06\x46\x32\x57\x9a\x3f\x4b\xfb\x53\xa5\xe6\
-\xc3\xa2\x9c\x8e\xdb\x8a\x4a\xaf\x66\xca\x1e\x06\x3b\xc9\x81\xfc\
-\xb4\x58\xec\x05\xb8\xb4\xef\x0e\x16\xdd\x96\x9b\xa7\x6e\x94\x3a\
-\xbe\xf3\xc5\xae\xf9\xbc\xeb\x46\x54\x4f\x1f\xa3\xd2\x16\x76\xab\
-\x7c\xf3\xc7\x88\x83\xb2\xb9\xc3\x4c\xc5\x77\x1c\xaa\xec\xe0\xb5\
-\x3d\xc0\x84\x8c\x95\xd3\x87\xa8\x59\xe4\xbc\x11\xe2\x4c\x30\xcf\
-\xcb\x7d\x8c\x9d\x9b\x73\xf8\x63\x87\x05\x97\xa9\xda\x2d\x18\x27\
-\x8f\x9c\xae\x93\x32\x76\x35\x96\xc9\x04\x43\x05\x5f\xe9\x30\x43\
-\x08\xd2\xc6\xf1\x4f\x7c\x74\x6e\xd2\x32\xe6\xcd\x61\x17\x7b\x94\
-\x13\x41\x57\x21\xb4\x67\x65\xbd\xf1\x59\xba\xb2\x24\xb6\x06\x23\
-\xe3\xae\x7e\xa3\x12\xe0\xd1\xe4\x3e\x75\xff\x94\x24\x2c\x3c\x54\
-\x4e\x33\x77\xb5\x97\xdc\xb1\x4b\x09\x5c\xcb\x97\xbd\x28\xe2\xaf\
-\x2d\x6e\x06\x14\x35\x14\xed\xeb\x76\x3a\x25\x92\x27\x7b\xc9\x4e\
-\x91\x7e\x2b\x4f\xfd\xc5\x01\xe5\x32\x95\x6a\x15\x48\xe0\x4e\x5a\
-\x21\x1d\xcb\x0e\x39\x1d\x0e\x00\x77\xa1\xa5\xbf\xa5\x9e\x87\xf3\
-\x9f\xb9\x17\x67\x3b\x1d\x43\xec\x59\x6c\xf2\xb6\xbc\x46\xcb\x7c\
-\x7a\xf5\x91\x50\xca\x9f\xdf\x20\xbb\x66\xd5\xde\x6d\x62\x06\xb6\
-\x4f\x3d\x92\xee\xf2\xc8\x51\xd2\x85\x73\xed\xdd\x2a\x42\x57\x7f\
-\x61\xc9\x16\x26\x37\x21\xef\x55\x7d\xaf\x6d\xd9\x41\x87\x83\x26\
-\x64\x31\x36\x8e\x24\x23\x2e\x76\xbb\xdb\xd2\xd3\xa5\x01\x01\x3d\
-\xc3\x5d\xf2\x86\x53\x48\xdf\x84\x75\x1f\xd5\xc0\x37\x27\xc0\xfc\
-\x50\xfb\x72\xd6\x5e\x57\x08\xb2\xeb\x03\xf0\xa3\x6b\xad\x17\xc4\
-\xe2\xda\x4f\x31\x21\xbe\x53\x57\x96\x64\xd6\x29\x58\x47\xfb\xc1\
-\xba\x52\x63\x70\x58\x97\x11\x52\xc5\x7c\xd5\x75\xd7\x50\x3b\x14\
-\x72\xf4\x2e\x21\x4f\x33\xf0\x8d\x90\x31\x37\x11\x66\xe4\x9c\x18\
-\x6e\x9a\x6c\xc0\x69\xa5\x4c\x5f\xe4\xf0\x5d\x42\xce\xdf\xaa\xaa\
-\xcc\x5d\x85\x4e\xa4\xc7\xea\xc7\x2f\xbe\x11\xf6\xcd\x18\xcd\xb5\
-\x06\x38\xb4\x6b\x1b\x70\x73\x35\x2d\x54\x03\x4e\x9e\x4a\xb8\xb9\
-\xb7\x32\x3d\xa6\x25\x39\x6f\xb6\x5e\x64\x2b\x84\xe3\x5f\x99\x56\
-\xb9\x71\x0c\xa3\x2c\x96\x55\xd4\xfb\x25\xd6\x06\x9e\x5d\x5a\xf4\
-\x76\x0b\xfd\x08\x35\xbe\xfe\xbd\x58\x48\x7a\x47\x28\x94\xbf\x0f\
-\x28\x8d\x5a\x1a\x56\x43\x5c\x0b\x75\xf2\x61\xa4\x24\xa5\x06\x75\
-\x29\x59\xe7\x5f\x12\x47\xe5\x65\xd5\x60\xba\x64\x20\x72\x16\x06\
-\x3f\x95\xa9\x58\x19\x45\x72\x7f\xfb\xd0\x1d\x28\x24\x02\xf7\x88\
-\x38\x86\x0f\x2f\xed\x05\xe4\x1d\x1b\xd5\x9c\xe9\xf2\x03\x23\x71\
-\x25\xd1\xdf\xd3\x16\x7a\xe9\xbd\x6b\xf7\x9c\x01\xc1\xd7\xc9\xc1\
-\x0e\xcd\x99\xdc\xb7\x9d\x7c\x6f\x46\x4a\xc2\xb2\xcb\x54\x16\x9c\
-\xac\xc2\xbd\xd9\x36\x63\x04\x37\x1c\x71\xca\x64\x21\xa8\x52\xe2\
-\x2b\x9c\x38\x7b\xb2\xc7\x0f\x58\x02\x77\xf5\x85\xaa\xcc\x04\xce\
-\xe9\x79\x37\x86\x75\xb8\xa0\xfe\x55\xce\x7d\x96\xec\x88\x42\x2f\
-\x2f\xe6\x52\x6f\xcc\x0c\x9e\x4a\x01\xe4\xf1\x1b\x30\x6d\xe2\x1d\
-\xb2\x22\x66\x66\xff\x79\xf4\x5f\x1b\x2d\x80\xe4\x11\xe5\xbe\xdc\
-\x26\xb6\x03\xed\xc7\x93\x35\xcf\x7f\x14\x16\x7b\xe5\xb8\x25\x35\
-\xbb\x4c\x9d\x08\xf7\x4d\xad\x45\x64\x2e\x9d\x7f\x0f\x90\xda\x0c\
-\x09\x2e\xa4\x09\xf0\xe4\x25\x27\x71\x76\x42\xcf\xc1\x4a\xcd\x64\
-\x3d\xc3\x87\x01\x6e\x93\x1d\xb1\xef\x4b\x24\x13\x69\x9e\x76\xd3\
-\x65\x4a\x02\x27\xd4\xea\x6e\x80\x87\xd9\xeb\x82\x24\x2c\x98\x12\
-\x5c\x7e\x3f\xd5\xcf\xa3\x32\xea\x6a\x89\x34\xef\x39\x4e\xbc\x0d\
-\x10\xdd\x2a\x6e\xf3\x9f\x61\xc5\x86\xbc\x68\x20\xf4\x10\xf5\xf1\
-\x32\xfa\x70\xab\xb8\x3a\x40\x33\x24\x6f\xa2\x25\xef\x44\x39\xe1\
-\xde\xf4\x99\xb4\x4b\x2d\xd2\x24\x94\xc2\x71\x15\x52\xbf\xf2\xa7\
-\xee\x95\xfe\x9a\x92\x6c\x4d\xf2\x2e\x40\x36\xcf\x47\x28\x4b\x3a\
-\xc9\xd9\x67\xae\xba\x24\x29\x74\x3f\x83\xa1\xf8\x14\xa1\xd4\x8e\
-\x87\xb4\x85\x39\xf2\x92\xa7\x7c\xd6\xd1\xf6\xc6\x10\xee\x3f\x96\
-\x32\x4e\x56\xc4\x31\x6f\x9d\x0e\xf1\xd5\xde\xda\x5d\x0d\x9e\xac\
-\xfd\x5f\xea\x53\xce\x2e\x4b\x1f\x4d\x3f\x8f\x92\xa8\x82\x12\x0e\
-\xc6\x06\xbc\x95\xe2\x4b\xf7\xad\x86\x7e\xe8\x65\xee\x1a\x1c\x06\
-\x9e\xec\x78\xc1\x95\x92\x91\x67\x7d\x59\x3e\xe9\x7e\x60\xba\x7b\
-\x35\xa7\x3e\x3a\x13\xb8\xc6\xd2\xf3\x34\x0d\x51\xa4\x58\x60\x70\
-\xc2\x06\x88\x5b\xf4\x27\x8d\x7b\xad\x0b\xef\x30\x07\x24\xe0\x25\
-\x78\xee\xc1\xf0\x6e\xfd\x74\x8a\xf1\xa6\xeb\x4e\x1a\xdb\x51\x73\
-\x5b\x1c\x54\x7a\xba\xf4\x6b\xdf\x1a\xac\x39\x98\x5c\x3f\x0c\xd4\
-\xd8\xac\x4d\xea\xce\x90\x11\x60\x68\x47\x8a\x7f\x5f\xd7\x33\x84\
-\x80\x10\x10\x02\x42\x40\x08\x08\x01\x21\x20\x04\x84\x80\x10\x10\
-\x02\x42\x40\x08\x08\x01\x21\x20\x04\x84\x80\x10\x10\x02\x42\x40\
-\x08\x08\x01\x21\x20\x04\x84\x80\x10\x10\xe2\xff\x8c\x68\xdc\xee\
-\xba\xc5\xd2\xa1\x1c\x09\xf4\x3a\x28\x8e\xad\xd9\x6c\xd6\xba\x68\
-\x6f\xe5\x6c\xbb\xfc\xb5\x1c\x7c\xea\x7e\x3a\x34\x0e\x77\xb8\x85\
-\x34\x4f\x8a\x70\x49\x12\xf1\x3a\xb5\x89\xa0\x91\x96\xde\x1b\xe6\
-\xda\x59\x32\xda\x25\xe9\x41\x0d\x68\x2e\x63\xc6\xf0\x06\xaa\x27\
-\x72\xea\xf8\xa9\xbf\xbd\x7a\x2a\x57\xe1\xa7\xaa\x0b\x0e\xd4\xd0\
-\x32\xa7\x7a\xdb\x4d\x8f\xb4\x6c\x8c\x64\xdf\x72\xa3\x2e\xaa\xa0\
-\x04\x23\x99\x2d\x35\x59\x8f\x6d\xc3\x83\xd6\xd3\x75\xe3\x67\x22\
-\x41\x57\x27\x06\x57\x7a\x07\x82\xba\x30\xc9\x22\xde\x26\xd9\x75\
-\x7a\xdc\x21\x06\x00\xbe\x68\xb7\xba\x28\x21\x84\x55\x17\x78\xd5\
-\xd0\x0e\x08\x6c\xe1\xba\x87\xf7\x4c\xec\x7f\xe0\xf9\x19\x3d\xe7\
-\xa3\x7d\x1a\xcd\x5d\xa7\xd1\x4d\x6a\xf2\x57\x20\xe7\x26\x63\x77\
-\xe5\xe8\x32\xb7\x18\xf4\x5e\x99\xb5\xce\x5c\x97\x8d\xda\xf9\x2b\
-\x59\xb1\x21\x6d\xf9\x22\xad\x82\xa7\xcc\x32\xbd\x7e\xff\x79\x5c\
-\xf9\xcb\x5b\x71\xaa\x4b\x8f\x7b\x25\xc5\x53\xc0\xe9\x6d\x3b\x63\
-\x5a\xcd\x42\x1d\xbe\x45\x6f\xd4\xbb\x9b\xb6\xa0\xd7\xa7\xcc\xa8\
-\x66\x59\xc6\x17\xf5\xf7\x63\xb2\xdf\x8e\xe3\x7a\x0b\xae\xeb\x74\
-\x5f\x08\x62\x8e\x75\xd9\x26\x72\x57\xa4\xfc\xcf\x7e\x7b\xf6\x96\
-\xf1\xd1\x07\x19\x36\x83\xe9\xc7\xba\x66\xc6\x03\x59\x81\x07\x80\
-\xf1\xf9\x63\xb9\xcb\x8e\xb6\xd8\xd5\x96\x15\xee\x3e\xcf\x11\xda\
-\xdd\xb7\xc3\x01\x8d\x2b\xeb\xde\xa0\xc3\x85\xe3\x0b\x93\xd8\xa2\
-\xd8\x43\xa3\xde\x8c\x9d\x86\x79\xb6\x89\x9a\xce\x40\x12\xc9\xe8\
-\x8a\xf9\x59\xd5\xf8\x26\xd9\xac\x2a\x0f\xef\xe7\xd1\x14\x55\x58\
-\x72\xbd\xbe\x35\x41\xb3\xc2\x79\x0c\x6e\xc5\xad\xcb\x74\xdd\xa3\
-\x48\xc1\x4f\x92\x39\x46\xaf\x39\x66\xd0\x25\x89\xe2\xa9\x9d\x65\
-\xec\x2c\xaa\xc7\x72\x12\xfc\xc0\x7a\x27\xf3\x57\x5e\x3b\xdf\xed\
-\xc2\xaa\x9f\x4d\x19\x4a\x04\x0e\x1b\x56\xea\x25\xd2\x6a\xce\x83\
-\xf1\xb1\x79\xcc\x24\x6d\x11\x60\x7b\x16\xa3\xb4\xa8\x2b\x25\xa2\
-\x18\x6e\x9a\xe6\xc9\x08\xcf\xcf\x18\x7c\xb3\xf9\x72\x49\x9c\x37\
-\xcf\x53\x1c\x47\x8f\xfe\xde\x10\xff\xfa\xd5\x69\x2c\x15\xef\xce\
-\x4d\x36\xc2\x5b\x2a\xc8\x2b\xaf\x7e\x92\x31\xe0\x9c\x33\x7e\x22\
-\x41\xff\x95\x12\x4f\x01\x51\x50\x73\xf8\x90\xfb\x0b\x5e\xae\x49\
-\xe5\xb2\x28\x6e\x61\x5d\x81\xa8\x6f\xcb\xf0\x13\x75\xa1\x0a\x4a\
-\xd2\xf8\xba\xcb\x8a\x9f\xe9\xcc\xc0\xe6\x77\xa3\x08\x63\x8d\x08\
-\xff\x08\x7d\x6e\x28\xa0\x37\xa7\xd3\x4c\x26\x20\x6d\xb9\x5d\x1d\
-\x15\xf5\xab\xc1\x5c\x64\x4c\x63\x8a\xff\x42\xd5\x74\x11\x43\xb2\
-\x1e\x9f\x03\x7a\x9c\xbf\x81\xc7\x49\x93\x12\x9f\xff\xe0\x5f\x13\
-\x77\xdf\xa0\x24\x1d\x22\x3c\x1a\x5a\x7d\x18\x0e\x14\xee\x98\xaa\
-\x44\x2a\xf4\x1d\x3b\xfe\xc2\x0f\x4a\x41\x56\x1d\x9a\x9a\xb2\x18\
-\x6a\x87\x12\xd8\xca\x66\x46\xce\xd9\x5a\xe5\x8f\x93\x29\x86\xf8\
-\x98\x78\x96\xbc\x85\xb7\x33\xf4\xb9\x17\x9a\xfe\xab\x7a\xf7\x5b\
-\xcf\x4a\x78\x0a\xda\x34\x39\xb3\x1c\x3f\xf9\x99\xb1\xce\x26\xc3\
-\x7e\xf5\x5f\xd3\x75\x4e\x56\xa4\x07\x7b\x84\xa7\x39\xcb\x61\xe1\
-\x8d\xcd\xcf\x0d\xa1\xe6\xf1\xd7\x6e\x2b\xfe\x4d\x8f\xdb\x8f\x5e\
-\xa1\xd6\x87\x85\x83\x09\x82\x99\xf8\x08\xbb\xfe\x86\x38\xca\xd2\
-\x4e\xb7\xea\xf3\x4d\x9e\xba\x6c\xac\x5f\x72\xaf\x29\x64\x65\x2e\
-\x12\x55\x6e\x48\xb8\xa1\x20\xc5\x58\x60\x32\xfa\x17\x60\x91\xeb\
-\x1e\xba\xb4\xbc\xd5\x34\xce\xed\xea\x2a\xf6\x22\xb6\x52\x53\x19\
-\x9e\x9f\x3a\xdd\x2a\x6a\xec\xb5\xc3\x6a\xf4\x3b\x67\xf4\xc3\x8d\
-\xbb\xdc\x4e\xa7\xae\xf9\xcf\x94\x57\x51\x3f\x91\x7d\x9e\xbb\x7b\
-\x6a\x4f\x80\x1a\x6d\x2f\x2c\x43\xcf\x5f\x54\x74\xfc\x78\xe8\x14\
-\xe8\xc3\x11\xb5\xfe\xcc\xdc\x98\xe6\x6a\xff\x89\xeb\x4b\x92\xb2\
-\x98\x37\xfb\x5d\xec\x51\xf9\xb3\xc5\xd5\x98\x5d\x1e\xf9\x6f\x9e\
-\xc8\xb6\xf1\xf3\xa6\xe5\xe0\x29\x52\x17\xab\x58\xfc\x44\xee\x32\
-\x89\x4e\x55\xf2\xb8\xf8\x9c\xe8\xb3\x85\x79\x21\x2b\xec\x5c\x78\
-\xcb\x39\x7f\xa5\x67\x96\x3d\x9f\x34\xa8\x48\xec\x66\x68\xac\x3e\
-\x02\xd5\x07\xb3\xb0\x0e\x3a\x35\xdb\x4d\x30\x12\x98\xd3\xd9\x9a\
-\x2e\x9c\x93\xaf\xd0\x9c\x0d\x95\x52\xfe\x18\xb1\xa1\x68\x43\x76\
-\x32\x25\xdd\x0e\xa8\x9f\x01\x4b\x63\x42\x67\x5e\xba\x9d\xb3\x85\
-\x6b\x67\xb3\x84\xb9\xa2\x91\xc3\x86\x82\xa5\xdb\x86\x4a\xa9\x4c\
-\xf3\xb9\x6c\xc9\x3d\x99\xa7\xd5\xa8\x3f\x12\x81\x5b\xf7\x49\xed\
-\x1e\xc6\xf5\xb3\xd3\x84\x01\x73\x79\xcf\x17\x13\x81\xa9\xfb\x11\
-\x86\x72\x21\xf7\x31\x5e\x6e\x0c\x61\x60\x4e\xd1\xd9\x5d\x67\x0f\
-\x5f\x5d\x3c\x9d\xb8\xa6\xbf\x5e\x8a\x1c\xf5\xb9\xa6\xab\xf8\xac\
-\x26\x92\x3a\x50\x13\x41\x19\x70\x8b\xa4\x9c\xae\x89\x38\x25\x02\
-\x26\x36\x64\x58\x3a\xf8\xf8\x2c\x4b\xf3\x32\x46\x9b\x74\xaf\xd9\
-\xba\x8b\xfe\xf3\x8d\xa6\xab\xf3\x61\x97\x1c\xfc\xe8\xb0\xda\xf6\
-\xfb\xbc\xa9\x21\xc4\x7f\x11\x3a\x0b\x27\xa2\x97\xa8\x6b\x6e\xbc\
-\xc2\xd0\x3d\x79\x02\x79\xbc\x2e\x28\xfe\xd2\x7f\x00\xac\xc0\x6f\
-\xb9\
-\x00\x00\x09\x93\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x2a\x00\x00\x00\x1e\x08\x06\x00\x00\x00\x5a\x28\x8c\xe0\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x09\x28\x49\x44\x41\x54\x58\x47\xa5\x98\xfb\x77\
-\x54\xd5\x1d\xc5\x3f\xf7\x31\x37\x33\xe4\x31\x93\x77\x08\x04\x92\
-\xc1\x20\x99\xc9\x43\x40\x82\x56\x01\x49\x52\x7f\xa8\x15\x09\x14\
-\x41\xb4\x88\xa2\x62\xff\x02\x57\x1f\x56\x7e\xd4\xda\xb5\xb4\xf8\
-\x58\x2e\xb5\xcb\x46\xa0\x5d\x6d\x09\xb8\xaa\x22\x94\xb0\x30\x04\
-\x12\x6a\x41\x20\x84\x08\x79\x4c\x20\x09\x31\x93\x07\x24\x99\x67\
-\x66\x72\xef\xed\x0f\x33\xb9\x64\x86\x89\xb4\x65\xcf\x4f\xf7\x9c\
-\x7d\xbe\x77\xdf\x7b\xee\xd9\x67\x9f\x11\x74\x5d\xd7\xb9\x03\x74\
-\x5d\xc7\xef\xf7\xf3\x5d\x7b\x3b\x9d\x1d\x9d\x8c\x8d\x8d\x11\x0e\
-\x87\x50\x55\x15\x49\x92\x51\x14\x05\x9b\xcd\xca\x3d\xc5\xc5\x94\
-\x38\x1c\x24\x27\x27\xc7\x8c\x0f\x06\x83\x9c\x3d\x73\x86\x6f\xcf\
-\x9e\x25\x29\xc9\x4c\x76\x4e\x36\x0e\x87\x83\x7b\x8a\x8b\x91\x24\
-\x29\x86\x3b\x1b\x84\x3b\x09\xd5\x34\x8d\x21\xb7\x9b\xcf\xff\xf1\
-\x39\x27\x4e\x34\xd2\xd6\x7a\x11\x8f\xc7\x13\xc3\x11\x04\x81\x94\
-\x94\x14\x4a\xcb\xca\x58\xbd\x66\x0d\x8f\x3d\xfe\x53\xf2\xf3\xf3\
-\x8d\xfe\xf1\xb1\x31\xfe\xf8\xf1\xc7\xbc\xff\xee\x7b\x88\xa2\x48\
-\x56\x56\x16\x95\x2b\x2b\xa9\xaa\xae\xe6\x91\xaa\x2a\xd2\xd2\xd2\
-\x62\xea\x25\x82\xb4\x6b\xd7\xae\x5d\xf1\x8d\xd3\xd0\x34\x8d\xef\
-\x07\xbe\xe7\xd3\xba\x3f\x51\xf7\xc9\x27\x74\x77\x75\x11\x0a\x85\
-\xe2\x69\x00\x84\x42\x21\xfa\xfb\xfa\xb8\xd8\xda\xca\xd4\x94\x8a\
-\xdd\x6e\x27\x35\x2a\x60\x72\x72\x92\x73\xe7\xce\xf1\xef\x6f\xbe\
-\x41\xd7\x75\x7c\x3e\x1f\xdd\xdd\xdd\xb4\xb7\xb7\x63\x32\x99\x28\
-\x2e\xbe\x07\x25\x29\x29\xbe\x64\x0c\x66\x15\xaa\xeb\x3a\x37\x6f\
-\xde\xe4\xd3\xba\x3a\xf6\xed\xd9\x83\xd7\xeb\x05\x40\x92\x24\xe6\
-\xcd\x9f\xcf\x8a\x95\x95\x94\x94\x94\xb0\xa0\x70\x21\x9a\xa6\x31\
-\x3e\x36\x06\x51\x51\x5d\x9d\x9d\x20\x08\x38\x9c\x4e\xcc\x66\x73\
-\xa4\x7f\x62\x82\x60\x20\xc0\x64\x30\x88\xd7\xeb\x45\xd7\x75\x26\
-\x26\x26\xe8\xec\xe8\x20\x33\x2b\x0b\xa7\xd3\x19\xa7\x20\x16\xb3\
-\x0a\x0d\x06\x83\x34\x36\x36\xf2\xee\xee\x77\xf0\x7a\x3c\x08\x82\
-\x80\x2d\x3d\x9d\xaa\xea\x2a\x36\x6c\xdc\x48\xed\xc6\x8d\xac\x5e\
-\xb3\x86\x15\x95\x95\xcc\x2f\x98\x8f\x49\x51\x18\x1d\x19\x21\x18\
-\x0c\x12\x0a\x85\xe8\xeb\xeb\x63\x6e\xde\x5c\x4a\x1c\x0e\x24\x49\
-\x22\x37\x37\x17\x67\xa9\x93\xbc\xfc\xb9\xc8\xb2\x44\x6f\x6f\x2f\
-\x9a\xa6\x11\x08\x04\x70\xbb\x07\x59\xf9\xc0\x83\xd8\xd2\x6d\xf1\
-\x32\x0c\xcc\x2a\x74\x74\x64\x84\xdd\x6f\xbf\x4d\x67\x47\x07\x00\
-\xa9\xa9\xa9\xac\xaf\x5d\xcf\x4b\x3b\x77\xb2\x6a\xf5\x6a\xb2\xb2\
-\xb2\xb0\xd9\x6c\x64\x65\x65\xb1\xa4\xa4\x04\x87\xd3\xc1\x54\x38\
-\xcc\xa5\xb6\x36\x54\x55\x25\x34\x39\x89\xc7\xe3\xa1\xba\xa6\x1a\
-\xb3\xc5\x82\xc5\x62\x21\x27\x37\x97\xd2\xb2\x32\x8a\xec\x76\xfa\
-\x7a\xfb\xe8\xeb\xed\x45\xd7\x75\x26\x43\x21\xd2\xd3\xd3\x59\x7e\
-\xff\xf2\x78\x19\x06\xc4\xf8\x06\x00\x55\x55\xe9\xef\xbf\xce\xb7\
-\x67\xce\x02\x60\x32\x99\x70\x96\x96\xb2\xfd\xb9\xe7\xb0\x2f\x5a\
-\x14\x4f\x47\x92\x24\x0a\x0b\x0b\xd9\xb2\x75\x2b\xcb\x96\x47\x6e\
-\x16\x0e\x87\xe9\x71\xb9\x68\x6f\x6f\x8f\xe1\xca\xb2\xcc\xbd\x4b\
-\x96\xb0\x6d\xfb\xb3\xa4\xa7\xa7\x03\xe0\xf3\x7a\x69\x3e\x75\x0a\
-\x55\x55\x63\xb8\x33\x91\x50\xe8\xe4\xe4\x24\xdd\xdd\x5d\x04\x02\
-\x01\x00\x52\x52\x52\xa8\xaa\xae\x66\xc1\xc2\x85\xf1\x54\x03\xa2\
-\x28\x32\x37\x7f\x2e\xeb\x6b\x6b\x8d\xb6\x40\x30\xc8\xc5\xd6\x8b\
-\x31\x3c\x80\xa4\xa4\x24\x9c\x4e\x27\x8e\xe8\x77\x19\x0e\x87\xe9\
-\xef\xeb\x63\x62\x7c\x3c\x9e\x6a\x20\xa1\xd0\xa9\xa9\x29\x46\x86\
-\x47\x8c\x6b\xb3\xd9\xcc\x92\x92\x25\x31\x9c\x44\x30\x9b\xcd\x94\
-\x38\x1c\x98\x4c\x26\x00\xc2\xa1\x10\xd7\xaf\x5f\x8f\xa7\x01\xa0\
-\x28\x0a\x0b\x0b\x0b\x8d\xeb\x29\x55\xe5\xe6\xcd\x9b\x31\x9c\x99\
-\x48\x28\x94\xa8\x37\x4e\x43\x8f\x5a\xd5\x9d\x20\x08\x02\xb2\x2c\
-\x1b\x63\x75\x5d\x67\x6a\x6a\x2a\x9e\x06\x80\xaa\x69\x78\xbd\xb7\
-\xfc\x58\x14\x04\x92\x7e\xc0\xa2\x12\x0a\x95\x65\x99\xec\x9c\x6c\
-\xe3\x7a\x32\x18\xa4\xb3\xa3\x33\x86\x93\x08\xa1\xc9\x10\x2e\x97\
-\xcb\xf0\x5a\xd9\x64\x22\x67\x46\x9d\x69\xa8\xaa\x8a\xdb\xed\xa6\
-\xf5\xfc\x05\x00\x44\x49\xc2\x96\x9e\x4e\x66\x66\x66\x3c\xd5\x40\
-\x42\xa1\x8a\xa2\x50\x54\x58\x84\xd9\x6c\x06\xc0\xe7\xf3\x71\xf2\
-\x64\x13\x37\x6e\xdc\x88\xa7\x1a\xd0\x75\x9d\x1b\x37\x46\x39\x7c\
-\xe8\x90\xd1\x66\x31\x9b\x29\x29\x71\xdc\xc6\x1b\x1e\x1a\xe2\xb3\
-\xfa\x03\x5c\xbd\x7a\xd5\xe0\x95\x96\x95\x61\xb6\x58\x62\xb8\x33\
-\x91\x50\xa8\x2c\xcb\xcc\x9b\x3f\x8f\xf2\x8a\x0a\x88\xee\x3a\xad\
-\xe7\x2f\x50\xff\xf7\xfd\x09\x3f\xf8\xe9\xcd\xe1\xcb\x2f\xbe\xe0\
-\x64\x53\x13\x00\x92\x2c\x93\x3f\x6f\x1e\x15\x4b\xef\x33\x38\x1e\
-\x8f\x87\x7f\xb5\x9c\x66\xdf\xde\x7d\x1c\xa8\xaf\x87\xe8\x22\xcc\
-\xcf\xcf\xe7\x27\x8f\x3d\x16\x53\x33\x1e\xb3\xfa\xa8\x24\x49\xc8\
-\xb2\x4c\x4b\x73\x33\xe1\x70\x98\x50\x28\x44\x77\x57\x17\x9a\xa6\
-\x63\x32\xc9\x48\xa2\x88\x24\xcb\x0c\x0f\x0f\xf3\x5d\x7b\x3b\x5f\
-\x7e\xfe\x05\x7f\xd9\xf7\x67\x46\x47\x47\x01\xb0\x59\xad\x6c\x7d\
-\xe6\x69\x1e\x5e\xb5\x0a\x9f\xcf\xc7\xb1\x86\x63\x1c\xfe\xea\x10\
-\x07\x0f\x1e\xe0\xd8\xd1\x06\x23\x2f\xa4\x59\xad\x6c\xd9\xfa\x14\
-\x8f\xaf\x5b\x87\x28\x26\x7c\x6f\xf0\x43\xa1\x44\xd7\x75\xdc\x6e\
-\x37\xbf\x7f\xe3\x77\x7c\x76\xf0\x60\xb4\x55\x20\x39\x25\x99\xa5\
-\x4b\x97\x52\x64\xb7\x93\x91\x91\xc1\xf0\xf0\x30\xae\xee\x2e\x5a\
-\xcf\x5f\xc0\x1f\xb5\x33\x8b\xc5\x42\x75\x4d\x0d\xbf\x7a\xf5\x37\
-\xe4\xe4\xe4\x30\x38\x38\xc8\x2f\x5f\x79\x85\x13\x5f\x37\x82\x10\
-\xa9\x83\x0e\x92\x2c\xe1\x74\x3a\x79\x7b\xf7\x6e\x16\x16\xce\x6e\
-\x7d\xcc\x36\xf5\x44\x57\x70\x66\x66\x26\x1b\x37\x6d\x62\x7e\x41\
-\x41\xa4\x51\xd7\xf1\x7a\x3c\x34\x35\x35\xb1\xa7\xae\x8e\x3f\xbc\
-\xf5\x16\xfb\xf6\xee\xe5\x74\x73\x0b\x7e\xbf\x1f\x5d\xd7\x11\x45\
-\x91\x82\x82\x02\xd6\xd7\xd6\x92\x93\x93\x63\x8c\xd3\x75\x1d\x41\
-\x10\x88\xfc\x40\x10\x22\x2b\x3d\x18\x08\x70\xac\xa1\x81\xee\xee\
-\xee\x98\xfb\xc7\x63\x56\xa1\x81\x40\x80\x96\xe6\x16\x1a\x8f\x1f\
-\x27\x29\x49\x89\x34\x0a\x91\x07\xb8\x65\x5c\xd3\x2f\x48\x00\x41\
-\x88\xf4\x09\x02\xe1\xa9\x30\x67\xcf\x9e\xe1\x64\x53\x13\xc1\x60\
-\x10\x51\x92\x48\x4d\x49\x41\x96\xe5\x19\x23\x23\x7e\xdd\xd5\xd5\
-\xc5\x7b\xef\xbc\xc3\x87\x1f\x7c\xc0\xa9\x93\x27\x67\x4d\x67\xb7\
-\x4d\xbd\xae\xe9\x8c\x8e\x8e\x72\xe4\xf0\x61\x0e\xd4\xd7\x73\xe1\
-\xfc\xf9\x99\xdd\x10\xe7\x97\x9a\xae\xa3\xa9\xea\x6d\x3e\xab\x28\
-\x0a\xce\x52\x27\xb5\x1b\x7f\xc6\xaa\x55\x0f\xd3\xd6\xd6\xc6\xa5\
-\x8b\x6d\x04\x82\x01\xdc\x83\x6e\xae\x5d\xbd\x4a\x67\x67\xa7\xe1\
-\xb3\x8a\xa2\x50\x5e\x51\xc1\xb6\xed\xcf\x26\x5c\x58\x31\x42\x75\
-\x5d\x67\xc8\xed\x66\xdf\x9e\xbd\xd4\xef\xdf\x8f\xdb\xed\x8e\x90\
-\x04\x81\x39\x73\xe6\xe0\x2c\x2d\x25\x3f\x3f\x9f\xac\xec\x2c\x4c\
-\xb2\x09\x41\x8c\x08\x0d\x4d\x4e\x32\x32\x32\xca\xf5\xfe\x7e\xae\
-\x5c\xbe\x6c\x44\x42\x51\x14\xc9\xc9\xc9\xe1\xc9\x2d\x9b\x79\x72\
-\xcb\x16\xf2\xf2\xf2\x8c\xed\xf2\xca\xe5\xcb\x34\x36\x36\xd2\x7c\
-\xaa\x99\xeb\xfd\xfd\x10\x75\x1b\x87\xd3\xc1\xab\xaf\xbd\xc6\xd2\
-\x65\xcb\xa6\x65\x45\x34\xcc\x14\x3a\x3e\x3e\xce\x9e\xba\x3a\x3e\
-\xfe\xf0\x23\xe3\x66\xb2\x2c\x53\x58\x54\x44\x75\x75\x35\xab\x1f\
-\x59\x43\x61\x51\x11\xb9\xb9\xb9\x33\x6b\xa0\xaa\x2a\x43\x43\x43\
-\xf4\x74\xbb\x68\x69\x69\xe1\x58\x43\x03\x1d\x57\xae\x18\xfd\x56\
-\xab\x95\xed\xcf\x3f\xcf\xf3\x2f\xec\x30\x8e\x29\x9a\xa6\x31\x32\
-\x3c\xcc\x57\x87\x0e\x51\x5f\x5f\x4f\x7b\xdb\x25\x88\x6e\xc3\x6b\
-\xab\xaa\xf8\xf5\x6f\x5f\x25\x2f\x2f\xcf\xa8\x61\xd8\x53\xc0\xef\
-\xa7\xe1\x68\x03\xef\xbf\xf7\x3e\x63\xd1\x10\x6c\x36\x9b\x79\xf0\
-\xa1\x1f\xb1\x6d\xdb\xb3\x6c\xda\xb2\x19\xbb\xdd\x4e\x4a\x4a\x8a\
-\x31\x78\x1a\xa2\x28\x92\x9a\x9a\x4a\xc1\x82\x05\x54\xdc\x57\x41\
-\x46\x46\x26\x01\xbf\x9f\xef\x07\x06\xd0\x34\x8d\x50\x28\xc4\xb5\
-\x6b\xd7\xc8\xca\x8e\x9c\x95\x88\xce\x52\x72\x4a\x0a\x8b\xef\xbd\
-\x17\x9b\xcd\x46\x8f\xcb\xc5\xe8\xe8\x68\x24\x67\x8c\x8c\x90\x96\
-\x96\x66\x24\x31\xa6\x85\x6a\x9a\x46\x8f\xcb\xc5\x9b\xaf\xbf\xc1\
-\xb5\xe9\xdd\xc2\x62\x61\x6d\x55\x15\x2f\xbd\xbc\x93\x47\xd6\xae\
-\x45\x51\xa2\x0b\xea\x0e\x50\x14\x85\x45\x76\x3b\x45\x76\x7b\x24\
-\xc1\x77\x46\xb6\xde\x80\xdf\xcf\xe0\xe0\x20\xf7\x57\xae\x20\x23\
-\x23\xc3\xe0\x9b\x4c\x26\xe6\x17\x14\x60\xb1\x58\x38\x77\xee\x1c\
-\xc1\x40\x80\x70\x38\xcc\xcd\x1b\x37\x58\xf9\xc0\x03\x46\x14\x14\
-\x01\xbc\x1e\x0f\xff\x3c\x72\x84\x4b\x97\x22\xaf\xdf\x64\x32\x51\
-\x56\x5e\xce\xce\x5f\xbc\x1c\xf3\x54\xff\x2d\x4c\x8a\x42\x59\x79\
-\x39\x2f\xee\x7c\x89\x65\xcb\x23\xdf\x9a\xaa\xaa\xf4\xb8\x5c\xec\
-\xff\xeb\xdf\x6e\x0b\x2a\xc9\xc9\xc9\xd4\x3c\xfa\x63\xaa\x6b\xaa\
-\x0d\x6e\xff\xf5\x7e\x1a\x8e\x1e\x35\x38\xa2\xa6\x69\x0c\x0c\x0c\
-\x70\xa0\xfe\x00\x44\xa7\x24\x3b\x3b\x9b\xa7\x7f\xfe\x0c\xa5\x65\
-\x65\x06\xf1\x7f\x85\x2c\xcb\x14\x2f\x5e\xcc\x73\x3b\x76\x18\x6f\
-\xd0\xe7\xf3\xf1\xf5\xf1\xe3\xf4\xb8\x7a\xe2\xe9\x58\xad\x56\x9e\
-\x78\x62\xbd\x71\x22\xf5\x79\x7d\x9c\x6e\x39\x6d\xb8\x89\x18\x0c\
-\x06\x69\xbd\x70\x81\xbe\xde\x5e\x88\x4e\xf9\x83\x0f\x3d\x44\x75\
-\x4d\x4d\x4c\xa1\xff\x07\x66\xb3\x99\xca\xca\x95\xd4\x3c\xfa\x28\
-\x4c\x2f\xa0\x91\x11\x23\x0f\xcc\x84\xc9\x64\xa2\xb0\xa8\x90\x92\
-\xe8\x37\x1c\x0e\x87\xe9\xeb\xed\xc5\xef\xf3\x03\x20\x7a\xbd\xde\
-\x98\x81\x56\xab\x95\xda\x0d\xb5\x46\x72\xba\x5b\x58\x6d\x56\xd6\
-\x3d\xb1\xce\x58\xed\x3e\x9f\x8f\x96\x96\xe6\x78\x1a\x00\x96\x39\
-\x73\xb8\x6f\xe9\x52\xe3\x5a\x55\x55\xc6\xa3\x21\x48\x0c\x06\x02\
-\xb4\x45\xad\x41\x92\x24\xf2\xe6\xce\xa5\xac\xbc\xdc\x20\xdf\x2d\
-\x64\x59\xa6\x60\xc1\x02\x8a\x17\x2f\x86\x68\x12\xeb\x71\xf5\x30\
-\x31\x31\x11\x4f\x45\x51\x14\x0a\x8b\x6e\xa5\x7e\x4d\xd3\xf0\xfb\
-\x7d\x00\x88\x53\x53\x53\x0c\x0d\x0d\x19\xc4\x85\x85\x0b\x6f\xfb\
-\x4b\xe6\x6e\x61\x31\x5b\x70\x96\xde\x3a\xb7\x87\xc3\x61\x06\x12\
-\x1c\x51\x14\x45\xa1\xbc\xbc\x82\x1d\x2f\xbe\xc0\x8e\x17\x5f\x60\
-\xd3\xe6\xcd\xa4\x59\xad\x00\x08\x83\x83\x83\xfa\x9b\xaf\xbf\x01\
-\x40\x92\xd9\xcc\x8a\x15\xf7\xb3\x7e\xc3\x86\xb8\x12\x77\x87\x80\
-\x3f\xc0\x89\x13\x27\x38\x7a\xe4\x08\x00\xb6\xf4\x74\x9e\x7a\x7a\
-\x2b\x8b\x12\x9c\x68\x67\x83\x10\x0e\x87\xf5\xd1\x91\x48\x86\x14\
-\xc4\xc8\x56\x99\xc8\xd4\xef\x06\xba\xae\x13\x08\x04\xf0\x4c\x44\
-\x32\xa8\x28\x89\xa4\xa5\xa5\xfd\xe0\x19\x29\x1e\xff\x01\x68\xea\
-\xe3\xec\xbc\x39\x77\xcf\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\x0c\xdd\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x29\x00\x00\x00\x2a\x08\x06\x00\x00\x00\x2e\xf4\x72\x58\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc4\x00\x00\x0e\xc4\x01\x95\x2b\
-\x0e\x1b\x00\x00\x0c\x72\x49\x44\x41\x54\x58\x47\xcd\x98\x7b\x4c\
-\xd3\xd7\xff\xc6\x9f\xde\x28\x94\xda\x52\x29\x94\x6b\xa9\xdc\x04\
-\xa4\x30\xa3\x53\x18\xe0\x0c\xc6\x29\x3a\x35\x8a\xb2\x6c\xa2\xb2\
-\xcd\x65\xec\x96\x2c\x59\x74\x89\xc9\xf6\xd7\xb2\xcc\x2c\x59\x8c\
-\x0c\x75\x57\x05\x17\xdd\x4c\x74\x6e\xc9\xe6\xa6\x13\x41\x41\xe7\
-\x28\xce\x0a\x22\xcc\x21\x20\x20\x05\x8a\x08\x6d\x69\x0b\x2d\xcf\
-\xf7\x0f\xa4\x3f\x5a\x2e\xba\x65\x7f\xfc\x5e\x7f\xb6\xcf\x79\x7f\
-\x9e\xcf\x39\xe7\x73\xce\x73\x8e\x80\x24\xf1\xff\x1c\xc1\xbf\x35\
-\x39\x34\x34\x84\xae\xae\x2e\xf4\xf6\xf6\xe2\xee\xdd\xbb\x68\x6b\
-\x6b\x83\xcd\x66\xf3\xd2\x84\x85\x85\x21\x2e\x2e\x0e\x71\x71\x71\
-\x88\x8d\x8d\x85\xbf\xbf\xbf\xd7\xff\x8f\xcb\x3f\x36\xd9\xd5\xd5\
-\x05\x83\xc1\x80\x9a\x9a\x1a\xdc\xb9\x73\x07\xfd\xfd\xfd\xb8\x77\
-\xef\x1e\x3a\x3b\x3b\x61\xb7\xdb\x31\xb9\x5c\x68\x68\x28\xb4\x5a\
-\x2d\xb4\x5a\x2d\x62\x63\x63\x11\x1b\x1b\x0b\xbd\x5e\x8f\x85\x0b\
-\x17\x22\x30\x30\xd0\xab\xee\x6c\x3c\xb6\xc9\xde\xde\x5e\x54\x56\
-\x56\xa2\xa2\xa2\x02\xb5\xb5\xb5\xb8\x75\xeb\x16\xec\x76\x3b\x00\
-\x20\x3c\x3c\x1c\x3a\x9d\x0e\x32\x99\x0c\x02\x81\x00\x0e\x87\x03\
-\xc3\xc3\xc3\xb0\xdb\xed\xe8\xe9\xe9\xc1\xe0\xe0\x20\x04\x02\x01\
-\x34\x1a\x0d\xe6\xcf\x9f\x8f\xdc\xdc\x5c\x6c\xd8\xb0\x01\x89\x89\
-\x89\xf0\xf3\xf3\xf3\x7d\xd4\x14\x1e\x69\xd2\xe5\x72\xa1\xba\xba\
-\x1a\x3f\xfc\xf0\x03\x7e\xfb\xed\x37\xdc\xbe\x7d\x1b\x4e\xa7\x13\
-\x29\x29\x29\xd0\xeb\xf5\x88\x8f\x8f\x47\x6c\x6c\x2c\xa2\xa3\xa3\
-\x11\x10\x10\x00\x00\x18\x19\x19\x81\xdd\x6e\x87\xc3\xe1\x80\xd9\
-\x6c\x86\xd1\x68\x44\x5d\x5d\x1d\xea\xeb\xeb\x61\xb7\xdb\xa1\x56\
-\xab\x91\x9d\x9d\x8d\xf5\xeb\xd7\x63\xcd\x9a\x35\x08\x09\x09\x81\
-\x50\x28\xf4\x7d\xb4\x87\x59\x4d\x9a\xcd\x66\x9c\x3a\x75\x0a\x27\
-\x4e\x9c\xc0\xef\xbf\xff\x0e\x9b\xcd\x86\x45\x8b\x16\x21\x3b\x3b\
-\x1b\x59\x59\x59\x48\x49\x49\xf1\xea\xc1\x99\xe8\xe8\xe8\xc0\xcd\
-\x9b\x37\x51\x57\x57\x87\xaa\xaa\x2a\x5c\xb9\x72\x05\x56\xab\x15\
-\x89\x89\x89\x58\xbd\x7a\x35\x0a\x0b\x0b\x91\x96\x96\x06\xa9\x54\
-\xea\xdb\x14\x98\xcd\xe4\xbd\x7b\xf7\xf0\xd5\x57\x5f\xa1\xac\xac\
-\x0c\x6d\x6d\x6d\x08\x0e\x0e\x46\x5e\x5e\x1e\x36\x6e\xdc\x88\xcc\
-\xcc\x4c\xa8\xd5\x6a\xcf\xdb\x4f\x18\x30\x99\x4c\x18\x1c\x1c\x44\
-\x60\x60\xa0\x67\x68\xf5\x7a\x3d\x14\x0a\x05\x04\x02\x01\x6c\x36\
-\x1b\x8c\x46\x23\xaa\xaa\xaa\xf0\xd3\x4f\x3f\xe1\xda\xb5\x6b\x10\
-\x08\x04\x58\xbe\x7c\x39\xde\x7e\xfb\x6d\x64\x67\x67\x7b\x46\xc3\
-\x0b\x4e\xc3\xdd\xbb\x77\xb9\x7b\xf7\x6e\x86\x87\x87\x53\x20\x10\
-\x30\x35\x35\x95\x7b\xf7\xee\xe5\xed\xdb\xb7\x39\x3a\x3a\xea\xd1\
-\xb5\xb6\xb6\xf2\xc0\x81\x03\xdc\xbc\x79\x33\x13\x12\x12\x18\x14\
-\x14\x44\x91\x48\x44\xb9\x5c\x4e\x9d\x4e\xc7\xdc\xdc\x5c\xbe\xf3\
-\xce\x3b\x3c\x73\xe6\x0c\x2d\x16\x8b\xa7\x9d\xd5\x6a\xe5\xb9\x73\
-\xe7\xb8\x65\xcb\x16\xce\x99\x33\x87\x00\xb8\x7c\xf9\x72\x5e\xb8\
-\x70\x81\x0e\x87\xc3\xa3\x9b\x60\x8a\xc9\xfb\xf7\xef\xf3\xbd\xf7\
-\xde\x63\x48\x48\x08\x01\x30\x2b\x2b\x8b\x65\x65\x65\x1c\x18\x18\
-\xf0\xd2\x55\x57\x57\xb3\xb8\xb8\x98\x91\x91\x91\x14\x89\x44\xf4\
-\xf7\xf7\x67\x6c\x6c\x2c\x33\x33\x33\xa9\xd7\xeb\xa9\x52\xa9\x28\
-\x14\x0a\xe9\xef\xef\xcf\xcc\xcc\x4c\x96\x96\x96\xd2\x6c\x36\x7b\
-\xd5\xa8\xad\xad\xe5\x2b\xaf\xbc\x42\x95\x4a\x45\x00\x5c\xbf\x7e\
-\x3d\xaf\x5f\xbf\x4e\x97\xcb\xe5\xa5\xf3\x32\x39\x3a\x3a\xca\x92\
-\x92\x12\xc6\xc4\xc4\x50\x20\x10\x30\x23\x23\x83\x27\x4f\x9e\xf4\
-\xea\x05\x92\xac\xab\xab\x63\x7e\x7e\x3e\xe5\x72\x39\x83\x82\x82\
-\xb8\x69\xd3\x26\x7e\xf4\xd1\x47\x3c\x76\xec\x18\xcf\x9e\x3d\xcb\
-\xd3\xa7\x4f\xf3\xe0\xc1\x83\x7c\xeb\xad\xb7\x98\x90\x90\x40\xb1\
-\x58\xcc\xf8\xf8\x78\x7e\xfe\xf9\xe7\x7c\xf0\xe0\x81\x57\xad\x5b\
-\xb7\x6e\xf1\xa5\x97\x5e\xa2\x52\xa9\xa4\x54\x2a\xe5\x1b\x6f\xbc\
-\xc1\xce\xce\x4e\x2f\x8d\x97\xc9\x4b\x97\x2e\x71\xd1\xa2\x45\x14\
-\x89\x44\x4c\x49\x49\xe1\xf1\xe3\xc7\xa7\x18\xb4\x58\x2c\x7c\xed\
-\xb5\xd7\xa8\x54\x2a\xa9\x52\xa9\xf8\xee\xbb\xef\xf2\xda\xb5\x6b\
-\xd3\x0e\x53\x57\x57\x17\xcb\xcb\xcb\x99\x9e\x9e\x4e\xb1\x58\x4c\
-\xbd\x5e\xcf\xea\xea\x6a\xaf\x29\x43\x92\x46\xa3\x91\x1b\x37\x6e\
-\x64\x60\x60\x20\xd5\x6a\x35\x0f\x1f\x3e\xcc\xa1\xa1\x21\xcf\xff\
-\x1e\x93\x03\x03\x03\xdc\xb1\x63\x07\xe5\x72\x39\x95\x4a\x25\xf7\
-\xef\xdf\x3f\x65\x88\x49\xf2\xd7\x5f\x7f\x65\x52\x52\x12\x05\x02\
-\x01\x8b\x8b\x8b\xd9\xda\xda\xca\xb1\xb1\x31\x5f\x99\x07\xa7\xd3\
-\xc9\x43\x87\x0e\x31\x2a\x2a\x8a\x00\xb8\x67\xcf\x1e\xf6\xf4\xf4\
-\xf8\xca\x78\xe9\xd2\x25\x2e\x59\xb2\x84\x62\xb1\x98\x39\x39\x39\
-\xbc\x71\xe3\x06\xdd\x6e\x37\x39\xd9\xe4\xe9\xd3\xa7\x19\x1b\x1b\
-\x4b\x00\x2c\x2c\x2c\x64\x7b\x7b\xfb\xe4\x1a\x1e\x8a\x8b\x8b\xa9\
-\x50\x28\x98\x90\x90\xc0\x8b\x17\x2f\x4e\xe9\x95\xe9\x30\x9b\xcd\
-\xdc\xb4\x69\x13\x03\x02\x02\xb8\x70\xe1\x42\x36\x34\x34\xf8\x4a\
-\x48\x92\x1f\x7f\xfc\x31\xc3\xc2\xc2\x28\x95\x4a\xbd\x3a\x49\x08\
-\x00\x76\xbb\x1d\x27\x4e\x9c\x80\xc9\x64\x82\x56\xab\x45\x61\x61\
-\x21\x34\x1a\x8d\xef\x42\x00\x9b\xcd\x86\x86\x86\x06\x58\xad\x56\
-\x2c\x5b\xb6\x0c\xf3\xe6\xcd\x83\x58\x2c\xf6\x95\x4d\x21\x38\x38\
-\x18\x39\x39\x39\x08\x0a\x0a\x42\x73\x73\x33\xfa\xfa\xfa\xe0\x76\
-\xbb\x7d\x65\xd8\xb2\x65\x0b\x52\x53\x53\x41\xd2\xe3\x07\x00\x84\
-\x00\xd0\xd8\xd8\x88\xeb\xd7\xaf\x63\x78\x78\x18\xab\x57\xaf\xc6\
-\x82\x05\x0b\xa6\x5d\x58\xcd\x66\x33\xac\x56\x2b\xc6\xc6\xc6\x10\
-\x1f\x1f\x0f\x99\x4c\xe6\x2b\x99\x91\x05\x0b\x16\x40\x2e\x97\x63\
-\x78\x78\x18\xdd\xdd\xdd\x18\x19\x19\xf1\x95\x20\x26\x26\x06\xeb\
-\xd6\xad\x43\x70\x70\x30\xea\xea\xea\x70\xe3\xc6\x0d\xd8\xed\xf6\
-\x71\x93\x97\x2f\x5f\xc6\x83\x07\x0f\x20\x97\xcb\x91\x97\x97\x07\
-\xb5\x5a\xed\xdb\x1e\x00\xe0\x76\xbb\x3d\x01\x42\x28\x14\xce\xba\
-\xcb\xf8\x22\x93\xc9\x20\x12\x89\x80\x87\xdb\xe6\xd8\xd8\x98\xaf\
-\x04\x00\xf0\xec\xb3\xcf\x22\x34\x34\x14\x76\xbb\x1d\x55\x55\x55\
-\x18\x18\x18\x18\x37\x59\x57\x57\x87\xc1\xc1\x41\x24\x25\x25\x21\
-\x31\x31\x71\xc6\x48\x15\x14\x14\x04\x89\x44\x02\x3c\xdc\x91\x1c\
-\x0e\x87\xaf\x64\x46\xba\xbb\xbb\xe1\x74\x3a\x81\x87\xc3\x3f\x51\
-\xc7\x97\x98\x98\x18\x24\x25\x25\x21\x20\x20\x00\x57\xaf\x5e\xc5\
-\x83\x07\x0f\xc6\x4d\xb6\xb7\xb7\xc3\x6e\xb7\x63\xd1\xa2\x45\x50\
-\x2a\x95\xbe\xed\x3c\x28\x14\x0a\xe8\x74\x3a\xf8\xfb\xfb\x7b\x0a\
-\x3c\x2e\x57\xae\x5c\xc1\xc0\xc0\x00\xc2\xc3\xc3\xa1\xd1\x68\x66\
-\x34\x29\x12\x89\x90\x9d\x9d\x0d\x95\x4a\x85\xbf\xfe\xfa\x0b\x56\
-\xab\x75\xdc\xa4\xd3\xe9\xc4\xd8\xd8\x18\x52\x53\x53\x21\x97\xcb\
-\x7d\xdb\x79\x10\x8b\xc5\x58\xb1\x62\x05\x82\x83\x83\x51\x5f\x5f\
-\x8f\x0b\x17\x2e\x60\x70\x70\xd0\x57\x36\x85\xab\x57\xaf\xe2\xe2\
-\xc5\x8b\xb0\x58\x2c\x58\xb9\x72\x25\x34\x1a\xcd\xac\x53\x25\x39\
-\x39\x19\x72\xb9\x1c\x16\x8b\xe5\xff\xe6\xe4\x04\xe1\xe1\xe1\xd3\
-\x7e\x30\x93\xc9\xcb\xcb\x43\x72\x72\x32\x46\x47\x47\xf1\xd9\x67\
-\x9f\xe1\xec\xd9\xb3\xb0\x5a\xad\xbe\x32\x0f\xf5\xf5\xf5\xd8\xb7\
-\x6f\x1f\x9a\x9b\x9b\x11\x15\x15\x85\xcd\x9b\x37\x23\x34\x34\xd4\
-\x57\xe6\x45\x44\x44\x84\xc7\x87\xc3\xe1\xf0\x36\x39\x67\xce\x9c\
-\x47\x2e\x29\x31\x31\x31\xd8\xb1\x63\x07\x74\x3a\x1d\x1a\x1a\x1a\
-\xf0\xc9\x27\x9f\xa0\xa4\xa4\x04\xe7\xcf\x9f\x47\x6b\x6b\x2b\x6c\
-\x36\x1b\x7a\x7a\x7a\x60\x30\x18\x70\xe4\xc8\x11\x7c\xf0\xc1\x07\
-\x38\x73\xe6\x0c\x48\xa2\xa8\xa8\x08\x19\x19\x19\x33\xce\xf9\x09\
-\x34\x1a\x8d\xc7\xe4\xc8\xc8\x08\xbc\x1c\x89\xc5\xe2\x59\x87\x61\
-\x82\x75\xeb\xd6\xc1\x62\xb1\x60\xff\xfe\xfd\x30\x18\x0c\xb8\x73\
-\xe7\x0e\x12\x13\x13\x11\x1d\x1d\x0d\xb5\x5a\x0d\x9b\xcd\x06\x93\
-\xc9\x84\xe6\xe6\x66\x74\x74\x74\xc0\xdf\xdf\x1f\x45\x45\x45\x28\
-\x2c\x2c\x44\x70\x70\xb0\x6f\xb9\x29\x04\x06\x06\x7a\x56\x02\x97\
-\xcb\xe5\xdd\x93\x36\x9b\x6d\xda\x45\xd6\x97\x80\x80\x00\x44\x44\
-\x44\x78\xc2\x6e\x6f\x6f\x2f\xaa\xab\xab\x71\xfc\xf8\x71\x94\x94\
-\x94\xe0\xeb\xaf\xbf\xc6\xcf\x3f\xff\x8c\x96\x96\x96\xf1\x9e\x10\
-\x8b\xa1\xd5\x6a\x67\x9d\xef\x93\x71\x38\x1c\x1e\x1f\x22\x91\xc8\
-\xdb\xe4\xfd\xfb\xf7\x31\x3a\x3a\x3a\xf9\xa7\x29\x74\x76\x76\xe2\
-\xd0\xa1\x43\xd8\xb7\x6f\x1f\x5a\x5a\x5a\xe0\x72\xb9\x20\x16\x8b\
-\x11\x15\x15\x85\x27\x9e\x78\x02\xcb\x96\x2d\xc3\xd2\xa5\x4b\x91\
-\x94\x94\x04\x85\x42\x01\xa1\x50\x08\x8b\xc5\x82\x6f\xbe\xf9\x06\
-\x7b\xf7\xee\x85\xc1\x60\x78\xe4\xd2\x35\xd9\x87\x44\x22\xf1\x1e\
-\xee\xae\xae\x2e\x38\x1c\x8e\x19\x4f\x72\x06\x83\x01\x47\x8f\x1e\
-\xc5\xc9\x93\x27\xd1\xdd\xdd\x8d\xf0\xf0\x70\xac\x5e\xbd\x1a\x7a\
-\xbd\x1e\xd1\xd1\xd1\x50\xa9\x54\x90\xcb\xe5\x18\x1d\x1d\x85\xc5\
-\x62\x41\x4f\x4f\x0f\xda\xdb\xdb\xf1\xc7\x1f\x7f\xa0\xb6\xb6\x16\
-\x2d\x2d\x2d\x68\x6a\x6a\xc2\xf6\xed\xdb\xb1\x66\xcd\x9a\x19\x97\
-\xbb\x8e\x8e\x0e\xcf\x8b\xf8\xf9\xf9\x8d\x27\xf3\x9c\x9c\x1c\x0a\
-\x04\x02\xbe\xf0\xc2\x0b\x6c\x6b\x6b\xf3\xdd\xf7\xc9\x87\x21\xf7\
-\xb9\xe7\x9e\xa3\x42\xa1\x20\x00\xae\x5a\xb5\x8a\xa5\xa5\xa5\x6c\
-\x68\x68\x98\x36\xa6\x4d\xd0\xdf\xdf\xcf\xca\xca\x4a\xbe\xff\xfe\
-\xfb\x8c\x8b\x8b\xa3\x48\x24\x62\x7a\x7a\x3a\xbf\xfc\xf2\xcb\x69\
-\x53\x16\x49\x7e\xfa\xe9\xa7\x8c\x88\x88\x60\x40\x40\x00\x6b\x6a\
-\x6a\xc6\x53\xd0\xb6\x6d\xdb\x28\x93\xc9\x98\x98\x98\x48\xa3\xd1\
-\xe8\xdb\x86\x0d\x0d\x0d\x2c\x28\x28\xa0\x5c\x2e\xa7\x5c\x2e\xe7\
-\xd6\xad\x5b\x59\x55\x55\xc5\xe1\xe1\x61\x5f\xe9\x8c\xdc\xbf\x7f\
-\x9f\x5f\x7c\xf1\x05\xd3\xd2\xd2\x28\x91\x48\x98\x9a\x9a\xca\xef\
-\xbe\xfb\x6e\x4a\x5e\x25\xc9\xa2\xa2\x22\x06\x06\x06\x32\x3d\x3d\
-\x9d\x0d\x0d\x0d\xe3\x26\x0f\x1e\x3c\xc8\xc8\xc8\x48\x4a\xa5\x52\
-\x9e\x38\x71\xc2\xeb\xe1\x66\xb3\x99\xaf\xbf\xfe\x3a\x83\x82\x82\
-\x28\x16\x8b\xb9\x73\xe7\x4e\xde\xb8\x71\x83\x23\x23\x23\x93\xeb\
-\x3e\x16\x36\x9b\x8d\xe5\xe5\xe5\x4c\x4e\x4e\xa6\x48\x24\x62\x46\
-\x46\x06\x6b\x6a\x6a\xbc\x6a\xb5\xb5\xb5\x71\xe9\xd2\xa5\x14\x0a\
-\x85\x7c\xf5\xd5\x57\xd9\xd9\xd9\x39\x6e\xb2\xb1\xb1\x91\x0b\x17\
-\x2e\xa4\x40\x20\xe0\xb6\x6d\xdb\xbc\xb2\x64\x79\x79\x39\xb5\x5a\
-\x2d\x01\x70\xed\xda\xb5\x34\x18\x0c\x8f\x95\x21\x67\xc2\x66\xb3\
-\xb1\xa4\xa4\x84\x91\x91\x91\x04\xc0\x37\xdf\x7c\x93\x5d\x5d\x5d\
-\x9e\xff\x4b\x4b\x4b\x19\x11\x11\x41\x91\x48\xc4\xb2\xb2\x32\x5a\
-\xad\xd6\x71\x93\x23\x23\x23\x9e\x30\x1b\x16\x16\xc6\x5f\x7e\xf9\
-\x85\x4e\xa7\x93\x7d\x7d\x7d\x5c\xb7\x6e\x1d\xa5\x52\x29\x75\x3a\
-\x1d\x7f\xfc\xf1\x47\xda\xed\xf6\xc9\xcf\xfc\x57\x98\xcd\x66\x16\
-\x14\x14\x50\x26\x93\x31\x32\x32\x92\x95\x95\x95\x1c\x1d\x1d\xa5\
-\xc9\x64\x62\x5e\x5e\x1e\xa5\x52\x29\x17\x2f\x5e\xcc\x3f\xff\xfc\
-\x93\x6e\xb7\x7b\x3c\xf4\x4a\x24\x12\xe4\xe7\xe7\x43\xa3\xd1\xc0\
-\x64\x32\xe1\xd8\xb1\x63\x30\x99\x4c\xa8\xa9\xa9\xc1\xcd\x9b\x37\
-\xe1\x74\x3a\xb1\x61\xc3\x06\x2c\x5e\xbc\xf8\x91\xbb\xc5\xe3\x10\
-\x1c\x1c\x8c\x82\x82\x02\x68\x34\x1a\x74\x75\x75\xe1\xf2\xe5\xcb\
-\x18\x1a\x1a\xc2\xc9\x93\x27\x61\x34\x1a\xe1\x76\xbb\xb1\x75\xeb\
-\x56\xe8\x74\xba\xf1\xb3\xfd\xc4\xdb\x0d\x0d\x0d\xb1\xb8\xb8\xd8\
-\x73\xc0\x3a\x70\xe0\x00\x5f\x7e\xf9\x65\xaa\x54\x2a\x86\x86\x86\
-\x7a\x7a\xf7\xbf\xa2\xbf\xbf\x9f\x2b\x56\xac\xa0\x58\x2c\xe6\x33\
-\xcf\x3c\xc3\x63\xc7\x8e\x31\x2b\x2b\x8b\x12\x89\x84\x59\x59\x59\
-\x34\x1a\x8d\x53\xcf\x38\x24\x69\x30\x18\x98\x99\x99\x49\xb1\x58\
-\xcc\xb4\xb4\x34\x6a\xb5\x5a\x4a\x24\x12\x3e\xfd\xf4\xd3\x6c\x6a\
-\x6a\x9a\x2c\xfd\x4f\xd8\xb5\x6b\x17\x55\x2a\x15\xd5\x6a\x35\x9f\
-\x7c\xf2\x49\xce\x99\x33\x87\x61\x61\x61\x2c\x2b\x2b\x9b\xfe\xb4\
-\x48\x92\x2e\x97\x8b\x87\x0f\x1f\x66\x5c\x5c\x1c\x85\x42\x21\x01\
-\x10\x00\x5f\x7c\xf1\x45\xde\xbd\x7b\x77\xb2\xf4\x3f\xe1\xc8\x91\
-\x23\x9e\x8f\x12\x00\xa5\x52\x29\x77\xef\xde\xcd\xee\xee\x6e\x2f\
-\x9d\xd7\xb6\x28\x12\x89\x90\x9f\x9f\x8f\x9d\x3b\x77\x7a\xc5\x29\
-\x7f\x7f\xff\x59\x6f\xbd\xfe\x2d\x32\x99\xcc\xab\xee\xda\xb5\x6b\
-\xb1\x7d\xfb\x76\x84\x84\x84\x78\xe9\xa6\x5c\xb3\x90\xe4\xbd\x7b\
-\xf7\xb8\x67\xcf\x1e\xcf\x55\x4b\x5a\x5a\x1a\x3f\xfc\xf0\x43\xb6\
-\xb6\xb6\x4e\xb9\x02\xf9\x37\xb8\x5c\x2e\x56\x54\x54\xf0\xf9\xe7\
-\x9f\xf7\xdc\x5c\xe4\xe7\xe7\xf3\xd2\xa5\x4b\xd3\xee\x5e\xd3\x9a\
-\xe4\xc3\x4b\xab\x5d\xbb\x76\x51\xad\x56\x13\x00\xc3\xc3\xc3\x59\
-\x54\x54\xc4\x53\xa7\x4e\xb1\xaf\xaf\xcf\x33\xa9\xff\x29\x4d\x4d\
-\x4d\x2c\x2d\x2d\x65\x6e\x6e\x2e\x65\x32\x19\xe7\xce\x9d\xcb\xe2\
-\xe2\x62\x1a\x0c\x86\x19\x3f\xcc\x19\xaf\xfe\x00\xa0\xb5\xb5\x15\
-\xdf\x7e\xfb\x2d\x8e\x1e\x3d\x8a\xbf\xff\xfe\x1b\x00\xa0\xd7\xeb\
-\xf1\xd4\x53\x4f\x61\xc9\x92\x25\x58\xb0\x60\x01\x12\x12\x12\x20\
-\x97\xcb\x67\xcd\xa1\x26\x93\x09\x2d\x2d\x2d\xa8\xad\xad\xc5\xd5\
-\xab\x57\x51\x53\x53\x83\xee\xee\x6e\xa4\xa5\xa5\xa1\xa0\xa0\x00\
-\x5b\xb6\x6c\x41\x4c\x4c\x8c\x27\x43\xfa\x32\xab\x49\x00\x18\x18\
-\x18\xc0\xb9\x73\xe7\xf0\xfd\xf7\xdf\xe3\xfc\xf9\xf3\x30\x9b\xcd\
-\x90\x48\x24\x98\x37\x6f\x1e\xe2\xe3\xe3\xa1\xd3\xe9\xa0\xd1\x68\
-\x30\x77\xee\x5c\xa8\x54\x2a\x28\x95\x4a\xb8\xdd\x6e\x0c\x0f\x0f\
-\xc3\x6a\xb5\xa2\xbb\xbb\x1b\xed\xed\xed\x68\x6b\x6b\x43\x7d\x7d\
-\x3d\xcc\x66\x33\x42\x42\x42\xb0\x6a\xd5\x2a\x6c\xdc\xb8\x11\xb9\
-\xb9\xb9\x50\x28\x14\xbe\x8f\xf5\xe2\x91\x26\xf1\xf0\xbc\xdd\xd8\
-\xd8\x88\xaa\xaa\x2a\x54\x54\x54\xc0\x68\x34\xa2\xa3\xa3\xc3\x93\
-\xf9\x64\x32\x19\x94\x4a\x25\x94\x4a\x25\x14\x0a\x05\xdc\x6e\x37\
-\xec\x76\x3b\x86\x87\x87\xd1\xdb\xdb\x0b\xbb\xdd\x0e\x3f\x3f\x3f\
-\xcc\x9f\x3f\x1f\xe9\xe9\xe9\xc8\xc8\xc8\xc0\xca\x95\x2b\xa1\xd3\
-\xe9\x66\x3c\x35\x4e\xe6\xb1\x4c\x4e\xe0\x74\x3a\xd1\xd8\xd8\x88\
-\xa6\xa6\x26\x74\x74\x74\xa0\xb9\xb9\x19\x2d\x2d\x2d\x30\x99\x4c\
-\xe8\xed\xed\xc5\xd0\xd0\x90\x27\x51\xcb\xe5\x72\x84\x85\x85\x21\
-\x2a\x2a\x0a\xd1\xd1\xd1\x48\x4e\x4e\x46\x4a\x4a\x0a\x92\x93\x93\
-\xa1\xd3\xe9\x1e\xeb\x42\x7f\x82\x7f\x64\x72\x32\x2e\x97\x0b\x1d\
-\x1d\x1d\x68\x6f\x6f\x47\x5f\x5f\x1f\xfa\xfb\xfb\x61\xb5\x5a\x3d\
-\x26\x03\x03\x03\x11\x12\x12\x82\xb0\xb0\x30\x44\x44\x44\x40\xab\
-\xd5\x3e\xf2\x24\x3a\x13\xff\x03\x55\x35\x25\xcf\xbd\xd5\x80\xb3\
-\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\x60\x82\
-\x00\x00\x11\xe3\
-\x89\
-\x50\x4e\x47\x0d\x0a\x1a\x0a\x00\x00\x00\x0d\x49\x48\x44\x52\x00\
-\x00\x00\x41\x00\x00\x00\x4c\x08\x06\x00\x00\x00\x32\x69\xda\x9b\
-\x00\x00\x00\x01\x73\x52\x47\x42\x00\xae\xce\x1c\xe9\x00\x00\x00\
-\x04\x67\x41\x4d\x41\x00\x00\xb1\x8f\x0b\xfc\x61\x05\x00\x00\x00\
-\x09\x70\x48\x59\x73\x00\x00\x0e\xc3\x00\x00\x0e\xc3\x01\xc7\x6f\
-\xa8\x64\x00\x00\x11\x78\x49\x44\x41\x54\x78\x5e\xdd\x9c\x79\x78\
-\x54\x45\xba\xc6\x7f\xa7\x97\xec\x49\x27\x9d\xd0\x09\x10\xc2\x22\
-\x04\x02\x08\x04\x93\x80\x66\x20\xe4\xa2\x8e\x17\x97\xb8\x80\xc4\
-\x61\x11\x10\x14\x87\x25\x33\x41\xb8\x32\x6e\x88\x3a\xc3\x08\x78\
-\xbd\x83\xa2\x92\x07\x74\x44\x40\x30\x02\x71\xc4\x3b\xe8\xa8\x8c\
-\x82\x66\x69\x20\x44\xbc\x04\xc1\x28\x10\xb3\xc0\x04\x08\x9d\x98\
-\x4e\x27\xa7\xeb\xfe\x91\xee\xce\xe9\xd3\x27\x0b\x5b\xbc\x97\xf7\
-\x79\xde\xe7\x54\x7d\xf5\x55\xd5\x57\x6f\x2d\xa7\x3a\x47\x91\x8a\
-\x8b\x8b\x05\x5d\x0c\xbb\xdd\xce\xae\x5d\xbb\x28\x29\x29\xc1\x68\
-\x34\x72\xe3\x8d\x37\x92\x9e\x9e\x8e\x4e\xa7\x53\xbb\x76\x09\xba\
-\xbc\xd7\x8a\x8a\x0a\xa6\x4f\x9f\x4e\x65\x65\x25\x19\x19\x19\x8c\
-\x1f\x3f\x9e\x3d\x7b\xf6\x30\x6f\xde\x3c\x1a\x1a\x1a\xd4\xee\x5d\
-\x02\xa9\x2b\x57\x82\x10\x82\xac\xac\x2c\xa6\x4e\x9d\x4a\x4a\x4a\
-\x8a\x57\xd9\xc6\x8d\x1b\x29\x2f\x2f\x67\xe9\xd2\xa5\x5e\xf6\xae\
-\x40\x97\x8a\x80\x4b\x08\x49\x92\xd4\x66\x64\x59\xe6\xde\x7b\xef\
-\x25\x37\x37\x17\xa3\xd1\xa8\x2e\xbe\xaa\xe8\xf2\xed\xa0\x25\x00\
-\x80\x5e\xaf\xa7\x57\xaf\x5e\x54\x57\x57\xab\x8b\xae\x3a\xba\x5c\
-\x84\xf6\x70\xe6\xcc\x19\x22\x22\x22\xd4\xe6\xab\x8e\xff\x33\x22\
-\x7c\xf5\xd5\x57\x58\x2c\x16\x82\x83\x83\xd5\x45\x57\x1d\xbf\xb8\
-\x08\x0d\x0d\x0d\xe4\xe5\xe5\xb1\x72\xe5\xca\x5f\xe4\x50\xe4\x97\
-\x14\x41\x96\x65\xd2\xd2\xd2\xb8\xe5\x96\x5b\x38\x7a\xf4\x28\xeb\
-\xd7\xaf\xa7\x47\x8f\x1e\x6a\xb7\x2e\xc1\x2f\x26\x02\x40\x53\x53\
-\x13\x03\x07\x0e\x64\xc9\x92\x25\x98\xcd\x66\x75\x71\x97\xe1\x17\
-\x13\xc1\x66\xb3\x21\x84\xc0\x6e\xb7\x63\xb7\xdb\xd5\xc5\x5d\x8a\
-\x2e\xbb\x27\xd8\x6c\x36\x8a\x8b\x8b\x29\x2a\x2a\x62\xff\xfe\xfd\
-\x38\x1c\x0e\xca\xca\xca\x08\x0e\x0e\x26\x22\x22\x02\x8b\xc5\x42\
-\x72\x72\x32\x49\x49\x49\x0c\x19\x32\x04\x7f\x7f\x7f\x75\x13\x57\
-\x0d\x57\x4d\x84\xba\xba\x3a\xcf\xa0\xad\x56\x2b\x0e\x87\x83\xc4\
-\xc4\x44\xcf\x40\xc3\xc3\xc3\xd9\xbb\x77\x2f\xa1\xa1\xa1\x8c\x18\
-\x31\x82\x8a\x8a\x0a\x0a\x0b\x0b\x29\x2a\x2a\xe2\x9b\x6f\xbe\x21\
-\x3a\x3a\xda\xe3\x3b\x74\xe8\x50\xfc\xfc\xfc\xd4\x5d\x5c\x31\x5c\
-\x31\x11\xea\xeb\xeb\x39\x78\xf0\x20\x56\xab\x95\xa2\xa2\x22\x1c\
-\x0e\x07\x23\x46\x8c\xf0\x0c\xe4\x62\xf7\x7c\x79\x79\xb9\x47\xc0\
-\xc3\x87\x0f\xfb\x88\x72\x25\x6f\x95\x97\x2c\x42\x5d\x5d\x1d\x87\
-\x0e\x1d\xc2\x6a\xb5\x62\xb5\x5a\x69\x68\x68\x20\x31\x31\x91\xa4\
-\xa4\x24\x92\x92\x92\x88\x8c\x8c\x54\x57\xb9\x2c\x9c\x3a\x75\xca\
-\x23\xca\xb7\xdf\x7e\x4b\x4c\x4c\x8c\xa7\xaf\x21\x43\x86\x5c\xd6\
-\x4a\xe9\xb4\x08\xca\x41\xef\xdf\xbf\x9f\xfa\xfa\x7a\xcf\xa0\x93\
-\x93\x93\xaf\xf8\xa0\x3b\x82\x5a\x94\xee\xdd\xbb\x7b\x44\x19\x3c\
-\x78\xf0\x45\x89\xd2\xa6\x08\x75\x75\x75\x94\x94\x94\x78\x06\x6d\
-\xb3\xd9\x18\x39\x72\x24\x49\x49\x49\xa4\xa4\xa4\x5c\xf4\xf2\xbe\
-\x9a\x10\x42\xf0\xd3\x4f\x3f\x51\x50\x50\xe0\x11\xa5\x67\xcf\x9e\
-\x1e\x51\x06\x0d\x1a\xd4\xee\x41\xeb\x11\xc1\xe9\x74\x52\x5c\x5c\
-\xcc\xbe\x7d\xfb\xb0\x5a\xad\xd8\x6c\x36\xcf\x4c\xa7\xa4\xa4\x74\
-\xf9\x4c\x5f\x0e\xdc\xa2\xe4\xe7\xe7\x7b\x44\x89\x8d\x8d\x25\x29\
-\x29\x89\xb4\xb4\x34\xfa\xf7\xef\xef\xe5\x2f\x15\x17\x17\x8b\xd3\
-\xa7\x4f\xb3\x74\xe9\x52\xc2\xc3\xc3\x19\x3f\x7e\x3c\xa3\x46\x8d\
-\xfa\x7f\x35\xe8\x8e\x20\x84\xa0\xbc\xbc\x9c\xfc\xfc\x7c\x76\xed\
-\xda\x45\x6c\x6c\x2c\x4f\x3e\xf9\x24\x01\x01\x01\x00\x48\xf9\xf9\
-\xf9\xe2\xc1\x07\x1f\x64\xde\xbc\x79\x8c\x1d\x3b\x56\x5d\xff\x9a\
-\x83\x10\x82\xf5\xeb\xd7\x53\x5a\x5a\xca\xaa\x55\xab\x00\xd0\x9b\
-\xcd\xe6\x65\xd1\xd1\xd1\x4c\x9a\x34\x49\xed\x7f\x4d\x42\x92\x24\
-\x12\x13\x13\xc9\xcb\xcb\x23\x36\x36\x96\x98\x98\x18\xf4\x4e\xa7\
-\x73\xd9\xec\xd9\xb3\x31\x99\x4c\x6a\xff\x6b\x16\x92\x24\xa1\xd7\
-\xeb\x39\x70\xe0\x00\xa3\x46\x8d\x42\x1a\x30\x60\x80\xd8\xb2\x65\
-\x0b\x4e\xa7\x93\x6d\xdb\xb6\xa9\xfd\xaf\x39\x84\x86\x86\x92\x91\
-\x91\x41\x71\x71\x31\xdb\xb7\x6f\x67\xf9\xf2\xe5\x30\x7a\xf4\x68\
-\xf1\xe1\x87\x1f\x8a\x2f\xbe\xf8\x42\x48\x92\x24\x80\x6b\x9a\x71\
-\x71\x71\xa2\xb8\xb8\x58\xbc\xf8\xe2\x8b\x62\xe6\xcc\x99\xa2\xb8\
-\xb8\x58\x48\xd9\xd9\xd9\xa2\xb1\xb1\x91\xc9\x93\x27\x33\x6b\xd6\
-\x2c\x5e\x5c\xb1\xc2\xa3\x9a\x70\xfd\x3d\x50\x96\x65\xac\x56\x2b\
-\xb2\x2c\x93\x9c\x9c\xec\x75\x65\xb5\xdb\xed\x14\x14\x14\x60\x32\
-\x99\x18\x3e\x7c\xb8\xd7\xdf\x10\xcf\x9d\x3b\xc7\x81\x03\x07\xe8\
-\xdd\xbb\xb7\xcf\x6b\xa9\x33\x90\x84\x50\x9b\x2e\x0b\x0e\x87\x83\
-\xc7\xff\xf0\x07\x76\xee\xdc\x49\x76\x76\x36\x53\xa6\x4c\xe1\x86\
-\x1b\x6e\x40\xda\xb7\x6f\x9f\x98\x36\x6d\x1a\x8f\x3d\xf6\x18\x39\
-\x39\x39\x7c\xfa\xc9\x27\x9e\x4a\x42\x92\xb0\xdb\xed\x4c\xce\x7c\
-\x80\x92\x93\x67\x70\xca\xcd\xf4\xef\x16\x4a\xde\xce\x1d\x84\x84\
-\x84\x50\x55\x55\x45\xc6\x7d\xf7\x53\x59\xdb\x80\xde\xcf\x9f\x9b\
-\x93\x06\xb3\xee\x8d\x37\x90\x24\x09\xab\xd5\xca\xb4\x39\xf3\x08\
-\x1b\xfe\x6f\x9c\xfb\xee\x00\x8f\xdc\x77\x2b\x8b\x16\x2d\xf2\x0a\
-\xaa\x23\x5c\x69\x11\xec\x76\x3b\xa9\x63\xc6\xf0\xd0\x43\x0f\xf1\
-\xd1\x47\x1f\xb1\x76\xed\x5a\x70\xdf\x13\xbe\xff\xfe\x7b\xb2\xb3\
-\xb3\x11\x42\xf0\xda\xab\xaf\x7a\x0e\xc9\x3e\xfd\xfa\xb1\x7d\xfb\
-\x76\x5e\xfe\xf4\x08\xe6\x41\x29\x34\xd5\x9d\xa7\xb1\xf6\x5f\x64\
-\xf6\x37\xb2\x60\xc1\x02\x96\x2e\x5d\x4a\x51\xd0\x08\xec\x35\x15\
-\x98\x13\x52\xf8\xe1\xa3\x0d\xac\xf9\xfd\x34\xc6\x8d\x1b\xc7\x84\
-\xdb\x6f\x27\xf4\x81\x15\x98\x7a\x27\x50\xfb\xe3\x11\x0a\xfe\x34\
-\x9d\xc2\x3d\xbb\xb1\x58\x2c\xaa\xd0\xb4\x51\x57\x57\xc7\xa9\x13\
-\x27\xd4\xe6\xcb\xc2\xa9\x53\xa7\x98\x3e\x63\x06\xc3\x86\x0d\xe3\
-\xa5\x97\x5e\xf2\x8c\xd3\x00\x70\xdd\x75\xd7\xb1\x7e\xfd\x7a\xa6\
-\x4e\x9d\xca\xc6\x4d\x9b\xa8\xab\xab\x03\xe0\x99\x67\x9e\xa1\xaa\
-\xaa\x8a\xc0\xa8\x9e\x98\x13\x5a\x3e\x96\x9c\x29\xde\x43\x65\x65\
-\x09\x00\x95\x95\x95\x04\x24\xff\x9a\x6e\x23\xd2\x00\x08\xb2\xc4\
-\x51\x51\x51\x01\xc0\x4f\x15\x55\x0c\x0f\x09\xa7\xb1\xf6\x5f\x1c\
-\xd9\xb6\x9a\xc6\x9f\x6d\x9c\x3e\x7d\xba\xd3\x22\x94\x95\x95\xb1\
-\x7a\xf5\x6a\xb5\xf9\x92\x21\x01\x26\x93\x89\xe8\xe8\x68\x72\x72\
-\x72\xbc\x3e\xf9\x79\xae\xcd\x17\x2e\x5c\x20\x2b\x2b\xcb\x67\x3b\
-\x1c\x3e\x7c\x98\xbb\xa6\xcd\xa1\x7f\xe6\x12\x24\x9d\x81\xe3\xdb\
-\x56\xf3\xf6\xcb\x2f\x90\x9a\x9a\xca\x7b\xef\xbd\xc7\x13\x6b\xfe\
-\xca\x75\xf7\xcc\xa7\xc9\x76\x8e\x93\xb9\xab\xf9\xe7\xee\xbf\xd1\
-\xbd\x7b\x77\x9e\x7e\xfa\x69\x3e\xfc\x9f\x33\xc4\xa5\x4d\xe4\xc2\
-\xa9\xa3\xfc\xbc\x6f\x33\xfb\xbe\xf8\x27\x7a\xbd\xde\xd3\x7e\x47\
-\xb8\x5a\xdb\x61\xc7\x8e\x1d\x5e\xf6\x0e\xff\xbc\x36\x74\xe8\x50\
-\xd6\xad\x7c\x8e\xc0\xaf\xde\xc2\xf8\xcf\x37\x78\xe9\xc9\xdf\x93\
-\x9a\x9a\x0a\xc0\xa4\x49\x93\x58\x3a\xf3\x3e\xc4\xee\x97\x31\x1f\
-\xde\xc1\xe6\x0d\xaf\xd3\xbd\x7b\x77\x00\x9e\x7a\xea\x29\x26\x8e\
-\xec\x85\x6d\xe7\x1f\xe9\x77\xf6\x00\x5b\x37\x6f\xba\x28\x01\xba\
-\x12\x1d\xae\x84\x5f\x12\x5d\xb5\x12\xbc\x44\xb8\xf9\x96\x5b\x88\
-\x88\x8a\xf6\x72\xb8\x96\x20\x84\x20\xc0\x20\xf1\xc1\x07\x1f\x78\
-\xd9\xbd\x44\xc8\x78\x28\x8b\x71\xff\xb9\xc7\x55\xc3\xed\xa1\xf0\
-\x56\x42\x28\xca\x94\x13\xa6\xb4\xa9\xd3\xca\x36\x3b\x2a\x57\xdb\
-\xb5\xca\xd5\x3e\xee\x32\x2d\x1b\x20\x37\xda\x39\xb4\x68\x34\x79\
-\x3b\x3b\x7b\x26\x48\xaa\xce\xd4\x50\x96\xb9\x7d\xd5\x36\x75\x5a\
-\xe9\xd3\x51\xb9\xda\xae\x55\xde\x56\x99\x96\x4d\x69\x57\xc1\x57\
-\x04\x21\xda\xa1\x53\xc3\x76\x69\x14\x72\x33\xcd\x3f\xdb\x68\x6e\
-\xa8\x43\x38\x65\x97\x5d\xdd\xbe\x32\xaf\x2e\xeb\x88\x6d\xf8\x6b\
-\xc0\x67\x3b\xa4\xad\xfe\x54\xed\x73\xf9\x10\x82\xf3\x65\x25\x54\
-\x5b\x3f\xa6\xe6\x48\x21\xa2\xe6\x14\x26\x3f\x08\x0b\x0d\xc1\xe9\
-\x74\x52\x6b\xab\xa3\x56\x36\x12\xd0\xbd\x3f\x91\x43\x6e\x24\x26\
-\xe5\xd7\x04\xc7\xf4\x55\xb7\x72\xd9\x70\x3a\xec\x1c\x7a\x2c\xd5\
-\x67\x3b\xf8\x8a\xb0\xea\x1f\x5e\x0e\x97\x03\xd9\x61\xe7\xe4\x67\
-\x5b\x28\xdf\xfd\x16\xa3\x13\x7a\x73\xf7\xdd\x77\x33\x7a\xf4\x68\
-\x74\x3a\x1d\x27\x4f\x9e\xa4\xb6\xb6\x16\x9d\x4e\x87\xd9\x6c\x26\
-\x2e\x2e\x8e\xda\xda\x5a\xf6\xec\xd9\xc3\x8e\x1d\x3b\x38\x66\x93\
-\xe8\x77\xe7\x5c\x62\x52\x6e\x43\x92\x7c\x17\xec\xa5\x40\x76\xd8\
-\x29\x59\xfc\xab\x0e\x44\x98\xb5\x90\xb4\x55\x2d\xaf\xc8\xd6\xb3\
-\x45\xf2\xda\x4a\xca\xf3\x4c\x6d\x11\x9e\x93\x08\xaa\x8b\x76\x73\
-\x7c\xd3\xf3\xcc\x98\x78\x07\xb3\x67\xcf\x66\xef\xde\xbd\xe4\xe6\
-\xe6\x52\x78\xec\x38\x81\xf1\x03\x09\xee\xd3\x07\x3f\x53\x38\x42\
-\x38\x69\x3c\x7b\x16\xdb\xb1\x63\x70\xe2\x47\xd2\x47\xa5\x70\xff\
-\xfd\xf7\xd3\xa7\x4f\x1f\x56\xae\x5c\xc9\x3f\x0e\x95\x31\x74\xce\
-\x0a\x4c\x7d\x87\xba\x62\x69\x2f\x02\xef\x5c\xeb\xb9\xd8\x62\x93\
-\x1d\x76\x4a\x96\x8c\xe9\x58\x84\xb1\x2b\x3f\xf6\x72\xb8\x58\xc8\
-\x0e\x3b\xdf\xe4\x2c\x65\xb0\xf1\x2c\xab\x56\xad\x22\x37\x37\x97\
-\xd7\x36\x6d\xc2\x9c\x71\x0f\x7d\x1f\x98\x4a\xd8\xc0\x81\x6d\xce\
-\xac\x90\x65\xfe\x55\x54\x40\xd9\x3b\x6f\xc3\xd7\xfb\x78\x62\xf1\
-\x62\x06\x0e\x1c\xc8\xdc\xdf\xce\xc3\x99\x78\x0f\xfd\xef\x9a\x0b\
-\x97\x71\x77\x91\x1d\x76\xbe\xf9\x8f\x34\x1f\x11\x7c\xa3\x51\x1f\
-\x24\x17\x41\x87\xed\x1c\xf9\xcf\x4e\x62\xee\xf8\xa1\x3c\xfe\xf8\
-\xe3\x64\x4c\x9a\xc4\xfb\x32\x8c\xd9\x5b\xc0\xf0\x67\x96\x13\x16\
-\x1f\x0f\x42\x20\x9c\xb2\x26\x91\x20\x2a\x65\x14\x29\x7f\x79\x95\
-\x61\x1f\xee\xe6\x85\x2f\xf7\xb1\x78\xc9\x12\x36\xbf\xb3\x91\xc4\
-\xe6\x63\x1c\x7c\x25\x0b\x21\x37\xfb\xf4\x7b\x51\xd4\x80\x8f\x08\
-\x42\x88\x4b\x62\x53\xfd\x05\x8a\x5e\xf8\x0d\xff\xf5\xc4\x42\x4c\
-\x26\x13\xf7\x65\xfd\x8e\x81\x1b\xdf\x65\xf0\xa2\xc5\xe8\xfd\x03\
-\x10\xb2\x13\x21\xcb\xae\xa7\x9b\xb2\xc2\xa6\x2c\x93\xf1\x8f\x8a\
-\x22\xf9\xe5\x57\xf0\x7f\xfc\x49\x6e\x9d\x38\x91\x19\x33\x66\x30\
-\x29\xb1\x27\x07\xfe\xb2\x00\xe1\x74\xfa\xf4\xdf\x19\x76\x52\x04\
-\x0d\xe5\x3a\x41\xe1\x94\xd9\xff\xf2\xa3\xfc\xe9\xb1\xb9\x54\x57\
-\x57\xf3\xdc\xf6\x1d\xa4\x7d\xf8\x77\x42\xfa\xf5\x6b\x09\xd8\x33\
-\xdb\xca\xb4\x3b\xef\xb6\xa9\xfd\x5a\xf2\x96\x5f\x8d\xe1\x86\xf7\
-\x76\x92\xb9\x30\x8b\x9b\x6f\xbe\x99\x09\x83\x22\x29\x7d\xf7\xcf\
-\x3e\x31\x74\x86\x42\x74\x46\x04\x01\x42\x38\x2f\x9a\xdf\xe7\xbd\
-\xc6\xbd\x29\x03\x08\x0b\x0b\x63\x45\xee\xfb\xa4\xbe\xbd\x19\x7d\
-\x40\x80\x62\xa6\x2f\x8f\x41\x3d\x7a\x30\xfa\xdd\xf7\x98\xf1\xfb\
-\x6c\x1e\x79\xe4\x11\xa2\x2a\x8b\x38\x53\xf2\xa5\x4f\x1c\x1d\x91\
-\xce\x88\x20\x68\x3d\x13\x3c\xcb\xa7\x03\xd6\x57\xfd\x48\xf3\xfe\
-\x1d\xcc\x9f\x3f\x9f\x05\x4f\x3d\xcd\xe8\x0d\x7f\x45\x32\x18\x14\
-\xb3\x79\x65\x18\x18\xd3\x9d\xeb\xd7\xac\x65\xfa\xcc\x59\xac\x7b\
-\xe3\x0d\xbe\x7b\xfb\x69\x64\x87\xdd\x27\x9e\xf6\x28\x84\x53\x39\
-\x5c\x0f\xda\x3c\x13\x5a\x2a\x75\xcc\xd2\x2d\x2b\xf8\xf3\x1f\x9f\
-\xe7\xb1\xc5\x8b\x89\x5f\xb6\xbc\xe5\xb5\xa7\x31\x9b\x57\x82\xe1\
-\x43\xaf\x87\x7f\x9f\xc0\xd6\xad\x5b\xf9\xed\xb4\x49\xfc\xb8\xfb\
-\x2d\x9f\x78\xda\x63\xeb\x4b\xd3\x1b\x97\x75\x26\xfc\x5c\x7d\x82\
-\x98\xc6\x4a\xcc\x66\x33\x07\x1b\x1d\x44\xa7\xa5\xfb\xcc\xe0\x95\
-\xe6\x80\x87\x1f\xe5\xf5\xad\x5b\x99\x32\x65\x0a\xa7\x3f\xdf\x8c\
-\xb3\xd9\xe1\x13\x57\x5b\x6c\x11\xc2\x17\x1a\x2b\xc1\x77\x2f\x79\
-\x88\xf7\xf3\xe4\xe7\x5b\x79\x74\xee\x23\xac\x5e\xbd\x9a\x41\xf3\
-\xb3\x7c\x66\xee\x6a\x50\x67\x34\xd2\xe3\x37\xd3\xd8\xb6\x6d\x1b\
-\x93\xee\xb8\x95\xea\xfd\xff\xf0\x8e\xcd\x8b\xc2\xeb\x49\xa7\x44\
-\x10\xae\x33\xa1\x25\xe1\x9b\x76\x2a\xd2\xc2\x49\xcd\x81\x8f\x49\
-\x4b\x4b\xe3\xcb\xef\x8e\x11\x91\x98\xe8\x33\x6b\x6a\xa2\x7a\x2a\
-\xed\x5a\x36\x75\x7d\x37\x7b\xdd\x7d\x0f\xef\x6c\xd9\x42\x66\x66\
-\x26\x55\x05\x1f\x69\xc7\xea\x8a\xb1\xc5\xee\x04\x2e\x76\x25\xb8\
-\x3b\x54\xa7\x15\xf9\x86\x9a\x4a\x06\xc7\x46\x51\x54\x54\x44\xb7\
-\xb4\xf4\x96\x99\x6a\x6e\x46\xc8\x5a\x94\x11\x72\x33\x4e\x57\xde\
-\xfd\x74\xd3\xd9\xac\xb0\xb9\xda\x70\xba\xea\xa8\xdb\x10\x72\x33\
-\x86\xd0\x50\xce\x47\x46\x11\x15\x15\x85\xfd\x44\x89\x42\x20\xe1\
-\x1d\xab\x2a\x66\x3a\x77\x30\xba\x1a\xd1\xa0\x7a\x66\x6a\xcb\xbe\
-\x21\x39\x39\x99\xfc\xfc\x7c\xcc\x23\x6f\x40\x34\xbb\x96\x6c\xb3\
-\x16\x9b\x35\x6c\x0a\x2a\xeb\x79\xd2\xea\x3a\xde\x79\xf3\xc8\x1b\
-\x28\x2c\x2c\x64\x70\xdf\x58\xec\x35\x95\xae\xb8\x94\x77\x0c\x0d\
-\xca\x9d\x11\x41\x00\x4e\x59\x93\x42\x95\xaf\xaf\xfa\x91\xf8\xf8\
-\x78\x4a\x4b\x4b\x5b\x2e\x45\xcd\xae\x59\xec\x22\x86\xf4\xed\x47\
-\x69\x69\x29\xf1\xf1\xf1\xd4\x57\xfe\xe0\x13\xaf\x2f\x9d\x08\x21\
-\x7b\x0d\xd7\x0d\xd5\x3d\xa1\xed\x95\xa0\xa6\xe3\x42\x0d\x16\x8b\
-\x85\xaa\xaa\x2a\xfc\xcd\x91\x38\x5d\xcb\xbc\xab\xe8\x6f\x36\x53\
-\x5d\x5d\x8d\xc5\x62\xa1\xf1\x42\x8d\x4f\x7c\xbe\x6c\x59\x25\x5a\
-\xf0\x3d\x13\x7c\xae\xb3\xda\x74\x36\x3b\x30\x1a\x8d\x34\x36\x35\
-\x81\x84\x6b\x86\xdc\xcb\x56\x8b\x5a\xcb\x5a\x59\xa6\x7e\xaa\xdb\
-\xf2\xce\x4b\x06\x23\x76\xbb\x1d\xa3\xd1\x88\xb3\xc9\xa1\xba\x72\
-\xfb\xc6\x2b\xdc\x2b\x42\x03\xaa\xed\xe0\x7e\xa5\xc8\x2e\xaa\x0e\
-\x17\x45\x5e\xa7\x37\xd2\xd8\xd8\x48\x80\x9f\x1f\xf2\xcf\x0d\x1a\
-\x03\x50\x53\x6b\x30\xca\x32\xf5\x53\xdd\x96\x77\xbe\xb9\xbe\x9e\
-\xa0\xa0\x20\x1c\x0e\x07\x92\x5e\xaf\x88\xad\x8d\xb8\x5d\x13\xab\
-\x85\x36\x56\x82\x06\x85\x77\xde\x18\x1a\x41\x75\x75\x35\x3d\x7a\
-\xf4\xa0\xa1\xb2\x02\x21\x37\x83\x8b\xee\x53\x5c\x99\xbe\xd2\x6c\
-\x3c\x5d\x45\x4c\x4c\x0c\x55\x55\x55\xf8\x85\x84\xfb\xc6\xab\x8e\
-\xdb\x35\xb1\x5a\x68\xe3\xed\xe0\x3a\x48\x34\xde\x0a\x6e\x06\x75\
-\xeb\xc9\xd1\xa3\x47\x49\x48\x48\x40\xfc\x50\x46\x84\x4e\x47\xb8\
-\x8b\x11\x2e\x2a\xd3\x57\x9a\x4d\x65\x65\x0c\x1e\x3c\x98\xd2\xd2\
-\x52\x02\x2d\xbd\x14\x71\xb6\xc6\xee\xbd\xad\x3b\xbb\x12\x84\x68\
-\x3d\x49\x5d\x7b\xc8\xfd\x54\x33\xa4\xd7\x40\x0a\x0a\x0b\x49\x4d\
-\x4d\xc5\x76\xa8\x98\x68\xa3\xa1\x4b\x79\xbe\xf8\x20\x49\x49\x49\
-\x1c\x3d\x55\x8d\x5f\xb0\xc9\x33\xf3\xca\xd8\x95\x6f\x06\xcf\x58\
-\x34\xd0\xf9\xed\xa0\xa2\x5f\xb0\x89\xa3\x95\xe7\x19\x36\x6c\x18\
-\x55\xf9\x5f\x63\x31\x1a\xb0\xf8\x19\x89\xf6\x33\x62\x71\xd1\x9d\
-\x8e\xd6\x48\xb7\x67\x53\xdb\xdd\xed\xb9\x6d\x81\xb5\xb5\x98\xe5\
-\x66\x4e\x9c\x38\x41\x40\xdc\x10\x85\x00\xbe\x71\x7a\x53\x7b\x25\
-\xe8\xe7\xce\x9d\xbb\x0c\xa0\xb1\xb1\x91\xcd\xdb\xff\x46\x8f\x1b\
-\xef\xf4\xfa\xd1\xd1\x1e\x1d\x75\xe7\x89\xc2\x86\xde\x29\x63\x08\
-\x0e\xa6\x5f\xdf\x7e\x84\x18\x0c\x84\x19\x0c\xc4\x06\x05\x71\x5d\
-\x68\x08\xfd\x43\x43\xe8\x1b\x1c\x4c\xf7\xc0\x40\x4c\x06\x23\x46\
-\x49\x22\x48\xaf\x27\xc4\x60\xf0\x61\xb8\xd1\x48\xaf\xa0\x20\xae\
-\x0b\x71\xd5\x0b\x09\xa1\x67\x60\x20\x66\x3f\x23\xfe\x92\x8e\x40\
-\x57\xbd\xaf\x36\xbd\xc3\xed\xa9\x37\xf1\xe9\xa7\x9f\x62\xeb\x35\
-\x9a\xc0\xa8\x9e\x3e\xb1\x69\x51\xc8\x4d\x9c\x2f\xfc\x80\x07\x32\
-\x33\xbd\x44\x68\x7f\x25\xa8\x0e\x43\xb5\x3d\x26\xe5\x36\x5e\x7b\
-\x63\x1d\xd9\xd9\xd9\xec\x7e\xfd\x35\xa2\xfd\xfd\xe8\x19\x18\x40\
-\x82\x29\x8c\xb8\xe0\x20\x4c\x46\x23\xfe\x3a\x1d\x7e\x3a\x1d\xa1\
-\x06\x03\x3d\x83\x02\x19\x1e\x11\xce\xb0\x70\x13\xc9\x91\x66\x7e\
-\x65\xe9\xc6\x18\x4b\x37\x6e\xea\x16\x45\x4a\xa4\x99\x94\xa8\x48\
-\xe2\x82\x02\x09\x33\x1a\x5a\xea\x49\x12\xc1\x06\x3d\xd1\x01\x01\
-\x0c\x32\x85\xd1\x3f\x24\x84\xb0\xa6\x26\xf6\xe7\xed\xe4\xce\x3b\
-\xef\x24\xef\x93\x2f\x88\x88\x1f\xd9\x66\x7c\x3e\xf1\x5f\xd2\xb5\
-\x59\x56\x1f\x30\xde\x76\xbf\x50\x33\xe7\x43\xfb\x50\x5a\x5a\xca\
-\x90\xde\xbd\x39\xf4\xf7\xbf\x13\xe5\xef\x8f\x41\x92\x7c\x66\x01\
-\x21\x30\x00\x81\x7a\x1d\x61\x46\x23\x7e\x3a\x9d\xe7\x77\xbe\x0e\
-\xf0\xd3\xe9\x90\x80\x00\xbd\xbe\xe5\x6b\xb4\x06\x83\x0d\x7a\x76\
-\xbe\xba\x86\xf9\x73\xe7\xf2\xfa\xeb\xaf\x63\x49\xbd\xa7\xe5\xf7\
-\x52\x1b\xf1\x69\xc5\xaf\x05\x9f\x6b\x73\x8b\xb3\xb7\x82\xed\xed\
-\xb5\x3e\xb7\x4e\xe3\xc9\x65\xcf\xb1\x6c\xd9\x32\x36\xac\x5a\x89\
-\x5c\x53\x43\x4c\x60\xa0\x26\xa3\x02\xfc\x09\x31\x18\x09\x56\x6c\
-\x81\x60\x05\x43\x0c\x06\xc2\x8c\x46\xa2\x3d\x75\x02\xbc\xea\x1f\
-\x2f\x2c\xe4\x3b\xab\x95\xf4\xf4\x74\xde\x7c\x7f\x17\x31\xc9\xbf\
-\xf6\x89\xa7\x23\x6a\xc1\x67\x25\xb4\x9e\xa6\x2e\xba\x2e\x1a\x6a\
-\x9b\x9b\xc6\x90\x08\x02\x46\xde\xc1\xb3\xcf\x3e\xcb\x2b\x6b\xd6\
-\x30\x77\xea\x14\xfc\x1c\x8d\x74\x0b\x0c\xa0\x5b\x60\x00\x16\xd7\
-\xb3\x25\x1d\x48\xb7\xc0\x40\x85\x2d\xd0\x65\x6b\xf5\x71\xdb\xd5\
-\x65\xe7\x4e\x9d\xe4\xa9\x45\xd9\xe4\xe4\xe4\x30\x6b\xf6\x1c\xfa\
-\xdd\xb3\xb0\xe5\xb3\x90\x56\x5c\x0a\x9b\x32\xf6\xce\xaf\x04\xcf\
-\x6d\xd1\xf7\xa2\xe1\x65\x73\xad\x18\x84\x4c\x4c\xd2\xad\x7c\x76\
-\xf4\x34\x56\xab\x95\xf9\xf3\xe6\x71\xc7\x84\x09\x9c\xab\xa9\xc1\
-\xa0\xd3\xa1\xd7\xe9\x30\xb8\xd8\x92\x96\x14\x36\x09\xbd\x4e\xf2\
-\x94\xb7\x52\xf2\xf2\x3b\xf2\xed\xb7\xdc\x3f\x71\x22\x6f\xbd\xf9\
-\x26\xcb\x9f\x7b\x8e\xfa\x5e\x29\x84\xf6\xec\xaf\x11\x97\x6b\x15\
-\x2b\x6c\x28\xd3\x4e\xd9\xf5\x2b\xd1\x1b\xaa\x1f\x50\x1a\xfb\xab\
-\x4d\xba\x3b\x6d\xb9\x96\x0e\xb8\x77\x21\xab\xde\x7c\x8f\xb3\x67\
-\xcf\xb2\x68\xd1\x22\xd2\xd3\xd3\xc9\x2f\x28\x50\x36\x7f\xd1\x10\
-\xc0\xd6\xad\x5b\xc9\xcc\xcc\x64\xc3\x86\x0d\xac\x5b\xb7\x8e\xfc\
-\x2a\x99\x1e\x37\xdd\xa5\x11\x8f\x2a\xa6\x36\xa8\x05\x9f\xed\xd0\
-\xda\x98\x42\x59\x1f\xfa\x76\x2a\xe9\xf4\x24\x4c\x7d\x82\x17\x72\
-\xb6\xf2\xe5\x97\x5f\xb2\x71\xe3\x46\x16\x2e\x58\xc0\xc2\xac\xac\
-\x4b\xfa\x9f\xc0\x8f\x1c\x39\xc2\xdd\x19\x19\x6c\xd9\xb2\x85\xf7\
-\xdf\x7f\x9f\x65\xcb\x96\xf1\x49\x99\x8d\x3e\xb7\xcd\xd0\x88\xa7\
-\xed\xb8\xbc\xf3\x9d\x39\x13\x84\xfb\x13\x99\xba\xb2\x9a\xca\x4e\
-\x5b\x83\x90\xf4\x46\x12\x7e\xf3\x38\xdb\x0f\x55\x30\xe7\xe1\x47\
-\x58\xbb\x76\x2d\x83\x13\x12\x18\x37\x6e\x1c\x73\xe6\xcc\xe1\xb3\
-\xcf\x3e\x6b\xf7\x1f\x8a\x38\x7f\xfe\x3c\xb9\xb9\xb9\x64\x64\x64\
-\xf0\xe0\x83\x0f\xf2\xf0\xc3\x0f\x33\x7b\xf6\x6c\x6e\xbb\xe3\x2e\
-\xbe\x0f\x1e\x48\xef\x9b\xa7\x6a\xc4\xd2\x71\x5c\x9e\x7c\x1b\xaf\
-\x48\xaf\x0f\xb2\xb7\x3f\x30\x8b\xeb\x1f\xfe\xb3\xda\x07\x3c\x5f\
-\xa8\x3b\x0f\x5b\xf9\x77\x9c\xf8\xef\x0d\xdc\x3d\xfe\x26\x7e\x97\
-\x95\x45\x79\x79\x39\xb9\xb9\xb9\x7c\xfd\xf5\xd7\x84\x87\x87\xd3\
-\xb7\x6f\x5f\x4c\x26\x13\x4e\xa7\x93\x9a\x9a\x1a\x8e\x1f\x3f\x8e\
-\x24\x49\xa4\xa7\xa7\x33\x79\xf2\x64\x1a\x1a\x1a\x58\xb1\x62\x05\
-\x07\xca\x6b\xe9\x3b\xe1\x21\xfc\x4d\xdd\xd4\x5d\x78\xbe\x44\x77\
-\x36\x2e\x67\xb3\x83\xca\x8d\x4b\xc9\xdb\xb9\xd3\xcb\xae\x12\x61\
-\x26\xd7\xcf\x69\xfd\x6f\x9b\xdb\x83\x10\xae\x0f\xc4\x9e\x84\x2b\
-\x1a\xb7\x5a\x12\x08\x21\x38\x77\xb4\x88\xca\x82\x8f\x88\x8f\x0a\
-\x22\x23\x23\x83\xb1\x63\xc7\x12\x1b\x1b\xcb\x85\x0b\x17\xa8\xad\
-\xad\x45\x92\x24\x22\x23\x23\xf1\xf7\xf7\xe7\xd8\xb1\x63\x7c\xfe\
-\xf9\xe7\x6c\xdf\x91\xc7\x39\x63\x04\x3d\x6e\xbc\x93\xd0\x5e\xf1\
-\x8a\x4e\x7d\xbe\xca\x7b\xc1\x53\xec\x56\x45\x11\x0b\xc2\x25\xc2\
-\xa6\x27\xda\x17\x61\x42\xe6\x4c\xae\x7f\xe8\x05\x2f\x87\x2b\x85\
-\xc6\x0b\x35\x9c\x3f\x76\x10\x5b\xf9\x77\xfc\x7c\xa6\x9c\x00\x9a\
-\x08\x0a\xf0\x43\x08\x41\x5d\x83\x03\xd9\x18\x44\x50\x74\x1c\x61\
-\x71\x09\x84\xf7\x1f\x81\x21\xe0\xca\xff\x13\x02\xce\x66\x07\x55\
-\x5b\x9e\xee\x48\x84\x19\x0c\x9d\xf9\xbc\x97\xc3\xd5\x85\x72\xca\
-\xae\x3e\x9c\xcd\x0e\xaa\xb7\x2e\xf3\x11\xc1\xf7\x9e\xe0\x3e\x4c\
-\xd4\xf7\x04\xa5\x5d\x2b\xad\x55\x4f\x6d\x53\xb6\x27\x5a\x0e\xaa\
-\xd6\x43\x4b\xa3\xbf\x8e\xda\x52\x96\x69\xf9\x69\xa4\xb5\xe0\xfb\
-\x8a\x6c\xab\x71\x75\x90\xea\xb4\x56\x3d\xb5\x4d\x1d\x9c\xba\x2d\
-\x75\x7f\x6a\x1f\x75\x5d\x75\x7d\xb5\x9f\x4f\x5a\xfb\xed\xa0\xf1\
-\x2b\xb2\x8d\xeb\xa6\x22\xad\xa6\xd2\xae\xf6\x6b\xab\x8e\xb2\x4c\
-\x79\xcd\x55\xfb\x6b\xe5\x95\xf5\xd4\x36\xad\x7a\x5e\xed\x6b\xc0\
-\xeb\x4c\xb8\x35\x63\x22\x3d\xc7\xdc\xab\xf6\xb9\x66\x20\x64\x19\
-\xf9\xf0\xc7\xe4\xe5\xe5\x79\xd9\x3d\x22\xd8\xed\x76\x72\x72\x72\
-\xbc\x0a\xaf\x45\x98\x4c\x26\xa6\x4f\x9f\xee\x65\xfb\x5f\xe1\x87\
-\xc7\xf5\x62\x65\x73\xaa\x00\x00\x00\x00\x49\x45\x4e\x44\xae\x42\
-\x60\x82\
-\x00\x00\xc2\x54\
-\x00\
-\x01\x00\x00\x00\x10\x01\x00\x00\x04\x00\x00\x47\x44\x45\x46\x0d\
-\xbd\x0f\x26\x00\x00\x02\x38\x00\x00\x00\xb2\x47\x50\x4f\x53\x32\
-\x6e\x68\xe1\x00\x00\x1c\x1c\x00\x00\x2f\x2a\x47\x53\x55\x42\x7b\
-\xae\x8d\x69\x00\x00\x02\xec\x00\x00\x02\x74\x4f\x53\x2f\x32\x7f\
-\x4d\x3b\xb9\x00\x00\x01\xd8\x00\x00\x00\x60\x53\x54\x41\x54\xf4\
-\x2f\xdf\x0f\x00\x00\x01\x98\x00\x00\x00\x40\x63\x6d\x61\x70\x6b\
-\x7d\x7d\xb8\x00\x00\x07\xf0\x00\x00\x03\xa6\x67\x61\x73\x70\x00\
-\x00\x00\x10\x00\x00\x01\x14\x00\x00\x00\x08\x67\x6c\x79\x66\x08\
-\x3e\x01\x5a\x00\x00\x4b\x48\x00\x00\x77\x0a\x68\x65\x61\x64\x15\
-\x7e\x92\x34\x00\x00\x01\x60\x00\x00\x00\x36\x68\x68\x65\x61\x07\
-\xa2\x02\xea\x00\x00\x01\x3c\x00\x00\x00\x24\x68\x6d\x74\x78\x73\
-\xc6\x17\x95\x00\x00\x0b\x98\x00\x00\x05\x1c\x6c\x6f\x63\x61\x38\
-\x8f\x55\xed\x00\x00\x05\x60\x00\x00\x02\x90\x6d\x61\x78\x70\x01\
-\x56\x00\xe3\x00\x00\x01\x1c\x00\x00\x00\x20\x6e\x61\x6d\x65\xa7\
-\x68\xe0\xc2\x00\x00\x10\xb4\x00\x00\x05\x96\x70\x6f\x73\x74\xcf\
-\x9d\x91\x4e\x00\x00\x16\x4c\x00\x00\x05\xcf\x70\x72\x65\x70\x68\
-\x06\x8c\x85\x00\x00\x01\x0c\x00\x00\x00\x07\xb8\x01\xff\x85\xb0\
-\x04\x8d\x00\x00\x01\x00\x01\xff\xff\x00\x0f\x00\x01\x00\x00\x01\
-\x47\x00\x7d\x00\x07\x00\x64\x00\x04\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x01\x00\x01\x00\x00\x03\
-\xce\xff\x14\x00\x00\x04\x71\xff\x7c\xfe\x1d\x04\x55\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x47\x00\
-\x01\x00\x00\x00\x02\x00\x42\x0a\xa8\xee\xe6\x5f\x0f\x3c\xf5\x00\
-\x03\x03\xe8\x00\x00\x00\x00\xd4\x4d\xdc\xd8\x00\x00\x00\x00\xde\
-\x46\x71\x4a\xff\x7c\xff\x07\x04\x55\x03\xe6\x00\x01\x00\x06\x00\
-\x02\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x08\x00\x02\x00\
-\x00\x00\x14\x00\x02\x00\x00\x00\x24\x00\x02\x77\x67\x68\x74\x01\
-\x00\x00\x00\x77\x64\x74\x68\x01\x01\x00\x01\x00\x10\x00\x04\x00\
-\x01\x00\x01\x00\x02\x01\x0e\x00\x64\x00\x00\x00\x01\x00\x00\x00\
-\x00\x01\x06\x02\xbc\x00\x00\x00\x04\x02\x1d\x02\xbc\x00\x05\x00\
-\x00\x02\x8a\x02\x58\x00\x00\x00\x4b\x02\x8a\x02\x58\x00\x00\x01\
-\x5e\x00\x32\x01\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x80\x00\x08\x6f\x40\x00\x00\x4a\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x73\x64\x65\x00\xa0\x00\x20\xfb\x4b\x03\xce\xff\x14\x00\
-\x00\x03\xe7\x00\xfc\x00\x00\x00\x21\x00\x00\x00\x00\x01\xf4\x02\
-\xbc\x00\x00\x00\x20\x00\x04\x00\x01\x00\x02\x00\x72\x00\x00\x00\
-\x0e\x00\x00\x00\x9a\x00\x14\x00\x08\x00\x5c\x00\x4e\x00\x46\x00\
-\x3e\x00\x36\x00\x2e\x00\x26\x00\x1e\x00\x02\x00\x01\x00\x7d\x00\
-\x84\x00\x00\x00\x01\x00\x04\x00\x01\x01\x71\x00\x01\x00\x04\x00\
-\x01\x01\x2d\x00\x01\x00\x04\x00\x01\x00\xfd\x00\x01\x00\x04\x00\
-\x01\x01\x6a\x00\x01\x00\x04\x00\x01\x01\x8e\x00\x01\x00\x04\x00\
-\x01\x01\x7a\x00\x02\x00\x0a\x00\x06\x00\x01\x02\x91\x00\x01\x01\
-\x48\x00\x01\x00\x04\x00\x01\x01\x76\x00\x02\x00\x06\x00\x01\x00\
-\x49\x00\x01\x00\x4b\x00\x58\x00\x01\x00\x5a\x00\x7c\x00\x01\x00\
-\x7d\x00\x84\x00\x02\x00\x87\x00\xbe\x00\x01\x01\x1c\x01\x39\x00\
-\x03\x00\x01\x00\x01\x00\x00\x00\x08\x00\x02\x00\x02\x01\x2a\x01\
-\x2a\x00\x00\x01\x2d\x01\x37\x00\x01\x00\x00\x00\x01\x00\x00\x00\
-\x0a\x00\x4a\x00\xae\x00\x03\x44\x46\x4c\x54\x00\x2c\x68\x65\x62\
-\x72\x00\x2c\x6c\x61\x74\x6e\x00\x14\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x07\x00\x00\x00\x02\x00\x03\x00\x04\x00\x05\x00\x06\x00\
-\x07\x00\x04\x00\x00\x00\x00\xff\xff\x00\x05\x00\x00\x00\x01\x00\
-\x03\x00\x06\x00\x07\x00\x08\x61\x61\x6c\x74\x00\x5e\x63\x63\x6d\
-\x70\x00\x58\x63\x63\x6d\x70\x00\x50\x64\x6c\x69\x67\x00\x4a\x66\
-\x72\x61\x63\x00\x44\x6c\x69\x67\x61\x00\x3e\x6f\x72\x64\x6e\x00\
-\x38\x73\x75\x70\x73\x00\x32\x00\x00\x00\x01\x00\x01\x00\x00\x00\
-\x01\x00\x05\x00\x00\x00\x01\x00\x03\x00\x00\x00\x01\x00\x02\x00\
-\x00\x00\x01\x00\x07\x00\x00\x00\x02\x00\x04\x00\x04\x00\x00\x00\
-\x01\x00\x04\x00\x00\x00\x01\x00\x00\x00\x08\x01\x98\x01\x80\x01\
-\x28\x00\xbc\x00\x96\x00\x4e\x00\x2c\x00\x12\x00\x04\x00\x08\x00\
-\x01\x00\x08\x00\x01\x01\x02\x00\x04\x00\x0e\x00\xcc\x00\xc2\x00\
-\xb8\x00\x01\x00\xd4\x00\x01\x00\x00\x00\x01\x00\x08\x00\x02\x00\
-\x0e\x00\x04\x00\x85\x00\x86\x00\x85\x00\x86\x00\x01\x00\x04\x00\
-\x01\x00\x22\x00\x3e\x00\x60\x00\x06\x00\x00\x00\x02\x00\x24\x00\
-\x0a\x00\x03\x00\x01\x00\x34\x00\x01\x00\x12\x00\x00\x00\x01\x00\
-\x00\x00\x06\x00\x01\x00\x02\x00\x22\x00\x60\x00\x03\x00\x01\x00\
-\x1a\x00\x01\x00\x12\x00\x00\x00\x01\x00\x00\x00\x06\x00\x01\x00\
-\x02\x00\x01\x00\x3e\x00\x02\x00\x01\x00\xbf\x00\xc8\x00\x00\x00\
-\x02\x00\x00\x00\x01\x00\x08\x00\x01\x00\x0a\x00\x02\x00\x18\x00\
-\x12\x00\x01\x00\x02\x00\x80\x00\x81\x00\x02\x00\x50\x00\x5b\x00\
-\x02\x00\x50\x00\x53\x00\x04\x00\x00\x00\x01\x00\x08\x00\x01\x00\
-\x58\x00\x04\x00\x2c\x00\x22\x00\x18\x00\x0e\x00\x01\x00\x04\x00\
-\x84\x00\x02\x00\x6f\x00\x01\x00\x04\x00\x83\x00\x02\x00\x5b\x00\
-\x01\x00\x04\x00\x82\x00\x02\x00\x59\x00\x05\x00\x24\x00\x1e\x00\
-\x18\x00\x12\x00\x0c\x00\x7f\x00\x02\x00\x6f\x00\x81\x00\x02\x00\
-\x5b\x00\x80\x00\x02\x00\x53\x00\x7d\x00\x02\x00\x50\x00\x7e\x00\
-\x03\x00\x50\x00\x53\x00\x01\x00\x04\x00\x50\x00\x59\x00\x5b\x00\
-\x6f\x00\x04\x00\x00\x00\x01\x00\x08\x00\x01\x00\x46\x00\x03\x00\
-\x2e\x00\x18\x00\x0c\x00\x01\x00\x04\x00\xcc\x00\x03\x00\xe2\x00\
-\xc3\x00\x02\x00\x0e\x00\x06\x00\xca\x00\x03\x00\xe2\x00\xc1\x00\
-\xcb\x00\x03\x00\xe2\x00\xc3\x00\x02\x00\x0e\x00\x06\x01\x1a\x00\
-\x03\x00\xe2\x00\xbf\x01\x1b\x00\x04\x00\xe2\x00\xbf\x00\xbf\x00\
-\x01\x00\x03\x00\xbf\x00\xc0\x00\xc2\x00\x01\x00\x00\x00\x01\x00\
-\x08\x00\x01\x00\x06\x00\x0d\x00\x01\x00\x03\x00\xc0\x00\xc1\x00\
-\xc2\x00\x01\x00\x00\x00\x01\x00\x08\x00\x02\x00\x14\x00\x07\x00\
-\x85\x00\x86\x00\x85\x00\x86\x00\xcd\x00\xce\x00\xcf\x00\x01\x00\
-\x07\x00\x01\x00\x22\x00\x3e\x00\x60\x00\xc0\x00\xc1\x00\xc2\x00\
-\x00\x00\x15\x00\x4a\x00\x56\x00\x62\x00\x6e\x00\x7a\x00\x86\x00\
-\x92\x00\xe4\x01\x32\x01\x89\x01\x95\x01\xc5\x01\xd0\x02\x09\x02\
-\x15\x02\x21\x02\x2d\x02\x39\x02\x6b\x02\xc5\x03\x03\x03\x22\x03\
-\x2e\x03\x3a\x03\x46\x03\x52\x03\x8d\x03\xc7\x03\xed\x04\x2a\x04\
-\x73\x04\xab\x04\xb7\x04\xf1\x04\xfd\x05\x09\x05\x15\x05\x21\x05\
-\x73\x05\x7f\x05\xcb\x06\x01\x06\x3d\x06\x86\x06\xcf\x07\x32\x07\
-\x3e\x07\x6b\x07\xa3\x07\xaf\x07\xbb\x07\xc7\x07\xd3\x08\x00\x08\
-\x4d\x08\x8a\x08\xba\x08\xc6\x08\xd2\x09\x06\x09\x12\x09\x5c\x09\
-\x68\x09\x73\x09\x7f\x09\x8a\x09\x96\x09\xa1\x0a\x31\x0a\x7f\x0a\
-\xcb\x0a\xd7\x0b\x25\x0b\x94\x0b\xdb\x0b\xe7\x0b\xf2\x0b\xfe\x0c\
-\x09\x0c\x4c\x0c\xae\x0c\xeb\x0d\x20\x0d\x3f\x0d\x4a\x0d\x56\x0d\
-\x62\x0d\x6d\x0d\xa8\x0d\xe3\x0e\x0f\x0e\x52\x0e\xb1\x0e\xf5\x0f\
-\x00\x0f\x35\x0f\x41\x0f\x4c\x0f\x58\x0f\x63\x0f\xb8\x0f\xc3\x10\
-\x39\x10\x88\x10\xd7\x11\x27\x11\x63\x11\xbf\x11\xca\x12\x2b\x12\
-\x6f\x12\xb2\x12\xbe\x12\xc9\x12\xd5\x12\xe0\x13\x09\x13\x51\x13\
-\x93\x13\xbf\x13\xcb\x13\xd7\x14\x09\x14\x14\x14\x8c\x15\x33\x15\
-\xa8\x15\xb4\x15\xc0\x16\x3a\x16\x8b\x16\xfe\x17\x45\x17\x71\x17\
-\xbf\x17\xcb\x17\xd7\x17\xe3\x18\x27\x18\x33\x18\x83\x18\x8e\x18\
-\xbd\x18\xc8\x19\x0a\x19\x16\x19\x35\x19\x40\x19\x4b\x19\x88\x19\
-\x93\x19\xc7\x1a\x04\x1a\x10\x1a\x2e\x1a\x39\x1a\x66\x1a\x72\x1a\
-\xb2\x1a\xbe\x1a\xfa\x1b\x05\x1b\x3c\x1b\x8f\x1b\x9b\x1b\xba\x1b\
-\xf3\x1b\xfe\x1c\x2a\x1c\x36\x1c\x7b\x1c\xbb\x1c\xc7\x1d\x10\x1d\
-\x1c\x1d\x5d\x1d\xa2\x1d\xae\x1e\x01\x1e\x0d\x1e\x39\x1e\x44\x1e\
-\x99\x1e\xa5\x1e\xb0\x1e\xc0\x1e\xcf\x1e\xdb\x1f\x1b\x1f\x27\x1f\
-\x64\x1f\x94\x1f\xe1\x20\x45\x20\x7c\x20\xdf\x21\x29\x21\x5d\x21\
-\xc3\x22\x0d\x22\x30\x22\xbc\x23\x34\x23\xd6\x24\x00\x24\x4b\x24\
-\xa8\x24\xa8\x24\xa8\x24\xb1\x24\xbe\x24\xdc\x24\xf5\x25\x27\x25\
-\x53\x25\x98\x25\xa8\x25\xd9\x26\x0a\x26\x61\x26\xb8\x26\xce\x26\
-\xea\x27\x2b\x27\x9a\x27\xbb\x27\xdb\x27\xf9\x28\x17\x28\x35\x28\
-\x53\x28\x89\x28\xbf\x29\x1a\x29\x73\x29\xa0\x29\xcd\x29\xd5\x29\
-\xe1\x2a\x3f\x2a\x4c\x2a\x7e\x2a\x87\x2a\x93\x2a\x9f\x2a\xcd\x2a\
-\xfa\x2b\x34\x2b\x54\x2b\xb5\x2c\x3f\x2c\xc0\x2c\xf5\x2d\x79\x2d\
-\xee\x2e\x5f\x2e\xc1\x2e\xed\x2f\x0c\x2f\x44\x2f\x7e\x2f\xd5\x30\
-\x4f\x30\xaf\x31\x40\x31\xb7\x32\x1b\x32\x82\x32\xde\x33\x15\x33\
-\x33\x33\x77\x33\xb5\x33\xec\x34\x1a\x34\x49\x34\x97\x34\xd7\x34\
-\xfc\x35\x2a\x35\x77\x35\xda\x36\x5c\x36\x72\x36\x97\x36\xea\x37\
-\x20\x37\x63\x37\x79\x37\x9e\x37\xd2\x37\xe7\x38\x0b\x38\x21\x38\
-\x37\x38\x6c\x38\x82\x38\x8e\x38\xa4\x38\xcb\x38\xfd\x39\x19\x39\
-\x36\x39\x52\x39\x86\x39\xaf\x39\xd9\x3a\x00\x3a\x2c\x3a\x63\x3a\
-\x81\x3a\xb8\x3a\xf1\x3a\xf9\x3b\x01\x3b\x09\x3b\x11\x3b\x45\x3b\
-\x4d\x3b\x55\x3b\x5d\x3b\x65\x3b\x6d\x3b\x75\x3b\x7d\x3b\x85\x00\
-\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x14\x00\x03\x00\x01\x00\
-\x00\x00\x14\x00\x04\x03\x92\x00\x00\x00\x5a\x00\x40\x00\x05\x00\
-\x1a\x00\x2f\x00\x39\x00\x7e\x00\xac\x00\xff\x01\x31\x01\x42\x01\
-\x53\x01\x61\x01\x78\x01\x7e\x01\x92\x02\xc7\x02\xdd\x03\x04\x03\
-\x08\x03\x0c\x03\x28\x05\xbc\x05\xbf\x05\xc2\x05\xc7\x05\xea\x05\
-\xf4\x20\x14\x20\x1a\x20\x1e\x20\x22\x20\x26\x20\x30\x20\x3a\x20\
-\x44\x20\xaa\x20\xac\x21\x22\x22\x12\xfb\x02\xfb\x2d\xfb\x36\xfb\
-\x3c\xfb\x3e\xfb\x41\xfb\x44\xfb\x4b\xff\xff\x00\x00\x00\x20\x00\
-\x30\x00\x3a\x00\xa0\x00\xae\x01\x31\x01\x41\x01\x52\x01\x60\x01\
-\x78\x01\x7d\x01\x92\x02\xc6\x02\xd8\x03\x00\x03\x06\x03\x0a\x03\
-\x27\x05\xb0\x05\xbe\x05\xc1\x05\xc7\x05\xd0\x05\xf3\x20\x13\x20\
-\x18\x20\x1c\x20\x20\x20\x26\x20\x30\x20\x39\x20\x44\x20\xaa\x20\
-\xac\x21\x22\x22\x12\xfb\x01\xfb\x2a\xfb\x2e\xfb\x38\xfb\x3e\xfb\
-\x40\xfb\x43\xfb\x46\xff\xff\x00\x00\x00\x8f\x00\x00\x00\x00\x00\
-\x00\xff\x23\x00\x00\x00\x00\x00\x00\xfe\xc3\x00\x00\xff\x68\xfe\
-\x79\x00\x00\x00\x00\x00\x00\x00\x00\xfe\x11\xfb\x6d\x00\x00\x00\
-\x00\xfb\x65\x00\x00\xfa\xdf\xe0\xd2\x00\x00\x00\x00\x00\x00\xe0\
-\xb3\xe0\xeb\xe0\xbd\xe0\x85\xe0\x61\xe0\x5b\xdf\xdf\xde\xfd\x05\
-\x7f\x05\x8e\x00\x00\x00\x00\x05\x67\x00\x00\x00\x00\x00\x00\x00\
-\x01\x00\x5a\x00\x00\x00\x76\x00\xfe\x01\x16\x00\x00\x01\xb6\x01\
-\xb8\x01\xba\x00\x00\x01\xba\x00\x00\x00\x00\x01\xb8\x01\xc2\x01\
-\xca\x01\xce\x00\x00\x00\x00\x01\xce\x01\xd0\x00\x00\x01\xd0\x00\
-\x00\x00\x00\x02\x00\x02\x04\x02\x08\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\xf8\x02\
-\x08\x00\x00\x02\x0e\x02\x10\x02\x12\x00\x00\x00\xd0\x00\xda\x00\
-\xf8\x00\xe1\x01\x0a\x01\x1a\x00\xfc\x00\xf9\x00\xe8\x00\xe9\x00\
-\xe0\x01\x0e\x00\xd6\x00\xe4\x00\xd5\x00\xe2\x00\xd7\x00\xd8\x01\
-\x14\x01\x12\x01\x13\x00\xdc\x00\xfb\x00\x01\x00\x09\x00\x0a\x00\
-\x0c\x00\x0e\x00\x13\x00\x14\x00\x15\x00\x16\x00\x1b\x00\x1c\x00\
-\x1d\x00\x1f\x00\x20\x00\x22\x00\x2a\x00\x2c\x00\x2d\x00\x2e\x00\
-\x30\x00\x31\x00\x36\x00\x37\x00\x38\x00\x39\x00\x3c\x00\xec\x00\
-\xe3\x00\xed\x01\x18\x00\xe7\x01\x3c\x00\x3e\x00\x46\x00\x47\x00\
-\x49\x00\x4b\x00\x50\x00\x51\x00\x52\x00\x53\x00\x59\x00\x5a\x00\
-\x5b\x00\x5d\x00\x5e\x00\x60\x00\x68\x00\x6a\x00\x6b\x00\x6c\x00\
-\x6f\x00\x70\x00\x75\x00\x76\x00\x77\x00\x78\x00\x7b\x00\xea\x01\
-\x03\x00\xeb\x01\x16\x00\xd1\x00\xdb\x01\x08\x01\x0c\x01\x09\x01\
-\x0d\x01\x04\x00\xfe\x01\x3a\x00\xff\x00\x85\x00\xf4\x01\x17\x01\
-\x00\x01\x44\x01\x02\x01\x15\x00\xce\x00\xcf\x01\x3d\x01\x19\x00\
-\xfd\x00\xde\x01\x45\x00\xcd\x00\x86\x00\xf5\x00\xcb\x00\xca\x00\
-\xcc\x00\xdd\x00\x05\x00\x02\x00\x03\x00\x07\x00\x04\x00\x06\x00\
-\x08\x00\x0b\x00\x12\x00\x0f\x00\x10\x00\x11\x00\x1a\x00\x17\x00\
-\x18\x00\x19\x00\x0d\x00\x21\x00\x26\x00\x23\x00\x24\x00\x28\x00\
-\x25\x01\x10\x00\x27\x00\x35\x00\x32\x00\x33\x00\x34\x00\x3a\x00\
-\x2b\x00\x6e\x00\x42\x00\x3f\x00\x40\x00\x44\x00\x41\x00\x43\x00\
-\x45\x00\x48\x00\x4f\x00\x4c\x00\x4d\x00\x4e\x00\x58\x00\x55\x00\
-\x56\x00\x57\x00\x4a\x00\x5f\x00\x64\x00\x61\x00\x62\x00\x66\x00\
-\x63\x01\x11\x00\x65\x00\x74\x00\x71\x00\x72\x00\x73\x00\x79\x00\
-\x69\x00\x7a\x00\x1e\x00\x5c\x00\x29\x00\x67\x00\x2f\x00\x6d\x00\
-\x3d\x00\x7c\x01\x41\x01\x3b\x01\x42\x01\x46\x01\x43\x01\x3e\x01\
-\x2f\x01\x30\x01\x32\x01\x36\x01\x37\x01\x34\x01\x2e\x01\x2d\x01\
-\x35\x01\x31\x01\x33\x00\xd4\x01\x2a\x01\x1c\x01\x2b\x00\x87\x00\
-\x8b\x00\x8d\x00\x8f\x00\x91\x00\x93\x00\x96\x00\x98\x00\x99\x00\
-\x9b\x00\x9d\x00\x9f\x00\xa1\x00\xa3\x00\xa4\x00\xa6\x00\xa7\x00\
-\xa9\x00\xab\x00\xac\x00\xae\x00\xb0\x00\xb1\x00\xb3\x00\xb5\x00\
-\xb7\x00\xbd\x00\xf2\x00\xf3\x00\xee\x00\xf0\x00\xf1\x00\xef\x01\
-\x05\x01\x06\x00\xdf\x00\x88\x00\x89\x00\x8a\x00\x8c\x00\x8e\x00\
-\x90\x00\x92\x00\x94\x00\x97\x00\x9a\x00\x9c\x00\x9e\x00\xa0\x00\
-\xa2\x00\xa8\x00\xaa\x00\xad\x00\xaf\x00\xb2\x00\xb4\x00\xb6\x00\
-\xbc\x00\xbe\x00\x95\x00\x00\x02\x1f\x00\x32\x02\xc7\x00\x04\x02\
-\xc7\x00\x04\x02\xc7\x00\x04\x02\xc7\x00\x04\x02\xc7\x00\x04\x02\
-\xc7\x00\x04\x02\xc7\x00\x04\x04\x2c\xff\xf3\x02\x61\x00\x1e\x02\
-\x77\x00\x0e\x02\x77\x00\x0e\x02\x8f\x00\x1c\x02\xf0\x00\x14\x02\
-\x5b\x00\x26\x02\x5b\x00\x26\x02\x5b\x00\x26\x02\x5b\x00\x26\x02\
-\x5b\x00\x26\x02\x65\x00\x26\x02\xcf\x00\x23\x02\x8a\x00\x1c\x00\
-\xef\x00\x1c\x00\xef\xff\xe1\x00\xef\xff\xb0\x00\xef\xff\xa1\x00\
-\xef\xff\xa9\x02\x13\x00\x0f\x02\x55\x00\x28\x02\x39\x00\x32\x02\
-\x93\x00\x0a\x03\x29\x00\x1c\x02\x9e\x00\x1c\x02\x9e\x00\x1c\x02\
-\xd1\x00\x0e\x02\xd1\x00\x0e\x02\xd1\x00\x0e\x02\xd1\x00\x0e\x02\
-\xd1\x00\x0e\x02\xe6\x00\x18\x02\xd1\x00\x0e\x03\xf8\x00\x0e\x02\
-\x53\x00\x23\x02\x5e\x00\x28\x03\x0e\x00\x0e\x02\x5c\x00\x23\x02\
-\x1e\x00\x0b\x02\x1e\x00\x0b\x02\x80\x00\x0f\x02\xa3\x00\x1c\x02\
-\xa3\x00\x1c\x02\xa3\x00\x1c\x02\xa3\x00\x1c\x02\xa3\x00\x1c\x02\
-\xd8\x00\x14\x03\xb3\x00\x09\x02\xb1\x00\x08\x02\x7e\x00\x00\x02\
-\x7e\x00\x00\x02\x7e\x00\x00\x02\x56\x00\x0e\x02\x56\x00\x0e\x02\
-\x2d\x00\x0f\x02\x2d\x00\x0f\x02\x2d\x00\x0f\x02\x2d\x00\x0f\x02\
-\x2d\x00\x0f\x02\x2d\x00\x0f\x02\x2d\x00\x0f\x03\x4e\x00\x0e\x02\
-\x2a\x00\x1e\x01\xf7\x00\x19\x01\xe7\x00\x19\x02\x2a\x00\x0f\x02\
-\x34\x00\x18\x02\x17\x00\x0f\x02\x17\x00\x0f\x02\x17\x00\x0f\x02\
-\x17\x00\x0f\x02\x17\x00\x0f\x01\xa3\x00\x05\x02\x22\x00\x0e\x02\
-\x33\x00\x1c\x00\xfb\x00\x23\x00\xed\x00\x1c\x00\xed\x00\x05\x00\
-\xed\xff\xad\x00\xed\xff\xa0\x00\xed\xff\xd1\x00\xea\xff\x7c\x02\
-\x00\x00\x23\x01\x37\x00\x23\x01\xb3\xff\xff\x03\x17\x00\x1c\x02\
-\x36\x00\x1e\x02\x36\x00\x1e\x02\x2e\x00\x0e\x02\x2e\x00\x0e\x02\
-\x2e\x00\x0e\x02\x2e\x00\x0e\x02\x2e\x00\x0e\x02\x2e\x00\x0e\x02\
-\x2e\x00\x0e\x03\x6e\x00\x0e\x02\x1d\x00\x1a\x02\x1b\x00\x1c\x02\
-\x1f\x00\x0a\x01\xb0\x00\x1e\x01\xc9\x00\x0f\x01\xc9\x00\x0f\x02\
-\x4d\x00\x1c\x01\xad\x00\x0a\x02\x38\x00\x1e\x02\x38\x00\x1e\x02\
-\x38\x00\x1e\x02\x38\x00\x1e\x02\x38\x00\x1e\x02\x41\x00\x09\x02\
-\xe1\x00\x06\x02\x1a\x00\x06\x02\x40\x00\x06\x02\x40\x00\x06\x02\
-\x40\x00\x06\x02\x21\x00\x0e\x02\x21\x00\x0e\x02\xeb\x00\x05\x03\
-\xdb\x00\x05\x02\xf5\x00\x05\x02\x9e\x00\x05\x02\xda\x00\x05\x01\
-\xef\xff\x7c\x02\x5a\x00\x1c\x02\xe2\x00\x05\x01\x9e\x00\x0e\x01\
-\x98\x00\x0e\x02\x77\x00\x12\x02\x77\x00\x12\x02\x77\x00\x12\x02\
-\x77\x00\x12\x02\x68\x00\x17\x02\x68\x00\x17\x01\xc1\x00\x03\x01\
-\xc1\x00\x03\x02\x4f\x00\x17\x02\x4f\x00\x17\x02\x4f\x00\x17\x02\
-\x4f\x00\x17\x00\xf8\x00\x21\x01\x3d\x00\x05\x00\xf8\xff\xe5\x01\
-\xb0\x00\x0e\x01\xb0\x00\x07\x02\x76\x00\x27\x02\x72\x00\x17\x02\
-\x72\x00\x17\x00\xf8\x00\x21\x00\xf8\xff\xc6\x02\x20\x00\x17\x02\
-\x20\x00\x17\x02\x2a\x00\x0c\x02\x2a\x00\x0c\x02\x0c\x00\x0d\x02\
-\x0c\x00\x0d\x02\x59\x00\x1c\x02\x8a\x00\x17\x02\x8a\x00\x17\x00\
-\xf8\x00\x21\x01\xb0\x00\x13\x01\xb0\x00\x13\x02\x7b\x00\x17\x02\
-\x7b\x00\x17\x02\x42\x00\x09\x02\x2e\x00\x12\x02\x2e\x00\x12\x02\
-\x3c\x00\x14\x02\x3c\x00\x14\x02\x2e\x00\x18\x02\x3a\x00\x0e\x02\
-\x3a\x00\x0e\x02\x5c\x00\x17\x02\x5c\x00\x17\x02\x12\x00\x0e\x02\
-\x12\x00\x0e\x02\xc3\x00\x17\x02\xc3\x00\x17\x02\xc3\x00\x17\x02\
-\xc3\x00\x17\x02\xc3\x00\x17\x02\xc3\x00\x17\x02\xae\x00\x17\x02\
-\xae\x00\x17\x02\x35\x00\x0e\x01\x7b\x00\x05\x02\x36\x00\x0e\x02\
-\x35\x00\x0e\x02\x27\x00\x05\x01\xed\x00\x05\x02\x09\x00\x0e\x02\
-\x0a\x00\x05\x02\x1d\x00\x0e\x02\x09\x00\x0e\x01\xf1\x00\x0d\x02\
-\xec\x00\x21\x02\xdb\x00\x21\x02\xec\x00\x19\x01\x2b\x00\x02\x01\
-\xa7\x00\x0e\x01\xa9\x00\x0e\x00\xeb\x00\x00\x00\xeb\x00\x00\x00\
-\xdc\x00\x0b\x01\xc0\x00\x15\x01\x2e\x00\x17\x00\xdc\x00\x0e\x00\
-\xdf\x00\x0f\x00\xdd\x00\x0e\x00\xdc\x00\x0e\x03\x23\x00\x19\x00\
-\xf8\x00\x1c\x00\xf9\x00\x1c\x01\xdc\x00\x05\x01\xdb\x00\x0a\x00\
-\xdc\x00\x0e\x01\x3e\x00\x0e\x01\xd4\xff\xfd\x02\xb9\xff\xff\x01\
-\xe9\xff\xfd\x01\xeb\xff\xff\x01\x93\x00\x0e\x02\x1e\x00\x0f\x02\
-\x99\x00\x0f\x03\x00\x00\x05\x01\x65\x00\x13\x01\x65\x00\x05\x01\
-\x62\x00\x05\x01\x62\x00\x05\x01\x44\x00\x1c\x01\x44\x00\x05\x00\
-\xdf\x00\x10\x01\xc0\x00\x16\x01\xc0\x00\x13\x01\xc0\x00\x15\x00\
-\xdc\x00\x0d\x00\xdc\x00\x0b\x02\x8e\x00\x0f\x02\x8b\x00\x0c\x01\
-\x64\x00\x0c\x01\x68\x00\x0a\x01\x8f\x00\x0e\x00\xc1\x00\x0e\x01\
-\xec\xff\xf7\x03\x4c\x00\x0e\x02\xb8\x00\x0e\x02\x3b\x00\x13\x02\
-\x09\x00\x0b\x02\x95\x00\x0e\x02\x95\x00\x0e\x03\x0d\x00\x05\x01\
-\x7b\x00\x0e\x00\xca\x00\x1c\x00\xc8\x00\x1c\x01\xea\x00\x05\x01\
-\xea\x00\x05\x02\x39\x00\x05\x01\x94\x00\x0e\x02\x76\x00\x0b\x01\
-\xba\x00\x0c\x03\xac\x00\x37\x02\x74\x00\x05\x02\x76\x00\x00\x01\
-\xea\x00\x0e\x02\x1c\x00\x0e\x01\xe5\x00\x0b\x01\xd4\x00\x0e\x01\
-\xbd\x00\x0e\x02\x47\x00\x03\x02\x47\x00\x05\x01\xd2\x00\x19\x02\
-\x2c\x00\x16\x01\xe9\x00\x05\x01\xe9\x00\x1a\x02\x2f\x00\x1c\x03\
-\x0b\x00\x1c\x04\x71\x00\x1c\x00\x00\x00\x17\x00\x00\x00\x17\x00\
-\x00\x00\x2a\x00\x00\x00\x4f\x00\x00\x00\x3c\x00\x00\x00\x17\x00\
-\x00\x00\x2a\x00\x00\x00\x2a\x00\x00\x00\x3c\x00\x00\x00\x33\x00\
-\x00\x00\x17\x00\x00\x00\x17\x00\x00\x00\x18\x00\x00\x00\x21\x00\
-\x00\x00\x21\x00\x00\x00\x17\x00\x00\x00\x17\x00\x00\x00\x2d\x00\
-\x00\x00\x2d\x00\x00\x00\x2f\x00\x00\x00\x7e\x00\x00\xff\xfe\x00\
-\x00\x00\x53\x00\x00\x00\x51\x00\x00\x00\x0c\x00\x00\x00\x2f\x00\
-\x00\x00\x41\x00\x00\x00\x83\x00\x00\x00\x42\x00\x00\x00\x37\x02\
-\x0e\x00\x2d\x01\x0f\x00\x2d\x01\xc0\x00\x2f\x02\x33\x00\x7e\x01\
-\xc0\xff\xfe\x02\x31\x00\x53\x02\x2e\x00\x51\x01\x5d\x00\x0c\x01\
-\x60\x00\x2f\x02\x1f\x00\x41\x02\x58\x00\x83\x01\x48\x00\x42\x01\
-\x33\x00\x37\x00\x00\x00\x1f\x01\x7a\x00\x03\x00\x01\x04\x09\x00\
-\x00\x00\xa8\x03\x74\x00\x03\x00\x01\x04\x09\x00\x01\x00\x0e\x03\
-\x66\x00\x03\x00\x01\x04\x09\x00\x02\x00\x08\x03\x5e\x00\x03\x00\
-\x01\x04\x09\x00\x03\x00\x2e\x03\x30\x00\x03\x00\x01\x04\x09\x00\
-\x04\x00\x18\x03\x18\x00\x03\x00\x01\x04\x09\x00\x05\x00\x1a\x02\
-\xfe\x00\x03\x00\x01\x04\x09\x00\x06\x00\x18\x02\xe6\x00\x03\x00\
-\x01\x04\x09\x00\x08\x00\x3a\x02\xac\x00\x03\x00\x01\x04\x09\x00\
-\x09\x00\x14\x02\x98\x00\x03\x00\x01\x04\x09\x00\x0b\x00\x26\x02\
-\x72\x00\x03\x00\x01\x04\x09\x00\x0c\x00\x26\x02\x72\x00\x03\x00\
-\x01\x04\x09\x00\x0d\x01\x20\x01\x52\x00\x03\x00\x01\x04\x09\x00\
-\x0e\x00\x34\x01\x1e\x00\x03\x00\x01\x04\x09\x00\x19\x00\x0e\x03\
-\x66\x00\x03\x00\x01\x04\x09\x01\x00\x00\x0c\x01\x12\x00\x03\x00\
-\x01\x04\x09\x01\x01\x00\x0a\x01\x08\x00\x03\x00\x01\x04\x09\x01\
-\x02\x00\x0a\x00\xfe\x00\x03\x00\x01\x04\x09\x01\x03\x00\x0e\x00\
-\xf0\x00\x03\x00\x01\x04\x09\x01\x04\x00\x0c\x00\xe4\x00\x03\x00\
-\x01\x04\x09\x01\x05\x00\x10\x00\xd4\x00\x03\x00\x01\x04\x09\x01\
-\x06\x00\x08\x03\x5e\x00\x03\x00\x01\x04\x09\x01\x07\x00\x1a\x00\
-\xba\x00\x03\x00\x01\x04\x09\x01\x08\x00\x1e\x00\x9c\x00\x03\x00\
-\x01\x04\x09\x01\x09\x00\x1c\x00\x80\x00\x03\x00\x01\x04\x09\x01\
-\x0a\x00\x20\x00\x60\x00\x03\x00\x01\x04\x09\x01\x0b\x00\x18\x02\
-\xe6\x00\x03\x00\x01\x04\x09\x01\x0c\x00\x12\x00\x4e\x00\x03\x00\
-\x01\x04\x09\x01\x0d\x00\x1a\x00\x34\x00\x03\x00\x01\x04\x09\x01\
-\x0e\x00\x0c\x00\x28\x00\x03\x00\x01\x04\x09\x01\x0f\x00\x18\x00\
-\x10\x00\x03\x00\x01\x04\x09\x01\x10\x00\x10\x00\x00\x00\x45\x00\
-\x78\x00\x70\x00\x61\x00\x6e\x00\x64\x00\x65\x00\x64\x00\x53\x00\
-\x65\x00\x6d\x00\x69\x00\x45\x00\x78\x00\x70\x00\x61\x00\x6e\x00\
-\x64\x00\x65\x00\x64\x00\x4e\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\
-\x6c\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x43\x00\x6f\x00\x6e\x00\
-\x64\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x43\x00\x6f\x00\
-\x6e\x00\x64\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x46\x00\
-\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x53\x00\
-\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x46\x00\
-\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x4d\x00\
-\x65\x00\x64\x00\x69\x00\x75\x00\x6d\x00\x46\x00\x72\x00\x65\x00\
-\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x52\x00\x65\x00\x67\x00\
-\x75\x00\x6c\x00\x61\x00\x72\x00\x46\x00\x72\x00\x65\x00\x64\x00\
-\x6f\x00\x6b\x00\x61\x00\x2d\x00\x4c\x00\x69\x00\x67\x00\x68\x00\
-\x74\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\x6c\x00\
-\x64\x00\x4d\x00\x65\x00\x64\x00\x69\x00\x75\x00\x6d\x00\x52\x00\
-\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x00\x4c\x00\x69\x00\
-\x67\x00\x68\x00\x74\x00\x57\x00\x69\x00\x64\x00\x74\x00\x68\x00\
-\x57\x00\x65\x00\x69\x00\x67\x00\x68\x00\x74\x00\x68\x00\x74\x00\
-\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\x00\
-\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\x00\
-\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\x00\
-\x54\x00\x68\x00\x69\x00\x73\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\
-\x74\x00\x20\x00\x53\x00\x6f\x00\x66\x00\x74\x00\x77\x00\x61\x00\
-\x72\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x6c\x00\x69\x00\
-\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x20\x00\x75\x00\
-\x6e\x00\x64\x00\x65\x00\x72\x00\x20\x00\x74\x00\x68\x00\x65\x00\
-\x20\x00\x53\x00\x49\x00\x4c\x00\x20\x00\x4f\x00\x70\x00\x65\x00\
-\x6e\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\x4c\x00\
-\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x2c\x00\x20\x00\
-\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\
-\x31\x00\x2e\x00\x31\x00\x2e\x00\x20\x00\x54\x00\x68\x00\x69\x00\
-\x73\x00\x20\x00\x6c\x00\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\
-\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x61\x00\x76\x00\x61\x00\
-\x69\x00\x6c\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x20\x00\x77\x00\
-\x69\x00\x74\x00\x68\x00\x20\x00\x61\x00\x20\x00\x46\x00\x41\x00\
-\x51\x00\x20\x00\x61\x00\x74\x00\x3a\x00\x20\x00\x68\x00\x74\x00\
-\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\x00\
-\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\x00\
-\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\x00\
-\x68\x00\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x68\x00\
-\x61\x00\x66\x00\x6f\x00\x6e\x00\x74\x00\x69\x00\x61\x00\x2e\x00\
-\x63\x00\x6f\x00\x6d\x00\x42\x00\x65\x00\x6e\x00\x20\x00\x4e\x00\
-\x61\x00\x74\x00\x68\x00\x61\x00\x6e\x00\x4d\x00\x69\x00\x6c\x00\
-\x65\x00\x6e\x00\x61\x00\x20\x00\x42\x00\x2e\x00\x20\x00\x42\x00\
-\x72\x00\x61\x00\x6e\x00\x64\x00\xe3\x00\x6f\x00\x2c\x00\x20\x00\
-\x42\x00\x65\x00\x6e\x00\x20\x00\x4e\x00\x61\x00\x74\x00\x68\x00\
-\x61\x00\x6e\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\
-\x61\x00\x2d\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x56\x00\x65\x00\
-\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\x32\x00\x2e\x00\
-\x30\x00\x30\x00\x31\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\
-\x6b\x00\x61\x00\x20\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x32\x00\
-\x2e\x00\x30\x00\x30\x00\x31\x00\x3b\x00\x73\x00\x73\x00\x64\x00\
-\x65\x00\x3b\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\
-\x61\x00\x2d\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x42\x00\x6f\x00\
-\x6c\x00\x64\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\
-\x61\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\x00\x69\x00\x67\x00\
-\x68\x00\x74\x00\x20\x00\x32\x00\x30\x00\x31\x00\x36\x00\x20\x00\
-\x54\x00\x68\x00\x65\x00\x20\x00\x46\x00\x72\x00\x65\x00\x64\x00\
-\x6f\x00\x6b\x00\x61\x00\x20\x00\x50\x00\x72\x00\x6f\x00\x6a\x00\
-\x65\x00\x63\x00\x74\x00\x20\x00\x41\x00\x75\x00\x74\x00\x68\x00\
-\x6f\x00\x72\x00\x73\x00\x20\x00\x28\x00\x68\x00\x74\x00\x74\x00\
-\x70\x00\x73\x00\x3a\x00\x2f\x00\x2f\x00\x67\x00\x69\x00\x74\x00\
-\x68\x00\x75\x00\x62\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x2f\x00\
-\x68\x00\x61\x00\x66\x00\x6f\x00\x6e\x00\x74\x00\x69\x00\x61\x00\
-\x2f\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\
-\x2d\x00\x4f\x00\x6e\x00\x65\x00\x29\x00\x00\x00\x02\x00\x00\x00\
-\x00\x00\x00\xff\x9c\x00\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x47\x00\x00\x00\
-\x24\x00\xc9\x00\xc7\x00\x62\x00\xad\x00\x63\x00\xae\x00\x90\x00\
-\x25\x00\x26\x00\x64\x00\x27\x00\xe9\x00\x28\x00\x65\x00\xc8\x00\
-\xca\x00\xcb\x00\x29\x00\x2a\x00\x2b\x00\x2c\x00\xcc\x00\xcd\x00\
-\xce\x00\xcf\x00\x2d\x00\x2e\x00\x2f\x00\xe2\x00\x30\x00\x31\x00\
-\x66\x00\x32\x00\xd0\x00\xd1\x00\x67\x00\xd3\x00\x91\x00\xaf\x00\
-\xb0\x00\x33\x00\xed\x00\x34\x00\x35\x00\x36\x00\xe4\x00\x37\x00\
-\x38\x00\xd4\x00\xd5\x00\x68\x00\xd6\x00\x39\x00\x3a\x00\x3b\x00\
-\x3c\x00\xeb\x00\xbb\x00\x3d\x00\xe6\x00\x44\x00\x69\x00\x6b\x00\
-\x6c\x00\x6a\x00\x6e\x00\x6d\x00\xa0\x00\x45\x00\x46\x00\x6f\x00\
-\x47\x00\xea\x00\x48\x00\x70\x00\x72\x00\x73\x00\x71\x00\x49\x00\
-\x4a\x00\x4b\x00\x4c\x00\xd7\x00\x74\x00\x76\x00\x77\x00\x75\x00\
-\x4d\x00\x4e\x00\x4f\x00\xe3\x00\x50\x00\x51\x00\x78\x00\x52\x00\
-\x79\x00\x7b\x00\x7c\x00\x7a\x00\xa1\x00\x7d\x00\xb1\x00\x53\x00\
-\xee\x00\x54\x00\x55\x00\x56\x00\xe5\x00\x89\x00\x57\x00\x58\x00\
-\x7e\x00\x80\x00\x81\x00\x7f\x00\x59\x00\x5a\x00\x5b\x00\x5c\x00\
-\xec\x00\xba\x00\x5d\x00\xe7\x01\x02\x01\x03\x01\x04\x00\xc0\x00\
-\xc1\x01\x05\x01\x06\x01\x07\x00\x9d\x00\x9e\x01\x08\x01\x09\x01\
-\x0a\x01\x0b\x01\x0c\x01\x0d\x01\x0e\x01\x0f\x01\x10\x01\x11\x01\
-\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\
-\x1a\x01\x1b\x01\x1c\x01\x1d\x01\x1e\x01\x1f\x01\x20\x01\x21\x01\
-\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\
-\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x01\x31\x01\
-\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\
-\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x00\x13\x00\x14\x00\
-\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\x1c\x00\
-\xbc\x00\xf4\x00\xf5\x00\xf6\x01\x40\x01\x41\x01\x42\x00\x03\x01\
-\x43\x01\x44\x01\x45\x01\x46\x00\x11\x00\x0f\x00\x1d\x00\x1e\x00\
-\xab\x00\x04\x00\xa3\x00\x22\x00\xa2\x00\xc3\x00\x87\x00\x0d\x00\
-\x06\x00\x12\x00\x3f\x00\x10\x00\xb2\x00\xb3\x00\x42\x00\x0b\x00\
-\x0c\x00\x5e\x00\x60\x00\x3e\x00\x40\x00\xc4\x00\xc5\x00\xb4\x00\
-\xb5\x00\xb6\x00\xb7\x00\xa9\x00\xaa\x00\xbe\x00\xbf\x00\x05\x00\
-\x0a\x00\xa6\x00\x23\x00\x09\x00\x88\x00\x86\x00\x8b\x00\x8a\x00\
-\x8c\x00\x83\x00\x5f\x00\xe8\x00\x82\x00\xc2\x01\x47\x00\x84\x00\
-\xbd\x00\x07\x01\x48\x00\x85\x00\x96\x00\x0e\x00\xef\x00\xf0\x00\
-\xb8\x00\x20\x00\x21\x00\x1f\x00\x93\x00\x61\x00\xa4\x00\x41\x01\
-\x49\x00\x08\x00\xc6\x01\x4a\x01\x4b\x01\x4c\x01\x4d\x01\x4e\x01\
-\x4f\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\
-\x57\x01\x58\x01\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x01\
-\x5f\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\
-\x67\x00\x8e\x00\xdc\x00\x43\x00\x8d\x00\xdf\x00\xd8\x00\xe1\x00\
-\xdb\x00\xdd\x00\xd9\x00\xda\x00\xde\x00\xe0\x03\x66\x5f\x66\x05\
-\x66\x5f\x66\x5f\x69\x03\x66\x5f\x74\x03\x6a\x5f\x6a\x03\x6c\x5f\
-\x6c\x03\x74\x5f\x74\x07\x75\x6e\x69\x30\x35\x44\x30\x07\x75\x6e\
-\x69\x46\x42\x32\x45\x07\x75\x6e\x69\x46\x42\x32\x46\x07\x75\x6e\
-\x69\x46\x42\x33\x30\x07\x75\x6e\x69\x30\x35\x44\x31\x07\x75\x6e\
-\x69\x46\x42\x33\x31\x07\x75\x6e\x69\x30\x35\x44\x32\x07\x75\x6e\
-\x69\x46\x42\x33\x32\x07\x75\x6e\x69\x30\x35\x44\x33\x07\x75\x6e\
-\x69\x46\x42\x33\x33\x07\x75\x6e\x69\x30\x35\x44\x34\x07\x75\x6e\
-\x69\x46\x42\x33\x34\x07\x75\x6e\x69\x30\x35\x44\x35\x07\x75\x6e\
-\x69\x46\x42\x33\x35\x07\x75\x6e\x69\x46\x42\x34\x42\x07\x75\x6e\
-\x69\x30\x35\x44\x36\x07\x75\x6e\x69\x46\x42\x33\x36\x07\x75\x6e\
-\x69\x30\x35\x44\x37\x07\x75\x6e\x69\x30\x35\x44\x38\x07\x75\x6e\
-\x69\x46\x42\x33\x38\x07\x75\x6e\x69\x30\x35\x44\x39\x07\x75\x6e\
-\x69\x46\x42\x33\x39\x07\x75\x6e\x69\x30\x35\x44\x41\x07\x75\x6e\
-\x69\x46\x42\x33\x41\x07\x75\x6e\x69\x30\x35\x44\x42\x07\x75\x6e\
-\x69\x46\x42\x33\x42\x07\x75\x6e\x69\x30\x35\x44\x43\x07\x75\x6e\
-\x69\x46\x42\x33\x43\x07\x75\x6e\x69\x30\x35\x44\x44\x07\x75\x6e\
-\x69\x30\x35\x44\x45\x07\x75\x6e\x69\x46\x42\x33\x45\x07\x75\x6e\
-\x69\x30\x35\x44\x46\x07\x75\x6e\x69\x30\x35\x45\x30\x07\x75\x6e\
-\x69\x46\x42\x34\x30\x07\x75\x6e\x69\x30\x35\x45\x31\x07\x75\x6e\
-\x69\x46\x42\x34\x31\x07\x75\x6e\x69\x30\x35\x45\x32\x07\x75\x6e\
-\x69\x30\x35\x45\x33\x07\x75\x6e\x69\x46\x42\x34\x33\x07\x75\x6e\
-\x69\x30\x35\x45\x34\x07\x75\x6e\x69\x46\x42\x34\x34\x07\x75\x6e\
-\x69\x30\x35\x45\x35\x07\x75\x6e\x69\x30\x35\x45\x36\x07\x75\x6e\
-\x69\x46\x42\x34\x36\x07\x75\x6e\x69\x30\x35\x45\x37\x07\x75\x6e\
-\x69\x46\x42\x34\x37\x07\x75\x6e\x69\x30\x35\x45\x38\x07\x75\x6e\
-\x69\x46\x42\x34\x38\x07\x75\x6e\x69\x30\x35\x45\x39\x07\x75\x6e\
-\x69\x46\x42\x32\x41\x07\x75\x6e\x69\x46\x42\x32\x42\x07\x75\x6e\
-\x69\x46\x42\x32\x43\x07\x75\x6e\x69\x46\x42\x32\x44\x07\x75\x6e\
-\x69\x46\x42\x34\x39\x07\x75\x6e\x69\x30\x35\x45\x41\x07\x75\x6e\
-\x69\x46\x42\x34\x41\x07\x75\x6e\x69\x30\x30\x42\x39\x07\x75\x6e\
-\x69\x30\x30\x42\x32\x07\x75\x6e\x69\x30\x30\x42\x33\x07\x75\x6e\
-\x69\x30\x30\x41\x30\x07\x75\x6e\x69\x30\x35\x46\x33\x07\x75\x6e\
-\x69\x30\x35\x46\x34\x07\x75\x6e\x69\x30\x35\x42\x45\x04\x45\x75\
-\x72\x6f\x09\x6e\x65\x77\x73\x68\x65\x71\x65\x6c\x07\x75\x6e\x69\
-\x30\x33\x42\x43\x07\x75\x6e\x69\x30\x35\x43\x31\x07\x75\x6e\x69\
-\x30\x35\x42\x30\x07\x75\x6e\x69\x30\x35\x42\x31\x07\x75\x6e\x69\
-\x30\x35\x42\x32\x07\x75\x6e\x69\x30\x35\x42\x33\x07\x75\x6e\x69\
-\x30\x35\x42\x34\x07\x75\x6e\x69\x30\x35\x42\x35\x07\x75\x6e\x69\
-\x30\x35\x42\x36\x07\x75\x6e\x69\x30\x35\x42\x37\x07\x75\x6e\x69\
-\x30\x35\x42\x38\x07\x75\x6e\x69\x30\x35\x42\x39\x07\x75\x6e\x69\
-\x30\x35\x42\x41\x07\x75\x6e\x69\x30\x35\x42\x42\x07\x75\x6e\x69\
-\x30\x35\x42\x43\x07\x75\x6e\x69\x30\x35\x42\x46\x07\x75\x6e\x69\
-\x30\x35\x43\x32\x07\x75\x6e\x69\x30\x35\x43\x37\x07\x75\x6e\x69\
-\x30\x33\x30\x38\x07\x75\x6e\x69\x30\x33\x30\x37\x09\x67\x72\x61\
-\x76\x65\x63\x6f\x6d\x62\x09\x61\x63\x75\x74\x65\x63\x6f\x6d\x62\
-\x07\x75\x6e\x69\x30\x33\x30\x42\x07\x75\x6e\x69\x30\x33\x30\x32\
-\x07\x75\x6e\x69\x30\x33\x30\x43\x07\x75\x6e\x69\x30\x33\x30\x36\
-\x07\x75\x6e\x69\x30\x33\x30\x41\x09\x74\x69\x6c\x64\x65\x63\x6f\
-\x6d\x62\x07\x75\x6e\x69\x30\x33\x30\x34\x07\x75\x6e\x69\x30\x33\
-\x32\x37\x07\x75\x6e\x69\x30\x33\x32\x38\x00\x00\x01\x00\x00\x00\
-\x0a\x00\x4c\x00\x82\x00\x03\x44\x46\x4c\x54\x00\x34\x68\x65\x62\
-\x72\x00\x24\x6c\x61\x74\x6e\x00\x14\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x03\x00\x01\x00\x02\x00\x03\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x03\x00\x00\x00\x02\x00\x03\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x02\x00\x02\x00\x03\x00\x04\x6b\x65\x72\x6e\x00\x30\x6b\
-\x65\x72\x6e\x00\x28\x6d\x61\x72\x6b\x00\x20\x6d\x6b\x6d\x6b\x00\
-\x1a\x00\x00\x00\x01\x00\x05\x00\x00\x00\x02\x00\x03\x00\x04\x00\
-\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02\x00\x06\x15\
-\xc0\x13\x5c\x11\x44\x01\xda\x00\x76\x00\x0e\x00\x06\x00\x10\x00\
-\x01\x00\x0a\x00\x00\x00\x01\x00\x4e\x00\x16\x00\x01\x00\x1c\x00\
-\x0c\x00\x01\x00\x04\x00\x01\x01\x29\x02\xa0\x00\x01\x00\x01\x01\
-\x37\x00\x0c\x00\x00\x10\xc4\x00\x00\x10\xb8\x00\x00\x10\xb2\x00\
-\x00\x10\xac\x00\x00\x10\xa6\x00\x00\x10\xa0\x00\x00\x10\x9a\x00\
-\x00\x10\x94\x00\x00\x10\x8e\x00\x00\x10\x88\x00\x00\x10\x82\x00\
-\x00\x10\x7c\x00\x02\x00\x02\x01\x2a\x01\x2a\x00\x00\x01\x2d\x01\
-\x37\x00\x01\x00\x05\x00\x00\x00\x01\x00\x08\x00\x01\x01\x46\x00\
-\x0c\x00\x04\x00\xe0\x00\x1a\x00\x01\x00\x05\x00\x7f\x00\x80\x00\
-\x81\x00\x83\x00\x84\x00\x05\x00\x9c\x00\x84\x00\x66\x00\x36\x00\
-\x0c\x00\x02\x00\x54\x00\x24\x00\x54\x00\x1e\x00\x54\x00\x18\x00\
-\x54\x00\x12\x00\x01\x02\x2a\x01\xf4\x00\x01\x02\x2a\x00\x00\x00\
-\x01\x00\xb9\x01\xf4\x00\x01\x00\xb9\x00\x00\x00\x02\x00\x2a\x00\
-\x24\x00\x2a\x00\x1e\x00\x2a\x00\x18\x00\x2a\x00\x12\x00\x01\x01\
-\xc4\x01\xf4\x00\x01\x01\xc4\x00\x00\x00\x01\x00\x97\x01\xf4\x00\
-\x01\x00\x97\x00\x00\x00\x01\x00\x00\x00\x00\x00\x02\x00\x00\x0c\
-\xb6\x00\x00\x0c\xb0\x00\x00\x00\x18\x00\x00\x00\x12\x00\x01\x02\
-\x42\x01\xf4\x00\x01\x02\x42\x00\x00\x00\x02\x00\x00\x0c\x98\x00\
-\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\x01\x02\x21\x00\
-\x00\x00\x02\x00\x00\x00\x24\x00\x00\x00\x1e\x00\x00\x00\x18\x00\
-\x00\x00\x12\x00\x01\x02\x38\x01\xf4\x00\x01\x02\x38\x00\x00\x00\
-\x01\x00\xbd\x01\xf4\x00\x01\x00\xbd\x00\x00\x00\x19\x00\x00\x0f\
-\xd0\x00\x01\x0f\xca\x00\x01\x0f\xc4\x00\x01\x0f\xbe\x00\x01\x0f\
-\xb8\x00\x01\x0f\xca\x00\x01\x0f\xb2\x00\x01\x0f\xb2\x00\x01\x0f\
-\xac\x00\x01\x0f\xac\x00\x01\x0f\xa6\x00\x02\x0f\xa0\x00\x03\x0f\
-\x9a\x00\x01\x0f\x94\x00\x03\x0f\x8e\x00\x03\x0f\x88\x00\x03\x0f\
-\x82\x00\x03\x0f\x7c\x00\x03\x0f\x76\x00\x03\x0f\x70\x00\x03\x0f\
-\x6a\x00\x03\x0f\x64\x00\x03\x0f\x5e\x00\x03\x0f\x58\x00\x03\x0f\
-\x52\x00\x02\x00\x03\x01\x1c\x01\x25\x00\x00\x01\x28\x01\x2a\x00\
-\x0a\x01\x2c\x01\x37\x00\x0d\x00\x04\x00\x00\x00\x01\x00\x08\x00\
-\x01\x0f\x52\x0e\x36\x00\x06\x0e\x52\x00\x0c\x00\xb2\x00\x00\x0e\
-\x24\x00\x00\x00\x00\x0e\x1e\x0e\x18\x00\x00\x0e\x24\x00\x00\x00\
-\x00\x0e\x12\x0e\x18\x00\x00\x0e\x24\x00\x00\x00\x00\x0e\x0c\x0e\
-\x18\x00\x00\x0e\x24\x00\x00\x00\x00\x0e\x1e\x0e\x18\x00\x00\x0e\
-\x24\x00\x00\x00\x00\x0e\x1e\x0e\x18\x00\x00\x0e\x24\x00\x00\x00\
-\x00\x0e\x1e\x0e\x18\x00\x00\x0e\x24\x00\x00\x00\x00\x0e\x1e\x0e\
-\x18\x00\x00\x0e\x06\x00\x00\x00\x00\x0e\x00\x00\x00\x00\x00\x0d\
-\xfa\x00\x00\x00\x00\x0d\xf4\x00\x00\x00\x00\x0d\xee\x00\x00\x00\
-\x00\x0d\xe8\x00\x00\x00\x00\x0d\xee\x00\x00\x00\x00\x0d\xe8\x00\
-\x00\x00\x00\x0d\xe2\x00\x00\x0d\xdc\x0d\xd6\x00\x00\x00\x00\x0d\
-\xd0\x00\x00\x0d\xca\x0d\xc4\x00\x00\x00\x00\x0d\xbe\x0d\xb8\x00\
-\x00\x0d\xb2\x0d\xac\x00\x00\x0d\xbe\x0d\xb8\x00\x00\x0d\xb2\x0d\
-\xac\x00\x00\x0d\xbe\x0d\xb8\x00\x00\x0d\xa6\x0d\xac\x00\x00\x0d\
-\xbe\x0d\xb8\x00\x00\x0d\xb2\x0d\xac\x00\x00\x0d\xbe\x0d\xb8\x00\
-\x00\x0d\xb2\x0d\xac\x00\x00\x0d\xa0\x00\x00\x00\x00\x0d\x9a\x00\
-\x00\x00\x00\x0d\x94\x00\x00\x00\x00\x0d\x8e\x00\x00\x00\x00\x0d\
-\x88\x0d\x82\x0d\x7c\x0d\x76\x00\x00\x00\x00\x0d\x70\x0d\x82\x00\
-\x00\x0d\x6a\x0d\x64\x00\x00\x0d\x70\x0d\x82\x00\x00\x0d\x5e\x0d\
-\x64\x00\x00\x0d\x70\x0d\x82\x00\x00\x0d\x58\x0d\x64\x00\x00\x0d\
-\x70\x0d\x82\x00\x00\x0d\x6a\x0d\x64\x00\x00\x0d\x70\x0d\x82\x00\
-\x00\x0d\x6a\x0d\x64\x00\x00\x0d\x52\x00\x00\x00\x00\x0d\x4c\x00\
-\x00\x00\x00\x0d\x46\x00\x00\x00\x00\x0d\x40\x00\x00\x0d\x3a\x0d\
-\x34\x00\x00\x0d\x2e\x0d\x28\x00\x00\x0d\x22\x0d\x1c\x00\x00\x0d\
-\x16\x0d\x10\x00\x00\x00\x00\x0d\x0a\x00\x00\x00\x00\x0d\x04\x00\
-\x00\x00\x00\x0c\xfe\x00\x00\x00\x00\x0c\xf8\x00\x00\x00\x00\x0c\
-\xfe\x00\x00\x00\x00\x0c\xf8\x00\x00\x0c\xf2\x0c\xec\x0d\x82\x0c\
-\xe6\x0c\xe0\x0c\xda\x0c\xf2\x0c\xec\x0d\x82\x0c\xe6\x0c\xd4\x0c\
-\xda\x0c\xf2\x0c\xec\x0d\x82\x0c\xe6\x0c\xce\x0c\xda\x0c\xf2\x0c\
-\xec\x0d\x82\x0c\xe6\x0c\xe0\x0c\xda\x0c\xf2\x0c\xec\x0d\x82\x0c\
-\xe6\x0c\xe0\x0c\xda\x00\x00\x0c\xec\x00\x00\x00\x00\x0c\xe0\x00\
-\x00\x0c\xf2\x0c\xec\x0d\x82\x0c\xe6\x0c\xe0\x0c\xda\x00\x00\x0c\
-\xc8\x00\x00\x00\x00\x0d\x3a\x00\x00\x00\x00\x0c\xc2\x00\x00\x00\
-\x00\x0c\xbc\x00\x00\x00\x00\x0d\xbe\x00\x00\x00\x00\x0d\xb2\x00\
-\x00\x00\x00\x0c\xb6\x00\x00\x00\x00\x0c\xb0\x00\x00\x00\x00\x0c\
-\xc2\x00\x00\x00\x00\x0c\xbc\x00\x00\x00\x00\x0c\xaa\x00\x00\x00\
-\x00\x0c\xa4\x00\x00\x00\x00\x0c\xaa\x00\x00\x00\x00\x0c\x9e\x00\
-\x00\x00\x00\x0c\x98\x00\x00\x0c\x92\x0c\x8c\x00\x00\x0c\x86\x0c\
-\x80\x00\x00\x00\x00\x0c\x7a\x0c\x74\x0c\x86\x0c\x80\x00\x00\x00\
-\x00\x0c\x6e\x0c\x74\x0c\x86\x0c\x80\x00\x00\x00\x00\x0c\x68\x0c\
-\x74\x0c\x86\x0c\x80\x00\x00\x00\x00\x0c\x7a\x0c\x74\x0c\x86\x0c\
-\x80\x00\x00\x00\x00\x0c\x7a\x0c\x74\x00\x00\x0c\x62\x00\x00\x00\
-\x00\x0c\x5c\x00\x00\x00\x00\x0c\x56\x00\x00\x00\x00\x0c\x50\x00\
-\x00\x00\x00\x0c\x4a\x00\x00\x00\x00\x0c\x44\x00\x00\x00\x00\x0c\
-\x3e\x0d\x82\x00\x00\x0c\x38\x00\x00\x00\x00\x0c\x3e\x0d\x82\x00\
-\x00\x0c\x32\x00\x00\x00\x00\x0c\x3e\x0d\x82\x00\x00\x0c\x38\x00\
-\x00\x00\x00\x0c\x2c\x00\x00\x00\x00\x0c\x26\x00\x00\x00\x00\x0c\
-\x2c\x00\x00\x00\x00\x0c\x20\x00\x00\x00\x00\x0c\x1a\x00\x00\x00\
-\x00\x0c\x14\x0c\x0e\x00\x00\x0c\x1a\x00\x00\x00\x00\x0c\x14\x0c\
-\x0e\x00\x00\x0c\x1a\x00\x00\x00\x00\x0c\x14\x0c\x0e\x00\x00\x0c\
-\x1a\x00\x00\x00\x00\x0c\x14\x0c\x0e\x00\x00\x0c\x1a\x00\x00\x00\
-\x00\x0c\x14\x0c\x0e\x00\x00\x0c\x1a\x00\x00\x00\x00\x0c\x14\x0c\
-\x0e\x00\x00\x0c\x1a\x00\x00\x00\x00\x0c\x14\x0c\x0e\x00\x00\x0c\
-\x08\x00\x00\x00\x00\x0c\x02\x00\x00\x00\x00\x0c\x1a\x00\x00\x00\
-\x00\x0c\x14\x00\x00\x00\x00\x0b\xfc\x00\x00\x00\x00\x0b\xf6\x00\
-\x00\x00\x00\x0b\xfc\x00\x00\x00\x00\x0b\xf6\x00\x00\x0b\xf0\x0b\
-\xea\x00\x00\x0b\xe4\x0b\xde\x00\x00\x00\x00\x0b\xd8\x00\x00\x00\
-\x00\x0b\xd2\x0b\xcc\x00\x00\x0b\xd8\x00\x00\x00\x00\x0b\xd2\x0b\
-\xcc\x00\x00\x0b\xd8\x00\x00\x00\x00\x0b\xd2\x0b\xcc\x00\x00\x0b\
-\xd8\x00\x00\x00\x00\x0b\xd2\x0b\xcc\x00\x00\x0b\xd8\x00\x00\x00\
-\x00\x0b\xd2\x0b\xcc\x00\x00\x0b\xc6\x00\x00\x00\x00\x0b\xc0\x00\
-\x00\x00\x00\x0b\xba\x00\x00\x00\x00\x0b\xb4\x00\x00\x00\x00\x0b\
-\xae\x00\x00\x0b\xa8\x0b\xa2\x00\x00\x00\x00\x0b\x9c\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x0b\x96\x00\x00\x00\x00\x0b\x90\x0b\
-\x8a\x00\x00\x0b\x96\x00\x00\x00\x00\x0b\x90\x0b\x8a\x00\x00\x0b\
-\x96\x00\x00\x00\x00\x0b\x90\x0b\x8a\x00\x00\x0b\x96\x00\x00\x00\
-\x00\x0b\x90\x0b\x8a\x00\x00\x0b\x96\x00\x00\x00\x00\x0b\x90\x0b\
-\x8a\x00\x00\x0b\x84\x00\x00\x00\x00\x0b\x7e\x00\x00\x0b\x78\x0b\
-\x72\x00\x00\x0b\x6c\x0b\x66\x00\x00\x0b\x60\x0b\x5a\x00\x00\x0b\
-\x54\x0b\x4e\x00\x00\x00\x00\x0b\x48\x00\x00\x00\x00\x0b\x42\x00\
-\x00\x00\x00\x0b\x3c\x00\x00\x00\x00\x0b\x36\x00\x00\x00\x00\x0b\
-\x3c\x00\x00\x00\x00\x0b\x36\x00\x00\x0b\x30\x0b\x2a\x00\x00\x0b\
-\x24\x0b\x1e\x0b\x18\x0b\x30\x0b\x2a\x00\x00\x0b\x24\x0b\x1e\x0b\
-\x18\x0b\x30\x0b\x2a\x00\x00\x0b\x24\x0b\x1e\x0b\x18\x0b\x30\x0b\
-\x2a\x00\x00\x0b\x24\x0b\x1e\x0b\x18\x0b\x30\x0b\x2a\x00\x00\x0b\
-\x24\x0b\x1e\x0b\x18\x0b\x30\x0b\x2a\x00\x00\x0b\x24\x0b\x1e\x0b\
-\x18\x0b\x30\x0b\x2a\x00\x00\x0b\x24\x0b\x1e\x0b\x18\x00\x00\x0b\
-\x12\x00\x00\x00\x00\x0b\x0c\x00\x00\x00\x00\x0c\xaa\x00\x00\x00\
-\x00\x0b\x06\x00\x00\x00\x00\x0b\x00\x00\x00\x00\x00\x0a\xfa\x00\
-\x00\x00\x00\x0a\xf4\x00\x00\x00\x00\x0a\xee\x00\x00\x00\x00\x0a\
-\xe8\x00\x00\x00\x00\x0a\xe2\x00\x00\x00\x00\x0a\xdc\x00\x00\x00\
-\x00\x0a\xd6\x00\x00\x00\x00\x0a\xdc\x00\x00\x00\x00\x0a\xd6\x00\
-\x00\x00\x00\x0d\x34\x00\x00\x00\x00\x0a\xd0\x00\x00\x0a\xca\x0a\
-\xc4\x00\x00\x0a\xbe\x0a\xb8\x00\x00\x0a\xb2\x0b\x3c\x00\x00\x00\
-\x00\x0b\x36\x0a\xac\x0a\xb2\x0b\x3c\x00\x00\x00\x00\x0b\x36\x0a\
-\xac\x0a\xb2\x0b\x3c\x00\x00\x00\x00\x0b\x36\x0a\xac\x0a\xb2\x0b\
-\x3c\x00\x00\x00\x00\x0b\x36\x0a\xac\x0a\xb2\x0b\x3c\x00\x00\x00\
-\x00\x0b\x36\x0a\xac\x00\x00\x0a\xa6\x00\x00\x00\x00\x0a\xa0\x00\
-\x00\x00\x00\x0a\x9a\x00\x00\x00\x00\x0a\x94\x00\x00\x00\x00\x0a\
-\x8e\x00\x00\x00\x00\x0a\x88\x00\x00\x00\x00\x0a\x82\x00\x00\x00\
-\x00\x0b\x78\x00\x00\x00\x00\x0a\x82\x00\x00\x00\x00\x0b\x78\x00\
-\x00\x00\x00\x0a\x82\x00\x00\x00\x00\x0b\x78\x00\x00\x00\x00\x0a\
-\xf4\x00\x00\x00\x00\x0a\xee\x00\x00\x00\x00\x0a\xf4\x00\x00\x00\
-\x00\x0a\xee\x00\x00\x00\x00\x0a\x7c\x0a\x76\x0a\x70\x0a\x6a\x00\
-\x00\x00\x00\x0a\x7c\x0a\x76\x0a\x70\x0a\x6a\x00\x00\x00\x00\x0a\
-\x7c\x0a\x76\x0a\x70\x0a\x6a\x00\x00\x00\x00\x0a\x7c\x0a\x76\x0a\
-\x70\x0a\x6a\x00\x00\x00\x00\x0a\x64\x0a\x76\x0a\x5e\x0a\x58\x00\
-\x00\x00\x00\x0a\x64\x0a\x76\x0a\x5e\x0a\x58\x00\x00\x00\x00\x0a\
-\x52\x0a\x4c\x0a\x46\x0a\x40\x00\x00\x00\x00\x0a\x52\x0a\x4c\x0a\
-\x46\x0a\x40\x00\x00\x00\x00\x0a\x3a\x0a\x34\x0a\x2e\x0a\x28\x00\
-\x00\x00\x00\x0a\x3a\x0a\x34\x0a\x2e\x0a\x28\x00\x00\x00\x00\x0a\
-\x22\x0a\x34\x0a\x1c\x0a\x28\x00\x00\x00\x00\x0a\x22\x0a\x34\x0a\
-\x1c\x0a\x28\x00\x00\x00\x00\x0a\x16\x0a\x10\x0a\x0a\x0a\x04\x00\
-\x00\x00\x00\x09\xfe\x09\xf8\x09\xf2\x09\xec\x00\x00\x00\x00\x0a\
-\x16\x0a\x10\x0a\x0a\x0a\x04\x00\x00\x00\x00\x0a\xdc\x0a\x34\x09\
-\xf2\x09\xe6\x00\x00\x00\x00\x09\xe0\x09\xda\x09\xd4\x09\xce\x00\
-\x00\x00\x00\x0d\xa0\x0a\x34\x09\xc8\x09\xc2\x00\x00\x00\x00\x09\
-\xbc\x09\xb6\x09\xb0\x09\xaa\x00\x00\x00\x00\x09\xbc\x09\xb6\x09\
-\xb0\x09\xaa\x00\x00\x00\x00\x0a\x16\x0a\x10\x09\xa4\x0a\x04\x00\
-\x00\x00\x00\x0a\x16\x0a\x10\x09\xa4\x0a\x04\x00\x00\x00\x00\x09\
-\x9e\x09\x98\x09\x92\x09\x8c\x00\x00\x00\x00\x09\x9e\x09\x98\x09\
-\x92\x09\x8c\x00\x00\x00\x00\x09\x86\x09\x80\x09\x7a\x0a\xfa\x00\
-\x00\x00\x00\x09\x86\x09\x80\x09\x7a\x0a\xfa\x00\x00\x00\x00\x09\
-\x74\x09\x6e\x09\x68\x09\x62\x00\x00\x00\x00\x09\x74\x09\x6e\x09\
-\x68\x09\x62\x00\x00\x00\x00\x0c\xc2\x09\x5c\x09\x56\x09\x50\x00\
-\x00\x00\x00\x09\x4a\x09\x44\x09\x3e\x09\x38\x00\x00\x00\x00\x09\
-\x4a\x09\x44\x09\x3e\x09\x38\x00\x00\x00\x00\x0a\x16\x0a\x10\x09\
-\x32\x0a\x04\x00\x00\x00\x00\x09\x2c\x09\x26\x09\x20\x09\x1a\x00\
-\x00\x00\x00\x09\x2c\x09\x26\x09\x20\x09\x1a\x00\x00\x00\x00\x09\
-\x14\x09\x0e\x09\x08\x09\x02\x00\x00\x00\x00\x09\x14\x09\x0e\x09\
-\x08\x09\x02\x00\x00\x00\x00\x08\xfc\x08\xf6\x08\xf0\x0b\x78\x00\
-\x00\x00\x00\x08\xea\x08\xe4\x08\xde\x0b\x1e\x00\x00\x00\x00\x08\
-\xea\x08\xe4\x08\xde\x0b\x1e\x00\x00\x00\x00\x08\xd8\x08\xd2\x08\
-\xcc\x08\xc6\x00\x00\x00\x00\x08\xd8\x08\xd2\x08\xcc\x08\xc6\x00\
-\x00\x00\x00\x0b\x2a\x0a\x34\x08\xc0\x0b\x1e\x00\x00\x00\x00\x0c\
-\xaa\x08\xba\x08\xb4\x0b\x78\x00\x00\x00\x00\x0c\xaa\x08\xba\x08\
-\xb4\x0b\x78\x00\x00\x00\x00\x08\xae\x08\xa8\x08\xa2\x08\x9c\x00\
-\x00\x00\x00\x08\xae\x08\xa8\x08\xa2\x08\x9c\x00\x00\x00\x00\x08\
-\x96\x0a\x10\x08\x90\x0b\x7e\x00\x00\x00\x00\x08\x96\x0a\x10\x08\
-\x90\x0b\x7e\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\
-\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x08\x8a\x08\
-\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\
-\x78\x08\x72\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\
-\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x00\x00\x08\
-\x6c\x08\x66\x08\x60\x08\x5a\x00\x00\x00\x00\x08\x6c\x08\x66\x08\
-\x60\x08\x5a\x00\x00\x00\x01\x01\x4d\x01\xf4\x00\x01\x01\x7f\x01\
-\x17\x00\x01\x00\x3f\x01\xf4\x00\x01\x01\x81\x00\x00\x00\x01\x01\
-\x60\x01\xf4\x00\x01\x01\xbd\x01\x00\x00\x01\x00\x74\x01\xf4\x00\
-\x01\x01\x60\xff\xed\x00\x01\x02\x4f\x01\xf4\x00\x01\x00\xa3\x00\
-\xfb\x00\x01\x01\x9b\x00\x00\x00\x01\x01\x03\x01\xf4\x00\x01\x01\
-\x19\x01\x41\x00\x01\x00\x07\x01\xf4\x00\x01\x01\x67\x00\x00\x00\
-\x01\x00\x72\x00\xed\x00\x01\x00\x1f\x01\xf4\x00\x01\x01\x17\x00\
-\xe9\x00\x01\x01\x20\x01\xf4\x00\x01\x01\x1e\x01\x0f\x00\x01\x00\
-\x4d\x01\xd8\x00\x01\x01\x20\x00\x00\x00\x01\x01\x2a\x00\xba\x00\
-\x01\x00\x54\x01\xd8\x00\x01\x00\xf7\x00\x80\x00\x01\x01\x36\x01\
-\x4f\x00\x01\x00\x42\x01\xf4\x00\x01\x01\x23\xff\xf7\x00\x01\x01\
-\x43\x01\xf4\x00\x01\x01\x42\x01\x1e\x00\x01\x00\x51\x01\xf4\x00\
-\x01\x01\x43\xff\xed\x00\x01\x00\xdb\x01\xf4\x00\x01\x00\x7e\x01\
-\x17\x00\x01\x00\x2a\x01\xf4\x00\x01\x00\xdb\x00\x00\x00\x01\x00\
-\x7d\x00\xe9\x00\x01\x01\x46\x01\xf4\x00\x01\x01\x59\x01\x17\x00\
-\x01\x00\x45\x01\xf4\x00\x01\x01\x46\x00\x00\x00\x01\x01\x2d\x01\
-\xd1\x00\x01\x01\x2d\x00\xe9\x00\x01\x00\x0e\x01\xd1\x00\x01\x01\
-\x48\x01\xf4\x00\x01\x00\x99\x01\x27\x00\x01\xff\xb8\x01\xd3\x00\
-\x01\x00\xef\x00\x00\x00\x01\x00\xe6\x01\x20\x00\x01\x00\x1e\x01\
-\xf4\x00\x01\x00\xf2\xff\xed\x00\x01\x01\x14\x01\xf4\x00\x01\x00\
-\xb9\x01\x04\x00\x01\x00\x27\x01\xf4\x00\x01\x00\xaf\x01\x04\x00\
-\x01\xff\xee\x01\x91\x00\x01\x01\x3a\x01\xf4\x00\x01\x01\x3a\x01\
-\x21\x00\x01\x00\x75\x01\xf4\x00\x01\x01\x3a\xff\xed\x00\x01\x01\
-\x3b\x01\xf4\x00\x01\x01\x32\x01\x17\x00\x01\x00\xea\x01\xf4\x00\
-\x01\x00\x3e\x01\x2a\x00\x01\x00\x24\x01\xf4\x00\x01\x00\xf6\x00\
-\x00\x00\x01\x00\xd9\x01\xf4\x00\x01\x00\xd1\x01\xf4\x00\x01\x00\
-\x2d\x01\x2a\x00\x01\x00\x6b\x01\xf4\x00\x01\x00\xd1\x00\x00\x00\
-\x01\x00\x7d\x01\xf4\x00\x01\xff\xd9\x01\x2a\x00\x01\x00\x17\x01\
-\xf4\x00\x01\x00\x7d\x00\x00\x00\x01\x01\x1f\x01\x17\x00\x01\x01\
-\x1f\x00\x00\x00\x01\x01\x28\x01\xf4\x00\x01\x00\xab\x01\x17\x00\
-\x01\x00\x13\x01\xf4\x00\x01\x01\x78\x00\x00\x00\x01\x00\xe4\x01\
-\xf4\x00\x01\x00\x7c\x01\x1e\x00\x01\x00\x2c\x01\xf4\x00\x01\x00\
-\xe4\x00\x00\x00\x01\x01\x34\x01\xf4\x00\x01\x00\xb8\x01\x1e\x00\
-\x01\x01\x34\x00\x00\x00\x01\x01\x3c\x01\xf4\x00\x01\x01\x1b\x00\
-\x52\x00\x01\x00\x14\x01\xf4\x00\x01\x01\x3c\x00\x00\x00\x01\x01\
-\x23\x00\x00\x00\x01\x01\x0d\x01\xf4\x00\x01\x01\x0d\x00\x00\x00\
-\x01\x01\x71\x01\xf4\x00\x01\x01\x71\x00\x00\x00\x01\x01\x21\x01\
-\xf4\x00\x01\x01\x21\x00\x00\x00\x01\x01\xfe\x00\x0a\x00\x01\x02\
-\x22\x01\xf4\x00\x01\x00\xd6\x01\xf4\x00\x01\x00\xd6\x00\xfa\x00\
-\x01\x00\xd6\x00\x00\x00\x01\x01\x93\x01\xf4\x00\x01\x01\x27\x01\
-\xf4\x00\x01\x00\xe5\x01\xf4\x00\x01\x00\xe5\x00\x00\x00\x01\x00\
-\xd7\x01\xf4\x00\x01\x00\xd7\x00\x00\x00\x01\x01\x11\x01\xf4\x00\
-\x01\x01\x11\x00\x00\x00\x01\x01\x0e\x01\xf4\x00\x01\x01\x0e\x00\
-\x00\x00\x01\x01\x0f\x01\xf4\x00\x01\x01\xb7\x01\xf4\x00\x01\x01\
-\xb7\x00\x00\x00\x01\x01\xf6\x00\x0a\x00\x01\x01\x17\x01\xf4\x00\
-\x01\x01\x17\x00\xfa\x00\x01\x01\x17\x00\x00\x00\x01\x02\x1a\x01\
-\xf4\x00\x01\x01\x1c\x01\xf4\x00\x01\x01\x1c\x00\x00\x00\x01\x01\
-\x8c\x01\xf4\x00\x01\x01\x8c\x00\x00\x00\x01\x00\xf9\x01\xf4\x00\
-\x01\x00\xf9\x00\xfa\x00\x01\x00\xf9\x00\x00\x00\x01\x01\x7d\x01\
-\xf4\x00\x01\x00\x9f\x01\xf4\x00\x01\x00\x9f\x00\xfa\x00\x01\x00\
-\x9f\x00\x00\x00\x01\x01\x23\x01\xf4\x00\x01\x01\x00\x01\xf4\x00\
-\x01\x01\x00\x00\x00\x00\x01\x00\xd5\x00\x0a\x00\x01\x00\x77\x01\
-\xf4\x00\x01\x00\x77\x00\x00\x00\x01\x00\x7e\x00\x00\x00\x01\x01\
-\x1a\x01\xf4\x00\x01\x01\x1a\x00\xfa\x00\x01\x01\x1a\x00\x00\x00\
-\x01\x01\x10\x01\xf4\x00\x01\x01\x10\x00\x00\x00\x01\x00\xd2\x01\
-\xf4\x00\x01\x00\xd2\x00\x00\x00\x01\x01\xe1\x00\x0a\x00\x01\x01\
-\x0c\x01\xf4\x00\x01\x01\x0c\x00\x00\x00\x01\x01\x15\x01\xf4\x00\
-\x01\x01\x15\x00\xfa\x00\x01\x01\x15\x00\x00\x00\x01\x02\x17\x01\
-\xf4\x00\x01\x00\xfc\x01\xf4\x00\x01\x00\xfc\x00\x00\x00\x01\x01\
-\xa7\x01\xf4\x00\x01\x01\xa7\x00\x00\x00\x01\x01\xf4\x00\x0a\x00\
-\x01\x01\x16\x01\xf4\x00\x01\x01\x16\x00\x00\x00\x01\x01\x2b\x03\
-\xa1\x00\x01\x01\x2b\x02\xbc\x00\x01\x01\x2b\x00\x00\x00\x01\x01\
-\x3f\x03\xc9\x00\x01\x01\x3f\x02\xbc\x00\x01\x01\x3f\x00\x00\x00\
-\x01\x01\x59\x02\xb5\x00\x01\x01\x59\x00\x00\x00\x01\x01\xda\x02\
-\xbc\x00\x01\x01\xda\x00\x00\x00\x01\x01\x6c\x02\xbc\x00\x01\x01\
-\x6c\x00\x00\x00\x01\x01\x52\x03\xce\x00\x01\x01\x52\x03\xc9\x00\
-\x01\x01\xa0\x00\x0a\x00\x01\x01\x52\x02\xbc\x00\x01\x01\x52\x00\
-\x00\x00\x01\x02\x8f\x02\xbc\x00\x01\x01\x40\x02\xbc\x00\x01\x01\
-\x40\x01\x5e\x00\x01\x01\x40\x00\x00\x00\x01\x01\x0f\x03\xa1\x00\
-\x01\x01\x0f\x02\xbc\x00\x01\x01\x0f\x00\x00\x00\x01\x01\x82\x02\
-\xbc\x00\x01\x01\x82\x00\x00\x00\x01\x01\x2d\x02\xbc\x00\x01\x01\
-\x2d\x00\x00\x00\x01\x02\x24\x00\x00\x00\x01\x01\x69\x03\xce\x00\
-\x01\x01\x69\x03\xc9\x00\x01\x01\xc2\x00\x02\x00\x01\x01\x69\x02\
-\xbc\x00\x01\x01\x69\x01\x5e\x00\x01\x01\x69\x00\x00\x00\x01\x02\
-\xbd\x02\xbc\x00\x01\x01\x4f\x02\xbc\x00\x01\x01\x4f\x00\x00\x00\
-\x01\x01\x95\x02\xbc\x00\x01\x01\x95\x00\x00\x00\x01\x01\x77\x02\
-\xbc\x00\x01\x01\x77\x01\x5e\x00\x01\x01\x77\x00\x00\x00\x01\x02\
-\x74\x02\xbc\x00\x01\x01\x27\x02\xbc\x00\x01\x01\x27\x01\x5e\x00\
-\x01\x01\x27\x00\x00\x00\x01\x02\x24\x02\xbc\x00\x01\x01\x35\x02\
-\xbc\x00\x01\x01\x35\x00\x00\x00\x01\x01\x96\x02\xbc\x00\x01\x01\
-\x0a\x00\x00\x00\x01\x00\x78\x03\xce\x00\x01\x00\x78\x03\xc9\x00\
-\x01\x00\xd7\x00\x0a\x00\x01\x00\x78\x02\xbc\x00\x01\x00\x78\x00\
-\x00\x00\x01\x01\x45\x02\xbc\x00\x01\x01\x45\x01\x5e\x00\x01\x00\
-\x14\x02\xbc\x00\x01\x01\x45\x00\x00\x00\x01\x01\x68\x02\xbc\x00\
-\x01\x01\x68\x00\x00\x00\x01\x01\x32\x02\xbc\x00\x01\x01\x32\x00\
-\x00\x00\x01\x01\x33\x03\xce\x00\x01\x02\x53\x00\x09\x00\x01\x01\
-\x33\x02\xbc\x00\x01\x00\x1e\x02\xbc\x00\x01\x01\x33\x00\x00\x00\
-\x01\x01\x8f\x02\xbc\x00\x01\x01\x8f\x01\x5e\x00\x01\x01\x8f\x00\
-\x00\x00\x01\x01\x48\x02\xbc\x00\x01\x01\x48\x01\x5e\x00\x01\x01\
-\x48\x00\x00\x00\x01\x01\x5a\x02\xbc\x00\x01\x01\x5a\x00\x00\x00\
-\x01\x01\x2f\x02\xbc\x00\x01\x01\x2f\x00\x00\x00\x01\x02\x16\x02\
-\xbc\x00\x01\x02\x16\x00\x00\x00\x01\x01\x64\x03\xce\x00\x01\x01\
-\x64\x03\xc9\x00\x01\x02\x80\x00\x0a\x00\x01\x01\x64\x02\xbc\x00\
-\x01\x01\x64\x00\x00\x00\x02\x00\x04\x00\x01\x00\x49\x00\x00\x00\
-\x4b\x00\x58\x00\x49\x00\x5a\x00\x7c\x00\x57\x00\x87\x00\xbe\x00\
-\x7a\x00\x1d\x00\x00\x00\xfa\x00\x01\x00\xf4\x00\x01\x00\xee\x00\
-\x01\x00\xe8\x00\x01\x00\xe2\x00\x01\x00\xf4\x00\x01\x00\xdc\x00\
-\x01\x00\xdc\x00\x01\x00\xd6\x00\x01\x00\xd6\x00\x02\x00\xfa\x00\
-\x02\x00\xfa\x00\x01\x00\xd0\x00\x03\x00\xca\x00\x04\x00\xc4\x00\
-\x02\x00\xfa\x00\x01\x00\xbe\x00\x04\x00\xb8\x00\x04\x00\xb2\x00\
-\x04\x00\xac\x00\x04\x00\xa6\x00\x04\x00\xa0\x00\x04\x00\x9a\x00\
-\x04\x00\x94\x00\x04\x00\x8e\x00\x04\x00\x88\x00\x04\x00\x82\x00\
-\x04\x00\x7c\x00\x05\x00\x76\x00\x01\x01\x14\xff\xca\x00\x01\x01\
-\x29\x01\xf4\x00\x01\x01\x07\x01\xf4\x00\x01\x00\xb2\x01\xf4\x00\
-\x01\x00\xb0\x01\xf4\x00\x01\x01\x1b\x01\xf4\x00\x01\x01\x1d\x01\
-\xf4\x00\x01\x00\xdf\x01\xf4\x00\x01\x00\xf0\x01\xf4\x00\x01\x00\
-\xd5\x01\xf4\x00\x01\x00\x88\x01\xf4\x00\x01\x01\x04\x01\xf4\x00\
-\x01\x00\x64\x00\x25\x00\x01\x00\x75\x01\x92\x00\x01\x00\x49\x01\
-\x22\x00\x01\x00\x4c\x00\x25\x00\x01\x00\x94\x00\x25\x00\x01\x00\
-\x9b\x00\x25\x00\x01\x00\xd1\x00\x25\x00\x01\x00\xdc\x00\x25\x00\
-\x01\x00\xdb\x00\x16\x00\x01\x00\x49\x00\x25\x00\x01\x00\x49\x01\
-\x87\x00\x02\x00\x02\x01\x1c\x01\x37\x00\x00\x01\x39\x01\x39\x00\
-\x1c\x00\x02\x00\x08\x00\x01\x00\x08\x00\x01\x00\x2a\x00\x05\x00\
-\x00\x00\x10\x01\xf6\x01\xb8\x01\x7a\x01\x72\x01\x64\x01\x5c\x01\
-\x4e\x01\x22\x01\x1a\x00\xfa\x00\xec\x00\xd8\x00\xbe\x00\x86\x01\
-\x5c\x00\x4e\x00\x01\x00\x10\x00\x87\x00\x8d\x00\x8f\x00\x91\x00\
-\x96\x00\x99\x00\x9b\x00\xa1\x00\xa4\x00\xa7\x00\xa9\x00\xab\x00\
-\xb1\x00\xb5\x00\xb7\x00\xbd\x00\x09\x00\x8f\xff\xce\xff\xce\x00\
-\x99\xff\xe2\xff\xe2\x00\x9b\xff\xd8\xff\xd8\x00\x9f\xff\xe2\xff\
-\xe2\x00\xa1\xff\xe2\xff\xe2\x00\xa9\xff\xe2\xff\xe2\x00\xab\xff\
-\xec\xff\xec\x00\xae\xff\xe2\xff\xe2\x00\xb3\xff\xe2\xff\xe2\x00\
-\x09\x00\x8b\xff\xb0\xff\xb0\x00\x91\xff\xe2\xff\xe2\x00\x98\xff\
-\xd8\xff\xd8\x00\x9d\xff\xec\xff\xec\x00\xa7\xff\xf6\xff\xf6\x00\
-\xa9\xff\xec\xff\xec\x00\xae\xff\xec\xff\xec\x00\xb5\xff\xe2\xff\
-\xe2\x00\xbd\xff\xe2\xff\xe2\x00\x04\x00\x99\xff\xe2\xff\xe2\x00\
-\xa1\xff\xec\xff\xec\x00\xa9\xff\xec\xff\xec\x00\xae\xff\xf6\xff\
-\xf6\x00\x03\x00\x99\xff\xf6\xff\xf6\x00\xa9\xff\xec\xff\xec\x00\
-\xae\x00\x00\x00\x00\x00\x02\x00\x8b\xff\xd8\xff\xd8\x00\xb1\xff\
-\xe2\xff\xe2\x00\x05\x00\x87\xff\xf6\xff\xf6\x00\x99\xff\xe2\xff\
-\xe2\x00\x9b\xff\xf6\xff\xf6\x00\x9f\xff\xec\xff\xec\x00\xa9\xff\
-\xf6\xff\xf6\x00\x01\x00\x9f\xff\xec\xff\xec\x00\x07\x00\x8b\xff\
-\xba\xff\xba\x00\x8d\xff\xce\xff\xce\x00\x91\xff\xe2\xff\xe2\x00\
-\x98\xff\xec\xff\xec\x00\xa3\xff\xec\xff\xec\x00\xa9\xff\xec\xff\
-\xec\x00\xb5\xff\xec\xff\xec\x00\x02\x00\x8b\xff\xba\xff\xba\x00\
-\x8d\xff\xec\xff\xec\x00\x01\x00\x8b\xff\xd8\xff\xd8\x00\x02\x00\
-\x8b\xff\xce\xff\xce\x00\x8d\xff\xec\xff\xec\x00\x01\x00\x8b\xff\
-\xf6\xff\xf6\x00\x0a\x00\x8b\xff\xa6\xff\xa6\x00\x8d\xff\xec\xff\
-\xec\x00\x91\xff\xe2\xff\xe2\x00\xa1\x00\x00\x00\x00\x00\xa3\xff\
-\xe2\xff\xe2\x00\xa4\xff\xe2\xff\xe2\x00\xa7\xff\xe2\xff\xe2\x00\
-\xa9\xff\xec\xff\xec\x00\xb5\xff\xce\xff\xce\x00\xbd\xff\xce\xff\
-\xce\x00\x0a\x00\x87\xff\xf6\xff\xf6\x00\x8f\xff\xe2\xff\xe2\x00\
-\x96\xff\xdd\xff\xdd\x00\x99\xff\xec\xff\xec\x00\x9b\xff\xec\xff\
-\xec\x00\x9f\xff\xec\xff\xec\x00\xa1\xff\xe2\xff\xe2\x00\xb3\xff\
-\xec\xff\xec\x00\xd2\xff\xc4\xff\xc4\x00\xf1\xff\xce\xff\xce\x00\
-\x04\x00\x8f\xff\xf6\xff\xf6\x00\x99\xff\xe7\xff\xe7\x00\x9f\xff\
-\xec\xff\xec\x00\xa1\xff\xec\xff\xec\x00\x02\x00\x00\x00\x02\x00\
-\x80\x00\x0a\x00\x02\x01\x92\x00\x04\x00\x00\x00\x72\x00\x26\x00\
-\x01\x00\x0b\x00\x00\xff\xe2\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xff\xf6\x00\x00\x00\x00\x00\x02\x00\x0c\x00\x01\x00\
-\x08\x00\x01\x00\x3e\x00\x43\x00\x03\x00\x45\x00\x45\x00\x03\x00\
-\x47\x00\x48\x00\x08\x00\x4c\x00\x4f\x00\x05\x00\x50\x00\x50\x00\
-\x06\x00\x53\x00\x58\x00\x04\x00\x60\x00\x67\x00\x02\x00\x6c\x00\
-\x6d\x00\x09\x00\x6f\x00\x6f\x00\x0a\x00\x78\x00\x7a\x00\x07\x00\
-\x80\x00\x81\x00\x06\x00\x02\x00\x00\x00\x01\x01\x1c\x00\x04\x00\
-\x00\x00\x89\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x00\x02\x00\x19\x00\x01\x00\x09\x00\x00\x00\
-\x0f\x00\x12\x00\x09\x00\x14\x00\x14\x00\x0d\x00\x16\x00\x1c\x00\
-\x0e\x00\x1f\x00\x1f\x00\x15\x00\x29\x00\x29\x00\x16\x00\x2b\x00\
-\x2d\x00\x17\x00\x30\x00\x30\x00\x1a\x00\x36\x00\x38\x00\x1b\x00\
-\x46\x00\x46\x00\x1e\x00\x49\x00\x4a\x00\x1f\x00\x50\x00\x58\x00\
-\x21\x00\x6a\x00\x6b\x00\x2a\x00\x6e\x00\x6e\x00\x2c\x00\x75\x00\
-\x77\x00\x2d\x00\x80\x00\x80\x00\x30\x00\x85\x00\x86\x00\x31\x00\
-\xbf\x00\xd0\x00\x33\x00\xd5\x00\xd5\x00\x45\x00\xd7\x00\xed\x00\
-\x46\x00\xf0\x00\xf7\x00\x5d\x00\xfa\x01\x0a\x00\x65\x01\x0c\x01\
-\x1b\x00\x76\x01\x35\x01\x36\x00\x86\x01\x39\x01\x39\x00\x88\x00\
-\x0b\x00\x01\xff\xe2\x00\x30\x00\x00\x00\x36\xff\x6a\x00\x3e\x00\
-\x00\x00\x4b\x00\x00\x00\x51\x00\x00\x00\x60\x00\x00\x00\x6a\x00\
-\x00\x00\x75\x00\x00\x00\x77\x00\x00\x00\x78\x00\x00\x00\x02\x00\
-\x08\x00\x02\x06\x50\x00\x0a\x00\x02\x04\x90\x00\x04\x00\x00\x05\
-\xa0\x04\xfa\x00\x18\x00\x18\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xbb\x00\x00\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x83\x00\x00\xff\xf6\x00\
-\x00\xff\xe2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xce\x00\
-\x00\x00\x00\x00\x00\xff\xf6\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x7e\xff\xd8\xff\xec\x00\
-\x00\xff\xe2\x00\x00\x00\x00\xff\xe4\x00\x00\x00\x00\xff\xce\x00\
-\x00\xff\xf1\x00\x00\xff\xf1\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\xff\xd8\xff\xf6\x00\
-\x00\xff\xec\x00\x00\xff\xe2\xff\xf6\xff\xec\x00\x00\x00\x00\xff\
-\xec\xff\xec\x00\x00\xff\xf6\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xc1\x00\x00\x00\x00\x00\
-\x00\xff\xf6\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x6a\xff\x88\xff\x7e\xff\
-\xec\x00\x00\x00\x00\xff\xb0\xff\x88\x00\x00\xff\x6a\xff\xce\xff\
-\xa6\xff\xab\xff\xce\xff\xec\x00\x00\xff\x88\x00\x00\x00\x00\xff\
-\xa6\xff\x9c\x00\x00\xff\xb0\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xd1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xf6\xff\xf6\xff\xec\x00\x00\xff\xe2\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\x91\x00\x00\xff\xec\x00\
-\x00\xff\xe2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xce\x00\
-\x00\x00\x00\x00\x00\xff\xf6\x00\x00\xff\xad\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xe2\xff\x9c\xff\xba\x00\x00\xff\
-\xf6\x00\x00\x00\x00\x00\x00\xff\xb5\xff\xe2\x00\x00\x00\x00\xff\
-\xec\xff\xec\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\xff\xec\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xe2\x00\x00\x00\x00\xff\xe7\x00\
-\x00\xff\xce\xff\xec\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\xff\
-\xf6\x00\x00\x00\x00\xff\xe2\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xce\xff\xce\xff\xf6\x00\
-\x00\xff\xf6\x00\x00\x00\x00\xff\xe2\x00\x00\xff\xce\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xec\xff\xd8\xff\x83\x00\x00\x00\x00\x00\
-\x00\xff\x88\x00\x00\x00\x00\x00\x00\xff\xd8\x00\x00\xff\x88\x00\
-\x00\x00\x00\x00\x00\xff\x88\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xf1\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd8\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xe2\xff\xec\x00\x00\x00\
-\x00\xff\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xec\xff\xec\x00\x00\x00\x00\xff\xec\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xf1\xff\x88\x00\x00\xff\xf6\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\xff\xf6\x00\x00\xff\xec\xff\
-\xf6\xff\xfa\x00\x00\xff\xf6\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd8\xff\xec\x00\
-\x00\xff\xe2\x00\x00\x00\x00\xff\xe4\x00\x00\x00\x00\xff\xce\x00\
-\x00\xff\xf1\x00\x00\xff\xf6\x00\x00\xff\x9c\x00\x00\x00\x00\x00\
-\x00\x00\x14\x00\x14\x00\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xff\xe2\x00\x00\x00\x00\xff\xce\x00\x00\x00\x00\xff\
-\xdd\x00\x00\x00\x14\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xb5\x00\x00\xff\xec\x00\
-\x00\xff\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd8\x00\
-\x00\x00\x00\x00\x00\xff\xf0\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xe2\xff\x9c\x00\x00\xff\xf6\x00\
-\x00\xff\xf6\x00\x00\x00\x00\x00\x00\xff\xe2\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xf6\x00\x00\xff\xad\x00\x00\x00\x00\xff\
-\xec\x00\x00\x00\x00\x00\x00\xff\xe2\xff\xec\xff\x7e\x00\x00\x00\
-\x00\xff\xf6\x00\x00\x00\x00\xff\xce\xff\xe2\x00\x00\x00\x00\xff\
-\xec\xff\xe2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\xff\xec\xff\xc9\x00\x00\x00\x00\x00\
-\x00\xff\xf6\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\xff\xf6\x00\x00\x00\x00\x00\x02\x00\x11\x00\x0a\x00\x0d\x00\
-\x00\x00\x1d\x00\x1e\x00\x04\x00\x20\x00\x28\x00\x06\x00\x2a\x00\
-\x2a\x00\x0f\x00\x2e\x00\x2f\x00\x10\x00\x31\x00\x35\x00\x12\x00\
-\x39\x00\x45\x00\x17\x00\x47\x00\x48\x00\x24\x00\x4b\x00\x4f\x00\
-\x26\x00\x5b\x00\x69\x00\x2b\x00\x6c\x00\x6d\x00\x3a\x00\x6f\x00\
-\x74\x00\x3c\x00\x78\x00\x7c\x00\x42\x00\x81\x00\x81\x00\x47\x00\
-\xd6\x00\xd6\x00\x48\x00\xee\x00\xef\x00\x49\x00\xf8\x00\xf9\x00\
-\x4b\x00\x02\x00\x1b\x00\x01\x00\x08\x00\x01\x00\x0a\x00\x0b\x00\
-\x0e\x00\x16\x00\x1a\x00\x05\x00\x2a\x00\x2a\x00\x16\x00\x2e\x00\
-\x2f\x00\x0f\x00\x31\x00\x35\x00\x06\x00\x39\x00\x3b\x00\x09\x00\
-\x3c\x00\x3d\x00\x10\x00\x3e\x00\x43\x00\x03\x00\x45\x00\x45\x00\
-\x03\x00\x47\x00\x48\x00\x11\x00\x4c\x00\x4f\x00\x08\x00\x50\x00\
-\x50\x00\x0b\x00\x53\x00\x58\x00\x04\x00\x5d\x00\x5f\x00\x0c\x00\
-\x60\x00\x67\x00\x02\x00\x6c\x00\x6d\x00\x14\x00\x6f\x00\x6f\x00\
-\x17\x00\x70\x00\x74\x00\x07\x00\x78\x00\x7a\x00\x0d\x00\x7b\x00\
-\x7c\x00\x15\x00\x80\x00\x81\x00\x0b\x00\xd5\x00\xd5\x00\x12\x00\
-\xd6\x00\xd6\x00\x0a\x00\xd9\x00\xd9\x00\x12\x00\xee\x00\xef\x00\
-\x0a\x00\xf8\x00\xf9\x00\x13\x00\x02\x00\x1b\x00\x0a\x00\x0b\x00\
-\x0b\x00\x0c\x00\x0d\x00\x0c\x00\x1d\x00\x1e\x00\x0d\x00\x20\x00\
-\x21\x00\x0e\x00\x2a\x00\x2a\x00\x16\x00\x2e\x00\x2f\x00\x0f\x00\
-\x31\x00\x35\x00\x04\x00\x39\x00\x3b\x00\x06\x00\x3c\x00\x3d\x00\
-\x10\x00\x3e\x00\x44\x00\x01\x00\x45\x00\x45\x00\x02\x00\x47\x00\
-\x48\x00\x11\x00\x4b\x00\x4f\x00\x02\x00\x5b\x00\x5c\x00\x08\x00\
-\x5d\x00\x5f\x00\x09\x00\x60\x00\x66\x00\x03\x00\x67\x00\x67\x00\
-\x02\x00\x68\x00\x69\x00\x12\x00\x6c\x00\x6d\x00\x14\x00\x6f\x00\
-\x6f\x00\x17\x00\x70\x00\x74\x00\x05\x00\x78\x00\x7a\x00\x0a\x00\
-\x7b\x00\x7c\x00\x15\x00\x81\x00\x81\x00\x08\x00\xd6\x00\xd6\x00\
-\x07\x00\xee\x00\xef\x00\x07\x00\xf8\x00\xf9\x00\x13\x00\x01\x00\
-\xf0\x00\x04\x00\x00\x00\x73\x12\x76\x12\x54\x12\x54\x12\x54\x12\
-\x54\x12\x54\x12\x54\x12\x4a\x12\x0c\x11\xfa\x11\xfa\x11\xbc\x11\
-\xbc\x12\x4a\x12\x4a\x12\x4a\x12\x4a\x12\x4a\x10\x9a\x10\x80\x10\
-\x6a\x0f\x34\x0f\x2a\x0f\x2a\x0f\x20\x0f\x20\x0f\x0a\x0f\x0a\x0f\
-\x0a\x0f\x0a\x0f\x0a\x0f\x0a\x0f\x0a\x12\x4a\x0e\xf4\x0d\xda\x0c\
-\xd8\x0c\xb6\x0c\x94\x0b\x52\x0b\x3c\x0b\x3c\x0b\x3c\x0b\x3c\x0b\
-\x3c\x09\xe6\x08\xe0\x08\x1a\x07\xe0\x07\xe0\x07\xe0\x07\xd6\x07\
-\xd6\x07\xc4\x07\xc4\x07\xc4\x07\xc4\x07\xc4\x07\xc4\x07\xc4\x07\
-\xba\x07\x60\x07\x46\x07\x46\x07\x30\x07\xba\x07\xba\x07\xba\x07\
-\xba\x07\xba\x06\xa2\x06\x7c\x06\x5a\x05\xac\x05\x9e\x05\x9e\x05\
-\x80\x05\x80\x05\x80\x05\x56\x05\x56\x05\x56\x05\x56\x05\x56\x05\
-\x56\x05\x56\x07\xba\x05\x30\x05\x0a\x04\xf8\x04\x22\x04\x10\x04\
-\x10\x04\x06\x03\xf4\x03\xf4\x03\xf4\x03\xf4\x03\xf4\x03\x5a\x02\
-\xac\x02\x42\x02\x14\x02\x14\x02\x14\x01\xfa\x01\xfa\x05\x9e\x01\
-\xe0\x01\xd6\x01\x74\x01\xd6\x01\xd6\x01\x52\x01\x3c\x00\x02\x00\
-\x0c\x00\x01\x00\x14\x00\x00\x00\x1b\x00\x1e\x00\x14\x00\x20\x00\
-\x2a\x00\x18\x00\x2c\x00\x49\x00\x23\x00\x4b\x00\x52\x00\x41\x00\
-\x5a\x00\x6d\x00\x49\x00\x6f\x00\x7c\x00\x5d\x00\x81\x00\x81\x00\
-\x6b\x00\xd5\x00\xd6\x00\x6c\x00\xd9\x00\xd9\x00\x6e\x00\xee\x00\
-\xef\x00\x6f\x00\xf8\x00\xf9\x00\x71\x00\x05\x00\x13\x00\x14\x00\
-\x1b\xff\x6a\x00\x1f\x00\x14\x00\x2d\x00\x14\x00\x5a\x00\x0a\x00\
-\x08\x00\x0a\xff\xe2\x00\x0b\xff\xe2\x00\x13\x00\x14\x00\x1b\xff\
-\x6a\x00\x1f\x00\x14\x00\x2d\x00\x14\x00\x5a\x00\x0a\x00\x68\x00\
-\x02\x00\x18\x00\x0a\xff\xd8\x00\x0b\xff\xd8\x00\x2c\xff\xe2\x00\
-\x30\xff\x38\x00\x31\xff\xd8\x00\x32\xff\xd8\x00\x33\xff\xd8\x00\
-\x34\xff\xd8\x00\x35\xff\xd8\x00\x36\xff\x56\x00\x37\xff\xa6\x00\
-\x39\xff\x74\x00\x3a\xff\x74\x00\x3b\xff\x74\x00\x50\xff\xd8\x00\
-\x6a\xff\xec\x00\x6f\xff\xd8\x00\x75\xff\xce\x00\x76\xff\xec\x00\
-\x78\xff\xd8\x00\x79\xff\xd8\x00\x7a\xff\xd8\x00\x80\xff\xd8\x00\
-\x81\xff\xd8\x00\x02\x00\x30\xff\x93\x00\x76\xff\xd1\x00\x06\x00\
-\x30\xff\x38\x00\x36\xff\x56\x00\x37\xff\xa6\x00\x6a\xff\xec\x00\
-\x75\xff\xce\x00\x76\xff\xec\x00\x06\x00\x30\xff\x9f\x00\x36\xff\
-\xbb\x00\x37\xff\xad\x00\x45\xff\xe2\x00\x75\xff\xf6\x00\x76\xff\
-\xf6\x00\x0b\x00\x08\xff\x9f\x00\x1b\xff\xa9\x00\x30\xff\x76\x00\
-\x36\xff\xd8\x00\x37\xff\xe4\x00\x38\xff\xc2\x00\x45\xff\xd8\x00\
-\x49\xff\xe7\x00\x5d\xff\xf0\x00\x67\xff\xd8\x00\xd9\xff\xba\x00\
-\x1a\x00\x3e\xff\xec\x00\x3f\xff\xec\x00\x40\xff\xec\x00\x41\xff\
-\xec\x00\x42\xff\xec\x00\x43\xff\xec\x00\x44\xff\xec\x00\x45\xff\
-\xec\x00\x47\xff\xec\x00\x48\xff\xec\x00\x49\xff\xec\x00\x4b\xff\
-\xec\x00\x4c\xff\xec\x00\x4d\xff\xec\x00\x4e\xff\xec\x00\x4f\xff\
-\xec\x00\x51\xff\xec\x00\x60\xff\xec\x00\x61\xff\xec\x00\x62\xff\
-\xec\x00\x63\xff\xec\x00\x64\xff\xec\x00\x65\xff\xec\x00\x66\xff\
-\xec\x00\x67\xff\xec\x00\x6a\xff\xec\x00\x2b\x00\x30\xff\x91\x00\
-\x36\xff\xd8\x00\x37\xff\xce\x00\x38\xff\xc9\x00\x39\xff\xb5\x00\
-\x3a\xff\xb5\x00\x3b\xff\xb5\x00\x3e\xff\xec\x00\x3f\xff\xec\x00\
-\x40\xff\xec\x00\x41\xff\xec\x00\x42\xff\xec\x00\x43\xff\xec\x00\
-\x44\xff\xec\x00\x45\xff\xec\x00\x47\xff\xec\x00\x48\xff\xec\x00\
-\x49\xff\xec\x00\x4b\xff\xec\x00\x4c\xff\xec\x00\x4d\xff\xec\x00\
-\x4e\xff\xec\x00\x4f\xff\xec\x00\x51\xff\xec\x00\x60\xff\xec\x00\
-\x61\xff\xec\x00\x62\xff\xec\x00\x63\xff\xec\x00\x64\xff\xec\x00\
-\x65\xff\xec\x00\x66\xff\xec\x00\x67\xff\xec\x00\x6a\xff\xec\x00\
-\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x75\x00\x0a\x00\x7b\xff\xf6\x00\
-\x7c\xff\xf6\x00\xd5\xff\xb0\x00\xd6\xff\xb0\x00\xd9\xff\xb0\x00\
-\xee\xff\xb0\x00\xef\xff\xb0\x00\x26\x00\x39\xff\xc2\x00\x3a\xff\
-\xc2\x00\x3b\xff\xc2\x00\x3e\xff\xe2\x00\x3f\xff\xe2\x00\x40\xff\
-\xe2\x00\x41\xff\xe2\x00\x42\xff\xe2\x00\x43\xff\xe2\x00\x44\xff\
-\xe2\x00\x45\xff\xe2\x00\x47\xff\xe2\x00\x48\xff\xe2\x00\x49\xff\
-\xe2\x00\x4b\xff\xe2\x00\x4c\xff\xe2\x00\x4d\xff\xe2\x00\x4e\xff\
-\xe2\x00\x4f\xff\xe2\x00\x51\xff\xe2\x00\x60\xff\xe2\x00\x61\xff\
-\xe2\x00\x62\xff\xe2\x00\x63\xff\xe2\x00\x64\xff\xe2\x00\x65\xff\
-\xe2\x00\x66\xff\xe2\x00\x67\xff\xe2\x00\x6a\xff\xe2\x00\x6c\xff\
-\xf6\x00\x6d\xff\xf6\x00\x7b\xff\xec\x00\x7c\xff\xec\x00\xd5\xff\
-\x9c\x00\xd6\xff\x9c\x00\xd9\xff\x9c\x00\xee\xff\x9c\x00\xef\xff\
-\x9c\x00\x04\x00\x30\xff\x88\x00\x36\xff\xbb\x00\x37\xff\xc9\x00\
-\x75\xff\xf6\x00\x02\x00\x36\xff\xe5\x00\x37\xff\xe5\x00\x04\x00\
-\x30\xff\x88\x00\x6f\xff\xf0\x00\x75\xff\xd8\x00\x76\xff\xe2\x00\
-\x35\x00\x01\xff\x9f\x00\x02\xff\x9f\x00\x03\xff\x9f\x00\x04\xff\
-\x9f\x00\x05\xff\x9f\x00\x06\xff\x9f\x00\x07\xff\x9f\x00\x08\xff\
-\x91\x00\x1b\xff\x83\x00\x30\xff\x9f\x00\x36\xff\xd7\x00\x37\xff\
-\xe4\x00\x38\xff\xe4\x00\x39\xff\xc9\x00\x3a\xff\xc9\x00\x3b\xff\
-\xc9\x00\x3c\xff\xd7\x00\x3d\xff\xd7\x00\x3e\xff\xe2\x00\x3f\xff\
-\xe2\x00\x40\xff\xe2\x00\x41\xff\xe2\x00\x42\xff\xe2\x00\x43\xff\
-\xe2\x00\x44\xff\xe2\x00\x45\xff\xe2\x00\x47\xff\xe2\x00\x48\xff\
-\xe2\x00\x49\xff\xe2\x00\x4b\xff\xe2\x00\x4c\xff\xe2\x00\x4d\xff\
-\xe2\x00\x4e\xff\xe2\x00\x4f\xff\xe2\x00\x51\xff\xe2\x00\x60\xff\
-\xe2\x00\x61\xff\xe2\x00\x62\xff\xe2\x00\x63\xff\xe2\x00\x64\xff\
-\xe2\x00\x65\xff\xe2\x00\x66\xff\xe2\x00\x67\xff\xe2\x00\x6a\xff\
-\xe2\x00\x6c\xff\xec\x00\x6d\xff\xec\x00\x7b\xff\xec\x00\x7c\xff\
-\xec\x00\xd5\xff\x9c\x00\xd6\xff\x9c\x00\xd9\xff\x9c\x00\xee\xff\
-\x9c\x00\xef\xff\x9c\x00\x04\x00\x39\xff\xb5\x00\x3a\xff\xb5\x00\
-\x3b\xff\xb5\x00\x59\x00\x7d\x00\x09\x00\x30\xff\x88\x00\x36\xff\
-\x9c\x00\x37\xff\xba\x00\x38\xff\xec\x00\x6a\x00\x00\x00\x75\xff\
-\xe2\x00\x76\xff\xec\x00\x77\xff\xec\x00\xd9\xff\xd8\x00\x09\x00\
-\x30\xff\x88\x00\x36\xff\x9c\x00\x37\xff\xba\x00\x38\xff\xec\x00\
-\x6a\xff\xf6\x00\x75\xff\xe2\x00\x76\xff\xec\x00\x77\xff\xec\x00\
-\xd9\xff\xd8\x00\x0a\x00\x30\xff\x88\x00\x36\xff\x9c\x00\x37\xff\
-\xba\x00\x38\xff\xec\x00\x50\xff\xec\x00\x75\xff\xe2\x00\x76\xff\
-\xec\x00\x77\xff\xec\x00\x78\xff\xe2\x00\xd9\xff\xd8\x00\x07\x00\
-\x30\xff\x75\x00\x36\xff\x91\x00\x37\xff\x9f\x00\x75\xff\xe2\x00\
-\x76\xff\xe2\x00\x80\xff\xec\x00\x81\xff\xec\x00\x03\x00\x5b\x00\
-\x00\x00\x75\xff\xd8\x00\x76\xff\xd8\x00\x2b\x00\x39\xff\x90\x00\
-\x3a\xff\x90\x00\x3b\xff\x90\x00\x3e\xff\xe2\x00\x3f\xff\xe2\x00\
-\x40\xff\xe2\x00\x41\xff\xe2\x00\x42\xff\xe2\x00\x43\xff\xe2\x00\
-\x44\xff\xe2\x00\x45\xff\xe2\x00\x47\xff\xe2\x00\x48\xff\xec\x00\
-\x49\xff\xe2\x00\x4b\xff\xe2\x00\x4c\xff\xe2\x00\x4d\xff\xe2\x00\
-\x4e\xff\xe2\x00\x4f\xff\xe2\x00\x50\xff\xe2\x00\x51\xff\xe2\x00\
-\x60\xff\xe2\x00\x61\xff\xe2\x00\x62\xff\xe2\x00\x63\xff\xe2\x00\
-\x64\xff\xe2\x00\x65\xff\xe2\x00\x66\xff\xe2\x00\x67\xff\xe2\x00\
-\x6a\xff\xe2\x00\x6f\xff\xe2\x00\x70\xff\xe2\x00\x71\xff\xe2\x00\
-\x72\xff\xe2\x00\x73\xff\xe2\x00\x74\xff\xe2\x00\x75\xff\xd3\x00\
-\x76\xff\xe2\x00\x78\xff\xd8\x00\x79\xff\xd8\x00\x7a\xff\xd8\x00\
-\x80\xff\xe2\x00\x81\xff\xe2\x00\x08\x00\x30\xff\x75\x00\x36\xff\
-\x91\x00\x37\xff\x9f\x00\x39\xff\x88\x00\x3a\xff\x88\x00\x3b\xff\
-\x88\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x09\x00\x39\xff\xa9\x00\
-\x3a\xff\xa9\x00\x3b\xff\xa9\x00\x59\x00\x61\x00\x75\xff\xf6\x00\
-\x76\xff\xf6\x00\x78\x00\x00\x00\x79\xff\xf8\x00\x7a\xff\xf8\x00\
-\x23\x00\x3e\xff\xec\x00\x3f\xff\xec\x00\x40\xff\xec\x00\x41\xff\
-\xec\x00\x42\xff\xec\x00\x43\xff\xec\x00\x44\xff\xec\x00\x45\xff\
-\xec\x00\x47\xff\xec\x00\x48\xff\xec\x00\x49\xff\xec\x00\x4b\xff\
-\xf6\x00\x4c\xff\xf6\x00\x4d\xff\xf6\x00\x4e\xff\xf6\x00\x4f\xff\
-\xf6\x00\x51\xff\xec\x00\x60\xff\xec\x00\x61\xff\xec\x00\x62\xff\
-\xec\x00\x63\xff\xec\x00\x64\xff\xec\x00\x65\xff\xec\x00\x66\xff\
-\xec\x00\x67\xff\xec\x00\x6a\xff\xec\x00\x6c\xff\xf6\x00\x6d\xff\
-\xf6\x00\x7b\xff\xf6\x00\x7c\xff\xf6\x00\xd5\xff\xb0\x00\xd6\xff\
-\xb0\x00\xd9\xff\xb0\x00\xee\xff\xb0\x00\xef\xff\xb0\x00\x05\x00\
-\x75\xff\xf6\x00\x76\xff\xf6\x00\x78\xff\xf6\x00\x79\xff\xf6\x00\
-\x7a\xff\xf6\x00\x06\x00\x30\xff\x6a\x00\x36\xff\x9c\x00\x37\xff\
-\xba\x00\x52\xff\xfa\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\x16\x00\
-\x30\xff\x88\x00\x36\xff\x9c\x00\x37\xff\xba\x00\x38\xff\xec\x00\
-\x39\xff\x7e\x00\x3a\xff\x7e\x00\x3b\xff\x7e\x00\x50\xff\xf6\x00\
-\x6f\xff\xf6\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x77\xff\xec\x00\
-\x78\x00\x00\x00\x7b\xff\xec\x00\x7c\xff\xec\x00\x80\xff\xf6\x00\
-\x81\xff\xf6\x00\xd5\xff\xec\x00\xd6\xff\xec\x00\xd9\xff\xec\x00\
-\xee\xff\xec\x00\xef\xff\xec\x00\x02\x00\x75\xff\xe2\x00\x76\xff\
-\xe2\x00\x04\x00\x30\xff\x91\x00\x36\xff\xbb\x00\x37\xff\xd7\x00\
-\x75\xff\xf1\x00\x02\x00\x75\xff\xc4\x00\x76\xff\xce\x00\x0e\x00\
-\x08\xff\x5a\x00\x1b\xff\x67\x00\x49\xff\x7e\x00\x51\xff\x7e\x00\
-\x59\xff\xec\x00\x5d\xff\xa6\x00\x68\xff\xb0\x00\x6a\xff\x88\x00\
-\x6b\xff\xb0\x00\x75\xff\xb0\x00\x76\xff\xb5\x00\x77\xff\xb0\x00\
-\xd8\xff\xb2\x00\xd9\xff\x6a\x00\x31\x00\x0a\xff\xd8\x00\x0b\xff\
-\xd8\x00\x14\xff\xd8\x00\x22\xff\xd8\x00\x23\xff\xd8\x00\x24\xff\
-\xd8\x00\x25\xff\xd8\x00\x26\xff\xd8\x00\x27\xff\xd8\x00\x28\xff\
-\xd8\x00\x29\xff\xd8\x00\x2c\xff\xd8\x00\x3e\xff\xec\x00\x3f\xff\
-\xec\x00\x40\xff\xec\x00\x41\xff\xec\x00\x42\xff\xec\x00\x43\xff\
-\xec\x00\x44\xff\xec\x00\x45\xff\xec\x00\x47\xff\xec\x00\x48\xff\
-\xec\x00\x49\xff\xec\x00\x4b\xff\xec\x00\x4c\xff\xec\x00\x4d\xff\
-\xec\x00\x4e\xff\xec\x00\x4f\xff\xec\x00\x50\xff\xce\x00\x51\xff\
-\xec\x00\x60\xff\xec\x00\x61\xff\xec\x00\x62\xff\xec\x00\x63\xff\
-\xec\x00\x64\xff\xec\x00\x65\xff\xec\x00\x66\xff\xec\x00\x67\xff\
-\xec\x00\x6a\xff\xec\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x6f\xff\
-\xce\x00\x75\xff\xbf\x00\x76\xff\xc2\x00\x78\xff\xc4\x00\x79\xff\
-\xc4\x00\x7a\xff\xc4\x00\x80\xff\xce\x00\x81\xff\xce\x00\x41\x00\
-\x08\xff\x83\x00\x3e\xff\xba\x00\x3f\xff\xba\x00\x40\xff\xba\x00\
-\x41\xff\xba\x00\x42\xff\xba\x00\x43\xff\xba\x00\x44\xff\xba\x00\
-\x45\xff\xa1\x00\x47\xff\xba\x00\x48\xff\xba\x00\x49\xff\xba\x00\
-\x4b\xff\xba\x00\x4c\xff\xba\x00\x4d\xff\xba\x00\x4e\xff\xba\x00\
-\x4f\xff\xba\x00\x50\xff\xd8\x00\x51\xff\xba\x00\x53\xff\xe2\x00\
-\x54\xff\xe2\x00\x55\xff\xe2\x00\x56\xff\xe2\x00\x57\xff\xe2\x00\
-\x58\xff\xe2\x00\x59\xff\xe2\x00\x5d\xff\xce\x00\x5e\xff\xce\x00\
-\x5f\xff\xce\x00\x60\xff\xba\x00\x61\xff\xba\x00\x62\xff\xba\x00\
-\x63\xff\xba\x00\x64\xff\xba\x00\x65\xff\xba\x00\x66\xff\xba\x00\
-\x67\xff\xba\x00\x68\xff\xc4\x00\x6a\xff\xba\x00\x6b\xff\xce\x00\
-\x6c\xff\xba\x00\x6d\xff\xba\x00\x6f\xff\xce\x00\x70\xff\xce\x00\
-\x71\xff\xce\x00\x72\xff\xce\x00\x73\xff\xce\x00\x74\xff\xce\x00\
-\x75\xff\xce\x00\x76\xff\xce\x00\x77\xff\xc4\x00\x78\xff\xce\x00\
-\x79\xff\xce\x00\x7a\xff\xce\x00\x7b\xff\xba\x00\x7c\xff\xba\x00\
-\x80\xff\xd8\x00\x81\xff\xd8\x00\xd5\xff\x88\x00\xd6\xff\x88\x00\
-\xd7\xff\xce\x00\xd8\xff\xce\x00\xd9\xff\x88\x00\xee\xff\x88\x00\
-\xef\xff\x88\x00\x55\x00\x01\xff\x6a\x00\x02\xff\x6a\x00\x03\xff\
-\x6a\x00\x04\xff\x6a\x00\x05\xff\x6a\x00\x06\xff\x6a\x00\x07\xff\
-\x6a\x00\x08\xff\x51\x00\x0a\xff\xd8\x00\x0b\xff\xd8\x00\x14\xff\
-\xd8\x00\x1b\xff\x79\x00\x22\xff\xd8\x00\x23\xff\xd8\x00\x24\xff\
-\xd8\x00\x25\xff\xd8\x00\x26\xff\xd8\x00\x27\xff\xd8\x00\x28\xff\
-\xd8\x00\x29\xff\xd8\x00\x2c\xff\xd8\x00\x3e\xff\x9c\x00\x3f\xff\
-\x9c\x00\x40\xff\x9c\x00\x41\xff\x9c\x00\x42\xff\x9c\x00\x43\xff\
-\x9c\x00\x44\xff\x9c\x00\x45\xff\x9c\x00\x47\xff\x9c\x00\x48\xff\
-\x9c\x00\x49\xff\x9c\x00\x4b\xff\x9c\x00\x4c\xff\x9c\x00\x4d\xff\
-\x9c\x00\x4e\xff\x9c\x00\x4f\xff\x9c\x00\x50\xff\xce\x00\x51\xff\
-\x9c\x00\x53\xff\xe7\x00\x54\xff\xe7\x00\x55\xff\xe7\x00\x56\xff\
-\xe7\x00\x57\xff\xe7\x00\x58\xff\xe7\x00\x59\xff\xe7\x00\x5d\xff\
-\xd8\x00\x5e\xff\xd8\x00\x5f\xff\xd8\x00\x60\xff\x9c\x00\x61\xff\
-\x9c\x00\x62\xff\x9c\x00\x63\xff\x9c\x00\x64\xff\x9c\x00\x65\xff\
-\x9c\x00\x66\xff\x9c\x00\x67\xff\x9c\x00\x68\xff\xd8\x00\x6a\xff\
-\x9c\x00\x6b\xff\xd8\x00\x6c\xff\xba\x00\x6d\xff\xba\x00\x6f\xff\
-\xce\x00\x70\xff\xd8\x00\x71\xff\xd8\x00\x72\xff\xd8\x00\x73\xff\
-\xd8\x00\x74\xff\xd8\x00\x75\xff\xce\x00\x76\xff\xd8\x00\x77\xff\
-\xce\x00\x78\xff\xce\x00\x79\xff\xce\x00\x7a\xff\xce\x00\x7b\xff\
-\xce\x00\x7c\xff\xce\x00\x80\xff\xce\x00\x81\xff\xce\x00\xd5\xff\
-\x74\x00\xd6\xff\x74\x00\xd7\xff\xce\x00\xd8\xff\xce\x00\xd9\xff\
-\x74\x00\xee\xff\x74\x00\xef\xff\x74\x00\x05\x00\x08\xff\xd6\x00\
-\x1b\xff\xd8\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\xd9\xff\xec\x00\
-\x50\x00\x01\xff\x6a\x00\x02\xff\x6a\x00\x03\xff\x6a\x00\x04\xff\
-\x6a\x00\x05\xff\x6a\x00\x06\xff\x6a\x00\x07\xff\x6a\x00\x08\xff\
-\x2b\x00\x0a\xff\xc4\x00\x0b\xff\xc4\x00\x14\xff\xc4\x00\x1b\xff\
-\x6a\x00\x22\xff\xc4\x00\x23\xff\xc4\x00\x24\xff\xc4\x00\x25\xff\
-\xc4\x00\x26\xff\xc4\x00\x27\xff\xc4\x00\x28\xff\xc4\x00\x29\xff\
-\xc4\x00\x2c\xff\xc4\x00\x2e\xff\xec\x00\x2f\xff\xec\x00\x3e\xff\
-\x88\x00\x3f\xff\x88\x00\x40\xff\x88\x00\x41\xff\xac\x00\x42\xff\
-\x88\x00\x43\xff\x88\x00\x44\xff\x88\x00\x45\xff\x88\x00\x47\xff\
-\x88\x00\x48\xff\x88\x00\x49\xff\x88\x00\x4b\xff\x88\x00\x4c\xff\
-\x88\x00\x4d\xff\xa6\x00\x4e\xff\xba\x00\x4f\xff\x88\x00\x50\xff\
-\xb0\x00\x51\xff\x83\x00\x5d\xff\x88\x00\x5e\xff\x88\x00\x5f\xff\
-\x88\x00\x60\xff\x88\x00\x61\xff\x88\x00\x62\xff\x9c\x00\x63\xff\
-\xce\x00\x64\xff\x88\x00\x65\xff\x88\x00\x66\xff\x9c\x00\x67\xff\
-\x88\x00\x68\xff\x88\x00\x6a\xff\x88\x00\x6b\xff\x88\x00\x6c\xff\
-\x88\x00\x6d\xff\xd6\x00\x6f\xff\x9c\x00\x70\xff\x88\x00\x71\xff\
-\x88\x00\x72\xff\x9c\x00\x73\xff\xce\x00\x74\xff\x88\x00\x75\xff\
-\x74\x00\x76\xff\x7e\x00\x77\xff\x74\x00\x78\xff\x74\x00\x79\xff\
-\x74\x00\x7a\xff\xba\x00\x7b\xff\x74\x00\x7c\xff\xac\x00\x80\xff\
-\xb0\x00\x81\xff\xb0\x00\xd5\xff\x74\x00\xd6\xff\x74\x00\xd7\xff\
-\x74\x00\xd8\xff\x74\x00\xd9\xff\x74\x00\xee\xff\x74\x00\xef\xff\
-\x74\x00\x08\x00\x2f\x00\x00\x00\x30\xff\xe2\x00\x36\xff\xe2\x00\
-\x37\xff\xe2\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x77\xff\xec\x00\
-\xd9\xff\xec\x00\x08\x00\x2f\x00\x00\x00\x30\xff\xce\x00\x36\xff\
-\xe2\x00\x37\xff\xe2\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x77\xff\
-\xec\x00\xd9\xff\xec\x00\x40\x00\x0a\xff\xf6\x00\x0b\xff\xf6\x00\
-\x14\xff\xf6\x00\x22\xff\xf6\x00\x23\xff\xf6\x00\x24\xff\xf6\x00\
-\x25\xff\xf6\x00\x26\xff\xf6\x00\x27\xff\xf6\x00\x28\xff\xf6\x00\
-\x29\xff\xf6\x00\x2c\xff\xf6\x00\x2e\xff\xf6\x00\x2f\xff\xf6\x00\
-\x30\xff\xd8\x00\x36\xff\xe2\x00\x37\xff\xe2\x00\x39\xff\xec\x00\
-\x3a\xff\xec\x00\x3b\xff\xec\x00\x3e\xff\xec\x00\x3f\xff\xec\x00\
-\x40\xff\xec\x00\x41\xff\xec\x00\x42\xff\xec\x00\x43\xff\xec\x00\
-\x44\xff\xec\x00\x45\xff\xec\x00\x47\xff\xec\x00\x48\xff\xec\x00\
-\x49\xff\xec\x00\x4b\xff\xec\x00\x4c\xff\xec\x00\x4d\xff\xec\x00\
-\x4e\xff\xec\x00\x4f\xff\xec\x00\x50\xff\xec\x00\x51\xff\xec\x00\
-\x60\xff\xec\x00\x61\xff\xec\x00\x62\xff\xec\x00\x63\xff\xec\x00\
-\x64\xff\xec\x00\x65\xff\xec\x00\x66\xff\xec\x00\x67\xff\xec\x00\
-\x6a\xff\xec\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x6f\xff\xec\x00\
-\x70\xff\xf6\x00\x71\xff\xf6\x00\x72\xff\xf6\x00\x73\xff\xf6\x00\
-\x74\xff\xf6\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\x78\xff\xe2\x00\
-\x79\xff\xe2\x00\x7a\xff\xe2\x00\x7b\xff\xf6\x00\x7c\xff\xf6\x00\
-\x80\xff\xec\x00\x81\xff\xec\x00\x46\x00\x0a\xff\xe2\x00\x0b\xff\
-\xe2\x00\x14\xff\xe2\x00\x22\xff\xe2\x00\x23\xff\xe2\x00\x24\xff\
-\xe2\x00\x25\xff\xe2\x00\x26\xff\xe2\x00\x27\xff\xe2\x00\x28\xff\
-\xe2\x00\x29\xff\xe2\x00\x2c\xff\xe2\x00\x30\xff\x83\x00\x31\xff\
-\xd8\x00\x32\xff\xd8\x00\x33\xff\xd8\x00\x34\xff\xd8\x00\x35\xff\
-\xd8\x00\x36\xff\x98\x00\x37\xff\xa2\x00\x39\xff\xa3\x00\x3a\xff\
-\xa3\x00\x3b\xff\xa3\x00\x3e\xff\xf6\x00\x3f\xff\xf6\x00\x40\xff\
-\xf6\x00\x41\xff\xf6\x00\x42\xff\xf6\x00\x43\xff\xf6\x00\x44\xff\
-\xf6\x00\x45\xff\xf6\x00\x47\xff\xf6\x00\x48\xff\xf6\x00\x49\xff\
-\xf6\x00\x4b\xff\xf6\x00\x4c\xff\xf6\x00\x4d\xff\xf6\x00\x4e\xff\
-\xf6\x00\x4f\xff\xf6\x00\x50\xff\xf6\x00\x51\xff\xf6\x00\x60\xff\
-\xf6\x00\x61\xff\xf6\x00\x62\xff\xf6\x00\x63\xff\xf6\x00\x64\xff\
-\xf6\x00\x65\xff\xf6\x00\x66\xff\xf6\x00\x67\xff\xf6\x00\x6a\xff\
-\xf6\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x6f\xff\xce\x00\x70\xff\
-\xe2\x00\x71\xff\xe2\x00\x72\xff\xe2\x00\x73\xff\xe2\x00\x74\xff\
-\xe2\x00\x75\xff\xd8\x00\x76\xff\xd8\x00\x77\xff\xf1\x00\x78\xff\
-\xd8\x00\x79\xff\xd8\x00\x7a\xff\xd8\x00\x7b\xff\xf6\x00\x7c\xff\
-\xf6\x00\x80\xff\xf6\x00\x81\xff\xf6\x00\xf8\xff\xce\x00\xf9\xff\
-\xce\x00\x05\x00\x08\xff\x59\x00\x30\xff\xd6\x00\x37\xff\xe4\x00\
-\x38\xff\xec\x00\xd9\xff\x7e\x00\x05\x00\x30\xff\xc4\x00\x36\xff\
-\xd8\x00\x38\xff\xd8\x00\x75\xff\xf6\x00\x77\xff\xf6\x00\x02\x00\
-\x75\xff\xf1\x00\x76\xff\xf6\x00\x02\x00\x75\xff\x7e\x00\x76\xff\
-\x9c\x00\x4d\x00\x01\xff\xf1\x00\x02\xff\xf1\x00\x03\xff\xf1\x00\
-\x04\xff\xf1\x00\x05\xff\xf1\x00\x06\xff\xf1\x00\x07\xff\xf1\x00\
-\x08\xff\xf1\x00\x0a\xff\xba\x00\x0b\xff\xba\x00\x14\xff\xba\x00\
-\x22\xff\xba\x00\x23\xff\xba\x00\x24\xff\xba\x00\x25\xff\xba\x00\
-\x26\xff\xba\x00\x27\xff\xba\x00\x28\xff\xba\x00\x29\xff\xba\x00\
-\x2c\xff\xba\x00\x31\xff\xf6\x00\x32\xff\xf6\x00\x33\xff\xf6\x00\
-\x34\xff\xf6\x00\x35\xff\xf6\x00\x3e\xff\xd8\x00\x3f\xff\xd8\x00\
-\x40\xff\xd8\x00\x41\xff\xd8\x00\x42\xff\xd8\x00\x43\xff\xd8\x00\
-\x44\xff\xd8\x00\x45\xff\xd8\x00\x47\xff\xd8\x00\x48\xff\xd8\x00\
-\x49\xff\xd8\x00\x4b\xff\xd8\x00\x4c\xff\xd8\x00\x4d\xff\xd8\x00\
-\x4e\xff\xd8\x00\x4f\xff\xd8\x00\x50\xff\xd3\x00\x51\xff\xd8\x00\
-\x53\xff\xe7\x00\x54\xff\xe7\x00\x55\xff\xe7\x00\x56\x00\x37\x00\
-\x57\x00\x61\x00\x58\x00\x1b\x00\x59\xff\xe7\x00\x60\xff\xd8\x00\
-\x61\xff\xd8\x00\x62\xff\xd8\x00\x63\xff\xd8\x00\x64\xff\xd8\x00\
-\x65\xff\xd8\x00\x66\xff\xd8\x00\x67\xff\xd8\x00\x68\xff\xf6\x00\
-\x6a\xff\xd8\x00\x6b\xff\xec\x00\x6f\xff\xce\x00\x70\xff\xe2\x00\
-\x71\xff\xe2\x00\x72\xff\xe2\x00\x73\xff\xe2\x00\x74\xff\xe2\x00\
-\x75\xff\xb0\x00\x76\xff\xbe\x00\x77\xff\xf6\x00\x78\xff\xb5\x00\
-\x79\xff\xb5\x00\x7a\xff\xb5\x00\x7b\xff\xec\x00\x7c\xff\xec\x00\
-\x80\xff\xd3\x00\x81\xff\xd3\x00\x05\x00\x08\xff\xe2\x00\x49\xff\
-\xf6\x00\xd6\xff\xe2\x00\xee\xff\xe2\x00\xef\xff\xe2\x00\x06\x00\
-\x36\xff\xec\x00\x75\xff\xe7\x00\x76\xff\xe7\x00\x78\xff\xe7\x00\
-\x79\xff\xe7\x00\x7a\xff\xe7\x00\x48\x00\x01\xff\xb0\x00\x02\xff\
-\xb0\x00\x03\xff\xb0\x00\x04\xff\xb0\x00\x05\xff\xb0\x00\x06\xff\
-\xb0\x00\x07\xff\xb0\x00\x08\xff\x4b\x00\x3e\xff\xa6\x00\x3f\xff\
-\xab\x00\x40\xff\xab\x00\x41\xff\xab\x00\x42\xff\xab\x00\x43\xff\
-\xab\x00\x44\xff\xab\x00\x45\xff\xa6\x00\x47\xff\xa6\x00\x48\xff\
-\xa6\x00\x49\xff\xa6\x00\x4b\xff\xa6\x00\x4c\xff\xa6\x00\x4d\xff\
-\xa6\x00\x4e\xff\xa6\x00\x4f\xff\xa6\x00\x50\xff\xc4\x00\x51\xff\
-\xa6\x00\x53\xff\xec\x00\x54\xff\xec\x00\x55\xff\xec\x00\x56\x00\
-\x46\x00\x57\x00\x61\x00\x58\x00\x1e\x00\x59\xff\xec\x00\x5d\xff\
-\xc4\x00\x5e\xff\xc4\x00\x5f\xff\xc4\x00\x60\xff\xa6\x00\x61\xff\
-\x9c\x00\x62\xff\x9c\x00\x63\xff\xba\x00\x64\xff\x9c\x00\x65\xff\
-\x9c\x00\x66\xff\x9c\x00\x67\xff\xa6\x00\x68\xff\xc4\x00\x6a\xff\
-\xa6\x00\x6b\xff\xc4\x00\x6c\xff\xb0\x00\x6d\xff\xd6\x00\x6f\xff\
-\xd8\x00\x70\xff\xc4\x00\x71\xff\xbf\x00\x72\xff\xbf\x00\x73\xff\
-\xbf\x00\x74\xff\xbf\x00\x75\xff\xba\x00\x76\xff\xc4\x00\x77\xff\
-\xc4\x00\x78\xff\xba\x00\x79\xff\xba\x00\x7a\xff\xba\x00\x7b\xff\
-\xba\x00\x7c\xff\xba\x00\x80\xff\xc4\x00\x81\xff\xc4\x00\xd5\xff\
-\x6a\x00\xd6\xff\x6a\x00\xd8\xff\xb2\x00\xd9\xff\x6f\x00\xee\xff\
-\x6a\x00\xef\xff\x6a\x01\x19\xff\xbf\x00\x0f\x00\x30\xff\xc4\x00\
-\x36\xff\xd8\x00\x38\xff\xd8\x00\x49\xff\xf1\x00\x75\xff\xf6\x00\
-\x76\xff\xf6\x00\x77\xff\xf6\x00\x79\xff\xf6\x00\x7a\xff\xf6\x00\
-\x7c\xff\xec\x00\x80\xff\xf6\x00\x81\xff\xf6\x00\xd9\xff\xce\x00\
-\xee\xff\xce\x00\xef\xff\xce\x00\x04\x00\x2c\xff\xf6\x00\x49\xff\
-\xec\x00\x51\xff\xec\x00\x76\xff\xe2\x00\x0f\x00\x30\xff\xe2\x00\
-\x37\xff\xec\x00\x38\xff\xec\x00\x39\xff\xec\x00\x3a\xff\xec\x00\
-\x3b\xff\xec\x00\x3c\xff\xec\x00\x3d\xff\xec\x00\x75\xff\xe2\x00\
-\x76\xff\xec\x00\xd5\xff\xec\x00\xd6\xff\xec\x00\xd9\xff\xec\x00\
-\xee\xff\xec\x00\xef\xff\xec\x00\x02\x00\x75\xff\xc4\x00\x76\xff\
-\xe2\x00\x08\x00\x30\xff\x45\x00\x36\xff\x6a\x00\x37\xff\x83\x00\
-\x49\xff\xd8\x00\x51\xff\xd8\x00\x5b\xff\xec\x00\x75\xff\x88\x00\
-\x76\xff\x9c\x00\x08\x00\x30\xff\x45\x00\x36\x00\x00\x00\x37\xff\
-\x83\x00\x49\xff\xd8\x00\x51\xff\xd8\x00\x5b\xff\xec\x00\x75\xff\
-\xa6\x00\x76\xff\x9c\x00\x00\x00\x02\x00\x32\x00\x27\x01\xed\x02\
-\x97\x00\x03\x00\x07\x00\x00\x77\x11\x21\x11\x25\x21\x11\x21\x32\
-\x01\xbb\xfe\x7a\x01\x51\xfe\xaf\x27\x02\x70\xfd\x90\x35\x02\x06\
-\x00\x00\x02\x00\x04\xff\xe7\x02\xc3\x02\xb3\x00\x18\x00\x1c\x00\
-\x00\x65\x16\x16\x06\x07\x06\x26\x27\x03\x03\x06\x06\x27\x26\x26\
-\x36\x37\x13\x36\x36\x33\x32\x16\x16\x17\x03\x37\x33\x17\x02\xb2\
-\x0f\x02\x1c\x1f\x30\x34\x17\xaa\xa8\x18\x34\x2f\x1f\x1d\x02\x0f\
-\xfb\x0c\x2f\x19\x12\x1f\x1a\x08\xf2\x4c\xa5\x4c\x76\x1e\x2a\x20\
-\x10\x17\x11\x31\x01\x5c\xfe\xa3\x2f\x11\x17\x0f\x20\x2a\x1e\x02\
-\x08\x18\x1d\x0d\x18\x11\xfe\x0b\x9c\x9c\x00\xff\xff\x00\x04\xff\
-\xe7\x02\xc3\x03\x97\x06\x26\x00\x01\x00\x00\x00\x07\x01\x30\x00\
-\x4f\x00\xbe\xff\xff\x00\x04\xff\xe7\x02\xc3\x03\xa0\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x32\x00\x49\x00\xc8\xff\xff\x00\x04\xff\
-\xe7\x02\xc3\x03\xa0\x06\x26\x00\x01\x00\x00\x00\x07\x01\x2d\x00\
-\x60\x00\xc8\xff\xff\x00\x04\xff\xe7\x02\xc3\x03\xa4\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x2f\x00\x8f\x00\xc8\xff\xff\x00\x04\xff\
-\xe7\x02\xc3\x03\xe6\x06\x26\x00\x01\x00\x00\x00\x07\x01\x35\x00\
-\xb4\x00\xd6\xff\xff\x00\x04\xff\xe7\x02\xc3\x03\x8c\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x36\x00\x61\x00\xb4\x00\x02\xff\xf3\xff\
-\xea\x04\x1e\x02\xb4\x00\x31\x00\x35\x00\x00\x45\x22\x26\x26\x35\
-\x11\x01\x06\x06\x26\x27\x26\x26\x36\x37\x01\x36\x36\x33\x21\x32\
-\x16\x16\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x15\x21\x32\x16\x16\x15\x14\x06\x06\x23\x25\x37\x33\
-\x15\x02\x53\x18\x2a\x19\xfe\xa3\x17\x2c\x2b\x15\x17\x0e\x10\x15\
-\x01\xd5\x0c\x21\x15\x01\x94\x16\x2a\x1b\x1a\x28\x15\xfe\xe9\xac\
-\x17\x29\x1b\x1a\x2a\x18\xab\x01\x18\x15\x28\x19\x1c\x2a\x16\xfd\
-\x2c\x8e\x8c\x08\x19\x2b\x19\x01\x3f\xfe\x80\x1a\x10\x11\x18\x1d\
-\x28\x24\x18\x02\x05\x0d\x0e\x08\x26\x2e\x2c\x27\x08\x4c\x08\x27\
-\x2d\x2d\x26\x08\x4b\x09\x26\x2d\x2d\x26\x08\x89\x9d\x9d\x00\x00\
-\x02\x00\x1e\xff\xf8\x02\x4d\x02\xb4\x00\x1b\x00\x38\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\
-\x06\x07\x1e\x02\x15\x0e\x03\x23\x27\x33\x32\x36\x36\x35\x34\x2e\
-\x03\x23\x23\x22\x26\x35\x34\x36\x33\x33\x32\x3e\x02\x35\x34\x26\
-\x23\x23\x79\x2d\x26\x08\x08\x26\x2e\xea\x3d\x60\x38\x07\x0f\x0b\
-\x11\x18\x0c\x01\x23\x3e\x50\x2d\x99\x8f\x07\x18\x13\x05\x0a\x0d\
-\x11\x0a\x0d\x28\x22\x25\x2a\x0c\x08\x0c\x07\x04\x15\x1f\x79\x08\
-\x1b\x2b\x17\x02\x04\x16\x2a\x1b\x3b\x62\x39\x13\x27\x25\x11\x15\
-\x31\x33\x1a\x30\x53\x3d\x23\xb7\x05\x17\x1b\x0e\x13\x0b\x05\x02\
-\x22\x2b\x29\x21\x02\x08\x0f\x0d\x17\x10\x00\x00\x01\x00\x0e\xff\
-\xed\x02\x6a\x02\xba\x00\x3d\x00\x00\x45\x22\x2e\x03\x35\x34\x3e\
-\x03\x33\x32\x16\x16\x17\x16\x16\x15\x14\x06\x07\x06\x06\x23\x22\
-\x26\x27\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x33\x32\x36\x36\
-\x37\x36\x36\x33\x32\x16\x17\x16\x16\x15\x14\x06\x07\x0e\x02\x01\
-\x78\x27\x60\x61\x51\x31\x31\x50\x61\x62\x29\x33\x4e\x31\x06\x14\
-\x23\x0b\x0b\x14\x23\x11\x0d\x18\x11\x07\x16\x26\x1f\x1a\x3d\x36\
-\x22\x23\x36\x3d\x19\x1a\x24\x1d\x0c\x0b\x1a\x0d\x11\x22\x13\x0b\
-\x0b\x23\x14\x07\x2e\x4e\x13\x19\x36\x56\x78\x4f\x4c\x74\x54\x34\
-\x19\x19\x1b\x04\x0d\x1f\x1a\x0d\x1c\x0f\x1c\x1a\x0c\x0b\x05\x0d\
-\x0b\x13\x29\x43\x2f\x30\x42\x29\x13\x09\x10\x08\x08\x0c\x1c\x1d\
-\x11\x1d\x0c\x19\x1e\x0c\x04\x1c\x18\xff\xff\x00\x0e\xff\x4a\x02\
-\x6a\x02\xba\x06\x26\x00\x0a\x00\x00\x00\x07\x01\x38\x00\xc8\x00\
-\x0a\x00\x02\x00\x1c\xff\xf8\x02\x81\x02\xb4\x00\x14\x00\x1f\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x17\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x23\x27\x33\x32\x36\x36\x35\x34\x26\x26\x23\x23\x77\
-\x2b\x26\x0a\x08\x26\x2e\xac\x47\x7e\x61\x37\x37\x61\x7f\x49\x4e\
-\x51\x2d\x4c\x2d\x2d\x4c\x2e\x50\x08\x1a\x2a\x18\x02\x05\x16\x2a\
-\x1b\x01\x36\x5f\x7e\x47\x49\x80\x61\x37\xb7\x2d\x4b\x2e\x2e\x4c\
-\x2d\xff\xff\x00\x14\xff\xf8\x02\xc8\x02\xb4\x04\x26\x00\x0c\x47\
-\x00\x00\x06\x00\xe4\x06\x5a\x00\x01\x00\x26\xff\xf7\x02\x4d\x02\
-\xb3\x00\x27\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\x21\x32\
-\x16\x16\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x15\x21\x32\x16\x16\x15\x14\x06\x06\x23\x81\x2d\x26\
-\x08\x29\x35\x01\x6e\x17\x29\x1b\x1b\x2a\x17\xfe\xec\xb9\x17\x24\
-\x16\x16\x26\x17\xb7\x01\x15\x17\x29\x1b\x1b\x2a\x17\x09\x1b\x2b\
-\x16\x02\x05\x34\x27\x08\x26\x2e\x2d\x26\x08\x59\x07\x20\x28\x26\
-\x21\x06\x59\x08\x26\x2e\x2d\x26\x08\xff\xff\x00\x26\xff\xf7\x02\
-\x4d\x03\xa1\x06\x26\x00\x0e\x00\x00\x00\x07\x01\x30\x00\x43\x00\
-\xc8\xff\xff\x00\x26\xff\xf7\x02\x4d\x03\xa0\x06\x26\x00\x0e\x00\
-\x00\x00\x07\x01\x32\x00\x18\x00\xc8\xff\xff\x00\x26\xff\xf7\x02\
-\x4d\x03\xa0\x06\x26\x00\x0e\x00\x00\x00\x07\x01\x2d\x00\x2f\x00\
-\xc8\xff\xff\x00\x26\xff\xf7\x02\x4d\x03\xa4\x06\x26\x00\x0e\x00\
-\x00\x00\x07\x01\x2f\x00\x35\x00\xc8\x00\x01\x00\x26\xff\xf7\x02\
-\x4c\x02\xb3\x00\x21\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\x23\x15\x14\x06\x06\x81\x2d\x26\x08\x29\x35\x01\
-\x6e\x17\x29\x1a\x1b\x2a\x17\xfe\xed\xb8\x17\x25\x15\x16\x25\x17\
-\xb7\x08\x26\x09\x1b\x2b\x16\x02\x05\x34\x27\x08\x26\x2e\x2d\x26\
-\x08\x59\x07\x21\x28\x26\x20\x06\xb5\x16\x2a\x1b\x00\x00\x01\x00\
-\x23\xff\xed\x02\xa2\x02\xbf\x00\x40\x00\x00\x45\x22\x2e\x02\x35\
-\x34\x3e\x02\x33\x32\x16\x16\x17\x16\x16\x15\x14\x06\x07\x06\x06\
-\x23\x22\x26\x27\x2e\x02\x23\x22\x06\x06\x15\x14\x16\x16\x33\x32\
-\x36\x36\x37\x35\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x1e\x02\
-\x15\x15\x14\x06\x07\x0e\x02\x01\x83\x48\x7f\x62\x37\x38\x63\x82\
-\x4a\x20\x4a\x47\x1a\x15\x23\x0c\x0b\x13\x26\x11\x0b\x17\x14\x06\
-\x22\x2f\x1a\x2f\x4e\x2e\x30\x4f\x2e\x12\x23\x22\x0d\x4a\x12\x20\
-\x14\x16\x22\x11\xaf\x28\x20\x07\x30\x29\x19\x3e\x47\x13\x3a\x66\
-\x86\x4c\x49\x7f\x61\x37\x0c\x19\x12\x0e\x20\x18\x0c\x1c\x10\x1c\
-\x19\x0b\x0c\x04\x0d\x0b\x2d\x4e\x30\x31\x53\x33\x02\x06\x05\x56\
-\x07\x20\x27\x27\x20\x06\x01\x1b\x26\x15\xcd\x1c\x3b\x15\x0d\x11\
-\x09\x00\x03\x00\x1c\xff\xf8\x02\x6e\x02\xb3\x00\x11\x00\x23\x00\
-\x27\x00\x00\x45\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x21\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x13\x35\x21\x15\x02\x12\x2d\x26\x08\
-\x08\x26\x2e\x2e\x25\x08\x08\x26\xfe\x37\x2d\x26\x08\x08\x26\x2e\
-\x2e\x25\x08\x08\x26\x1e\x01\x04\x08\x1b\x2b\x16\x02\x04\x16\x2a\
-\x1b\x1b\x2a\x17\xfd\xfc\x16\x2a\x1b\x1b\x2b\x16\x02\x04\x16\x2a\
-\x1b\x1b\x2a\x17\xfd\xfc\x16\x2a\x1b\x01\x0f\x9c\x9c\x00\x01\x00\
-\x1c\xff\xf7\x00\xd3\x02\xb3\x00\x11\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x77\x2d\x26\
-\x08\x08\x26\x2e\x2e\x25\x08\x08\x26\x09\x1b\x2b\x16\x02\x05\x16\
-\x2a\x1b\x1b\x2a\x17\xfd\xfb\x16\x2a\x1b\x00\xff\xff\xff\xe1\xff\
-\xf7\x01\x10\x03\x97\x06\x26\x00\x16\x00\x00\x00\x07\x01\x30\xff\
-\x63\x00\xbe\xff\xff\xff\xb0\xff\xf7\x01\x40\x03\xa0\x06\x26\x00\
-\x16\x00\x00\x00\x07\x01\x32\xff\x5d\x00\xc8\xff\xff\xff\xa1\xff\
-\xf7\x01\x55\x03\xa0\x06\x26\x00\x16\x00\x00\x00\x07\x01\x2d\xff\
-\x74\x00\xc8\xff\xff\xff\xa9\xff\xf7\x00\xd6\x03\xa4\x06\x26\x00\
-\x16\x00\x00\x00\x07\x01\x2f\xff\x7a\x00\xc8\x00\x01\x00\x0f\xff\
-\xed\x01\xed\x02\xb3\x00\x28\x00\x00\x57\x22\x2e\x02\x31\x26\x26\
-\x35\x34\x36\x37\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x3e\x02\
-\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\xe8\x2a\
-\x44\x2f\x19\x0d\x16\x11\x12\x11\x20\x10\x14\x21\x0d\x04\x0e\x16\
-\x10\x10\x1b\x13\x0a\x09\x27\x2e\x2c\x25\x09\x28\x48\x5f\x13\x18\
-\x20\x18\x0e\x1d\x13\x10\x21\x13\x12\x12\x18\x0e\x03\x0b\x09\x0b\
-\x15\x1d\x12\x01\x5b\x17\x2e\x1e\x1c\x2b\x16\xfe\x98\x35\x5d\x47\
-\x28\x00\x01\x00\x28\xff\xe9\x02\x3e\x02\xc1\x00\x24\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\x37\x36\
-\x36\x16\x17\x16\x16\x07\x07\x17\x16\x06\x07\x06\x06\x26\x27\x27\
-\x15\x14\x06\x06\x83\x2d\x26\x08\x08\x26\x2e\x2e\x25\x08\xae\x17\
-\x28\x2a\x19\x29\x02\x22\xc4\xc5\x25\x05\x29\x1e\x2a\x24\x16\xaf\
-\x08\x26\x09\x1b\x2b\x16\x02\x05\x16\x2a\x1b\x1b\x2a\x17\x8a\xc7\
-\x19\x14\x0c\x18\x25\x38\x24\xc8\xc5\x25\x3b\x22\x18\x0c\x15\x1a\
-\xc7\x8d\x16\x2a\x1b\x00\x01\x00\x32\xff\xf7\x02\x2a\x02\xb3\x00\
-\x17\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x33\x32\x16\x16\x15\x14\x06\x06\x23\x8d\x2d\x26\x08\x08\
-\x26\x2e\x2e\x25\x08\xf4\x13\x23\x17\x18\x23\x13\x09\x1b\x2b\x16\
-\x02\x05\x16\x2a\x1b\x1b\x2a\x17\xfe\x3c\x06\x21\x27\x26\x21\x07\
-\x00\x00\x02\x00\x0a\xff\xf7\x02\x7a\x02\xb3\x00\x0d\x00\x25\x00\
-\x00\x77\x06\x26\x27\x26\x36\x37\x25\x36\x16\x17\x16\x06\x07\x03\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x67\x23\x26\x0b\x09\x15\x23\x01\x1e\
-\x25\x24\x0a\x07\x14\x21\xa8\x2d\x26\x08\x08\x26\x2e\x2e\x25\x08\
-\xf4\x13\x23\x17\x18\x23\x13\xfd\x0b\x15\x27\x26\x25\x09\x50\x08\
-\x15\x23\x25\x25\x0a\xfe\xa9\x1b\x2b\x16\x02\x05\x16\x2a\x1b\x1b\
-\x2a\x17\xfe\x3c\x06\x21\x27\x26\x21\x07\x00\x00\x01\x00\x1c\xff\
-\xf8\x03\x0d\x02\xb2\x00\x30\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x17\x13\x23\x13\x3e\x02\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x23\x22\x26\x26\x35\x11\x07\x0e\x02\x23\x22\
-\x26\x26\x27\x27\x11\x14\x06\x06\x76\x2c\x26\x08\x08\x26\x2e\x1f\
-\x1d\x0d\x07\xcf\x06\xce\x0a\x11\x1d\x1b\x2d\x26\x08\x08\x26\x2e\
-\x2d\x26\x08\x75\x04\x10\x1e\x1b\x1b\x1f\x10\x04\x74\x08\x26\x08\
-\x1a\x2a\x18\x02\x04\x16\x29\x1b\x08\x0c\x08\xfe\xf6\x01\x09\x0b\
-\x0c\x06\x1b\x2a\x17\xfd\xfc\x16\x2a\x1a\x1b\x2b\x16\x01\x1c\x9f\
-\x05\x14\x10\x10\x13\x06\x9e\xfe\xe3\x16\x2a\x1a\x00\x00\x01\x00\
-\x1c\xff\xf7\x02\x82\x02\xb2\x00\x23\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x17\x13\x11\x34\x36\x36\x33\x32\x16\
-\x16\x15\x11\x14\x06\x06\x23\x22\x26\x27\x01\x11\x14\x06\x06\x76\
-\x2c\x26\x08\x08\x27\x2d\x2c\x20\x0d\xfa\x09\x26\x2d\x2e\x25\x08\
-\x08\x26\x2e\x22\x23\x0c\xfe\xfd\x08\x26\x09\x1b\x2a\x17\x02\x07\
-\x16\x28\x1a\x16\x11\xfe\xb0\x01\x1f\x16\x28\x1a\x1b\x2a\x17\xfd\
-\xfc\x16\x2a\x1b\x0b\x10\x01\x56\xfe\xea\x16\x2a\x1b\xff\xff\x00\
-\x1c\xff\xf7\x02\x82\x03\x8c\x06\x26\x00\x20\x00\x00\x00\x07\x01\
-\x36\x00\x4c\x00\xb4\x00\x02\x00\x0e\xff\xec\x02\xc3\x02\xbb\x00\
-\x13\x00\x27\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\
-\x02\x15\x14\x0e\x02\x27\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x0e\
-\x02\x15\x14\x1e\x02\x01\x6d\x49\x7f\x60\x37\x35\x5e\x7d\x47\x49\
-\x7f\x60\x36\x35\x5f\x7b\x4c\x22\x3c\x2d\x19\x1a\x2d\x3b\x21\x22\
-\x3b\x2d\x1a\x1a\x2d\x3b\x14\x37\x62\x81\x49\x4c\x84\x64\x38\x37\
-\x62\x83\x4c\x4a\x82\x63\x38\xb7\x1b\x2f\x41\x25\x25\x40\x31\x1b\
-\x1b\x31\x40\x25\x24\x40\x31\x1b\x00\xff\xff\x00\x0e\xff\xec\x02\
-\xc3\x03\x97\x06\x26\x00\x22\x00\x00\x00\x07\x01\x30\x00\x54\x00\
-\xbe\xff\xff\x00\x0e\xff\xec\x02\xc3\x03\xa0\x06\x26\x00\x22\x00\
-\x00\x00\x07\x01\x32\x00\x4e\x00\xc8\xff\xff\x00\x0e\xff\xec\x02\
-\xc3\x03\xa0\x06\x26\x00\x22\x00\x00\x00\x07\x01\x2d\x00\x65\x00\
-\xc8\xff\xff\x00\x0e\xff\xec\x02\xc3\x03\xa4\x06\x26\x00\x22\x00\
-\x00\x00\x07\x01\x2f\x00\x6b\x00\xc8\x00\x03\x00\x18\xff\xbd\x02\
-\xcd\x02\xe7\x00\x13\x00\x27\x00\x35\x00\x00\x45\x22\x2e\x02\x35\
-\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x3e\x02\x35\
-\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x07\x26\x26\x37\x01\
-\x36\x36\x17\x16\x16\x07\x01\x06\x06\x01\x77\x49\x7f\x60\x37\x35\
-\x5e\x7d\x47\x49\x7f\x60\x36\x35\x5f\x7b\x4c\x22\x3c\x2d\x19\x1a\
-\x2d\x3b\x21\x22\x3c\x2d\x19\x1a\x2d\x3b\x98\x2e\x11\x13\x01\x2c\
-\x14\x31\x2c\x31\x0e\x15\xfe\xd5\x14\x2f\x14\x37\x62\x81\x49\x4c\
-\x84\x64\x38\x37\x62\x83\x4c\x4a\x82\x63\x38\xb7\x1b\x2f\x41\x25\
-\x25\x40\x31\x1b\x1b\x31\x40\x25\x25\x40\x30\x1b\xd1\x16\x2b\x29\
-\x02\x73\x2a\x0e\x16\x18\x2c\x2b\xfd\x93\x2a\x0e\x00\xff\xff\x00\
-\x0e\xff\xec\x02\xc3\x03\x8c\x06\x26\x00\x22\x00\x00\x00\x07\x01\
-\x36\x00\x66\x00\xb4\x00\x02\x00\x0e\xff\xf7\x03\xea\x02\xb3\x00\
-\x29\x00\x34\x00\x00\x45\x2e\x03\x35\x34\x3e\x02\x33\x21\x32\x16\
-\x16\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\x14\x06\x06\
-\x23\x23\x15\x21\x36\x16\x16\x15\x14\x06\x06\x23\x25\x33\x11\x23\
-\x0e\x02\x15\x14\x16\x16\x01\x5a\x46\x78\x5b\x33\x34\x5c\x78\x45\
-\x02\x33\x17\x2a\x1b\x1c\x2a\x16\xfe\xeb\xaf\x17\x29\x1b\x1b\x2b\
-\x17\xad\x01\x15\x17\x2a\x1b\x1c\x2a\x16\xfd\xcd\x67\x66\x2b\x44\
-\x28\x28\x44\x09\x04\x38\x5f\x7a\x45\x49\x80\x62\x37\x08\x26\x2e\
-\x2d\x26\x08\x4c\x08\x26\x2e\x2d\x26\x08\x4f\x02\x06\x26\x2e\x2d\
-\x26\x08\xb3\x01\x52\x02\x2e\x4b\x2e\x2c\x4b\x2e\x00\x00\x02\x00\
-\x23\xff\xf8\x02\x45\x02\xb3\x00\x19\x00\x24\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x33\x32\x1e\x02\x15\x14\x0e\x02\x23\
-\x23\x15\x14\x06\x06\x13\x33\x32\x36\x36\x35\x34\x26\x26\x23\x23\
-\x7e\x2d\x26\x08\x08\x26\x2e\xc7\x26\x58\x4f\x32\x32\x4f\x58\x27\
-\x6b\x08\x26\x2e\x6c\x0d\x22\x1a\x14\x21\x15\x6b\x08\x1b\x2b\x16\
-\x02\x04\x16\x2a\x1b\x1f\x40\x60\x42\x41\x60\x3f\x1f\x60\x16\x2a\
-\x1b\x01\x72\x0d\x20\x1c\x15\x21\x13\x00\x02\x00\x28\xff\xf8\x02\
-\x4a\x02\xb3\x00\x1e\x00\x29\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x15\x33\x32\x1e\x02\x15\x14\x0e\x02\
-\x23\x23\x15\x14\x06\x06\x13\x33\x32\x36\x36\x35\x34\x26\x26\x23\
-\x23\x83\x2d\x26\x08\x08\x26\x2e\x2e\x25\x08\x6c\x26\x58\x4f\x32\
-\x32\x4f\x58\x27\x6b\x08\x26\x2e\x6c\x0d\x22\x1a\x14\x21\x15\x6b\
-\x08\x1b\x2b\x16\x02\x04\x16\x2a\x1b\x1b\x2a\x17\x02\x1f\x40\x60\
-\x42\x41\x60\x3f\x1f\x02\x16\x2a\x1b\x01\x14\x0d\x20\x1c\x15\x21\
-\x13\x00\x02\x00\x0e\xff\xea\x03\x04\x02\xbb\x00\x1d\x00\x31\x00\
-\x00\x65\x16\x16\x07\x06\x06\x26\x27\x27\x06\x06\x23\x22\x2e\x02\
-\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x07\x05\x32\x3e\x02\
-\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x02\xcf\x2b\x0a\
-\x1f\x16\x24\x29\x1c\x38\x29\x62\x36\x49\x7f\x60\x37\x35\x5e\x7d\
-\x47\x49\x7f\x60\x36\x11\x10\xfe\xc6\x22\x3c\x2d\x19\x1a\x2d\x3b\
-\x21\x22\x3c\x2d\x19\x1a\x2d\x3b\x9e\x1c\x37\x2c\x1f\x16\x0c\x12\
-\x24\x1e\x22\x37\x62\x81\x49\x4c\x84\x64\x38\x37\x62\x83\x4c\x28\
-\x4c\x23\x19\x1b\x2f\x41\x25\x25\x40\x31\x1b\x1b\x31\x40\x25\x25\
-\x40\x30\x1b\x00\x03\x00\x23\xff\xee\x02\x55\x02\xb3\x00\x19\x00\
-\x23\x00\x2f\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x33\
-\x32\x1e\x02\x15\x14\x0e\x02\x07\x23\x15\x14\x06\x06\x25\x06\x26\
-\x27\x27\x37\x17\x16\x16\x06\x01\x33\x32\x3e\x02\x35\x34\x26\x26\
-\x23\x23\x7e\x2d\x26\x08\x08\x26\x2e\xc9\x26\x58\x4e\x32\x1b\x35\
-\x4b\x30\xa1\x08\x26\x01\x75\x2d\x34\x1e\xb8\xd0\x7c\x14\x0b\x16\
-\xfe\x9b\x6e\x09\x19\x16\x0f\x14\x21\x14\x6c\x08\x1b\x2b\x16\x02\
-\x04\x16\x2a\x1b\x1f\x40\x60\x42\x2e\x50\x41\x31\x0e\x61\x16\x2a\
-\x1b\x18\x22\x0d\x28\xfa\x1a\xa7\x1d\x28\x24\x01\x43\x07\x11\x1c\
-\x15\x15\x21\x13\x00\x00\x01\x00\x0b\xff\xed\x02\x10\x02\xbe\x00\
-\x45\x00\x00\x45\x22\x2e\x02\x27\x26\x26\x36\x37\x36\x36\x16\x17\
-\x16\x16\x33\x32\x36\x36\x35\x34\x2e\x02\x27\x2e\x04\x35\x34\x36\
-\x36\x33\x32\x1e\x02\x17\x16\x16\x07\x06\x06\x27\x2e\x02\x23\x22\
-\x0e\x02\x15\x14\x1e\x02\x17\x1e\x03\x15\x14\x0e\x02\x01\x0f\x3d\
-\x55\x36\x1c\x03\x14\x09\x15\x19\x17\x2c\x2b\x14\x18\x22\x16\x1b\
-\x22\x10\x22\x37\x44\x21\x14\x26\x21\x18\x0d\x3d\x6b\x44\x31\x46\
-\x2d\x18\x03\x21\x06\x1b\x1e\x3a\x26\x08\x10\x1b\x1b\x0a\x14\x0e\
-\x09\x20\x35\x40\x21\x1b\x32\x26\x17\x32\x4f\x59\x13\x1e\x29\x22\
-\x04\x19\x28\x28\x18\x16\x05\x18\x17\x1b\x13\x0d\x1b\x15\x11\x13\
-\x0e\x11\x0e\x08\x18\x1f\x2b\x36\x22\x3d\x60\x38\x10\x16\x13\x03\
-\x1e\x2b\x28\x2b\x0b\x18\x06\x0f\x0b\x07\x0b\x10\x09\x15\x17\x0c\
-\x0c\x0a\x09\x1c\x2c\x41\x2f\x41\x5b\x37\x19\xff\xff\x00\x0b\xff\
-\xed\x02\x10\x03\xa3\x06\x26\x00\x2e\x00\x00\x00\x07\x01\x33\xff\
-\xf6\x00\xc8\x00\x01\x00\x0f\xff\xf7\x02\x71\x02\xb4\x00\x1c\x00\
-\x00\x41\x32\x16\x16\x15\x14\x06\x06\x23\x23\x11\x14\x06\x06\x23\
-\x22\x26\x26\x35\x11\x23\x22\x26\x26\x35\x34\x36\x36\x33\x02\x25\
-\x13\x22\x17\x17\x23\x13\x8a\x08\x25\x2e\x2c\x26\x07\x8b\x12\x23\
-\x17\x17\x24\x12\x02\xb4\x06\x20\x27\x26\x21\x06\xfe\x36\x16\x29\
-\x1a\x1b\x29\x16\x01\xc9\x07\x20\x27\x26\x20\x06\x00\x00\x01\x00\
-\x1c\xff\xec\x02\x87\x02\xb4\x00\x25\x00\x00\x45\x22\x2e\x02\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x16\x16\x33\x32\x36\
-\x36\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\x01\
-\x50\x4c\x73\x4e\x27\x08\x26\x2e\x2e\x26\x08\x16\x37\x32\x26\x38\
-\x1f\x09\x26\x2d\x2e\x25\x08\x28\x4f\x74\x14\x3d\x64\x78\x3b\x01\
-\x18\x17\x2a\x1b\x1b\x2a\x18\xfe\xe9\x21\x48\x33\x27\x47\x2f\x01\
-\x1c\x16\x27\x1a\x1c\x2a\x17\xfe\xe7\x3c\x77\x63\x3c\xff\xff\x00\
-\x1c\xff\xec\x02\x87\x03\x97\x06\x26\x00\x31\x00\x00\x00\x07\x01\
-\x30\x00\x3d\x00\xbe\xff\xff\x00\x1c\xff\xec\x02\x87\x03\xa0\x06\
-\x26\x00\x31\x00\x00\x00\x07\x01\x32\x00\x37\x00\xc8\xff\xff\x00\
-\x1c\xff\xec\x02\x87\x03\xa0\x06\x26\x00\x31\x00\x00\x00\x07\x01\
-\x2d\x00\x4e\x00\xc8\xff\xff\x00\x1c\xff\xec\x02\x87\x03\xa4\x06\
-\x26\x00\x31\x00\x00\x00\x07\x01\x2f\x00\x54\x00\xc8\x00\x01\x00\
-\x14\xff\xf8\x02\xc5\x02\xbb\x00\x17\x00\x00\x45\x22\x26\x27\x03\
-\x26\x36\x37\x36\x36\x16\x17\x13\x13\x36\x36\x16\x17\x16\x16\x07\
-\x03\x06\x06\x01\x6e\x21\x2e\x0b\xed\x13\x13\x2e\x20\x2d\x20\x0c\
-\x9e\x9e\x0d\x20\x2e\x1e\x32\x10\x14\xed\x0a\x2f\x08\x19\x19\x02\
-\x09\x2c\x33\x16\x12\x01\x1e\x1f\xfe\x7b\x01\x85\x1f\x1e\x02\x11\
-\x18\x31\x2c\xfd\xf7\x16\x1c\x00\x01\x00\x09\xff\xf8\x03\xa4\x02\
-\xbb\x00\x2e\x00\x00\x45\x22\x26\x26\x27\x03\x26\x36\x37\x36\x16\
-\x16\x17\x13\x13\x3e\x02\x33\x32\x16\x16\x17\x13\x13\x3e\x02\x17\
-\x1e\x02\x07\x03\x0e\x02\x23\x22\x26\x26\x27\x03\x03\x0e\x02\x01\
-\x22\x20\x24\x10\x02\xb4\x0f\x15\x34\x22\x2a\x1c\x0b\x68\x52\x03\
-\x0f\x24\x22\x26\x25\x0e\x03\x52\x68\x0b\x1b\x2c\x22\x24\x1e\x01\
-\x0a\xb3\x02\x0f\x24\x22\x22\x26\x10\x01\x5e\x5e\x01\x10\x25\x08\
-\x1a\x1f\x05\x02\x04\x32\x31\x11\x0b\x02\x20\x22\xfe\xd0\x01\x2b\
-\x0a\x20\x19\x1c\x20\x08\xfe\xd4\x01\x32\x21\x21\x04\x0c\x0d\x1d\
-\x2a\x21\xfd\xfc\x06\x1e\x1a\x1f\x21\x03\x01\x34\xfe\xcd\x05\x21\
-\x1e\x00\x02\x00\x08\xff\xe9\x02\xaa\x02\xc3\x00\x0f\x00\x1f\x00\
-\x00\x65\x06\x06\x26\x27\x01\x26\x26\x37\x36\x36\x16\x17\x01\x16\
-\x16\x05\x26\x36\x37\x01\x36\x36\x16\x17\x16\x06\x07\x01\x06\x06\
-\x26\x02\x81\x1b\x29\x26\x17\xfe\x2a\x21\x01\x27\x1b\x29\x27\x16\
-\x01\xd6\x22\x02\xfd\x86\x28\x01\x22\x01\xd6\x17\x26\x29\x1b\x28\
-\x02\x21\xfe\x2a\x16\x27\x29\x10\x18\x0f\x13\x1a\x02\x04\x23\x3a\
-\x24\x19\x0f\x13\x1b\xfd\xfb\x25\x37\x24\x24\x37\x25\x02\x05\x1b\
-\x13\x0f\x19\x24\x3a\x23\xfd\xfc\x1a\x13\x0f\x00\x01\x00\x00\xff\
-\xf5\x02\x7c\x02\xc0\x00\x1b\x00\x00\x41\x16\x16\x07\x03\x15\x14\
-\x06\x06\x23\x22\x26\x26\x35\x35\x03\x26\x36\x37\x36\x36\x16\x17\
-\x17\x37\x36\x36\x16\x02\x48\x2c\x08\x1a\xc7\x08\x26\x2e\x2e\x26\
-\x08\xc7\x1c\x0c\x2b\x1f\x2c\x24\x11\x85\x8b\x13\x23\x2c\x02\xa4\
-\x1e\x37\x26\xfe\xd6\xaf\x16\x2a\x1b\x1b\x2b\x17\xad\x01\x2a\x27\
-\x38\x1c\x15\x07\x19\x1c\xd6\xd6\x1d\x18\x08\xff\xff\x00\x00\xff\
-\xf5\x02\x7c\x03\x97\x06\x26\x00\x39\x00\x00\x00\x07\x01\x30\x00\
-\x2a\x00\xbe\xff\xff\x00\x00\xff\xf5\x02\x7c\x03\xa0\x06\x26\x00\
-\x39\x00\x00\x00\x07\x01\x2d\x00\x3b\x00\xc8\x00\x01\x00\x0e\xff\
-\xf5\x02\x48\x02\xb4\x00\x21\x00\x00\x57\x22\x26\x35\x34\x36\x37\
-\x01\x23\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x15\x14\x06\
-\x07\x01\x33\x32\x16\x16\x15\x14\x06\x06\x23\x69\x26\x35\x06\x07\
-\x01\x16\xc4\x16\x2c\x1d\x1b\x2b\x16\x01\x76\x26\x35\x06\x07\xfe\
-\xea\xd6\x16\x29\x1b\x1b\x2a\x17\x0b\x35\x28\x0e\x17\x08\x01\x81\
-\x07\x25\x2c\x2e\x26\x08\x36\x28\x0e\x17\x08\xfe\x7f\x08\x25\x2b\
-\x2d\x26\x08\xff\xff\x00\x0e\xff\xf5\x02\x48\x03\xa3\x06\x26\x00\
-\x3c\x00\x00\x00\x07\x01\x33\x00\x12\x00\xc8\x00\x02\x00\x0f\xff\
-\xf9\x02\x0f\x01\xf3\x00\x22\x00\x32\x00\x00\x45\x22\x26\x37\x33\
-\x0e\x02\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\x17\x23\
-\x26\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x27\x32\x36\x36\x35\
-\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\xb4\x2d\x2b\x01\
-\x0e\x05\x1d\x30\x23\x2d\x53\x41\x26\x26\x42\x52\x2d\x22\x2f\x1d\
-\x05\x0b\x01\x2b\x2d\x2d\x25\x08\x08\x25\xd3\x13\x1f\x13\x13\x20\
-\x14\x14\x21\x14\x15\x22\x07\x1e\x13\x07\x17\x13\x29\x48\x5b\x32\
-\x31\x5a\x47\x29\x14\x18\x08\x19\x1c\x1b\x2a\x16\xfe\xbb\x16\x2a\
-\x1a\xb5\x14\x21\x13\x14\x20\x14\x14\x21\x14\x13\x20\x14\x00\xff\
-\xff\x00\x0f\xff\xf9\x02\x0f\x02\xd9\x06\x26\x00\x3e\x00\x00\x00\
-\x07\x01\x30\x00\x26\x00\x00\xff\xff\x00\x0f\xff\xf9\x02\x0f\x02\
-\xd8\x06\x26\x00\x3e\x00\x00\x00\x06\x01\x32\xf9\x00\xff\xff\x00\
-\x0f\xff\xf9\x02\x0f\x02\xd8\x06\x26\x00\x3e\x00\x00\x00\x07\x01\
-\x2d\x00\x12\x00\x00\xff\xff\x00\x0f\xff\xf9\x02\x0f\x02\xdc\x06\
-\x26\x00\x3e\x00\x00\x00\x06\x01\x2f\x41\x00\xff\xff\x00\x0f\xff\
-\xf9\x02\x0f\x03\x10\x06\x26\x00\x3e\x00\x00\x00\x07\x01\x35\x00\
-\x64\x00\x00\xff\xff\x00\x0f\xff\xf9\x02\x0f\x02\xd8\x06\x26\x00\
-\x3e\x00\x00\x00\x06\x01\x36\x0f\x00\x00\x03\x00\x0e\xff\xee\x03\
-\x40\x01\xfb\x00\x4c\x00\x58\x00\x68\x00\x00\x53\x32\x16\x16\x17\
-\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x23\x23\x1e\x03\x33\x32\x3e\
-\x02\x33\x32\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x26\x26\x27\
-\x0e\x02\x23\x22\x26\x35\x34\x36\x36\x33\x32\x1e\x03\x17\x2e\x02\
-\x23\x22\x0e\x02\x07\x06\x22\x27\x26\x34\x37\x3e\x02\x05\x33\x32\
-\x36\x35\x34\x26\x26\x23\x22\x06\x06\x05\x32\x3e\x02\x37\x2e\x02\
-\x23\x22\x06\x06\x15\x14\x16\xff\x1f\x3b\x35\x17\x18\x3a\x42\x23\
-\x3b\x56\x38\x1b\x37\x2d\xce\x03\x10\x17\x1c\x0f\x1c\x25\x19\x16\
-\x0d\x12\x1e\x0b\x06\x07\x3d\x5e\x31\x29\x48\x3d\x18\x12\x34\x51\
-\x3e\x58\x5b\x30\x5a\x3e\x0f\x1c\x1a\x17\x14\x09\x02\x12\x20\x19\
-\x0a\x11\x0f\x0e\x07\x22\x45\x1c\x25\x24\x0f\x37\x4c\x01\x3c\x6a\
-\x0b\x0d\x0d\x17\x11\x10\x21\x18\xfe\xd3\x11\x1f\x1d\x18\x09\x09\
-\x1d\x24\x16\x17\x1e\x0e\x19\x01\xfb\x0f\x1c\x15\x14\x1b\x0e\x26\
-\x3c\x44\x1e\x38\x43\x09\x0f\x0c\x07\x07\x0a\x07\x16\x17\x0c\x18\
-\x0b\x20\x28\x12\x11\x21\x18\x12\x23\x17\x4f\x4e\x29\x3a\x20\x02\
-\x05\x06\x09\x05\x20\x2a\x15\x03\x05\x0a\x07\x24\x21\x2b\x37\x22\
-\x0e\x1e\x15\xdd\x0a\x0a\x0c\x11\x09\x11\x1b\xbd\x06\x0b\x0f\x09\
-\x03\x06\x05\x05\x09\x08\x11\x10\x00\x00\x03\x00\x1e\xff\xf8\x02\
-\x1b\x02\xd8\x00\x13\x00\x23\x00\x34\x00\x00\x45\x22\x2e\x02\x37\
-\x3e\x03\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x36\x36\x35\x34\
-\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x07\x22\x26\x26\x35\x11\
-\x34\x36\x36\x33\x32\x16\x16\x07\x11\x06\x06\x01\x34\x31\x48\x2e\
-\x16\x01\x01\x17\x2e\x46\x30\x2c\x53\x42\x26\x26\x41\x53\x45\x14\
-\x21\x14\x13\x21\x14\x14\x21\x13\x14\x20\x91\x2d\x26\x07\x08\x26\
-\x2d\x2d\x24\x06\x01\x07\x27\x07\x2b\x49\x5b\x31\x30\x5a\x46\x29\
-\x2a\x47\x5a\x30\x32\x5c\x47\x29\xb4\x14\x21\x13\x14\x21\x13\x14\
-\x20\x14\x13\x21\x14\xb5\x1b\x2a\x16\x02\x2b\x17\x29\x1a\x1b\x2a\
-\x16\xfd\xad\x1a\x18\x00\x01\x00\x19\xff\xf2\x01\xe0\x01\xf9\x00\
-\x34\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\x17\
-\x16\x16\x15\x14\x06\x07\x06\x23\x22\x2e\x02\x23\x22\x06\x06\x15\
-\x14\x16\x16\x33\x32\x36\x36\x33\x36\x36\x33\x32\x16\x17\x16\x16\
-\x06\x07\x0e\x02\x01\x1f\x29\x5b\x50\x32\x32\x4f\x5b\x28\x26\x38\
-\x24\x08\x14\x23\x0a\x0b\x24\x24\x10\x18\x14\x17\x11\x14\x22\x14\
-\x14\x21\x13\x0e\x13\x0a\x01\x0e\x19\x0d\x11\x24\x16\x15\x05\x1c\
-\x1d\x03\x23\x3a\x0e\x21\x41\x62\x41\x40\x61\x40\x21\x10\x13\x05\
-\x0c\x1f\x1a\x0d\x1b\x11\x37\x0b\x0e\x0b\x14\x21\x15\x15\x22\x14\
-\x06\x07\x08\x0e\x19\x1c\x1a\x2d\x27\x12\x02\x13\x12\xff\xff\x00\
-\x19\xff\x40\x01\xe0\x01\xf9\x04\x26\x00\x47\x00\x00\x00\x07\x01\
-\x38\x00\x78\x00\x00\x00\x03\x00\x0f\xff\xf8\x02\x0c\x02\xd8\x00\
-\x13\x00\x23\x00\x34\x00\x00\x57\x22\x2e\x02\x35\x34\x3e\x02\x33\
-\x32\x1e\x02\x17\x16\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\
-\x22\x06\x06\x15\x14\x16\x16\x17\x22\x26\x27\x11\x34\x36\x36\x33\
-\x32\x16\x16\x15\x11\x14\x06\x06\xf6\x2d\x53\x41\x26\x26\x42\x53\
-\x2c\x30\x46\x2e\x17\x01\x01\x16\x2e\x47\x1a\x13\x20\x14\x13\x20\
-\x15\x14\x21\x13\x14\x22\xb7\x28\x28\x07\x05\x24\x2d\x2e\x25\x08\
-\x08\x25\x07\x29\x47\x5c\x32\x30\x5a\x47\x2a\x29\x46\x5a\x30\x31\
-\x5b\x49\x2b\xb4\x14\x21\x13\x14\x20\x14\x13\x21\x14\x13\x21\x14\
-\xb5\x18\x1a\x02\x53\x16\x2a\x1b\x1a\x29\x17\xfd\xd5\x16\x2a\x1b\
-\x00\x00\x02\x00\x18\xff\xee\x02\x1f\x02\xf9\x00\x3a\x00\x4a\x00\
-\x00\x41\x16\x16\x06\x07\x07\x1e\x03\x07\x0e\x03\x23\x22\x2e\x02\
-\x35\x34\x3e\x02\x33\x32\x16\x17\x26\x26\x27\x07\x06\x06\x26\x27\
-\x26\x26\x36\x37\x37\x26\x26\x35\x34\x36\x37\x36\x36\x33\x32\x16\
-\x16\x17\x37\x36\x36\x16\x03\x32\x36\x36\x35\x34\x26\x26\x23\x22\
-\x06\x06\x15\x14\x16\x16\x01\x67\x12\x0d\x04\x09\x11\x32\x48\x2c\
-\x11\x05\x03\x2b\x47\x59\x32\x2d\x5b\x4c\x2e\x2d\x49\x55\x28\x1f\
-\x2f\x10\x12\x2b\x17\x14\x0b\x13\x15\x0e\x14\x0f\x06\x0b\x0c\x16\
-\x13\x07\x07\x0b\x1d\x11\x0b\x14\x13\x08\x11\x0b\x12\x16\x3d\x0f\
-\x25\x1c\x14\x25\x18\x15\x23\x15\x1b\x25\x02\xeb\x0b\x15\x16\x0f\
-\x16\x26\x5f\x6f\x7a\x41\x31\x58\x44\x26\x24\x43\x5e\x3a\x38\x5b\
-\x42\x24\x0a\x08\x19\x27\x0d\x1c\x10\x0b\x06\x07\x0c\x14\x16\x0f\
-\x10\x0b\x13\x11\x0a\x16\x0d\x17\x15\x06\x08\x05\x19\x10\x0f\x02\
-\xfd\xaa\x0e\x23\x1e\x18\x23\x13\x15\x23\x17\x1e\x22\x0e\x00\x00\
-\x02\x00\x0f\xff\xec\x02\x08\x01\xfe\x00\x25\x00\x31\x00\x00\x45\
-\x22\x2e\x02\x35\x34\x36\x36\x33\x32\x1e\x02\x15\x14\x06\x23\x23\
-\x1e\x02\x33\x32\x3e\x03\x33\x32\x16\x17\x16\x16\x15\x14\x06\x06\
-\x03\x33\x32\x36\x35\x34\x26\x26\x23\x22\x06\x06\x01\x20\x4b\x68\
-\x40\x1e\x46\x7c\x50\x3e\x58\x37\x1a\x38\x2c\xd5\x04\x19\x26\x16\
-\x16\x22\x19\x15\x11\x08\x12\x1e\x0c\x07\x06\x31\x5c\x94\x70\x0e\
-\x0d\x0f\x1a\x12\x18\x24\x13\x14\x31\x4f\x5c\x2b\x4f\x78\x44\x28\
-\x3e\x46\x1e\x39\x3c\x10\x17\x0d\x05\x08\x08\x05\x18\x18\x0d\x17\
-\x0a\x1e\x28\x15\x01\x31\x0c\x0c\x0d\x12\x09\x13\x1d\xff\xff\x00\
-\x0f\xff\xec\x02\x08\x02\xd9\x06\x26\x00\x4b\x00\x00\x00\x07\x01\
-\x30\x00\x1c\x00\x00\xff\xff\x00\x0f\xff\xec\x02\x08\x02\xd8\x06\
-\x26\x00\x4b\x00\x00\x00\x06\x01\x32\xef\x00\xff\xff\x00\x0f\xff\
-\xec\x02\x08\x02\xd8\x06\x26\x00\x4b\x00\x00\x00\x07\x01\x2d\x00\
-\x08\x00\x00\xff\xff\x00\x0f\xff\xec\x02\x08\x02\xdc\x06\x26\x00\
-\x4b\x00\x00\x00\x06\x01\x2f\x37\x00\x00\x02\x00\x05\xff\xf6\x01\
-\x9e\x02\xda\x00\x1b\x00\x2d\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x0e\x02\x15\x11\
-\x14\x06\x06\x03\x33\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\x23\
-\x26\x26\x35\x34\x36\xb4\x2c\x26\x08\x18\x33\x4f\x37\x16\x2a\x1b\
-\x1c\x2a\x16\x07\x0a\x06\x03\x08\x27\x9c\x75\x8a\x16\x29\x1b\x1b\
-\x29\x17\x7f\x83\x22\x1a\x20\x0a\x1b\x2b\x16\x01\xc3\x20\x45\x3b\
-\x25\x08\x25\x2e\x2d\x26\x07\x02\x03\x06\x03\xfe\x39\x16\x29\x1b\
-\x01\xf7\x05\x08\x26\x2e\x2a\x26\x0a\x03\x02\x28\x2e\x2b\x2b\x00\
-\x03\x00\x0e\xff\x24\x02\x04\x01\xf5\x00\x22\x00\x35\x00\x45\x00\
-\x00\x45\x22\x2e\x02\x35\x34\x36\x37\x36\x36\x33\x32\x1e\x02\x33\
-\x32\x3e\x02\x35\x11\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\
-\x27\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x06\
-\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\
-\x01\x09\x23\x49\x3e\x26\x0f\x0f\x10\x18\x11\x0f\x17\x18\x23\x1b\
-\x0f\x1a\x13\x0c\x04\x2a\x2b\x2c\x24\x07\x2d\x4a\x58\x45\x2c\x51\
-\x40\x25\x25\x41\x51\x2b\x2c\x39\x21\x0e\x19\x40\x23\x13\x1f\x13\
-\x13\x20\x14\x13\x20\x13\x14\x21\xdc\x13\x20\x25\x12\x14\x22\x10\
-\x11\x14\x0e\x11\x0e\x0d\x17\x1f\x12\x01\x9c\x1e\x1a\x1a\x29\x16\
-\xfe\x7f\x3b\x5c\x3f\x21\xe2\x28\x46\x59\x31\x2f\x58\x45\x29\x24\
-\x42\x5b\x37\x4c\x6e\x3b\xb0\x14\x20\x12\x14\x20\x13\x14\x20\x13\
-\x12\x20\x14\x00\x01\x00\x1c\xff\xf7\x02\x17\x02\xd8\x00\x2a\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x36\x36\x33\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\
-\x35\x34\x26\x26\x23\x22\x06\x07\x15\x14\x06\x06\x76\x2d\x26\x07\
-\x08\x26\x2d\x2d\x25\x08\x0f\x33\x22\x40\x66\x3c\x08\x25\x2e\x2c\
-\x27\x08\x10\x1e\x15\x1b\x2e\x04\x08\x25\x09\x1b\x2a\x16\x02\x2c\
-\x17\x29\x1a\x1b\x29\x17\xb6\x0e\x1d\x43\x72\x48\xa4\x16\x29\x1b\
-\x1a\x2a\x18\xa3\x16\x1f\x12\x22\x16\xb4\x16\x2a\x1a\x00\x02\x00\
-\x23\xff\xf7\x00\xd8\x02\xd8\x00\x11\x00\x21\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x03\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x7d\
-\x2d\x26\x07\x08\x26\x2d\x2d\x25\x08\x08\x25\x2e\x2d\x26\x07\x08\
-\x26\x2d\x2d\x25\x08\x08\x25\x09\x1b\x2a\x16\x01\x46\x16\x29\x1b\
-\x1b\x2a\x17\xfe\xbb\x16\x2a\x1a\x02\x2c\x1b\x2a\x16\x17\x29\x1a\
-\x1b\x2a\x16\x16\x2a\x1a\x00\x00\x01\x00\x1c\xff\xf7\x00\xd1\x01\
-\xf2\x00\x11\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x76\x2d\x26\x07\x08\x26\x2d\x2d\x25\
-\x08\x08\x25\x09\x1b\x2a\x16\x01\x46\x16\x29\x1b\x1b\x2a\x17\xfe\
-\xbb\x16\x2a\x1a\x00\xff\xff\x00\x05\xff\xf7\x01\x34\x02\xd9\x06\
-\x26\x00\x54\x00\x00\x00\x06\x01\x30\x87\x00\xff\xff\xff\xad\xff\
-\xf7\x01\x3d\x02\xd8\x06\x26\x00\x54\x00\x00\x00\x07\x01\x32\xff\
-\x5a\x00\x00\xff\xff\xff\xa0\xff\xf7\x01\x54\x02\xd8\x06\x26\x00\
-\x54\x00\x00\x00\x07\x01\x2d\xff\x73\x00\x00\xff\xff\xff\xd1\xff\
-\xf7\x00\xfe\x02\xdc\x06\x26\x00\x54\x00\x00\x00\x06\x01\x2f\xa2\
-\x00\x00\x02\xff\x7c\xff\x25\x00\xce\x02\xd7\x00\x1b\x00\x27\x00\
-\x00\x47\x22\x26\x26\x35\x34\x36\x36\x33\x32\x3e\x02\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\x13\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x2c\x15\x28\x1b\x1b\x29\x16\x08\x18\
-\x17\x0f\x08\x26\x2c\x2c\x25\x07\x2e\x4a\x58\x76\x33\x25\x26\x34\
-\x33\x25\x26\xdb\x08\x25\x2d\x2a\x25\x09\x05\x10\x1e\x19\x01\x80\
-\x14\x26\x19\x1b\x29\x16\xfe\x81\x3c\x5d\x3f\x20\x03\x00\x26\x34\
-\x33\x25\x25\x33\x34\x26\x00\x00\x01\x00\x23\xff\xed\x01\xf9\x02\
-\xda\x00\x24\x00\x00\x65\x16\x16\x07\x06\x06\x26\x27\x27\x15\x14\
-\x06\x06\x23\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\
-\x11\x37\x36\x36\x16\x17\x16\x06\x07\x07\x01\xcf\x25\x05\x24\x1b\
-\x27\x26\x1a\x7b\x08\x25\x2e\x2d\x26\x07\x08\x26\x2d\x2d\x25\x08\
-\x55\x18\x2a\x29\x17\x27\x03\x24\x51\x9c\x21\x3b\x26\x1c\x11\x11\
-\x17\x73\x37\x16\x2a\x1a\x1b\x2a\x16\x02\x2d\x17\x29\x1b\x1b\x2a\
-\x17\xfe\xec\x53\x17\x11\x0f\x19\x2a\x34\x24\x47\x00\x00\x01\x00\
-\x23\xff\xf7\x01\x32\x02\xda\x00\x1c\x00\x00\x57\x22\x2e\x03\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\xf2\x2e\x45\x30\x1e\x0e\x08\x26\x2d\x2d\x25\
-\x08\x01\x05\x0b\x0a\x0d\x1d\x15\x15\x1e\x09\x08\x18\x2d\x49\x37\
-\x01\xbb\x17\x29\x1b\x1b\x2a\x17\xfe\x51\x0f\x11\x08\x01\x07\x23\
-\x2b\x2d\x26\x07\x00\x00\x02\xff\xff\xff\xf7\x01\xb2\x02\xda\x00\
-\x0d\x00\x2a\x00\x00\x77\x06\x26\x27\x26\x36\x37\x25\x36\x16\x17\
-\x16\x06\x07\x03\x22\x2e\x03\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x1e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x51\x1d\x1f\
-\x0b\x0b\x15\x25\x01\x28\x1f\x20\x0a\x08\x15\x22\x2f\x2e\x45\x30\
-\x1e\x0e\x08\x26\x2d\x2d\x25\x08\x01\x05\x0b\x0a\x0d\x1d\x15\x15\
-\x1e\xfd\x08\x16\x23\x25\x25\x0a\x50\x08\x15\x23\x25\x26\x09\xfe\
-\xa9\x08\x18\x2d\x49\x37\x01\xbb\x17\x29\x1b\x1b\x2a\x17\xfe\x51\
-\x0f\x11\x08\x01\x07\x23\x2b\x2d\x26\x07\x00\x00\x01\x00\x1c\xff\
-\xf7\x02\xfc\x01\xf4\x00\x46\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x15\x27\x30\x3e\x02\x33\x32\x16\x16\x17\x3e\
-\x02\x33\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\
-\x34\x26\x26\x23\x22\x06\x06\x15\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x35\x34\x26\x26\x23\x22\x06\x06\x15\x15\x14\x06\x06\x76\x2d\
-\x26\x07\x08\x26\x2e\x2d\x29\x11\x0f\x1d\x2a\x1b\x1f\x34\x2b\x10\
-\x0b\x26\x35\x21\x3b\x53\x2b\x08\x26\x2e\x2d\x26\x07\x0b\x15\x10\
-\x11\x15\x09\x08\x26\x2e\x2d\x26\x07\x0a\x15\x11\x14\x14\x07\x08\
-\x26\x09\x1b\x2a\x16\x01\x47\x17\x29\x1a\x23\x27\x05\x15\x1c\x15\
-\x10\x21\x18\x0d\x22\x1a\x3c\x72\x51\xa3\x16\x2a\x1b\x1c\x2a\x16\
-\xa3\x18\x1f\x10\x0e\x1f\x1b\xa3\x16\x2a\x1b\x1c\x2a\x16\xa3\x18\
-\x20\x0f\x14\x20\x13\xa5\x16\x2a\x1a\x00\x01\x00\x1e\xff\xf8\x02\
-\x1a\x01\xf3\x00\x2f\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x32\x16\x16\x06\x17\x07\x26\x3e\x02\x33\x32\x1e\x02\x15\x15\
-\x14\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\x26\x23\x22\x06\x06\
-\x15\x15\x14\x06\x06\x78\x2d\x26\x07\x08\x26\x2d\x29\x25\x0a\x01\
-\x02\x08\x01\x19\x29\x2f\x15\x32\x4c\x33\x1a\x08\x25\x2e\x2e\x26\
-\x08\x11\x1f\x17\x16\x21\x12\x08\x25\x08\x1b\x2a\x16\x01\x49\x16\
-\x28\x19\x15\x1e\x19\x03\x06\x0f\x1e\x19\x0f\x26\x45\x5c\x36\xa4\
-\x16\x2a\x1a\x1b\x2a\x16\xa3\x17\x20\x11\x12\x20\x16\xa4\x16\x2a\
-\x1a\xff\xff\x00\x1e\xff\xf8\x02\x1a\x02\xd8\x06\x26\x00\x5e\x00\
-\x00\x00\x06\x01\x36\x15\x00\x00\x02\x00\x0e\xff\xee\x02\x20\x01\
-\xff\x00\x12\x00\x22\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\
-\x22\x06\x06\x15\x14\x16\x16\x01\x18\x2e\x5e\x4f\x2f\x2a\x49\x5f\
-\x36\x4a\x78\x48\x30\x4e\x5d\x2f\x0f\x27\x1d\x15\x26\x19\x16\x24\
-\x16\x1c\x26\x12\x25\x45\x61\x3c\x37\x60\x49\x2a\x47\x78\x4a\x3f\
-\x62\x44\x23\xb7\x0f\x24\x1f\x19\x24\x14\x15\x25\x18\x1e\x24\x0f\
-\x00\xff\xff\x00\x0e\xff\xee\x02\x20\x02\xd9\x06\x26\x00\x60\x00\
-\x00\x00\x07\x01\x30\x00\x27\x00\x00\xff\xff\x00\x0e\xff\xee\x02\
-\x20\x02\xd8\x06\x26\x00\x60\x00\x00\x00\x06\x01\x32\xfa\x00\xff\
-\xff\x00\x0e\xff\xee\x02\x20\x02\xd8\x06\x26\x00\x60\x00\x00\x00\
-\x07\x01\x2d\x00\x13\x00\x00\xff\xff\x00\x0e\xff\xee\x02\x20\x02\
-\xdc\x06\x26\x00\x60\x00\x00\x00\x06\x01\x2f\x42\x00\x00\x04\x00\
-\x0e\xff\x62\x02\x20\x02\x89\x00\x09\x00\x12\x00\x25\x00\x35\x00\
-\x00\x41\x27\x37\x36\x36\x17\x16\x16\x06\x07\x01\x26\x26\x37\x37\
-\x17\x07\x06\x06\x37\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\
-\x15\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\
-\x15\x14\x16\x16\x01\xca\x9c\x31\x14\x2f\x2d\x20\x19\x03\x0c\xfe\
-\x66\x28\x19\x15\x32\x9a\x30\x14\x2d\x8a\x2e\x5e\x4f\x2f\x2a\x49\
-\x5f\x36\x4a\x78\x48\x30\x4e\x5d\x2f\x0f\x27\x1d\x15\x26\x19\x16\
-\x24\x16\x1c\x26\x01\xa4\x4a\x65\x29\x0d\x14\x10\x1d\x26\x1d\xfd\
-\x71\x13\x2f\x29\x66\x4a\x64\x2a\x0d\x8c\x25\x45\x61\x3c\x37\x60\
-\x49\x2a\x47\x78\x4a\x3f\x62\x44\x23\xb7\x0f\x24\x1f\x19\x24\x14\
-\x15\x25\x18\x1e\x24\x0f\x00\xff\xff\x00\x0e\xff\xee\x02\x20\x02\
-\xd8\x06\x26\x00\x60\x00\x00\x00\x06\x01\x36\x10\x00\x00\x04\x00\
-\x0e\xff\xeb\x03\x62\x01\xff\x00\x12\x00\x22\x00\x48\x00\x54\x00\
-\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x0e\
-\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\
-\x16\x05\x22\x2e\x02\x35\x34\x36\x36\x33\x32\x1e\x02\x15\x14\x06\
-\x23\x23\x1e\x02\x33\x32\x3e\x03\x33\x32\x16\x17\x16\x16\x15\x14\
-\x06\x06\x03\x33\x32\x36\x35\x34\x26\x26\x23\x22\x06\x06\x01\x18\
-\x2e\x5e\x4f\x2f\x2a\x49\x5f\x36\x4a\x78\x48\x30\x4e\x5d\x2f\x0f\
-\x27\x1d\x15\x26\x19\x16\x24\x16\x1c\x26\x01\x73\x4b\x68\x40\x1e\
-\x46\x7c\x50\x3e\x58\x37\x1a\x38\x2c\xd2\x04\x1a\x24\x14\x16\x22\
-\x19\x15\x11\x08\x12\x1e\x0c\x07\x06\x31\x5c\x93\x6a\x0e\x0c\x0c\
-\x18\x11\x10\x22\x19\x12\x25\x45\x61\x3c\x37\x60\x49\x2a\x47\x78\
-\x4a\x3f\x62\x44\x23\xb7\x0f\x24\x1f\x19\x24\x14\x15\x25\x18\x1e\
-\x24\x0f\xba\x31\x50\x5c\x2b\x4f\x78\x44\x28\x3e\x46\x1e\x39\x45\
-\x0b\x14\x0b\x05\x07\x08\x05\x18\x18\x0d\x17\x0a\x1f\x29\x14\x01\
-\x33\x0a\x0a\x0c\x11\x09\x11\x1b\x00\x00\x03\x00\x1a\xff\x23\x02\
-\x13\x01\xf3\x00\x13\x00\x24\x00\x34\x00\x00\x65\x22\x2e\x02\x37\
-\x3e\x03\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\x22\x26\x26\x35\x11\
-\x34\x36\x36\x33\x32\x16\x17\x11\x16\x06\x06\x13\x32\x36\x36\x35\
-\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\x2c\x31\x48\x2e\
-\x16\x01\x01\x17\x2e\x46\x30\x2c\x53\x42\x26\x26\x41\x53\xe6\x2c\
-\x26\x07\x07\x25\x2c\x23\x2e\x0a\x02\x09\x26\x74\x14\x21\x14\x13\
-\x21\x14\x14\x21\x13\x14\x20\x03\x28\x45\x58\x31\x30\x5a\x46\x29\
-\x2a\x47\x5a\x30\x32\x59\x43\x26\xe0\x1a\x28\x16\x02\x1f\x16\x28\
-\x1b\x13\x14\xfd\xb0\x16\x29\x1a\x01\x8a\x14\x21\x13\x14\x21\x13\
-\x14\x20\x14\x13\x21\x14\x00\x00\x03\x00\x1c\xff\x25\x02\x10\x02\
-\xe5\x00\x13\x00\x25\x00\x35\x00\x00\x65\x22\x2e\x02\x37\x3e\x03\
-\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\x22\x26\x26\x35\x11\x34\x36\
-\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x13\x32\x36\x36\x35\x34\
-\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\x29\x31\x48\x2e\x16\
-\x01\x01\x17\x2e\x46\x30\x2c\x53\x42\x26\x26\x41\x53\xe6\x2a\x23\
-\x07\x07\x24\x2a\x2a\x23\x08\x08\x23\x76\x14\x21\x14\x13\x21\x14\
-\x15\x20\x13\x14\x20\x03\x28\x45\x58\x31\x30\x5a\x46\x29\x2a\x47\
-\x5a\x30\x32\x59\x43\x26\xde\x1b\x29\x16\x03\x0d\x16\x29\x1a\x1b\
-\x29\x16\xfc\xf2\x16\x28\x1a\x01\x88\x14\x21\x13\x14\x21\x13\x14\
-\x20\x14\x13\x21\x14\x00\x03\x00\x0a\xff\x23\x02\x03\x01\xf3\x00\
-\x13\x00\x23\x00\x35\x00\x00\x77\x22\x2e\x02\x35\x34\x3e\x02\x33\
-\x32\x1e\x02\x17\x16\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\
-\x22\x06\x06\x15\x14\x16\x16\x13\x22\x26\x26\x37\x11\x3e\x02\x33\
-\x32\x16\x16\x15\x11\x14\x06\x06\xf1\x2d\x53\x41\x26\x26\x42\x53\
-\x2c\x30\x46\x2e\x17\x01\x01\x16\x2e\x47\x1a\x13\x20\x14\x13\x20\
-\x15\x14\x21\x13\x14\x22\xb4\x2c\x27\x08\x01\x07\x18\x25\x17\x2c\
-\x25\x07\x07\x25\x03\x26\x43\x59\x32\x30\x5a\x47\x2a\x29\x46\x5a\
-\x30\x31\x58\x45\x28\xaa\x14\x21\x13\x14\x20\x14\x13\x21\x14\x13\
-\x21\x14\xfe\x76\x1a\x29\x16\x02\x50\x0e\x11\x08\x1b\x28\x16\xfd\
-\xe1\x16\x28\x1a\x00\x00\x01\x00\x1e\xff\xf7\x01\xa6\x01\xf8\x00\
-\x2a\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x27\x30\x3e\x02\x33\x32\x1e\x03\x15\x14\x06\x23\x22\x2e\x02\
-\x23\x22\x0e\x02\x15\x15\x14\x06\x06\x78\x2d\x26\x07\x08\x26\x2d\
-\x2c\x25\x08\x10\x10\x1f\x2b\x1b\x09\x1b\x1f\x1b\x11\x2b\x23\x13\
-\x10\x07\x09\x0c\x0f\x19\x13\x0a\x08\x26\x09\x1b\x2b\x16\x01\x46\
-\x17\x29\x1a\x18\x1d\x08\x06\x12\x18\x12\x03\x08\x10\x1a\x13\x32\
-\x46\x05\x05\x05\x07\x0e\x13\x0b\xc3\x16\x2a\x1a\x00\x00\x01\x00\
-\x0f\xff\xee\x01\xba\x01\xfd\x00\x42\x00\x00\x57\x22\x2e\x02\x35\
-\x34\x36\x36\x37\x36\x36\x33\x32\x1e\x02\x33\x32\x36\x35\x34\x2e\
-\x03\x27\x2e\x03\x35\x34\x36\x36\x33\x32\x1e\x02\x17\x16\x16\x07\
-\x06\x06\x23\x22\x26\x26\x23\x22\x06\x06\x15\x14\x1e\x02\x17\x1e\
-\x03\x15\x14\x06\xdb\x1c\x45\x41\x2a\x09\x10\x0c\x07\x13\x0d\x12\
-\x22\x22\x25\x15\x13\x13\x0d\x17\x1e\x22\x12\x17\x2c\x23\x15\x30\
-\x5e\x45\x11\x22\x23\x23\x12\x25\x02\x16\x0c\x19\x0d\x10\x26\x2a\
-\x15\x0c\x11\x08\x0f\x19\x21\x13\x1a\x37\x2e\x1c\x71\x12\x0d\x19\
-\x22\x16\x0a\x19\x1e\x11\x0a\x0a\x0f\x13\x0f\x08\x08\x08\x0a\x07\
-\x06\x08\x06\x07\x17\x26\x36\x27\x34\x46\x24\x04\x08\x0d\x08\x10\
-\x39\x1f\x13\x13\x12\x12\x05\x09\x06\x0b\x0d\x08\x06\x03\x04\x11\
-\x20\x38\x2d\x55\x58\xff\xff\x00\x0f\xff\xee\x01\xba\x02\xdb\x06\
-\x26\x00\x6c\x00\x00\x00\x06\x01\x33\xca\x00\x00\x01\x00\x1c\xff\
-\xd9\x02\x3f\x02\xc5\x00\x47\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x02\x15\x14\x1e\x03\x15\x14\
-\x0e\x02\x23\x22\x26\x27\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\
-\x33\x32\x36\x36\x35\x34\x2e\x03\x35\x34\x3e\x02\x35\x34\x26\x26\
-\x23\x22\x0e\x02\x15\x11\x14\x06\x06\x75\x2c\x26\x07\x35\x70\x57\
-\x45\x5f\x30\x18\x1f\x18\x21\x30\x30\x21\x16\x2d\x44\x2d\x11\x29\
-\x17\x1f\x31\x0d\x1b\x14\x10\x1e\x1d\x0c\x08\x0a\x05\x1f\x2e\x2f\
-\x1f\x15\x1a\x15\x07\x0f\x0d\x13\x1c\x13\x09\x08\x25\x27\x1b\x29\
-\x16\x01\xaf\x52\x64\x2d\x20\x3d\x2d\x2d\x3b\x26\x18\x09\x11\x19\
-\x1e\x2a\x43\x33\x2c\x42\x2c\x16\x04\x03\x05\x1b\x26\x17\x32\x23\
-\x0c\x0d\x09\x12\x0f\x0a\x16\x1c\x28\x36\x25\x28\x30\x1e\x18\x10\
-\x05\x06\x03\x08\x0f\x18\x10\xfe\x47\x16\x28\x1a\x00\x00\x02\x00\
-\x0a\xff\xf7\x01\xa3\x02\x9b\x00\x1b\x00\x2d\x00\x00\x45\x22\x2e\
-\x02\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\
-\x32\x16\x16\x15\x14\x06\x06\x03\x33\x37\x32\x16\x16\x15\x14\x06\
-\x06\x23\x27\x23\x26\x26\x35\x34\x36\x01\x2e\x35\x4e\x33\x19\x08\
-\x26\x2d\x2c\x26\x08\x03\x06\x0a\x08\x1a\x29\x17\x1c\x2a\xf9\x75\
-\x8a\x16\x29\x1b\x1b\x29\x17\x7f\x83\x22\x1a\x20\x09\x18\x32\x4c\
-\x33\x01\x84\x17\x27\x19\x1b\x2a\x16\xfe\x89\x0b\x0f\x08\x04\x08\
-\x22\x28\x2d\x26\x07\x01\xf6\x05\x08\x26\x2e\x2a\x26\x0a\x03\x02\
-\x28\x2e\x2b\x2b\x00\x00\x01\x00\x1e\xff\xf8\x02\x1a\x01\xf4\x00\
-\x2f\x00\x00\x45\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x16\x16\x33\x32\x36\x36\x35\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x23\x22\x2e\x02\x35\x17\x30\x0e\x02\
-\x01\x01\x30\x53\x3e\x22\x08\x26\x2d\x2e\x25\x08\x11\x21\x16\x16\
-\x20\x12\x08\x26\x2d\x2e\x25\x08\x08\x26\x2d\x21\x25\x10\x03\x11\
-\x10\x1f\x2b\x07\x26\x45\x5c\x36\xa3\x17\x29\x1b\x1b\x2a\x17\xa2\
-\x17\x20\x11\x12\x20\x16\xa4\x17\x29\x1a\x1b\x2a\x16\xfe\xb7\x16\
-\x28\x1a\x0f\x17\x17\x08\x05\x13\x19\x13\x00\xff\xff\x00\x1e\xff\
-\xf8\x02\x1a\x02\xd9\x06\x26\x00\x70\x00\x00\x00\x07\x01\x30\x00\
-\x2c\x00\x00\xff\xff\x00\x1e\xff\xf8\x02\x1a\x02\xd8\x06\x26\x00\
-\x70\x00\x00\x00\x06\x01\x32\xff\x00\xff\xff\x00\x1e\xff\xf8\x02\
-\x1a\x02\xd8\x06\x26\x00\x70\x00\x00\x00\x07\x01\x2d\x00\x18\x00\
-\x00\xff\xff\x00\x1e\xff\xf8\x02\x1a\x02\xdc\x06\x26\x00\x70\x00\
-\x00\x00\x06\x01\x2f\x47\x00\x00\x01\x00\x09\xff\xf2\x02\x36\x02\
-\x01\x00\x15\x00\x00\x45\x22\x26\x27\x03\x26\x36\x37\x36\x16\x17\
-\x17\x37\x36\x36\x17\x16\x16\x07\x03\x06\x06\x01\x20\x1c\x29\x0b\
-\xb1\x16\x10\x2e\x2f\x36\x16\x5e\x5e\x17\x36\x2e\x2f\x0e\x15\xb1\
-\x0b\x28\x0e\x16\x16\x01\x51\x2b\x3a\x16\x17\x0e\x32\xd6\xd6\x34\
-\x0c\x17\x17\x3b\x29\xfe\xaf\x16\x16\x00\x01\x00\x06\xff\xf4\x02\
-\xe6\x02\x03\x00\x2c\x00\x00\x57\x22\x26\x26\x27\x03\x26\x36\x36\
-\x37\x36\x16\x17\x17\x37\x3e\x02\x33\x32\x16\x16\x17\x17\x37\x36\
-\x36\x17\x16\x16\x07\x03\x0e\x02\x23\x22\x26\x26\x27\x27\x07\x0e\
-\x02\xeb\x20\x23\x10\x05\x85\x08\x01\x1b\x1d\x2e\x3b\x0d\x36\x2f\
-\x04\x10\x23\x1e\x21\x24\x12\x03\x2e\x30\x11\x37\x2d\x2a\x20\x12\
-\x86\x05\x10\x22\x1f\x20\x22\x11\x06\x2e\x2e\x08\x0e\x20\x0c\x1a\
-\x22\x0b\x01\x47\x1c\x27\x1c\x0b\x14\x11\x28\x95\x81\x0a\x1e\x19\
-\x19\x1f\x0a\x80\x85\x2c\x20\x14\x13\x35\x27\xfe\xbb\x0c\x22\x19\
-\x16\x21\x10\x7b\x7b\x15\x20\x12\x00\x00\x02\x00\x06\xff\xed\x02\
-\x14\x01\xff\x00\x10\x00\x22\x00\x00\x41\x16\x16\x06\x07\x01\x06\
-\x06\x26\x27\x26\x26\x36\x37\x01\x36\x36\x05\x36\x36\x16\x17\x01\
-\x16\x16\x06\x07\x06\x06\x26\x27\x01\x26\x26\x36\x01\xeb\x1a\x0f\
-\x11\x18\xfe\xc1\x17\x26\x27\x1a\x19\x0f\x12\x16\x01\x3f\x25\x34\
-\xfe\x68\x19\x27\x27\x17\x01\x3f\x17\x12\x0e\x1b\x1a\x26\x25\x19\
-\xfe\xc1\x17\x11\x0f\x01\xd7\x1a\x28\x26\x18\xfe\xbe\x17\x11\x10\
-\x18\x1a\x28\x27\x16\x01\x43\x23\x03\x26\x19\x0f\x10\x18\xfe\xbd\
-\x17\x26\x28\x1a\x19\x0f\x11\x17\x01\x42\x17\x26\x29\x00\x02\x00\
-\x06\xff\x14\x02\x3c\x02\x03\x00\x0d\x00\x16\x00\x00\x57\x26\x26\
-\x37\x13\x36\x36\x17\x16\x16\x07\x03\x06\x06\x37\x03\x26\x36\x37\
-\x36\x16\x17\x17\xbd\x31\x10\x15\xf3\x15\x30\x32\x30\x11\x13\xf5\
-\x14\x31\x1f\xee\x1a\x0a\x2b\x2f\x33\x1b\xa2\xd6\x16\x35\x2b\x02\
-\x20\x2f\x12\x14\x16\x32\x2a\xfd\xdb\x2f\x13\xf2\x01\x68\x28\x35\
-\x1b\x1d\x0d\x29\xf5\xff\xff\x00\x06\xff\x14\x02\x3c\x02\xd9\x06\
-\x26\x00\x78\x00\x00\x00\x07\x01\x30\x00\x33\x00\x00\xff\xff\x00\
-\x06\xff\x14\x02\x3c\x02\xd8\x06\x26\x00\x78\x00\x00\x00\x07\x01\
-\x2d\x00\x1f\x00\x00\x00\x01\x00\x0e\xff\xf7\x02\x13\x01\xf3\x00\
-\x21\x00\x00\x57\x22\x26\x35\x34\x36\x37\x37\x23\x22\x26\x26\x35\
-\x34\x36\x36\x33\x21\x32\x16\x15\x14\x06\x07\x07\x33\x32\x16\x16\
-\x15\x14\x06\x06\x23\x68\x25\x35\x0d\x0e\xc0\x6b\x16\x2a\x1c\x1c\
-\x2a\x16\x01\x2f\x25\x35\x0e\x0c\xbb\x87\x17\x29\x1a\x1b\x29\x17\
-\x09\x36\x25\x12\x21\x0d\xac\x08\x26\x2d\x2d\x25\x08\x34\x25\x13\
-\x23\x0b\xac\x08\x27\x2d\x2d\x26\x07\xff\xff\x00\x0e\xff\xf7\x02\
-\x13\x02\xdb\x06\x26\x00\x7b\x00\x00\x00\x06\x01\x33\xf6\x00\x00\
-\x01\x00\x05\xff\xf7\x02\xe6\x02\xdb\x00\x5a\x00\x00\x57\x22\x26\
-\x26\x35\x35\x07\x22\x26\x35\x34\x36\x33\x17\x35\x34\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x06\x06\x23\x22\x06\x06\x15\x15\x36\x36\x33\
-\x32\x16\x17\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\
-\x22\x06\x06\x15\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\x22\x26\
-\x27\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x22\x06\x06\x23\x22\
-\x26\x27\x15\x14\x06\x06\xb4\x2c\x26\x08\x18\x21\x1c\x1e\x22\x15\
-\x18\x33\x4f\x37\x16\x2a\x1b\x1c\x2a\x16\x09\x0c\x05\x0d\x2d\x14\
-\x12\x27\x0c\x18\x32\x4f\x37\x16\x2a\x1b\x1b\x2a\x17\x09\x0b\x05\
-\x32\x17\x29\x1b\x1b\x29\x17\x02\x24\x0c\x09\x26\x2d\x2c\x26\x08\
-\x07\x17\x18\x0b\x12\x32\x0e\x08\x27\x09\x1b\x2b\x16\xec\x02\x2b\
-\x30\x2f\x2b\x02\x26\x20\x45\x3b\x25\x08\x25\x2e\x2d\x26\x07\x03\
-\x06\x05\x2a\x02\x02\x02\x01\x27\x20\x45\x3b\x25\x08\x25\x2e\x2d\
-\x26\x07\x03\x06\x05\x29\x04\x08\x26\x2e\x2a\x26\x0a\x02\x01\xef\
-\x16\x29\x1b\x1b\x2b\x16\xec\x01\x01\x02\x01\xef\x16\x29\x1b\x00\
-\x03\x00\x05\xff\xf7\x03\xbd\x02\xdb\x00\x5a\x00\x6c\x00\x7c\x00\
-\x00\x57\x22\x26\x26\x35\x35\x07\x22\x26\x35\x34\x36\x33\x17\x35\
-\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x06\x06\x15\
-\x15\x36\x36\x33\x32\x16\x17\x35\x34\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\x22\x06\x06\x15\x15\x37\x32\x16\x16\x15\x14\x06\
-\x06\x23\x22\x26\x27\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x22\
-\x06\x06\x23\x22\x26\x27\x15\x14\x06\x06\x21\x22\x26\x26\x35\x11\
-\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x03\x22\x26\x26\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\xb4\x2c\x26\x08\
-\x18\x21\x1c\x1e\x22\x15\x18\x33\x4f\x37\x16\x2a\x1b\x1c\x2a\x16\
-\x09\x0c\x05\x0d\x2d\x14\x12\x27\x0c\x18\x32\x4f\x37\x16\x2a\x1b\
-\x1b\x2a\x17\x09\x0b\x05\x32\x17\x29\x1b\x1b\x29\x17\x02\x24\x0c\
-\x09\x26\x2d\x2c\x26\x08\x07\x17\x18\x0b\x12\x32\x0e\x08\x27\x02\
-\x82\x2d\x26\x07\x08\x26\x2d\x2d\x25\x07\x08\x25\x2d\x2d\x26\x07\
-\x08\x26\x2d\x2d\x25\x07\x08\x25\x09\x1b\x2b\x16\xec\x02\x2b\x30\
-\x2f\x2b\x02\x26\x20\x45\x3b\x25\x08\x25\x2e\x2d\x26\x07\x03\x06\
-\x05\x2a\x02\x02\x02\x01\x27\x20\x45\x3b\x25\x08\x25\x2e\x2d\x26\
-\x07\x03\x06\x05\x29\x04\x08\x26\x2e\x2a\x26\x0a\x02\x01\xef\x16\
-\x29\x1b\x1b\x2b\x16\xec\x01\x01\x02\x01\xef\x16\x29\x1b\x1b\x29\
-\x16\x01\x44\x16\x2a\x1b\x1c\x2a\x16\xfe\xbc\x16\x29\x1a\x02\x28\
-\x1c\x2a\x15\x17\x29\x1a\x1b\x2a\x16\x16\x29\x1b\x00\x00\x01\x00\
-\x05\xff\xf7\x02\xf0\x02\xdb\x00\x57\x00\x00\x57\x22\x26\x26\x35\
-\x35\x07\x22\x26\x35\x34\x36\x33\x17\x35\x34\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x23\x22\x06\x06\x15\x15\x36\x36\x33\x32\x16\
-\x17\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x37\x32\x16\x16\x15\
-\x14\x06\x06\x23\x27\x15\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x22\x26\x26\x35\x35\x22\x06\x06\x23\x22\x26\x27\x15\x14\
-\x06\x06\xb4\x2c\x26\x08\x18\x21\x1c\x1e\x22\x15\x18\x33\x4f\x37\
-\x16\x2a\x1b\x1c\x2a\x16\x09\x0c\x05\x0d\x2e\x15\x16\x2c\x0c\x08\
-\x26\x2d\x2c\x25\x08\x34\x17\x29\x1a\x1b\x2a\x16\x33\x05\x0c\x0a\
-\x1a\x29\x17\x1c\x2a\x15\x3f\x5d\x32\x08\x1b\x1d\x0d\x12\x31\x0e\
-\x08\x27\x09\x1b\x2b\x16\xec\x02\x2b\x30\x2f\x2b\x02\x26\x20\x45\
-\x3b\x25\x08\x25\x2e\x2d\x26\x07\x03\x06\x05\x2a\x02\x02\x02\x01\
-\x55\x17\x27\x19\x1b\x2a\x16\x51\x03\x08\x26\x2e\x2d\x26\x07\x03\
-\x76\x0f\x10\x07\x08\x22\x28\x2d\x26\x07\x31\x5a\x3e\x7f\x01\x01\
-\x02\x01\xef\x16\x29\x1b\x00\xff\xff\x00\x05\xff\xf6\x02\x7b\x02\
-\xda\x04\x26\x00\x50\x00\x00\x00\x07\x00\x53\x01\xa3\x00\x00\xff\
-\xff\x00\x05\xff\xf6\x02\xd5\x02\xda\x04\x26\x00\x50\x00\x00\x00\
-\x07\x00\x5b\x01\xa3\x00\x00\x00\x04\xff\x7c\xff\x1f\x01\xd3\x02\
-\xd4\x00\x19\x00\x29\x00\x44\x00\x54\x00\x00\x45\x22\x26\x26\x35\
-\x34\x36\x36\x33\x32\x36\x36\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x13\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x14\x06\x06\x01\x22\x26\x26\x35\x34\x36\x36\x33\x32\x36\
-\x36\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\x13\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x01\
-\x1a\x15\x28\x1b\x0f\x20\x17\x0a\x0a\x04\x07\x25\x2e\x2d\x25\x07\
-\x2c\x52\x23\x2c\x25\x07\x07\x26\x2c\x2d\x25\x08\x08\x25\xfe\x2e\
-\x15\x28\x1b\x1a\x29\x16\x0b\x22\x1a\x07\x25\x2e\x2c\x25\x07\x2e\
-\x4b\x57\x76\x2c\x25\x07\x07\x26\x2c\x2d\x25\x07\x08\x25\xe1\x08\
-\x25\x2d\x1e\x27\x13\x09\x21\x23\x01\x7a\x16\x29\x1a\x1b\x29\x16\
-\xfe\x80\x4e\x6f\x3b\x03\x01\x1b\x2a\x15\x16\x29\x1a\x1b\x29\x16\
-\x16\x29\x1a\xfd\x00\x08\x25\x2d\x2a\x25\x09\x0b\x21\x21\x01\x7a\
-\x16\x29\x1a\x1b\x29\x16\xfe\x80\x3c\x5c\x40\x20\x03\x01\x1b\x29\
-\x16\x16\x29\x1a\x1b\x29\x16\x16\x29\x1a\x00\x00\x02\x00\x1c\xff\
-\xf9\x02\x4c\x02\xdb\x00\x1c\x00\x38\x00\x00\x45\x22\x2e\x03\x35\
-\x03\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x21\x22\x2e\x03\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x16\x16\x23\x32\x16\x16\x15\x14\x06\x06\x01\
-\xef\x29\x42\x31\x21\x11\x01\x08\x26\x2e\x2c\x26\x08\x02\x05\x0b\
-\x09\x21\x28\x12\x14\x29\xfe\xc0\x26\x3b\x2a\x1b\x0d\x08\x26\x2d\
-\x2d\x25\x08\x02\x01\x04\x1a\x1f\x0d\x0f\x1f\x07\x10\x21\x31\x41\
-\x29\x01\xbc\x16\x29\x1b\x1b\x2a\x16\xfe\x41\x06\x07\x05\x01\x12\
-\x28\x21\x1f\x28\x13\x0e\x1f\x30\x43\x2c\x01\xbc\x16\x29\x1b\x1b\
-\x2a\x16\xfe\x41\x08\x08\x03\x12\x28\x21\x1f\x28\x13\x00\x01\x00\
-\x05\xff\xf7\x02\xde\x02\x9b\x00\x56\x00\x00\x45\x22\x26\x26\x35\
-\x35\x07\x22\x26\x35\x34\x36\x33\x17\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x15\x32\x36\x33\x32\x16\x33\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\x15\x14\x16\
-\x16\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x22\
-\x06\x06\x23\x22\x26\x27\x15\x14\x16\x16\x33\x32\x16\x16\x15\x14\
-\x06\x06\x01\x29\x42\x5c\x31\x18\x21\x1c\x1e\x22\x15\x08\x26\x2d\
-\x2c\x26\x08\x0b\x29\x15\x15\x24\x0a\x08\x26\x2d\x2c\x25\x08\x35\
-\x16\x29\x1b\x1c\x29\x16\x34\x05\x0c\x0a\x1b\x29\x17\x1c\x2a\x15\
-\x42\x5d\x30\x07\x17\x18\x0b\x10\x2e\x0d\x05\x0c\x0a\x1a\x29\x17\
-\x1c\x2a\x09\x2f\x5a\x40\x7f\x02\x2b\x30\x2f\x2b\x02\x54\x17\x27\
-\x19\x1b\x2a\x16\x4f\x01\x01\x53\x17\x27\x19\x1b\x2a\x16\x51\x03\
-\x08\x26\x2e\x2d\x26\x07\x03\x76\x0f\x10\x07\x08\x22\x28\x2d\x26\
-\x07\x2f\x5a\x40\x7f\x02\x01\x02\x01\x76\x0f\x10\x07\x08\x22\x28\
-\x2d\x26\x07\x00\x02\x00\x0e\x01\x30\x01\x82\x02\xa0\x00\x20\x00\
-\x2f\x00\x00\x41\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x35\
-\x17\x0e\x02\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x17\
-\x07\x36\x36\x07\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x15\x14\
-\x16\x16\x01\x3f\x22\x1b\x06\x06\x1c\x22\x22\x21\x15\x06\x1c\x24\
-\x15\x2b\x4d\x2f\x30\x4c\x2b\x1a\x23\x15\x05\x12\x01\x20\x53\x0d\
-\x14\x0d\x0d\x15\x0e\x14\x1d\x0e\x17\x02\xa0\x15\x1e\x10\xe9\x10\
-\x20\x14\x1a\x1d\x09\x0d\x15\x0c\x35\x55\x30\x2f\x53\x34\x0e\x13\
-\x07\x10\x1e\x1a\xe8\x0e\x16\x0c\x0e\x17\x0d\x1e\x15\x0c\x16\x0d\
-\x00\x00\x02\x00\x0e\x01\x22\x01\x8a\x02\x9d\x00\x0f\x00\x1b\x00\
-\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\
-\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xce\x34\x57\
-\x35\x34\x57\x33\x35\x56\x33\x33\x55\x36\x17\x20\x1e\x1a\x16\x1f\
-\x20\x01\x22\x33\x56\x33\x35\x56\x34\x33\x56\x36\x34\x56\x32\x86\
-\x20\x18\x19\x1d\x20\x17\x17\x20\x00\x00\x03\x00\x12\xff\xef\x02\
-\x66\x02\x52\x00\x11\x00\x1c\x00\x2b\x00\x00\x65\x06\x22\x26\x27\
-\x01\x26\x26\x36\x37\x36\x36\x16\x17\x01\x16\x16\x06\x05\x26\x26\
-\x36\x37\x13\x17\x03\x0e\x02\x25\x27\x37\x3e\x02\x17\x16\x16\x06\
-\x07\x07\x0e\x02\x02\x2b\x25\x2f\x1f\x0e\xfe\xa4\x0e\x12\x0f\x25\
-\x25\x2d\x1f\x0f\x01\x5c\x0e\x13\x0f\xfe\x0c\x2c\x1e\x03\x06\x60\
-\x9a\x4b\x05\x12\x2c\x01\x29\x4b\x48\x07\x14\x2d\x2b\x2b\x1b\x05\
-\x07\x2d\x09\x21\x31\x0a\x1b\x1e\x10\x01\x9a\x11\x26\x2d\x1a\x1c\
-\x01\x1d\x12\xfe\x67\x11\x26\x2d\x2b\x0b\x25\x2c\x15\x01\x3e\x4f\
-\xfe\xdb\x14\x24\x0e\xc3\x65\xf1\x16\x23\x0c\x0d\x0d\x25\x2b\x17\
-\x9e\x17\x22\x25\x00\xff\xff\x00\x12\xff\x83\x02\x66\x02\x52\x06\
-\x26\x00\x87\x00\x00\x00\x07\x01\x24\x00\xa8\xff\xdb\xff\xff\x00\
-\x12\xff\x1d\x02\x66\x02\x52\x06\x26\x00\x87\x00\x00\x00\x07\x01\
-\x25\x00\xa8\xff\xdb\xff\xff\x00\x12\xff\xef\x02\x66\x02\x52\x06\
-\x26\x00\x87\x00\x00\x00\x07\x01\x29\x00\xd2\xff\x30\x00\x02\x00\
-\x17\xff\xf7\x02\x55\x02\x4a\x00\x1d\x00\x2f\x00\x00\x45\x22\x26\
-\x26\x35\x35\x34\x2e\x02\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\
-\x33\x32\x1e\x02\x15\x15\x14\x06\x06\x21\x22\x26\x26\x35\x34\x36\
-\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x01\xa4\x2c\x27\x09\
-\x0f\x1e\x2f\x21\x4d\x17\x2b\x1b\x1b\x2a\x17\x4b\x50\x75\x4d\x26\
-\x08\x26\xfe\xa2\x17\x2b\x1b\x1b\x2b\x16\x01\x86\x17\x2a\x1b\x1b\
-\x2a\x18\x09\x19\x28\x15\xa8\x29\x3b\x27\x12\x08\x27\x2d\x2e\x26\
-\x08\x29\x54\x7f\x57\xa3\x17\x2b\x1b\x08\x27\x2d\x2e\x26\x08\x08\
-\x26\x2e\x2d\x27\x08\xff\xff\x00\x17\xff\xf7\x02\x55\x02\x4a\x06\
-\x26\x00\x8b\x00\x00\x00\x07\x01\x29\x00\x6f\xff\xfc\x00\x02\x00\
-\x03\xff\xf7\x01\xb9\x02\x4f\x00\x1f\x00\x33\x00\x00\x45\x22\x26\
-\x26\x27\x27\x2e\x03\x23\x22\x26\x27\x26\x26\x37\x37\x36\x36\x17\
-\x32\x16\x33\x1e\x03\x17\x17\x16\x06\x25\x06\x26\x26\x27\x26\x36\
-\x37\x3e\x04\x37\x17\x0e\x04\x01\x56\x2d\x25\x08\x03\x19\x04\x04\
-\x0a\x18\x19\x16\x1d\x0c\x0e\x0d\x01\x03\x02\x21\x31\x01\x17\x01\
-\x43\x4f\x2a\x15\x0a\x22\x08\x2b\xfe\xe5\x1e\x30\x1d\x02\x03\x1a\
-\x28\x1c\x31\x30\x31\x36\x1f\x01\x17\x27\x24\x27\x2f\x09\x19\x27\
-\x15\xb1\x1d\x37\x2d\x1b\x02\x07\x09\x21\x19\x2f\x20\x1b\x02\x01\
-\x02\x2e\x4f\x67\x3c\xd5\x31\x2d\x04\x04\x05\x21\x25\x38\x2b\x01\
-\x01\x0d\x15\x1b\x1f\x0f\x62\x18\x30\x2b\x24\x19\x00\xff\xff\x00\
-\x03\xff\xf7\x01\xb9\x02\x4f\x06\x26\x00\x8d\x00\x00\x00\x06\x01\
-\x29\x33\xfc\x00\x02\x00\x17\xff\xf7\x02\x37\x02\x4a\x00\x11\x00\
-\x1c\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x03\x22\x26\x26\x35\x11\x17\x11\x14\x06\x06\
-\x74\x17\x2b\x1b\x1b\x2b\x16\x01\x68\x17\x2a\x1b\x1b\x2a\x18\x63\
-\x2d\x26\x08\xb7\x08\x27\x01\x92\x08\x27\x2d\x2e\x26\x08\x08\x26\
-\x2e\x2d\x27\x08\xfe\x65\x1b\x2b\x17\x01\x6f\x11\xfe\x9b\x15\x28\
-\x19\xff\xff\x00\x17\xff\xf7\x02\x37\x02\x4a\x06\x26\x00\x8f\x00\
-\x00\x00\x06\x01\x29\x62\xf5\x00\x02\x00\x17\xff\xf7\x02\x37\x02\
-\x4a\x00\x1b\x00\x2d\x00\x00\x45\x22\x26\x26\x35\x35\x34\x26\x26\
-\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x15\
-\x14\x06\x06\x21\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x06\x06\x01\xdc\x2d\x26\x09\x1a\x37\x2c\x8f\x17\x2b\
-\x1b\x1b\x2b\x16\x8d\x6a\x8a\x43\x08\x25\xfe\x72\x2d\x26\x08\x08\
-\x26\x2e\x2e\x25\x08\x08\x26\x09\x19\x28\x15\xa8\x37\x45\x21\x08\
-\x27\x2d\x2e\x26\x08\x49\x96\x74\xa3\x17\x2b\x1b\x1b\x2b\x16\x95\
-\x16\x2a\x1b\x1c\x2a\x16\x95\x16\x2a\x1b\x00\xff\xff\x00\x17\xff\
-\xf7\x02\x37\x02\x4a\x06\x26\x00\x91\x00\x00\x00\x07\x01\x29\x00\
-\xd6\xff\xf5\x00\x01\x00\x21\xff\xf7\x00\xd8\x02\x4a\x00\x11\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x06\x06\x7c\x2d\x26\x08\x08\x26\x2e\x2e\x25\x08\x08\x26\x09\
-\x1b\x2b\x16\x01\x9c\x16\x2a\x1b\x1c\x2a\x16\xfe\x64\x16\x2a\x1b\
-\x00\xff\xff\x00\x05\xff\xf7\x01\x2c\x02\x4a\x04\x26\x00\x93\x54\
-\x00\x00\x06\x01\x29\xe4\x08\xff\xff\xff\xe5\xff\xf7\x00\xd8\x02\
-\xf0\x06\x26\x00\x93\x00\x00\x00\x06\x01\x26\xce\x6d\x00\x02\x00\
-\x0e\xff\xf7\x01\x99\x02\x4a\x00\x14\x00\x26\x00\x00\x57\x22\x2e\
-\x02\x27\x27\x26\x26\x36\x37\x17\x06\x06\x14\x16\x16\x17\x17\x16\
-\x06\x03\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\
-\x06\x06\x23\xe5\x23\x24\x0f\x05\x03\x10\x07\x0a\x0f\x1c\xa9\x12\
-\x0f\x08\x0a\x03\x10\x08\x29\xb2\x17\x2b\x1b\x1b\x2a\x17\xd3\x17\
-\x2a\x1b\x1b\x2a\x18\x09\x10\x1b\x20\x10\x55\x27\x61\x5f\x24\x0f\
-\x07\x2d\x3d\x41\x39\x11\x58\x2e\x2a\x01\x9b\x08\x27\x2d\x2e\x26\
-\x08\x08\x26\x2e\x2d\x27\x08\xff\xff\x00\x07\xff\xf7\x01\xaa\x02\
-\x4a\x04\x26\x00\x96\x11\x00\x00\x06\x01\x29\xe6\x08\x00\x01\x00\
-\x27\xff\xf7\x02\x5e\x02\x4a\x00\x23\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x37\x32\x1e\x02\x15\x15\x14\x06\x06\x23\x22\
-\x26\x26\x35\x35\x34\x2e\x02\x23\x23\x11\x14\x06\x06\x83\x2e\x26\
-\x08\x08\x26\x2e\xa4\x50\x75\x4c\x26\x08\x25\x2e\x2d\x26\x09\x0f\
-\x1e\x2f\x21\x4b\x08\x26\x09\x1b\x2a\x17\x01\x9b\x16\x29\x1c\x01\
-\x28\x54\x80\x57\xa3\x17\x2b\x1b\x19\x28\x15\xa8\x29\x3b\x27\x12\
-\xfe\xc2\x18\x2a\x1b\x00\x01\x00\x17\xff\xec\x02\x5e\x02\x4a\x00\
-\x2a\x00\x00\x45\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x16\x33\x32\x36\x27\x26\x26\x23\x23\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x16\x16\x07\x14\x0e\x02\x01\x38\x4c\x6d\
-\x46\x22\x08\x26\x2e\x2e\x26\x08\x34\x38\x3b\x32\x02\x01\x24\x20\
-\x0c\x17\x26\x16\x1b\x2a\x17\x0a\x4b\x6f\x3c\x03\x2c\x50\x69\x14\
-\x3d\x64\x77\x3b\xaf\x17\x2a\x1b\x1b\x2a\x18\xae\x50\x4b\x4a\x52\
-\x26\x2c\x08\x27\x2d\x2e\x26\x08\x4c\x88\x5a\x40\x6f\x53\x2e\xff\
-\xff\x00\x17\xff\xec\x02\x5e\x02\x4a\x06\x26\x00\x99\x00\x00\x00\
-\x07\x01\x29\x00\xf1\xff\xff\x00\x01\x00\x21\x00\xdf\x00\xd8\x02\
-\x4a\x00\x11\x00\x00\x77\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x15\x14\x06\x06\x7c\x2d\x26\x08\x08\x26\x2e\x2e\x25\
-\x08\x08\x26\xdf\x1c\x2a\x16\xb4\x16\x2a\x1b\x1c\x2a\x16\xb4\x16\
-\x2a\x1b\x00\xff\xff\xff\xc6\x00\xdf\x00\xd8\x02\x4a\x04\x26\x00\
-\x9b\x00\x00\x00\x06\x01\x29\xa5\x6f\x00\x01\x00\x17\xff\x6b\x02\
-\x09\x02\x4a\x00\x1d\x00\x00\x45\x22\x26\x26\x35\x11\x34\x2e\x02\
-\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x1e\x02\x15\x11\
-\x14\x06\x06\x01\xae\x2d\x26\x09\x0f\x1f\x2f\x21\x60\x17\x2b\x1b\
-\x1b\x2b\x16\x5e\x50\x75\x4d\x26\x08\x25\x95\x1a\x28\x15\x01\x33\
-\x29\x3b\x27\x12\x08\x27\x2d\x2e\x26\x08\x29\x54\x7f\x57\xfe\xd1\
-\x16\x2b\x1c\xff\xff\x00\x17\xff\x6b\x02\x09\x02\x4a\x06\x26\x00\
-\x9d\x00\x00\x00\x07\x01\x29\x00\x70\xff\xe2\x00\x01\x00\x0c\xff\
-\xeb\x02\x18\x02\x4a\x00\x2b\x00\x00\x57\x22\x26\x27\x26\x26\x27\
-\x26\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x32\x36\x36\x35\
-\x34\x26\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\
-\x15\x14\x0e\x02\xf6\x40\x55\x1b\x19\x1e\x02\x01\x0c\x0a\x0f\x20\
-\x16\x0e\x1a\x0a\x14\x2b\x16\x25\x34\x1b\x3b\x31\x73\x17\x27\x16\
-\x1b\x2b\x17\x7a\x4e\x7c\x48\x34\x55\x67\x15\x1f\x0f\x0e\x27\x16\
-\x0b\x22\x13\x1a\x18\x11\x08\x0d\x0e\x1d\x36\x27\x35\x41\x08\x27\
-\x2d\x2e\x26\x08\x4f\x89\x56\x4c\x73\x4c\x26\xff\xff\x00\x0c\xff\
-\xeb\x02\x18\x02\x4a\x06\x26\x00\x9f\x00\x00\x00\x07\x01\x29\x00\
-\x9d\xff\xfe\x00\x02\x00\x0d\xff\xe9\x02\x09\x02\xde\x00\x10\x00\
-\x24\x00\x00\x57\x26\x26\x37\x3e\x03\x37\x17\x0e\x02\x07\x0e\x02\
-\x01\x27\x21\x22\x26\x27\x27\x26\x36\x36\x33\x32\x16\x16\x17\x17\
-\x33\x32\x16\x16\xbc\x31\x12\x1c\x20\x3a\x35\x31\x16\x8b\x1c\x3d\
-\x43\x24\x0c\x1d\x2d\x01\x10\x77\xfe\xfe\x35\x2a\x03\x07\x01\x0a\
-\x29\x2d\x2e\x23\x06\x01\x03\xb8\x37\x43\x0f\x03\x1b\x3d\x28\x2d\
-\x5b\x5d\x5f\x30\x72\x41\x79\x70\x35\x11\x20\x06\x01\x88\x21\x27\
-\x34\x95\x17\x2a\x1b\x1c\x2a\x16\x38\x3d\x63\xff\xff\x00\x0d\xff\
-\xe9\x02\x09\x02\xde\x06\x26\x00\xa1\x00\x00\x00\x06\x01\x29\x50\
-\x05\x00\x02\x00\x1c\xff\xf7\x02\x46\x02\x4a\x00\x20\x00\x24\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\x33\x32\x16\x16\x15\x15\
-\x14\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\x26\x23\x23\x11\x14\
-\x06\x06\x23\x37\x21\x17\x78\x2e\x26\x08\x31\x35\x9f\x5a\x83\x48\
-\x08\x25\x2e\x2d\x26\x09\x15\x2f\x27\x50\x08\x26\x37\x01\x01\x83\
-\x01\x09\x1b\x2a\x17\x01\x94\x34\x2f\x4d\x8b\x5f\xbf\x17\x2b\x1b\
-\x19\x28\x15\xc3\x2e\x39\x1b\xfe\xc2\x18\x2a\x1b\xb8\xb8\x00\x00\
-\x02\x00\x17\xff\xf7\x02\x6d\x02\x51\x00\x2c\x00\x37\x00\x00\x65\
-\x15\x14\x06\x06\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x35\
-\x34\x26\x26\x23\x22\x0e\x02\x07\x07\x0e\x02\x23\x22\x26\x37\x13\
-\x17\x3e\x04\x33\x32\x16\x16\x05\x03\x26\x26\x36\x37\x36\x16\x16\
-\x17\x17\x02\x6d\x0a\x26\x2b\xa6\x16\x2b\x1b\x1b\x2b\x17\x49\x10\
-\x21\x1b\x24\x2a\x16\x0b\x05\x1d\x04\x07\x24\x2e\x39\x2a\x09\x2e\
-\x40\x12\x16\x18\x2c\x4f\x43\x48\x63\x34\xfd\xfc\x4b\x05\x02\x1f\
-\x2d\x2c\x2b\x11\x05\x2b\xfd\xaa\x2b\x27\x0a\x08\x26\x2e\x2e\x26\
-\x08\x4b\x38\x45\x20\x1e\x2f\x37\x19\xa8\x16\x2a\x1b\x2c\x31\x01\
-\x0f\x4d\x28\x57\x52\x41\x27\x4f\x96\xbc\x01\x2b\x17\x2b\x23\x0a\
-\x09\x12\x25\x15\xcc\xff\xff\x00\x17\xff\xf7\x02\x6d\x02\x51\x06\
-\x26\x00\xa4\x00\x00\x00\x07\x01\x29\x01\x10\xff\xf5\x00\x01\x00\
-\x21\xff\x6b\x00\xd8\x02\x4a\x00\x11\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x7c\x2d\x26\
-\x08\x08\x26\x2e\x2e\x25\x08\x08\x26\x95\x1c\x2a\x16\x02\x28\x16\
-\x2a\x1b\x1c\x2a\x16\xfd\xd8\x16\x2a\x1b\x00\x00\x02\x00\x13\xff\
-\xf7\x01\x95\x02\x4a\x00\x1b\x00\x26\x00\x00\x45\x22\x26\x26\x35\
-\x35\x34\x26\x26\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\
-\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x34\x36\x36\x33\
-\x33\x07\x01\x39\x2c\x27\x09\x11\x22\x1c\x0c\x17\x2b\x1b\x1b\x2b\
-\x16\x0b\x5a\x76\x39\x08\x26\xf7\x17\x2b\x1b\x1b\x2a\x17\xd5\x01\
-\x09\x19\x28\x15\xc3\x2e\x39\x1b\x08\x27\x2d\x2e\x26\x08\x43\x8a\
-\x6a\xbf\x17\x2b\x1b\x08\x27\x2d\x2e\x26\x08\xb8\x00\xff\xff\x00\
-\x13\xff\xf7\x01\x95\x02\x4a\x06\x26\x00\xa7\x00\x00\x00\x06\x01\
-\x29\x35\xf5\x00\x02\x00\x17\xff\xe7\x02\x6d\x02\x4a\x00\x10\x00\
-\x1c\x00\x00\x45\x22\x26\x26\x35\x35\x34\x36\x33\x33\x32\x16\x16\
-\x15\x14\x06\x06\x27\x32\x36\x35\x34\x26\x26\x23\x23\x15\x14\x16\
-\x01\x46\x5a\x89\x4c\x38\x2a\xc6\x5c\x87\x4b\x4a\x85\x5c\x35\x3e\
-\x1b\x33\x24\x74\x3f\x19\x4d\x8b\x5c\xcc\x2b\x38\x4a\x87\x5b\x5d\
-\x8c\x4e\xb9\x44\x3a\x25\x34\x1b\x74\x3a\x44\xff\xff\x00\x17\xff\
-\xe7\x02\x6d\x02\x4a\x06\x26\x00\xa9\x00\x00\x00\x07\x01\x29\x00\
-\xf9\xff\xfc\x00\x02\x00\x09\xff\xcc\x02\x27\x02\x51\x00\x1c\x00\
-\x2a\x00\x00\x57\x06\x06\x26\x27\x26\x36\x36\x37\x37\x3e\x02\x35\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x07\x14\x0e\x02\x07\x27\x26\
-\x26\x27\x27\x26\x26\x36\x37\x36\x16\x16\x17\x13\x7f\x16\x28\x21\
-\x0c\x0b\x13\x2a\x17\xb9\x2a\x25\x09\x08\x26\x2d\x2d\x28\x09\x01\
-\x1b\x39\x5c\x43\x72\x1a\x29\x10\x4c\x07\x04\x1d\x2c\x2c\x2d\x15\
-\x06\x65\x2d\x06\x01\x20\x2b\x28\x2c\x16\x06\x31\x0e\x23\x33\x25\
-\xb2\x16\x27\x1a\x1b\x2b\x17\x83\x4c\x72\x53\x3c\x16\x7e\x0b\x23\
-\x2e\xf3\x16\x2a\x25\x0c\x0c\x16\x2b\x15\xfe\xad\x00\x00\x01\x00\
-\x12\xff\x6b\x02\x1a\x02\x4b\x00\x29\x00\x00\x45\x22\x26\x26\x35\
-\x11\x34\x26\x26\x23\x23\x22\x06\x16\x17\x1e\x02\x17\x16\x16\x06\
-\x07\x06\x2e\x02\x27\x26\x3e\x02\x33\x33\x32\x16\x16\x15\x11\x14\
-\x06\x06\x01\xbd\x2d\x26\x08\x11\x23\x1b\x40\x13\x13\x03\x0e\x08\
-\x10\x0f\x08\x17\x08\x1d\x21\x1c\x3e\x38\x25\x03\x02\x21\x40\x57\
-\x34\x12\x54\x77\x3f\x08\x26\x95\x1c\x2a\x16\x01\x61\x24\x2f\x18\
-\x12\x19\x0c\x06\x0e\x0d\x07\x13\x29\x2c\x19\x15\x0c\x35\x55\x33\
-\x30\x53\x3e\x23\x44\x81\x5b\xfe\x9b\x16\x2a\x1b\x00\xff\xff\x00\
-\x12\xff\x6b\x02\x1a\x02\x4b\x06\x26\x00\xac\x00\x00\x00\x07\x01\
-\x29\x00\xe1\xff\x98\x00\x01\x00\x14\xff\xf7\x02\x25\x02\x4b\x00\
-\x32\x00\x00\x57\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x36\x36\
-\x35\x35\x34\x26\x23\x23\x22\x06\x06\x17\x16\x16\x17\x16\x14\x06\
-\x06\x07\x06\x2e\x02\x27\x26\x3e\x02\x33\x33\x32\x16\x16\x15\x15\
-\x14\x06\x06\x23\x7e\x16\x2b\x1b\x1b\x2b\x17\x90\x1d\x2a\x17\x2d\
-\x29\x35\x10\x14\x01\x0c\x05\x0a\x04\x13\x15\x19\x06\x17\x35\x31\
-\x22\x04\x04\x1e\x3d\x56\x33\x1c\x55\x7a\x42\x44\x7e\x57\x09\x08\
-\x26\x2e\x2e\x26\x08\x1a\x31\x22\x0c\x32\x39\x0f\x14\x0a\x04\x07\
-\x04\x0e\x26\x26\x1d\x05\x13\x06\x27\x42\x29\x31\x55\x41\x24\x46\
-\x81\x59\x12\x5a\x82\x46\x00\xff\xff\x00\x14\xff\xf7\x02\x25\x02\
-\x4b\x06\x26\x00\xae\x00\x00\x00\x07\x01\x29\x00\xd5\xff\xed\x00\
-\x02\x00\x18\xff\x66\x02\x18\x02\x4d\x00\x1b\x00\x26\x00\x00\x45\
-\x06\x26\x26\x27\x2e\x03\x27\x2e\x02\x36\x37\x36\x36\x16\x17\x1e\
-\x03\x17\x16\x16\x06\x06\x03\x27\x37\x36\x36\x32\x17\x16\x16\x06\
-\x07\x01\x78\x2c\x2b\x11\x05\x11\x29\x31\x3a\x23\x09\x17\x0b\x10\
-\x1e\x1d\x2e\x28\x11\x28\x49\x3e\x2e\x0d\x03\x06\x07\x1d\x46\x73\
-\x85\x0d\x1d\x2f\x26\x26\x0e\x13\x0c\x92\x08\x10\x24\x15\x48\x83\
-\x79\x72\x37\x0e\x22\x26\x27\x12\x16\x0b\x13\x19\x3a\x8b\x95\x96\
-\x45\x10\x26\x25\x1c\x01\x3a\x7e\xf3\x12\x1c\x1a\x19\x2c\x28\x13\
-\x00\x00\x03\x00\x0e\xff\xf5\x02\x31\x02\x56\x00\x11\x00\x1c\x00\
-\x27\x00\x00\x45\x27\x01\x26\x36\x37\x36\x16\x16\x17\x01\x16\x16\
-\x17\x16\x14\x06\x06\x25\x22\x26\x26\x35\x34\x36\x36\x33\x21\x17\
-\x27\x27\x37\x3e\x02\x17\x16\x16\x06\x07\x01\xa6\x66\xfe\xef\x1b\
-\x15\x25\x26\x2e\x1f\x0d\x01\x02\x0b\x10\x08\x0f\x17\x2a\xfe\xaa\
-\x17\x2b\x1b\x1b\x2a\x17\x01\x3f\x0b\x32\x7a\x73\x0c\x1b\x2e\x28\
-\x27\x12\x0f\x0b\x09\x74\x01\x5b\x24\x38\x19\x1b\x01\x1d\x13\xfe\
-\xad\x0d\x16\x0e\x19\x3d\x35\x21\x02\x08\x27\x2d\x2e\x26\x08\xb8\
-\xb9\x76\xfb\x13\x1e\x03\x17\x16\x2b\x29\x14\xff\xff\x00\x0e\xff\
-\xf5\x02\x31\x02\x56\x06\x26\x00\xb1\x00\x00\x00\x07\x01\x29\x00\
-\x29\xff\xcb\x00\x03\x00\x17\xff\x3d\x02\x4c\x02\x4b\x00\x13\x00\
-\x25\x00\x35\x00\x00\x45\x26\x26\x37\x3e\x04\x37\x17\x0e\x04\x07\
-\x0e\x02\x05\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\
-\x11\x14\x06\x06\x01\x27\x23\x21\x22\x26\x26\x35\x34\x36\x36\x33\
-\x05\x32\x16\x16\x01\x5d\x35\x1f\x11\x10\x1e\x1b\x19\x19\x0d\x9c\
-\x0a\x15\x15\x16\x18\x0e\x08\x18\x2b\xfe\xf8\x2d\x26\x08\x08\x26\
-\x2e\x2e\x25\x08\x08\x26\x01\x8e\x9f\x24\xff\x00\x17\x2b\x1b\x1b\
-\x2b\x16\x01\x37\x3f\x4d\x16\x0b\x11\x36\x2d\x29\x4e\x4e\x4f\x50\
-\x2a\x6c\x24\x45\x45\x43\x44\x23\x14\x26\x10\xac\x1b\x2b\x16\x01\
-\x57\x17\x29\x1b\x1b\x2a\x17\xfe\xa9\x16\x2a\x1b\x02\x36\x20\x08\
-\x27\x2d\x2e\x26\x08\x01\x36\x61\x00\xff\xff\x00\x17\xff\x3d\x02\
-\x4c\x02\x4b\x06\x26\x00\xb3\x00\x00\x00\x07\x01\x29\x00\xd0\x00\
-\x1f\x00\x01\x00\x0e\xff\xf7\x01\xf6\x02\x4a\x00\x1d\x00\x00\x45\
-\x22\x26\x26\x35\x35\x34\x2e\x02\x23\x23\x22\x26\x26\x35\x34\x36\
-\x36\x33\x33\x32\x1e\x02\x15\x15\x14\x06\x06\x01\x9b\x2d\x26\x09\
-\x0f\x1f\x2f\x21\x56\x17\x2b\x1b\x1b\x2a\x17\x55\x50\x75\x4c\x26\
-\x08\x25\x09\x19\x28\x15\xa8\x29\x3b\x27\x12\x08\x27\x2d\x2e\x26\
-\x08\x29\x54\x7f\x57\xa3\x17\x2b\x1b\xff\xff\x00\x0e\xff\xf7\x01\
-\xf6\x02\x4a\x06\x26\x00\xb5\x00\x00\x00\x06\x01\x29\x5a\xd9\x00\
-\x02\x00\x17\xff\xec\x02\xac\x02\x4a\x00\x25\x00\x3c\x00\x00\x45\
-\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x14\x16\
-\x16\x33\x32\x36\x36\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x14\x0e\x02\x25\x35\x33\x32\x3e\x02\x37\x37\x3e\x02\x33\x32\x16\
-\x16\x07\x07\x0e\x03\x23\x01\x5e\x52\x7b\x52\x28\x08\x26\x2e\x2e\
-\x26\x08\x21\x41\x2f\x3a\x40\x1a\x09\x27\x2c\x2e\x26\x08\x29\x53\
-\x7e\xfe\xe1\x30\x0f\x16\x11\x09\x01\x02\x01\x09\x26\x2d\x2e\x27\
-\x08\x02\x03\x05\x19\x32\x54\x3f\x14\x3d\x64\x78\x3b\xae\x17\x2a\
-\x1b\x1b\x2a\x18\xad\x33\x45\x24\x2c\x48\x29\xb2\x16\x27\x1a\x1c\
-\x2a\x17\xaf\x3c\x77\x63\x3c\xbd\x77\x14\x29\x3d\x28\x32\x16\x27\
-\x19\x1b\x2b\x18\x2e\x43\x68\x46\x24\xff\xff\x00\x17\xff\xec\x02\
-\xac\x02\xec\x06\x26\x00\xb7\x00\x00\x00\x07\x01\x1c\x02\x06\x00\
-\x6d\xff\xff\x00\x17\xff\xec\x02\xac\x02\xec\x06\x26\x00\xb7\x00\
-\x00\x00\x06\x01\x2b\x2b\x6d\xff\xff\x00\x17\xff\xec\x02\xac\x02\
-\xec\x06\x26\x00\xb7\x00\x00\x00\x27\x01\x29\x01\x74\xff\xde\x00\
-\x07\x01\x1c\x02\x06\x00\x6d\xff\xff\x00\x17\xff\xec\x02\xac\x02\
-\xec\x06\x26\x00\xb7\x00\x00\x00\x27\x01\x29\x01\x74\xff\xde\x00\
-\x06\x01\x2b\x2b\x6d\xff\xff\x00\x17\xff\xec\x02\xac\x02\x4a\x06\
-\x26\x00\xb7\x00\x00\x00\x07\x01\x29\x01\x74\xff\xde\x00\x01\x00\
-\x17\xff\xf7\x02\x97\x02\x4b\x00\x2b\x00\x00\x57\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x11\x17\x06\x06\x26\x26\x35\x34\x36\x37\x37\
-\x36\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\
-\x26\x23\x23\x11\x14\x06\x23\x74\x17\x2b\x1b\x1b\x2b\x16\x11\x7c\
-\x25\x48\x3a\x22\x38\x41\xa6\x6c\x8e\x47\x08\x25\x2e\x2d\x26\x09\
-\x1b\x37\x2c\x25\x30\x2d\x09\x08\x27\x2d\x2e\x26\x08\x01\x23\x3c\
-\x06\x07\x09\x23\x24\x3b\x33\x01\x02\x01\x4a\x97\x73\xa3\x17\x2b\
-\x1b\x19\x28\x15\xa8\x37\x45\x21\xfe\xd3\x35\x39\x00\xff\xff\x00\
-\x17\xff\xf7\x02\x97\x02\x4b\x06\x26\x00\xbd\x00\x00\x00\x07\x01\
-\x29\x01\x36\xff\xf5\x00\x02\x00\x0e\xff\xea\x02\x27\x02\xbd\x00\
-\x17\x00\x2a\x00\x00\x45\x22\x2e\x03\x35\x34\x3e\x03\x33\x32\x1e\
-\x03\x15\x14\x0e\x03\x27\x32\x3e\x03\x35\x35\x34\x26\x26\x23\x22\
-\x06\x06\x15\x14\x16\x16\x01\x1e\x46\x61\x3c\x21\x0c\x0c\x1f\x3c\
-\x61\x46\x44\x5f\x3b\x21\x0c\x0d\x21\x3b\x5d\x47\x1a\x20\x12\x08\
-\x02\x13\x25\x1d\x1e\x26\x12\x13\x26\x16\x31\x50\x60\x61\x28\x24\
-\x5e\x61\x53\x33\x32\x51\x61\x60\x26\x28\x61\x60\x50\x30\xb8\x19\
-\x28\x2f\x2d\x10\x05\x3a\x4f\x29\x28\x50\x3b\x39\x4f\x29\x00\x00\
-\x02\x00\x05\xff\xf5\x01\x5e\x02\xb3\x00\x0d\x00\x1b\x00\x00\x45\
-\x22\x26\x35\x11\x34\x36\x33\x32\x16\x15\x11\x14\x06\x03\x06\x26\
-\x27\x26\x36\x37\x37\x36\x16\x17\x16\x06\x07\x01\x03\x32\x28\x28\
-\x33\x32\x28\x28\x97\x22\x37\x20\x21\x04\x28\x7f\x21\x39\x1f\x20\
-\x05\x28\x0b\x28\x33\x02\x09\x32\x28\x29\x33\xfd\xf8\x32\x28\x01\
-\xa4\x1e\x02\x22\x23\x3e\x23\x72\x1e\x05\x22\x22\x3d\x24\x00\x00\
-\x01\x00\x0e\xff\xf5\x02\x2f\x02\xbd\x00\x38\x00\x00\x57\x22\x26\
-\x35\x34\x36\x36\x37\x3e\x04\x35\x34\x26\x26\x23\x22\x0e\x02\x15\
-\x14\x06\x06\x23\x22\x26\x26\x35\x34\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x0e\x04\x23\x37\x33\x32\x16\x16\x15\x14\x06\x06\x23\x69\x25\
-\x36\x09\x10\x0b\x1a\x4c\x52\x48\x2d\x09\x20\x23\x15\x1e\x12\x09\
-\x08\x26\x2e\x2d\x26\x08\x23\x44\x60\x3d\x49\x76\x46\x20\x33\x3a\
-\x36\x24\x04\x0a\x9e\x17\x2a\x1a\x1b\x2b\x17\x0b\x38\x25\x13\x22\
-\x1f\x0d\x21\x36\x30\x30\x38\x22\x0a\x1f\x19\x0b\x15\x1f\x14\x15\
-\x27\x19\x1b\x2b\x16\x2e\x5c\x4b\x2e\x47\x77\x4a\x31\x50\x3f\x2d\
-\x1d\x0e\x10\x08\x27\x2e\x2c\x27\x08\x00\x01\x00\x0e\xff\xeb\x02\
-\x27\x02\xbd\x00\x48\x00\x00\x45\x22\x2e\x02\x35\x34\x33\x32\x16\
-\x16\x17\x30\x16\x16\x33\x32\x36\x36\x35\x34\x26\x26\x23\x22\x26\
-\x26\x35\x34\x36\x36\x33\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x07\x06\x06\x27\x26\x26\x37\x14\x3e\x03\x33\x32\x1e\x02\x15\
-\x14\x06\x06\x07\x1e\x03\x15\x14\x06\x06\x01\x19\x36\x60\x4b\x2a\
-\x64\x1c\x1d\x12\x09\x0d\x24\x23\x1b\x26\x15\x14\x22\x17\x16\x2a\
-\x1b\x1b\x2b\x16\x14\x1b\x0e\x0f\x1c\x13\x18\x1c\x0f\x05\x13\x3f\
-\x2c\x2b\x0c\x14\x0b\x1e\x32\x4e\x36\x3f\x5f\x41\x21\x19\x21\x0b\
-\x09\x1c\x1b\x13\x46\x7a\x15\x24\x3f\x51\x2c\x3f\x0a\x19\x17\x19\
-\x19\x0e\x1a\x11\x14\x1a\x0c\x06\x24\x2d\x2e\x23\x05\x05\x0e\x0d\
-\x0f\x15\x0b\x0c\x13\x09\x2a\x11\x18\x1a\x3a\x28\x01\x19\x26\x27\
-\x1a\x28\x40\x4d\x26\x25\x33\x1d\x06\x06\x17\x24\x2f\x1e\x45\x6b\
-\x3e\x00\x01\x00\x05\xff\xf8\x02\x0b\x02\xbc\x00\x23\x00\x00\x45\
-\x22\x26\x26\x35\x35\x23\x22\x26\x26\x35\x34\x36\x37\x13\x36\x36\
-\x17\x16\x16\x07\x07\x33\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x06\x06\x01\xae\x2d\x26\x08\xf3\x2d\x26\x08\x01\x02\x4d\x0d\
-\x32\x32\x25\x29\x06\x3e\x83\x08\x27\x2e\x2d\x26\x08\x09\x26\x08\
-\x1b\x2b\x16\x68\x1b\x2b\x16\x0b\x0e\x07\x01\x37\x37\x16\x0c\x0a\
-\x25\x1a\xff\xf5\x16\x27\x1a\x1b\x2a\x17\xfd\xfb\x17\x2a\x1a\x00\
-\x01\x00\x05\xff\xea\x01\xdf\x02\xb5\x00\x47\x00\x00\x57\x22\x2e\
-\x02\x31\x26\x26\x35\x34\x36\x37\x36\x36\x33\x32\x16\x17\x30\x16\
-\x16\x33\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x07\x06\x06\
-\x23\x22\x26\x27\x26\x26\x35\x13\x3e\x02\x33\x17\x32\x16\x16\x15\
-\x14\x06\x06\x23\x23\x07\x36\x32\x36\x33\x33\x32\x1e\x02\x15\x14\
-\x06\x06\xec\x2f\x48\x31\x19\x0f\x17\x12\x13\x0f\x1f\x10\x0f\x1f\
-\x16\x0b\x19\x16\x15\x1d\x0f\x10\x1c\x12\x0c\x11\x09\x01\x0a\x1a\
-\x14\x0f\x20\x12\x20\x19\x25\x02\x0c\x26\x28\xe5\x17\x29\x1b\x19\
-\x28\x15\x9a\x07\x03\x06\x05\x03\x05\x2f\x56\x43\x27\x40\x6e\x16\
-\x15\x1c\x15\x0d\x1d\x13\x10\x21\x13\x11\x11\x0f\x12\x08\x08\x0e\
-\x19\x12\x11\x1a\x0f\x06\x07\x01\x09\x0f\x0a\x0a\x11\x1a\x10\x01\
-\x1c\x0f\x2b\x21\x01\x08\x27\x2f\x2b\x25\x07\x35\x01\x01\x25\x42\
-\x54\x2f\x46\x70\x42\x00\x02\x00\x0e\xff\xeb\x01\xfb\x02\xb3\x00\
-\x24\x00\x34\x00\x00\x45\x22\x26\x26\x35\x34\x3e\x03\x33\x32\x16\
-\x16\x15\x14\x06\x06\x23\x22\x0e\x03\x31\x27\x30\x36\x36\x33\x32\
-\x16\x16\x15\x14\x06\x06\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\
-\x06\x06\x15\x14\x16\x16\x01\x0b\x4f\x71\x3d\x24\x43\x5f\x77\x45\
-\x16\x28\x1a\x1b\x2a\x17\x2d\x3f\x29\x18\x09\x0c\x15\x21\x12\x3f\
-\x6a\x40\x40\x6d\x47\x16\x1c\x0d\x0e\x1a\x11\x14\x1f\x10\x0c\x1b\
-\x15\x45\x81\x59\x4c\x82\x69\x4a\x28\x08\x26\x2e\x2d\x26\x08\x18\
-\x24\x24\x18\x0b\x09\x08\x3a\x5e\x38\x40\x68\x3d\xab\x0b\x18\x12\
-\x0f\x16\x0c\x0c\x15\x0e\x13\x19\x0b\x00\x01\x00\x05\xff\xf7\x02\
-\x05\x02\xb2\x00\x23\x00\x00\x57\x22\x26\x26\x35\x34\x3e\x04\x37\
-\x23\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x0e\
-\x04\x15\x14\x06\x06\xc1\x2d\x26\x09\x19\x29\x2f\x2c\x21\x05\xc8\
-\x16\x2a\x1b\x1a\x27\x15\x01\x4f\x2e\x25\x08\x22\x34\x3c\x34\x22\
-\x09\x27\x09\x14\x25\x17\x34\x60\x58\x4d\x3f\x2e\x0e\x09\x26\x2d\
-\x2d\x26\x08\x1b\x2a\x17\x27\x57\x5b\x5d\x5c\x57\x28\x16\x24\x14\
-\x00\x00\x03\x00\x0e\xff\xea\x02\x0f\x02\xc1\x00\x27\x00\x37\x00\
-\x47\x00\x00\x45\x22\x26\x26\x35\x34\x3e\x03\x07\x16\x2e\x02\x35\
-\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x37\x26\x1e\x03\x15\
-\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\
-\x14\x16\x16\x13\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\
-\x14\x16\x16\x01\x11\x49\x75\x45\x16\x1e\x19\x06\x0d\x0f\x0b\x1d\
-\x19\x40\x6d\x42\x41\x6a\x3f\x10\x16\x12\x03\x0a\x0c\x06\x19\x1d\
-\x15\x2e\x4b\x59\x2d\x17\x20\x11\x11\x21\x18\x17\x21\x11\x12\x21\
-\x18\x11\x17\x0c\x0d\x17\x11\x10\x18\x0c\x0d\x18\x16\x3f\x6d\x45\
-\x21\x37\x28\x17\x05\x09\x0a\x07\x20\x36\x24\x3e\x63\x3b\x3b\x66\
-\x3f\x18\x2b\x21\x14\x04\x09\x09\x05\x18\x28\x37\x20\x39\x5a\x3e\
-\x20\xaf\x0f\x1c\x13\x13\x1b\x0e\x0e\x1b\x13\x13\x1c\x0f\x01\x23\
-\x0a\x13\x0d\x0d\x13\x0a\x0a\x13\x0d\x0d\x13\x0a\x00\x00\x02\x00\
-\x0e\xff\xf6\x01\xfb\x02\xbe\x00\x24\x00\x34\x00\x00\x57\x22\x26\
-\x26\x35\x34\x36\x36\x33\x32\x3e\x03\x31\x17\x30\x06\x06\x23\x22\
-\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x13\x32\
-\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x75\x15\
-\x27\x19\x1b\x2b\x17\x2d\x3f\x29\x17\x09\x0d\x15\x22\x12\x3e\x6a\
-\x40\x40\x6c\x43\x4f\x72\x3d\x24\x43\x60\x78\x40\x15\x1e\x10\x0d\
-\x1b\x16\x16\x1c\x0d\x0f\x1a\x0a\x09\x26\x2d\x2e\x25\x08\x18\x24\
-\x24\x18\x0b\x08\x09\x3a\x5e\x37\x41\x68\x3d\x45\x80\x5a\x4c\x83\
-\x69\x4a\x27\x01\xb7\x0b\x16\x0e\x14\x18\x0b\x0b\x17\x13\x0e\x17\
-\x0c\x00\x01\x00\x0d\xff\xd9\x01\xe4\x02\xe4\x00\x11\x00\x00\x57\
-\x26\x26\x36\x37\x01\x3e\x02\x17\x16\x16\x06\x07\x01\x0e\x02\x31\
-\x19\x0b\x09\x04\x01\x65\x05\x0d\x1a\x16\x19\x0a\x09\x04\xfe\x9a\
-\x04\x0e\x18\x1b\x0d\x17\x14\x08\x02\xa3\x09\x10\x03\x0c\x0d\x17\
-\x13\x09\xfd\x5d\x09\x10\x03\x00\x03\x00\x21\xff\xda\x02\xc0\x02\
-\xe4\x00\x11\x00\x2b\x00\x60\x00\x00\x57\x26\x26\x36\x37\x01\x36\
-\x36\x16\x17\x16\x16\x14\x07\x01\x06\x06\x26\x13\x22\x26\x26\x35\
-\x35\x06\x06\x23\x22\x26\x27\x26\x26\x37\x37\x36\x36\x33\x32\x16\
-\x15\x11\x14\x06\x06\x13\x22\x26\x26\x35\x34\x36\x36\x37\x3e\x03\
-\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x02\x07\x37\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x81\x11\x0f\x01\x07\x01\x67\x08\x13\
-\x18\x0f\x10\x0f\x07\xfe\x96\x06\x12\x17\x27\x1e\x19\x06\x07\x0c\
-\x07\x0a\x16\x09\x15\x02\x18\x54\x0a\x16\x0d\x1e\x20\x05\x1b\xea\
-\x15\x1f\x11\x11\x1d\x12\x14\x29\x23\x16\x03\x0c\x0c\x0e\x0c\x03\
-\x08\x1c\x20\x1d\x18\x05\x29\x46\x2b\x2b\x46\x29\x16\x22\x20\x0b\
-\x01\x3c\x0b\x18\x12\x11\x18\x0c\x1b\x0a\x11\x14\x0d\x02\xa7\x0f\
-\x0d\x03\x09\x09\x12\x13\x0d\xfd\x55\x0c\x0c\x03\x01\x5f\x12\x19\
-\x09\x9d\x02\x03\x0c\x09\x15\x2c\x16\x4c\x0a\x0a\x1c\x1a\xfe\xd2\
-\x0a\x18\x12\xfe\xbc\x10\x1f\x14\x16\x20\x19\x0a\x0b\x15\x18\x20\
-\x15\x01\x0a\x0a\x0f\x0f\x01\x0e\x1c\x13\x15\x1e\x0b\x2b\x47\x2a\
-\x2a\x47\x2c\x1c\x2e\x23\x18\x07\x0a\x05\x1a\x20\x1f\x1a\x05\x00\
-\x03\x00\x21\xff\xda\x02\xac\x02\xe4\x00\x11\x00\x35\x00\x4f\x00\
-\x00\x57\x26\x26\x36\x37\x01\x36\x36\x16\x17\x16\x16\x14\x07\x01\
-\x06\x06\x26\x25\x22\x26\x26\x35\x35\x23\x22\x26\x35\x34\x36\x37\
-\x37\x36\x36\x17\x1e\x02\x07\x07\x33\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x11\x14\x06\x06\x01\x22\x26\x26\x35\x35\x06\x06\x23\x22\
-\x26\x27\x26\x26\x37\x37\x36\x36\x33\x32\x16\x15\x11\x14\x06\x06\
-\x84\x11\x0f\x01\x07\x01\x67\x08\x13\x18\x0f\x10\x0f\x07\xfe\x96\
-\x06\x12\x17\x01\xd9\x1e\x1a\x06\x80\x19\x1c\x02\x03\x27\x08\x20\
-\x22\x17\x18\x05\x06\x18\x29\x05\x1b\x1f\x1f\x1a\x05\x05\x1a\xfe\
-\x2b\x1e\x19\x06\x07\x0c\x07\x0a\x16\x09\x15\x02\x18\x54\x0a\x16\
-\x0d\x1e\x20\x05\x1b\x1b\x0a\x11\x14\x0d\x02\xa7\x0f\x0d\x03\x09\
-\x09\x12\x13\x0d\xfd\x55\x0c\x0c\x03\x1c\x12\x19\x0a\x36\x1e\x1a\
-\x09\x13\x0b\x9d\x22\x14\x08\x07\x14\x1f\x18\x60\x7b\x0d\x1a\x12\
-\x13\x1b\x0d\xfe\xd8\x09\x19\x12\x01\x43\x12\x19\x09\x9d\x02\x03\
-\x0c\x09\x15\x2c\x16\x4c\x0a\x0a\x1c\x1a\xfe\xd2\x0a\x18\x12\x00\
-\x03\x00\x19\xff\xdb\x02\xd4\x02\xe3\x00\x11\x00\x4e\x00\x72\x00\
-\x00\x57\x26\x26\x36\x37\x01\x36\x36\x16\x17\x16\x16\x14\x07\x01\
-\x06\x06\x26\x03\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x17\x1e\
-\x02\x33\x32\x36\x35\x34\x26\x23\x22\x26\x35\x34\x36\x33\x32\x36\
-\x35\x34\x26\x23\x22\x06\x06\x07\x06\x06\x23\x22\x26\x35\x34\x36\
-\x36\x33\x32\x16\x16\x15\x14\x06\x07\x16\x16\x15\x14\x06\x06\x01\
-\x22\x26\x26\x35\x35\x23\x22\x26\x35\x34\x36\x37\x37\x36\x36\x17\
-\x1e\x02\x07\x07\x33\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\
-\x06\x06\xab\x11\x10\x01\x08\x01\x67\x09\x13\x17\x0f\x10\x0f\x07\
-\xfe\x96\x07\x11\x17\x10\x29\x42\x27\x18\x1c\x05\x17\x13\x03\x01\
-\x07\x14\x13\x0f\x1c\x0b\x23\x0d\x11\x14\x0a\x14\x12\x17\x0e\x0d\
-\x0e\x07\x03\x04\x0a\x15\x16\x26\x1d\x3d\x2e\x2b\x3e\x23\x19\x08\
-\x12\x17\x22\x44\x01\xb7\x1e\x1a\x06\x80\x19\x1c\x02\x03\x27\x08\
-\x21\x21\x17\x18\x05\x06\x18\x29\x05\x1b\x1f\x1f\x1a\x05\x05\x1a\
-\x1b\x0a\x12\x14\x0c\x02\xa7\x0f\x0c\x02\x09\x09\x12\x13\x0d\xfd\
-\x55\x0c\x0b\x03\x01\x5d\x24\x3b\x20\x12\x10\x04\x0e\x08\x02\x17\
-\x15\x12\x12\x0b\x12\x0c\x1f\x18\x09\x11\x11\x0e\x0e\x07\x0b\x07\
-\x0a\x12\x20\x15\x0c\x30\x27\x23\x36\x1d\x22\x1f\x06\x0d\x29\x17\
-\x20\x3e\x27\xfe\xbe\x12\x19\x0a\x36\x1e\x1a\x09\x13\x0b\x9d\x22\
-\x16\x0a\x07\x14\x1f\x18\x60\x7b\x0d\x1a\x12\x13\x1b\x0d\xfe\xd8\
-\x09\x19\x12\x00\x01\x00\x02\x00\xc0\x01\x0f\x02\xbe\x00\x19\x00\
-\x00\x77\x22\x26\x26\x35\x35\x06\x06\x23\x22\x26\x27\x26\x36\x37\
-\x37\x36\x36\x33\x32\x16\x15\x11\x14\x06\x06\xbf\x26\x20\x06\x08\
-\x11\x08\x0d\x1e\x0c\x19\x07\x17\x6b\x0b\x1c\x0f\x26\x28\x07\x21\
-\xc0\x17\x1e\x0c\xc8\x04\x04\x12\x0d\x1e\x30\x17\x61\x0c\x0c\x22\
-\x20\xfe\x83\x0d\x1d\x15\x00\x00\x01\x00\x0e\x00\xc0\x01\xa3\x02\
-\xc4\x00\x35\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x37\x3e\x03\
-\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x07\x27\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x64\x1a\x26\x15\x0f\x1b\x11\x1a\x3b\
-\x35\x22\x06\x10\x10\x13\x10\x04\x0a\x23\x26\x24\x1e\x06\x34\x57\
-\x36\x37\x57\x34\x11\x1b\x1f\x1d\x0a\x1e\x61\x0d\x1e\x16\x15\x1e\
-\x0e\xc0\x14\x25\x19\x17\x25\x1f\x0c\x14\x20\x20\x27\x19\x01\x0e\
-\x0e\x14\x14\x01\x12\x22\x17\x1a\x23\x0e\x36\x59\x34\x34\x59\x37\
-\x1c\x30\x28\x1f\x17\x07\x0b\x07\x20\x27\x26\x20\x06\x00\x01\x00\
-\x0e\x00\xb8\x01\x9b\x02\xc4\x00\x43\x00\x00\x77\x22\x26\x26\x35\
-\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x36\x36\x35\x34\x26\
-\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x36\x35\x34\x26\x23\x22\
-\x06\x06\x07\x06\x06\x23\x22\x26\x27\x26\x35\x34\x3e\x02\x33\x32\
-\x16\x16\x15\x14\x06\x07\x1e\x02\x15\x14\x06\x06\xd1\x36\x59\x34\
-\x14\x26\x19\x1a\x1a\x06\x01\x0a\x18\x16\x14\x13\x06\x0c\x1c\x0e\
-\x19\x0e\x10\x17\x0b\x13\x0d\x14\x10\x10\x0e\x06\x03\x06\x15\x1a\
-\x0f\x1c\x11\x18\x16\x2d\x44\x2e\x34\x54\x32\x12\x12\x0e\x15\x0b\
-\x34\x5b\xb8\x2f\x4d\x2d\x12\x1a\x0d\x10\x11\x03\x19\x17\x0e\x10\
-\x03\x13\x0a\x05\x1c\x20\x19\x15\x05\x0f\x12\x0b\x10\x0e\x11\x06\
-\x0b\x14\x0c\x0d\x18\x1b\x0c\x2d\x2f\x20\x2b\x49\x2c\x1c\x2c\x11\
-\x0c\x20\x23\x12\x33\x51\x2e\xff\xff\x00\x0b\x01\x60\x00\xcc\x02\
-\xb3\x04\x07\x00\xd6\xff\xfc\x01\xfd\xff\xff\x00\x15\x01\x5f\x01\
-\xa9\x02\xb2\x04\x27\x00\xd6\x00\x06\x01\xfc\x00\x07\x00\xd6\x00\
-\xd9\x01\xfc\x00\x01\x00\x17\x01\x92\x01\x17\x02\x4a\x00\x11\x00\
-\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\
-\x06\x06\x23\x74\x17\x2b\x1b\x1b\x2b\x16\x48\x17\x2a\x1b\x1b\x2a\
-\x18\x01\x92\x08\x27\x2d\x2e\x26\x08\x08\x26\x2e\x2d\x27\x08\x00\
-\x01\x00\x0e\xff\xf6\x00\xce\x00\xb6\x00\x0d\x00\x00\x57\x22\x26\
-\x35\x34\x36\x36\x33\x32\x16\x15\x14\x06\x06\x6e\x35\x2b\x13\x2a\
-\x24\x35\x2a\x12\x2a\x0a\x2a\x34\x25\x2a\x13\x2b\x36\x23\x2a\x12\
-\x00\x00\x01\x00\x0f\xff\x63\x00\xd0\x00\xb6\x00\x1f\x00\x00\x57\
-\x30\x26\x26\x35\x34\x36\x37\x36\x36\x37\x26\x26\x27\x26\x26\x35\
-\x3e\x02\x33\x32\x17\x16\x16\x15\x14\x06\x07\x0e\x02\x2a\x0d\x0d\
-\x11\x05\x02\x20\x04\x0d\x15\x08\x0e\x05\x01\x08\x29\x30\x36\x16\
-\x0e\x05\x01\x02\x05\x2f\x46\x9d\x04\x12\x16\x1a\x12\x01\x02\x1b\
-\x1f\x03\x0b\x07\x0e\x2a\x13\x16\x2b\x1d\x16\x0e\x29\x14\x0a\x13\
-\x09\x39\x5c\x37\x00\x00\x02\x00\x0e\xff\xf6\x00\xcf\x01\xdf\x00\
-\x0d\x00\x1b\x00\x00\x53\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\
-\x14\x06\x06\x03\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\x14\x06\
-\x06\x6f\x35\x2b\x13\x2a\x24\x35\x2a\x12\x2a\x25\x35\x2b\x13\x2a\
-\x24\x35\x2a\x12\x2a\x01\x1f\x2a\x34\x25\x2a\x13\x2b\x36\x23\x2a\
-\x12\xfe\xd7\x2a\x34\x25\x2a\x13\x2b\x36\x23\x2a\x12\x00\x02\x00\
-\x0e\xff\x62\x00\xce\x01\xdf\x00\x1f\x00\x2d\x00\x00\x57\x30\x26\
-\x26\x35\x34\x36\x37\x36\x36\x37\x26\x26\x27\x26\x26\x35\x34\x36\
-\x36\x33\x32\x17\x16\x16\x15\x14\x06\x07\x0e\x02\x13\x22\x26\x35\
-\x34\x36\x36\x33\x32\x16\x15\x14\x06\x06\x29\x0d\x0d\x11\x05\x02\
-\x20\x04\x0d\x15\x07\x0f\x05\x11\x2a\x26\x36\x17\x0e\x04\x01\x01\
-\x05\x2f\x46\x1c\x37\x29\x10\x2b\x26\x39\x26\x08\x28\x9e\x04\x13\
-\x16\x1a\x11\x01\x02\x1c\x1f\x03\x0a\x07\x0e\x27\x13\x25\x2a\x13\
-\x16\x0e\x27\x13\x10\x12\x07\x39\x5d\x37\x01\xbc\x2d\x31\x25\x2b\
-\x13\x2b\x37\x16\x2c\x1d\x00\xff\xff\x00\x19\xff\xf6\x03\x0a\x00\
-\xb6\x04\x27\x00\xd5\x01\x23\x00\x00\x00\x27\x00\xd5\x02\x3c\x00\
-\x00\x00\x06\x00\xd5\x0b\x00\x00\x02\x00\x1c\xff\xf6\x00\xdc\x02\
-\xb7\x00\x11\x00\x1f\x00\x00\x77\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x32\x16\x16\x15\x11\x14\x06\x06\x07\x22\x26\x35\x34\x36\x36\
-\x33\x32\x16\x15\x14\x06\x06\x7c\x2d\x26\x08\x08\x26\x2e\x2e\x25\
-\x08\x08\x26\x2e\x3a\x26\x09\x28\x30\x3b\x24\x08\x28\xec\x18\x25\
-\x14\x01\x27\x14\x26\x19\x19\x27\x14\xfe\xd9\x14\x25\x17\xf6\x2d\
-\x34\x16\x2c\x1d\x2c\x35\x16\x2c\x1d\x00\x02\x00\x1c\xff\x22\x00\
-\xdc\x01\xe3\x00\x11\x00\x1f\x00\x00\x77\x32\x16\x16\x15\x11\x14\
-\x06\x06\x23\x22\x26\x26\x35\x11\x34\x36\x36\x37\x32\x16\x16\x15\
-\x14\x06\x23\x22\x26\x26\x35\x34\x36\x7c\x2e\x26\x08\x08\x25\x2e\
-\x2e\x26\x08\x08\x26\x2d\x30\x28\x08\x24\x3b\x30\x28\x09\x26\xed\
-\x17\x25\x14\xfe\xd9\x14\x27\x19\x19\x26\x14\x01\x27\x14\x25\x18\
-\xf6\x1d\x2b\x17\x35\x2c\x1d\x2c\x16\x35\x2c\x00\x02\x00\x05\xff\
-\xf6\x01\xce\x02\xc4\x00\x30\x00\x3e\x00\x00\x77\x22\x26\x26\x35\
-\x35\x34\x3e\x04\x35\x34\x26\x23\x22\x06\x06\x07\x0e\x02\x27\x2e\
-\x02\x37\x3e\x04\x33\x32\x16\x16\x15\x14\x0e\x03\x23\x37\x15\x14\
-\x06\x06\x07\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\x14\x06\x06\
-\xec\x2a\x23\x07\x15\x21\x26\x21\x15\x20\x24\x10\x16\x0b\x03\x0a\
-\x19\x26\x20\x22\x1f\x03\x09\x01\x0d\x1c\x31\x49\x34\x42\x69\x3d\
-\x1c\x2a\x2b\x1f\x03\x07\x08\x24\x2d\x3a\x25\x08\x28\x30\x3b\x25\
-\x08\x29\xea\x17\x24\x13\x07\x20\x26\x17\x0f\x0f\x17\x14\x1d\x1a\
-\x08\x0b\x06\x1e\x22\x07\x0c\x0e\x1a\x24\x1d\x03\x1f\x2b\x2a\x1c\
-\x3b\x63\x3e\x2d\x41\x2a\x18\x0a\x0c\x0a\x11\x21\x14\xf4\x2c\x35\
-\x16\x2c\x1d\x2c\x35\x16\x2c\x1d\x00\x00\x02\x00\x0a\xff\x1d\x01\
-\xd3\x01\xeb\x00\x30\x00\x3e\x00\x00\x77\x32\x16\x16\x15\x15\x14\
-\x0e\x04\x15\x14\x16\x33\x32\x36\x36\x37\x3e\x02\x17\x1e\x02\x07\
-\x0e\x04\x23\x22\x26\x26\x35\x34\x3e\x03\x33\x07\x35\x34\x36\x36\
-\x37\x32\x16\x15\x14\x06\x06\x23\x22\x26\x35\x34\x36\x36\xec\x2a\
-\x23\x07\x15\x21\x26\x21\x15\x20\x24\x11\x15\x0c\x02\x0b\x18\x27\
-\x1f\x22\x1f\x03\x09\x01\x0d\x1c\x31\x49\x34\x41\x6a\x3d\x1c\x2a\
-\x2b\x1f\x03\x07\x08\x25\x2c\x3b\x24\x08\x28\x30\x3b\x25\x08\x29\
-\xf7\x17\x23\x14\x07\x20\x26\x17\x0f\x0f\x17\x14\x1d\x1a\x08\x0c\
-\x05\x1e\x23\x06\x0c\x0d\x1b\x24\x1d\x03\x1f\x2b\x2a\x1c\x3b\x64\
-\x3d\x2d\x41\x2a\x18\x0a\x0c\x0a\x12\x20\x14\xf4\x2c\x35\x16\x2c\
-\x1d\x2d\x34\x17\x2b\x1d\x00\x00\x01\x00\x0e\x00\xbf\x00\xce\x01\
-\x7f\x00\x0b\x00\x00\x77\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\x6f\x36\x2b\x2b\x36\x35\x2a\x2a\xbf\x2a\x35\x36\x2b\x2b\x36\
-\x35\x2a\x00\x00\x01\x00\x0e\x00\x95\x01\x30\x01\xb7\x00\x0f\x00\
-\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\
-\x06\x9f\x30\x40\x21\x21\x40\x30\x30\x40\x21\x21\x40\x95\x20\x41\
-\x30\x30\x40\x21\x21\x40\x30\x30\x40\x21\x00\x00\x01\xff\xfd\x00\
-\xfc\x01\xd6\x02\xbd\x00\x27\x00\x00\x53\x32\x16\x15\x15\x37\x36\
-\x16\x17\x16\x06\x07\x07\x17\x16\x06\x07\x06\x26\x27\x27\x07\x06\
-\x06\x27\x26\x26\x37\x37\x27\x26\x26\x37\x36\x36\x17\x17\x35\x34\
-\x36\xea\x2f\x26\x30\x23\x28\x0d\x0f\x1a\x2f\x1b\x1f\x12\x0e\x24\
-\x26\x33\x1a\x14\x1c\x16\x32\x26\x25\x0a\x19\x17\x25\x29\x16\x0f\
-\x10\x2c\x28\x26\x26\x02\xbd\x25\x2f\x1f\x0f\x09\x1a\x2b\x2d\x2f\
-\x10\x08\x2c\x1e\x2d\x1a\x1c\x09\x26\x1b\x27\x1d\x02\x1b\x1a\x30\
-\x23\x21\x0b\x09\x2e\x2f\x2f\x1a\x0e\x0c\x24\x2c\x24\x00\x02\xff\
-\xff\xff\xfa\x02\xb8\x02\xb1\x00\x4b\x00\x4f\x00\x00\x57\x22\x26\
-\x37\x37\x23\x22\x26\x37\x3e\x02\x33\x33\x37\x23\x22\x26\x37\x3e\
-\x02\x33\x33\x37\x3e\x02\x33\x32\x16\x07\x07\x33\x37\x3e\x02\x33\
-\x32\x16\x07\x07\x33\x32\x16\x07\x0e\x02\x23\x23\x07\x33\x32\x16\
-\x07\x0e\x02\x23\x23\x07\x0e\x02\x23\x22\x26\x37\x37\x23\x07\x0e\
-\x02\x13\x33\x37\x23\xa3\x22\x24\x04\x11\x33\x26\x1a\x08\x06\x18\
-\x20\x10\x34\x0e\x33\x25\x1b\x08\x06\x18\x20\x10\x34\x0f\x04\x06\
-\x21\x2c\x24\x27\x04\x15\x78\x0e\x04\x07\x21\x2c\x24\x26\x04\x14\
-\x24\x26\x18\x06\x05\x19\x1f\x10\x27\x0d\x24\x26\x1a\x08\x06\x19\
-\x1e\x10\x27\x0c\x03\x0c\x24\x28\x21\x25\x04\x11\x77\x0c\x03\x0c\
-\x24\x56\x78\x0d\x76\x06\x16\x16\x6d\x21\x28\x22\x1c\x06\x54\x20\
-\x28\x22\x1c\x06\x58\x16\x28\x1b\x19\x19\x7f\x58\x16\x28\x1b\x18\
-\x18\x81\x20\x28\x22\x1c\x06\x54\x20\x28\x22\x1d\x06\x4a\x14\x24\
-\x17\x16\x16\x6d\x4a\x14\x24\x17\x01\x26\x54\x00\x01\xff\xfd\xff\
-\xbf\x01\xe9\x02\xe3\x00\x0f\x00\x00\x57\x26\x26\x37\x01\x36\x36\
-\x16\x17\x16\x16\x06\x07\x01\x06\x06\x3c\x2e\x11\x13\x01\x2c\x0e\
-\x1d\x29\x1d\x21\x1b\x04\x0e\xfe\xd5\x13\x2f\x2e\x16\x2b\x29\x02\
-\x73\x1c\x18\x04\x0e\x10\x1d\x25\x1d\xfd\x93\x2b\x0b\x00\x01\xff\
-\xff\xff\xc2\x01\xea\x02\xe5\x00\x0e\x00\x00\x45\x06\x06\x26\x27\
-\x01\x26\x36\x37\x36\x16\x17\x01\x16\x06\x01\xaf\x1e\x2a\x1e\x0b\
-\xfe\xd3\x12\x14\x2b\x2c\x32\x13\x01\x29\x12\x12\x2e\x0e\x02\x1a\
-\x19\x02\x75\x24\x2e\x15\x14\x0f\x27\xfd\x92\x2b\x30\x00\x01\x00\
-\x0e\x00\xae\x01\x85\x01\x53\x00\x11\x00\x00\x77\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\x06\x23\x5a\x0f\x24\
-\x19\x1a\x24\x0f\xdd\x10\x24\x19\x18\x23\x12\xae\x07\x23\x2a\x29\
-\x21\x07\x07\x22\x29\x29\x23\x07\x00\x00\x01\x00\x0f\x00\xaa\x02\
-\x0f\x01\x53\x00\x11\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x5b\x10\x23\x19\x1a\x25\x10\
-\x01\x62\x11\x25\x19\x18\x24\x14\xaa\x08\x24\x2a\x2a\x22\x07\x07\
-\x23\x2a\x2a\x23\x08\x00\x01\x00\x0f\x00\xaa\x02\x8a\x01\x53\x00\
-\x11\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x5b\x10\x23\x19\x1a\x25\x10\x01\xde\x11\x24\
-\x19\x17\x24\x14\xaa\x08\x24\x2a\x2a\x22\x07\x07\x23\x2a\x2a\x23\
-\x08\x00\x01\x00\x05\xff\x23\x02\xfc\xff\xb6\x00\x11\x00\x00\x57\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x47\x0f\x1f\x14\x15\x1f\x0f\x02\x72\x0f\x1f\x14\x15\x1f\x0f\
-\xdd\x06\x1f\x24\x25\x1f\x06\x06\x1f\x26\x24\x1e\x06\x00\x01\x00\
-\x13\xff\x51\x01\x60\x03\x09\x00\x25\x00\x00\x45\x22\x2e\x03\x35\
-\x34\x3e\x03\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x06\x06\
-\x15\x14\x1e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x01\x1b\x37\x57\
-\x3e\x29\x13\x12\x28\x3e\x57\x3a\x11\x1f\x14\x13\x1d\x10\x05\x13\
-\x32\x25\x11\x1d\x27\x16\x11\x1f\x14\x15\x20\xaf\x3b\x64\x7b\x84\
-\x3c\x3a\x84\x7d\x66\x3d\x08\x1d\x21\x22\x1d\x06\x46\x94\x77\x47\
-\x7a\x5c\x34\x06\x1d\x23\x22\x1d\x06\x00\x01\x00\x05\xff\x51\x01\
-\x53\x03\x09\x00\x25\x00\x00\x57\x22\x26\x26\x35\x34\x36\x36\x33\
-\x32\x3e\x02\x35\x34\x26\x26\x23\x23\x22\x26\x26\x35\x34\x36\x36\
-\x33\x32\x1e\x03\x15\x14\x0e\x03\x4a\x10\x20\x15\x14\x20\x10\x16\
-\x27\x1d\x11\x25\x31\x14\x05\x0f\x1e\x13\x14\x20\x10\x3a\x57\x3f\
-\x27\x13\x14\x28\x3f\x56\xaf\x06\x1d\x22\x23\x1d\x06\x34\x5c\x7a\
-\x47\x77\x94\x46\x06\x1d\x22\x21\x1d\x08\x3d\x66\x7d\x83\x3b\x3c\
-\x84\x7b\x64\x3b\x00\x00\x01\x00\x05\xff\x53\x01\x5e\x03\x07\x00\
-\x42\x00\x00\x45\x22\x2e\x02\x35\x27\x34\x2e\x02\x23\x23\x22\x26\
-\x35\x34\x36\x36\x33\x33\x32\x3e\x02\x35\x37\x34\x3e\x02\x33\x32\
-\x16\x16\x15\x14\x06\x06\x07\x22\x06\x06\x15\x15\x14\x0e\x02\x07\
-\x1e\x03\x15\x07\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\x01\
-\x11\x23\x3b\x2b\x18\x01\x0a\x10\x0f\x06\x05\x1d\x19\x13\x1a\x08\
-\x03\x05\x11\x11\x0b\x01\x18\x2b\x3a\x23\x14\x23\x17\x17\x23\x13\
-\x03\x04\x02\x05\x0d\x17\x11\x11\x17\x0d\x05\x01\x02\x04\x03\x13\
-\x23\x18\x18\x23\xad\x1a\x2f\x41\x26\xba\x0c\x0e\x07\x02\x25\x27\
-\x26\x20\x07\x02\x07\x0e\x0d\xbe\x25\x3f\x2e\x1a\x07\x20\x25\x24\
-\x20\x08\x01\x04\x0b\x0c\x9e\x24\x2f\x1f\x16\x09\x0a\x18\x20\x2c\
-\x1f\x9e\x04\x07\x03\x06\x20\x26\x26\x20\x06\x00\x01\x00\x05\xff\
-\x53\x01\x5e\x03\x07\x00\x42\x00\x00\x57\x22\x26\x26\x35\x34\x36\
-\x36\x33\x32\x36\x36\x35\x35\x34\x3e\x02\x37\x2e\x03\x35\x35\x34\
-\x26\x26\x23\x2e\x02\x35\x34\x36\x36\x33\x32\x1e\x02\x15\x15\x14\
-\x1e\x02\x33\x33\x32\x16\x16\x15\x14\x06\x23\x23\x22\x0e\x02\x15\
-\x15\x14\x0e\x02\x52\x11\x24\x18\x18\x24\x12\x03\x04\x02\x05\x0c\
-\x17\x11\x11\x17\x0c\x05\x03\x04\x03\x12\x24\x17\x17\x24\x13\x23\
-\x3a\x2c\x18\x0b\x11\x11\x05\x03\x09\x19\x13\x19\x1d\x05\x06\x0f\
-\x10\x0a\x19\x2b\x3b\xad\x06\x20\x26\x26\x20\x06\x03\x07\x04\x9e\
-\x1f\x2c\x20\x18\x0a\x09\x16\x1f\x2f\x24\x9e\x0c\x0b\x04\x01\x08\
-\x20\x24\x25\x20\x07\x1a\x2e\x3f\x25\xbe\x0d\x0e\x07\x02\x07\x20\
-\x26\x27\x25\x02\x07\x0f\x0c\xb9\x26\x41\x2f\x1a\x00\x00\x01\x00\
-\x1c\xff\x53\x01\x3f\x03\x07\x00\x1d\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x11\
-\x33\x32\x16\x16\x15\x14\x06\x06\x23\x71\x2a\x24\x07\x07\x24\x2a\
-\x90\x0f\x1c\x13\x13\x1d\x0f\x3b\x3c\x0f\x1c\x13\x13\x1d\x0f\xad\
-\x1b\x2a\x15\x03\x00\x16\x29\x1b\x06\x20\x27\x26\x20\x06\xfd\x7e\
-\x06\x21\x27\x25\x20\x06\x00\x00\x01\x00\x05\xff\x53\x01\x28\x03\
-\x07\x00\x1d\x00\x00\x57\x22\x26\x26\x35\x34\x36\x36\x33\x33\x11\
-\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x11\x14\
-\x06\x06\x23\x44\x0e\x1e\x13\x13\x1d\x0e\x3b\x3a\x0e\x1e\x13\x13\
-\x1d\x0e\x8f\x2b\x24\x07\x07\x23\x2b\xad\x06\x20\x25\x27\x21\x06\
-\x02\x82\x06\x20\x26\x27\x20\x06\x1b\x29\x16\xfd\x00\x15\x2a\x1b\
-\x00\xff\xff\x00\x10\xff\x63\x00\xd1\x00\xb6\x04\x06\x00\xd6\x01\
-\x00\xff\xff\x00\x16\xff\x63\x01\xad\x00\xb6\x04\x26\x00\xd6\x07\
-\x00\x00\x07\x00\xd6\x00\xdd\x00\x00\x00\x02\x00\x13\x01\x61\x01\
-\xa7\x02\xb4\x00\x1f\x00\x3f\x00\x00\x41\x30\x16\x16\x15\x14\x06\
-\x07\x06\x06\x07\x16\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x27\
-\x26\x26\x35\x34\x36\x37\x3e\x02\x23\x30\x16\x16\x15\x14\x06\x07\
-\x06\x06\x07\x16\x16\x17\x16\x16\x15\x14\x06\x06\x23\x22\x27\x26\
-\x26\x35\x34\x36\x37\x3e\x02\x01\x8c\x0d\x0d\x11\x05\x02\x1f\x05\
-\x0d\x15\x08\x0e\x05\x09\x28\x31\x36\x16\x0e\x05\x02\x01\x06\x2e\
-\x47\xab\x0d\x0d\x11\x05\x02\x1f\x05\x0d\x15\x08\x0e\x05\x09\x28\
-\x31\x36\x16\x0e\x05\x02\x01\x06\x2e\x47\x02\xb4\x04\x12\x16\x1a\
-\x11\x02\x01\x1b\x20\x03\x0a\x08\x0e\x29\x14\x16\x2b\x1d\x16\x0e\
-\x29\x14\x0a\x13\x09\x39\x5d\x36\x04\x12\x16\x1a\x11\x02\x01\x1b\
-\x20\x03\x0a\x08\x0e\x29\x14\x16\x2b\x1d\x16\x0e\x29\x14\x0a\x13\
-\x09\x39\x5d\x36\x00\xff\xff\x00\x15\x01\x5f\x01\xa9\x02\xb2\x04\
-\x27\x00\xd6\x00\x06\x01\xfc\x00\x07\x00\xd6\x00\xd9\x01\xfc\x00\
-\x01\x00\x0d\x01\x61\x00\xce\x02\xb4\x00\x1f\x00\x00\x53\x30\x16\
-\x16\x15\x14\x06\x07\x06\x06\x07\x16\x16\x17\x16\x16\x15\x14\x06\
-\x06\x23\x22\x27\x26\x26\x35\x34\x36\x37\x3e\x02\xb3\x0d\x0d\x11\
-\x05\x02\x1f\x05\x0d\x15\x08\x0e\x05\x09\x28\x31\x36\x16\x0e\x05\
-\x02\x01\x06\x2e\x47\x02\xb4\x04\x12\x16\x1a\x11\x02\x01\x1b\x20\
-\x03\x0a\x08\x0e\x29\x14\x16\x2b\x1d\x16\x0e\x29\x14\x0a\x13\x09\
-\x39\x5d\x36\xff\xff\x00\x0b\x01\x60\x00\xcc\x02\xb3\x04\x07\x00\
-\xd6\xff\xfc\x01\xfd\xff\xff\x00\x0f\xff\xf5\x02\x82\x01\xf3\x04\
-\x26\x00\xf6\x03\x00\x00\x07\x00\xf6\x01\x25\x00\x00\xff\xff\x00\
-\x0c\xff\xf5\x02\x7c\x01\xf3\x04\x26\x00\xf7\x02\x00\x00\x07\x00\
-\xf7\x01\x21\x00\x00\x00\x01\x00\x0c\xff\xf5\x01\x5d\x01\xf3\x00\
-\x19\x00\x00\x65\x06\x06\x26\x27\x27\x26\x26\x35\x34\x36\x37\x37\
-\x36\x36\x16\x17\x16\x16\x06\x07\x07\x17\x16\x16\x06\x01\x3d\x17\
-\x25\x23\x15\xa1\x0f\x0d\x0d\x0f\xa3\x15\x23\x24\x16\x19\x06\x17\
-\x15\x66\x65\x17\x17\x08\x1c\x17\x10\x0f\x14\xa0\x0f\x1d\x10\x10\
-\x1c\x0f\xa2\x15\x0d\x10\x17\x18\x24\x21\x16\x65\x65\x16\x22\x23\
-\x00\x00\x01\x00\x0a\xff\xf5\x01\x5b\x01\xf3\x00\x19\x00\x00\x77\
-\x26\x26\x36\x37\x37\x27\x26\x26\x36\x37\x36\x36\x16\x17\x17\x16\
-\x16\x15\x14\x06\x07\x07\x06\x06\x26\x2a\x18\x08\x18\x16\x65\x66\
-\x14\x18\x07\x18\x17\x23\x23\x15\xa3\x0f\x0d\x0d\x0f\xa1\x14\x23\
-\x25\x1c\x18\x23\x22\x16\x65\x65\x16\x21\x24\x18\x17\x10\x0d\x15\
-\xa2\x0f\x1c\x10\x10\x1d\x0f\xa0\x14\x0f\x10\x00\x02\x00\x0e\x01\
-\x59\x01\x81\x02\xb3\x00\x13\x00\x27\x00\x00\x41\x22\x2e\x03\x35\
-\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x23\x22\x2e\x03\x35\
-\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x01\x2d\x11\x1a\x14\
-\x0d\x06\x07\x23\x2a\x29\x22\x07\x06\x0d\x14\x1b\xdf\x11\x1b\x13\
-\x0d\x06\x07\x22\x2a\x29\x22\x07\x06\x0d\x14\x1b\x01\x59\x25\x3b\
-\x44\x3e\x14\x18\x2e\x1e\x1f\x2e\x17\x14\x3e\x44\x3b\x25\x25\x3b\
-\x44\x3e\x14\x18\x2e\x1e\x1f\x2e\x17\x14\x3e\x44\x3b\x25\x00\x00\
-\x01\x00\x0e\x01\x59\x00\xb3\x02\xb3\x00\x13\x00\x00\x53\x22\x2e\
-\x03\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x60\x11\x1b\
-\x13\x0d\x06\x07\x22\x2a\x29\x22\x07\x06\x0d\x14\x1b\x01\x59\x25\
-\x3b\x44\x3e\x14\x18\x2e\x1e\x1f\x2e\x17\x14\x3e\x44\x3b\x25\x00\
-\x01\xff\xf7\xff\x26\x01\xe7\x02\xbb\x00\x45\x00\x00\x57\x22\x26\
-\x26\x35\x34\x36\x37\x36\x36\x33\x32\x36\x36\x35\x13\x23\x22\x26\
-\x26\x35\x34\x34\x37\x3e\x02\x33\x17\x37\x3e\x03\x33\x32\x16\x16\
-\x15\x14\x14\x07\x0e\x02\x23\x22\x0e\x02\x15\x07\x37\x32\x16\x16\
-\x15\x14\x14\x07\x0e\x02\x23\x27\x03\x0e\x03\x4b\x17\x27\x16\x01\
-\x01\x02\x2d\x34\x09\x0d\x08\x23\x0b\x13\x26\x19\x01\x05\x1e\x2a\
-\x16\x0a\x06\x03\x1f\x37\x52\x36\x14\x26\x18\x01\x04\x1d\x29\x16\
-\x08\x0c\x07\x04\x04\x32\x14\x26\x18\x01\x04\x1e\x2a\x16\x33\x24\
-\x0b\x24\x36\x4b\xda\x06\x1a\x1e\x06\x0e\x07\x2c\x2a\x05\x09\x06\
-\x01\x39\x07\x1e\x21\x05\x0b\x05\x2d\x25\x07\x01\x24\x20\x43\x3b\
-\x24\x06\x1c\x22\x05\x0b\x07\x2b\x25\x08\x02\x04\x05\x04\x27\x04\
-\x06\x1c\x23\x05\x0b\x06\x2a\x26\x09\x03\xfe\xc3\x34\x49\x2f\x16\
-\x00\x00\x02\x00\x0e\xff\x7e\x03\x3e\x02\x77\x00\x52\x00\x67\x00\
-\x00\x45\x22\x26\x26\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\
-\x02\x23\x22\x26\x35\x34\x34\x31\x0e\x02\x23\x22\x2e\x02\x35\x34\
-\x34\x37\x3e\x03\x33\x32\x16\x16\x17\x07\x36\x36\x33\x32\x16\x07\
-\x03\x14\x16\x33\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x06\x06\x15\
-\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\x03\x32\x3e\x02\x37\
-\x35\x34\x2e\x02\x23\x22\x0e\x02\x07\x15\x14\x16\x16\x01\x79\x6f\
-\xa3\x59\x3a\x69\x90\x55\x61\x9d\x6f\x3b\x2e\x4b\x59\x2a\x43\x55\
-\x07\x15\x1b\x11\x1e\x36\x2a\x17\x01\x04\x24\x36\x40\x21\x15\x23\
-\x1b\x07\x17\x02\x22\x25\x20\x22\x03\x28\x07\x0f\x0c\x26\x27\x1a\
-\x27\x4a\x69\x42\x50\x77\x41\x34\x66\x4b\x1c\x1c\x0b\x15\x1f\x07\
-\x0a\x13\x10\x0b\x01\x06\x0c\x10\x09\x0a\x14\x10\x0a\x02\x0c\x14\
-\x82\x5d\xac\x74\x53\x8b\x66\x38\x36\x64\x8e\x59\x4b\x6e\x48\x24\
-\x4e\x41\x01\x04\x05\x0a\x06\x1b\x2e\x3c\x21\x06\x0b\x06\x24\x42\
-\x34\x1e\x0c\x17\x10\x06\x1f\x1b\x16\x19\xfe\xcb\x07\x04\x0d\x23\
-\x43\x37\x38\x59\x3e\x21\x3c\x6b\x49\x53\x70\x39\x09\x1d\x1e\x21\
-\x1c\x06\x01\x5b\x08\x0e\x12\x0a\x05\x0a\x10\x0c\x06\x08\x0e\x12\
-\x0b\x06\x0b\x14\x0b\x00\x03\x00\x0e\xff\xef\x02\xac\x02\xd4\x00\
-\x3b\x00\x4c\x00\x5c\x00\x00\x45\x22\x26\x26\x35\x34\x36\x36\x37\
-\x2e\x02\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x02\x07\x1e\
-\x02\x17\x36\x36\x37\x36\x36\x33\x32\x16\x16\x07\x06\x06\x07\x3a\
-\x02\x33\x32\x16\x15\x14\x06\x23\x22\x26\x26\x27\x0e\x02\x27\x32\
-\x32\x33\x2e\x03\x27\x0e\x03\x15\x14\x16\x16\x13\x3e\x03\x35\x34\
-\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\x06\x51\x6f\x38\x17\x2f\
-\x23\x0b\x10\x08\x32\x62\x47\x3d\x57\x2f\x1b\x2e\x38\x1d\x10\x21\
-\x24\x12\x0b\x0f\x04\x05\x2f\x28\x27\x20\x08\x01\x02\x1a\x17\x02\
-\x03\x04\x01\x29\x29\x24\x2f\x1b\x36\x35\x1a\x1d\x3c\x3c\x17\x06\
-\x0b\x04\x0a\x15\x15\x14\x0a\x03\x04\x03\x02\x11\x20\x10\x14\x1c\
-\x11\x08\x13\x11\x11\x16\x0a\x03\x05\x11\x2f\x5d\x45\x24\x41\x3f\
-\x1e\x1b\x32\x30\x16\x3f\x55\x2b\x2a\x4e\x37\x23\x3a\x32\x2b\x14\
-\x14\x26\x22\x0f\x11\x23\x12\x19\x17\x14\x1b\x0b\x21\x43\x21\x2a\
-\x29\x34\x26\x09\x12\x0d\x0f\x15\x0b\x9d\x0a\x16\x18\x18\x0d\x05\
-\x0a\x0a\x0a\x05\x11\x18\x0c\x01\x57\x0d\x14\x10\x0d\x06\x0f\x10\
-\x08\x11\x0d\x09\x14\x15\x00\x00\x01\x00\x13\xff\x1f\x02\x0e\x02\
-\x43\x00\x22\x00\x00\x45\x22\x26\x26\x35\x11\x2e\x02\x35\x34\x3e\
-\x02\x33\x21\x32\x16\x16\x15\x11\x14\x06\x06\x23\x22\x26\x26\x35\
-\x11\x23\x11\x14\x06\x06\x01\x01\x24\x1f\x06\x46\x47\x18\x0a\x22\
-\x46\x3c\x01\x05\x24\x1e\x06\x06\x1e\x25\x24\x1f\x06\x32\x06\x1e\
-\xe1\x1b\x2a\x16\x01\x72\x02\x2c\x4c\x31\x29\x40\x2c\x17\x1b\x29\
-\x16\xfd\x8f\x15\x29\x1b\x1b\x2a\x16\x02\x59\xfd\xa5\x15\x29\x1b\
-\x00\x00\x02\x00\x0b\xff\x25\x01\xfb\x02\xd4\x00\x4b\x00\x5d\x00\
-\x00\x45\x22\x2e\x02\x27\x26\x36\x37\x36\x16\x17\x1e\x02\x33\x32\
-\x36\x36\x35\x34\x2e\x02\x27\x2e\x02\x35\x34\x36\x36\x37\x26\x26\
-\x35\x34\x36\x36\x33\x32\x16\x16\x17\x16\x16\x07\x06\x06\x27\x2e\
-\x02\x23\x22\x06\x06\x15\x14\x1e\x05\x15\x14\x06\x07\x16\x16\x15\
-\x14\x0e\x02\x13\x3e\x02\x35\x34\x2e\x02\x27\x06\x06\x15\x14\x1e\
-\x03\x01\x03\x35\x4f\x35\x1e\x05\x1c\x07\x25\x25\x36\x1f\x12\x19\
-\x17\x0e\x1a\x20\x0f\x1c\x30\x3a\x1e\x24\x40\x28\x0a\x13\x0e\x16\
-\x15\x3b\x66\x41\x29\x3e\x37\x1c\x1f\x03\x1a\x1d\x38\x24\x08\x0e\
-\x1a\x1a\x0d\x17\x0e\x21\x37\x41\x41\x37\x21\x13\x14\x14\x13\x30\
-\x4d\x55\x07\x09\x0c\x05\x0d\x17\x21\x14\x11\x17\x0a\x13\x1a\x1f\
-\xdb\x1b\x26\x21\x06\x25\x34\x23\x20\x13\x1d\x11\x16\x09\x0c\x1b\
-\x14\x0f\x12\x0c\x0e\x0b\x0d\x2d\x4c\x3b\x17\x2b\x28\x11\x19\x41\
-\x28\x3a\x5c\x36\x0d\x1b\x15\x1a\x2a\x25\x2a\x0b\x18\x06\x0e\x0a\
-\x0b\x12\x0b\x15\x17\x0c\x0c\x17\x2a\x47\x38\x25\x40\x1b\x17\x3f\
-\x26\x3f\x56\x35\x18\x01\xa9\x05\x0d\x14\x0c\x0a\x0e\x0b\x0a\x05\
-\x04\x16\x0e\x0b\x11\x0c\x09\x07\x00\x00\x03\x00\x0e\x00\x50\x02\
-\x87\x02\xc0\x00\x13\x00\x3f\x00\x53\x00\x00\x65\x22\x2e\x02\x35\
-\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x22\x26\x26\x35\
-\x34\x36\x36\x33\x32\x16\x16\x17\x16\x06\x07\x06\x06\x26\x27\x30\
-\x26\x23\x22\x06\x06\x15\x14\x16\x16\x33\x32\x36\x36\x33\x32\x16\
-\x17\x16\x06\x07\x0e\x02\x07\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\
-\x0e\x02\x15\x14\x1e\x02\x01\x4a\x4e\x77\x4f\x28\x28\x50\x77\x4e\
-\x50\x76\x4f\x27\x29\x4f\x77\x43\x38\x59\x33\x33\x56\x32\x2d\x3c\
-\x20\x01\x03\x14\x0e\x09\x12\x10\x07\x1e\x14\x17\x23\x14\x14\x23\
-\x14\x15\x14\x12\x0f\x0e\x0c\x0d\x15\x01\x17\x10\x23\x24\x1c\x3c\
-\x54\x32\x17\x19\x35\x52\x3a\x3b\x53\x33\x18\x19\x36\x52\x50\x25\
-\x4d\x75\x4f\x51\x76\x4e\x25\x26\x4d\x76\x50\x51\x76\x4b\x25\x79\
-\x33\x59\x39\x31\x53\x33\x1d\x21\x07\x10\x23\x0b\x06\x05\x03\x04\
-\x14\x13\x22\x17\x15\x21\x14\x0e\x0d\x07\x10\x1b\x29\x10\x0b\x10\
-\x08\x17\x17\x33\x52\x3a\x3c\x52\x32\x16\x17\x33\x53\x3c\x3c\x51\
-\x31\x15\x00\x00\x04\x00\x0e\x00\x50\x02\x87\x02\xc0\x00\x13\x00\
-\x27\x00\x47\x00\x50\x00\x00\x41\x32\x1e\x02\x15\x14\x0e\x02\x23\
-\x22\x2e\x02\x35\x34\x3e\x02\x13\x32\x3e\x02\x35\x34\x2e\x02\x23\
-\x22\x0e\x02\x15\x14\x1e\x02\x37\x17\x16\x06\x06\x23\x22\x26\x27\
-\x27\x23\x15\x14\x06\x06\x23\x22\x26\x26\x35\x11\x34\x36\x36\x33\
-\x33\x32\x16\x16\x15\x14\x06\x27\x15\x33\x32\x36\x37\x34\x26\x23\
-\x01\x4b\x50\x76\x4f\x27\x29\x4f\x77\x4e\x4e\x77\x4f\x28\x28\x50\
-\x77\x4e\x39\x53\x34\x19\x19\x35\x52\x3a\x3b\x53\x33\x18\x19\x36\
-\x52\xb5\x24\x05\x15\x24\x12\x0d\x15\x05\x1d\x29\x05\x17\x1c\x1c\
-\x18\x05\x0d\x1e\x17\x4d\x2a\x41\x26\x10\x9f\x21\x0c\x10\x01\x11\
-\x0e\x02\xc0\x26\x4d\x76\x50\x51\x76\x4b\x25\x25\x4d\x75\x4f\x51\
-\x76\x4e\x25\xfd\xf2\x18\x34\x51\x39\x3c\x52\x32\x16\x17\x33\x53\
-\x3c\x3c\x51\x31\x15\xb1\x60\x0c\x18\x0f\x10\x0d\x44\x26\x0c\x19\
-\x12\x13\x1a\x0a\x01\x0d\x12\x15\x09\x24\x40\x29\x19\x2c\x61\x34\
-\x0e\x0a\x0d\x0f\x00\x00\x02\x00\x05\x00\xd4\x02\xf1\x02\x58\x00\
-\x1a\x00\x46\x00\x00\x77\x22\x26\x26\x35\x35\x23\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x23\x23\x15\x14\x06\x06\
-\x33\x22\x26\x26\x35\x13\x34\x36\x36\x33\x32\x16\x17\x17\x37\x36\
-\x36\x33\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\
-\x07\x06\x06\x23\x22\x26\x27\x27\x15\x14\x06\x06\xb6\x20\x1c\x07\
-\x37\x0a\x1a\x13\x12\x18\x0a\xf8\x0d\x18\x10\x35\x38\x06\x1c\xda\
-\x20\x1b\x05\x01\x06\x1d\x22\x1a\x18\x03\x46\x42\x02\x1a\x1a\x24\
-\x1d\x06\x06\x1a\x1f\x21\x1e\x07\x1c\x07\x10\x08\x07\x11\x08\x1a\
-\x06\x1d\xd4\x14\x1c\x0c\xc6\x05\x1b\x20\x21\x1b\x05\x05\x1b\x21\
-\x40\xc7\x0c\x1c\x13\x12\x1c\x0d\x01\x08\x09\x1f\x19\x14\x04\x62\
-\x5e\x04\x17\x19\x23\x0e\xfe\x0e\x1b\x12\x11\x1a\x0f\x3d\x19\x04\
-\x06\x06\x06\x18\x3b\x0f\x1c\x12\x00\x00\x02\x00\x0e\x01\x71\x01\
-\x6d\x02\xd4\x00\x0f\x00\x1b\x00\x00\x53\x22\x26\x26\x35\x34\x36\
-\x36\x33\x32\x16\x16\x15\x14\x06\x06\x27\x32\x36\x35\x34\x26\x23\
-\x22\x06\x15\x14\x16\xbe\x2f\x51\x30\x30\x4f\x30\x31\x4f\x30\x2f\
-\x50\x31\x14\x1e\x1c\x16\x15\x1c\x1d\x01\x71\x30\x50\x30\x32\x51\
-\x30\x30\x50\x32\x31\x50\x30\x7f\x1d\x17\x16\x1b\x1d\x16\x16\x1c\
-\x00\x00\x01\x00\x1c\xff\x1f\x00\xae\x02\xd8\x00\x11\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\
-\x06\x64\x24\x1e\x06\x06\x1f\x24\x25\x1e\x06\x06\x1f\xe1\x1b\x2a\
-\x16\x03\x05\x16\x29\x1a\x1b\x29\x16\xfc\xfa\x15\x29\x1b\x00\x00\
-\x02\x00\x1c\xff\x27\x00\xac\x02\xd8\x00\x11\x00\x23\x00\x00\x53\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\
-\x06\x03\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x06\x06\x64\x24\x1e\x06\x06\x1f\x23\x24\x1e\x06\x06\x1e\x24\
-\x24\x1e\x06\x06\x1f\x24\x24\x1d\x06\x06\x1e\x01\x1f\x1b\x21\x09\
-\x01\x1c\x16\x28\x1a\x1a\x29\x16\xfe\xe5\x09\x21\x1b\xfe\x08\x1b\
-\x29\x16\x01\x1a\x0a\x21\x1b\x1b\x21\x0a\xfe\xe5\x16\x29\x1a\x00\
-\x02\x00\x05\xff\x47\x01\xe5\x02\xc0\x00\x11\x00\x25\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\
-\x06\x03\x22\x26\x26\x35\x34\x36\x36\x33\x17\x37\x32\x16\x16\x15\
-\x14\x06\x06\x23\x27\xf5\x2c\x26\x08\x08\x26\x2d\x2d\x25\x07\x08\
-\x25\xcd\x11\x26\x19\x1b\x27\x11\x9d\x9e\x12\x26\x1a\x18\x26\x15\
-\x9d\xb9\x1a\x29\x17\x02\xc9\x15\x28\x19\x1b\x29\x16\xfd\x3a\x16\
-\x29\x1a\x01\xf9\x07\x24\x29\x29\x22\x07\x06\x06\x07\x22\x2a\x29\
-\x23\x07\x06\x00\x03\x00\x05\xff\x47\x01\xe5\x02\xc0\x00\x11\x00\
-\x25\x00\x39\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x27\x22\x26\x26\x35\x34\x36\x36\x17\
-\x17\x37\x36\x16\x16\x15\x14\x06\x06\x27\x27\x03\x22\x26\x26\x35\
-\x34\x36\x36\x33\x17\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\xf5\
-\x2c\x26\x08\x08\x26\x2d\x2d\x25\x07\x08\x25\xcd\x11\x26\x19\x1b\
-\x27\x11\x9d\x9e\x12\x26\x1a\x18\x26\x15\x9d\xa0\x11\x26\x19\x1b\
-\x27\x11\x9d\x9e\x12\x26\x1a\x18\x26\x15\x9d\xb9\x1a\x29\x17\x02\
-\xc9\x15\x28\x19\x1b\x29\x16\xfd\x3a\x16\x29\x1a\xd8\x07\x24\x29\
-\x29\x23\x07\x01\x06\x06\x01\x07\x23\x2a\x29\x24\x07\x01\x06\x01\
-\x1b\x07\x24\x29\x29\x22\x07\x06\x06\x07\x22\x2a\x29\x23\x07\x06\
-\x00\x00\x03\x00\x05\xff\xf9\x02\x2b\x02\xd5\x00\x33\x00\x45\x00\
-\x57\x00\x00\x45\x22\x2e\x03\x27\x26\x26\x36\x37\x3e\x04\x33\x33\
-\x32\x16\x16\x15\x14\x06\x06\x23\x23\x22\x0e\x03\x07\x06\x06\x16\
-\x17\x1e\x04\x33\x33\x32\x16\x16\x15\x14\x06\x06\x23\x25\x22\x26\
-\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x25\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x01\x60\x29\x48\x3d\x2e\x21\x09\x04\x03\x02\x02\x0a\x2c\x3a\
-\x40\x3f\x1a\x74\x16\x28\x19\x1b\x29\x17\x70\x07\x11\x14\x12\x0f\
-\x04\x06\x04\x04\x05\x06\x0f\x10\x12\x12\x09\x71\x17\x29\x1a\x19\
-\x27\x15\xfe\x69\x0e\x1b\x11\x13\x1b\x0b\x01\x7f\x0c\x1b\x13\x11\
-\x1b\x0e\xfe\x82\x0e\x1b\x11\x13\x1b\x0b\x01\x7f\x0c\x1b\x13\x11\
-\x1b\x0e\x07\x15\x2a\x3c\x4f\x30\x26\x4e\x4c\x22\x40\x5a\x39\x20\
-\x0d\x08\x26\x2d\x2d\x26\x07\x02\x07\x10\x1e\x18\x22\x4a\x48\x21\
-\x16\x1e\x11\x08\x02\x08\x26\x2d\x2b\x26\x08\xe7\x05\x19\x1e\x1d\
-\x17\x04\x05\x18\x1d\x1c\x19\x05\x99\x05\x19\x1d\x1d\x18\x05\x05\
-\x19\x1e\x1c\x18\x05\x00\x01\x00\x0e\xff\xab\x01\x86\x02\x76\x00\
-\x44\x00\x00\x57\x22\x26\x26\x35\x35\x2e\x02\x35\x34\x36\x36\x37\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x1e\x02\x17\x16\x16\x15\
-\x14\x06\x07\x06\x23\x22\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\
-\x33\x32\x36\x36\x33\x32\x16\x17\x16\x16\x15\x14\x06\x07\x0e\x02\
-\x07\x15\x14\x06\x06\xe3\x1f\x1b\x05\x2d\x44\x25\x25\x44\x2d\x05\
-\x1b\x1f\x20\x1a\x05\x0c\x14\x11\x05\x10\x1d\x09\x09\x1e\x1e\x10\
-\x17\x17\x13\x10\x1c\x10\x10\x1b\x10\x11\x18\x17\x0e\x0e\x1f\x12\
-\x0a\x0a\x18\x17\x09\x11\x11\x0a\x05\x1a\x55\x18\x24\x12\x45\x0c\
-\x3a\x55\x33\x34\x52\x38\x0b\x52\x14\x24\x17\x18\x24\x13\x52\x03\
-\x07\x07\x03\x09\x1c\x16\x0a\x18\x0e\x2e\x0f\x0f\x10\x1b\x11\x11\
-\x1b\x10\x0e\x0e\x14\x17\x0c\x17\x0b\x10\x20\x0e\x06\x0a\x05\x02\
-\x43\x13\x24\x17\x00\x00\x02\x00\x0b\xff\xf4\x02\x6b\x02\xde\x00\
-\x52\x00\x62\x00\x00\x77\x26\x26\x37\x3e\x02\x37\x2e\x02\x35\x34\
-\x36\x37\x26\x26\x27\x26\x36\x37\x36\x16\x17\x16\x16\x17\x1e\x02\
-\x33\x33\x32\x36\x36\x37\x36\x36\x37\x36\x36\x17\x16\x16\x07\x06\
-\x06\x07\x16\x16\x15\x14\x06\x06\x07\x1e\x02\x17\x16\x06\x07\x06\
-\x26\x27\x26\x26\x27\x2e\x02\x23\x23\x22\x0e\x02\x07\x06\x06\x07\
-\x06\x06\x37\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\
-\x16\x16\x39\x25\x09\x13\x07\x10\x15\x0c\x08\x1a\x13\x1c\x19\x0b\
-\x23\x0a\x10\x09\x20\x26\x2b\x13\x04\x08\x04\x02\x29\x3f\x23\x0c\
-\x26\x3b\x24\x03\x04\x07\x04\x15\x2a\x24\x25\x06\x11\x0b\x1b\x13\
-\x1a\x1b\x0c\x16\x11\x08\x15\x14\x05\x14\x09\x24\x25\x29\x14\x04\
-\x08\x04\x02\x27\x3f\x26\x13\x1c\x2c\x21\x15\x04\x04\x06\x04\x16\
-\x26\xd7\x2e\x39\x1a\x1a\x36\x2c\x2b\x37\x19\x1a\x35\x0b\x14\x30\
-\x1f\x0d\x19\x18\x09\x0b\x2f\x47\x2f\x38\x5e\x23\x0a\x27\x15\x20\
-\x2d\x15\x18\x11\x21\x07\x0c\x07\x06\x0a\x06\x06\x0a\x07\x06\x0c\
-\x06\x23\x0a\x13\x16\x2c\x21\x12\x26\x0e\x22\x5c\x37\x23\x40\x39\
-\x17\x08\x1a\x1a\x08\x22\x2a\x17\x19\x10\x22\x06\x0d\x05\x07\x0b\
-\x06\x03\x06\x09\x05\x07\x0c\x07\x24\x0a\xf5\x19\x37\x2c\x2c\x36\
-\x1a\x1a\x36\x2b\x2a\x37\x1c\x00\x01\x00\x0c\xff\xab\x01\xac\x02\
-\xda\x00\x54\x00\x00\x65\x14\x0e\x02\x07\x15\x14\x06\x06\x23\x22\
-\x26\x26\x35\x35\x2e\x02\x27\x26\x36\x37\x36\x36\x16\x17\x16\x16\
-\x33\x32\x36\x36\x35\x34\x26\x26\x27\x2e\x03\x35\x34\x3e\x02\x37\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x16\x16\x17\x16\x16\x07\
-\x06\x06\x26\x27\x2e\x02\x23\x22\x0e\x02\x15\x14\x16\x16\x17\x1e\
-\x03\x01\xac\x14\x25\x35\x21\x06\x1b\x20\x1f\x1b\x05\x19\x2d\x25\
-\x0f\x17\x06\x1f\x13\x25\x23\x0e\x11\x1c\x13\x15\x1a\x0c\x31\x4a\
-\x24\x13\x22\x1a\x0f\x12\x23\x31\x1f\x05\x1b\x20\x1f\x1b\x06\x17\
-\x24\x17\x1c\x05\x17\x0f\x21\x22\x14\x07\x0d\x15\x15\x08\x0e\x0b\
-\x07\x1f\x33\x1d\x1a\x33\x2a\x19\xe2\x25\x3b\x2d\x1e\x08\x36\x13\
-\x24\x17\x18\x24\x12\x36\x06\x16\x1e\x13\x20\x2b\x1e\x11\x05\x13\
-\x12\x14\x11\x0a\x15\x10\x12\x0f\x10\x11\x09\x1a\x25\x31\x21\x21\
-\x36\x29\x1c\x07\x2e\x13\x23\x17\x18\x23\x13\x2b\x04\x13\x13\x18\
-\x22\x22\x18\x14\x06\x0d\x05\x0c\x08\x05\x09\x0c\x06\x12\x12\x0a\
-\x06\x06\x14\x24\x3a\x00\x02\x00\x37\xff\xec\x03\x77\x02\x4a\x00\
-\x25\x00\x48\x00\x00\x45\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x15\x14\x1e\x02\x33\x32\x36\x36\x35\x35\x34\x36\x36\
-\x33\x32\x16\x16\x15\x15\x14\x0e\x02\x25\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x37\x32\x1e\x02\x15\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x35\x34\x26\x26\x23\x23\x11\x14\x06\x06\x02\x3b\x62\x89\x46\
-\x07\x25\x2e\x2e\x25\x07\x07\x18\x33\x2b\x2f\x3b\x1b\x09\x26\x2d\
-\x2e\x25\x08\x23\x4c\x78\xfe\x03\x2e\x26\x08\x08\x26\x2e\xca\x4f\
-\x74\x4d\x26\x07\x25\x2c\x2e\x26\x07\x13\x2a\x25\x8e\x09\x26\x14\
-\x40\x7e\x5c\x0f\x17\x2a\x1b\x1b\x2a\x18\x05\x1c\x29\x1a\x0c\x20\
-\x46\x37\xb2\x16\x27\x1a\x1c\x2a\x17\xb1\x3b\x77\x62\x3c\x0b\x1b\
-\x2a\x17\x01\x9b\x16\x2a\x1b\x01\x14\x39\x6c\x57\x05\x17\x30\x20\
-\x1e\x2d\x15\x09\x2b\x26\x0a\xfe\xc2\x18\x2a\x1b\x00\x00\x01\x00\
-\x05\xff\xf7\x02\x6f\x02\xb5\x00\x4b\x00\x00\x57\x22\x26\x35\x34\
-\x3e\x02\x35\x34\x26\x27\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\
-\x35\x34\x36\x37\x3e\x02\x33\x32\x1e\x02\x17\x16\x16\x07\x06\x26\
-\x27\x2e\x02\x23\x22\x06\x06\x15\x15\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x16\x16\x15\x14\x06\x06\x07\x33\x32\x16\x16\x15\x14\
-\x06\x06\x23\x96\x26\x2f\x12\x19\x12\x05\x02\x30\x10\x1e\x14\x16\
-\x21\x11\x0b\x0e\x0e\x15\x4b\x61\x37\x35\x4e\x36\x1c\x01\x1a\x02\
-\x1e\x1f\x43\x16\x02\x11\x26\x20\x23\x31\x19\x57\x11\x1f\x14\x14\
-\x1f\x10\x35\x02\x02\x02\x03\x03\xf9\x15\x27\x19\x1a\x27\x15\x09\
-\x2f\x26\x18\x1e\x1b\x25\x1e\x02\x19\x0a\x07\x1f\x22\x24\x1e\x06\
-\x14\x25\x3e\x1e\x2b\x3e\x22\x17\x1e\x18\x02\x1f\x3d\x1d\x1c\x01\
-\x1c\x02\x0e\x0d\x17\x2c\x20\x13\x06\x1e\x25\x22\x1e\x07\x0a\x1a\
-\x05\x09\x14\x14\x0a\x07\x24\x2b\x2a\x23\x07\x00\x03\x00\x00\xff\
-\xf5\x02\x7c\x02\xc4\x00\x19\x00\x2b\x00\x3b\x00\x00\x41\x16\x16\
-\x07\x03\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x03\x26\x36\x37\
-\x36\x16\x17\x17\x37\x36\x36\x01\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x25\x22\x26\x26\x35\x34\x36\
-\x33\x21\x32\x16\x15\x14\x06\x06\x23\x02\x48\x2c\x08\x1a\xc7\x08\
-\x26\x2e\x2e\x26\x08\xc7\x1c\x0c\x2b\x2f\x37\x1a\x88\x88\x1d\x35\
-\xfe\x8b\x10\x22\x18\x1a\x24\x10\x01\x27\x11\x23\x19\x17\x22\x11\
-\xfe\xd2\x10\x22\x18\x26\x24\x01\x2f\x26\x23\x17\x22\x11\x02\xa4\
-\x1e\x37\x26\xfe\xd6\xaf\x16\x2a\x1b\x1b\x2b\x17\xad\x01\x2a\x27\
-\x38\x1c\x20\x10\x29\xda\xda\x2c\x0a\xfd\x80\x05\x1a\x1d\x1d\x18\
-\x05\x05\x18\x1e\x1d\x19\x05\xa1\x05\x1a\x1d\x23\x18\x19\x23\x1d\
-\x19\x05\x00\x00\x02\x00\x0e\x00\x18\x01\xdc\x01\xe5\x00\x11\x00\
-\x23\x00\x00\x77\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x27\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\
-\x16\x16\x15\x14\x06\x06\x23\xf5\x29\x22\x07\x07\x23\x29\x29\x22\
-\x07\x07\x22\xc4\x12\x24\x17\x19\x27\x14\x01\x28\x14\x26\x18\x17\
-\x23\x13\x18\x19\x26\x14\x01\x29\x14\x25\x18\x18\x26\x14\xfe\xd7\
-\x14\x26\x18\x94\x07\x23\x29\x2a\x22\x07\x07\x23\x2a\x29\x22\x07\
-\x00\x00\x01\x00\x0e\x00\xaa\x02\x0e\x01\x53\x00\x11\x00\x00\x77\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x5c\x10\x24\x1a\x1a\x25\x10\x01\x62\x11\x25\x19\x19\x24\x13\
-\xaa\x07\x24\x2b\x2a\x22\x07\x07\x23\x2a\x2b\x23\x07\x00\x01\x00\
-\x0b\x00\x0e\x01\xdb\x01\xdc\x00\x27\x00\x00\x65\x17\x16\x16\x06\
-\x07\x06\x06\x26\x27\x27\x07\x06\x06\x26\x27\x26\x26\x36\x37\x37\
-\x27\x26\x26\x36\x37\x36\x36\x16\x17\x17\x37\x36\x36\x16\x17\x16\
-\x16\x06\x07\x01\x68\x4d\x17\x0f\x0e\x16\x16\x25\x25\x16\x4e\x4e\
-\x16\x25\x25\x16\x16\x0e\x10\x16\x4d\x50\x15\x0e\x0e\x16\x17\x25\
-\x25\x15\x4e\x4e\x15\x25\x26\x16\x16\x0e\x0e\x15\xf5\x4d\x15\x25\
-\x25\x16\x16\x0f\x0f\x16\x4e\x4e\x16\x0f\x0f\x16\x16\x25\x25\x15\
-\x4d\x50\x15\x24\x25\x16\x15\x0e\x0e\x15\x4e\x4e\x15\x0e\x0e\x15\
-\x16\x25\x24\x15\x00\x00\x03\x00\x0e\xff\xf9\x01\xc6\x02\x19\x00\
-\x11\x00\x1d\x00\x29\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x07\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x03\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\x58\x0f\x23\x18\x1a\x24\x10\x01\x1d\x10\x24\x19\x17\x24\x13\
-\x8f\x2f\x26\x26\x30\x2f\x25\x26\x2f\x2f\x26\x26\x30\x2f\x25\x26\
-\xbd\x07\x20\x26\x26\x1f\x06\x06\x20\x26\x25\x20\x07\xc4\x25\x2e\
-\x31\x26\x26\x30\x2f\x25\x01\x76\x25\x2e\x31\x26\x26\x30\x2f\x25\
-\x00\x00\x02\x00\x0e\x00\x50\x01\xaf\x01\xb3\x00\x11\x00\x23\x00\
-\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\
-\x06\x06\x23\x05\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x57\x0e\x22\x18\x18\x22\x0f\x01\x0d\x10\x22\
-\x18\x17\x23\x11\xfe\xf3\x0f\x22\x18\x19\x22\x0f\x01\x0d\x0f\x22\
-\x18\x17\x22\x11\x01\x15\x06\x22\x28\x27\x20\x07\x07\x20\x28\x28\
-\x21\x06\xc5\x06\x22\x28\x27\x21\x06\x07\x20\x28\x28\x21\x06\x00\
-\x01\x00\x03\xff\xf5\x02\x42\x02\x8c\x00\x19\x00\x00\x77\x06\x06\
-\x26\x27\x26\x36\x36\x37\x25\x25\x2e\x02\x37\x36\x36\x16\x17\x05\
-\x16\x16\x15\x14\x06\x07\x8d\x12\x25\x27\x16\x16\x04\x1e\x12\x01\
-\x14\xfe\xed\x12\x1e\x03\x14\x15\x27\x25\x12\x01\x8d\x0b\x1e\x1b\
-\x0d\x0c\x0b\x0c\x12\x23\x23\x2b\x1a\x0b\xa3\xa3\x0b\x1b\x2b\x22\
-\x24\x12\x0c\x0b\xec\x06\x1c\x25\x1c\x26\x08\x00\x01\x00\x05\xff\
-\xf5\x02\x44\x02\x8c\x00\x19\x00\x00\x65\x25\x26\x26\x35\x34\x36\
-\x37\x25\x36\x36\x16\x17\x16\x06\x06\x07\x05\x05\x1e\x02\x07\x06\
-\x06\x26\x01\xba\xfe\x73\x0d\x1b\x1f\x0a\x01\x8d\x12\x25\x27\x15\
-\x15\x04\x1e\x12\xfe\xed\x01\x14\x12\x1e\x04\x16\x15\x28\x25\x0c\
-\xec\x08\x26\x1c\x25\x1c\x06\xec\x0b\x0c\x12\x24\x22\x2b\x1b\x0b\
-\xa3\xa3\x0b\x1a\x2b\x23\x23\x12\x0c\x00\x03\x00\x19\xff\xf8\x01\
-\xb9\x02\x0d\x00\x11\x00\x23\x00\x35\x00\x00\x53\x22\x26\x26\x35\
-\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x07\x22\x26\
-\x26\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x14\x06\x06\x07\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x62\x0f\x22\x18\x19\x22\x0f\x01\x0c\x10\x22\x18\x17\x22\x12\
-\x86\x29\x22\x07\x07\x23\x29\x29\x22\x07\x07\x22\xb0\x0f\x22\x18\
-\x19\x22\x0f\x01\x0c\x10\x22\x18\x17\x22\x12\x01\x0c\x05\x1e\x25\
-\x25\x1e\x06\x06\x1f\x25\x24\x1e\x05\x68\x19\x26\x14\xc5\x14\x25\
-\x18\x18\x26\x14\xc5\x14\x26\x18\xac\x05\x1e\x25\x25\x1e\x06\x06\
-\x1f\x25\x24\x1e\x05\x00\x01\x00\x16\x00\x8a\x02\x13\x01\x69\x00\
-\x2c\x00\x00\x53\x32\x1e\x03\x33\x32\x3e\x02\x33\x32\x16\x17\x16\
-\x16\x15\x14\x0e\x02\x23\x22\x2e\x03\x23\x22\x0e\x02\x23\x22\x26\
-\x26\x27\x26\x26\x37\x3e\x03\xd4\x1b\x26\x1c\x14\x10\x08\x0e\x10\
-\x0d\x16\x14\x0c\x18\x0d\x19\x17\x22\x38\x41\x1e\x1b\x27\x1c\x15\
-\x11\x08\x0e\x0f\x0d\x15\x15\x08\x12\x13\x0a\x25\x08\x16\x04\x17\
-\x29\x3c\x01\x69\x0c\x10\x11\x0c\x11\x17\x11\x09\x0a\x10\x1f\x0f\
-\x17\x32\x2a\x1a\x0c\x11\x11\x0c\x12\x17\x12\x05\x0c\x08\x1f\x28\
-\x21\x05\x1e\x22\x19\x00\x01\x00\x05\x00\x6b\x01\xe5\x01\xa3\x00\
-\x16\x00\x00\x65\x22\x26\x26\x35\x35\x21\x22\x26\x26\x35\x34\x36\
-\x36\x33\x21\x32\x16\x15\x15\x14\x06\x06\x01\x9c\x24\x1e\x06\xfe\
-\xf8\x0f\x21\x17\x18\x23\x0f\x01\x49\x2b\x22\x07\x1e\x6b\x19\x22\
-\x0f\x3b\x08\x25\x2c\x2d\x25\x08\x23\x25\xa9\x0f\x21\x17\x00\x00\
-\x01\x00\x1a\x00\xdb\x01\xcf\x02\x02\x00\x19\x00\x00\x53\x32\x16\
-\x17\x17\x16\x16\x06\x07\x06\x06\x26\x27\x27\x07\x06\x06\x26\x27\
-\x26\x26\x36\x37\x37\x36\x36\xf5\x11\x19\x0a\x88\x0c\x12\x06\x1a\
-\x1a\x26\x1b\x0a\x55\x55\x0a\x1b\x25\x1b\x1a\x07\x13\x0b\x89\x09\
-\x19\x02\x02\x0f\x0a\x89\x0b\x1b\x25\x1a\x1a\x06\x12\x0a\x56\x56\
-\x0a\x12\x06\x1a\x1a\x25\x1b\x0b\x89\x0a\x0f\x00\x01\x00\x1c\xff\
-\x2a\x02\x13\x01\xf4\x00\x36\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x15\x14\x16\x16\x33\x32\x36\x36\x35\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x23\x22\x2e\
-\x02\x27\x17\x0e\x03\x23\x22\x26\x27\x15\x14\x06\x06\x75\x2c\x26\
-\x07\x07\x26\x2d\x2d\x25\x08\x11\x20\x16\x16\x20\x12\x07\x26\x2d\
-\x2d\x25\x08\x08\x25\x2e\x1d\x22\x12\x07\x01\x0f\x04\x0f\x18\x20\
-\x15\x13\x1f\x0c\x08\x26\xd6\x1b\x2a\x15\x02\x16\x16\x29\x1a\x1b\
-\x29\x16\xa2\x16\x1f\x11\x12\x20\x15\xa2\x17\x29\x1a\x1b\x2a\x16\
-\xfe\xbd\x16\x29\x1a\x0b\x12\x14\x09\x03\x06\x12\x13\x0c\x0a\x07\
-\x8b\x15\x29\x1b\x00\x00\x05\x00\x1c\xff\xda\x02\xef\x02\xe3\x00\
-\x11\x00\x1d\x00\x29\x00\x35\x00\x41\x00\x00\x57\x2e\x02\x37\x01\
-\x36\x36\x16\x17\x16\x16\x14\x07\x01\x06\x06\x26\x03\x22\x26\x35\
-\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\
-\x06\x15\x14\x16\x01\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\
-\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xc2\x0e\x11\x02\
-\x08\x01\x68\x08\x12\x18\x0f\x10\x10\x08\xfe\x96\x07\x11\x17\x0f\
-\x4b\x5b\x59\x4c\x4f\x58\x56\x51\x19\x16\x15\x1a\x19\x15\x15\x01\
-\xa2\x4b\x5c\x5a\x4c\x4f\x57\x55\x51\x1a\x15\x15\x1a\x19\x15\x15\
-\x1b\x08\x11\x16\x0d\x02\xa7\x0e\x0d\x02\x09\x09\x13\x13\x0c\xfd\
-\x55\x0e\x0a\x04\x01\x6a\x64\x52\x54\x64\x61\x56\x57\x60\x82\x1a\
-\x1c\x1d\x17\x17\x1d\x1d\x19\xfe\x2b\x64\x52\x55\x63\x60\x57\x58\
-\x5f\x82\x19\x1d\x1d\x17\x18\x1d\x1d\x18\x00\x00\x07\x00\x1c\xff\
-\xda\x04\x55\x02\xe3\x00\x11\x00\x1d\x00\x29\x00\x35\x00\x41\x00\
-\x4d\x00\x59\x00\x00\x57\x2e\x02\x37\x01\x36\x36\x16\x17\x16\x16\
-\x14\x07\x01\x06\x06\x26\x03\x22\x26\x35\x34\x36\x33\x32\x16\x15\
-\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\x01\x22\
-\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x35\x34\x26\
-\x23\x22\x06\x15\x14\x16\x05\x22\x26\x35\x34\x36\x33\x32\x16\x15\
-\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xc2\x0e\
-\x11\x02\x08\x01\x68\x08\x12\x18\x0f\x10\x10\x08\xfe\x96\x07\x11\
-\x17\x0f\x4b\x5b\x59\x4c\x4f\x58\x56\x51\x19\x16\x15\x1a\x19\x15\
-\x15\x01\xa4\x4b\x5c\x5a\x4c\x4f\x57\x55\x51\x1a\x15\x15\x1a\x19\
-\x15\x15\x01\x7e\x4b\x5c\x5a\x4c\x4f\x57\x55\x51\x19\x16\x15\x1b\
-\x19\x14\x15\x1b\x08\x11\x16\x0d\x02\xa7\x0e\x0d\x02\x09\x09\x13\
-\x13\x0c\xfd\x55\x0e\x0a\x04\x01\x6a\x64\x52\x54\x64\x61\x56\x57\
-\x60\x82\x1a\x1c\x1d\x17\x17\x1d\x1d\x19\xfe\x2b\x64\x52\x55\x63\
-\x60\x57\x58\x5f\x82\x19\x1d\x1d\x17\x18\x1d\x1d\x18\x82\x64\x52\
-\x55\x63\x61\x56\x58\x5f\x82\x1a\x1c\x1e\x16\x18\x1d\x1d\x18\x00\
-\x01\x00\x17\x02\x15\x00\x7c\x02\x7f\x00\x0b\x00\x00\x53\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x49\x14\x1e\x1e\x14\x14\x1f\
-\x1e\x02\x15\x20\x16\x15\x1f\x1f\x15\x16\x20\x00\x02\x00\x17\xff\
-\x1b\x00\x7c\xff\xf8\x00\x0b\x00\x17\x00\x00\x57\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x49\x14\x1e\x1f\x13\x15\x1e\x1e\x15\x14\x1e\x1e\x14\
-\x15\x1e\x1e\xe5\x1e\x16\x15\x21\x20\x16\x16\x1e\x75\x1e\x16\x16\
-\x1e\x1e\x16\x16\x1e\x00\x05\x00\x2a\xff\x1b\x01\x8b\xff\xf8\x00\
-\x0b\x00\x17\x00\x23\x00\x2f\x00\x3b\x00\x00\x45\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x33\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x33\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x01\x59\x15\x1d\x1e\x14\x15\x1d\x1d\
-\xd6\x16\x1e\x20\x14\x14\x1c\x1c\x4e\x15\x1f\x1f\x15\x14\x1c\x1c\
-\x61\x15\x1d\x1d\x15\x15\x1d\x1d\x71\x15\x1d\x1d\x15\x15\x1d\x1d\
-\xe5\x1e\x16\x15\x21\x20\x16\x16\x1e\x1e\x16\x15\x21\x20\x16\x16\
-\x1e\x75\x1e\x16\x15\x1f\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x1e\x16\
-\x16\x1e\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x00\x00\x03\x00\x4f\xff\
-\x1b\x01\x7c\xff\xf8\x00\x0d\x00\x19\x00\x25\x00\x00\x57\x22\x35\
-\x35\x34\x36\x33\x33\x32\x16\x15\x15\x14\x23\x17\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x70\x21\x12\x0f\x6b\x0f\x12\x21\x6f\x15\x1d\x1e\x14\
-\x15\x1d\x1d\x15\x15\x1d\x1d\x15\x15\x1d\x1d\x58\x20\x04\x0f\x12\
-\x12\x0f\x04\x20\x8d\x1e\x16\x15\x21\x20\x16\x16\x1e\x75\x1e\x16\
-\x16\x1e\x1e\x16\x16\x1e\x00\x00\x03\x00\x3c\xff\x1b\x01\x7c\xff\
-\xf8\x00\x17\x00\x23\x00\x2f\x00\x00\x57\x22\x26\x37\x37\x23\x22\
-\x35\x35\x34\x36\x33\x33\x32\x16\x15\x15\x14\x23\x23\x17\x16\x06\
-\x23\x17\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x9a\x10\x11\x02\x09\x27\x21\
-\x12\x0f\x7e\x0f\x12\x21\x26\x07\x02\x11\x10\xad\x15\x1d\x1e\x14\
-\x15\x1d\x1d\x15\x15\x1d\x1d\x15\x15\x1d\x1d\xbe\x13\x10\x43\x20\
-\x04\x0f\x12\x12\x0f\x04\x20\x44\x0f\x13\x27\x1e\x16\x15\x21\x20\
-\x16\x16\x1e\x75\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x00\x00\x01\x00\
-\x17\xff\x8b\x00\x7c\xff\xf3\x00\x0b\x00\x00\x57\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x49\x14\x1e\x1e\x14\x15\x1e\x1e\x75\
-\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x00\x00\x02\x00\x2a\xff\x8b\x01\
-\x09\xff\xf3\x00\x0b\x00\x17\x00\x00\x57\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x23\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\xd7\x15\x1d\x1d\x15\x15\x1d\x1d\x8e\x15\x1f\x1f\x15\x14\x1c\
-\x1c\x75\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x1f\x15\x15\x1f\x1e\x16\
-\x15\x1f\x00\x00\x03\x00\x2a\xff\x1b\x01\x05\xff\xf8\x00\x0b\x00\
-\x17\x00\x23\x00\x00\x57\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x33\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x98\x16\x1e\x20\x14\x14\x1c\
-\x1c\x4e\x15\x1f\x1f\x15\x14\x1c\x1c\x61\x15\x1d\x1d\x15\x15\x1d\
-\x1d\xe5\x1e\x16\x15\x21\x20\x16\x16\x1e\x75\x1e\x16\x15\x1f\x1e\
-\x16\x16\x1e\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x00\x01\x00\x3c\xff\
-\xa8\x00\xe9\xff\xed\x00\x0c\x00\x00\x57\x22\x35\x35\x34\x36\x33\
-\x33\x32\x15\x15\x14\x23\x5d\x21\x12\x0f\x6c\x20\x20\x58\x20\x04\
-\x0f\x12\x21\x04\x20\x00\x01\x00\x33\xff\x42\x00\xf3\xff\xed\x00\
-\x17\x00\x00\x57\x22\x26\x37\x37\x23\x22\x35\x35\x34\x36\x33\x33\
-\x32\x16\x15\x15\x14\x23\x23\x17\x16\x06\x23\x91\x10\x11\x02\x08\
-\x26\x21\x12\x0f\x7e\x0f\x12\x21\x27\x07\x02\x10\x10\xbe\x13\x10\
-\x43\x20\x04\x0f\x12\x12\x0f\x04\x20\x44\x0f\x13\x00\x00\x01\x00\
-\x17\x02\x19\x00\x7c\x02\x83\x00\x0b\x00\x00\x53\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x49\x15\x1d\x1e\x14\x15\x1e\x1c\x02\
-\x19\x1f\x17\x15\x1f\x1f\x15\x17\x1f\x00\x01\x00\x17\x02\x19\x00\
-\x7c\x02\x83\x00\x0b\x00\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x49\x14\x1e\x1e\x14\x14\x1f\x1e\x02\x19\x20\x16\x15\
-\x1f\x1f\x15\x16\x20\x00\x03\x00\x18\xff\x07\x01\x2a\x00\x04\x00\
-\x0b\x00\x17\x00\x23\x00\x00\x57\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x17\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\xf7\x15\x1d\x1d\x15\
-\x15\x1e\x1e\xc0\x15\x1f\x1f\x15\x15\x1c\x1c\x41\x15\x1d\x1d\x15\
-\x15\x1d\x1d\xf9\x1e\x16\x16\x1e\x1e\x16\x16\x1e\x95\x1f\x15\x15\
-\x1f\x1e\x16\x16\x1e\x4b\x1f\x16\x15\x1f\x1f\x16\x15\x1f\x00\x00\
-\x01\x00\x21\x00\xfd\x00\x72\x01\x53\x00\x0b\x00\x00\x77\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x49\x11\x17\x18\x10\x11\x18\
-\x17\xfd\x19\x13\x11\x19\x19\x11\x13\x19\x00\x00\x01\x00\x21\x02\
-\x27\x00\xca\x02\x4d\x00\x03\x00\x00\x53\x35\x33\x15\x21\xa9\x02\
-\x27\x26\x26\x00\x01\x00\x17\x02\x15\x00\x7c\x02\x7f\x00\x0b\x00\
-\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x49\x14\x1e\
-\x1e\x14\x14\x1f\x1e\x02\x15\x20\x16\x15\x1f\x1f\x15\x16\x20\x00\
-\x01\x00\x17\xff\x1e\x00\xb0\xff\xf6\x00\x19\x00\x00\x57\x22\x26\
-\x37\x37\x23\x22\x26\x35\x35\x34\x36\x33\x33\x32\x16\x15\x15\x14\
-\x06\x23\x23\x17\x16\x06\x23\x63\x10\x11\x01\x0d\x18\x0f\x12\x12\
-\x0f\x57\x0f\x12\x12\x0f\x19\x0e\x02\x11\x11\xe2\x13\x10\x72\x12\
-\x0f\x01\x0f\x12\x12\x0f\x01\x0f\x12\x72\x10\x13\x00\x00\x02\x00\
-\x2d\x02\x20\x01\xe1\x02\xd8\x00\x0f\x00\x1f\x00\x00\x41\x22\x26\
-\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x21\x22\x26\
-\x26\x35\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x01\x84\x2e\x26\
-\x08\x08\x27\x2e\x2e\x26\x08\x08\x26\xfe\xd6\x2e\x26\x08\x01\x07\
-\x27\x2e\x2e\x26\x08\x08\x26\x02\x20\x1b\x2b\x17\x17\x2a\x1a\x1b\
-\x2b\x17\x16\x2a\x1b\x1b\x2b\x17\x17\x2a\x1a\x1b\x2b\x17\x16\x2a\
-\x1b\x00\x01\x00\x2d\x02\x84\x00\xe2\x03\x3a\x00\x0f\x00\x00\x53\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x87\
-\x2d\x25\x08\x08\x26\x2d\x2d\x25\x08\x08\x25\x02\x84\x1c\x2a\x16\
-\x16\x29\x1b\x1c\x29\x16\x16\x2a\x1b\x00\x01\x00\x2f\x02\x06\x01\
-\x5c\x02\xdc\x00\x0d\x00\x00\x53\x27\x26\x26\x37\x36\x36\x17\x17\
-\x16\x16\x07\x06\x06\xfe\x9d\x25\x0d\x0c\x0d\x22\x25\x99\x25\x0f\
-\x0d\x0d\x21\x02\x0d\x32\x0d\x28\x28\x2c\x14\x0a\x2f\x0c\x29\x29\
-\x2b\x14\x00\x00\x01\x00\x7e\x02\x08\x01\xad\x02\xd9\x00\x0d\x00\
-\x00\x53\x22\x26\x27\x26\x36\x37\x37\x32\x16\x17\x16\x06\x07\xc1\
-\x12\x1a\x0a\x0d\x10\x24\xb8\x12\x1a\x09\x0e\x12\x22\x02\x08\x1e\
-\x1f\x2a\x29\x0b\x36\x1e\x1f\x28\x2a\x0b\x00\x00\x02\xff\xfe\x02\
-\x21\x01\xd6\x03\x45\x00\x0d\x00\x1b\x00\x00\x41\x06\x26\x27\x26\
-\x26\x37\x37\x36\x16\x17\x16\x16\x07\x05\x06\x26\x27\x26\x26\x37\
-\x37\x36\x16\x17\x16\x16\x07\x01\x5f\x0d\x27\x1d\x25\x0f\x13\x66\
-\x0d\x28\x1b\x25\x0e\x12\xfe\xbf\x0d\x27\x1d\x25\x0f\x13\x66\x0d\
-\x28\x1b\x25\x0e\x12\x02\x2d\x0c\x04\x11\x17\x29\x21\xa2\x0c\x05\
-\x11\x15\x2b\x1f\xa3\x0c\x04\x11\x17\x29\x21\xa2\x0c\x05\x11\x15\
-\x2b\x1f\x00\x00\x01\x00\x53\x02\x0d\x01\xe3\x02\xd8\x00\x15\x00\
-\x00\x41\x32\x16\x17\x17\x16\x16\x07\x06\x06\x27\x27\x07\x06\x26\
-\x27\x26\x36\x37\x37\x36\x36\x01\x1c\x08\x0d\x03\x81\x20\x0e\x10\
-\x0d\x22\x11\x77\x76\x13\x21\x0e\x11\x0d\x21\x82\x02\x0f\x02\xd8\
-\x04\x01\x2b\x0a\x34\x20\x1b\x22\x07\x2d\x2b\x07\x23\x19\x20\x32\
-\x0b\x2b\x01\x04\x00\x00\x01\x00\x51\x02\x15\x01\xe2\x02\xdb\x00\
-\x17\x00\x00\x41\x37\x36\x36\x16\x17\x16\x06\x07\x07\x22\x06\x23\
-\x22\x26\x23\x27\x26\x26\x37\x36\x36\x16\x17\x01\x19\x4d\x0d\x24\
-\x28\x12\x11\x10\x20\x81\x03\x0d\x08\x08\x0e\x02\x81\x1f\x10\x10\
-\x12\x23\x20\x0c\x02\xac\x22\x05\x08\x13\x25\x23\x31\x0a\x2b\x05\
-\x05\x2b\x09\x34\x21\x24\x14\x05\x04\x00\x01\x00\x0c\x02\x35\x01\
-\x54\x02\xd8\x00\x17\x00\x00\x53\x22\x26\x27\x26\x36\x33\x33\x32\
-\x17\x16\x16\x33\x32\x36\x37\x36\x33\x33\x32\x16\x07\x06\x06\xb0\
-\x3c\x58\x0c\x04\x0f\x17\x2a\x18\x04\x03\x1d\x18\x17\x1d\x03\x04\
-\x18\x2b\x16\x10\x04\x0a\x5a\x02\x35\x48\x36\x14\x11\x15\x15\x1c\
-\x1c\x15\x15\x12\x14\x35\x48\x00\x02\x00\x2f\x02\x0d\x01\x31\x03\
-\x10\x00\x0f\x00\x1b\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\
-\x32\x16\x16\x15\x14\x06\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\
-\x15\x14\x16\xb0\x23\x3b\x23\x23\x3a\x23\x24\x3b\x23\x23\x3a\x24\
-\x14\x1b\x1b\x15\x13\x1c\x1c\x02\x0d\x23\x3b\x23\x24\x3b\x23\x22\
-\x3b\x24\x24\x3b\x23\x52\x1c\x15\x14\x1a\x1b\x14\x15\x1b\x00\x00\
-\x01\x00\x41\x02\x19\x01\xc7\x02\xd8\x00\x22\x00\x00\x53\x32\x16\
-\x16\x33\x32\x36\x36\x33\x32\x16\x17\x16\x16\x07\x0e\x02\x23\x22\
-\x26\x26\x23\x22\x06\x07\x06\x06\x27\x26\x26\x37\x3e\x02\xd3\x1a\
-\x1b\x13\x0b\x0f\x12\x15\x13\x0a\x14\x0b\x21\x0e\x12\x0c\x2b\x32\
-\x17\x19\x1d\x14\x0c\x1b\x1a\x08\x0a\x13\x1c\x1f\x09\x13\x0e\x2c\
-\x31\x02\xd8\x18\x18\x18\x18\x08\x08\x16\x29\x1d\x14\x26\x17\x19\
-\x19\x15\x0a\x0d\x08\x16\x18\x26\x1c\x14\x24\x17\x00\x00\x01\x00\
-\x83\x02\x31\x01\xce\x02\xa0\x00\x11\x00\x00\x53\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\x06\x23\xb6\x0a\x18\
-\x11\x11\x18\x0a\xe5\x0b\x17\x11\x10\x17\x0c\x02\x31\x05\x18\x1c\
-\x1b\x17\x04\x05\x16\x1c\x1c\x17\x05\x00\x01\x00\x42\xff\x40\x01\
-\x06\x00\x1e\x00\x25\x00\x00\x57\x22\x26\x27\x34\x37\x36\x36\x33\
-\x32\x16\x33\x32\x36\x35\x34\x26\x23\x22\x06\x23\x22\x26\x27\x26\
-\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x95\x1d\x32\
-\x04\x0b\x0b\x10\x08\x0d\x0c\x0e\x05\x12\x12\x06\x0a\x11\x0d\x0c\
-\x11\x05\x04\x06\x1b\x27\x12\x17\x34\x25\x20\x34\xc0\x1d\x16\x0f\
-\x0c\x0d\x0b\x0e\x0a\x0d\x0e\x0a\x0f\x12\x07\x08\x0d\x06\x0f\x17\
-\x0c\x18\x30\x26\x21\x32\x1d\x00\x01\x00\x37\xff\x3f\x00\xfd\x00\
-\x1e\x00\x25\x00\x00\x57\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\
-\x17\x16\x06\x07\x06\x06\x23\x22\x26\x23\x22\x06\x15\x14\x16\x33\
-\x32\x36\x33\x32\x16\x17\x16\x16\x07\x06\x06\xa8\x2e\x43\x25\x35\
-\x16\x13\x25\x1a\x02\x02\x05\x06\x05\x11\x0d\x0b\x12\x0b\x06\x12\
-\x12\x06\x0e\x09\x0f\x09\x11\x0a\x06\x06\x02\x02\x35\xc1\x40\x30\
-\x26\x31\x18\x0d\x14\x0b\x07\x11\x09\x08\x12\x0f\x0a\x0e\x0d\x0a\
-\x0e\x0b\x0d\x07\x10\x08\x13\x1c\x00\xff\xff\x00\x2d\x02\x20\x01\
-\xe1\x02\xd8\x04\x06\x01\x2d\x00\x00\xff\xff\x00\x2d\x02\x84\x00\
-\xe2\x03\x3a\x04\x06\x01\x2e\x00\x00\xff\xff\x00\x2f\x02\x06\x01\
-\x5c\x02\xdc\x04\x06\x01\x2f\x00\x00\xff\xff\x00\x7e\x02\x08\x01\
-\xad\x02\xd9\x04\x06\x01\x30\x00\x00\x00\x02\xff\xfe\x02\x21\x01\
-\xd6\x03\x45\x00\x0d\x00\x1b\x00\x00\x41\x06\x26\x27\x26\x26\x37\
-\x37\x36\x16\x17\x16\x16\x07\x05\x06\x26\x27\x26\x26\x37\x37\x36\
-\x16\x17\x16\x16\x07\x01\x5f\x0d\x27\x1d\x25\x0f\x13\x66\x0d\x28\
-\x1b\x25\x0e\x12\xfe\xbf\x0d\x27\x1d\x25\x0f\x13\x66\x0d\x28\x1b\
-\x25\x0e\x12\x02\x2d\x0c\x04\x11\x17\x29\x21\xa2\x0c\x05\x11\x15\
-\x2b\x1f\xa3\x0c\x04\x11\x17\x29\x21\xa2\x0c\x05\x11\x15\x2b\x1f\
-\x00\xff\xff\x00\x53\x02\x0d\x01\xe3\x02\xd8\x04\x06\x01\x32\x00\
-\x00\xff\xff\x00\x51\x02\x15\x01\xe2\x02\xdb\x04\x06\x01\x33\x00\
-\x00\xff\xff\x00\x0c\x02\x35\x01\x54\x02\xd8\x04\x06\x01\x34\x00\
-\x00\xff\xff\x00\x2f\x02\x0d\x01\x31\x03\x10\x04\x06\x01\x35\x00\
-\x00\xff\xff\x00\x41\x02\x19\x01\xc7\x02\xd8\x04\x06\x01\x36\x00\
-\x00\xff\xff\x00\x83\x02\x31\x01\xce\x02\xa0\x04\x06\x01\x37\x00\
-\x00\xff\xff\x00\x42\xff\x40\x01\x06\x00\x1e\x04\x06\x01\x38\x00\
-\x00\xff\xff\x00\x37\xff\x3f\x00\xfd\x00\x1e\x04\x06\x01\x39\x00\
-\x00\x00\x00\
-\x00\x00\xc2\xec\
-\x00\
-\x01\x00\x00\x00\x10\x01\x00\x00\x04\x00\x00\x47\x44\x45\x46\x0d\
-\x67\x0d\x62\x00\x00\x02\x38\x00\x00\x00\xaa\x47\x50\x4f\x53\x83\
-\x50\x8c\x58\x00\x00\x1c\x3c\x00\x00\x2f\x42\x47\x53\x55\x42\x7b\
-\xae\x8d\x69\x00\x00\x02\xe4\x00\x00\x02\x74\x4f\x53\x2f\x32\x7e\
-\xe9\x3b\xd7\x00\x00\x01\xd8\x00\x00\x00\x60\x53\x54\x41\x54\xf3\
-\xcb\xdf\x0e\x00\x00\x01\x98\x00\x00\x00\x40\x63\x6d\x61\x70\x6b\
-\x7d\x7d\xb8\x00\x00\x07\xe8\x00\x00\x03\xa6\x67\x61\x73\x70\x00\
-\x00\x00\x10\x00\x00\x01\x14\x00\x00\x00\x08\x67\x6c\x79\x66\x47\
-\xdb\x89\x47\x00\x00\x4b\x80\x00\x00\x77\x6c\x68\x65\x61\x64\x15\
-\xa7\x92\x2b\x00\x00\x01\x60\x00\x00\x00\x36\x68\x68\x65\x61\x07\
-\xcc\x03\x2f\x00\x00\x01\x3c\x00\x00\x00\x24\x68\x6d\x74\x78\x71\
-\xe1\x21\x81\x00\x00\x0b\x90\x00\x00\x05\x1c\x6c\x6f\x63\x61\x47\
-\xdf\x65\x53\x00\x00\x05\x58\x00\x00\x02\x90\x6d\x61\x78\x70\x01\
-\x56\x00\xe3\x00\x00\x01\x1c\x00\x00\x00\x20\x6e\x61\x6d\x65\xa8\
-\xf4\xea\x77\x00\x00\x10\xac\x00\x00\x05\xbe\x70\x6f\x73\x74\xcf\
-\x9d\x91\x4e\x00\x00\x16\x6c\x00\x00\x05\xcf\x70\x72\x65\x70\x68\
-\x06\x8c\x85\x00\x00\x01\x0c\x00\x00\x00\x07\xb8\x01\xff\x85\xb0\
-\x04\x8d\x00\x00\x01\x00\x01\xff\xff\x00\x0f\x00\x01\x00\x00\x01\
-\x47\x00\x7d\x00\x07\x00\x64\x00\x04\x00\x01\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x03\x00\x01\x00\x01\x00\x00\x03\
-\xce\xff\x14\x00\x00\x04\x8c\xff\x8c\xfe\x47\x04\x6f\x00\x01\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x47\x00\
-\x01\x00\x00\x00\x02\x00\x42\xcd\x51\x53\xfc\x5f\x0f\x3c\xf5\x00\
-\x03\x03\xe8\x00\x00\x00\x00\xd4\x4d\xdc\xd8\x00\x00\x00\x00\xde\
-\x46\x71\x4a\xff\x8c\xff\x0a\x04\x6f\x03\xda\x00\x00\x00\x06\x00\
-\x02\x00\x00\x00\x00\x00\x00\x00\x01\x00\x01\x00\x08\x00\x02\x00\
-\x00\x00\x14\x00\x02\x00\x00\x00\x24\x00\x02\x77\x67\x68\x74\x01\
-\x00\x00\x00\x77\x64\x74\x68\x01\x01\x00\x01\x00\x10\x00\x04\x00\
-\x01\x00\x01\x00\x02\x01\x0e\x00\x64\x00\x00\x00\x01\x00\x00\x00\
-\x00\x01\x05\x02\x58\x00\x00\x00\x04\x02\x1b\x02\x58\x00\x05\x00\
-\x00\x02\x8a\x02\x58\x00\x00\x00\x4b\x02\x8a\x02\x58\x00\x00\x01\
-\x5e\x00\x32\x01\x2c\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x80\x00\x08\x6f\x40\x00\x00\x4a\x00\x00\x00\x00\x00\x00\x00\
-\x00\x73\x73\x64\x65\x00\xc0\x00\x20\xfb\x4b\x03\xce\xff\x14\x00\
-\x00\x03\xe7\x00\xfc\x00\x00\x00\x21\x00\x00\x00\x00\x01\xf4\x02\
-\xbc\x00\x00\x00\x20\x00\x04\x00\x01\x00\x02\x00\x6a\x00\x00\x00\
-\x0e\x00\x00\x00\x92\x00\x14\x00\x08\x00\x54\x00\x46\x00\x54\x00\
-\x3e\x00\x36\x00\x2e\x00\x26\x00\x1e\x00\x02\x00\x01\x00\x7d\x00\
-\x84\x00\x00\x00\x01\x00\x04\x00\x01\x01\x62\x00\x01\x00\x04\x00\
-\x01\x01\x21\x00\x01\x00\x04\x00\x01\x00\xf3\x00\x01\x00\x04\x00\
-\x01\x01\x60\x00\x01\x00\x04\x00\x01\x01\x71\x00\x02\x00\x0a\x00\
-\x06\x00\x01\x02\x74\x00\x01\x01\x3a\x00\x01\x00\x04\x00\x01\x01\
-\x65\x00\x02\x00\x06\x00\x01\x00\x49\x00\x01\x00\x4b\x00\x58\x00\
-\x01\x00\x5a\x00\x7c\x00\x01\x00\x7d\x00\x84\x00\x02\x00\x87\x00\
-\xbe\x00\x01\x01\x1c\x01\x39\x00\x03\x00\x01\x00\x01\x00\x00\x00\
-\x08\x00\x02\x00\x02\x01\x2a\x01\x2a\x00\x00\x01\x2d\x01\x37\x00\
-\x01\x00\x00\x00\x01\x00\x00\x00\x0a\x00\x4a\x00\xae\x00\x03\x44\
-\x46\x4c\x54\x00\x2c\x68\x65\x62\x72\x00\x2c\x6c\x61\x74\x6e\x00\
-\x14\x00\x04\x00\x00\x00\x00\xff\xff\x00\x07\x00\x00\x00\x02\x00\
-\x03\x00\x04\x00\x05\x00\x06\x00\x07\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x05\x00\x00\x00\x01\x00\x03\x00\x06\x00\x07\x00\x08\x61\
-\x61\x6c\x74\x00\x5e\x63\x63\x6d\x70\x00\x58\x63\x63\x6d\x70\x00\
-\x50\x64\x6c\x69\x67\x00\x4a\x66\x72\x61\x63\x00\x44\x6c\x69\x67\
-\x61\x00\x3e\x6f\x72\x64\x6e\x00\x38\x73\x75\x70\x73\x00\x32\x00\
-\x00\x00\x01\x00\x01\x00\x00\x00\x01\x00\x05\x00\x00\x00\x01\x00\
-\x03\x00\x00\x00\x01\x00\x02\x00\x00\x00\x01\x00\x07\x00\x00\x00\
-\x02\x00\x04\x00\x04\x00\x00\x00\x01\x00\x04\x00\x00\x00\x01\x00\
-\x00\x00\x08\x01\x98\x01\x80\x01\x28\x00\xbc\x00\x96\x00\x4e\x00\
-\x2c\x00\x12\x00\x04\x00\x08\x00\x01\x00\x08\x00\x01\x01\x02\x00\
-\x04\x00\x0e\x00\xcc\x00\xc2\x00\xb8\x00\x01\x00\xd4\x00\x01\x00\
-\x00\x00\x01\x00\x08\x00\x02\x00\x0e\x00\x04\x00\x85\x00\x86\x00\
-\x85\x00\x86\x00\x01\x00\x04\x00\x01\x00\x22\x00\x3e\x00\x60\x00\
-\x06\x00\x00\x00\x02\x00\x24\x00\x0a\x00\x03\x00\x01\x00\x34\x00\
-\x01\x00\x12\x00\x00\x00\x01\x00\x00\x00\x06\x00\x01\x00\x02\x00\
-\x22\x00\x60\x00\x03\x00\x01\x00\x1a\x00\x01\x00\x12\x00\x00\x00\
-\x01\x00\x00\x00\x06\x00\x01\x00\x02\x00\x01\x00\x3e\x00\x02\x00\
-\x01\x00\xbf\x00\xc8\x00\x00\x00\x02\x00\x00\x00\x01\x00\x08\x00\
-\x01\x00\x0a\x00\x02\x00\x18\x00\x12\x00\x01\x00\x02\x00\x80\x00\
-\x81\x00\x02\x00\x50\x00\x5b\x00\x02\x00\x50\x00\x53\x00\x04\x00\
-\x00\x00\x01\x00\x08\x00\x01\x00\x58\x00\x04\x00\x2c\x00\x22\x00\
-\x18\x00\x0e\x00\x01\x00\x04\x00\x84\x00\x02\x00\x6f\x00\x01\x00\
-\x04\x00\x83\x00\x02\x00\x5b\x00\x01\x00\x04\x00\x82\x00\x02\x00\
-\x59\x00\x05\x00\x24\x00\x1e\x00\x18\x00\x12\x00\x0c\x00\x7f\x00\
-\x02\x00\x6f\x00\x81\x00\x02\x00\x5b\x00\x80\x00\x02\x00\x53\x00\
-\x7d\x00\x02\x00\x50\x00\x7e\x00\x03\x00\x50\x00\x53\x00\x01\x00\
-\x04\x00\x50\x00\x59\x00\x5b\x00\x6f\x00\x04\x00\x00\x00\x01\x00\
-\x08\x00\x01\x00\x46\x00\x03\x00\x2e\x00\x18\x00\x0c\x00\x01\x00\
-\x04\x00\xcc\x00\x03\x00\xe2\x00\xc3\x00\x02\x00\x0e\x00\x06\x00\
-\xca\x00\x03\x00\xe2\x00\xc1\x00\xcb\x00\x03\x00\xe2\x00\xc3\x00\
-\x02\x00\x0e\x00\x06\x01\x1a\x00\x03\x00\xe2\x00\xbf\x01\x1b\x00\
-\x04\x00\xe2\x00\xbf\x00\xbf\x00\x01\x00\x03\x00\xbf\x00\xc0\x00\
-\xc2\x00\x01\x00\x00\x00\x01\x00\x08\x00\x01\x00\x06\x00\x0d\x00\
-\x01\x00\x03\x00\xc0\x00\xc1\x00\xc2\x00\x01\x00\x00\x00\x01\x00\
-\x08\x00\x02\x00\x14\x00\x07\x00\x85\x00\x86\x00\x85\x00\x86\x00\
-\xcd\x00\xce\x00\xcf\x00\x01\x00\x07\x00\x01\x00\x22\x00\x3e\x00\
-\x60\x00\xc0\x00\xc1\x00\xc2\x00\x00\x00\x15\x00\x4a\x00\x56\x00\
-\x62\x00\x6e\x00\x7a\x00\x86\x00\x92\x00\xe4\x01\x33\x01\x8b\x01\
-\x97\x01\xc7\x01\xd2\x02\x0b\x02\x17\x02\x23\x02\x2f\x02\x3b\x02\
-\x6d\x02\xc9\x03\x07\x03\x26\x03\x32\x03\x3e\x03\x4a\x03\x56\x03\
-\x92\x03\xcc\x03\xf2\x04\x2f\x04\x78\x04\xb1\x04\xbd\x04\xf7\x05\
-\x03\x05\x0f\x05\x1b\x05\x27\x05\x79\x05\x85\x05\xd1\x06\x07\x06\
-\x43\x06\x8c\x06\xd5\x07\x38\x07\x44\x07\x71\x07\xa9\x07\xb5\x07\
-\xc1\x07\xcd\x07\xd9\x08\x06\x08\x53\x08\x8f\x08\xbf\x08\xcb\x08\
-\xd7\x09\x0c\x09\x18\x09\x62\x09\x6e\x09\x79\x09\x85\x09\x90\x09\
-\x9c\x09\xa7\x0a\x39\x0a\x87\x0a\xd5\x0a\xe1\x0b\x2f\x0b\x9f\x0b\
-\xe7\x0b\xf3\x0b\xfe\x0c\x0a\x0c\x15\x0c\x58\x0c\xba\x0c\xf7\x0d\
-\x2c\x0d\x4b\x0d\x56\x0d\x62\x0d\x6d\x0d\x78\x0d\xb3\x0d\xee\x0e\
-\x1a\x0e\x5d\x0e\xbd\x0f\x00\x0f\x0b\x0f\x40\x0f\x4c\x0f\x57\x0f\
-\x63\x0f\x6e\x0f\xc3\x0f\xce\x10\x44\x10\x92\x10\xe0\x11\x2f\x11\
-\x6b\x11\xc9\x11\xd4\x12\x36\x12\x7a\x12\xbd\x12\xc9\x12\xd4\x12\
-\xe0\x12\xeb\x13\x15\x13\x5d\x13\x9f\x13\xcc\x13\xd8\x13\xe4\x14\
-\x16\x14\x21\x14\x9c\x15\x45\x15\xbb\x15\xc7\x15\xd3\x16\x4d\x16\
-\x9e\x17\x11\x17\x58\x17\x84\x17\xd3\x17\xdf\x17\xeb\x17\xf7\x18\
-\x3b\x18\x47\x18\x97\x18\xa2\x18\xd1\x18\xdc\x19\x1e\x19\x2a\x19\
-\x49\x19\x54\x19\x5f\x19\x9c\x19\xa7\x19\xdb\x1a\x18\x1a\x24\x1a\
-\x42\x1a\x4d\x1a\x7a\x1a\x86\x1a\xc6\x1a\xd2\x1b\x0e\x1b\x19\x1b\
-\x50\x1b\xa4\x1b\xb0\x1b\xcf\x1c\x08\x1c\x13\x1c\x3f\x1c\x4b\x1c\
-\x90\x1c\xd0\x1c\xdc\x1d\x25\x1d\x31\x1d\x72\x1d\xb8\x1d\xc4\x1e\
-\x16\x1e\x22\x1e\x4e\x1e\x59\x1e\xaf\x1e\xbb\x1e\xc6\x1e\xd6\x1e\
-\xe5\x1e\xf1\x1f\x31\x1f\x3d\x1f\x7a\x1f\xaa\x1f\xf8\x20\x5d\x20\
-\x96\x20\xfb\x21\x46\x21\x7a\x21\xe0\x22\x2b\x22\x4e\x22\xdc\x23\
-\x56\x23\xfa\x24\x25\x24\x70\x24\xce\x24\xce\x24\xce\x24\xd7\x24\
-\xe4\x25\x02\x25\x1b\x25\x4c\x25\x78\x25\xbc\x25\xcc\x25\xfd\x26\
-\x2f\x26\x86\x26\xde\x26\xf4\x27\x10\x27\x51\x27\xc0\x27\xe1\x28\
-\x01\x28\x1f\x28\x3d\x28\x5b\x28\x79\x28\xaf\x28\xe5\x29\x40\x29\
-\x99\x29\xc6\x29\xf3\x29\xfb\x2a\x07\x2a\x64\x2a\x71\x2a\xa3\x2a\
-\xac\x2a\xb8\x2a\xc4\x2a\xf2\x2b\x1f\x2b\x59\x2b\x79\x2b\xda\x2c\
-\x67\x2c\xea\x2d\x1e\x2d\xa1\x2e\x17\x2e\x88\x2e\xea\x2f\x16\x2f\
-\x35\x2f\x6d\x2f\xa7\x2f\xfe\x30\x78\x30\xdb\x31\x6c\x31\xe3\x32\
-\x47\x32\xae\x33\x0a\x33\x41\x33\x5f\x33\xa3\x33\xe1\x34\x18\x34\
-\x46\x34\x75\x34\xc3\x35\x05\x35\x2a\x35\x58\x35\xa5\x36\x08\x36\
-\x8b\x36\xa1\x36\xc6\x37\x19\x37\x4f\x37\x92\x37\xa8\x37\xcd\x38\
-\x01\x38\x16\x38\x3a\x38\x50\x38\x66\x38\x9b\x38\xb1\x38\xbd\x38\
-\xd3\x38\xfa\x39\x2c\x39\x48\x39\x65\x39\x82\x39\xb6\x39\xdf\x3a\
-\x09\x3a\x30\x3a\x5c\x3a\x94\x3a\xb2\x3a\xe9\x3b\x22\x3b\x2a\x3b\
-\x32\x3b\x3a\x3b\x42\x3b\x76\x3b\x7e\x3b\x86\x3b\x8e\x3b\x96\x3b\
-\x9e\x3b\xa6\x3b\xae\x3b\xb6\x00\x00\x00\x02\x00\x00\x00\x03\x00\
-\x00\x00\x14\x00\x03\x00\x01\x00\x00\x00\x14\x00\x04\x03\x92\x00\
-\x00\x00\x5a\x00\x40\x00\x05\x00\x1a\x00\x2f\x00\x39\x00\x7e\x00\
-\xac\x00\xff\x01\x31\x01\x42\x01\x53\x01\x61\x01\x78\x01\x7e\x01\
-\x92\x02\xc7\x02\xdd\x03\x04\x03\x08\x03\x0c\x03\x28\x05\xbc\x05\
-\xbf\x05\xc2\x05\xc7\x05\xea\x05\xf4\x20\x14\x20\x1a\x20\x1e\x20\
-\x22\x20\x26\x20\x30\x20\x3a\x20\x44\x20\xaa\x20\xac\x21\x22\x22\
-\x12\xfb\x02\xfb\x2d\xfb\x36\xfb\x3c\xfb\x3e\xfb\x41\xfb\x44\xfb\
-\x4b\xff\xff\x00\x00\x00\x20\x00\x30\x00\x3a\x00\xa0\x00\xae\x01\
-\x31\x01\x41\x01\x52\x01\x60\x01\x78\x01\x7d\x01\x92\x02\xc6\x02\
-\xd8\x03\x00\x03\x06\x03\x0a\x03\x27\x05\xb0\x05\xbe\x05\xc1\x05\
-\xc7\x05\xd0\x05\xf3\x20\x13\x20\x18\x20\x1c\x20\x20\x20\x26\x20\
-\x30\x20\x39\x20\x44\x20\xaa\x20\xac\x21\x22\x22\x12\xfb\x01\xfb\
-\x2a\xfb\x2e\xfb\x38\xfb\x3e\xfb\x40\xfb\x43\xfb\x46\xff\xff\x00\
-\x00\x00\x8f\x00\x00\x00\x00\x00\x00\xff\x23\x00\x00\x00\x00\x00\
-\x00\xfe\xc3\x00\x00\xff\x68\xfe\x79\x00\x00\x00\x00\x00\x00\x00\
-\x00\xfe\x11\xfb\x6d\x00\x00\x00\x00\xfb\x65\x00\x00\xfa\xdf\xe0\
-\xd2\x00\x00\x00\x00\x00\x00\xe0\xb3\xe0\xeb\xe0\xbd\xe0\x85\xe0\
-\x61\xe0\x5b\xdf\xdf\xde\xfd\x05\x7f\x05\x8e\x00\x00\x00\x00\x05\
-\x67\x00\x00\x00\x00\x00\x00\x00\x01\x00\x5a\x00\x00\x00\x76\x00\
-\xfe\x01\x16\x00\x00\x01\xb6\x01\xb8\x01\xba\x00\x00\x01\xba\x00\
-\x00\x00\x00\x01\xb8\x01\xc2\x01\xca\x01\xce\x00\x00\x00\x00\x01\
-\xce\x01\xd0\x00\x00\x01\xd0\x00\x00\x00\x00\x02\x00\x02\x04\x02\
-\x08\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x01\xf8\x02\x08\x00\x00\x02\x0e\x02\x10\x02\
-\x12\x00\x00\x00\xd0\x00\xda\x00\xf8\x00\xe1\x01\x0a\x01\x1a\x00\
-\xfc\x00\xf9\x00\xe8\x00\xe9\x00\xe0\x01\x0e\x00\xd6\x00\xe4\x00\
-\xd5\x00\xe2\x00\xd7\x00\xd8\x01\x14\x01\x12\x01\x13\x00\xdc\x00\
-\xfb\x00\x01\x00\x09\x00\x0a\x00\x0c\x00\x0e\x00\x13\x00\x14\x00\
-\x15\x00\x16\x00\x1b\x00\x1c\x00\x1d\x00\x1f\x00\x20\x00\x22\x00\
-\x2a\x00\x2c\x00\x2d\x00\x2e\x00\x30\x00\x31\x00\x36\x00\x37\x00\
-\x38\x00\x39\x00\x3c\x00\xec\x00\xe3\x00\xed\x01\x18\x00\xe7\x01\
-\x3c\x00\x3e\x00\x46\x00\x47\x00\x49\x00\x4b\x00\x50\x00\x51\x00\
-\x52\x00\x53\x00\x59\x00\x5a\x00\x5b\x00\x5d\x00\x5e\x00\x60\x00\
-\x68\x00\x6a\x00\x6b\x00\x6c\x00\x6f\x00\x70\x00\x75\x00\x76\x00\
-\x77\x00\x78\x00\x7b\x00\xea\x01\x03\x00\xeb\x01\x16\x00\xd1\x00\
-\xdb\x01\x08\x01\x0c\x01\x09\x01\x0d\x01\x04\x00\xfe\x01\x3a\x00\
-\xff\x00\x85\x00\xf4\x01\x17\x01\x00\x01\x44\x01\x02\x01\x15\x00\
-\xce\x00\xcf\x01\x3d\x01\x19\x00\xfd\x00\xde\x01\x45\x00\xcd\x00\
-\x86\x00\xf5\x00\xcb\x00\xca\x00\xcc\x00\xdd\x00\x05\x00\x02\x00\
-\x03\x00\x07\x00\x04\x00\x06\x00\x08\x00\x0b\x00\x12\x00\x0f\x00\
-\x10\x00\x11\x00\x1a\x00\x17\x00\x18\x00\x19\x00\x0d\x00\x21\x00\
-\x26\x00\x23\x00\x24\x00\x28\x00\x25\x01\x10\x00\x27\x00\x35\x00\
-\x32\x00\x33\x00\x34\x00\x3a\x00\x2b\x00\x6e\x00\x42\x00\x3f\x00\
-\x40\x00\x44\x00\x41\x00\x43\x00\x45\x00\x48\x00\x4f\x00\x4c\x00\
-\x4d\x00\x4e\x00\x58\x00\x55\x00\x56\x00\x57\x00\x4a\x00\x5f\x00\
-\x64\x00\x61\x00\x62\x00\x66\x00\x63\x01\x11\x00\x65\x00\x74\x00\
-\x71\x00\x72\x00\x73\x00\x79\x00\x69\x00\x7a\x00\x1e\x00\x5c\x00\
-\x29\x00\x67\x00\x2f\x00\x6d\x00\x3d\x00\x7c\x01\x41\x01\x3b\x01\
-\x42\x01\x46\x01\x43\x01\x3e\x01\x2f\x01\x30\x01\x32\x01\x36\x01\
-\x37\x01\x34\x01\x2e\x01\x2d\x01\x35\x01\x31\x01\x33\x00\xd4\x01\
-\x2a\x01\x1c\x01\x2b\x00\x87\x00\x8b\x00\x8d\x00\x8f\x00\x91\x00\
-\x93\x00\x96\x00\x98\x00\x99\x00\x9b\x00\x9d\x00\x9f\x00\xa1\x00\
-\xa3\x00\xa4\x00\xa6\x00\xa7\x00\xa9\x00\xab\x00\xac\x00\xae\x00\
-\xb0\x00\xb1\x00\xb3\x00\xb5\x00\xb7\x00\xbd\x00\xf2\x00\xf3\x00\
-\xee\x00\xf0\x00\xf1\x00\xef\x01\x05\x01\x06\x00\xdf\x00\x88\x00\
-\x89\x00\x8a\x00\x8c\x00\x8e\x00\x90\x00\x92\x00\x94\x00\x97\x00\
-\x9a\x00\x9c\x00\x9e\x00\xa0\x00\xa2\x00\xa8\x00\xaa\x00\xad\x00\
-\xaf\x00\xb2\x00\xb4\x00\xb6\x00\xbc\x00\xbe\x00\x95\x00\x00\x02\
-\x1f\x00\x32\x02\xc5\x00\x07\x02\xc5\x00\x07\x02\xc5\x00\x07\x02\
-\xc5\x00\x07\x02\xc5\x00\x07\x02\xc5\x00\x07\x02\xc5\x00\x07\x04\
-\x40\x00\x00\x02\x6b\x00\x27\x02\x83\x00\x1a\x02\x83\x00\x1a\x02\
-\x9b\x00\x28\x02\xec\x00\x15\x02\x62\x00\x33\x02\x62\x00\x33\x02\
-\x62\x00\x33\x02\x62\x00\x33\x02\x62\x00\x33\x02\x6b\x00\x33\x02\
-\xcb\x00\x2a\x02\x96\x00\x2b\x00\xe8\x00\x28\x00\xe8\xff\xf2\x00\
-\xe8\xff\xbb\x00\xe8\xff\xbc\x00\xe8\xff\xae\x02\x18\x00\x18\x02\
-\x53\x00\x32\x02\x35\x00\x37\x02\x84\x00\x0b\x03\x2e\x00\x2a\x02\
-\xab\x00\x28\x02\xab\x00\x28\x02\xd5\x00\x12\x02\xd5\x00\x12\x02\
-\xd5\x00\x12\x02\xd5\x00\x12\x02\xd5\x00\x12\x02\xe4\x00\x1a\x02\
-\xd5\x00\x12\x04\x08\x00\x18\x02\x55\x00\x2e\x02\x5a\x00\x31\x03\
-\x18\x00\x12\x02\x63\x00\x31\x02\x22\x00\x15\x02\x22\x00\x15\x02\
-\x88\x00\x17\x02\xb0\x00\x2b\x02\xb0\x00\x2b\x02\xb0\x00\x2b\x02\
-\xb0\x00\x2b\x02\xb0\x00\x2b\x02\xd7\x00\x1f\x03\xb9\x00\x0f\x02\
-\xb3\x00\x1a\x02\x7e\x00\x09\x02\x7e\x00\x09\x02\x7e\x00\x09\x02\
-\x4e\x00\x13\x02\x4e\x00\x13\x02\x33\x00\x17\x02\x33\x00\x17\x02\
-\x33\x00\x17\x02\x33\x00\x17\x02\x33\x00\x17\x02\x33\x00\x17\x02\
-\x33\x00\x17\x03\x5b\x00\x13\x02\x33\x00\x27\x01\xf9\x00\x1e\x01\
-\xf0\x00\x1e\x02\x35\x00\x1a\x02\x39\x00\x1f\x02\x19\x00\x17\x02\
-\x19\x00\x17\x02\x19\x00\x17\x02\x19\x00\x17\x02\x19\x00\x17\x01\
-\x95\x00\x0d\x02\x28\x00\x17\x02\x2a\x00\x25\x00\xf2\x00\x2c\x00\
-\xe1\x00\x25\x00\xe1\x00\x0d\x00\xe1\xff\xb7\x00\xe1\xff\xba\x00\
-\xe1\xff\xce\x00\xec\xff\x8c\x01\xf8\x00\x2c\x01\x2d\x00\x2b\x01\
-\x97\x00\x03\x03\x23\x00\x28\x02\x33\x00\x29\x02\x33\x00\x29\x02\
-\x2f\x00\x15\x02\x2f\x00\x15\x02\x2f\x00\x15\x02\x2f\x00\x15\x02\
-\x2f\x00\x15\x02\x2f\x00\x15\x02\x2f\x00\x15\x03\x7f\x00\x15\x02\
-\x28\x00\x24\x02\x25\x00\x25\x02\x27\x00\x13\x01\xa7\x00\x29\x01\
-\xca\x00\x1a\x01\xca\x00\x1a\x02\x4b\x00\x28\x01\x9b\x00\x10\x02\
-\x30\x00\x24\x02\x30\x00\x24\x02\x30\x00\x24\x02\x30\x00\x24\x02\
-\x30\x00\x24\x02\x34\x00\x0f\x02\xea\x00\x0d\x02\x0b\x00\x10\x02\
-\x2f\x00\x0d\x02\x2f\x00\x0d\x02\x2f\x00\x0d\x02\x1c\x00\x16\x02\
-\x1c\x00\x16\x02\xc7\x00\x0d\x03\xac\x00\x0d\x02\xcb\x00\x0d\x02\
-\x84\x00\x0d\x02\xc4\x00\x0d\x01\xde\xff\x96\x02\x3e\x00\x25\x02\
-\xbe\x00\x0b\x01\xa6\x00\x11\x01\xa0\x00\x17\x02\x7c\x00\x1b\x02\
-\x7c\x00\x1b\x02\x7c\x00\x1b\x02\x7c\x00\x1b\x02\x6f\x00\x24\x02\
-\x6f\x00\x24\x01\xc0\x00\x0f\x01\xc0\x00\x0f\x02\x55\x00\x1f\x02\
-\x55\x00\x1f\x02\x55\x00\x22\x02\x55\x00\x22\x00\xf8\x00\x31\x01\
-\x43\x00\x0e\x00\xf8\xff\xe7\x01\xb3\x00\x19\x01\xb8\x00\x0a\x02\
-\x7d\x00\x32\x02\x79\x00\x22\x02\x79\x00\x22\x00\xf8\x00\x31\x01\
-\x15\xff\xe0\x02\x25\x00\x1f\x02\x25\x00\x1f\x02\x30\x00\x18\x02\
-\x30\x00\x18\x02\x0b\x00\x1a\x02\x0b\x00\x1a\x02\x5f\x00\x27\x02\
-\x91\x00\x22\x02\x91\x00\x22\x00\xf8\x00\x31\x01\xb3\x00\x22\x01\
-\xb3\x00\x22\x02\x82\x00\x24\x02\x82\x00\x24\x02\x48\x00\x16\x02\
-\x34\x00\x17\x02\x34\x00\x17\x02\x42\x00\x1d\x02\x42\x00\x1d\x02\
-\x34\x00\x26\x02\x40\x00\x1b\x02\x40\x00\x1b\x02\x5b\x00\x24\x02\
-\x5b\x00\x24\x02\x17\x00\x13\x02\x17\x00\x13\x02\xcb\x00\x24\x02\
-\xcb\x00\x24\x02\xcb\x00\x24\x02\xcb\x00\x24\x02\xcb\x00\x24\x02\
-\xcb\x00\x24\x02\xb6\x00\x22\x02\xb6\x00\x22\x02\x3c\x00\x18\x01\
-\x7f\x00\x11\x02\x41\x00\x19\x02\x3c\x00\x18\x02\x25\x00\x12\x01\
-\xf5\x00\x12\x02\x0e\x00\x18\x02\x15\x00\x12\x02\x23\x00\x18\x02\
-\x0e\x00\x18\x01\xec\x00\x10\x02\xfa\x00\x31\x02\xe9\x00\x2a\x03\
-\x04\x00\x28\x01\x31\x00\x0d\x01\xaf\x00\x13\x01\xb1\x00\x12\x00\
-\xf1\x00\x00\x00\xf1\x00\x00\x00\xca\x00\x11\x01\x8d\x00\x18\x01\
-\x2e\x00\x1a\x00\xd9\x00\x1b\x00\xe0\x00\x1e\x00\xe1\x00\x1c\x00\
-\xda\x00\x1b\x02\xe3\x00\x23\x00\xf2\x00\x28\x00\xf3\x00\x28\x01\
-\xe1\x00\x13\x01\xdb\x00\x14\x00\xcf\x00\x16\x01\x23\x00\x16\x01\
-\xdd\x00\x0d\x02\xda\x00\x12\x01\xf2\x00\x06\x01\xf4\x00\x09\x01\
-\x9b\x00\x0c\x02\x23\x00\x0d\x02\xa0\x00\x0d\x03\x0f\x00\x12\x01\
-\x6c\x00\x1f\x01\x6c\x00\x14\x01\x69\x00\x0c\x01\x69\x00\x0c\x01\
-\x4a\x00\x21\x01\x4a\x00\x10\x00\xcc\x00\x14\x01\x8d\x00\x1b\x01\
-\x8d\x00\x18\x01\x8c\x00\x18\x00\xca\x00\x12\x00\xc7\x00\x11\x02\
-\x68\x00\x0f\x02\x62\x00\x09\x01\x63\x00\x12\x01\x5f\x00\x0d\x01\
-\x7a\x00\x1b\x00\xbd\x00\x18\x01\xe8\xff\xfa\x03\x47\x00\x16\x02\
-\xbe\x00\x14\x02\x21\x00\x17\x02\x13\x00\x16\x02\x92\x00\x18\x02\
-\x92\x00\x18\x03\x19\x00\x0f\x01\x6b\x00\x0f\x00\xce\x00\x2a\x00\
-\xcc\x00\x2a\x01\xe9\x00\x12\x01\xe9\x00\x12\x02\x3f\x00\x12\x01\
-\x9c\x00\x10\x02\x82\x00\x14\x01\xc2\x00\x13\x03\xab\x00\x3d\x02\
-\x80\x00\x0c\x02\x82\x00\x0e\x01\xfa\x00\x16\x02\x24\x00\x16\x01\
-\xda\x00\x13\x01\xd3\x00\x16\x01\xc4\x00\x16\x02\x30\x00\x0c\x02\
-\x30\x00\x0d\x01\xde\x00\x19\x02\x2b\x00\x1e\x01\xf2\x00\x10\x01\
-\xf0\x00\x1b\x02\x3a\x00\x28\x03\x1a\x00\x1d\x04\x8c\x00\x1d\x00\
-\x00\x00\x1d\x00\x00\x00\x1d\x00\x00\x00\x30\x00\x00\x00\x53\x00\
-\x00\x00\x40\x00\x00\x00\x1d\x00\x00\x00\x30\x00\x00\x00\x30\x00\
-\x00\x00\x40\x00\x00\x00\x37\x00\x00\x00\x1d\x00\x00\x00\x1d\x00\
-\x00\x00\x1e\x00\x00\x00\x24\x00\x00\x00\x24\x00\x00\x00\x1d\x00\
-\x00\x00\x1a\x00\x00\x00\x2d\x00\x00\x00\x2d\x00\x00\x00\x2e\x00\
-\x00\x00\x69\x00\x00\x00\x09\x00\x00\x00\x49\x00\x00\x00\x48\x00\
-\x00\x00\x16\x00\x00\x00\x2f\x00\x00\x00\x3c\x00\x00\x00\x6e\x00\
-\x00\x00\x3d\x00\x00\x00\x35\x01\xce\x00\x2d\x00\xf3\x00\x2d\x01\
-\x9a\x00\x2e\x01\xf0\x00\x69\x01\xa7\x00\x09\x01\xfe\x00\x49\x01\
-\xfc\x00\x48\x01\x60\x00\x16\x01\x52\x00\x2f\x01\xf5\x00\x3c\x02\
-\x0d\x00\x6e\x01\x34\x00\x3d\x01\x24\x00\x35\x00\x00\x00\x21\x01\
-\x92\x00\x03\x00\x01\x04\x09\x00\x00\x00\xa8\x03\x84\x00\x03\x00\
-\x01\x04\x09\x00\x01\x00\x20\x03\x64\x00\x03\x00\x01\x04\x09\x00\
-\x02\x00\x0e\x03\x56\x00\x03\x00\x01\x04\x09\x00\x03\x00\x36\x03\
-\x20\x00\x03\x00\x01\x04\x09\x00\x04\x00\x20\x03\x64\x00\x03\x00\
-\x01\x04\x09\x00\x05\x00\x1a\x03\x06\x00\x03\x00\x01\x04\x09\x00\
-\x06\x00\x20\x02\xe6\x00\x03\x00\x01\x04\x09\x00\x08\x00\x3a\x02\
-\xac\x00\x03\x00\x01\x04\x09\x00\x09\x00\x14\x02\x98\x00\x03\x00\
-\x01\x04\x09\x00\x0b\x00\x26\x02\x72\x00\x03\x00\x01\x04\x09\x00\
-\x0c\x00\x26\x02\x72\x00\x03\x00\x01\x04\x09\x00\x0d\x01\x20\x01\
-\x52\x00\x03\x00\x01\x04\x09\x00\x0e\x00\x34\x01\x1e\x00\x03\x00\
-\x01\x04\x09\x00\x10\x00\x0e\x01\x10\x00\x03\x00\x01\x04\x09\x00\
-\x11\x00\x10\x01\x00\x00\x03\x00\x01\x04\x09\x00\x19\x00\x0e\x01\
-\x10\x00\x03\x00\x01\x04\x09\x01\x00\x00\x0c\x00\xf4\x00\x03\x00\
-\x01\x04\x09\x01\x01\x00\x0a\x00\xea\x00\x03\x00\x01\x04\x09\x01\
-\x02\x00\x0a\x00\xe0\x00\x03\x00\x01\x04\x09\x01\x03\x00\x0e\x03\
-\x56\x00\x03\x00\x01\x04\x09\x01\x04\x00\x0c\x00\xd4\x00\x03\x00\
-\x01\x04\x09\x01\x05\x00\x10\x01\x00\x00\x03\x00\x01\x04\x09\x01\
-\x06\x00\x08\x00\xcc\x00\x03\x00\x01\x04\x09\x01\x07\x00\x1a\x00\
-\xb2\x00\x03\x00\x01\x04\x09\x01\x08\x00\x1e\x00\x94\x00\x03\x00\
-\x01\x04\x09\x01\x09\x00\x1c\x00\x78\x00\x03\x00\x01\x04\x09\x01\
-\x0a\x00\x20\x02\xe6\x00\x03\x00\x01\x04\x09\x01\x0b\x00\x18\x00\
-\x60\x00\x03\x00\x01\x04\x09\x01\x0c\x00\x12\x00\x4e\x00\x03\x00\
-\x01\x04\x09\x01\x0d\x00\x1a\x00\x34\x00\x03\x00\x01\x04\x09\x01\
-\x0e\x00\x0c\x00\x28\x00\x03\x00\x01\x04\x09\x01\x0f\x00\x18\x00\
-\x10\x00\x03\x00\x01\x04\x09\x01\x10\x00\x10\x00\x00\x00\x45\x00\
-\x78\x00\x70\x00\x61\x00\x6e\x00\x64\x00\x65\x00\x64\x00\x53\x00\
-\x65\x00\x6d\x00\x69\x00\x45\x00\x78\x00\x70\x00\x61\x00\x6e\x00\
-\x64\x00\x65\x00\x64\x00\x4e\x00\x6f\x00\x72\x00\x6d\x00\x61\x00\
-\x6c\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x43\x00\x6f\x00\x6e\x00\
-\x64\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x43\x00\x6f\x00\
-\x6e\x00\x64\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x46\x00\
-\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x42\x00\
-\x6f\x00\x6c\x00\x64\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\
-\x6b\x00\x61\x00\x2d\x00\x4d\x00\x65\x00\x64\x00\x69\x00\x75\x00\
-\x6d\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\
-\x2d\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\x72\x00\
-\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\
-\x4c\x00\x69\x00\x67\x00\x68\x00\x74\x00\x42\x00\x6f\x00\x6c\x00\
-\x64\x00\x4d\x00\x65\x00\x64\x00\x69\x00\x75\x00\x6d\x00\x4c\x00\
-\x69\x00\x67\x00\x68\x00\x74\x00\x57\x00\x69\x00\x64\x00\x74\x00\
-\x68\x00\x57\x00\x65\x00\x69\x00\x67\x00\x68\x00\x74\x00\x53\x00\
-\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x46\x00\
-\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x68\x00\x74\x00\
-\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\x00\
-\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\x00\
-\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\x00\
-\x54\x00\x68\x00\x69\x00\x73\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\
-\x74\x00\x20\x00\x53\x00\x6f\x00\x66\x00\x74\x00\x77\x00\x61\x00\
-\x72\x00\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x6c\x00\x69\x00\
-\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x64\x00\x20\x00\x75\x00\
-\x6e\x00\x64\x00\x65\x00\x72\x00\x20\x00\x74\x00\x68\x00\x65\x00\
-\x20\x00\x53\x00\x49\x00\x4c\x00\x20\x00\x4f\x00\x70\x00\x65\x00\
-\x6e\x00\x20\x00\x46\x00\x6f\x00\x6e\x00\x74\x00\x20\x00\x4c\x00\
-\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\x65\x00\x2c\x00\x20\x00\
-\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\x6e\x00\x20\x00\
-\x31\x00\x2e\x00\x31\x00\x2e\x00\x20\x00\x54\x00\x68\x00\x69\x00\
-\x73\x00\x20\x00\x6c\x00\x69\x00\x63\x00\x65\x00\x6e\x00\x73\x00\
-\x65\x00\x20\x00\x69\x00\x73\x00\x20\x00\x61\x00\x76\x00\x61\x00\
-\x69\x00\x6c\x00\x61\x00\x62\x00\x6c\x00\x65\x00\x20\x00\x77\x00\
-\x69\x00\x74\x00\x68\x00\x20\x00\x61\x00\x20\x00\x46\x00\x41\x00\
-\x51\x00\x20\x00\x61\x00\x74\x00\x3a\x00\x20\x00\x68\x00\x74\x00\
-\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x73\x00\x63\x00\x72\x00\
-\x69\x00\x70\x00\x74\x00\x73\x00\x2e\x00\x73\x00\x69\x00\x6c\x00\
-\x2e\x00\x6f\x00\x72\x00\x67\x00\x2f\x00\x4f\x00\x46\x00\x4c\x00\
-\x68\x00\x74\x00\x74\x00\x70\x00\x3a\x00\x2f\x00\x2f\x00\x68\x00\
-\x61\x00\x66\x00\x6f\x00\x6e\x00\x74\x00\x69\x00\x61\x00\x2e\x00\
-\x63\x00\x6f\x00\x6d\x00\x42\x00\x65\x00\x6e\x00\x20\x00\x4e\x00\
-\x61\x00\x74\x00\x68\x00\x61\x00\x6e\x00\x4d\x00\x69\x00\x6c\x00\
-\x65\x00\x6e\x00\x61\x00\x20\x00\x42\x00\x2e\x00\x20\x00\x42\x00\
-\x72\x00\x61\x00\x6e\x00\x64\x00\xe3\x00\x6f\x00\x2c\x00\x20\x00\
-\x42\x00\x65\x00\x6e\x00\x20\x00\x4e\x00\x61\x00\x74\x00\x68\x00\
-\x61\x00\x6e\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\
-\x61\x00\x2d\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\
-\x6c\x00\x64\x00\x56\x00\x65\x00\x72\x00\x73\x00\x69\x00\x6f\x00\
-\x6e\x00\x20\x00\x32\x00\x2e\x00\x30\x00\x30\x00\x31\x00\x32\x00\
-\x2e\x00\x30\x00\x30\x00\x31\x00\x3b\x00\x73\x00\x73\x00\x64\x00\
-\x65\x00\x3b\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\
-\x61\x00\x2d\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\
-\x6c\x00\x64\x00\x52\x00\x65\x00\x67\x00\x75\x00\x6c\x00\x61\x00\
-\x72\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\
-\x20\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\x6c\x00\
-\x64\x00\x43\x00\x6f\x00\x70\x00\x79\x00\x72\x00\x69\x00\x67\x00\
-\x68\x00\x74\x00\x20\x00\x32\x00\x30\x00\x31\x00\x36\x00\x20\x00\
-\x54\x00\x68\x00\x65\x00\x20\x00\x46\x00\x72\x00\x65\x00\x64\x00\
-\x6f\x00\x6b\x00\x61\x00\x20\x00\x50\x00\x72\x00\x6f\x00\x6a\x00\
-\x65\x00\x63\x00\x74\x00\x20\x00\x41\x00\x75\x00\x74\x00\x68\x00\
-\x6f\x00\x72\x00\x73\x00\x20\x00\x28\x00\x68\x00\x74\x00\x74\x00\
-\x70\x00\x73\x00\x3a\x00\x2f\x00\x2f\x00\x67\x00\x69\x00\x74\x00\
-\x68\x00\x75\x00\x62\x00\x2e\x00\x63\x00\x6f\x00\x6d\x00\x2f\x00\
-\x68\x00\x61\x00\x66\x00\x6f\x00\x6e\x00\x74\x00\x69\x00\x61\x00\
-\x2f\x00\x46\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\
-\x2d\x00\x4f\x00\x6e\x00\x65\x00\x29\x00\x00\x00\x02\x00\x00\x00\
-\x00\x00\x00\xff\x9c\x00\x32\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x01\x47\x00\x00\x00\
-\x24\x00\xc9\x00\xc7\x00\x62\x00\xad\x00\x63\x00\xae\x00\x90\x00\
-\x25\x00\x26\x00\x64\x00\x27\x00\xe9\x00\x28\x00\x65\x00\xc8\x00\
-\xca\x00\xcb\x00\x29\x00\x2a\x00\x2b\x00\x2c\x00\xcc\x00\xcd\x00\
-\xce\x00\xcf\x00\x2d\x00\x2e\x00\x2f\x00\xe2\x00\x30\x00\x31\x00\
-\x66\x00\x32\x00\xd0\x00\xd1\x00\x67\x00\xd3\x00\x91\x00\xaf\x00\
-\xb0\x00\x33\x00\xed\x00\x34\x00\x35\x00\x36\x00\xe4\x00\x37\x00\
-\x38\x00\xd4\x00\xd5\x00\x68\x00\xd6\x00\x39\x00\x3a\x00\x3b\x00\
-\x3c\x00\xeb\x00\xbb\x00\x3d\x00\xe6\x00\x44\x00\x69\x00\x6b\x00\
-\x6c\x00\x6a\x00\x6e\x00\x6d\x00\xa0\x00\x45\x00\x46\x00\x6f\x00\
-\x47\x00\xea\x00\x48\x00\x70\x00\x72\x00\x73\x00\x71\x00\x49\x00\
-\x4a\x00\x4b\x00\x4c\x00\xd7\x00\x74\x00\x76\x00\x77\x00\x75\x00\
-\x4d\x00\x4e\x00\x4f\x00\xe3\x00\x50\x00\x51\x00\x78\x00\x52\x00\
-\x79\x00\x7b\x00\x7c\x00\x7a\x00\xa1\x00\x7d\x00\xb1\x00\x53\x00\
-\xee\x00\x54\x00\x55\x00\x56\x00\xe5\x00\x89\x00\x57\x00\x58\x00\
-\x7e\x00\x80\x00\x81\x00\x7f\x00\x59\x00\x5a\x00\x5b\x00\x5c\x00\
-\xec\x00\xba\x00\x5d\x00\xe7\x01\x02\x01\x03\x01\x04\x00\xc0\x00\
-\xc1\x01\x05\x01\x06\x01\x07\x00\x9d\x00\x9e\x01\x08\x01\x09\x01\
-\x0a\x01\x0b\x01\x0c\x01\x0d\x01\x0e\x01\x0f\x01\x10\x01\x11\x01\
-\x12\x01\x13\x01\x14\x01\x15\x01\x16\x01\x17\x01\x18\x01\x19\x01\
-\x1a\x01\x1b\x01\x1c\x01\x1d\x01\x1e\x01\x1f\x01\x20\x01\x21\x01\
-\x22\x01\x23\x01\x24\x01\x25\x01\x26\x01\x27\x01\x28\x01\x29\x01\
-\x2a\x01\x2b\x01\x2c\x01\x2d\x01\x2e\x01\x2f\x01\x30\x01\x31\x01\
-\x32\x01\x33\x01\x34\x01\x35\x01\x36\x01\x37\x01\x38\x01\x39\x01\
-\x3a\x01\x3b\x01\x3c\x01\x3d\x01\x3e\x01\x3f\x00\x13\x00\x14\x00\
-\x15\x00\x16\x00\x17\x00\x18\x00\x19\x00\x1a\x00\x1b\x00\x1c\x00\
-\xbc\x00\xf4\x00\xf5\x00\xf6\x01\x40\x01\x41\x01\x42\x00\x03\x01\
-\x43\x01\x44\x01\x45\x01\x46\x00\x11\x00\x0f\x00\x1d\x00\x1e\x00\
-\xab\x00\x04\x00\xa3\x00\x22\x00\xa2\x00\xc3\x00\x87\x00\x0d\x00\
-\x06\x00\x12\x00\x3f\x00\x10\x00\xb2\x00\xb3\x00\x42\x00\x0b\x00\
-\x0c\x00\x5e\x00\x60\x00\x3e\x00\x40\x00\xc4\x00\xc5\x00\xb4\x00\
-\xb5\x00\xb6\x00\xb7\x00\xa9\x00\xaa\x00\xbe\x00\xbf\x00\x05\x00\
-\x0a\x00\xa6\x00\x23\x00\x09\x00\x88\x00\x86\x00\x8b\x00\x8a\x00\
-\x8c\x00\x83\x00\x5f\x00\xe8\x00\x82\x00\xc2\x01\x47\x00\x84\x00\
-\xbd\x00\x07\x01\x48\x00\x85\x00\x96\x00\x0e\x00\xef\x00\xf0\x00\
-\xb8\x00\x20\x00\x21\x00\x1f\x00\x93\x00\x61\x00\xa4\x00\x41\x01\
-\x49\x00\x08\x00\xc6\x01\x4a\x01\x4b\x01\x4c\x01\x4d\x01\x4e\x01\
-\x4f\x01\x50\x01\x51\x01\x52\x01\x53\x01\x54\x01\x55\x01\x56\x01\
-\x57\x01\x58\x01\x59\x01\x5a\x01\x5b\x01\x5c\x01\x5d\x01\x5e\x01\
-\x5f\x01\x60\x01\x61\x01\x62\x01\x63\x01\x64\x01\x65\x01\x66\x01\
-\x67\x00\x8e\x00\xdc\x00\x43\x00\x8d\x00\xdf\x00\xd8\x00\xe1\x00\
-\xdb\x00\xdd\x00\xd9\x00\xda\x00\xde\x00\xe0\x03\x66\x5f\x66\x05\
-\x66\x5f\x66\x5f\x69\x03\x66\x5f\x74\x03\x6a\x5f\x6a\x03\x6c\x5f\
-\x6c\x03\x74\x5f\x74\x07\x75\x6e\x69\x30\x35\x44\x30\x07\x75\x6e\
-\x69\x46\x42\x32\x45\x07\x75\x6e\x69\x46\x42\x32\x46\x07\x75\x6e\
-\x69\x46\x42\x33\x30\x07\x75\x6e\x69\x30\x35\x44\x31\x07\x75\x6e\
-\x69\x46\x42\x33\x31\x07\x75\x6e\x69\x30\x35\x44\x32\x07\x75\x6e\
-\x69\x46\x42\x33\x32\x07\x75\x6e\x69\x30\x35\x44\x33\x07\x75\x6e\
-\x69\x46\x42\x33\x33\x07\x75\x6e\x69\x30\x35\x44\x34\x07\x75\x6e\
-\x69\x46\x42\x33\x34\x07\x75\x6e\x69\x30\x35\x44\x35\x07\x75\x6e\
-\x69\x46\x42\x33\x35\x07\x75\x6e\x69\x46\x42\x34\x42\x07\x75\x6e\
-\x69\x30\x35\x44\x36\x07\x75\x6e\x69\x46\x42\x33\x36\x07\x75\x6e\
-\x69\x30\x35\x44\x37\x07\x75\x6e\x69\x30\x35\x44\x38\x07\x75\x6e\
-\x69\x46\x42\x33\x38\x07\x75\x6e\x69\x30\x35\x44\x39\x07\x75\x6e\
-\x69\x46\x42\x33\x39\x07\x75\x6e\x69\x30\x35\x44\x41\x07\x75\x6e\
-\x69\x46\x42\x33\x41\x07\x75\x6e\x69\x30\x35\x44\x42\x07\x75\x6e\
-\x69\x46\x42\x33\x42\x07\x75\x6e\x69\x30\x35\x44\x43\x07\x75\x6e\
-\x69\x46\x42\x33\x43\x07\x75\x6e\x69\x30\x35\x44\x44\x07\x75\x6e\
-\x69\x30\x35\x44\x45\x07\x75\x6e\x69\x46\x42\x33\x45\x07\x75\x6e\
-\x69\x30\x35\x44\x46\x07\x75\x6e\x69\x30\x35\x45\x30\x07\x75\x6e\
-\x69\x46\x42\x34\x30\x07\x75\x6e\x69\x30\x35\x45\x31\x07\x75\x6e\
-\x69\x46\x42\x34\x31\x07\x75\x6e\x69\x30\x35\x45\x32\x07\x75\x6e\
-\x69\x30\x35\x45\x33\x07\x75\x6e\x69\x46\x42\x34\x33\x07\x75\x6e\
-\x69\x30\x35\x45\x34\x07\x75\x6e\x69\x46\x42\x34\x34\x07\x75\x6e\
-\x69\x30\x35\x45\x35\x07\x75\x6e\x69\x30\x35\x45\x36\x07\x75\x6e\
-\x69\x46\x42\x34\x36\x07\x75\x6e\x69\x30\x35\x45\x37\x07\x75\x6e\
-\x69\x46\x42\x34\x37\x07\x75\x6e\x69\x30\x35\x45\x38\x07\x75\x6e\
-\x69\x46\x42\x34\x38\x07\x75\x6e\x69\x30\x35\x45\x39\x07\x75\x6e\
-\x69\x46\x42\x32\x41\x07\x75\x6e\x69\x46\x42\x32\x42\x07\x75\x6e\
-\x69\x46\x42\x32\x43\x07\x75\x6e\x69\x46\x42\x32\x44\x07\x75\x6e\
-\x69\x46\x42\x34\x39\x07\x75\x6e\x69\x30\x35\x45\x41\x07\x75\x6e\
-\x69\x46\x42\x34\x41\x07\x75\x6e\x69\x30\x30\x42\x39\x07\x75\x6e\
-\x69\x30\x30\x42\x32\x07\x75\x6e\x69\x30\x30\x42\x33\x07\x75\x6e\
-\x69\x30\x30\x41\x30\x07\x75\x6e\x69\x30\x35\x46\x33\x07\x75\x6e\
-\x69\x30\x35\x46\x34\x07\x75\x6e\x69\x30\x35\x42\x45\x04\x45\x75\
-\x72\x6f\x09\x6e\x65\x77\x73\x68\x65\x71\x65\x6c\x07\x75\x6e\x69\
-\x30\x33\x42\x43\x07\x75\x6e\x69\x30\x35\x43\x31\x07\x75\x6e\x69\
-\x30\x35\x42\x30\x07\x75\x6e\x69\x30\x35\x42\x31\x07\x75\x6e\x69\
-\x30\x35\x42\x32\x07\x75\x6e\x69\x30\x35\x42\x33\x07\x75\x6e\x69\
-\x30\x35\x42\x34\x07\x75\x6e\x69\x30\x35\x42\x35\x07\x75\x6e\x69\
-\x30\x35\x42\x36\x07\x75\x6e\x69\x30\x35\x42\x37\x07\x75\x6e\x69\
-\x30\x35\x42\x38\x07\x75\x6e\x69\x30\x35\x42\x39\x07\x75\x6e\x69\
-\x30\x35\x42\x41\x07\x75\x6e\x69\x30\x35\x42\x42\x07\x75\x6e\x69\
-\x30\x35\x42\x43\x07\x75\x6e\x69\x30\x35\x42\x46\x07\x75\x6e\x69\
-\x30\x35\x43\x32\x07\x75\x6e\x69\x30\x35\x43\x37\x07\x75\x6e\x69\
-\x30\x33\x30\x38\x07\x75\x6e\x69\x30\x33\x30\x37\x09\x67\x72\x61\
-\x76\x65\x63\x6f\x6d\x62\x09\x61\x63\x75\x74\x65\x63\x6f\x6d\x62\
-\x07\x75\x6e\x69\x30\x33\x30\x42\x07\x75\x6e\x69\x30\x33\x30\x32\
-\x07\x75\x6e\x69\x30\x33\x30\x43\x07\x75\x6e\x69\x30\x33\x30\x36\
-\x07\x75\x6e\x69\x30\x33\x30\x41\x09\x74\x69\x6c\x64\x65\x63\x6f\
-\x6d\x62\x07\x75\x6e\x69\x30\x33\x30\x34\x07\x75\x6e\x69\x30\x33\
-\x32\x37\x07\x75\x6e\x69\x30\x33\x32\x38\x00\x00\x01\x00\x00\x00\
-\x0a\x00\x4c\x00\x82\x00\x03\x44\x46\x4c\x54\x00\x34\x68\x65\x62\
-\x72\x00\x24\x6c\x61\x74\x6e\x00\x14\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x03\x00\x01\x00\x02\x00\x03\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x03\x00\x00\x00\x02\x00\x03\x00\x04\x00\x00\x00\x00\xff\
-\xff\x00\x02\x00\x02\x00\x03\x00\x04\x6b\x65\x72\x6e\x00\x30\x6b\
-\x65\x72\x6e\x00\x28\x6d\x61\x72\x6b\x00\x20\x6d\x6b\x6d\x6b\x00\
-\x1a\x00\x00\x00\x01\x00\x05\x00\x00\x00\x02\x00\x03\x00\x04\x00\
-\x00\x00\x02\x00\x00\x00\x01\x00\x00\x00\x01\x00\x02\x00\x06\x15\
-\xd8\x13\x74\x11\x5c\x01\xc8\x00\x76\x00\x0e\x00\x06\x00\x10\x00\
-\x01\x00\x0a\x00\x00\x00\x01\x00\x4e\x00\x16\x00\x01\x00\x1c\x00\
-\x0c\x00\x01\x00\x04\x00\x01\x01\x03\x02\x93\x00\x01\x00\x01\x01\
-\x37\x00\x0c\x00\x00\x10\xdc\x00\x00\x10\xd0\x00\x00\x10\xca\x00\
-\x00\x10\xc4\x00\x00\x10\xbe\x00\x00\x10\xb8\x00\x00\x10\xb2\x00\
-\x00\x10\xac\x00\x00\x10\xa6\x00\x00\x10\xa0\x00\x00\x10\x9a\x00\
-\x00\x10\xb2\x00\x02\x00\x02\x01\x2a\x01\x2a\x00\x00\x01\x2d\x01\
-\x37\x00\x01\x00\x05\x00\x00\x00\x01\x00\x08\x00\x01\x01\x34\x00\
-\x0c\x00\x04\x00\xce\x00\x1a\x00\x01\x00\x05\x00\x7f\x00\x80\x00\
-\x81\x00\x83\x00\x84\x00\x05\x00\x90\x00\x78\x00\x5a\x00\x2a\x00\
-\x0c\x00\x02\x00\x48\x00\xa2\x00\x48\x10\x36\x00\x48\x00\x18\x00\
-\x48\x00\x12\x00\x01\x02\x13\x01\xf4\x00\x01\x02\x13\x00\x00\x00\
-\x02\x00\x2a\x00\x24\x00\x2a\x00\x1e\x00\x2a\x00\x18\x00\x2a\x00\
-\x12\x00\x01\x01\xb1\x01\xf4\x00\x01\x01\xb1\x00\x00\x00\x01\x00\
-\x91\x01\xf4\x00\x01\x00\x91\x00\x00\x00\x01\x00\x00\x00\x00\x00\
-\x02\x00\x00\x0c\xce\x00\x00\x0c\xc8\x00\x00\x00\x18\x00\x00\x00\
-\x12\x00\x01\x02\x2a\x01\xf4\x00\x01\x02\x2a\x00\x00\x00\x02\x00\
-\x00\x0c\xb0\x00\x00\x00\x00\x00\x00\x00\x12\x00\x00\x00\x00\x00\
-\x01\x02\x0d\x00\x00\x00\x02\x00\x00\x00\x1e\x00\x00\x0f\xb2\x00\
-\x00\x00\x18\x00\x00\x00\x12\x00\x01\x02\x1a\x01\xf4\x00\x01\x02\
-\x1a\x00\x00\x00\x01\x00\xb1\x00\x00\x00\x19\x00\x00\x0f\xfa\x00\
-\x01\x0f\xf4\x00\x01\x0f\xee\x00\x01\x0f\xe8\x00\x01\x0f\xe2\x00\
-\x01\x0f\xf4\x00\x01\x0f\xdc\x00\x01\x0f\xdc\x00\x01\x0f\xd6\x00\
-\x01\x0f\xd6\x00\x01\x0f\xd0\x00\x02\x0f\xca\x00\x03\x0f\xc4\x00\
-\x01\x0f\xbe\x00\x03\x0f\xb8\x00\x03\x0f\xb2\x00\x03\x0f\xac\x00\
-\x03\x0f\xa6\x00\x03\x0f\xa0\x00\x03\x0f\x9a\x00\x03\x0f\x94\x00\
-\x03\x0f\x8e\x00\x03\x0f\x88\x00\x03\x0f\x82\x00\x03\x0f\x9a\x00\
-\x02\x00\x03\x01\x1c\x01\x25\x00\x00\x01\x28\x01\x2a\x00\x0a\x01\
-\x2c\x01\x37\x00\x0d\x00\x04\x00\x00\x00\x01\x00\x08\x00\x01\x0f\
-\x7c\x0e\x66\x00\x06\x0e\x82\x00\x0c\x00\xb2\x00\x00\x0e\x54\x00\
-\x00\x00\x00\x0e\x4e\x0e\x48\x00\x00\x0e\x54\x00\x00\x00\x00\x0e\
-\x42\x0e\x48\x00\x00\x0e\x54\x00\x00\x00\x00\x0e\x3c\x0e\x48\x00\
-\x00\x0e\x54\x00\x00\x00\x00\x0e\x4e\x0e\x48\x00\x00\x0e\x54\x00\
-\x00\x00\x00\x0e\x4e\x0e\x48\x00\x00\x0e\x54\x00\x00\x00\x00\x0e\
-\x4e\x0e\x48\x00\x00\x0e\x54\x00\x00\x00\x00\x0e\x4e\x0e\x48\x00\
-\x00\x0e\x36\x00\x00\x00\x00\x0e\x30\x00\x00\x00\x00\x0e\x2a\x00\
-\x00\x00\x00\x0e\x24\x00\x00\x00\x00\x0e\x1e\x00\x00\x00\x00\x0e\
-\x18\x00\x00\x00\x00\x0e\x1e\x00\x00\x00\x00\x0e\x18\x00\x00\x00\
-\x00\x0e\x12\x00\x00\x0e\x0c\x0e\x06\x00\x00\x00\x00\x0e\x00\x00\
-\x00\x0d\xfa\x0d\xf4\x00\x00\x00\x00\x0d\xee\x0d\xe8\x00\x00\x0d\
-\xe2\x0d\xdc\x00\x00\x0d\xee\x0d\xe8\x00\x00\x0d\xe2\x0d\xdc\x00\
-\x00\x0d\xee\x0d\xe8\x00\x00\x0d\xd6\x0d\xdc\x00\x00\x0d\xee\x0d\
-\xe8\x00\x00\x0d\xe2\x0d\xdc\x00\x00\x0d\xee\x0d\xe8\x00\x00\x0d\
-\xe2\x0d\xdc\x00\x00\x0d\xd0\x00\x00\x00\x00\x0d\xca\x00\x00\x00\
-\x00\x0d\xc4\x00\x00\x00\x00\x0d\xbe\x00\x00\x00\x00\x0d\xb8\x0d\
-\xb2\x0d\xac\x0d\xa6\x00\x00\x00\x00\x0d\xa0\x0d\x9a\x00\x00\x0d\
-\x94\x0d\x8e\x00\x00\x0d\xa0\x0d\x9a\x00\x00\x0d\x88\x0d\x8e\x00\
-\x00\x0d\xa0\x0d\x9a\x00\x00\x0d\x82\x0d\x8e\x00\x00\x0d\xa0\x0d\
-\x9a\x00\x00\x0d\x94\x0d\x8e\x00\x00\x0d\xa0\x0d\x9a\x00\x00\x0d\
-\x94\x0d\x8e\x00\x00\x0d\x7c\x00\x00\x00\x00\x0d\x76\x00\x00\x00\
-\x00\x0d\x70\x00\x00\x00\x00\x0e\x24\x00\x00\x0d\x6a\x0d\x64\x00\
-\x00\x0d\x5e\x0d\x58\x00\x00\x0d\x52\x0d\x4c\x00\x00\x0d\x46\x0d\
-\x40\x00\x00\x00\x00\x0d\x3a\x00\x00\x00\x00\x0d\x34\x00\x00\x00\
-\x00\x0d\x2e\x00\x00\x00\x00\x0d\x28\x00\x00\x00\x00\x0d\x2e\x00\
-\x00\x00\x00\x0d\x28\x00\x00\x0d\x22\x0d\x1c\x0d\x16\x0d\x10\x0d\
-\x0a\x0d\x04\x0d\x22\x0d\x1c\x0d\x16\x0d\x10\x0c\xfe\x0d\x04\x0d\
-\x22\x0d\x1c\x0d\x16\x0d\x10\x0c\xf8\x0d\x04\x0d\x22\x0d\x1c\x0d\
-\x16\x0d\x10\x0d\x0a\x0d\x04\x0d\x22\x0d\x1c\x0d\x16\x0d\x10\x0d\
-\x0a\x0d\x04\x00\x00\x0d\x1c\x00\x00\x00\x00\x0d\x0a\x00\x00\x0d\
-\x22\x0d\x1c\x0d\x16\x0d\x10\x0d\x0a\x0d\x04\x00\x00\x0c\xf2\x00\
-\x00\x00\x00\x0c\xec\x00\x00\x00\x00\x0c\xe6\x00\x00\x00\x00\x0c\
-\xe0\x00\x00\x00\x00\x0d\x70\x00\x00\x00\x00\x0e\x24\x00\x00\x00\
-\x00\x0c\xda\x00\x00\x00\x00\x0c\xd4\x00\x00\x00\x00\x0c\xce\x00\
-\x00\x00\x00\x0c\xc8\x00\x00\x00\x00\x0c\xc2\x00\x00\x00\x00\x0c\
-\xbc\x00\x00\x00\x00\x0c\xc2\x00\x00\x00\x00\x0c\xb6\x00\x00\x00\
-\x00\x0c\xb0\x00\x00\x0c\xaa\x0c\xa4\x00\x00\x0c\x9e\x0c\x98\x00\
-\x00\x00\x00\x0c\x92\x0c\x8c\x0c\x9e\x0c\x98\x00\x00\x00\x00\x0c\
-\x86\x0c\x8c\x0c\x9e\x0c\x98\x00\x00\x00\x00\x0c\x80\x0c\x8c\x0c\
-\x9e\x0c\x98\x00\x00\x00\x00\x0c\x92\x0c\x8c\x0c\x9e\x0c\x98\x00\
-\x00\x00\x00\x0c\x92\x0c\x8c\x00\x00\x0d\x1c\x00\x00\x00\x00\x0d\
-\xbe\x00\x00\x00\x00\x0c\x7a\x00\x00\x00\x00\x0c\x74\x00\x00\x00\
-\x00\x0c\x6e\x00\x00\x00\x00\x0c\x68\x00\x00\x00\x00\x0c\x62\x0d\
-\x16\x00\x00\x0c\x5c\x00\x00\x00\x00\x0c\x62\x0d\x16\x00\x00\x0c\
-\x56\x00\x00\x00\x00\x0c\x62\x0d\x16\x00\x00\x0c\x5c\x00\x00\x00\
-\x00\x0c\x50\x00\x00\x00\x00\x0c\x4a\x00\x00\x00\x00\x0c\x50\x00\
-\x00\x00\x00\x0c\x44\x00\x00\x00\x00\x0c\x3e\x00\x00\x00\x00\x0c\
-\x38\x0c\x32\x00\x00\x0c\x3e\x00\x00\x00\x00\x0c\x38\x0c\x32\x00\
-\x00\x0c\x3e\x00\x00\x00\x00\x0c\x38\x0c\x32\x00\x00\x0c\x3e\x00\
-\x00\x00\x00\x0c\x38\x0c\x32\x00\x00\x0c\x3e\x00\x00\x00\x00\x0c\
-\x38\x0c\x32\x00\x00\x0c\x3e\x00\x00\x00\x00\x0c\x38\x0c\x32\x00\
-\x00\x0c\x3e\x00\x00\x00\x00\x0c\x38\x0c\x32\x00\x00\x0c\x2c\x00\
-\x00\x00\x00\x0c\x26\x00\x00\x00\x00\x0c\x20\x00\x00\x00\x00\x0c\
-\x1a\x00\x00\x00\x00\x0c\x14\x00\x00\x00\x00\x0c\x0e\x00\x00\x00\
-\x00\x0c\x14\x00\x00\x00\x00\x0c\x0e\x00\x00\x0c\x08\x0c\x3e\x00\
-\x00\x0c\x02\x0b\xfc\x00\x00\x00\x00\x0b\xf6\x00\x00\x00\x00\x0b\
-\xf0\x0b\xea\x00\x00\x0b\xf6\x00\x00\x00\x00\x0b\xf0\x0b\xea\x00\
-\x00\x0b\xf6\x00\x00\x00\x00\x0b\xf0\x0b\xea\x00\x00\x0b\xf6\x00\
-\x00\x00\x00\x0b\xf0\x0b\xea\x00\x00\x0b\xf6\x00\x00\x00\x00\x0b\
-\xf0\x0b\xea\x00\x00\x0b\xe4\x00\x00\x00\x00\x0b\xde\x00\x00\x00\
-\x00\x0b\xd8\x00\x00\x00\x00\x0b\xd2\x00\x00\x00\x00\x0b\xcc\x00\
-\x00\x0b\xc6\x0b\xc0\x00\x00\x00\x00\x0b\xba\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x0b\xb4\x00\x00\x00\x00\x0b\xae\x0b\xa8\x00\
-\x00\x0b\xb4\x00\x00\x00\x00\x0b\xae\x0b\xa8\x00\x00\x0b\xb4\x00\
-\x00\x00\x00\x0b\xae\x0b\xa8\x00\x00\x0b\xb4\x00\x00\x00\x00\x0b\
-\xae\x0b\xa8\x00\x00\x0b\xb4\x00\x00\x00\x00\x0b\xae\x0b\xa8\x00\
-\x00\x0b\xa2\x00\x00\x00\x00\x0b\x9c\x00\x00\x0b\x96\x0b\x90\x00\
-\x00\x0b\x8a\x0b\x84\x00\x00\x0b\x7e\x0b\x78\x00\x00\x0b\x72\x0b\
-\x6c\x00\x00\x00\x00\x0b\x66\x00\x00\x00\x00\x0b\x60\x00\x00\x00\
-\x00\x0b\x5a\x00\x00\x00\x00\x0b\x96\x00\x00\x00\x00\x0b\x5a\x00\
-\x00\x00\x00\x0b\x96\x00\x00\x0b\x54\x0b\x4e\x00\x00\x0b\x48\x0c\
-\x38\x0b\x42\x0b\x54\x0b\x4e\x00\x00\x0b\x48\x0c\x38\x0b\x42\x0b\
-\x54\x0b\x4e\x00\x00\x0b\x48\x0c\x38\x0b\x42\x0b\x54\x0b\x4e\x00\
-\x00\x0b\x48\x0c\x38\x0b\x42\x0b\x54\x0b\x4e\x00\x00\x0b\x48\x0c\
-\x38\x0b\x42\x0b\x54\x0b\x4e\x00\x00\x0b\x48\x0b\x3c\x0b\x42\x0b\
-\x54\x0b\x4e\x00\x00\x0b\x48\x0c\x38\x0b\x42\x00\x00\x0b\x36\x00\
-\x00\x00\x00\x0b\x30\x00\x00\x00\x00\x0b\x2a\x00\x00\x00\x00\x0b\
-\x3c\x00\x00\x00\x00\x0b\x24\x00\x00\x00\x00\x0b\xfc\x00\x00\x00\
-\x00\x0b\x24\x00\x00\x00\x00\x0b\xfc\x00\x00\x00\x00\x0b\x1e\x00\
-\x00\x00\x00\x0b\x18\x00\x00\x00\x00\x0b\x12\x00\x00\x00\x00\x0b\
-\x6c\x00\x00\x00\x00\x0b\x12\x00\x00\x00\x00\x0b\x6c\x00\x00\x00\
-\x00\x0b\x0c\x00\x00\x00\x00\x0b\x06\x00\x00\x0b\x00\x0a\xfa\x00\
-\x00\x0a\xf4\x0a\xee\x00\x00\x0a\xe8\x0b\x4e\x00\x00\x00\x00\x0c\
-\x38\x0a\xe2\x0a\xe8\x0b\x4e\x00\x00\x00\x00\x0c\x38\x0a\xe2\x0a\
-\xe8\x0b\x4e\x00\x00\x00\x00\x0c\x38\x0a\xe2\x0a\xe8\x0b\x4e\x00\
-\x00\x00\x00\x0c\x38\x0a\xe2\x0a\xe8\x0b\x4e\x00\x00\x00\x00\x0c\
-\x38\x0a\xe2\x00\x00\x0c\x3e\x00\x00\x00\x00\x0a\xdc\x00\x00\x00\
-\x00\x0a\xd6\x00\x00\x00\x00\x0a\xd0\x00\x00\x00\x00\x0a\xca\x00\
-\x00\x00\x00\x0a\xc4\x00\x00\x00\x00\x0a\xbe\x00\x00\x00\x00\x0a\
-\xb8\x00\x00\x00\x00\x0a\xbe\x00\x00\x00\x00\x0a\xb8\x00\x00\x00\
-\x00\x0a\xbe\x00\x00\x00\x00\x0a\xb8\x00\x00\x00\x00\x0a\xb2\x00\
-\x00\x00\x00\x0a\xac\x00\x00\x00\x00\x0a\xb2\x00\x00\x00\x00\x0a\
-\xac\x00\x00\x00\x00\x0a\xa6\x0a\xa0\x0a\x9a\x0a\x94\x00\x00\x00\
-\x00\x0a\xa6\x0a\xa0\x0a\x9a\x0a\x94\x00\x00\x00\x00\x0a\xa6\x0a\
-\xa0\x0a\x9a\x0a\x94\x00\x00\x00\x00\x0a\xa6\x0a\xa0\x0a\x9a\x0a\
-\x94\x00\x00\x00\x00\x0a\x8e\x0a\x88\x0a\x82\x0a\x7c\x00\x00\x00\
-\x00\x0a\x8e\x0a\x88\x0a\x82\x0a\x7c\x00\x00\x00\x00\x0a\x76\x0a\
-\x70\x0a\x6a\x0a\x64\x00\x00\x00\x00\x0a\x76\x0a\x70\x0a\x6a\x0a\
-\x64\x00\x00\x00\x00\x0a\x5e\x0a\x58\x0a\x52\x0a\x4c\x00\x00\x00\
-\x00\x0a\x5e\x0a\x58\x0a\x52\x0a\x4c\x00\x00\x00\x00\x0a\x46\x0a\
-\x58\x0a\x40\x0a\x4c\x00\x00\x00\x00\x0a\x46\x0a\x58\x0a\x40\x0a\
-\x4c\x00\x00\x00\x00\x0b\xba\x0a\x3a\x0a\x34\x0a\x2e\x00\x00\x00\
-\x00\x0a\x28\x0a\x22\x0a\x1c\x0f\x1c\x00\x00\x00\x00\x0b\xba\x0a\
-\x3a\x0a\x34\x0a\x2e\x00\x00\x00\x00\x0b\x78\x0a\x16\x0a\x10\x0a\
-\x0a\x00\x00\x00\x00\x0a\x04\x09\xfe\x09\xf8\x09\xf2\x00\x00\x00\
-\x00\x0d\xd0\x0a\x58\x09\xec\x09\xe6\x00\x00\x00\x00\x09\xe0\x09\
-\xda\x09\xd4\x09\xce\x00\x00\x00\x00\x09\xe0\x09\xda\x09\xd4\x09\
-\xce\x00\x00\x00\x00\x0b\xba\x0a\x3a\x09\xc8\x0a\x2e\x00\x00\x00\
-\x00\x09\xc2\x09\xbc\x09\xb6\x09\xb0\x00\x00\x00\x00\x09\xaa\x09\
-\xa4\x09\x9e\x0b\x3c\x00\x00\x00\x00\x09\xaa\x09\xa4\x09\x9e\x0b\
-\x3c\x00\x00\x00\x00\x09\x98\x09\x92\x09\x8c\x09\x86\x00\x00\x00\
-\x00\x09\x98\x09\x92\x09\x8c\x09\x86\x00\x00\x00\x00\x09\x80\x09\
-\x7a\x09\x74\x09\x6e\x00\x00\x00\x00\x09\x80\x09\x7a\x09\x74\x09\
-\x6e\x00\x00\x00\x00\x09\x68\x09\x62\x09\x5c\x09\x56\x00\x00\x00\
-\x00\x09\x50\x09\x4a\x09\x44\x09\x3e\x00\x00\x00\x00\x09\x50\x09\
-\x4a\x09\x44\x09\x3e\x00\x00\x00\x00\x0b\xba\x0a\x3a\x09\x38\x0a\
-\x2e\x00\x00\x00\x00\x09\x32\x09\x2c\x09\x26\x09\x20\x00\x00\x00\
-\x00\x09\x32\x09\x2c\x09\x26\x09\x20\x00\x00\x00\x00\x09\x1a\x09\
-\x14\x09\x0e\x09\x08\x00\x00\x00\x00\x09\x1a\x09\x14\x09\x0e\x09\
-\x08\x00\x00\x00\x00\x09\x02\x08\xfc\x08\xf6\x0b\x06\x00\x00\x00\
-\x00\x08\xf0\x08\xea\x08\xe4\x0a\xdc\x00\x00\x00\x00\x08\xf0\x08\
-\xea\x08\xe4\x0a\xdc\x00\x00\x00\x00\x08\xde\x08\xd8\x08\xd2\x08\
-\xcc\x00\x00\x00\x00\x08\xde\x08\xd8\x08\xd2\x08\xcc\x00\x00\x00\
-\x00\x0c\x3e\x0a\x58\x08\xc6\x0a\xdc\x00\x00\x00\x00\x0c\xc2\x08\
-\xc0\x08\xba\x08\xb4\x00\x00\x00\x00\x0c\xc2\x08\xc0\x08\xba\x08\
-\xb4\x00\x00\x00\x00\x08\xae\x08\xa8\x08\xa2\x0a\xc4\x00\x00\x00\
-\x00\x08\xae\x08\xa8\x08\xa2\x0a\xc4\x00\x00\x00\x00\x08\x9c\x0a\
-\x3a\x08\x96\x08\x90\x00\x00\x00\x00\x08\x9c\x0a\x3a\x08\x96\x08\
-\x90\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x08\
-\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x08\x8a\x08\x84\x08\
-\x7e\x08\x78\x08\x72\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\
-\x72\x00\x00\x08\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x08\
-\x8a\x08\x84\x08\x7e\x08\x78\x08\x72\x00\x00\x00\x00\x08\x6c\x08\
-\x66\x08\x60\x08\x5a\x00\x00\x00\x00\x08\x6c\x08\x66\x08\x60\x08\
-\x5a\x00\x00\x00\x01\x01\x51\x01\xf4\x00\x01\x01\x86\x01\x1c\x00\
-\x01\x00\x3e\x01\xf4\x00\x01\x01\x88\x00\x00\x00\x01\x01\x64\x01\
-\xf4\x00\x01\x01\xc6\x01\x05\x00\x01\x00\x74\x01\xf4\x00\x01\x01\
-\x64\xff\xed\x00\x01\x02\x58\x01\xf4\x00\x01\x01\x02\x01\xf4\x00\
-\x01\x00\xa4\x01\x00\x00\x01\x01\xa0\x00\x00\x00\x01\x01\x1c\x01\
-\x47\x00\x01\x00\x05\x01\xf4\x00\x01\x01\x62\x00\x00\x00\x01\x01\
-\x21\x01\xf4\x00\x01\x00\x86\x00\xda\x00\x01\x00\x1d\x01\xf4\x00\
-\x01\x00\xed\x00\xe3\x00\x01\x01\x23\x01\xf4\x00\x01\x01\x21\x01\
-\x14\x00\x01\x00\x4c\x01\xd8\x00\x01\x01\x23\x00\x00\x00\x01\x01\
-\x28\x00\xdc\x00\x01\x00\x53\x01\xd8\x00\x01\x00\xf9\x00\x83\x00\
-\x01\x01\x39\x01\x55\x00\x01\x00\x41\x01\xf4\x00\x01\x01\x26\xff\
-\xf7\x00\x01\x01\x47\x01\xf4\x00\x01\x01\x43\x01\x23\x00\x01\x00\
-\x50\x01\xf4\x00\x01\x01\x47\xff\xed\x00\x01\x00\xdd\x01\xf4\x00\
-\x01\x00\x85\x01\x1c\x00\x01\x00\x28\x01\xf4\x00\x01\x00\xdd\x00\
-\x00\x00\x01\x00\x7d\x00\xed\x00\x01\x01\x4a\x01\xf4\x00\x01\x01\
-\x5d\x01\x1c\x00\x01\x00\x44\x01\xf4\x00\x01\x01\x4a\x00\x00\x00\
-\x01\x01\x30\x01\xda\x00\x01\x01\x30\x00\xed\x00\x01\x00\x0c\x01\
-\xda\x00\x01\x01\x30\x00\x00\x00\x01\x01\x3b\x01\xf4\x00\x01\x00\
-\x97\x01\x2d\x00\x01\xff\xc6\x01\xca\x00\x01\x00\xed\x00\x00\x00\
-\x01\x01\x11\x01\xf4\x00\x01\x00\xe8\x01\x26\x00\x01\x00\x1c\x01\
-\xf4\x00\x01\x00\xf4\xff\xed\x00\x01\x00\xc2\x01\x09\x00\x01\x00\
-\x24\x01\xf4\x00\x01\x00\xbc\x01\x09\x00\x01\x00\x98\x01\xf4\x00\
-\x01\x00\x0b\x01\x99\x00\x01\x00\x30\x01\xf4\x00\x01\x00\x98\x00\
-\x00\x00\x01\xff\xf0\x01\x99\x00\x01\x01\x3e\x01\xf4\x00\x01\x01\
-\x3e\x01\x27\x00\x01\x00\x70\x01\xf4\x00\x01\x01\x3e\xff\xed\x00\
-\x01\x01\x3f\x01\xf4\x00\x01\x01\x35\x01\x1c\x00\x01\x00\xec\x01\
-\xf4\x00\x01\x00\x44\x01\x30\x00\x01\x00\x27\x01\xf4\x00\x01\x00\
-\xf8\x00\x00\x00\x01\x00\xdb\x01\xf4\x00\x01\x00\x33\x01\x30\x00\
-\x01\x00\x16\x01\xf4\x00\x01\x00\x34\x01\x30\x00\x01\x00\x69\x01\
-\xf4\x00\x01\x00\xd1\x00\x00\x00\x01\x00\x7d\x01\xf4\x00\x01\xff\
-\xe0\x01\x30\x00\x01\x00\x15\x01\xf4\x00\x01\x01\x22\x01\x1c\x00\
-\x01\x01\x22\x00\x00\x00\x01\x01\x2b\x01\xf4\x00\x01\x00\xac\x01\
-\x1c\x00\x01\x00\x11\x01\xf4\x00\x01\x01\x7d\x00\x00\x00\x01\x00\
-\xe1\x01\xf4\x00\x01\x00\x7f\x01\x24\x00\x01\x00\x2a\x01\xf4\x00\
-\x01\x00\xe1\x00\x00\x00\x01\x01\x22\x01\xf4\x00\x01\x00\xc2\x01\
-\x22\x00\x01\x00\x12\x01\xf4\x00\x01\x01\x38\x00\x00\x00\x01\x01\
-\x44\x01\xf4\x00\x01\x01\x1e\x00\x57\x00\x01\x00\x1e\x01\xf4\x00\
-\x01\x01\x44\x00\x00\x00\x01\x01\x0f\x01\xf4\x00\x01\x01\x0f\x00\
-\x00\x00\x01\x01\x1b\x01\xf4\x00\x01\x01\x1b\x00\x00\x00\x01\x01\
-\x06\x01\xf4\x00\x01\x01\x06\x00\x00\x00\x01\x01\x75\x01\xf4\x00\
-\x01\x01\x75\x00\x00\x00\x01\x01\x1a\x01\xf4\x00\x01\x01\xfb\x00\
-\x0a\x00\x01\x02\x1f\x01\xf4\x00\x01\x00\xc8\x01\xf4\x00\x01\x00\
-\xc8\x00\xfa\x00\x01\x00\xc8\x00\x00\x00\x01\x01\x89\x01\xf4\x00\
-\x01\x01\x26\x01\xf4\x00\x01\x01\x26\x00\x00\x00\x01\x00\xe5\x00\
-\x00\x00\x01\x00\xd4\x01\xf4\x00\x01\x00\xd4\x00\x00\x00\x01\x01\
-\x13\x00\x00\x00\x01\x01\x15\x00\x00\x00\x01\x01\xbf\x01\xf4\x00\
-\x01\x01\xbf\x00\x00\x00\x01\x01\x15\x01\xf4\x00\x01\x01\xf7\x00\
-\x0a\x00\x01\x01\x18\x00\xfa\x00\x01\x01\x18\x00\x00\x00\x01\x02\
-\x1b\x01\xf4\x00\x01\x01\x1d\x00\x00\x00\x01\x01\x92\x01\xf4\x00\
-\x01\x01\x92\x00\x00\x00\x01\x00\xe7\x01\xf4\x00\x01\x00\xe7\x00\
-\xfa\x00\x01\x00\xe7\x00\x00\x00\x01\x01\x6c\x01\xf4\x00\x01\x00\
-\x99\x01\xf4\x00\x01\x00\x99\x00\xfa\x00\x01\x00\x99\x00\x00\x00\
-\x01\x01\x1d\x01\xf4\x00\x01\x00\xfe\x01\xf4\x00\x01\x00\xfe\x00\
-\x00\x00\x01\x00\xd6\x00\x0a\x00\x01\x00\x71\x01\xf4\x00\x01\x00\
-\x71\xff\xff\x00\x01\x00\x7d\x00\x00\x00\x01\x01\x16\x01\xf4\x00\
-\x01\x01\x16\x00\xfa\x00\x01\x01\x16\x00\x00\x00\x01\x01\x14\x01\
-\xf4\x00\x01\x01\x14\x00\x00\x00\x01\x00\xc9\x01\xf4\x00\x01\x00\
-\xc9\x00\x00\x00\x01\x01\xe3\x00\x0a\x00\x01\x01\x0d\x01\xf4\x00\
-\x01\x01\x0d\x00\x00\x00\x01\x01\x13\x01\xf4\x00\x01\x01\x1a\x00\
-\xfa\x00\x01\x02\x22\x01\xf4\x00\x01\x01\x01\x01\xf4\x00\x01\x00\
-\xfc\x00\x00\x00\x01\x01\x1c\x01\xf4\x00\x01\x01\x1c\x00\x00\x00\
-\x01\x01\xaf\x01\xf4\x00\x01\x01\xaf\x00\x00\x00\x01\x01\xf3\x00\
-\x0a\x00\x01\x01\x18\x01\xf4\x00\x01\x01\x1a\x00\x00\x00\x01\x01\
-\x27\x03\x8e\x00\x01\x01\x27\x02\xbc\x00\x01\x01\x27\xff\xff\x00\
-\x01\x01\x3f\x03\xab\x00\x01\x01\x3f\x02\xbc\x00\x01\x01\x3f\x00\
-\x00\x00\x01\x01\x57\x02\xb5\x00\x01\x01\x57\x00\x00\x00\x01\x01\
-\xdd\x02\xbc\x00\x01\x01\xdd\xff\xff\x00\x01\x01\x58\x03\xb0\x00\
-\x01\x01\x58\x03\xab\x00\x01\x01\x99\x00\x0a\x00\x01\x01\x58\x02\
-\xbc\x00\x01\x01\x58\x00\x00\x00\x01\x02\xa0\x02\xc4\x00\x01\x01\
-\x43\x02\xbc\x00\x01\x01\x43\x01\x62\x00\x01\x01\x43\xff\xff\x00\
-\x01\x01\x10\x03\x8e\x00\x01\x01\x10\x02\xbc\x00\x01\x01\x12\x00\
-\x00\x00\x01\x01\x2c\x02\xbc\x00\x01\x01\x31\xff\xff\x00\x01\x01\
-\x7f\x02\xbc\x00\x01\x01\x89\x00\x00\x00\x01\x01\x2f\x02\xbc\x00\
-\x01\x01\x2f\xff\xff\x00\x01\x02\x2b\x02\xbc\x00\x01\x02\x2b\xff\
-\xff\x00\x01\x01\x6b\x03\xb0\x00\x01\x01\x6b\x03\xab\x00\x01\x01\
-\xb1\x00\x03\x00\x01\x01\x6b\x02\xbc\x00\x01\x01\x6b\x01\x5e\x00\
-\x01\x00\x14\x02\xbc\x00\x01\x01\x6b\x00\x00\x00\x01\x02\xc1\x02\
-\xbc\x00\x01\x01\x55\x02\xbc\x00\x01\x01\x55\x00\x00\x00\x01\x01\
-\x94\x02\xbc\x00\x01\x01\x9d\xff\xff\x00\x01\x01\x40\x02\xbc\x00\
-\x01\x01\x6a\x01\x62\x00\x01\x01\x6a\xff\xff\x00\x01\x02\x70\x02\
-\xbc\x00\x01\x00\xf7\x02\xbc\x00\x01\x01\x22\x01\x62\x00\x01\x01\
-\x22\xff\xff\x00\x01\x02\x27\x02\xbc\x00\x01\x01\x34\x00\x00\x00\
-\x01\x01\x73\x02\xbc\x00\x01\x01\x0c\x00\x00\x00\x01\x00\x73\x03\
-\xb0\x00\x01\x00\x73\x03\xab\x00\x01\x00\xd4\x00\x0a\x00\x01\x00\
-\x73\x02\xbc\x00\x01\x00\x0d\x02\xbc\x00\x01\x00\x73\x00\x00\x00\
-\x01\x01\x4b\x02\xbc\x00\x01\x01\x4b\x01\x5e\x00\x01\x00\x17\x02\
-\xbc\x00\x01\x01\x4b\x00\x00\x00\x01\x01\x6c\x02\xbc\x00\x01\x01\
-\x65\x00\x00\x00\x01\x01\x35\x02\xbc\x00\x01\x01\x35\x00\x00\x00\
-\x01\x01\x36\x03\xb0\x00\x01\x02\x44\x00\x09\x00\x01\x01\x36\x02\
-\xbc\x00\x01\x00\x1c\x02\xbc\x00\x01\x01\x36\x00\x00\x00\x01\x01\
-\x86\x02\xbc\x00\x01\x01\x8d\x01\x62\x00\x01\x01\x8d\xff\xff\x00\
-\x01\x01\x47\x02\xbc\x00\x01\x01\x4e\x01\x62\x00\x01\x01\x4e\xff\
-\xff\x00\x01\x01\x68\x02\xbc\x00\x01\x01\x68\x00\x00\x00\x01\x01\
-\x34\x02\xbc\x00\x01\x01\x34\xff\xff\x00\x01\x02\x20\x02\xbc\x00\
-\x01\x02\x20\x00\x00\x00\x01\x01\x62\x03\xb0\x00\x01\x01\x62\x03\
-\xab\x00\x01\x02\x82\x00\x0a\x00\x01\x01\x62\x02\xbc\x00\x01\x01\
-\x63\x00\x00\x00\x02\x00\x04\x00\x01\x00\x49\x00\x00\x00\x4b\x00\
-\x58\x00\x49\x00\x5a\x00\x7c\x00\x57\x00\x87\x00\xbe\x00\x7a\x00\
-\x1d\x00\x00\x00\xf4\x00\x01\x00\xee\x00\x01\x00\xe8\x00\x01\x00\
-\xe2\x00\x01\x00\xdc\x00\x01\x00\xee\x00\x01\x00\xd6\x00\x01\x00\
-\xd6\x00\x01\x00\xd0\x00\x01\x00\xd0\x00\x02\x00\xf4\x00\x02\x00\
-\xf4\x00\x01\x00\xca\x00\x03\x00\xc4\x00\x04\x00\xbe\x00\x02\x00\
-\xf4\x00\x01\x00\xb8\x00\x04\x00\xb2\x00\x04\x00\xac\x00\x04\x00\
-\xa6\x00\x04\x00\xa0\x00\x04\x00\x9a\x00\x04\x00\x94\x00\x04\x00\
-\x8e\x00\x04\x00\x88\x00\x04\x00\x82\x00\x04\x00\x7c\x00\x04\x00\
-\x94\x00\x05\x00\x76\x00\x01\x00\xfa\xff\xcf\x00\x01\x00\xf7\x01\
-\xf4\x00\x01\x00\xab\x01\xf5\x00\x01\x00\xb1\x01\xf4\x00\x01\x01\
-\x01\x01\xf5\x00\x01\x01\x03\x01\xf4\x00\x01\x00\xcb\x01\xf4\x00\
-\x01\x00\xcd\x01\xf5\x00\x01\x00\xd1\x01\xf4\x00\x01\x00\x7a\x01\
-\xf8\x00\x01\x00\xe4\x01\xf4\x00\x01\x00\x66\x00\x26\x00\x01\x00\
-\x77\x01\x9a\x00\x01\x00\x4b\x01\x28\x00\x01\x00\x4e\x00\x26\x00\
-\x01\x00\x97\x00\x26\x00\x01\x00\x9e\x00\x26\x00\x01\x00\xd5\x00\
-\x26\x00\x01\x00\xe0\x00\x26\x00\x01\x00\xe2\x00\x1b\x00\x01\x00\
-\x4b\x00\x26\x00\x01\x00\x4b\x01\x8e\x00\x02\x00\x02\x01\x1c\x01\
-\x37\x00\x00\x01\x39\x01\x39\x00\x1c\x00\x02\x00\x08\x00\x01\x00\
-\x08\x00\x01\x00\x2a\x00\x05\x00\x00\x00\x10\x01\xf6\x01\xb8\x01\
-\x7a\x01\x72\x01\x64\x01\x5c\x01\x4e\x01\x22\x01\x1a\x00\xfa\x00\
-\xec\x00\xd8\x00\xbe\x00\x86\x01\x5c\x00\x4e\x00\x01\x00\x10\x00\
-\x87\x00\x8d\x00\x8f\x00\x91\x00\x96\x00\x99\x00\x9b\x00\xa1\x00\
-\xa4\x00\xa7\x00\xa9\x00\xab\x00\xb1\x00\xb5\x00\xb7\x00\xbd\x00\
-\x09\x00\x8f\xff\xce\xff\xce\x00\x99\xff\xe2\xff\xe2\x00\x9b\xff\
-\xd8\xff\xd8\x00\x9f\xff\xe2\xff\xe2\x00\xa1\xff\xe2\xff\xe2\x00\
-\xa9\xff\xe2\xff\xe2\x00\xab\xff\xec\xff\xec\x00\xae\xff\xe2\xff\
-\xe2\x00\xb3\xff\xe2\xff\xe2\x00\x09\x00\x8b\xff\xb0\xff\xb0\x00\
-\x91\xff\xe2\xff\xe2\x00\x98\xff\xd8\xff\xd8\x00\x9d\xff\xec\xff\
-\xec\x00\xa7\xff\xf6\xff\xf6\x00\xa9\xff\xec\xff\xec\x00\xae\xff\
-\xec\xff\xec\x00\xb5\xff\xe2\xff\xe2\x00\xbd\xff\xe2\xff\xe2\x00\
-\x04\x00\x99\xff\xe2\xff\xe2\x00\xa1\xff\xec\xff\xec\x00\xa9\xff\
-\xec\xff\xec\x00\xae\xff\xf6\xff\xf6\x00\x03\x00\x99\xff\xf6\xff\
-\xf6\x00\xa9\xff\xec\xff\xec\x00\xae\x00\x00\x00\x00\x00\x02\x00\
-\x8b\xff\xd8\xff\xd8\x00\xb1\xff\xe2\xff\xe2\x00\x05\x00\x87\xff\
-\xf6\xff\xf6\x00\x99\xff\xe2\xff\xe2\x00\x9b\xff\xf6\xff\xf6\x00\
-\x9f\xff\xec\xff\xec\x00\xa9\xff\xf6\xff\xf6\x00\x01\x00\x9f\xff\
-\xec\xff\xec\x00\x07\x00\x8b\xff\xba\xff\xba\x00\x8d\xff\xce\xff\
-\xce\x00\x91\xff\xe2\xff\xe2\x00\x98\xff\xec\xff\xec\x00\xa3\xff\
-\xec\xff\xec\x00\xa9\xff\xec\xff\xec\x00\xb5\xff\xec\xff\xec\x00\
-\x02\x00\x8b\xff\xba\xff\xba\x00\x8d\xff\xec\xff\xec\x00\x01\x00\
-\x8b\xff\xd8\xff\xd8\x00\x02\x00\x8b\xff\xce\xff\xce\x00\x8d\xff\
-\xec\xff\xec\x00\x01\x00\x8b\xff\xf6\xff\xf6\x00\x0a\x00\x8b\xff\
-\xa6\xff\xa6\x00\x8d\xff\xec\xff\xec\x00\x91\xff\xe2\xff\xe2\x00\
-\xa1\x00\x00\x00\x00\x00\xa3\xff\xe2\xff\xe2\x00\xa4\xff\xe2\xff\
-\xe2\x00\xa7\xff\xe2\xff\xe2\x00\xa9\xff\xec\xff\xec\x00\xb5\xff\
-\xce\xff\xce\x00\xbd\xff\xce\xff\xce\x00\x0a\x00\x87\xff\xf6\xff\
-\xf6\x00\x8f\xff\xe2\xff\xe2\x00\x96\xff\xdd\xff\xdd\x00\x99\xff\
-\xec\xff\xec\x00\x9b\xff\xec\xff\xec\x00\x9f\xff\xec\xff\xec\x00\
-\xa1\xff\xe2\xff\xe2\x00\xb3\xff\xec\xff\xec\x00\xd2\xff\xc4\xff\
-\xc4\x00\xf1\xff\xce\xff\xce\x00\x04\x00\x8f\xff\xf6\xff\xf6\x00\
-\x99\xff\xe7\xff\xe7\x00\x9f\xff\xec\xff\xec\x00\xa1\xff\xec\xff\
-\xec\x00\x02\x00\x00\x00\x02\x00\x80\x00\x0a\x00\x02\x01\x92\x00\
-\x04\x00\x00\x00\x72\x00\x26\x00\x01\x00\x0b\x00\x00\xff\xea\x00\
-\x00\xff\xfb\x00\x00\xff\xfb\xff\xfa\xff\xf6\xff\xf1\x00\x00\xff\
-\xfa\x00\x02\x00\x0c\x00\x01\x00\x08\x00\x01\x00\x3e\x00\x43\x00\
-\x03\x00\x45\x00\x45\x00\x03\x00\x47\x00\x48\x00\x08\x00\x4c\x00\
-\x4f\x00\x05\x00\x50\x00\x50\x00\x06\x00\x53\x00\x58\x00\x04\x00\
-\x60\x00\x67\x00\x02\x00\x6c\x00\x6d\x00\x09\x00\x6f\x00\x6f\x00\
-\x0a\x00\x78\x00\x7a\x00\x07\x00\x80\x00\x81\x00\x06\x00\x02\x00\
-\x00\x00\x01\x01\x1c\x00\x04\x00\x00\x00\x89\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\
-\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x01\xb6\x00\x02\x00\
-\x19\x00\x01\x00\x09\x00\x00\x00\x0f\x00\x12\x00\x09\x00\x14\x00\
-\x14\x00\x0d\x00\x16\x00\x1c\x00\x0e\x00\x1f\x00\x1f\x00\x15\x00\
-\x29\x00\x29\x00\x16\x00\x2b\x00\x2d\x00\x17\x00\x30\x00\x30\x00\
-\x1a\x00\x36\x00\x38\x00\x1b\x00\x46\x00\x46\x00\x1e\x00\x49\x00\
-\x4a\x00\x1f\x00\x50\x00\x58\x00\x21\x00\x6a\x00\x6b\x00\x2a\x00\
-\x6e\x00\x6e\x00\x2c\x00\x75\x00\x77\x00\x2d\x00\x80\x00\x80\x00\
-\x30\x00\x85\x00\x86\x00\x31\x00\xbf\x00\xd0\x00\x33\x00\xd5\x00\
-\xd5\x00\x45\x00\xd7\x00\xed\x00\x46\x00\xf0\x00\xf7\x00\x5d\x00\
-\xfa\x01\x0a\x00\x65\x01\x0c\x01\x1b\x00\x76\x01\x35\x01\x36\x00\
-\x86\x01\x39\x01\x39\x00\x88\x00\x0b\x00\x01\xff\xea\x00\x30\x00\
-\x00\x00\x36\xff\x6a\x00\x3e\xff\xfb\x00\x4b\x00\x00\x00\x51\x00\
-\x00\x00\x60\xff\xfe\x00\x6a\x00\x00\x00\x75\x00\x00\x00\x77\x00\
-\x00\x00\x78\xff\xf6\x00\x02\x00\x08\x00\x02\x06\x50\x00\x0a\x00\
-\x02\x04\x90\x00\x04\x00\x00\x05\xa0\x04\xfa\x00\x18\x00\x18\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xbb\x00\x00\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\x83\x00\x00\xff\xf6\x00\x00\xff\xe2\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xce\x00\x00\x00\x00\x00\x00\xff\xf6\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\x7e\xff\xd8\xff\xec\x00\x00\xff\xe2\x00\x00\x00\x00\xff\
-\xe4\x00\x00\x00\x00\xff\xce\x00\x00\xff\xf1\x00\x00\xff\xf1\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xec\x00\x00\xff\xd8\xff\xf6\x00\x00\xff\xec\x00\x00\xff\xe2\xff\
-\xf6\xff\xec\x00\x00\x00\x00\xff\xec\xff\xec\x00\x00\xff\xf6\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xc1\x00\x00\x00\x00\x00\x00\xff\xf6\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\x6a\xff\x88\xff\x7e\xff\xec\x00\x00\x00\x00\xff\xb0\xff\
-\x88\x00\x00\xff\x6a\xff\xce\xff\xa6\xff\xab\xff\xce\xff\xec\x00\
-\x00\xff\x88\x00\x00\x00\x00\xff\xa6\xff\x9c\x00\x00\xff\xb0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd1\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf6\xff\
-\xf1\xff\xec\x00\x00\xff\xe2\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\x91\x00\x00\xff\xec\x00\x00\xff\xe2\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xce\x00\x00\x00\x00\x00\x00\xff\xf6\x00\
-\x00\xff\xad\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xe2\xff\x9c\xff\xba\x00\x00\xff\xf6\x00\x00\x00\x00\x00\x00\xff\
-\xb5\xff\xe2\x00\x00\x00\x00\xff\xea\xff\xec\x00\x00\x00\x00\x00\
-\x00\xff\xec\x00\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xe2\x00\x00\x00\x00\xff\xe7\x00\x00\xff\xce\xff\xec\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\xff\xf6\x00\x00\x00\x00\xff\xe2\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xce\xff\xce\xff\xf6\x00\x00\xff\xf6\x00\x00\xff\xf6\xff\
-\xe2\x00\x00\xff\xce\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xec\xff\
-\xd8\xff\x83\x00\x00\x00\x00\x00\x00\xff\x88\x00\x00\x00\x00\x00\
-\x00\xff\xd8\x00\x00\xff\x88\x00\x00\x00\x00\x00\x00\xff\x88\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf1\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xd8\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xe2\xff\xec\x00\x00\x00\x00\xff\xd8\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xec\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xec\xff\
-\xec\x00\x00\x00\x00\xff\xec\x00\x00\xff\xce\x00\x00\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xd8\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xf5\xff\x88\x00\x00\xff\xf6\x00\x00\xff\xec\x00\x00\x00\x00\x00\
-\x00\xff\xf6\x00\x00\xff\xec\xff\xf6\xff\xfa\x00\x00\xff\xf6\x00\
-\x00\xff\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\xff\xd8\xff\xec\x00\x00\xff\xe2\x00\x00\x00\x00\xff\
-\xe4\x00\x00\x00\x00\xff\xce\x00\x00\xff\xf1\x00\x00\xff\xf6\x00\
-\x00\xff\x9c\x00\x00\x00\x00\x00\x00\x00\x14\x00\x14\x00\x00\xff\
-\xce\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xe2\x00\x00\x00\
-\x00\xff\xce\x00\x00\x00\x00\xff\xdd\x00\x00\x00\x14\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\xff\xb5\x00\x00\xff\xec\x00\x00\xff\xd8\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\xff\xd8\xff\xfb\x00\x00\x00\x00\xff\xf0\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xe2\xff\x9c\x00\x00\xff\xf6\x00\x00\xff\xf1\x00\x00\x00\x00\x00\
-\x00\xff\xe2\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\xf6\x00\
-\x00\xff\xad\x00\x00\x00\x00\xff\xec\x00\x00\x00\x00\x00\x00\xff\
-\xe2\xff\xec\xff\x7e\x00\x00\x00\x00\xff\xf6\x00\x00\x00\x00\xff\
-\xce\xff\xe2\x00\x00\x00\x00\xff\xec\xff\xe2\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\x00\xff\
-\xec\xff\xc9\x00\x00\x00\x00\x00\x00\xff\xf5\x00\x00\x00\x00\x00\
-\x00\xff\xec\x00\x00\x00\x00\x00\x00\xff\xf6\x00\x00\x00\x00\x00\
-\x02\x00\x11\x00\x0a\x00\x0d\x00\x00\x00\x1d\x00\x1e\x00\x04\x00\
-\x20\x00\x28\x00\x06\x00\x2a\x00\x2a\x00\x0f\x00\x2e\x00\x2f\x00\
-\x10\x00\x31\x00\x35\x00\x12\x00\x39\x00\x45\x00\x17\x00\x47\x00\
-\x48\x00\x24\x00\x4b\x00\x4f\x00\x26\x00\x5b\x00\x69\x00\x2b\x00\
-\x6c\x00\x6d\x00\x3a\x00\x6f\x00\x74\x00\x3c\x00\x78\x00\x7c\x00\
-\x42\x00\x81\x00\x81\x00\x47\x00\xd6\x00\xd6\x00\x48\x00\xee\x00\
-\xef\x00\x49\x00\xf8\x00\xf9\x00\x4b\x00\x02\x00\x1b\x00\x01\x00\
-\x08\x00\x01\x00\x0a\x00\x0b\x00\x0e\x00\x16\x00\x1a\x00\x05\x00\
-\x2a\x00\x2a\x00\x16\x00\x2e\x00\x2f\x00\x0f\x00\x31\x00\x35\x00\
-\x06\x00\x39\x00\x3b\x00\x09\x00\x3c\x00\x3d\x00\x10\x00\x3e\x00\
-\x43\x00\x03\x00\x45\x00\x45\x00\x03\x00\x47\x00\x48\x00\x11\x00\
-\x4c\x00\x4f\x00\x08\x00\x50\x00\x50\x00\x0b\x00\x53\x00\x58\x00\
-\x04\x00\x5d\x00\x5f\x00\x0c\x00\x60\x00\x67\x00\x02\x00\x6c\x00\
-\x6d\x00\x14\x00\x6f\x00\x6f\x00\x17\x00\x70\x00\x74\x00\x07\x00\
-\x78\x00\x7a\x00\x0d\x00\x7b\x00\x7c\x00\x15\x00\x80\x00\x81\x00\
-\x0b\x00\xd5\x00\xd5\x00\x12\x00\xd6\x00\xd6\x00\x0a\x00\xd9\x00\
-\xd9\x00\x12\x00\xee\x00\xef\x00\x0a\x00\xf8\x00\xf9\x00\x13\x00\
-\x02\x00\x1b\x00\x0a\x00\x0b\x00\x0b\x00\x0c\x00\x0d\x00\x0c\x00\
-\x1d\x00\x1e\x00\x0d\x00\x20\x00\x21\x00\x0e\x00\x2a\x00\x2a\x00\
-\x16\x00\x2e\x00\x2f\x00\x0f\x00\x31\x00\x35\x00\x04\x00\x39\x00\
-\x3b\x00\x06\x00\x3c\x00\x3d\x00\x10\x00\x3e\x00\x44\x00\x01\x00\
-\x45\x00\x45\x00\x02\x00\x47\x00\x48\x00\x11\x00\x4b\x00\x4f\x00\
-\x02\x00\x5b\x00\x5c\x00\x08\x00\x5d\x00\x5f\x00\x09\x00\x60\x00\
-\x66\x00\x03\x00\x67\x00\x67\x00\x02\x00\x68\x00\x69\x00\x12\x00\
-\x6c\x00\x6d\x00\x14\x00\x6f\x00\x6f\x00\x17\x00\x70\x00\x74\x00\
-\x05\x00\x78\x00\x7a\x00\x0a\x00\x7b\x00\x7c\x00\x15\x00\x81\x00\
-\x81\x00\x08\x00\xd6\x00\xd6\x00\x07\x00\xee\x00\xef\x00\x07\x00\
-\xf8\x00\xf9\x00\x13\x00\x01\x00\xf0\x00\x04\x00\x00\x00\x73\x12\
-\x76\x12\x54\x12\x54\x12\x54\x12\x54\x12\x54\x12\x54\x12\x4a\x12\
-\x0c\x11\xfa\x11\xfa\x11\xbc\x11\xbc\x12\x4a\x12\x4a\x12\x4a\x12\
-\x4a\x12\x4a\x10\x9a\x10\x80\x10\x6a\x0f\x34\x0f\x2a\x0f\x2a\x0f\
-\x20\x0f\x20\x0f\x0a\x0f\x0a\x0f\x0a\x0f\x0a\x0f\x0a\x0f\x0a\x0f\
-\x0a\x12\x4a\x0e\xf4\x0d\xda\x0c\xd8\x0c\xb6\x0c\x94\x0b\x52\x0b\
-\x3c\x0b\x3c\x0b\x3c\x0b\x3c\x0b\x3c\x09\xe6\x08\xe0\x08\x1a\x07\
-\xe0\x07\xe0\x07\xe0\x07\xd6\x07\xd6\x07\xc4\x07\xc4\x07\xc4\x07\
-\xc4\x07\xc4\x07\xc4\x07\xc4\x07\xba\x07\x60\x07\x46\x07\x46\x07\
-\x30\x07\xba\x07\xba\x07\xba\x07\xba\x07\xba\x06\xa2\x06\x7c\x06\
-\x5a\x05\xac\x05\x9e\x05\x9e\x05\x80\x05\x80\x05\x80\x05\x56\x05\
-\x56\x05\x56\x05\x56\x05\x56\x05\x56\x05\x56\x07\xba\x05\x30\x05\
-\x0a\x04\xf8\x04\x22\x04\x10\x04\x10\x04\x06\x03\xf4\x03\xf4\x03\
-\xf4\x03\xf4\x03\xf4\x03\x5a\x02\xac\x02\x42\x02\x14\x02\x14\x02\
-\x14\x01\xfa\x01\xfa\x05\x9e\x01\xe0\x01\xd6\x01\x74\x01\xd6\x01\
-\xd6\x01\x52\x01\x3c\x00\x02\x00\x0c\x00\x01\x00\x14\x00\x00\x00\
-\x1b\x00\x1e\x00\x14\x00\x20\x00\x2a\x00\x18\x00\x2c\x00\x49\x00\
-\x23\x00\x4b\x00\x52\x00\x41\x00\x5a\x00\x6d\x00\x49\x00\x6f\x00\
-\x7c\x00\x5d\x00\x81\x00\x81\x00\x6b\x00\xd5\x00\xd6\x00\x6c\x00\
-\xd9\x00\xd9\x00\x6e\x00\xee\x00\xef\x00\x6f\x00\xf8\x00\xf9\x00\
-\x71\x00\x05\x00\x13\x00\x14\x00\x1b\xff\x6a\x00\x1f\x00\x14\x00\
-\x2d\x00\x14\x00\x5a\x00\x0a\x00\x08\x00\x0a\xff\xe2\x00\x0b\xff\
-\xe2\x00\x13\x00\x14\x00\x1b\xff\x6a\x00\x1f\x00\x14\x00\x2d\x00\
-\x14\x00\x5a\x00\x0a\x00\x68\x00\x02\x00\x18\x00\x0a\xff\xd8\x00\
-\x0b\xff\xd8\x00\x2c\xff\xe2\x00\x30\xff\x38\x00\x31\xff\xd8\x00\
-\x32\xff\xd8\x00\x33\xff\xd8\x00\x34\xff\xd8\x00\x35\xff\xd8\x00\
-\x36\xff\x56\x00\x37\xff\xa6\x00\x39\xff\x74\x00\x3a\xff\x74\x00\
-\x3b\xff\x74\x00\x50\xff\xd8\x00\x6a\xff\xec\x00\x6f\xff\xd8\x00\
-\x75\xff\xce\x00\x76\xff\xec\x00\x78\xff\xd8\x00\x79\xff\xd8\x00\
-\x7a\xff\xd8\x00\x80\xff\xd8\x00\x81\xff\xd8\x00\x02\x00\x30\xff\
-\x93\x00\x76\xff\xd1\x00\x06\x00\x30\xff\x38\x00\x36\xff\x56\x00\
-\x37\xff\xa6\x00\x6a\xff\xec\x00\x75\xff\xce\x00\x76\xff\xec\x00\
-\x06\x00\x30\xff\x9f\x00\x36\xff\xbb\x00\x37\xff\xad\x00\x45\xff\
-\xe2\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\x0b\x00\x08\xff\x9f\x00\
-\x1b\xff\xa9\x00\x30\xff\x76\x00\x36\xff\xd8\x00\x37\xff\xe4\x00\
-\x38\xff\xc2\x00\x45\xff\xd8\x00\x49\xff\xe3\x00\x5d\xff\xf0\x00\
-\x67\xff\xd8\x00\xd9\xff\xba\x00\x1a\x00\x3e\xff\xec\x00\x3f\xff\
-\xec\x00\x40\xff\xec\x00\x41\xff\xec\x00\x42\xff\xec\x00\x43\xff\
-\xec\x00\x44\xff\xec\x00\x45\xff\xec\x00\x47\xff\xec\x00\x48\xff\
-\xec\x00\x49\xff\xec\x00\x4b\xff\xec\x00\x4c\xff\xec\x00\x4d\xff\
-\xec\x00\x4e\xff\xec\x00\x4f\xff\xec\x00\x51\xff\xec\x00\x60\xff\
-\xec\x00\x61\xff\xec\x00\x62\xff\xec\x00\x63\xff\xec\x00\x64\xff\
-\xec\x00\x65\xff\xec\x00\x66\xff\xec\x00\x67\xff\xec\x00\x6a\xff\
-\xec\x00\x2b\x00\x30\xff\x91\x00\x36\xff\xd8\x00\x37\xff\xce\x00\
-\x38\xff\xc9\x00\x39\xff\xb5\x00\x3a\xff\xb5\x00\x3b\xff\xb5\x00\
-\x3e\xff\xec\x00\x3f\xff\xec\x00\x40\xff\xec\x00\x41\xff\xec\x00\
-\x42\xff\xec\x00\x43\xff\xec\x00\x44\xff\xec\x00\x45\xff\xec\x00\
-\x47\xff\xec\x00\x48\xff\xec\x00\x49\xff\xec\x00\x4b\xff\xec\x00\
-\x4c\xff\xec\x00\x4d\xff\xec\x00\x4e\xff\xec\x00\x4f\xff\xec\x00\
-\x51\xff\xec\x00\x60\xff\xec\x00\x61\xff\xec\x00\x62\xff\xec\x00\
-\x63\xff\xec\x00\x64\xff\xec\x00\x65\xff\xec\x00\x66\xff\xec\x00\
-\x67\xff\xec\x00\x6a\xff\xec\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\
-\x75\x00\x0a\x00\x7b\xff\xf6\x00\x7c\xff\xf6\x00\xd5\xff\xb0\x00\
-\xd6\xff\xb0\x00\xd9\xff\xb0\x00\xee\xff\xb0\x00\xef\xff\xb0\x00\
-\x26\x00\x39\xff\xc2\x00\x3a\xff\xc2\x00\x3b\xff\xc2\x00\x3e\xff\
-\xe2\x00\x3f\xff\xe2\x00\x40\xff\xe2\x00\x41\xff\xe2\x00\x42\xff\
-\xe2\x00\x43\xff\xe2\x00\x44\xff\xe2\x00\x45\xff\xe2\x00\x47\xff\
-\xe2\x00\x48\xff\xe2\x00\x49\xff\xe2\x00\x4b\xff\xe2\x00\x4c\xff\
-\xe2\x00\x4d\xff\xe2\x00\x4e\xff\xe2\x00\x4f\xff\xe2\x00\x51\xff\
-\xe2\x00\x60\xff\xe2\x00\x61\xff\xe2\x00\x62\xff\xe2\x00\x63\xff\
-\xe2\x00\x64\xff\xe2\x00\x65\xff\xe2\x00\x66\xff\xe2\x00\x67\xff\
-\xe2\x00\x6a\xff\xe2\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x7b\xff\
-\xec\x00\x7c\xff\xec\x00\xd5\xff\x9c\x00\xd6\xff\x9c\x00\xd9\xff\
-\x9c\x00\xee\xff\x9c\x00\xef\xff\x9c\x00\x04\x00\x30\xff\x88\x00\
-\x36\xff\xbb\x00\x37\xff\xc9\x00\x75\xff\xf6\x00\x02\x00\x36\xff\
-\xe5\x00\x37\xff\xe5\x00\x04\x00\x30\xff\x88\x00\x6f\xff\xf0\x00\
-\x75\xff\xd8\x00\x76\xff\xe2\x00\x35\x00\x01\xff\x9f\x00\x02\xff\
-\x9f\x00\x03\xff\x9f\x00\x04\xff\x9f\x00\x05\xff\x9f\x00\x06\xff\
-\x9f\x00\x07\xff\x9f\x00\x08\xff\x91\x00\x1b\xff\x83\x00\x30\xff\
-\x9f\x00\x36\xff\xd7\x00\x37\xff\xe4\x00\x38\xff\xe4\x00\x39\xff\
-\xc9\x00\x3a\xff\xc9\x00\x3b\xff\xc9\x00\x3c\xff\xd7\x00\x3d\xff\
-\xd7\x00\x3e\xff\xe2\x00\x3f\xff\xe2\x00\x40\xff\xe2\x00\x41\xff\
-\xe2\x00\x42\xff\xe2\x00\x43\xff\xe2\x00\x44\xff\xe2\x00\x45\xff\
-\xe2\x00\x47\xff\xe2\x00\x48\xff\xe2\x00\x49\xff\xe2\x00\x4b\xff\
-\xe2\x00\x4c\xff\xe2\x00\x4d\xff\xe2\x00\x4e\xff\xe2\x00\x4f\xff\
-\xe2\x00\x51\xff\xe2\x00\x60\xff\xea\x00\x61\xff\xe2\x00\x62\xff\
-\xe2\x00\x63\xff\xe2\x00\x64\xff\xe2\x00\x65\xff\xe2\x00\x66\xff\
-\xe2\x00\x67\xff\xe2\x00\x6a\xff\xe2\x00\x6c\xff\xea\x00\x6d\xff\
-\xec\x00\x7b\xff\xec\x00\x7c\xff\xec\x00\xd5\xff\x9c\x00\xd6\xff\
-\x9c\x00\xd9\xff\x9c\x00\xee\xff\x9c\x00\xef\xff\x9c\x00\x04\x00\
-\x39\xff\xb5\x00\x3a\xff\xb5\x00\x3b\xff\xb5\x00\x59\x00\x7d\x00\
-\x09\x00\x30\xff\x88\x00\x36\xff\x9c\x00\x37\xff\xba\x00\x38\xff\
-\xec\x00\x6a\xff\xfe\x00\x75\xff\xe2\x00\x76\xff\xec\x00\x77\xff\
-\xec\x00\xd9\xff\xd8\x00\x09\x00\x30\xff\x88\x00\x36\xff\x9c\x00\
-\x37\xff\xba\x00\x38\xff\xec\x00\x6a\xff\xf6\x00\x75\xff\xe2\x00\
-\x76\xff\xec\x00\x77\xff\xec\x00\xd9\xff\xd8\x00\x0a\x00\x30\xff\
-\x88\x00\x36\xff\x9c\x00\x37\xff\xba\x00\x38\xff\xec\x00\x50\xff\
-\xec\x00\x75\xff\xe2\x00\x76\xff\xec\x00\x77\xff\xec\x00\x78\xff\
-\xe2\x00\xd9\xff\xd8\x00\x07\x00\x30\xff\x75\x00\x36\xff\x91\x00\
-\x37\xff\x9f\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x80\xff\xec\x00\
-\x81\xff\xec\x00\x03\x00\x5b\xff\xf6\x00\x75\xff\xd8\x00\x76\xff\
-\xd8\x00\x2b\x00\x39\xff\x90\x00\x3a\xff\x90\x00\x3b\xff\x90\x00\
-\x3e\xff\xe2\x00\x3f\xff\xe2\x00\x40\xff\xe2\x00\x41\xff\xe2\x00\
-\x42\xff\xe2\x00\x43\xff\xe2\x00\x44\xff\xe2\x00\x45\xff\xe2\x00\
-\x47\xff\xe2\x00\x48\xff\xec\x00\x49\xff\xe2\x00\x4b\xff\xe2\x00\
-\x4c\xff\xe2\x00\x4d\xff\xe2\x00\x4e\xff\xe2\x00\x4f\xff\xe2\x00\
-\x50\xff\xe2\x00\x51\xff\xe2\x00\x60\xff\xe2\x00\x61\xff\xe2\x00\
-\x62\xff\xe2\x00\x63\xff\xe2\x00\x64\xff\xe2\x00\x65\xff\xe2\x00\
-\x66\xff\xe2\x00\x67\xff\xe2\x00\x6a\xff\xe2\x00\x6f\xff\xe2\x00\
-\x70\xff\xe2\x00\x71\xff\xe2\x00\x72\xff\xe2\x00\x73\xff\xe2\x00\
-\x74\xff\xe2\x00\x75\xff\xd3\x00\x76\xff\xe2\x00\x78\xff\xd8\x00\
-\x79\xff\xd8\x00\x7a\xff\xd8\x00\x80\xff\xe2\x00\x81\xff\xe2\x00\
-\x08\x00\x30\xff\x75\x00\x36\xff\x91\x00\x37\xff\x9f\x00\x39\xff\
-\x88\x00\x3a\xff\x88\x00\x3b\xff\x88\x00\x75\xff\xe2\x00\x76\xff\
-\xe2\x00\x09\x00\x39\xff\xa9\x00\x3a\xff\xa9\x00\x3b\xff\xa9\x00\
-\x59\x00\x61\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\x78\xff\xfe\x00\
-\x79\xff\xf8\x00\x7a\xff\xf8\x00\x23\x00\x3e\xff\xec\x00\x3f\xff\
-\xec\x00\x40\xff\xec\x00\x41\xff\xec\x00\x42\xff\xec\x00\x43\xff\
-\xec\x00\x44\xff\xec\x00\x45\xff\xec\x00\x47\xff\xec\x00\x48\xff\
-\xec\x00\x49\xff\xec\x00\x4b\xff\xf6\x00\x4c\xff\xf6\x00\x4d\xff\
-\xf6\x00\x4e\xff\xf6\x00\x4f\xff\xf6\x00\x51\xff\xec\x00\x60\xff\
-\xeb\x00\x61\xff\xec\x00\x62\xff\xec\x00\x63\xff\xec\x00\x64\xff\
-\xec\x00\x65\xff\xec\x00\x66\xff\xec\x00\x67\xff\xec\x00\x6a\xff\
-\xec\x00\x6c\xff\xf6\x00\x6d\xff\xf6\x00\x7b\xff\xf6\x00\x7c\xff\
-\xf6\x00\xd5\xff\xb0\x00\xd6\xff\xb0\x00\xd9\xff\xb0\x00\xee\xff\
-\xb0\x00\xef\xff\xb0\x00\x05\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\
-\x78\xff\xf6\x00\x79\xff\xf6\x00\x7a\xff\xf6\x00\x06\x00\x30\xff\
-\x6a\x00\x36\xff\x9c\x00\x37\xff\xba\x00\x52\xff\xfa\x00\x75\xff\
-\xf6\x00\x76\xff\xf6\x00\x16\x00\x30\xff\x88\x00\x36\xff\x9c\x00\
-\x37\xff\xba\x00\x38\xff\xec\x00\x39\xff\x7e\x00\x3a\xff\x7e\x00\
-\x3b\xff\x7e\x00\x50\xff\xf6\x00\x6f\xff\xf6\x00\x75\xff\xe2\x00\
-\x76\xff\xe2\x00\x77\xff\xec\x00\x78\xff\xf6\x00\x7b\xff\xec\x00\
-\x7c\xff\xec\x00\x80\xff\xf6\x00\x81\xff\xf6\x00\xd5\xff\xec\x00\
-\xd6\xff\xec\x00\xd9\xff\xec\x00\xee\xff\xec\x00\xef\xff\xec\x00\
-\x02\x00\x75\xff\xe2\x00\x76\xff\xe2\x00\x04\x00\x30\xff\x91\x00\
-\x36\xff\xbb\x00\x37\xff\xd7\x00\x75\xff\xf1\x00\x02\x00\x75\xff\
-\xc4\x00\x76\xff\xce\x00\x0e\x00\x08\xff\x5a\x00\x1b\xff\x67\x00\
-\x49\xff\x7e\x00\x51\xff\x7e\x00\x59\xff\xec\x00\x5d\xff\xa6\x00\
-\x68\xff\xb0\x00\x6a\xff\x88\x00\x6b\xff\xb0\x00\x75\xff\xb0\x00\
-\x76\xff\xb5\x00\x77\xff\xb0\x00\xd8\xff\xb2\x00\xd9\xff\x6a\x00\
-\x31\x00\x0a\xff\xd8\x00\x0b\xff\xd8\x00\x14\xff\xd8\x00\x22\xff\
-\xd8\x00\x23\xff\xd8\x00\x24\xff\xd8\x00\x25\xff\xd8\x00\x26\xff\
-\xd8\x00\x27\xff\xd8\x00\x28\xff\xd8\x00\x29\xff\xd8\x00\x2c\xff\
-\xd8\x00\x3e\xff\xec\x00\x3f\xff\xec\x00\x40\xff\xec\x00\x41\xff\
-\xec\x00\x42\xff\xec\x00\x43\xff\xec\x00\x44\xff\xec\x00\x45\xff\
-\xec\x00\x47\xff\xec\x00\x48\xff\xec\x00\x49\xff\xec\x00\x4b\xff\
-\xec\x00\x4c\xff\xec\x00\x4d\xff\xec\x00\x4e\xff\xec\x00\x4f\xff\
-\xec\x00\x50\xff\xce\x00\x51\xff\xec\x00\x60\xff\xec\x00\x61\xff\
-\xec\x00\x62\xff\xec\x00\x63\xff\xec\x00\x64\xff\xec\x00\x65\xff\
-\xec\x00\x66\xff\xec\x00\x67\xff\xec\x00\x6a\xff\xec\x00\x6c\xff\
-\xf6\x00\x6d\xff\xf6\x00\x6f\xff\xce\x00\x75\xff\xbf\x00\x76\xff\
-\xc2\x00\x78\xff\xc4\x00\x79\xff\xc4\x00\x7a\xff\xc4\x00\x80\xff\
-\xce\x00\x81\xff\xce\x00\x41\x00\x08\xff\x83\x00\x3e\xff\xba\x00\
-\x3f\xff\xba\x00\x40\xff\xba\x00\x41\xff\xba\x00\x42\xff\xba\x00\
-\x43\xff\xba\x00\x44\xff\xba\x00\x45\xff\xa1\x00\x47\xff\xba\x00\
-\x48\xff\xba\x00\x49\xff\xba\x00\x4b\xff\xba\x00\x4c\xff\xba\x00\
-\x4d\xff\xba\x00\x4e\xff\xba\x00\x4f\xff\xba\x00\x50\xff\xd8\x00\
-\x51\xff\xba\x00\x53\xff\xe2\x00\x54\xff\xe2\x00\x55\xff\xe2\x00\
-\x56\xff\xe2\x00\x57\xff\xe2\x00\x58\xff\xe2\x00\x59\xff\xe2\x00\
-\x5d\xff\xce\x00\x5e\xff\xce\x00\x5f\xff\xce\x00\x60\xff\xba\x00\
-\x61\xff\xba\x00\x62\xff\xba\x00\x63\xff\xba\x00\x64\xff\xba\x00\
-\x65\xff\xba\x00\x66\xff\xba\x00\x67\xff\xba\x00\x68\xff\xc4\x00\
-\x6a\xff\xba\x00\x6b\xff\xce\x00\x6c\xff\xba\x00\x6d\xff\xba\x00\
-\x6f\xff\xce\x00\x70\xff\xce\x00\x71\xff\xce\x00\x72\xff\xce\x00\
-\x73\xff\xce\x00\x74\xff\xce\x00\x75\xff\xce\x00\x76\xff\xce\x00\
-\x77\xff\xc4\x00\x78\xff\xce\x00\x79\xff\xce\x00\x7a\xff\xce\x00\
-\x7b\xff\xba\x00\x7c\xff\xba\x00\x80\xff\xd8\x00\x81\xff\xd8\x00\
-\xd5\xff\x88\x00\xd6\xff\x88\x00\xd7\xff\xce\x00\xd8\xff\xce\x00\
-\xd9\xff\x88\x00\xee\xff\x88\x00\xef\xff\x88\x00\x55\x00\x01\xff\
-\x6a\x00\x02\xff\x6a\x00\x03\xff\x6a\x00\x04\xff\x6a\x00\x05\xff\
-\x6a\x00\x06\xff\x6a\x00\x07\xff\x6a\x00\x08\xff\x51\x00\x0a\xff\
-\xd8\x00\x0b\xff\xd8\x00\x14\xff\xd8\x00\x1b\xff\x79\x00\x22\xff\
-\xd8\x00\x23\xff\xd8\x00\x24\xff\xd8\x00\x25\xff\xd8\x00\x26\xff\
-\xd8\x00\x27\xff\xd8\x00\x28\xff\xd8\x00\x29\xff\xd8\x00\x2c\xff\
-\xd8\x00\x3e\xff\x9c\x00\x3f\xff\x9c\x00\x40\xff\x9c\x00\x41\xff\
-\x9c\x00\x42\xff\x9c\x00\x43\xff\x9c\x00\x44\xff\x9c\x00\x45\xff\
-\x9c\x00\x47\xff\x9c\x00\x48\xff\x9c\x00\x49\xff\x9c\x00\x4b\xff\
-\x9c\x00\x4c\xff\x9c\x00\x4d\xff\x9c\x00\x4e\xff\x9c\x00\x4f\xff\
-\x9c\x00\x50\xff\xce\x00\x51\xff\x9c\x00\x53\xff\xe7\x00\x54\xff\
-\xe7\x00\x55\xff\xe7\x00\x56\xff\xe7\x00\x57\xff\xe7\x00\x58\xff\
-\xe7\x00\x59\xff\xe7\x00\x5d\xff\xd8\x00\x5e\xff\xd8\x00\x5f\xff\
-\xd8\x00\x60\xff\x9c\x00\x61\xff\x9c\x00\x62\xff\x9c\x00\x63\xff\
-\x9c\x00\x64\xff\x9c\x00\x65\xff\x9c\x00\x66\xff\x9c\x00\x67\xff\
-\x9c\x00\x68\xff\xd8\x00\x6a\xff\x9c\x00\x6b\xff\xd8\x00\x6c\xff\
-\xba\x00\x6d\xff\xba\x00\x6f\xff\xce\x00\x70\xff\xd8\x00\x71\xff\
-\xd8\x00\x72\xff\xd8\x00\x73\xff\xd8\x00\x74\xff\xd8\x00\x75\xff\
-\xce\x00\x76\xff\xd8\x00\x77\xff\xce\x00\x78\xff\xce\x00\x79\xff\
-\xce\x00\x7a\xff\xce\x00\x7b\xff\xce\x00\x7c\xff\xce\x00\x80\xff\
-\xce\x00\x81\xff\xce\x00\xd5\xff\x74\x00\xd6\xff\x74\x00\xd7\xff\
-\xce\x00\xd8\xff\xce\x00\xd9\xff\x74\x00\xee\xff\x74\x00\xef\xff\
-\x74\x00\x05\x00\x08\xff\xd6\x00\x1b\xff\xd8\x00\x75\xff\xf6\x00\
-\x76\xff\xf6\x00\xd9\xff\xec\x00\x50\x00\x01\xff\x6a\x00\x02\xff\
-\x6a\x00\x03\xff\x6a\x00\x04\xff\x6a\x00\x05\xff\x6a\x00\x06\xff\
-\x6a\x00\x07\xff\x6a\x00\x08\xff\x2b\x00\x0a\xff\xc4\x00\x0b\xff\
-\xc4\x00\x14\xff\xc4\x00\x1b\xff\x6a\x00\x22\xff\xc4\x00\x23\xff\
-\xc4\x00\x24\xff\xc4\x00\x25\xff\xc4\x00\x26\xff\xc4\x00\x27\xff\
-\xc4\x00\x28\xff\xc4\x00\x29\xff\xc4\x00\x2c\xff\xc4\x00\x2e\xff\
-\xec\x00\x2f\xff\xec\x00\x3e\xff\x88\x00\x3f\xff\x88\x00\x40\xff\
-\x88\x00\x41\xff\xac\x00\x42\xff\x88\x00\x43\xff\x88\x00\x44\xff\
-\x88\x00\x45\xff\x88\x00\x47\xff\x88\x00\x48\xff\x88\x00\x49\xff\
-\x88\x00\x4b\xff\x88\x00\x4c\xff\x88\x00\x4d\xff\xa6\x00\x4e\xff\
-\xba\x00\x4f\xff\x88\x00\x50\xff\xb0\x00\x51\xff\x83\x00\x5d\xff\
-\x88\x00\x5e\xff\x88\x00\x5f\xff\x88\x00\x60\xff\x88\x00\x61\xff\
-\x88\x00\x62\xff\x9c\x00\x63\xff\xce\x00\x64\xff\x88\x00\x65\xff\
-\x88\x00\x66\xff\x9c\x00\x67\xff\x88\x00\x68\xff\x88\x00\x6a\xff\
-\x88\x00\x6b\xff\x88\x00\x6c\xff\x88\x00\x6d\xff\xd6\x00\x6f\xff\
-\x9c\x00\x70\xff\x88\x00\x71\xff\x88\x00\x72\xff\x9c\x00\x73\xff\
-\xce\x00\x74\xff\x88\x00\x75\xff\x74\x00\x76\xff\x7e\x00\x77\xff\
-\x74\x00\x78\xff\x74\x00\x79\xff\x74\x00\x7a\xff\xba\x00\x7b\xff\
-\x74\x00\x7c\xff\xac\x00\x80\xff\xb0\x00\x81\xff\xb0\x00\xd5\xff\
-\x74\x00\xd6\xff\x74\x00\xd7\xff\x74\x00\xd8\xff\x74\x00\xd9\xff\
-\x74\x00\xee\xff\x74\x00\xef\xff\x74\x00\x08\x00\x2f\x00\x00\x00\
-\x30\xff\xdd\x00\x36\xff\xe2\x00\x37\xff\xe2\x00\x75\xff\xe2\x00\
-\x76\xff\xe2\x00\x77\xff\xec\x00\xd9\xff\xec\x00\x08\x00\x2f\x00\
-\x00\x00\x30\xff\xce\x00\x36\xff\xe2\x00\x37\xff\xe2\x00\x75\xff\
-\xe2\x00\x76\xff\xe2\x00\x77\xff\xec\x00\xd9\xff\xec\x00\x40\x00\
-\x0a\xff\xf6\x00\x0b\xff\xf6\x00\x14\xff\xf6\x00\x22\xff\xf6\x00\
-\x23\xff\xf6\x00\x24\xff\xf6\x00\x25\xff\xf6\x00\x26\xff\xf6\x00\
-\x27\xff\xf6\x00\x28\xff\xf6\x00\x29\xff\xf6\x00\x2c\xff\xf6\x00\
-\x2e\xff\xf6\x00\x2f\xff\xf6\x00\x30\xff\xd8\x00\x36\xff\xe2\x00\
-\x37\xff\xe2\x00\x39\xff\xec\x00\x3a\xff\xec\x00\x3b\xff\xec\x00\
-\x3e\xff\xec\x00\x3f\xff\xec\x00\x40\xff\xec\x00\x41\xff\xec\x00\
-\x42\xff\xec\x00\x43\xff\xec\x00\x44\xff\xec\x00\x45\xff\xec\x00\
-\x47\xff\xec\x00\x48\xff\xec\x00\x49\xff\xec\x00\x4b\xff\xec\x00\
-\x4c\xff\xec\x00\x4d\xff\xec\x00\x4e\xff\xec\x00\x4f\xff\xec\x00\
-\x50\xff\xec\x00\x51\xff\xec\x00\x60\xff\xec\x00\x61\xff\xec\x00\
-\x62\xff\xec\x00\x63\xff\xec\x00\x64\xff\xec\x00\x65\xff\xec\x00\
-\x66\xff\xec\x00\x67\xff\xec\x00\x6a\xff\xec\x00\x6c\xff\xf6\x00\
-\x6d\xff\xf6\x00\x6f\xff\xec\x00\x70\xff\xf6\x00\x71\xff\xf6\x00\
-\x72\xff\xf6\x00\x73\xff\xf6\x00\x74\xff\xf6\x00\x75\xff\xf6\x00\
-\x76\xff\xf6\x00\x78\xff\xe2\x00\x79\xff\xe2\x00\x7a\xff\xe2\x00\
-\x7b\xff\xf6\x00\x7c\xff\xf6\x00\x80\xff\xec\x00\x81\xff\xec\x00\
-\x46\x00\x0a\xff\xe2\x00\x0b\xff\xe2\x00\x14\xff\xe2\x00\x22\xff\
-\xe2\x00\x23\xff\xe2\x00\x24\xff\xe2\x00\x25\xff\xe2\x00\x26\xff\
-\xe2\x00\x27\xff\xe2\x00\x28\xff\xe2\x00\x29\xff\xe2\x00\x2c\xff\
-\xe2\x00\x30\xff\x83\x00\x31\xff\xd8\x00\x32\xff\xd8\x00\x33\xff\
-\xd8\x00\x34\xff\xd8\x00\x35\xff\xd8\x00\x36\xff\x98\x00\x37\xff\
-\xa2\x00\x39\xff\xa3\x00\x3a\xff\xa3\x00\x3b\xff\xa3\x00\x3e\xff\
-\xf6\x00\x3f\xff\xf6\x00\x40\xff\xf6\x00\x41\xff\xf6\x00\x42\xff\
-\xf6\x00\x43\xff\xf6\x00\x44\xff\xf6\x00\x45\xff\xf6\x00\x47\xff\
-\xf6\x00\x48\xff\xf6\x00\x49\xff\xf6\x00\x4b\xff\xf6\x00\x4c\xff\
-\xf6\x00\x4d\xff\xf6\x00\x4e\xff\xf6\x00\x4f\xff\xf6\x00\x50\xff\
-\xf6\x00\x51\xff\xf6\x00\x60\xff\xf6\x00\x61\xff\xf6\x00\x62\xff\
-\xf6\x00\x63\xff\xf6\x00\x64\xff\xf6\x00\x65\xff\xf6\x00\x66\xff\
-\xf6\x00\x67\xff\xf6\x00\x6a\xff\xf6\x00\x6c\xff\xf6\x00\x6d\xff\
-\xf6\x00\x6f\xff\xce\x00\x70\xff\xe2\x00\x71\xff\xe2\x00\x72\xff\
-\xe2\x00\x73\xff\xe2\x00\x74\xff\xe2\x00\x75\xff\xd8\x00\x76\xff\
-\xd8\x00\x77\xff\xf1\x00\x78\xff\xd8\x00\x79\xff\xd8\x00\x7a\xff\
-\xd8\x00\x7b\xff\xf6\x00\x7c\xff\xf6\x00\x80\xff\xf6\x00\x81\xff\
-\xf6\x00\xf8\xff\xce\x00\xf9\xff\xce\x00\x05\x00\x08\xff\x59\x00\
-\x30\xff\xd6\x00\x37\xff\xe4\x00\x38\xff\xec\x00\xd9\xff\x7e\x00\
-\x05\x00\x30\xff\xc4\x00\x36\xff\xd8\x00\x38\xff\xd8\x00\x75\xff\
-\xf6\x00\x77\xff\xf6\x00\x02\x00\x75\xff\xf1\x00\x76\xff\xf6\x00\
-\x02\x00\x75\xff\x7e\x00\x76\xff\x9c\x00\x4d\x00\x01\xff\xf1\x00\
-\x02\xff\xf1\x00\x03\xff\xf1\x00\x04\xff\xf1\x00\x05\xff\xf1\x00\
-\x06\xff\xf1\x00\x07\xff\xf1\x00\x08\xff\xf1\x00\x0a\xff\xba\x00\
-\x0b\xff\xba\x00\x14\xff\xba\x00\x22\xff\xba\x00\x23\xff\xba\x00\
-\x24\xff\xba\x00\x25\xff\xba\x00\x26\xff\xba\x00\x27\xff\xba\x00\
-\x28\xff\xba\x00\x29\xff\xba\x00\x2c\xff\xba\x00\x31\xff\xf6\x00\
-\x32\xff\xf6\x00\x33\xff\xf6\x00\x34\xff\xf6\x00\x35\xff\xf6\x00\
-\x3e\xff\xd8\x00\x3f\xff\xd8\x00\x40\xff\xd8\x00\x41\xff\xd8\x00\
-\x42\xff\xd8\x00\x43\xff\xd8\x00\x44\xff\xd8\x00\x45\xff\xd8\x00\
-\x47\xff\xd8\x00\x48\xff\xd8\x00\x49\xff\xd8\x00\x4b\xff\xd8\x00\
-\x4c\xff\xd8\x00\x4d\xff\xd8\x00\x4e\xff\xd8\x00\x4f\xff\xd8\x00\
-\x50\xff\xd3\x00\x51\xff\xd8\x00\x53\xff\xe7\x00\x54\xff\xe7\x00\
-\x55\xff\xe7\x00\x56\x00\x37\x00\x57\x00\x61\x00\x58\x00\x1b\x00\
-\x59\xff\xe7\x00\x60\xff\xd8\x00\x61\xff\xd8\x00\x62\xff\xd8\x00\
-\x63\xff\xd8\x00\x64\xff\xd8\x00\x65\xff\xd8\x00\x66\xff\xd8\x00\
-\x67\xff\xd8\x00\x68\xff\xf6\x00\x6a\xff\xd8\x00\x6b\xff\xec\x00\
-\x6f\xff\xce\x00\x70\xff\xe2\x00\x71\xff\xe2\x00\x72\xff\xe2\x00\
-\x73\xff\xe2\x00\x74\xff\xe2\x00\x75\xff\xb0\x00\x76\xff\xbe\x00\
-\x77\xff\xf6\x00\x78\xff\xb5\x00\x79\xff\xb5\x00\x7a\xff\xb5\x00\
-\x7b\xff\xec\x00\x7c\xff\xec\x00\x80\xff\xd3\x00\x81\xff\xd3\x00\
-\x05\x00\x08\xff\xe2\x00\x49\xff\xf6\x00\xd6\xff\xe2\x00\xee\xff\
-\xe2\x00\xef\xff\xe2\x00\x06\x00\x36\xff\xec\x00\x75\xff\xe7\x00\
-\x76\xff\xe7\x00\x78\xff\xe7\x00\x79\xff\xe7\x00\x7a\xff\xe7\x00\
-\x48\x00\x01\xff\xb0\x00\x02\xff\xb0\x00\x03\xff\xb0\x00\x04\xff\
-\xb0\x00\x05\xff\xb0\x00\x06\xff\xb0\x00\x07\xff\xb0\x00\x08\xff\
-\x4b\x00\x3e\xff\xa1\x00\x3f\xff\xab\x00\x40\xff\xab\x00\x41\xff\
-\xab\x00\x42\xff\xab\x00\x43\xff\xab\x00\x44\xff\xab\x00\x45\xff\
-\xa6\x00\x47\xff\xa6\x00\x48\xff\xa6\x00\x49\xff\xa6\x00\x4b\xff\
-\xa6\x00\x4c\xff\xa6\x00\x4d\xff\xa6\x00\x4e\xff\xa6\x00\x4f\xff\
-\xa6\x00\x50\xff\xc4\x00\x51\xff\xa6\x00\x53\xff\xec\x00\x54\xff\
-\xec\x00\x55\xff\xec\x00\x56\x00\x46\x00\x57\x00\x61\x00\x58\x00\
-\x1e\x00\x59\xff\xec\x00\x5d\xff\xc4\x00\x5e\xff\xc4\x00\x5f\xff\
-\xc4\x00\x60\xff\xa4\x00\x61\xff\x9c\x00\x62\xff\x9c\x00\x63\xff\
-\xba\x00\x64\xff\x9c\x00\x65\xff\x9c\x00\x66\xff\x9c\x00\x67\xff\
-\xa6\x00\x68\xff\xc4\x00\x6a\xff\xa6\x00\x6b\xff\xc4\x00\x6c\xff\
-\xb0\x00\x6d\xff\xd6\x00\x6f\xff\xd8\x00\x70\xff\xc4\x00\x71\xff\
-\xbf\x00\x72\xff\xbf\x00\x73\xff\xbf\x00\x74\xff\xbf\x00\x75\xff\
-\xba\x00\x76\xff\xc4\x00\x77\xff\xc4\x00\x78\xff\xba\x00\x79\xff\
-\xba\x00\x7a\xff\xba\x00\x7b\xff\xba\x00\x7c\xff\xba\x00\x80\xff\
-\xc4\x00\x81\xff\xc4\x00\xd5\xff\x6a\x00\xd6\xff\x6a\x00\xd8\xff\
-\xb2\x00\xd9\xff\x6f\x00\xee\xff\x6a\x00\xef\xff\x6a\x01\x19\xff\
-\xbf\x00\x0f\x00\x30\xff\xc4\x00\x36\xff\xd8\x00\x38\xff\xd8\x00\
-\x49\xff\xf1\x00\x75\xff\xf6\x00\x76\xff\xf6\x00\x77\xff\xf6\x00\
-\x79\xff\xf6\x00\x7a\xff\xf6\x00\x7c\xff\xec\x00\x80\xff\xf6\x00\
-\x81\xff\xf6\x00\xd9\xff\xce\x00\xee\xff\xce\x00\xef\xff\xce\x00\
-\x04\x00\x2c\xff\xf6\x00\x49\xff\xec\x00\x51\xff\xec\x00\x76\xff\
-\xe2\x00\x0f\x00\x30\xff\xe2\x00\x37\xff\xec\x00\x38\xff\xec\x00\
-\x39\xff\xec\x00\x3a\xff\xec\x00\x3b\xff\xec\x00\x3c\xff\xec\x00\
-\x3d\xff\xec\x00\x75\xff\xe2\x00\x76\xff\xec\x00\xd5\xff\xec\x00\
-\xd6\xff\xec\x00\xd9\xff\xec\x00\xee\xff\xec\x00\xef\xff\xec\x00\
-\x02\x00\x75\xff\xc4\x00\x76\xff\xe2\x00\x08\x00\x30\xff\x45\x00\
-\x36\xff\x6a\x00\x37\xff\x83\x00\x49\xff\xd8\x00\x51\xff\xd8\x00\
-\x5b\xff\xec\x00\x75\xff\x88\x00\x76\xff\x9c\x00\x08\x00\x30\xff\
-\x45\x00\x36\x00\x00\x00\x37\xff\x83\x00\x49\xff\xd8\x00\x51\xff\
-\xd8\x00\x5b\xff\xec\x00\x75\xff\x9f\x00\x76\xff\x9c\x00\x00\x00\
-\x02\x00\x32\x00\x27\x01\xed\x02\x97\x00\x03\x00\x07\x00\x00\x77\
-\x11\x21\x11\x25\x21\x11\x21\x32\x01\xbb\xfe\x7a\x01\x51\xfe\xaf\
-\x27\x02\x70\xfd\x90\x35\x02\x06\x00\x00\x02\x00\x07\xff\xea\x02\
-\xbe\x02\xb2\x00\x18\x00\x1c\x00\x00\x65\x16\x16\x06\x07\x06\x26\
-\x27\x03\x03\x06\x06\x27\x26\x26\x36\x37\x01\x36\x36\x33\x32\x16\
-\x16\x17\x03\x37\x33\x17\x02\xb0\x0c\x02\x17\x1a\x28\x2c\x13\xc4\
-\xc3\x14\x2b\x28\x1a\x17\x02\x0d\x01\x07\x0a\x27\x15\x0f\x1a\x15\
-\x07\xee\x3e\xd5\x3e\x61\x19\x23\x1b\x0d\x13\x0f\x28\x01\x9a\xfe\
-\x66\x27\x0f\x13\x0c\x1b\x25\x19\x02\x23\x14\x18\x0b\x14\x0e\xfe\
-\x15\x81\x81\xff\xff\x00\x07\xff\xea\x02\xbe\x03\x86\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x30\x00\x77\x00\xbe\xff\xff\x00\x07\xff\
-\xea\x02\xbe\x03\x8e\x06\x26\x00\x01\x00\x00\x00\x07\x01\x32\x00\
-\x61\x00\xc8\xff\xff\x00\x07\xff\xea\x02\xbe\x03\x89\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x2d\x00\x7e\x00\xc8\xff\xff\x00\x07\xff\
-\xea\x02\xbe\x03\x92\x06\x26\x00\x01\x00\x00\x00\x07\x01\x2f\x00\
-\x91\x00\xc8\xff\xff\x00\x07\xff\xea\x02\xbe\x03\xda\x06\x26\x00\
-\x01\x00\x00\x00\x07\x01\x35\x00\xb9\x00\xd8\xff\xff\x00\x07\xff\
-\xea\x02\xbe\x03\x79\x06\x26\x00\x01\x00\x00\x00\x07\x01\x36\x00\
-\x70\x00\xb4\x00\x02\x00\x00\xff\xeb\x04\x27\x02\xb3\x00\x31\x00\
-\x35\x00\x00\x45\x22\x26\x26\x35\x11\x01\x06\x06\x26\x27\x26\x26\
-\x36\x37\x01\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x21\
-\x15\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x15\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x25\x37\x33\x15\x02\x5f\x13\x23\x15\xfe\x77\
-\x12\x25\x23\x12\x14\x0b\x0e\x11\x01\xe3\x0b\x1c\x12\x01\xa0\x13\
-\x23\x16\x15\x21\x12\xfe\xce\xc4\x14\x22\x15\x15\x22\x15\xc3\x01\
-\x33\x12\x21\x14\x17\x23\x13\xfd\x10\x72\xc9\x09\x15\x24\x15\x01\
-\x89\xfe\x40\x15\x0e\x0f\x14\x18\x22\x1e\x14\x02\x22\x0c\x0b\x08\
-\x1f\x26\x23\x21\x07\x79\x08\x20\x25\x24\x20\x08\x79\x09\x1f\x25\
-\x24\x20\x08\x9d\x82\x82\x00\x00\x02\x00\x27\xff\xf7\x02\x4e\x02\
-\xb3\x00\x1b\x00\x38\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x33\x32\x16\x16\x07\x16\x06\x06\x07\x1e\x02\x15\x0e\x03\x23\
-\x27\x33\x32\x36\x36\x35\x34\x2e\x03\x23\x23\x22\x26\x35\x34\x36\
-\x33\x33\x32\x3e\x02\x35\x34\x26\x23\x23\x72\x24\x20\x07\x07\x20\
-\x25\xf9\x3b\x5c\x36\x01\x01\x0a\x13\x0e\x15\x1c\x0f\x01\x21\x3c\
-\x4e\x2c\xb7\xad\x11\x23\x17\x0a\x12\x16\x18\x0b\x1d\x22\x1c\x1f\
-\x22\x1d\x0a\x16\x11\x0b\x22\x2b\x95\x09\x17\x25\x14\x02\x1e\x14\
-\x23\x17\x38\x5e\x37\x16\x2a\x27\x10\x14\x33\x38\x1d\x2e\x51\x3b\
-\x22\x97\x0d\x23\x20\x15\x1c\x0f\x06\x02\x1d\x24\x23\x1c\x02\x0a\
-\x17\x14\x22\x1d\x00\x00\x01\x00\x1a\xff\xef\x02\x6a\x02\xb9\x00\
-\x3d\x00\x00\x45\x22\x2e\x03\x35\x34\x3e\x03\x33\x32\x16\x16\x17\
-\x16\x16\x17\x14\x06\x07\x06\x06\x23\x22\x26\x27\x2e\x02\x23\x22\
-\x0e\x02\x15\x14\x1e\x02\x33\x32\x36\x36\x37\x36\x36\x33\x32\x16\
-\x17\x16\x16\x07\x14\x06\x07\x0e\x02\x01\x80\x2c\x62\x5e\x4d\x2d\
-\x2d\x4c\x5e\x64\x2d\x33\x4c\x30\x06\x12\x20\x01\x09\x09\x10\x1d\
-\x0f\x0c\x15\x10\x07\x1a\x2c\x22\x23\x47\x3c\x24\x25\x3c\x47\x22\
-\x1e\x2b\x1f\x0b\x0b\x17\x0c\x0e\x1d\x0f\x09\x0a\x01\x20\x12\x08\
-\x2e\x4c\x11\x1c\x38\x57\x75\x4b\x48\x71\x54\x37\x1b\x18\x19\x05\
-\x0b\x1c\x17\x0c\x17\x0d\x17\x15\x0c\x0a\x05\x0f\x0d\x19\x32\x4d\
-\x33\x35\x4c\x32\x19\x0c\x11\x07\x07\x0c\x16\x18\x0d\x19\x0c\x15\
-\x1b\x0b\x04\x1b\x17\xff\xff\x00\x1a\xff\x50\x02\x6a\x02\xb9\x06\
-\x26\x00\x0a\x00\x00\x00\x07\x01\x38\x00\xd9\x00\x0c\x00\x02\x00\
-\x28\xff\xf7\x02\x7f\x02\xb3\x00\x14\x00\x1f\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x17\x33\x32\x1e\x02\x15\x14\x0e\x02\x23\
-\x27\x33\x32\x36\x36\x35\x34\x26\x26\x23\x23\x74\x23\x1f\x0a\x08\
-\x20\x25\xb4\x48\x7c\x5e\x34\x34\x5e\x7d\x4a\x66\x69\x36\x56\x32\
-\x32\x56\x37\x68\x09\x16\x23\x14\x02\x23\x13\x23\x16\x01\x34\x5e\
-\x7e\x4a\x4b\x81\x5f\x36\x99\x33\x58\x39\x39\x5a\x33\xff\xff\x00\
-\x15\xff\xf7\x02\xbe\x02\xb3\x04\x26\x00\x0c\x3f\x00\x00\x06\x00\
-\xe4\x0a\x5a\x00\x01\x00\x33\xff\xf7\x02\x47\x02\xb2\x00\x27\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\x21\x32\x16\x16\x15\x14\
-\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\x14\x06\x06\x23\x23\x15\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x7e\x24\x20\x07\x22\x2c\x01\
-\x7a\x14\x22\x16\x16\x23\x14\xfe\xd1\xce\x14\x1f\x12\x12\x20\x15\
-\xcc\x01\x30\x14\x22\x16\x16\x23\x14\x09\x15\x24\x13\x02\x23\x2c\
-\x20\x07\x20\x26\x24\x20\x07\x81\x06\x1c\x21\x1f\x1c\x06\x86\x08\
-\x1f\x26\x24\x20\x07\xff\xff\x00\x33\xff\xf7\x02\x47\x03\x8f\x06\
-\x26\x00\x0e\x00\x00\x00\x07\x01\x30\x00\x69\x00\xc7\xff\xff\x00\
-\x33\xff\xf7\x02\x47\x03\x8e\x06\x26\x00\x0e\x00\x00\x00\x07\x01\
-\x32\x00\x35\x00\xc8\xff\xff\x00\x33\xff\xf7\x02\x47\x03\x89\x06\
-\x26\x00\x0e\x00\x00\x00\x07\x01\x2d\x00\x52\x00\xc8\xff\xff\x00\
-\x33\xff\xf7\x02\x47\x03\x92\x06\x26\x00\x0e\x00\x00\x00\x07\x01\
-\x2f\x00\x43\x00\xc8\x00\x01\x00\x33\xff\xf7\x02\x46\x02\xb2\x00\
-\x21\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\x15\x14\x06\x06\x23\
-\x23\x15\x14\x06\x06\x7e\x24\x20\x07\x22\x2c\x01\x7a\x14\x22\x15\
-\x16\x23\x14\xfe\xd2\xcd\x14\x1f\x12\x12\x1f\x15\xcc\x08\x1f\x09\
-\x15\x24\x13\x02\x23\x2c\x20\x07\x20\x26\x24\x20\x07\x81\x06\x1c\
-\x21\x20\x1b\x06\xd3\x13\x23\x15\x00\x00\x01\x00\x2a\xff\xef\x02\
-\x97\x02\xbd\x00\x40\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x37\
-\x32\x16\x16\x17\x16\x16\x15\x16\x06\x07\x06\x06\x23\x22\x26\x27\
-\x2e\x02\x23\x22\x06\x06\x07\x1e\x02\x33\x32\x36\x36\x37\x35\x23\
-\x22\x26\x26\x35\x34\x36\x36\x33\x33\x1e\x02\x15\x15\x14\x06\x07\
-\x0e\x02\x01\x86\x4a\x7e\x5f\x35\x36\x60\x82\x4c\x1f\x47\x44\x19\
-\x14\x1f\x01\x0a\x09\x10\x1f\x0f\x08\x16\x13\x09\x26\x31\x1a\x39\
-\x5a\x33\x01\x01\x34\x5b\x38\x14\x29\x27\x10\x6b\x11\x1b\x11\x12\
-\x1d\x10\xbd\x21\x1c\x08\x2c\x26\x18\x3d\x44\x11\x38\x64\x86\x4e\
-\x4a\x7f\x5f\x35\x01\x0c\x18\x11\x0d\x1d\x14\x0a\x19\x0d\x17\x14\
-\x0a\x0c\x06\x0e\x0b\x33\x5a\x3b\x3c\x5f\x38\x04\x09\x07\x7a\x06\
-\x1c\x20\x20\x1b\x06\x01\x16\x21\x13\xda\x18\x33\x13\x0d\x11\x0a\
-\x00\x00\x03\x00\x2b\xff\xf7\x02\x6b\x02\xb2\x00\x11\x00\x23\x00\
-\x27\x00\x00\x45\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x21\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x13\x35\x21\x15\x02\x1f\x25\x1f\x08\
-\x08\x20\x25\x25\x1f\x07\x07\x20\xfe\x33\x25\x20\x07\x08\x1f\x26\
-\x25\x1f\x07\x07\x20\x0f\x01\x38\x09\x16\x24\x13\x02\x22\x14\x22\
-\x16\x16\x22\x15\xfd\xde\x13\x23\x16\x16\x24\x13\x02\x22\x14\x22\
-\x16\x16\x22\x15\xfd\xde\x13\x23\x16\x01\x1e\x84\x84\x00\x01\x00\
-\x28\xff\xf7\x00\xc0\x02\xb2\x00\x11\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x73\x24\x20\
-\x07\x07\x20\x25\x26\x1f\x07\x08\x1f\x09\x15\x24\x13\x02\x23\x14\
-\x22\x16\x16\x22\x15\xfd\xdd\x13\x23\x15\x00\xff\xff\xff\xf2\xff\
-\xf7\x01\x0a\x03\x86\x06\x26\x00\x16\x00\x00\x00\x07\x01\x30\xff\
-\x88\x00\xbe\xff\xff\xff\xbb\xff\xf7\x01\x2b\x03\x8e\x06\x26\x00\
-\x16\x00\x00\x00\x07\x01\x32\xff\x72\x00\xc8\xff\xff\xff\xbc\xff\
-\xf7\x01\x30\x03\x89\x06\x26\x00\x16\x00\x00\x00\x07\x01\x2d\xff\
-\x8f\x00\xc8\xff\xff\xff\xae\xff\xf7\x00\xc5\x03\x92\x06\x26\x00\
-\x16\x00\x00\x00\x07\x01\x2f\xff\x80\x00\xc8\x00\x01\x00\x18\xff\
-\xef\x01\xe4\x02\xb2\x00\x28\x00\x00\x57\x22\x2e\x02\x27\x26\x26\
-\x35\x34\x36\x37\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x3e\x02\
-\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\xec\x25\
-\x40\x2f\x1c\x04\x0d\x13\x0f\x0e\x0f\x1b\x0d\x12\x1b\x0f\x06\x14\
-\x1c\x13\x16\x22\x17\x0c\x08\x21\x25\x24\x1e\x08\x24\x43\x5b\x11\
-\x15\x1c\x19\x04\x0d\x19\x10\x0d\x1d\x0f\x0f\x0f\x16\x0f\x04\x0e\
-\x0b\x0f\x1d\x27\x17\x01\x6c\x15\x27\x18\x16\x24\x13\xfe\x86\x35\
-\x5c\x44\x27\x00\x01\x00\x32\xff\xeb\x02\x33\x02\xbd\x00\x24\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x37\x36\x36\x16\x17\x16\x16\x07\x07\x17\x16\x06\x07\x06\x06\x26\
-\x27\x27\x15\x14\x06\x06\x7d\x24\x20\x07\x07\x20\x25\x26\x1f\x07\
-\xd6\x14\x21\x23\x14\x22\x01\x1d\xe6\xe8\x1f\x03\x22\x18\x23\x1e\
-\x13\xd8\x07\x20\x09\x15\x24\x13\x02\x24\x13\x23\x15\x16\x22\x14\
-\xad\xe0\x14\x10\x0a\x14\x1f\x2f\x1d\xe0\xde\x1f\x31\x1c\x14\x0b\
-\x11\x15\xe1\xb0\x13\x23\x15\x00\x01\x00\x37\xff\xf7\x02\x23\x02\
-\xb2\x00\x17\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x21\x32\x16\x16\x15\x14\x06\x06\x23\x83\x24\x20\
-\x08\x07\x20\x25\x26\x1f\x07\x01\x12\x11\x1e\x13\x14\x1d\x11\x09\
-\x15\x24\x13\x02\x23\x14\x22\x16\x16\x22\x14\xfe\x15\x06\x1c\x20\
-\x1f\x1d\x06\x00\x02\x00\x0b\xff\xf7\x02\x6b\x02\xb2\x00\x0d\x00\
-\x25\x00\x00\x77\x06\x26\x27\x26\x36\x37\x25\x36\x16\x17\x16\x06\
-\x07\x03\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x5b\x1e\x21\x09\x08\x11\x1e\
-\x01\x18\x1f\x1f\x09\x07\x11\x1d\xa6\x25\x20\x07\x07\x20\x25\x25\
-\x1f\x08\x01\x12\x11\x1d\x13\x13\x1d\x11\xf7\x09\x11\x22\x20\x20\
-\x08\x53\x07\x11\x1f\x20\x20\x08\xfe\xac\x15\x24\x13\x02\x23\x14\
-\x22\x16\x16\x22\x14\xfe\x15\x06\x1c\x20\x1f\x1d\x06\x00\x01\x00\
-\x2a\xff\xf7\x03\x05\x02\xb1\x00\x30\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x17\x13\x23\x13\x3e\x02\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x23\x22\x26\x26\x35\x11\x07\x0e\x02\
-\x23\x22\x26\x26\x27\x27\x11\x14\x06\x06\x75\x24\x1f\x08\x08\x20\
-\x25\x19\x1a\x0c\x07\xe1\x0f\xe2\x08\x10\x19\x17\x24\x20\x08\x08\
-\x20\x25\x24\x20\x08\x95\x04\x0e\x19\x15\x16\x19\x0e\x05\x94\x08\
-\x1f\x09\x16\x23\x14\x02\x23\x13\x21\x16\x06\x0b\x07\xfe\xd0\x01\
-\x30\x0a\x0a\x04\x16\x23\x13\xfd\xdd\x13\x22\x16\x16\x24\x13\x01\
-\x65\xd3\x05\x11\x0c\x0c\x10\x06\xd2\xfe\x9a\x13\x22\x16\x00\x00\
-\x01\x00\x28\xff\xf7\x02\x7d\x02\xb1\x00\x23\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x17\x01\x11\x34\x36\x36\x33\
-\x32\x16\x16\x15\x11\x14\x06\x06\x23\x22\x26\x27\x01\x11\x14\x06\
-\x06\x73\x23\x20\x08\x08\x21\x25\x24\x1c\x0b\x01\x24\x09\x20\x24\
-\x25\x1f\x07\x08\x20\x25\x1c\x1f\x0b\xfe\xd6\x08\x20\x09\x16\x23\
-\x14\x02\x25\x13\x20\x15\x11\x0f\xfe\x6f\x01\x69\x13\x20\x15\x16\
-\x23\x13\xfd\xde\x13\x23\x16\x0a\x0e\x01\x94\xfe\xa0\x13\x23\x16\
-\x00\xff\xff\x00\x28\xff\xf7\x02\x7d\x03\x79\x06\x26\x00\x20\x00\
-\x00\x00\x07\x01\x36\x00\x63\x00\xb4\x00\x02\x00\x12\xff\xed\x02\
-\xc3\x02\xb9\x00\x13\x00\x27\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\
-\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\x32\x3e\x02\x35\x34\x2e\
-\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x01\x6f\x48\x7f\x5f\x37\x35\
-\x5d\x7c\x47\x48\x7f\x5e\x37\x35\x5e\x7b\x4b\x28\x46\x35\x1d\x1e\
-\x35\x45\x28\x27\x45\x35\x1f\x1f\x35\x44\x13\x37\x61\x80\x4a\x4b\
-\x83\x64\x38\x37\x62\x82\x4c\x49\x81\x63\x38\x98\x20\x37\x4b\x2c\
-\x2a\x4b\x39\x20\x20\x39\x4b\x2b\x2a\x4b\x38\x20\x00\xff\xff\x00\
-\x12\xff\xed\x02\xc3\x03\x86\x06\x26\x00\x22\x00\x00\x00\x07\x01\
-\x30\x00\x80\x00\xbe\xff\xff\x00\x12\xff\xed\x02\xc3\x03\x8e\x06\
-\x26\x00\x22\x00\x00\x00\x07\x01\x32\x00\x6a\x00\xc8\xff\xff\x00\
-\x12\xff\xed\x02\xc3\x03\x89\x06\x26\x00\x22\x00\x00\x00\x07\x01\
-\x2d\x00\x87\x00\xc8\xff\xff\x00\x12\xff\xed\x02\xc3\x03\x92\x06\
-\x26\x00\x22\x00\x00\x00\x07\x01\x2f\x00\x78\x00\xc8\x00\x03\x00\
-\x1a\xff\xc6\x02\xca\x02\xdf\x00\x13\x00\x27\x00\x35\x00\x00\x45\
-\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x27\
-\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x07\
-\x26\x26\x37\x01\x36\x36\x17\x16\x16\x07\x01\x06\x06\x01\x77\x49\
-\x7e\x60\x36\x34\x5e\x7c\x46\x49\x7e\x5f\x36\x35\x5e\x7a\x4c\x28\
-\x47\x34\x1e\x1e\x35\x46\x27\x27\x47\x35\x1d\x1e\x35\x45\x8f\x26\
-\x0e\x10\x01\x31\x11\x29\x24\x29\x0b\x11\xfe\xd0\x11\x27\x13\x37\
-\x61\x80\x4a\x4b\x83\x64\x38\x37\x62\x82\x4c\x49\x81\x63\x38\x98\
-\x20\x37\x4b\x2c\x2a\x4b\x39\x20\x20\x39\x4b\x2b\x2a\x4b\x38\x20\
-\xae\x12\x25\x23\x02\x7e\x23\x0d\x13\x14\x25\x24\xfd\x86\x23\x0c\
-\x00\xff\xff\x00\x12\xff\xed\x02\xc3\x03\x79\x06\x26\x00\x22\x00\
-\x00\x00\x07\x01\x36\x00\x79\x00\xb4\x00\x02\x00\x18\xff\xf7\x03\
-\xef\x02\xb2\x00\x29\x00\x34\x00\x00\x45\x2e\x03\x35\x34\x3e\x02\
-\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x21\x15\x33\x32\x16\x16\
-\x15\x14\x06\x06\x23\x23\x15\x21\x36\x16\x16\x15\x14\x06\x06\x23\
-\x25\x33\x11\x23\x0e\x02\x15\x14\x16\x16\x01\x5d\x45\x76\x59\x31\
-\x32\x59\x76\x45\x02\x45\x14\x23\x15\x16\x23\x13\xfe\xd0\xc7\x14\
-\x22\x15\x16\x23\x14\xc5\x01\x30\x14\x23\x15\x16\x23\x13\xfd\xba\
-\x7d\x7c\x32\x4e\x2d\x2d\x4e\x09\x03\x36\x5e\x7c\x47\x4a\x80\x61\
-\x36\x07\x20\x26\x24\x20\x07\x79\x07\x20\x26\x24\x20\x07\x7e\x02\
-\x06\x1f\x26\x24\x20\x07\x94\x01\x8f\x01\x35\x59\x38\x37\x59\x35\
-\x00\x00\x02\x00\x2e\xff\xf7\x02\x3d\x02\xb2\x00\x19\x00\x24\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x23\x23\x15\x14\x06\x06\x13\x33\x32\x36\x36\x35\x34\
-\x26\x26\x23\x23\x7a\x25\x1f\x08\x08\x20\x25\xcd\x2a\x55\x49\x2d\
-\x2d\x49\x56\x2a\x80\x08\x20\x28\x81\x16\x2b\x1d\x18\x2b\x1c\x80\
-\x09\x16\x24\x13\x02\x22\x13\x23\x16\x1e\x3f\x5c\x3e\x3d\x5c\x3d\
-\x1f\x83\x13\x23\x16\x01\x67\x13\x2a\x21\x1c\x2a\x18\x00\x02\x00\
-\x31\xff\xf7\x02\x40\x02\xb2\x00\x1e\x00\x29\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\x33\x32\x1e\x02\
-\x15\x14\x0e\x02\x23\x23\x15\x14\x06\x06\x13\x33\x32\x36\x36\x35\
-\x34\x26\x26\x23\x23\x7c\x24\x20\x07\x07\x20\x25\x26\x1f\x07\x82\
-\x27\x56\x4a\x2e\x2e\x4a\x56\x28\x81\x07\x20\x27\x82\x14\x2b\x1e\
-\x19\x2b\x1a\x81\x09\x16\x24\x13\x02\x22\x14\x22\x16\x16\x22\x15\
-\x1a\x1f\x3f\x5c\x3d\x3c\x5b\x3e\x20\x1c\x13\x23\x16\x01\x01\x14\
-\x2a\x1f\x1b\x2b\x18\x00\x02\x00\x12\xff\xed\x03\x09\x02\xb9\x00\
-\x1d\x00\x31\x00\x00\x65\x16\x16\x07\x06\x06\x26\x27\x27\x06\x06\
-\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x07\
-\x05\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\
-\x02\xdd\x23\x09\x1a\x12\x1e\x22\x17\x4a\x2b\x68\x3a\x48\x7f\x5f\
-\x37\x35\x5d\x7c\x47\x48\x7f\x5f\x36\x15\x13\xfe\xcf\x28\x46\x35\
-\x1d\x1e\x35\x45\x27\x28\x46\x35\x1e\x1f\x35\x45\x84\x17\x2e\x24\
-\x1a\x12\x0a\x0f\x30\x23\x28\x37\x61\x81\x48\x4c\x83\x64\x38\x37\
-\x62\x82\x4c\x2b\x52\x25\x2b\x20\x37\x4c\x2b\x2a\x4b\x39\x20\x20\
-\x39\x4b\x2b\x2a\x4b\x38\x20\x00\x03\x00\x31\xff\xf0\x02\x4f\x02\
-\xb2\x00\x19\x00\x23\x00\x2f\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\x23\x15\x14\x06\
-\x06\x25\x06\x26\x27\x27\x37\x17\x16\x16\x06\x01\x33\x32\x3e\x02\
-\x35\x34\x26\x26\x23\x23\x7c\x24\x20\x07\x07\x20\x25\xd0\x29\x56\
-\x48\x2c\x19\x32\x4a\x30\xb2\x08\x20\x01\x81\x25\x2c\x18\xb0\xab\
-\x81\x11\x09\x13\xfe\x8d\x8b\x0e\x1e\x18\x10\x17\x2a\x1c\x82\x09\
-\x16\x24\x13\x02\x23\x13\x22\x16\x1e\x3e\x5c\x3f\x2a\x4e\x42\x2f\
-\x0a\x85\x13\x23\x16\x14\x1b\x0c\x21\xfc\x16\xb9\x18\x22\x1e\x01\
-\x40\x0b\x16\x24\x19\x1d\x2a\x17\x00\x00\x01\x00\x15\xff\xed\x02\
-\x0b\x02\xbd\x00\x45\x00\x00\x45\x22\x2e\x02\x27\x26\x26\x36\x37\
-\x36\x36\x16\x17\x16\x16\x33\x32\x36\x36\x35\x34\x2e\x02\x27\x2e\
-\x04\x35\x34\x36\x36\x33\x32\x1e\x02\x17\x16\x16\x07\x06\x06\x27\
-\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x17\x1e\x03\x15\x14\x0e\
-\x02\x01\x0f\x35\x4f\x37\x20\x06\x11\x08\x11\x15\x15\x25\x24\x11\
-\x18\x2f\x1a\x21\x2e\x18\x21\x37\x43\x21\x17\x2a\x26\x1b\x0f\x3a\
-\x67\x43\x2d\x43\x2e\x1b\x05\x1c\x06\x18\x19\x31\x1f\x0c\x18\x21\
-\x1b\x10\x1c\x14\x0c\x1f\x33\x3f\x21\x1e\x38\x2c\x1b\x2e\x4c\x58\
-\x13\x1a\x25\x24\x09\x16\x21\x22\x14\x12\x03\x16\x14\x1d\x17\x10\
-\x23\x1b\x16\x1b\x14\x13\x0d\x08\x18\x1e\x2a\x36\x23\x3b\x5c\x35\
-\x10\x16\x15\x06\x1a\x25\x21\x23\x08\x15\x0b\x12\x0b\x09\x10\x17\
-\x0e\x17\x1c\x11\x0f\x0a\x0a\x1d\x2c\x42\x30\x3c\x56\x36\x19\xff\
-\xff\x00\x15\xff\xed\x02\x0b\x03\x90\x06\x26\x00\x2e\x00\x00\x00\
-\x07\x01\x33\x00\x10\x00\xc8\x00\x01\x00\x17\xff\xf7\x02\x72\x02\
-\xb3\x00\x1c\x00\x00\x41\x32\x16\x16\x15\x14\x06\x06\x23\x23\x11\
-\x14\x06\x06\x23\x22\x26\x26\x35\x11\x23\x22\x26\x26\x35\x34\x36\
-\x36\x33\x02\x32\x11\x1c\x13\x13\x1e\x11\xa1\x07\x1f\x25\x24\x20\
-\x06\xa3\x10\x1e\x12\x12\x1e\x10\x02\xb3\x06\x1b\x21\x1f\x1c\x06\
-\xfe\x11\x13\x22\x15\x15\x23\x13\x01\xee\x07\x1b\x20\x20\x1b\x06\
-\x00\x00\x01\x00\x2b\xff\xee\x02\x85\x02\xb3\x00\x25\x00\x00\x45\
-\x22\x2e\x02\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x16\
-\x16\x33\x32\x36\x36\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x0e\x02\x01\x56\x49\x6f\x4d\x26\x07\x20\x25\x26\x20\x07\x1d\
-\x42\x36\x2e\x42\x24\x08\x20\x25\x25\x1f\x07\x27\x4d\x71\x12\x39\
-\x5f\x77\x3e\x01\x2b\x14\x23\x16\x16\x23\x15\xfe\xd6\x2c\x52\x36\
-\x2d\x51\x37\x01\x30\x12\x20\x15\x17\x22\x15\xfe\xd4\x3f\x76\x5e\
-\x38\xff\xff\x00\x2b\xff\xee\x02\x85\x03\x86\x06\x26\x00\x31\x00\
-\x00\x00\x07\x01\x30\x00\x6d\x00\xbe\xff\xff\x00\x2b\xff\xee\x02\
-\x85\x03\x8e\x06\x26\x00\x31\x00\x00\x00\x07\x01\x32\x00\x57\x00\
-\xc8\xff\xff\x00\x2b\xff\xee\x02\x85\x03\x89\x06\x26\x00\x31\x00\
-\x00\x00\x07\x01\x2d\x00\x74\x00\xc8\xff\xff\x00\x2b\xff\xee\x02\
-\x85\x03\x92\x06\x26\x00\x31\x00\x00\x00\x07\x01\x2f\x00\x65\x00\
-\xc8\x00\x01\x00\x1f\xff\xf7\x02\xb8\x02\xba\x00\x17\x00\x00\x45\
-\x22\x26\x27\x03\x26\x36\x37\x36\x36\x16\x17\x13\x13\x36\x36\x32\
-\x17\x16\x16\x07\x03\x06\x06\x01\x6d\x1c\x27\x09\xf2\x10\x11\x26\
-\x1a\x25\x1b\x0a\xb1\xb2\x0a\x1b\x26\x1a\x2b\x0b\x10\xf2\x09\x27\
-\x09\x15\x15\x02\x29\x25\x29\x12\x0f\x01\x19\x19\xfe\x45\x01\xb8\
-\x1a\x1a\x0f\x14\x2b\x24\xfd\xda\x13\x17\x00\x00\x01\x00\x0f\xff\
-\xf9\x03\xa5\x02\xb9\x00\x2e\x00\x00\x45\x22\x26\x26\x27\x03\x26\
-\x36\x37\x36\x16\x16\x17\x13\x13\x3e\x02\x33\x32\x16\x16\x17\x13\
-\x13\x3e\x02\x17\x1e\x02\x07\x03\x0e\x02\x23\x22\x26\x26\x27\x03\
-\x03\x0e\x02\x01\x1f\x1a\x1e\x0d\x02\xbc\x0d\x12\x2b\x1c\x23\x17\
-\x09\x7d\x69\x03\x0d\x1e\x1b\x1f\x1f\x0c\x03\x6a\x7c\x09\x17\x25\
-\x1c\x1e\x18\x01\x08\xbc\x02\x0d\x1d\x1c\x1b\x20\x0d\x02\x73\x73\
-\x01\x0e\x1f\x07\x14\x1a\x05\x02\x21\x2a\x29\x0e\x09\x02\x1a\x1c\
-\xfe\x8d\x01\x6e\x0a\x1a\x14\x16\x1a\x07\xfe\x8f\x01\x74\x1c\x1b\
-\x04\x0a\x0b\x18\x23\x1c\xfd\xdf\x06\x19\x14\x18\x1b\x05\x01\x75\
-\xfe\x8b\x05\x1c\x17\x00\x02\x00\x1a\xff\xe9\x02\x9a\x02\xc0\x00\
-\x0f\x00\x1f\x00\x00\x65\x06\x06\x26\x27\x01\x26\x34\x37\x36\x36\
-\x16\x17\x01\x16\x16\x05\x26\x34\x37\x01\x36\x36\x16\x17\x16\x06\
-\x07\x01\x06\x06\x26\x02\x78\x17\x22\x1f\x13\xfe\x29\x1c\x21\x16\
-\x22\x20\x13\x01\xd7\x1c\x01\xfd\xa1\x21\x1c\x01\xd7\x13\x20\x22\
-\x16\x22\x01\x1c\xfe\x29\x12\x20\x22\x09\x14\x0c\x10\x16\x02\x25\
-\x1e\x30\x1d\x15\x0c\x10\x17\xfd\xda\x1f\x2e\x1d\x1d\x2e\x1f\x02\
-\x26\x17\x10\x0c\x15\x1d\x30\x1e\xfd\xdb\x16\x10\x0c\x00\x01\x00\
-\x09\xff\xf5\x02\x74\x02\xbe\x00\x1b\x00\x00\x41\x16\x16\x07\x03\
-\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x03\x26\x36\x37\x36\x36\
-\x16\x17\x17\x37\x36\x36\x16\x02\x49\x24\x07\x15\xd3\x08\x1f\x26\
-\x25\x20\x07\xd4\x16\x0a\x23\x1a\x24\x1e\x0e\x9d\xa1\x10\x1d\x24\
-\x02\xa7\x19\x2d\x20\xfe\xc3\xc3\x13\x23\x16\x16\x24\x14\xc1\x01\
-\x3d\x20\x2e\x18\x11\x06\x14\x17\xfa\xfa\x18\x13\x06\xff\xff\x00\
-\x09\xff\xf5\x02\x74\x03\x86\x06\x26\x00\x39\x00\x00\x00\x07\x01\
-\x30\x00\x54\x00\xbe\xff\xff\x00\x09\xff\xf5\x02\x74\x03\x89\x06\
-\x26\x00\x39\x00\x00\x00\x07\x01\x2d\x00\x5b\x00\xc8\x00\x01\x00\
-\x13\xff\xf5\x02\x3b\x02\xb3\x00\x21\x00\x00\x57\x22\x26\x35\x34\
-\x36\x37\x01\x23\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x15\
-\x14\x06\x07\x01\x21\x32\x16\x16\x15\x14\x06\x06\x23\x5f\x20\x2c\
-\x06\x05\x01\x34\xef\x13\x25\x18\x16\x24\x13\x01\x82\x20\x2b\x06\
-\x06\xfe\xce\x01\x01\x14\x22\x15\x16\x22\x15\x0b\x2b\x22\x0c\x14\
-\x06\x01\xb6\x06\x1f\x23\x26\x1f\x08\x2d\x20\x0d\x15\x08\xfe\x4d\
-\x07\x1f\x22\x25\x20\x07\x00\xff\xff\x00\x13\xff\xf5\x02\x3b\x03\
-\x90\x06\x26\x00\x3c\x00\x00\x00\x07\x01\x33\x00\x28\x00\xc8\x00\
-\x02\x00\x17\xff\xf8\x02\x0c\x01\xeb\x00\x22\x00\x32\x00\x00\x45\
-\x22\x26\x35\x37\x0e\x02\x23\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\
-\x16\x16\x17\x27\x26\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x27\
-\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\
-\xc1\x25\x23\x0a\x06\x22\x36\x28\x2e\x53\x40\x25\x25\x41\x52\x2e\
-\x25\x34\x23\x09\x08\x01\x23\x26\x24\x1f\x07\x07\x1f\xd3\x1a\x2b\
-\x19\x1a\x2c\x1a\x1d\x2d\x1b\x1b\x2f\x08\x1a\x13\x11\x0a\x1d\x17\
-\x28\x47\x5a\x32\x31\x59\x45\x28\x15\x1c\x0d\x0e\x18\x19\x16\x24\
-\x14\xfe\xa7\x13\x24\x15\x95\x1b\x2e\x1c\x1d\x2d\x1b\x1c\x2e\x1d\
-\x1b\x2d\x1b\xff\xff\x00\x17\xff\xf8\x02\x0c\x02\xc7\x06\x26\x00\
-\x3e\x00\x00\x00\x07\x01\x30\x00\x4a\xff\xff\xff\xff\x00\x17\xff\
-\xf8\x02\x0c\x02\xc6\x06\x26\x00\x3e\x00\x00\x00\x06\x01\x32\x15\
-\x00\xff\xff\x00\x17\xff\xf8\x02\x0c\x02\xc1\x06\x26\x00\x3e\x00\
-\x00\x00\x07\x01\x2d\x00\x34\x00\x00\xff\xff\x00\x17\xff\xf8\x02\
-\x0c\x02\xca\x06\x26\x00\x3e\x00\x00\x00\x06\x01\x2f\x46\x00\xff\
-\xff\x00\x17\xff\xf8\x02\x0c\x03\x01\x06\x26\x00\x3e\x00\x00\x00\
-\x07\x01\x35\x00\x6d\x00\x00\xff\xff\x00\x17\xff\xf8\x02\x0c\x02\
-\xc5\x06\x26\x00\x3e\x00\x00\x00\x06\x01\x36\x21\x00\x00\x03\x00\
-\x13\xff\xef\x03\x48\x01\xf0\x00\x4c\x00\x58\x00\x68\x00\x00\x41\
-\x32\x16\x16\x17\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x23\x23\x1e\
-\x03\x33\x32\x3e\x02\x37\x32\x16\x17\x16\x16\x15\x14\x06\x06\x23\
-\x22\x26\x26\x27\x0e\x02\x23\x22\x26\x35\x34\x36\x36\x33\x32\x1e\
-\x03\x17\x2e\x02\x23\x22\x0e\x02\x07\x06\x06\x27\x26\x36\x37\x3e\
-\x02\x05\x33\x32\x36\x35\x34\x26\x26\x23\x22\x06\x06\x05\x32\x3e\
-\x02\x37\x2e\x02\x23\x22\x06\x06\x15\x14\x16\x01\x00\x21\x3d\x36\
-\x16\x17\x3b\x46\x26\x38\x54\x38\x1c\x35\x2a\xe9\x02\x14\x1f\x26\
-\x13\x1e\x28\x1b\x17\x0c\x0f\x19\x09\x06\x06\x39\x5b\x32\x2b\x4b\
-\x3d\x17\x12\x35\x54\x40\x55\x5c\x2f\x58\x3d\x10\x20\x1e\x1b\x18\
-\x0a\x02\x14\x28\x20\x0d\x17\x15\x13\x08\x1e\x39\x18\x1e\x02\x1f\
-\x12\x37\x48\x01\x2a\x9a\x0e\x0f\x14\x23\x18\x18\x2e\x1f\xfe\xe1\
-\x15\x27\x22\x1b\x08\x0b\x24\x2c\x18\x1f\x27\x11\x22\x01\xf0\x11\
-\x21\x1a\x18\x21\x11\x23\x39\x43\x1f\x36\x3b\x11\x1b\x14\x0b\x08\
-\x0b\x09\x01\x10\x13\x0b\x14\x0a\x1b\x25\x14\x14\x26\x1c\x16\x28\
-\x1a\x4d\x48\x29\x3a\x21\x03\x05\x07\x0a\x05\x28\x36\x1d\x04\x07\
-\x0c\x09\x1f\x01\x1c\x23\x2f\x1d\x10\x1d\x13\xd9\x0a\x0d\x12\x1a\
-\x0f\x16\x26\xd1\x09\x10\x16\x0e\x05\x09\x07\x09\x10\x0c\x16\x17\
-\x00\x00\x03\x00\x27\xff\xf7\x02\x19\x02\xce\x00\x13\x00\x23\x00\
-\x34\x00\x00\x45\x22\x2e\x02\x37\x34\x3e\x02\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\
-\x14\x16\x16\x07\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x07\x11\x06\x06\x01\x35\x31\x4b\x31\x19\x01\x1a\x31\x49\x31\x2c\
-\x53\x40\x25\x25\x40\x52\x42\x1c\x2c\x1b\x1a\x2c\x1c\x1b\x2d\x19\
-\x1a\x2c\x94\x24\x20\x07\x08\x1f\x25\x24\x1e\x06\x01\x05\x20\x08\
-\x29\x46\x5a\x33\x31\x5a\x44\x27\x28\x45\x59\x31\x33\x5b\x46\x27\
-\x94\x1b\x2e\x1c\x1d\x2d\x1a\x1a\x2d\x1d\x1c\x2e\x1b\x95\x16\x23\
-\x13\x02\x3f\x15\x22\x15\x16\x23\x13\xfd\xa2\x17\x16\x00\x01\x00\
-\x1e\xff\xf3\x01\xde\x01\xef\x00\x34\x00\x00\x45\x22\x2e\x02\x35\
-\x34\x3e\x02\x33\x32\x16\x16\x17\x16\x16\x07\x06\x06\x07\x06\x27\
-\x2e\x03\x23\x22\x06\x06\x15\x14\x16\x16\x33\x32\x36\x36\x37\x36\
-\x36\x33\x32\x16\x17\x16\x16\x06\x07\x0e\x02\x01\x20\x2c\x5b\x4d\
-\x2e\x2e\x4c\x5b\x2b\x25\x3b\x29\x09\x11\x1a\x01\x01\x0c\x09\x1e\
-\x1e\x0f\x19\x17\x1a\x11\x1d\x2e\x1b\x1b\x2d\x1c\x11\x19\x12\x05\
-\x0c\x16\x0c\x0e\x1e\x12\x10\x05\x16\x17\x08\x29\x3b\x0d\x21\x41\
-\x5f\x3e\x3e\x5e\x40\x21\x11\x18\x09\x0d\x1a\x15\x0b\x17\x0c\x2a\
-\x04\x03\x0e\x0f\x0a\x1a\x2e\x1e\x1d\x2e\x1b\x08\x0b\x03\x08\x0d\
-\x15\x17\x15\x24\x20\x0f\x07\x16\x12\xff\xff\x00\x1e\xff\x45\x01\
-\xde\x01\xef\x04\x26\x00\x47\x00\x00\x00\x07\x01\x38\x00\x85\x00\
-\x00\x00\x03\x00\x1a\xff\xf7\x02\x0c\x02\xce\x00\x13\x00\x23\x00\
-\x34\x00\x00\x57\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x17\
-\x16\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\
-\x14\x16\x16\x17\x22\x26\x27\x11\x34\x36\x36\x33\x32\x16\x16\x15\
-\x11\x14\x06\x06\xff\x2d\x53\x40\x25\x25\x41\x52\x2d\x30\x49\x32\
-\x19\x01\x01\x19\x32\x49\x1e\x1b\x2b\x1b\x1a\x2c\x1c\x1b\x2d\x19\
-\x1a\x2e\xc9\x22\x22\x05\x05\x1e\x25\x25\x1f\x07\x07\x1f\x08\x27\
-\x46\x5b\x33\x31\x59\x45\x28\x27\x44\x5a\x31\x33\x5a\x46\x29\x94\
-\x1b\x2e\x1c\x1d\x2d\x1a\x1a\x2d\x1d\x1c\x2e\x1b\x95\x16\x17\x02\
-\x5e\x13\x23\x16\x15\x22\x14\xfd\xc0\x13\x23\x16\x00\x00\x02\x00\
-\x1f\xff\xf0\x02\x19\x02\xf2\x00\x3a\x00\x4a\x00\x00\x41\x16\x16\
-\x06\x07\x07\x1e\x03\x07\x0e\x03\x23\x22\x2e\x02\x35\x34\x3e\x02\
-\x33\x32\x16\x17\x26\x26\x27\x07\x06\x06\x26\x27\x26\x26\x36\x37\
-\x37\x26\x26\x27\x26\x36\x37\x36\x36\x17\x1e\x02\x17\x37\x36\x36\
-\x16\x03\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\
-\x16\x01\x65\x10\x0b\x04\x08\x14\x32\x48\x2d\x12\x03\x03\x29\x45\
-\x59\x32\x2e\x59\x49\x2b\x2a\x47\x55\x2a\x24\x39\x13\x12\x33\x20\
-\x1b\x09\x12\x13\x0d\x11\x0d\x05\x0a\x12\x14\x15\x03\x04\x04\x06\
-\x0a\x1a\x10\x0b\x15\x14\x09\x16\x0a\x10\x14\x3a\x17\x30\x20\x1a\
-\x30\x1e\x1d\x2f\x1c\x20\x31\x02\xe5\x0a\x13\x14\x0d\x19\x23\x5b\
-\x6d\x7c\x44\x32\x58\x44\x25\x24\x43\x5d\x38\x37\x5b\x42\x24\x11\
-\x0f\x25\x36\x11\x24\x0e\x0a\x05\x07\x0b\x12\x14\x0d\x18\x09\x10\
-\x0d\x09\x15\x0d\x15\x11\x01\x01\x06\x07\x05\x1e\x0f\x0c\x02\xfd\
-\x93\x17\x30\x24\x20\x30\x1b\x1d\x30\x1f\x24\x2f\x17\x00\x02\x00\
-\x17\xff\xee\x02\x02\x01\xf3\x00\x25\x00\x31\x00\x00\x45\x22\x2e\
-\x02\x35\x34\x36\x36\x33\x32\x1e\x02\x15\x14\x06\x23\x23\x1e\x02\
-\x33\x32\x3e\x03\x37\x36\x16\x17\x16\x16\x15\x14\x06\x06\x03\x33\
-\x32\x36\x35\x34\x26\x26\x23\x22\x06\x06\x01\x21\x46\x65\x40\x1f\
-\x44\x78\x4e\x3a\x55\x37\x1b\x35\x29\xee\x02\x21\x32\x1c\x18\x24\
-\x1a\x16\x11\x08\x0f\x19\x0a\x07\x05\x31\x59\xaa\x9e\x10\x0f\x16\
-\x25\x18\x1f\x30\x1b\x12\x2e\x4b\x5c\x2e\x4b\x74\x43\x25\x3b\x44\
-\x1f\x37\x35\x1a\x24\x14\x05\x09\x09\x06\x01\x01\x13\x13\x0b\x14\
-\x0a\x18\x26\x16\x01\x28\x0b\x10\x12\x1b\x0f\x18\x28\xff\xff\x00\
-\x17\xff\xee\x02\x02\x02\xc7\x06\x26\x00\x4b\x00\x00\x00\x07\x01\
-\x30\x00\x40\xff\xff\xff\xff\x00\x17\xff\xee\x02\x02\x02\xc6\x06\
-\x26\x00\x4b\x00\x00\x00\x06\x01\x32\x0a\x00\xff\xff\x00\x17\xff\
-\xee\x02\x02\x02\xc1\x06\x26\x00\x4b\x00\x00\x00\x07\x01\x2d\x00\
-\x29\x00\x00\xff\xff\x00\x17\xff\xee\x02\x02\x02\xca\x06\x26\x00\
-\x4b\x00\x00\x00\x06\x01\x2f\x3c\x00\x00\x02\x00\x0d\xff\xf6\x01\
-\x88\x02\xd0\x00\x1b\x00\x2d\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x0e\x02\x15\x11\
-\x14\x06\x06\x03\x33\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\x23\
-\x26\x26\x35\x34\x36\xae\x23\x20\x07\x16\x30\x4a\x35\x13\x23\x15\
-\x16\x23\x13\x0d\x11\x0a\x05\x08\x20\x8e\x6e\x8a\x13\x22\x16\x15\
-\x22\x14\x83\x79\x1d\x17\x1c\x0a\x16\x23\x14\x01\xd4\x22\x42\x35\
-\x20\x07\x1f\x25\x25\x1f\x07\x03\x06\x0e\x0a\xfe\x27\x13\x22\x15\
-\x01\xed\x04\x07\x20\x25\x22\x20\x09\x03\x01\x21\x27\x24\x23\x00\
-\x03\x00\x17\xff\x29\x01\xfe\x01\xed\x00\x22\x00\x35\x00\x45\x00\
-\x00\x45\x22\x2e\x02\x35\x34\x36\x37\x36\x36\x33\x32\x1e\x02\x33\
-\x32\x3e\x02\x35\x11\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\
-\x27\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x14\x06\x06\
-\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\
-\x01\x0a\x23\x46\x3a\x22\x0c\x0c\x0e\x14\x0e\x0e\x16\x19\x26\x1d\
-\x15\x22\x1a\x0e\x03\x23\x24\x24\x1d\x07\x2a\x46\x56\x40\x2d\x51\
-\x3f\x24\x24\x3f\x51\x2d\x2c\x3e\x27\x12\x20\x48\x29\x1a\x2a\x19\
-\x19\x2b\x1b\x1b\x2a\x19\x1a\x2b\xd7\x12\x1e\x22\x11\x10\x1b\x0d\
-\x0f\x10\x0f\x12\x0f\x0f\x1d\x27\x18\x01\x9e\x1a\x17\x15\x22\x13\
-\xfe\x75\x39\x59\x3d\x20\xdb\x27\x44\x58\x31\x31\x57\x43\x27\x23\
-\x41\x59\x37\x4a\x6d\x3b\x91\x1b\x2c\x1c\x1c\x2c\x1a\x1a\x2d\x1c\
-\x1b\x2c\x1b\x00\x01\x00\x25\xff\xf7\x02\x0a\x02\xce\x00\x2a\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x36\x36\x33\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\
-\x35\x34\x26\x26\x23\x22\x06\x07\x15\x14\x06\x06\x70\x24\x20\x07\
-\x08\x20\x24\x25\x1f\x07\x12\x39\x27\x3e\x63\x3b\x08\x1e\x26\x23\
-\x21\x07\x14\x27\x1c\x25\x37\x04\x08\x1f\x09\x15\x23\x14\x02\x40\
-\x14\x22\x15\x16\x22\x14\xcc\x13\x22\x3f\x6e\x47\xb5\x14\x22\x15\
-\x15\x23\x14\xb5\x1d\x29\x18\x2d\x20\xc7\x14\x22\x15\x00\x02\x00\
-\x2c\xff\xf7\x00\xc6\x02\xce\x00\x11\x00\x21\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x03\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x79\
-\x25\x1f\x07\x07\x20\x25\x24\x1f\x07\x07\x1f\x25\x26\x20\x07\x08\
-\x20\x26\x25\x20\x07\x07\x20\x09\x15\x23\x13\x01\x5d\x14\x22\x15\
-\x16\x22\x15\xfe\xa4\x13\x23\x14\x02\x3c\x16\x24\x14\x15\x23\x15\
-\x16\x24\x14\x14\x24\x15\x00\x00\x01\x00\x25\xff\xf7\x00\xbb\x01\
-\xea\x00\x11\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x70\x24\x20\x07\x08\x1f\x25\x24\x1f\
-\x07\x07\x1f\x09\x15\x23\x13\x01\x5d\x14\x22\x15\x16\x22\x15\xfe\
-\xa4\x13\x23\x14\x00\xff\xff\x00\x0d\xff\xf7\x01\x25\x02\xc7\x06\
-\x26\x00\x54\x00\x00\x00\x06\x01\x30\xa4\xff\xff\xff\xff\xb7\xff\
-\xf7\x01\x27\x02\xc6\x06\x26\x00\x54\x00\x00\x00\x07\x01\x32\xff\
-\x6e\x00\x00\xff\xff\xff\xba\xff\xf7\x01\x2e\x02\xc1\x06\x26\x00\
-\x54\x00\x00\x00\x06\x01\x2d\x8d\x00\xff\xff\xff\xce\xff\xf7\x00\
-\xe4\x02\xca\x06\x26\x00\x54\x00\x00\x00\x06\x01\x2f\xa0\x00\x00\
-\x02\xff\x8c\xff\x2a\x00\xc2\x02\xcd\x00\x1b\x00\x27\x00\x00\x47\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x3e\x02\x35\x11\x34\x36\x36\
-\x33\x32\x16\x16\x15\x11\x14\x0e\x02\x13\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x2b\x12\x22\x15\x15\x23\x13\x0d\x1e\x1a\x11\
-\x07\x20\x23\x24\x1f\x06\x29\x44\x53\x75\x2b\x20\x21\x2c\x2c\x1f\
-\x20\xd6\x07\x1f\x24\x22\x1f\x08\x06\x13\x24\x1d\x01\x91\x11\x20\
-\x14\x16\x22\x13\xfe\x71\x3a\x57\x3b\x1d\x03\x0a\x21\x2d\x2b\x20\
-\x20\x2c\x2c\x21\x00\x00\x01\x00\x2c\xff\xee\x01\xe9\x02\xcf\x00\
-\x24\x00\x00\x65\x16\x16\x07\x06\x06\x26\x27\x27\x15\x14\x06\x06\
-\x23\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x37\
-\x36\x36\x16\x17\x16\x06\x07\x07\x01\xc6\x1f\x04\x1d\x16\x21\x20\
-\x15\x9e\x07\x1f\x25\x24\x20\x07\x08\x20\x24\x24\x1f\x07\x70\x14\
-\x23\x22\x13\x20\x02\x1e\x6c\x7f\x1b\x31\x20\x17\x0e\x0d\x13\x8a\
-\x56\x14\x22\x15\x15\x23\x14\x02\x41\x14\x22\x15\x15\x23\x14\xfe\
-\xd2\x6c\x13\x0e\x0c\x15\x23\x2b\x1e\x62\x00\x00\x01\x00\x2b\xff\
-\xf7\x01\x21\x02\xd0\x00\x1c\x00\x00\x57\x22\x2e\x03\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\x32\x16\x16\x15\
-\x14\x06\x06\xe9\x29\x3f\x2d\x1c\x0d\x07\x20\x24\x24\x1f\x08\x03\
-\x09\x10\x0d\x0c\x19\x12\x12\x19\x09\x09\x18\x2a\x43\x31\x01\xce\
-\x14\x22\x16\x16\x22\x14\xfe\x39\x10\x15\x0c\x04\x06\x1e\x23\x24\
-\x20\x06\x00\x00\x02\x00\x03\xff\xf7\x01\x93\x02\xd0\x00\x0d\x00\
-\x2a\x00\x00\x53\x06\x26\x27\x26\x36\x37\x25\x36\x16\x17\x16\x06\
-\x07\x03\x22\x2e\x03\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x1e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x4a\x1a\x1b\x09\x09\
-\x11\x20\x01\x18\x1b\x1d\x08\x07\x11\x1e\x2c\x2a\x3f\x2c\x1d\x0d\
-\x07\x20\x24\x25\x1f\x07\x04\x09\x10\x0c\x0d\x19\x11\x11\x1a\x01\
-\x06\x07\x12\x1e\x1f\x20\x09\x4d\x08\x12\x1e\x1f\x21\x08\xfe\xa3\
-\x09\x18\x2a\x43\x31\x01\xce\x14\x22\x16\x16\x22\x14\xfe\x39\x10\
-\x15\x0c\x04\x06\x1e\x23\x24\x20\x06\x00\x01\x00\x28\xff\xf6\x02\
-\xfd\x01\xec\x00\x46\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x32\x16\x15\x07\x3e\x03\x33\x32\x16\x16\x17\x3e\x02\x33\x32\
-\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\x26\
-\x23\x22\x06\x06\x15\x15\x14\x06\x06\x27\x2e\x02\x35\x35\x34\x26\
-\x26\x23\x22\x06\x06\x15\x15\x14\x06\x06\x72\x24\x20\x06\x07\x20\
-\x25\x25\x22\x0d\x02\x14\x20\x2b\x19\x21\x35\x2b\x10\x0e\x28\x37\
-\x22\x3a\x51\x2a\x07\x20\x25\x25\x1f\x07\x0e\x1d\x16\x17\x20\x10\
-\x0a\x21\x24\x24\x1e\x06\x0e\x1c\x17\x19\x20\x0f\x07\x20\x09\x16\
-\x22\x14\x01\x5e\x14\x21\x15\x1d\x21\x0b\x05\x18\x1a\x13\x13\x25\
-\x1c\x14\x26\x1a\x3b\x6e\x4e\xb3\x13\x23\x15\x16\x23\x13\xb3\x1f\
-\x2a\x17\x15\x2b\x21\xb3\x14\x23\x15\x01\x01\x16\x23\x12\xb3\x1f\
-\x2b\x16\x1a\x2b\x1b\xb4\x14\x22\x15\x00\x01\x00\x29\xff\xf8\x02\
-\x0e\x01\xeb\x00\x2f\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x32\x16\x16\x14\x17\x07\x3e\x03\x33\x32\x1e\x02\x15\x15\x14\
-\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\x26\x23\x22\x06\x06\x15\
-\x15\x14\x06\x06\x74\x25\x1f\x07\x08\x1f\x25\x20\x1e\x09\x02\x06\
-\x02\x1b\x29\x2f\x17\x30\x4b\x34\x1b\x07\x1f\x25\x26\x1f\x08\x14\
-\x28\x1d\x1d\x2a\x17\x07\x1f\x08\x15\x23\x13\x01\x60\x13\x21\x14\
-\x11\x18\x15\x04\x13\x0f\x1f\x19\x0e\x23\x42\x59\x35\xb6\x13\x23\
-\x14\x15\x23\x13\xb5\x1e\x2a\x17\x18\x2a\x1d\xb6\x13\x23\x14\xff\
-\xff\x00\x29\xff\xf8\x02\x0e\x02\xc5\x06\x26\x00\x5e\x00\x00\x00\
-\x06\x01\x36\x26\x00\x00\x02\x00\x15\xff\xef\x02\x1a\x01\xf5\x00\
-\x12\x00\x22\x00\x00\x45\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x15\x14\x16\x16\x01\x19\x2f\x5d\x4c\x2c\x28\x48\x5d\x35\x48\
-\x75\x46\x2d\x4b\x5b\x30\x18\x32\x22\x1c\x31\x20\x1e\x2f\x1d\x21\
-\x32\x11\x25\x44\x5f\x3a\x36\x5d\x48\x29\x45\x76\x48\x3d\x5f\x44\
-\x23\x97\x18\x30\x25\x20\x30\x1b\x1c\x31\x1f\x24\x31\x17\x00\xff\
-\xff\x00\x15\xff\xef\x02\x1a\x02\xc7\x06\x26\x00\x60\x00\x00\x00\
-\x07\x01\x30\x00\x4a\xff\xff\xff\xff\x00\x15\xff\xef\x02\x1a\x02\
-\xc6\x06\x26\x00\x60\x00\x00\x00\x06\x01\x32\x15\x00\xff\xff\x00\
-\x15\xff\xef\x02\x1a\x02\xc1\x06\x26\x00\x60\x00\x00\x00\x07\x01\
-\x2d\x00\x34\x00\x00\xff\xff\x00\x15\xff\xef\x02\x1a\x02\xca\x06\
-\x26\x00\x60\x00\x00\x00\x06\x01\x2f\x46\x00\x00\x04\x00\x15\xff\
-\x71\x02\x1a\x02\x73\x00\x09\x00\x12\x00\x25\x00\x35\x00\x00\x41\
-\x27\x37\x36\x36\x17\x16\x16\x06\x07\x01\x26\x26\x37\x37\x17\x07\
-\x06\x06\x37\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\
-\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\
-\x16\x16\x01\xbe\x82\x32\x11\x28\x25\x1b\x15\x03\x0a\xfe\x75\x21\
-\x14\x12\x33\x80\x31\x11\x27\x8e\x2f\x5d\x4c\x2c\x28\x48\x5d\x35\
-\x48\x75\x46\x2d\x4b\x5b\x30\x18\x32\x22\x1c\x31\x20\x1e\x2f\x1d\
-\x21\x32\x01\xa1\x3e\x67\x22\x0b\x11\x0d\x18\x20\x18\xfd\x7d\x10\
-\x28\x22\x67\x40\x64\x23\x0b\x7e\x25\x44\x5f\x3a\x36\x5d\x48\x29\
-\x45\x76\x48\x3d\x5f\x44\x23\x97\x18\x30\x25\x20\x30\x1b\x1c\x31\
-\x1f\x24\x31\x17\x00\xff\xff\x00\x15\xff\xef\x02\x1a\x02\xc5\x06\
-\x26\x00\x60\x00\x00\x00\x06\x01\x36\x21\x00\x00\x04\x00\x15\xff\
-\xed\x03\x6f\x01\xf5\x00\x12\x00\x22\x00\x48\x00\x54\x00\x00\x45\
-\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x0e\x02\x27\
-\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x05\
-\x22\x2e\x02\x35\x34\x36\x36\x33\x32\x1e\x02\x15\x14\x06\x23\x23\
-\x1e\x02\x33\x32\x3e\x03\x33\x32\x16\x17\x16\x16\x15\x14\x06\x06\
-\x03\x33\x32\x36\x35\x34\x26\x26\x23\x22\x06\x06\x01\x19\x2f\x5d\
-\x4c\x2c\x28\x48\x5d\x35\x48\x75\x46\x2d\x4b\x5b\x30\x18\x32\x22\
-\x1c\x31\x20\x1e\x2f\x1d\x21\x32\x01\x8e\x46\x64\x41\x1f\x44\x78\
-\x4e\x3a\x55\x37\x1c\x36\x29\xec\x03\x21\x31\x1a\x18\x24\x1b\x16\
-\x11\x08\x10\x18\x0a\x06\x05\x30\x5a\xa9\x9a\x0f\x0f\x14\x23\x18\
-\x19\x2e\x20\x11\x25\x44\x5f\x3a\x36\x5d\x48\x29\x45\x76\x48\x3d\
-\x5f\x44\x23\x97\x18\x30\x25\x20\x30\x1b\x1c\x31\x1f\x24\x31\x17\
-\x99\x2e\x4c\x5c\x2e\x4b\x74\x43\x25\x3b\x44\x1f\x37\x3c\x16\x22\
-\x12\x06\x08\x09\x06\x13\x13\x0b\x13\x0a\x19\x27\x15\x01\x2a\x0a\
-\x0d\x12\x1a\x0f\x16\x26\x00\x00\x03\x00\x24\xff\x28\x02\x13\x01\
-\xeb\x00\x13\x00\x24\x00\x34\x00\x00\x61\x22\x2e\x02\x37\x34\x3e\
-\x02\x33\x32\x1e\x02\x15\x14\x0e\x02\x07\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x17\x11\x16\x06\x06\x13\x32\x36\x36\x35\x34\
-\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\x2f\x31\x4b\x31\x19\
-\x01\x1a\x31\x49\x31\x2c\x53\x40\x25\x25\x40\x52\xee\x24\x1f\x07\
-\x06\x1f\x24\x1f\x25\x08\x01\x08\x1f\x87\x1c\x2c\x1b\x1a\x2c\x1c\
-\x1b\x2d\x19\x1a\x2c\x27\x43\x58\x33\x31\x59\x45\x27\x28\x45\x5a\
-\x32\x32\x59\x42\x25\xd8\x15\x21\x13\x02\x2f\x14\x21\x16\x12\x13\
-\xfd\xac\x13\x22\x15\x01\x65\x1b\x2e\x1c\x1d\x2d\x1a\x1b\x2d\x1c\
-\x1c\x2e\x1b\x00\x03\x00\x25\xff\x29\x02\x11\x02\xd8\x00\x13\x00\
-\x25\x00\x35\x00\x00\x61\x22\x2e\x02\x35\x3e\x03\x33\x32\x1e\x02\
-\x15\x14\x0e\x02\x07\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\
-\x16\x15\x11\x14\x06\x06\x13\x32\x36\x36\x35\x34\x26\x26\x23\x22\
-\x06\x06\x15\x14\x16\x16\x01\x2c\x31\x4a\x32\x18\x01\x1a\x31\x49\
-\x30\x2d\x52\x41\x25\x25\x40\x52\xee\x22\x1e\x07\x07\x1e\x22\x23\
-\x1d\x08\x08\x1d\x89\x1c\x2c\x1b\x1a\x2d\x1b\x1c\x2c\x1a\x1b\x2c\
-\x27\x43\x58\x33\x31\x59\x45\x27\x28\x45\x5a\x32\x32\x59\x42\x25\
-\xd7\x16\x22\x13\x03\x19\x14\x22\x15\x16\x22\x13\xfc\xe6\x13\x22\
-\x15\x01\x64\x1b\x2e\x1c\x1d\x2d\x1a\x1b\x2d\x1c\x1c\x2e\x1b\x00\
-\x03\x00\x13\xff\x28\x02\x02\x01\xeb\x00\x13\x00\x23\x00\x35\x00\
-\x00\x73\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\x16\x0e\
-\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\
-\x16\x13\x22\x26\x26\x37\x11\x3e\x02\x33\x32\x16\x16\x15\x11\x14\
-\x06\x06\xf7\x2d\x52\x40\x25\x25\x40\x53\x2c\x31\x49\x31\x1a\x01\
-\x19\x31\x4a\x1d\x1a\x2c\x1a\x19\x2c\x1c\x1b\x2d\x1a\x1b\x2d\xc7\
-\x24\x20\x08\x01\x05\x14\x1f\x14\x24\x1f\x06\x07\x1f\x25\x42\x59\
-\x32\x32\x5a\x45\x28\x27\x45\x59\x31\x33\x58\x43\x27\x8d\x1b\x2e\
-\x1c\x1c\x2d\x1b\x1a\x2e\x1c\x1c\x2e\x1b\xfe\x9b\x15\x22\x13\x02\
-\x54\x0d\x10\x08\x16\x21\x14\xfd\xd1\x13\x21\x15\x00\x00\x01\x00\
-\x29\xff\xf7\x01\x95\x01\xf0\x00\x2a\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x07\x3e\x03\x33\x32\x1e\x03\
-\x15\x14\x06\x23\x22\x2e\x02\x23\x22\x0e\x02\x15\x15\x14\x06\x06\
-\x74\x25\x1f\x07\x08\x1f\x25\x23\x1f\x08\x0c\x02\x11\x1e\x2b\x1c\
-\x0b\x1b\x1d\x18\x0f\x26\x1d\x11\x0e\x09\x0c\x10\x0f\x1b\x17\x0d\
-\x07\x20\x09\x15\x24\x13\x01\x5d\x14\x22\x15\x13\x19\x09\x06\x04\
-\x15\x17\x10\x03\x09\x0f\x16\x10\x29\x39\x06\x06\x05\x08\x11\x19\
-\x0f\xdc\x13\x23\x14\x00\x01\x00\x1a\xff\xef\x01\xb1\x01\xf2\x00\
-\x42\x00\x00\x57\x22\x2e\x02\x27\x26\x36\x36\x37\x36\x36\x17\x1e\
-\x03\x33\x32\x36\x35\x34\x2e\x03\x27\x2e\x03\x35\x34\x36\x36\x33\
-\x32\x1e\x02\x17\x16\x16\x07\x06\x06\x27\x2e\x02\x23\x22\x06\x06\
-\x15\x14\x1e\x02\x17\x1e\x03\x15\x14\x06\xdd\x1b\x3f\x3c\x28\x03\
-\x02\x05\x0e\x0a\x08\x14\x0d\x10\x21\x21\x24\x13\x1c\x1f\x0d\x17\
-\x1e\x23\x12\x19\x2e\x26\x16\x2e\x58\x3f\x12\x24\x23\x22\x11\x1e\
-\x02\x12\x0b\x18\x0d\x10\x25\x29\x14\x11\x18\x0c\x0f\x1a\x22\x14\
-\x1b\x39\x2f\x1d\x6e\x11\x0c\x17\x1f\x14\x0a\x17\x19\x0e\x0b\x06\
-\x04\x03\x0f\x11\x0d\x11\x0f\x0b\x0e\x0b\x08\x09\x05\x07\x16\x23\
-\x33\x25\x31\x42\x23\x04\x0a\x0e\x0a\x0e\x30\x19\x11\x0f\x03\x04\
-\x12\x10\x09\x0f\x0a\x0d\x0f\x0a\x08\x04\x05\x11\x20\x36\x2c\x4f\
-\x54\xff\xff\x00\x1a\xff\xef\x01\xb1\x02\xc7\x06\x26\x00\x6c\x00\
-\x00\x00\x06\x01\x33\xe6\xff\x00\x01\x00\x28\xff\xde\x02\x33\x02\
-\xbd\x00\x47\x00\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\
-\x16\x16\x15\x14\x0e\x02\x15\x14\x1e\x03\x15\x14\x0e\x02\x23\x22\
-\x26\x27\x26\x26\x37\x3e\x02\x17\x1e\x02\x33\x32\x36\x36\x35\x34\
-\x2e\x03\x35\x34\x3e\x02\x35\x34\x26\x26\x23\x22\x0e\x02\x15\x11\
-\x14\x06\x06\x72\x24\x1f\x07\x33\x6b\x52\x41\x58\x2c\x18\x1f\x18\
-\x22\x31\x31\x21\x17\x2d\x43\x2a\x16\x2f\x18\x1a\x23\x01\x01\x0d\
-\x17\x11\x0f\x1c\x1d\x0f\x0d\x16\x0c\x20\x30\x30\x20\x15\x1c\x16\
-\x0b\x16\x12\x19\x24\x16\x0a\x07\x1f\x22\x15\x22\x13\x01\xb6\x4f\
-\x62\x2e\x22\x3d\x29\x2b\x39\x25\x1b\x0d\x13\x1a\x1c\x28\x3f\x32\
-\x2a\x3f\x2c\x16\x08\x06\x06\x18\x20\x14\x27\x1a\x01\x02\x0c\x0d\
-\x0c\x19\x14\x10\x1b\x1c\x25\x32\x23\x27\x2f\x1f\x1d\x15\x09\x0e\
-\x07\x0c\x15\x20\x13\xfe\x3f\x13\x21\x14\x00\x00\x02\x00\x10\xff\
-\xf7\x01\x8b\x02\x92\x00\x1b\x00\x2d\x00\x00\x45\x22\x2e\x02\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x03\x33\x37\x32\x16\x16\x15\x14\x06\x06\x23\
-\x27\x23\x26\x26\x35\x34\x36\x01\x2a\x33\x49\x30\x17\x07\x20\x24\
-\x24\x20\x07\x05\x0a\x12\x0d\x16\x22\x13\x16\x23\xf5\x6e\x8a\x13\
-\x22\x16\x15\x22\x14\x83\x79\x1d\x17\x1c\x09\x16\x2e\x47\x31\x01\
-\x96\x14\x20\x15\x16\x22\x14\xfe\x73\x10\x15\x0a\x04\x08\x1c\x21\
-\x24\x20\x06\x01\xec\x04\x07\x20\x25\x22\x20\x09\x03\x01\x21\x27\
-\x24\x23\x00\x00\x01\x00\x24\xff\xf8\x02\x09\x01\xec\x00\x2f\x00\
-\x00\x45\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x14\x16\x16\x33\x32\x36\x36\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x23\x22\x2e\x02\x35\x37\x0e\x03\x01\x00\x2e\
-\x51\x3c\x21\x08\x1f\x25\x25\x1f\x07\x15\x29\x1c\x1d\x29\x17\x08\
-\x1f\x25\x25\x1f\x07\x07\x20\x24\x1b\x1e\x0e\x03\x0d\x03\x14\x21\
-\x2c\x08\x24\x41\x59\x35\xb5\x14\x22\x16\x16\x23\x14\xb4\x1d\x2b\
-\x16\x17\x2a\x1d\xb6\x14\x22\x15\x16\x23\x13\xfe\xa0\x13\x21\x14\
-\x0c\x12\x14\x08\x0b\x04\x16\x19\x12\xff\xff\x00\x24\xff\xf8\x02\
-\x09\x02\xc7\x06\x26\x00\x70\x00\x00\x00\x07\x01\x30\x00\x4b\xff\
-\xff\xff\xff\x00\x24\xff\xf8\x02\x09\x02\xc6\x06\x26\x00\x70\x00\
-\x00\x00\x06\x01\x32\x15\x00\xff\xff\x00\x24\xff\xf8\x02\x09\x02\
-\xc1\x06\x26\x00\x70\x00\x00\x00\x07\x01\x2d\x00\x34\x00\x00\xff\
-\xff\x00\x24\xff\xf8\x02\x09\x02\xca\x06\x26\x00\x70\x00\x00\x00\
-\x06\x01\x2f\x47\x00\x00\x01\x00\x0f\xff\xf3\x02\x22\x01\xf8\x00\
-\x15\x00\x00\x45\x22\x26\x27\x03\x26\x36\x37\x36\x16\x17\x13\x13\
-\x36\x36\x17\x16\x16\x07\x03\x06\x06\x01\x19\x18\x22\x0a\xb4\x12\
-\x0f\x26\x26\x2d\x12\x70\x70\x13\x2c\x28\x29\x09\x11\xb3\x09\x22\
-\x0d\x12\x13\x01\x67\x24\x2f\x13\x12\x0b\x29\xfe\xfb\x01\x01\x2b\
-\x0e\x14\x13\x33\x21\xfe\x9b\x13\x12\x00\x01\x00\x0d\xff\xf6\x02\
-\xe6\x01\xf9\x00\x2c\x00\x00\x57\x22\x26\x26\x27\x03\x26\x36\x36\
-\x37\x36\x16\x17\x17\x37\x3e\x02\x33\x32\x16\x16\x17\x17\x37\x36\
-\x36\x17\x16\x16\x07\x03\x0e\x02\x23\x22\x26\x26\x27\x27\x07\x0e\
-\x02\xea\x1b\x1d\x0d\x04\x8d\x07\x01\x17\x19\x26\x30\x0c\x4a\x42\
-\x04\x0e\x1d\x19\x1b\x1e\x0f\x03\x42\x46\x0e\x2e\x26\x23\x1a\x10\
-\x8d\x04\x0e\x1c\x19\x1a\x1c\x0f\x05\x43\x42\x07\x0c\x1b\x0a\x14\
-\x1c\x0a\x01\x5d\x18\x21\x17\x09\x10\x0e\x22\xc9\xb9\x0a\x19\x14\
-\x14\x1a\x09\xb9\xbd\x25\x1a\x10\x0f\x2c\x22\xfe\xa4\x0b\x1c\x13\
-\x11\x1c\x0e\xb8\xb8\x12\x1b\x0e\x00\x00\x02\x00\x10\xff\xee\x01\
-\xfc\x01\xf6\x00\x10\x00\x22\x00\x00\x41\x16\x16\x06\x07\x01\x06\
-\x06\x26\x27\x26\x26\x36\x37\x01\x36\x36\x05\x36\x36\x16\x17\x01\
-\x16\x16\x06\x07\x06\x06\x26\x27\x01\x26\x26\x36\x01\xd9\x16\x0d\
-\x0e\x15\xfe\xc2\x13\x20\x21\x15\x15\x0d\x0f\x13\x01\x3e\x1f\x2b\
-\xfe\x78\x15\x21\x20\x13\x01\x3e\x14\x0f\x0c\x17\x15\x20\x1f\x15\
-\xfe\xc2\x14\x0e\x0d\x01\xd6\x15\x21\x21\x16\xfe\xa8\x14\x0f\x0c\
-\x14\x15\x21\x21\x14\x01\x59\x1f\x03\x1e\x14\x0c\x0f\x15\xfe\xa7\
-\x15\x20\x21\x15\x14\x0c\x0f\x14\x01\x58\x15\x21\x22\x00\x02\x00\
-\x0d\xff\x1b\x02\x25\x01\xf8\x00\x0d\x00\x16\x00\x00\x57\x26\x26\
-\x37\x13\x36\x36\x17\x16\x16\x07\x03\x06\x06\x37\x03\x26\x36\x37\
-\x36\x16\x17\x13\xb7\x29\x0d\x11\xfb\x11\x29\x29\x28\x0d\x10\xfc\
-\x11\x28\x2e\xeb\x16\x09\x23\x27\x2b\x16\xad\xd3\x12\x2c\x25\x02\
-\x31\x27\x0f\x10\x13\x2a\x23\xfd\xcb\x27\x10\xfb\x01\x66\x21\x2c\
-\x17\x18\x0b\x22\xfe\xf7\x00\xff\xff\x00\x0d\xff\x1b\x02\x25\x02\
-\xc7\x06\x26\x00\x78\x00\x00\x00\x07\x01\x30\x00\x4e\xff\xff\xff\
-\xff\x00\x0d\xff\x1b\x02\x25\x02\xc1\x06\x26\x00\x78\x00\x00\x00\
-\x07\x01\x2d\x00\x37\x00\x00\x00\x01\x00\x16\xff\xf7\x02\x07\x01\
-\xeb\x00\x21\x00\x00\x57\x22\x26\x35\x34\x36\x37\x37\x23\x22\x26\
-\x26\x35\x34\x36\x36\x33\x21\x32\x16\x15\x14\x06\x07\x07\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x60\x1f\x2b\x0b\x0c\xe2\x98\x13\x23\
-\x16\x16\x23\x13\x01\x39\x20\x2a\x0b\x0a\xde\xb5\x14\x22\x15\x16\
-\x22\x14\x09\x2b\x20\x0f\x1c\x0b\xdd\x07\x20\x24\x25\x1f\x07\x2a\
-\x20\x10\x1c\x09\xde\x08\x20\x25\x24\x20\x06\xff\xff\x00\x16\xff\
-\xf7\x02\x07\x02\xc7\x06\x26\x00\x7b\x00\x00\x00\x06\x01\x33\x0e\
-\xff\x00\x01\x00\x0d\xff\xf7\x02\xbd\x02\xd1\x00\x5a\x00\x00\x57\
-\x22\x26\x26\x35\x11\x07\x22\x26\x35\x34\x36\x33\x17\x35\x34\x3e\
-\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x06\x06\x15\x15\x36\
-\x36\x33\x32\x16\x17\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x22\x06\x06\x15\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\
-\x26\x26\x27\x11\x14\x06\x06\x23\x22\x26\x26\x35\x11\x22\x06\x06\
-\x23\x22\x26\x27\x11\x14\x06\x06\xad\x23\x20\x07\x22\x1c\x18\x1a\
-\x1d\x1f\x16\x30\x4a\x35\x13\x23\x16\x17\x23\x13\x10\x15\x08\x11\
-\x2d\x16\x12\x2a\x10\x16\x2f\x4a\x35\x13\x23\x16\x16\x23\x14\x10\
-\x14\x08\x41\x14\x22\x15\x15\x22\x14\x08\x29\x10\x09\x1f\x25\x23\
-\x20\x07\x08\x1b\x1b\x0b\x10\x35\x12\x08\x20\x09\x15\x24\x13\x01\
-\x10\x02\x24\x28\x27\x23\x02\x33\x22\x42\x35\x20\x08\x1e\x26\x24\
-\x20\x06\x05\x0e\x0e\x37\x02\x02\x02\x01\x34\x22\x42\x35\x20\x08\
-\x1e\x26\x24\x20\x06\x05\x0e\x0e\x36\x04\x08\x1f\x25\x22\x20\x09\
-\x01\x01\x01\xfe\xed\x13\x22\x15\x15\x24\x13\x01\x10\x01\x01\x02\
-\x01\xfe\xed\x13\x22\x15\x00\x00\x03\x00\x0d\xff\xf7\x03\x83\x02\
-\xd1\x00\x5a\x00\x6c\x00\x7c\x00\x00\x57\x22\x26\x26\x35\x11\x07\
-\x22\x26\x35\x34\x36\x33\x17\x35\x34\x3e\x02\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\x22\x06\x06\x15\x15\x36\x36\x33\x32\x16\x17\x35\
-\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x06\x06\x15\
-\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\x26\x26\x27\x11\x14\x06\
-\x06\x23\x22\x26\x26\x35\x11\x22\x06\x06\x23\x22\x26\x27\x11\x14\
-\x06\x06\x21\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\
-\x11\x14\x06\x06\x03\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x14\x06\x06\xad\x23\x20\x07\x22\x1c\x18\x1a\x1d\x1f\x16\x30\
-\x4a\x35\x13\x23\x16\x17\x23\x13\x10\x15\x08\x11\x2d\x16\x12\x2a\
-\x10\x16\x2f\x4a\x35\x13\x23\x16\x16\x23\x14\x10\x14\x08\x41\x14\
-\x22\x15\x15\x22\x14\x08\x29\x10\x09\x1f\x25\x23\x20\x07\x08\x1b\
-\x1b\x0b\x10\x35\x12\x08\x20\x02\x64\x24\x20\x07\x08\x1f\x25\x24\
-\x1f\x07\x08\x1f\x24\x25\x21\x07\x08\x21\x25\x25\x20\x07\x08\x20\
-\x09\x15\x24\x13\x01\x10\x02\x24\x28\x27\x23\x02\x33\x22\x42\x35\
-\x20\x08\x1e\x26\x24\x20\x06\x05\x0e\x0e\x37\x02\x02\x02\x01\x34\
-\x22\x42\x35\x20\x08\x1e\x26\x24\x20\x06\x05\x0e\x0e\x36\x04\x08\
-\x1f\x25\x22\x20\x09\x01\x01\x01\xfe\xed\x13\x22\x15\x15\x24\x13\
-\x01\x10\x01\x01\x02\x01\xfe\xed\x13\x22\x15\x15\x22\x14\x01\x5b\
-\x13\x23\x16\x17\x23\x13\xfe\xa5\x14\x22\x14\x02\x39\x17\x24\x13\
-\x15\x23\x15\x16\x24\x14\x14\x23\x16\x00\x01\x00\x0d\xff\xf7\x02\
-\xbf\x02\xd1\x00\x57\x00\x00\x57\x22\x26\x26\x35\x11\x07\x22\x26\
-\x35\x34\x36\x33\x17\x35\x34\x3e\x02\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x22\x06\x06\x15\x15\x36\x36\x33\x32\x16\x17\x35\x34\x36\
-\x36\x33\x32\x16\x16\x15\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\
-\x27\x15\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\x23\x22\x26\
-\x26\x35\x35\x22\x06\x06\x23\x22\x26\x27\x11\x14\x06\x06\xad\x23\
-\x20\x07\x22\x1c\x18\x1a\x1d\x1f\x16\x30\x4a\x35\x13\x23\x16\x17\
-\x23\x13\x10\x15\x08\x0f\x31\x16\x14\x2b\x0d\x07\x20\x24\x24\x1f\
-\x07\x43\x14\x22\x15\x16\x22\x14\x42\x09\x14\x11\x17\x22\x12\x16\
-\x23\x12\x3f\x57\x2d\x09\x1c\x1c\x0b\x13\x33\x10\x08\x20\x09\x15\
-\x24\x13\x01\x10\x02\x24\x28\x27\x23\x02\x33\x22\x42\x35\x20\x08\
-\x1e\x26\x24\x20\x06\x05\x0e\x0e\x37\x02\x02\x02\x01\x65\x14\x20\
-\x15\x16\x22\x14\x62\x03\x07\x20\x25\x24\x20\x07\x03\x9a\x16\x15\
-\x08\x08\x1c\x21\x24\x20\x06\x2b\x54\x3d\xa0\x01\x01\x02\x01\xfe\
-\xed\x13\x22\x15\x00\xff\xff\x00\x0d\xff\xf6\x02\x56\x02\xd0\x04\
-\x26\x00\x50\x00\x00\x00\x07\x00\x53\x01\x90\x00\x00\xff\xff\x00\
-\x0d\xff\xf6\x02\xb2\x02\xd0\x04\x26\x00\x50\x00\x00\x00\x07\x00\
-\x5b\x01\x91\x00\x00\x00\x04\xff\x96\xff\x25\x01\xbb\x02\xcb\x00\
-\x19\x00\x29\x00\x44\x00\x54\x00\x00\x45\x22\x26\x26\x35\x34\x36\
-\x36\x33\x32\x36\x36\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x06\x06\x13\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\
-\x14\x06\x06\x01\x22\x26\x26\x35\x34\x36\x36\x33\x32\x36\x36\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x0e\x02\x13\x22\x26\
-\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x01\x0b\x12\
-\x22\x15\x0c\x1c\x14\x0d\x11\x09\x06\x1f\x25\x25\x1e\x07\x2a\x4d\
-\x2b\x24\x20\x07\x07\x21\x24\x26\x1f\x08\x08\x1f\xfe\x4b\x12\x22\
-\x15\x15\x22\x13\x12\x28\x1d\x06\x1f\x25\x24\x1f\x06\x29\x45\x52\
-\x75\x24\x20\x07\x07\x21\x24\x26\x1f\x07\x07\x20\xdb\x08\x1f\x24\
-\x19\x20\x10\x0b\x27\x28\x01\x8d\x13\x21\x15\x15\x23\x13\xfe\x70\
-\x4b\x68\x36\x03\x0c\x16\x24\x13\x14\x23\x15\x16\x23\x14\x14\x23\
-\x15\xfc\xf5\x08\x1e\x25\x22\x1e\x09\x0c\x27\x27\x01\x8c\x13\x22\
-\x15\x16\x22\x13\xfe\x70\x39\x57\x3c\x1d\x03\x0b\x17\x23\x14\x14\
-\x23\x15\x16\x23\x15\x13\x23\x16\x00\x00\x02\x00\x25\xff\xf8\x02\
-\x2b\x02\xd1\x00\x1c\x00\x38\x00\x00\x45\x22\x2e\x03\x35\x03\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x1e\x02\x33\x32\x16\x16\x15\
-\x14\x06\x06\x21\x22\x2e\x03\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\x01\xdd\x25\
-\x3d\x2d\x1f\x0f\x01\x07\x20\x25\x24\x1f\x08\x04\x09\x10\x0c\x1b\
-\x22\x0f\x11\x22\xfe\xd7\x24\x37\x28\x1a\x0d\x08\x1f\x25\x24\x1f\
-\x08\x06\x0a\x03\x17\x1a\x0c\x0d\x1b\x08\x0f\x1f\x2e\x3c\x26\x01\
-\xcf\x14\x22\x16\x16\x22\x14\xfe\x2e\x0a\x0e\x09\x04\x0e\x22\x1b\
-\x1a\x21\x10\x0e\x1d\x2d\x3e\x28\x01\xcf\x14\x22\x16\x16\x22\x14\
-\xfe\x2e\x0d\x10\x08\x0e\x22\x1b\x1a\x21\x10\x00\x01\x00\x0b\xff\
-\xf7\x02\xb4\x02\x92\x00\x56\x00\x00\x45\x22\x26\x26\x35\x35\x07\
-\x22\x26\x35\x34\x36\x33\x17\x35\x34\x36\x36\x33\x32\x16\x16\x15\
-\x15\x32\x36\x33\x32\x16\x33\x35\x34\x36\x36\x33\x32\x16\x16\x15\
-\x15\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\x15\x14\x16\x16\x33\
-\x32\x16\x16\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x22\x06\x06\
-\x23\x22\x26\x27\x15\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\
-\x01\x23\x41\x55\x2b\x22\x1d\x18\x1a\x1e\x1f\x07\x20\x24\x24\x20\
-\x07\x0d\x2c\x14\x15\x2b\x0b\x08\x1f\x24\x24\x1f\x08\x43\x13\x22\
-\x16\x17\x21\x14\x42\x08\x14\x11\x18\x22\x12\x16\x23\x12\x41\x57\
-\x2c\x05\x1a\x1e\x0c\x11\x2f\x0f\x07\x13\x11\x17\x22\x13\x17\x23\
-\x09\x2a\x54\x3e\xa0\x02\x24\x28\x27\x23\x02\x64\x14\x20\x15\x16\
-\x22\x14\x60\x01\x01\x63\x14\x20\x15\x16\x22\x14\x62\x03\x07\x20\
-\x25\x24\x20\x07\x03\x9a\x16\x15\x08\x08\x1c\x21\x24\x20\x06\x2a\
-\x54\x3e\xa0\x02\x01\x02\x01\x9a\x16\x15\x08\x08\x1c\x21\x24\x20\
-\x06\x00\x02\x00\x11\x01\x32\x01\x84\x02\xa4\x00\x20\x00\x2f\x00\
-\x00\x41\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x27\x37\x0e\
-\x02\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x17\x07\x34\
-\x36\x07\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x15\x14\x16\x16\
-\x01\x4c\x1c\x17\x05\x05\x18\x1c\x1d\x1c\x01\x10\x07\x1f\x28\x18\
-\x2d\x4e\x2f\x30\x4d\x2d\x1b\x27\x1a\x07\x0d\x1c\x61\x13\x1c\x12\
-\x12\x1d\x14\x1e\x28\x13\x20\x02\xa4\x12\x1a\x10\xfb\x0f\x1c\x10\
-\x17\x1a\x04\x10\x18\x0d\x33\x56\x32\x31\x53\x33\x0f\x16\x0a\x04\
-\x1b\x18\xff\x13\x20\x13\x15\x21\x12\x2a\x1f\x13\x20\x12\x00\x00\
-\x02\x00\x17\x01\x27\x01\x8e\x02\xa1\x00\x0f\x00\x1b\x00\x00\x53\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x27\
-\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xd5\x35\x55\x34\x33\
-\x56\x33\x36\x54\x31\x31\x54\x36\x1f\x29\x27\x21\x1f\x29\x2a\x01\
-\x27\x32\x56\x34\x36\x55\x33\x32\x55\x37\x35\x55\x32\x72\x2b\x21\
-\x22\x27\x2a\x20\x20\x2b\x00\x00\x03\x00\x1b\xff\xef\x02\x5f\x02\
-\x4d\x00\x11\x00\x1c\x00\x2b\x00\x00\x65\x06\x06\x26\x27\x01\x26\
-\x26\x36\x37\x36\x16\x16\x17\x01\x16\x16\x06\x05\x26\x26\x36\x37\
-\x13\x17\x03\x0e\x02\x25\x27\x13\x3e\x02\x17\x16\x16\x06\x07\x07\
-\x0e\x02\x02\x33\x1e\x27\x1a\x0c\xfe\x93\x0e\x11\x0c\x1f\x1e\x26\
-\x1b\x0e\x01\x6d\x0d\x0f\x0d\xfe\x08\x24\x19\x03\x05\x67\x7f\x55\
-\x05\x0f\x25\x01\x3b\x3d\x4c\x07\x11\x25\x24\x23\x16\x04\x07\x34\
-\x08\x1b\x2a\x06\x16\x01\x18\x0e\x01\xb3\x10\x22\x26\x16\x17\x01\
-\x1a\x11\xfe\x4e\x0f\x1f\x25\x22\x09\x1e\x27\x13\x01\x59\x3f\xfe\
-\xbc\x14\x20\x0c\xbd\x4d\x01\x11\x14\x1f\x0b\x0b\x0a\x1f\x26\x15\
-\xbd\x16\x21\x20\x00\xff\xff\x00\x1b\xff\x86\x02\x5f\x02\x4d\x06\
-\x26\x00\x87\x00\x00\x00\x07\x01\x24\x00\xad\xff\xda\xff\xff\x00\
-\x1b\xff\x1e\x02\x5f\x02\x4d\x06\x26\x00\x87\x00\x00\x00\x07\x01\
-\x25\x00\xad\xff\xda\xff\xff\x00\x1b\xff\xef\x02\x5f\x02\x4d\x06\
-\x26\x00\x87\x00\x00\x00\x07\x01\x29\x00\xd3\xff\x30\x00\x02\x00\
-\x24\xff\xf7\x02\x51\x02\x49\x00\x1d\x00\x2f\x00\x00\x45\x22\x26\
-\x26\x35\x35\x34\x2e\x02\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\
-\x33\x32\x1e\x02\x15\x15\x14\x06\x06\x21\x22\x26\x26\x35\x34\x36\
-\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x01\xb1\x23\x21\x08\
-\x12\x23\x37\x25\x59\x13\x24\x16\x16\x23\x13\x57\x4c\x71\x4a\x25\
-\x07\x20\xfe\x9b\x13\x24\x16\x16\x24\x12\x01\x95\x14\x22\x16\x16\
-\x22\x15\x09\x14\x20\x12\xc2\x2d\x43\x2c\x15\x08\x20\x24\x25\x20\
-\x08\x29\x51\x7b\x53\xbd\x14\x23\x16\x07\x21\x24\x25\x1f\x08\x08\
-\x1f\x25\x24\x21\x07\xff\xff\x00\x24\xff\xf7\x02\x51\x02\x49\x06\
-\x26\x00\x8b\x00\x00\x00\x07\x01\x29\x00\x78\xff\xfa\x00\x02\x00\
-\x0f\xff\xf7\x01\xa9\x02\x4c\x00\x1f\x00\x33\x00\x00\x45\x22\x26\
-\x26\x27\x27\x2e\x03\x27\x22\x26\x27\x26\x26\x37\x37\x36\x36\x17\
-\x32\x16\x17\x1e\x03\x17\x17\x16\x06\x25\x06\x26\x26\x27\x26\x36\
-\x33\x3e\x04\x37\x17\x0e\x04\x01\x57\x24\x1f\x07\x03\x1d\x04\x06\
-\x0b\x19\x18\x17\x1e\x0b\x0c\x0b\x01\x02\x02\x1b\x28\x02\x19\x07\
-\x3a\x45\x27\x13\x09\x26\x07\x24\xfe\xe6\x19\x28\x17\x02\x02\x17\
-\x21\x1b\x31\x30\x31\x33\x1c\x01\x15\x26\x27\x29\x31\x09\x14\x20\
-\x12\xdd\x1f\x37\x2c\x19\x01\x02\x06\x07\x1b\x14\x27\x1b\x16\x01\
-\x01\x01\x02\x29\x47\x5d\x38\xfe\x28\x25\x03\x03\x05\x1b\x1f\x2f\
-\x23\x01\x0d\x14\x1b\x21\x12\x58\x17\x2d\x27\x21\x16\xff\xff\x00\
-\x0f\xff\xf7\x01\xa9\x02\x4c\x06\x26\x00\x8d\x00\x00\x00\x06\x01\
-\x29\x34\xfc\x00\x02\x00\x1f\xff\xf7\x02\x33\x02\x49\x00\x11\x00\
-\x1c\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x03\x22\x26\x26\x35\x11\x17\x11\x14\x06\x06\
-\x6c\x13\x24\x16\x16\x24\x12\x01\x7c\x13\x23\x16\x16\x23\x14\x68\
-\x24\x1f\x08\x97\x07\x21\x01\xb0\x08\x20\x24\x25\x20\x08\x08\x20\
-\x25\x24\x20\x08\xfe\x47\x16\x23\x14\x01\x91\x0d\xfe\x75\x11\x21\
-\x14\xff\xff\x00\x1f\xff\xf7\x02\x33\x02\x49\x06\x26\x00\x8f\x00\
-\x00\x00\x06\x01\x29\x61\xf5\x00\x02\x00\x22\xff\xf7\x02\x35\x02\
-\x49\x00\x1b\x00\x2d\x00\x00\x45\x22\x26\x26\x35\x35\x34\x26\x26\
-\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x15\
-\x14\x06\x06\x21\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x06\x06\x01\xea\x24\x20\x08\x1f\x40\x32\x9e\x14\x23\
-\x16\x16\x23\x13\x9c\x65\x85\x41\x07\x1f\xfe\x68\x24\x20\x07\x07\
-\x20\x25\x25\x1f\x07\x08\x1f\x09\x14\x21\x11\xc2\x3d\x4e\x26\x08\
-\x20\x24\x25\x20\x08\x48\x91\x6f\xbd\x14\x23\x16\x16\x23\x13\xb6\
-\x13\x22\x16\x17\x22\x13\xb6\x13\x22\x16\x00\xff\xff\x00\x22\xff\
-\xf7\x02\x35\x02\x49\x06\x26\x00\x91\x00\x00\x00\x07\x01\x29\x00\
-\xd8\xff\xf5\x00\x01\x00\x31\xff\xf7\x00\xc8\x02\x49\x00\x11\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\
-\x14\x06\x06\x7c\x24\x20\x07\x07\x20\x25\x25\x1f\x07\x08\x1f\x09\
-\x16\x23\x13\x01\xba\x13\x23\x16\x17\x23\x13\xfe\x46\x13\x22\x16\
-\x00\xff\xff\x00\x0e\xff\xf7\x01\x1c\x02\x49\x04\x26\x00\x93\x54\
-\x00\x00\x06\x01\x29\xea\x08\xff\xff\xff\xe7\xff\xf7\x00\xc8\x02\
-\xf0\x06\x26\x00\x93\x00\x00\x00\x06\x01\x26\xcb\x66\x00\x02\x00\
-\x19\xff\xf7\x01\x90\x02\x49\x00\x14\x00\x26\x00\x00\x57\x22\x2e\
-\x02\x27\x27\x26\x26\x36\x37\x17\x0e\x02\x16\x16\x17\x17\x16\x06\
-\x03\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\xe8\x1c\x1e\x0c\x05\x02\x15\x07\x08\x0f\x18\x89\x0e\x0d\
-\x01\x06\x08\x04\x14\x07\x21\xb1\x14\x23\x16\x16\x23\x13\xdf\x13\
-\x23\x16\x16\x23\x14\x09\x0d\x17\x1c\x0e\x86\x2c\x5d\x55\x21\x0c\
-\x08\x2a\x36\x3c\x39\x16\x87\x29\x24\x01\xb9\x08\x20\x24\x25\x20\
-\x08\x08\x20\x25\x24\x20\x08\xff\xff\x00\x0a\xff\xf7\x01\xa1\x02\
-\x49\x04\x26\x00\x96\x11\x00\x00\x06\x01\x29\xe6\x08\x00\x01\x00\
-\x32\xff\xf7\x02\x58\x02\x49\x00\x23\x00\x00\x57\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x37\x32\x1e\x02\x15\x15\x14\x06\x06\x23\x22\
-\x26\x26\x35\x35\x34\x2e\x02\x23\x23\x11\x14\x06\x06\x7e\x25\x1f\
-\x08\x08\x1f\x25\xaf\x4c\x70\x4a\x25\x07\x1f\x25\x24\x20\x08\x12\
-\x24\x36\x25\x66\x07\x20\x09\x16\x23\x13\x01\xb9\x13\x22\x17\x01\
-\x28\x51\x7c\x53\xbd\x14\x23\x16\x14\x21\x11\xc2\x2d\x43\x2c\x15\
-\xfe\x94\x14\x23\x16\x00\x01\x00\x22\xff\xee\x02\x5b\x02\x49\x00\
-\x2a\x00\x00\x45\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x16\x33\x32\x36\x27\x26\x26\x23\x23\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x16\x16\x07\x14\x0e\x02\x01\x3c\x49\x6a\
-\x45\x22\x07\x20\x25\x25\x1f\x08\x42\x43\x44\x41\x02\x01\x34\x2a\
-\x18\x13\x1f\x12\x16\x23\x14\x14\x4a\x6d\x3c\x03\x2a\x4d\x67\x12\
-\x39\x62\x78\x41\xba\x14\x23\x16\x16\x23\x15\xb9\x5e\x5d\x58\x5a\
-\x38\x3f\x08\x20\x24\x25\x20\x08\x4a\x87\x5a\x42\x6f\x52\x2d\xff\
-\xff\x00\x22\xff\xee\x02\x5b\x02\x49\x06\x26\x00\x99\x00\x00\x00\
-\x07\x01\x29\x00\xf3\xff\xff\x00\x01\x00\x31\x00\xf0\x00\xc8\x02\
-\x49\x00\x11\x00\x00\x77\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x15\x14\x06\x06\x7c\x24\x20\x07\x07\x20\x25\x25\x1f\
-\x07\x08\x1f\xf0\x17\x22\x13\xc1\x13\x23\x16\x17\x23\x13\xc1\x13\
-\x22\x16\x00\xff\xff\xff\xe0\x00\xf0\x00\xe3\x02\x49\x04\x26\x00\
-\x9b\x1b\x00\x00\x06\x01\x29\xbc\x71\x00\x01\x00\x1f\xff\x6b\x02\
-\x04\x02\x49\x00\x1d\x00\x00\x45\x22\x26\x26\x35\x11\x34\x2e\x02\
-\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x1e\x02\x15\x11\
-\x14\x06\x06\x01\xb9\x24\x20\x09\x11\x25\x36\x25\x6f\x13\x24\x16\
-\x16\x24\x12\x6d\x4c\x70\x4b\x25\x08\x1f\x95\x15\x20\x12\x01\x4d\
-\x2d\x43\x2c\x15\x08\x20\x24\x25\x20\x08\x29\x51\x7b\x53\xfe\xb7\
-\x13\x23\x17\xff\xff\x00\x1f\xff\x6b\x02\x04\x02\x49\x06\x26\x00\
-\x9d\x00\x00\x00\x07\x01\x29\x00\x77\xff\xe2\x00\x01\x00\x18\xff\
-\xed\x02\x12\x02\x49\x00\x2b\x00\x00\x57\x22\x26\x27\x26\x26\x27\
-\x34\x36\x37\x36\x36\x33\x32\x16\x17\x16\x16\x33\x32\x36\x36\x35\
-\x34\x26\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\
-\x15\x14\x0e\x02\xf8\x3c\x55\x1c\x16\x1b\x02\x0a\x08\x0c\x1b\x11\
-\x0b\x17\x09\x17\x31\x1d\x2a\x3f\x21\x45\x3b\x7e\x13\x1f\x12\x16\
-\x24\x13\x84\x4c\x77\x44\x30\x51\x65\x13\x1d\x10\x0c\x22\x12\x0a\
-\x1c\x10\x15\x14\x0e\x07\x0f\x10\x24\x44\x2f\x43\x51\x08\x21\x23\
-\x25\x20\x08\x4e\x88\x57\x49\x72\x4d\x27\x00\xff\xff\x00\x18\xff\
-\xed\x02\x12\x02\x49\x06\x26\x00\x9f\x00\x00\x00\x07\x01\x29\x00\
-\x9d\xff\xfe\x00\x02\x00\x1a\xff\xec\x01\xfc\x02\xdf\x00\x10\x00\
-\x24\x00\x00\x57\x26\x26\x37\x3e\x03\x37\x17\x0e\x02\x07\x0e\x02\
-\x01\x27\x21\x22\x26\x27\x27\x26\x36\x36\x33\x32\x16\x16\x15\x17\
-\x33\x32\x16\x16\xbf\x29\x10\x16\x25\x3f\x36\x30\x14\x73\x1b\x3d\
-\x47\x2a\x0a\x19\x25\x01\x0c\x64\xfe\xf0\x2b\x24\x03\x07\x01\x09\
-\x23\x24\x25\x1c\x07\x04\xd0\x2f\x39\x0e\x04\x16\x32\x20\x36\x66\
-\x63\x64\x33\x5d\x44\x7f\x7d\x42\x0f\x1b\x05\x01\xa7\x1d\x21\x2b\
-\x98\x13\x23\x15\x16\x23\x14\x49\x32\x53\x00\xff\xff\x00\x1a\xff\
-\xec\x01\xfc\x02\xdf\x06\x26\x00\xa1\x00\x00\x00\x06\x01\x29\x4c\
-\x05\x00\x02\x00\x27\xff\xf7\x02\x42\x02\x49\x00\x20\x00\x24\x00\
-\x00\x57\x22\x26\x26\x35\x11\x34\x36\x33\x33\x32\x16\x16\x15\x15\
-\x14\x06\x06\x23\x22\x26\x26\x35\x35\x34\x26\x26\x23\x23\x11\x14\
-\x06\x06\x23\x37\x21\x17\x73\x25\x20\x07\x2a\x2c\xac\x58\x7d\x44\
-\x07\x1f\x25\x24\x20\x08\x1b\x37\x2d\x6d\x08\x1f\x2c\x01\x01\x8f\
-\x01\x09\x16\x23\x13\x01\xb2\x2c\x28\x49\x86\x5d\xd9\x14\x23\x16\
-\x14\x21\x11\xdd\x34\x42\x20\xfe\x94\x14\x23\x16\x98\x98\x00\x00\
-\x02\x00\x22\xff\xf7\x02\x65\x02\x4f\x00\x2c\x00\x37\x00\x00\x41\
-\x15\x14\x06\x06\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x35\
-\x34\x26\x26\x23\x22\x0e\x02\x07\x07\x0e\x02\x23\x22\x26\x37\x13\
-\x17\x3e\x04\x33\x32\x16\x16\x05\x03\x26\x26\x36\x37\x36\x16\x16\
-\x17\x17\x02\x65\x09\x1f\x23\xc0\x13\x23\x16\x16\x23\x14\x72\x15\
-\x2b\x21\x23\x2e\x1c\x11\x07\x25\x04\x07\x1e\x25\x2e\x24\x08\x36\
-\x35\x10\x18\x1b\x2e\x49\x3a\x47\x61\x34\xfe\x0b\x47\x05\x01\x19\
-\x25\x25\x24\x0e\x04\x2c\x01\x11\xce\x23\x20\x09\x08\x1f\x25\x25\
-\x20\x07\x7f\x3b\x4a\x22\x1d\x31\x3c\x1f\xc9\x13\x23\x16\x25\x28\
-\x01\x2a\x3b\x27\x51\x49\x38\x22\x49\x8d\xa5\x01\x17\x14\x24\x1d\
-\x08\x08\x10\x1f\x11\xc5\x00\xff\xff\x00\x22\xff\xf7\x02\x65\x02\
-\x4f\x06\x26\x00\xa4\x00\x00\x00\x07\x01\x29\x01\x13\xff\xf5\x00\
-\x01\x00\x31\xff\x6b\x00\xc8\x02\x49\x00\x11\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x7c\
-\x24\x20\x07\x07\x20\x25\x25\x1f\x07\x08\x1f\x95\x17\x22\x13\x02\
-\x46\x13\x23\x16\x17\x23\x13\xfd\xba\x13\x22\x16\x00\x00\x02\x00\
-\x22\xff\xf7\x01\x90\x02\x49\x00\x1b\x00\x26\x00\x00\x45\x22\x26\
-\x26\x35\x35\x34\x26\x26\x23\x23\x22\x26\x26\x35\x34\x36\x36\x33\
-\x33\x32\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\x35\x34\x36\
-\x36\x33\x33\x07\x01\x44\x23\x21\x08\x16\x2a\x22\x14\x14\x23\x16\
-\x16\x23\x13\x13\x55\x70\x37\x07\x20\xf9\x14\x24\x16\x16\x23\x14\
-\xde\x01\x09\x14\x21\x11\xdd\x34\x42\x20\x08\x20\x24\x25\x20\x08\
-\x42\x84\x66\xd9\x14\x23\x16\x08\x20\x24\x25\x20\x07\x98\x00\xff\
-\xff\x00\x22\xff\xf7\x01\x90\x02\x49\x06\x26\x00\xa7\x00\x00\x00\
-\x06\x01\x29\x3b\xf5\x00\x02\x00\x24\xff\xec\x02\x67\x02\x49\x00\
-\x10\x00\x1c\x00\x00\x45\x22\x26\x26\x35\x35\x34\x36\x33\x33\x32\
-\x16\x16\x15\x14\x06\x06\x27\x32\x36\x35\x34\x26\x26\x23\x23\x15\
-\x14\x16\x01\x4a\x58\x85\x49\x2f\x23\xcd\x5a\x82\x48\x46\x81\x5a\
-\x3f\x4a\x20\x3d\x2b\x8a\x4a\x14\x4b\x89\x5b\xda\x25\x2f\x49\x87\
-\x5b\x5d\x8a\x4b\x99\x52\x47\x2e\x42\x22\x92\x47\x52\xff\xff\x00\
-\x24\xff\xec\x02\x67\x02\x49\x06\x26\x00\xa9\x00\x00\x00\x07\x01\
-\x29\x00\xf9\xff\xfc\x00\x02\x00\x16\xff\xd1\x02\x1d\x02\x4e\x00\
-\x1c\x00\x2a\x00\x00\x57\x06\x22\x26\x27\x26\x36\x36\x37\x37\x3e\
-\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x07\x14\x0e\x02\x07\
-\x27\x26\x26\x27\x03\x26\x26\x36\x37\x36\x16\x16\x17\x13\x7a\x13\
-\x23\x1c\x09\x09\x10\x23\x14\xc0\x2c\x2c\x0f\x08\x1f\x24\x24\x22\
-\x08\x01\x1b\x38\x59\x3f\x63\x16\x24\x0d\x5b\x06\x03\x18\x24\x24\
-\x25\x12\x06\x70\x29\x06\x1b\x23\x20\x24\x13\x05\x34\x0e\x29\x3b\
-\x2a\xc7\x12\x20\x15\x16\x24\x14\x9c\x48\x6d\x50\x3a\x15\x67\x09\
-\x21\x26\x01\x24\x13\x23\x1e\x0a\x0a\x11\x24\x13\xfe\x88\x00\x00\
-\x01\x00\x17\xff\x6b\x02\x16\x02\x4b\x00\x29\x00\x00\x45\x22\x26\
-\x26\x35\x11\x34\x26\x26\x23\x23\x22\x06\x06\x17\x1e\x02\x17\x16\
-\x16\x06\x07\x06\x2e\x02\x27\x26\x3e\x02\x33\x33\x32\x16\x16\x15\
-\x11\x14\x06\x06\x01\xc9\x24\x1f\x08\x18\x30\x24\x34\x19\x20\x09\
-\x0a\x06\x10\x13\x0c\x14\x07\x19\x1d\x17\x38\x34\x22\x03\x01\x21\
-\x3f\x55\x33\x10\x53\x76\x3e\x08\x1f\x95\x17\x22\x13\x01\x72\x2e\
-\x3c\x1f\x17\x23\x11\x0c\x16\x13\x08\x10\x24\x27\x13\x10\x0e\x32\
-\x4f\x30\x30\x51\x3d\x22\x43\x81\x5b\xfe\x8a\x13\x22\x16\x00\xff\
-\xff\x00\x17\xff\x6b\x02\x16\x02\x4b\x06\x26\x00\xac\x00\x00\x00\
-\x07\x01\x29\x00\xde\xff\xb4\x00\x01\x00\x1d\xff\xf7\x02\x23\x02\
-\x4b\x00\x32\x00\x00\x57\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\
-\x36\x36\x35\x35\x34\x26\x23\x23\x22\x06\x06\x17\x16\x16\x17\x16\
-\x16\x06\x06\x07\x06\x2e\x02\x27\x26\x3e\x02\x33\x33\x32\x16\x16\
-\x15\x15\x14\x06\x06\x23\x79\x13\x23\x16\x16\x23\x14\x95\x26\x37\
-\x1f\x3b\x36\x2d\x16\x21\x0c\x09\x04\x0f\x0d\x10\x01\x10\x16\x08\
-\x13\x31\x2f\x20\x03\x03\x1f\x3c\x55\x32\x18\x54\x77\x41\x45\x7e\
-\x56\x09\x08\x1f\x25\x25\x20\x07\x21\x3f\x2d\x0d\x41\x48\x15\x1f\
-\x0f\x0f\x14\x08\x0c\x20\x21\x19\x04\x0f\x0a\x28\x41\x28\x30\x53\
-\x3f\x23\x45\x80\x5a\x13\x5b\x82\x45\xff\xff\x00\x1d\xff\xf7\x02\
-\x23\x02\x4b\x06\x26\x00\xae\x00\x00\x00\x07\x01\x29\x00\xd6\xff\
-\xed\x00\x02\x00\x26\xff\x66\x02\x12\x02\x49\x00\x1b\x00\x26\x00\
-\x00\x45\x06\x26\x26\x27\x2e\x03\x27\x2e\x02\x36\x37\x36\x36\x16\
-\x17\x1e\x03\x17\x16\x16\x06\x06\x03\x27\x13\x36\x36\x32\x17\x16\
-\x16\x06\x07\x01\x82\x24\x24\x0f\x04\x10\x2c\x38\x41\x26\x09\x14\
-\x09\x0d\x18\x18\x27\x22\x0e\x2b\x4e\x42\x31\x0c\x03\x05\x06\x18\
-\x4b\x61\x8e\x0b\x1a\x27\x1e\x1e\x0c\x0e\x0b\x94\x06\x0d\x1d\x12\
-\x4b\x8e\x85\x7c\x37\x0e\x1e\x1f\x20\x0f\x12\x09\x11\x15\x3b\x90\
-\x9c\x9d\x47\x0f\x21\x1f\x17\x01\x3e\x63\x01\x0f\x11\x17\x15\x14\
-\x24\x21\x11\x00\x03\x00\x1b\xff\xf5\x02\x24\x02\x50\x00\x11\x00\
-\x1c\x00\x27\x00\x00\x45\x27\x01\x26\x36\x37\x36\x16\x16\x17\x01\
-\x16\x16\x17\x16\x16\x06\x06\x25\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x17\x27\x27\x13\x3e\x02\x17\x16\x16\x06\x07\x01\xb1\x5d\xfe\
-\xe5\x16\x11\x1e\x1f\x26\x1a\x0c\x01\x10\x0b\x11\x07\x0c\x01\x13\
-\x22\xfe\xa0\x14\x23\x16\x16\x23\x13\x01\x4e\x06\x40\x66\x7a\x0a\
-\x17\x26\x20\x1f\x0f\x0b\x0a\x09\x70\x01\x71\x1e\x2e\x16\x16\x01\
-\x17\x11\xfe\x91\x0e\x19\x0c\x14\x33\x2c\x1d\x02\x08\x20\x24\x25\
-\x20\x07\x98\xc6\x5c\x01\x0c\x10\x18\x02\x13\x11\x23\x23\x11\xff\
-\xff\x00\x1b\xff\xf5\x02\x24\x02\x50\x06\x26\x00\xb1\x00\x00\x00\
-\x07\x01\x29\x00\x3b\xff\xb3\x00\x03\x00\x24\xff\x48\x02\x43\x02\
-\x49\x00\x13\x00\x25\x00\x35\x00\x00\x45\x26\x26\x37\x3e\x04\x37\
-\x17\x0e\x04\x07\x0e\x02\x07\x22\x26\x26\x35\x11\x34\x36\x36\x33\
-\x32\x16\x16\x15\x11\x14\x06\x06\x01\x27\x23\x21\x22\x26\x26\x35\
-\x34\x36\x36\x33\x21\x32\x16\x16\x01\x5b\x2c\x1b\x0e\x0f\x1f\x1f\
-\x1e\x1c\x0d\x81\x0b\x18\x1a\x1b\x1a\x0c\x07\x15\x23\xff\x24\x20\
-\x07\x07\x20\x25\x25\x1f\x07\x08\x1f\x01\x91\x81\x37\xfe\xf8\x13\
-\x24\x16\x16\x24\x12\x01\x4a\x36\x41\x12\x0a\x0e\x2d\x24\x26\x53\
-\x58\x59\x57\x29\x59\x25\x4e\x51\x4e\x49\x20\x12\x1f\x0d\xa5\x16\
-\x24\x13\x01\x74\x13\x22\x16\x16\x23\x13\xfe\x8c\x13\x23\x16\x02\
-\x4c\x1d\x08\x20\x24\x25\x20\x07\x2e\x52\x00\xff\xff\x00\x24\xff\
-\x48\x02\x43\x02\x49\x06\x26\x00\xb3\x00\x00\x00\x07\x01\x29\x00\
-\xd1\x00\x20\x00\x01\x00\x13\xff\xf7\x01\xec\x02\x49\x00\x1d\x00\
-\x00\x45\x22\x26\x26\x35\x35\x34\x2e\x02\x23\x23\x22\x26\x26\x35\
-\x34\x36\x36\x33\x33\x32\x1e\x02\x15\x15\x14\x06\x06\x01\xa0\x24\
-\x1f\x09\x12\x24\x36\x26\x61\x14\x24\x16\x16\x23\x14\x60\x4c\x71\
-\x4a\x25\x08\x1f\x09\x14\x21\x11\xc2\x2d\x43\x2c\x15\x08\x20\x24\
-\x25\x20\x08\x29\x51\x7b\x53\xbd\x14\x23\x16\xff\xff\x00\x13\xff\
-\xf7\x01\xec\x02\x49\x06\x26\x00\xb5\x00\x00\x00\x06\x01\x29\x59\
-\xd8\x00\x02\x00\x24\xff\xee\x02\xa7\x02\x49\x00\x25\x00\x3c\x00\
-\x00\x45\x22\x2e\x02\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\
-\x14\x16\x16\x33\x32\x36\x36\x35\x35\x34\x36\x36\x33\x32\x16\x16\
-\x15\x15\x14\x0e\x02\x25\x27\x33\x32\x3e\x02\x37\x37\x3e\x02\x33\
-\x32\x16\x16\x07\x07\x0e\x03\x23\x01\x62\x4f\x77\x50\x28\x08\x20\
-\x24\x25\x20\x08\x26\x4c\x35\x3f\x4a\x22\x09\x20\x23\x25\x20\x07\
-\x28\x52\x7a\xfe\xe9\x05\x29\x13\x1e\x18\x0d\x01\x03\x01\x08\x20\
-\x24\x25\x21\x07\x02\x04\x04\x1b\x34\x50\x39\x12\x39\x5f\x76\x3e\
-\xc2\x14\x23\x16\x16\x23\x15\xc1\x39\x50\x2b\x31\x52\x32\xc7\x12\
-\x20\x15\x17\x23\x14\xc3\x3f\x75\x5e\x38\xa7\x63\x1b\x32\x45\x2b\
-\x4d\x12\x20\x15\x16\x23\x14\x49\x42\x6a\x4b\x27\x00\xff\xff\x00\
-\x24\xff\xee\x02\xa7\x02\xec\x06\x26\x00\xb7\x00\x00\x00\x07\x01\
-\x1c\x02\x0d\x00\x66\xff\xff\x00\x24\xff\xee\x02\xa7\x02\xec\x06\
-\x26\x00\xb7\x00\x00\x00\x06\x01\x2b\x29\x66\xff\xff\x00\x24\xff\
-\xee\x02\xa7\x02\xec\x06\x26\x00\xb7\x00\x00\x00\x27\x01\x29\x01\
-\x7b\xff\xdd\x00\x07\x01\x1c\x02\x0d\x00\x66\xff\xff\x00\x24\xff\
-\xee\x02\xa7\x02\xec\x06\x26\x00\xb7\x00\x00\x00\x27\x01\x29\x01\
-\x7b\xff\xdd\x00\x06\x01\x2b\x29\x66\xff\xff\x00\x24\xff\xee\x02\
-\xa7\x02\x49\x06\x26\x00\xb7\x00\x00\x00\x07\x01\x29\x01\x7b\xff\
-\xdd\x00\x01\x00\x22\xff\xf7\x02\x90\x02\x4a\x00\x2b\x00\x00\x57\
-\x22\x26\x26\x35\x34\x36\x36\x33\x33\x11\x17\x06\x06\x26\x26\x35\
-\x34\x36\x37\x37\x36\x16\x16\x15\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x35\x34\x26\x26\x23\x23\x11\x14\x06\x23\x6f\x14\x23\x16\x16\
-\x23\x13\x28\x5f\x23\x3d\x2f\x1b\x2e\x39\xa8\x68\x89\x45\x08\x1f\
-\x25\x24\x1f\x09\x20\x40\x32\x37\x28\x25\x09\x08\x20\x24\x25\x20\
-\x07\x01\x54\x31\x04\x05\x09\x1d\x1d\x30\x2a\x01\x02\x01\x48\x92\
-\x6f\xbd\x14\x23\x16\x14\x21\x11\xc2\x3d\x4e\x26\xfe\xa6\x2e\x31\
-\x00\xff\xff\x00\x22\xff\xf7\x02\x90\x02\x4a\x06\x26\x00\xbd\x00\
-\x00\x00\x07\x01\x29\x01\x3b\xff\xf5\x00\x02\x00\x18\xff\xec\x02\
-\x24\x02\xbb\x00\x17\x00\x2a\x00\x00\x45\x22\x2e\x03\x35\x34\x3e\
-\x03\x33\x32\x1e\x03\x15\x14\x0e\x03\x27\x32\x3e\x03\x35\x35\x34\
-\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x01\x22\x41\x5c\x3c\x23\
-\x0e\x0e\x22\x3b\x5d\x40\x3e\x5b\x3a\x23\x0e\x0f\x22\x3b\x58\x42\
-\x21\x29\x17\x0b\x02\x18\x30\x25\x26\x31\x18\x19\x31\x14\x2c\x4b\
-\x5d\x65\x2f\x2c\x63\x5e\x4d\x2d\x2d\x4b\x5e\x64\x2e\x2f\x64\x5e\
-\x4a\x2c\x99\x1f\x30\x37\x33\x11\x05\x43\x5c\x30\x2f\x5d\x44\x42\
-\x5c\x30\x00\x00\x02\x00\x11\xff\xf5\x01\x5c\x02\xb2\x00\x0d\x00\
-\x1b\x00\x00\x45\x22\x26\x35\x11\x34\x36\x33\x32\x16\x15\x11\x14\
-\x06\x03\x06\x26\x27\x26\x36\x37\x37\x36\x16\x17\x16\x06\x07\x01\
-\x10\x29\x21\x21\x2a\x2a\x21\x21\xa9\x1d\x2e\x1a\x1c\x04\x21\x95\
-\x1c\x2f\x1a\x1b\x04\x22\x0b\x22\x2a\x02\x26\x2a\x21\x22\x2b\xfd\
-\xdb\x2a\x21\x01\xad\x19\x02\x1c\x1e\x33\x1d\x84\x19\x04\x1d\x1c\
-\x32\x1e\x00\x00\x01\x00\x19\xff\xf8\x02\x2e\x02\xbb\x00\x38\x00\
-\x00\x57\x22\x26\x35\x34\x36\x36\x37\x3e\x04\x35\x34\x26\x26\x23\
-\x22\x0e\x02\x15\x14\x06\x06\x23\x22\x26\x26\x35\x34\x3e\x02\x33\
-\x32\x16\x16\x15\x14\x0e\x04\x07\x07\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x64\x1e\x2d\x06\x0f\x0d\x23\x56\x55\x47\x2b\x11\x2c\x27\
-\x1a\x27\x19\x0c\x07\x20\x26\x25\x20\x06\x22\x42\x5d\x3c\x49\x72\
-\x43\x1c\x2f\x39\x3a\x32\x11\x0e\xdd\x14\x23\x15\x16\x24\x14\x08\
-\x2f\x1e\x12\x20\x1e\x0c\x24\x3b\x35\x35\x3d\x24\x14\x29\x1b\x0e\
-\x1b\x28\x1a\x13\x21\x14\x17\x25\x13\x30\x5b\x47\x2a\x41\x72\x4a\
-\x2c\x4a\x3d\x30\x24\x1b\x09\x02\x08\x20\x26\x23\x21\x07\x00\x00\
-\x01\x00\x18\xff\xed\x02\x24\x02\xbc\x00\x48\x00\x00\x45\x22\x2e\
-\x02\x27\x34\x33\x32\x16\x16\x17\x1e\x02\x33\x32\x36\x36\x35\x34\
-\x26\x26\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x36\x36\x35\x34\
-\x26\x26\x23\x22\x06\x06\x07\x06\x06\x27\x26\x26\x37\x3e\x04\x33\
-\x32\x1e\x02\x15\x14\x06\x06\x07\x1e\x03\x15\x14\x06\x06\x01\x1d\
-\x35\x5e\x48\x29\x01\x53\x18\x19\x0e\x08\x03\x18\x2d\x24\x22\x31\
-\x1b\x1a\x2d\x1e\x14\x24\x16\x16\x24\x15\x1b\x24\x13\x15\x25\x19\
-\x1b\x23\x17\x09\x11\x33\x25\x22\x0b\x0f\x02\x0e\x1f\x32\x49\x33\
-\x3b\x5b\x3e\x20\x19\x24\x0f\x0f\x21\x1b\x12\x44\x76\x13\x23\x3c\
-\x4d\x2a\x36\x09\x17\x15\x0a\x20\x19\x15\x25\x17\x1a\x24\x12\x06\
-\x1e\x25\x25\x1d\x05\x0c\x17\x11\x15\x1f\x10\x0d\x18\x0e\x23\x0e\
-\x15\x15\x2e\x20\x02\x1b\x25\x24\x18\x25\x3d\x4a\x26\x24\x34\x21\
-\x07\x07\x1c\x27\x30\x1c\x42\x68\x3d\x00\x01\x00\x12\xff\xf7\x02\
-\x02\x02\xbb\x00\x23\x00\x00\x45\x22\x26\x26\x35\x35\x21\x22\x26\
-\x26\x35\x34\x36\x37\x13\x36\x36\x17\x16\x16\x07\x03\x33\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x01\xb5\x25\x20\x07\
-\xfe\xf4\x24\x20\x07\x01\x02\x57\x0c\x29\x29\x20\x22\x06\x4b\xae\
-\x08\x20\x26\x24\x20\x07\x08\x20\x09\x16\x24\x13\x80\x16\x23\x13\
-\x0a\x0d\x06\x01\x4d\x2e\x13\x0a\x08\x20\x18\xfe\xe1\x01\x1a\x12\
-\x20\x15\x16\x23\x14\xfd\xdd\x14\x23\x15\x00\x00\x01\x00\x12\xff\
-\xec\x01\xdd\x02\xb4\x00\x47\x00\x00\x57\x22\x2e\x02\x27\x26\x26\
-\x35\x34\x36\x37\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x36\x36\
-\x35\x34\x26\x26\x23\x22\x06\x06\x07\x06\x06\x23\x06\x26\x27\x26\
-\x26\x35\x13\x3e\x02\x33\x17\x32\x16\x16\x15\x14\x06\x06\x23\x23\
-\x07\x3e\x02\x33\x33\x32\x1e\x02\x15\x14\x06\x06\xf2\x2b\x43\x2f\
-\x1d\x05\x0e\x13\x0e\x10\x0d\x1a\x0d\x0c\x1a\x13\x04\x11\x1f\x1a\
-\x1c\x27\x16\x17\x26\x18\x0e\x16\x0f\x04\x09\x15\x10\x0d\x1c\x11\
-\x1b\x16\x27\x02\x0a\x1f\x21\xef\x14\x22\x15\x14\x21\x12\xb0\x0e\
-\x06\x0e\x0e\x07\x06\x2d\x53\x41\x26\x3e\x6b\x14\x12\x19\x15\x04\
-\x0b\x18\x10\x0d\x1c\x10\x0f\x0f\x0c\x10\x03\x0c\x0a\x14\x25\x1a\
-\x18\x26\x15\x06\x0a\x04\x08\x0d\x01\x07\x09\x0e\x16\x0f\x01\x23\
-\x0e\x24\x1b\x01\x08\x20\x26\x23\x1f\x06\x65\x04\x04\x03\x24\x40\
-\x52\x2e\x45\x6e\x40\x00\x02\x00\x18\xff\xee\x01\xf6\x02\xb3\x00\
-\x24\x00\x34\x00\x00\x45\x22\x26\x26\x35\x34\x3e\x03\x33\x32\x16\
-\x16\x15\x14\x06\x06\x23\x22\x0e\x03\x15\x27\x3e\x02\x33\x32\x16\
-\x16\x15\x14\x06\x06\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x15\x14\x16\x16\x01\x0e\x4d\x6e\x3b\x24\x43\x5f\x77\x45\x13\
-\x20\x15\x16\x23\x14\x2f\x47\x32\x20\x0f\x0d\x03\x1d\x2b\x19\x3f\
-\x66\x3c\x3c\x69\x47\x1d\x26\x13\x13\x24\x19\x1b\x2a\x15\x12\x25\
-\x12\x43\x7f\x59\x4d\x82\x69\x4b\x27\x07\x20\x25\x25\x1f\x08\x18\
-\x29\x2e\x2c\x0f\x03\x08\x14\x0d\x38\x5d\x39\x40\x66\x3b\x8d\x12\
-\x24\x18\x17\x21\x13\x12\x21\x15\x1a\x24\x13\x00\x01\x00\x12\xff\
-\xf7\x02\x03\x02\xb1\x00\x23\x00\x00\x57\x22\x26\x26\x35\x34\x3e\
-\x04\x37\x23\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\
-\x14\x0e\x04\x15\x14\x06\x06\xc3\x24\x20\x08\x1d\x2f\x36\x31\x21\
-\x03\xf1\x13\x23\x15\x14\x20\x12\x01\x60\x25\x1f\x07\x23\x37\x3f\
-\x37\x23\x09\x20\x09\x0f\x1e\x13\x36\x68\x5f\x56\x47\x37\x12\x08\
-\x20\x24\x25\x1f\x07\x16\x24\x15\x28\x59\x5e\x60\x61\x5f\x2e\x12\
-\x1d\x0f\x00\x00\x03\x00\x18\xff\xec\x02\x0b\x02\xbf\x00\x27\x00\
-\x37\x00\x47\x00\x00\x45\x22\x26\x26\x35\x34\x3e\x03\x07\x16\x2e\
-\x02\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x37\x26\x1e\
-\x03\x15\x14\x0e\x02\x27\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x15\x14\x16\x16\x13\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\
-\x06\x15\x14\x16\x16\x01\x14\x48\x71\x43\x14\x1b\x1a\x0e\x05\x06\
-\x11\x1c\x16\x3d\x69\x41\x40\x66\x3c\x0e\x14\x13\x09\x03\x04\x0d\
-\x1a\x1b\x12\x2b\x47\x57\x2f\x1e\x2b\x17\x17\x2c\x1f\x1e\x2b\x18\
-\x18\x2c\x1f\x18\x21\x12\x13\x21\x18\x17\x22\x12\x13\x22\x14\x3c\
-\x68\x43\x1f\x34\x29\x1a\x0a\x04\x05\x0d\x22\x34\x20\x3c\x5f\x37\
-\x37\x61\x3d\x16\x29\x21\x17\x09\x05\x04\x0b\x1a\x29\x34\x1e\x36\
-\x56\x3b\x20\x90\x15\x26\x19\x1a\x26\x14\x14\x26\x1a\x19\x26\x15\
-\x01\x31\x10\x1d\x14\x14\x1c\x10\x10\x1c\x14\x14\x1d\x10\x00\x00\
-\x02\x00\x18\xff\xf6\x01\xf6\x02\xbc\x00\x24\x00\x34\x00\x00\x57\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x3e\x03\x35\x17\x0e\x02\x23\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x13\
-\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x16\x16\x72\
-\x12\x20\x14\x15\x24\x14\x2f\x47\x32\x20\x0e\x0e\x03\x1c\x2d\x19\
-\x3e\x66\x3c\x3d\x68\x43\x4c\x6f\x3b\x24\x43\x5f\x78\x46\x1d\x28\
-\x16\x13\x26\x1c\x1d\x27\x13\x14\x25\x0a\x09\x1f\x25\x25\x1f\x07\
-\x19\x28\x2f\x2b\x10\x03\x08\x13\x0e\x38\x5d\x38\x41\x66\x3b\x43\
-\x7e\x5a\x4d\x83\x69\x4b\x27\x01\xa0\x11\x22\x15\x1b\x23\x12\x12\
-\x22\x1a\x15\x23\x12\x00\x01\x00\x10\xff\xdb\x01\xdd\x02\xe2\x00\
-\x11\x00\x00\x57\x26\x26\x36\x37\x01\x3e\x02\x17\x16\x16\x06\x07\
-\x01\x0e\x02\x2f\x15\x0a\x08\x05\x01\x65\x05\x0d\x18\x13\x15\x09\
-\x08\x05\xfe\x9a\x05\x0e\x16\x1b\x0b\x15\x14\x0a\x02\xa3\x0a\x10\
-\x02\x0a\x0b\x14\x14\x0a\xfd\x5d\x0b\x0f\x03\x00\x03\x00\x31\xff\
-\xdc\x02\xd0\x02\xe2\x00\x11\x00\x2b\x00\x60\x00\x00\x57\x26\x26\
-\x36\x37\x01\x36\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\x26\x13\
-\x22\x26\x26\x35\x35\x06\x06\x07\x06\x26\x27\x26\x26\x37\x37\x36\
-\x36\x33\x32\x16\x15\x11\x14\x06\x06\x13\x22\x26\x26\x35\x34\x36\
-\x36\x37\x3e\x03\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x06\x06\
-\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x02\
-\x07\x27\x33\x32\x16\x16\x15\x14\x06\x06\x23\x89\x0f\x0d\x02\x08\
-\x01\x66\x08\x12\x16\x0d\x0e\x0d\x01\x07\xfe\x97\x07\x11\x14\x2a\
-\x19\x16\x06\x08\x0f\x09\x0a\x15\x0a\x12\x01\x15\x55\x09\x13\x0d\
-\x1a\x1b\x05\x17\xed\x11\x1a\x0e\x0c\x18\x11\x1b\x32\x29\x19\x08\
-\x13\x11\x12\x14\x07\x07\x18\x1b\x19\x15\x04\x28\x45\x2b\x2c\x45\
-\x28\x16\x24\x2b\x16\x07\x63\x0b\x14\x0f\x0e\x15\x0b\x1b\x09\x10\
-\x14\x0e\x02\xa6\x0f\x0d\x02\x08\x08\x11\x13\x0e\xfd\x57\x0c\x0d\
-\x02\x01\x64\x0f\x16\x09\xb8\x04\x07\x03\x03\x09\x0a\x13\x25\x14\
-\x4b\x09\x08\x18\x18\xfe\xce\x0a\x15\x0f\xfe\xb5\x0f\x1a\x11\x12\
-\x1d\x17\x0a\x10\x1d\x1e\x25\x17\x06\x10\x0c\x11\x16\x09\x0d\x18\
-\x0f\x12\x1a\x0a\x2c\x45\x29\x28\x44\x2b\x1b\x2f\x27\x20\x0e\x03\
-\x06\x16\x1b\x19\x16\x06\x00\x00\x03\x00\x2a\xff\xdc\x02\xb2\x02\
-\xe2\x00\x11\x00\x35\x00\x4f\x00\x00\x57\x26\x26\x36\x37\x01\x36\
-\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\x26\x25\x22\x26\x26\x35\
-\x35\x23\x22\x26\x35\x34\x36\x37\x37\x36\x36\x17\x1e\x02\x07\x07\
-\x33\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x01\x22\
-\x26\x26\x35\x35\x06\x06\x07\x06\x26\x27\x26\x26\x37\x37\x36\x36\
-\x33\x32\x16\x15\x11\x14\x06\x06\x89\x0f\x0d\x02\x07\x01\x67\x08\
-\x11\x16\x0e\x0e\x0d\x01\x08\xfe\x97\x06\x11\x15\x01\xe4\x19\x17\
-\x05\x8e\x17\x19\x02\x03\x2f\x08\x1b\x1e\x14\x15\x04\x05\x23\x44\
-\x05\x18\x1a\x1a\x16\x05\x05\x17\xfe\x24\x19\x16\x05\x09\x0f\x08\
-\x0b\x15\x09\x12\x01\x15\x54\x0a\x13\x0c\x1b\x1b\x05\x18\x1b\x09\
-\x10\x14\x0e\x02\xa6\x0f\x0d\x02\x08\x08\x11\x13\x0e\xfd\x57\x0c\
-\x0d\x02\x1a\x0f\x16\x0a\x3e\x1a\x18\x08\x10\x0a\xb1\x1f\x10\x06\
-\x06\x11\x1b\x15\x7f\x95\x0c\x17\x0e\x10\x17\x0d\xfe\xc7\x09\x16\
-\x0f\x01\x4a\x0f\x16\x09\xb8\x04\x07\x03\x03\x09\x0a\x13\x25\x14\
-\x4b\x09\x08\x18\x18\xfe\xce\x0a\x15\x0f\x00\x00\x03\x00\x28\xff\
-\xdd\x02\xdd\x02\xe1\x00\x11\x00\x4e\x00\x72\x00\x00\x57\x26\x26\
-\x36\x37\x01\x36\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\x26\x03\
-\x22\x26\x26\x27\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x36\
-\x35\x34\x26\x23\x22\x26\x35\x34\x36\x33\x32\x36\x35\x34\x26\x23\
-\x22\x06\x06\x07\x06\x06\x23\x22\x26\x37\x3e\x02\x33\x32\x16\x16\
-\x15\x14\x06\x07\x16\x16\x15\x14\x06\x06\x01\x22\x26\x26\x35\x35\
-\x23\x22\x26\x35\x34\x36\x37\x37\x36\x36\x17\x1e\x02\x07\x07\x33\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\xb7\x0f\x0e\
-\x02\x08\x01\x67\x08\x12\x15\x0e\x0e\x0d\x02\x07\xfe\x97\x07\x10\
-\x15\x0e\x28\x40\x26\x01\x14\x18\x05\x16\x10\x03\x02\x0b\x17\x13\
-\x14\x21\x13\x23\x0e\x10\x13\x0b\x16\x16\x1a\x12\x0d\x11\x0a\x05\
-\x03\x0a\x12\x13\x22\x01\x02\x1f\x39\x29\x29\x3b\x22\x18\x0a\x13\
-\x18\x22\x42\x01\xc0\x19\x17\x06\x8e\x17\x18\x02\x02\x30\x08\x1c\
-\x1c\x14\x15\x05\x06\x22\x43\x05\x18\x1a\x1a\x17\x05\x05\x17\x1b\
-\x09\x11\x14\x0d\x02\xa6\x0f\x0c\x01\x08\x08\x11\x13\x0e\xfd\x57\
-\x0c\x0c\x02\x01\x62\x21\x38\x1f\x10\x0e\x05\x0f\x08\x06\x17\x13\
-\x17\x15\x0f\x16\x0c\x1b\x15\x0a\x13\x11\x11\x13\x07\x0d\x08\x09\
-\x10\x1d\x13\x0e\x2c\x21\x21\x34\x1d\x1e\x21\x08\x0d\x2b\x18\x20\
-\x3c\x24\xfe\xb7\x0f\x16\x0a\x3e\x1a\x18\x08\x10\x0a\xb1\x1f\x12\
-\x08\x06\x11\x1b\x15\x7f\x95\x0c\x17\x0e\x10\x17\x0d\xfe\xc7\x09\
-\x16\x0f\x00\x00\x01\x00\x0d\x00\xbf\x01\x05\x02\xba\x00\x19\x00\
-\x00\x77\x22\x26\x26\x35\x35\x06\x06\x07\x06\x26\x27\x26\x36\x37\
-\x37\x36\x36\x33\x32\x16\x15\x11\x14\x06\x06\xc2\x1f\x1b\x06\x0b\
-\x17\x0b\x0d\x1a\x0c\x15\x05\x15\x6d\x0a\x18\x0e\x20\x21\x06\x1c\
-\xbf\x13\x1a\x0c\xf6\x06\x0b\x03\x03\x0d\x0d\x1a\x29\x13\x5f\x0a\
-\x0a\x1d\x1c\xfe\x75\x0d\x19\x11\x00\x00\x01\x00\x13\x00\xc1\x01\
-\x9f\x02\xc3\x00\x35\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x37\
-\x3e\x03\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\x06\x06\x23\x22\
-\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x07\x27\
-\x33\x32\x16\x16\x15\x14\x06\x06\x23\x5a\x15\x20\x12\x0b\x17\x11\
-\x22\x44\x3a\x23\x0b\x19\x15\x18\x19\x0a\x08\x1e\x1f\x1f\x19\x05\
-\x31\x55\x36\x37\x55\x31\x11\x1c\x25\x29\x15\x20\x8b\x0c\x1a\x12\
-\x11\x1a\x0d\xc1\x11\x1f\x15\x13\x21\x1d\x0b\x19\x28\x27\x2c\x1c\
-\x09\x16\x11\x16\x1d\x0a\x11\x1d\x12\x16\x1e\x0d\x36\x56\x31\x30\
-\x55\x37\x1b\x30\x2a\x24\x1f\x0e\x02\x07\x1b\x20\x1f\x1b\x06\x00\
-\x01\x00\x12\x00\xb8\x01\x96\x02\xc2\x00\x43\x00\x00\x77\x22\x26\
-\x26\x27\x34\x36\x36\x33\x32\x16\x17\x1e\x02\x33\x32\x36\x36\x35\
-\x34\x26\x23\x22\x26\x26\x35\x34\x36\x36\x33\x32\x36\x35\x34\x26\
-\x23\x22\x06\x06\x07\x06\x06\x23\x22\x26\x27\x26\x37\x3e\x03\x33\
-\x32\x16\x16\x15\x14\x06\x07\x1e\x02\x15\x14\x06\x06\xd1\x34\x56\
-\x34\x01\x11\x20\x15\x19\x15\x05\x03\x10\x1e\x18\x18\x1b\x0c\x18\
-\x22\x0e\x16\x0d\x0e\x15\x0c\x18\x17\x1c\x16\x13\x14\x0c\x04\x06\
-\x12\x16\x0d\x17\x0f\x16\x02\x02\x18\x2d\x3f\x29\x33\x50\x30\x15\
-\x14\x10\x18\x0d\x33\x58\xb8\x2c\x49\x2c\x10\x16\x0c\x11\x11\x08\
-\x1b\x16\x11\x17\x0a\x18\x15\x05\x18\x1b\x16\x13\x05\x15\x14\x12\
-\x18\x0d\x13\x09\x0a\x12\x0a\x0b\x15\x18\x0e\x2b\x29\x1b\x29\x46\
-\x2b\x1d\x2e\x11\x0c\x22\x26\x13\x32\x4f\x2c\xff\xff\x00\x11\x01\
-\x91\x00\xb5\x02\xb3\x04\x07\x00\xd6\xff\xf4\x02\x18\xff\xff\x00\
-\x18\x01\x91\x01\x72\x02\xb2\x04\x27\x00\xd6\xff\xfb\x02\x17\x00\
-\x07\x00\xd6\x00\xb1\x02\x17\x00\x01\x00\x1a\x01\xaa\x01\x14\x02\
-\x43\x00\x11\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x67\x14\x23\x16\x16\x23\x13\x62\x14\
-\x23\x15\x16\x22\x15\x01\xaa\x07\x20\x25\x25\x20\x08\x08\x20\x25\
-\x25\x20\x07\x00\x01\x00\x1b\xff\xf6\x00\xbe\x00\x99\x00\x0d\x00\
-\x00\x57\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\x14\x06\x06\x6d\
-\x2e\x24\x10\x24\x1e\x2e\x23\x0f\x24\x0a\x24\x2c\x1f\x24\x10\x24\
-\x2e\x1e\x24\x0f\x00\x00\x01\x00\x1e\xff\x79\x00\xc1\x00\x9b\x00\
-\x1f\x00\x00\x57\x30\x26\x26\x35\x34\x36\x37\x36\x36\x37\x26\x26\
-\x27\x26\x26\x35\x34\x36\x36\x33\x32\x17\x16\x16\x15\x14\x14\x07\
-\x0e\x02\x34\x0b\x0b\x0f\x04\x01\x1d\x03\x0b\x12\x07\x0c\x04\x07\
-\x23\x29\x2e\x12\x0c\x04\x02\x04\x28\x3c\x87\x04\x0f\x12\x17\x0e\
-\x01\x02\x17\x1c\x03\x09\x06\x0c\x24\x10\x13\x24\x19\x13\x0c\x22\
-\x12\x08\x10\x08\x30\x4f\x30\x00\x02\x00\x1c\xff\xf6\x00\xc1\x01\
-\xd4\x00\x0d\x00\x1b\x00\x00\x53\x22\x26\x35\x34\x36\x36\x33\x32\
-\x16\x15\x14\x06\x06\x03\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\
-\x14\x06\x06\x6f\x2d\x25\x10\x24\x1f\x2d\x24\x10\x23\x20\x2d\x25\
-\x10\x24\x1f\x2d\x24\x0f\x24\x01\x31\x23\x2d\x1f\x24\x10\x24\x2e\
-\x1e\x24\x0f\xfe\xc5\x24\x2c\x1f\x24\x10\x24\x2e\x1e\x24\x0f\x00\
-\x02\x00\x1b\xff\x79\x00\xbf\x01\xd4\x00\x1f\x00\x2d\x00\x00\x57\
-\x30\x26\x26\x35\x34\x36\x33\x36\x36\x37\x26\x26\x27\x26\x26\x35\
-\x34\x36\x36\x33\x32\x17\x16\x16\x15\x14\x06\x07\x0e\x02\x13\x22\
-\x26\x35\x34\x36\x36\x33\x32\x16\x15\x14\x06\x06\x32\x0b\x0b\x0f\
-\x04\x01\x1d\x03\x0b\x12\x07\x0c\x04\x0d\x24\x21\x2e\x13\x0c\x04\
-\x01\x01\x04\x28\x3c\x18\x2f\x23\x0e\x24\x20\x31\x20\x07\x23\x87\
-\x03\x10\x12\x17\x0e\x02\x18\x1c\x03\x08\x07\x0b\x22\x10\x1e\x24\
-\x11\x13\x0c\x21\x10\x0d\x10\x06\x30\x50\x2f\x01\xb6\x26\x2a\x20\
-\x25\x10\x25\x2f\x14\x25\x18\xff\xff\x00\x23\xff\xf6\x02\xc0\x00\
-\x99\x04\x27\x00\xd5\x01\x05\x00\x00\x00\x27\x00\xd5\x02\x02\x00\
-\x00\x00\x06\x00\xd5\x08\x00\x00\x02\x00\x28\xff\xf6\x00\xcb\x02\
-\xb5\x00\x11\x00\x1f\x00\x00\x77\x22\x26\x26\x35\x11\x34\x36\x36\
-\x33\x32\x16\x16\x15\x11\x14\x06\x06\x07\x22\x26\x35\x34\x36\x36\
-\x33\x32\x16\x15\x14\x06\x06\x79\x24\x20\x07\x07\x20\x25\x25\x1f\
-\x07\x07\x1f\x26\x31\x20\x08\x22\x28\x32\x1f\x08\x22\xdc\x13\x1f\
-\x12\x01\x4f\x12\x20\x14\x14\x20\x12\xfe\xb0\x11\x20\x12\xe6\x26\
-\x2c\x14\x25\x18\x25\x2d\x14\x25\x18\x00\x02\x00\x28\xff\x2a\x00\
-\xcb\x01\xe9\x00\x11\x00\x1f\x00\x00\x53\x32\x16\x16\x15\x11\x14\
-\x06\x06\x23\x22\x26\x26\x35\x11\x34\x36\x36\x37\x32\x16\x16\x15\
-\x14\x06\x23\x22\x26\x26\x35\x34\x36\x79\x26\x1f\x07\x07\x1f\x25\
-\x25\x20\x07\x07\x20\x24\x28\x22\x08\x1f\x32\x28\x22\x08\x20\x01\
-\x03\x12\x1f\x12\xfe\xb0\x12\x20\x14\x14\x20\x12\x01\x4f\x12\x1f\
-\x13\xe6\x18\x24\x15\x2d\x25\x18\x25\x14\x2d\x25\x00\x00\x02\x00\
-\x13\xff\xf6\x01\xc9\x02\xc3\x00\x30\x00\x3e\x00\x00\x77\x22\x26\
-\x26\x35\x35\x34\x3e\x04\x35\x34\x26\x23\x22\x06\x06\x07\x0e\x02\
-\x27\x2e\x02\x37\x3e\x04\x33\x32\x16\x16\x15\x14\x0e\x03\x07\x37\
-\x15\x14\x06\x06\x07\x22\x26\x35\x34\x36\x36\x33\x32\x16\x15\x14\
-\x06\x06\xf0\x22\x1d\x07\x16\x22\x26\x22\x16\x2a\x2b\x14\x1e\x12\
-\x05\x08\x15\x20\x1a\x1c\x1a\x02\x07\x02\x10\x1d\x30\x44\x2e\x41\
-\x64\x39\x18\x26\x2b\x24\x0b\x07\x08\x1e\x24\x31\x20\x07\x22\x29\
-\x33\x1f\x07\x23\xda\x13\x1e\x11\x24\x1c\x21\x15\x10\x13\x1e\x1a\
-\x26\x25\x0c\x12\x0b\x18\x1c\x05\x0a\x0b\x15\x1e\x18\x08\x21\x27\
-\x25\x18\x38\x5e\x3d\x29\x3e\x2b\x1b\x0f\x03\x0c\x27\x10\x1c\x10\
-\xe4\x26\x2c\x13\x26\x18\x25\x2d\x13\x25\x19\x00\x02\x00\x14\xff\
-\x1f\x01\xcb\x01\xeb\x00\x30\x00\x3e\x00\x00\x53\x32\x16\x16\x15\
-\x15\x14\x0e\x04\x15\x14\x16\x33\x32\x36\x36\x37\x3e\x02\x17\x1e\
-\x02\x07\x0e\x04\x23\x22\x26\x26\x35\x34\x3e\x03\x37\x07\x35\x34\
-\x36\x36\x37\x32\x16\x15\x14\x06\x06\x23\x22\x26\x35\x34\x36\x36\
-\xed\x23\x1d\x06\x16\x22\x26\x22\x16\x2a\x2c\x15\x1d\x12\x04\x09\
-\x14\x21\x1a\x1b\x1a\x03\x08\x02\x0f\x1e\x30\x43\x2e\x41\x65\x39\
-\x18\x27\x2a\x25\x0a\x06\x07\x1f\x23\x32\x1f\x07\x22\x29\x32\x1f\
-\x06\x23\x01\x07\x12\x1e\x12\x24\x1c\x21\x15\x10\x13\x1e\x1a\x25\
-\x26\x0c\x13\x0a\x19\x1c\x04\x09\x0b\x16\x1e\x18\x08\x20\x28\x25\
-\x17\x37\x5f\x3d\x28\x3e\x2b\x1c\x0f\x02\x0b\x26\x11\x1b\x10\xe4\
-\x25\x2d\x13\x25\x19\x26\x2c\x14\x25\x18\x00\x00\x01\x00\x16\x00\
-\xcd\x00\xb9\x01\x71\x00\x0b\x00\x00\x77\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x68\x2e\x24\x23\x2f\x2e\x23\x22\xcd\x25\x2c\
-\x2c\x27\x25\x2d\x2c\x26\x00\x00\x01\x00\x16\x00\xab\x01\x0d\x01\
-\xa2\x00\x0f\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x14\x06\x06\x91\x28\x37\x1c\x1c\x37\x28\x29\x37\x1c\x1c\
-\x37\xab\x1b\x37\x29\x29\x37\x1c\x1c\x37\x29\x29\x36\x1c\x00\x00\
-\x01\x00\x0d\x01\x0c\x01\xc7\x02\xad\x00\x27\x00\x00\x53\x32\x16\
-\x15\x15\x37\x36\x16\x17\x16\x06\x07\x07\x17\x16\x06\x07\x06\x26\
-\x27\x27\x07\x06\x06\x27\x26\x26\x37\x37\x27\x26\x26\x37\x36\x36\
-\x17\x17\x35\x34\x36\xea\x26\x1f\x44\x1c\x21\x0b\x0c\x15\x25\x34\
-\x2b\x0f\x0c\x1d\x1e\x2a\x15\x23\x29\x12\x29\x1e\x1e\x08\x14\x25\
-\x3d\x20\x11\x0c\x0d\x23\x20\x3d\x1f\x02\xad\x1e\x26\x34\x15\x07\
-\x15\x23\x24\x26\x0d\x10\x3d\x18\x25\x15\x17\x07\x1f\x2f\x38\x18\
-\x01\x16\x15\x27\x1c\x34\x12\x07\x26\x26\x26\x15\x0b\x13\x38\x24\
-\x1d\x00\x02\x00\x12\xff\xf7\x02\xc7\x02\xb4\x00\x4b\x00\x4f\x00\
-\x00\x57\x22\x26\x37\x37\x23\x22\x26\x37\x3e\x02\x33\x33\x37\x23\
-\x22\x26\x37\x3e\x02\x33\x33\x37\x3e\x02\x33\x32\x16\x07\x07\x33\
-\x37\x3e\x02\x33\x32\x16\x07\x07\x33\x32\x16\x07\x0e\x02\x23\x23\
-\x07\x33\x32\x16\x07\x0e\x02\x23\x23\x07\x0e\x02\x23\x22\x26\x37\
-\x37\x23\x07\x0e\x02\x13\x33\x37\x23\xae\x1d\x1c\x04\x12\x46\x1e\
-\x15\x06\x05\x13\x1d\x0f\x43\x13\x46\x1e\x15\x06\x04\x14\x1c\x10\
-\x42\x13\x04\x08\x1e\x24\x1f\x1e\x05\x16\x94\x11\x04\x08\x1d\x25\
-\x1f\x1e\x04\x16\x37\x1f\x13\x06\x04\x16\x1a\x0e\x36\x12\x37\x1f\
-\x14\x06\x06\x15\x19\x0f\x35\x0f\x03\x0c\x20\x22\x1c\x1d\x04\x12\
-\x92\x0f\x03\x0c\x20\x51\x94\x12\x91\x09\x16\x17\x74\x1b\x21\x1c\
-\x19\x06\x75\x1a\x21\x1d\x18\x07\x6c\x16\x22\x15\x18\x1a\x87\x6b\
-\x16\x23\x15\x17\x18\x8a\x1c\x20\x1d\x18\x06\x75\x1b\x1f\x1d\x1a\
-\x06\x5a\x13\x20\x14\x16\x17\x74\x59\x14\x20\x14\x01\x18\x75\x00\
-\x01\x00\x06\xff\xc1\x01\xe2\x02\xdb\x00\x0f\x00\x00\x57\x26\x26\
-\x37\x01\x36\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\x39\x26\x0d\
-\x11\x01\x3a\x0d\x19\x22\x18\x1b\x16\x04\x0d\xfe\xc7\x11\x28\x2f\
-\x13\x26\x24\x02\x7f\x19\x15\x02\x0c\x0d\x19\x21\x1a\xfd\x86\x26\
-\x0b\x00\x01\x00\x09\xff\xc5\x01\xe0\x02\xe1\x00\x0e\x00\x00\x45\
-\x06\x06\x26\x27\x01\x26\x36\x37\x36\x16\x17\x01\x16\x06\x01\xaf\
-\x19\x23\x19\x0a\xfe\xc9\x10\x0f\x24\x24\x2b\x11\x01\x33\x11\x0f\
-\x2e\x0c\x01\x17\x17\x02\x83\x21\x28\x11\x11\x0e\x23\xfd\x82\x26\
-\x29\x00\x01\x00\x0c\x00\xbb\x01\x78\x01\x46\x00\x11\x00\x00\x77\
-\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\x06\
-\x23\x4c\x0e\x1e\x14\x15\x1e\x0e\xea\x0f\x1e\x14\x13\x1e\x10\xbb\
-\x07\x1d\x22\x22\x1c\x07\x07\x1d\x21\x22\x1d\x07\x00\x00\x01\x00\
-\x0d\x00\xb8\x02\x05\x01\x46\x00\x11\x00\x00\x77\x22\x26\x26\x35\
-\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x4d\x0f\x1d\
-\x14\x14\x1f\x0f\x01\x74\x0f\x1f\x14\x13\x1f\x11\xb8\x07\x1f\x22\
-\x22\x1d\x07\x07\x1d\x23\x22\x1e\x07\x00\x01\x00\x0d\x00\xb8\x02\
-\x82\x01\x46\x00\x11\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x4d\x0f\x1d\x14\x14\x1f\x0f\
-\x01\xf1\x10\x1e\x14\x13\x1e\x12\xb8\x07\x1f\x22\x22\x1d\x07\x07\
-\x1d\x23\x22\x1e\x07\x00\x01\x00\x12\xff\x3d\x02\xfe\xff\xba\x00\
-\x11\x00\x00\x57\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x4b\x0e\x1a\x11\x11\x1b\x0e\x02\x79\x0e\x1a\
-\x11\x12\x1a\x0e\xc3\x06\x1a\x1e\x1f\x1a\x06\x06\x1a\x20\x1d\x1a\
-\x06\x00\x01\x00\x1f\xff\x55\x01\x57\x03\x05\x00\x25\x00\x00\x45\
-\x22\x2e\x03\x35\x34\x3e\x03\x33\x32\x16\x16\x15\x14\x06\x06\x23\
-\x23\x22\x06\x06\x15\x14\x1e\x02\x33\x32\x16\x16\x15\x14\x06\x06\
-\x01\x1b\x33\x52\x3c\x28\x13\x12\x28\x3c\x52\x35\x10\x1a\x11\x10\
-\x18\x0f\x05\x1a\x36\x26\x13\x20\x2b\x19\x10\x1a\x11\x11\x1c\xab\
-\x37\x5f\x78\x87\x41\x40\x87\x7a\x61\x38\x07\x19\x1c\x1c\x19\x06\
-\x4d\x9c\x78\x4c\x81\x5f\x35\x06\x19\x1d\x1c\x19\x06\x00\x01\x00\
-\x14\xff\x55\x01\x4d\x03\x05\x00\x25\x00\x00\x57\x22\x26\x26\x35\
-\x34\x36\x36\x33\x32\x3e\x02\x35\x34\x26\x26\x23\x23\x22\x26\x26\
-\x35\x34\x36\x36\x33\x32\x1e\x03\x15\x14\x0e\x03\x50\x0f\x1b\x12\
-\x11\x1b\x0f\x19\x2c\x20\x12\x25\x36\x1b\x05\x0e\x19\x10\x11\x1b\
-\x0f\x35\x53\x3c\x27\x13\x14\x27\x3d\x51\xab\x06\x19\x1c\x1d\x19\
-\x06\x35\x5f\x81\x4c\x78\x9c\x4d\x06\x19\x1c\x1c\x19\x07\x38\x61\
-\x7a\x86\x41\x41\x87\x78\x5f\x37\x00\x00\x01\x00\x0c\xff\x57\x01\
-\x52\x03\x03\x00\x42\x00\x00\x45\x22\x2e\x02\x35\x27\x34\x2e\x02\
-\x23\x23\x22\x26\x35\x34\x36\x36\x33\x33\x32\x3e\x02\x35\x37\x34\
-\x3e\x02\x33\x32\x16\x16\x15\x14\x06\x06\x07\x22\x06\x06\x15\x15\
-\x14\x0e\x02\x07\x1e\x03\x15\x07\x14\x16\x16\x33\x32\x16\x16\x15\
-\x14\x06\x06\x01\x11\x22\x37\x27\x15\x01\x0a\x11\x15\x0b\x07\x19\
-\x14\x0f\x15\x08\x05\x0b\x16\x12\x0b\x01\x15\x27\x36\x22\x12\x1e\
-\x12\x12\x1e\x11\x08\x08\x04\x06\x0f\x19\x13\x13\x19\x0f\x06\x01\
-\x04\x09\x07\x11\x1e\x13\x13\x1e\xa9\x17\x2b\x3d\x26\xc1\x0f\x12\
-\x0a\x04\x1f\x21\x1f\x1c\x06\x04\x0a\x13\x0f\xc6\x24\x3b\x2a\x17\
-\x07\x1b\x1e\x1e\x1b\x08\x01\x06\x10\x10\xa6\x20\x2e\x21\x17\x09\
-\x09\x1a\x22\x2d\x1d\xa5\x09\x0c\x05\x06\x1b\x1f\x20\x1b\x06\x00\
-\x01\x00\x0c\xff\x57\x01\x52\x03\x03\x00\x42\x00\x00\x57\x22\x26\
-\x26\x35\x34\x36\x36\x33\x32\x36\x36\x35\x35\x34\x3e\x02\x37\x2e\
-\x03\x35\x35\x34\x26\x26\x23\x2e\x02\x35\x34\x36\x36\x33\x32\x1e\
-\x02\x15\x15\x14\x1e\x02\x33\x33\x32\x16\x16\x15\x14\x06\x23\x23\
-\x22\x0e\x02\x15\x15\x14\x0e\x02\x4d\x0f\x1f\x13\x13\x1f\x10\x08\
-\x09\x03\x06\x0e\x1a\x12\x12\x1a\x0e\x06\x04\x09\x08\x10\x1e\x13\
-\x13\x1e\x11\x22\x37\x27\x15\x0b\x13\x16\x0a\x06\x08\x14\x0f\x14\
-\x18\x08\x0b\x14\x12\x0a\x16\x26\x38\xa9\x06\x1b\x20\x1f\x1b\x06\
-\x05\x0c\x09\xa5\x1d\x2d\x22\x1a\x09\x09\x17\x21\x2e\x20\xa6\x10\
-\x10\x06\x01\x08\x1b\x1e\x1e\x1b\x07\x17\x2a\x3b\x24\xc6\x0f\x13\
-\x0a\x04\x06\x1c\x1f\x21\x1f\x04\x0a\x13\x0f\xc0\x26\x3d\x2b\x17\
-\x00\x00\x01\x00\x21\xff\x57\x01\x36\x03\x03\x00\x1d\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x11\x33\x32\x16\x16\x15\x14\x06\x06\x23\x69\x22\x1f\
-\x07\x07\x1f\x22\x98\x0e\x18\x0f\x10\x19\x0e\x50\x51\x0e\x18\x10\
-\x0f\x19\x0e\xa9\x16\x23\x12\x03\x16\x13\x22\x16\x06\x1b\x21\x1f\
-\x1b\x06\xfd\x58\x06\x1c\x20\x1e\x1c\x06\x00\x00\x01\x00\x10\xff\
-\x57\x01\x25\x03\x03\x00\x1d\x00\x00\x57\x22\x26\x26\x35\x34\x36\
-\x36\x33\x33\x11\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\x16\
-\x16\x15\x11\x14\x06\x06\x23\x46\x0d\x19\x10\x10\x19\x0d\x51\x50\
-\x0d\x1a\x10\x10\x19\x0d\x96\x24\x1e\x07\x07\x1e\x23\xa9\x06\x1c\
-\x1e\x20\x1c\x06\x02\xa8\x06\x1b\x1f\x21\x1b\x06\x16\x22\x13\xfc\
-\xea\x12\x23\x16\x00\xff\xff\x00\x14\xff\x79\x00\xb8\x00\x9b\x04\
-\x06\x00\xd6\xf7\x00\xff\xff\x00\x1b\xff\x79\x01\x76\x00\x9b\x04\
-\x26\x00\xd6\xfd\x00\x00\x07\x00\xd6\x00\xb4\x00\x00\x00\x02\x00\
-\x18\x01\x92\x01\x6f\x02\xb3\x00\x1f\x00\x3f\x00\x00\x41\x30\x16\
-\x16\x15\x14\x06\x07\x22\x06\x07\x16\x16\x17\x16\x16\x15\x14\x06\
-\x06\x23\x22\x27\x26\x26\x35\x34\x36\x37\x3e\x02\x23\x30\x16\x16\
-\x15\x14\x06\x07\x22\x06\x07\x16\x16\x17\x16\x16\x15\x14\x06\x06\
-\x23\x22\x27\x26\x26\x35\x34\x36\x37\x3e\x02\x01\x59\x0b\x0b\x0f\
-\x04\x01\x1c\x04\x0b\x12\x07\x0c\x04\x07\x22\x2a\x2e\x12\x0c\x04\
-\x01\x01\x05\x27\x3d\x91\x0a\x0b\x0f\x03\x02\x1c\x04\x0c\x12\x07\
-\x0b\x05\x08\x22\x29\x2e\x13\x0c\x04\x01\x01\x05\x28\x3c\x02\xb3\
-\x03\x0f\x13\x16\x0e\x02\x18\x1d\x02\x09\x07\x0c\x22\x11\x13\x25\
-\x18\x12\x0c\x23\x11\x09\x10\x08\x30\x50\x2e\x03\x0f\x13\x16\x0e\
-\x02\x18\x1d\x02\x09\x07\x0c\x22\x11\x13\x25\x18\x12\x0c\x23\x11\
-\x09\x10\x08\x30\x50\x2e\x00\xff\xff\x00\x18\x01\x91\x01\x72\x02\
-\xb2\x04\x27\x00\xd6\xff\xfb\x02\x17\x00\x07\x00\xd6\x00\xb1\x02\
-\x17\x00\x01\x00\x12\x01\x92\x00\xb5\x02\xb3\x00\x1f\x00\x00\x53\
-\x30\x16\x16\x15\x14\x06\x07\x22\x06\x07\x16\x16\x17\x16\x16\x15\
-\x14\x06\x06\x23\x22\x27\x26\x26\x35\x34\x36\x37\x3e\x02\x9f\x0b\
-\x0b\x0f\x04\x01\x1c\x04\x0b\x12\x07\x0c\x04\x07\x22\x2a\x2e\x12\
-\x0c\x04\x01\x01\x05\x27\x3d\x02\xb3\x03\x0f\x13\x16\x0e\x02\x18\
-\x1d\x02\x09\x07\x0c\x22\x11\x13\x25\x18\x12\x0c\x23\x11\x09\x10\
-\x08\x30\x50\x2e\x00\xff\xff\x00\x11\x01\x78\x00\xb5\x02\x9a\x04\
-\x07\x00\xd6\xff\xf4\x01\xff\xff\xff\x00\x0f\xff\xf1\x02\x5b\x01\
-\xeb\x04\x26\x00\xf6\xfd\x00\x00\x07\x00\xf6\x01\x06\x00\x00\xff\
-\xff\x00\x09\xff\xf1\x02\x53\x01\xeb\x04\x26\x00\xf7\xfd\x00\x00\
-\x07\x00\xf7\x01\x03\x00\x00\x00\x01\x00\x12\xff\xf1\x01\x55\x01\
-\xeb\x00\x19\x00\x00\x65\x06\x06\x26\x27\x27\x26\x26\x35\x34\x36\
-\x37\x37\x36\x36\x16\x17\x16\x16\x06\x07\x07\x17\x16\x16\x06\x01\
-\x3a\x14\x1f\x1d\x12\xae\x0d\x0b\x0b\x0d\xb0\x11\x1e\x1e\x13\x14\
-\x06\x13\x11\x7d\x7c\x13\x13\x07\x12\x13\x0e\x0d\x10\xae\x0d\x18\
-\x0d\x0d\x18\x0c\xb0\x11\x0b\x0d\x14\x14\x1e\x1c\x12\x7c\x7b\x13\
-\x1d\x1d\x00\x00\x01\x00\x0d\xff\xf1\x01\x50\x01\xeb\x00\x19\x00\
-\x00\x77\x26\x26\x36\x37\x37\x27\x26\x26\x36\x37\x36\x36\x16\x17\
-\x17\x16\x16\x15\x14\x06\x07\x07\x06\x06\x26\x28\x14\x07\x13\x13\
-\x7b\x7c\x11\x14\x07\x14\x13\x1e\x1d\x12\xb0\x0c\x0c\x0c\x0c\xaf\
-\x10\x1e\x1f\x12\x14\x1d\x1d\x13\x7b\x7c\x12\x1c\x1e\x14\x14\x0d\
-\x0b\x11\xb0\x0c\x18\x0d\x0d\x18\x0d\xae\x10\x0d\x0e\x00\x02\x00\
-\x1b\x01\x7a\x01\x5f\x02\xb0\x00\x13\x00\x27\x00\x00\x41\x22\x2e\
-\x03\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x23\x22\x2e\
-\x03\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x01\x17\x0e\
-\x17\x11\x0b\x05\x06\x1e\x24\x23\x1d\x06\x05\x0c\x11\x17\xc5\x0f\
-\x17\x10\x0b\x05\x06\x1d\x24\x23\x1d\x06\x05\x0c\x11\x17\x01\x7a\
-\x20\x34\x3d\x3a\x16\x14\x27\x1a\x1a\x27\x14\x16\x3a\x3d\x34\x20\
-\x20\x34\x3d\x3a\x16\x14\x27\x1a\x1a\x27\x14\x16\x3a\x3d\x34\x20\
-\x00\x00\x01\x00\x18\x01\x7a\x00\xa5\x02\xb0\x00\x13\x00\x00\x53\
-\x22\x2e\x03\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x0e\x03\x5e\
-\x0e\x17\x10\x0c\x05\x06\x1d\x24\x23\x1d\x06\x05\x0b\x11\x17\x01\
-\x7a\x20\x34\x3d\x3a\x16\x14\x27\x1a\x1a\x27\x14\x16\x3a\x3d\x34\
-\x20\x00\x01\xff\xfa\xff\x2a\x01\xd3\x02\xbb\x00\x45\x00\x00\x57\
-\x22\x26\x26\x35\x34\x36\x37\x36\x36\x33\x32\x36\x36\x37\x13\x23\
-\x22\x26\x26\x35\x34\x34\x37\x3e\x02\x33\x17\x37\x3e\x03\x33\x32\
-\x16\x16\x15\x14\x14\x07\x0e\x02\x23\x22\x0e\x02\x07\x07\x37\x32\
-\x16\x16\x15\x14\x14\x15\x0e\x02\x23\x27\x03\x0e\x03\x41\x13\x21\
-\x13\x01\x01\x02\x25\x2d\x0d\x15\x0d\x01\x26\x1f\x10\x1e\x14\x01\
-\x04\x18\x24\x14\x1a\x09\x03\x1f\x35\x4c\x31\x11\x1e\x13\x01\x03\
-\x18\x22\x14\x0b\x12\x0c\x07\x01\x06\x48\x10\x1f\x12\x04\x18\x24\
-\x13\x44\x28\x09\x23\x34\x46\xd6\x06\x15\x18\x06\x0c\x05\x24\x22\
-\x09\x11\x0a\x01\x5f\x07\x18\x1a\x06\x09\x04\x24\x1f\x07\x03\x3a\
-\x20\x3d\x35\x1f\x05\x17\x1c\x05\x09\x06\x22\x1f\x07\x04\x08\x0b\
-\x08\x3b\x06\x06\x17\x1b\x05\x0a\x06\x22\x20\x07\x03\xfe\xa0\x31\
-\x45\x2b\x15\x00\x02\x00\x16\xff\x7a\x03\x32\x02\x6c\x00\x52\x00\
-\x67\x00\x00\x45\x22\x26\x26\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x23\x22\x26\x37\x36\x36\x35\x0e\x02\x23\x22\x2e\x02\
-\x35\x34\x34\x37\x3e\x03\x33\x32\x16\x16\x17\x27\x36\x36\x33\x32\
-\x16\x07\x03\x06\x16\x33\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x06\
-\x06\x15\x14\x16\x16\x33\x32\x16\x16\x15\x14\x06\x06\x03\x32\x3e\
-\x02\x37\x35\x34\x2e\x02\x23\x22\x0e\x02\x07\x15\x14\x16\x16\x01\
-\x7b\x6e\xa0\x57\x38\x68\x8d\x55\x5f\x98\x6a\x39\x2a\x46\x55\x2a\
-\x40\x4f\x01\x01\x01\x08\x17\x1f\x15\x1d\x34\x29\x16\x01\x04\x22\
-\x33\x3e\x20\x18\x26\x1c\x06\x10\x02\x1e\x1f\x1b\x1d\x03\x28\x01\
-\x0d\x13\x11\x29\x27\x18\x26\x4a\x6c\x45\x54\x7d\x45\x38\x6c\x4e\
-\x18\x18\x0a\x12\x1a\x08\x0d\x17\x13\x0d\x02\x08\x0f\x15\x0b\x0d\
-\x19\x13\x0c\x02\x0f\x19\x86\x5d\xaa\x73\x52\x8a\x65\x37\x35\x63\
-\x8c\x57\x48\x6c\x49\x25\x49\x3d\x06\x0c\x04\x07\x0e\x08\x19\x2c\
-\x3a\x22\x06\x0b\x05\x25\x41\x32\x1c\x0e\x18\x0e\x05\x1b\x15\x14\
-\x16\xfe\xc8\x0c\x0b\x12\x2a\x47\x36\x3c\x5e\x42\x24\x40\x72\x4e\
-\x56\x78\x3e\x09\x19\x18\x1b\x18\x07\x01\x49\x0a\x11\x17\x0e\x06\
-\x0e\x15\x10\x08\x0a\x11\x18\x0e\x07\x10\x1b\x0e\x00\x00\x03\x00\
-\x14\xff\xf1\x02\xa4\x02\xce\x00\x3b\x00\x4c\x00\x5c\x00\x00\x45\
-\x22\x26\x26\x35\x34\x36\x36\x37\x2e\x02\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x14\x0e\x02\x07\x1e\x02\x17\x36\x36\x37\x36\x36\x33\
-\x32\x16\x16\x07\x06\x06\x07\x1e\x02\x33\x32\x16\x15\x14\x06\x23\
-\x22\x26\x26\x27\x0e\x02\x27\x32\x36\x37\x2e\x03\x27\x0e\x03\x15\
-\x14\x16\x16\x13\x3e\x03\x35\x34\x26\x23\x22\x06\x06\x15\x14\x16\
-\x16\x01\x01\x4c\x6a\x37\x1a\x32\x25\x0c\x13\x09\x31\x5d\x43\x39\
-\x52\x2d\x1b\x30\x3c\x21\x14\x29\x2c\x15\x15\x14\x04\x05\x26\x24\
-\x1f\x1b\x08\x01\x02\x22\x1d\x06\x0b\x0d\x09\x23\x22\x1e\x28\x1b\
-\x38\x37\x1b\x1d\x3d\x3e\x1b\x0f\x1c\x0a\x0c\x1c\x1c\x1c\x0d\x09\
-\x0c\x08\x04\x15\x28\x12\x18\x24\x18\x0c\x1b\x17\x16\x1e\x0f\x05\
-\x09\x0f\x2d\x5a\x42\x23\x41\x40\x1f\x1b\x35\x33\x18\x3b\x51\x2a\
-\x28\x4a\x34\x1f\x37\x33\x30\x17\x1b\x31\x2a\x10\x16\x29\x16\x14\
-\x15\x11\x17\x0a\x23\x46\x23\x02\x02\x01\x23\x23\x2c\x20\x08\x13\
-\x0e\x10\x17\x0c\x85\x06\x04\x0c\x1d\x20\x22\x12\x0a\x11\x0f\x10\
-\x08\x16\x1f\x10\x01\x57\x11\x1b\x16\x13\x08\x15\x18\x0c\x18\x12\
-\x0c\x19\x1e\x00\x01\x00\x17\xff\x18\x01\xf1\x02\x4a\x00\x22\x00\
-\x00\x45\x22\x26\x26\x35\x11\x2e\x02\x35\x34\x3e\x02\x33\x33\x32\
-\x16\x16\x15\x11\x14\x06\x06\x23\x22\x26\x26\x35\x11\x23\x11\x14\
-\x06\x06\x01\x03\x1e\x1a\x06\x47\x4c\x1b\x0b\x23\x43\x37\xf5\x1e\
-\x1a\x05\x05\x1a\x1f\x1d\x1b\x06\x34\x06\x1a\xe8\x17\x25\x15\x01\
-\x95\x01\x28\x4a\x33\x29\x3e\x2a\x15\x17\x24\x15\xfd\x6d\x14\x24\
-\x17\x17\x25\x15\x02\x7e\xfd\x80\x14\x24\x17\x00\x02\x00\x16\xff\
-\x23\x01\xfb\x02\xd0\x00\x4b\x00\x5d\x00\x00\x45\x22\x2e\x02\x27\
-\x26\x36\x37\x36\x16\x17\x1e\x02\x33\x32\x36\x36\x35\x34\x2e\x02\
-\x27\x2e\x02\x35\x34\x36\x36\x37\x26\x26\x35\x34\x36\x36\x33\x32\
-\x16\x16\x17\x16\x16\x07\x06\x06\x27\x2e\x02\x23\x22\x06\x06\x15\
-\x14\x1e\x05\x15\x14\x06\x07\x16\x16\x15\x14\x0e\x02\x11\x3e\x02\
-\x35\x34\x2e\x02\x27\x06\x06\x15\x14\x1e\x03\x01\x09\x2f\x4b\x37\
-\x23\x07\x18\x05\x20\x20\x2e\x1a\x12\x20\x21\x11\x20\x2b\x16\x20\
-\x36\x41\x21\x24\x40\x27\x0e\x1c\x13\x1c\x21\x39\x63\x40\x2a\x41\
-\x37\x19\x1a\x03\x17\x18\x2f\x1e\x0a\x17\x22\x1a\x14\x22\x13\x23\
-\x3a\x45\x45\x3a\x23\x1e\x1b\x1a\x1f\x2c\x48\x55\x11\x18\x0d\x10\
-\x1e\x2a\x1a\x1d\x22\x0c\x17\x20\x24\xdd\x19\x24\x23\x0a\x20\x2c\
-\x1d\x1c\x13\x1a\x13\x19\x0c\x10\x21\x19\x14\x1a\x10\x11\x0c\x0d\
-\x2b\x47\x37\x1a\x30\x28\x10\x17\x42\x2c\x39\x56\x32\x10\x1d\x14\
-\x18\x23\x1f\x22\x09\x15\x09\x12\x0b\x0d\x18\x12\x18\x1b\x11\x0f\
-\x19\x29\x43\x35\x2a\x43\x1a\x16\x40\x2a\x3a\x51\x33\x19\x01\x97\
-\x05\x11\x1c\x12\x0e\x14\x10\x0e\x06\x05\x1f\x19\x0e\x15\x0f\x0c\
-\x09\x00\x03\x00\x18\x00\x5b\x02\x7a\x02\xbc\x00\x13\x00\x3f\x00\
-\x53\x00\x00\x65\x22\x2e\x02\x35\x34\x3e\x02\x33\x32\x1e\x02\x15\
-\x14\x0e\x02\x27\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x17\
-\x16\x06\x07\x06\x06\x26\x27\x26\x26\x23\x22\x06\x06\x15\x14\x16\
-\x16\x33\x32\x36\x36\x33\x36\x16\x17\x16\x06\x07\x0e\x02\x07\x32\
-\x3e\x02\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\x02\x01\x4a\
-\x4d\x73\x4c\x26\x26\x4c\x72\x4d\x4e\x73\x4b\x25\x26\x4b\x73\x42\
-\x37\x57\x32\x32\x55\x32\x28\x36\x1e\x02\x06\x0c\x0d\x08\x11\x10\
-\x07\x01\x1f\x16\x1b\x28\x18\x18\x28\x18\x15\x16\x12\x0c\x0e\x0d\
-\x0d\x12\x05\x14\x0d\x20\x24\x1f\x3c\x54\x33\x18\x19\x35\x53\x3a\
-\x3b\x54\x33\x18\x19\x35\x53\x5b\x23\x4b\x72\x4e\x50\x73\x4c\x24\
-\x25\x4a\x74\x4f\x4f\x73\x4a\x23\x74\x32\x57\x38\x32\x52\x32\x18\
-\x1b\x06\x0f\x1f\x0c\x07\x04\x04\x04\x01\x13\x17\x28\x1b\x1a\x27\
-\x18\x0d\x0c\x02\x03\x10\x18\x24\x0e\x09\x0f\x08\x1f\x18\x34\x54\
-\x3b\x3d\x54\x33\x17\x17\x35\x54\x3d\x3d\x53\x32\x17\x00\x04\x00\
-\x18\x00\x5b\x02\x7a\x02\xbc\x00\x13\x00\x27\x00\x47\x00\x50\x00\
-\x00\x41\x32\x1e\x02\x15\x14\x0e\x02\x23\x22\x2e\x02\x35\x34\x3e\
-\x02\x13\x32\x3e\x02\x35\x34\x2e\x02\x23\x22\x0e\x02\x15\x14\x1e\
-\x02\x37\x17\x16\x06\x06\x07\x06\x26\x27\x27\x23\x15\x14\x06\x06\
-\x23\x22\x26\x26\x35\x11\x34\x36\x36\x33\x33\x32\x16\x16\x15\x14\
-\x06\x27\x15\x33\x32\x36\x35\x34\x26\x23\x01\x49\x4e\x73\x4b\x25\
-\x26\x4b\x73\x4c\x4d\x73\x4c\x26\x26\x4c\x72\x4d\x3a\x53\x35\x19\
-\x19\x35\x53\x3a\x3b\x54\x33\x18\x19\x35\x53\xa9\x2a\x05\x0f\x1d\
-\x10\x0c\x13\x06\x27\x36\x05\x14\x17\x17\x14\x05\x0b\x19\x13\x56\
-\x29\x3d\x23\x13\xa3\x33\x0f\x14\x15\x13\x02\xbc\x25\x4a\x74\x4f\
-\x4f\x73\x4a\x23\x23\x4b\x72\x4e\x50\x73\x4c\x24\xfd\xf4\x19\x35\
-\x53\x3a\x3d\x54\x33\x17\x17\x35\x54\x3d\x3d\x53\x32\x17\xb6\x62\
-\x0b\x15\x0e\x01\x01\x0e\x0c\x50\x38\x0b\x15\x0f\x10\x16\x09\x01\
-\x19\x10\x12\x08\x22\x3d\x28\x19\x31\x71\x4a\x14\x0f\x13\x14\x00\
-\x02\x00\x0f\x00\xd3\x02\xf9\x02\x59\x00\x1a\x00\x46\x00\x00\x77\
-\x22\x26\x26\x35\x35\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\
-\x16\x16\x15\x14\x23\x23\x15\x14\x06\x06\x33\x22\x26\x26\x35\x13\
-\x34\x36\x36\x33\x32\x16\x17\x17\x37\x36\x36\x33\x32\x16\x16\x15\
-\x11\x14\x06\x06\x23\x22\x26\x26\x35\x35\x07\x06\x06\x23\x22\x26\
-\x27\x27\x15\x14\x06\x06\xbd\x1a\x18\x07\x45\x0a\x16\x10\x0f\x15\
-\x0a\xff\x0c\x15\x0e\x2f\x45\x06\x19\xda\x1a\x17\x06\x01\x06\x1a\
-\x1b\x16\x16\x03\x55\x52\x03\x18\x15\x1d\x19\x06\x06\x17\x19\x1b\
-\x1a\x07\x2f\x06\x10\x08\x07\x0f\x08\x2e\x06\x19\xd3\x11\x18\x0c\
-\xe1\x06\x17\x1a\x1b\x18\x05\x05\x18\x1b\x37\xe2\x0c\x18\x10\x10\
-\x18\x0c\x01\x1a\x09\x1a\x15\x11\x04\x7b\x78\x05\x12\x14\x1e\x0d\
-\xfe\xee\x0d\x17\x10\x0f\x17\x0d\x70\x3b\x05\x06\x06\x06\x3a\x6e\
-\x0d\x18\x10\x00\x02\x00\x0f\x01\x7c\x01\x5c\x02\xcb\x00\x0f\x00\
-\x1b\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\
-\x14\x06\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xb6\
-\x2d\x4c\x2e\x2e\x4b\x2d\x2e\x4b\x2e\x2d\x4c\x2e\x18\x23\x22\x19\
-\x19\x22\x23\x01\x7c\x2d\x4c\x2d\x2f\x4d\x2d\x2d\x4c\x2f\x2e\x4c\
-\x2d\x6c\x22\x1a\x1b\x20\x22\x1a\x1a\x21\x00\x00\x01\x00\x2a\xff\
-\x25\x00\xa6\x02\xce\x00\x11\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x67\x1d\x1a\x06\x06\
-\x1a\x1e\x1f\x19\x06\x06\x1a\xdb\x15\x23\x13\x03\x14\x13\x22\x15\
-\x16\x22\x13\xfc\xec\x13\x22\x15\x00\x00\x02\x00\x2a\xff\x2b\x00\
-\xa4\x02\xce\x00\x11\x00\x23\x00\x00\x53\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x03\x22\x26\x26\x35\
-\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x67\x1d\x1a\
-\x06\x06\x1a\x1d\x1e\x1a\x05\x05\x1a\x1e\x1d\x1a\x06\x06\x1a\x1e\
-\x1e\x19\x05\x05\x1a\x01\x22\x15\x1c\x0a\x01\x28\x13\x21\x15\x15\
-\x22\x14\xfe\xda\x0a\x1c\x15\xfe\x09\x15\x22\x14\x01\x26\x0a\x1c\
-\x16\x16\x1c\x0b\xfe\xda\x14\x22\x14\x00\x02\x00\x12\xff\x43\x01\
-\xda\x02\xbc\x00\x11\x00\x25\x00\x00\x57\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\x06\x03\x22\x26\x26\x35\
-\x34\x36\x36\x33\x17\x37\x32\x16\x16\x15\x14\x06\x06\x23\x27\xf4\
-\x24\x20\x07\x07\x20\x25\x24\x1f\x06\x07\x1f\xc2\x10\x20\x14\x16\
-\x20\x0f\x9d\xa1\x10\x20\x15\x14\x20\x12\xa0\xbd\x15\x22\x14\x02\
-\xe6\x13\x21\x14\x16\x22\x13\xfd\x1c\x14\x22\x14\x02\x13\x07\x1e\
-\x22\x21\x1d\x07\x06\x06\x07\x1d\x22\x22\x1d\x07\x06\x00\x03\x00\
-\x12\xff\x43\x01\xda\x02\xbc\x00\x11\x00\x25\x00\x39\x00\x00\x57\
-\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\
-\x06\x27\x22\x26\x26\x35\x34\x36\x36\x17\x17\x37\x36\x16\x16\x15\
-\x14\x06\x06\x27\x27\x03\x22\x26\x26\x35\x34\x36\x36\x33\x17\x37\
-\x32\x16\x16\x15\x14\x06\x06\x23\x27\xf4\x24\x20\x07\x07\x20\x25\
-\x24\x1f\x06\x07\x1f\xc2\x10\x20\x14\x16\x20\x0f\x9d\xa1\x10\x20\
-\x15\x14\x20\x12\xa0\x9e\x10\x20\x14\x16\x20\x0f\x9d\xa1\x10\x20\
-\x15\x14\x20\x12\xa0\xbd\x15\x22\x14\x02\xe6\x13\x21\x14\x16\x22\
-\x13\xfd\x1c\x14\x22\x14\xf0\x06\x1e\x22\x22\x1d\x07\x01\x06\x06\
-\x01\x07\x1d\x23\x21\x1f\x06\x01\x05\x01\x1e\x07\x1e\x22\x21\x1d\
-\x07\x06\x06\x07\x1d\x22\x22\x1d\x07\x06\x00\x00\x03\x00\x12\xff\
-\xf8\x02\x27\x02\xd0\x00\x33\x00\x45\x00\x57\x00\x00\x45\x22\x2e\
-\x03\x27\x26\x26\x36\x37\x3e\x04\x33\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x22\x0e\x03\x07\x06\x06\x16\x17\x1e\x04\x33\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x25\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x25\x22\x26\x26\x35\x34\x36\
-\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x01\x6d\x2b\x4a\x3e\
-\x2d\x1f\x07\x03\x02\x02\x01\x08\x26\x36\x40\x44\x20\x72\x13\x21\
-\x14\x16\x22\x14\x6e\x0f\x1c\x1b\x17\x0f\x03\x05\x03\x03\x04\x04\
-\x10\x14\x1a\x1d\x11\x6f\x14\x22\x15\x14\x20\x12\xfe\x64\x0e\x17\
-\x0e\x0f\x18\x0a\x01\x7e\x0b\x18\x0f\x0e\x18\x0d\xfe\x85\x0e\x17\
-\x0e\x0f\x18\x0a\x01\x7e\x0b\x18\x0f\x0e\x18\x0d\x08\x16\x2b\x3d\
-\x50\x2f\x25\x4b\x4a\x22\x3a\x56\x3b\x24\x10\x07\x1f\x25\x24\x20\
-\x06\x06\x0d\x17\x24\x1a\x22\x4a\x49\x22\x19\x27\x19\x10\x06\x07\
-\x20\x25\x22\x20\x07\xee\x05\x16\x19\x19\x14\x05\x06\x15\x19\x17\
-\x16\x05\x9a\x05\x16\x19\x19\x15\x05\x05\x16\x1a\x17\x16\x05\x00\
-\x01\x00\x10\xff\xaf\x01\x8a\x02\x6c\x00\x44\x00\x00\x57\x22\x26\
-\x26\x35\x35\x2e\x02\x35\x34\x36\x36\x37\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x15\x1e\x02\x17\x16\x16\x07\x06\x06\x07\x06\x27\x2e\
-\x02\x23\x22\x06\x06\x15\x14\x16\x16\x33\x32\x36\x36\x37\x36\x16\
-\x17\x16\x16\x17\x16\x06\x07\x0e\x02\x07\x15\x14\x06\x06\xe5\x1a\
-\x17\x05\x31\x47\x27\x27\x47\x31\x05\x17\x1a\x1b\x16\x05\x11\x1c\
-\x17\x06\x0e\x16\x01\x02\x0a\x09\x19\x19\x10\x1a\x1b\x14\x19\x26\
-\x15\x15\x25\x19\x12\x1c\x1b\x0e\x0d\x1a\x0f\x09\x0a\x02\x01\x12\
-\x13\x0b\x18\x19\x0e\x05\x16\x51\x13\x1e\x11\x48\x0b\x3a\x57\x34\
-\x36\x54\x3a\x09\x54\x11\x1f\x12\x13\x1f\x11\x52\x03\x0b\x0d\x06\
-\x0a\x18\x12\x0a\x14\x0a\x23\x04\x05\x10\x0e\x17\x27\x18\x18\x27\
-\x17\x0c\x0f\x04\x02\x0d\x11\x09\x14\x0a\x0e\x1c\x0d\x09\x0e\x07\
-\x02\x47\x11\x1e\x12\x00\x02\x00\x14\xff\xf3\x02\x6b\x02\xd6\x00\
-\x52\x00\x62\x00\x00\x77\x26\x26\x37\x3e\x02\x37\x2e\x02\x35\x34\
-\x36\x37\x26\x26\x27\x26\x36\x37\x36\x16\x17\x16\x16\x17\x1e\x02\
-\x33\x33\x32\x36\x36\x37\x36\x36\x37\x36\x36\x17\x16\x16\x07\x06\
-\x06\x07\x16\x16\x15\x14\x06\x06\x07\x1e\x02\x17\x16\x06\x07\x06\
-\x26\x27\x26\x26\x27\x2e\x02\x23\x23\x22\x0e\x02\x07\x06\x06\x07\
-\x06\x06\x37\x32\x36\x36\x35\x34\x26\x26\x23\x22\x06\x06\x15\x14\
-\x16\x16\x3b\x1e\x09\x0f\x08\x16\x1d\x10\x0e\x20\x16\x24\x21\x16\
-\x29\x0b\x0e\x08\x1b\x1f\x24\x10\x05\x0a\x04\x07\x30\x44\x22\x0d\
-\x25\x41\x2b\x07\x04\x09\x04\x12\x23\x1e\x1f\x05\x0e\x0c\x25\x1d\
-\x23\x24\x10\x1d\x15\x0e\x1c\x18\x06\x10\x08\x1e\x1e\x22\x11\x05\
-\x09\x05\x04\x2a\x44\x2c\x13\x21\x30\x23\x17\x05\x07\x08\x04\x12\
-\x20\xe0\x33\x42\x21\x20\x40\x31\x30\x40\x20\x20\x3f\x06\x10\x27\
-\x19\x11\x1f\x1b\x08\x0d\x32\x49\x2f\x3a\x64\x24\x0c\x2b\x17\x1b\
-\x26\x12\x13\x0e\x1c\x07\x0e\x08\x0a\x0e\x06\x06\x0e\x0b\x07\x0e\
-\x06\x1d\x09\x0f\x12\x25\x1c\x17\x2a\x0e\x21\x63\x3a\x24\x44\x3b\
-\x16\x08\x1c\x1f\x0c\x1d\x23\x13\x14\x0d\x1d\x08\x0f\x06\x0a\x0d\
-\x07\x04\x07\x0b\x07\x0a\x0f\x07\x1e\x08\xdf\x1f\x40\x30\x31\x3f\
-\x20\x20\x3f\x30\x2e\x41\x21\x00\x01\x00\x13\xff\xaf\x01\xa7\x02\
-\xd7\x00\x54\x00\x00\x65\x14\x0e\x02\x07\x15\x14\x06\x06\x23\x22\
-\x26\x26\x35\x35\x2e\x02\x27\x26\x36\x37\x36\x36\x16\x17\x16\x16\
-\x33\x32\x36\x36\x35\x34\x26\x26\x27\x2e\x03\x35\x34\x3e\x02\x37\
-\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x16\x16\x17\x16\x16\x07\
-\x06\x06\x26\x27\x2e\x02\x23\x22\x0e\x02\x15\x14\x16\x16\x17\x1e\
-\x03\x01\xa7\x15\x27\x36\x22\x06\x18\x1a\x1a\x18\x05\x1a\x2f\x27\
-\x0e\x13\x03\x1b\x12\x20\x1e\x0c\x10\x25\x17\x1a\x23\x11\x2e\x47\
-\x24\x16\x28\x1f\x12\x12\x23\x31\x1f\x05\x18\x1a\x1a\x18\x06\x1c\
-\x2b\x15\x18\x04\x14\x0d\x1c\x1d\x11\x08\x14\x1a\x14\x0d\x14\x0f\
-\x09\x20\x35\x1e\x1b\x35\x2c\x1b\xda\x23\x3a\x2c\x1d\x07\x3d\x11\
-\x1e\x12\x13\x1e\x11\x3d\x05\x16\x20\x13\x1b\x26\x19\x0f\x03\x12\
-\x10\x15\x14\x0d\x1b\x13\x17\x16\x13\x0f\x0a\x19\x24\x32\x22\x20\
-\x35\x28\x1b\x06\x36\x11\x1d\x13\x13\x1e\x11\x34\x04\x18\x12\x15\
-\x1f\x1c\x14\x10\x06\x0c\x07\x0e\x09\x07\x0c\x11\x0a\x15\x16\x0e\
-\x08\x07\x15\x24\x3a\x00\x02\x00\x3d\xff\xee\x03\x70\x02\x49\x00\
-\x25\x00\x48\x00\x00\x45\x22\x26\x26\x35\x35\x34\x36\x36\x33\x32\
-\x16\x16\x15\x15\x14\x1e\x02\x33\x32\x36\x36\x35\x35\x34\x36\x36\
-\x33\x32\x16\x16\x15\x15\x14\x0e\x02\x25\x22\x26\x26\x35\x11\x34\
-\x36\x36\x33\x37\x32\x1e\x02\x15\x15\x14\x06\x06\x23\x22\x26\x26\
-\x35\x35\x34\x26\x26\x23\x23\x11\x14\x06\x06\x02\x39\x61\x87\x46\
-\x07\x1f\x25\x25\x1f\x07\x0d\x21\x3c\x2e\x36\x47\x23\x08\x20\x24\
-\x25\x1f\x07\x24\x4c\x76\xfd\xff\x25\x20\x07\x07\x20\x25\xd0\x4b\
-\x70\x4b\x25\x07\x1f\x23\x25\x20\x07\x1a\x36\x2d\x9c\x09\x1f\x12\
-\x43\x81\x5c\x1a\x13\x23\x16\x16\x23\x14\x12\x23\x36\x24\x12\x28\
-\x51\x3c\xc7\x12\x20\x15\x17\x23\x14\xc5\x3d\x76\x5d\x38\x09\x16\
-\x23\x13\x01\xb9\x13\x23\x16\x01\x19\x3d\x6c\x54\x14\x14\x27\x1a\
-\x18\x24\x12\x18\x34\x37\x15\xfe\x94\x14\x23\x16\x00\x00\x01\x00\
-\x0c\xff\xf7\x02\x72\x02\xb6\x00\x4b\x00\x00\x57\x22\x26\x35\x34\
-\x3e\x02\x35\x34\x26\x27\x23\x22\x26\x26\x35\x34\x36\x36\x33\x33\
-\x35\x34\x36\x37\x3e\x02\x33\x32\x1e\x02\x17\x16\x16\x07\x06\x22\
-\x27\x2e\x02\x23\x22\x06\x06\x15\x15\x33\x32\x16\x16\x15\x14\x06\
-\x06\x23\x23\x16\x16\x15\x14\x06\x06\x07\x21\x32\x16\x16\x15\x14\
-\x06\x06\x23\x90\x21\x26\x12\x19\x13\x05\x05\x38\x0f\x1a\x10\x12\
-\x1c\x0f\x1a\x0e\x0e\x15\x48\x61\x39\x2f\x49\x36\x20\x04\x17\x02\
-\x1a\x1b\x37\x14\x05\x18\x2b\x21\x2a\x3b\x1f\x6b\x0f\x1a\x11\x11\
-\x1a\x0f\x4e\x04\x02\x05\x08\x06\x01\x25\x13\x21\x15\x16\x21\x13\
-\x09\x27\x21\x1a\x1f\x1c\x28\x21\x04\x21\x0e\x07\x1a\x1c\x1e\x1a\
-\x06\x24\x25\x3a\x1e\x2a\x3e\x22\x15\x1d\x1b\x06\x1b\x33\x19\x18\
-\x18\x07\x14\x0f\x1d\x36\x26\x22\x06\x1a\x1e\x1d\x19\x07\x0e\x21\
-\x07\x0d\x1d\x1d\x0c\x07\x1f\x23\x23\x1e\x06\x00\x03\x00\x0e\xff\
-\xf5\x02\x7a\x02\xc1\x00\x19\x00\x2b\x00\x3b\x00\x00\x41\x16\x16\
-\x07\x03\x15\x14\x06\x06\x23\x22\x26\x26\x35\x35\x03\x26\x36\x37\
-\x36\x16\x17\x17\x37\x36\x36\x01\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x25\x22\x26\x26\x35\x34\x36\
-\x33\x21\x32\x16\x15\x14\x06\x06\x23\x02\x4f\x24\x07\x15\xd3\x08\
-\x20\x25\x25\x20\x07\xd4\x17\x0b\x23\x27\x2e\x15\x9f\x9f\x18\x2c\
-\xfe\x85\x0f\x1c\x14\x15\x1e\x0f\x01\x22\x0f\x1e\x14\x13\x1d\x0f\
-\xfe\xd9\x0f\x1c\x14\x20\x1f\x01\x28\x20\x1e\x13\x1d\x0f\x02\xa7\
-\x19\x2d\x20\xfe\xc3\xc3\x13\x23\x16\x16\x24\x14\xc1\x01\x3d\x20\
-\x2e\x18\x1a\x0c\x22\xfd\xfd\x24\x08\xfd\x9a\x05\x16\x19\x19\x15\
-\x05\x05\x15\x1a\x18\x16\x05\x94\x05\x17\x18\x1f\x15\x16\x1f\x18\
-\x16\x05\x00\x00\x02\x00\x16\x00\x18\x01\xe4\x01\xe6\x00\x11\x00\
-\x23\x00\x00\x77\x22\x26\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\
-\x15\x11\x14\x06\x06\x27\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\
-\x16\x16\x15\x14\x06\x06\x23\xfd\x21\x1d\x07\x07\x1d\x22\x21\x1d\
-\x07\x07\x1d\xc8\x10\x1e\x13\x14\x20\x12\x01\x43\x12\x20\x13\x13\
-\x1d\x11\x18\x14\x20\x12\x01\x44\x12\x1e\x14\x14\x20\x11\xfe\xbc\
-\x11\x20\x14\xa2\x06\x1e\x21\x23\x1c\x07\x07\x1d\x23\x21\x1d\x06\
-\x00\x00\x01\x00\x16\x00\xb8\x02\x0e\x01\x46\x00\x11\x00\x00\x77\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x58\x0f\x1e\x15\x15\x1f\x0e\x01\x74\x10\x1e\x14\x14\x1e\x11\
-\xb8\x07\x1e\x23\x22\x1d\x07\x07\x1d\x23\x23\x1d\x07\x00\x01\x00\
-\x13\x00\x1e\x01\xc8\x01\xd1\x00\x27\x00\x00\x65\x17\x16\x16\x06\
-\x07\x06\x06\x26\x27\x27\x07\x06\x06\x26\x27\x26\x26\x36\x37\x37\
-\x27\x26\x26\x36\x37\x36\x36\x16\x17\x17\x37\x36\x36\x16\x17\x16\
-\x16\x06\x07\x01\x50\x58\x13\x0d\x0c\x12\x13\x1f\x1f\x12\x59\x59\
-\x12\x20\x1f\x12\x13\x0c\x0e\x12\x58\x5a\x12\x0c\x0c\x13\x13\x1f\
-\x1f\x12\x59\x59\x11\x1f\x20\x13\x12\x0c\x0c\x12\xf8\x58\x12\x1f\
-\x1f\x12\x13\x0d\x0d\x12\x59\x58\x13\x0d\x0d\x12\x13\x1f\x1f\x12\
-\x58\x5a\x12\x1e\x1f\x13\x12\x0b\x0c\x11\x59\x59\x12\x0b\x0c\x11\
-\x13\x1f\x1e\x12\x00\x00\x03\x00\x16\x00\x08\x01\xbd\x02\x05\x00\
-\x11\x00\x1d\x00\x29\x00\x00\x77\x22\x26\x26\x35\x34\x36\x36\x33\
-\x21\x32\x16\x16\x15\x14\x06\x06\x23\x07\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x03\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\x55\x0e\x1e\x13\x15\x1e\x0e\x01\x25\x0f\x1e\x14\x13\x1e\x11\
-\x93\x29\x21\x21\x2a\x28\x20\x20\x29\x29\x21\x21\x2a\x28\x20\x20\
-\xc6\x07\x1b\x1f\x20\x1a\x06\x06\x1b\x1f\x1f\x1b\x07\xbe\x20\x28\
-\x2a\x21\x21\x29\x29\x20\x01\x6a\x20\x28\x2b\x20\x20\x2a\x29\x20\
-\x00\x00\x02\x00\x16\x00\x5c\x01\xae\x01\xa7\x00\x11\x00\x23\x00\
-\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\
-\x06\x06\x23\x05\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\
-\x15\x14\x06\x06\x23\x54\x0d\x1d\x13\x13\x1d\x0d\x01\x1c\x0e\x1d\
-\x13\x13\x1d\x10\xfe\xe6\x0e\x1d\x13\x14\x1d\x0d\x01\x1c\x0e\x1c\
-\x13\x12\x1d\x10\x01\x21\x06\x1d\x21\x20\x1b\x07\x07\x1b\x21\x21\
-\x1c\x06\xc5\x05\x1d\x21\x20\x1c\x06\x07\x1b\x21\x21\x1c\x05\x00\
-\x01\x00\x0c\xff\xf4\x02\x23\x02\x70\x00\x19\x00\x00\x77\x06\x06\
-\x26\x27\x26\x36\x36\x37\x25\x25\x2e\x02\x37\x36\x36\x16\x17\x05\
-\x16\x16\x15\x14\x06\x07\x80\x10\x1f\x20\x12\x13\x02\x18\x0f\x01\
-\x23\xfe\xde\x10\x17\x01\x11\x11\x21\x1f\x0f\x01\x83\x0a\x17\x15\
-\x0c\x08\x09\x0b\x0f\x1c\x1d\x24\x16\x0a\xb2\xb1\x0a\x17\x24\x1c\
-\x1d\x0f\x0b\x09\xee\x05\x19\x1d\x16\x20\x07\x00\x01\x00\x0d\xff\
-\xf4\x02\x24\x02\x70\x00\x19\x00\x00\x65\x25\x26\x26\x35\x34\x36\
-\x37\x25\x36\x36\x16\x17\x16\x06\x06\x07\x05\x05\x1e\x02\x07\x06\
-\x06\x26\x01\xb0\xfe\x7e\x0c\x15\x18\x09\x01\x83\x0f\x1f\x21\x11\
-\x12\x02\x17\x10\xfe\xde\x01\x23\x0f\x18\x02\x13\x11\x21\x1f\x08\
-\xee\x07\x20\x16\x1d\x19\x05\xee\x09\x0b\x0f\x1d\x1c\x24\x17\x0a\
-\xb1\xb2\x0a\x16\x24\x1d\x1c\x0f\x0b\x00\x03\x00\x19\xff\xf7\x01\
-\xc5\x01\xf0\x00\x11\x00\x23\x00\x35\x00\x00\x53\x22\x26\x26\x35\
-\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\x23\x07\x22\x26\
-\x26\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x15\x14\x06\x06\x07\
-\x22\x26\x26\x35\x34\x36\x36\x33\x21\x32\x16\x16\x15\x14\x06\x06\
-\x23\x57\x0e\x1c\x14\x14\x1d\x0e\x01\x2e\x0f\x1c\x14\x13\x1d\x10\
-\x97\x21\x1d\x07\x07\x1e\x21\x22\x1c\x07\x07\x1c\xba\x0e\x1c\x14\
-\x14\x1d\x0e\x01\x2e\x0f\x1c\x14\x13\x1d\x10\x01\x02\x05\x19\x1f\
-\x1f\x19\x06\x06\x1a\x1f\x1e\x19\x05\x6d\x14\x20\x12\xd1\x12\x1e\
-\x14\x14\x20\x11\xd1\x11\x20\x14\x9e\x05\x1a\x1f\x1e\x1a\x06\x06\
-\x1a\x1f\x1e\x1a\x05\x00\x01\x00\x1e\x00\x9c\x02\x0a\x01\x65\x00\
-\x2c\x00\x00\x53\x32\x1e\x03\x33\x32\x3e\x02\x37\x36\x16\x17\x16\
-\x16\x15\x14\x0e\x02\x23\x22\x2e\x03\x23\x22\x0e\x02\x07\x06\x26\
-\x26\x27\x26\x26\x37\x3e\x03\xcf\x1a\x26\x1d\x17\x14\x0a\x0d\x11\
-\x0f\x15\x10\x0a\x19\x0c\x15\x13\x1f\x33\x3d\x1c\x1b\x27\x1d\x17\
-\x14\x0b\x0d\x11\x0f\x14\x11\x07\x11\x12\x09\x1f\x08\x12\x05\x18\
-\x28\x37\x01\x65\x0d\x12\x12\x0d\x0f\x15\x12\x03\x02\x05\x09\x0d\
-\x1a\x0e\x15\x2e\x27\x19\x0d\x12\x13\x0d\x10\x15\x12\x02\x02\x02\
-\x0a\x07\x18\x23\x1b\x08\x1e\x20\x16\x00\x01\x00\x10\x00\x72\x01\
-\xe4\x01\x91\x00\x16\x00\x00\x65\x22\x26\x26\x35\x35\x21\x22\x26\
-\x26\x35\x34\x36\x36\x33\x21\x32\x16\x15\x15\x14\x06\x06\x01\xa6\
-\x1d\x1a\x06\xfe\xe4\x0e\x1c\x13\x14\x1d\x0e\x01\x55\x24\x1c\x06\
-\x1a\x72\x14\x1c\x0e\x4c\x07\x1f\x24\x24\x1f\x08\x1e\x20\xa5\x0e\
-\x1c\x12\x00\x00\x01\x00\x1b\x00\xe5\x01\xd5\x02\x03\x00\x19\x00\
-\x00\x53\x32\x16\x17\x17\x16\x16\x06\x07\x06\x06\x26\x27\x27\x07\
-\x06\x06\x26\x27\x26\x26\x36\x37\x37\x36\x36\xf8\x0e\x16\x08\x97\
-\x0b\x0f\x06\x16\x15\x20\x18\x09\x6b\x6a\x0a\x17\x1f\x16\x16\x07\
-\x10\x0a\x97\x08\x16\x02\x03\x0d\x08\x98\x0a\x18\x1f\x15\x16\x05\
-\x0f\x09\x6b\x6b\x09\x0f\x05\x16\x15\x1f\x18\x0a\x98\x08\x0d\x00\
-\x01\x00\x28\xff\x2c\x02\x09\x01\xec\x00\x36\x00\x00\x57\x22\x26\
-\x26\x35\x11\x34\x36\x36\x33\x32\x16\x16\x15\x15\x14\x16\x16\x33\
-\x32\x36\x36\x35\x35\x34\x36\x36\x33\x32\x16\x16\x15\x11\x14\x06\
-\x06\x23\x22\x2e\x02\x27\x37\x0e\x03\x23\x22\x26\x27\x15\x14\x06\
-\x06\x71\x23\x1f\x07\x07\x20\x23\x25\x1f\x07\x15\x28\x1c\x1d\x2a\
-\x17\x06\x20\x24\x25\x1e\x08\x08\x1e\x26\x17\x1c\x0f\x06\x01\x0b\
-\x06\x13\x1c\x24\x17\x19\x29\x10\x08\x1f\xd4\x16\x23\x12\x02\x2a\
-\x14\x21\x15\x16\x22\x13\xb4\x1d\x29\x17\x17\x2b\x1b\xb5\x14\x22\
-\x15\x16\x23\x13\xfe\xa5\x13\x22\x15\x09\x0f\x12\x08\x0d\x09\x15\
-\x15\x0c\x0f\x0c\xa0\x12\x22\x16\x00\x00\x05\x00\x1d\xff\xd6\x02\
-\xfe\x02\xdb\x00\x11\x00\x1d\x00\x29\x00\x35\x00\x41\x00\x00\x57\
-\x26\x26\x34\x37\x01\x36\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\
-\x26\x03\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\
-\x35\x34\x26\x23\x22\x06\x15\x14\x16\x01\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\
-\x16\xc8\x0d\x0f\x08\x01\x67\x08\x11\x16\x0e\x0e\x0d\x01\x08\xfe\
-\x97\x07\x10\x15\x0e\x4d\x5d\x5c\x4d\x4f\x5b\x59\x51\x21\x21\x21\
-\x21\x21\x21\x21\x01\xb1\x4d\x5e\x5d\x4d\x50\x59\x58\x51\x22\x20\
-\x20\x22\x21\x21\x21\x21\x08\x10\x15\x0e\x02\xa6\x0e\x0d\x01\x08\
-\x08\x11\x13\x0d\xfd\x57\x0e\x0c\x03\x01\x6b\x65\x53\x54\x64\x62\
-\x55\x57\x62\x6f\x27\x24\x24\x23\x23\x24\x25\x26\xfe\x42\x65\x52\
-\x55\x64\x61\x57\x57\x61\x6f\x26\x25\x24\x23\x24\x24\x25\x25\x00\
-\x07\x00\x1d\xff\xd6\x04\x6f\x02\xdb\x00\x11\x00\x1d\x00\x29\x00\
-\x35\x00\x41\x00\x4d\x00\x59\x00\x00\x57\x26\x26\x34\x37\x01\x36\
-\x36\x16\x17\x16\x16\x06\x07\x01\x06\x06\x26\x03\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\
-\x15\x14\x16\x01\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\
-\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\x05\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x27\x32\x36\x35\x34\x26\x23\x22\x06\
-\x15\x14\x16\xc8\x0d\x0f\x08\x01\x67\x08\x11\x16\x0e\x0e\x0d\x01\
-\x08\xfe\x97\x07\x10\x15\x0e\x4d\x5d\x5c\x4d\x4f\x5b\x59\x51\x21\
-\x21\x21\x21\x21\x21\x21\x01\xb3\x4d\x5e\x5c\x4e\x4f\x5a\x58\x51\
-\x21\x21\x21\x21\x21\x21\x21\x01\x91\x4d\x5e\x5c\x4e\x4f\x5a\x58\
-\x51\x20\x22\x21\x22\x21\x20\x21\x21\x08\x10\x15\x0e\x02\xa6\x0e\
-\x0d\x01\x08\x08\x11\x13\x0d\xfd\x57\x0e\x0c\x03\x01\x6b\x65\x53\
-\x54\x64\x62\x55\x57\x62\x6f\x27\x24\x24\x23\x23\x24\x25\x26\xfe\
-\x42\x65\x52\x55\x64\x61\x57\x57\x61\x6f\x26\x25\x24\x23\x24\x24\
-\x25\x25\x6f\x65\x52\x55\x64\x62\x56\x57\x61\x6f\x26\x25\x25\x22\
-\x24\x24\x25\x25\x00\x00\x01\x00\x1d\x02\x24\x00\x79\x02\x86\x00\
-\x0b\x00\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\
-\x13\x1b\x1b\x13\x12\x1c\x1b\x02\x24\x1e\x14\x13\x1d\x1d\x13\x14\
-\x1e\x00\x02\x00\x1d\xff\x1e\x00\x79\xff\xf6\x00\x0b\x00\x17\x00\
-\x00\x57\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\x13\x1b\x1c\x12\x13\x1b\
-\x1b\x13\x13\x1b\x1b\x13\x13\x1b\x1b\xe2\x1c\x14\x14\x1e\x1d\x15\
-\x14\x1c\x78\x1c\x14\x14\x1c\x1d\x14\x14\x1b\x00\x05\x00\x30\xff\
-\x1e\x01\x8e\xff\xf6\x00\x0b\x00\x17\x00\x23\x00\x2f\x00\x3b\x00\
-\x00\x45\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x33\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\x33\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x01\x60\x13\
-\x1b\x1b\x12\x14\x1b\x1c\xd7\x14\x1c\x1d\x13\x12\x1a\x1a\x4d\x14\
-\x1c\x1c\x14\x12\x1a\x1a\x65\x13\x1b\x1b\x13\x13\x1b\x1b\x76\x13\
-\x1b\x1b\x13\x12\x1c\x1c\xe2\x1c\x14\x14\x1e\x1d\x15\x14\x1c\x1c\
-\x14\x14\x1e\x1d\x15\x14\x1c\x78\x1b\x14\x14\x1d\x1c\x14\x15\x1b\
-\x1c\x14\x14\x1c\x1d\x14\x14\x1b\x1c\x14\x14\x1c\x1d\x14\x14\x1b\
-\x00\x00\x03\x00\x53\xff\x1e\x01\x7e\xff\xf6\x00\x0d\x00\x19\x00\
-\x25\x00\x00\x57\x22\x35\x35\x34\x36\x33\x33\x32\x16\x15\x15\x14\
-\x23\x17\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x72\x1f\x11\x0e\x6d\x0f\x10\
-\x1f\x71\x13\x1b\x1c\x12\x14\x1a\x1b\x13\x13\x1b\x1b\x13\x13\x1b\
-\x1b\x54\x1e\x04\x0e\x11\x11\x0e\x04\x1e\x8e\x1c\x14\x14\x1e\x1d\
-\x15\x14\x1c\x78\x1c\x14\x14\x1c\x1d\x14\x14\x1b\x00\x00\x03\x00\
-\x40\xff\x1e\x01\x7e\xff\xf6\x00\x17\x00\x23\x00\x2f\x00\x00\x57\
-\x22\x26\x37\x37\x23\x22\x35\x35\x34\x36\x33\x33\x32\x16\x15\x15\
-\x14\x23\x23\x17\x16\x06\x23\x17\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x9d\
-\x0f\x10\x02\x09\x2a\x1f\x11\x0e\x80\x0f\x10\x1f\x29\x07\x02\x10\
-\x0f\xb0\x13\x1b\x1c\x12\x14\x1a\x1b\x13\x13\x1b\x1b\x13\x13\x1b\
-\x1b\xbc\x12\x0f\x47\x1e\x04\x0e\x11\x11\x0e\x04\x1e\x48\x0f\x11\
-\x26\x1c\x14\x14\x1e\x1d\x15\x14\x1c\x78\x1c\x14\x14\x1c\x1d\x14\
-\x14\x1b\x00\x00\x01\x00\x1d\xff\x91\x00\x79\xff\xf1\x00\x0b\x00\
-\x00\x57\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\x13\x1b\
-\x1b\x13\x13\x1b\x1b\x6f\x1c\x14\x14\x1c\x1d\x14\x14\x1b\x00\x00\
-\x02\x00\x30\xff\x91\x01\x09\xff\xf1\x00\x0b\x00\x17\x00\x00\x57\
-\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x23\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\xdb\x13\x1b\x1b\x13\x13\x1b\x1b\x8e\
-\x14\x1c\x1c\x14\x12\x1a\x1a\x6f\x1c\x14\x14\x1c\x1d\x14\x14\x1b\
-\x1c\x14\x13\x1d\x1c\x14\x14\x1c\x00\x00\x03\x00\x30\xff\x1e\x01\
-\x05\xff\xf6\x00\x0b\x00\x17\x00\x23\x00\x00\x57\x22\x26\x35\x34\
-\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x33\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x9b\
-\x14\x1c\x1d\x13\x12\x1a\x1a\x4d\x14\x1c\x1c\x14\x12\x1a\x1a\x65\
-\x13\x1b\x1b\x13\x13\x1b\x1b\xe2\x1c\x14\x14\x1e\x1d\x15\x14\x1c\
-\x78\x1b\x14\x14\x1d\x1c\x14\x15\x1b\x1c\x14\x14\x1c\x1d\x14\x14\
-\x1b\x00\x01\x00\x40\xff\xac\x00\xeb\xff\xed\x00\x0c\x00\x00\x57\
-\x22\x35\x35\x34\x36\x33\x33\x32\x15\x15\x14\x23\x5f\x1f\x11\x0e\
-\x6e\x1e\x1e\x54\x1e\x04\x0e\x11\x1f\x04\x1e\x00\x01\x00\x37\xff\
-\x44\x00\xf5\xff\xed\x00\x17\x00\x00\x57\x22\x26\x37\x37\x23\x22\
-\x35\x35\x34\x36\x33\x33\x32\x16\x15\x15\x14\x23\x23\x17\x16\x06\
-\x23\x94\x0f\x10\x02\x08\x29\x1f\x10\x0f\x80\x0e\x11\x1f\x2a\x07\
-\x02\x0f\x0f\xbc\x12\x0f\x47\x1e\x04\x0e\x11\x11\x0e\x04\x1e\x48\
-\x0f\x11\x00\x00\x01\x00\x1d\x02\x28\x00\x79\x02\x8a\x00\x0b\x00\
-\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\x14\x1a\
-\x1b\x12\x14\x1b\x1a\x02\x28\x1d\x15\x13\x1d\x1c\x14\x15\x1d\x00\
-\x01\x00\x1d\x02\x28\x00\x79\x02\x8a\x00\x0b\x00\x00\x53\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\x13\x1b\x1b\x13\x12\x1c\
-\x1b\x02\x28\x1e\x14\x13\x1d\x1d\x13\x14\x1e\x00\x03\x00\x1e\xff\
-\x0a\x01\x2b\x00\x02\x00\x0b\x00\x17\x00\x23\x00\x00\x57\x22\x26\
-\x35\x34\x36\x33\x32\x16\x15\x14\x06\x27\x22\x26\x35\x34\x36\x33\
-\x32\x16\x15\x14\x06\x17\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\
-\x06\xfc\x13\x1b\x1b\x13\x13\x1c\x1c\xc1\x14\x1c\x1c\x14\x13\x19\
-\x19\x44\x13\x1b\x1b\x13\x13\x1b\x1b\xf6\x1c\x14\x14\x1c\x1c\x14\
-\x14\x1c\x98\x1c\x14\x13\x1d\x1c\x14\x15\x1b\x4c\x1c\x14\x14\x1c\
-\x1c\x14\x14\x1c\x00\x00\x01\x00\x24\x01\x04\x00\x72\x01\x57\x00\
-\x0b\x00\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\x15\x14\x06\x4b\
-\x11\x16\x17\x0f\x11\x17\x16\x01\x04\x19\x12\x10\x18\x18\x11\x12\
-\x18\x00\x01\x00\x24\x02\x34\x00\xcb\x02\x58\x00\x03\x00\x00\x53\
-\x35\x33\x15\x24\xa7\x02\x34\x24\x24\x00\x01\x00\x1d\x02\x24\x00\
-\x79\x02\x86\x00\x0b\x00\x00\x53\x22\x26\x35\x34\x36\x33\x32\x16\
-\x15\x14\x06\x4b\x13\x1b\x1b\x13\x12\x1c\x1b\x02\x24\x1e\x14\x13\
-\x1d\x1d\x13\x14\x1e\x00\x01\x00\x1a\xff\x1f\x00\xb1\xff\xf6\x00\
-\x19\x00\x00\x57\x22\x26\x37\x37\x23\x22\x26\x35\x35\x34\x36\x33\
-\x33\x32\x16\x15\x15\x14\x06\x23\x23\x17\x16\x06\x23\x65\x0f\x10\
-\x01\x0d\x1b\x0e\x11\x11\x0e\x59\x0e\x11\x11\x0e\x1d\x0f\x02\x10\
-\x10\xe1\x12\x0f\x77\x11\x0e\x01\x0e\x11\x11\x0e\x01\x0e\x11\x77\
-\x0f\x12\x00\x00\x02\x00\x2d\x02\x26\x01\xa1\x02\xc1\x00\x0f\x00\
-\x1f\x00\x00\x41\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\
-\x14\x06\x06\x23\x22\x26\x26\x35\x3e\x02\x33\x32\x16\x16\x15\x14\
-\x06\x06\x01\x53\x27\x20\x07\x07\x21\x26\x27\x20\x07\x07\x20\xff\
-\x27\x20\x07\x01\x06\x21\x27\x26\x20\x07\x07\x20\x02\x26\x17\x24\
-\x14\x13\x23\x16\x16\x25\x13\x12\x24\x17\x17\x24\x14\x13\x23\x16\
-\x16\x25\x13\x12\x24\x17\x00\x00\x01\x00\x2d\x02\x8a\x00\xc6\x03\
-\x23\x00\x0f\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\
-\x16\x15\x14\x06\x06\x79\x26\x1f\x07\x07\x1f\x27\x26\x1f\x07\x07\
-\x20\x02\x8a\x18\x23\x12\x13\x22\x17\x17\x23\x12\x13\x24\x16\x00\
-\x01\x00\x2e\x02\x0d\x01\x44\x02\xca\x00\x0d\x00\x00\x53\x27\x26\
-\x26\x37\x36\x36\x17\x17\x16\x16\x07\x06\x06\xf4\x9b\x1f\x0c\x0a\
-\x0b\x1e\x1f\x98\x20\x0c\x0b\x0b\x1c\x02\x14\x32\x0b\x22\x21\x25\
-\x11\x09\x30\x0a\x23\x22\x24\x11\x00\x00\x01\x00\x69\x02\x0f\x01\
-\x81\x02\xc8\x00\x0d\x00\x00\x53\x06\x26\x27\x26\x36\x37\x37\x36\
-\x16\x17\x16\x06\x07\xa6\x12\x17\x09\x0b\x0e\x1e\xb0\x11\x18\x08\
-\x0b\x0f\x1d\x02\x10\x01\x18\x1b\x23\x22\x0a\x36\x01\x19\x1b\x21\
-\x23\x0a\x00\x00\x02\x00\x09\x02\x28\x01\xac\x03\x33\x00\x0d\x00\
-\x1b\x00\x00\x41\x06\x26\x27\x26\x26\x37\x37\x36\x16\x17\x16\x16\
-\x07\x05\x06\x26\x27\x26\x26\x37\x37\x36\x16\x17\x16\x16\x07\x01\
-\x3e\x0c\x21\x19\x1f\x0d\x10\x60\x0c\x22\x18\x1f\x0b\x0f\xfe\xde\
-\x0c\x21\x19\x1f\x0d\x10\x60\x0c\x22\x18\x1f\x0b\x0f\x02\x35\x0d\
-\x02\x0e\x14\x22\x1c\x9d\x0c\x02\x0f\x12\x24\x1b\x9c\x0d\x02\x0e\
-\x14\x22\x1c\x9d\x0c\x02\x0f\x12\x24\x1b\x00\x00\x01\x00\x49\x02\
-\x11\x01\xb9\x02\xc6\x00\x15\x00\x00\x41\x32\x16\x17\x17\x16\x16\
-\x07\x06\x06\x27\x27\x07\x06\x26\x27\x26\x36\x37\x37\x36\x36\x01\
-\x02\x07\x0b\x03\x7a\x1c\x0c\x0e\x0b\x1e\x0f\x71\x70\x11\x1d\x0c\
-\x0f\x0c\x1d\x7a\x02\x0d\x02\xc6\x04\x01\x2d\x09\x2c\x1b\x18\x1b\
-\x07\x2f\x2d\x07\x1c\x16\x1c\x29\x0a\x2d\x01\x04\x00\x00\x01\x00\
-\x48\x02\x18\x01\xb9\x02\xc8\x00\x17\x00\x00\x41\x37\x36\x36\x16\
-\x17\x16\x06\x07\x07\x22\x06\x23\x22\x26\x23\x27\x26\x26\x37\x36\
-\x36\x16\x17\x01\x00\x51\x0c\x1d\x21\x0f\x0f\x0e\x1d\x79\x03\x0b\
-\x07\x07\x0c\x03\x79\x1b\x0e\x0d\x0f\x1d\x1b\x0b\x02\x96\x27\x05\
-\x06\x10\x1e\x1e\x29\x09\x2e\x04\x04\x2e\x08\x2b\x1c\x1e\x11\x04\
-\x04\x00\x01\x00\x16\x02\x2f\x01\x4d\x02\xc6\x00\x17\x00\x00\x53\
-\x22\x26\x27\x26\x36\x33\x33\x32\x17\x16\x16\x33\x32\x36\x37\x36\
-\x33\x33\x32\x16\x07\x06\x06\xb1\x3a\x52\x0c\x03\x0c\x15\x24\x14\
-\x04\x04\x20\x1a\x19\x20\x04\x04\x14\x26\x13\x0e\x04\x0a\x54\x02\
-\x2f\x43\x34\x12\x0e\x12\x17\x1d\x1d\x17\x12\x0f\x12\x33\x43\x00\
-\x02\x00\x2f\x02\x0c\x01\x24\x03\x02\x00\x0f\x00\x1b\x00\x00\x53\
-\x22\x26\x26\x35\x34\x36\x36\x33\x32\x16\x16\x15\x14\x06\x06\x27\
-\x32\x36\x35\x34\x26\x23\x22\x06\x15\x14\x16\xa9\x22\x37\x21\x21\
-\x36\x22\x22\x38\x22\x22\x37\x22\x15\x1d\x1d\x16\x14\x1d\x1d\x02\
-\x0c\x21\x38\x22\x21\x38\x22\x21\x37\x23\x22\x38\x21\x49\x1e\x15\
-\x15\x1c\x1d\x14\x16\x1d\x00\x00\x01\x00\x3c\x02\x1f\x01\xa8\x02\
-\xc5\x00\x22\x00\x00\x53\x32\x16\x16\x33\x32\x36\x36\x37\x36\x16\
-\x17\x16\x16\x07\x0e\x02\x23\x22\x26\x26\x23\x22\x06\x07\x06\x06\
-\x27\x26\x26\x37\x3e\x02\xc0\x1a\x1d\x16\x0c\x0d\x11\x13\x0f\x08\
-\x15\x0b\x1a\x0d\x0e\x09\x26\x30\x17\x17\x1f\x18\x0d\x17\x1a\x07\
-\x09\x13\x18\x19\x08\x0f\x0c\x28\x2e\x02\xc5\x17\x18\x14\x15\x02\
-\x02\x04\x08\x11\x21\x17\x14\x25\x16\x18\x19\x14\x0a\x0c\x07\x12\
-\x13\x21\x17\x13\x21\x15\x00\x00\x01\x00\x6e\x02\x36\x01\x97\x02\
-\x93\x00\x11\x00\x00\x53\x22\x26\x26\x35\x34\x36\x36\x33\x33\x32\
-\x16\x16\x15\x14\x06\x06\x23\x9a\x09\x15\x0e\x0e\x15\x09\xd2\x0a\
-\x13\x0e\x0d\x14\x0a\x02\x36\x04\x14\x17\x17\x13\x04\x05\x12\x17\
-\x17\x14\x04\x00\x01\x00\x3d\xff\x45\x00\xf7\x00\x19\x00\x25\x00\
-\x00\x57\x22\x26\x27\x34\x37\x36\x36\x33\x32\x16\x33\x32\x36\x35\
-\x34\x26\x23\x22\x06\x23\x22\x26\x27\x26\x26\x35\x34\x36\x36\x33\
-\x32\x16\x16\x15\x14\x06\x06\x8b\x1b\x30\x03\x0a\x0a\x0e\x07\x0b\
-\x0f\x0d\x08\x14\x14\x09\x0c\x12\x0a\x0a\x0f\x05\x04\x05\x1a\x24\
-\x11\x18\x31\x22\x1e\x32\xbb\x1a\x13\x0d\x0c\x0c\x0a\x0e\x0e\x0e\
-\x0f\x0e\x0f\x0f\x08\x08\x0b\x06\x0c\x15\x0b\x18\x2e\x23\x1f\x30\
-\x1c\x00\x01\x00\x35\xff\x44\x00\xf0\x00\x19\x00\x25\x00\x00\x57\
-\x22\x26\x35\x34\x36\x36\x33\x32\x16\x16\x17\x16\x06\x07\x06\x06\
-\x23\x22\x26\x23\x22\x06\x15\x14\x16\x33\x32\x36\x33\x32\x16\x17\
-\x16\x16\x07\x06\x06\xa1\x2d\x3f\x22\x32\x17\x11\x23\x19\x02\x01\
-\x04\x06\x05\x0f\x0a\x09\x13\x0c\x0a\x13\x14\x09\x0c\x0d\x0d\x08\
-\x0e\x0a\x05\x05\x01\x02\x32\xbc\x3e\x2d\x23\x2f\x18\x0c\x12\x0a\
-\x06\x0f\x08\x09\x0f\x0f\x0e\x0f\x0e\x0e\x0e\x0a\x0c\x06\x0e\x08\
-\x10\x1a\x00\xff\xff\x00\x2d\x02\x26\x01\xa1\x02\xc1\x04\x06\x01\
-\x2d\x00\x00\xff\xff\x00\x2d\x02\x8a\x00\xc6\x03\x23\x04\x06\x01\
-\x2e\x00\x00\xff\xff\x00\x2e\x02\x0d\x01\x44\x02\xca\x04\x06\x01\
-\x2f\x00\x00\xff\xff\x00\x69\x02\x0f\x01\x81\x02\xc8\x04\x06\x01\
-\x30\x00\x00\x00\x02\x00\x09\x02\x28\x01\xac\x03\x33\x00\x0d\x00\
-\x1b\x00\x00\x41\x06\x26\x27\x26\x26\x37\x37\x36\x16\x17\x16\x16\
-\x07\x05\x06\x26\x27\x26\x26\x37\x37\x36\x16\x17\x16\x16\x07\x01\
-\x3e\x0c\x21\x19\x1f\x0d\x10\x60\x0c\x22\x18\x1f\x0b\x0f\xfe\xde\
-\x0c\x21\x19\x1f\x0d\x10\x60\x0c\x22\x18\x1f\x0b\x0f\x02\x35\x0d\
-\x02\x0e\x14\x22\x1c\x9d\x0c\x02\x0f\x12\x24\x1b\x9c\x0d\x02\x0e\
-\x14\x22\x1c\x9d\x0c\x02\x0f\x12\x24\x1b\x00\xff\xff\x00\x49\x02\
-\x11\x01\xb9\x02\xc6\x04\x06\x01\x32\x00\x00\xff\xff\x00\x48\x02\
-\x18\x01\xb9\x02\xc8\x04\x06\x01\x33\x00\x00\xff\xff\x00\x16\x02\
-\x2f\x01\x4d\x02\xc6\x04\x06\x01\x34\x00\x00\xff\xff\x00\x2f\x02\
-\x0c\x01\x24\x03\x02\x04\x06\x01\x35\x00\x00\xff\xff\x00\x3c\x02\
-\x1f\x01\xa8\x02\xc5\x04\x06\x01\x36\x00\x00\xff\xff\x00\x6e\x02\
-\x36\x01\x97\x02\x93\x04\x06\x01\x37\x00\x00\xff\xff\x00\x3d\xff\
-\x45\x00\xf7\x00\x19\x04\x06\x01\x38\x00\x00\xff\xff\x00\x35\xff\
-\x44\x00\xf0\x00\x19\x04\x06\x01\x39\x00\x00\
-"
-
-qt_resource_name = b"\
-\x00\x04\
-\x00\x06\xd6\x54\
-\x00\x66\
-\x00\x6f\x00\x6e\x00\x74\
-\x00\x06\
-\x07\x03\x7d\xc3\
-\x00\x69\
-\x00\x6d\x00\x61\x00\x67\x00\x65\x00\x73\
-\x00\x05\
-\x00\x4f\xa6\x53\
-\x00\x49\
-\x00\x63\x00\x6f\x00\x6e\x00\x73\
-\x00\x0b\
-\x09\xed\x20\x27\
-\x00\x42\
-\x00\x6c\x00\x75\x00\x65\x00\x63\x00\x61\x00\x6c\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x06\x38\x5e\xa7\
-\x00\x48\
-\x00\x6f\x00\x6d\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x0c\xad\x0f\x07\
-\x00\x64\
-\x00\x65\x00\x6c\x00\x65\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x03\x09\xc2\xc7\
-\x00\x44\
-\x00\x65\x00\x6c\x00\x69\x00\x76\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x09\x07\xd9\x87\
-\x00\x52\
-\x00\x65\x00\x70\x00\x6f\x00\x72\x00\x74\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x05\xdf\xc4\x27\
-\x00\x70\
-\x00\x65\x00\x6e\x00\x63\x00\x65\x00\x64\x00\x69\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0a\
-\x05\x9b\x26\x47\
-\x00\x54\
-\x00\x72\x00\x61\x00\x6e\x00\x73\x00\x61\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x07\
-\x0c\xf8\x57\x87\
-\x00\x65\
-\x00\x79\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x09\xab\xb0\xa7\
-\x00\x73\
-\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x69\x00\x6e\x00\x67\x00\x72\x00\x61\x00\x79\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x14\
-\x07\xac\x30\x47\
-\x00\x73\
-\x00\x65\x00\x61\x00\x72\x00\x63\x00\x68\x00\x69\x00\x6e\x00\x67\x00\x72\x00\x61\x00\x79\x00\x73\x00\x6d\x00\x6f\x00\x6c\x00\x2e\
-\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x09\xc5\xc2\x47\
-\x00\x44\
-\x00\x61\x00\x73\x00\x68\x00\x42\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x12\
-\x00\x4b\xf8\x87\
-\x00\x50\
-\x00\x72\x00\x6f\x00\x66\x00\x69\x00\x6c\x00\x65\x00\x6e\x00\x6f\x00\x77\x00\x68\x00\x69\x00\x74\x00\x65\x00\x2e\x00\x70\x00\x6e\
-\x00\x67\
-\x00\x0e\
-\x0c\xd3\x68\x27\
-\x00\x4f\
-\x00\x72\x00\x64\x00\x65\x00\x72\x00\x6e\x00\x6f\x00\x77\x00\x62\x00\x67\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0f\x05\xc0\x47\
-\x00\x4d\
-\x00\x65\x00\x74\x00\x72\x00\x69\x00\x63\x00\x73\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x09\xc5\x5c\xc7\
-\x00\x55\
-\x00\x73\x00\x65\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x0c\xb7\x5c\x67\
-\x00\x53\
-\x00\x65\x00\x74\x00\x74\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0c\
-\x07\xb5\x0f\xc7\
-\x00\x63\
-\x00\x61\x00\x6c\x00\x65\x00\x6e\x00\x64\x00\x61\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0e\x24\xf1\xe7\
-\x00\x4c\
-\x00\x6f\x00\x67\x00\x6f\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x08\
-\x08\x84\x5a\xe7\
-\x00\x66\
-\x00\x72\x00\x65\x00\x31\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x05\
-\x00\x37\x57\x47\
-\x00\x34\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x06\
-\x06\xd5\x57\x47\
-\x00\x66\
-\x00\x72\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x05\
-\x00\x34\x57\x47\
-\x00\x31\
-\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x0b\xd3\x6f\xa7\
-\x00\x55\
-\x00\x73\x00\x65\x00\x72\x00\x57\x00\x42\x00\x47\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x0b\
-\x00\x8b\x7c\xe7\
-\x00\x50\
-\x00\x72\x00\x6f\x00\x66\x00\x69\x00\x6c\x00\x65\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x09\
-\x0e\x25\xb1\xe7\
-\x00\x6c\
-\x00\x6f\x00\x67\x00\x6f\x00\x32\x00\x2e\x00\x70\x00\x6e\x00\x67\
-\x00\x10\
-\x04\xf6\x3a\x66\
-\x00\x46\
-\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x2e\x00\x74\x00\x74\x00\x66\
-\x00\x14\
-\x05\xfa\x82\x46\
-\x00\x46\
-\x00\x72\x00\x65\x00\x64\x00\x6f\x00\x6b\x00\x61\x00\x2d\x00\x53\x00\x65\x00\x6d\x00\x69\x00\x42\x00\x6f\x00\x6c\x00\x64\x00\x2e\
-\x00\x74\x00\x74\x00\x66\
-"
-
-qt_resource_struct_v1 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x1d\
-\x00\x00\x00\x20\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x0e\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x04\
-\x00\x00\x02\x6a\x00\x01\x00\x00\x00\x01\x00\x00\xf8\x14\
-\x00\x00\x02\x48\x00\x01\x00\x00\x00\x01\x00\x00\xc7\x57\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x0b\xf1\
-\x00\x00\x02\x58\x00\x00\x00\x00\x00\x01\x00\x00\xd4\x9b\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x87\x80\
-\x00\x00\x02\x32\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xf8\
-\x00\x00\x02\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x02\x5a\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x79\xd0\
-\x00\x00\x02\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x90\x13\
-\x00\x00\x02\xb2\x00\x00\x00\x00\x00\x01\x00\x01\x18\xd2\
-\x00\x00\x01\x68\x00\x00\x00\x00\x00\x01\x00\x00\x52\x2f\
-\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x17\x58\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x28\xbc\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x25\x1e\
-\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xe0\
-\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x42\x53\
-\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xb3\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x10\
-\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x70\xbb\
-\x00\x00\x01\x50\x00\x00\x00\x00\x00\x01\x00\x00\x46\xf0\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x14\xaf\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x5f\xc2\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x37\x9e\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x68\x8d\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\x2a\xb9\
-\x00\x00\x02\xf0\x00\x00\x00\x00\x00\x01\x00\x01\xed\x11\
-"
-
-qt_resource_struct_v2 = b"\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x03\x00\x00\x00\x01\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x00\x00\x02\x00\x00\x00\x02\x00\x00\x00\x1d\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x20\x00\x02\x00\x00\x00\x0f\x00\x00\x00\x0e\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x00\x0e\x00\x02\x00\x00\x00\x0a\x00\x00\x00\x04\
-\x00\x00\x00\x00\x00\x00\x00\x00\
-\x00\x00\x02\x6a\x00\x01\x00\x00\x00\x01\x00\x00\xf8\x14\
-\x00\x00\x01\x9a\xda\xa5\x81\xa3\
-\x00\x00\x02\x48\x00\x01\x00\x00\x00\x01\x00\x00\xc7\x57\
-\x00\x00\x01\x9a\xe3\xff\xa5\x58\
-\x00\x00\x02\x96\x00\x00\x00\x00\x00\x01\x00\x01\x0b\xf1\
-\x00\x00\x01\x9a\xe4\xef\x45\xd9\
-\x00\x00\x02\x58\x00\x00\x00\x00\x00\x01\x00\x00\xd4\x9b\
-\x00\x00\x01\x9a\xe4\xd7\x2b\x43\
-\x00\x00\x01\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x87\x80\
-\x00\x00\x01\x9a\xf2\xbb\x78\xe2\
-\x00\x00\x02\x32\x00\x00\x00\x00\x00\x01\x00\x00\xa1\xf8\
-\x00\x00\x01\x9a\xe4\xd7\xf0\x2b\
-\x00\x00\x02\x7a\x00\x00\x00\x00\x00\x01\x00\x01\x02\x5a\
-\x00\x00\x01\x9a\xe5\x24\x2f\x28\
-\x00\x00\x01\xe6\x00\x00\x00\x00\x00\x01\x00\x00\x79\xd0\
-\x00\x00\x01\x9a\xe4\x96\xc6\xa6\
-\x00\x00\x02\x1a\x00\x00\x00\x00\x00\x01\x00\x00\x90\x13\
-\x00\x00\x01\x9a\xda\xca\x5e\xfa\
-\x00\x00\x02\xb2\x00\x00\x00\x00\x00\x01\x00\x01\x18\xd2\
-\x00\x00\x01\x9a\xe4\x36\x9d\x99\
-\x00\x00\x01\x68\x00\x00\x00\x00\x00\x01\x00\x00\x52\x2f\
-\x00\x00\x01\x9b\x02\x59\xd0\xb3\
-\x00\x00\x00\x7c\x00\x00\x00\x00\x00\x01\x00\x00\x17\x58\
-\x00\x00\x01\x9b\x26\x78\x70\xd9\
-\x00\x00\x00\xce\x00\x00\x00\x00\x00\x01\x00\x00\x28\xbc\
-\x00\x00\x01\x9a\xe4\x4c\xb8\x6d\
-\x00\x00\x00\xb0\x00\x00\x00\x00\x00\x01\x00\x00\x25\x1e\
-\x00\x00\x01\x9a\xf9\x30\x32\x84\
-\x00\x00\x00\x4c\x00\x00\x00\x00\x00\x01\x00\x00\x0d\xe0\
-\x00\x00\x01\x9a\xe4\x40\x34\xeb\
-\x00\x00\x01\x22\x00\x00\x00\x00\x00\x01\x00\x00\x42\x53\
-\x00\x00\x01\x9a\xf8\x4e\xdc\x04\
-\x00\x00\x00\x94\x00\x00\x00\x00\x00\x01\x00\x00\x1e\xb3\
-\x00\x00\x01\x9a\xe4\xee\xcb\x83\
-\x00\x00\x00\xfc\x00\x00\x00\x00\x00\x01\x00\x00\x3d\x10\
-\x00\x00\x01\x9a\xf8\x4a\x2a\xd9\
-\x00\x00\x01\xd0\x00\x00\x00\x00\x00\x01\x00\x00\x70\xbb\
-\x00\x00\x01\x9a\xe4\x4c\x05\xaa\
-\x00\x00\x01\x50\x00\x00\x00\x00\x00\x01\x00\x00\x46\xf0\
-\x00\x00\x01\x9a\xe4\x4b\x75\x55\
-\x00\x00\x00\x30\x00\x00\x00\x00\x00\x01\x00\x00\x00\x00\
-\x00\x00\x01\x9b\x16\xc1\x6b\x00\
-\x00\x00\x00\x62\x00\x00\x00\x00\x00\x01\x00\x00\x14\xaf\
-\x00\x00\x01\x9a\xf9\x30\xd0\x77\
-\x00\x00\x01\x92\x00\x00\x00\x00\x00\x01\x00\x00\x5f\xc2\
-\x00\x00\x01\x9a\xf3\x1b\xe9\x86\
-\x00\x00\x00\xe8\x00\x00\x00\x00\x00\x01\x00\x00\x37\x9e\
-\x00\x00\x01\x9a\xf9\x25\x78\xd7\
-\x00\x00\x01\xb4\x00\x00\x00\x00\x00\x01\x00\x00\x68\x8d\
-\x00\x00\x01\x9a\xf3\x07\x33\xb3\
-\x00\x00\x02\xca\x00\x00\x00\x00\x00\x01\x00\x01\x2a\xb9\
-\x00\x00\x01\x99\x39\xa9\xf6\x40\
-\x00\x00\x02\xf0\x00\x00\x00\x00\x00\x01\x00\x01\xed\x11\
-\x00\x00\x01\x99\x39\xa9\xf6\x40\
-"
-
-qt_version = [int(v) for v in QtCore.qVersion().split('.')]
-if qt_version < [5, 8, 0]:
-    rcc_version = 1
-    qt_resource_struct = qt_resource_struct_v1
-else:
-    rcc_version = 2
-    qt_resource_struct = qt_resource_struct_v2
-
-def qInitResources():
-    QtCore.qRegisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-def qCleanupResources():
-    QtCore.qUnregisterResourceData(rcc_version, qt_resource_struct, qt_resource_name, qt_resource_data)
-
-qInitResources()
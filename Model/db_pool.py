@@ -0,0 +1,143 @@
+"""
+Washy Laundry Management System - Database Connection Pool
+Hands out one MySQL connection per operation and reconnects dropped links
+"""
+
+import queue
+import threading
+import time
+from contextlib import contextmanager
+
+import mysql.connector
+
+from Model.query_log import InstrumentedConnection
+
+DEFAULT_DB_CONFIG = {
+    'host': 'localhost',
+    'user': 'root',
+    'password': '',
+    'database': 'washy'
+}
+
+
+class ConnectionPool:
+    """Small thread-safe pool of mysql.connector connections"""
+
+    def __init__(self, db_config=None, size=5, timeout=10, ping_after=30.0):
+        """Initialize pool; connections are opened lazily up to `size`.
+
+        A connection is only pinged on checkout once it has sat idle for
+        `ping_after` seconds; recently used links are handed out as-is.
+        """
+        self.db_config = dict(DEFAULT_DB_CONFIG)
+        if db_config:
+            self.db_config.update(db_config)
+        self.size = size
+        self.timeout = timeout
+        self.ping_after = ping_after
+        self._idle = queue.LifoQueue()     # (released_at, conn)
+        self._created = 0
+        self._lock = threading.Lock()
+
+    def _open(self):
+        """Open a brand new connection with the pool configuration; its cursors are timed by the query log"""
+        return InstrumentedConnection(mysql.connector.connect(
+            host=self.db_config.get('host', 'localhost'),
+            user=self.db_config.get('user', 'root'),
+            password=self.db_config.get('password', ''),
+            database=self.db_config.get('database', 'washy')
+        ))
+
+    def ensure_alive(self, conn, last_used=None):
+        """Ping the connection and reconnect if the link was dropped.
+
+        With last_used (a time.monotonic() value) the ping is skipped unless
+        the connection has been idle for at least ping_after seconds or its
+        last statement failed because the link dropped. If reopening fails the
+        connection's slot is given back and the error is raised; do not
+        release conn afterwards.
+        """
+        if (last_used is not None and not getattr(conn, 'link_lost', False)
+                and time.monotonic() - last_used < self.ping_after):
+            return conn
+        try:
+            # One quick attempt: a dead server must not stall the GUI thread
+            conn.ping(reconnect=True, attempts=1, delay=0)
+            conn.link_lost = False
+            return conn
+        except mysql.connector.Error as err:
+            print(f"✗ Pooled connection lost, reopening: {err}")
+            try:
+                conn.close()
+            except Exception:
+                pass
+            try:
+                return self._open()
+            except mysql.connector.Error:
+                # The checked-out slot is gone with the dead connection
+                with self._lock:
+                    self._created -= 1
+                raise
+
+    def get_connection(self):
+        """Check out a live connection, opening one if the pool is not full"""
+        try:
+            released_at, conn = self._idle.get_nowait()
+        except queue.Empty:
+            conn = None
+            with self._lock:
+                if self._created < self.size:
+                    self._created += 1
+                    try:
+                        conn = self._open()
+                    except mysql.connector.Error:
+                        self._created -= 1
+                        raise
+            if conn is None:
+                try:
+                    released_at, conn = self._idle.get(timeout=self.timeout)
+                except queue.Empty:
+                    raise mysql.connector.Error(msg="Connection pool exhausted")
+                conn = self.ensure_alive(conn, released_at)
+            return conn
+        return self.ensure_alive(conn, released_at)
+
+    def release(self, conn):
+        """Return a connection to the pool, discarding any open transaction"""
+        if conn is None:
+            return
+        try:
+            if conn.in_transaction:
+                conn.rollback()
+            self._idle.put_nowait((time.monotonic(), conn))
+        except mysql.connector.Error:
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self._lock:
+                self._created -= 1
+
+    @contextmanager
+    def connection(self):
+        """Context manager: `with pool.connection() as conn:`"""
+        conn = self.get_connection()
+        try:
+            yield conn
+        finally:
+            self.release(conn)
+
+    def close_all(self):
+        """Close every idle connection in the pool"""
+        while True:
+            try:
+                _, conn = self._idle.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception:
+                pass
+            with self._lock:
+                self._created -= 1
+        print("✓ Connection pool closed")
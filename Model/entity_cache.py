@@ -0,0 +1,169 @@
+"""
+Washy Laundry Management System - Entity Cache
+Read-through LRU cache for the records that popups and edit screens open repeatedly
+"""
+
+import copy
+import threading
+import time
+from collections import OrderedDict
+
+# Namespace -> tables its cached records are built from (rows and aggregates)
+ENTITY_TABLES = {
+    'customer': ('Customer', 'Orders', 'Transactions'),
+    'addresses': ('Address',),
+    'staff': ('Employees', 'Staff', 'Customer', 'Orders', 'Transactions', 'StaffActivityLog'),
+    'order': ('Orders', 'OrderService', 'Transactions', 'Customer'),
+}
+
+
+class EntityCache:
+    """
+    get(namespace, key, load) returns a private copy of the cached record,
+    calling load() only on a miss or once the entry is older than ttl;
+    get_many() does the same for several keys with one batched load.
+
+    - At most max_entries records are kept; the least recently used goes first.
+    - None results (not found / query failed) are never cached.
+    - invalidate_tables() drops every namespace built from a changed table.
+      Model._tables_changed calls it once its own writes committed; observe_versions()
+      does the same for DataVersion counters changed by other clients.
+    - A load that raced with an invalidation of its namespace is returned
+      but not stored.
+    """
+
+    def __init__(self, max_entries=256, ttl=30.0, entity_tables=ENTITY_TABLES):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.entity_tables = entity_tables
+
+        self._entries = OrderedDict()   # (namespace, key) -> (stored_at, value)
+        self._generations = {}          # namespace -> invalidation count
+        self._versions = {}             # table -> last DataVersion counter seen
+        self._lock = threading.Lock()
+
+        self.hits = 0
+        self.misses = 0
+        self.expired = 0
+        self.evictions = 0
+        self.invalidations = 0
+
+    # ---------------------- LOOKUP ----------------------
+    def get(self, namespace, key, load):
+        with self._lock:
+            found, value = self._lookup(namespace, key)
+            if found:
+                return value
+            generation = self._generations.get(namespace, 0)
+
+        value = load()
+        if value is None:
+            return None
+        with self._lock:
+            self._store(namespace, {key: value}, generation)
+        return value
+
+    def get_many(self, namespace, keys, load_many):
+        """
+        {key: record} for every key found; load_many(missing_keys) -> {key: record}
+        is called once for all keys that are not cached.
+        """
+        results = {}
+        missing = []
+        with self._lock:
+            for key in dict.fromkeys(keys):
+                found, value = self._lookup(namespace, key)
+                if found:
+                    results[key] = value
+                else:
+                    missing.append(key)
+            generation = self._generations.get(namespace, 0)
+
+        if missing:
+            loaded = {key: value for key, value in (load_many(missing) or {}).items() if value is not None}
+            with self._lock:
+                self._store(namespace, loaded, generation)
+            results.update(loaded)
+        return results
+
+    def _lookup(self, namespace, key):
+        """(True, copy) for a fresh entry, else (False, None); caller holds the lock"""
+        entry_key = (namespace, key)
+        entry = self._entries.get(entry_key)
+        if entry is not None:
+            stored_at, value = entry
+            if time.monotonic() - stored_at < self.ttl:
+                self._entries.move_to_end(entry_key)
+                self.hits += 1
+                return True, copy.deepcopy(value)
+            del self._entries[entry_key]
+            self.expired += 1
+        self.misses += 1
+        return False, None
+
+    def _store(self, namespace, values, generation):
+        """Cache loaded records unless the namespace was invalidated meanwhile; caller holds the lock"""
+        if self._generations.get(namespace, 0) != generation:
+            return
+        now = time.monotonic()
+        for key, value in values.items():
+            entry_key = (namespace, key)
+            self._entries[entry_key] = (now, copy.deepcopy(value))
+            self._entries.move_to_end(entry_key)
+        while len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+            self.evictions += 1
+
+    # ---------------------- INVALIDATION ----------------------
+    def invalidate(self, namespace=None, key=None):
+        """Drop one record, one namespace, or (no arguments) everything"""
+        with self._lock:
+            if namespace is None:
+                targets = list(self._entries)
+                for name in self.entity_tables:
+                    self._generations[name] = self._generations.get(name, 0) + 1
+            elif key is None:
+                targets = [entry_key for entry_key in self._entries if entry_key[0] == namespace]
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            else:
+                targets = [(namespace, key)] if (namespace, key) in self._entries else []
+                self._generations[namespace] = self._generations.get(namespace, 0) + 1
+            for entry_key in targets:
+                del self._entries[entry_key]
+            self.invalidations += len(targets)
+
+    def invalidate_tables(self, tables):
+        """Drop the namespaces built from any of these tables"""
+        tables = set(tables)
+        for namespace, sources in self.entity_tables.items():
+            if tables.intersection(sources):
+                self.invalidate(namespace)
+
+    def observe_versions(self, versions):
+        """Compare DataVersion counters with the last ones seen; tables that moved invalidate"""
+        with self._lock:
+            changed = {table for table, version in versions.items()
+                       if table in self._versions and self._versions[table] != version}
+            self._versions.update(versions)
+        if changed:
+            self.invalidate_tables(changed)
+
+    # ---------------------- STATS ----------------------
+    def stats(self):
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                'entries': len(self._entries),
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / lookups if lookups else 0.0,
+                'expired': self.expired,
+                'evictions': self.evictions,
+                'invalidations': self.invalidations,
+            }
+
+    def stats_line(self):
+        stats = self.stats()
+        return (f"{stats['hits']} hits, {stats['misses']} misses ({stats['hit_rate']:.0%} hit rate), "
+                f"{stats['entries']} cached, {stats['expired']} expired, "
+                f"{stats['evictions']} evicted, {stats['invalidations']} invalidated")
@@ -0,0 +1,224 @@
+"""
+Washy Laundry Management System - Schema Migrations
+Versioned schema changes applied at startup, plus an EXPLAIN check of the hot queries (see queries)
+
+    python -m Model.migrations              apply pending migrations
+    python -m Model.migrations --status     list applied / pending versions
+    python -m Model.migrations --explain    show the plan of every hot query
+"""
+
+from datetime import datetime, timedelta
+
+import mysql.connector
+
+from Model import queries
+
+# MySQL errors meaning "already there": the schema was changed by hand or a
+# migration stopped halfway (DDL commits implicitly, statement by statement)
+ER_DUP_FIELDNAME = 1060
+ER_DUP_KEYNAME = 1061
+ALREADY_APPLIED = (ER_DUP_FIELDNAME, ER_DUP_KEYNAME)
+
+# (version, description, statements) - append only, never edit an applied version
+MIGRATIONS = (
+    (1, "Orders indexes for status, date and owner filters", (
+        "CREATE INDEX idx_orders_status_date ON Orders (Status, OrderDate)",
+        "CREATE INDEX idx_orders_status_delivered ON Orders (Status, DateDelivered)",
+        "CREATE INDEX idx_orders_date_id ON Orders (OrderDate, OrderID)",
+        "CREATE INDEX idx_orders_customer_date ON Orders (CustomerID, OrderDate)",
+        "CREATE INDEX idx_orders_staff_date ON Orders (StaffID, OrderDate)",
+    )),
+    (2, "Staff activity timeline", (
+        "CREATE INDEX idx_activity_staff_time ON StaffActivityLog (StaffID, ActivityTime)",
+    )),
+    (3, "Customers by creator and creation date", (
+        "CREATE INDEX idx_customer_staff_created ON Customer (StaffID, DateCreated)",
+        "CREATE INDEX idx_customer_admin_created ON Customer (AdminID, DateCreated)",
+        "CREATE INDEX idx_customer_created ON Customer (DateCreated)",
+    )),
+    (4, "Transactions by staff member", (
+        "CREATE INDEX idx_transactions_staff_order ON Transactions (StaffID, OrderID)",
+    )),
+    # Tables earlier releases created at startup with CREATE TABLE IF NOT EXISTS
+    (5, "Per-table change counters", (
+        """
+        CREATE TABLE IF NOT EXISTS DataVersion
+        (
+            TableName VARCHAR(64)     NOT NULL PRIMARY KEY,
+            Version   BIGINT UNSIGNED NOT NULL DEFAULT 0,
+            UpdatedAt TIMESTAMP       NOT NULL DEFAULT CURRENT_TIMESTAMP
+                ON UPDATE CURRENT_TIMESTAMP
+        )
+        """,
+    )),
+    (6, "Daily order, service and staff rollups", (
+        """
+        CREATE TABLE IF NOT EXISTS DailyOrderSummary
+        (
+            SummaryDate      DATE           NOT NULL PRIMARY KEY,
+            TotalOrders      INT UNSIGNED   NOT NULL DEFAULT 0,
+            PendingOrders    INT UNSIGNED   NOT NULL DEFAULT 0,
+            ProcessingOrders INT UNSIGNED   NOT NULL DEFAULT 0,
+            CompletedOrders  INT UNSIGNED   NOT NULL DEFAULT 0,
+            CancelledOrders  INT UNSIGNED   NOT NULL DEFAULT 0,
+            OrderAmount      DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            CompletedRevenue DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            CompletedKg      DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            UpdatedAt        TIMESTAMP      NOT NULL DEFAULT CURRENT_TIMESTAMP
+                ON UPDATE CURRENT_TIMESTAMP
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS DailyServiceSummary
+        (
+            SummaryDate  DATE           NOT NULL,
+            ServiceName  VARCHAR(100)   NOT NULL,
+            ServiceCount INT UNSIGNED   NOT NULL DEFAULT 0,
+            WeightKg     DECIMAL(12, 2) NOT NULL DEFAULT 0,
+            Revenue      DECIMAL(14, 2) NOT NULL DEFAULT 0,
+            PRIMARY KEY (SummaryDate, ServiceName)
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS DailyStaffSummary
+        (
+            SummaryDate DATE         NOT NULL,
+            StaffID     INT          NOT NULL,
+            TotalOrders INT UNSIGNED NOT NULL DEFAULT 0,
+            PRIMARY KEY (SummaryDate, StaffID)
+        )
+        """,
+    )),
+)
+
+
+# ---------------------- RUNNER ----------------------
+def ensure_migration_table(cursor):
+    cursor.execute("""
+                   CREATE TABLE IF NOT EXISTS SchemaMigration
+                   (
+                       Version   INT          NOT NULL PRIMARY KEY,
+                       Name      VARCHAR(200) NOT NULL,
+                       AppliedAt TIMESTAMP    NOT NULL DEFAULT CURRENT_TIMESTAMP
+                   )
+                   """)
+
+
+def applied_versions(cursor):
+    ensure_migration_table(cursor)
+    cursor.execute("SELECT Version FROM SchemaMigration")
+    return {row[0] if not isinstance(row, dict) else row['Version'] for row in cursor.fetchall()}
+
+
+def migrate(conn):
+    """Apply every pending migration in version order; returns the versions applied"""
+    cursor = conn.cursor()
+    try:
+        done = applied_versions(cursor)
+        applied = []
+        for version, name, statements in sorted(MIGRATIONS):
+            if version in done:
+                continue
+            for statement in statements:
+                try:
+                    cursor.execute(statement)
+                except mysql.connector.Error as err:
+                    if err.errno not in ALREADY_APPLIED:
+                        raise
+                    print(f"✓ Migration {version}: already present, skipped: {statement}")
+            cursor.execute("INSERT INTO SchemaMigration (Version, Name) VALUES (%s, %s)", (version, name))
+            conn.commit()
+            applied.append(version)
+            print(f"✓ Migration {version} applied: {name}")
+        return applied
+    finally:
+        cursor.close()
+
+
+# ---------------------- PLAN CHECK ----------------------
+def hot_queries():
+    """(name, sql, params) of the reads the dashboards, history and profiles run, with sample parameters"""
+    today = datetime.now().date()
+    tomorrow = today + timedelta(days=1)
+    week_start = today - timedelta(days=today.weekday())
+    year_start = today.replace(month=1, day=1)
+    return (
+        ("Order counters", queries.ORDER_COUNTERS, (today, tomorrow)),
+        ("Orders by status", queries.ORDERS_BY_STATUS, ('Pending',)),
+        ("Order history page", *queries.orders_page()),
+        ("Order history page (filtered)", *queries.orders_page('Completed', (datetime.now(), 1 << 30))),
+        ("Orders of a year", queries.ORDERS_OF_YEAR, (year_start, year_start.replace(year=year_start.year + 1))),
+        ("Orders of a customer", queries.ORDERS_OF_CUSTOMER, (1,)),
+        ("Staff profile", queries.STAFF_PROFILE, (1, 1, 1, 1)),
+        ("Staff recent activity", queries.STAFF_RECENT_ACTIVITY, (1,)),
+        ("Admin recent customers", queries.ADMIN_RECENT_CUSTOMERS, (1,)),
+        ("Monthly revenue", queries.COMPLETED_REVENUE, (today.replace(day=1), tomorrow)),
+        ("Weekly order counts", queries.WEEKLY_ORDER_COUNTS,
+         (week_start - timedelta(weeks=8), week_start + timedelta(days=7))),
+        ("Top services this week", queries.TOP_SERVICES, (week_start, week_start + timedelta(days=7), 3)),
+    )
+
+
+def explain(cursor, query, params=()):
+    """EXPLAIN rows of one query as dicts"""
+    cursor.execute(f"EXPLAIN {query}", params)
+    columns = [column[0] for column in cursor.description]
+    return [dict(zip(columns, row)) for row in cursor.fetchall()]
+
+
+def full_scans(plan):
+    """Plan rows that read the whole table instead of using an index"""
+    return [row for row in plan
+            if row.get('table') and not str(row['table']).startswith('<')      # derived tables, unions
+            and row.get('type') not in ('system', 'const')                     # one-row reads
+            and (row.get('type') == 'ALL' or not row.get('key'))]
+
+
+def check_plans(conn):
+    """EXPLAIN every hot query; returns [(name, plan, full_scans)] and prints a summary"""
+    cursor = conn.cursor()
+    results = []
+    try:
+        for name, query, params in hot_queries():
+            plan = explain(cursor, query, params)
+            scans = full_scans(plan)
+            results.append((name, plan, scans))
+            access = ", ".join(f"{row.get('table')} {row.get('type')} {row.get('key') or '(no index)'}" for row in plan)
+            print(f"{'✗' if scans else '✓'} {name}: {access}")
+    finally:
+        cursor.close()
+    return results
+
+
+def main():
+    import argparse
+
+    from Model.db_pool import DEFAULT_DB_CONFIG
+
+    parser = argparse.ArgumentParser(description="Apply schema migrations and check query plans")
+    parser.add_argument('--status', action='store_true', help="list applied and pending migrations")
+    parser.add_argument('--explain', action='store_true', help="EXPLAIN the hot queries")
+    for key, value in DEFAULT_DB_CONFIG.items():
+        parser.add_argument(f'--{key}', default=value)
+    args = parser.parse_args()
+
+    conn = mysql.connector.connect(**{key: getattr(args, key) for key in DEFAULT_DB_CONFIG})
+    try:
+        if args.status:
+            cursor = conn.cursor()
+            done = applied_versions(cursor)
+            cursor.close()
+            for version, name, _ in sorted(MIGRATIONS):
+                print(f"{'applied' if version in done else 'pending'}  {version:>3}  {name}")
+        elif args.explain:
+            scans = [name for name, _, rows in check_plans(conn) if rows]
+            raise SystemExit(1 if scans else 0)
+        else:
+            applied = migrate(conn)
+            print(f"✓ Schema up to date ({len(applied)} migrations applied)")
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
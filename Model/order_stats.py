@@ -0,0 +1,51 @@
+"""
+Washy Laundry Management System - Shared Order Statistics
+One cached source for the home/dashboard order counters
+"""
+
+import time
+
+from PyQt6.QtCore import QObject, pyqtSignal
+
+EMPTY_ORDER_STATS = {
+    'completed_today': 0,
+    'pending_issues': 0,
+    'pending_delivery': 0,
+    'pending_pickup': 0
+}
+
+
+class OrderStatsService(QObject):
+    """Caches Model.get_order_counters() briefly and publishes every refresh"""
+
+    stats_updated = pyqtSignal(dict)
+
+    def __init__(self, model, max_age=5.0):
+        super().__init__()
+        self.model = model
+        self.max_age = max_age
+        self._stats = None
+        self._fetched_at = 0.0
+
+    def get_stats(self, force=False):
+        """Return the cached counters, querying again once they are older than max_age"""
+        if not force and self._stats is not None and time.monotonic() - self._fetched_at < self.max_age:
+            return dict(self._stats)
+        return self.refresh()
+
+    def refresh(self):
+        """Query the counters now and notify every subscribed screen"""
+        stats = self.model.get_order_counters()
+        if stats is None:
+            return dict(self._stats or EMPTY_ORDER_STATS)
+
+        self._stats = stats
+        self._fetched_at = time.monotonic()
+        print(f"✓ Order stats: Today={stats['completed_today']}, Issues={stats['pending_issues']}, "
+              f"Delivery={stats['pending_delivery']}, Pickup={stats['pending_pickup']}")
+        self.stats_updated.emit(dict(stats))
+        return dict(stats)
+
+    def invalidate(self):
+        """Drop the cached counters so the next get_stats() hits the database"""
+        self._stats = None
@@ -0,0 +1,320 @@
+"""
+Washy Laundry Management System - Daily Order Summary
+Per-day rollups of Orders/OrderService that the dashboards and period reports read
+
+Writes keep them current with per-order deltas (contribution/apply_delta).
+
+Backfill or repair (e.g. after editing Orders outside the application):
+    python -m Model.order_summary [--from 2024-01-01] [--to 2024-12-31]
+"""
+
+from datetime import date, datetime, timedelta
+
+SUMMARY_TABLES = ('DailyOrderSummary', 'DailyServiceSummary', 'DailyStaffSummary')
+
+# Each rollup is recomputed from the orders placed in [start, end)
+_REFRESH_QUERIES = (
+    """
+    INSERT INTO DailyOrderSummary
+    (SummaryDate, TotalOrders, PendingOrders, ProcessingOrders, CompletedOrders, CancelledOrders,
+     OrderAmount, CompletedRevenue, CompletedKg)
+    SELECT DATE(o.OrderDate),
+           COUNT(*),
+           COALESCE(SUM(o.Status = 'Pending'), 0),
+           COALESCE(SUM(o.Status = 'Processing'), 0),
+           COALESCE(SUM(o.Status = 'Completed'), 0),
+           COALESCE(SUM(o.Status = 'Cancelled'), 0),
+           COALESCE(SUM(o.TotalAmount), 0),
+           COALESCE(SUM(CASE WHEN o.Status = 'Completed' THEN o.TotalAmount END), 0),
+           COALESCE(SUM(CASE
+                            WHEN o.Status = 'Completed'
+                                THEN (SELECT SUM(os.WeightKg) FROM OrderService os WHERE os.OrderID = o.OrderID)
+                        END), 0)
+    FROM Orders o
+    WHERE o.OrderDate >= %s
+      AND o.OrderDate < %s
+    GROUP BY DATE(o.OrderDate)
+    """,
+    """
+    INSERT INTO DailyServiceSummary (SummaryDate, ServiceName, ServiceCount, WeightKg, Revenue)
+    SELECT DATE(o.OrderDate),
+           os.ServiceName,
+           COUNT(*),
+           COALESCE(SUM(os.WeightKg), 0),
+           COALESCE(SUM(os.TotalAmount), 0)
+    FROM OrderService os
+             INNER JOIN Orders o ON os.OrderID = o.OrderID
+    WHERE o.OrderDate >= %s
+      AND o.OrderDate < %s
+      AND os.ServiceName IS NOT NULL
+    GROUP BY DATE(o.OrderDate), os.ServiceName
+    """,
+    """
+    INSERT INTO DailyStaffSummary (SummaryDate, StaffID, TotalOrders)
+    SELECT DATE(OrderDate), StaffID, COUNT(*)
+    FROM Orders
+    WHERE OrderDate >= %s
+      AND OrderDate < %s
+      AND StaffID IS NOT NULL
+    GROUP BY DATE(OrderDate), StaffID
+    """,
+)
+
+
+def is_empty(cursor):
+    """True if the rollups (created by migration 6, see migrations) hold no data yet"""
+    cursor.execute("SELECT 1 FROM DailyOrderSummary LIMIT 1")
+    return cursor.fetchone() is None
+
+
+# ---------------------- INCREMENTAL ----------------------
+# Counter columns of each rollup; a contribution maps table -> {key: {column: value}}
+ORDER_COLUMNS = ('TotalOrders', 'PendingOrders', 'ProcessingOrders', 'CompletedOrders', 'CancelledOrders',
+                 'OrderAmount', 'CompletedRevenue', 'CompletedKg')
+SERVICE_COLUMNS = ('ServiceCount', 'WeightKg', 'Revenue')
+STAFF_COLUMNS = ('TotalOrders',)
+
+_KEY_COLUMNS = {
+    'DailyOrderSummary': ('SummaryDate',),
+    'DailyServiceSummary': ('SummaryDate', 'ServiceName'),
+    'DailyStaffSummary': ('SummaryDate', 'StaffID'),
+}
+_COUNTER_COLUMNS = {
+    'DailyOrderSummary': ORDER_COLUMNS,
+    'DailyServiceSummary': SERVICE_COLUMNS,
+    'DailyStaffSummary': STAFF_COLUMNS,
+}
+# A row whose count column drops to zero no longer stands for any order
+_COUNT_COLUMN = {
+    'DailyOrderSummary': 'TotalOrders',
+    'DailyServiceSummary': 'ServiceCount',
+    'DailyStaffSummary': 'TotalOrders',
+}
+
+
+def empty_contribution():
+    return {table: {} for table in SUMMARY_TABLES}
+
+
+def contribution(cursor, order_ids):
+    """
+    What the given orders add to the rollups, read through their primary keys.
+    Same arithmetic as the _REFRESH_QUERIES, one order at a time.
+
+    Locking reads (run inside the writer's transaction): the Orders rows are
+    locked first and their services read under that lock, so a before/after
+    pair only ever differs by this transaction's own changes.
+    """
+    totals = empty_contribution()
+    order_ids = [order_id for order_id in dict.fromkeys(order_ids) if order_id is not None]
+    if not order_ids:
+        return totals
+    placeholders = ", ".join(["%s"] * len(order_ids))
+
+    cursor.execute(f"""
+                   SELECT OrderID, DATE(OrderDate), Status, COALESCE(TotalAmount, 0), StaffID
+                   FROM Orders
+                   WHERE OrderID IN ({placeholders})
+                   FOR UPDATE
+                   """, tuple(order_ids))
+    orders = _tuples(cursor.fetchall())
+
+    cursor.execute(f"""
+                   SELECT OrderID, ServiceName, COUNT(*),
+                          COALESCE(SUM(WeightKg), 0), COALESCE(SUM(TotalAmount), 0)
+                   FROM OrderService
+                   WHERE OrderID IN ({placeholders})
+                   GROUP BY OrderID, ServiceName
+                   FOR UPDATE
+                   """, tuple(order_ids))
+    services = {}
+    for order_id, service_name, count, weight, revenue in _tuples(cursor.fetchall()):
+        services.setdefault(order_id, []).append((service_name, count, weight, revenue))
+
+    for order_id, day, status, amount, staff_id in orders:
+        order_services = services.get(order_id, [])
+        completed = status == 'Completed'
+        _add(totals['DailyOrderSummary'], (day,), {
+            'TotalOrders': 1,
+            'PendingOrders': int(status == 'Pending'),
+            'ProcessingOrders': int(status == 'Processing'),
+            'CompletedOrders': int(completed),
+            'CancelledOrders': int(status == 'Cancelled'),
+            'OrderAmount': amount,
+            'CompletedRevenue': amount if completed else 0,
+            'CompletedKg': sum(weight for _, _, weight, _ in order_services) if completed else 0,
+        })
+        for service_name, count, weight, revenue in order_services:
+            if service_name is not None:
+                _add(totals['DailyServiceSummary'], (day, service_name),
+                     {'ServiceCount': count, 'WeightKg': weight, 'Revenue': revenue})
+        if staff_id is not None:
+            _add(totals['DailyStaffSummary'], (day, staff_id), {'TotalOrders': 1})
+    return totals
+
+
+def merge(total, part):
+    """Add contribution part into total (in place); returns total"""
+    for table, rows in part.items():
+        for key, values in rows.items():
+            _add(total[table], key, values)
+    return total
+
+
+def apply_delta(cursor, before, after):
+    """
+    Move the rollups from the `before` contribution of some orders to their
+    `after` contribution inside the caller's transaction. Only the summary
+    rows of the affected keys are touched:
+
+        key only in after    INSERT ... ON DUPLICATE KEY UPDATE col = col + delta
+        key in before        UPDATE col = col + delta (the row holds at least before)
+
+    Rows left standing for no order are deleted, as a rebuild would not write them.
+    """
+    for table in SUMMARY_TABLES:
+        key_columns = _KEY_COLUMNS[table]
+        counters = _COUNTER_COLUMNS[table]
+        old_rows, new_rows = before[table], after[table]
+        for key in sorted(set(old_rows) | set(new_rows), key=str):
+            old = old_rows.get(key, {})
+            new = new_rows.get(key, {})
+            delta = [new.get(column, 0) - old.get(column, 0) for column in counters]
+            if not any(delta):
+                continue
+            if key not in old_rows:
+                cursor.execute(f"""
+                    INSERT INTO {table} ({', '.join(key_columns + counters)})
+                    VALUES ({', '.join(['%s'] * (len(key_columns) + len(counters)))})
+                    ON DUPLICATE KEY UPDATE {', '.join(f'{c} = {c} + VALUES({c})' for c in counters)}
+                    """, (*key, *delta))
+                continue
+            where = " AND ".join(f"{column} = %s" for column in key_columns)
+            cursor.execute(f"""
+                UPDATE {table}
+                SET {', '.join(f'{c} = {c} + %s' for c in counters)}
+                WHERE {where}
+                """, (*delta, *key))
+            if key not in new_rows:
+                cursor.execute(f"DELETE FROM {table} WHERE {where} AND {_COUNT_COLUMN[table]} = 0", key)
+
+
+def order_ids_of(cursor, column, value):
+    """IDs of every order whose CustomerID/StaffID is value (before a delete cascades to them), locked"""
+    if column not in ('CustomerID', 'StaffID'):
+        raise ValueError(f"Unsupported column: {column}")
+    cursor.execute(f"SELECT OrderID FROM Orders WHERE {column} = %s FOR UPDATE", (value,))
+    return [_first(row) for row in cursor.fetchall()]
+
+
+def order_of_service(cursor, order_service_id):
+    cursor.execute("SELECT OrderID FROM OrderService WHERE OrderServiceID = %s", (order_service_id,))
+    return _first(cursor.fetchone())
+
+
+def _add(rows, key, values):
+    current = rows.setdefault(key, {})
+    for column, value in values.items():
+        current[column] = current.get(column, 0) + value
+
+
+def _tuples(rows):
+    return [tuple(row.values()) if isinstance(row, dict) else tuple(row) for row in rows]
+
+
+# ---------------------- FULL REBUILD ----------------------
+def refresh_range(cursor, start, end):
+    """Recompute the rollups of every day in [start, end) from Orders (backfill and CLI only)"""
+    for table in SUMMARY_TABLES:
+        cursor.execute(f"DELETE FROM {table} WHERE SummaryDate >= %s AND SummaryDate < %s", (start, end))
+    for query in _REFRESH_QUERIES:
+        cursor.execute(query, (start, end))
+
+
+def rebuild(conn, start=None, end=None):
+    """
+    Backfill the rollups from Orders, one month per transaction so a large
+    history does not hold locks for long. Without bounds every order date is covered.
+    Returns the number of days written.
+    """
+    cursor = conn.cursor()
+    try:
+        if start is None or end is None:
+            cursor.execute("SELECT MIN(DATE(OrderDate)), MAX(DATE(OrderDate)) FROM Orders")
+            first, last = cursor.fetchone()
+            if first is None:
+                return 0
+            start = start or first
+            end = end or last + timedelta(days=1)
+
+        month = start
+        while month < end:
+            next_month = min(_next_month(month), end)
+            refresh_range(cursor, month, next_month)
+            conn.commit()
+            month = next_month
+
+        cursor.execute("SELECT COUNT(*) FROM DailyOrderSummary WHERE SummaryDate >= %s AND SummaryDate < %s",
+                       (start, end))
+        return _first(cursor.fetchone()) or 0
+    except Exception:
+        conn.rollback()
+        raise
+    finally:
+        cursor.close()
+
+
+def _first(row):
+    if row is None:
+        return None
+    return next(iter(row.values())) if isinstance(row, dict) else row[0]
+
+
+def _next_month(day):
+    return date(day.year + (day.month == 12), day.month % 12 + 1, 1)
+
+
+def main():
+    import argparse
+
+    import mysql.connector
+
+    from Model import migrations
+
+    parser = argparse.ArgumentParser(description="Rebuild the daily order summary tables from Orders")
+    parser.add_argument('--from', dest='start', help="first day (YYYY-MM-DD), default: first order")
+    parser.add_argument('--to', dest='end', help="last day (YYYY-MM-DD), default: last order")
+    parser.add_argument('--host', default='localhost')
+    parser.add_argument('--user', default='root')
+    parser.add_argument('--password', default='')
+    parser.add_argument('--database', default='washy')
+    args = parser.parse_args()
+
+    start = datetime.strptime(args.start, "%Y-%m-%d").date() if args.start else None
+    end = datetime.strptime(args.end, "%Y-%m-%d").date() + timedelta(days=1) if args.end else None
+
+    conn = mysql.connector.connect(host=args.host, user=args.user, password=args.password,
+                                   database=args.database)
+    try:
+        migrations.migrate(conn)
+        cursor = conn.cursor()
+        days = rebuild(conn, start, end)
+        print(f"✓ Daily order summary rebuilt: {days} days")
+
+        # Running dashboards poll the Orders counter; make them reload
+        try:
+            cursor.execute("""
+                           INSERT INTO DataVersion (TableName, Version)
+                           VALUES ('Orders', 1)
+                           ON DUPLICATE KEY UPDATE Version = Version + 1
+                           """)
+            conn.commit()
+        except mysql.connector.Error as err:
+            print(f"✗ Could not bump the Orders data version: {err}")
+        cursor.close()
+    finally:
+        conn.close()
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,187 @@
+"""
+Washy Laundry Management System - Hot Queries
+SQL of the dashboard, history and profile reads, shared by Model and the EXPLAIN check in migrations
+"""
+
+# ---------------------- ORDERS ----------------------
+# (start of today, start of tomorrow)
+ORDER_COUNTERS = """
+    SELECT (SELECT COUNT(*)
+            FROM Orders
+            WHERE Status = 'Completed'
+              AND DateDelivered >= %s
+              AND DateDelivered < %s) as completed_today,
+           (SELECT COUNT(*)
+            FROM Orders
+            WHERE Status NOT IN ('Completed', 'Cancelled')) as pending_issues,
+           (SELECT COUNT(*)
+            FROM Orders
+            WHERE Status IN ('Ready for Delivery', 'Processing')) as pending_delivery,
+           (SELECT COUNT(*)
+            FROM Orders
+            WHERE Status = 'Pending') as pending_pickup
+    """
+
+_ORDER_LIST_COLUMNS = """
+    SELECT o.OrderID,
+           o.CustomerID,
+           CONCAT(c.CFName, ' ', COALESCE(c.CMName, ''), ' ', c.CLName) as customer_name,
+           o.OrderDate,
+           o.DatePicked,
+           o.DateDelivered,
+           o.TotalAmount,
+           o.Status,
+           o.StaffID
+    FROM Orders o
+             LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
+    """
+
+# (status,)
+ORDERS_BY_STATUS = _ORDER_LIST_COLUMNS + """
+    WHERE o.Status = %s
+    ORDER BY o.OrderDate DESC
+    """
+
+# (customer_id,)
+ORDERS_OF_CUSTOMER = """
+    SELECT o.*, CONCAT(c.CFName, ' ', COALESCE(c.CMName, ''), ' ', c.CLName) as customer_name
+    FROM Orders o
+             LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
+    WHERE o.CustomerID = %s
+    ORDER BY o.OrderDate DESC
+    """
+
+# (first day of the year, first day of the next year)
+ORDERS_OF_YEAR = """
+    SELECT o.OrderID,
+           CONCAT(c.CFName, ' ', c.CLName) as customer_name,
+           CONCAT(e.EFName, ' ', e.ELName) as staff_name,
+           o.OrderDate,
+           o.Status,
+           o.TotalAmount,
+           o.DatePicked,
+           o.DateDelivered
+    FROM Orders o
+             LEFT JOIN Customer c ON o.CustomerID = c.CustomerID
+             LEFT JOIN Staff s ON o.StaffID = s.StaffID
+             LEFT JOIN Employees e ON s.EmployeeID = e.EmployeeID
+    WHERE o.OrderDate >= %s
+      AND o.OrderDate < %s
+    ORDER BY o.OrderDate DESC
+    """
+
+
+def orders_page(status=None, after=None, page_size=100, search=None):
+    """
+    (sql, params) of one keyset page of orders, newest first.
+    after: (OrderDate, OrderID) of the last row already shown, None for the first page
+    search: substring of the order number (WSHY#001), customer name, status or date (YYYY-MM-DD)
+    """
+    conditions = []
+    params = []
+    if status:
+        conditions.append("o.Status = %s")
+        params.append(status)
+    if search:
+        pattern = "%" + search.replace("\\", "\\\\").replace("%", "\\%").replace("_", "\\_") + "%"
+        conditions.append("""(CONCAT('WSHY#', LPAD(o.OrderID, GREATEST(3, CHAR_LENGTH(o.OrderID)), '0')) LIKE %s
+                              OR CONCAT(c.CFName, ' ', COALESCE(c.CMName, ''), ' ', c.CLName) LIKE %s
+                              OR o.Status LIKE %s
+                              OR CAST(DATE(o.OrderDate) AS CHAR) LIKE %s)""")
+        params.extend([pattern] * 4)
+    if after:
+        after_date, after_id = after
+        conditions.append("(o.OrderDate < %s OR (o.OrderDate = %s AND o.OrderID < %s))")
+        params.extend([after_date, after_date, after_id])
+    where = f"WHERE {' AND '.join(conditions)}" if conditions else ""
+    query = _ORDER_LIST_COLUMNS + f"""
+    {where}
+    ORDER BY o.OrderDate DESC, o.OrderID DESC
+    LIMIT %s
+    """
+    params.append(page_size)
+    return query, tuple(params)
+
+
+# ---------------------- PROFILES ----------------------
+# (staff_id,) * 4 - each counter is aggregated on its own (one StaffID index
+# lookup per table) instead of joining Orders x Customer x Transactions
+STAFF_PROFILE = """
+    SELECT e.*,
+           s.*,
+           sec.Username,
+           os.orders_processed,
+           cs.customers_created,
+           ts.transactions_count,
+           ts.total_transactions
+    FROM Employees e
+             INNER JOIN Staff s ON e.EmployeeID = s.EmployeeID
+             LEFT JOIN SecurStaff sec ON s.StaffID = sec.StaffID
+             CROSS JOIN (SELECT COUNT(*) AS orders_processed
+                         FROM Orders
+                         WHERE StaffID = %s) os
+             CROSS JOIN (SELECT COUNT(*) AS customers_created
+                         FROM Customer
+                         WHERE StaffID = %s) cs
+             CROSS JOIN (SELECT COUNT(*) AS transactions_count,
+                                COALESCE(SUM(CASE
+                                                 WHEN o.Status = 'Completed' THEN t.AmountPaid
+                                                 ELSE 0
+                                             END), 0) AS total_transactions
+                         FROM Transactions t
+                                  INNER JOIN Orders o
+                                             ON o.OrderID = t.OrderID AND o.StaffID = t.StaffID
+                         WHERE t.StaffID = %s) ts
+    WHERE s.StaffID = %s
+    """
+
+# (staff_id,)
+STAFF_RECENT_ACTIVITY = """
+    SELECT ActivityType, ActivityTime, OrderID, CustomerID
+    FROM StaffActivityLog
+    WHERE StaffID = %s
+    ORDER BY ActivityTime DESC LIMIT 2
+    """
+
+# (admin_id,)
+ADMIN_RECENT_CUSTOMERS = """
+    SELECT 'CREATE_CUSTOMER' as ActivityType,
+           DateCreated       as ActivityTime,
+           CustomerID,
+           NULL              as OrderID
+    FROM Customer
+    WHERE AdminID = %s
+    ORDER BY DateCreated DESC LIMIT 2
+    """
+
+# ---------------------- DAILY SUMMARY ----------------------
+# (first day, day after the last)
+COMPLETED_REVENUE = """
+    SELECT COALESCE(SUM(CompletedRevenue), 0) as revenue
+    FROM DailyOrderSummary
+    WHERE SummaryDate >= %s
+      AND SummaryDate < %s
+    """
+
+# (first Monday, Monday after the last week)
+WEEKLY_ORDER_COUNTS = """
+    SELECT DATE_SUB(SummaryDate, INTERVAL WEEKDAY(SummaryDate) DAY) as week_start,
+           SUM(TotalOrders) as orders
+    FROM DailyOrderSummary
+    WHERE SummaryDate >= %s
+      AND SummaryDate < %s
+    GROUP BY week_start
+    """
+
+# (Monday, next Monday, limit)
+TOP_SERVICES = """
+    SELECT ServiceName,
+           CAST(SUM(ServiceCount) AS UNSIGNED) as service_count,
+           SUM(Revenue)                        as total_revenue
+    FROM DailyServiceSummary
+    WHERE SummaryDate >= %s
+      AND SummaryDate < %s
+    GROUP BY ServiceName
+    ORDER BY service_count DESC
+    LIMIT %s
+    """
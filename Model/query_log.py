@@ -0,0 +1,311 @@
+"""
+Washy Laundry Management System - Query Log
+Times every statement run through the Model's connections, logs slow ones and totals them per page
+
+    logs/slow_queries.log   statements slower than SLOW_QUERY_MS (rotated at 1 MB, 5 files kept)
+
+Leaving a page prints what it cost while it was shown, e.g.
+    ✓ Queries: Admin/ManageOrder ran 3,214 queries in 4.20 s (9,870 rows, 2 slow)
+           3,000x  1.90 s  SELECT * FROM Address WHERE CustomerID=?  <- Control.AdminOrderManagementControl...
+"""
+
+import logging
+import os
+import re
+import sys
+import threading
+import time
+from collections import defaultdict
+from logging.handlers import RotatingFileHandler
+
+LOG_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "logs")
+SLOW_QUERY_LOG = os.path.join(LOG_DIR, "slow_queries.log")
+
+SLOW_QUERY_MS = 200          # statements at least this slow go to the slow-query log
+PAGE_QUERY_BUDGET = 150      # more queries than this in one page visit is reported as over budget
+REPEAT_THRESHOLD = 20        # one fingerprint repeated this often in a visit looks like an N+1 loop
+
+# Client errors meaning the server link is gone (server gone away, lost connection, ...)
+LINK_LOST_ERRNOS = (2006, 2013, 2055)
+
+# Callers are attributed to the first frame in one of these packages
+CALLER_PACKAGES = ('Control.', 'View.')
+
+_STRING = re.compile(r"'(?:[^'\\]|\\.|'')*'|\"(?:[^\"\\]|\\.|\"\")*\"")
+_NUMBER = re.compile(r"\b\d+(?:\.\d+)?\b")
+_PLACEHOLDER = re.compile(r"%s|%\([^)]*\)s")
+_IN_LIST = re.compile(r"\bIN\s*\(\s*\?(?:\s*,\s*\?)*\s*\)", re.IGNORECASE)
+_SPACE = re.compile(r"\s+")
+
+
+def fingerprint(query):
+    """SQL with literals and parameters replaced by ?, IN lists collapsed and whitespace squeezed"""
+    if isinstance(query, (bytes, bytearray)):
+        query = query.decode('utf-8', 'replace')
+    text = _STRING.sub("?", query)
+    text = _PLACEHOLDER.sub("?", text)
+    text = _NUMBER.sub("?", text)
+    text = _IN_LIST.sub("IN (...)", text)
+    return _SPACE.sub(" ", text).replace("\\", "").strip()
+
+
+def calling_site(skip=3):
+    """'Control.Module.Class.method' of the nearest controller/view frame, else the nearest Model frame"""
+    frame = sys._getframe(skip)
+    fallback = None
+    while frame is not None:
+        module = frame.f_globals.get('__name__', '')
+        if module.startswith(CALLER_PACKAGES):
+            code = frame.f_code
+            return f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+        if fallback is None and module.startswith('Model.') and module != __name__:
+            code = frame.f_code
+            fallback = f"{module}.{getattr(code, 'co_qualname', code.co_name)}"
+        frame = frame.f_back
+    return fallback or "?"
+
+
+class _Visit:
+    """Totals of one page visit"""
+
+    def __init__(self, page):
+        self.page = page
+        self.started = time.monotonic()
+        self.queries = 0
+        self.seconds = 0.0
+        self.rows = 0
+        self.slow = 0
+        self.by_fingerprint = defaultdict(lambda: [0, 0.0, 0, None])   # fingerprint -> [count, seconds, rows, caller]
+
+
+class QueryStats:
+    """
+    Collects one record per statement (fingerprint, duration, caller) plus
+    the rows fetched for it from InstrumentedCursor and totals them per page visit and per page.
+
+    watch_pages(stackedWidget, "Admin") starts a new visit whenever that
+    stack switches pages; connect it before the page's own loaders so the
+    queries of opening the page are counted for it. Queries on worker
+    threads count toward the page on screen.
+    """
+
+    def __init__(self):
+        self.slow_query_ms = SLOW_QUERY_MS
+        self.page_budget = PAGE_QUERY_BUDGET
+        self.enabled = True
+
+        self._lock = threading.Lock()
+        self._visit = _Visit("Startup")
+        self._pages = defaultdict(lambda: {'visits': 0, 'queries': 0, 'seconds': 0.0, 'slow': 0})
+        self._slow_log = None
+
+    # ---------------------- RECORDING ----------------------
+    def record(self, text, seconds, rows, caller):
+        """One executed statement; rows is the cursor rowcount (-1 until an unbuffered SELECT is read)"""
+        slow = seconds * 1000 >= self.slow_query_ms
+        with self._lock:
+            visit = self._visit
+            visit.queries += 1
+            visit.seconds += seconds
+            visit.slow += slow
+            entry = visit.by_fingerprint[text]
+            entry[0] += 1
+            entry[1] += seconds
+            entry[3] = entry[3] or caller
+            if rows > 0:
+                visit.rows += rows
+                entry[2] += rows
+            page = visit.page
+        if slow:
+            # Parameters are never logged: the login query carries passwords
+            self._slow_logger().warning("%8.1f ms  rows=%-6s  page=%s  caller=%s  %s",
+                                        seconds * 1000, rows, page, caller, text)
+
+    def add_rows(self, text, rows):
+        """Rows fetched from an unbuffered cursor after execute() returned"""
+        if rows <= 0:
+            return
+        with self._lock:
+            self._visit.rows += rows
+            self._visit.by_fingerprint[text][2] += rows
+
+    def _slow_logger(self):
+        if self._slow_log is None:
+            logger = logging.getLogger("washy.slow_queries")
+            logger.propagate = False
+            if not logger.handlers:
+                try:
+                    os.makedirs(LOG_DIR, exist_ok=True)
+                    handler = RotatingFileHandler(SLOW_QUERY_LOG, maxBytes=1_000_000, backupCount=5,
+                                                  encoding="utf-8")
+                except OSError as e:
+                    print(f"✗ Query log: Cannot open {SLOW_QUERY_LOG}: {e}")
+                    handler = logging.NullHandler()
+                handler.setFormatter(logging.Formatter("%(asctime)s %(message)s"))
+                logger.addHandler(handler)
+            logger.setLevel(logging.WARNING)
+            self._slow_log = logger
+        return self._slow_log
+
+    # ---------------------- PAGES ----------------------
+    def watch_pages(self, stacked_widget, prefix):
+        """Start a visit named '<prefix>/<page objectName>' on every page switch"""
+        def on_page_changed(index):
+            page = stacked_widget.widget(index)
+            name = page.objectName() if page is not None and page.objectName() else str(index)
+            self.begin_page(f"{prefix}/{name}")
+        stacked_widget.currentChanged.connect(on_page_changed)
+
+    def begin_page(self, page):
+        """Close the current visit (printing its totals) and start counting for page"""
+        with self._lock:
+            finished, self._visit = self._visit, _Visit(page)
+            self._add_to_page(finished)
+        self._report(finished)
+
+    def _add_to_page(self, visit):
+        if not visit.queries:
+            return
+        totals = self._pages[visit.page]
+        totals['visits'] += 1
+        totals['queries'] += visit.queries
+        totals['seconds'] += visit.seconds
+        totals['slow'] += visit.slow
+
+    def _report(self, visit):
+        if not visit.queries:
+            return
+        over = visit.queries > self.page_budget
+        print(f"{'✗' if over else '✓'} Queries: {visit.page} ran {visit.queries:,} queries "
+              f"in {visit.seconds:.2f} s ({visit.rows:,} rows, {visit.slow} slow)"
+              + (f" - over the budget of {self.page_budget}" if over else ""))
+
+        repeated = sorted(((count, seconds, text, caller)
+                           for text, (count, seconds, _, caller) in visit.by_fingerprint.items()
+                           if count >= REPEAT_THRESHOLD), reverse=True)
+        for count, seconds, text, caller in repeated[:5]:
+            print(f"    {count:>6,}x {seconds:6.2f} s  {text[:100]}  <- {caller}")
+        if over:
+            self._slow_logger().warning("page %s ran %d queries in %.2f s (budget %d)",
+                                        visit.page, visit.queries, visit.seconds, self.page_budget)
+
+    # ---------------------- TOTALS ----------------------
+    def current_visit(self):
+        """(page, queries, seconds) of the page on screen"""
+        with self._lock:
+            return self._visit.page, self._visit.queries, self._visit.seconds
+
+    def page_totals(self):
+        """{page: {'visits', 'queries', 'seconds', 'slow'}} over every finished visit"""
+        with self._lock:
+            return {page: dict(totals) for page, totals in self._pages.items()}
+
+    def over_budget(self):
+        """Pages whose average visit ran more than page_budget queries"""
+        return sorted(page for page, totals in self.page_totals().items()
+                      if totals['queries'] / totals['visits'] > self.page_budget)
+
+    def summary(self):
+        """Close the current visit and print the totals of every page"""
+        self.begin_page("Shutdown")
+        totals = self.page_totals()
+        if not totals:
+            return
+        print("✓ Queries per page (all visits):")
+        for page, page_totals in sorted(totals.items(), key=lambda item: -item[1]['seconds']):
+            print(f"    {page:<28} {page_totals['visits']:>4} visits {page_totals['queries']:>8,} queries "
+                  f"{page_totals['seconds']:8.2f} s {page_totals['slow']:>5} slow")
+
+
+# Shared by every Model connection
+query_stats = QueryStats()
+
+
+# ---------------------- WRAPPERS ----------------------
+class InstrumentedCursor:
+    """mysql.connector cursor whose execute()/executemany() are timed and whose fetched rows are counted"""
+
+    def __init__(self, cursor, stats=query_stats, connection=None):
+        self._cursor = cursor
+        self._stats = stats
+        self._connection = connection
+        self._fingerprint = None
+        self._counted = True      # rowcount already recorded at execute time (buffered / DML)
+
+    def _timed(self, method, query, *args, **kwargs):
+        if not self._stats.enabled:
+            self._fingerprint = None
+            return self._run(method, query, *args, **kwargs)
+        self._fingerprint = fingerprint(query)
+        started = time.perf_counter()
+        try:
+            return self._run(method, query, *args, **kwargs)
+        finally:
+            elapsed = time.perf_counter() - started
+            rows = getattr(self._cursor, 'rowcount', -1)
+            self._counted = rows >= 0
+            self._stats.record(self._fingerprint, elapsed, rows, calling_site())
+
+    def _run(self, method, query, *args, **kwargs):
+        try:
+            return method(query, *args, **kwargs)
+        except Exception as err:
+            if self._connection is not None and getattr(err, 'errno', None) in LINK_LOST_ERRNOS:
+                self._connection.link_lost = True
+            raise
+
+    def execute(self, query, *args, **kwargs):
+        return self._timed(self._cursor.execute, query, *args, **kwargs)
+
+    def executemany(self, query, *args, **kwargs):
+        return self._timed(self._cursor.executemany, query, *args, **kwargs)
+
+    def _fetched(self, rows):
+        if self._fingerprint is not None and not self._counted:
+            self._stats.add_rows(self._fingerprint, rows)
+
+    def fetchone(self):
+        row = self._cursor.fetchone()
+        self._fetched(row is not None)
+        return row
+
+    def fetchmany(self, *args, **kwargs):
+        rows = self._cursor.fetchmany(*args, **kwargs)
+        self._fetched(len(rows))
+        return rows
+
+    def fetchall(self):
+        rows = self._cursor.fetchall()
+        self._fetched(len(rows))
+        return rows
+
+    def __iter__(self):
+        return iter(self.fetchone, None)
+
+    def __enter__(self):
+        self._cursor.__enter__()
+        return self
+
+    def __exit__(self, *exc_info):
+        return self._cursor.__exit__(*exc_info)
+
+    def __getattr__(self, name):
+        return getattr(self._cursor, name)
+
+
+class InstrumentedConnection:
+    """
+    mysql.connector connection handing out InstrumentedCursors; everything else is passed through.
+    link_lost is set once a statement failed because the server link dropped (see ConnectionPool).
+    """
+
+    def __init__(self, conn, stats=query_stats):
+        self._conn = conn
+        self._stats = stats
+        self.link_lost = False
+
+    def cursor(self, *args, **kwargs):
+        return InstrumentedCursor(self._conn.cursor(*args, **kwargs), self._stats, self)
+
+    def __getattr__(self, name):
+        return getattr(self._conn, name)
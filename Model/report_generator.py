@@ -15,6 +15,8 @@ from datetime import datetime
 import mysql.connector
 from typing import Dict, List, Any
 
+from Model.report_worker import build_progress
+
 
 class WashyEnhancedReportGenerator:
     """Generate beautiful detailed PDF reports for Washy Laundry System"""
@@ -23,6 +25,7 @@ class WashyEnhancedReportGenerator:
         """Initialize report generator with database configuration"""
         self.db_config = db_config
         self.conn = None
+        self.last_filename = None
 
     def connect_db(self):
         """Establish database connection"""
@@ -96,7 +99,7 @@ class WashyEnhancedReportGenerator:
         cursor.close()
         return staff_data
 
-    def generate_staff_report(self, staff_id: int, filename: str = None):
+    def generate_staff_report(self, staff_id: int, filename: str = None, progress=None):
         """Generate detailed staff performance report"""
 
         if not self.connect_db():
@@ -104,6 +107,8 @@ class WashyEnhancedReportGenerator:
             return False
 
         try:
+            if progress:
+                progress(10, "Loading staff details")
             staff = self.get_staff_full_details(staff_id)
             if not staff:
                 print(f"Staff ID {staff_id} not found")
@@ -112,6 +117,7 @@ class WashyEnhancedReportGenerator:
             if not filename:
                 staff_name = f"{staff['EFName']}_{staff['ELName']}".replace(" ", "_")
                 filename = f"Staff_{staff_id}_{staff_name}.pdf"
+            self.last_filename = filename
 
             doc = SimpleDocTemplate(filename, pagesize=letter,
                                    rightMargin=50, leftMargin=50,
@@ -232,6 +238,9 @@ class WashyEnhancedReportGenerator:
             footer_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
             elements.append(Paragraph(footer_text, styles['Normal']))
 
+            if progress:
+                progress(50, "Building PDF")
+                doc.setProgressCallBack(build_progress(progress, 50, 99))
             doc.build(elements)
             print(f"✅ Staff report generated: {filename}")
             return True
@@ -293,7 +302,7 @@ class WashyEnhancedReportGenerator:
         cursor.close()
         return customer_data
 
-    def generate_customer_report(self, customer_id: int, filename: str = None):
+    def generate_customer_report(self, customer_id: int, filename: str = None, progress=None):
         """Generate detailed customer report"""
 
         if not self.connect_db():
@@ -301,6 +310,8 @@ class WashyEnhancedReportGenerator:
             return False
 
         try:
+            if progress:
+                progress(10, "Loading customer details")
             customer = self.get_customer_full_details(customer_id)
             if not customer:
                 print(f"Customer ID {customer_id} not found")
@@ -309,6 +320,7 @@ class WashyEnhancedReportGenerator:
             if not filename:
                 customer_name = f"{customer['CFName']}_{customer['CLName']}".replace(" ", "_")
                 filename = f"Customer_{customer_id}_{customer_name}.pdf"
+            self.last_filename = filename
 
             doc = SimpleDocTemplate(filename, pagesize=letter,
                                    rightMargin=50, leftMargin=50,
@@ -440,6 +452,9 @@ class WashyEnhancedReportGenerator:
             footer_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
             elements.append(Paragraph(footer_text, styles['Normal']))
 
+            if progress:
+                progress(50, "Building PDF")
+                doc.setProgressCallBack(build_progress(progress, 50, 99))
             doc.build(elements)
             print(f"✅ Customer report generated: {filename}")
             return True
@@ -496,7 +511,7 @@ class WashyEnhancedReportGenerator:
         cursor.close()
         return order_data
 
-    def generate_order_report(self, order_id: int, filename: str = None):
+    def generate_order_report(self, order_id: int, filename: str = None, progress=None):
         """Generate detailed order report"""
 
         if not self.connect_db():
@@ -504,6 +519,8 @@ class WashyEnhancedReportGenerator:
             return False
 
         try:
+            if progress:
+                progress(10, "Loading order details")
             order = self.get_order_full_details(order_id)
             if not order:
                 print(f"Order ID {order_id} not found")
@@ -511,6 +528,7 @@ class WashyEnhancedReportGenerator:
 
             if not filename:
                 filename = f"Order_WSHY{order_id:03d}.pdf"
+            self.last_filename = filename
 
             doc = SimpleDocTemplate(filename, pagesize=letter,
                                    rightMargin=50, leftMargin=50,
@@ -721,6 +739,9 @@ class WashyEnhancedReportGenerator:
             footer_text = f"Generated on: {datetime.now().strftime('%B %d, %Y at %I:%M %p')}"
             elements.append(Paragraph(footer_text, styles['Normal']))
 
+            if progress:
+                progress(50, "Building PDF")
+                doc.setProgressCallBack(build_progress(progress, 50, 99))
             doc.build(elements)
             print(f"✅ Order report generated: {filename}")
             return True
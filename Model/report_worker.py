@@ -0,0 +1,175 @@
+"""
+Washy Laundry Management System - Background Report Worker
+Builds PDF reports in a separate process so the GUI thread stays responsive
+"""
+
+import multiprocessing
+import os
+import queue
+
+from PyQt6.QtCore import Qt, QObject, QTimer, pyqtSignal
+from PyQt6.QtWidgets import QProgressDialog
+
+# kind -> (module, generator class, method)
+REPORT_KINDS = {
+    'annual': ('Model.Anual_Report', 'WashyAnnualReportGenerator', 'generate_annual_report'),
+    'order': ('Model.report_generator', 'WashyEnhancedReportGenerator', 'generate_order_report'),
+    'customer': ('Model.report_generator', 'WashyEnhancedReportGenerator', 'generate_customer_report'),
+    'staff': ('Model.report_generator', 'WashyEnhancedReportGenerator', 'generate_staff_report'),
+}
+
+
+def build_progress(progress, start=60, end=99):
+    """Adapter for doc.setProgressCallBack() mapping ReportLab's build progress into [start, end]"""
+    state = {'size': 0, 'last': -1}
+
+    def callback(kind, value):
+        if kind == 'SIZE_EST':
+            state['size'] = value or 0
+        elif kind == 'PROGRESS' and state['size']:
+            percent = start + int((end - start) * min(value / state['size'], 1.0))
+            if percent != state['last']:
+                state['last'] = percent
+                progress(percent, "Building PDF")
+
+    return callback
+
+
+def _run_report(kind, db_config, args, filename, messages):
+    """Child process entry point: build one report and post progress/result messages"""
+    import importlib
+
+    def progress(percent, message):
+        messages.put(('progress', percent, message))
+
+    try:
+        module_name, class_name, method_name = REPORT_KINDS[kind]
+        generator_class = getattr(importlib.import_module(module_name), class_name)
+        generator = generator_class(db_config)
+        success = getattr(generator, method_name)(*args, filename=filename, progress=progress)
+        if success:
+            messages.put(('done', True, generator.last_filename or filename or ''))
+        else:
+            messages.put(('error', "The report generator reported a failure (see console)", filename or ''))
+    except Exception as e:
+        messages.put(('error', str(e), filename or ''))
+
+
+class ReportJob(QObject):
+    """
+    Runs one report generator in a worker process.
+
+        job = ReportJob('annual', model.db_config, (year,), filepath, parent=self)
+        job.progress.connect(...)
+        job.finished.connect(...)
+        job.start()
+
+    The child opens its own database connection (pooled connections cannot
+    cross process boundaries). cancel() terminates the process.
+    """
+
+    progress = pyqtSignal(int, str)      # percent, message
+    finished = pyqtSignal(bool, str)     # success, filename (or error text on failure)
+    cancelled = pyqtSignal()
+
+    POLL_INTERVAL_MS = 100
+
+    def __init__(self, kind, db_config, args=(), filename=None, parent=None):
+        super().__init__(parent)
+        if kind not in REPORT_KINDS:
+            raise ValueError(f"Unknown report kind: {kind}")
+        self.kind = kind
+        self.db_config = dict(db_config)
+        self.args = tuple(args)
+        self.filename = filename
+        self._process = None
+        self._messages = None
+        self._timer = QTimer(self)
+        self._timer.setInterval(self.POLL_INTERVAL_MS)
+        self._timer.timeout.connect(self._poll)
+
+    def start(self):
+        # spawn: never fork a process that owns a QApplication
+        context = multiprocessing.get_context('spawn')
+        self._messages = context.Queue()
+        self._process = context.Process(
+            target=_run_report,
+            args=(self.kind, self.db_config, self.args, self.filename, self._messages),
+            daemon=True
+        )
+        self._process.start()
+        self._timer.start()
+        self.progress.emit(0, "Starting")
+        print(f"✓ Report job started: {self.kind} {self.args}")
+
+    def is_running(self):
+        return self._process is not None and self._process.is_alive()
+
+    def cancel(self):
+        """Stop the worker and discard a partially written file"""
+        if self._process is None:
+            return
+        self._timer.stop()
+        if self._process.is_alive():
+            self._process.terminate()
+        self._process.join(1)
+        self._cleanup()
+        if self.filename and os.path.exists(self.filename):
+            try:
+                os.remove(self.filename)
+            except OSError:
+                pass
+        print(f"✓ Report job cancelled: {self.kind} {self.args}")
+        self.cancelled.emit()
+
+    def _poll(self):
+        while True:
+            try:
+                message = self._messages.get_nowait()
+            except queue.Empty:
+                break
+            if message[0] == 'progress':
+                self.progress.emit(message[1], message[2])
+            elif message[0] == 'done':
+                self._finish(message[1], message[2])
+                return
+            elif message[0] == 'error':
+                print(f"✗ Report job failed: {message[1]}")
+                self._finish(False, message[1])
+                return
+
+        if self._process is not None and not self._process.is_alive():
+            # Worker died without reporting back
+            self._finish(False, f"Report process exited with code {self._process.exitcode}")
+
+    def _finish(self, success, result):
+        self._timer.stop()
+        if self._process is not None:
+            self._process.join(1)
+        self._cleanup()
+        if success:
+            self.progress.emit(100, "Done")
+        self.finished.emit(success, result)
+
+    def _cleanup(self):
+        if self._messages is not None:
+            self._messages.close()
+        self._process = None
+        self._messages = None
+
+
+def attach_progress_dialog(job, parent, title, label):
+    """Window-modal progress dialog that follows job and cancels it from its Cancel button"""
+    dialog = QProgressDialog(label, "Cancel", 0, 100, parent)
+    dialog.setWindowTitle(title)
+    dialog.setWindowModality(Qt.WindowModality.WindowModal)
+    dialog.setMinimumDuration(0)
+    dialog.setAutoClose(False)
+    dialog.setAutoReset(False)
+
+    job.progress.connect(lambda percent, message: dialog.setValue(percent))
+    job.progress.connect(lambda percent, message: dialog.setLabelText(f"{label}\n{message}"))
+    job.finished.connect(lambda success, result: dialog.close())
+    job.cancelled.connect(dialog.close)
+    dialog.canceled.connect(job.cancel)
+    return dialog
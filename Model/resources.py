@@ -0,0 +1,159 @@
+"""
+Washy Laundry Management System - Application Resources
+Registers the compiled images/Resc_rc.rcc on first use and hands out cached pixmaps
+
+Build step (after changing images/Resc_rc.qrc or one of its files):
+    python -m Model.resources
+"""
+
+import os
+import struct
+import sys
+import xml.etree.ElementTree as ET
+import zlib
+
+ROOT_DIR = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+QRC_PATH = os.path.join(ROOT_DIR, "images", "Resc_rc.qrc")
+RCC_PATH = os.path.join(ROOT_DIR, "images", "Resc_rc.rcc")
+
+# Same defaults as Qt's rcc: zlib only if it saves at least 30%
+COMPRESS_THRESHOLD = 70
+RCC_FORMAT_VERSION = 2
+
+_registered = False
+_pixmaps = {}
+
+
+# ---------------------- RUNTIME ----------------------
+def ensure_resources():
+    """Register the .rcc once; Qt memory-maps the file instead of copying it"""
+    global _registered
+    if _registered:
+        return True
+
+    from PyQt6.QtCore import QResource
+
+    if not os.path.exists(RCC_PATH):
+        build_rcc()
+    _registered = QResource.registerResource(RCC_PATH)
+    if _registered:
+        print(f"✓ Resources registered: {os.path.basename(RCC_PATH)}")
+    else:
+        print(f"✗ Could not register resources from {RCC_PATH}")
+    return _registered
+
+
+def resource_pixmap(path):
+    """QPixmap for a ':/...' resource path, decoded on first request and shared afterwards"""
+    pixmap = _pixmaps.get(path)
+    if pixmap is None:
+        from PyQt6.QtGui import QPixmap
+
+        ensure_resources()
+        pixmap = QPixmap(path)
+        _pixmaps[path] = pixmap
+    return pixmap
+
+
+# ---------------------- BUILD ----------------------
+def _qt_hash(name):
+    """qt_hash() from QtCore, used to order and look up resource names"""
+    h = 0
+    for (unit,) in struct.iter_unpack('>H', name.encode('utf-16-be')):
+        h = ((h << 4) + unit) & 0xffffffff
+        h ^= (h & 0xf0000000) >> 23
+        h &= 0x0fffffff
+    return h
+
+
+class _Node:
+    def __init__(self, name, path=None):
+        self.name = name
+        self.path = path          # file on disk, None for directories
+        self.children = {}
+        self.name_offset = 0
+        self.data_offset = 0
+        self.child_offset = 0
+
+    def sorted_children(self):
+        return sorted(self.children.values(), key=lambda node: _qt_hash(node.name))
+
+
+def _read_qrc(qrc_path):
+    """Resource tree of a .qrc file (prefix folders + files)"""
+    root = _Node("")
+    base = os.path.dirname(qrc_path)
+    for resource in ET.parse(qrc_path).getroot().iter('qresource'):
+        prefix = resource.get('prefix', '/')
+        for file in resource.iter('file'):
+            alias = file.get('alias') or file.text.strip()
+            parts = [part for part in (prefix + "/" + alias).split("/") if part]
+            node = root
+            for folder in parts[:-1]:
+                node = node.children.setdefault(folder, _Node(folder))
+            node.children[parts[-1]] = _Node(parts[-1], os.path.join(base, file.text.strip()))
+    return root
+
+
+def build_rcc(qrc_path=QRC_PATH, rcc_path=RCC_PATH):
+    """
+    Write a binary resource file (the format of 'rcc -binary') for qrc_path.
+    Pure Python, so a Qt SDK with the rcc tool is not needed to rebuild it.
+    """
+    root = _read_qrc(qrc_path)
+
+    # Breadth-first order, children of a folder stored together sorted by hash
+    ordered = [root]
+    index = 0
+    while index < len(ordered):
+        node = ordered[index]
+        if node.path is None:
+            node.child_offset = len(ordered)
+            ordered.extend(node.sorted_children())
+        index += 1
+
+    names, data, tree = bytearray(), bytearray(), bytearray()
+    name_offsets = {}
+    for node in ordered[1:]:
+        if node.name not in name_offsets:
+            name_offsets[node.name] = len(names)
+            encoded = node.name.encode('utf-16-be')
+            names += struct.pack('>HI', len(node.name), _qt_hash(node.name)) + encoded
+        node.name_offset = name_offsets[node.name]
+
+    for node in ordered:
+        if node.path is None:
+            tree += struct.pack('>IHII', node.name_offset, 0x02, len(node.children), node.child_offset)
+        else:
+            with open(node.path, 'rb') as f:
+                content = f.read()
+            flags = 0
+            compressed = zlib.compress(content)
+            if len(compressed) + 4 < len(content) * COMPRESS_THRESHOLD / 100:
+                # qCompress layout: uncompressed size, then the zlib stream
+                content = struct.pack('>I', len(content)) + compressed
+                flags = 0x01
+            node.data_offset = len(data)
+            data += struct.pack('>I', len(content)) + content
+            # territory AnyTerritory (0), language C (1)
+            tree += struct.pack('>IHHHI', node.name_offset, flags, 0, 1, node.data_offset)
+        # last-modified timestamp (format 2); 0 keeps the build reproducible
+        tree += struct.pack('>Q', 0)
+
+    header_size = 20
+    tree_offset = header_size
+    data_offset = tree_offset + len(tree)
+    names_offset = data_offset + len(data)
+    header = b'qres' + struct.pack('>IIII', RCC_FORMAT_VERSION, tree_offset, data_offset, names_offset)
+
+    tmp_path = rcc_path + ".tmp"
+    with open(tmp_path, 'wb') as f:
+        f.write(header + tree + data + names)
+    os.replace(tmp_path, rcc_path)
+    print(f"✓ Resources compiled: {os.path.relpath(rcc_path, ROOT_DIR)} "
+          f"({len(ordered)} entries, {os.path.getsize(rcc_path)} bytes)")
+    return rcc_path
+
+
+if __name__ == "__main__":
+    build_rcc(*sys.argv[1:3])
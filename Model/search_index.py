@@ -0,0 +1,146 @@
+"""
+Washy Laundry Management System - Search Index
+In-memory trigram index that resolves customer and staff searches to IDs
+"""
+
+import threading
+
+# Shorter terms have no trigram to look up; callers use SQL LIKE for them
+MIN_TERM_LENGTH = 3
+
+
+def _trigrams(text):
+    return {text[i:i + 3] for i in range(len(text) - 2)}
+
+
+class TrigramIndex:
+    """
+    Case-insensitive substring index over a few text fields per ID.
+
+    search(term) matches like SQL `field LIKE '%term%'` on any field for
+    terms of 3+ characters: the term's trigram posting sets are intersected,
+    then the substring is confirmed on the (few) candidates.
+    """
+
+    def __init__(self):
+        self._postings = {}    # trigram -> {id}
+        self._docs = {}        # id -> fields joined by NUL
+
+    def __len__(self):
+        return len(self._docs)
+
+    def clear(self):
+        self._postings.clear()
+        self._docs.clear()
+
+    def put(self, doc_id, fields):
+        """Add or replace the searchable fields of doc_id"""
+        if doc_id in self._docs:
+            self.remove(doc_id)
+        values = [str(value).lower() for value in fields if value]
+        # NUL never occurs in a term, so no trigram spans two fields
+        text = "\0".join(values)
+        for gram in _trigrams(text):
+            self._postings.setdefault(gram, set()).add(doc_id)
+        self._docs[doc_id] = text
+
+    def remove(self, doc_id):
+        text = self._docs.pop(doc_id, None)
+        if text is None:
+            return
+        for gram in _trigrams(text):
+            ids = self._postings.get(gram)
+            if ids is not None:
+                ids.discard(doc_id)
+                if not ids:
+                    del self._postings[gram]
+
+    def load(self, rows):
+        """Rebuild from (id, field, field, ...) rows"""
+        self.clear()
+        for row in rows:
+            self.put(row[0], row[1:])
+
+    def search(self, term):
+        """IDs whose fields contain term (case-insensitive); None for terms shorter than MIN_TERM_LENGTH"""
+        term = term.lower()
+        if len(term) < MIN_TERM_LENGTH:
+            return None
+
+        postings = []
+        for gram in _trigrams(term):
+            ids = self._postings.get(gram)
+            if not ids:
+                return set()
+            postings.append(ids)
+        postings.sort(key=len)
+        candidates = set(postings[0]).intersection(*postings[1:])
+        if len(term) == 3:
+            return candidates
+        return {doc_id for doc_id in candidates if term in self._docs[doc_id]}
+
+
+class SearchIndex:
+    """
+    TrigramIndex kept in step with the database through the DataVersion
+    counters of `tables`.
+
+    Built on the first search from load_rows() -> [(id, field, ...), ...].
+    Model writes report their own change with changed(); if the counters
+    show that another client wrote as well, the next search rebuilds.
+    Searches run on worker threads (see View/LiveSearch.py), hence the lock.
+    """
+
+    def __init__(self, model, tables, load_rows, name):
+        self.model = model
+        self.tables = tuple(tables)
+        self.load_rows = load_rows
+        self.name = name
+
+        self.index = TrigramIndex()
+        self.versions = None          # counters the index matches, None = not built / stale
+        self._lock = threading.Lock()
+
+    def search(self, term):
+        """Matching IDs, or None for short terms or if the index is unavailable (caller falls back to SQL)"""
+        if len(term) < MIN_TERM_LENGTH:
+            return None
+        with self._lock:
+            current = self.model.get_data_version(self.tables)
+            if current is None:
+                return None
+            if current != self.versions:
+                rows = self.load_rows()
+                if rows is None:
+                    return None
+                self.index.load(rows)
+                self.versions = current
+                print(f"✓ {self.name} index built: {len(self.index)} entries")
+            return self.index.search(term)
+
+    def changed(self, doc_id, fields, *bumped_tables):
+        """
+        Apply one committed write of this process: fields=None removes doc_id,
+        doc_id=None only accounts for the version bump.
+        """
+        with self._lock:
+            if self.versions is None:
+                return
+            expected = dict(self.versions)
+            for table in bumped_tables:
+                if table in expected:
+                    expected[table] += 1
+
+            if doc_id is not None:
+                if fields is None:
+                    self.index.remove(doc_id)
+                else:
+                    self.index.put(doc_id, fields)
+
+            current = self.model.get_data_version(self.tables)
+            # Someone else changed these tables too: rebuild on the next search
+            self.versions = current if current == expected else None
+
+    def invalidate(self):
+        with self._lock:
+            self.versions = None
@@ -0,0 +1,170 @@
+"""
+Washy Laundry Management System - Unit of Work
+Groups the writes of one order operation into a single transaction
+"""
+
+from Model import order_summary
+
+
+class UnitOfWork:
+    """
+    One pooled connection, one transaction, one commit.
+
+        with model.unit_of_work() as uow:
+            order_id = uow.insert_order(...)
+            uow.insert_order_service(order_id, ...)
+            uow.log_activity(staff_id, 'CREATE_ORDER', order_id, customer_id)
+
+    Everything is committed together when the block exits normally and
+    rolled back if any statement raises. DataVersion counters for the
+    touched tables are bumped, and the daily order summary is moved by the
+    difference the changed orders make to it, inside the same transaction;
+    the Model's caches of those tables are dropped once it has committed.
+    """
+
+    def __init__(self, model):
+        self.model = model
+        self.conn = None
+        self.cursor = None
+        self._tables = set()
+        self._summary_orders = set()     # orders whose summary contribution may change
+        self._summary_before = None      # their contribution before this unit touched them
+
+    def __enter__(self):
+        self.conn = self.model.pool.get_connection()
+        self.cursor = self.conn.cursor()
+        self._tables = set()
+        self._summary_orders = set()
+        self._summary_before = order_summary.empty_contribution()
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        try:
+            if exc_type is None:
+                try:
+                    if self._summary_orders:
+                        after = order_summary.contribution(self.cursor, self._summary_orders)
+                        order_summary.apply_delta(self.cursor, self._summary_before, after)
+                    if self._tables:
+                        self.model._bump_version(self.cursor, *sorted(self._tables))
+                    self.conn.commit()
+                except Exception:
+                    self.conn.rollback()
+                    raise
+                if self._tables:
+                    self.model._tables_changed(*self._tables)
+            else:
+                self.conn.rollback()
+        finally:
+            self.cursor.close()
+            self.model.pool.release(self.conn)
+            self.conn = None
+            self.cursor = None
+        return False
+
+    def execute(self, query, params=(), *tables):
+        """Run one statement and remember which tables it changed"""
+        self.cursor.execute(query, params)
+        self._tables.update(tables)
+        return self.cursor
+
+    # ---------------------- ORDERS ----------------------
+    def insert_order(self, customer_id, staff_id, total_amount, status='Pending'):
+        self.execute("""
+                     INSERT INTO Orders (CustomerID, StaffID, TotalAmount, Status)
+                     VALUES (%s, %s, %s, %s)
+                     """, (customer_id, staff_id, total_amount, status), 'Orders')
+        order_id = self.cursor.lastrowid
+        # New order: nothing to take back from the summary
+        self._summary_orders.add(order_id)
+        return order_id
+
+    def set_order_status(self, order_id, status):
+        self._summarise_order(order_id)
+        self.execute("UPDATE Orders SET Status=%s WHERE OrderID=%s", (status, order_id), 'Orders')
+
+    def set_order_total(self, order_id, total_amount):
+        self._summarise_order(order_id)
+        self.execute("UPDATE Orders SET TotalAmount=%s WHERE OrderID=%s", (total_amount, order_id), 'Orders')
+
+    def mark_order_picked_up(self, order_id, staff_id, picked_at):
+        """Pickup: the order moves to Processing and to the staff member who collected it"""
+        self._summarise_order(order_id)
+        self.execute("""
+                     UPDATE Orders
+                     SET Status     = 'Processing',
+                         DatePicked = %s,
+                         StaffID    = %s
+                     WHERE OrderID = %s
+                     """, (picked_at, staff_id, order_id), 'Orders')
+
+    def mark_order_delivered(self, order_id, delivered_at):
+        """Delivery time only: DateDelivered is not part of any summary rollup"""
+        self.execute("UPDATE Orders SET DateDelivered=%s WHERE OrderID=%s", (delivered_at, order_id), 'Orders')
+
+    def delete_order(self, order_id):
+        """Delete an order (cascades to related tables); returns the number of rows deleted"""
+        self._summarise_order(order_id)
+        return self.execute("DELETE FROM Orders WHERE OrderID=%s", (order_id,), 'Orders').rowcount
+
+    def insert_order_service(self, order_id, service_name, weight_kg, price_per_kg,
+                             wash_amount, fast_dry, fast_dry_amount, iron_only,
+                             iron_only_amount, fold, fold_amount, total_amount):
+        self._summarise_order(order_id)
+        self.execute("""
+                     INSERT INTO OrderService
+                     (OrderID, ServiceName, WeightKg, PriceperKG, WashAmount,
+                      FastDry, FastDryAmount, IronOnly, IronOnlyAmount,
+                      Fold, FoldAmount, TotalAmount)
+                     VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s, %s)
+                     """, (order_id, service_name, weight_kg, price_per_kg,
+                           wash_amount, fast_dry, fast_dry_amount, iron_only,
+                           iron_only_amount, fold, fold_amount, total_amount), 'OrderService')
+        return self.cursor.lastrowid
+
+    def update_order_service(self, service_id, weight_kg, price_per_kg, wash_amount,
+                             fast_dry, fast_dry_amount, iron_only, iron_only_amount,
+                             fold, fold_amount, total_amount):
+        self._summarise_order(order_summary.order_of_service(self.cursor, service_id))
+        self.execute("""
+                     UPDATE OrderService
+                     SET WeightKg       = %s,
+                         PriceperKG     = %s,
+                         WashAmount     = %s,
+                         FastDry        = %s,
+                         FastDryAmount  = %s,
+                         IronOnly       = %s,
+                         IronOnlyAmount = %s,
+                         Fold           = %s,
+                         FoldAmount     = %s,
+                         TotalAmount    = %s
+                     WHERE OrderServiceID = %s
+                     """, (weight_kg, price_per_kg, wash_amount, fast_dry, fast_dry_amount,
+                           iron_only, iron_only_amount, fold, fold_amount, total_amount,
+                           service_id), 'OrderService')
+
+    def insert_transaction(self, order_id, amount_paid, payment_method, staff_id=None):
+        self.execute("""
+                     INSERT INTO Transactions (OrderID, AmountPaid, PaymentMethod, StaffID)
+                     VALUES (%s, %s, %s, %s)
+                     """, (order_id, amount_paid, payment_method, staff_id), 'Transactions')
+        return self.cursor.lastrowid
+
+    def _summarise_order(self, order_id):
+        """Call before changing an order: locks it and records what it adds to the summary now, once per unit"""
+        if order_id is None or order_id in self._summary_orders:
+            return
+        self._summary_orders.add(order_id)
+        order_summary.merge(self._summary_before, order_summary.contribution(self.cursor, [order_id]))
+
+    # ---------------------- STAFF ----------------------
+    def log_activity(self, staff_id, activity_type, order_id=None, customer_id=None):
+        self.execute("""
+                     INSERT INTO StaffActivityLog
+                         (StaffID, ActivityType, OrderID, CustomerID, ActivityTime)
+                     VALUES (%s, %s, %s, %s, NOW())
+                     """, (staff_id, activity_type, order_id, customer_id), 'StaffActivityLog')
+
+    def touch_staff(self, staff_id):
+        """Update LastActiveAt (not a tracked change, same as update_staff_last_active)"""
+        self.execute("UPDATE Staff SET LastActiveAt = NOW() WHERE StaffID = %s", (staff_id,))
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt
+
+from View.fonts import FREDOKA, apply_fonts
 
 
 class CreateCustomer:
@@ -19,47 +19,15 @@ class CreateCustomer:
     def setup_CreateCustomer_ui(self):
         """Setup dashboard-specific UI elements"""
 
-        # Add "Dashboard" title label
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            if hasattr(self.main_window, "ok_8"):
-                title= getattr(self.main_window, "ok_8")
-                title.setFont(QFont(family,30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            # Check if title label already exists, if not create i
-
-        # Setup fonts for dashboard buttons
-        Pl_buttons = ["PI_3","PI_4"]
-        for name in Pl_buttons:
-            if hasattr(self.main_window, name):
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                name = getattr(self.main_window, name)
-                name.setFont(QFont(family, 10))
-                name.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        cs_buttons = ["label_42","label_43", "label_44", "label_49", "label_50", "label_51", "label_52","label_53","label_54"]
-        for name in cs_buttons:
-            if hasattr(self.main_window, name):
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                name = getattr(self.main_window, name)
-                name.setFont(QFont(family, 8))
-                name.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        side_buttons = ["Homebut_6", "Userbut_6", "Dashbut_6", "Orderbut_6","Reportbut_6", "Settbut_6"]
-        for name in side_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        click_buttons =["crt_btn_3","crt_btn_4"]
-        for name in click_buttons:
-            if hasattr(self.main_window, name):
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont(family, 10))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Title, section headings, field labels, sidebar and action buttons
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_8"]),
+            (FREDOKA, 10, ["PI_3", "PI_4"]),
+            (FREDOKA, 8, ["label_42", "label_43", "label_44", "label_49", "label_50",
+                          "label_51", "label_52", "label_53", "label_54"]),
+            ("Arial", 15, ["Homebut_6", "Userbut_6", "Dashbut_6", "Orderbut_6", "Reportbut_6", "Settbut_6"]),
+            (FREDOKA, 10, ["crt_btn_3", "crt_btn_4"]),
+        ])
 
     def show(self):
         """Show the dashboard page"""
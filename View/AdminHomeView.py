@@ -1,11 +1,12 @@
 import os
 
-from PyQt6 import uic
-from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QMainWindow, QLabel
-from PyQt6.QtGui import QFontDatabase, QPixmap, QPainter, QFont
+from PyQt6.QtGui import QPixmap, QPainter
+from View.ui_loader import load_ui
 from datetime import datetime
-import Model.Resc_rc
+from Model.resources import ensure_resources, resource_pixmap
+from Model.order_stats import EMPTY_ORDER_STATS
+from View.fonts import FREDOKA, FREDOKA_BOLD, get_font, apply_fonts
 
 
 
@@ -13,13 +14,16 @@ class AdminHome(QMainWindow):
     def __init__(self):
         super().__init__()
 
+        # The .ui file references :/ images, register the compiled resources first
+        ensure_resources()
+
         # Load the main UI file
         current_dir = os.path.dirname(os.path.abspath(__file__))
         ui_path = os.path.join(current_dir, "AdminMainWindow.ui")
-        uic.loadUi(ui_path, self)
+        load_ui(ui_path, self)
 
-        # Load image from QRC resource
-        self.image = QPixmap(":/images/4.png")
+        # Background image, decoded on first paint (shared by both home windows)
+        self.image = None
 
         # Get page indices by finding widgets by objectName
         self.home_page_index = self.find_page_index("AH")
@@ -77,44 +81,18 @@ class AdminHome(QMainWindow):
         # Washy label
         label = QLabel("Washy", self)
         label.setGeometry(110, 35, 150, 80)
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-Bold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            label.setFont(QFont(family, 22))
-            if hasattr(self, "ok"):
-                ok = getattr(self, "ok")
-                ok.setFont(QFont(family, 30))
-                ok.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Sidebar button fonts
-        sidebar_buttons = ["Homebut_2", "Userbut_2", "Orderbut_2", "Settbut_2",
-                           "Reportbut_2", "Dashbut_2"]
-        for name in sidebar_buttons:
-            if hasattr(self, name):
-                btn = getattr(self, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Other buttons
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_buttons = ["b1", "b2", "b3", "b4", "b5"]
-            for button in other_buttons:
-                if hasattr(self, button):
-                    btn = getattr(self, button)
-                    btn.setFont(QFont(family, 10))
-        if font_id!= -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_label = ["l6","label_31","label_29","label_16","l2_3"]
-            for label in other_label:
-                if hasattr(self, label):
-                    lb = getattr(self, label)
-                    lb.setFont(QFont(family, 11))
-
-        if hasattr(self, "label_16"):
-            label = getattr(self, "label_16")
-            label.setFont(QFont("Arial", 11))
+        label.setFont(get_font(FREDOKA_BOLD, 22))
+
+        # Title, sidebar buttons, quick-action buttons and home labels
+        apply_fonts(self, [
+            (FREDOKA_BOLD, 30, ["ok"]),
+            ("Arial", 15, ["Homebut_2", "Userbut_2", "Orderbut_2", "Settbut_2", "Reportbut_2", "Dashbut_2"]),
+        ])
+        apply_fonts(self, [
+            (FREDOKA, 10, ["b1", "b2", "b3", "b4", "b5"]),
+            (FREDOKA, 11, ["l6", "label_31", "label_29", "l2_3"]),
+            ("Arial", 11, ["label_16"]),
+        ], no_focus=False)
 
     # In AdminHomeView.py - REPLACE the load_home_data method with this:
 
@@ -176,88 +154,16 @@ class AdminHome(QMainWindow):
             traceback.print_exc()
 
     def get_order_statistics(self):
-        """Get order statistics for the home page"""
-        print("🔵 ADMIN get_order_statistics() CALLED!")  # Debug line
-        try:
-            if not self.model:
-                print("✗ Model not available for statistics")
-                return {
-                    'completed_today': 0,
-                    'pending_issues': 0,
-                    'pending_delivery': 0,
-                    'pending_pickup': 0
-                }
-
-            # Get today's date
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            cursor = self.model.conn.cursor(dictionary=True)
-
-            # 1. Get orders completed today
-            cursor.execute("""
-                           SELECT COUNT(*) as completed_today
-                           FROM Orders
-                           WHERE DATE (DateDelivered) = %s AND Status = 'Completed'
-                           """, (today,))
-            result = cursor.fetchone()
-            completed_today = result['completed_today'] if result else 0
-            print(f"🔵 Query 1 - Completed today: {completed_today}")
-
-            # 2. Get pending issues (orders not completed AND not cancelled)
-            query2 = """
-                     SELECT COUNT(*) as pending_issues
-                     FROM Orders
-                     WHERE Status NOT IN ('Completed', 'Cancelled')
-                     """
-            print(f"🔵 Executing query 2: {query2}")
-            cursor.execute(query2)
-            result = cursor.fetchone()
-            pending_issues = result['pending_issues'] if result else 0
-            print(f"🔵 Query 2 - Pending issues: {pending_issues}")
-
-            # 3. Get pending delivery orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_delivery
-                           FROM Orders
-                           WHERE (Status = 'Ready for Delivery' OR Status = 'Processing')
-                             AND Status != 'Cancelled'
-                           """)
-            result = cursor.fetchone()
-            pending_delivery = result['pending_delivery'] if result else 0
-            print(f"🔵 Query 3 - Pending delivery: {pending_delivery}")
-
-            # 4. Get pending pickup orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_pickup
-                           FROM Orders
-                           WHERE Status = 'Pending'
-                           """)
-            result = cursor.fetchone()
-            pending_pickup = result['pending_pickup'] if result else 0
-            print(f"🔵 Query 4 - Pending pickup: {pending_pickup}")
-
-            cursor.close()
-
-            print(
-                f"✓ Statistics retrieved: Today={completed_today}, Issues={pending_issues}, Delivery={pending_delivery}, Pickup={pending_pickup}")
-
-            return {
-                'completed_today': completed_today,
-                'pending_issues': pending_issues,
-                'pending_delivery': pending_delivery,
-                'pending_pickup': pending_pickup
-            }
+        """Get order statistics for the home page (shared Model service, one cached query)"""
+        if not self.model:
+            print("✗ Model not available for statistics")
+            return dict(EMPTY_ORDER_STATS)
 
+        try:
+            return self.model.order_stats.get_stats()
         except Exception as e:
-            import traceback
             print(f"✗ Error getting order statistics: {e}")
-            traceback.print_exc()
-            return {
-                'completed_today': 0,
-                'pending_issues': 0,
-                'pending_delivery': 0,
-                'pending_pickup': 0
-            }
+            return dict(EMPTY_ORDER_STATS)
 
     def update_profile_name(self):
         """Update the profile name with admin information"""
@@ -280,6 +186,8 @@ class AdminHome(QMainWindow):
             print(f"✗ Error updating profile name: {e}")
 
     def paintEvent(self, event):
+        if self.image is None:
+            self.image = resource_pixmap(":/images/4.png")
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self.width(), self.height(), self.image)
         painter.end()
\ No newline at end of file
@@ -1,6 +1,5 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt
+from View.fonts import FREDOKA, get_font, apply_fonts
 
 
 class AReport:
@@ -19,41 +18,20 @@ class AReport:
     def setup_report_ui(self):
         """Setup dashboard-specific UI elements"""
 
-        # Add "Dashboard" title label
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            if hasattr(self.main_window, "ok_7"):
-                title= getattr(self.main_window, "ok_7")
-                title.setFont(QFont(family,30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            # Check if title label already exists, if not create i
-
         if hasattr(self.main_window, "line4"):
-            le = getattr(self.main_window, "line4")
-            le.setPlaceholderText("Search")
-            le.setFont(QFont("Arial", 10))
-
-        # Setup fonts for dashboard buttons
-        report_buttons = ["Homebut_9", "Userbut_9", "Dashbut_9", "Orderbut_9",
-                             "Reportbut_9", "Settbut_9"]
-        for name in report_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+            self.main_window.line4.setPlaceholderText("Search")
 
-        other_buttons = ["nwbut_11","nwbut_13","nwbut_14", "gotc_4"]
-        for fbut in other_buttons:
-            if hasattr(self.main_window, fbut):
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-                but = getattr(self.main_window, fbut)
-                but.setFont(QFont(family, 10))
-                but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Title, sidebar and action buttons; the search box keeps its focus
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_7"]),
+            ("Arial", 15, ["Homebut_9", "Userbut_9", "Dashbut_9", "Orderbut_9", "Reportbut_9", "Settbut_9"]),
+            (FREDOKA, 10, ["nwbut_11", "nwbut_13", "nwbut_14", "gotc_4"]),
+        ])
+        apply_fonts(self.main_window, [("Arial", 10, ["line4"])], no_focus=False)
 
         if hasattr(self.main_window, "tableWidget_4"):
             table = getattr(self.main_window, "tableWidget_4")
-            table.setFont(QFont("Arial", 10))
+            table.setFont(get_font("Arial", 10))
             table.setSortingEnabled(True)
             table.setSelectionBehavior(table.SelectionBehavior.SelectRows)
             table.setSelectionMode(table.SelectionMode.SingleSelection)
@@ -1,5 +1,4 @@
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt
+from View.fonts import FREDOKA, get_font, apply_fonts
 
 
 class AManager:
@@ -15,49 +14,24 @@ class AManager:
     def setup_user_ui(self):
         """Setup user manager-specific UI elements"""
 
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-
-            if hasattr(self.main_window, "ok_3"):
-                title = getattr(self.main_window, "ok_3")
-
-                title.setFont(QFont(family, 30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            other_buttons = ["nwbut", "nwbut_2", "nwbut_3", "nwbut_4", "gotc"]
-            for fbut in other_buttons:
-                if hasattr(self.main_window, fbut):
-                    but = getattr(self.main_window, fbut)
-                    but.setFont(QFont(family, 10))
-                    but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        users_buttons = [
-            "Homebut_5", "Userbut_5", "Dashbut_5",
-            "Orderbut_5", "Reportbut_5", "Settbut_5"
-        ]
-        for name in users_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
         if hasattr(self.main_window, "line"):
             le = getattr(self.main_window, "line")
             le.setPlaceholderText("Search staff by name, email, or phone...")
-            le.setFont(QFont("Arial", 10))
             le.setClearButtonEnabled(True)
 
-        if hasattr(self.main_window, "name_srt_btn"):
-            btn = getattr(self.main_window, "name_srt_btn")
-            btn.setFont(QFont("Arial", 10))
-            btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Title, action buttons, sidebar and sort button; the search box keeps its focus
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_3"]),
+            (FREDOKA, 10, ["nwbut", "nwbut_2", "nwbut_3", "nwbut_4", "gotc"]),
+            ("Arial", 15, ["Homebut_5", "Userbut_5", "Dashbut_5", "Orderbut_5", "Reportbut_5", "Settbut_5"]),
+            ("Arial", 10, ["name_srt_btn"]),
+        ])
+        apply_fonts(self.main_window, [("Arial", 10, ["line"])], no_focus=False)
 
         # UPDATED: Setup table widget with correct name 'tw'
         if hasattr(self.main_window, "tw"):
             table = getattr(self.main_window, "tw")
-            table.setFont(QFont("Arial", 10))
+            table.setFont(get_font("Arial", 10))
             table.setSortingEnabled(True)
             table.setSelectionBehavior(table.SelectionBehavior.SelectRows)
             table.setSelectionMode(table.SelectionMode.SingleSelection)
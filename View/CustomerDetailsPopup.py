@@ -4,10 +4,12 @@ Draggable popup window for displaying customer details
 Loads UI from CustomerDetailsPopup.ui created in Qt Designer
 Connected to database for real-time customer data
 """
-from Model.report_generator import WashyEnhancedReportGenerator
-from PyQt6 import QtWidgets, uic
+from Model.report_worker import ReportJob, attach_progress_dialog
+from PyQt6 import QtWidgets
 from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QFont, QFontDatabase, QCursor
+from PyQt6.QtGui import QCursor
+from View.ui_loader import load_ui
+from View.fonts import FREDOKA, apply_fonts
 from datetime import datetime
 import os
 
@@ -37,31 +39,14 @@ class CustomerDetailsPopup(QtWidgets.QWidget):
 
         # Load UI file
         if os.path.exists(ui_file):
-            uic.loadUi(ui_file, self)
+            load_ui(ui_file, self)
             self.setup_loaded_ui()
         else:
             self.create_basic_ui()
 
-        # Load custom font - Apply to heading labels only (matching StaffDetailsPopup)
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            # Apply font to heading labels only
-            for label_name in ['label_personal_info', 'label_order_stats', 'label_order_history']:
-                label = self.findChild(QtWidgets.QLabel, label_name)
-                if label:
-                    label.setFont(QFont(family, 10))
-                    label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_buttons = ["print"]
-            for fbut in other_buttons:
-                if hasattr(self, fbut):
-                    but = getattr(self, fbut)
-                    but.setFont(QFont(family, 10))
-                    but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Heading labels and the print button
+        apply_fonts(self, [(FREDOKA, 10, ["label_personal_info", "label_order_stats",
+                                          "label_order_history", "print"])])
 
         if hasattr(self, 'print'):
             self.print.clicked.connect(self.print_customer_pdf)
@@ -158,13 +143,30 @@ class CustomerDetailsPopup(QtWidgets.QWidget):
             self.dragging = False
             self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
 
-    def loadCustomerFromDatabase(self, customer_id):
-        """Load customer data from database using model"""
+    # ---------------------- POPUP POOL ----------------------
+    # Tables the record below is built from (see View/PopupPool.py)
+    RECORD_TABLES = ('Customer', 'Address', 'Orders')
+
+    @staticmethod
+    def fetch_record(model, customer_id):
+        """Customer plus the address lookup format_customer_data() needs"""
+        customer_data = model.get_customer_by_id(customer_id)
+        if not customer_data:
+            return None
+        customer_data['_addresses'] = model.get_customer_addresses(customer_id)
+        return customer_data
+
+    def load_record(self, customer_id, record=None):
+        return self.loadCustomerFromDatabase(customer_id, record)
+
+    def loadCustomerFromDatabase(self, customer_id, customer_data=None):
+        """Load customer data from database using model (or a prefetched record)"""
         self.current_customer_id = customer_id
         if not self.model:
             return False
 
-        customer_data = self.model.get_customer_by_id(customer_id)
+        if customer_data is None:
+            customer_data = self.model.get_customer_by_id(customer_id)
 
         if not customer_data:
             return False
@@ -245,7 +247,10 @@ class CustomerDetailsPopup(QtWidgets.QWidget):
         addresses_text = "No addresses on file"
         if self.model:
             try:
-                addresses = self.model.get_customer_addresses(customer_id)
+                if '_addresses' in db_data:
+                    addresses = db_data['_addresses']
+                else:
+                    addresses = self.model.get_customer_addresses(customer_id)
 
                 if addresses:
                     address_list = []
@@ -370,30 +375,15 @@ class CustomerDetailsPopup(QtWidgets.QWidget):
                 'database': 'washy'
             }
 
-            report_gen = WashyEnhancedReportGenerator(db_config)
-
-            # Show progress cursor
-            QtWidgets.QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-
-            success = report_gen.generate_customer_report(self.current_customer_id)
-
-            QtWidgets.QApplication.restoreOverrideCursor()
-
-            if success:
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Success",
-                    "Customer report generated successfully!\n\nLocation: Current directory"
-                )
-            else:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Error",
-                    "Failed to generate PDF report."
-                )
+            # Build the PDF in a worker process so the popup stays responsive
+            job = ReportJob('customer', getattr(self.model, 'db_config', db_config),
+                            (self.current_customer_id,), parent=self)
+            attach_progress_dialog(job, self, "Generating Report", "Generating customer report...")
+            job.finished.connect(self.on_pdf_finished)
+            self.report_job = job
+            job.start()
 
         except Exception as e:
-            QtWidgets.QApplication.restoreOverrideCursor()
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
@@ -403,6 +393,22 @@ class CustomerDetailsPopup(QtWidgets.QWidget):
             import traceback
             traceback.print_exc()
 
+    def on_pdf_finished(self, success, result):
+        """Worker finished: result is the saved filename, or the error text"""
+        self.report_job = None
+        if success:
+            QtWidgets.QMessageBox.information(
+                self,
+                "Success",
+                f"Customer report generated successfully!\n\nFile: {result}"
+            )
+        else:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Error",
+                f"Failed to generate PDF report.\n{result}"
+            )
+
     def closeEvent(self, event):
         """Handle popup close event safely"""
         try:
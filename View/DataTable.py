@@ -0,0 +1,350 @@
+"""
+Washy Laundry Management System - Shared Data Table
+Model/view replacement for the QTableWidget list screens
+"""
+
+from datetime import date, datetime
+from decimal import Decimal
+
+from PyQt6.QtCore import Qt, QAbstractTableModel, QModelIndex, QSortFilterProxyModel
+from PyQt6.QtGui import QColor
+from PyQt6.QtWidgets import QTableView, QTableWidget, QAbstractItemView, QHeaderView
+
+# Status colours used by every order list
+STATUS_COLORS = {
+    'Completed': QColor(Qt.GlobalColor.darkGreen),
+    'Pending': QColor(Qt.GlobalColor.darkYellow),
+    'Processing': QColor(Qt.GlobalColor.darkBlue),
+    'Ready': QColor(Qt.GlobalColor.darkBlue),
+    'Ready for Delivery': QColor(Qt.GlobalColor.darkBlue),
+    'Cancelled': QColor(Qt.GlobalColor.darkRed),
+}
+
+
+def status_color(status):
+    """Foreground colour for an order status (None = default)"""
+    return STATUS_COLORS.get(status)
+
+
+def default_sort_key(value):
+    """Sort numbers numerically, dates chronologically and text case-insensitively"""
+    if value is None:
+        return ""
+    if isinstance(value, (int, float, Decimal)) and not isinstance(value, bool):
+        return float(value)
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return str(value).lower()
+
+
+class TableColumn:
+    """One visible column: header text plus how to render/sort/colour a record"""
+
+    def __init__(self, header, display, sort_key=None, color=None, align=None):
+        # display(record) -> str, sort_key(record) -> raw value, color(record) -> QColor/None
+        self.header = header
+        self.display = display
+        self.sort_key = sort_key
+        self.color = color
+        self.align = align
+
+
+class ColumnarTableModel(QAbstractTableModel):
+    """Read-only table model that keeps each column in its own flat list"""
+
+    SORT_ROLE = Qt.ItemDataRole.UserRole + 1
+
+    def __init__(self, columns, keys=(), parent=None):
+        super().__init__(parent)
+        self.columns = columns
+        self.keys = tuple(keys)
+        self._display = [[] for _ in columns]
+        self._sort = [[] for _ in columns]
+        self._colors = [None for _ in columns]
+        self._values = {key: [] for key in self.keys}
+        self._row_count = 0
+
+        # Keyset paging: fetch_page(after, page_size) -> records
+        self._fetch_page = None
+        self._page_size = 0
+        self._has_more = False
+
+    def _columnize(self, records):
+        """Split records into per-column display/sort/colour lists"""
+        display, sort, colors = [], [], []
+        for column in self.columns:
+            shown = [column.display(record) for record in records]
+            display.append([text if isinstance(text, str) else str(text) for text in shown])
+            if column.sort_key:
+                sort.append([default_sort_key(column.sort_key(record)) for record in records])
+            else:
+                sort.append(None)
+            colors.append([column.color(record) for record in records] if column.color else None)
+        values = {key: [record.get(key) for record in records] for key in self.keys}
+        return display, sort, colors, values
+
+    def set_records(self, records):
+        """Replace every row; records are dicts, only the needed fields are kept"""
+        self.beginResetModel()
+        self._display, self._sort, self._colors, self._values = self._columnize(records)
+        self._row_count = len(records)
+        self._fetch_page = None
+        self._has_more = False
+        self.endResetModel()
+
+    def append_records(self, records):
+        """Add rows at the end without touching the ones already shown"""
+        if not records:
+            return
+        display, sort, colors, values = self._columnize(records)
+        first = self._row_count
+        self.beginInsertRows(QModelIndex(), first, first + len(records) - 1)
+        for column in range(len(self.columns)):
+            self._display[column].extend(display[column])
+            if self._sort[column] is not None:
+                self._sort[column].extend(sort[column])
+            if self._colors[column] is not None:
+                self._colors[column].extend(colors[column])
+        for key in self.keys:
+            self._values[key].extend(values[key])
+        self._row_count += len(records)
+        self.endInsertRows()
+
+    def set_pager(self, fetch_page, page_size, first_page=None):
+        """Show the first page (fetched here unless given); later pages are pulled in through fetchMore()"""
+        records = fetch_page(None, page_size) if first_page is None else first_page
+        self.set_records(records)
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._has_more = len(records) == page_size
+
+    def reload_pages(self):
+        """Re-run the paged query for as many rows as are loaded; False if there is no pager"""
+        if self._fetch_page is None:
+            return False
+        fetch_page, page_size = self._fetch_page, self._page_size
+        wanted = max(self._row_count, page_size)
+        records = fetch_page(None, wanted)
+        self.set_records(records)
+        self._fetch_page = fetch_page
+        self._page_size = page_size
+        self._has_more = len(records) == wanted
+        return True
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_page is not None and self._has_more
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        # Keys of the last loaded row are the keyset cursor for the next page
+        after = {key: values[-1] for key, values in self._values.items()} if self._row_count else None
+        records = self._fetch_page(after, self._page_size)
+        self._has_more = len(records) == self._page_size
+        self.append_records(records)
+
+    def remove_row(self, row):
+        """Drop one row without reloading the rest"""
+        if not 0 <= row < self._row_count:
+            return
+        self.beginRemoveRows(QModelIndex(), row, row)
+        for column_lists in (self._display, self._sort, self._colors):
+            for values in column_lists:
+                if values is not None:
+                    del values[row]
+        for values in self._values.values():
+            del values[row]
+        self._row_count -= 1
+        self.endRemoveRows()
+
+    def set_cell(self, row, column, text, color=None):
+        """Change one visible cell in place (e.g. a status after an update)"""
+        self._display[column][row] = text
+        if self._sort[column] is not None:
+            self._sort[column][row] = default_sort_key(text)
+        if self._colors[column] is not None:
+            self._colors[column][row] = color
+        index = self.index(row, column)
+        self.dataChanged.emit(index, index)
+
+    def value(self, row, key):
+        """Raw value of a stored key (e.g. 'OrderID') for a source row"""
+        return self._values[key][row]
+
+    def text(self, row, column):
+        return self._display[column][row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else self._row_count
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self.columns)
+
+    def data(self, index, role=Qt.ItemDataRole.DisplayRole):
+        if not index.isValid():
+            return None
+        row, column = index.row(), index.column()
+        if role == Qt.ItemDataRole.DisplayRole:
+            return self._display[column][row]
+        if role == self.SORT_ROLE:
+            sort_values = self._sort[column]
+            return sort_values[row] if sort_values is not None else self._display[column][row].lower()
+        if role == Qt.ItemDataRole.ForegroundRole:
+            colors = self._colors[column]
+            return colors[row] if colors is not None else None
+        if role == Qt.ItemDataRole.TextAlignmentRole:
+            return self.columns[column].align
+        return None
+
+    def headerData(self, section, orientation, role=Qt.ItemDataRole.DisplayRole):
+        if role == Qt.ItemDataRole.DisplayRole and orientation == Qt.Orientation.Horizontal:
+            return self.columns[section].header
+        return None
+
+
+class DataTable:
+    """
+    QTableView + ColumnarTableModel + QSortFilterProxyModel for a list screen.
+
+    The QTableWidget created by the .ui file is swapped for a QTableView in
+    the same place (same geometry, style and object name) and the window
+    attribute is re-pointed to the new view.
+    """
+
+    def __init__(self, window, name, columns, keys=()):
+        self.view = self._install_view(window, name)
+        self.model = ColumnarTableModel(columns, keys, self.view)
+        self.proxy = QSortFilterProxyModel(self.view)
+        self.proxy.setSourceModel(self.model)
+        self.proxy.setSortRole(ColumnarTableModel.SORT_ROLE)
+        self.proxy.setFilterCaseSensitivity(Qt.CaseSensitivity.CaseInsensitive)
+        self.proxy.setFilterKeyColumn(-1)
+        self.view.setModel(self.proxy)
+
+    @staticmethod
+    def _install_view(window, name):
+        old = getattr(window, name)
+        if isinstance(old, QTableView) and not isinstance(old, QTableWidget):
+            return old
+
+        view = QTableView(old.parentWidget())
+        view.setObjectName(name)
+        view.setGeometry(old.geometry())
+        view.setStyleSheet(old.styleSheet().replace("QTableWidget", "QTableView"))
+        view.setFont(old.font())
+        view.setAlternatingRowColors(old.alternatingRowColors())
+        view.setShowGrid(old.showGrid())
+        view.setWordWrap(old.wordWrap())
+        view.setVerticalScrollBarPolicy(old.verticalScrollBarPolicy())
+        view.setHorizontalScrollBarPolicy(old.horizontalScrollBarPolicy())
+        view.setSelectionBehavior(QAbstractItemView.SelectionBehavior.SelectRows)
+        view.setSelectionMode(QAbstractItemView.SelectionMode.SingleSelection)
+        view.setEditTriggers(QAbstractItemView.EditTrigger.NoEditTriggers)
+        view.setDragDropMode(QAbstractItemView.DragDropMode.NoDragDrop)
+        view.verticalHeader().setVisible(False)
+        view.horizontalHeader().setStretchLastSection(True)
+        view.horizontalHeader().setSectionsMovable(False)
+        view.horizontalHeader().setHighlightSections(False)
+        if old.isSortingEnabled():
+            # Header clicks sort; no column is sorted until the user asks
+            view.horizontalHeader().setSortIndicator(-1, Qt.SortOrder.AscendingOrder)
+            view.setSortingEnabled(True)
+        if not old.isHidden():
+            view.show()
+
+        old.hide()
+        old.deleteLater()
+        setattr(window, name, view)
+        return view
+
+    # ---------------------- DATA ----------------------
+    def set_records(self, records):
+        self.model.set_records(records)
+
+    def load_pages(self, fetch_page, page_size=100, first_page=None):
+        """
+        Keyset-paged loading: fetch_page(after, page_size) returns the next
+        records, `after` being the stored keys of the last loaded row (None
+        for the first page). Further pages load as the view scrolls down.
+        first_page: records already fetched for the first page (e.g. on a worker thread)
+        """
+        self.model.set_pager(fetch_page, page_size, first_page)
+
+    def reload_pages(self):
+        """
+        Refresh a paged table in place: the same query is re-run for every
+        row loaded so far, and the scroll position and selected row are kept.
+        Returns False if the table is not paged.
+        """
+        key = self.model.keys[0] if self.model.keys else None
+        selected = self.selected_value(key) if key else None
+        scroll = self.view.verticalScrollBar().value()
+
+        if not self.model.reload_pages():
+            return False
+
+        if selected is not None:
+            for row in range(self.model.rowCount()):
+                if self.model.value(row, key) == selected:
+                    self.view.selectRow(self.proxy.mapFromSource(self.model.index(row, 0)).row())
+                    break
+        self.view.verticalScrollBar().setValue(scroll)
+        return True
+
+    def row_count(self):
+        return self.proxy.rowCount()
+
+    def selected_row(self):
+        """Source row of the current selection, or None"""
+        rows = self.view.selectionModel().selectedRows()
+        if not rows:
+            return None
+        return self.proxy.mapToSource(rows[0]).row()
+
+    def value(self, row, key):
+        return self.model.value(row, key)
+
+    def text(self, row, column):
+        return self.model.text(row, column)
+
+    def selected_value(self, key):
+        """Stored key of the selected row (e.g. 'OrderID'), or None"""
+        row = self.selected_row()
+        return None if row is None else self.model.value(row, key)
+
+    def next_value(self, key):
+        """Stored key of the row shown below the selection (prefetch hint), or None"""
+        rows = self.view.selectionModel().selectedRows()
+        if not rows or rows[0].row() + 1 >= self.proxy.rowCount():
+            return None
+        below = self.proxy.mapToSource(self.proxy.index(rows[0].row() + 1, 0))
+        return self.model.value(below.row(), key)
+
+    def set_cell(self, row, column, text, color=None):
+        self.model.set_cell(row, column, text, color)
+
+    def remove_row(self, row):
+        self.model.remove_row(row)
+
+    # ---------------------- VIEW ----------------------
+    def sort(self, column, ascending=True):
+        order = Qt.SortOrder.AscendingOrder if ascending else Qt.SortOrder.DescendingOrder
+        self.view.sortByColumn(column, order)
+
+    def set_filter(self, text):
+        """Case-insensitive match against every visible column"""
+        self.proxy.setFilterFixedString(text)
+
+    def on_double_click(self, callback):
+        """callback(row, column) with source-model coordinates"""
+        self.view.doubleClicked.connect(
+            lambda index: callback(self.proxy.mapToSource(index).row(), index.column()))
+
+    def set_resize_modes(self, stretch=(0,), to_contents=(), interactive=()):
+        header = self.view.horizontalHeader()
+        for column in stretch:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Stretch)
+        for column in to_contents:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.ResizeToContents)
+        for column in interactive:
+            header.setSectionResizeMode(column, QHeaderView.ResizeMode.Interactive)
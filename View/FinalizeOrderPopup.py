@@ -1,8 +1,10 @@
 
 
-from PyQt6 import QtCore, QtGui, QtWidgets, uic
+from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import Qt, QPoint, pyqtSignal
-from PyQt6.QtGui import QFont, QFontDatabase, QCursor
+from PyQt6.QtGui import QCursor
+from View.ui_loader import load_ui
+from View.fonts import FREDOKA, get_font, apply_fonts
 from datetime import datetime
 import os
 
@@ -34,7 +36,7 @@ class FinalizeOrderPopup(QtWidgets.QWidget):
 
         # Load UI file
         if os.path.exists(ui_file):
-            uic.loadUi(ui_file, self)
+            load_ui(ui_file, self)
             self.setup_loaded_ui()
         else:
             print(f"Error: UI file '{ui_file}' not found!")
@@ -44,24 +46,13 @@ class FinalizeOrderPopup(QtWidgets.QWidget):
         self.load_custom_fonts()
 
     def load_custom_fonts(self):
-        """Load custom Fredoka font"""
-        font_path = "C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf"
-        if os.path.exists(font_path):
-            font_id = QFontDatabase.addApplicationFont(font_path)
-            if font_id != -1:
-                family = QFontDatabase.applicationFontFamilies(font_id)[0]
-
-                # Apply font to all labels
-                for obj in self.findChildren(QtWidgets.QLabel):
-                    obj.setFont(QFont(family, 10))
-                    obj.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-                # Apply font to buttons
-                button_names = ["b1", "b2", "crt_btn_10", "crt_btn_8"]
-                for button_name in button_names:
-                    if hasattr(self, button_name):
-                        btn = getattr(self, button_name)
-                        btn.setFont(QFont(family, 10))
+        """Apply the Fredoka font to the labels and buttons"""
+        # Every label, then the action buttons (which keep their focus policy)
+        fredoka = get_font(FREDOKA, 10)
+        for obj in self.findChildren(QtWidgets.QLabel):
+            obj.setFont(fredoka)
+            obj.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        apply_fonts(self, [(FREDOKA, 10, ["b1", "b2", "crt_btn_10", "crt_btn_8"])], no_focus=False)
 
     def set_staff_id(self, staff_id):
         """Set the staff ID for transactions"""
@@ -388,57 +379,34 @@ class FinalizeOrderPopup(QtWidgets.QWidget):
             print(f"✓ Processing transaction: OrderID={self.current_order_id}, "
                   f"Amount={amount_paid}, Method={payment_method}, StaffID={self.staff_id}")
 
-            # Add transaction to database
-            transaction_id = self.model.add_transaction(
+            # ✅ Payment, status change and activity log commit together
+            transaction_id = self.model.complete_order_payment(
                 order_id=self.current_order_id,
                 amount_paid=amount_paid,
                 payment_method=payment_method,
-                staff_id=self.staff_id
+                staff_id=self.staff_id,
+                customer_id=self.current_order_data.get('CustomerID')
             )
 
             if transaction_id:
-                # Update order status to Completed
-                success = self.model.update_order_status(self.current_order_id, 'Completed')
-
-                # Update staff last active timestamp
-                if self.staff_id:
-                    self.model.update_staff_last_active(self.staff_id)
-
-                # ✅ LOG ACTIVITY
-                if self.staff_id:
-                    customer_id = self.current_order_data.get('CustomerID')
-                    self.model.log_staff_activity(
-                        staff_id=self.staff_id,
-                        activity_type='COMPLETE_TRANSACTION',
-                        order_id=self.current_order_id,
-                        customer_id=customer_id
-                    )
-
-                if success:
-                    formatted_id = self.format_order_id(self.current_order_id)
-                    print(f"✓ Transaction completed: OrderID={self.current_order_id}, "
-                          f"TransactionID={transaction_id}, StaffID={self.staff_id}")
-
-                    # Show success message
-                    QtWidgets.QMessageBox.information(
-                        self,
-                        "Transaction Complete",
-                        f"Order {formatted_id} has been completed successfully!\n\n"
-                        f"Amount Paid: ₱{amount_paid:.2f}\n"
-                        f"Payment Method: {payment_method}"
-                    )
-
-                    # Emit signal that transaction is completed
-                    self.transaction_completed.emit(self.current_order_id)
-
-                    # Close the popup
-                    self.close()
-                else:
-                    QtWidgets.QMessageBox.warning(
-                        self,
-                        "Warning",
-                        f"Transaction recorded (ID: {transaction_id}), but failed to update order status."
-                    )
+                formatted_id = self.format_order_id(self.current_order_id)
+                print(f"✓ Transaction completed: OrderID={self.current_order_id}, "
+                      f"TransactionID={transaction_id}, StaffID={self.staff_id}")
+
+                # Show success message
+                QtWidgets.QMessageBox.information(
+                    self,
+                    "Transaction Complete",
+                    f"Order {formatted_id} has been completed successfully!\n\n"
+                    f"Amount Paid: ₱{amount_paid:.2f}\n"
+                    f"Payment Method: {payment_method}"
+                )
+
+                # Emit signal that transaction is completed
+                self.transaction_completed.emit(self.current_order_id)
+
+                # Close the popup
+                self.close()
             else:
                 QtWidgets.QMessageBox.critical(
                     self,
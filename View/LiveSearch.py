@@ -0,0 +1,113 @@
+"""
+Washy Laundry Management System - Live Search
+Debounced search boxes whose queries run on a worker thread
+"""
+
+from PyQt6.QtCore import QObject, QRunnable, QThreadPool, QTimer, pyqtSignal
+
+# Quiet time after the last keystroke before a query is started
+DEBOUNCE_MS = 250
+
+
+class _SearchRunnable(QRunnable):
+    def __init__(self, search, generation, term):
+        super().__init__()
+        self.search = search
+        self.generation = generation
+        self.term = term
+
+    def run(self):
+        try:
+            results, error = self.search.query(self.term), None
+        except Exception as e:
+            results, error = [], str(e)
+        # Emitted from the worker thread, delivered on the GUI thread (queued)
+        self.search.finished.emit(self.generation, self.term, results, error)
+
+
+class LiveSearch(QObject):
+    """
+    Search-as-you-type for one list screen.
+
+        self.customer_search = LiveSearch(
+            lambda term: self.model.search_customers(term),   # worker thread
+            self.apply_customer_search)                        # GUI thread: (term, results)
+
+        def search_customer(self):                             # textChanged slot
+            self.customer_search.request(self.admin_home.line2.text().strip())
+
+    - request() restarts a short debounce timer, so a burst of keystrokes
+      becomes one query; run_now() skips the wait (returnPressed).
+    - query(term) must only use @pooled Model methods, which lease their own
+      connection per thread, and must not touch widgets.
+    - At most one query per screen is in flight. Typing while it runs only
+      remembers the newest term, which is queried when the current one ends.
+    - Every request/cancel bumps a generation number. A result from an
+      older generation is dropped, so only the latest result set is applied.
+    """
+
+    finished = pyqtSignal(int, str, object, object)
+
+    def __init__(self, query, apply, delay_ms=DEBOUNCE_MS, name="Search", parent=None):
+        super().__init__(parent)
+        self.query = query
+        self.apply = apply
+        self.name = name
+
+        self._generation = 0
+        self._term = ""
+        self._running = False
+        self._pending = False
+
+        self._timer = QTimer(self)
+        self._timer.setSingleShot(True)
+        self._timer.setInterval(delay_ms)
+        self._timer.timeout.connect(self._start)
+
+        self.finished.connect(self._on_finished)
+
+    def request(self, term):
+        """Search for term once typing pauses"""
+        self._generation += 1
+        self._term = term
+        self._timer.start()
+
+    def run_now(self, term):
+        """Search for term without waiting"""
+        self._generation += 1
+        self._term = term
+        self._timer.stop()
+        self._start()
+
+    def cancel(self):
+        """Forget the pending search and ignore any result still on its way"""
+        self._generation += 1
+        self._timer.stop()
+        self._pending = False
+
+    def _start(self):
+        if self._running:
+            self._pending = True
+            return
+        self._running = True
+        self._pending = False
+        QThreadPool.globalInstance().start(_SearchRunnable(self, self._generation, self._term))
+
+    def _on_finished(self, generation, term, results, error):
+        self._running = False
+
+        if generation != self._generation:
+            print(f"✓ {self.name}: Discarded stale results for '{term}'")
+        elif error:
+            print(f"✗ {self.name}: Error searching '{term}': {error}")
+        else:
+            try:
+                self.apply(term, results)
+            except Exception as e:
+                print(f"✗ {self.name}: Error showing results for '{term}': {e}")
+                import traceback
+                traceback.print_exc()
+
+        # A newer term arrived meanwhile (unless its debounce timer will start it anyway)
+        if self._pending and not self._timer.isActive():
+            self._start()
@@ -1,7 +1,8 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QApplication, QPushButton, QLineEdit
-from PyQt6.QtGui import QPainter, QPixmap, QFont, QFontDatabase, QIcon
+from PyQt6.QtGui import QPainter, QPixmap, QFont, QIcon
 from PyQt6.QtCore import Qt
 import os
+from View.fonts import FREDOKA, get_font
 
 
 class LoginView(QWidget):
@@ -27,15 +28,7 @@ class LoginView(QWidget):
         label.setGeometry(0, 250, 1024, 60)
         label.setAlignment(Qt.AlignmentFlag.AlignCenter)
 
-        # Load custom font
-        font_path = os.path.join(base_path, "fonts/Fredoka-SemiBold.ttf")
-        font_id = QFontDatabase.addApplicationFont(font_path)
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-        else:
-            family = "Arial"  # Fallback font
-
-        label.setFont(QFont(family, 36, QFont.Weight.Bold))
+        label.setFont(get_font(FREDOKA, 36, QFont.Weight.Bold))
         label.setStyleSheet("color: #1a1a1a;")
 
         # USERNAME INPUT FIELD
@@ -83,7 +76,7 @@ class LoginView(QWidget):
         self.show_password_btn = QPushButton("Show", self)
         self.show_password_btn.setGeometry(610, 415, 45, 30)
         self.show_password_btn.setCursor(Qt.CursorShape.PointingHandCursor)
-        self.show_password_btn.setFont(QFont(family, 9))
+        self.show_password_btn.setFont(get_font(FREDOKA, 9))
         self.show_password_btn.setStyleSheet("""
             QPushButton {
                 background: transparent;
@@ -99,7 +92,7 @@ class LoginView(QWidget):
 
         # LOGIN BUTTON
         self.login_btn = QPushButton("Login", self)
-        self.login_btn.setFont(QFont(family, 16, QFont.Weight.Bold))
+        self.login_btn.setFont(get_font(FREDOKA, 16, QFont.Weight.Bold))
         self.login_btn.setGeometry(412, 480, 200, 50)
         self.login_btn.setCursor(Qt.CursorShape.PointingHandCursor)
         self.login_btn.setStyleSheet("""
@@ -4,11 +4,13 @@ Draggable popup window for displaying order details
 Loads UI from OrderDetailsPopup.ui created in Qt Designer
 Connected to database for real-time order data
 """
-from Model.report_generator import WashyEnhancedReportGenerator
-from PyQt6 import QtWidgets, uic
+from Model.report_worker import ReportJob, attach_progress_dialog
+from PyQt6 import QtWidgets
 from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QFont, QFontDatabase, QCursor
+from PyQt6.QtGui import QCursor
 from PyQt6.QtWidgets import QTableWidgetItem
+from View.ui_loader import load_ui
+from View.fonts import FREDOKA, get_font, apply_fonts
 from datetime import datetime
 import os
 
@@ -37,33 +39,16 @@ class OrderDetailsPopup(QtWidgets.QWidget):
 
         # Load UI file
         if os.path.exists(ui_file):
-            uic.loadUi(ui_file, self)
+            load_ui(ui_file, self)
             self.setup_loaded_ui()
         else:
             print(f"Error: UI file '{ui_file}' not found!")
             self.create_basic_ui()
 
-        # Load custom font for headings
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            for label_name in ['label_title', 'label_order_info', 'label_order_items',
-                              'label_summary', 'label_grand', 'label_address',
-                              'label_personal_info_3', 'label_address_2']:
-                label = self.findChild(QtWidgets.QLabel, label_name)
-                if label:
-                    label.setFont(QFont(family, 10))
-                    label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_buttons = ["print"]
-            for fbut in other_buttons:
-                if hasattr(self, fbut):
-                    but = getattr(self, fbut)
-                    but.setFont(QFont(family, 10))
-                    but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Heading labels and the print button
+        apply_fonts(self, [(FREDOKA, 10, ["label_title", "label_order_info", "label_order_items",
+                                          "label_summary", "label_grand", "label_address",
+                                          "label_personal_info_3", "label_address_2", "print"])])
 
         if hasattr(self, 'print'):
             self.print.clicked.connect(self.print_order_pdf)
@@ -74,6 +59,25 @@ class OrderDetailsPopup(QtWidgets.QWidget):
         """Format order ID as WSHY#001, WSHY#002, etc."""
         return f"WSHY#{order_id:03d}"
 
+    # ---------------------- POPUP POOL ----------------------
+    # Tables the record below is built from (see View/PopupPool.py)
+    RECORD_TABLES = ('Orders', 'OrderService', 'Transactions', 'Customer', 'Address', 'Staff')
+
+    @staticmethod
+    def fetch_record(model, order_id):
+        """Order plus the staff and address lookups setOrderData() needs"""
+        order_data = model.get_order_by_id(order_id)
+        if not order_data:
+            return None
+        staff_id = order_data.get('StaffID')
+        customer_id = order_data.get('CustomerID')
+        order_data['_staff'] = model.get_staff_by_id(staff_id) if staff_id else None
+        order_data['_addresses'] = model.get_customer_addresses(customer_id) if customer_id else []
+        return order_data
+
+    def load_record(self, order_id, record=None):
+        return self.loadOrderFromDatabase(order_id, record)
+
     def setup_loaded_ui(self):
         """Setup UI elements after loading .ui file"""
         # Connect close button
@@ -100,7 +104,7 @@ class OrderDetailsPopup(QtWidgets.QWidget):
         self.value_order_created = self.findChild(QtWidgets.QLabel, "value_order_created")
 
         # Apply Arial font to all value labels
-        arial_font = QFont("Arial", 9)
+        arial_font = get_font("Arial", 9)
         value_labels = [
             self.value_status, self.value_payment, self.value_orderby,
             self.value_procesd, self.value_address, self.value_wash,
@@ -129,7 +133,7 @@ class OrderDetailsPopup(QtWidgets.QWidget):
         self.ordertable.verticalHeader().setVisible(False)
 
         # Apply Arial font to table items
-        arial_font = QFont("Arial", 9)
+        arial_font = get_font("Arial", 9)
         self.ordertable.setFont(arial_font)
 
         # Apply Arial font to header
@@ -183,13 +187,14 @@ class OrderDetailsPopup(QtWidgets.QWidget):
             self.dragging = False
             self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
 
-    def loadOrderFromDatabase(self, order_id):
-        """Load order data from database using model"""
+    def loadOrderFromDatabase(self, order_id, order_data=None):
+        """Load order data from database using model (or a prefetched record)"""
         if not self.model:
             print("Error: No model provided")
             return False
 
-        order_data = self.model.get_order_by_id(order_id)
+        if order_data is None:
+            order_data = self.model.get_order_by_id(order_id)
 
         if not order_data:
             print(f"Error: Order {order_id} not found")
@@ -292,7 +297,10 @@ class OrderDetailsPopup(QtWidgets.QWidget):
             staff_id = order_data.get('StaffID')
             if staff_id:
                 try:
-                    staff_data = self.model.get_staff_by_id(staff_id)
+                    if '_staff' in order_data:
+                        staff_data = order_data['_staff']
+                    else:
+                        staff_data = self.model.get_staff_by_id(staff_id)
                     if staff_data:
                         staff_name = f"{staff_data.get('EFName', '')} {staff_data.get('ELName', '')}"
                         self.value_procesd.setText(staff_name.strip())
@@ -308,7 +316,10 @@ class OrderDetailsPopup(QtWidgets.QWidget):
             customer_id = order_data.get('CustomerID')
             if customer_id and self.model:
                 try:
-                    addresses = self.model.get_customer_addresses(customer_id)
+                    if '_addresses' in order_data:
+                        addresses = order_data['_addresses']
+                    else:
+                        addresses = self.model.get_customer_addresses(customer_id)
                     if addresses and len(addresses) > 0:
                         addr = addresses[0]
                         parts = []
@@ -429,33 +440,18 @@ class OrderDetailsPopup(QtWidgets.QWidget):
                 'database': 'washy'
             }
 
-            report_gen = WashyEnhancedReportGenerator(db_config)
-
             filename = f"C:\\Users\\NITRO\\PycharmProjects\\Washyy\\View\\Reports\\Order_WSHY{self.current_order_id:03d}.pdf"
 
-            QtWidgets.QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-
-            success = report_gen.generate_order_report(self.current_order_id, filename)
-
-            QtWidgets.QApplication.restoreOverrideCursor()
-
-            if success:
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Success",
-                    f"Order report saved as:\n{filename}\n\nLocation: Current directory"
-                )
-            else:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Error",
-                    "Failed to generate PDF report."
-                )
-
-
+            # Build the PDF in a worker process so the popup stays responsive
+            job = ReportJob('order', getattr(self.model, 'db_config', db_config),
+                            (self.current_order_id,), filename, parent=self)
+            attach_progress_dialog(job, self, "Generating Report",
+                                   f"Generating report for {self.format_order_id(self.current_order_id)}...")
+            job.finished.connect(self.on_pdf_finished)
+            self.report_job = job
+            job.start()
 
         except Exception as e:
-            QtWidgets.QApplication.restoreOverrideCursor()
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
@@ -465,6 +461,22 @@ class OrderDetailsPopup(QtWidgets.QWidget):
             import traceback
             traceback.print_exc()
 
+    def on_pdf_finished(self, success, result):
+        """Worker finished: result is the saved filename, or the error text"""
+        self.report_job = None
+        if success:
+            QtWidgets.QMessageBox.information(
+                self,
+                "Success",
+                f"Order report saved as:\n{result}\n\nLocation: Current directory"
+            )
+        else:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Error",
+                f"Failed to generate PDF report.\n{result}"
+            )
+
     def closeEvent(self, event):
         """Handle popup close event safely"""
         try:
@@ -0,0 +1,89 @@
+"""
+Washy Laundry Management System - Detail Popup Pool
+Keeps one built instance per popup type and parent window and rebinds it to new records
+"""
+
+from PyQt6.QtCore import QTimer
+
+
+class PopupPool:
+    """
+    Reusable detail popups.
+
+    Building a popup parses its .ui file and registers fonts, so each popup
+    class is built once per parent window and only rebound on later opens:
+
+        popup = popup_pool.open(OrderDetailsPopup, self.admin_home, self.model, order_id)
+        popup_pool.prefetch(OrderDetailsPopup, self.model, next_order_id)
+
+    A popup class takes part by providing:
+        RECORD_TABLES                    DataVersion tables its record is built from
+        fetch_record(model, record_id)   static, every query the popup needs
+        load_record(record_id, record)   bind a fetched record (None = query now)
+
+    Pooled popups are closed, never deleteLater()'d, by their controllers
+    (e.g. on logout); the parent windows outlive a logout and so do they.
+    """
+
+    def __init__(self):
+        self._popups = {}       # (popup class, parent) -> popup
+        self._prefetched = {}   # (popup class, record id) -> (record, data version)
+
+    def get(self, popup_class, parent, model):
+        """Built popup for this parent, creating it on first use"""
+        key = (popup_class, parent)
+        popup = self._popups.get(key)
+        if popup is None:
+            popup = popup_class(parent=parent, model=model)
+            self._popups[key] = popup
+            # A popup deleted elsewhere (or with its parent) is rebuilt on the next open
+            popup.destroyed.connect(lambda *_, key=key: self._popups.pop(key, None))
+            print(f"✓ PopupPool: Built {popup_class.__name__}")
+        # closeEvent() drops the model reference, so hand it back on every open
+        popup.model = model
+        return popup
+
+    def warm(self, popup_class, parent, model):
+        """Build the popup once the event loop is idle so the first open is cheap too"""
+        QTimer.singleShot(0, lambda: self.get(popup_class, parent, model))
+
+    def open(self, popup_class, parent, model, record_id):
+        """Rebind the pooled popup to record_id; returns the popup, or None if it could not load"""
+        popup = self.get(popup_class, parent, model)
+        record = self._take_prefetched(popup_class, model, record_id)
+        if not popup.load_record(record_id, record):
+            return None
+        return popup
+
+    def prefetch(self, popup_class, model, record_id):
+        """Load the record the user is likely to open next, after the current open has painted"""
+        if record_id is None or (popup_class, record_id) in self._prefetched:
+            return
+        QTimer.singleShot(0, lambda: self._prefetch(popup_class, model, record_id))
+
+    def _prefetch(self, popup_class, model, record_id):
+        version = model.get_data_version(popup_class.RECORD_TABLES)
+        record = popup_class.fetch_record(model, record_id)
+        if record:
+            # Only the latest hint per popup type is worth keeping
+            self._prefetched = {key: value for key, value in self._prefetched.items()
+                                if key[0] is not popup_class}
+            self._prefetched[(popup_class, record_id)] = (record, version)
+
+    def _take_prefetched(self, popup_class, model, record_id):
+        entry = self._prefetched.pop((popup_class, record_id), None)
+        if entry is None:
+            return None
+        record, version = entry
+        # Discard the record if any table it was built from changed since
+        if model.get_data_version(popup_class.RECORD_TABLES) != version:
+            return None
+        return record
+
+    def invalidate(self):
+        """Forget prefetched records (e.g. after logout)"""
+        self._prefetched.clear()
+
+
+# Shared by every controller
+popup_pool = PopupPool()
@@ -0,0 +1,162 @@
+"""
+Washy Laundry Management System - Refresh Scheduler
+One timer for every auto-refreshing page; only the page on screen is refreshed
+"""
+
+import time
+
+from PyQt6.QtCore import QEvent, QObject, QTimer
+
+
+class RefreshTask:
+    """One registered page refresh (see RefreshScheduler.register)"""
+
+    def __init__(self, window, page_index, callback, interval_ms, max_interval_ms, model, tables, name):
+        self.window = window
+        self.page_index = page_index
+        self.callback = callback
+        self.base_interval = interval_ms / 1000
+        self.max_interval = max_interval_ms / 1000
+        self.model = model
+        self.tables = tuple(tables or ())
+        self.name = name
+
+        self.interval = self.base_interval   # current interval, grows while data is unchanged
+        self.due = time.monotonic() + self.interval
+        self.versions = None                 # DataVersion snapshot of the last refresh
+        self.running = False
+
+
+class RefreshScheduler(QObject):
+    """
+    Periodic refreshes for the stacked pages of the admin and staff windows.
+
+        self.refresh_task = refresh_scheduler.register(
+            self.main_window, self.main_window.dashboard_page_index,
+            self.refresh_dashboard_data, interval_ms=30000,
+            model=self.model, tables=('Orders', 'Transactions'))
+
+    - One single-shot QTimer is armed for the next task that is due on a page
+      currently shown; tasks of other pages never run.
+    - Showing a page restarts its clock, since the page reloads itself on
+      show. Several refresh_now() calls before the timer fires run only once,
+      and a task that is still running is not started again.
+    - With model and tables, a tick first compares the DataVersion counters.
+      If nothing changed the callback is skipped and the interval doubles up
+      to max_interval_ms; a change runs it and resets the interval.
+    - Nothing runs while a window is minimized or hidden. Tasks that fell due
+      meanwhile run as soon as it is restored.
+    """
+
+    def __init__(self):
+        super().__init__()
+        self._tasks = []
+        self._windows = []
+        self._timer = None   # created on first use, after the QApplication exists
+
+    # ---------------------- REGISTRATION ----------------------
+    def register(self, window, page_index, callback, interval_ms=30000,
+                 model=None, tables=None, max_interval_ms=None, name=None):
+        """Refresh page_index of window every interval_ms while it is shown; returns the task"""
+        task = RefreshTask(window, page_index, callback, interval_ms,
+                           max_interval_ms or interval_ms * 4, model, tables,
+                           name or getattr(callback, '__qualname__', 'refresh'))
+        self._tasks.append(task)
+
+        if not any(watched is window for watched in self._windows):
+            self._windows.append(window)
+            window.stackedWidget.currentChanged.connect(
+                lambda index, w=window: self._on_page_changed(w, index))
+            window.installEventFilter(self)
+
+        if self._is_active(task):
+            self._snapshot(task)
+        self._schedule()
+        print(f"✓ RefreshScheduler: Registered {task.name} ({interval_ms // 1000}s)")
+        return task
+
+    def unregister(self, task):
+        if task in self._tasks:
+            self._tasks.remove(task)
+            self._schedule()
+
+    def refresh_now(self, task):
+        """Run task on the next timer tick (calls made before then are coalesced)"""
+        task.due = 0
+        self._schedule()
+
+    def mark_fresh(self, task):
+        """The page has just updated itself (e.g. after a local edit); restart its clock"""
+        self._snapshot(task)
+        self._schedule()
+
+    # ---------------------- STATE ----------------------
+    def eventFilter(self, obj, event):
+        if event.type() in (QEvent.Type.WindowStateChange, QEvent.Type.Show, QEvent.Type.Hide):
+            # isMinimized()/isVisible() are up to date once the event is handled
+            QTimer.singleShot(0, self._schedule)
+        return False
+
+    @staticmethod
+    def _is_active(task):
+        window = task.window
+        return (window.isVisible() and not window.isMinimized()
+                and window.stackedWidget.currentIndex() == task.page_index)
+
+    def _on_page_changed(self, window, index):
+        for task in self._tasks:
+            if task.window is window and task.page_index == index:
+                self._snapshot(task)
+        self._schedule()
+
+    def _snapshot(self, task):
+        task.interval = task.base_interval
+        task.due = time.monotonic() + task.interval
+        if task.model and task.tables:
+            task.versions = task.model.get_data_version(task.tables)
+
+    # ---------------------- TIMER ----------------------
+    def _schedule(self):
+        """Arm the timer for the earliest task due on a page that is shown"""
+        if self._timer is None:
+            self._timer = QTimer(self)
+            self._timer.setSingleShot(True)
+            self._timer.timeout.connect(self._tick)
+
+        active = [task for task in self._tasks if self._is_active(task)]
+        if not active:
+            self._timer.stop()
+            return
+        delay = max(0.0, min(task.due for task in active) - time.monotonic())
+        self._timer.start(int(delay * 1000))
+
+    def _tick(self):
+        now = time.monotonic()
+        for task in list(self._tasks):
+            if task.due <= now and self._is_active(task):
+                self._run(task)
+        self._schedule()
+
+    def _run(self, task):
+        if task.running:
+            return
+        task.running = True
+        try:
+            if task.model and task.tables:
+                changed, versions = task.model.get_changed_tables(task.versions, task.tables)
+                if task.versions is not None and not changed:
+                    task.interval = min(task.interval * 2, task.max_interval)
+                    return
+                task.versions = versions
+                print(f"🔄 RefreshScheduler: {task.name} ({', '.join(sorted(changed))} changed)")
+            task.callback()
+            task.interval = task.base_interval
+        except Exception as e:
+            print(f"✗ RefreshScheduler: {task.name} failed: {e}")
+        finally:
+            task.running = False
+            task.due = time.monotonic() + task.interval
+
+
+# Shared by every view and controller
+refresh_scheduler = RefreshScheduler()
@@ -1,16 +1,18 @@
-from PyQt6.QtWidgets import QLabel, QVBoxLayout, QWidget
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt, QTimer
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
-from matplotlib.figure import Figure
+from PyQt6.QtWidgets import QLabel
+from PyQt6.QtCore import Qt
 from datetime import datetime, timedelta
+from Model.order_stats import EMPTY_ORDER_STATS
+from View.fonts import FREDOKA, apply_fonts
+from View.RefreshScheduler import refresh_scheduler
+from View.WeeklyOrdersChart import WeeklyOrdersChart
 
 
 class SDashboard:
     """Staff Dashboard view logic - works with the staff dashboard page in stackedWidget"""
 
+    # Tables behind the counters, graph and live feed
+    REFRESH_TABLES = ('Orders', 'Transactions', 'Customer', 'StaffActivityLog')
+
     def __init__(self, staff_home, model):
         self.staff_home = staff_home
         self.model = model
@@ -24,70 +26,65 @@ class SDashboard:
         self.setup_weekly_orders_graph()
         self.setup_live_order_feed()
 
-        # Setup auto-refresh timer (refresh every 30 seconds)
-        self.refresh_timer = QTimer()
-        self.refresh_timer.timeout.connect(self.refresh_dashboard_data)
-        self.refresh_timer.start(30000)  # 30 seconds
+        # Controls switch to this page directly too, so watch the stacked widget
+        # to build the graph on the first visit whichever way it happens
+        self.staff_home.stackedWidget.currentChanged.connect(self.on_page_changed)
+        if self.staff_home.stackedWidget.currentIndex() == self.staff_home.dashboard_page_index:
+            self.ensure_graph_canvas()
+
+        # Any screen refreshing the shared order stats updates this page too
+        self.model.order_stats.stats_updated.connect(self.apply_pending_statistics)
+
+        # Auto-refresh every 30 seconds while this page is on screen and the data changed
+        self.refresh_task = refresh_scheduler.register(
+            self.staff_home, self.staff_home.dashboard_page_index, self.refresh_dashboard_data,
+            interval_ms=30000, model=self.model, tables=self.REFRESH_TABLES)
 
     def setup_dashboard_ui(self):
         """Setup dashboard UI elements and fonts"""
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-
-            if hasattr(self.staff_home, "title"):
-                title = getattr(self.staff_home, "title")
-                title.setFont(QFont(family, 30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        dashboard_buttons = ["Homebut", "Userbut", "Dashbut", "Orderbut",
-                             "Reportbut", "Settbut", "Delivlab"]
-        for name in dashboard_buttons:
-            if hasattr(self.staff_home, name):
-                btn = getattr(self.staff_home, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            label_names = ["l1", "l2", "ordereview", "liveorder"]
-            for label_name in label_names:
-                if hasattr(self.staff_home, label_name):
-                    lab = getattr(self.staff_home, label_name)
-                    lab.setFont(QFont(family, 13))
-                    lab.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            inlab_names = ["totalorder", "monthlyrev", "pendingdel", "pendingpick"]
-            for label_name in inlab_names:
-                if hasattr(self.staff_home, label_name):
-                    lab = getattr(self.staff_home, label_name)
-                    lab.setFont(QFont(family, 9))
-                    lab.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Title, sidebar buttons, section labels and card labels
+        apply_fonts(self.staff_home, [
+            (FREDOKA, 30, ["title"]),
+            ("Arial", 15, ["Homebut", "Userbut", "Dashbut", "Orderbut", "Reportbut", "Settbut", "Delivlab"]),
+            (FREDOKA, 13, ["l1", "l2", "ordereview", "liveorder"]),
+            (FREDOKA, 9, ["totalorder", "monthlyrev", "pendingdel", "pendingpick"]),
+        ])
 
     def setup_weekly_orders_graph(self):
-        """Setup the weekly orders line graph"""
+        """
+        Create the container for the weekly orders graph. The matplotlib
+        figure is built by ensure_graph_canvas() on the first visit.
+        """
+        self.weekly_chart = None
         try:
-            self.graph_widget = QWidget(self.dashboard_widget)
-            self.graph_widget.setGeometry(320, 370, 420, 150)
-
-            layout = QVBoxLayout(self.graph_widget)
-            layout.setContentsMargins(0, 0, 0, 0)
-
-            self.figure = Figure(figsize=(5, 2), dpi=80)
-            self.figure.patch.set_facecolor('#f0f0f0')
-            self.canvas = FigureCanvas(self.figure)
-
-            layout.addWidget(self.canvas)
-            self.graph_widget.show()
+            self.weekly_chart = WeeklyOrdersChart(self.dashboard_widget)
+        except Exception as e:
+            print(f"❌ Error setting up weekly orders graph: {e}")
+            import traceback
+            traceback.print_exc()
 
-            print("✅ Weekly orders graph created")
+    def ensure_graph_canvas(self):
+        """Import matplotlib and create the figure the first time the graph is needed"""
+        if not self.weekly_chart:
+            return False
+        if self.weekly_chart.is_ready():
+            return True
+        try:
+            self.weekly_chart.ensure_canvas()
+            print("✅ Weekly orders graph widget created")
+            return True
 
         except Exception as e:
-            print(f"❌ Error setting up weekly orders graph: {e}")
+            print(f"❌ Error creating weekly orders graph: {e}")
             import traceback
             traceback.print_exc()
+            return False
+
+    def on_page_changed(self, index):
+        """Create and draw the graph the first time the dashboard page is shown"""
+        if index == self.staff_home.dashboard_page_index and self.weekly_chart and not self.weekly_chart.is_ready():
+            if self.ensure_graph_canvas():
+                self.update_weekly_orders_graph()
 
     def setup_live_order_feed(self):
         """Setup the live order feed widget using existing UI labels"""
@@ -205,77 +202,41 @@ class SDashboard:
         return "Just now"
 
     def get_weekly_orders_data(self):
-        """Get orders data grouped by week for the last 8 weeks"""
+        """Order counts per week for the last 8 weeks, oldest first (empty list on error)"""
         try:
-            all_orders = self.model.get_all_orders()
-
-            if not all_orders:
-                print("⚠️ No orders found")
-                return pd.DataFrame(columns=['week', 'orders'])
-
-            df = pd.DataFrame(all_orders)
-            df['OrderDate'] = pd.to_datetime(df['OrderDate'])
-
             end_date = datetime.now()
             start_date = end_date - timedelta(weeks=8)
-            df = df[df['OrderDate'] >= start_date]
 
-            df['week'] = df['OrderDate'].dt.to_period('W')
-            weekly_orders = df.groupby('week').size().reset_index(name='orders')
-            weekly_orders['week'] = weekly_orders['week'].astype(str)
+            # Weekly buckets are computed by the database over the date window
+            weekly = self.model.get_weekly_order_counts(start_date, end_date)
 
-            all_weeks = pd.period_range(start=start_date, end=end_date, freq='W')
-            full_df = pd.DataFrame({'week': all_weeks.astype(str)})
-            full_df = full_df.merge(weekly_orders, on='week', how='left')
-            full_df['orders'] = full_df['orders'].fillna(0).astype(int)
+            if not weekly:
+                print("⚠️ No orders found")
+                return []
 
-            return full_df
+            return [row['orders'] for row in weekly]
 
         except Exception as e:
             print(f"❌ Error getting weekly orders data: {e}")
             import traceback
             traceback.print_exc()
-            return pd.DataFrame(columns=['week', 'orders'])
+            return []
 
     def update_weekly_orders_graph(self):
-        """Update the weekly orders line graph"""
+        """Update the weekly orders line graph (skipped until the dashboard has been shown)"""
+        if not self.weekly_chart or not self.weekly_chart.is_ready():
+            return
+
         try:
-            df = self.get_weekly_orders_data()
+            orders = self.get_weekly_orders_data()
 
-            if df.empty:
+            if not orders:
                 print("⚠️ No data to plot")
                 return
 
-            self.figure.clear()
-            ax = self.figure.add_subplot(111)
-
-            ax.plot(range(len(df)), df['orders'],
-                    color='#3855DB', linewidth=2, marker='o',
-                    markersize=6, markerfacecolor='#3855DB')
-
-            ax.set_facecolor('#ffffff')
-            ax.set_title('Orders Per Week (Last 8 Weeks)',
-                         fontsize=12, fontweight='bold', color='#333333', pad=10)
-            ax.set_xlabel('Week', fontsize=9, color='#666666')
-            ax.set_ylabel('Orders', fontsize=9, color='#666666')
-
-            week_labels = [f"W{i + 1}" for i in range(len(df))]
-            ax.set_xticks(range(len(df)))
-            ax.set_xticklabels(week_labels, rotation=45, ha='right', fontsize=8)
-
-            ax.yaxis.set_major_locator(plt.MaxNLocator(integer=True))
-            ax.tick_params(axis='y', labelsize=8)
-
-            ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
-
-            for i, value in enumerate(df['orders']):
-                ax.text(i, value, str(int(value)),
-                        ha='center', va='bottom', fontsize=8, color='#3855DB')
-
-            self.figure.tight_layout()
-            self.canvas.draw()
-
-            print(f"✅ Weekly orders graph updated")
+            # Only the line and labels change; nothing is drawn if the counts are the same
+            if self.weekly_chart.set_series(orders):
+                print(f"✅ Weekly orders graph updated with {len(orders)} weeks of data")
 
         except Exception as e:
             print(f"❌ Error updating weekly orders graph: {e}")
@@ -283,89 +244,25 @@ class SDashboard:
             traceback.print_exc()
 
     def get_order_statistics(self):
-        """Get order statistics for the dashboard - SAME AS StaffHomeView"""
-        print("🔵 STAFF DASHBOARD get_order_statistics() CALLED!")
-        try:
-            if not self.model:
-                print("✗ Model not available for statistics")
-                return {
-                    'completed_today': 0,
-                    'pending_issues': 0,
-                    'pending_delivery': 0,
-                    'pending_pickup': 0
-                }
-
-            # Get today's date
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            cursor = self.model.conn.cursor(dictionary=True)
-
-            # 1. Get orders completed today
-            cursor.execute("""
-                           SELECT COUNT(*) as completed_today
-                           FROM Orders
-                           WHERE DATE(DateDelivered) = %s AND Status = 'Completed'
-                           """, (today,))
-            result = cursor.fetchone()
-            completed_today = result['completed_today'] if result else 0
-
-            # 2. Get pending issues (orders not completed AND not cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_issues
-                           FROM Orders
-                           WHERE Status NOT IN ('Completed', 'Cancelled')
-                           """)
-            result = cursor.fetchone()
-            pending_issues = result['pending_issues'] if result else 0
-
-            # 3. Get pending delivery orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_delivery
-                           FROM Orders
-                           WHERE (Status = 'Ready for Delivery' OR Status = 'Processing')
-                             AND Status != 'Cancelled'
-                           """)
-            result = cursor.fetchone()
-            pending_delivery = result['pending_delivery'] if result else 0
-
-            # 4. Get pending pickup orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_pickup
-                           FROM Orders
-                           WHERE Status = 'Pending'
-                           """)
-            result = cursor.fetchone()
-            pending_pickup = result['pending_pickup'] if result else 0
-
-            cursor.close()
-
-            print(f"✓ Dashboard stats: Today={completed_today}, Issues={pending_issues}, "
-                  f"Delivery={pending_delivery}, Pickup={pending_pickup}")
-
-            return {
-                'completed_today': completed_today,
-                'pending_issues': pending_issues,
-                'pending_delivery': pending_delivery,
-                'pending_pickup': pending_pickup
-            }
+        """Get order statistics for the dashboard (shared Model service, one cached query)"""
+        if not self.model:
+            print("✗ Model not available for statistics")
+            return dict(EMPTY_ORDER_STATS)
 
+        try:
+            return self.model.order_stats.get_stats()
         except Exception as e:
-            import traceback
-            print(f"✗ Error getting dashboard order statistics: {e}")
-            traceback.print_exc()
-            return {
-                'completed_today': 0,
-                'pending_issues': 0,
-                'pending_delivery': 0,
-                'pending_pickup': 0
-            }
+            print(f"✗ Error getting order statistics: {e}")
+            return dict(EMPTY_ORDER_STATS)
 
     def load_pending_statistics(self):
         """Load pending pickup and delivery statistics for dashboard"""
-        try:
-            # Get order statistics using the same method as home view
-            stats = self.get_order_statistics()
+        # Get order statistics using the same method as home view
+        self.apply_pending_statistics(self.get_order_statistics())
 
+    def apply_pending_statistics(self, stats):
+        """Show pending counters (also called on model.order_stats.stats_updated)"""
+        try:
             if stats:
                 # Update pending delivery in dashboard
                 if hasattr(self.staff_home, "tert4_4"):  # Pending Delivery in dashboard
@@ -430,36 +327,9 @@ class SDashboard:
     def get_completed_orders_revenue(self):
         """Get total revenue from completed orders only for current month"""
         try:
-            # Get all orders with 'Completed' status
-            completed_orders = self.model.get_orders_by_status('Completed')
-
-            if not completed_orders:
-                print("⚠️ No completed orders found")
-                return 0.0
-
-            # Filter for current month
-            current_month = datetime.now().month
-            current_year = datetime.now().year
-
-            total_revenue = 0.0
-            for order in completed_orders:
-                try:
-                    # Parse order date
-                    order_date = order.get('OrderDate')
-                    if isinstance(order_date, str):
-                        order_date = datetime.strptime(order_date, '%Y-%m-%d %H:%M:%S')
-                    elif not isinstance(order_date, datetime):
-                        continue
-
-                    # Check if order is from current month
-                    if order_date.month == current_month and order_date.year == current_year:
-                        # Use TotalAmount instead of TotalPrice (based on the database schema)
-                        total_amount = order.get('TotalAmount', 0)
-                        if total_amount:
-                            total_revenue += float(total_amount)
-                except Exception as e:
-                    print(f"⚠️ Error processing order {order.get('OrderID')}: {e}")
-                    continue
+            # Summed over this month's rows of the daily order summary
+            month_start = datetime.now().date().replace(day=1)
+            total_revenue = self.model.get_completed_revenue(month_start)
 
             print(f"✅ Total revenue from completed orders: ₱{total_revenue:,.2f}")
             return total_revenue
@@ -471,7 +341,7 @@ class SDashboard:
             return 0.0
 
     def refresh_dashboard_data(self):
-        """Refresh dashboard data"""
+        """Refresh dashboard data (called by the refresh scheduler)"""
         print("🔄 Refreshing dashboard...")
         self.load_dashboard_data()
 
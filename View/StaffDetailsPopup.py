@@ -4,10 +4,12 @@ Draggable popup window for displaying staff details
 Loads UI from StaffDetailPopup.ui created in Qt Designer
 Connected to database for real-time staff data
 """
-from Model.report_generator import WashyEnhancedReportGenerator
-from PyQt6 import QtWidgets, uic
+from Model.report_worker import ReportJob, attach_progress_dialog
+from PyQt6 import QtWidgets
 from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QFont, QFontDatabase, QCursor
+from PyQt6.QtGui import QCursor
+from View.ui_loader import load_ui
+from View.fonts import FREDOKA, apply_fonts
 from datetime import datetime
 import os
 
@@ -37,31 +39,14 @@ class StaffDetailsPopup(QtWidgets.QWidget):
 
         # Load UI file
         if os.path.exists(ui_file):
-            uic.loadUi(ui_file, self)
+            load_ui(ui_file, self)
             self.setup_loaded_ui()
         else:
             self.create_basic_ui()
 
-        # Load custom font
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            # Apply font to heading labels only
-            for label_name in ['label_personal_info', 'label_order_stats', 'label_recent_activity']:
-                label = self.findChild(QtWidgets.QLabel, label_name)
-                if label:
-                    label.setFont(QFont(family, 10))
-                    label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_buttons = ["print"]
-            for fbut in other_buttons:
-                if hasattr(self, fbut):
-                    but = getattr(self, fbut)
-                    but.setFont(QFont(family, 10))
-                    but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Heading labels and the print button
+        apply_fonts(self, [(FREDOKA, 10, ["label_personal_info", "label_order_stats",
+                                          "label_recent_activity", "print"])])
 
         if hasattr(self, 'print'):
             self.print.clicked.connect(self.print_staff_pdf)
@@ -152,14 +137,26 @@ class StaffDetailsPopup(QtWidgets.QWidget):
             self.dragging = False
             self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
 
-    def loadStaffFromDatabase(self, staff_id):
-        """Load staff data from database using model"""
+    # ---------------------- POPUP POOL ----------------------
+    # Tables the record below is built from (see View/PopupPool.py)
+    RECORD_TABLES = ('Employees', 'Staff', 'Orders', 'StaffActivityLog')
+
+    @staticmethod
+    def fetch_record(model, staff_id):
+        return model.get_staff_by_id(staff_id)
+
+    def load_record(self, staff_id, record=None):
+        return self.loadStaffFromDatabase(staff_id, record)
+
+    def loadStaffFromDatabase(self, staff_id, staff_data=None):
+        """Load staff data from database using model (or a prefetched record)"""
         self.current_staff_id = staff_id
         if not self.model:
             print("Error: No model provided")
             return False
 
-        staff_data = self.model.get_staff_by_id(staff_id)
+        if staff_data is None:
+            staff_data = self.model.get_staff_by_id(staff_id)
 
         if not staff_data:
             print(f"Error: Staff {staff_id} not found")
@@ -187,30 +184,15 @@ class StaffDetailsPopup(QtWidgets.QWidget):
                 'database': 'washy'
             }
 
-            report_gen = WashyEnhancedReportGenerator(db_config)
-
-            # Show progress cursor
-            QtWidgets.QApplication.setOverrideCursor(Qt.CursorShape.WaitCursor)
-
-            success = report_gen.generate_staff_report(self.current_staff_id)
-
-            QtWidgets.QApplication.restoreOverrideCursor()
-
-            if success:
-                QtWidgets.QMessageBox.information(
-                    self,
-                    "Success",
-                    "Staff report generated successfully!\n\nLocation: Current directory"
-                )
-            else:
-                QtWidgets.QMessageBox.warning(
-                    self,
-                    "Error",
-                    "Failed to generate PDF report."
-                )
+            # Build the PDF in a worker process so the popup stays responsive
+            job = ReportJob('staff', getattr(self.model, 'db_config', db_config),
+                            (self.current_staff_id,), parent=self)
+            attach_progress_dialog(job, self, "Generating Report", "Generating staff report...")
+            job.finished.connect(self.on_pdf_finished)
+            self.report_job = job
+            job.start()
 
         except Exception as e:
-            QtWidgets.QApplication.restoreOverrideCursor()
             QtWidgets.QMessageBox.critical(
                 self,
                 "Error",
@@ -220,6 +202,22 @@ class StaffDetailsPopup(QtWidgets.QWidget):
             import traceback
             traceback.print_exc()
 
+    def on_pdf_finished(self, success, result):
+        """Worker finished: result is the saved filename, or the error text"""
+        self.report_job = None
+        if success:
+            QtWidgets.QMessageBox.information(
+                self,
+                "Success",
+                f"Staff report generated successfully!\n\nFile: {result}"
+            )
+        else:
+            QtWidgets.QMessageBox.warning(
+                self,
+                "Error",
+                f"Failed to generate PDF report.\n{result}"
+            )
+
     def format_staff_data(self, db_data):
         """Format database data for popup"""
         # Build full name
@@ -1,6 +1,5 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt
+from View.fonts import FREDOKA, apply_fonts
 
 
 class SEditCustomer:
@@ -19,51 +18,20 @@ class SEditCustomer:
     def setup_EditCustomer_ui(self):
         """Setup EditCustomer-specific UI elements"""
 
-        # Add "Edit Customer" title label
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-
-            # Title
-            if hasattr(self.main_window, "ok_10"):
-                title = getattr(self.main_window, "ok_10")
-                title.setText("Edit Customer")
-                title.setFont(QFont(family, 30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Section labels (Personal Information, Address)
-            section_labels = ["PI_7", "PI_8"]
-            for name in section_labels:
-                if hasattr(self.main_window, name):
-                    lbl = getattr(self.main_window, name)
-                    lbl.setFont(QFont(family, 10))
-                    lbl.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Field labels
-            field_labels = ["label_68", "label_72", "label_70", "label_65", "label_73",
-                            "label_66", "label_67", "label_69", "label_71"]
-            for name in field_labels:
-                if hasattr(self.main_window, name):
-                    lbl = getattr(self.main_window, name)
-                    lbl.setFont(QFont(family, 8))
-                    lbl.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Action buttons
-            action_buttons = ["crt_btn_7", "crt_btn_8"]
-            for name in action_buttons:
-                if hasattr(self.main_window, name):
-                    btn = getattr(self.main_window, name)
-                    btn.setFont(QFont(family, 10))
-                    btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Sidebar buttons - EditCustomer page uses _8 suffix
-        side_buttons = ["Homebut_8", "Userbut_8", "Dashbut_8", "Orderbut_8",
-                        "Reportbut_8", "Delivlab_8", "Settbut_8"]
-        for name in side_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        if hasattr(self.main_window, "ok_10"):
+            self.main_window.ok_10.setText("Edit Customer")
+
+        # Title, section labels (Personal Information, Address), field labels,
+        # action buttons and sidebar (EditCustomer page uses the _8 suffix)
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_10"]),
+            (FREDOKA, 10, ["PI_7", "PI_8"]),
+            (FREDOKA, 8, ["label_68", "label_72", "label_70", "label_65", "label_73",
+                          "label_66", "label_67", "label_69", "label_71"]),
+            (FREDOKA, 10, ["crt_btn_7", "crt_btn_8"]),
+            ("Arial", 15, ["Homebut_8", "Userbut_8", "Dashbut_8", "Orderbut_8",
+                           "Reportbut_8", "Delivlab_8", "Settbut_8"]),
+        ])
 
     def show(self):
         """Show the EditCustomer page"""
@@ -1,6 +1,6 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QFontDatabase, QFont, QDoubleValidator
-from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QDoubleValidator
+from View.fonts import FREDOKA, apply_fonts
 
 
 class SEditOrder:
@@ -19,73 +19,27 @@ class SEditOrder:
     def setup_EditOrder_ui(self):
         """Setup EditOrder-specific UI elements with proper fonts"""
 
-        # Load Fredoka font
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
+        # Title, service/summary labels, buttons and sidebar
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_9"]),
+            (FREDOKA, 9, ["servicesTitle_2", "summaryTitle_2", "fastDryPriceLabel_2",
+                          "washPriceLabel_2", "weightLabel_2", "quantityLabel_2",
+                          "summaryWashLabel_2", "summaryFastDryLabel_2", "summaryIronLabel_2",
+                          "summaryFoldLabel_2", "totalLabel_2", "fastDryPriceLabel_5", "fastDryPriceLabel_6"]),
+            (FREDOKA, 10, ["createOrderButton_2", "cancelButton_2",
+                           "fastDryCheckbox_2", "ironCheckbox_2", "foldCheckbox_2"]),
+            ("Arial", 15, ["Homebut_10", "Userbut_10", "Dashbut_10", "Orderbut_10", "Delivlab_10",
+                           "Reportbut_10", "Settbut_10"]),
+        ])
+        # Price display labels and inputs keep their focus policy
+        apply_fonts(self.main_window, [
+            (FREDOKA, 10, ["summaryWashPrice_2", "summaryFastDryPrice_2",
+                           "summaryIronPrice_2", "summaryFoldPrice_2", "totalPrice_2"]),
+            ("Arial", 10, ["weightInput_2", "quantitySpinBox_2"]),
+        ], no_focus=False)
 
-        if font_id == -1:
-            print("Warning: Could not load Fredoka-SemiBold.ttf font")
-            fredoka_family = "Arial"  # Fallback
-        else:
-            families = QFontDatabase.applicationFontFamilies(font_id)
-            if families:
-                fredoka_family = families[0]
-                print(f"Successfully loaded font: {fredoka_family}")
-            else:
-                print("Warning: Font loaded but no family found")
-                fredoka_family = "Arial"
-
-        # Title with Fredoka
-        if hasattr(self.main_window, "ok_9"):
-            title = self.main_window.ok_9
-            title.setFont(QFont(fredoka_family, 30))
-            title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-        else:
-            print("Warning: ok_9 widget not found")
-
-        # All labels with Fredoka
-        fredoka_labels = [
-            "servicesTitle_2", "summaryTitle_2", "fastDryPriceLabel_2",
-            "washPriceLabel_2", "weightLabel_2", "quantityLabel_2",
-            "summaryWashLabel_2", "summaryFastDryLabel_2", "summaryIronLabel_2",
-            "summaryFoldLabel_2", "totalLabel_2", "fastDryPriceLabel_5", "fastDryPriceLabel_6"
-        ]
-        for label_name in fredoka_labels:
-            if hasattr(self.main_window, label_name):
-                label = getattr(self.main_window, label_name)
-                label.setFont(QFont(fredoka_family, 9))
-                label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            else:
-                print(f"Warning: {label_name} widget not found")
-
-        # Price display labels (slightly smaller)
-        price_labels = [
-            "summaryWashPrice_2", "summaryFastDryPrice_2",
-            "summaryIronPrice_2", "summaryFoldPrice_2", "totalPrice_2"
-        ]
-        for label_name in price_labels:
-            if hasattr(self.main_window, label_name):
-                label = getattr(self.main_window, label_name)
-                label.setFont(QFont(fredoka_family, 10))
-            else:
-                print(f"Warning: {label_name} widget not found")
-
-        # Buttons with Fredoka
-        fredoka_buttons = [
-            "createOrderButton_2", "cancelButton_2",
-            "fastDryCheckbox_2", "ironCheckbox_2", "foldCheckbox_2"
-        ]
-        for button_name in fredoka_buttons:
-            if hasattr(self.main_window, button_name):
-                button = getattr(self.main_window, button_name)
-                button.setFont(QFont(fredoka_family, 10))
-                button.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            else:
-                print(f"Warning: {button_name} widget not found")
-
-        # Line edits and spinbox with Arial
         if hasattr(self.main_window, "weightInput_2"):
             weight_input = self.main_window.weightInput_2
-            weight_input.setFont(QFont("Arial", 10))
             weight_input.setPlaceholderText("0.00")
             # Add validator for decimal numbers
             validator = QDoubleValidator(0.0, 999.99, 2)
@@ -94,25 +48,6 @@ class SEditOrder:
         else:
             print("Warning: weightInput_2 widget not found")
 
-        if hasattr(self.main_window, "quantitySpinBox_2"):
-            quantity_spin = self.main_window.quantitySpinBox_2
-            quantity_spin.setFont(QFont("Arial", 10))
-        else:
-            print("Warning: quantitySpinBox_2 widget not found")
-
-        # Sidebar buttons with Arial
-        sidebar_buttons = [
-            "Homebut_10", "Userbut_10", "Dashbut_10",
-            "Orderbut_10", "Delivlab_10", "Reportbut_10", "Settbut_10"
-        ]
-        for name in sidebar_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-            else:
-                print(f"Warning: {name} widget not found")
-
     def reset_form(self):
         """Reset form to default values"""
         if hasattr(self.main_window, "weightInput_2"):
@@ -1,24 +1,28 @@
 import os
 
-from PyQt6 import uic
-from PyQt6.QtCore import Qt
 from PyQt6.QtWidgets import QMainWindow, QLabel
-from PyQt6.QtGui import QFontDatabase, QPixmap, QPainter, QFont
+from PyQt6.QtGui import QPixmap, QPainter
+from View.ui_loader import load_ui
 from datetime import datetime
-import Model.Resc_rc
+from Model.resources import ensure_resources, resource_pixmap
+from Model.order_stats import EMPTY_ORDER_STATS
+from View.fonts import FREDOKA, get_font, apply_fonts
 
 
 class StaffHome(QMainWindow):
     def __init__(self):
         super().__init__()
 
+        # The .ui file references :/ images, register the compiled resources first
+        ensure_resources()
+
         # Load the main UI file
         current_dir = os.path.dirname(os.path.abspath(__file__))
         ui_path = os.path.join(current_dir, "StaffMainWindow.ui")
-        uic.loadUi(ui_path, self)
+        load_ui(ui_path, self)
 
-        # Load image from QRC resource
-        self.image = QPixmap(":/images/4.png")
+        # Background image, decoded on first paint (shared by both home windows)
+        self.image = None
 
         # Get page indices
         self.home_page_index = self.find_page_index("SH")
@@ -76,48 +80,19 @@ class StaffHome(QMainWindow):
         # Washy label
         label = QLabel("Washy", self)
         label.setGeometry(110, 35, 150, 80)
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            label.setFont(QFont(family, 22))
-            if hasattr(self, "ok"):
-                ok = getattr(self, "ok")
-                ok.setFont(QFont(family, 30))
-                ok.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Sidebar button fonts
-        sidebar_buttons = ["Homebut_2", "Userbut_2", "Orderbut_2", "Delivlab_2", "Settbut_2",
-                           "Reportbut_2", "Dashbut_2"]
-        for name in sidebar_buttons:
-            if hasattr(self, name):
-                btn = getattr(self, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Other buttons
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_buttons = ["b1", "b2", "b3", "b4", "b5"]
-            for button in other_buttons:
-                if hasattr(self, button):
-                    btn = getattr(self, button)
-                    btn.setFont(QFont(family, 10))
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_label = ["l6", "label_31", "label_29","label_16","l2_2"]
-            for label in other_label:
-                if hasattr(self, label):
-                    lb = getattr(self, label)
-                    lb.setFont(QFont(family, 11))
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            other_label = ["label_32", "label_33"]
-            for label in other_label:
-                if hasattr(self, label):
-                    lb = getattr(self, label)
-                    lb.setFont(QFont(family, 10))
-
+        label.setFont(get_font(FREDOKA, 22))
+
+        # Title, sidebar buttons, quick-action buttons and home labels
+        apply_fonts(self, [
+            (FREDOKA, 30, ["ok"]),
+            ("Arial", 15, ["Homebut_2", "Userbut_2", "Orderbut_2", "Delivlab_2", "Settbut_2",
+                           "Reportbut_2", "Dashbut_2"]),
+        ])
+        apply_fonts(self, [
+            (FREDOKA, 10, ["b1", "b2", "b3", "b4", "b5"]),
+            (FREDOKA, 11, ["l6", "label_31", "label_29", "label_16", "l2_2"]),
+            (FREDOKA, 10, ["label_32", "label_33"]),
+        ], no_focus=False)
 
     def load_home_data(self):
         """Load order analytics and pending approvals data"""
@@ -216,88 +191,16 @@ class StaffHome(QMainWindow):
             traceback.print_exc()
 
     def get_order_statistics(self):
-        """Get order statistics for the home page"""
-        print("🔵 STAFF get_order_statistics() CALLED!")  # Debug line
-        try:
-            if not self.model:
-                print("✗ Model not available for statistics")
-                return {
-                    'completed_today': 0,
-                    'pending_issues': 0,
-                    'pending_delivery': 0,
-                    'pending_pickup': 0
-                }
-
-            # Get today's date
-            today = datetime.now().strftime("%Y-%m-%d")
-
-            cursor = self.model.conn.cursor(dictionary=True)
-
-            # 1. Get orders completed today
-            cursor.execute("""
-                           SELECT COUNT(*) as completed_today
-                           FROM Orders
-                           WHERE DATE (DateDelivered) = %s AND Status = 'Completed'
-                           """, (today,))
-            result = cursor.fetchone()
-            completed_today = result['completed_today'] if result else 0
-            print(f"🔵 Query 1 - Completed today: {completed_today}")
-
-            # 2. Get pending issues (orders not completed AND not cancelled)
-            query2 = """
-                     SELECT COUNT(*) as pending_issues
-                     FROM Orders
-                     WHERE Status NOT IN ('Completed', 'Cancelled')
-                     """
-            print(f"🔵 Executing query 2: {query2}")
-            cursor.execute(query2)
-            result = cursor.fetchone()
-            pending_issues = result['pending_issues'] if result else 0
-            print(f"🔵 Query 2 - Pending issues: {pending_issues}")
-
-            # 3. Get pending delivery orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_delivery
-                           FROM Orders
-                           WHERE (Status = 'Ready for Delivery' OR Status = 'Processing')
-                             AND Status != 'Cancelled'
-                           """)
-            result = cursor.fetchone()
-            pending_delivery = result['pending_delivery'] if result else 0
-            print(f"🔵 Query 3 - Pending delivery: {pending_delivery}")
-
-            # 4. Get pending pickup orders (exclude cancelled)
-            cursor.execute("""
-                           SELECT COUNT(*) as pending_pickup
-                           FROM Orders
-                           WHERE Status = 'Pending'
-                           """)
-            result = cursor.fetchone()
-            pending_pickup = result['pending_pickup'] if result else 0
-            print(f"🔵 Query 4 - Pending pickup: {pending_pickup}")
-
-            cursor.close()
-
-            print(
-                f"✓ Statistics retrieved: Today={completed_today}, Issues={pending_issues}, Delivery={pending_delivery}, Pickup={pending_pickup}")
-
-            return {
-                'completed_today': completed_today,
-                'pending_issues': pending_issues,
-                'pending_delivery': pending_delivery,
-                'pending_pickup': pending_pickup
-            }
+        """Get order statistics for the home page (shared Model service, one cached query)"""
+        if not self.model:
+            print("✗ Model not available for statistics")
+            return dict(EMPTY_ORDER_STATS)
 
+        try:
+            return self.model.order_stats.get_stats()
         except Exception as e:
-            import traceback
             print(f"✗ Error getting order statistics: {e}")
-            traceback.print_exc()
-            return {
-                'completed_today': 0,
-                'pending_issues': 0,
-                'pending_delivery': 0,
-                'pending_pickup': 0
-            }
+            return dict(EMPTY_ORDER_STATS)
 
     def update_profile_name(self):
         """Update the profile name with staff information"""
@@ -320,6 +223,8 @@ class StaffHome(QMainWindow):
             print(f"✗ Error updating profile name: {e}")
 
     def paintEvent(self, event):
+        if self.image is None:
+            self.image = resource_pixmap(":/images/4.png")
         painter = QPainter(self)
         painter.drawPixmap(0, 0, self.width(), self.height(), self.image)
         painter.end()
\ No newline at end of file
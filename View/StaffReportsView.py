@@ -1,6 +1,5 @@
 from PyQt6.QtWidgets import QLabel
-from PyQt6.QtGui import QFontDatabase, QFont
-from PyQt6.QtCore import Qt
+from View.fonts import FREDOKA, get_font, apply_fonts
 
 
 class SReports:
@@ -19,63 +18,28 @@ class SReports:
     def setup_report_ui(self):
         """Setup History/Report page-specific UI elements"""
 
-        # Add "Transaction & History" title label
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-
-            # Title
-            if hasattr(self.main_window, "ok_7"):
-                title = getattr(self.main_window, "ok_7")
-                title.setText("Transaction & History")
-                title.setFont(QFont(family, 30))
-                title.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Search field
-            if hasattr(self.main_window, "line4"):
-                le = getattr(self.main_window, "line4")
-                le.setPlaceholderText("Search by Name, ID, Status, etc.")
-                le.setFont(QFont("Arial", 10))
-
-            # Action buttons
-            other_buttons = ["nwbut_11", "nwbut_13", "nwbut_14"]
-            for fbut in other_buttons:
-                if hasattr(self.main_window, fbut):
-                    but = getattr(self.main_window, fbut)
-                    but.setFont(QFont(family, 10))
-                    but.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Filter/Sort button
-            if hasattr(self.main_window, "name_srt_btn_4"):
-                btn = getattr(self.main_window, "name_srt_btn_4")
-                btn.setText("All")  # Initial filter state
-                btn.setFont(QFont(family, 10))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            # Labels
-            if hasattr(self.main_window, "label_36"):
-                lbl = getattr(self.main_window, "label_36")
-                lbl.setFont(QFont(family, 10))
-                lbl.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-            if hasattr(self.main_window, "label_39"):
-                lbl = getattr(self.main_window, "label_39")
-                lbl.setFont(QFont(family, 8))
-                lbl.setFocusPolicy(Qt.FocusPolicy.NoFocus)
-
-        # Setup fonts for sidebar buttons - History page uses _4 suffix
-        report_buttons = ["Homebut_4", "Userbut_4", "Dashbut_4", "Orderbut_4",
-                          "Reportbut_4", "Delivlab_4", "Settbut_4"]
-        for name in report_buttons:
-            if hasattr(self.main_window, name):
-                btn = getattr(self.main_window, name)
-                btn.setFont(QFont("Arial", 15))
-                btn.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Title, search field and initial filter state
+        if hasattr(self.main_window, "ok_7"):
+            self.main_window.ok_7.setText("Transaction & History")
+        if hasattr(self.main_window, "line4"):
+            self.main_window.line4.setPlaceholderText("Search by Name, ID, Status, etc.")
+        if hasattr(self.main_window, "name_srt_btn_4"):
+            self.main_window.name_srt_btn_4.setText("All")
+
+        # Title, action/filter buttons, labels and sidebar (History page uses the _4 suffix)
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_7"]),
+            (FREDOKA, 10, ["nwbut_11", "nwbut_13", "nwbut_14", "name_srt_btn_4", "label_36"]),
+            (FREDOKA, 8, ["label_39"]),
+            ("Arial", 15, ["Homebut_4", "Userbut_4", "Dashbut_4", "Orderbut_4",
+                           "Reportbut_4", "Delivlab_4", "Settbut_4"]),
+        ])
+        apply_fonts(self.main_window, [("Arial", 10, ["line4"])], no_focus=False)
 
         # Setup table widget
         if hasattr(self.main_window, "tableWidget_4"):
             table = getattr(self.main_window, "tableWidget_4")
-            table.setFont(QFont("Arial", 10))
+            table.setFont(get_font("Arial", 10))
             table.setSortingEnabled(True)
             table.setSelectionBehavior(table.SelectionBehavior.SelectRows)
             table.setSelectionMode(table.SelectionMode.SingleSelection)
@@ -0,0 +1,155 @@
+"""
+Washy Laundry Management System - Weekly Orders Chart
+Dashboard line graph that keeps its matplotlib artists and only redraws what changed
+"""
+
+import math
+
+from PyQt6.QtWidgets import QVBoxLayout, QWidget
+
+LINE_COLOR = '#3855DB'
+
+
+class WeeklyOrdersChart:
+    """
+    "Orders Per Week" graph for the admin and staff dashboards.
+
+    The container widget is created with the page; matplotlib is imported and
+    the figure built by ensure_canvas() on the first visit. The axes, line and
+    value annotations are created once and set_series() only updates their
+    data:
+
+        unchanged series           nothing is drawn
+        same week count / y-range  the line and labels are blitted onto the
+                                   cached background
+        otherwise                  one full draw (ticks or y-limits changed)
+    """
+
+    def __init__(self, parent, geometry=(320, 370, 420, 150)):
+        self.figure = None
+        self.canvas = None
+        self.ax = None
+        self.line = None
+        self.value_labels = []
+
+        self._series = None
+        self._ylim_top = None
+        self._background = None
+
+        self.widget = QWidget(parent)
+        self.widget.setGeometry(*geometry)
+        self.layout = QVBoxLayout(self.widget)
+        self.layout.setContentsMargins(0, 0, 0, 0)
+        self.widget.show()
+
+    def is_ready(self):
+        return self.canvas is not None
+
+    # ---------------------- SETUP ----------------------
+    def ensure_canvas(self):
+        """Import matplotlib and build the figure and its artists (first call only)"""
+        if self.canvas is not None:
+            return
+
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+        from matplotlib.figure import Figure
+        from matplotlib.ticker import MaxNLocator
+
+        self.figure = Figure(figsize=(5, 2), dpi=80)
+        self.figure.patch.set_facecolor('#f0f0f0')
+        self.canvas = FigureCanvas(self.figure)
+        self.layout.addWidget(self.canvas)
+
+        ax = self.figure.add_subplot(111)
+        ax.set_facecolor('#ffffff')
+        ax.set_title('Orders Per Week (Last 8 Weeks)',
+                     fontsize=12, fontweight='bold', color='#333333', pad=10)
+        ax.set_xlabel('Week', fontsize=9, color='#666666')
+        ax.set_ylabel('Orders', fontsize=9, color='#666666')
+        ax.yaxis.set_major_locator(MaxNLocator(integer=True))
+        ax.tick_params(axis='y', labelsize=8)
+        ax.grid(True, alpha=0.3, linestyle='--', linewidth=0.5)
+        self.ax = ax
+
+        # Animated artists are left out of normal draws and painted by
+        # _draw_series(), so the background underneath them can be cached
+        self.line, = ax.plot([], [], color=LINE_COLOR, linewidth=2, marker='o',
+                             markersize=6, markerfacecolor=LINE_COLOR, animated=True)
+
+        self.canvas.mpl_connect('draw_event', self._on_draw)
+
+    # ---------------------- DATA ----------------------
+    def set_series(self, orders):
+        """
+        Show the weekly order counts (oldest first).
+        Returns False when the series is unchanged and nothing was drawn.
+        """
+        orders = [int(value) for value in orders]
+        if orders == self._series:
+            return False
+        self.ensure_canvas()
+
+        previous = self._series
+        self._series = orders
+
+        self.line.set_data(range(len(orders)), orders)
+        self._set_value_labels(orders)
+
+        ylim_top = self._nice_top(max(orders, default=0))
+        layout_changed = previous is None or len(previous) != len(orders) or ylim_top != self._ylim_top
+
+        if layout_changed:
+            self._ylim_top = ylim_top
+            self._set_axes_layout(len(orders))
+            self.canvas.draw_idle()
+        elif self._background is not None:
+            self._blit()
+        else:
+            self.canvas.draw_idle()
+        return True
+
+    def _set_value_labels(self, orders):
+        """Reuse one text artist per week, adding or hiding artists when the week count changes"""
+        while len(self.value_labels) < len(orders):
+            self.value_labels.append(
+                self.ax.text(0, 0, "", ha='center', va='bottom', fontsize=8,
+                             color=LINE_COLOR, animated=True))
+        for i, label in enumerate(self.value_labels):
+            if i < len(orders):
+                label.set_position((i, orders[i]))
+                label.set_text(str(orders[i]))
+                label.set_visible(True)
+            else:
+                label.set_visible(False)
+
+    def _set_axes_layout(self, weeks):
+        self.ax.set_xlim(-0.5, weeks - 0.5)
+        self.ax.set_ylim(0, self._ylim_top)
+        self.ax.set_xticks(range(weeks))
+        self.ax.set_xticklabels([f"W{i + 1}" for i in range(weeks)], rotation=45, ha='right', fontsize=8)
+        self.figure.tight_layout()
+
+    @staticmethod
+    def _nice_top(peak):
+        """Y-limit with headroom for the labels, rounded so small changes keep the same axes"""
+        if peak <= 4:
+            return 5
+        step = 5 if peak < 50 else 10 ** int(math.log10(peak))
+        return int(math.ceil(peak * 1.2 / step) * step)
+
+    # ---------------------- DRAWING ----------------------
+    def _on_draw(self, event):
+        """After a full draw: cache the static background, then paint the series on top"""
+        self._background = self.canvas.copy_from_bbox(self.figure.bbox)
+        self._draw_series()
+
+    def _draw_series(self):
+        self.ax.draw_artist(self.line)
+        for label in self.value_labels:
+            if label.get_visible():
+                self.ax.draw_artist(label)
+
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self._draw_series()
+        self.canvas.blit(self.figure.bbox)
@@ -5,9 +5,11 @@ Loads UI from adminpopup.ui created in Qt Designer
 Connected to database for real-time admin data
 """
 
-from PyQt6 import QtCore, QtGui, QtWidgets, uic
+from PyQt6 import QtCore, QtGui, QtWidgets
 from PyQt6.QtCore import Qt, QPoint
-from PyQt6.QtGui import QFont, QFontDatabase, QCursor
+from PyQt6.QtGui import QCursor
+from View.ui_loader import load_ui
+from View.fonts import FREDOKA, apply_fonts
 from datetime import datetime
 import os
 
@@ -37,21 +39,13 @@ class AdminDetailsPopup(QtWidgets.QWidget):
 
         # Load UI file
         if os.path.exists(ui_file):
-            uic.loadUi(ui_file, self)
+            load_ui(ui_file, self)
             self.setup_loaded_ui()
         else:
             self.create_basic_ui()
 
-        # Load custom font
-        font_id = QFontDatabase.addApplicationFont("C:/Users/NITRO/PycharmProjects/Washyy/fonts/Fredoka-SemiBold.ttf")
-        if font_id != -1:
-            family = QFontDatabase.applicationFontFamilies(font_id)[0]
-            # Apply font to heading labels only
-            for label_name in ['label_personal_info', 'label_order_stats', 'label_recent_activity']:
-                label = self.findChild(QtWidgets.QLabel, label_name)
-                if label:
-                    label.setFont(QFont(family, 10))
-                    label.setFocusPolicy(Qt.FocusPolicy.NoFocus)
+        # Heading labels
+        apply_fonts(self, [(FREDOKA, 10, ["label_personal_info", "label_order_stats", "label_recent_activity"])])
 
     def setup_loaded_ui(self):
         """Setup UI elements after loading .ui file"""
@@ -138,13 +132,25 @@ class AdminDetailsPopup(QtWidgets.QWidget):
             self.dragging = False
             self.setCursor(QCursor(Qt.CursorShape.ArrowCursor))
 
-    def loadAdminFromDatabase(self, admin_id):
-        """Load admin data from database using model"""
+    # ---------------------- POPUP POOL ----------------------
+    # Tables the record below is built from (see View/PopupPool.py)
+    RECORD_TABLES = ('Employees', 'Admin')
+
+    @staticmethod
+    def fetch_record(model, admin_id):
+        return model.get_admin_by_id(admin_id)
+
+    def load_record(self, admin_id, record=None):
+        return self.loadAdminFromDatabase(admin_id, record)
+
+    def loadAdminFromDatabase(self, admin_id, admin_data=None):
+        """Load admin data from database using model (or a prefetched record)"""
         if not self.model:
             print("Error: No model provided")
             return False
 
-        admin_data = self.model.get_admin_by_id(admin_id)
+        if admin_data is None:
+            admin_data = self.model.get_admin_by_id(admin_id)
 
         if not admin_data:
             print(f"Error: Admin {admin_id} not found")
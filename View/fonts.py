@@ -0,0 +1,79 @@
+"""
+Washy Laundry Management System - Font Registry
+Loads each bundled font file once per process and shares the QFont objects
+"""
+
+import os
+
+from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QFont, QFontDatabase
+
+FONT_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "fonts")
+FALLBACK_FAMILY = "Arial"
+
+# Bundled font files (fonts/<name>.ttf)
+FREDOKA = "Fredoka-SemiBold"
+FREDOKA_BOLD = "Fredoka-Bold"
+
+_families = {}   # font file name -> family (None if it could not be loaded)
+_fonts = {}      # (font name, size, weight) -> QFont
+
+
+def font_family(font_name):
+    """
+    Family for a bundled font file, registering fonts/<font_name>.ttf on
+    first use. Names without a bundled file are plain system families.
+    """
+    if font_name in _families:
+        return _families[font_name]
+
+    path = os.path.join(FONT_DIR, f"{font_name}.ttf")
+    if not os.path.exists(path):
+        _families[font_name] = font_name
+        return font_name
+
+    family = None
+    font_id = QFontDatabase.addApplicationFont(path)
+    if font_id != -1:
+        families = QFontDatabase.applicationFontFamilies(font_id)
+        family = families[0] if families else None
+    if family:
+        print(f"✓ Font registered: {font_name} ({family})")
+    else:
+        print(f"✗ Could not load font {path}, using {FALLBACK_FAMILY}")
+    _families[font_name] = family
+    return family
+
+
+def get_font(font_name, size, weight=None):
+    """Shared QFont for a bundled font (or system family) at a point size"""
+    key = (font_name, size, weight)
+    font = _fonts.get(key)
+    if font is None:
+        family = font_family(font_name) or FALLBACK_FAMILY
+        font = QFont(family, size) if weight is None else QFont(family, size, weight)
+        _fonts[key] = font
+    return font
+
+
+def apply_fonts(window, rules, no_focus=True):
+    """
+    Set fonts on a window's named children in one pass.
+
+        apply_fonts(self.main_window, [
+            (FREDOKA, 30, ["ok_4"]),
+            ("Arial", 15, ["Homebut_7", "Userbut_7"]),
+        ])
+
+    Missing widget names are skipped. With no_focus the widgets also stop
+    taking keyboard focus, as the headings and buttons always have.
+    """
+    for font_name, size, names in rules:
+        font = get_font(font_name, size)
+        for name in names:
+            widget = getattr(window, name, None)
+            if widget is None:
+                continue
+            widget.setFont(font)
+            if no_focus:
+                widget.setFocusPolicy(Qt.FocusPolicy.NoFocus)
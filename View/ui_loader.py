@@ -0,0 +1,123 @@
+"""
+Washy Laundry Management System - Compiled UI Loader
+Builds widgets from Python modules generated from the Qt Designer .ui files
+
+Build step (run after editing a .ui file, or let the first start do it):
+    python -m View.ui_loader
+"""
+
+import glob
+import hashlib
+import importlib.util
+import os
+import sys
+
+from PyQt6 import uic
+
+CACHE_DIR_NAME = "ui_cache"
+HASH_PREFIX = "# ui-hash: "
+
+# ui path -> (hash, Ui_ class) for modules already imported in this process
+_loaded = {}
+
+
+def _ui_hash(ui_path):
+    with open(ui_path, 'rb') as f:
+        return hashlib.sha1(f.read()).hexdigest()
+
+
+def _cache_path(ui_path):
+    folder, name = os.path.split(os.path.abspath(ui_path))
+    stem = os.path.splitext(name)[0]
+    return os.path.join(folder, CACHE_DIR_NAME, f"ui_{stem}.py")
+
+
+def _cached_hash(py_path):
+    """Hash recorded in the first line of a generated module, or None"""
+    try:
+        with open(py_path, 'r', encoding='utf-8') as f:
+            first_line = f.readline()
+    except OSError:
+        return None
+    if first_line.startswith(HASH_PREFIX):
+        return first_line[len(HASH_PREFIX):].strip()
+    return None
+
+
+def compile_ui(ui_path, ui_hash=None):
+    """Generate the Python module for one .ui file; returns its path"""
+    ui_hash = ui_hash or _ui_hash(ui_path)
+    py_path = _cache_path(ui_path)
+    os.makedirs(os.path.dirname(py_path), exist_ok=True)
+
+    tmp_path = py_path + ".tmp"
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        f.write(f"{HASH_PREFIX}{ui_hash}\n")
+        uic.compileUi(ui_path, f)
+    os.replace(tmp_path, py_path)
+    print(f"✓ UI compiled: {os.path.basename(ui_path)} -> {os.path.relpath(py_path)}")
+    return py_path
+
+
+def _import_ui_class(py_path):
+    module_name = "_ui_" + os.path.splitext(os.path.basename(py_path))[0]
+    spec = importlib.util.spec_from_file_location(module_name, py_path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    for name, value in vars(module).items():
+        if name.startswith("Ui_") and isinstance(value, type):
+            return value
+    raise ImportError(f"No Ui_ class in {py_path}")
+
+
+def _get_ui_class(ui_path):
+    """Ui_ class for ui_path, compiling again if the .ui file changed"""
+    ui_hash = _ui_hash(ui_path)
+    loaded = _loaded.get(ui_path)
+    if loaded and loaded[0] == ui_hash:
+        return loaded[1]
+
+    py_path = _cache_path(ui_path)
+    if _cached_hash(py_path) != ui_hash:
+        compile_ui(ui_path, ui_hash)
+
+    ui_class = _import_ui_class(py_path)
+    _loaded[ui_path] = (ui_hash, ui_class)
+    return ui_class
+
+
+def load_ui(ui_path, widget):
+    """
+    Drop-in for uic.loadUi(ui_path, widget): child widgets end up as
+    attributes of widget. Uses the generated module when it matches the
+    .ui file and only parses the XML with uic when that is not possible.
+    """
+    try:
+        ui_class = _get_ui_class(ui_path)
+    except Exception as e:
+        print(f"✗ UI cache unavailable for {os.path.basename(ui_path)} ({e}), using uic.loadUi")
+        return uic.loadUi(ui_path, widget)
+
+    ui = ui_class()
+    ui.setupUi(widget)
+    # uic.loadUi sets children on the widget itself; keep that contract
+    for name, value in vars(ui).items():
+        setattr(widget, name, value)
+    return widget
+
+
+def compile_all(folder=None):
+    """Regenerate every stale module for the .ui files in folder (default: View/)"""
+    folder = folder or os.path.dirname(os.path.abspath(__file__))
+    compiled = 0
+    for ui_path in sorted(glob.glob(os.path.join(folder, "*.ui"))):
+        ui_hash = _ui_hash(ui_path)
+        if _cached_hash(_cache_path(ui_path)) != ui_hash:
+            compile_ui(ui_path, ui_hash)
+            compiled += 1
+    print(f"✓ UI modules up to date ({compiled} compiled)")
+    return compiled
+
+
+if __name__ == "__main__":
+    compile_all(sys.argv[1] if len(sys.argv) > 1 else None)